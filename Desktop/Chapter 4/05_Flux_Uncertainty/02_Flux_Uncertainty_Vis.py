@@ -15,6 +15,11 @@ from mpl_toolkits.mplot3d import Axes3D
 import geopandas as gpd
 import os
 
+from adaptive_surface import AdaptiveSurface, mc_evaluator
+from dataset_daemon import attach_dataset
+from flux_mc import FIBER_ASPECT, FILM_THICKNESS_UM, bootstrap_statistics
+from startup_loader import FutureWatcher, gather, load_concurrently, log_load_timings, submit_process
+
 plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams['font.family'] = 'Times New Roman'
 plt.rcParams['font.size'] = 9
@@ -24,6 +29,14 @@ UNC_DIR = os.path.join(BASE_DIR, "05_Flux_Uncertainty")
 PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
 PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
 LEV12_SHP = os.path.join(BASE_DIR, "BasinATLAS_v10_shp", "BasinATLAS_v10_lev12.shp")
+DEFAULT_TOTAL_ITEM_FLUX = 1e15
+
+# Surfaces (precomputed once in a worker process): MC runs on an adaptive quadtree
+# that refines where the surface curves, plotted as a triangulated scattered surface
+SURFACE_ALPHA_RANGE = (2.0, 3.5)
+SURFACE_MIN_RANGE = (50.0, 300.0)
+SURFACE_MAX_EVALS = 120
+SURFACE_MC_DRAWS = 2000
 
 DENSITIES = {
     'Poly_PE': 0.95, 'Poly_PP': 0.91, 'Poly_PS': 1.05,
@@ -50,42 +63,81 @@ def load_and_filter_priors():
     return shape_df, poly_df
 
 
+def load_coastal_basins():
+    # Attach to the dataset daemon's shared copy when one is running
+    shared = attach_dataset()
+    if shared is not None:
+        coastal_basins = shared.coastal_basins()
+        print(f"Attached {len(coastal_basins)} river mouths from the dataset daemon")
+        return coastal_basins
+    print("Loading Level 12 HydroBasin...")
+    gdf = gpd.read_file(LEV12_SHP)
+    coastal_basins = gdf[gdf['COAST'] == 1].copy()
+    print(f"Found {len(coastal_basins)} river mouths")
+    return coastal_basins
+
+
+def load_item_fluxes():
+    """Flux_Linear per basin in items/yr, or None when the modeling file is unavailable"""
+    shared = attach_dataset()
+    if shared is not None and shared.item_fluxes() is not None:
+        return shared.item_fluxes()
+    try:
+        flux_path = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
+        if os.path.exists(flux_path):
+            print("Loading Flux_Data_Modeling.csv...")
+            df = pd.read_csv(flux_path)
+            if 'Flux_Linear' in df.columns:
+                # Flux_Linear is likely items/sec (need to verify unit based on context, 
+                # usually river flux models are m3/s or items/s or items/day). 
+                # Assuming items/sec -> items/year: * 31536000
+                # Based on previous tasks it was implicitly items/s
+                return df['Flux_Linear'].values * 31536000
+            print("Column 'Flux_Linear' not found. Using default.")
+        else:
+             print(f"File not found: {flux_path}. Using default.")
+    except Exception as e:
+        print(f"Error loading flux data: {e}, using default.")
+    return None
+
+
 class CoastalFluxSimulator:
-    def __init__(self):
-        shape_df, poly_df = load_and_filter_priors()
-        self.shape_probs = shape_df['Prob'].to_dict()
-        self.poly_probs = poly_df['Prob'].to_dict()
+    def __init__(self, load_inputs=True):
         self.densities = DENSITIES
-        
-        print("Loading Level 12 HydroBasin...")
-        gdf = gpd.read_file(LEV12_SHP)
-        self.coastal_basins = gdf[gdf['COAST'] == 1].copy()
-        print(f"Found {len(self.coastal_basins)} river mouths")
-        
-        # Load Flux Data from Modeling File
+        self.shape_probs, self.poly_probs = {}, {}
+        self.coastal_basins = None
         self.item_fluxes = None
-        try:
-            flux_path = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
-            if os.path.exists(flux_path):
-                print("Loading Flux_Data_Modeling.csv...")
-                df = pd.read_csv(flux_path)
-                if 'Flux_Linear' in df.columns:
-                    # Flux_Linear is likely items/sec (need to verify unit based on context, 
-                    # usually river flux models are m3/s or items/s or items/day). 
-                    # Assuming items/sec -> items/year: * 31536000
-                    # Based on previous tasks it was implicitly items/s
-                    self.item_fluxes = df['Flux_Linear'].values * 31536000
-                    self.total_item_flux_yr = np.sum(self.item_fluxes)
-                    print(f"Loaded Total Item Flux: {self.total_item_flux_yr:.2e} items/yr")
-                else:
-                    print("Column 'Flux_Linear' not found. Using default.")
-                    self.total_item_flux_yr = 1e15
-            else:
-                 print(f"File not found: {flux_path}. Using default.")
-                 self.total_item_flux_yr = 1e15
-        except Exception as e:
-            print(f"Error loading flux data: {e}, using default.")
-            self.total_item_flux_yr = 1e15
+        self.total_item_flux_yr = DEFAULT_TOTAL_ITEM_FLUX
+        
+        # Shapefile, flux CSV and priors load concurrently; the set_* methods install
+        # each one as it arrives (finish_loading() waits for all of them)
+        self.loads = {}
+        if load_inputs:
+            self.loads = load_concurrently(priors=load_and_filter_priors, basins=load_coastal_basins,
+                                           flux=load_item_fluxes)
+    
+    def set_priors(self, shape_df, poly_df):
+        self.shape_probs = shape_df['Prob'].to_dict()
+        self.poly_probs = poly_df['Prob'].to_dict()
+    
+    def set_coastal_basins(self, coastal_basins):
+        self.coastal_basins = coastal_basins
+    
+    def set_item_fluxes(self, item_fluxes):
+        self.item_fluxes = item_fluxes
+        if item_fluxes is None:
+            self.total_item_flux_yr = DEFAULT_TOTAL_ITEM_FLUX
+        else:
+            self.total_item_flux_yr = np.sum(item_fluxes)
+            print(f"Loaded Total Item Flux: {self.total_item_flux_yr:.2e} items/yr")
+    
+    def finish_loading(self):
+        """Block until every input is loaded and installed"""
+        results = gather(self.loads)
+        self.set_priors(*results['priors'])
+        self.set_coastal_basins(results['basins'])
+        self.set_item_fluxes(results['flux'])
+        return self
     
     def sample_sizes(self, n, alpha, min_um, max_um):
         u = np.random.random(n)
@@ -100,7 +152,7 @@ class CoastalFluxSimulator:
         
         mask_fiber = (shapes == 'Shape_Fiber')
         L = sizes_um[mask_fiber]
-        D = L / 10.0
+        D = L / FIBER_ASPECT
         volumes[mask_fiber] = np.pi * (D/2)**2 * L
         
         mask_sphere = np.isin(shapes, ['Shape_Fragment', 'Shape_Pellet'])
@@ -109,7 +161,7 @@ class CoastalFluxSimulator:
         
         mask_film = (shapes == 'Shape_Film')
         D = sizes_um[mask_film]
-        volumes[mask_film] = D**2 * 20.0
+        volumes[mask_film] = D**2 * FILM_THICKNESS_UM
         
         return volumes
     
@@ -149,7 +201,26 @@ class CoastalFluxSimulator:
         return A, M, Z
 
 
+def precompute_mass_surfaces(alpha_range, min_range, max_evals, n=SURFACE_MC_DRAWS, max_size=5000):
+    """
+    Worker-process entry: P5/P50/P95 particle mass (g) at the nodes of an adaptive
+    (alpha, min size) surface, with its triangles and extrema.
+    Mass does not depend on the flux CSV; the GUI scales it to kt/yr once the CSV is in.
+    """
+    sim = CoastalFluxSimulator(load_inputs=False)
+    sim.set_priors(*load_and_filter_priors())
+    stats = ('P5', 'P50', 'P95')
+    evaluate = mc_evaluator(sim.shape_probs, sim.poly_probs, n, max_size, sim.densities, stats=stats)
+    surface = AdaptiveSurface(evaluate, stats, alpha_range, min_range, max_evals=max_evals).build().to_dict()
+    surface['values'] = {k: np.array(v) for k, v in surface['values'].items()}
+    return surface
+
+
 def create_interactive_vis():
+    # Surfaces start first (slowest), then the input loads; the figure builds meanwhile
+    print("Computing parameter surfaces in a worker process...")
+    surface_future = submit_process(precompute_mass_surfaces, SURFACE_ALPHA_RANGE, SURFACE_MIN_RANGE,
+                                    SURFACE_MAX_EVALS)
     sim = CoastalFluxSimulator()
     
     fig = plt.figure(figsize=(18, 12))
@@ -159,9 +230,8 @@ def create_interactive_vis():
     # Title
     ax_title = fig.add_subplot(gs[0, :])
     ax_title.axis('off')
-    ax_title.text(0.5, 0.5,
-                 f"Flux Uncertainty (Level 12) | {len(sim.coastal_basins)} Mouths | Quantile Analysis",
-                 ha='center', va='center', fontsize=13, fontweight='bold')
+    title_text = ax_title.text(0.5, 0.5, "Flux Uncertainty (Level 12) | Loading... | Quantile Analysis",
+                               ha='center', va='center', fontsize=13, fontweight='bold')
     
     # Row 1: Priors
     ax_shape = fig.add_subplot(gs[1, 0])
@@ -174,43 +244,62 @@ def create_interactive_vis():
     ax_results = fig.add_subplot(gs[2, 2])
     
     plt.subplots_adjust(top=0.9) # Adjust spacing
-
-    # Plot Item Flux Histogram (Static Input)
-    if sim.item_fluxes is not None:
-        valid_fluxes = sim.item_fluxes[sim.item_fluxes > 0]
-        if len(valid_fluxes) > 0:
-            ax_item.hist(np.log10(valid_fluxes), bins=40, color='purple', alpha=0.7, edgecolor='black')
-            ax_item.set_title('Global Item Flux (Input)', fontweight='bold', fontsize=10)
-            ax_item.set_xlabel('Log10(items/yr)', fontsize=8)
-            ax_item.set_ylabel('Basin Count', fontsize=8)
-            
-            # Show Total Sum
-            ax_item.text(0.95, 0.95, f"Total:\\n{sim.total_item_flux_yr:.1e}\\nitems/yr", 
-                         transform=ax_item.transAxes, ha='right', va='top', fontsize=8,
-                         bbox=dict(boxstyle='round', facecolor='white', alpha=0.8, ec='none'))
-        else:
-             ax_item.text(0.5, 0.5, "No positive flux data", ha='center', fontsize=9)
-    else:
-        ax_item.text(0.5, 0.5, "Item Data Not Loaded", ha='center', fontsize=9)
-    ax_item.grid(alpha=0.3)
     
     # Row 3: 3D Surfaces (P5, P50, P95)
     ax_surf_p5 = fig.add_subplot(gs[3, 0], projection='3d')
     ax_surf_p50 = fig.add_subplot(gs[3, 1], projection='3d')
     ax_surf_p95 = fig.add_subplot(gs[3, 2], projection='3d')
     
-    # Plot sorted priors
-    shape_series = pd.Series(sim.shape_probs)
-    shape_series.plot(kind='bar', ax=ax_shape, color='steelblue', alpha=0.7)
-    ax_shape.set_title('Shape (sorted)', fontweight='bold', fontsize=10)
-    ax_shape.tick_params(axis='x', rotation=45, labelsize=7)
-    ax_shape.set_ylabel('Probability', fontsize=8)
+    # Panels that wait on an input show a placeholder until it arrives
+    placeholders = {ax: ax.text(0.5, 0.5, "Loading...", ha='center', va='center', fontsize=9,
+                                transform=ax.transAxes, color='gray')
+                    for ax in (ax_shape, ax_polymer, ax_item, ax_results)}
+    for ax in (ax_surf_p5, ax_surf_p50, ax_surf_p95):
+        placeholders[ax] = ax.text2D(0.5, 0.5, "Computing surface...", ha='center', va='center',
+                                     fontsize=9, transform=ax.transAxes, color='gray')
+    
+    def draw_basins(coastal_basins):
+        sim.set_coastal_basins(coastal_basins)
+        title_text.set_text(f"Flux Uncertainty (Level 12) | {len(coastal_basins)} Mouths | Quantile Analysis")
+    
+    def draw_item_flux(item_fluxes):
+        # Plot Item Flux Histogram (Static Input)
+        sim.set_item_fluxes(item_fluxes)
+        placeholders.pop(ax_item).remove()
+        if sim.item_fluxes is not None:
+            valid_fluxes = sim.item_fluxes[sim.item_fluxes > 0]
+            if len(valid_fluxes) > 0:
+                ax_item.hist(np.log10(valid_fluxes), bins=40, color='purple', alpha=0.7, edgecolor='black')
+                ax_item.set_title('Global Item Flux (Input)', fontweight='bold', fontsize=10)
+                ax_item.set_xlabel('Log10(items/yr)', fontsize=8)
+                ax_item.set_ylabel('Basin Count', fontsize=8)
+                
+                # Show Total Sum
+                ax_item.text(0.95, 0.95, f"Total:\\n{sim.total_item_flux_yr:.1e}\\nitems/yr", 
+                             transform=ax_item.transAxes, ha='right', va='top', fontsize=8,
+                             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8, ec='none'))
+            else:
+                 ax_item.text(0.5, 0.5, "No positive flux data", ha='center', fontsize=9)
+        else:
+            ax_item.text(0.5, 0.5, "Item Data Not Loaded", ha='center', fontsize=9)
+        ax_item.grid(alpha=0.3)
     
-    poly_series = pd.Series(sim.poly_probs)
-    poly_series.plot(kind='bar', ax=ax_polymer, color='seagreen', alpha=0.7)
-    ax_polymer.set_title('Polymer (sorted)', fontweight='bold', fontsize=10)
-    ax_polymer.tick_params(axis='x', rotation=45, labelsize=7)
-    ax_polymer.set_ylabel('Probability', fontsize=8)
+    def draw_priors(priors):
+        # Plot sorted priors
+        sim.set_priors(*priors)
+        placeholders.pop(ax_shape).remove()
+        placeholders.pop(ax_polymer).remove()
+        shape_series = pd.Series(sim.shape_probs)
+        shape_series.plot(kind='bar', ax=ax_shape, color='steelblue', alpha=0.7)
+        ax_shape.set_title('Shape (sorted)', fontweight='bold', fontsize=10)
+        ax_shape.tick_params(axis='x', rotation=45, labelsize=7)
+        ax_shape.set_ylabel('Probability', fontsize=8)
+        
+        poly_series = pd.Series(sim.poly_probs)
+        poly_series.plot(kind='bar', ax=ax_polymer, color='seagreen', alpha=0.7)
+        ax_polymer.set_title('Polymer (sorted)', fontweight='bold', fontsize=10)
+        ax_polymer.tick_params(axis='x', rotation=45, labelsize=7)
+        ax_polymer.set_ylabel('Probability', fontsize=8)
     
     # Sliders
     slider_alpha = Slider(plt.axes([0.15, 0.04, 0.25, 0.015]), 'α',
@@ -220,108 +309,136 @@ def create_interactive_vis():
     slider_n = Slider(plt.axes([0.55, 0.03, 0.25, 0.015]), 'Samples',
                      1000, 10000, valinit=3000, valstep=500)
     
-    # Pre-compute surfaces (this takes time, do once)
-    print("Computing parameter surfaces...")
-    alpha_grid = np.linspace(2.0, 3.5, 8)
-    min_grid = np.linspace(50, 300, 8)
+    # Artists are created once; update() only changes their data
+    MASS_BINS = 60
+    QUANT_COLORS = {'P5': 'blue', 'P50': 'green', 'P95': 'red'}
+    
+    size_line, = ax_size.plot([], [], 'r-', linewidth=2)
+    size_fill = ax_size.fill_between([1, 2], [0, 0], alpha=0.2, color='red')
+    ax_size.set_xlabel('μm', fontsize=8)
+    ax_size.set_xscale('log')
+    ax_size.set_ylim(0, 1.05)
+    ax_size.grid(alpha=0.3)
+    
+    mass_bars = ax_mass.bar(np.zeros(MASS_BINS), np.zeros(MASS_BINS), width=1.0, align='edge',
+                            color='skyblue', edgecolor='black', alpha=0.6)
+    quant_lines = {q_name: ax_mass.axvline(0, color=color, linestyle='--', linewidth=1.5, label=q_name)
+                   for q_name, color in QUANT_COLORS.items()}
+    ax_mass.set_title('Particle Mass Distribution', fontweight='bold', fontsize=10)
+    ax_mass.set_xlabel('Log₁₀(mg)', fontsize=8)
+    ax_mass.set_ylabel('Density', fontsize=8)
+    mass_legend = ax_mass.legend(fontsize=7, loc='upper left')
+    ax_mass.grid(alpha=0.3)
+    
+    ax_results.axis('off')
+    results_box = ax_results.text(0.1, 0.5, '', transform=ax_results.transAxes,
+                                  va='center', fontsize=9, family='monospace',
+                                  bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
     
-    surfaces = {}
-    for q_name, q_func in [('P5', lambda q: q['P5']), 
-                           ('P50', lambda q: q['P50']), 
-                           ('P95', lambda q: q['P95'])]:
-        print(f"  Computing {q_name} surface...")
-        A, M, Z = sim.compute_surface(alpha_grid, min_grid, q_func)
-        surfaces[q_name] = (A, M, Z)
+    # Surfaces and extrema are static; only the current-point marker moves
+    current_markers = {}
+    
+    def draw_surfaces(item_fluxes, surface):
+        A, M = np.array(surface['alpha']), np.array(surface['min_size'])
+        for ax_surf, q_name, color in [(ax_surf_p5, 'P5', 'Blues'),
+                                       (ax_surf_p50, 'P50', 'Greens'),
+                                       (ax_surf_p95, 'P95', 'Reds')]:
+            Z = sim.estimate_flux(surface['values'][q_name])
+            placeholders.pop(ax_surf).remove()
+            
+            ax_surf.plot_trisurf(A, M, Z, triangles=surface['triangles'], cmap=color, alpha=0.7,
+                                 edgecolor='none', antialiased=True)
+            
+            # Extrema located by the adaptive search
+            peak, trough = surface['extrema'][q_name]['max'], surface['extrema'][q_name]['min']
+            z_max, z_min = sim.estimate_flux(peak['value']), sim.estimate_flux(trough['value'])
+            
+            # Mark extrema
+            ax_surf.scatter([peak['alpha']], [peak['min_size']], [z_max],
+                          color='red', s=100, marker='^', label=f'Max: {z_max:.0f}')
+            ax_surf.scatter([trough['alpha']], [trough['min_size']], [z_min],
+                          color='blue', s=100, marker='v', label=f'Min: {z_min:.0f}')
+            
+            current_markers[q_name] = ax_surf.scatter([A[0]], [M[0]], [Z[0]],
+                          color='yellow', s=80, marker='o', edgecolors='black', linewidths=2, label='Current')
+            
+            ax_surf.set_xlabel('α', fontsize=8)
+            ax_surf.set_ylabel('Min (μm)', fontsize=8)
+            ax_surf.set_zlabel('kt/yr', fontsize=8)
+            ax_surf.set_title(f'{q_name} Surface', fontweight='bold', fontsize=10)
+            ax_surf.legend(fontsize=6, loc='upper left')
+            ax_surf.view_init(elev=25, azim=-60)
+        print("Surfaces ready")
+        if ready['mc']:
+            update(None)
+    
+    ready = {'mc': False}
+    
+    def enable_mc(priors, item_fluxes):
+        # Sliders respond once the MC inputs are in; the surfaces may still be computing
+        ready['mc'] = True
+        placeholders.pop(ax_results).remove()
+        update(None)
     
     def update(val):
+        if not ready['mc']:
+            return
         alpha, min_s, n = slider_alpha.val, slider_min.val, int(slider_n.val)
         
         # Size distribution
-        ax_size.clear()
         x = np.linspace(min_s, 5000, 1000)
         y = (x ** (-alpha)) / np.max(x ** (-alpha))
-        ax_size.plot(x, y, 'r-', linewidth=2)
-        ax_size.fill_between(x, y, alpha=0.2, color='red')
+        size_line.set_data(x, y)
+        size_fill.set_verts([np.column_stack([np.r_[x, x[::-1]], np.r_[y, np.zeros_like(y)]])])
+        ax_size.set_xlim(min_s, 5000)
         ax_size.set_title(f'Size (α={alpha:.2f})', fontweight='bold', fontsize=10)
-        ax_size.set_xlabel('μm', fontsize=8)
-        ax_size.set_xscale('log')
-        ax_size.grid(alpha=0.3)
         
         # Monte Carlo with quantiles
         masses, quants = sim.run_monte_carlo(n, alpha, min_s, 5000)
         
-        # Mass distribution
-        ax_mass.clear()
-        ax_mass.hist(np.log10(masses * 1000 + 1e-12), bins=60,
-                    color='skyblue', edgecolor='black', alpha=0.6, density=True)
-        
-        # Add quantile lines
-        for q_name, q_val in quants.items():
-            color = {'P5': 'blue', 'P50': 'green', 'P95': 'red'}[q_name]
-            ax_mass.axvline(np.log10(q_val * 1000), color=color,
-                           linestyle='--', linewidth=1.5, label=f'{q_name}: {q_val*1000:.4f} mg')
+        # Mass distribution: move and resize the existing bars
+        heights, edges = np.histogram(np.log10(masses * 1000 + 1e-12), bins=MASS_BINS, density=True)
+        for bar, left, width, height in zip(mass_bars, edges[:-1], np.diff(edges), heights):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
+        ax_mass.set_xlim(edges[0], edges[-1])
+        ax_mass.set_ylim(0, heights.max() * 1.05)
         
-        ax_mass.set_title('Particle Mass Distribution', fontweight='bold', fontsize=10)
-        ax_mass.set_xlabel('Log₁₀(mg)', fontsize=8)
-        ax_mass.set_ylabel('Density', fontsize=8)
-        ax_mass.legend(fontsize=7, loc='upper left')
-        ax_mass.grid(alpha=0.3)
+        # Quantile lines
+        for text, (q_name, line) in zip(mass_legend.get_texts(), quant_lines.items()):
+            q_val = quants[q_name]
+            line.set_xdata([np.log10(q_val * 1000)] * 2)
+            text.set_text(f'{q_name}: {q_val*1000:.4f} mg')
         
         # Results table
-        ax_results.clear()
-        ax_results.axis('off')
-        
         flux_p5 = sim.estimate_flux(quants['P5'])
         flux_p50 = sim.estimate_flux(quants['P50'])
         flux_p95 = sim.estimate_flux(quants['P95'])
         
+        # 95% bootstrap intervals: Monte Carlo error of each reported flux
+        ci = {k: (sim.estimate_flux(v['lo']), sim.estimate_flux(v['hi']))
+              for k, v in bootstrap_statistics(masses).items()}
+        
         results_text = (
-            f"Quantile Analysis (n={n})\\n"
-            f"{'='*30}\\n"
-            f"P5  (5%):  {flux_p5:>8.1f} kt/yr\\n"
-            f"P50 (50%): {flux_p50:>8.1f} kt/yr\\n"
-            f"P95 (95%): {flux_p95:>8.1f} kt/yr\\n"
-            f"{'='*30}\\n"
-            f"Range: {flux_p95-flux_p5:.1f} kt/yr\\n"
-            f"Ratio: {flux_p95/flux_p5:.2f}x"
+            f"Quantile Analysis (n={n})\n"
+            f"{'='*30}\n"
+            f"P5  (5%):  {flux_p5:>8.1f} kt/yr\n"
+            f"           [{ci['P5'][0]:.1f}, {ci['P5'][1]:.1f}]\n"
+            f"P50 (50%): {flux_p50:>8.1f} kt/yr\n"
+            f"           [{ci['P50'][0]:.1f}, {ci['P50'][1]:.1f}]\n"
+            f"P95 (95%): {flux_p95:>8.1f} kt/yr\n"
+            f"           [{ci['P95'][0]:.1f}, {ci['P95'][1]:.1f}]\n"
+            f"{'='*30}\n"
+            f"Range: {flux_p95-flux_p5:.1f} kt/yr\n"
+            f"Ratio: {flux_p95/flux_p5:.2f}x\n"
+            f"[..] = 95% bootstrap CI"
         )
+        results_box.set_text(results_text)
         
-        ax_results.text(0.1, 0.5, results_text, transform=ax_results.transAxes,
-                       va='center', fontsize=9, family='monospace',
-                       bbox=dict(boxstyle='round', facecolor='lightyellow', alpha=0.8))
-        
-        # Update surfaces
-        for ax_surf, q_name, color in [(ax_surf_p5, 'P5', 'Blues'),
-                                       (ax_surf_p50, 'P50', 'Greens'),
-                                       (ax_surf_p95, 'P95', 'Reds')]:
-            ax_surf.clear()
-            A, M, Z = surfaces[q_name]
-            
-            surf = ax_surf.plot_surface(A, M, Z, cmap=color, alpha=0.7,
-                                       edgecolor='none', antialiased=True)
-            
-            # Find extrema
-            idx_min = np.unravel_index(np.argmin(Z), Z.shape)
-            idx_max = np.unravel_index(np.argmax(Z), Z.shape)
-            
-            # Mark extrema
-            ax_surf.scatter([A[idx_max]], [M[idx_max]], [Z[idx_max]],
-                          color='red', s=100, marker='^', label=f'Max: {Z[idx_max]:.0f}')
-            ax_surf.scatter([A[idx_min]], [M[idx_min]], [Z[idx_min]],
-                          color='blue', s=100, marker='v', label=f'Min: {Z[idx_min]:.0f}')
-            
-            # Mark current point
-            current_flux = sim.estimate_flux(quants[q_name])
-            ax_surf.scatter([alpha], [min_s], [current_flux],
-                          color='yellow', s=80, marker='o', edgecolors='black', linewidths=2, label='Current')
-
-            
-            ax_surf.set_xlabel('α', fontsize=8)
-            ax_surf.set_ylabel('Min (μm)', fontsize=8)
-            ax_surf.set_zlabel('kt/yr', fontsize=8)
-            ax_surf.set_title(f'{q_name} Surface', fontweight='bold', fontsize=10)
-            ax_surf.legend(fontsize=6, loc='upper left')
-            ax_surf.view_init(elev=25, azim=-60)
+        # Mark current point
+        for q_name, marker in current_markers.items():
+            marker._offsets3d = ([alpha], [min_s], [sim.estimate_flux(quants[q_name])])
         
         fig.canvas.draw_idle()
     
@@ -329,11 +446,19 @@ def create_interactive_vis():
     slider_min.on_changed(update)
     slider_n.on_changed(update)
     
-    update(None)
+    # Panels fill in on the GUI thread as their inputs resolve
+    watcher = FutureWatcher(fig)
+    watcher.when_done(sim.loads['basins'], draw_basins)
+    watcher.when_done(sim.loads['flux'], draw_item_flux)
+    watcher.when_done(sim.loads['priors'], draw_priors)
+    watcher.when_done([sim.loads['priors'], sim.loads['flux']], enable_mc)
+    watcher.when_done([sim.loads['flux'], surface_future], draw_surfaces)
+    watcher.start()
     plt.show()
 
 
 if __name__ == "__main__":
+    log_load_timings()
     print("="*60)
     print("Enhanced Flux Visualization | Quantile + Surface Analysis")
     print("="*60)
@@ -19,6 +19,12 @@ import geopandas as gpd
 import json
 import os
 
+from adaptive_surface import AdaptiveSurface, mc_evaluator
+from dataset_daemon import attach_dataset
+from flux_mc import (FIBER_ASPECT, FILM_THICKNESS_UM, REWEIGHT_HIST_BINS, elasticities,
+                     nested_flux_quantiles, pathwise_gradients, sample_masses, ReweightableDraws)
+from startup_loader import FutureWatcher, gather, load_concurrently, log_load_timings, submit_process
+
 plt.rcParams['font.family'] = 'Times New Roman'
 plt.rcParams['font.size'] = 8
 
@@ -28,6 +34,20 @@ PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
 PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
 LEV12_SHP = os.path.join(BASE_DIR, "BasinATLAS_v10_shp", "BasinATLAS_v10_lev12.shp")
 PRESETS_FILE = os.path.join(UNC_DIR, "config_presets.json")
+DEFAULT_TOTAL_ITEM_FLUX = 1e15
+
+# Surfaces (precomputed once in a worker process): MC runs on an adaptive quadtree
+# that refines where the surface curves, plotted as a triangulated scattered surface
+SURFACE_ALPHA_RANGE = (2.0, 3.5)
+SURFACE_MIN_RANGE = (60.0, 250.0)
+SURFACE_MAX_EVALS = 120
+SURFACE_MC_DRAWS = 2000
+
+# Effective field-sample count behind the priors (Dirichlet concentration)
+PRIOR_CONCENTRATION = 100.0
+
+# Reweighted draws are reused while their effective sample size stays above this fraction
+MIN_ESS_FRACTION = 0.2
 
 # Load presets
 with open(PRESETS_FILE, 'r') as f:
@@ -57,38 +77,78 @@ def load_priors():
     return shape_df, poly_df
 
 
+def load_coastal_basins():
+    # Attach to the dataset daemon's shared copy when one is running
+    shared = attach_dataset()
+    if shared is not None:
+        coastal_basins = shared.coastal_basins()
+        print(f"Attached {len(coastal_basins)} coastal basins from the dataset daemon")
+        return coastal_basins
+    gdf = gpd.read_file(LEV12_SHP)
+    coastal_basins = gdf[gdf['COAST'] == 1].copy()
+    print(f"Loaded {len(coastal_basins)} coastal basins")
+    return coastal_basins
+
+
+def load_item_fluxes():
+    """Flux_Linear per basin in items/yr, or None when the modeling file is unavailable"""
+    shared = attach_dataset()
+    if shared is not None and shared.item_fluxes() is not None:
+        return shared.item_fluxes()
+    try:
+        flux_path = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
+        if os.path.exists(flux_path):
+            print("Loading Flux_Data_Modeling.csv...")
+            df = pd.read_csv(flux_path)
+            if 'Flux_Linear' in df.columns:
+                return df['Flux_Linear'].values * 31536000
+    except Exception as e:
+        print(f"Error loading flux data: {e}, using default.")
+    return None
+
+
 class EnhancedFluxSimulator:
-    def __init__(self):
-        shape_df, poly_df = load_priors()
-        self.shape_probs_original = shape_df['Prob'].to_dict()
-        self.poly_probs_original = poly_df['Prob'].to_dict()
-        self.shape_probs = self.shape_probs_original.copy()
-        self.poly_probs = self.poly_probs_original.copy()
+    def __init__(self, load_inputs=True):
+        self.shape_probs_original, self.poly_probs_original = {}, {}
+        self.shape_probs, self.poly_probs = {}, {}
         self.densities = DENSITIES
-        
-        gdf = gpd.read_file(LEV12_SHP)
-        self.coastal_basins = gdf[gdf['COAST'] == 1].copy()
-        
-        # Load Flux Data
+        self.last_draws = None
+        self.last_d_log_mass = None
+        self.last_nested = None
+        self.coastal_basins = None
         self.item_fluxes = None
-        try:
-            flux_path = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
-            if os.path.exists(flux_path):
-                print("Loading Flux_Data_Modeling.csv...")
-                df = pd.read_csv(flux_path)
-                if 'Flux_Linear' in df.columns:
-                    self.item_fluxes = df['Flux_Linear'].values * 31536000
-                    self.total_item_flux_yr = np.sum(self.item_fluxes)
-                    print(f"Loaded Total Item Flux: {self.total_item_flux_yr:.2e} items/yr")
-                else:
-                    self.total_item_flux_yr = 1e15
-            else:
-                 self.total_item_flux_yr = 1e15
-        except Exception as e:
-            print(f"Error loading flux data: {e}, using default.")
-            self.total_item_flux_yr = 1e15
+        self.total_item_flux_yr = DEFAULT_TOTAL_ITEM_FLUX
         
-        print(f"Loaded {len(self.coastal_basins)} coastal basins")
+        # Shapefile, flux CSV and priors load concurrently; the set_* methods install
+        # each one as it arrives (finish_loading() waits for all of them)
+        self.loads = {}
+        if load_inputs:
+            self.loads = load_concurrently(priors=load_priors, basins=load_coastal_basins,
+                                           flux=load_item_fluxes)
+    
+    def set_priors(self, shape_df, poly_df):
+        self.shape_probs_original = shape_df['Prob'].to_dict()
+        self.poly_probs_original = poly_df['Prob'].to_dict()
+        self.reset_priors()
+    
+    def set_coastal_basins(self, coastal_basins):
+        self.coastal_basins = coastal_basins
+    
+    def set_item_fluxes(self, item_fluxes):
+        self.item_fluxes = item_fluxes
+        if item_fluxes is None:
+            self.total_item_flux_yr = DEFAULT_TOTAL_ITEM_FLUX
+        else:
+            self.total_item_flux_yr = np.sum(item_fluxes)
+            print(f"Loaded Total Item Flux: {self.total_item_flux_yr:.2e} items/yr")
+    
+    def finish_loading(self):
+        """Block until every input is loaded and installed"""
+        results = gather(self.loads)
+        self.set_priors(*results['priors'])
+        self.set_coastal_basins(results['basins'])
+        self.set_item_fluxes(results['flux'])
+        return self
     
     def reset_priors(self):
         self.shape_probs = self.shape_probs_original.copy()
@@ -107,6 +167,18 @@ class EnhancedFluxSimulator:
                 total = sum(self.poly_probs.values())
                 self.poly_probs = {k: v/total for k, v in self.poly_probs.items()}
     
+    def set_prior_factors(self, shape_factors=None, poly_factors=None):
+        """Scale original priors by per-category factors (absolute, not cumulative), renormalize"""
+        shape_factors = shape_factors or {}
+        poly_factors = poly_factors or {}
+        shape = {k: v * shape_factors.get(k, 1.0) for k, v in self.shape_probs_original.items()}
+        poly = {k: v * poly_factors.get(k, 1.0) for k, v in self.poly_probs_original.items()}
+        shape_total, poly_total = sum(shape.values()), sum(poly.values())
+        if shape_total > 0:
+            self.shape_probs = {k: v/shape_total for k, v in shape.items()}
+        if poly_total > 0:
+            self.poly_probs = {k: v/poly_total for k, v in poly.items()}
+    
     def sample_sizes(self, n, alpha, min_um, max_um):
         u = np.random.random(n)
         if abs(alpha - 1.0) < 0.01:
@@ -120,7 +192,7 @@ class EnhancedFluxSimulator:
         
         mask_fiber = (shapes == 'Shape_Fiber')
         L = sizes_um[mask_fiber]
-        D = L / 10.0
+        D = L / FIBER_ASPECT
         volumes[mask_fiber] = np.pi * (D/2)**2 * L
         
         mask_sphere = np.isin(shapes, ['Shape_Fragment', 'Shape_Pellet'])
@@ -129,22 +201,16 @@ class EnhancedFluxSimulator:
         
         mask_film = (shapes == 'Shape_Film')
         D = sizes_um[mask_film]
-        volumes[mask_film] = D**2 * 20.0
+        volumes[mask_film] = D**2 * FILM_THICKNESS_UM
         
         return volumes
     
     def run_monte_carlo_with_convergence(self, n, alpha, min_size, max_size):
-        """Run MC and track convergence"""
-        shapes = np.random.choice(list(self.shape_probs.keys()), size=n,
-                                  p=list(self.shape_probs.values()))
-        polymers = np.random.choice(list(self.poly_probs.keys()), size=n,
-                                    p=list(self.poly_probs.values()))
-        densities = np.array([self.densities.get(p, 1.0) for p in polymers])
-        
-        sizes = self.sample_sizes(n, alpha, min_size, max_size)
-        volumes_um3 = self.calculate_volumes(sizes, shapes)
-        volumes_cm3 = volumes_um3 * 1e-12
-        masses_g = volumes_cm3 * densities
+        """Run MC and track convergence; draws and their pathwise derivatives are kept for reweighting"""
+        masses_g, shape_codes, poly_codes, self.last_d_log_mass = sample_masses(
+            n, alpha, min_size, max_size, self.shape_probs, self.poly_probs, self.densities, derivatives=True)
+        self.last_draws = ReweightableDraws(masses_g, shape_codes, poly_codes,
+                                            self.shape_probs, self.poly_probs)
         
         # Calculate running mean for convergence
         running_mean = np.cumsum(masses_g) / np.arange(1, n+1)
@@ -156,12 +222,89 @@ class EnhancedFluxSimulator:
         
         return masses_g, {'P5': p5, 'P50': p50, 'P95': p95, 'mean': np.mean(masses_g)}, running_mean
     
+    def reweight_last_run(self):
+        """
+        Re-target the last MC run to the current priors without drawing again.
+        Returns (quants, running_mean, (hist_counts, hist_edges)), or None if
+        the draws cannot represent the new priors and a fresh run is needed.
+        """
+        draws = self.last_draws
+        if draws is None or not draws.can_reweight(self.shape_probs, self.poly_probs):
+            return None
+        w_cell = draws.cell_weights(self.shape_probs, self.poly_probs)
+        if draws.effective_sample_size(w_cell) < MIN_ESS_FRACTION * len(draws.masses_g):
+            return None
+        
+        p5, p50, p95 = draws.quantiles(w_cell, (5, 50, 95))
+        quants = {'P5': p5, 'P50': p50, 'P95': p95, 'mean': draws.mean(w_cell)}
+        return quants, draws.running_mean(w_cell), draws.histogram(w_cell)
+    
+    def histogram_last_run(self):
+        """(counts, edges) of the last run's draws as drawn, on the cached bin edges"""
+        draws = self.last_draws
+        return draws.histogram(np.ones(len(draws.cell_hist)))
+    
+    def bootstrap_last_run(self):
+        """95% bootstrap CI (kt/yr) of each reported statistic for the last run under the current priors"""
+        draws = self.last_draws
+        ci = draws.bootstrap(draws.cell_weights(self.shape_probs, self.poly_probs))
+        return {k: (self.estimate_flux(v['lo']), self.estimate_flux(v['hi'])) for k, v in ci.items()}
+    
+    def elasticities_last_run(self, quants, alpha, min_size, max_size):
+        """Local flux elasticities (alpha, min, max) of each statistic for the last run under the current priors"""
+        draws = self.last_draws
+        w = draws.cell_weights(self.shape_probs, self.poly_probs)[draws.cell]
+        grads = pathwise_gradients(draws.masses_g, self.last_d_log_mass, w)
+        return elasticities(quants, grads, alpha, min_size, max_size)
+    
     def estimate_flux(self, mean_mass_g):
         total_kg_yr = self.total_item_flux_yr * mean_mass_g / 1000.0
         return total_kg_yr / 1e6
+    
+    def run_nested_uncertainty(self, alpha, min_size, max_size, n_outer=200, n_inner=2000,
+                               concentration=PRIOR_CONCENTRATION):
+        """Flux quantiles including prior composition uncertainty (Dirichlet outer loop)"""
+        return nested_flux_quantiles(self.total_item_flux_yr, alpha, min_size, max_size,
+                                     self.shape_probs, self.poly_probs,
+                                     n_outer=n_outer, n_inner=n_inner,
+                                     shape_concentration=concentration,
+                                     poly_concentration=concentration)
+    
+    def nested_band(self, alpha, min_size, max_size, refresh=True):
+        """
+        run_nested_uncertainty memoised on (alpha, min, max, priors, total flux); returns (band, current).
+        refresh=False keeps the last band when the key moved (prior-slider reweights), so the
+        200 x 2000 nested MC only reruns on a full update or the toggle
+        """
+        key = (alpha, min_size, max_size, self.total_item_flux_yr,
+               tuple(sorted(self.shape_probs.items())), tuple(sorted(self.poly_probs.items())))
+        if self.last_nested is None or (refresh and self.last_nested[0] != key):
+            self.last_nested = (key, self.run_nested_uncertainty(alpha, min_size, max_size))
+        return self.last_nested[1], self.last_nested[0] == key
+
+
+def precompute_mass_surfaces(alpha_range, min_range, max_evals, n=SURFACE_MC_DRAWS, max_size=5000):
+    """
+    Worker-process entry: mean, P50 and P95-P5 particle mass (g) at the nodes of an
+    adaptive (alpha, min size) surface, with its triangles and extrema.
+    Flux is linear in mass, so the GUI scales these to kt/yr once the flux CSV is in.
+    """
+    sim = EnhancedFluxSimulator(load_inputs=False)
+    sim.set_priors(*load_priors())
+    stats = ('mean', 'P50', 'range')
+    evaluate = mc_evaluator(sim.shape_probs, sim.poly_probs, n, max_size, sim.densities, stats=stats)
+    surface = AdaptiveSurface(evaluate, stats, alpha_range, min_range, max_evals=max_evals).build().to_dict()
+    rename = {'mean': 'mean', 'P50': 'p50', 'range': 'range'}
+    surface['values'] = {rename[k]: np.array(v) for k, v in surface['values'].items()}
+    surface['extrema'] = {rename[k]: v for k, v in surface['extrema'].items()}
+    return surface
 
 
 def create_enhanced_explorer():
+    # Surfaces start first (slowest), then the input loads; the figure builds meanwhile
+    print("Pre-computing surfaces in a worker process...")
+    surface_future = submit_process(precompute_mass_surfaces, SURFACE_ALPHA_RANGE, SURFACE_MIN_RANGE,
+                                    SURFACE_MAX_EVALS)
     sim = EnhancedFluxSimulator()
     
     fig = plt.figure(figsize=(20, 12))
@@ -195,22 +338,30 @@ def create_enhanced_explorer():
     ax_mass = fig.add_subplot(gs[2, 1:3])
     ax_results = fig.add_subplot(gs[2, 3])
 
-    # Plot Item Flux
-    if sim.item_fluxes is not None:
-        valid_fluxes = sim.item_fluxes[sim.item_fluxes > 0]
-        if len(valid_fluxes) > 0:
-            ax_item.hist(np.log10(valid_fluxes), bins=40, color='purple', alpha=0.7, edgecolor='black')
-            ax_item.set_title('Item Flux (Input)', fontweight='bold', fontsize=9)
-            ax_item.set_xlabel('Log10(items/yr)', fontsize=8)
-            ax_item.set_ylabel('Frequency', fontsize=8)
-            ax_item.text(0.95, 0.95, f"Total:\\n{sim.total_item_flux_yr:.1e}", 
-                         transform=ax_item.transAxes, ha='right', va='top', fontsize=7,
-                         bbox=dict(fc='white', alpha=0.7, ec='none'))
+    # Panels that wait on an input show a placeholder until it arrives
+    placeholders = {ax: ax.text(0.5, 0.5, "Loading...", ha='center', va='center', fontsize=8,
+                                transform=ax.transAxes, color='gray')
+                    for ax in (ax_shape, ax_polymer, ax_item, ax_results)}
+    
+    def draw_item_flux(item_fluxes):
+        # Plot Item Flux
+        sim.set_item_fluxes(item_fluxes)
+        placeholders.pop(ax_item).remove()
+        if sim.item_fluxes is not None:
+            valid_fluxes = sim.item_fluxes[sim.item_fluxes > 0]
+            if len(valid_fluxes) > 0:
+                ax_item.hist(np.log10(valid_fluxes), bins=40, color='purple', alpha=0.7, edgecolor='black')
+                ax_item.set_title('Item Flux (Input)', fontweight='bold', fontsize=9)
+                ax_item.set_xlabel('Log10(items/yr)', fontsize=8)
+                ax_item.set_ylabel('Frequency', fontsize=8)
+                ax_item.text(0.95, 0.95, f"Total:\\n{sim.total_item_flux_yr:.1e}", 
+                             transform=ax_item.transAxes, ha='right', va='top', fontsize=7,
+                             bbox=dict(fc='white', alpha=0.7, ec='none'))
+            else:
+                 ax_item.text(0.5, 0.5, "No positive data", ha='center')
         else:
-             ax_item.text(0.5, 0.5, "No positive data", ha='center')
-    else:
-        ax_item.text(0.5, 0.5, "Data Not Loaded", ha='center')
-    ax_item.grid(alpha=0.3)
+            ax_item.text(0.5, 0.5, "Data Not Loaded", ha='center')
+        ax_item.grid(alpha=0.3)
     
     # Row 3: Preset buttons (dedicated row)
     ax_button_row = fig.add_subplot(gs[3, :])
@@ -221,9 +372,21 @@ def create_enhanced_explorer():
     ax_surf_p50 = fig.add_subplot(gs[4, 2], projection='3d')
     ax_surf_range = fig.add_subplot(gs[4, 3], projection='3d')
     
-    # Plot initial priors
+    prior_bars = {}
+    
     def plot_priors():
-        ax_shape.clear()
+        for ax, bars, probs in [(ax_shape, prior_bars['shape'], sim.shape_probs),
+                                (ax_polymer, prior_bars['poly'], sim.poly_probs)]:
+            heights = list(probs.values())
+            for bar, height in zip(bars, heights):
+                bar.set_height(height)
+            ax.set_ylim(0, max(heights) * 1.05)
+    
+    def draw_priors(priors):
+        sim.set_priors(*priors)
+        placeholders.pop(ax_shape).remove()
+        placeholders.pop(ax_polymer).remove()
+        # Plot initial priors (bars are created once; plot_priors only sets heights)
         pd.Series(sim.shape_probs).plot(kind='bar', ax=ax_shape, color='steelblue', alpha=0.7)
         ax_shape.set_title('Shape Distribution', fontweight='bold', fontsize=9)
         ax_shape.set_ylabel('Probability', fontsize=8)
@@ -234,8 +397,7 @@ def create_enhanced_explorer():
         ax_shape.text(0.02, 0.98, f"{annot['what']}\n{annot['why']}",
                      transform=ax_shape.transAxes, va='top', fontsize=5.5,
                      bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.7))
-        
-        ax_polymer.clear()
+    
         pd.Series(sim.poly_probs).plot(kind='bar', ax=ax_polymer, color='seagreen', alpha=0.7)
         ax_polymer.set_title('Polymer Distribution', fontweight='bold', fontsize=9)
         ax_polymer.set_ylabel('Probability', fontsize=8)
@@ -245,8 +407,9 @@ def create_enhanced_explorer():
         ax_polymer.text(0.02, 0.98, f"{annot['what']}\n{annot['why']}",
                        transform=ax_polymer.transAxes, va='top', fontsize=5.5,
                        bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.7))
+        prior_bars['shape'], prior_bars['poly'] = list(ax_shape.patches), list(ax_polymer.patches)
     
-    plot_priors()
+        plot_priors()
     
     # Sliders (at bottom)
     slider_alpha = Slider(plt.axes([0.10, 0.015, 0.2, 0.012]), 'α',
@@ -256,6 +419,12 @@ def create_enhanced_explorer():
     slider_n = Slider(plt.axes([0.66, 0.015, 0.2, 0.012]), 'MC Samples',
                      1000, 8000, valinit=3000, valstep=500)
     
+    # Prior edits (applied by reweighting the current draws)
+    slider_fiber = Slider(plt.axes([0.10, 0.035, 0.2, 0.012]), 'Fiber ×',
+                         0.0, 3.0, valinit=1.0, valstep=0.1)
+    slider_lowrho = Slider(plt.axes([0.38, 0.035, 0.2, 0.012]), 'Low-ρ ×',
+                          0.0, 3.0, valinit=1.0, valstep=0.1)
+    
     # Preset buttons (in dedicated row 3)
     preset_buttons = []
     button_width = 0.18
@@ -273,80 +442,137 @@ def create_enhanced_explorer():
     btn_reset = Button(plt.axes([0.65, button_y, button_width, button_height]), 
                       'Reset Priors', color='lightcoral', hovercolor='salmon')
     
-    # Store surfaces (pre-computed)
-    surfaces = {}
-    print("Pre-computing surfaces...")
-    alpha_grid = np.linspace(2.0, 3.5, 6)
-    min_grid = np.linspace(60, 250, 6)
-    A, M = np.meshgrid(alpha_grid, min_grid)
-    Z_mean = np.zeros_like(A)
-    Z_p50 = np.zeros_like(A)
-    Z_range = np.zeros_like(A)
-    
-    for i in range(A.shape[0]):
-        for j in range(A.shape[1]):
-            _, quants, _ = sim.run_monte_carlo_with_convergence(500, A[i,j], M[i,j], 5000)
-            Z_mean[i,j] = sim.estimate_flux(quants['mean'])
-            Z_p50[i,j] = sim.estimate_flux(quants['P50'])
-            Z_range[i,j] = sim.estimate_flux(quants['P95']) - sim.estimate_flux(quants['P5'])
-    
-    surfaces = {'mean': (A, M, Z_mean), 'p50': (A, M, Z_p50), 'range': (A, M, Z_range)}
-    print("Surfaces ready!")
+    # Nested prior-uncertainty toggle
+    nested_state = {'on': False}
+    btn_nested = Button(plt.axes([0.85, button_y, 0.12, button_height]),
+                        'Prior Unc.: Off', color='lightgray', hovercolor='silver')
+    
+    # Retained artists: created once, update()/render_mc() only change their data
+    QUANT_COLORS = {'P5': 'blue', 'P50': 'green', 'P95': 'red'}
+    
+    size_line, = ax_size.plot([], [], 'r-', linewidth=2)
+    size_fill = ax_size.fill_between([1, 2], [0, 0], alpha=0.2, color='red')
+    ax_size.set_xlabel('μm', fontsize=8)
+    ax_size.set_xscale('log')
+    ax_size.set_ylim(0, 1.05)
+    ax_size.grid(alpha=0.3)
+    annot = CONFIG['plot_annotations']['size_distribution']
+    ax_size.text(0.02, 0.98, annot['what'], transform=ax_size.transAxes,
+                va='top', fontsize=5.5, bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.7))
+    
+    conv_line, = ax_convergence.plot([], [], linewidth=1.5, color='blue')
+    conv_final = ax_convergence.axhline(0, color='red', linestyle='--', label='Final Mean')
+    ax_convergence.set_title('MC Convergence', fontweight='bold', fontsize=9)
+    ax_convergence.set_xlabel('Iteration', fontsize=8)
+    ax_convergence.set_ylabel('Running Mean (mg)', fontsize=8)
+    ax_convergence.legend(fontsize=6)
+    ax_convergence.grid(alpha=0.3)
+    ax_convergence.text(0.02, 0.98, "Shows stability of estimate\\nwith more samples",
+                       transform=ax_convergence.transAxes, va='top', fontsize=5.5,
+                       bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.7))
+    
+    n_hist_bins = REWEIGHT_HIST_BINS
+    mass_bars = ax_mass.bar(np.zeros(n_hist_bins), np.zeros(n_hist_bins), width=1.0, align='edge',
+                            color='skyblue', edgecolor='black', alpha=0.6)
+    quant_lines = {q_name: ax_mass.axvline(0, color=color, linestyle='--', linewidth=2, label=q_name)
+                   for q_name, color in QUANT_COLORS.items()}
+    ax_mass.set_title('Particle Mass Distribution', fontweight='bold', fontsize=10)
+    ax_mass.set_xlabel('Log₁₀(mg)', fontsize=8)
+    ax_mass.set_ylabel('Density', fontsize=8)
+    mass_legend = ax_mass.legend(fontsize=7, loc='upper left')
+    ax_mass.grid(alpha=0.3)
+    
+    ax_results.axis('off')
+    results_box = ax_results.text(0.1, 0.5, '', transform=ax_results.transAxes,
+                                  va='center', fontsize=8, family='monospace',
+                                  bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
+    
+    # Surfaces are static after the precompute; only the current-point marker moves
+    current_markers = {}
+    for ax_surf in (ax_surf_mean, ax_surf_p50, ax_surf_range):
+        placeholders[ax_surf] = ax_surf.text2D(0.5, 0.5, "Computing surface...", ha='center', va='center',
+                                               fontsize=8, transform=ax_surf.transAxes, color='gray')
+    
+    def draw_surfaces(item_fluxes, surface):
+        A, M = np.array(surface['alpha']), np.array(surface['min_size'])
+        for ax_surf, surf_type, title, cmap in [(ax_surf_mean, 'mean', 'Mean Flux', 'viridis'),
+                                                  (ax_surf_p50, 'p50', 'P50 Flux', 'Greens'),
+                                                  (ax_surf_range, 'range', 'Uncertainty Range', 'Reds')]:
+            Z = sim.estimate_flux(surface['values'][surf_type])
+            placeholders.pop(ax_surf).remove()
+            ax_surf.plot_trisurf(A, M, Z, triangles=surface['triangles'], cmap=cmap, alpha=0.7,
+                                 edgecolor='none')
+        
+            peak = surface['extrema'][surf_type]['max']
+            z_max = sim.estimate_flux(peak['value'])
+            ax_surf.scatter([peak['alpha']], [peak['min_size']], [z_max],
+                          color='red', s=80, marker='^', label=f'Max: {z_max:.0f}')
+        
+            current_markers[surf_type] = ax_surf.scatter([A[0]], [M[0]], [Z[0]],
+                          color='yellow', s=60, marker='o', edgecolors='black')
+        
+            ax_surf.set_xlabel('α', fontsize=7)
+            ax_surf.set_ylabel('Min', fontsize=7)
+            ax_surf.set_zlabel('kt/yr', fontsize=7)
+            ax_surf.set_title(title, fontweight='bold', fontsize=9)
+            ax_surf.legend(fontsize=6)
+            ax_surf.view_init(elev=20, azim=-70)
+    
+        print("Surfaces ready!")
+        if ready['mc']:
+            update(None)
+    
+    ready = {'mc': False}
+    
+    def enable_mc(priors, item_fluxes):
+        # Sliders and buttons respond once the MC inputs are in; surfaces may still be computing
+        ready['mc'] = True
+        placeholders.pop(ax_results).remove()
+        update(None)
     
     def update(val):
+        if not ready['mc']:
+            return
         alpha, min_s, n = slider_alpha.val, slider_min.val, int(slider_n.val)
         
         # Size distribution
-        ax_size.clear()
         x = np.linspace(min_s, 5000, 1000)
         y = (x ** (-alpha)) / np.max(x ** (-alpha))
-        ax_size.plot(x, y, 'r-', linewidth=2)
-        ax_size.fill_between(x, y, alpha=0.2, color='red')
+        size_line.set_data(x, y)
+        size_fill.set_verts([np.column_stack([np.r_[x, x[::-1]], np.r_[y, np.zeros_like(y)]])])
+        ax_size.set_xlim(min_s, 5000)
         ax_size.set_title(f'Size Distribution (α={alpha:.2f})', fontweight='bold', fontsize=9)
-        ax_size.set_xlabel('μm', fontsize=8)
-        ax_size.set_xscale('log')
-        ax_size.grid(alpha=0.3)
-        annot = CONFIG['plot_annotations']['size_distribution']
-        ax_size.text(0.02, 0.98, annot['what'], transform=ax_size.transAxes,
-                    va='top', fontsize=5.5, bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.7))
         
         # MC with convergence
-        masses, quants, running_mean = sim.run_monte_carlo_with_convergence(n, alpha, min_s, 5000)
+        _, quants, running_mean = sim.run_monte_carlo_with_convergence(n, alpha, min_s, 5000)
+        render_mc(quants, running_mean, sim.histogram_last_run())
+    
+    def render_mc(quants, running_mean, mass_hist, refresh_nested=True):
+        alpha, min_s, n = slider_alpha.val, slider_min.val, int(slider_n.val)
         
         # Convergence plot
-        ax_convergence.clear()
-        ax_convergence.plot(running_mean * 1000, linewidth=1.5, color='blue')
-        ax_convergence.axhline(quants['mean'] * 1000, color='red', linestyle='--', label='Final Mean')
-        ax_convergence.set_title('MC Convergence', fontweight='bold', fontsize=9)
-        ax_convergence.set_xlabel('Iteration', fontsize=8)
-        ax_convergence.set_ylabel('Running Mean (mg)', fontsize=8)
-        ax_convergence.legend(fontsize=6)
-        ax_convergence.grid(alpha=0.3)
-        ax_convergence.text(0.02, 0.98, "Shows stability of estimate\\nwith more samples",
-                           transform=ax_convergence.transAxes, va='top', fontsize=5.5,
-                           bbox=dict(boxstyle='round', fc='lightyellow', alpha=0.7))
-        
-        # Mass distribution
-        ax_mass.clear()
-        ax_mass.hist(np.log10(masses * 1000 + 1e-12), bins=70,
-                    color='skyblue', edgecolor='black', alpha=0.6, density=True)
+        conv_line.set_data(np.arange(len(running_mean)), running_mean * 1000)
+        conv_final.set_ydata([quants['mean'] * 1000] * 2)
+        ax_convergence.relim()
+        ax_convergence.autoscale_view()
         
-        for q_name, q_val in quants.items():
-            if q_name in ['P5', 'P50', 'P95']:
-                color = {'P5': 'blue', 'P50': 'green', 'P95': 'red'}[q_name]
-                ax_mass.axvline(np.log10(q_val * 1000), color=color,
-                               linestyle='--', linewidth=2, label=f'{q_name}: {q_val*1000:.3f} mg')
+        # Mass distribution: density-normalised heights on the cached bin edges
+        counts, edges = mass_hist
+        widths = np.diff(edges)
+        heights = counts / max(counts.sum(), 1e-300) / widths
+        for bar, left, width, height in zip(mass_bars, edges[:-1], widths, heights):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
+        ax_mass.set_xlim(edges[0], edges[-1])
+        ax_mass.set_ylim(0, heights.max() * 1.05)
         
-        ax_mass.set_title('Particle Mass Distribution', fontweight='bold', fontsize=10)
-        ax_mass.set_xlabel('Log₁₀(mg)', fontsize=8)
-        ax_mass.set_ylabel('Density', fontsize=8)
-        ax_mass.legend(fontsize=7, loc='upper left')
-        ax_mass.grid(alpha=0.3)
+        for text, (q_name, line) in zip(mass_legend.get_texts(), quant_lines.items()):
+            q_val = quants[q_name]
+            line.set_xdata([np.log10(q_val * 1000)] * 2)
+            text.set_text(f'{q_name}: {q_val*1000:.3f} mg')
         
         # Results summary
-        ax_results.clear()
-        ax_results.axis('off')
-        
         flux_p5 = sim.estimate_flux(quants['P5'])
         flux_p50 = sim.estimate_flux(quants['P50'])
         flux_p95 = sim.estimate_flux(quants['P95'])
@@ -355,46 +581,44 @@ def create_enhanced_explorer():
         # Compare to literature
         lit_refs = CONFIG['reference_values']['literature_estimates']
         
+        # 95% bootstrap intervals of the current (possibly reweighted) draws
+        ci = sim.bootstrap_last_run()
+        
+        # Local elasticities from the pathwise derivatives of the same draws
+        elast = sim.elasticities_last_run(quants, alpha, min_s, 5000)
+        elast_rows = "".join(f"{stat:<5} {elast[stat][0]:>+6.2f} {elast[stat][1]:>+5.2f} {elast[stat][2]:>+5.2f}\n"
+                             for stat in ('mean', 'P50'))
+        
         results_text = (
-            f"═══ RESULTS (n={n}) ═══\\n"
-            f"P5:   {flux_p5:>7.1f} kt/yr\\n"
-            f"Mean: {flux_mean:>7.1f} kt/yr\\n"
-            f"P50:  {flux_p50:>7.1f} kt/yr\\n"
-            f"P95:  {flux_p95:>7.1f} kt/yr\\n"
-            f"───────────────────\\n"
-            f"Range: {flux_p95-flux_p5:.0f} kt/yr\\n"
-            f"CV: {(flux_p95-flux_p5)/(2*flux_p50)*100:.1f}%\\n"
-            f"\\n📚 Literature:\\n"
-            f"Lebreton'17: {lit_refs['Lebreton2017']['value']} kt/yr\\n"
+            f"═══ RESULTS (n={n}) ═══\n"
+            f"P5:   {flux_p5:>7.1f} [{ci['P5'][0]:.1f}, {ci['P5'][1]:.1f}]\n"
+            f"Mean: {flux_mean:>7.1f} [{ci['mean'][0]:.1f}, {ci['mean'][1]:.1f}]\n"
+            f"P50:  {flux_p50:>7.1f} [{ci['P50'][0]:.1f}, {ci['P50'][1]:.1f}]\n"
+            f"P95:  {flux_p95:>7.1f} [{ci['P95'][0]:.1f}, {ci['P95'][1]:.1f}]\n"
+            f"kt/yr [95% bootstrap CI]\n"
+            f"───────────────────\n"
+            f"Range: {flux_p95-flux_p5:.0f} kt/yr\n"
+            f"CV: {(flux_p95-flux_p5)/(2*flux_p50)*100:.1f}%\n"
+            f"Elasticity  α    min   max\n"
+            f"{elast_rows}"
+            f"\n📚 Literature:\n"
+            f"Lebreton'17: {lit_refs['Lebreton2017']['value']} kt/yr\n"
             f"Meijer'21: {lit_refs['Meijer2021']['value']} kt/yr"
         )
         
-        ax_results.text(0.1, 0.5, results_text, transform=ax_results.transAxes,
-                       va='center', fontsize=8, family='monospace',
-                       bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.8))
+        if nested_state['on']:
+            nested, current = sim.nested_band(alpha, min_s, 5000, refresh=refresh_nested)
+            results_text += "\n\nWith prior uncertainty (P5-P95):" + ("" if current else " [previous priors]")
+            for stat in ['mean', 'P50']:
+                band = nested[stat]
+                results_text += f"\n{stat:>4}: {band['P5']:.1f}-{band['P95']:.1f} kt/yr"
         
-        # Update surfaces
-        for ax_surf, surf_type, title, cmap in [(ax_surf_mean, 'mean', 'Mean Flux', 'viridis'),
-                                                  (ax_surf_p50, 'p50', 'P50 Flux', 'Greens'),
-                                                  (ax_surf_range, 'range', 'Uncertainty Range', 'Reds')]:
-            ax_surf.clear()
-            A, M, Z = surfaces[surf_type]
-            surf = ax_surf.plot_surface(A, M, Z, cmap=cmap, alpha=0.7, edgecolor='none')
-            
-            idx_max = np.unravel_index(np.argmax(Z), Z.shape)
-            ax_surf.scatter([A[idx_max]], [M[idx_max]], [Z[idx_max]],
-                          color='red', s=80, marker='^', label=f'Max: {Z[idx_max]:.0f}')
-            
-            current_z = sim.estimate_flux(quants['mean' if surf_type == 'mean' else 'P50']) if surf_type != 'range' else (flux_p95 - flux_p5)
-            ax_surf.scatter([alpha], [min_s], [current_z],
-                          color='yellow', s=60, marker='o', edgecolors='black')
-            
-            ax_surf.set_xlabel('α', fontsize=7)
-            ax_surf.set_ylabel('Min', fontsize=7)
-            ax_surf.set_zlabel('kt/yr', fontsize=7)
-            ax_surf.set_title(title, fontweight='bold', fontsize=9)
-            ax_surf.legend(fontsize=6)
-            ax_surf.view_init(elev=20, azim=-70)
+        results_box.set_text(results_text)
+        
+        # Move the current-point markers
+        current_z = {'mean': flux_mean, 'p50': flux_p50, 'range': flux_p95 - flux_p5}
+        for surf_type, marker in current_markers.items():
+            marker._offsets3d = ([alpha], [min_s], [current_z[surf_type]])
         
         fig.canvas.draw_idle()
     
@@ -409,22 +633,53 @@ def create_enhanced_explorer():
         slider_n.set_val(params['mc_samples'])
         print(f"Applied preset: {preset['name']}")
     
+    def update_priors(val):
+        if not ready['mc']:
+            return
+        low_density_polys = [p for p in sim.poly_probs_original if sim.densities.get(p, 1.0) < 1.0]
+        sim.set_prior_factors({'Shape_Fiber': slider_fiber.val},
+                              {p: slider_lowrho.val for p in low_density_polys})
+        plot_priors()
+        reweighted = sim.reweight_last_run()
+        if reweighted is None:
+            update(None)
+        else:
+            render_mc(*reweighted, refresh_nested=False)
+    
     def reset_priors_callback(event):
+        for slider in (slider_fiber, slider_lowrho):
+            slider.eventson = False
+            slider.set_val(1.0)
+            slider.eventson = True
         sim.reset_priors()
-        plot_priors()
+        update_priors(None)
+    
+    def toggle_nested_callback(event):
+        nested_state['on'] = not nested_state['on']
+        btn_nested.label.set_text(f"Prior Unc.: {'On' if nested_state['on'] else 'Off'}")
         update(None)
-        fig.canvas.draw_idle()
     
     btn_reset.on_clicked(reset_priors_callback)
+    btn_nested.on_clicked(toggle_nested_callback)
     slider_alpha.on_changed(update)
     slider_min.on_changed(update)
     slider_n.on_changed(update)
+    slider_fiber.on_changed(update_priors)
+    slider_lowrho.on_changed(update_priors)
     
-    update(None)
+    # Panels fill in on the GUI thread as their inputs resolve
+    watcher = FutureWatcher(fig)
+    watcher.when_done(sim.loads['basins'], sim.set_coastal_basins)
+    watcher.when_done(sim.loads['flux'], draw_item_flux)
+    watcher.when_done(sim.loads['priors'], draw_priors)
+    watcher.when_done([sim.loads['priors'], sim.loads['flux']], enable_mc)
+    watcher.when_done([sim.loads['flux'], surface_future], draw_surfaces)
+    watcher.start()
     plt.show()
 
 
 if __name__ == "__main__":
+    log_load_timings()
     print("="*70)
     print("Enhanced Coastal Flux Uncertainty Explorer")
     print("Comprehensive Monte Carlo Analysis with Sensitivity & Presets")
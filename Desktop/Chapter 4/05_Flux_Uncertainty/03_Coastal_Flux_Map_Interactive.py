@@ -13,6 +13,9 @@ import matplotlib.gridspec as gridspec
 import geopandas as gpd
 import os
 
+from dataset_daemon import attach_dataset
+from flux_ranking import FluxRanking
+
 plt.style.use('seaborn-v0_8-whitegrid')
 
 BASE_DIR = r"c:\Users\syyda\Desktop\Chapter 4"
@@ -88,10 +91,19 @@ class FluxCalculator:
         return np.mean(masses_g)
 
 
-def create_map_visualization():
+def load_coastal_basins():
+    # Attach to the dataset daemon's shared copy when one is running
+    shared = attach_dataset()
+    if shared is not None:
+        print("Attaching coastal basins from the dataset daemon...")
+        return shared.coastal_basins()
     print("Loading coastal basins...")
     gdf = gpd.read_file(LEV12_SHP)
-    coastal = gdf[gdf['COAST'] == 1].copy()
+    return gdf[gdf['COAST'] == 1].copy()
+
+
+def create_map_visualization():
+    coastal = load_coastal_basins()
     print(f"Found {len(coastal)} coastal basins")
     
     # Use discharge as proxy for item flux (proportional distribution)
@@ -101,6 +113,8 @@ def create_map_visualization():
     # Total item flux placeholder
     TOTAL_ITEMS = 1e15  # items/yr
     coastal['item_flux'] = coastal['flux_fraction'] * TOTAL_ITEMS
+    # Flux = item flux x one mean mass: order and cumulative shares are fixed, only the scale moves
+    ranking = FluxRanking(coastal['HYBAS_ID'], coastal['item_flux'])
     
     calc = FluxCalculator()
     
@@ -169,13 +183,15 @@ def create_map_visualization():
         ax_map.set_ylabel('Latitude', fontsize=10)
         ax_map.grid(alpha=0.3)
         
-        # Summary stats
-        total_flux = coastal['mass_flux_kt'].sum()
-        max_flux_basin = coastal.loc[coastal['mass_flux_kt'].idxmax()]
+        # Summary stats from the ranking index (no rescan of the basins)
+        summary = ranking.summary(mean_mass, n_top=1)
+        top = summary['top'][0]
+        shares = summary['count_for_share']
         
         stats_text = (
-            f"Total Coastal Flux: {total_flux:.1f} kt/yr\\n"
-            f"Max Basin Flux: {coastal['mass_flux_kt'].max():.2f} kt/yr (HYBAS_ID: {int(max_flux_basin['HYBAS_ID'])})\\n"
+            f"Total Coastal Flux: {summary['total']:.1f} kt/yr\n"
+            f"Max Basin Flux: {top['value']:.2f} kt/yr (HYBAS_ID: {top['id']}, {top['share']:.1%})\n"
+            f"50% / 90% of flux: {shares['0.5']} / {shares['0.9']} basins\n"
             f"Basins: {len(coastal)} | Quantile: P{int(quantile*100)}"
         )
         
@@ -3,6 +3,23 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import shapely
+from shapely import box
+
+from flux_ranking import FluxRanking, ranking_path_for
+from pfaf_rollup import CACHE_DIR, file_cache_key
+from pipeline_profiler import NULL_PROFILER, add_profiler_arguments, profiler_from_args
+from regional_priors import REGION_DIGITS, add_regional_arguments
+from river_routing import RiverNetwork
+from startup_loader import load_concurrently
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
 
 # --- Configuration ---
 # Use the detected python path if needed in executing, but this is the script content.
@@ -12,90 +29,529 @@ CSV_DDM30_PATH = r"c:\Users\syyda\Downloads\basins\basins\ddm30_MARINAMulti_Sept
 FLUX_DATA_PATH = r"c:\Users\syyda\Desktop\Chapter 4\04_Flux_Analysis\Flux_Data_Modeling.csv"
 OUTPUT_JS_PATH = r"c:\Users\syyda\Desktop\Chapter 4\05_Flux_Uncertainty\coastal_data_ddm30.js"
 
-def load_and_process():
-    print("Loading Data...")
-    
-    # 1. Load Flux Data (Model Results) n=900k
-    print(f"Reading Flux Data: {FLUX_DATA_PATH}")
-    # We need HYBAS_ID, Flux_Linear (Items?), Natural_Discharge_Upstream
-    use_cols = ['HYBAS_ID', 'Flux_Linear', 'Natural_Discharge_Upstream']
-    # Check if headers exist, read first row to confirm
-    df_flux = pd.read_csv(FLUX_DATA_PATH)
-    
+# --- Low-memory mode ---
+LOW_MEMORY_CHUNK_ROWS = 100000
+# float64 like the in-memory path, so both modes select and export identical values
+FLUX_DTYPES = {'HYBAS_ID': 'int64', 'Flux_Linear': 'float64', 'Natural_Discharge_Upstream': 'float64'}
+# Provenance written into the export per aggregation mode
+AGGREGATION_SOURCES = {
+    'outlet': "DDM30 Aggregated (Max Discharge Outlet)",
+    'overlay': "DDM30 Aggregated (Area-Weighted Overlay of De-accumulated Local Loads)",
+}
+
+# Working set of one polygon in a batch (read, centroid, DDM30 query), as measured RSS growth
+# on 20k-polygon batches of 5 / 64 / 512 vertices: ~2.2 kB per row plus ~2.5x its .shp bytes
+POLYGON_ROW_OVERHEAD = 2200
+POLYGON_DISK_FACTOR = 2.5
+# Fallback when the atlas cannot be inspected: a polygon of ~5.5 kB on disk (~340 vertices)
+BYTES_PER_POLYGON_ROW = 16 * 1024
+
+def polygon_row_bytes(atlas_path=None):
+    """Estimated batch working set per polygon, from the atlas' mean .shp record size"""
+    if atlas_path is not None:
+        shx_path = os.path.splitext(atlas_path)[0] + '.shx'
+        if os.path.exists(atlas_path) and os.path.exists(shx_path):
+            # .shx: 100-byte header, then 8 bytes per record
+            n_records = (os.path.getsize(shx_path) - 100) // 8
+            if n_records > 0:
+                return POLYGON_ROW_OVERHEAD + POLYGON_DISK_FACTOR * os.path.getsize(atlas_path) / n_records
+    return BYTES_PER_POLYGON_ROW
+
+def chunk_rows_for_budget(memory_budget_mb, atlas_path=None):
+    """Batch size that keeps polygon batches within half of the RAM budget"""
+    return max(5000, int(memory_budget_mb * 1024**2 * 0.5 / polygon_row_bytes(atlas_path)))
+
+
+# --- Partitioned mode ---
+# Level 12 HYBAS_IDs: region digit, level (2 digits), 7-digit sequence
+HYBAS_REGION_DIVISOR = 10**9
+PARTITION_TILE_DEG = 30.0
+# Atlas polygons are read with this margin around a tile so that basins whose
+# centroid falls in the tile but whose polygon does not touch it are not lost
+PARTITION_HALO_DEG = 1.0
+
+# --- Overlay mode ---
+# Equal-area CRS for intersection areas (WGS 84 / NSIDC EASE-Grid 2.0 Global)
+OVERLAY_CRS = 'EPSG:6933'
+# Border pairs (Level 12 polygon crossing a DDM30 boundary) per worker task
+OVERLAY_CHUNK_PAIRS = 20000
+
+
+def read_ddm30_polygons(ddm30_shp_path, **read_kwargs):
+    """DDM30 polygons renamed to the DDM30 CSV schema (Basin_ID, Basin_name), in EPSG:4326"""
+    gdf_ddm30 = gpd.read_file(ddm30_shp_path, **read_kwargs)
+    # Rename columns to match DDM30 CSV schema
+    gdf_ddm30 = gdf_ddm30.rename(columns={'subbasn': 'Basin_ID', 'name': 'Basin_name'})
+    if gdf_ddm30.crs and gdf_ddm30.crs.to_epsg() != 4326:
+        gdf_ddm30 = gdf_ddm30.to_crs(epsg=4326)
+    return gdf_ddm30
+
+
+def read_flux_table(flux_path):
+    df_flux = pd.read_csv(flux_path)
     # Ensure HYBAS_ID is int64
     df_flux['HYBAS_ID'] = df_flux['HYBAS_ID'].astype('int64')
-    print(f"  - Flux Records: {len(df_flux)}")
+    return df_flux
 
-    # 2. Load BasinATLAS Geometry (n=huge)
-    # We need to attach geometry to df_flux based on HYBAS_ID
-    print(f"Reading BasinATLAS SHP (This may take a moment): {SHP_BASIN_ATLAS_PATH}")
+
+def read_atlas_polygons(atlas_path):
     # Read only geometry and HYBAS_ID to save memory
-    gdf_atlas = gpd.read_file(SHP_BASIN_ATLAS_PATH, include_fields=['HYBAS_ID', 'geometry']) 
+    gdf_atlas = gpd.read_file(atlas_path, include_fields=['HYBAS_ID', 'geometry']) 
     # Note: 'include_fields' might not be supported in older fiona/gpd versions, 
     # but gpd.read_file reads all. We'll filter columns after read if needed.
-    
     gdf_atlas['HYBAS_ID'] = gdf_atlas['HYBAS_ID'].astype('int64')
+    return gdf_atlas
+
+
+def assign_outlets_by_centroid(flux_path, atlas_path, ddm30_shp_path, profiler=NULL_PROFILER):
+    """Full in-memory path: one Level 12 outlet (max discharge) per DDM30 basin"""
+    # 1-2. Flux Data (Model Results, n=900k), BasinATLAS geometry (n=huge) and the
+    # DDM30 polygons are independent reads: run them concurrently
+    print(f"Reading Flux Data: {flux_path}")
+    print(f"Reading BasinATLAS SHP (This may take a moment): {atlas_path}")
+    print(f"Reading DDM30 SHP: {ddm30_shp_path}")
+    with profiler.stage('load_inputs') as st:
+        loads = load_concurrently(flux=(read_flux_table, flux_path), atlas=(read_atlas_polygons, atlas_path),
+                                  ddm30=(read_ddm30_polygons, ddm30_shp_path))
+        df_flux = loads['flux'].result()
+        gdf_atlas = loads['atlas'].result()
+        st.rows = len(gdf_atlas)
+    print(f"  - Flux Records: {len(df_flux)}")
     print(f"  - BasinATLAS Polygons: {len(gdf_atlas)}")
     
     # 3. Merge Flux Data with Geometry
     print("Merging Flux Data with Geometry...")
     # Inner join: Only map basins we have flux data for
-    gdf_flux = gdf_atlas.merge(df_flux, on='HYBAS_ID', how='inner')
+    with profiler.stage('merge_flux_geometry') as st:
+        gdf_flux = gdf_atlas.merge(df_flux, on='HYBAS_ID', how='inner')
+        st.rows = len(gdf_flux)
     print(f"  - Mapped Flux Basins: {len(gdf_flux)}")
     
-    # Free up memory
+    # Free up memory (the finished futures hold references too)
     del gdf_atlas
     del df_flux
+    del loads['atlas'], loads['flux']
     
     # 4. Convert to Centroids for Point-in-Polygon check?
     # Or keep as polygons for potential intersection?
     # Centroids are faster for "Assignment".
     print("Calculating Centroids...")
-    gdf_flux['centroid'] = gdf_flux.geometry.centroid
-    gdf_flux = gdf_flux.set_geometry('centroid') # Set active geometry to centroid
-    # drop polygon geometry to save memory if verified
-    # gdf_flux = gdf_flux.drop(columns=['geometry']) 
-    
-    # 5. Load DDM30 Basins
-    print(f"Reading DDM30 SHP: {SHP_DDM30_PATH}")
-    gdf_ddm30 = gpd.read_file(SHP_DDM30_PATH)
-    # Rename columns to match DDM30 CSV schema
-    gdf_ddm30 = gdf_ddm30.rename(columns={'subbasn': 'Basin_ID', 'name': 'Basin_name'})
+    with profiler.stage('centroids') as st:
+        gdf_flux['centroid'] = gdf_flux.geometry.centroid
+        gdf_flux = gdf_flux.set_geometry('centroid') # Set active geometry to centroid
+        # drop polygon geometry to save memory if verified
+        # gdf_flux = gdf_flux.drop(columns=['geometry']) 
+        st.rows = len(gdf_flux)
     
-    if gdf_ddm30.crs and gdf_ddm30.crs.to_epsg() != 4326:
-        gdf_ddm30 = gdf_ddm30.to_crs(epsg=4326)
+    # 5. DDM30 Basins (loaded alongside the other inputs)
+    with profiler.stage('read_ddm30') as st:
+        gdf_ddm30 = loads['ddm30'].result()
         
-    # Ensure Flux Data is CRS 4326
-    if gdf_flux.crs and gdf_flux.crs.to_epsg() != 4326:
-        gdf_flux = gdf_flux.to_crs(epsg=4326)
+        # Ensure Flux Data is CRS 4326
+        if gdf_flux.crs and gdf_flux.crs.to_epsg() != 4326:
+            gdf_flux = gdf_flux.to_crs(epsg=4326)
+        st.rows = len(gdf_ddm30)
 
     # 6. Spatial Join: Assign Lev12 Subbasins to DDM30 Basins
     print("Performing Spatial Join (Level 12 Centroids -> DDM30 Polygons)...")
     # outcome: each Lev12 ID will have a DDM30 Basin_ID
-    joined = gpd.sjoin(gdf_flux, gdf_ddm30[['Basin_ID', 'Basin_name', 'geometry']], how="inner", predicate="within")
+    with profiler.stage('sjoin') as st:
+        joined = gpd.sjoin(gdf_flux, gdf_ddm30[['Basin_ID', 'Basin_name', 'geometry']], how="inner", predicate="within")
+        st.rows = len(joined)
     print(f"  - Joined Records: {len(joined)}")
     
     # 7. Aggregate: Select Representative Outlet per DDM30 Basin
     print("Aggregating to DDM30 (Selecting Outlet)...")
     # For each DDM30 Basin_ID, select the Lev12 subbasin with Max Discharge
     
-    # Sort by Discharge descending
-    joined_sorted = joined.sort_values(by='Natural_Discharge_Upstream', ascending=False)
+    with profiler.stage('select_outlets') as st:
+        # Sort by Discharge descending
+        joined_sorted = joined.sort_values(by='Natural_Discharge_Upstream', ascending=False)
     
-    # Drop duplicates on Basin_ID, keeping first (which is Max Discharge)
-    ddm30_aggregated = joined_sorted.drop_duplicates(subset=['Basin_ID'], keep='first')
+        # Drop duplicates on Basin_ID, keeping first (which is Max Discharge)
+        ddm30_aggregated = joined_sorted.drop_duplicates(subset=['Basin_ID'], keep='first')
+        st.rows = len(ddm30_aggregated)
     
     print(f"  - Aggregated DDM30 Basins: {len(ddm30_aggregated)}")
     
+    return ddm30_aggregated
+
+
+def assign_outlets_low_memory(flux_path, atlas_path, ddm30_shp_path,
+                              chunk_rows=LOW_MEMORY_CHUNK_ROWS, profiler=NULL_PROFILER):
+    """
+    Memory-bounded variant of assign_outlets_by_centroid (same output).
+    - First pass over the flux CSV keeps only its HYBAS_IDs (8 bytes per row)
+    - BasinATLAS read chunk_rows polygons at a time; each batch is reduced to
+      centroids, assigned to DDM30 polygons and its polygons dropped at once
+    - Second pass streams the flux CSV (float64) against the (HYBAS_ID, Basin_ID)
+      keys and keeps the running max-discharge row per DDM30 basin, so no full
+      flux table is held
+    """
+    print(f"Reading Flux IDs in chunks of {chunk_rows} rows: {flux_path}")
+    with profiler.stage('read_flux_ids') as st:
+        chunks = pd.read_csv(flux_path, usecols=['HYBAS_ID'], dtype={'HYBAS_ID': 'int64'}, chunksize=chunk_rows)
+        flux_ids = np.concatenate([chunk['HYBAS_ID'].values for chunk in chunks])
+        st.rows = len(flux_ids)
+    print(f"  - Flux Records: {len(flux_ids)}")
+    
+    print(f"Reading DDM30 SHP: {ddm30_shp_path}")
+    with profiler.stage('read_ddm30') as st:
+        gdf_ddm30 = read_ddm30_polygons(ddm30_shp_path)
+        ddm30_names = pd.DataFrame(gdf_ddm30[['Basin_ID', 'Basin_name']])
+        ddm30_ids = gdf_ddm30['Basin_ID'].values
+        ddm30_tree = gdf_ddm30.sindex
+        st.rows = len(gdf_ddm30)
+    
+    print(f"Streaming BasinATLAS polygons -> centroids -> DDM30 ({chunk_rows} per batch)...")
+    hybas_parts, basin_parts = [], []
+    with profiler.stage('stream_centroids_sjoin') as st:
+        start = 0
+        while True:
+            batch = gpd.read_file(atlas_path, columns=['HYBAS_ID'], rows=slice(start, start + chunk_rows))
+            n_read = len(batch)
+            if n_read == 0:
+                break
+            ids = batch['HYBAS_ID'].values.astype('int64')
+            keep = np.isin(ids, flux_ids)
+            centroids = gpd.GeoSeries(batch.geometry.values[keep].centroid, crs=batch.crs)
+            del batch  # polygons are not needed past this point
+            if centroids.crs and centroids.crs.to_epsg() != 4326:
+                centroids = centroids.to_crs(epsg=4326)
+            
+            point_idx, poly_idx = ddm30_tree.query(centroids.values, predicate='within')
+            hybas_parts.append(ids[keep][point_idx])
+            basin_parts.append(ddm30_ids[poly_idx])
+            print(f"  - Polygons {start}-{start + n_read}: {len(point_idx)} assigned")
+            start += n_read
+            if n_read < chunk_rows:
+                break
+        keys = pd.DataFrame({'HYBAS_ID': np.concatenate(hybas_parts) if hybas_parts else np.array([], dtype='int64'),
+                             'Basin_ID': np.concatenate(basin_parts) if basin_parts else np.array([])})
+        st.rows = len(keys)
+    print(f"  - Joined Records: {len(keys)}")
+    
+    print("Aggregating to DDM30 (Selecting Outlet, streaming flux values)...")
+    with profiler.stage('select_outlets') as st:
+        # Running best row per Basin_ID; candidates are at most one per basin plus one chunk
+        best = None
+        for chunk in pd.read_csv(flux_path, usecols=list(FLUX_DTYPES), dtype=FLUX_DTYPES, chunksize=chunk_rows):
+            candidates = keys.merge(chunk, on='HYBAS_ID', how='inner')
+            if best is not None:
+                candidates = pd.concat([best, candidates], ignore_index=True)
+            best = (candidates.sort_values(by='Natural_Discharge_Upstream', ascending=False, kind='stable')
+                              .drop_duplicates(subset=['Basin_ID'], keep='first'))
+        del keys
+        if best is None:
+            best = pd.DataFrame(columns=['HYBAS_ID', 'Basin_ID'] + list(FLUX_DTYPES)[1:])
+        
+        # DDM30 names for the selected outlets only
+        ddm30_aggregated = best.reset_index(drop=True).merge(ddm30_names, on='Basin_ID', how='left')
+        st.rows = len(ddm30_aggregated)
+    print(f"  - Aggregated DDM30 Basins: {len(ddm30_aggregated)}")
+    
+    return ddm30_aggregated
+
+# Per-process state for partition workers (set once by the pool initializer)
+_WORKER_FLUX = None
+
+
+def _init_partition_worker(flux_keys):
+    global _WORKER_FLUX
+    _WORKER_FLUX = flux_keys
+
+
+def region_partitions(hybas_ids):
+    """One partition per BasinATLAS region present in the flux table"""
+    regions = np.unique(np.asarray(hybas_ids) // HYBAS_REGION_DIVISOR)
+    return [{'name': f'region_{r}',
+             'where': f"HYBAS_ID >= {r * HYBAS_REGION_DIVISOR} AND HYBAS_ID < {(r + 1) * HYBAS_REGION_DIVISOR}"}
+            for r in regions]
+
+
+def tile_partitions(tile_deg=PARTITION_TILE_DEG, halo_deg=PARTITION_HALO_DEG):
+    """Lon/lat tiles; a basin belongs to the tile containing its centroid"""
+    nx = int(np.ceil(360.0 / tile_deg))
+    ny = int(np.ceil(180.0 / tile_deg))
+    parts = []
+    for j in range(ny):
+        for i in range(nx):
+            x0, y0 = -180.0 + i * tile_deg, -90.0 + j * tile_deg
+            parts.append({'name': f'tile_{i}_{j}', 'tile': (i, j), 'tile_deg': tile_deg,
+                          'bbox': (x0 - halo_deg, y0 - halo_deg,
+                                   x0 + tile_deg + halo_deg, y0 + tile_deg + halo_deg)})
+    return parts
+
+
+def assign_partition(part, atlas_path, ddm30_shp_path):
+    """
+    Centroid -> DDM30 assignment for one partition, run inside a worker process.
+    Only this partition's Level 12 polygons and the DDM30 polygons overlapping
+    its centroid extent are loaded. DDM30 basins that straddle partition borders
+    are read by every partition they touch; the returned per-partition outlets
+    are reduced again by the caller.
+    """
+    t0 = time.perf_counter()
+    gdf = gpd.read_file(atlas_path, columns=['HYBAS_ID'], where=part.get('where'), bbox=part.get('bbox'))
+    ids = gdf['HYBAS_ID'].values.astype('int64')
+    keep = np.isin(ids, _WORKER_FLUX.index.values)
+    centroids = gpd.GeoSeries(gdf.geometry.values[keep].centroid, crs=gdf.crs)
+    n_polygons = len(gdf)
+    del gdf
+    ids = ids[keep]
+    if centroids.crs and centroids.crs.to_epsg() != 4326:
+        centroids = centroids.to_crs(epsg=4326)
+    
+    if 'tile' in part:
+        # Ownership: drop centroids that belong to a neighbouring tile (halo)
+        size = part['tile_deg']
+        ix = np.floor((centroids.x.values + 180.0) / size)
+        iy = np.floor((centroids.y.values + 90.0) / size)
+        nx, ny = int(np.ceil(360.0 / size)), int(np.ceil(180.0 / size))
+        own = ((np.clip(ix, 0, nx - 1) == part['tile'][0]) & (np.clip(iy, 0, ny - 1) == part['tile'][1]))
+        centroids, ids = centroids[own], ids[own]
+    
+    empty = pd.DataFrame({'HYBAS_ID': np.array([], dtype='int64'), 'Basin_ID': np.array([]),
+                          'Basin_name': np.array([], dtype=object),
+                          'Natural_Discharge_Upstream': np.array([], dtype='float32')})
+    stats = {'name': part['name'], 'polygons': n_polygons, 'centroids': len(ids)}
+    if len(ids) == 0:
+        stats['seconds'] = time.perf_counter() - t0
+        return empty, stats
+    
+    extent = gpd.GeoSeries([box(*centroids.total_bounds)], crs='EPSG:4326')
+    gdf_ddm30 = read_ddm30_polygons(ddm30_shp_path, bbox=extent)
+    
+    point_idx, poly_idx = gdf_ddm30.sindex.query(centroids.values, predicate='within')
+    keys = pd.DataFrame({'HYBAS_ID': ids[point_idx],
+                         'Basin_ID': gdf_ddm30['Basin_ID'].values[poly_idx],
+                         'Basin_name': gdf_ddm30['Basin_name'].values[poly_idx]})
+    keys['Natural_Discharge_Upstream'] = _WORKER_FLUX.reindex(keys['HYBAS_ID']).values
+    
+    # Local outlet per DDM30 basin; the caller picks the max across partitions
+    keys = keys.sort_values(by='Natural_Discharge_Upstream', ascending=False)
+    keys = keys.drop_duplicates(subset=['Basin_ID'], keep='first')
+    stats.update(ddm30_polygons=len(gdf_ddm30), outlets=len(keys), seconds=time.perf_counter() - t0)
+    return keys, stats
+
+
+def assign_outlets_partitioned(flux_path, atlas_path, ddm30_shp_path, partition_by='region',
+                               tile_deg=PARTITION_TILE_DEG, max_workers=None, profiler=NULL_PROFILER):
+    """
+    Partitioned variant of assign_outlets_by_centroid for full-planet runs.
+    - partition_by='region': one partition per HYBAS_ID region digit (attribute-filtered reads)
+    - partition_by='tile': tile_deg lon/lat tiles with a halo (bbox-filtered reads)
+    Partitions run in a process pool, so no process holds the whole geometry set.
+    """
+    print(f"Reading Flux Data: {flux_path}")
+    with profiler.stage('read_flux_csv') as st:
+        df_flux = pd.read_csv(flux_path, usecols=list(FLUX_DTYPES), dtype={'HYBAS_ID': 'int64'})
+        st.rows = len(df_flux)
+    print(f"  - Flux Records: {len(df_flux)}")
+    
+    if partition_by == 'region':
+        partitions = region_partitions(df_flux['HYBAS_ID'].values)
+    elif partition_by == 'tile':
+        partitions = tile_partitions(tile_deg)
+    else:
+        raise ValueError(f"Unknown partition_by: {partition_by}")
+    
+    flux_keys = df_flux.set_index('HYBAS_ID')['Natural_Discharge_Upstream']
+    print(f"Assigning {len(partitions)} partitions ({partition_by}) in a process pool...")
+    with profiler.stage('partition_workers') as st:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_partition_worker,
+                                 initargs=(flux_keys,)) as pool:
+            futures = [pool.submit(assign_partition, part, atlas_path, ddm30_shp_path) for part in partitions]
+            results = [f.result() for f in futures]
+        parts = [keys for keys, _ in results if len(keys)]
+        candidates = pd.concat(parts, ignore_index=True) if parts else results[0][0]
+        st.rows = len(candidates)
+    for _, stats in results:
+        if stats['centroids']:
+            print(f"  - {stats['name']}: {stats['centroids']} centroids -> "
+                  f"{stats['outlets']} outlets ({stats['seconds']:.1f} s)")
+    
+    print("Aggregating to DDM30 (Selecting Outlet)...")
+    with profiler.stage('select_outlets') as st:
+        candidates = candidates.sort_values(by='Natural_Discharge_Upstream', ascending=False)
+        outlets = candidates.drop_duplicates(subset=['Basin_ID'], keep='first')[['HYBAS_ID', 'Basin_ID', 'Basin_name']]
+        ddm30_aggregated = outlets.merge(df_flux, on='HYBAS_ID', how='left')
+        for col in ['Flux_Linear', 'Natural_Discharge_Upstream']:
+            ddm30_aggregated[col] = ddm30_aggregated[col].astype('float64')
+        st.rows = len(ddm30_aggregated)
+    print(f"  - Aggregated DDM30 Basins: {len(ddm30_aggregated)}")
+    
+    return ddm30_aggregated
+
+
+def _to_equal_area(geoseries):
+    """Geometries clipped to the valid lon/lat range (no antimeridian overshoot) and projected to OVERLAY_CRS"""
+    if geoseries.crs and geoseries.crs.to_epsg() != 4326:
+        geoseries = geoseries.to_crs(epsg=4326)
+    clipped = gpd.GeoSeries(shapely.clip_by_rect(geoseries.values.to_numpy(), -180.0, -90.0, 180.0, 90.0),
+                            crs=geoseries.crs)
+    return clipped.to_crs(OVERLAY_CRS).values.to_numpy()
+
+
+def _intersection_area_chunk(lev12_geoms, ddm30_geoms, lev12_pos, ddm30_pos):
+    """Intersection areas of one chunk of border pairs; geometries are the chunk's unique polygons"""
+    return shapely.area(shapely.intersection(lev12_geoms[lev12_pos], ddm30_geoms[ddm30_pos]))
+
+
+def overlay_weights(atlas_path, ddm30_shp_path, max_workers=None, cache_dir=CACHE_DIR,
+                    chunk_pairs=OVERLAY_CHUNK_PAIRS, profiler=NULL_PROFILER):
+    """
+    Sparse (n_ddm30, n_lev12) matrix W with W[j, i] = share of Level 12 basin i's area inside DDM30 basin j.
+    - Both layers projected to an equal-area CRS
+    - Candidate pairs from an STRtree query; pairs whose Level 12 polygon lies inside
+      the DDM30 polygon get weight 1 without computing an intersection
+    - Remaining border pairs are intersected in chunks in a process pool
+    Cached per pair of shapefiles. Returns (W, hybas_ids, ddm30 DataFrame of Basin_ID/Basin_name).
+    """
+    if sparse is None:
+        raise ImportError("Overlay mode needs scipy (scipy.sparse)")
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"ddm30_overlay_{file_cache_key(atlas_path)}_{file_cache_key(ddm30_shp_path)}.npz")
+        if os.path.exists(cache_path):
+            with np.load(cache_path, allow_pickle=True) as data:
+                weights = sparse.csr_matrix((data['data'], data['indices'], data['indptr']), shape=tuple(data['shape']))
+                ddm30 = pd.DataFrame({'Basin_ID': data['basin_ids'], 'Basin_name': data['basin_names']})
+                print(f"Loaded overlay weights: {cache_path}")
+                return weights, data['hybas_ids'], ddm30
+
+    print(f"Reading BasinATLAS and DDM30 polygons for the overlay ({OVERLAY_CRS})...")
+    with profiler.stage('read_project_polygons') as st:
+        gdf_atlas = gpd.read_file(atlas_path, columns=['HYBAS_ID'])
+        hybas_ids = gdf_atlas['HYBAS_ID'].values.astype('int64')
+        lev12 = _to_equal_area(gdf_atlas.geometry)
+        del gdf_atlas
+        gdf_ddm30 = read_ddm30_polygons(ddm30_shp_path)
+        ddm30 = pd.DataFrame(gdf_ddm30[['Basin_ID', 'Basin_name']]).reset_index(drop=True)
+        ddm30_geoms = _to_equal_area(gdf_ddm30.geometry)
+        del gdf_ddm30
+        lev12_area = shapely.area(lev12)
+        st.rows = len(lev12)
+
+    with profiler.stage('candidate_pairs') as st:
+        tree = shapely.STRtree(lev12)
+        ddm30_idx, lev12_idx = tree.query(ddm30_geoms, predicate='intersects')
+        inner_ddm30, inner_lev12 = tree.query(ddm30_geoms, predicate='contains_properly')
+        n_lev12 = len(lev12)
+        border = ~np.isin(ddm30_idx * n_lev12 + lev12_idx, inner_ddm30 * n_lev12 + inner_lev12)
+        border_ddm30, border_lev12 = ddm30_idx[border], lev12_idx[border]
+        st.rows = len(ddm30_idx)
+    print(f"  - Candidate pairs: {len(ddm30_idx)} ({len(inner_lev12)} inside, {len(border_lev12)} on borders)")
+
+    with profiler.stage('border_intersections') as st:
+        # Sorted by DDM30 polygon so each task ships few (large) DDM30 geometries
+        order = np.lexsort((border_lev12, border_ddm30))
+        border_ddm30, border_lev12 = border_ddm30[order], border_lev12[order]
+        tasks = []
+        for start in range(0, len(order), chunk_pairs):
+            lev_u, lev_pos = np.unique(border_lev12[start:start + chunk_pairs], return_inverse=True)
+            ddm_u, ddm_pos = np.unique(border_ddm30[start:start + chunk_pairs], return_inverse=True)
+            tasks.append((lev12[lev_u], ddm30_geoms[ddm_u], lev_pos, ddm_pos))
+        if len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                areas = list(pool.map(_intersection_area_chunk, *zip(*tasks)))
+        else:
+            areas = [_intersection_area_chunk(*task) for task in tasks]
+        border_area = np.concatenate(areas) if areas else np.array([])
+        st.rows = len(border_area)
+
+    with profiler.stage('weight_matrix') as st:
+        rows = np.concatenate([inner_ddm30, border_ddm30])
+        cols = np.concatenate([inner_lev12, border_lev12])
+        share = np.concatenate([np.ones(len(inner_lev12)),
+                                border_area / np.where(lev12_area[border_lev12] > 0, lev12_area[border_lev12], 1.0)])
+        keep = share > 0
+        weights = sparse.csr_matrix((np.minimum(share[keep], 1.0), (rows[keep], cols[keep])),
+                                    shape=(len(ddm30_geoms), n_lev12))
+        st.rows = weights.nnz
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(cache_path, data=weights.data, indices=weights.indices, indptr=weights.indptr,
+                 shape=np.array(weights.shape), hybas_ids=hybas_ids,
+                 basin_ids=ddm30['Basin_ID'].values, basin_names=ddm30['Basin_name'].values.astype(object))
+    return weights, hybas_ids, ddm30
+
+
+def aggregate_by_overlay(flux_path, atlas_path, ddm30_shp_path, max_workers=None,
+                         cache_dir=CACHE_DIR, profiler=NULL_PROFILER):
+    """
+    Area-weighted alternative to the outlet selection.
+    Flux_Linear and Natural_Discharge_Upstream are accumulated along the river network,
+    so they are first reduced to local (per-basin) contributions; each DDM30 basin then
+    receives W @ local, i.e. every Level 12 basin split by the area it shares with it.
+    Basins straddling a border are shared, and basins outside every DDM30 polygon
+    contribute only the part that overlaps one.
+    Atlas basins missing from the flux table count as 0 and negative residuals are clipped,
+    which moves an unmatched basin's upstream load onto the next matched basin downstream;
+    both counts are reported and kept in attrs['overlay_audit'] (written to the export).
+    """
+    weights, hybas_ids, ddm30 = overlay_weights(atlas_path, ddm30_shp_path, max_workers, cache_dir,
+                                                profiler=profiler)
+
+    print(f"Reading Flux Data: {flux_path}")
+    with profiler.stage('read_flux_csv') as st:
+        df_flux = pd.read_csv(flux_path, usecols=list(FLUX_DTYPES), dtype={'HYBAS_ID': 'int64'})
+        st.rows = len(df_flux)
+
+    print("De-accumulating flux along NEXT_DOWN and applying the overlay weights...")
+    with profiler.stage('overlay_aggregate') as st:
+        network = RiverNetwork.from_atlas(atlas_path, cache_dir)
+        position = network.index.get_indexer(hybas_ids)
+        matched = np.zeros(len(network.hybas_ids), dtype=bool)
+        lookup = network.index.get_indexer(df_flux['HYBAS_ID'].values)
+        matched[lookup[lookup >= 0]] = True
+        audit = {'n_atlas_basins': int(len(matched)), 'n_unmatched': int((~matched).sum()), 'clipped': {}}
+        columns = {}
+        for col in ['Flux_Linear', 'Natural_Discharge_Upstream']:
+            local = network.local_loads(network.align(df_flux['HYBAS_ID'].values, df_flux[col].values), clip=False)
+            negative = local < 0
+            audit['clipped'][col] = {'n_basins': int(negative.sum()), 'amount': float(-local[negative].sum())}
+            columns[col] = weights @ np.maximum(local, 0.0)[position]
+        ddm30_aggregated = ddm30.assign(**columns, n_lev12=np.diff(weights.indptr))
+        ddm30_aggregated = ddm30_aggregated[ddm30_aggregated['n_lev12'] > 0].reset_index(drop=True)
+        ddm30_aggregated.attrs['overlay_audit'] = audit
+        st.rows = len(ddm30_aggregated)
+
+    if audit['n_unmatched']:
+        print(f"  Warning: {audit['n_unmatched']} of {audit['n_atlas_basins']} Level 12 basins have no flux row; "
+              f"their upstream load is attributed to the next matched basin downstream")
+    for col, clipped in audit['clipped'].items():
+        if clipped['n_basins']:
+            print(f"  Warning: {clipped['n_basins']} negative local {col} residuals clipped to 0 "
+                  f"(total {clipped['amount']:.4g})")
+
+    covered = np.asarray(weights.sum(axis=0)).ravel()
+    print(f"  - Aggregated DDM30 Basins: {len(ddm30_aggregated)} "
+          f"({int((covered > 0).sum())} Level 12 basins overlap DDM30, {int(((covered > 0) & (covered < 0.999)).sum())} partially)")
+    return ddm30_aggregated
+
+
+def write_ddm30_export(ddm30_aggregated, ddm30_csv_path=CSV_DDM30_PATH, output_path=OUTPUT_JS_PATH,
+                       profiler=NULL_PROFILER, regional_mass=None, method='outlet'):
+    """
+    Join selected outlets with the DDM30 metadata, apply Include_Flag and write window.COASTAL_DATA_DDM30.
+    method: 'outlet' or 'overlay', recorded as the export's source/method (the two differ in what a
+    basin's flux means: the outlet's accumulated flux vs the area-weighted sum of local loads).
+    regional_mass: optional RegionalMass; each basin's mass per item is scaled by its region's
+    composition factor (regional / global-prior mass), matched by Basin_ID or outlet HYBAS_ID.
+    """
     # 8. Load DDM30 CSV for Filters and correct Mouth Coordinates
-    print(f"Reading DDM30 Metadata: {CSV_DDM30_PATH}")
-    try:
-        df_ddm30_meta = pd.read_csv(CSV_DDM30_PATH, encoding='latin1')
-    except:
+    print(f"Reading DDM30 Metadata: {ddm30_csv_path}")
+    with profiler.stage('read_ddm30_meta') as st:
         try:
-            df_ddm30_meta = pd.read_csv(CSV_DDM30_PATH, encoding='utf-8-sig')
+            df_ddm30_meta = pd.read_csv(ddm30_csv_path, encoding='latin1')
         except:
-            df_ddm30_meta = pd.read_csv(CSV_DDM30_PATH, encoding='utf-8')
+            try:
+                df_ddm30_meta = pd.read_csv(ddm30_csv_path, encoding='utf-8-sig')
+            except:
+                df_ddm30_meta = pd.read_csv(ddm30_csv_path, encoding='utf-8')
+        st.rows = len(df_ddm30_meta)
     
     import sys
     print("Aggregated Columns:", ddm30_aggregated.columns.tolist())
@@ -125,70 +581,158 @@ def load_and_process():
 
     # Merge aggregated flux with DDM30 metadata (Coordinates, Filtering info)
     # We prefer Lat_mouth/Lon_mouth from DDM30 meta over the Lev12 centroid
-    final_df = pd.merge(ddm30_aggregated, df_ddm30_meta, on='Basin_ID', how='inner', suffixes=('_lev12', '_ddm30'))
+    with profiler.stage('merge_meta_filter') as st:
+        final_df = pd.merge(ddm30_aggregated, df_ddm30_meta, on='Basin_ID', how='inner', suffixes=('_lev12', '_ddm30'))
     
-    # 9. Apply Filters
-    # "filter should also be appied by using ddm30 related file"
-    # Filter by Include_Flag if present
-    if 'Include_Flag' in final_df.columns:
-        print("Filtering by Include_Flag == 1...")
-        final_df = final_df[final_df['Include_Flag'] == 1]
+        # 9. Apply Filters
+        # "filter should also be appied by using ddm30 related file"
+        # Filter by Include_Flag if present
+        if 'Include_Flag' in final_df.columns:
+            print("Filtering by Include_Flag == 1...")
+            final_df = final_df[final_df['Include_Flag'] == 1]
+        final_df = final_df.assign(mass_factor=1.0)
+        if regional_mass is not None:
+            region_col = 'Basin_ID' if regional_mass.priors.key == 'ddm30' else 'HYBAS_ID'
+            if region_col not in final_df.columns:
+                raise ValueError(f"Regional priors keyed by {region_col}, which this aggregation does not provide")
+            final_df['mass_factor'] = regional_mass.relative_to_global(final_df[region_col])
+        st.rows = len(final_df)
     
     print(f"  - Final Count: {len(final_df)}")
     
     # 10. Export
     print("Exporting to JS...")
     
-    output_data = {
-        "source": "DDM30 Aggregated (Max Discharge Outlet)",
-        "total_basins": len(final_df),
-        "total_items_yr": final_df['Flux_Linear'].sum(), # Sum of the outlets' flux
-        "basins": []
-    }
-    
-    for _, row in final_df.iterrows():
-        # Coordinates: Use DDM30 reported Mouth coordinates
-        lat = row.get('Lat_mouth', row.get('Lat_mouth_ddm30', 0))
-        lon = row.get('Lon_mouth', row.get('Lon_mouth_ddm30', 0))
+    with profiler.stage('export_js') as st:
+        output_data = {
+            "source": AGGREGATION_SOURCES[method],
+            "method": method,
+            "total_basins": len(final_df),
+            "total_items_yr": final_df['Flux_Linear'].sum(), # Sum of the basins' flux
+            "basins": []
+        }
+        if regional_mass is not None:
+            output_data["prior_regions"] = regional_mass.summary(final_df[region_col])
+        if 'overlay_audit' in ddm30_aggregated.attrs:
+            output_data["overlay_audit"] = ddm30_aggregated.attrs['overlay_audit']
+    
+        for _, row in final_df.iterrows():
+            # Coordinates: Use DDM30 reported Mouth coordinates
+            lat = row.get('Lat_mouth', row.get('Lat_mouth_ddm30', 0))
+            lon = row.get('Lon_mouth', row.get('Lon_mouth_ddm30', 0))
         
-        # Flux: The Flux_Linear from the selected Level 12 outlet
-        flux_val = row['Flux_Linear'] # Items/yr
-        discharge_val = row['Natural_Discharge_Upstream'] # From Lev12 model
+            # Flux: The Flux_Linear from the selected Level 12 outlet
+            flux_val = row['Flux_Linear'] # Items/yr
+            discharge_val = row['Natural_Discharge_Upstream'] # From Lev12 model
         
-        # Calculate Mass Flux (kt/yr)
-        # Factor from previous data: 19.148 kt / 703.1e12 items = 2.7234e-5 mg/item ?? 
-        # 19.148 * 10^9 mg / 703.1 * 10^12 = 0.027 mg. 
-        # Wait: 1 kt = 1e9 g. 19 kt = 19e9 g. 
-        # 19e9 g / 703e12 items = 2.7e-5 g/item = 0.027 mg/item.
-        mass_per_item_g = 2.7234e-5
-        flux_mass_val = flux_val * mass_per_item_g / 1e9 # to kt
+            # Calculate Mass Flux (kt/yr)
+            # Factor from previous data: 19.148 kt / 703.1e12 items = 2.7234e-5 mg/item ?? 
+            # 19.148 * 10^9 mg / 703.1 * 10^12 = 0.027 mg. 
+            # Wait: 1 kt = 1e9 g. 19 kt = 19e9 g. 
+            # 19e9 g / 703e12 items = 2.7e-5 g/item = 0.027 mg/item.
+            mass_per_item_g = 2.7234e-5 * row['mass_factor']
+            flux_mass_val = flux_val * mass_per_item_g / 1e9 # to kt
         
-        # Name
-        name = row.get('Basin_name_ddm30', row.get('Basin_name', f"Basin {row['Basin_ID']}"))
+            # Name
+            name = row.get('Basin_name_ddm30', row.get('Basin_name', f"Basin {row['Basin_ID']}"))
         
-        if pd.isna(lat) or pd.isna(lon):
-            continue
+            if pd.isna(lat) or pd.isna(lon):
+                continue
             
-        output_data["basins"].append({
-            "id": int(row['Basin_ID']),
-            "name": str(name),
-            "lat": float(lat),
-            "lon": float(lon),
-            "discharge": float(discharge_val),
-            "flux_items": float(flux_val),
-            "flux_baseline": float(flux_mass_val),
-            # Optional: DDM30 also has 'Dis_m3s' (observed/modeled). 
-            # We provide our model's discharge for consistency with Flux calculation.
-        })
+            output_data["basins"].append({
+                "id": int(row['Basin_ID']),
+                "name": str(name),
+                "lat": float(lat),
+                "lon": float(lon),
+                "discharge": float(discharge_val),
+                "flux_items": float(flux_val),
+                "flux_baseline": float(flux_mass_val),
+                # Optional: DDM30 also has 'Dis_m3s' (observed/modeled). 
+                # We provide our model's discharge for consistency with Flux calculation.
+            })
+            if regional_mass is not None:
+                output_data["basins"][-1]["mass_factor"] = float(row['mass_factor'])
         
-    output_data["total_flux_kt"] = sum(b['flux_baseline'] for b in output_data["basins"])
+        output_data["total_flux_kt"] = sum(b['flux_baseline'] for b in output_data["basins"])
+        ranking = FluxRanking.from_basins(output_data["basins"], regional=regional_mass is not None)
+        output_data["ranking"] = ranking.to_export()
     
-    js_content = f"window.COASTAL_DATA_DDM30 = {json.dumps(output_data)};"
+        js_content = f"window.COASTAL_DATA_DDM30 = {json.dumps(output_data)};"
     
-    with open(OUTPUT_JS_PATH, 'w') as f:
-        f.write(js_content)
+        with open(output_path, 'w') as f:
+            f.write(js_content)
+        ranking.save(ranking_path_for(output_path))
+        st.rows = len(output_data['basins'])
         
-    print(f"Write successful: {OUTPUT_JS_PATH}")
+    print(f"Write successful: {output_path}")
+
+
+def load_and_process(flux_path=FLUX_DATA_PATH, atlas_path=SHP_BASIN_ATLAS_PATH,
+                     ddm30_shp_path=SHP_DDM30_PATH, ddm30_csv_path=CSV_DDM30_PATH,
+                     output_path=OUTPUT_JS_PATH, profiler=NULL_PROFILER,
+                     low_memory=False, chunk_rows=LOW_MEMORY_CHUNK_ROWS,
+                     partition_by=None, tile_deg=PARTITION_TILE_DEG, max_workers=None, overlay=False,
+                     regional_priors=None, region_key='ddm30', region_digits=REGION_DIGITS):
+    print("Loading Data...")
+    
+    regional_mass = None
+    if regional_priors:
+        # Runs on a loader thread while the outlets are assigned
+        from export_basin_data import PRIOR_POLY, PRIOR_SHAPE, mean_mass_from_priors
+        regional_mass = load_concurrently(mass=(mean_mass_from_priors, PRIOR_SHAPE, PRIOR_POLY,
+                                                regional_priors, region_key, region_digits))['mass']
+    
+    if overlay:
+        ddm30_aggregated = aggregate_by_overlay(flux_path, atlas_path, ddm30_shp_path,
+                                                max_workers=max_workers, profiler=profiler)
+    elif partition_by:
+        ddm30_aggregated = assign_outlets_partitioned(flux_path, atlas_path, ddm30_shp_path,
+                                                      partition_by=partition_by, tile_deg=tile_deg,
+                                                      max_workers=max_workers, profiler=profiler)
+    elif low_memory:
+        ddm30_aggregated = assign_outlets_low_memory(flux_path, atlas_path, ddm30_shp_path,
+                                                     chunk_rows=chunk_rows, profiler=profiler)
+    else:
+        ddm30_aggregated = assign_outlets_by_centroid(flux_path, atlas_path, ddm30_shp_path,
+                                                      profiler=profiler)
+    
+    write_ddm30_export(ddm30_aggregated, ddm30_csv_path, output_path, profiler,
+                       regional_mass=regional_mass.result() if regional_mass else None,
+                       method='overlay' if overlay else 'outlet')
 
 if __name__ == "__main__":
-    load_and_process()
+    import argparse
+    from flux_raster import add_raster_arguments, rasterize_export
+
+    parser = add_profiler_arguments(argparse.ArgumentParser(description="Aggregate Level 12 flux to DDM30 basins"))
+    parser.add_argument('--low-memory', action='store_true',
+                        help="Chunked, projected reads and streaming centroids (bounded RAM)")
+    parser.add_argument('--chunk-rows', type=int, default=LOW_MEMORY_CHUNK_ROWS,
+                        help="Rows per CSV chunk / polygon batch in low-memory mode")
+    parser.add_argument('--memory-budget-mb', type=float, default=None,
+                        help="Derive --chunk-rows from a RAM budget (implies --low-memory)")
+    parser.add_argument('--partition-by', choices=['region', 'tile'], default=None,
+                        help="Process BasinATLAS regions or lon/lat tiles in a process pool")
+    parser.add_argument('--tile-deg', type=float, default=PARTITION_TILE_DEG,
+                        help="Tile size in degrees for --partition-by tile")
+    parser.add_argument('--overlay', action='store_true',
+                        help="Area-weighted polygon overlay instead of one centroid-assigned outlet per DDM30 basin")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size (default: all cores)")
+    add_raster_arguments(parser)
+    add_regional_arguments(parser).set_defaults(region_key='ddm30')
+    args = parser.parse_args()
+    profiler = profiler_from_args('load_and_process', args)
+    chunk_rows = args.chunk_rows
+    if args.memory_budget_mb:
+        chunk_rows = chunk_rows_for_budget(args.memory_budget_mb, SHP_BASIN_ATLAS_PATH)
+    try:
+        load_and_process(profiler=profiler, low_memory=args.low_memory or bool(args.memory_budget_mb),
+                         chunk_rows=chunk_rows, partition_by=args.partition_by,
+                         tile_deg=args.tile_deg, max_workers=args.workers, overlay=args.overlay,
+                         regional_priors=args.regional_priors, region_key=args.region_key,
+                         region_digits=args.region_digits)
+        if args.raster_dir:
+            with profiler.stage('rasterize'):
+                rasterize_export(OUTPUT_JS_PATH, args.raster_dir, args.raster_res, args.land_shp)
+    finally:
+        profiler.write_report(args.profile_report or os.path.splitext(OUTPUT_JS_PATH)[0] + "_run_report.json")
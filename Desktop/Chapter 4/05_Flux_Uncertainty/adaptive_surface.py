@@ -0,0 +1,250 @@
+"""
+Adaptive (alpha, min size) surfaces of particle-mass statistics
+- Starts from a coarse grid of cells and splits a cell into four (quadtree) where
+  the value at its centre departs from the bilinear prediction of its corners,
+  i.e. where the surface curves; worst cells first, within an evaluation budget
+- A new child is queued with a quarter of its parent's error (second-order decay)
+  and its centre is only evaluated if that estimate reaches the top of the queue
+- With MC evaluators the departure must also exceed the MC error (bootstrap se),
+  so cells are not refined into noise
+- Extrema are located by compass search around the best evaluated point
+- Output is a scattered-point surface with Delaunay triangles (normalized
+  coordinates), for plot_trisurf in the explorers and mesh3d in Surface_Explorer_3D.html
+
+    surface = AdaptiveSurface(mc_evaluator(shape_probs, poly_probs), max_evals=120).build()
+    surface.to_dict()                     # {'alpha', 'min_size', 'values', 'triangles', 'extrema', ...}
+    python adaptive_surface.py            # writes adaptive_surface_data.js (exact mixture statistics)
+"""
+
+import heapq
+import json
+import os
+
+import numpy as np
+
+from flux_lookup import STATS, mass_statistics_exact
+from flux_mc import bootstrap_statistics, sample_masses
+
+try:
+    from scipy.spatial import Delaunay
+except ImportError:
+    Delaunay = None
+
+UNC_DIR = os.path.dirname(os.path.abspath(__file__))
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+OUTPUT_JS = os.path.join(UNC_DIR, "adaptive_surface_data.js")
+
+ALPHA_RANGE = (2.0, 3.5)
+MIN_RANGE = (50.0, 300.0)
+BASE_CELLS = 4
+MAX_DEPTH = 4
+# Refinement threshold on |log value - bilinear prediction| (~2% relative)
+LOG_TOL = 0.02
+NOISE_Z = 2.0
+MAX_EVALS = 150
+# Part of MAX_EVALS kept for the extrema search
+EXTREMA_EVALS = 30
+EXTREMA_STEPS = 12
+# Node coordinates are snapped to this lattice so shared corners are evaluated once
+LATTICE = 1 << 20
+SURFACE_BOOTSTRAP = 50
+
+
+def exact_evaluator(shape_probs, poly_probs, max_size=5000, densities=None, stats=STATS):
+    """f(alpha, min) -> ({stat: mass_g}, {stat: 0}) from the closed-form mixture statistics"""
+    def evaluate(alpha, min_size):
+        exact = mass_statistics_exact(alpha, min_size, max_size, shape_probs, poly_probs, densities)
+        values = _with_range({k: float(v) for k, v in exact.items()}, stats)
+        return values, {k: 0.0 for k in values}
+    return evaluate
+
+
+def mc_evaluator(shape_probs, poly_probs, n=500, max_size=5000, densities=None, rng=None, stats=STATS,
+                 n_boot=SURFACE_BOOTSTRAP):
+    """f(alpha, min) -> ({stat: mass_g}, {stat: bootstrap se}) from one MC run of n draws"""
+    rng = np.random.default_rng() if rng is None else rng
+
+    def evaluate(alpha, min_size):
+        masses_g = sample_masses(n, alpha, min_size, max_size, shape_probs, poly_probs, densities, rng)[0]
+        boot = bootstrap_statistics(masses_g, n_boot=n_boot, rng=rng)
+        values = {'mean': masses_g.mean()}
+        for q, v in zip((5, 50, 95), np.percentile(masses_g, (5, 50, 95))):
+            values[f'P{q}'] = v
+        se = {k: b['se'] for k, b in boot.items()}
+        if 'range' in stats:
+            se['range'] = float(np.hypot(se['P5'], se['P95']))
+        return _with_range(values, stats), {k: se[k] for k in stats}
+    return evaluate
+
+
+def _with_range(values, stats):
+    """Select stats; 'range' is the P95 - P5 spread"""
+    if 'range' in stats:
+        values = dict(values, range=values['P95'] - values['P5'])
+    return {k: values[k] for k in stats}
+
+
+class AdaptiveSurface:
+    """
+    Quadtree refinement over the unit square mapped to alpha_range x min_range.
+
+    nodes : {(i, j) lattice key: (log values (n_stats,), log se (n_stats,))}
+    cells : leaves of the quadtree as (i0, j0, size) in lattice units
+    """
+
+    def __init__(self, evaluate, stats=STATS, alpha_range=ALPHA_RANGE, min_range=MIN_RANGE,
+                 base_cells=BASE_CELLS, max_depth=MAX_DEPTH, log_tol=LOG_TOL, noise_z=NOISE_Z,
+                 max_evals=MAX_EVALS, extrema_evals=EXTREMA_EVALS, extrema_steps=EXTREMA_STEPS):
+        self.evaluate = evaluate
+        self.stats = tuple(stats)
+        self.alpha_range, self.min_range = alpha_range, min_range
+        self.base_cells, self.max_depth = base_cells, max_depth
+        self.log_tol, self.noise_z = log_tol, noise_z
+        self.max_evals, self.extrema_evals, self.extrema_steps = max_evals, extrema_evals, extrema_steps
+        self.nodes = {}
+        self.cells = []
+        self.extrema = {}
+
+    # --- Coordinates ---
+    def params(self, key):
+        u, v = key[0] / LATTICE, key[1] / LATTICE
+        return (self.alpha_range[0] + u * (self.alpha_range[1] - self.alpha_range[0]),
+                self.min_range[0] + v * (self.min_range[1] - self.min_range[0]))
+
+    def node(self, key):
+        """Log values and log se at a lattice node, evaluated once"""
+        if key not in self.nodes:
+            values, se = self.evaluate(*self.params(key))
+            z = np.array([values[s] for s in self.stats], dtype=float)
+            self.nodes[key] = (np.log(z), np.array([se[s] for s in self.stats], dtype=float) / z)
+        return self.nodes[key]
+
+    @property
+    def n_evals(self):
+        return len(self.nodes)
+
+    # --- Refinement ---
+    def cell_error(self, cell):
+        """Largest departure of the centre from the bilinear prediction beyond the MC noise"""
+        i0, j0, size = cell
+        corners = [self.node((i0 + di, j0 + dj))[0] for di in (0, size) for dj in (0, size)]
+        centre, centre_se = self.node((i0 + size // 2, j0 + size // 2))
+        excess = np.abs(centre - np.mean(corners, axis=0)) - self.noise_z * centre_se
+        return float(excess.max())
+
+    def build(self):
+        size = LATTICE // self.base_cells
+        min_size = size >> self.max_depth
+        heap = []
+        for i, j in np.ndindex(self.base_cells, self.base_cells):
+            cell = (i * size, j * size, size)
+            heapq.heappush(heap, (-self.cell_error(cell), True, cell))
+
+        # Worst cell first. Entries are (-error, measured, cell): an unmeasured child
+        # carries its parent's error / 4 until its centre is evaluated
+        finest = []
+        while heap and self.n_evals + 4 <= self.max_evals - self.extrema_evals:
+            if -heap[0][0] <= self.log_tol:
+                break
+            _, measured, cell = heapq.heappop(heap)
+            if not measured:
+                heapq.heappush(heap, (-self.cell_error(cell), True, cell))
+                continue
+            if cell[2] <= min_size:
+                finest.append(cell)
+                continue
+            err = self.cell_error(cell)
+            i0, j0, half = cell[0], cell[1], cell[2] // 2
+            for key in ((i0 + half, j0), (i0, j0 + half), (i0 + 2 * half, j0 + half), (i0 + half, j0 + 2 * half)):
+                self.node(key)
+            for di, dj in ((0, 0), (half, 0), (0, half), (half, half)):
+                heapq.heappush(heap, (-err / 4.0, False, (i0 + di, j0 + dj, half)))
+        self.cells = finest + [cell for _, _, cell in heap]
+        self.locate_extrema(min_size)
+        return self
+
+    def locate_extrema(self, min_step):
+        """Compass search from the best evaluated node, per stat and direction"""
+        for k, stat in enumerate(self.stats):
+            self.extrema[stat] = {}
+            for name, sign in (('max', 1.0), ('min', -1.0)):
+                best = max(self.nodes, key=lambda key: sign * self.nodes[key][0][k])
+                step = max(min_step, self._local_cell_size(best))
+                for _ in range(self.extrema_steps):
+                    if step < max(min_step // 4, 1):
+                        break
+                    z_best, se_best = self.nodes[best][0][k], self.nodes[best][1][k]
+                    moved = False
+                    for di, dj in ((step, 0), (-step, 0), (0, step), (0, -step)):
+                        key = (best[0] + di, best[1] + dj)
+                        if not (0 <= key[0] <= LATTICE and 0 <= key[1] <= LATTICE):
+                            continue
+                        if key not in self.nodes and self.n_evals >= self.max_evals:
+                            continue
+                        z, se = self.node(key)
+                        if sign * (z[k] - z_best) > self.noise_z * np.hypot(se[k], se_best):
+                            best, moved = key, True
+                            break
+                    if not moved:
+                        step //= 2
+                alpha, min_size = self.params(best)
+                self.extrema[stat][name] = {'alpha': alpha, 'min_size': min_size,
+                                            'value': float(np.exp(self.nodes[best][0][k]))}
+
+    def _local_cell_size(self, key):
+        sizes = [s for i0, j0, s in self.cells if i0 <= key[0] <= i0 + s and j0 <= key[1] <= j0 + s]
+        return min(sizes) if sizes else LATTICE // self.base_cells
+
+    # --- Output ---
+    def points(self):
+        """(alpha, min_size, {stat: mass_g}) over every evaluated node"""
+        keys = sorted(self.nodes)
+        alpha, min_size = np.array([self.params(k) for k in keys]).T
+        logs = np.array([self.nodes[k][0] for k in keys])
+        return alpha, min_size, {stat: np.exp(logs[:, k]) for k, stat in enumerate(self.stats)}
+
+    def triangles(self):
+        """Delaunay triangles in normalized coordinates, or None without scipy"""
+        if Delaunay is None or self.n_evals < 3:
+            return None
+        uv = np.array(sorted(self.nodes), dtype=float) / LATTICE
+        return Delaunay(uv).simplices
+
+    def to_dict(self):
+        alpha, min_size, values = self.points()
+        tri = self.triangles()
+        return {'alpha': alpha.tolist(), 'min_size': min_size.tolist(),
+                'values': {k: v.tolist() for k, v in values.items()},
+                'triangles': None if tri is None else tri.tolist(),
+                'extrema': self.extrema, 'n_evals': self.n_evals,
+                'alpha_range': list(self.alpha_range), 'min_range': list(self.min_range)}
+
+
+def write_surface_js(surface, path=OUTPUT_JS, meta=None):
+    """window.ADAPTIVE_SURFACE for Surface_Explorer_3D.html (mass in g; the page scales to kt/yr)"""
+    data = dict(surface.to_dict(), **(meta or {}))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"window.ADAPTIVE_SURFACE = {json.dumps(data)};\n")
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from priors import load_priors
+
+    parser = argparse.ArgumentParser(description="Build an adaptive (alpha, min size) mass surface")
+    parser.add_argument('--max-size', type=float, default=5000)
+    parser.add_argument('--max-evals', type=int, default=MAX_EVALS)
+    parser.add_argument('--mc', type=int, default=0, help="MC draws per point (default: exact statistics)")
+    parser.add_argument('--out', default=OUTPUT_JS)
+    args = parser.parse_args()
+
+    shape_probs, poly_probs = load_priors(PRIOR_SHAPE, PRIOR_POLY)
+    stats = STATS + ('range',)
+    evaluate = (mc_evaluator(shape_probs, poly_probs, args.mc, args.max_size, stats=stats) if args.mc
+                else exact_evaluator(shape_probs, poly_probs, args.max_size, stats=stats))
+    surface = AdaptiveSurface(evaluate, stats, max_evals=args.max_evals).build()
+    write_surface_js(surface, args.out, {'max_size': args.max_size, 'source': f"MC n={args.mc}" if args.mc else 'exact'})
+    print(f"{surface.n_evals} evaluations, {len(surface.cells)} leaf cells -> {args.out}")
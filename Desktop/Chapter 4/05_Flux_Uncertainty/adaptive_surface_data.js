@@ -0,0 +1 @@
+window.ADAPTIVE_SURFACE = {"alpha": [2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0, 2.005859375, 2.01171875, 2.0234375, 2.046875, 2.09375, 2.09375, 2.09375, 2.09375, 2.09375, 2.09375, 2.1875, 2.1875, 2.1875, 2.1875, 2.1875, 2.1875, 2.1875, 2.1875, 2.1875, 2.1875, 2.28125, 2.28125, 2.28125, 2.28125, 2.375, 2.375, 2.375, 2.375, 2.375, 2.375, 2.375, 2.375, 2.46875, 2.46875, 2.46875, 2.46875, 2.5625, 2.5625, 2.5625, 2.5625, 2.5625, 2.5625, 2.5625, 2.5625, 2.5625, 2.65625, 2.65625, 2.65625, 2.65625, 2.65625, 2.75, 2.75, 2.75, 2.75, 2.75, 2.75, 2.75, 2.75, 2.75, 2.84375, 2.84375, 2.84375, 2.84375, 2.84375, 2.9375, 2.9375, 2.9375, 2.9375, 2.9375, 2.9375, 2.9375, 2.9375, 2.9375, 3.03125, 3.03125, 3.03125, 3.03125, 3.03125, 3.125, 3.125, 3.125, 3.125, 3.125, 3.125, 3.125, 3.125, 3.125, 3.125, 3.21875, 3.21875, 3.21875, 3.21875, 3.3125, 3.3125, 3.3125, 3.3125, 3.3125, 3.3125, 3.3125, 3.3125, 3.3125, 3.40625, 3.40625, 3.40625, 3.40625, 3.453125, 3.4765625, 3.48828125, 3.494140625, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5, 3.5], "min_size": [50.0, 65.625, 81.25, 96.875, 112.5, 143.75, 175.0, 237.5, 268.75, 284.375, 292.1875, 296.09375, 298.046875, 299.0234375, 300.0, 300.0, 300.0, 300.0, 300.0, 50.0, 65.625, 81.25, 96.875, 112.5, 300.0, 50.0, 65.625, 81.25, 96.875, 112.5, 143.75, 175.0, 206.25, 268.75, 300.0, 50.0, 65.625, 81.25, 96.875, 50.0, 65.625, 81.25, 112.5, 143.75, 175.0, 237.5, 300.0, 50.0, 65.625, 81.25, 96.875, 50.0, 65.625, 81.25, 96.875, 112.5, 143.75, 175.0, 206.25, 268.75, 50.0, 65.625, 81.25, 96.875, 112.5, 50.0, 65.625, 81.25, 96.875, 112.5, 143.75, 175.0, 237.5, 300.0, 50.0, 65.625, 81.25, 96.875, 112.5, 50.0, 65.625, 81.25, 96.875, 112.5, 143.75, 175.0, 206.25, 268.75, 50.0, 65.625, 81.25, 96.875, 112.5, 50.0, 65.625, 81.25, 96.875, 112.5, 143.75, 175.0, 206.25, 237.5, 300.0, 50.0, 65.625, 81.25, 96.875, 50.0, 65.625, 81.25, 112.5, 143.75, 175.0, 206.25, 237.5, 268.75, 50.0, 65.625, 81.25, 96.875, 50.0, 50.0, 50.0, 50.0, 50.0, 50.9765625, 51.953125, 53.90625, 57.8125, 65.625, 81.25, 112.5, 143.75, 175.0, 206.25, 237.5, 300.0], "values": {"mean": [0.0001220630760190748, 0.000160701838608661, 0.0001995758637380689, 0.00023868515140729787, 0.0002780297016163492, 0.0003574245896539156, 0.00043776052785076894, 0.000601255554722334, 0.0006844146433970459, 0.0007263470815441351, 0.000747401524070113, 0.0007579508011962096, 0.0007632309537250348, 0.0007658724084808919, 0.0007685147822310451, 0.0007617772988074116, 0.000755092727977468, 0.000741881180872523, 0.0007160804357320713, 9.06483455183793e-05, 0.00012231044611959804, 0.00015483165370065908, 0.00018809021379019523, 0.00022200342336672725, 0.0006669038067980376, 6.70694417437857e-05, 9.276717133456984e-05, 0.000119725409924527, 0.0001477608387347315, 0.00017674638442059717, 0.00023721493599573903, 0.0003006031595361462, 0.00036656519374325843, 0.0005052922082348024, 0.0005777317101644567, 4.948596370125715e-05, 7.017562304512385e-05, 9.234969158977317e-05, 0.00011580585503176762, 3.6443132275321504e-05, 5.299053072502474e-05, 7.111222297600595e-05, 0.00011135739310209078, 0.00015616017754642664, 0.00020489530497399313, 0.0003125532302270574, 0.00043201264268148036, 2.6809917660552432e-05, 3.997409463753141e-05, 5.470688974379133e-05, 7.08390782490116e-05, 1.9718935149358967e-05, 3.014878771087056e-05, 4.2077852028345776e-05, 5.5368771674627636e-05, 6.991791127622603e-05, 0.00010247767438767525, 0.0001392564242281753, 0.0001798903102886432, 0.00027165470178495114, 1.4512448380985431e-05, 2.275168463994651e-05, 3.238195085340444e-05, 4.329939453330859e-05, 5.542379565570782e-05, 1.0696310344882919e-05, 1.7193159129727695e-05, 2.495271139852094e-05, 3.390270412333579e-05, 4.3985820425662655e-05, 6.736905815161358e-05, 9.479827987980595e-05, 0.00016089450502060728, 0.00024083301848190703, 7.9021011507474e-06, 1.3021210341840416e-05, 1.9267796666358788e-05, 2.659734388763371e-05, 3.497332950997572e-05, 5.856850081752153e-06, 9.891661461506144e-06, 1.4920736786114434e-05, 2.092265891577461e-05, 2.7878781903895407e-05, 4.4588236561356625e-05, 6.49308904639172e-05, 8.88034488085303e-05, 0.00014677376116530591, 4.359329894317894e-06, 7.543882416363807e-06, 1.1597088004194607e-05, 1.651590035467834e-05, 2.229636573027534e-05, 3.261802173048687e-06, 5.7813950424679246e-06, 9.054777109567864e-06, 1.309289055960553e-05, 1.7903370698829415e-05, 2.986091821261837e-05, 4.4951353260052867e-05, 6.318109166980508e-05, 8.45450202945235e-05, 0.00013661691444841106, 2.4561444957137276e-06, 4.456616027093053e-06, 7.108181408829038e-06, 1.0431951499435151e-05, 1.8634186779232828e-06, 3.459002313349096e-06, 5.615415401414296e-06, 1.1717763322565547e-05, 2.03389104178496e-05, 3.1596346099903464e-05, 4.557504028057945e-05, 6.233720932457324e-05, 8.19282090461101e-05, 1.426093392816915e-06, 2.705931793260523e-06, 4.468293483966332e-06, 6.745718678745821e-06, 1.252130771415313e-06, 1.1744243663932448e-06, 1.1376859909906852e-06, 1.1198218743929526e-06, 1.1022858205500183e-06, 1.1554671699215816e-06, 1.2101198666686492e-06, 1.323883863579663e-06, 1.5695497683604312e-06, 2.1357449494130146e-06, 3.5844786891486867e-06, 7.862500573775998e-06, 1.4159984795417668e-05, 2.2647243040408272e-05, 3.3458635210341335e-05, 4.670221920861607e-05, 8.082101122388966e-05], "P5": [1.337782290706455e-09, 3.021344120360605e-09, 5.7276879008226376e-09, 9.697245415934552e-09, 1.5168100396762276e-08, 3.156806435864937e-08, 5.6821669386814716e-08, 1.413781329767655e-07, 2.043831623526354e-07, 2.41869033772124e-07, 2.622071689333268e-07, 2.7278740380205476e-07, 2.7818185570851794e-07, 2.8090535790646124e-07, 2.836464509409449e-07, 2.8323168724569827e-07, 2.82820821807356e-07, 2.82010598208177e-07, 2.804349046096694e-07, 1.302155434588501e-09, 2.9419997111739853e-09, 5.579297082263059e-09, 9.449538073191896e-09, 1.4785608470862606e-08, 2.7745285399482946e-07, 1.2724850436516164e-09, 2.8756829534708555e-09, 5.4548640367028495e-09, 9.241057783426588e-09, 1.446297957294469e-08, 3.013369539636054e-08, 5.4297118223861965e-08, 8.877204893203511e-08, 1.958783835357875e-07, 2.7209336314313684e-07, 1.2474542884554896e-09, 2.8195810359065776e-09, 5.349326751115682e-09, 9.063758477568108e-09, 1.2261179845339033e-09, 2.7716561804531224e-09, 5.258987381458328e-09, 1.3951821718526433e-08, 2.9084841357874773e-08, 5.24363959939444e-08, 1.3087242165368473e-07, 2.633461852739556e-07, 1.2077482793152453e-09, 2.730326352012486e-09, 5.180954833466855e-09, 8.78014304964871e-09, 1.1917895122280457e-09, 2.694375530983074e-09, 5.1129934251007415e-09, 8.665428685793187e-09, 1.3568440645494569e-08, 2.8293524467510338e-08, 5.102471004099851e-08, 8.349343928587487e-08, 1.8454848982196534e-07, 1.1778071330279227e-09, 2.66284422244667e-09, 5.0533232233137426e-09, 8.564600439073707e-09, 1.3411186945256646e-08, 1.165267056491432e-09, 2.634547620100345e-09, 4.999740302500181e-09, 8.474000470214725e-09, 1.326980801951183e-08, 2.7674528209964466e-08, 4.991589031199986e-08, 1.2469912562285784e-07, 2.5117320195766197e-07, 1.1541143720423146e-09, 2.609367937312575e-09, 4.95203210460247e-09, 8.393285163151462e-09, 1.3143773499893774e-08, 1.1441276976580783e-09, 2.5868121219305544e-09, 4.90927771569841e-09, 8.320919470409569e-09, 1.3030726847743146e-08, 2.7177838043010995e-08, 4.9024089330579636e-08, 8.024004985559981e-08, 1.7745530095308182e-07, 1.135154478985754e-09, 2.5665393846107385e-09, 4.870838522794934e-09, 8.255835090492017e-09, 1.2929017149801593e-08, 1.1265615120724317e-09, 2.547116180086095e-09, 4.83398791341736e-09, 8.193396020570264e-09, 1.2831319449299439e-08, 2.6761294427049436e-08, 4.827277359624651e-08, 7.901154213917073e-08, 1.2062220232480238e-07, 2.4303024038696716e-07, 1.1173745736953927e-09, 2.526352960805002e-09, 4.794602205139714e-09, 8.126678112660044e-09, 1.1090074002405355e-09, 2.5074403247796356e-09, 4.758722036569451e-09, 1.2631961831506583e-08, 2.6346133327733908e-08, 4.752533931032285e-08, 7.779099904827652e-08, 1.1876379414320762e-07, 1.720635229463973e-07, 1.1013560422068343e-09, 2.490144253003541e-09, 4.725905477455792e-09, 8.010284202203283e-09, 1.0977709682615009e-09, 1.0960342574512094e-09, 1.0951793590169814e-09, 1.0947552139645938e-09, 1.0943332492637665e-09, 1.1597147519177057e-09, 1.2276498896288487e-09, 1.3713767470170952e-09, 1.691626523387945e-09, 2.4742681297148015e-09, 4.6957808440373645e-09, 1.2464990037935432e-08, 2.5998562137584646e-08, 4.689916095827476e-08, 7.67676823726757e-08, 1.1720437317931726e-07, 2.361803978623933e-07], "P50": [8.58398792788576e-08, 1.8290374280628203e-07, 3.31696445690557e-07, 5.409364756803687e-07, 8.176109014276394e-07, 1.6057094812423795e-06, 2.74754660299523e-06, 6.062000883158164e-06, 8.149619345498242e-06, 9.317671396497467e-06, 9.932637938834297e-06, 1.0247831349670813e-05, 1.0407351902207788e-05, 1.0487592645731379e-05, 1.0568153505724131e-05, 1.0435590653053527e-05, 1.0305300916623718e-05, 1.0051373530006794e-05, 9.568997543698143e-06, 7.649994830818878e-08, 1.6236427368478272e-07, 2.9340023517146273e-07, 4.769806709029361e-07, 7.21289930247125e-07, 8.697716060110828e-06, 6.902514030360906e-08, 1.4580839088529712e-07, 2.6154120039600623e-07, 4.13470420879276e-07, 6.056464308814436e-07, 1.1328624585777834e-06, 1.8708542118971923e-06, 2.8396709973421224e-06, 5.5289631301169445e-06, 7.270108663102801e-06, 6.281717542574287e-08, 1.2898836319421553e-07, 2.2094317319582098e-07, 3.4512218247641726e-07, 5.5089514013179505e-08, 1.1026540156725868e-07, 1.8981296821569138e-07, 4.3208832771010437e-07, 8.069712976296909e-07, 1.3355455599743172e-06, 2.924340086063843e-06, 5.316486413697928e-06, 4.7313457711528837e-08, 9.565236015820698e-08, 1.650712657363457e-07, 2.58988553559678e-07, 3.82552809463898e-08, 8.368778965866558e-08, 1.454655130651909e-07, 2.2830811865368284e-07, 3.346928428378232e-07, 6.245993868283596e-07, 1.0295813095921136e-06, 1.5674455796576091e-06, 3.0967016260530074e-06, 3.130276581804095e-08, 7.056947055016807e-08, 1.2914279675429434e-07, 2.0373383805561162e-07, 2.994054493970126e-07, 2.6149129214390603e-08, 5.9006630905069886e-08, 1.117312501423943e-07, 1.8308860887364412e-07, 2.6994074958662914e-07, 5.071382147880028e-07, 8.413191343830532e-07, 1.8319247678133648e-06, 3.3389680543443986e-06, 2.2236693072968488e-08, 5.0209177437279115e-08, 9.51406425236156e-08, 1.609723234974275e-07, 2.4508135210664373e-07, 1.9203311505704643e-08, 4.337762735395922e-08, 8.223505419138739e-08, 1.392124887453993e-07, 2.1771078461498342e-07, 4.2454430582890254e-07, 7.074204741382415e-07, 1.0781764230635453e-06, 2.1301923334016118e-06, 1.680724711854989e-08, 3.797536292372418e-08, 7.201669396777883e-08, 1.219597161463759e-07, 1.9080969696828405e-07, 1.488305280373403e-08, 3.363355383404484e-08, 6.379667961710784e-08, 1.0806682257643768e-07, 1.691233074074082e-07, 3.5221784824800737e-07, 6.078662960783144e-07, 9.32205461738896e-07, 1.343086563537449e-06, 2.458040184453657e-06, 1.331489721085264e-08, 3.009313031955399e-08, 5.7089434455610944e-08, 9.672219549764389e-08, 1.2019997336179841e-08, 2.7168470817502047e-08, 5.1546089314693164e-08, 1.3673490193304602e-07, 2.8500375094319196e-07, 5.136110090094472e-07, 8.20297774555125e-07, 1.1852605868213446e-06, 1.6351223780971688e-06, 1.0938070186414496e-08, 2.4724141785782362e-08, 4.6911553374578685e-08, 7.949465016645948e-08, 1.0462542967910679e-08, 1.0239076901249972e-08, 1.0130692890620036e-08, 1.0077311743011972e-08, 1.0024461448071452e-08, 1.0623187425396634e-08, 1.1245289162734409e-08, 1.2561409510179682e-08, 1.5493843579515507e-08, 2.2659671527528516e-08, 4.2996268020761144e-08, 1.140898484087334e-07, 2.3790384316740963e-07, 4.289620256112799e-07, 7.016807095694875e-07, 1.0598162967654298e-06, 1.9529996102005522e-06], "P95": [4.186966105300656e-05, 8.067708700337327e-05, 0.00013196330412108294, 0.0001944665933043981, 0.00026671546604420285, 0.00043455911491472004, 0.000630210653473967, 0.0011129502273511175, 0.0014534802232199287, 0.0016528292079662544, 0.001757060574724346, 0.001810237490067868, 0.0018370881460795646, 0.0018505786326952997, 0.0018641124090251285, 0.0018352462595922043, 0.0018068799242450407, 0.0017516145028359904, 0.0016467322081173766, 2.5588285237747673e-05, 5.144370978745831e-05, 8.737516044135415e-05, 0.00013314826181081004, 0.00018817882186209685, 0.0014581607133479914, 1.628768989868761e-05, 3.3779945195156155e-05, 5.9041619743244746e-05, 9.238976921006154e-05, 0.00013381089618480014, 0.00023973904530553451, 0.0003732767087221583, 0.0005311521149206671, 0.0009123191360135614, 0.0011657401482339197, 1.0830874955402087e-05, 2.2961605398701435e-05, 4.099028951521771e-05, 6.544910378443694e-05, 7.518611173308076e-06, 1.6182588533433124e-05, 2.933039576683095e-05, 7.121303097656036e-05, 0.00013592555522969353, 0.00022419194446504707, 0.00046751088043420365, 0.0007947666159234062, 5.432902765186575e-06, 1.1813792985031223e-05, 2.1642027628736545e-05, 3.545750386809171e-05, 4.0706735068432426e-06, 8.91245632526636e-06, 1.6448676387077087e-05, 2.715865086695285e-05, 4.145682553747548e-05, 8.215368609340989e-05, 0.0001405762547400016, 0.0002178201903997162, 0.0004292277391191971, 3.149533456005272e-06, 6.927090261248188e-06, 1.2850221022301946e-05, 2.133414891203422e-05, 3.2753811525821765e-05, 2.5063381825769267e-06, 5.529032655136518e-06, 1.0293019409142573e-05, 1.715513129176478e-05, 2.6447156817306983e-05, 5.351108033051714e-05, 9.357350849046059e-05, 0.00021860369089794185, 0.00040861208491197327, 2.043913352047672e-06, 4.5178863011866045e-06, 8.43119295251588e-06, 1.4090703193925387e-05, 2.1787683954380318e-05, 1.7025912058117536e-06, 3.7684090427798338e-06, 7.0445089885454935e-06, 1.1796203592826007e-05, 1.8279033677322665e-05, 3.7402880682583695e-05, 6.621415180745086e-05, 0.00010627674860252154, 0.00022509111647561818, 1.4446456711267823e-06, 3.2003487011940417e-06, 5.989808429609241e-06, 1.004416785988565e-05, 1.558841188641713e-05, 1.2455560994926253e-06, 2.7610125811625585e-06, 5.1720484418532574e-06, 8.681784305989012e-06, 1.3489438128101975e-05, 2.7771007539538532e-05, 4.9502215619518023e-05, 8.005805167086202e-05, 0.00012067921563940069, 0.00023631092717125844, 1.0889698754210355e-06, 2.4149884810878706e-06, 4.5268061098836015e-06, 7.604507510227068e-06, 9.637193175612922e-07, 2.137950067514784e-06, 4.009531450067492e-06, 1.048736179628748e-05, 2.1663984183001967e-05, 3.8766836440976196e-05, 6.297014318585783e-05, 9.538075624332064e-05, 0.00013702401711144976, 8.620090372604493e-07, 1.912840770814155e-06, 3.5888264158688903e-06, 6.035181511908872e-06, 8.181805782078431e-07, 7.97772479577361e-07, 7.879180471665371e-07, 7.830751083042301e-07, 7.782872080087666e-07, 8.23546459162762e-07, 8.705301411490806e-07, 9.69800156672528e-07, 1.1904561463460062e-06, 1.7274716419667267e-06, 3.2421631771086076e-06, 8.495207975361699e-06, 1.7583883943351035e-05, 3.153675060905988e-05, 5.1356419982205244e-05, 7.801140138311922e-05, 0.0001554740508425525], "range": [4.186832327071584e-05, 8.067406565925288e-05, 0.00013195757643318218, 0.00019445689605898233, 0.00026670029794380605, 0.00043452754685036147, 0.0006301538318045801, 0.0011128088492181403, 0.0014532758400575756, 0.0016525873389324824, 0.0017567983675554118, 0.0018099647026640652, 0.0018368099642238562, 0.0018502977273373933, 0.0018638287625741881, 0.001834963027904959, 0.0018065971034232336, 0.0017513324922377826, 0.0016464517732127668, 2.5586983082313108e-05, 5.1440767787747126e-05, 8.736958114427185e-05, 0.0001331388122727369, 0.00018816403625362607, 0.0014578832604939967, 1.628641741364395e-05, 3.3777069512202694e-05, 5.903616487920802e-05, 9.238052815227818e-05, 0.00013379643320522727, 0.00023970891161013811, 0.00037322241160393435, 0.0005310633428717348, 0.0009121232576300257, 0.0011654680548707766, 1.0829627501113639e-05, 2.2958785817665526e-05, 4.0984940188466603e-05, 6.54400400259594e-05, 7.517385055323541e-06, 1.617981687725266e-05, 2.9325136779449483e-05, 7.11990791548418e-05, 0.00013589647038833564, 0.000224139508069053, 0.00046738000801254987, 0.0007945032697381326, 5.43169501690726e-06, 1.1811062658679219e-05, 2.1636846673903077e-05, 3.544872372504205e-05, 4.069481717331013e-06, 8.909761949735374e-06, 1.644356339365199e-05, 2.7149985438267042e-05, 4.144325709683002e-05, 8.212539256894245e-05, 0.0001405252300299606, 0.00021773669696043018, 0.00042904319062937534, 3.1483556488722413e-06, 6.924427417025747e-06, 1.2845167699078624e-05, 2.132558431159514e-05, 3.274040033887651e-05, 2.5051729155204334e-06, 5.526398107516416e-06, 1.0288019668840076e-05, 1.7146657291294565e-05, 2.6433887009287454e-05, 5.348340580230718e-05, 9.352359260014854e-05, 0.00021847899177231895, 0.00040836091171001567, 2.0427592376756286e-06, 4.515276933249292e-06, 8.426240920411283e-06, 1.4082309908762234e-05, 2.1774540180880415e-05, 1.701447078114096e-06, 3.7658222306579027e-06, 7.039599710829797e-06, 1.1787882673355604e-05, 1.8266002950474928e-05, 3.7375702844540686e-05, 6.616512771812031e-05, 0.00010619650855266595, 0.0002249136611746652, 1.4435105166477954e-06, 3.197782161809432e-06, 5.98493759108645e-06, 1.0035912024795154e-05, 1.5575482869267336e-05, 1.2444295379805527e-06, 2.7584654649824727e-06, 5.167214453939842e-06, 8.673590909968448e-06, 1.3476606808652685e-05, 2.77442462451115e-05, 4.9453942845921754e-05, 7.99790401287229e-05, 0.00012055859343707591, 0.00023606789693087125, 1.0878525008473407e-06, 2.4124621281270656e-06, 4.522011507678461e-06, 7.596380832114407e-06, 9.62610310161052e-07, 2.1354426271900027e-06, 4.0047727280309255e-06, 1.0474729834455974e-05, 2.1637638049674215e-05, 3.8719311101665845e-05, 6.289235218680955e-05, 9.52619924491775e-05, 0.00013685195358850325, 8.609076812182428e-07, 1.9103506265611506e-06, 3.5841005103914318e-06, 6.027171227706669e-06, 8.170828072395819e-07, 7.966764453199099e-07, 7.868228678075205e-07, 7.819803530902649e-07, 7.771928747595031e-07, 8.223867444108449e-07, 8.693024912594519e-07, 9.684287799255108e-07, 1.1887645198226173e-06, 1.7249973738370114e-06, 3.2374673962645722e-06, 8.482742985323764e-06, 1.755788538121346e-05, 3.148985144810158e-05, 5.127965229983252e-05, 7.789419700993985e-05, 0.00015523787044469009]}, "triangles": [[32, 7, 6], [102, 115, 136], [115, 135, 136], [46, 59, 73], [87, 102, 73], [33, 8, 7], [34, 33, 46], [32, 31, 44], [31, 32, 6], [57, 58, 44], [58, 57, 71], [85, 86, 71], [114, 115, 101], [115, 114, 135], [86, 100, 101], [9, 8, 33], [29, 38, 42], [50, 55, 42], [106, 110, 97], [119, 130, 131], [110, 119, 131], [83, 92, 84], [92, 98, 84], [98, 92, 97], [23, 5, 4], [5, 23, 30], [23, 29, 30], [28, 38, 29], [38, 37, 41], [49, 50, 41], [55, 64, 56], [64, 70, 56], [70, 64, 69], [50, 54, 55], [78, 70, 69], [78, 83, 84], [70, 78, 84], [96, 106, 97], [106, 105, 109], [119, 118, 130], [118, 119, 109], [34, 24, 33], [24, 9, 33], [116, 120, 117], [128, 129, 117], [120, 128, 117], [13, 15, 14], [125, 123, 124], [32, 33, 7], [33, 32, 45], [58, 32, 44], [32, 58, 45], [59, 33, 45], [33, 59, 46], [58, 59, 45], [59, 58, 72], [87, 115, 102], [115, 87, 101], [87, 59, 72], [59, 87, 73], [86, 87, 72], [87, 86, 101], [58, 86, 72], [86, 58, 71], [31, 5, 30], [5, 31, 6], [43, 31, 30], [31, 43, 44], [29, 43, 30], [43, 29, 42], [55, 43, 42], [43, 55, 56], [57, 43, 56], [43, 57, 44], [70, 57, 56], [57, 70, 71], [85, 70, 84], [70, 85, 71], [132, 110, 131], [110, 132, 111], [98, 85, 84], [85, 98, 99], [98, 110, 111], [110, 98, 97], [114, 134, 135], [134, 114, 113], [112, 98, 111], [98, 112, 99], [132, 112, 111], [112, 132, 133], [112, 134, 113], [134, 112, 133], [100, 85, 99], [85, 100, 86], [100, 112, 113], [112, 100, 99], [114, 100, 113], [100, 114, 101], [50, 38, 41], [38, 50, 42], [119, 106, 109], [106, 119, 110], [19, 1, 0], [1, 19, 20], [3, 23, 4], [23, 3, 22], [21, 1, 20], [1, 21, 2], [3, 21, 22], [21, 3, 2], [21, 28, 22], [28, 21, 27], [28, 23, 22], [23, 28, 29], [21, 26, 27], [26, 21, 20], [19, 26, 20], [26, 19, 25], [35, 26, 25], [26, 35, 36], [37, 28, 27], [28, 37, 38], [37, 26, 36], [26, 37, 27], [40, 37, 36], [37, 40, 41], [35, 40, 36], [40, 35, 39], [47, 40, 39], [40, 47, 48], [49, 40, 48], [40, 49, 41], [108, 116, 117], [116, 108, 107], [108, 103, 107], [103, 108, 104], [94, 103, 104], [103, 94, 93], [94, 88, 93], [88, 94, 89], [49, 54, 50], [54, 49, 53], [64, 54, 63], [54, 64, 55], [49, 52, 53], [52, 49, 48], [47, 52, 48], [52, 47, 51], [60, 52, 51], [52, 60, 61], [54, 62, 63], [62, 54, 53], [62, 52, 61], [52, 62, 53], [80, 88, 89], [88, 80, 79], [80, 74, 79], [74, 80, 75], [66, 62, 61], [62, 66, 67], [60, 66, 61], [66, 60, 65], [66, 74, 75], [74, 66, 65], [76, 66, 75], [66, 76, 67], [80, 76, 75], [76, 80, 81], [68, 62, 67], [62, 68, 63], [76, 68, 67], [68, 76, 77], [68, 64, 63], [64, 68, 69], [68, 78, 69], [78, 68, 77], [80, 90, 81], [90, 80, 89], [94, 90, 89], [90, 94, 95], [76, 82, 77], [82, 76, 81], [90, 82, 81], [82, 90, 91], [82, 78, 77], [78, 82, 83], [82, 92, 83], [92, 82, 91], [90, 96, 91], [96, 90, 95], [96, 92, 91], [92, 96, 97], [94, 105, 95], [105, 94, 104], [108, 105, 104], [105, 108, 109], [105, 96, 95], [96, 105, 106], [108, 118, 109], [118, 108, 117], [129, 118, 117], [118, 129, 130], [24, 10, 9], [10, 24, 18], [17, 10, 18], [17, 11, 10], [121, 128, 120], [128, 121, 127], [17, 12, 11], [16, 12, 17], [121, 122, 127], [122, 126, 127], [13, 12, 16], [15, 13, 16], [122, 123, 126], [123, 125, 126]], "extrema": {"mean": {"max": {"alpha": 2.0, "min_size": 300.0, "value": 0.0007685147822310451}, "min": {"alpha": 3.5, "min_size": 50.0, "value": 1.1022858205500183e-06}}, "P5": {"max": {"alpha": 2.0, "min_size": 300.0, "value": 2.836464509409449e-07}, "min": {"alpha": 3.5, "min_size": 50.0, "value": 1.0943332492637665e-09}}, "P50": {"max": {"alpha": 2.0, "min_size": 300.0, "value": 1.0568153505724131e-05}, "min": {"alpha": 3.5, "min_size": 50.0, "value": 1.0024461448071452e-08}}, "P95": {"max": {"alpha": 2.0, "min_size": 300.0, "value": 0.0018641124090251285}, "min": {"alpha": 3.5, "min_size": 50.0, "value": 7.782872080087666e-07}}, "range": {"max": {"alpha": 2.0, "min_size": 300.0, "value": 0.0018638287625741881}, "min": {"alpha": 3.5, "min_size": 50.0, "value": 7.771928747595031e-07}}}, "n_evals": 137, "alpha_range": [2.0, 3.5], "min_range": [50.0, 300.0], "max_size": 5000, "source": "exact"};
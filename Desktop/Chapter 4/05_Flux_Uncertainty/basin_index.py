@@ -0,0 +1,206 @@
+"""
+Spatial index over exported basin mouth coordinates
+- KD-tree on 3-D unit vectors (great-circle radius and nearest-neighbour queries)
+- Latitude-sorted arrays for bounding boxes (dateline-aware)
+- Bulk queries: arrays of query points are answered in one call
+- Persisted as <export>_index.npz next to coastal_data*.js and rebuilt when the export changes
+
+    index = BasinIndex.for_export('coastal_data.js')
+    pos = index.radius(-50.25, 0.25, 200)                    # mouths within 200 km
+    dist_km, pos = index.nearest(4.3, 52.0, k=5)
+    index.summarize(index.bbox(-10, 30, 40, 46), 'flux_baseline')
+"""
+
+import json
+import os
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+EARTH_RADIUS_KM = 6371.0088
+VALUE_COLUMNS = ('discharge', 'flux_items', 'flux_baseline')
+# Written by regional-prior exports only: per-basin mass relative to the global-prior mass
+OPTIONAL_COLUMNS = ('mass_factor',)
+BRUTE_FORCE_CHUNK = 256
+
+
+def load_basin_table(js_path):
+    """Column arrays from an exported window.COASTAL_DATA* file"""
+    with open(js_path, encoding='utf-8') as f:
+        content = f.read()
+    data = json.loads(content.split('=', 1)[1].strip().rstrip(';'))
+    basins = data['basins']
+    table = {
+        'id': np.array([b['id'] for b in basins], dtype=np.int64),
+        'lat': np.array([b['lat'] for b in basins], dtype=float),
+        'lon': np.array([b['lon'] for b in basins], dtype=float),
+    }
+    for col in VALUE_COLUMNS:
+        table[col] = np.array([b[col] for b in basins], dtype=float)
+    for col in OPTIONAL_COLUMNS:
+        if basins and col in basins[0]:
+            table[col] = np.array([b[col] for b in basins], dtype=float)
+    if basins and 'name' in basins[0]:
+        table['name'] = np.array([b.get('name', '') for b in basins], dtype=object)
+    return table
+
+
+def lonlat_to_xyz(lon, lat):
+    lon, lat = np.radians(lon), np.radians(lat)
+    cos_lat = np.cos(lat)
+    return np.stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def chord_from_km(distance_km):
+    return 2.0 * np.sin(np.minimum(np.asarray(distance_km) / EARTH_RADIUS_KM, np.pi) / 2.0)
+
+
+def km_from_chord(chord):
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(np.asarray(chord) / 2.0, 0.0, 1.0))
+
+
+def index_path_for(js_path):
+    return os.path.splitext(js_path)[0] + "_index.npz"
+
+
+class BasinIndex:
+    def __init__(self, ids, lon, lat, columns=None, names=None):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.lon = np.asarray(lon, dtype=float)
+        self.lat = np.asarray(lat, dtype=float)
+        self.columns = {k: np.asarray(v, dtype=float) for k, v in (columns or {}).items()}
+        self.names = names
+        self.xyz = lonlat_to_xyz(self.lon, self.lat)
+        self.tree = cKDTree(self.xyz) if cKDTree is not None else None
+        self.lat_order = np.argsort(self.lat, kind='stable')
+        self.sorted_lat = self.lat[self.lat_order]
+
+    @classmethod
+    def from_table(cls, table):
+        return cls(table['id'], table['lon'], table['lat'],
+                   {k: table[k] for k in VALUE_COLUMNS + OPTIONAL_COLUMNS if k in table}, table.get('name'))
+
+    # --- Persistence ---
+    def save(self, path):
+        arrays = dict(ids=self.ids, lon=self.lon, lat=self.lat,
+                      **{f'col_{k}': v for k, v in self.columns.items()})
+        if self.names is not None:
+            arrays['names'] = np.asarray(self.names, dtype=str)
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            columns = {k[4:]: data[k] for k in data.files if k.startswith('col_')}
+            names = data['names'].astype(object) if 'names' in data.files else None
+            return cls(data['ids'], data['lon'], data['lat'], columns, names)
+
+    @classmethod
+    def for_export(cls, js_path, rebuild=False):
+        """Load the persisted index next to an export; rebuild it if the export is newer"""
+        path = index_path_for(js_path)
+        if not rebuild and os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(js_path):
+            return cls.load(path)
+        index = cls.from_table(load_basin_table(js_path))
+        index.save(path)
+        return index
+
+    # --- Queries (positions into the index arrays) ---
+    def radius(self, lon, lat, radius_km):
+        """
+        Basins within radius_km (great circle) of each point.
+        Scalar point -> array of positions; arrays of points -> list of arrays.
+        """
+        points = lonlat_to_xyz(np.atleast_1d(lon), np.atleast_1d(lat))
+        chord = np.broadcast_to(chord_from_km(radius_km), (len(points),))
+        if self.tree is not None:
+            hits = self.tree.query_ball_point(points, chord, return_sorted=True)
+            hits = [np.asarray(h, dtype=np.int64) for h in hits]
+        else:
+            hits = []
+            for start in range(0, len(points), BRUTE_FORCE_CHUNK):
+                block = points[start:start + BRUTE_FORCE_CHUNK]
+                d = np.linalg.norm(block[:, None, :] - self.xyz[None, :, :], axis=-1)
+                hits.extend(np.flatnonzero(row <= c) for row, c in zip(d, chord[start:start + len(block)]))
+        return hits[0] if np.ndim(lon) == 0 else hits
+
+    def nearest(self, lon, lat, k=1):
+        """(distance_km, positions) of the k nearest basins; shapes (..., k)"""
+        points = lonlat_to_xyz(np.atleast_1d(lon), np.atleast_1d(lat))
+        k = min(k, len(self.ids))
+        if self.tree is not None:
+            chord, pos = self.tree.query(points, k=k)
+            chord, pos = chord.reshape(len(points), k), pos.reshape(len(points), k)
+        else:
+            d = np.linalg.norm(points[:, None, :] - self.xyz[None, :, :], axis=-1)
+            pos = np.argsort(d, axis=1)[:, :k]
+            chord = np.take_along_axis(d, pos, axis=1)
+        dist = km_from_chord(chord)
+        return (dist[0], pos[0]) if np.ndim(lon) == 0 else (dist, pos)
+
+    def bbox(self, min_lon, min_lat, max_lon, max_lat):
+        """Basins inside a lon/lat box; min_lon > max_lon wraps across the dateline"""
+        lo = np.searchsorted(self.sorted_lat, min_lat, side='left')
+        hi = np.searchsorted(self.sorted_lat, max_lat, side='right')
+        cand = self.lat_order[lo:hi]
+        lon = self.lon[cand]
+        if min_lon <= max_lon:
+            inside = (lon >= min_lon) & (lon <= max_lon)
+        else:
+            inside = (lon >= min_lon) | (lon <= max_lon)
+        return np.sort(cand[inside])
+
+    # --- Summaries ---
+    def summarize(self, positions, column='flux_baseline'):
+        values = self.columns[column][positions]
+        summary = {'count': int(len(positions)), 'sum': float(values.sum()) if len(values) else 0.0}
+        if len(values):
+            top = positions[np.argmax(values)]
+            summary.update(max=float(values.max()), max_id=int(self.ids[top]),
+                           max_lat=float(self.lat[top]), max_lon=float(self.lon[top]))
+        return summary
+
+    def top(self, column='flux_baseline', positions=None, n=10):
+        positions = np.arange(len(self.ids)) if positions is None else np.asarray(positions)
+        values = self.columns[column][positions]
+        n = min(n, len(positions))
+        if n == 0:
+            return positions[:0]
+        part = np.argpartition(-values, n - 1)[:n]
+        return positions[part[np.argsort(-values[part], kind='stable')]]
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build / query the basin mouth spatial index")
+    parser.add_argument('export', help="coastal_data.js or coastal_data_ddm30.js")
+    parser.add_argument('--rebuild', action='store_true')
+    parser.add_argument('--near', type=float, nargs=2, metavar=('LON', 'LAT'))
+    parser.add_argument('--radius-km', type=float, default=200.0)
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--bbox', type=float, nargs=4, metavar=('MIN_LON', 'MIN_LAT', 'MAX_LON', 'MAX_LAT'))
+    parser.add_argument('--column', default='flux_baseline')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    index = BasinIndex.for_export(args.export, rebuild=args.rebuild)
+    print(f"Index: {len(index.ids)} basins ({time.perf_counter() - t0:.3f} s) -> {index_path_for(args.export)}")
+    if args.near:
+        t0 = time.perf_counter()
+        pos = index.radius(args.near[0], args.near[1], args.radius_km)
+        dist, nearest = index.nearest(args.near[0], args.near[1], k=args.k)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"Within {args.radius_km:g} km: {index.summarize(pos, args.column)} ({elapsed:.2f} ms)")
+        for d, p in zip(dist, nearest):
+            print(f"  {int(index.ids[p])}: {d:.1f} km, {args.column}={index.columns[args.column][p]:.4g}")
+    if args.bbox:
+        t0 = time.perf_counter()
+        pos = index.bbox(*args.bbox)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"In bbox: {index.summarize(pos, args.column)} ({elapsed:.2f} ms)")
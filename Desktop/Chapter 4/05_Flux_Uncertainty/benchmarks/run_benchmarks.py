@@ -0,0 +1,315 @@
+"""
+Benchmark suite for the flux uncertainty tools
+- MC kernels (string-based legacy path vs coded flux_mc path, streamed, nested mode)
+- Explorer surface precompute and the sparse-grid parameter sweep
+- Explorer input load: shapefile read vs attaching to the shared-memory dataset
+- load_and_process (DDM30) and export_coastal_data (Level 12), stage by stage
+  on synthetic inputs of 10k..1M basins
+
+Results are written as JSON; runs writing into results/ are also appended to
+results/history.jsonl so that regressions show up as tracked numbers (ad-hoc
+runs with --out elsewhere, or --no-history, leave it alone); --compare flags
+slowdowns against a saved baseline.
+
+    python run_benchmarks.py --sizes 10000 100000 --out results/latest.json
+    python run_benchmarks.py --compare results/baseline.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import importlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+UNC_DIR = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+HISTORY_FILE = os.path.join(RESULTS_DIR, "history.jsonl")
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), "flux_bench_data")
+
+sys.path.insert(0, UNC_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import adaptive_surface
+import dataset_daemon
+import flux_mc
+import flux_sweep
+from pipeline_profiler import RunProfiler
+from synthetic_data import generate_dataset
+
+# Synthetic grids are in EPSG:4326 like the real inputs; the pipelines warn about it
+warnings.filterwarnings('ignore', message='Geometry is in a geographic CRS')
+
+
+def timed(func, repeat=1, quiet=True):
+    """Best-of-repeat wall time in seconds and the last return value"""
+    best, value = np.inf, None
+    for _ in range(repeat):
+        sink = io.StringIO() if quiet else sys.stdout
+        with contextlib.redirect_stdout(sink):
+            t0 = time.perf_counter()
+            value = func()
+            best = min(best, time.perf_counter() - t0)
+    return best, value
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=UNC_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_mc(results, n_draws, repeat):
+    ebd = importlib.import_module('export_basin_data')
+    shape_probs, poly_probs = ebd.load_priors(PRIOR_SHAPE, PRIOR_POLY)
+    params = {'n': n_draws}
+
+    results['mc.legacy_strings'] = {'seconds': timed(
+        lambda: ebd.estimate_mean_mass(shape_probs, poly_probs, n_draws, 2.64, 100, 5000), repeat)[0],
+        'params': params}
+    results['mc.coded'] = {'seconds': timed(
+        lambda: flux_mc.sample_masses(n_draws, 2.64, 100, 5000, shape_probs, poly_probs)[0].mean(), repeat)[0],
+        'params': params}
+    results['mc.streamed'] = {'seconds': timed(
+        lambda: flux_mc.stream_mass_statistics(n_draws, 2.64, 100, 5000, shape_probs, poly_probs)['mean'], repeat)[0],
+        'params': dict(params, chunk=flux_mc.STREAM_CHUNK, jit=flux_mc.numba is not None)}
+    results['mc.nested_200x2000'] = {'seconds': timed(
+        lambda: flux_mc.nested_flux_quantiles(1e15, 2.64, 100, 5000, shape_probs, poly_probs), repeat)[0],
+        'params': {'n_outer': 200, 'n_inner': 2000}}
+
+
+def bench_surface(results, repeat):
+    """The 02_Flux_Uncertainty_Vis startup precompute: 3 quantile surfaces on an 8x8 grid"""
+    vis = importlib.import_module('02_Flux_Uncertainty_Vis')
+    ebd = importlib.import_module('export_basin_data')
+    # Skip the shapefile/CSV loads; only the MC state is needed
+    sim = vis.CoastalFluxSimulator(load_inputs=False)
+    sim.shape_probs, sim.poly_probs = ebd.load_priors(PRIOR_SHAPE, PRIOR_POLY)
+
+    alpha_grid = np.linspace(2.0, 3.5, 8)
+    min_grid = np.linspace(50, 300, 8)
+
+    def precompute():
+        for q_name in ['P5', 'P50', 'P95']:
+            sim.compute_surface(alpha_grid, min_grid, lambda q, k=q_name: q[k])
+
+    results['surface.precompute_8x8x3'] = {'seconds': timed(precompute, repeat)[0],
+                                           'params': {'grid': [8, 8], 'draws_per_cell': 500}}
+
+    # 4x4 MC knots with pathwise gradients, Hermite-interpolated to 16x16
+    def gradient_precompute():
+        flux_mc.gradient_surfaces(np.linspace(2.0, 3.5, 4), np.linspace(50, 300, 4), np.linspace(2.0, 3.5, 16),
+                                  np.linspace(50, 300, 16), 500, 5000, sim.shape_probs, sim.poly_probs)
+
+    results['surface.gradient_4x4_to_16x16'] = {'seconds': timed(gradient_precompute, repeat)[0],
+                                                'params': {'knots': [4, 4], 'grid': [16, 16],
+                                                           'draws_per_knot': 500}}
+
+    # What the explorers now run: adaptive quadtree of MC runs (adaptive_surface.py)
+    def adaptive_precompute():
+        evaluate = adaptive_surface.mc_evaluator(sim.shape_probs, sim.poly_probs, vis.SURFACE_MC_DRAWS,
+                                                 stats=('P5', 'P50', 'P95'))
+        return adaptive_surface.AdaptiveSurface(evaluate, ('P5', 'P50', 'P95'), vis.SURFACE_ALPHA_RANGE,
+                                                vis.SURFACE_MIN_RANGE, max_evals=vis.SURFACE_MAX_EVALS).build()
+
+    seconds, surface = timed(adaptive_precompute, repeat)
+    results['surface.adaptive'] = {'seconds': seconds,
+                                   'params': {'max_evals': vis.SURFACE_MAX_EVALS, 'n_evals': surface.n_evals,
+                                              'draws_per_point': vis.SURFACE_MC_DRAWS}}
+
+    # Smolyak sweep over the 8 default physical parameters (flux_sweep.py)
+    def sweep_precompute():
+        return flux_sweep.SparseGridSweep(sim.shape_probs, sim.poly_probs, level=flux_sweep.SPARSE_LEVEL).build()
+
+    seconds, sweep = timed(sweep_precompute, repeat)
+    results['sweep.smolyak'] = {'seconds': seconds,
+                                'params': {'level': flux_sweep.SPARSE_LEVEL, 'dims': len(sweep.names),
+                                           'points': len(sweep)}}
+
+
+def bench_stages(results, paths, n_basins):
+    """Stage primitives shared by both pipelines, timed in isolation"""
+    prefix = f'stages[{n_basins}]'
+    t, atlas = timed(lambda: gpd.read_file(paths['atlas_shp']))
+    results[f'{prefix}.read_atlas'] = {'seconds': t, 'rows': len(atlas)}
+    t, flux = timed(lambda: pd.read_csv(paths['flux_csv']))
+    results[f'{prefix}.read_flux_csv'] = {'seconds': t, 'rows': len(flux)}
+    t, merged = timed(lambda: atlas[['HYBAS_ID', 'geometry']].merge(flux, on='HYBAS_ID', how='inner'))
+    results[f'{prefix}.merge'] = {'seconds': t, 'rows': len(merged)}
+    t, centroids = timed(lambda: merged.geometry.centroid)
+    results[f'{prefix}.centroid'] = {'seconds': t, 'rows': len(centroids)}
+    points = gpd.GeoDataFrame(merged.drop(columns='geometry'), geometry=centroids, crs=atlas.crs)
+    ddm30 = gpd.read_file(paths['ddm30_shp'])
+    t, joined = timed(lambda: gpd.sjoin(points, ddm30[['subbasn', 'geometry']], how='inner', predicate='within'))
+    results[f'{prefix}.sjoin'] = {'seconds': t, 'rows': len(joined)}
+    t, _ = timed(lambda: [{'id': int(r['HYBAS_ID']), 'flux': float(r['Flux_Linear'])}
+                          for _, r in merged.iterrows()])
+    results[f'{prefix}.export_loop_iterrows'] = {'seconds': t, 'rows': len(merged)}
+
+    # Explorer startup: own shapefile read vs a view over the daemon's block
+    t, coastal = timed(lambda: dataset_daemon.read_coastal_basins(paths['atlas_shp']))
+    results[f'{prefix}.read_coastal'] = {'seconds': t, 'rows': len(coastal)}
+    shm = dataset_daemon.publish_dataset(paths['atlas_shp'], paths['flux_csv'],
+                                         name=f'flux_bench_{n_basins}', replace=True)
+    try:
+        t, shared = timed(lambda: dataset_daemon.SharedDataset(shm).coastal_basins())
+        results[f'{prefix}.shared_attach'] = {'seconds': t, 'rows': len(shared), 'block_mb': shm.size / 1e6}
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def record_pipeline(results, name, seconds, profiler):
+    """Total time plus the per-stage breakdown from the pipeline's own run report"""
+    results[name] = {'seconds': seconds}
+    for stage in profiler.stages:
+        results[f"{name}/{stage['name']}"] = {'seconds': stage['wall_s'], 'cpu_s': stage['cpu_s'],
+                                             'rows': stage['rows'], 'rss_delta_mb': stage['rss_delta_mb'],
+                                             'stage_peak_rss_mb': stage['stage_peak_rss_mb']}
+
+
+def bench_pipelines(results, paths, n_basins, work_dir):
+    ddm = importlib.import_module('06_Aggregate_DDM30')
+    ebd = importlib.import_module('export_basin_data')
+
+    ddm_out = os.path.join(work_dir, 'coastal_data_ddm30.js')
+    prof = RunProfiler('load_and_process', enabled=True, verbose=False)
+    t, _ = timed(lambda: ddm.load_and_process(
+        flux_path=paths['flux_csv'], atlas_path=paths['atlas_shp'],
+        ddm30_shp_path=paths['ddm30_shp'], ddm30_csv_path=paths['ddm30_csv'],
+        output_path=ddm_out, profiler=prof))
+    if not os.path.exists(ddm_out):
+        raise RuntimeError("load_and_process produced no output")
+    record_pipeline(results, f'pipeline[{n_basins}].load_and_process', t, prof)
+
+    prof = RunProfiler('load_and_process_low_memory', enabled=True, verbose=False)
+    t, _ = timed(lambda: ddm.load_and_process(
+        flux_path=paths['flux_csv'], atlas_path=paths['atlas_shp'],
+        ddm30_shp_path=paths['ddm30_shp'], ddm30_csv_path=paths['ddm30_csv'],
+        output_path=ddm_out, profiler=prof, low_memory=True))
+    record_pipeline(results, f'pipeline[{n_basins}].load_and_process_low_memory', t, prof)
+
+    prof = RunProfiler('load_and_process_partitioned', enabled=True, verbose=False)
+    t, _ = timed(lambda: ddm.load_and_process(
+        flux_path=paths['flux_csv'], atlas_path=paths['atlas_shp'],
+        ddm30_shp_path=paths['ddm30_shp'], ddm30_csv_path=paths['ddm30_csv'],
+        output_path=ddm_out, profiler=prof, partition_by='region'))
+    record_pipeline(results, f'pipeline[{n_basins}].load_and_process_partitioned', t, prof)
+
+    lev12_out = os.path.join(work_dir, 'coastal_data.js')
+    prof = RunProfiler('export_coastal_data', enabled=True, verbose=False)
+    t, _ = timed(lambda: ebd.export_coastal_data(
+        lev12_shp=paths['atlas_shp'], flux_file=paths['flux_csv'], output_file=lev12_out,
+        prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY, profiler=prof))
+    if not os.path.exists(lev12_out):
+        raise RuntimeError("export_coastal_data produced no output")
+    record_pipeline(results, f'pipeline[{n_basins}].export_coastal_data', t, prof)
+
+
+def compare(results, baseline_path, tolerance):
+    """Print ratios against a baseline; return the names that regressed"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+    regressions = []
+    print(f"\n{'benchmark':<60} {'base (s)':>10} {'now (s)':>10} {'ratio':>7}")
+    for name, entry in results.items():
+        if name not in baseline:
+            continue
+        base, now = baseline[name]['seconds'], entry['seconds']
+        ratio = now / base if base > 0 else np.inf
+        flag = '  << REGRESSION' if ratio > 1 + tolerance else ''
+        print(f"{name:<60} {base:>10.4f} {now:>10.4f} {ratio:>7.2f}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flux uncertainty benchmark suite")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help="Synthetic level-12 basin counts (10k..1M)")
+    parser.add_argument('--suites', nargs='+', default=['mc', 'surface', 'stages', 'pipelines'],
+                        choices=['mc', 'surface', 'stages', 'pipelines'])
+    parser.add_argument('--mc-draws', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3, help="Best-of repeats for kernels")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="Synthetic data cache")
+    parser.add_argument('--out', default=os.path.join(RESULTS_DIR, 'latest.json'))
+    parser.add_argument('--no-history', action='store_true',
+                        help="Do not append to results/history.jsonl (implied when --out is outside results/)")
+    parser.add_argument('--compare', help="Baseline JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed slowdown (0.2 = 20%%)")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args()
+
+    results = {}
+    if 'mc' in args.suites:
+        print("Benchmarking MC kernels...")
+        bench_mc(results, args.mc_draws, args.repeat)
+    if 'surface' in args.suites:
+        print("Benchmarking surface precompute...")
+        bench_surface(results, args.repeat)
+
+    for n_basins in args.sizes:
+        if not {'stages', 'pipelines'} & set(args.suites):
+            break
+        print(f"Preparing synthetic data ({n_basins} basins)...")
+        t, paths = timed(lambda: generate_dataset(os.path.join(args.data_dir, str(n_basins)), n_basins))
+        print(f"  - ready in {t:.1f} s")
+        if 'stages' in args.suites:
+            print(f"Benchmarking stages ({n_basins} basins)...")
+            bench_stages(results, paths, n_basins)
+        if 'pipelines' in args.suites:
+            print(f"Benchmarking pipelines ({n_basins} basins)...")
+            with tempfile.TemporaryDirectory() as work_dir:
+                bench_pipelines(results, paths, n_basins, work_dir)
+
+    for name, entry in results.items():
+        print(f"{name:<60} {entry['seconds']:>10.4f} s")
+
+    report = {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'git': git_revision(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'geopandas': gpd.__version__,
+            'machine': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=2)
+    in_results = os.path.dirname(os.path.abspath(args.out)) == os.path.abspath(RESULTS_DIR)
+    if in_results and not args.no_history:
+        with open(HISTORY_FILE, 'a') as f:
+            f.write(json.dumps(report) + '\n')
+    print(f"\nWrote {args.out}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
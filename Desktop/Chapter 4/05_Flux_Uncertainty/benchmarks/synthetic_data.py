@@ -0,0 +1,189 @@
+"""
+Synthetic stand-ins for the BasinATLAS / Flux_Data_Modeling / DDM30 inputs
+- Level 12 polygon grid with HYBAS_ID, NEXT_DOWN, PFAF_ID, COAST, dis_m3_pyr
+- Flux CSV with Flux_Linear, Natural_Discharge_Upstream, Conc_Linear
+- DDM30-like basin polygons (subbasn, name) and mouth metadata CSV
+
+HYBAS_IDs follow the BasinATLAS layout: region digit, level (12), 7-digit
+sequence. Each grid row is cut into east-flowing rivers of `river_length`
+cells; the east-most cell of each river is the coastal outlet.
+"""
+
+import json
+import os
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from shapely import box
+
+LAT_MIN, LAT_MAX = -56.0, 84.0
+N_REGIONS = 9
+
+
+def _grid_shape(n_basins):
+    ny = max(1, int(round(np.sqrt(n_basins * (LAT_MAX - LAT_MIN) / 360.0))))
+    nx = int(np.ceil(n_basins / ny))
+    return nx, ny
+
+
+def _pfaf_digits(seq, n_digits=11):
+    """Base-9 digits 1..9 so that PFAF prefixes nest like real Pfafstetter codes"""
+    code = np.zeros_like(seq)
+    rest = seq.copy()
+    for k in range(n_digits):
+        code += (rest % 9 + 1) * 10 ** k
+        rest //= 9
+    return code
+
+
+def make_level12_grid(n_basins, seed=0, river_length=40, n_attributes=20):
+    """BasinATLAS level-12 stand-in as a GeoDataFrame (EPSG:4326)"""
+    rng = np.random.default_rng(seed)
+    nx, ny = _grid_shape(n_basins)
+    cell_w = 360.0 / nx
+    cell_h = (LAT_MAX - LAT_MIN) / ny
+
+    idx = np.arange(n_basins)
+    row, col = idx // nx, idx % nx
+    region = 1 + col * N_REGIONS // nx
+    region_start = -((-(region - 1) * nx) // N_REGIONS)  # ceil((region-1) * nx / 9)
+    river = (col - region_start) // river_length
+
+    # Sequence number within each region, row-major
+    order = np.lexsort((idx, region))
+    seq = np.empty(n_basins, dtype=np.int64)
+    seq[order] = np.arange(n_basins) - np.searchsorted(region[order], region[order])
+    hybas_id = region.astype(np.int64) * 10**9 + 12 * 10**7 + seq + 1
+
+    same_river = np.zeros(n_basins, dtype=bool)
+    same_river[:-1] = ((row[1:] == row[:-1]) & (region[1:] == region[:-1])
+                       & (river[1:] == river[:-1]))
+    next_down = np.where(same_river, np.roll(hybas_id, -1), 0)
+    coast = (~same_river).astype(np.int64)
+
+    sub_area = rng.lognormal(np.log(cell_w * cell_h * 1.2e4), 0.3, n_basins)
+    local_runoff = rng.lognormal(np.log(5e6), 1.2, n_basins)
+    river_key = pd.Series(row * (N_REGIONS + 1) * (nx + 1) + region * (nx + 1) + river)
+    df = pd.DataFrame({
+        'HYBAS_ID': hybas_id,
+        'NEXT_DOWN': next_down,
+        'NEXT_SINK': 0,
+        'MAIN_BAS': 0,
+        'SUB_AREA': sub_area,
+        'UP_AREA': pd.Series(sub_area).groupby(river_key).cumsum().values,
+        'PFAF_ID': region.astype(np.int64) * 10**11 + _pfaf_digits(seq),
+        'ENDO': 0,
+        'COAST': coast,
+        'ORDER': 1,
+        'SORT': idx + 1,
+        'dis_m3_pyr': pd.Series(local_runoff).groupby(river_key).cumsum().values,
+    })
+    outlet_of_river = pd.Series(hybas_id).groupby(river_key).transform('last').values
+    df['MAIN_BAS'] = outlet_of_river
+    df['NEXT_SINK'] = outlet_of_river
+    for k in range(n_attributes):
+        df[f'attr_{k:02d}'] = rng.random(n_basins)
+
+    x0 = -180.0 + col * cell_w
+    y0 = LAT_MIN + row * cell_h
+    geometry = box(x0, y0, x0 + cell_w, y0 + cell_h)
+    gdf = gpd.GeoDataFrame(df, geometry=geometry, crs='EPSG:4326')
+    gdf.attrs['grid'] = {'nx': nx, 'ny': ny, 'cell_w': cell_w, 'cell_h': cell_h}
+    return gdf
+
+
+def make_flux_table(atlas, seed=0, coverage=0.9, n_extra_columns=10):
+    """Flux_Data_Modeling.csv stand-in; covers a random `coverage` share of basins"""
+    rng = np.random.default_rng(seed + 1)
+    keep = rng.random(len(atlas)) < coverage
+    keep |= atlas['COAST'].values == 1
+    sub = atlas.loc[keep]
+    discharge_m3s = sub['dis_m3_pyr'].values / 31536000.0
+    conc = rng.lognormal(np.log(2.0), 1.0, len(sub))
+    df = pd.DataFrame({
+        'HYBAS_ID': sub['HYBAS_ID'].values,
+        'Flux_Linear': conc * discharge_m3s * rng.lognormal(0.0, 0.5, len(sub)),
+        'Natural_Discharge_Upstream': discharge_m3s,
+        'Conc_Linear': conc,
+    })
+    for k in range(n_extra_columns):
+        df[f'Var_{k:02d}'] = rng.random(len(sub))
+    return df
+
+
+def make_ddm30(atlas, seed=0, block=10, include_share=0.9):
+    """
+    DDM30 stand-in: rectangles of block x block level-12 cells, offset by 0.3
+    of a cell so that some level-12 basins straddle DDM30 borders.
+    Returns (polygons GeoDataFrame, metadata DataFrame).
+    """
+    rng = np.random.default_rng(seed + 2)
+    grid = atlas.attrs['grid']
+    w, h = grid['cell_w'] * block, grid['cell_h'] * block
+    nbx = int(np.ceil(grid['nx'] / block)) + 1
+    nby = int(np.ceil(grid['ny'] / block)) + 1
+
+    bx, by = np.meshgrid(np.arange(nbx), np.arange(nby))
+    bx, by = bx.ravel(), by.ravel()
+    x0 = -180.0 + (bx - 0.3 / block) * w
+    y0 = LAT_MIN + (by - 0.3 / block) * h
+    basin_id = np.arange(1, len(bx) + 1)
+    names = np.array([f'Basin_{i}' for i in basin_id])
+
+    polygons = gpd.GeoDataFrame({'subbasn': basin_id.astype(float), 'name': names},
+                                geometry=box(x0, y0, x0 + w, y0 + h), crs='EPSG:4326')
+    meta = pd.DataFrame({
+        'subbasin': basin_id,
+        'name': names,
+        'Lat_mouth': np.round(y0 + h / 2, 2),
+        'Lon_mouth': np.round(x0 + w, 2),
+        'Include_Flag': (rng.random(len(basin_id)) < include_share).astype(int),
+    })
+    return polygons, meta
+
+
+def generate_dataset(out_dir, n_basins, seed=0, river_length=40, ddm30_block=10,
+                     n_attributes=20, n_extra_flux_columns=10, flux_coverage=0.9):
+    """
+    Write a full synthetic input set to out_dir and return its file paths.
+    An existing set with the same parameters is reused.
+    """
+    params = dict(n_basins=n_basins, seed=seed, river_length=river_length,
+                  ddm30_block=ddm30_block, n_attributes=n_attributes,
+                  n_extra_flux_columns=n_extra_flux_columns, flux_coverage=flux_coverage)
+    paths = {
+        'atlas_shp': os.path.join(out_dir, 'BasinATLAS_v10_lev12.shp'),
+        'flux_csv': os.path.join(out_dir, 'Flux_Data_Modeling.csv'),
+        'ddm30_shp': os.path.join(out_dir, 'basins_joined.shp'),
+        'ddm30_csv': os.path.join(out_dir, 'ddm30_meta.csv'),
+    }
+    manifest_path = os.path.join(out_dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            if json.load(f).get('params') == params and all(map(os.path.exists, paths.values())):
+                return paths
+
+    os.makedirs(out_dir, exist_ok=True)
+    atlas = make_level12_grid(n_basins, seed, river_length, n_attributes)
+    make_flux_table(atlas, seed, flux_coverage, n_extra_flux_columns).to_csv(paths['flux_csv'], index=False)
+    polygons, meta = make_ddm30(atlas, seed, ddm30_block)
+    polygons.to_file(paths['ddm30_shp'])
+    meta.to_csv(paths['ddm30_csv'], index=False)
+    atlas.to_file(paths['atlas_shp'])
+
+    with open(manifest_path, 'w') as f:
+        json.dump({'params': params, 'paths': paths}, f, indent=2)
+    return paths
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic BasinATLAS/DDM30 inputs")
+    parser.add_argument('out_dir')
+    parser.add_argument('--basins', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    for key, path in generate_dataset(args.out_dir, args.basins, args.seed).items():
+        print(f"{key}: {path}")
@@ -0,0 +1,260 @@
+"""
+Shared-memory resident dataset for the explorers
+- A daemon reads the coastal Level 12 basins (attributes and geometry) and the
+  flux CSV once and publishes them as one named shared-memory block
+- Explorers attach by name and wrap the block in read-only numpy views (no copy),
+  so further explorer instances skip the shapefile and add only their own
+  Python objects (DataFrame wrapper, shapely geometries)
+- Block layout: 8-byte manifest length, JSON manifest ({array: dtype, shape,
+  offset}, columns, CRS, source files), then the arrays at 64-byte offsets
+- Geometry is stored as shapely ragged arrays (coordinates + part offsets) and
+  rebuilt with shapely.from_ragged_array; Polygon/MultiPolygon mixes come back
+  as MultiPolygon
+- Without a running daemon, or when a source file changed after the daemon read
+  it, attach_dataset() returns None and the explorers read the files themselves
+
+    python dataset_daemon.py                        # load once, serve until Ctrl+C
+    dataset = attach_dataset()
+    dataset.item_fluxes()                           # (N,) items/yr, view into shared memory
+    dataset.coastal_basins()                        # GeoDataFrame over the shared columns
+"""
+
+import json
+import os
+import signal
+import struct
+import sys
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from export_basin_data import FLUX_FILE, LEV12_SHP, read_coastal_basins
+from startup_loader import gather, load_concurrently
+
+try:
+    import shapely
+except ImportError:
+    shapely = None
+
+SHM_NAME = "flux_dataset"
+ALIGN = 64
+HEADER = struct.Struct('<Q')
+SECONDS_PER_YEAR = 31536000.0
+ITEM_FLUX = 'item_flux'
+# Array name prefixes inside the block
+COLUMN_PREFIX = 'col:'
+GEOMETRY_PREFIX = 'geom:'
+
+_attached = {}
+_attach_lock = threading.Lock()
+
+
+# --- Packing ---
+def _column_array(series):
+    """Attribute column as a fixed-width numpy array (text as unicode, not objects)"""
+    values = series.to_numpy()
+    if values.dtype.kind in 'biuf':
+        return values
+    return series.astype(str).to_numpy().astype(str)
+
+
+def basin_arrays(coastal):
+    """({name: array}, manifest entries) for the attributes, index and geometry of a GeoDataFrame"""
+    arrays = {'index': coastal.index.to_numpy()}
+    columns = [c for c in coastal.columns if c != coastal.geometry.name]
+    for column in columns:
+        arrays[COLUMN_PREFIX + column] = _column_array(coastal[column])
+    geometry_type, coords, offsets = shapely.to_ragged_array(coastal.geometry.values, include_z=False)
+    arrays[GEOMETRY_PREFIX + 'coords'] = coords
+    for k, offset in enumerate(offsets):
+        arrays[f'{GEOMETRY_PREFIX}offsets{k}'] = offset
+    meta = {'columns': columns, 'geometry_type': int(geometry_type), 'n_offsets': len(offsets),
+            'crs': None if coastal.crs is None else coastal.crs.to_wkt()}
+    return arrays, meta
+
+
+def read_item_fluxes(flux_file=FLUX_FILE):
+    """Flux_Linear in items/yr (same conversion as the explorers), or None without the column"""
+    df = pd.read_csv(flux_file)
+    if 'Flux_Linear' not in df.columns:
+        return None
+    return df['Flux_Linear'].to_numpy() * SECONDS_PER_YEAR
+
+
+def _aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def publish(arrays, meta, name=SHM_NAME, replace=False):
+    """Copy arrays into a new shared-memory block; returns the (daemon-owned) SharedMemory"""
+    layout, offset = {}, 0
+    for key, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[key] = array
+        layout[key] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _aligned(offset + array.nbytes)
+    manifest = json.dumps(dict(meta, arrays=layout)).encode('utf-8')
+    data_start = _aligned(HEADER.size + len(manifest))
+    size = max(data_start + offset, 1)
+
+    if replace:
+        try:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+    try:
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        raise RuntimeError(f"Shared memory block {name!r} exists: a daemon is running "
+                           f"(or one crashed; restart with --replace)") from None
+    HEADER.pack_into(shm.buf, 0, len(manifest))
+    shm.buf[HEADER.size:HEADER.size + len(manifest)] = manifest
+    for key, array in arrays.items():
+        start = data_start + layout[key]['offset']
+        shm.buf[start:start + array.nbytes] = array.reshape(-1).view(np.uint8)
+    return shm
+
+
+def publish_dataset(lev12_shp=LEV12_SHP, flux_file=FLUX_FILE, name=SHM_NAME, replace=False):
+    """Read the coastal basins and item fluxes (concurrently) and publish them"""
+    if shapely is None:
+        raise ImportError("dataset_daemon needs shapely >= 2.0 for the ragged geometry arrays")
+    loaders = {'basins': (read_coastal_basins, lev12_shp)}
+    if os.path.exists(flux_file):
+        loaders['flux'] = (read_item_fluxes, flux_file)
+    results = gather(load_concurrently(**loaders))
+    arrays, meta = basin_arrays(results['basins'])
+    if results.get('flux') is not None:
+        arrays[ITEM_FLUX] = results['flux']
+    meta['sources'] = {path: os.path.getmtime(path) for path in (lev12_shp, flux_file) if os.path.exists(path)}
+    meta['created'] = time.time()
+    return publish(arrays, meta, name, replace)
+
+
+# --- Attaching ---
+def _open_block(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    # Before Python 3.13 an attached block is registered with this process's resource
+    # tracker, which would unlink the daemon's block when the explorer exits
+    if os.name == 'posix':
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class SharedDataset:
+    """
+    Read-only numpy views into a published block.
+
+    arrays   : {name: ndarray} backed by shared memory (writeable=False)
+    manifest : columns, geometry layout, CRS and source mtimes from the daemon
+    """
+
+    def __init__(self, shm):
+        self.shm = shm
+        (length,) = HEADER.unpack_from(shm.buf, 0)
+        self.manifest = json.loads(bytes(shm.buf[HEADER.size:HEADER.size + length]).decode('utf-8'))
+        data_start = _aligned(HEADER.size + length)
+        self.arrays = {}
+        for key, entry in self.manifest['arrays'].items():
+            array = np.ndarray(entry['shape'], dtype=np.dtype(entry['dtype']), buffer=shm.buf,
+                               offset=data_start + entry['offset'])
+            array.flags.writeable = False
+            self.arrays[key] = array
+        self._geometry = None
+
+    @classmethod
+    def attach(cls, name=SHM_NAME):
+        return cls(_open_block(name))
+
+    def is_current(self):
+        """True while every source file is unchanged since the daemon read it"""
+        return all(os.path.exists(path) and os.path.getmtime(path) == mtime
+                   for path, mtime in self.manifest['sources'].items())
+
+    def array(self, name):
+        return self.arrays[name]
+
+    def item_fluxes(self):
+        """Flux_Linear in items/yr, or None when the daemon had no flux column"""
+        return self.arrays.get(ITEM_FLUX)
+
+    def columns(self, names=None):
+        """DataFrame of attribute columns over the shared arrays"""
+        names = self.manifest['columns'] if names is None else names
+        return pd.DataFrame({c: self.arrays[COLUMN_PREFIX + c] for c in names},
+                            index=self.arrays['index'], copy=False)
+
+    def geometry(self):
+        """Shapely geometries rebuilt from the shared ragged arrays (once per process)"""
+        if self._geometry is None:
+            offsets = tuple(self.arrays[f'{GEOMETRY_PREFIX}offsets{k}'] for k in range(self.manifest['n_offsets']))
+            self._geometry = shapely.from_ragged_array(shapely.GeometryType(self.manifest['geometry_type']),
+                                                       self.arrays[GEOMETRY_PREFIX + 'coords'], offsets)
+        return self._geometry
+
+    def coastal_basins(self):
+        """The daemon's coastal basins as a GeoDataFrame (gdf[gdf['COAST'] == 1])"""
+        import geopandas as gpd
+        return gpd.GeoDataFrame(self.columns(), geometry=self.geometry(), crs=self.manifest['crs'], copy=False)
+
+    def close(self):
+        self.arrays.clear()
+        self.shm.close()
+
+
+def attach_dataset(name=SHM_NAME):
+    """Process-wide attachment to the daemon's block, or None (no daemon, stale sources)"""
+    with _attach_lock:
+        if name not in _attached:
+            try:
+                dataset = SharedDataset.attach(name)
+            except FileNotFoundError:
+                dataset = None
+            if dataset is not None and not dataset.is_current():
+                print(f"Shared dataset {name!r} is older than its source files; reading them directly")
+                dataset = None
+            _attached[name] = dataset
+        return _attached[name]
+
+
+def serve(lev12_shp=LEV12_SHP, flux_file=FLUX_FILE, name=SHM_NAME, replace=False):
+    t0 = time.perf_counter()
+    shm = publish_dataset(lev12_shp, flux_file, name, replace)
+    dataset = SharedDataset(shm)
+    n_basins = len(dataset.array('index'))
+    flux = dataset.item_fluxes()
+    print(f"Published {n_basins} coastal basins"
+          f"{'' if flux is None else f' and {len(flux)} item fluxes'} as {name!r} "
+          f"({shm.size / 1e6:.1f} MB, {time.perf_counter() - t0:.1f} s); Ctrl+C to stop")
+    # Unlink the block on termination too, not only on Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("Stopping")
+    finally:
+        dataset.arrays.clear()
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Keep the explorer inputs resident in shared memory")
+    parser.add_argument('--atlas', default=LEV12_SHP)
+    parser.add_argument('--flux', default=FLUX_FILE)
+    parser.add_argument('--name', default=SHM_NAME, help="Shared memory block name")
+    parser.add_argument('--replace', action='store_true', help="Remove a block left behind by a crashed daemon")
+    args = parser.parse_args()
+    serve(args.atlas, args.flux, args.name, args.replace)
@@ -8,31 +8,26 @@ import numpy as np
 import json
 import os
 
+from flux_mc import FIBER_ASPECT, FILM_THICKNESS_UM
+from flux_ranking import FluxRanking, ranking_path_for
+from pipeline_profiler import NULL_PROFILER, add_profiler_arguments, profiler_from_args
+from priors import load_priors
+from regional_priors import REGION_DIGITS, RegionalMass, RegionalPriors, add_regional_arguments
+from startup_loader import load_concurrently
+
 BASE_DIR = r"c:\Users\syyda\Desktop\Chapter 4"
 UNC_DIR = os.path.join(BASE_DIR, "05_Flux_Uncertainty")
 LEV12_SHP = os.path.join(BASE_DIR, "BasinATLAS_v10_shp", "BasinATLAS_v10_lev12.shp")
 PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
 PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+FLUX_FILE = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
+OUTPUT_FILE = os.path.join(UNC_DIR, 'coastal_data.js')
 
 DENSITIES = {
     'Poly_PE': 0.95, 'Poly_PP': 0.91, 'Poly_PS': 1.05,
     'Poly_PET': 1.38, 'Poly_PVC': 1.38, 'Poly_PA': 1.15,
 }
 
-def load_priors():
-    shape_df = pd.read_csv(PRIOR_SHAPE, index_col=0, header=None, names=['Prob'])
-    shape_df = shape_df[~shape_df.index.str.contains('Other', case=False, na=False)]
-    shape_df = shape_df[shape_df['Prob'] > 0]
-    shape_df['Prob'] = shape_df['Prob'] / shape_df['Prob'].sum()
-    
-    poly_df = pd.read_csv(PRIOR_POLY, index_col=0, header=None, names=['Prob'])
-    poly_df = poly_df[~poly_df.index.str.contains('Other', case=False, na=False)]
-    poly_df = poly_df.dropna()
-    poly_df = poly_df[poly_df['Prob'] > 0]
-    poly_df['Prob'] = poly_df['Prob'] / poly_df['Prob'].sum()
-    
-    return shape_df['Prob'].to_dict(), poly_df['Prob'].to_dict()
-
 def sample_sizes(n, alpha, min_um, max_um):
     u = np.random.random(n)
     if abs(alpha - 1.0) < 0.01:
@@ -41,11 +36,11 @@ def sample_sizes(n, alpha, min_um, max_um):
     term2 = min_um ** (1 - alpha)
     return ((term1 - term2) * u + term2) ** (1 / (1 - alpha))
 
-def calculate_volumes(sizes_um, shapes):
+def calculate_volumes(sizes_um, shapes, fiber_aspect=FIBER_ASPECT, film_thickness_um=FILM_THICKNESS_UM):
     volumes = np.zeros_like(sizes_um)
     mask_fiber = (shapes == 'Shape_Fiber')
     L = sizes_um[mask_fiber]
-    D = L / 10.0
+    D = L / fiber_aspect
     volumes[mask_fiber] = np.pi * (D/2)**2 * L
     
     mask_sphere = np.isin(shapes, ['Shape_Fragment', 'Shape_Pellet'])
@@ -54,7 +49,7 @@ def calculate_volumes(sizes_um, shapes):
     
     mask_film = (shapes == 'Shape_Film')
     D = sizes_um[mask_film]
-    volumes[mask_film] = D**2 * 20.0
+    volumes[mask_film] = D**2 * film_thickness_um
     
     return volumes
 
@@ -70,63 +65,44 @@ def estimate_mean_mass(shape_probs, poly_probs, n, alpha, min_size, max_size):
     
     return np.mean(masses_g)
 
-def export_coastal_data():
-    print("Loading Level 12 coastal basins...")
-    gdf = gpd.read_file(LEV12_SHP)
-    
-    # 1. Filter for Coastal Basins (COAST == 1)
-    coastal = gdf[gdf['COAST'] == 1].copy()
-    print(f"Found {len(coastal)} coastal basins in shapefile.")
-    
-    # 2. Load Filter/Data from Flux_Data_Modeling.csv
-    flux_file = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
-    if not os.path.exists(flux_file):
-        print(f"Error: Modeling file not found: {flux_file}")
-        return
-
-    print("Loading Flux_Data_Modeling.csv...")
-    try:
-        # Load specific columns to save memory
-        model_df = pd.read_csv(flux_file, usecols=['HYBAS_ID', 'Flux_Linear', 'Natural_Discharge_Upstream', 'Conc_Linear'])
-        
-        # Ensure ID is correct type for merging
-        model_df['HYBAS_ID'] = model_df['HYBAS_ID'].astype(int)
-        
-        # Filter coastal basins to keep ONLY those present in the modeling file
-        # Inner join will drop any shapefile basins not in the model file
-        merged = coastal.merge(model_df, on='HYBAS_ID', how='inner')
-        print(f"Filtered to {len(merged)} basins matching Flux_Data_Modeling.csv whitelist.")
-        
-        # 3. Prepare Data for Export
-        # Calculate Mean Mass per Particle (g) based on Priors (Default Alpha=2.64)
-        shape_probs, poly_probs = load_priors()
-        print("Calculating mean particle mass (α=2.64) for mass conversion...")
-        mean_mass_g = estimate_mean_mass(shape_probs, poly_probs, 5000, 2.64, 100, 5000)
-        print(f"Mean particle mass: {mean_mass_g:.6e} g")
-
-        # Convert Flux_Linear (items/s) to Mass Flux (kt/yr)
-        # 1. items/s -> items/yr
-        # 2. items/yr * g/item = g/yr
-        # 3. g/yr / 1e9 = kt/yr
+def export_merged_basins(merged, mean_mass_g, output_file=OUTPUT_FILE, profiler=NULL_PROFILER):
+    """
+    Derive flux/discharge columns and centroids for merged coastal basins and write window.COASTAL_DATA.
+    mean_mass_g: one mass for every basin, or a RegionalMass looked up by HYBAS_ID.
+    """
+    regional = mean_mass_g if isinstance(mean_mass_g, RegionalMass) else None
+    if regional is not None:
+        mean_mass_g = regional.for_basins(merged['HYBAS_ID'])
+        # Lets consumers that recompute mass at other settings (rasters, service) keep the regional composition
+        merged['mass_factor'] = regional.relative_to_global(merged['HYBAS_ID'])
+    # Convert Flux_Linear (items/s) to Mass Flux (kt/yr)
+    # 1. items/s -> items/yr
+    # 2. items/yr * g/item = g/yr
+    # 3. g/yr / 1e9 = kt/yr
+    with profiler.stage('derive_columns') as st:
         SECONDS_PER_YEAR = 31536000.0
-        
+    
         merged['items_per_sec'] = merged['Flux_Linear']
         merged['items_per_yr'] = merged['items_per_sec'] * SECONDS_PER_YEAR
         merged['flux_kt'] = (merged['items_per_yr'] * mean_mass_g) / 1e9
-        
+    
         # Low flux filtration (optional, but keeps file size down if needed)
         # merged = merged[merged['flux_kt'] > 1e-6] 
 
         # Discharge: Natural_Discharge_Upstream is likely m3/s. 
         # Convert to m3/yr for display
         merged['discharge_m3yr'] = merged['Natural_Discharge_Upstream'] * SECONDS_PER_YEAR
-        
-        # Geometry
+        st.rows = len(merged)
+    
+    # Geometry
+    with profiler.stage('centroids') as st:
         merged['centroid'] = merged.geometry.centroid
         merged['lon'] = merged['centroid'].x
         merged['lat'] = merged['centroid'].y
-        
-        # Export List
+        st.rows = len(merged)
+    
+    # Export List
+    with profiler.stage('export_loop') as st:
         basin_data = []
         for idx, row in merged.iterrows():
             basin_data.append({
@@ -137,13 +113,15 @@ def export_coastal_data():
                 'flux_baseline': float(row['flux_kt']),    # kt/yr (Corrected Mass)
                 'flux_items': float(row['items_per_yr'])   # items/yr (Raw Count)
             })
-            
-        total_flux_kt = sum(b['flux_baseline'] for b in basin_data)
-        total_items = sum(b['flux_items'] for b in basin_data)
-        total_discharge = sum(b['discharge'] for b in basin_data)
-        
-        output_file = os.path.join(UNC_DIR, 'coastal_data.js')
+            if regional is not None:
+                basin_data[-1]['mass_factor'] = float(row['mass_factor'])
+        st.rows = len(basin_data)
         
+    total_flux_kt = sum(b['flux_baseline'] for b in basin_data)
+    total_items = sum(b['flux_items'] for b in basin_data)
+    total_discharge = sum(b['discharge'] for b in basin_data)
+    
+    with profiler.stage('write_js') as st:
         data_dict = {
             'total_basins': len(basin_data),
             'total_discharge': total_discharge,
@@ -152,13 +130,81 @@ def export_coastal_data():
             'source': "Flux_Data_Modeling.csv (filtered) converted to Mass",
             'basins': basin_data
         }
-        
+        if regional is not None:
+            data_dict['prior_regions'] = regional.summary(merged['HYBAS_ID'])
+        # Order by item flux holds for any alpha/size setting; built once, persisted with the export
+        ranking = FluxRanking.from_basins(basin_data, regional=regional is not None)
+        data_dict['ranking'] = ranking.to_export()
+    
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(f"window.COASTAL_DATA = {json.dumps(data_dict)};")
+        ranking.save(ranking_path_for(output_file))
+    
+    print(f"\\nExported {len(basin_data)} basins to {output_file}")
+    print(f"Total Flux: {total_flux_kt:.2f} kt/yr")
+    print(f"Total Items: {total_items:.2e} items/yr")
+    return data_dict
+
+def read_coastal_basins(lev12_shp=LEV12_SHP):
+    gdf = gpd.read_file(lev12_shp)
+    # Filter for Coastal Basins (COAST == 1)
+    return gdf[gdf['COAST'] == 1].copy()
+
+def read_model_csv(flux_file=FLUX_FILE):
+    # Load specific columns to save memory
+    model_df = pd.read_csv(flux_file, usecols=['HYBAS_ID', 'Flux_Linear', 'Natural_Discharge_Upstream', 'Conc_Linear'])
+    # Ensure ID is correct type for merging
+    model_df['HYBAS_ID'] = model_df['HYBAS_ID'].astype(int)
+    return model_df
+
+def mean_mass_from_priors(prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY, regional_priors=None,
+                          region_key='hybas', region_digits=REGION_DIGITS):
+    # Calculate Mean Mass per Particle (g) based on Priors (Default Alpha=2.64)
+    shape_probs, poly_probs = load_priors(prior_shape, prior_poly)
+    if regional_priors is None:
+        print("Calculating mean particle mass (α=2.64) for mass conversion...")
+        return estimate_mean_mass(shape_probs, poly_probs, 5000, 2.64, 100, 5000)
+    # One batch over all regions (row 0 = global priors), shared size draws
+    regional = RegionalPriors.from_csv(regional_priors, shape_probs, poly_probs, region_key, region_digits)
+    print(f"Calculating mean particle mass (α=2.64) for {len(regional)} prior regions...")
+    return regional.mean_mass(5000, 2.64, 100, 5000, densities=DENSITIES)
+
+def export_coastal_data(lev12_shp=LEV12_SHP, flux_file=FLUX_FILE, output_file=OUTPUT_FILE,
+                        prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY, profiler=NULL_PROFILER,
+                        regional_priors=None, region_digits=REGION_DIGITS):
+    if not os.path.exists(flux_file):
+        print(f"Error: Modeling file not found: {flux_file}")
+        return
+    
+    # 1-3. Shapefile, modeling CSV and the prior-based mean mass are independent: load them concurrently
+    print("Loading Level 12 coastal basins, Flux_Data_Modeling.csv and priors concurrently...")
+    with profiler.stage('load_inputs') as st:
+        loads = load_concurrently(coastal=(read_coastal_basins, lev12_shp),
+                                  model=(read_model_csv, flux_file),
+                                  mean_mass=(mean_mass_from_priors, prior_shape, prior_poly,
+                                             regional_priors, 'hybas', region_digits))
+        coastal = loads['coastal'].result()
+        st.rows = len(coastal)
+    print(f"Found {len(coastal)} coastal basins in shapefile.")
+
+    try:
+        model_df = loads['model'].result()
         
-        print(f"\\nExported {len(basin_data)} basins to {output_file}")
-        print(f"Total Flux: {total_flux_kt:.2f} kt/yr")
-        print(f"Total Items: {total_items:.2e} items/yr")
+        # Filter coastal basins to keep ONLY those present in the modeling file
+        # Inner join will drop any shapefile basins not in the model file
+        with profiler.stage('merge') as st:
+            merged = coastal.merge(model_df, on='HYBAS_ID', how='inner')
+            st.rows = len(merged)
+        print(f"Filtered to {len(merged)} basins matching Flux_Data_Modeling.csv whitelist.")
+        
+        mean_mass_g = loads['mean_mass'].result()
+        if isinstance(mean_mass_g, RegionalMass):
+            for region, row in mean_mass_g.summary(merged['HYBAS_ID']).items():
+                print(f"Mean particle mass [{region}]: {row['mass_g']:.6e} g ({row['n_basins']} basins)")
+        else:
+            print(f"Mean particle mass: {mean_mass_g:.6e} g")
+
+        export_merged_basins(merged, mean_mass_g, output_file, profiler)
         
     except Exception as e:
         print(f"Error processing data: {e}")
@@ -166,4 +212,22 @@ def export_coastal_data():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    export_coastal_data()
+    import argparse
+    
+    from flux_raster import add_raster_arguments, rasterize_export
+
+    parser = add_profiler_arguments(argparse.ArgumentParser(description=__doc__.strip()))
+    add_raster_arguments(parser)
+    add_regional_arguments(parser)
+    args = parser.parse_args()
+    if args.regional_priors and args.region_key != 'hybas':
+        parser.error("Level 12 basins are matched to regions by HYBAS_ID prefix (--region-key hybas)")
+    profiler = profiler_from_args('export_coastal_data', args)
+    try:
+        export_coastal_data(profiler=profiler, regional_priors=args.regional_priors,
+                            region_digits=args.region_digits)
+        if args.raster_dir:
+            with profiler.stage('rasterize'):
+                rasterize_export(OUTPUT_FILE, args.raster_dir, args.raster_res, args.land_shp)
+    finally:
+        profiler.write_report(args.profile_report or os.path.splitext(OUTPUT_FILE)[0] + "_run_report.json")
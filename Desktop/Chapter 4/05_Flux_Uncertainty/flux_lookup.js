@@ -0,0 +1,86 @@
+/*
+ * Reader and interpolator for the (alpha, min, max) mass lookup table built by flux_lookup.py.
+ * Same binary layout and trilinear interpolation as MassLookupTable.query.
+ *
+ *   <script src="flux_lookup_data.js"></script>   (sets window.FLUX_LOOKUP_DATA, base64)
+ *   <script src="flux_lookup.js"></script>        (sets window.FLUX_LOOKUP when data is present)
+ *   FLUX_LOOKUP.query(2.64, 100, 5000)  ->  {mean, P5, P50, P95} in g
+ */
+(function (global) {
+    const MAGIC = 'FLUXLUT1';
+
+    class FluxLookup {
+        constructor(buffer) {
+            const bytes = new Uint8Array(buffer);
+            if (String.fromCharCode(...bytes.subarray(0, 8)) !== MAGIC) {
+                throw new Error('Not a flux lookup table');
+            }
+            const headerLen = new DataView(buffer).getUint32(8, true);
+            const header = JSON.parse(new TextDecoder().decode(bytes.subarray(12, 12 + headerLen)));
+            this.header = header;
+            this.axes = header.axes;
+            this.stats = header.stats;
+            this.shape = header.shape;
+            this.values = new Float32Array(buffer, 12 + headerLen);
+            this.lo = this.axes.map(ax => this._coord(ax, ax.start));
+            this.step = this.axes.map(ax => (this._coord(ax, ax.stop) - this._coord(ax, ax.start)) / (ax.n - 1));
+        }
+
+        static fromBase64(text) {
+            const binary = atob(text);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            return new FluxLookup(bytes.buffer);
+        }
+
+        static async fromUrl(url) {
+            const response = await fetch(url);
+            return new FluxLookup(await response.arrayBuffer());
+        }
+
+        _coord(axis, value) {
+            return axis.scale === 'log' ? Math.log(value) : value;
+        }
+
+        // Trilinear interpolation in (alpha, log min, log max), clamped to the table range
+        query(alpha, minSize, maxSize) {
+            const x = [alpha, minSize, maxSize];
+            const idx = [], frac = [];
+            for (let d = 0; d < 3; d++) {
+                const n = this.axes[d].n;
+                const t = Math.min(Math.max((this._coord(this.axes[d], x[d]) - this.lo[d]) / this.step[d], 0), n - 1);
+                const i = Math.min(Math.floor(t), n - 2);
+                idx.push(i);
+                frac.push(t - i);
+            }
+            const [, nA, nMin, nMax] = this.shape;
+            const statStride = nA * nMin * nMax;
+            const result = {};
+            this.stats.forEach((stat, k) => {
+                let acc = 0;
+                for (let corner = 0; corner < 8; corner++) {
+                    const b0 = corner & 1, b1 = (corner >> 1) & 1, b2 = (corner >> 2) & 1;
+                    const w = (b0 ? frac[0] : 1 - frac[0]) * (b1 ? frac[1] : 1 - frac[1]) * (b2 ? frac[2] : 1 - frac[2]);
+                    if (w === 0) continue;
+                    const offset = k * statStride + ((idx[0] + b0) * nMin + (idx[1] + b1)) * nMax + (idx[2] + b2);
+                    acc += w * this.values[offset];
+                }
+                result[stat] = Math.pow(10, acc);
+            });
+            return result;
+        }
+
+        // Flux (kt/yr) for each statistic
+        fluxKt(totalItemFluxYr, alpha, minSize, maxSize) {
+            const masses = this.query(alpha, minSize, maxSize);
+            const flux = {};
+            for (const stat of this.stats) flux[stat] = totalItemFluxYr * masses[stat] / 1e9;
+            return flux;
+        }
+    }
+
+    global.FluxLookup = FluxLookup;
+    if (global.FLUX_LOOKUP_DATA) {
+        global.FLUX_LOOKUP = FluxLookup.fromBase64(global.FLUX_LOOKUP_DATA);
+    }
+})(typeof window !== 'undefined' ? window : globalThis);
@@ -0,0 +1,222 @@
+"""
+Precomputed (alpha, min_size, max_size) lookup table of particle mass statistics
+- Exact mean and P5/P50/P95 mass of the shape x polymer x power-law mixture
+  (closed-form moments, quantiles by bisection on the mixture CDF)
+- Compact float32 binary asset shared by Python and the HTML dashboards
+- Constant-time trilinear interpolation in (alpha, log min, log max)
+
+    python flux_lookup.py                 # writes flux_lookup.bin + flux_lookup_data.js
+    table = MassLookupTable.load('flux_lookup.bin')
+    table.query(2.64, 100, 5000)          # {'mean': .., 'P5': .., 'P50': .., 'P95': ..} in g
+
+Binary layout (little-endian): b'FLUXLUT1', uint32 header length, JSON header,
+padding to a 4-byte boundary, then float32 log10(mass_g) values of shape
+(stat, alpha, min, max). flux_lookup.js reads the same bytes.
+"""
+
+import base64
+import json
+import os
+import struct
+
+import numpy as np
+
+from flux_mc import FIBER_ASPECT, FILM_THICKNESS_UM, UM3_TO_CM3, density_array, shape_geometry
+
+UNC_DIR = os.path.dirname(os.path.abspath(__file__))
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+OUTPUT_BIN = os.path.join(UNC_DIR, "flux_lookup.bin")
+OUTPUT_JS = os.path.join(UNC_DIR, "flux_lookup_data.js")
+
+MAGIC = b'FLUXLUT1'
+STATS = ('mean', 'P5', 'P50', 'P95')
+
+# Covers the slider ranges of the explorers and dashboards
+DEFAULT_AXES = (
+    {'name': 'alpha', 'scale': 'linear', 'start': 1.5, 'stop': 4.0, 'n': 51},
+    {'name': 'min_size_um', 'scale': 'log', 'start': 10.0, 'stop': 500.0, 'n': 25},
+    {'name': 'max_size_um', 'scale': 'log', 'start': 500.0, 'stop': 10000.0, 'n': 21},
+)
+
+BISECTION_STEPS = 50
+
+
+def axis_values(axis):
+    if axis['scale'] == 'log':
+        return np.geomspace(axis['start'], axis['stop'], axis['n'])
+    return np.linspace(axis['start'], axis['stop'], axis['n'])
+
+
+def _power_integral(a, b, k):
+    """Integral of s**(k-1) over [a, b]; the k -> 0 limit is log(b/a)"""
+    log_ratio = np.log(b / a)
+    small = np.abs(k) < 1e-9
+    k_safe = np.where(small, 1.0, k)
+    return np.where(small, log_ratio, a ** k_safe * np.expm1(k_safe * log_ratio) / k_safe)
+
+
+def mixture_components(shape_probs, poly_probs, densities=None, fiber_aspect=FIBER_ASPECT,
+                       film_thickness_um=FILM_THICKNESS_UM):
+    """(weight, coef, power) per distinct shape x polymer mass law m = coef * size**power"""
+    s_coef, s_power = shape_geometry(list(shape_probs.keys()), fiber_aspect, film_thickness_um)
+    rho = density_array(list(poly_probs.keys()), densities)
+    weight = np.outer(list(shape_probs.values()), list(poly_probs.values())).ravel()
+    coef = np.outer(s_coef, rho).ravel() * UM3_TO_CM3
+    power = np.repeat(s_power, len(rho))
+    keep = (weight > 0) & (coef > 0)
+    # Identical mass laws (e.g. fragment/pellet, PET/PVC) collapse into one component
+    laws, inverse = np.unique(np.column_stack([coef[keep], power[keep]]), axis=0, return_inverse=True)
+    merged = np.bincount(inverse.ravel(), weights=weight[keep], minlength=len(laws))
+    return merged / merged.sum(), laws[:, 0], laws[:, 1]
+
+
+def mass_statistics_exact(alpha, min_size, max_size, shape_probs, poly_probs,
+                          densities=None, quantiles=(5, 50, 95), fiber_aspect=FIBER_ASPECT,
+                          film_thickness_um=FILM_THICKNESS_UM):
+    """
+    Mean and quantiles of particle mass (g) without sampling; alpha/min/max broadcast.
+    Equivalent to flux_mc.sample_masses in the limit of infinite draws.
+    """
+    weight, coef, power = mixture_components(shape_probs, poly_probs, densities, fiber_aspect, film_thickness_um)
+    return mixture_statistics(alpha, min_size, max_size, weight, coef, power, quantiles)
+
+
+def mixture_statistics(alpha, min_size, max_size, weight, coef, power, quantiles=(5, 50, 95)):
+    """
+    Mean and quantiles of a mixture of mass laws m = coef * size**power.
+    weight/coef/power: (K,) shared by every point, or (..., K) per point (zero-weight padding allowed).
+    """
+    alpha, a, b = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (alpha, min_size, max_size)))
+    weight, coef, power = (np.asarray(v, dtype=float) for v in (weight, coef, power))
+    al, aa, bb = alpha[..., None], a[..., None], b[..., None]
+    norm = _power_integral(a, b, 1.0 - alpha)
+
+    mean = (weight * coef * _power_integral(aa, bb, power + 1.0 - al)).sum(axis=-1) / norm
+    stats = {'mean': mean}
+
+    log_coef = np.log(np.where(weight > 0, coef, 1.0))
+    safe_power = np.where(weight > 0, power, 1.0)
+
+    def cdf(log_m):
+        size = np.clip(np.exp((log_m[..., None] - log_coef) / safe_power), aa, bb)
+        return (weight * _power_integral(aa, size, 1.0 - al)).sum(axis=-1) / norm
+
+    lo_init = np.where(weight > 0, log_coef + safe_power * np.log(aa), np.inf).min(axis=-1)
+    hi_init = np.where(weight > 0, log_coef + safe_power * np.log(bb), -np.inf).max(axis=-1)
+    for q in quantiles:
+        lo, hi = lo_init.copy(), hi_init.copy()
+        for _ in range(BISECTION_STEPS):
+            mid = 0.5 * (lo + hi)
+            below = cdf(mid) < q / 100.0
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        stats[f'P{q:g}'] = np.exp(0.5 * (lo + hi))
+    return stats
+
+
+class MassLookupTable:
+    def __init__(self, axes, log10_values, meta=None):
+        self.axes = [dict(axis) for axis in axes]
+        self.log10_values = np.asarray(log10_values, dtype=np.float32)
+        self.meta = meta or {}
+        self._lo = np.array([self._coord(ax, ax['start']) for ax in self.axes])
+        self._step = np.array([(self._coord(ax, ax['stop']) - self._coord(ax, ax['start'])) / (ax['n'] - 1)
+                               for ax in self.axes])
+
+    @staticmethod
+    def _coord(axis, value):
+        return np.log(value) if axis['scale'] == 'log' else value
+
+    @classmethod
+    def build(cls, shape_probs, poly_probs, densities=None, axes=DEFAULT_AXES):
+        alpha, min_size, max_size = np.meshgrid(*(axis_values(ax) for ax in axes), indexing='ij')
+        # Degenerate corner (min == max): nudge so the distribution stays proper
+        max_size = np.maximum(max_size, min_size * 1.001)
+        stats = mass_statistics_exact(alpha, min_size, max_size, shape_probs, poly_probs, densities)
+        values = np.stack([np.log10(stats[s]) for s in STATS])
+        meta = {'stats': list(STATS), 'values': 'log10_mass_g',
+                'shape_probs': dict(shape_probs), 'poly_probs': dict(poly_probs)}
+        return cls(axes, values, meta)
+
+    def query(self, alpha, min_size, max_size):
+        """Trilinear interpolation (clamped to the table range); returns {stat: mass_g}"""
+        coords = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (alpha, min_size, max_size)))
+        idx, frac = [], []
+        for axis, x, lo, step in zip(self.axes, coords, self._lo, self._step):
+            t = np.clip((self._coord(axis, x) - lo) / step, 0, axis['n'] - 1)
+            i = np.minimum(np.floor(t).astype(int), axis['n'] - 2)
+            idx.append(i)
+            frac.append(t - i)
+
+        result = 0.0
+        for corner in range(8):
+            weight = 1.0
+            pos = []
+            for d in range(3):
+                bit = (corner >> d) & 1
+                weight = weight * (frac[d] if bit else 1.0 - frac[d])
+                pos.append(idx[d] + bit)
+            result = result + weight[None] * self.log10_values[:, pos[0], pos[1], pos[2]]
+        values = 10.0 ** np.asarray(result, dtype=float)
+        return {stat: values[k] for k, stat in enumerate(STATS)}
+
+    def flux_kt(self, total_item_flux_yr, alpha, min_size, max_size):
+        """Flux (kt/yr) for each statistic"""
+        return {k: total_item_flux_yr * v / 1e9 for k, v in self.query(alpha, min_size, max_size).items()}
+
+    # --- Serialisation ---
+    def to_bytes(self):
+        header = dict(self.meta, axes=self.axes, shape=list(self.log10_values.shape), dtype='float32')
+        header_bytes = json.dumps(header).encode('utf-8')
+        header_bytes += b' ' * (-(len(MAGIC) + 4 + len(header_bytes)) % 4)
+        return (MAGIC + struct.pack('<I', len(header_bytes)) + header_bytes
+                + self.log10_values.astype('<f4').tobytes())
+
+    @classmethod
+    def from_bytes(cls, raw):
+        if raw[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a flux lookup table")
+        (header_len,) = struct.unpack('<I', raw[len(MAGIC):len(MAGIC) + 4])
+        start = len(MAGIC) + 4
+        header = json.loads(raw[start:start + header_len].decode('utf-8'))
+        values = np.frombuffer(raw, dtype='<f4', offset=start + header_len).reshape(header['shape'])
+        axes = header.pop('axes')
+        return cls(axes, values, header)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def write_js(self, path):
+        """Base64 copy for pages opened from file:// (no fetch of binary files there)"""
+        encoded = base64.b64encode(self.to_bytes()).decode('ascii')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'window.FLUX_LOOKUP_DATA = "{encoded}";\n')
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from priors import load_priors
+
+    parser = argparse.ArgumentParser(description="Build the (alpha, min, max) mass lookup table")
+    parser.add_argument('--out-bin', default=OUTPUT_BIN)
+    parser.add_argument('--out-js', default=OUTPUT_JS)
+    args = parser.parse_args()
+
+    shape_probs, poly_probs = load_priors(PRIOR_SHAPE, PRIOR_POLY)
+    t0 = time.perf_counter()
+    table = MassLookupTable.build(shape_probs, poly_probs)
+    print(f"Built {'x'.join(map(str, table.log10_values.shape))} table in {time.perf_counter() - t0:.1f} s")
+    table.save(args.out_bin)
+    table.write_js(args.out_js)
+    print(f"Wrote {args.out_bin} ({os.path.getsize(args.out_bin) / 1024:.0f} KB) and {args.out_js}")
+    stats = table.query(2.64, 100, 5000)
+    print("alpha=2.64, 100-5000 um: " + ", ".join(f"{k}={v * 1000:.4g} mg" for k, v in stats.items()))
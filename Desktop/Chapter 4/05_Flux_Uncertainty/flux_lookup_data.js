@@ -0,0 +1 @@
+window.FLUX_LOOKUP_DATA = "RkxVWExVVDGoAwAAeyJzdGF0cyI6IFsibWVhbiIsICJQNSIsICJQNTAiLCAiUDk1Il0sICJ2YWx1ZXMiOiAibG9nMTBfbWFzc19nIiwgInNoYXBlX3Byb2JzIjogeyJTaGFwZV9GaWJlciI6IDAuNTg4NTM2MjM1NDgwMzgxOCwgIlNoYXBlX0ZyYWdtZW50IjogMC4yOTk1ODk2NzI1NTcxOTc1LCAiU2hhcGVfUGVsbGV0IjogMC4wMzYyMDMyMjgxMzI5NTYyNiwgIlNoYXBlX0ZpbG0iOiAwLjA3NTY3MDg2MzgyOTQ2NDQ5fSwgInBvbHlfcHJvYnMiOiB7IlBvbHlfUEUiOiAwLjMwOTgwMTc5ODUzMDQ4NjA2LCAiUG9seV9QUCI6IDAuMjUyMzcyNDIxNzQzNjk0NTYsICJQb2x5X1BTIjogMC4wNzkzMTEwMDY4ODU5MTM5NywgIlBvbHlfUEVUIjogMC4xMjkyODE4NTM5ODQzMjg1NywgIlBvbHlfUFZDIjogMC4wMjQ0OTc2MTIwMjM0ODQ3NSwgIlBvbHlfUEEiOiAwLjE0MDA2MDY4NDg3OTYyMjgsICJQb2x5X1BDIjogMC4wMDcyMjU0ODY2NjIyNDQ3NjIsICJQb2x5X1BVIjogMC4wMDQ2MDk4ODc3MDU4NTUxNiwgIlBvbHlfUE1NQSI6IDAuMDAyNDA3OTk1NzgxNTk4OTI3NSwgIlBvbHlfRVBTIjogMC4wMDM0Njc1NjU5ODY3MDk2MTIsICJQb2x5X1JheW9uIjogMC4wNDYzNzAwNDcyMjI5NDg1MSwgIlBvbHlfQ0EiOiAwLjAwMDU5MzYzODU5MzExMjI4MzV9LCAiYXhlcyI6IFt7Im5hbWUiOiAiYWxwaGEiLCAic2NhbGUiOiAibGluZWFyIiwgInN0YXJ0IjogMS41LCAic3RvcCI6IDQuMCwgIm4iOiA1MX0sIHsibmFtZSI6ICJtaW5fc2l6ZV91bSIsICJzY2FsZSI6ICJsb2ciLCAic3RhcnQiOiAxMC4wLCAic3RvcCI6IDUwMC4wLCAibiI6IDI1fSwgeyJuYW1lIjogIm1heF9zaXplX3VtIiwgInNjYWxlIjogImxvZyIsICJzdGFydCI6IDUwMC4wLCAic3RvcCI6IDEwMDAwLjAsICJuIjogMjF9XSwgInNoYXBlIjogWzQsIDUxLCAyNSwgMjFdLCAiZHR5cGUiOiAiZmxvYXQzMiJ9ICAgtNTCwNPXvcCv1bjA1M6zwMHDrsDktKnAoKKkwE2Nn8A4dZrAqFqVwNk9kMAEH4vAWv6FwAfcgMBkcHfA/iVtwBvZYsD1iVjAvjhOwKblQ8DXkDnAzoDBwBCIvMCuibfAP4aywEp+rcBEcqjAmWKjwKVPnsC8OZnAKSGUwC4Gj8AF6YnA5cmEwPdRf8DnDHXA5cRqwDZ6YMAYLVbAwN1LwGKMQcAqOTfA6ifAwMYzu8CQObbA7DmxwGo1rMCJLKfAux+iwGUPncDh+5fAfuWSwITMjcAysYjAwpODwMnofMCSpnLAL2FowOkYXsADzlPAt4BJwDsxP8DB3zTAdcm+wHHaucDg5LTAcumvwMToqsBd46XAu9mgwEnMm8Bou5bAbqeRwKmQjMBdd4fAxluCwDl8esAhPXDAnPplwPq0W8CBbFHAciFHwAbUPMBxhDLAyGS9wH17uMAZi7PAXJSuwO2XqcBjlqTAQ5CfwASGmsANeJXAvGaQwGVSi8BSO4bAxSGBwPILeMBH0G3A6JBjwClOWcBZCE/Au79EwJB0OsAOJzDAJPm7wEEWt8CmK7LAIjqtwG9CqMAwRaPA9UKewEA8mcCCMZTAIiOPwHkRisDZ/ITAFMt/wJeXdcCvX2vAwyNhwDDkVsBJoUzAWVtCwKQSOMBnxy3As4W6wP2ptcDbxbDAL9qrwMPnpsBK76HAZPGcwJzul8Bx55LAUdyNwJ/NiMCzu4PAuE19wMAec8D76mjA2bJewMF2VMALN0rACvQ/wAiuNcBGZSvAfAm5wNc1tMD2WK/A1HOqwE6HpcAqlKDAFZubwKyclsB4mZHA8pGMwIeGh8CYd4LA9sp6wPmgcMDBcWbAyz1cwIQFUsBQyUfAh4k9wHlGM8BvACnAZYO3wNS4ssAa5K3ATgapwGMgpMAzM5/AgD+awPRFlcAoR5DAokOLwNo7hsA5MIHAPkJ4wMAdbsCO82PAL8RZwByQT8DBV0XAgBs7wLDbMMCgmCbALPK1wNUxscBKZqzAu5CnwDmyosC2y53AB96YwOnpk8AG8I7A8/CJwDPthMB6yn/A8bJ1wIaUa8Deb2HAjkVXwBwWTcD94ULAnak4wFxtLsCQLSTAYlS0wJWfr8Bj3qrAHBKmwO87ocDpXJzA93WXwOyHksCFk43AZpmIwCOag8B+LH3AWhxzwKgEacAg5l7AZsFUwA2XSsCYZ0DAfTM2wCX7K8DvviHAY6iywJ8ArsAbS6nATImkwIG8n8Dm5ZrAhQaWwEkfkcADMYzAbTyHwCtCgsCbhXrArX1wwHBtZsCwVVzAIzdSwGwSSMAb6D3As7gzwKiEKcBjTB/AVuywwExTrMD5qqfA+/SiwMYynsCnZZnAyI6UwDCvj8DLx4rAZtmFwLnkgMDQ1HfABdZtwBHOY8DWvVnAIKZPwKOHRcAAYzvAxzgxwHkJJ8CJ1RzAJx6vwL2VqsBR/KXArVOhwGudnMAA25fAtw2TwLk2jsALV4nAl2+EwFYCf8D7GHXAXyRrwKMlYcDEHVfApA1NwAz2QsCw1zjAMLMuwByJJMDzWRrAgTutwNXFqMA+PaTAr6OfwO/6msCaRJbAIoKRwNW0jMDX3YfAL/6CwIstfMDOUHLAlWdowCBzXsCOdFTA3GxKwOtcQMCERTbAWCcswAkDIsAl2RfA1EGrwDzhpsCea6LAGOOdwJpJmcDuoJTAr+qPwFEoi8AeW4bAPYSBwGZJecDSem/AVp5lwF+1W8AtwVHA3cJHwG27PcC9qzPAlZQpwKh2H8CVUhXAVi6pwFrlpMAShaDAvw+cwH2Hl8BB7pLA00WOwM+PicCpzYTArQCAwANUdsBXlWzAJ8diwAzrWMByAk/Amw5FwKMQO8CHCTHAJ/omwE3jHMCqxRLACv6mwF/PosD8hp7AQCeawGuylcCeKpHAzJGMwL/ph8AXNIPAjeR8wDRLc8BynmnAUuBfwKcSVsAJN0zA5k5CwH5bOMDwXS7AOFckwDdIGsC2MRDA2K2kwEycoMCHbpzA9yaYwPjHk8DRU4/AoMyKwF00hsDTjIHARK95wH4scMDvk2bA6OdcwHYqU8BrXUnAZII/wMyaNcDnpyvA0qohwIykF8D2lQ3AmTqiwAJJnsCvOJrACQyWwHzFkcBpZ43AFvSIwKZthMAjrH/ATV52wAv1bMBNc2PArttZwIMwUMDbc0bAiqc8wC7NMsA15ijA4vMewFb3FMCO8QrAP6GfwF7Sm8BV4pfAb9OTwBaoj8C4YovAuAWHwF6TgsCdG3zACu5ywKKhacCtOWDAG7lWwI4iTcBceEPAl7w5wBbxL8B5FybALzEcwH4/EsCGQwjA896cwFM1mcBTaJXAB3qRwLxsjcDaQonA0v6EwAijgMCMY3jAZlpvwJouZsDM41zASX1TwAb+ScCoaEDAib82wL4ELcAhOiPAU2EZwMd7D8DDigXAQ/GZwBJvlsCgx5LArPyOwEgQi8DABIfAe9yCwNYzfcDrfnTAzZ5rwNKXYsD5bVnA7SRQwP6/RsAnQj3AEq4zwBwGKsBfTCDAt4IWwMeqDMAGxgLAQdaWwDJ9k8B2/Y/AWliMwJqPiMBEpYTAoZuAwDTqeMA/aHDAM7ZnwK3YXsAH1FXASKxMwCBlQ8DkATrAlIUwwN/yJsAnTB3AiZMTwOTKCcDC5/+/X4eTwNZdkMB1B43AUIqJwK7nhcBEIYLAOnJ8wP9idMCkGWzAEJtjwBPsWsBREVLAKA9JwKXpP8B/pDbAEEMtwF/II8AfNxrAt5EQwEfaBsBpJfq/BlfEwL1vv8Bng7rAj5K1wLGdsMA5pavAi6mmwPuqocDXqZzAY6aXwNqgksB0mY3AX5CIwMeFg8Cj83zAQdlywKa8aMAHnl7Al31UwIBbSsDpN0DAF+zCwK4IvsDZH7nALjK0wDJAr8BYSqrAClGlwKVUoMB5VZvA0FOWwOtPkcADSozATEKHwPM4gsBCXHrA90NwwEUpZsBnDFzAke1RwPLMR8C1qj3AdXzBwF+dvMB0uLfAU86ywIvfrcCa7KjA8PWjwPH7nsDz/pnAR/+UwDH9j8Dw+IrAuvKFwMLqgMBkwnfAZqxtwM6TY8DdeFnAyltPwMk8RcAHHDvAkAfAwFItu8DFTLbAl2axwGJ7rMCti6fA85eiwJ2gncALppjAkqiTwH2ojsAPponAg6GEwB82f8DGJXXAURJrwAv8YMA441bAFshMwNyqQsC7izjAxoy+wPS3ucBL3LTAh/qvwE8Tq8A2J6bAvzahwF9CnMB9SpfAdU+SwJhRjcAvUYjAe06DwGqTfMAghnLAd3VowL9hXsBCS1TARDJKwP4WQMCo+TXAXAu9wKE8uMB0ZrPAoYmuwN6mqcDLvqTA+dGfwOTgmsD/65XArfOQwEb4i8Aa+obAcPmBwAntecAi42/Aj9VlwKjEW8C/sFHAG5pHwP2APcCfZTPAf4K7wJ26tsCZ6rHAUBOtwIo1qMD4UaPANmmewM57mcA8ipTA7pSPwEOcisCToIXAKqKAwJpCd8BxPG3ARzJjwH0kWcBrE0/AYP9EwKLoOsBwzzDAPfG5wBIxtcD6Z7DA65arwL6+psA34KHAAPycwLMSmMDWJJPA4zKOwEM9icBURITA2ZB+wK2TdMCokWrARItgwOuAVsD9ckzAz2FCwK5NOMDhNi7Agla4wAqfs8DA3a7AsROqwM9BpcDvaKDA0ImbwBmllsBhu5HALM2MwO/ah8AS5YLA5dd7wMXfccBZ4mfAIuBdwJfZU8Agz0nAHME/wN+vNcC0myvAFLG2wG8DssDySq3Ax4iowPi9o8B0657ACxKawHkylcBkTZDAXGOLwOZ0hsB0goHA2hh5wFgmb8AELmXAbzBbwBouUcB6J0fA9Bw9wOgOM8Cm/SjAjv+0wAJdsMB1rqvAMvWmwF4yosABZ53ABJSYwDi6k8BT2o7A+vSJwLwKhcAaHIDAC1N2wMdmbMAddGLArHtYwAN+TsCie0TA+3Q6wHRqMMBqXCbAWUCzwFmqrsAIB6rA01elwACeoMC02pvA8w6XwKM7ksCTYY3AeIGIwPObg8AoY33AsYVzwGOgacAFtF/ASsFVwNDIS8Aly0HAx8g3wCfCLcCqtyPAqnGxwNjprMA8U6jAZa+jwL//nsCORZrA84GVwPO1kMBx4ovAOQiHwAAogsDKhHrA7K9wwGLSZsAK7VzAqgBTwPMNScCCFT/A5Bc1wJYVK8AIDyHAgJGvwLEZq8BwkabAdfqhwE9WncBoppjAA+yTwD8oj8AgXIrAh4iFwECugMD8m3fAv9BtwOP7Y8BgHlrAFjlQwMlMRsAoWjzA0GEywE1kKMAaYh7AoJ2twNs3qcDQv6TAXTegwDqgm8D2+5bA+EuSwIORjcC3zYjAlAGEwPtbfsB6p3TACedqwOUbYcAlR1fAxGlNwJyEQ8B0mDnA+aUvwMetJcBpsBvAk5OrwBRCp8BN3KLARGSewNbbmcC6RJXAgaCQwJLwi8AuNofAdXKCwNFMe8DSpXHAgvFnwEQxXsBVZlTAy5FKwJ+0QMCszzbAuOMswHDxIsBw+RjAs3CpwOI1pcCi5KDAFX+cwEIHmMAIf5PAHuiOwBVEisBUlIXAHtqAwCMteMBflW7Ate5kwLc6W8DIelHAJrBHwObbPcAC/zPAVRoqwKMuIMCaPBbALDKnwJkQo8BN1p7AhoWawGgglsD6qJHAHSGNwImKiMDQ5oPAtG5+wNP6dMA/dGvA9txhwME2WMAxg07ArMNEwGv5OsCJJTHA/EgnwKJkHcA+eRPAENWkwGHPoMCdrpzAD3WYwPMklMBywI/AkkmLwDbChsAZLILAmRF7wHSzccBLQGjAYLpewLUjVcARfkvACctBwAEMOMA2Qi7AwW4kwJqSGsCfrhDAbFaiwElvnsC4aprA+0qWwFsSksAYw43AW1+JwC7phMB0YoDA05l3wERUbsAR92TAxoRbwKb/UcC1aUjAvMQ+wFASNcDZUyvAlIohwJq3F8Dm2w3AYrOfwF7tm8CpB5jAawSUwOTlj8BfrovAHGCHwEf9gsDWD33A3QN0wB/aasDHlWHArTlYwGHITsApREXAC687wNMKMsAYWSjAQpsewJHSFMAgAAvAT+mcwMdGmcCAgpXAa56RwKycjcCEf4nAQEmFwCD8gMCkNHnAx0twwHtBZ8BAGV7ARNZUwGZ7S8A2C0LAAIg4wMzzLsBoUCXAbp8bwEniEcA5GgjA6vWZwOV4lsBm2JLAChaPwL4zi8CmM4fAAxiDwD/GfcCDLnXALG1swFyGY8DpfVrAV1dRwNoVSMBUvD7AW001wD3LK8AHOCLAiZUYwGDlDsD4KAXAbdeWwH2Bk8DDBpDAdGiMwCmoiMDMx4TAfsmAwP5eecA4+HDANGNowFSkX8C8v1bAR7lNwICURMCgVDvAjvwxwOOOKMDyDR/Ay3sVwELaC8D3KgLAX4eTwNNekMBmC43AG5OJwCD3hcAIOYLAdLV8wKi8dMAsjGzAmihkwH+WW8A/2lLABvhJwLPzQMDW0DfArpIuwCY8JcDezxvALFASwCS/CMA8Pf6/7ODFwM0PwcDWObzAkV+3wHiBssD3n63AbbuowC/Uo8CJ6p7Au/6ZwAIRlcCRIZDAlzCLwDw+hsCmSoHA66t4wIzAbsBm02TApeRawHL0UMDzAkfAW17EwNaQv8AfvrrAyea1wFYLscA5LKzA2UmnwJFkosCwfJ3AfpKYwDqmk8AcuI7AVciJwBLXhMD0yH/AYOF1wKb3a8D9C2LAmB5YwKMvTsBFP0TAY9fCwOoNvsDYPrnAymq0wE2Sr8DdtarA59WlwM7yoMDnDJzAfySXwNo5ksA0TY3Aw16IwLZug8Bw+nzA3BRzwPQsacDzQl/AEFdVwHppS8BbekHAekvBwI2GvMCRu7fAMuuywAYWrsCTPKnAUF+kwKd+n8D1mprAi7SVwLTLkMCx4IvAvPOGwAgFgsCEKXrAKUZwwEVgZsAaeFzA4o1SwNChSMAUtD7AAbq/wDH6usDOM7bAkGexwByWrMADwKfAxeWiwNUHnsCZJpnAaUKUwJVbj8BkcorAFYeFwOCZgMDtVXfACHVtwGGRY8A/q1nA4cJPwH7YRcBK7DvAQiK+wDVoucD+prTAZt+vwB8Sq8DHP6bA7GihwAiOnMCMr5fA182SwELpjcAZAonAoRiEwCxafsBdf3TANaFqwAvAYMAr3FbA2vVMwFUNQ8DTIjnAcIO8wOPPt8CAFLPAI1KuwI2JqcBuu6TAXeifwOUQm8B8NZbAjlaRwHt0jMCWj4fAKqiCwPR8e8CBpXHAZcpnwP7rXcCfClTAlSZKwCJAQMCCVzbAnty6wGkwtsCae7HAIb+swNX7p8B0MqPAp2OewAOQmcAOuJTAPNyPwPb8isCYGobAdjWBwK2beMD4x27AP/BkwOsUW8BWNlHA01RHwKxwPcAiijPAwSy5wNmItMB426/ApiWrwFBopsBHpKHARdqcwO8KmMDZNpPAgl6OwF+CicDWooTAgoB/wOG1dcBY5mvAZhJiwHw6WMABX07ATYBEwLOeOsB6ujDAp3K3wCPYssApM67A3ISpwEDOpMA9EKDAokubwCSBlsBnsZHA+dyMwFoEiMD8J4PAg5B8wAnLcsAoAGnAazBfwFFcVcBIhEvAtahBwPHJN8BK6C3A9Ky1wBEdscCZgazAzdunwMwso8CXdZ7AE7eZwArylMAxJ5DAKFeLwHyChsCqqYHARZp5wI/ab8DhFGbA10lcwPt5UsDLpUjAss0+wBXyNMBLEyvAIdqzwEVWr8CQxarAYymmwPyCocB405zA1RuYwPRck8Cfl47Ah8yJwEv8hMB2J4DACJ12wMbjbMDpI2PAH15ZwAGTT8AZw0XA4e47wMcWMsArOyjAc/ixwDCCrcCp/ajAYmykwLjPn8DoKJvAC3mWwB/BkcACAo3AfTyIwD9xg8DKQX3A8pdzwO3lacCVLGDAqmxWwNimTMC520LA1As5wKI3L8CRXyXA+wWwwBOfq8BTKKfAYKOiwL4RnsDHdJnAuM2UwKkdkMCUZYvAWKaGwLvggcDYKnrADYpwwCngZsAgLl3AyHRTwOS0ScAd7z/ADCQ2wDdULMAYgCLAlgCuwPyqqcDJQ6XAycygwKFHnMDTtZfAuxiTwJJxjsBwwYnATwmFwAxKgMDaCHfAQXJtwIDRY8CsJ1rAtXVQwHW8RsCp/DzA/TYzwAdsKcBOnB/A7eWrwL+jp8ASTqPA0uaewMhvmsCb6pXAzFiRwLe7jMCUFIjAfGSDwNBYfcBo2nPATE9qwNe4YMA9GFfAkG5NwMK8Q8CqAzrAB0QwwIN+JsC1sxzAerOpwAKHpcAARaHAfO+cwGOImMB+EZTAdoyPwMv6isDaXYbA27aBwMsNesDmnXDAwx9nwOmUXcC0/lPAWV5KwOm0QMBWAzfAeEotwAyLI8C8xRnAkWanwDlSo8AxJp/AleSawG+PlsCrKJLAFrKNwFcticDxm4TAf/5/wPiwdsB/UW3ABeJjwEZkWsDK2VDA70NHwOmjPcDJ+jPAgkkqwOqQIMDB0RbAcPykwLYCocAX75zAt8OYwLOClMAYLpDA08eLwLFRh8BczYLArnh8wP0/c8Aa82nAOJRgwEolV8AMqE3ACB5EwJ2IOsD+6DDAPkAnwFCPHcAM1xPAU3KiwLSVnsD+nJrATYqWwMZfksCIH47AoMuJwP1lhcBw8IDAQdl4wCm4b8BWgGbAPTRdwBTWU8DOZ0rAK+tAwLZhN8DNzC3Api0kwFWFGsDN1BDAjsWfwHAInMAiLZjAojWUwA4kkMCM+ovAO7uHwClog8CSBn7A1hx1wHUWbMB99mLArb9ZwIB0UMAsF0fAqak9wLctNMDjpCrAjRAhwO5xF8AYyg3ArfOcwEJYmcC/nJXA8cKRwNbMjcCIvInAMJSFwO5VgcCkB3rAoD9xwHRXaMB9Ul/AyjNWwCD+TMD9s0PAmVc6wO/qMMDBbyfAoOcdwOxTFMDgtQrAkvqZwLuClsAy6ZLAeC+PwFRXi8DDYofA4FODwKdZfsB+33XAaD1twFF3ZMDhkFvAeo1SwC9wScDJO0DAyfI2wGyXLcCuKyTAV7EawPcpEcDzlgfAmdiWwMiFk8ATEJDAlXiMwMnAiMBz6oTAj/eAwG/UecAoiXHAjxFpwMxxYMDMrVfAQMlOwIrHRcDFqzzAvngzwPgwKsC21iDA92sXwIXyDcD0awTAX4eTwNFfkMBYD43A6JuJwJgGhsDbUILA6Ph8wLYWdcBV/2zAFLdkwDtCXMD1pFPANONKwKwAQsDHADnAo+YvwBG1JsCbbh3AhRUUwNWrCsBWMwHA/nHHwI23wsB6+L3ATTW5wH1utMBzpK/Aj9eqwCEIpsB0NqHAyGKcwFWNl8BPtpLA4d2NwDQEicBqKYTARJt+wPDhdMAHJ2vAtmphwCOtV8Bv7k3APNfFwCEgwcANZLzAkKO3wCvfssBOF67AXkypwLN+pMCbrp/AXNyawDQIlsBXMpHA9VqMwDuCh8BMqILAk5p7wKTiccAAKWjA021ewEixVMCE80rAYjjEwAqFv8BWzLrA4A62wDJNscDGh6zACL+nwFfzosAGJZ7AYVSZwKmBlMAZrY/A5NaKwDj/hcA+JoHAMph4wNLhbsCWKWXAsG9bwEy0UcCT90fA6pTCwNHlvcDqMLnA3Xa0wD+4r8CS9arATC+mwNJlocB/mZzApsqXwIz5ksBwJo7Ai1GJwA57hMBKRn/A7ZN1wEzfa8CiKGLAKHBYwA22TsB++kTAOezAwOtBvMBQkbfAHNuywPAfrsBbYKnA25ykwN/Vn8DKC5vA9D6WwKlvkcAvnozAwsqHwJj1gsDCPXzAjY1ywN3aaMD2JV/AEm9VwGe2S8Aj/EHAoD2/wL+YusD97LXAIjuxwNqDrMDBx6fAYAejwDJDnsChe5nADbGUwMvjj8AlFIvAXkKGwLBugcCdMnnA0YRvwE/UZcBeIVzAQGxSwC+1SMBe/D7AVoi9wJjpuMBUQ7TAYZavwH7jqsBTK6bAeG6hwHKtnMC26JfArSCTwLRVjsAbiInALbiEwE/Mf8CLJHbAc3lswF/LYsCgGlnAfWdPwDayRcAD+zvAd8u7wK4zt8Chk7LAPOytwE8+qcCWiqTAtNGfwD0Um8CyUpbAhY2RwB3FjMDS+YfA9iuDwJ23fMA0E3PAIWtpwMa/X8B8EVbAkGBMwEmtQsDk9zjA/wW6wBd2tcAV3bDA+juswKyTp8D45KLAlDCewCF3mcAvuZTAO/ePwLYxi8AEaYbAe52BwNaeecAx/m/AgVlmwDOxXMCoBVPAN1dJwCymP8DM8jXAxja4wM6vs8DHHq/AzYSqwN3ipcDYOaHAh4qcwJ7Vl8C7G5PAaV2OwCabicBe1YTAdAyAwHyBdsAQ5WzALERjwEqfWcDT9k/AKEtGwJ2cPMB/6zLAfVy2wKbfscCtV63Ax8WowA0rpMB5iJ/A6N6awCEvlsDUeZHAnb+MwAUBiMCHPoPAH/F8wPxec8BPx2nAsCpgwKOJVsCg5EzAETxDwFOQOcC64S/AqXW0wEwEsMCWhqvA2/2mwE9rosAH0J3A+SyZwAKDlMDm0o/AUR2LwN9ihsAWpIHA4sJ5wLM2cMBepGbAiQxdwMtvU8CnzknAkylAwPiANsAz1SzAoYCywEAcrsArqqnA1SulwJCioMCPD5zA5HOXwIPQksBHJo7A8XWJwC7AhMCWBYDAYI12wOYHbcCUe2PAJOlZwDxRUMBytEbARhM9wDBuM8CVxSnAi3uwwNUlrMDowKfAWU6jwJrPnsD+RZrAsrKVwMkWkcA2c4zA0ciHwFwYg8D/xHzAqU9zwMLRacA2TGDA2L9WwGMtTcB7lUPAs/g5wI9XMMCAsibAXGSuwCwfqsAcyaXA4GOhwA7xnMAXcpjATeiTwN1Uj8DXuIrALhWGwLlqgcBydHnArghwwFOTZsBtFV3A6I9TwJQDSsAscUDAU9k2wJ08LcCKmyPA3DiswDYGqMDhwKPAs2qfwF4Fm8B5kpbAdROSwKKJjcAu9ojAKFqEwAVtf8AoGHbAOLdswIlLY8BG1lnAelhQwBDTRsDZRj3AjbQzwNIcKsA5gCDApvapwLPYpcAlpqHA6GCdwNAKmcCTpZTAxTKQwNizi8AdKofAwpaCwKn1e8CQrnLA5VlpwCj5X8CqjVbAlxhNwPuaQ8C/FTrAtYkwwJX3JsADYB3ANZunwDuUo8Cidp/AZ0SbwHX/lsCjqZLApkSOwBTSicBgU4XA2cmAwF9teMDiNW/AIe9lwMqaXMBbOlPAKM9JwFxaQMAC3TbABVgtwDbMI8BNOhrA9COlwEk2ocDuL53A5xKZwDDhlMC4nJDAVEeMwLzih8CHcIPATuR9wN3RdMAYrGvAH3ViwNcuWcDx2k/A6npGwBcQPcClmzPAnh4qwO6ZIMBmDhfATI6iwEK8nsB/z5rA+smWwLWtksCwfI7A2TiKwAfkhcD0f4HAbxx6wIsgccDhDmjA0elewH2zVcDNbUzAcBpDwOi6OcCJUDDAgdwmwNtfHcCE2xPAwtefwJQjnMC7UpjAE2eUwJFikMA6R4zADReIwPvTg8C2/37A0jh2wHtWbcCeW2TA4kpbwKkmUsAY8UjAGaw/wFxZNsBm+izAjJAjwPwcGsDFoBDADv6cwMRpmcAQt5XAmOeRwDb9jcDh+YnAnt+FwGuwgcB43HrA1DVywGNwacBbj2DAq5VXwP6FTsC6YkXABi48wM7pMsDGlynAczkgwCzQFsAiXQ3AO/+ZwJOMlsAG+pLA9kiPwAh7i8AUkofAEJCDwALufsDPkXbAbQ9uwJVqZcDDplzAL8dTwM/OSsBQwEHAG544wFtqL8D+JibAvNUcwBp4E8B0DwrAxdmWwBSKk8BlGZDAvIiMwHfZiMA3DYXA0yWBwH9KesADG3LAN8FpwAJBYcAhnljAE9xPwBf+RsAlBz7A7fk0wN/YK8AnpiLAt2MZwEoTEMBotgbAX4eTwM9gkMBKE43AuKSJwBUWhsC8aILAkzx9wCVxdcAYc23AckZlwDvvXMBecVTAmtBLwHMQQ8AsNDrAwj4xwOoyKMAXEx/AeeEVwAagDMB8UAPA0AnJwIdmxMDSvr/AMxO7wCJktsAFsrHAN/2swAlGqMDDjKPAodGewN0UmsClVpXAJpeQwITWi8DhFIfAWlKCwBMee8AMlnHAyAxowGmCXsAR91TAXFbHwCW2wsAtEb7AAmi5wCK7tMD7CrDA71erwFOipsB06qHAljCdwPJ0mMC+t5PAJ/mOwFY5isBueIXAj7aAwKznd8C0YG7AY9hkwOBOW8BMxFHAH5/FwGECwcCEYLzAILq3wLsPs8DLYa7AurCpwOT8pMCcRqDAKY6bwMvTlsC7F5LAKlqNwEObiMAu24PAGjR+wPqvdMAzKmvA9KJhwGYaWMCwkE7AluPDwMpKv8ByrLrAMgm2wJphscAstqzAWQeowIRVo8AGoZ7ALuqZwEAxlcB5dpDADrqLwDD8hsAIPYLAd/l6wNV2ccBl8mfAWWxewODkVMAiXEvALiPCwNqOvcCA9LjAz1S0wGWwr8DNB6vAg1umwPGrocB6+ZzAcUSYwCKNk8DO047AsBiKwPxbhcDfnYDAA713wA88bsAguWTAbjRbwCyuUcCFJkjAPV3AwP3Nu8ApOLfAgpyywLP7rcBSVqnA5aykwOT/n8C2T5vAuZyWwD7nkcCNL43A5nWIwIK6g8Aj+33Ag350wHP/asA1fmHACftXwCR2TsC270TAAZG+wIUHusDWdrXAxN+wwAtDrMBOoafAIvuiwAdRnsBwo5nAw/KUwFk/kMCBiYvAgtGGwJgXgsD2t3rAtj1xwMXAZ8BwQV7A+r9UwJ48S8CRt0HAnr28wK86uMDXr7PA+h2vwOSFqsBL6KXAzkWhwPyenMBU9JfARUaTwDGVjsBw4YnATiuFwBBzgMDicXfAT/ptwMV/ZMCWAlvADINRwGoBSMDqfT7AGeK6wJxmtsBo4rHAdVatwKTDqMC8KqTAboyfwFbpmsABQpbA6JaRwHnojMAVN4jAD4ODwGeZfcCKKHTA+7NqwCQ8YcBhwVfAA0ROwFPERMCRQjvAVf24wE6KtMClDbDAbIirwJj7psAFaKLAds6dwJovmcAJjJTATOSPwNw4i8AkiobAgdiBwI5IesCA23DAWmpnwI/1XcCHfVTAmgJLwBuFQcBPBTjADw63wKOkssCNMK7A+bKpwPQspcBxn6DASAucwDlxl8Dv0ZLAAi6OwPeFicBF2oTAViuAwArzdsBLim3A/hxkwKSrWsCwNlHAhb5HwH5DPsDoxTTA2xK1wFW0sMD9SazAGNWnwNFWo8Ay0J7AK0KawJKtlcAkE5HAinOMwFnPh8AWJ4PAa/Z8wD+Yc8BfNGrAbMtgwPVdV8B77E3AbHdEwC3/OsAWhDHAIwqzwPW3rsCoWKrAoe2lwCd4ocBe+ZzAUXKYwOzjk8AET4/AU7SKwIIUhsAkcIHAd495wHo3cMAe2WbAF3VdwAUMVMB4nkrA7CxBwNG3N8CKPy7AIvKwwOatrMAcW6jAR/ujwMqPn8DqGZvAy5qWwHYTksDUhI3Auu+IwOBUhMDcaX/A6iB2wPDPbMDTd2PAXhlawEa1UMApTEfAld49wAZtNMDq9yrA6MiuwGCUqsC4T6bAj/yhwGmcncCnMJnAjLqUwD07kMDAs4vA/ySHwMyPgsC+6XvAvalywLhgacCxD2DAjbdWwBZZTcD/9EPA54s6wFkeMcDSrCfAWIyswG1pqMCvNKTA1++fwIecm8A/PJfAYtCSwDNajsDV2onATVOFwIbEgMCeXnjAxShvwMnoZcDMn1zA0U5TwLz2ScBVmEDAUDQ3wErLLcDPXSTAMTqqwO0qpsAGCKLATNOdwHuOmcAyO5XA89qQwCFvjMD++IfArXmDwGjkfcD4xnTAq5xrwPRmYsAZJ1nAP95PwGWNRsBxNT3AK9czwEZzKsBfCiHAFtCnwJrWo8CZx5/A8KSbwG9wl8DTK5PAu9iOwKp4isADDYbACZeBwL4vesAUIXHA6gNowN/ZXsBlpFXAxmRMwCMcQ8B/yznAvXMwwKYVJ8DtsR3Am0ulwBZqocAgcZ3AmmKZwGFAlcBHDJHACMiMwEV1iMCDFYTASFR/wNdodsD8am3AwlxkwP8/W8BTFlLAMeFIwOOhP8CMWTbALQktwKuxI8DQUxrAWKqiwPPinsA5ApvA/gmXwCP8ksCH2o7A+6aKwD5jhsDxEILAMmN7wDWNcsB1omnAOaVgwJGXV8BSe07AH1JFwGwdPMCC3jLAh5YpwHxGIMBH7xbA/umfwMk+nMB1eJjAuZiUwGihkMBklIzAi3OIwLFAhMAo+3/AsVd3wAiabsD5xGXAD9tcwJXeU8Cc0UrA+7VBwFeNOMAmWS/AshomwCLTHMB4gxPAcQidwE57mcBw0ZXAXAySwMotjsCMN4rAgyuGwI8LgsAKs3vASS5zwCaMasCwz2HAtftYwMMSUMApF0fA+Qo+wA3wNMANyCvAb5QiwIBWGcBnDxDA5QOawG2WlsDhCpPAg2KPwNmei8CXwYfAj8yDwESDf8BjRXfAJuNuwA5gZsBrv13ATgRVwIkxTMCuSUPADU86wL1DMcCbKSjATwIfwFPPFcD2kQzA8dqWwGCOk8C5IpDA6piMwDPyiMAWMIXARlSBwCbBesDArXLAGnJqwOIRYsCfkFnAofFQwP83SMCOZj/A5H82wFSGLcD5eyTAsWIbwCk8EsDdCQnAX4eTwM1hkMA9F43Aia2JwJklhsCpgILAcoB9wO/LdcBs523AqtZlwG6dXcBmP1XAHcBMwOciRMDeajvA3JoywHm1KcAPvSDAurMXwF6bDsCodQXA9KfKwEMcxsBYjMHAtfi8wMxhuMACyLPAsCuvwCONqsCi7KXAZ0qhwKmmnMCWAZjAV1uTwA+0jsDfC4rA4mKFwDC5gMDAHXjAB8huwFZxZcDMGVzAWNvIwHVSxMAJxb/AnjO7wK6etsCmBrLA5GutwL3OqMB4L6TAWY6fwJbrmsBkR5bA7KGRwFf7jMDGU4jAVquDwEcEfsCIsHTAmFtrwJsFYsCxrljAQAvHwI6FwsD5+r3AFWy5wGXZtMBcQ7DAYqqrwM8Op8DzcKLAFdGdwHAvmcA8jJTAp+ePwNxBi8D/mobAMPOBwBiVesBYQnHATO5nwBuZXsDmQlXAMTfFwCK1wMDJLbzAxaG3wKMRs8Dhfa7A7OapwCVNpcDjsKDAcRKcwBFyl8D9z5LAaiyOwIOHicBy4YTAWjqAwLAkd8AS023ACIBkwLwrW8BV1lHAnF7DwLHgvsAHXbrAStS1wBJHscDltazAPSGowIKJo8AS757APVKawE6zlcCCEpHAEnCMwDDMh8AHJ4PAeQF9wOWyc8CPYmrAqRBhwGK9V8DjaE7A3oDBwK0HvcA2iLjANAO0wEx5r8AS66rACFmmwKHDocBCK53ARJCYwPfyk8CgU4/AfLKKwMEPhsCea4HAe4x5wIg/cMCl8GbACqBdwOtNVMBz+krAPp2/wG8pu8DBrrbAAC6ywOGnrcACHanA9I2kwDL7n8AuZZvAR8yWwNYwksAmk43AevOIwA5ShMAqXn/AfBV2wGPKbMAkfWPAAS5awDDdUMDjikfA57K9wDxFucAE0LTAHVSwwEzSq8BBS6fAmL+iwNsvnsCEnJnA/wWVwKtskMDc0IvA3DKHwOySgsCN4nvAOZxywDhTacDXB2DAXbpWwAhrTcANGkTA6cC7wD1at8A+67LA33SuwPj3qcBKdaXAge2gwDRhnMDq0JfAGz2TwC+mjsCEDIrAanCFwCrSgMAKZHjAYiBvwMHZZcB/kFzA6ERTwED3ScDEp0DAM8a5wH5ntcCX/7DAh4+swDoYqMCGmqPAKBefwMaOmsD3AZbAPnGRwBDdjMDTRYjA46uDwB4ffsA84nTAnqFrwLFdYsDWFlnAYs1PwKKBRsDZMz3Aj8G3wOprs8AXDK/AN6OqwE8ypsBIuqHA8zudwAq4mMAyL5TA/qGPwO8Qi8B4fIbA/eSBwLKVesCyXHHAhx9owKzeXsCLmlXAhVNMwO8JQ8ASvjnAo7G1wEhmscCmD63A966owFhFpMDK05/ANFubwGXclsATWJLA4s6NwGJBicATsITAZhuAwHwHd8Do0m3AqZlkwEtcW8BEG1LAANdIwN6PP8AwRjbA6ZSzwDlVr8AICavAqrGmwFdQosAq5p3AInSZwCT7lMD7e5DAXveLwO1th8A44ILAeJ18wNNzc8BGRGrAfw9hwBjWV8CYmE7AdldFwB0TPMDqyzLAtGmxwDU3rcDZ9qjAEKqkwC5SoMBp8JvA2oWXwH4Tk8A5mo7A1BqKwAWWhcBqDIHAJP14wPXZb8AjsGbAcYBdwI1LVMAQEkvAftRBwFCTOMDuTi/ALi6vwIoKq8CN16bAwpaiwJlJnsBk8ZnAWI+VwIwkkcD+sYzAjziIwAe5g8A4aH7A1lR1wAM5bMC4FWPA0utZwBK8UMAkh0fAoE0+wAsQNcDczivAWeCswFvNqMBtqaTAL3agwC01nMDU55fAdo+TwEgtj8BiworAvk+GwD7WgcBVrXrAbaNxwACQaMAndF/A2lBWwPUmTcA590PAUsI6wNaIMcBKSyjAF36qwKl9psCaaqLAnUaewFQTmsBJ0pXA6oSRwIosjcBcyojAd1+EwK7Zf8C55nbAoedtwMjdZMBtylvAqK5SwG+LScCfYUDA9zE3wCX9LcC9wyTAMAWowFEZpMAPGaDAKAacwFHil8Arr5PAQW6PwAEhi8C/yIbArWaCwMj3e8C8EnPA+R9qwBAhYcBmF1jANgRPwJroRcCIxTzA3ZszwFlsKsCoNyHAZHOlwBqeocCnsp3AyLKZwDyglcC4fJHA3kmNwDkJicA6vITAMWSAwKsEeMB7L2/AykpmwFtYXcC/WVTAXFBLwG89QsAPIjnANv8vwL7VJsBqph3AdcaiwMIJn8AnNZvAVUqXwApLk8AFOY/A+xWLwJHjhsBSo4LAXa18wPP9c8DTOmvALWZiwPmBWcD7j1DAxpFHwMGIPsAodjXAF1sswIQ4I8BNDxrAQfyfwA5anMBNnpjAksqUwI/gkMAC4ozAq9CIwD+uhMBkfIDATXl4wO/gb8BYMmfA9m9ewPubVcBiuEzA78ZDwDjJOsCkwDHAc64owL2TH8B/cRbA1xKdwN+MmcDf65XAPjGSwI9ejsCDdYrA2XeGwFFngsBEi3zA4yh0wJuqa8BTE2PAtmVawDSkUcAC0UjAHe4/wE39NsAoAC7AF/gkwFrmG8APzBLAjgiawEmglsDBG5PAH3yPwMXCi8BJ8YfAWAmEwLEMgMAs+nfAfbhvwKFXZ8C42l7ArERWwCqYTcCm10TAWAU8wD8jM8AlMyrAozYhwCQvGMDrHQ/AHdyWwK2Sk8APLJDAHqmMwP0KicAQU4XA5oKBwF04e8BRQXPAKSRrwFfkYsArhVrAyAlSwBl1ScDQyUDAZQo4wBE5L8DZVybAh2gdwLhsFMDZZQvAX4eTwMpikMAwG43AW7aJwCI1hsCkmILAgsR9wA8ndsBKXG7AsGdmwMRMXsD6DlbApLFNwOc3RcCzpDzAv/ozwIM8K8A/bCLA+YsZwH+dEMBwogfA/EvMwEfYx8CKYMPAQuW+wOBmusDE5bXARWKxwK/crMBEVajAQMyjwNRBn8AttprAcymWwMebkcBIDY3AEX6IwDfug8Ceu37A1Zl1wDJ3bMDQU2PAzGXKwKP0xcAnf8HA3wW9wEGJuMC1CbTAmYevwD0Dq8DpfKbA2vShwEhrncBi4JjAUlSUwD7Hj8BFOYvAhKqGwBQbgsASFnvA7vRxwN3SaMD9r1/AbnzIwC8OxMBHm7/ASCS7wK+ptsDuK7LAaKutwHMoqcBco6TAZxygwM2Tm8DECZfAd36SwBDyjcCwZInAdtaEwH1HgMC6b3fAUk9uwOktZcCcC1zAa4/GwIEkwsCOtL3AK0C5wOTHtMAvTLDAec2rwB9Mp8BzyKLAv0KewEK7mcA0MpXAxqeQwCQcjMBzj4fA1AGDwMfmfMB5yHPA6KhqwD2IYcCZZljAPJ7EwCI3wMCQyrvALVm3wIvjssAvaq7AjO2pwAdupcD766DAtmecwH/hl8CQWZPAIdCOwGBFisB2uYXAiCyBwGg9ecAvIHDAkwFnwMHhXcDdwFTARajCwIlFvsDW3LnA4G61wEf8sMCahazAVwuowOyNo8C7DZ/AG4uawFcGlsCxf5HAZfeMwKZtiMCg4oPA9ax+wLOSdcC2dmzAMlljwFg6WsBPGlHA1qzAwBlPvMDU6rfAyoCzwKsRr8ARnqrAhSamwIKrocBxLZ3AsqyYwJcplMBqpI/Aah2LwNGUhsDPCoLAIv96wHfmccDiy2jAnq9fwN+RVsDRck3AJKu+wB5TusDr87XAX46xwDojrcAls6jAtj6kwHPGn8DRSpvAOcyWwAVLksCGx43AA0KJwLq6hMDiMYDAVU93wH04bsCEH2XArQRcwDDoUsBByknASaK8wMtQuMBk97PA/ZavwGUwq8BYxKbAelOiwF7encCFZZnAY+mUwF1qkMDK6IvA+2SHwDLfgsBdr3zASJ1zwISIasBicWHALFhYwCA9T8B3IEbAQJG6wDZHtsBw9LHA65mtwIo4qcAa0aTAUWSgwNHym8AqfZfA2gOTwFGHjsDyB4rAFYaFwAUCgcAN+HjAqOhvwETWZsA9wV3A46lUwHyQS8BIdULA5Ha4wFk1tMAk6q/AV5arwO06p8DF2KLAqnCewEwDmsBNkZXANxuRwImhjMCwJIjADaWDwOpFfsBnPXXAFjFswGohY8DKDlrAkPlQwAviR8CByD7A6VG2wAkassBz163AU4upwLo2pcCd2qDA3HecwDsPmMBroZPACS+PwKC4isCqPobAlMGBwHqDesDyfnHAJnZowJZpX8C2WVbA6kZNwIsxRMDnGTvA4CC0wPjzr8Axu6vA0HenwP4qo8DK1Z7AKHmawPMVlsDurJHAyj6NwB/MiMB4VYTAnLZ/wBi8dsAgvG3AWrdkwFmuW8CeoVLAmpFJwLB+QMA5aTfAM+KxwLHBrcALlKnAnVqlwKkWocBYyZzAtXOYwLMWlMAss4/A4kmLwILbhsClaILAqON7wA7vcsBO9GnAJfRgwDfvV8AV5k7AP9lFwCXJPMAqtjPAJpSvwJyBq8CKYKfAZDKjwIb4nsAxtJrAi2aWwKAQksBhs43ApU+JwC/mhMCqd4DAXQl4wIgbb8DDJmbA4itdwJ4rVMCbJkvAaR1CwIYQOcBiADDA2TStwPYxqcAPH6XAqv2gwDzPnMAflZjAk1CUwL8CkMCtrIvATE+HwHbrgsDUA33ApiZ0wJRAa8CqUmLA1l1ZwOpiUMCeYkfAll0+wGFUNcB+RyzAUsKqwODQpsDXzaLAzbqewEuZmsDDapbAkTCSwPTrjcATnonA90eFwJDqgMBpDXnATDpwwB5dZ8AOd17AKIlVwFqUTMB2mUPAM5k6wDWUMcAKiyjAgTqowFpcpMD8aqDABWicwA1VmMCcM5TAJQWQwAPLi8B2hofApDiDwC/FfcB/CnXA50JswOdvY8DWklrA4axRwBe/SMBjyj/Al882wGzPLcCEyiTATJulwFLSocB99J3AagOawLgAlsD/7ZHAyMyNwIWeicCUZIXANCCBwBalecBI+XDA3j5owIZ3X8DBpFbA5sdNwCTiRMCH9DvA/v8ywFoFKsBTBSHAouKiwLAwn8BIaJvA+YqXwGGak8AgmI/AzYWLwPNkh8AFN4PAwvp9wI1ydcC612zAXixkwFtyW8Bhq1LA8dhJwGP8QMDnFjjAiikvwDo1JsDKOh3Aiw6gwGJ1nMBBxJjAnPyUwAEgkcAOMI3AZC6JwJschcA9/IDAgZ15wAMrccCFo2jAVwlgwJBeV8ASpU7AkN5FwIwMPcBfMDTAOksrwCxeIsAjahnAQB2dwHaemcBcBpbAOlaSwIKPjsDDs4rAmsSGwKjDgsAPZX3AgyV1wJzLbMAVWmTAdtNbwA46U8D5j0rAG9dBwCgROcCkPzDA6mMnwCt/HsB4khXAOQ2awCiqlsCoLJPAx5WPwMzmi8AnIYjAZkaEwChYgMAYsHjAW49wwDBRaMCG+F/AHYhXwH0CT8D7aUbAssA9wIsINcA7QyzASXIjwBCXGsDFshHASd2WwPqWk8BnNZDAVrmMwNMjicAhdoXAsLGBwBuwe8Cr1XPAU9drwEq4Y8Cpe1vAYyRTwDi1SsC2MELAM5k5wM7wMMByOSjA13QfwIakFsDcyQ3AX4eTwMhjkMAjH43AML+JwLBEhsCqsILAwQh+wICCdsCr0W7AeflmwC/9XsAD4FbAEqVOwFBPRsCC4T3AOF41wMzHLMBfICTA4WkbwAqmEsBo1gnAd/XNwBuaycDkOsXATdjAwMNyvMCmCrjAR6CzwPIzr8DlxarAWVamwH/locCBc53AhgCZwK2MlMATGJDA0aKLwPwsh8CotoLAyX98wH+Rc8CMomrAVfXLwEKcx8ARP8PAQ96+wEx6usCRE7bAaqqxwCc/rcAM0qjAVGOkwDXzn8DdgZvAcg+XwBmcksDvJ47AELOJwJI9hcCKx4DAEqJ4wD+0b8C0xWbATvLJwN+bxcACQcHAQeK8wBmAuMD1GrTANrOvwC9Jq8Ap3abAZ2+iwB8AnsCDj5nAvx2VwPmqkMBQN4zA4sKHwMhNg8AwsH3AycN0wH3Wa8Bq6GLA9OvHwI6Yw8BeQL/A+uO6wOaDtsCYILLAdrqtwNpRqcAV56TAbHqgwBwMnMBbnJfAViuTwDi5jsAkRorAONKFwJFdgcCL0HnA1uRwwCf4Z8CdCl/Ax+HFwN6RwcDCPL3AFuO4wGiFtMA1JLDA77+rwPZYp8Ci76LAPISewAkXmsBDqJXAGziRwL/GjMBVVIjA/+CDwLjZfsAK8HXAIQVtwCYZZMA6LFvANNPDwE2Hv8C8NbvAMN+2wEOEssB/Ja7AXMOpwEVepcCZ9qDAqYycwL4gmMAYs5PA7kOPwHHTisDLYYbAIu+BwC73esCKDnLAjCRpwGA5YMAqTVfAlL/BwEZ4vcDIKrnA1Ne0wBOAsMAbJKzAbsSnwIJho8C++57Ae5OawAoplsCwvJHAqk6NwC7fiMBqboTAEPl/wFYTd8DmK27A9kJlwLdYXMBSbVPAJaa/wCBku8BPG7fAfcyywGJ4rsChH6rAycKlwFxiocDJ/pzAdZiYwLcvlMDbxI/AJliLwNHphsAReoLAKBJ8wAAuc8DxR2rAOGBhwAp3WMCWjE/AD4a9wBhKucCkBrXAkrywwKhsrMCaF6jABb6jwHdgn8Br/5rAUJuWwIc0ksBjy43AMWCJwDHzhMCchIDASyl4wPFGb8B5YmbAJnxdwDKUVMDSqkvAWl67wFEpt8AD7LLAY6euwEtcqsB9C6bAqLWhwGhbncBF/ZjAupuUwDA3kMAI0IvAk2aHwBv7gsC9G33ALT50wOhda8BEe2LAjJZZwAKwUMDgx0fA8C25wNAAtcCMyrDAK4yswJlGqMCu+qPAKamfwLVSm8Dr95bAUpmSwGE3jsCA0onADGuFwFcBgcBOK3nAeFBwwJdyZ8AOkl7AL69VwEXKTMCR40PAmPO2wHzPssBCoa7ABWqqwMkqpsB55KHA55edwNJFmcDi7pTArZOQwLg0jMB30ofAUm2DwEgLfsB6N3XAxl9swKeEY8CKplrAzMVRwMHiSMCy/T/A9620wBmUsMAGb6zA8j+owPUHpMASyJ/AL4GbwB80l8Cc4ZLAToqOwMcuisCMz4XAEG2BwG8PesC9P3HApWtowLKTX8BeuFbAE9pNwDD5RMAFFjzAkVuywEhNrsCbMqrA0QymwBvdocCRpJ3AMWSZwOMclcB2z5DApHyMwBEliMBQyYPAxNN+wHYOdsB+Q23AjnNkwEOfW8Akx1LArOtJwEMNQcBGLDjAw/qvwIj5q8Cd6qfAX8+jwBWpn8DveJvAA0CXwE7/ksC3t47AC2qKwAIXhsBBv4HAssZ6wJUHcsAPQmnA6XZgwNKmV8Bm0k7ALfpFwJ8ePcAkQDTA0ImtwDSXqcCHlaXAN4ahwJ9qncAGRJnAmhOVwHLakMCLmYzAx1GIwPYDhMCcYX/A5bF2wOj5bcCnOmXABHVcwMWpU8Cb2UrAHwVCwNosOcBDUTDA3garwIskp8CzMaPAzy+fwE4gm8CMBJfAzt2SwEOtjsABdIrAAzOGwC3rgcCbOnvAM5RywGnkacBfLGHAE21YwGinT8Al3EbA+As+wHw3NcA4XyzAA3CowLGfpMBavaDAfsqcwJfImMAVuZTAUp2QwJR2jMALRojAywyEwKGXf8D+B3fASGxuwOrFZcAsFl3ALl5UwO+eS8BQ2ULAGQ46wPk9McCIaSjAUMOlwLsGosCgNp7AelSawMxhlsAQYJLAtVCOwBU1isB5DobADt6BwNNJe8ASyHLAnzhqwBSdYcDf9ljARkdQwGuPR8BL0D7Aygo2wK4/LcCnbyTA3f6iwLlXn8CXm5vA5suXwCPqk8DO94/AZPaLwFPnh8D3y4PAMEt/wMjqdsDkeG7AffdlwFxoXcAbzVTAKSdMwM13Q8AnwDrAOQEywOU7KcDxcCDA3CCgwMWQnMBQ6pjA0i6VwLlfkcCCfo3ArYyJwLeLhcAQfYHAJsR6wBR4csBIGGrA7qZhwAQmWcBTl1DAdvxHwN5WP8DSpzbAdPAtwMYxJcCrbBzAqiedwBSwmcDnIJbAUHuSwKDAjsBH8orAwBGHwIwgg8BTQH7ADSR2wATvbcDJo2XAvkRdwBLUVMDCU0zAm8VDwDkrO8APhjLAZNcpwF4gIcD9YRjA4xGawAi0lsCUPZPAfK+PwOoKjMAuUYjAt4OEwACkgMAWZ3nAqmdxwJ5MacCvGGHAcs5YwEpwUMBqAEjAz4A/wEnzNsB3WS7AzLQlwJIGHcDwTxTAdt6WwEebk8DAPpDAlMmMwLU8icBKmYXAo+CBwFcofMDCanTAiItswKWNZMD8c1zATkFUwDD4S8AJm0PADiw7wD+tMsBvICrAPochwCLjGMBoNRDAX4eTwMZkkMAWI43ABsiJwEJUhsC7yILAK01+wD7edsCFR2/A+YtnwJ2uX8BrslfAS5pPwP5oR8AdIT/AEcU2wBNXLsAl2SXAHE0dwJy0FMAdEQzA96PPwENhy8DiGsfASdHCwOGEvsAINrrADeW1wDeSscDEPa3A6ueowNeQpMC2OKDAqd+bwNCFl8BFK5PAINCOwHV0isBXGIbA07uBwPK9esClA3LAi4nNwONIycBOBMXASrzAwEZxvMCjI7jAuNOzwNCBr8AuLqvACtmmwJiCosACK57Ab9KZwAB5lcDTHpHA/8OMwJxoiMC7DITA3WB/wIendsCN7W3AhGzLwDsux8C768LAi6W+wCFcusDmD7bAN8GxwGNwrcCzHanAYsmkwKlzoMC1HJzAr8SXwLxrk8D6EY/AhbeKwHRchsDcAILAnEl7wLSQcsAa12nAekzJwO4QxcDW0MDAxIy8wDVFuMCc+rPAWa2vwMZdq8AtDKfA0riiwO5jnsC2DZrAVLaVwPBdkcCrBI3ApKqIwPJPhMBb6X/A0TF3wGl5bsA+wGXA9SjHwJLwwsBDs77Ao3G6wDsstsCE47HA6ZetwMhJqcBz+aTANKegwElTnMDp/ZfARaeTwIdPj8DT9orASp2GwAhDgsBH0HvAZhlzwJFhasDoqGHAawHFwK/MwMCXkrzAy1O4wN8QtMBXyq/ApYCrwDE0p8BU5aLAXpSewJJBmsAu7ZXAZZeRwGhAjcBc6IjAZo+EwKQ1gMBftnfAQgBvwBhJZsAFkV3APtXCwLekvsBWbrrAzzK2wMPyscDArq3ARWepwMEcpcCXz6DAHYCcwJ8umMBe25PAlYaPwHUwi8At2YbA4ICCwGZPfMCBm3PAR+ZqwOQvYsB9eFnAu6PAwAx4vMDyRbjAMQ60wHbRr8BekKvAc0unwC4Do8D7t57AOmqawD0alsBOyJHArHSNwI8ficAnyYTAoHGAwD4yeMCHf2/AVMtmwNYVXsA4X1XAEmy+wPVFusDJGLbAYeWxwHusrcDCbqnAzCylwCDnoMA0npzAclKYwDQElMDLs4/Af2GLwI0Nh8AruILAEMN8wJ0TdMBCYmvAQK9iwMz6WcAXRVHAXS28wKQNuMAh5rPAu7evwECDq8BrSafA4AqjwDXInsDrgZrAdziWwD7skcCbnY3A20yJwEP6hMAPpoDA66B4wEbzb8B/Q2fA3pFewJ/eVcD3KU3Alua5wCzOtcAprbHAhIStwB9VqcDFH6XALeWgwPmlnMC7YpjA8huUwBDSj8B4hYvAgzaHwHzlgsBPJX3AgXx0wPPQa8ABI2PA+XJawB/BUcCwDUnAlpa3wIWGs8DxbK/A5kqrwFghp8Ao8aLAHLuewOl/msAvQJbAfPyRwE+1jcAWa4nAMx6FwP3OgMB++3jAdlVwwFWsZ8CCAF/AVFJWwBiiTcAS8ETAGzy1wIY1scBtJK3A7wmpwBbnpMDTvKDABIycwG5VmMDDGZTAodmPwJSVi8AYTofAnAODwABtfcAxznTAXytswA6FY8Cv21rApi9SwEuBScDo0EDAvtWywOjZrsBy0qrAkcCmwGKlosDtgZ7AIleawNsllsDd7pHA2LKNwGhyicAXLoXAYuaAwGg3ecDanHDAwv1nwLJaX8ArtFbAnwpOwHBeRcDzrzzA/GGwwEByrMC0dajAnW2kwCtboMB9P5zAmBuYwGvwk8DPvo/Ah4eLwEJLh8CaCoPANYx9wHn8dMDYZmzAD8xjwMQsW8CJiVLA3uJJwDM5QcDpjDjANd+twAr9qcDIDKbAww+iwEAHnsBv9JnAbdiVwD60kcDRiI3A/VaJwIYfhcAX44DAmUR5wF27cMBuK2jAoZVfwLP6VsBJW07A9LdFwDMRPcB2ZzTAtEurwKJ4p8AjlqPAlqWfwE2om8COn5fAiIyTwFdwj8AATIvAcSCHwIDugsDebX3A1vR0wBxzbMDC6WPAullbwNnDUsDaKErAYolBwALmOMA4PzDAtaWowFHjpMAhEKHAhy2dwOI8mcCFP5XAszaRwJ0jjcBfB4nA/eKEwGW3gMDZCnnArJtwwJwiaMDdoF/AfxdXwHSHTsCS8UXAk1Y9wB23NMC+EyzAcOulwFE7osAIeZ7A8aWawG7DlsDe0pLAlNWOwNTMisDPuYbAoZ2CwJryfMCFm3TArTdswJjIY8CeT1vA881SwKhESsCvtEHA3R45wO6DMMCF5CfAJxujwNx+n8ASz5vAFw2YwEg6lMAIWJDAtGeMwKFqiMASYoTAO0+AwGpmeMANHnDAOcdnwJ5jX8C+9FbA9HtOwHT6RcBQcT3Ae+E0wMhLLMD1sCPAMzOgwDSsnMB4EJnAM2GVwLOfkcBWzY3AfeuJwIj7hcDL/oHAFe17wPLHc8BkkGvAd0hjwAjyWsDGjlLANiBKwLOnQcBzJjnAiJ0wwOQNKMBeeB/AFjKdwLbBmcB+O5bAfaCSwOfxjsAKMYvAQ1+HwPR9g8D3HH/AXyR3wKoUb8A+8GbAVLlewPlxVsAMHE7AP7lFwBZLPcDv0jTAAFIswFzJI8D4ORvAjhaawOq9lsCGTpPAPcmPwB8vjMBdgYjARcGEwDPwgMAUH3rAUkFywMxJasANO2LAfhdawFrhUcCwmknAYEVBwB3jOMBwdTDAtv0nwCd9H8DZ9BbAot+WwJWfk8AbSJDA19mMwKJVicCIvIXAug+CwAqhfMCJAHXAtkBtwFFkZcAGbl3AZGBVwNM9TcCSCEXAs8I8wBduNMB0DCzAVJ8jwBcoG8D2pxLAYIeTwMRlkMAKJ43A3dCJwNljhsDX4ILAvpF+wEM6d8DSvW/AJB9owP1gYMAdhljAMZFQwMyESMBYY0DAFS84wBfqL8BDlifAUjUfwM/IFsAcUg7ADFfRwEotzcADAMnAq8/EwKacwMBOZ7zA8C+4wND2s8AqvK/AMoCrwBVDp8D6BKPAA8aewE6GmsD1RZbADQWSwKrDjcDcgYnAsj+FwDn9gMD3dHnACiLPwBj6ysBozsbAc5/CwKRtvsBaObrA6AK2wJXKscCikK3ARlWpwLAYpcAK26DAeZycwB1dmMAQHZTAa9yPwEKbi8CnWYfAqReDwKuqfcBxJXXAtOrMwN7EyMAGm8TArm3AwEk9vMA6CrjA29SzwHidr8BVZKvArimnwLXtosCZsJ7Af3KawIozlsDX85HAgLONwJtyicA6MYXAb++AwJFaecCk1XDAqrDKwEaNxsCTZcLAHTq+wFwLusC82bXAnaWxwFFvrcAiN6nATv2kwA3CoMCRhZzAAkiYwIYJlMA8yo/AQIqLwKlJh8CNCIPA/I19wBUKdcCChWzAe3PIwO5SxMC6LcDAcwS8wJvXt8Cnp7PA/XSvwPY/q8DiCKfABdCiwJuVnsDZWZrA7ByWwP3ekcAtoI3Am2CJwGEghcCV34DAlzx5wCm5cMD+NGjAqDLGwGYVwsAX873AWcy5wLqhtcC3c7HAv0KtwDQPqcBp2aTAq6GgwDxonMBTLZjAJPGTwNmzj8CYdYvAgjaHwLP2gsCKbH3Amep0wLhnbMAH5GPAne3DwCvUv8A2tbvAapG3wGBps8CgPa/AoQ6rwM7cpsCEqKLAFXKewMk5msDe/5XAi8SRwACIjcBmSonA4QuFwJDMgMAdGXnA6ZdwwKwVaMCKkl/AsqPBwKeOvcCUc7nAMlO1wCcuscAGBa3AUtiowIGopMD2daDADkGcwBUKmMBS0ZPAAJePwFVbi8B9HofAoOCCwMRDfcDAxHTAaURswOzCY8BxQFvAKFS/wDFEu8CaLbfAKxGzwJjvrsCCyarAeZ+mwPxxosB6QZ7AVw6awOvYlcCAoZHAWmiNwLMticC+8YTAp7SAwCfteMBMb3DA9+9nwFpvX8Ch7VbAJv68wAb0uMCa4rTAu8qwwCytrMCdiqjArGOkwOM4oMC/CpzArNmXwAymk8AzcI/AajiLwPP+hsAGxILAqQ99wBKVdMCSGGzAappjwNIaW8D8mVLAuKC6wEqdtsDQkbLAM3+uwEhmqsDOR6bAcSSiwMz8ncBm0ZnAuqKVwDJxkcAsPY3A+gaJwOXOhMAslYDADLR4wEc7cMBbwGfAkkNfwCzFVsBeRU7AzTq4wAY/tMBdOrDAzC2swDkaqMB1AKTAPuGfwDu9m8AFlZfAImmTwAk6j8AiCIvAytOGwFKdgsD/yXzAJFZ0wH3fa8BpZmPAOetawDduUsCe70nAN8u1wCfYscBI263ApdWpwDfIpcDhs6HAcpmdwKV5mcAfVZXAeCyRwDIAjcDC0IjAkZ6EwPlpgMCRZnjAjfVvwF+BZ8BwCl/AH5FWwLsVTsCLmEXArFCzwHxnr8B5c6vAwXWnwF1vo8BFYZ/AWUybwGYxl8AmEZPAPOyOwD3DisCrlobA+maCwCBpfMCM/3PA15FrwIogY8AdrFrA+DRSwHm7ScDtP0HAxMmwwLbrrMC9AanABg2lwK0OocC6B53AI/mYwMnjlMB1yJDA36eMwKuCiMBsWYTAoiyAwIL5d8BalG/AfypnwIy8XsAKS1bAb9ZNwCNfRcCC5TzAADWuwGxjqsDDhKbAPZqiwAilnsA+pprA6Z6WwPqPksBTeo7Au16KwOs9hsCEGILAMd57wFGEc8BMJGvA7L5iwOBUWsDD5lHAHHVJwGMAQcD9iDjAz5CrwBzNp8Ad+6PAExygwDYxnMCzO5jAozyUwBA1kMDsJYzAFRCIwFT0g8DApn/AtVt3wKcIb8CZrmbAbU5ewOvoVcDCfk3AjBBFwNCePMAFKjTAktuowDMnpcBJY6HAGJGdwN+xmcDaxpXAMtGRwALSjcBTyonAFruFwCmlgcCsEnvApNBywH2FasBZMmLAN9hZwPp3UcBqEknANahAwPY5OMAyyC/AqROmwBJwosCxu57AxveawJMll8BaRpPAVFuPwKxli8B9ZofAzl6DwCOffsBMc3bAqDtuwKP5ZcB/rl3AXltVwEABTcAHoUTAejs8wEnRM8ANYyvAfTejwBemn8C1ApzAh06YwMmKlMDBuJDArtmMwMvuiMBD+YTAMPqAwDXlecDrxnHAPZtpwL9jYcDaIVnA1NZQwM6DSMDHKUDAo8k3wClkL8AI+ibAjkWgwLDHnMC2NpnAupOVwOrfkcCDHI7Ay0qKwAFshsBfgYLAJRh9wGoadcCeC23Aqe1kwEfCXMAMi1TAY0lMwJL+Q8C6qzvA3FEzwNzxKsCCjCLAhDydwF7TmcAhVpbAwMWSwFMjj8AJcIvAHa2HwNXbg8Dk+n/AWiZ4wGc8cMBCP2jA/TBgwH8TWMCG6E/AqbFHwFNwP8DLJTfAM9MuwI55JsDAGR7AOhuawM7HlsB8X5PACeOPwGhTjMCvsYjADP+EwLs8gcAA2HrAOhxzwJpIa8B5X2PAD2NbwHFVU8CIOEvAFA5DwKzXOsC9ljLAj0wqwEf6IcDpoBnAzuCWwOOjk8B4UZDAHuqMwJluicDa34XA9D6CwCsafcD0lnXAzPZtwDY8ZsCoaV7AfYFWwPGFTsAYeUbA3lw+wAUzNsAm/S3AsLwlwO1yHcADIRXAYIeTwMFmkMD+Ko3AtdmJwHRzhsD8+ILAdtZ+wImWd8CJNHDA7rJowD4UYcD/WlnAqIlRwJWiScADqEHACZw5wJWAMcBsVynAKCIhwDviGMDwmBDARg7TwLf9zsDK6crA7dLGwIO5wsDhnb7AUYC6wBZhtsBpQLLAfB6uwHr7qcCJ16XAybKhwFaNncBJZ5nAuECVwLQZkcBN8ozAkcqIwIuihMBGeoDAbL7QwHOvzMDonMjAQIfEwOJuwMAoVLzAYze4wNcYtMDC+K/AWNerwMi0p8A4kaPAzWyfwKNHm8DWIZfAe/uSwKXUjsBnrYrAzoWGwOZdgsB2a3zAgmzOwGNfysB2TsbAODrCwBQjvsBsCbrAlO21wNbPscBzsK3Ao4+pwJhtpcB8SqHAdCadwKABmcAd3JTAAbaQwGOPjMBVaIjA5ECEwCAZgMAn4nfAMBjMwDsNyMAy/sPAmuu/wOfVu8B/vbfAvaKzwPCFr8BeZ6vAQ0enwNUlo8BAA5/Ard+awD67lsASlpLAQnCOwOVJisAOI4bAzvuBwGeoe8CVWHPAD8HJwJ+4xcDMq8HAIpu9wB2HucAscLXAsFaxwP46rcBiHanAG/6kwGTdoMBuu5zAZZiYwG10lMCnT5DAMCqMwB8EiMCK3YPABW1/wDIed8C1zm7AqGbHwClhw8DpVr/AgEi7wHI2t8A4IbPAOQmvwNPuqsBV0qbACLSiwCmUnsDucprAhVCWwBktksDMCI7AvOOJwAW+hcC9l4HA8eF6wJGTcsB4RGrAdQjFwF8GwcAf/7zAVvO4wJTjtMBa0LDAGrqswDehqMAKhqTA4WigwP9JnMCfKZjA9AeUwCvlj8BswYvA1pyHwIl3g8A3o37AS1Z2wHIIbsDNuWXA2qXCwLmnvsD1o7rAOpu2wCWOssBBfa7ACmmqwO1RpsBKOKLAdxyewL7+mcBe35XAkr6RwImcjcBweYnAalWFwJgwgcAsFnrA+clxwL98acCjLmHAJj7AwJlEvMDeRLjAsD+0wLg1sMCNJ6zAthWowKsApMDV6J/Ak86bwDWyl8AClJPAO3SPwBRTi8C9MIfAYA2DwD/SfcA2iHXA3DxtwF3wZMDiolzAkNC9wEvcucA74bXAK+CxwNDZrcDPzqnAvb+lwB2tocBil53A836ZwCxklcBaR5HAxCiNwKYIicA054TAnMSAwA5CecAs+XDA0K5owC5jYMBxFljAOFy7wAVut8BXeLPAB3yvwN15q8CKcqfAsGajwOBWn8CZQ5vATi2XwGIUk8At+Y7A/NuKwBS9hsCunILA/vV8wGWwdMDeaGzArR9kwA3VW8AviVPAIuC4wOL4tMBjCbHAjxKtwDsVqcArEqXADgqhwIP9nMAZ7ZjAS9mUwIrCkMA4qYzAqo2IwC1whMACUYDAxWB4wAIdcMAT12fAQY9fwNBFV8D4+k7AOVu2wOR7ssB5k67A8aKqwDCrpsAMraLAQ6mewIWgmsBtk5bAh4KSwE1ujsAvV4rAiz2GwLYhgsD2B3zANslzwJuHa8CIQ2PAU/1awEe1UsCia0rAS8yzwPP1r8CYFazAQyyowOo6pMBxQqDAqEOcwFA/mMATNpTAjSiQwEUXjMC4AojAT+uDwNaif8C+anfA6S5vwNXvZsDyrV7AoWlWwDYjTsD62kXAEDKxwNplrcCljqnAg62lwHzDocCE0Z3AftiZwDrZlcB01JHA18qNwPy8icBsq4XAnpaBwPv9esDSyXLAZpFqwEdVYsD0FVrA2tNRwFqPScDGSEHAKouuwFDKqsBo/abAkiWjwOBDn8BYWZvA7WaXwIFtk8DjbY/AzmiLwOteh8DUUIPAG35+wCNUdsCSJG7AI/BlwHq3XcAme1XApTtNwGT5RMDBtDzAKtarwPMhqMCWYKTAOJOgwPa6nMDj2JjABe6UwE37kMCcAY3AwgGJwHj8hMBn8oDATch5wHqkccBDemnAfEphwN4VWcAN3VDAlqBIwPZgQMCaHjjAmBGpwFRrpcDLtqHAJPWdwIEnmsACT5bAuWySwKmBjsDFjorA7pSGwPGUgsASH33AvAp1wA3ubMARymTAt59cwNFvVMAZO0zAMAJEwKXFO8D0hTPA+TumwPikosCW/p7A8kmbwDGIl8B4upPA5OGPwIj/i8BnFIjAdSGEwJEngMAQT3jAK0RwwMMvaMAEE2DA+u5XwJTET8CklEfA4l8/wPImN8Bg6i7A31OjwGnNn8B+NpzAMZCYwKDblMDwGZHAR0yNwMJzicBykYXAXaaBwOpme8A0c3PAM3NrwFxoY8AAVFvATDdTwEwTS8Dv6ELABrk6wEqEMsBfSyrA8FegwDbjnMAKXZnAZcaVwFkgksAEbI7Ai6qKwBTdhsC8BIPAKkV+wElvdsC5iW7APJZmwG2WXsDDi1bAjndOwPxaRsAaNz7A1ww2wATdLcBdqCXA9EadwArlmcDOcJbAGOuSwOJUj8A9r4vASPuHwCc6hMD/bIDA3il5wBJmccCkkGnAfKthwFq4WcDcuFHAea5JwIKaQcAnfjnAdFoxwFowKcCsACHA5h+awLPRlsB2cJPA3vyPwMV3jMAi4ojABz2FwJCJgcDGkXvASvhzwOlIbMDJhWTA9LBcwFTMVMCs2UzAmdpEwJTQPMDwvDTA3aAswGl9JMCGUxzA+uGWwDGok8DWWpDAafqMwJmHicA+A4bATm6CwLGTfcD2LXbAt61uwDsVZ8DCZl/Ac6RXwFnQT8Bf7EfASvo/wLn7N8Am8i/A594nwCzDH8AFoBfAYIeTwL9nkMDzLo3Aj+KJwBODhsApEYPAURt/wAzzd8Chq3DASkdpwE/IYcD8MFrAj4NSwDDCSsDu7kLAtAs7wEkaM8BPHCvAQRMjwHUAG8Ag5RLAOcnUwBXS0MC418zAi9rIwOvaxMAs2cDAltW8wGnQuMDaybTAGsKwwFK5rMCor6jAOaWkwCGaoMB4jpzAUoKYwL91lMDQaJDAkVuMwA1OiMBOQITATF7SwIdozsBab8rANXPGwHt0wsCCc77AmHC6wP1rtsDuZbLAm16uwDJWqsDZTKbAsEKiwNQ3nsBeLJrAYyCWwPcTksAoB47ABPqJwJjshcDt3oHAkvHPwGf9y8ChBcjAswrEwAcNwMD5DLzA2Qq4wO0GtMB0AbDAo/qrwKryp8Cw6aPA2t+fwETVm8ALypfARb6TwAWyj8BcpYvAWZiHwAmLg8Ds+n7AuYLNwHGQycBQmsXA0aDBwGOkvcBppbnAN6S1wBqhscBSnK3AG5apwKaOpcAdhqHAqHydwGdymcB2Z5XA7VuRwOFPjcBmQ4nAijaFwFspgcDJN3rAZBHLwFIhx8AfLcPATzW/wFg6u8CiPLfAijyzwGA6r8BrNqvA6DCnwA8qo8ANIp/ACxmbwC0Pl8CQBJPAUfmOwITtisA+4YbAkNSCwBGPfcBodHXAKZ3IwK2vxMC9vcDA5se8wKfOuMBv0rTAotOwwJbSrMCZz6jA7MqkwMvEoMBnvZzA7rSYwIWrlMBNoZDAZJaMwOGKiMDbfoTAZHKAwBXLeMC8sHDAiyXGwBM7wsDIS77AQVi6wAZhtsCPZrLAR2muwI1pqsC0Z6bAA2SiwLtensATWJrAOlCWwFxHksCbPY7AGDOKwO0nhsAyHILA9h98wLMGdMC57GvA/anDwAjDv8DT1rvA/+W3wCDxs8C3+K/AOf2rwAz/p8CJ/qPAAfyfwLr3m8Du8ZfA1OqTwJnij8Bm2YvAW8+HwJjEg8Btcn/AmFp3wNdBb8BNKGfA3SnBwPtGvcBcXrnAsHC1wJJ+scCSiK3AK4+pwM+SpcDhk6HAtpKdwJyPmcDVipXAnISRwCJ9jcCVdInAGWuFwNFggcCxq3rAkZRywGt8asBmY2LAdaS+wEnGusDU4bbA0feywOoIr8C5FavAxh6nwIwko8B3J5/A5yebwDAml8CcIpPAax2PwNYWi8AND4fAOgaDwAb5fcAO5HXAw81twFW2ZcDtnV3A9hi8wDhAuMCTYLTA0HqwwKWPrMC6n6jApKukwOizoMD+uJzAULuYwDu7lMAPuZDAFrWMwI2viMCsqITAoKCAwCkvecBYG3HACgZpwHXvYMDH11jAfYa5wPmztcDe2bHAA/mtwC0SqsAQJqbATzWiwHxAnsAcSJrAokyWwHZOksDzTY7AaUuKwBxHhsBMQYLAVnR8wNNjdMBeUWzAOz1kwKYnXMDVEFTAC+y2wKMgs8DjTK/ArnGrwNiPp8AjqKPAQbufwNPJm8Bo1JfAgtuTwJTfj8AC4YvAJuCHwE7dg8B9sX/AZqV3wMCWb8DlhWfAI3NfwL5eV8DwSE/Ai0i0wDeFsMC2uKzA++OowOUHpcBHJaHA4TydwGJPmcBqXZXAhmeRwDZujcDrcYnACHOFwOVxgcCe3XrAE9RywJ/HasCouGLAh6dawIiUUsDuf0rA1ZqxwJ3grcBXHKrA/E6mwH15osC5nJ7Af7mawI/QlsCX4pLANPCOwPL5isBPAIfAuwODwDIJfsB+BnbA8v9twBT2ZcBX6V3AIdpVwMjITcCZtUXAquGuwKoxq8CqdqfAr7GjwLHjn8CfDZzAWDCYwKpMlMBTY5DA/3SMwEuCiMDDi4TA4pGAwC8qecCMK3HAhChpwLAhYcCSF1nAngpRwDj7SMC26UDAvxuswB13qMCCxqTA9gqhwHpFncAJd5nAj6CVwOvCkcDr3o3ASvWJwLYGhsDJE4LAGzp8wAFGdMAfTGzAN01kwPRJXMDrQlTAoDhMwIQrRMD7GzzAwkepwKyvpcCfCqLAoVmewLqdmsDs15bAMQmTwHUyj8CWVIvAYHCHwJCGg8CkL3/AgEl3wMhbb8B0Z2fAX21fwEpuV8Dgak/AtWNHwExZP8AWTDfAXmSmwALaosCyQZ/AbpybwD7rl8ApL5TAMmmQwFGajMBzw4jAdeWEwCQBgcB4LnrA0FBywIRqasCqfGLAN4hawAeOUsDajkrAW4tCwB2EOsCjeTLATHCjwM70n8BoapzAD9KYwMMslcCMe5HAcL+NwHL5icCMKobAqFOCwEnrfMCdInXAw05twBJxZcC+il3A3JxVwGKoTcArrkXA+K49wHKrNcAvpC3AVWqgwMf+nMBwg5nAMfmVwPtgksDPu47AtQqLwLROh8DPiIPA+3N/wFnGd8B0CnDA5EFowCRuYMCIkFjAR6pQwHS8SMAHyEDA2804wLHOMMAzyyjAZVGdwLv2mcCEi5bAgRCTwJCGj8Cj7ovAu0mIwN+YhMAX3YDAyC56wICRcsAw5GrAkihjwEJgW8C4jFPATa9LwDXJQ8CG2zvAOOczwCftK8AT7iPAkiSawJrblsB0gZPAvRaQwDOcjMC0EonAMXuFwKzWgcBVTHzAaNV0wJdKbcDUrWXA+gBewMVFVsDSfU7AmqpGwHXNPsCb5zbAI/ouwAMGJ8AaDB/AJ+OWwH+sk8A1ZJDAuAqNwKKgicCyJobAxJ2CwJINfsCCxXbAZGVvwEnvZ8A0ZWDAG8lYwNkcUcArYknArppBwN7HOcAV6zHAiwUqwFgYIsB1JBrAYIeTwL1okMDnMo3AauuJwLWShsBfKYPAS2B/wMdPeMASI3HAK9xpwB59YsD6B1vAx35TwHfjS8DpN0TA2308wOy2NMCZ5CzAPgglwBMjHcAzNhXAdofWwPGp0sBSyc7AAebKwFcAx8CjGMPAKy+/wCxEu8DaV7fAZGqzwPJ7r8CmjKvAn5ynwPero8DDup/AGcmbwAfXl8Cd5JPA5/GPwPD+i8DBC4jARQHUwOgk0MBLRczA2GLIwO99xMDhlsDA+K28wHTDuMCL17TAcOqwwEv8rMBBDanAcx2lwPssocDwO53AaUqZwHVYlcAkZpHAhHONwJ+AicCAjYXAhnnRwIaezcAawMnAr97FwKr6wcBiFL7AIyy6wDFCtsDGVrLAFmquwE18qsCTjabAB56iwMmtnsDwvJrAksuWwMLZksCQ547ACfWKwDsCh8AuD4PA8O/OwI4Wy8CJOcfAV1nDwGF2v8ACkbvAjam3wEnAs8Bz1a/AQ+mrwOj7p8CMDaTAUR6gwFcunMC5PZjAjUyUwOdakMDaaIzAcnaIwL6DhMDHkIDAMGTMwLWMyMBZscTAmNLAwOLwvMCZDLnAEya1wJ09scB5U63A4WepwAl7pcAcjaHAQZ6dwJmumcBAvpXAUM2RwN7bjcD76YnAufeFwCQFgsCQJHzA5tXJwKcAxsA/J8LAM0q+wPdpusD2hrbAi6GywAm6rsC40KrA1eWmwJj5osAwDJ/Axx2bwIAul8B7PpPA0k2PwJxci8DtaofA13iDwM4Mf8BXJ3fAo0THwANyw8Dnmr/A27+7wF3ht8Df/7PAwxuwwGM1rMAKTajA/mKkwHl3oMCwipzAzpyYwPutlMBZvpDABM6MwBfdiMCm64TAxPmAwAIPesDXKXLA56/EwFfgwMDrC73AOTO5wMhWtcASd7HAgpStwHevqcBGyKXAON+hwI70ncCACJrAPxuWwPYsksDJPY7A2k2KwEJdhsAabILA7vR8wNMQdcADLG3AIhfCwCNLvsDaebrA6KO2wN/JssBB7K7AgwurwAsop8A3QqPAVVqfwK5wm8B/hZfA/ZiTwFerj8C3vIvAP82HwA7dg8B82H/AyvV3wC8ScMDLLWjArnm/wNKxu8Aw5LfAdRG0wDw6sMATX6zAeICowNuepMCiuqDAI9ScwK7rmMCGAZXA5xWRwAQpjcAKO4nAIEyFwGlcgcAC2HrAAvZywP4Sa8AbL2PA09a8wL4TucBYSrXAWXuxwGmnrcAfz6nABfOlwJYTosBBMZ7AZUyawFlllsBpfJLA1ZGOwNmlisCkuIbAZMqCwHu2fcCi1nXAdvVtwCYTZsDeL17Awi26wCtwtsCpq7LA/uCuwN4Qq8DtO6fAwWKjwOCFn8DDpZvA1MKXwHLdk8Dy9Y/AmwyMwK8hiMBkNYTA7UeAwOSyeMAx1HDAAfRowIgSYcD2L1nAmH23wErGs8BmB7DAuEGswAN2qMD2pKTAM8+gwE71nMDKF5nAHjeVwLFTkcDibY3AAYaJwFechcAhsYHAL4l7wNKtc8B80GvAdvFjwP0QXMBFL1TAXcW0wDQVscC6XK3AyJypwCrWpcCdCaLA0TeewGVhmsDrhpbA46iSwMPHjsDx44rAyf2GwJsVg8BZV37AeIB2wP2mbsBGy2bAou1ewFgOV8CkLU/ABgSywO9brsC/qqrAWfGmwJEwo8A0aZ/A/ZubwJrJl8Co8pPAtxeQwEc5jMDLV4jAqXOEwDqNgMCcSXnAU3VxwBSeacBHxGHASOhZwGYKUsDmKkrAdjivwG6Zq8B58KfAfz6kwGKEoMD2wpzABvuYwEwtlcB0WpHAG4ONwM+nicAOyYXAS+eBwNQFfMCJOHTAUWdswLWSZMAsu1zAH+FUwOcETcDVJkXAiGGswJPMqMDXLKXAPoOhwK/QncALFprAJ1SWwMqLksCuvY7AgOqKwNoSh8BKN4PAmrB+wKrsdsCLI2/A7VVnwG2EX8CRr1fA0ddPwJP9R8AxIUDADH6pwDf0pcC8XqLAhL6ewHoUm8CEYZfAg6aTwErkj8CiG4zAQ02IwNh5hMD9oYDAeYx5wCvOccDwCWrAj0BiwLdyWsAEoVLA+8tKwBL0QsCyGTvA1oymwCwPo8D/hJ/AMu+bwK5OmMBfpJTAK/GQwPE1jcCFc4nArqqFwCXcgcAqEXzAMGF0wHOpbMDw6mTAhSZdwPpcVcD8jk3AJ71FwADoPcD+DzbAwoyjwEUcoMBxnpzAHhSZwC1+lcCJ3ZHAGzOOwMt/isB4xIbA9AGDwBByfsDY1HbAlC1vwHp9Z8CgxV/AAgdYwIBCUMDeeEjAzapAwObYOMCvAzHAv3ygwGAancDoqZnAGSyWwMuhksDeC4/APmuLwNTAh8CHDYTANVKAwGYfecCPjXHAV/BpwBNJYsD3mFrAG+FSwHoiS8DzXUPATpQ7wDnGM8BN9CvA2FudwHAImsBDppbA+zWTwFq4j8A1LozAcJiIwPT3hMCrTYHA9jR7wIa+c8CwOWzAAKhkwOsKXcDEY1XAwLNNwPn7RcBqPT7A8ng2wFivLsBN4SbAPimawILllsB2kpPAozCQwLDAjMBgQ4nAh7mFwAgkgsCYB33AebN1wIJNbsBw12bA7FJfwIbBV8CxJFDAwX1IwO7NQMBQFjnA5FcxwIqTKcAKyiHAU+SWwM6wk8CVbZDAChuNwLK5icA1SobAVM2CwMeHfsCKXXfAwh1wwETKaMDeZGHATu9ZwD5rUsA+2krAwj1DwCGXO8CS5zPALzAswPZxJMDIrRzAYIeTwLtpkMDcNo3ARvSJwFqihsCbQYPAYaV/wLOseMDTmnHAhHFqwJgyY8Dh31vAL3tUwEEGTcDBgkXAQfI9wDZWNsD3ry7AvgAnwKdJH8CuixfAkkjYwNaE1MAhvtDA0/TMwEIpycC7W8XAgIzBwMy7vcDS6bnAvha2wLdCssDfba7AUZiqwCjCpsB666LAWBSfwNM8m8D5ZJfA1oyTwHS0j8Dc24vA86bVwCzk0cBKHs7As1XKwMCKxsDBvcLA++6+wKweu8AHTbfAPXqzwHSmr8DQ0avAcPynwG4mpMDgT6DA2XicwGyhmMCmyZTAlPGQwEAZjcC0QInAAgTTwF1Cz8B4fcvAvLXHwIbrw8AqH8DA8FC8wBiBuMDar7TAaN2wwOoJrcCGNanAXGClwIiKocAhtJ3APN2ZwOsFlsA9LpLAP1aOwPx9isB/pYbAgV/QwDWfzMB828jAxBTFwHBLwcDWf73ARLK5wPzitcA5ErLAL0CuwAttqsD0mKbAC8SiwG7unsA3GJvAekGXwEpqk8C5ko/A07qLwKXih8A5CoTAJbnNwHL6ycAeOMbAnXLCwFWqvsCj37rA2BK3wDtEs8ALdK/AgKKrwMfPp8AM/KPAcSegwBdSnMAXfJjAi6WUwITOkMAV94zATR+JwDhHhcDhboHAmxDLwMxTx8Aek8PADM+/wAMIvMBlPrjAh3K0wLeksMA31azAQgSpwAoypcC8XqHAf4qdwHW1mcC535XAZgmSwJAyjsBLW4rApoOGwK6rgsDipn3AgGXIwOuqxMAw7MDA0Sm9wEFkucDqm7XAKNGxwEsErsCcNarAWmWmwLyTosDywJ7AJe2awHoYl8AQQ5PAAW2PwGaWi8BTv4fA2OeDwAQQgMDKb3jAY7fFwGv/wcD7Qr7AnYK6wMy+tsD597LAhi6vwMpiq8AUlafAqMWjwMH0n8CUIpzATU+YwBR7lMALppDAUNCMwPv5iMAjI4XA20uBwGXoesBvOHPAxgXDwNtQv8Abl7vAGNm3wFYXtMBMUrDAZoqswAHAqMBz86TABSWhwPlUncCGg5nA37CVwC/dkcCbCI7AQjOKwEJdhsCyhoLATV99wGOwdcDEAG7AFVDAwLmevMAc6LjA3Cy1wIRtscCVqq3Ag+SpwLQbpsCFUKLARYOewDy0msCo45bAvxGTwLI+j8CpaovAx5WHwCvAg8Di03/AXCZ4wO53cMC5yGjArZW9wG/oucB6NbbAcX2ywO3ArsB3AKvAjDynwJx1o8ALrJ/AMeCbwFsSmMDQQpTAy3GQwH+fjMAczIjAyPeEwKUigcCimXrAy+xywPE+a8A5kGPA2NW6wFott8CefrPAVMqvwBsRrMCJU6jAJZKkwGjNoMC/BZ3AizuZwCNvlcDRoJHA2dCNwHX/icDXLIbAK1mCwDEJfcB/XnXAebJtwFAFZsAvV17AzQ+4wMBstMDiwrDA6xKtwIZdqcBSo6XA4uShwLkinsBOXZrADJWWwFLKksB0/Y7Auy6LwGleh8C2jIPAqHN/wNnLd8BMInDAP3dowOvKYMB+HVnAsEK1wNalscCLAa7AjVaqwJSlpsBJ76LASTSfwCJ1m8BYspfAX+yTwKAjkMB4WIzAOouIwC28hMCR64DAOzN6wAaNcsDV5GrA8jpjwJyPW8AG41PAl22ywMDXrsDLOavAf5SnwJroo8DSNqDAzn+cwCjEmMBvBJXAJEGRwLh6jcCVsYnAFOaFwIcYgsBsknzAvfB0wG5MbcDdpWXAXf1dwDRTVsChp07AiI+vwJABrMDEaqjA8MukwNolocBAeZ3A1MaZwD4PlsAWU5LA6pKOwDjPisByCIfA/j6DwG/mfsDaSnfAy6tvwLwJaMAZZWDAP75YwH8VUcAfa0nAf6eswEwiqcCIk6XAAfyhwINcnsDStZrArQiXwMVVk8C/nY/AM+GLwK4giMCtXITAoZWAwOCXecDl/3HA8GNqwI3EYsA0IlvAUH1TwD3WS8BLLUTAc7SpwO84psAbs6LAwiOfwLKLm8C465fAl0SUwAyXkMDI44zAbyuJwJtuhcDUrYHAMtN7wLJEdMD0sGzApxhlwGt8XcDH3FXANjpOwCGVRsDj7T7AXrWmwHJEo8B3yJ/ANUKcwHeymMAMGpXAvXmRwFDSjcB/JIrA/XCGwGy4gsDJ9n3A4XR2wBrsbsBSXWfAU8lfwM0wWMBdlFDAjfRIwNRRQcCbrDnAQamjwMxDoMCV0pzAVlaZwNTPlcDcP5LAO6eOwLoGi8AgX4fAJrGDwP36f8CYiXjATA9xwCyNacAyBGLAPXVawBXhUsBrSEvA2qtDwOwLPMAZaTTALI+gwAI2ncBv0JnAHF+WwMTiksAqXI/AHMyLwGYziMDSkoTAJuuAwDh6esDJEnPAR6FrwOAmZMCopFzAlhtVwIyMTcBQ+EXAk18+wPHCNsD0Ii/AS2adwCcamsAKwZbAg1uTwD3qj8DvbYzAYeeIwFxXhcCuvoHARTx8wPjsdMDukG3AhilmwAq4XsCmPVfAb7tPwF4ySMBSo0DAFA85wFR2McCv2SnA6y2awGvvlsB7o5PAkUqQwDzljMAkdInAA/iFwJ1xgsB8w33AZZJ2wIlRb8ByAmjAlqZgwFc/WcD9zVHAt1NKwJnRQsCcSDvAobkzwHElLMC8jCTAf+WWwB21k8D3dpDAXyuNwMnSicDGbYbA/PyCwEYCf8AA9nfAvNZwwBWmacCdZWLA4BZbwFO7U8BaVEzAPONEwCppPcA55zXAY14uwInPJsB0Ox/AYIeTwLlqkMDROo3AI/2JwAGyhsDeWYPAkep/wMsJecDbEnLASQdrwKroY8CYuFzAqHhVwGQqTsBDz0bAqGg/wN73N8AUfjDAYfwowMFzIcAV5RnAIQzawFVi1sCstdLAggbPwCpVy8DtocfACu3DwLo2wMAuf7zAkca4wAcNtcCyUrHArZetwBLcqcD0H6bAZmOiwHemnsA26ZrArSuXwOhtk8Dur4/A8k7XwOil08Dm+c/ATkvMwHSayMCi58TAHDPBwBt9vcDTxbnAbw22wBdUssDrma7ACt+qwIwjp8CHZ6PAD6ufwDLum8AAMZjAhHOUwMq1kMDY94zAq5DUwIno0MBSPc3AaY/JwCbfxcDXLMLAwXi+wB/DusApDLfAC1SzwO6ar8D14KvAPiaowORqpMD+rqDAn/KcwNk1mcC5eJXATbuRwJ/9jcC5P4rAF9HRwAwqzsDHf8rAsdLGwCQjw8Bxcb/A4b27wLQIuMAgUrTAVpqwwIDhrMDEJ6nAQW2lwBSyocBS9p3AEzqawGd9lsBewJLABAOPwGZFi8COh4fA9w/PwDhqy8AWwcfA/BTEwElmwMBStbzAZQK5wMJNtcCll7HAQOCtwMEnqsBPbqbACrSiwBH5nsB9PZvAY4GXwNfEk8DpB5DApkqMwByNiMBTz4TAAk3MwM+oyMAHAcXAGlbBwGuovcBX+LnAK0a2wC+SssCg3K7AtiWrwJ9tp8CFtKPAjPqfwNM/nMB1hJjAiciUwCQMkcBWT43AL5KJwLzUhcAHF4LA5IfJwIflxcBZP8LA0pW+wFvpusBTOrfAD4mzwNvVr8D4IKzAoGqowAazpMBX+qDAuECdwEyGmcAwy5XAew+SwEVTjsCflorAmdmGwEIcg8BJvX7APMDGwAggw8DAe7/A4tO7wNwouMAVe7TA58qwwKEYrcCLZKnA466lwN/3ocCwP57Af4aawG/MlsChEZPAL1aPwDGai8C73YfA3iCEwKhjgMBQTHnAmvXDwPBXwMDmtbzA/Q+5wK1mtcBjurHAfguuwFRaqsAzp6bAXfKiwA08n8B4hJvAycuXwCoSlMC6V5DAmZyMwN/giMCiJIXA9meBwNNVe8AX23PAgSfBwNCMvcBl7bnAykm2wH+issD3967AmUqrwMKap8DE6KPA6TSgwHB/nMCSyJjAgRCVwGdXkcBpnY3AqOKJwEAnhsBJa4LArl19wPnjdcCRaW7AY1W+wCa+usDLIbfA5ICzwPnbr8CDM6zA84eowKzZpMAJKaHAV3adwN/BmcDdC5bAiFSSwA6cjsCZ4orATCiHwEdtg8BFY3/A7+p3wLFxcMCu92jAo367wGTrt8CXUrTA17SwwLISrcCrbKnAO8OlwM0WosDEZ57AdLaawC0Dl8AxTpPAu5ePwAHgi8AwJ4jAbm2EwN+ygMA/73nAkndywOX+asBbhWPAkqK4wOoTtcA4f7HAH+WtwDVGqsAHo6bAFfyiwNRRn8CtpJvAAfWXwCNDlMBej5DA9NmMwB4jicAQa4XA9bGBwOfve8BZenTAeQNtwHiLZcCBEl7AdMC1wAg3ssANp67AKhGrwP91p8Af1qPAFjKgwGGKnMBz35jAtTGVwIKBkcAuz43AARuKwDxlhsAWroLAhet9wNV4dsBoBG/AfY5nwEwXYMAFn1jAfNeywABUr8BkyavAVTiowHmhpMBuBaHAxmSdwArAmcC2F5bAPGySwAG+jsBgDYvAq1qHwCmmg8Ay4H/AZHF4wEoAccA2jWnAcRhiwDqiWsDHKlPA1eavwAVqrMB95ajA7VmlwADIocBdMJ7AnpOawFXylsAKTZPANqSPwEr4i8CrSYjAsZiEwK7lgMDOYXrANPVywP2Fa8CFFGTAH6FcwBMsVcCetU3Anu2swD94qcCK+qXAMHWiwODonsBGVpvABb6XwLkglMDyfpDANdmMwP0vicC3g4XAyNSBwBFHfMCN4HTAknZtwJgJZsALml7ASShXwKK0T8BcP0jA9OqpwM59psCyB6PAT4mfwFUDnMBzdpjAVeOUwJxKkcDkrI3AvAqKwKlkhsAju4LAMB1+wNi+dsDrW2/AB/VnwLaKYMBxHVnAoq1RwKU7SsDLx0LA9d2mwNB5o8AWDKDAcJWcwI4WmcAgkJXA1QKSwFZvjsBG1orAPziHwNCVg8D63n/AfIt4wAAyccBM02nAD3BiwOMIW8BRnlPA0zBMwNLARMCpTj3Ax8WjwGFroMDRBp3AtJiZwLIhlsB8opLAwBuPwC2Oi8Bt+ofAImGEwObCgMCMQHrAjvNywMGfa8D+RWTACudcwJODVcA0HE7AdbFGwM5DP8Co0zfAnaGgwKtRncAE95nANpKWwOAjk8CrrI/AQy2MwFumiMCfGIXAuYSBwJjWe8DfmXTAZVRtwDIHZsA0s17ARllXwCr6T8COlkjADi9BwDHEOcBvVjLAwHCdwOIrmsDX25bAGIGTwDYckMDMrYzAhDaJwAy3hcATMILAkUR9wKocdsC06W7A4qxnwFBnYMAFGlnA8sVRwO9rSsC/DEPAEak7wIBBNMCT1izAmDKawFX5lsCDtJPAhWSQwNMJjcD+pInAoTaGwGW/gsDtf37AD3J3wIlWcMCuLmnAwvthwPi+WsBreVPAJCxMwBHYRMAOfj3A3R42wC27LsCYUyfArOaWwGy5k8BZgJDAtjuNwObricBikYbAtyyDwAV9f8DYjnjAQZBxwKCCasBRZ2PApj9cwOUMVcA/0E3A0YpGwKQ9P8Cn6TfAtY8wwJIwKcDtzCHAYIeTwLdrkMDGPo3AAAaKwKvBhsAncoPA6xeAwApnecAii3LAbJ1rwEOfZMAFkl3AEHdWwLZPT8A7HUjA0uBAwJqbOcCaTjLAxPoqwPSgI8DsQRzAutHbwP5B2MCAr9TAlxrRwJKDzcC36snAQlDGwGu0wsBfF7/ASXm7wE3at8CJOrTAGpqwwBf5rMCTV6nAorWlwFITosCwcJ7Ayc2awKUql8BNh5PA3/jYwLNp1cCz19HAN0POwJGsysAHFMfA2XnDwD3ev8BlQbzAeqO4wKMEtcD+ZLHAqsStwL0jqsBMgqbAa+CiwCg+n8CSm5vAtPiXwJhVlMBHspDAJB/WwKmQ0sBB/87AS2vLwBjVx8DyPMTAGKPAwMYHvcAsa7nAd821wMwussBOj67AGu+qwEhOp8DvrKPAIQugwO9onMBmxpjAlCOVwIKAkcA53Y3AX0TTwLi2z8ALJszAtpLIwA/9xMBhZcHA8Mu9wPYwusColLbANPeywMBYr8BxuavAZRmowLR4pMB316DAwTWdwKOTmcAr8ZXAZ06SwGCrjsAhCIvAWWjQwLPbzMDnS8nAVrnFwFgkwsA9jb7ASfS6wLxZt8DKvbPApCCwwHSCrMBe46jAgUOlwPmiocDfAZ7ARmCawEC+lsDdG5PAKnmPwDLWi8D/MojA14rNwGb/ycCocMbAAt/CwNFKv8BmtLvACxy4wACCtMB+5rDAuEmtwNmrqcAIDabAZm2iwBDNnsAfLJvAqYqXwMHok8B3RpDA2aOMwPMAicDPXYXAk6vKwJIhx8AYlMPAjQPAwFFwvMC72rjAF0O1wKmpscCvDq7AXHKqwN/UpsBiNqPAB5efwO32m8AvVpjA5LSUwCETkcD1cI3Acc6JwKArhsCOiILAOsrHwPBBxMD3tcDAvSa9wKeUucAQALbASGmywJjQrsBANqvAeZqnwHP9o8BbX6DAVsCcwIUgmcAFgJXA796RwFc9jsBRm4rA6/iGwDVWg8BxZn/AcObEwCxgwcD81b3AU0i6wJy3tsA1JLPAdY6vwKj2q8AUXajA9MGkwH4locDgh53AQ+mZwMpJlsCVqZLAvgiPwFtni8CCxYfAQyOEwKyAgMCWu3nAy//BwOh7vsDT87rABWi3wO3Ys8DxRrDAa7KswK4bqcAEg6XAreihwONMnsDZr5rAuRGXwKtyk8DQ0o/ARTKMwCSRiMCB74TAcE2BwP9Ve8B+EHTA1BW/wLqUu8AdD7jAfoW0wFD4sMABaK3A8dSpwHg/psDlp6LAfw6fwINzm8Ap15fAoDmUwBObkMCl+4zAdluJwKO6hcBCGYLA0e58wFCqdcAdZW7ACCi8wCiquMBtJ7XAW6CxwG8VrsAZh6rAwvWmwMlho8CDy5/APDOcwDeZmMCw/ZTA3GCRwOnCjcD+I4rAP4SGwMrjgsBzhX7AR0J3wDf+b8BluWjA0zW5wKy7tcBIPLLAMLiuwOUvq8Dho6fAkhSkwF+CoMCi7ZzAsFaZwNG9lcBHI5LAS4eOwBHqisDES4fAi6yDwIgMgMCv13jAJpVxwJ9RasBBDWPAlz62wLTIssAnTa/AgMyrwERHqMD0vaTABzGhwOmgncD+DZrAn3iWwB3hksC/R4/AxayLwGgQiMDYcoTAQNSAwItpesATKXPATudrwG6kZMCcYF3AqUGzwJ/Qr8B2WazAwtyowA9bpcDj1KHAvEqewA69msBFLJfAwpiTwNwCkMDjaozAHNGIwMY1hcAYmYHAgfZ7wNW4dMBzeW3AmzhmwIT2XsBbs1fAVT6wwMDSrMCTYKnAYeilwLxqosAv6J7AP2GbwGjWl8AdSJTAyLaQwMgijcB0jInAGfSFwP1ZgsC2fH3A1EJ2wLAGb8CdyGfA4YhgwLpHWcBeBVLA4DOtwGTOqcDRYabAuu6iwLN1n8BM95vAEHSYwIPslMAeYZHAVdKNwI9AisAqrIbAfRWDwKf5fsDixHfAI41wwNRSacBRFmLA6tdawOWXU8B+VkzAiyGqwM/CpsB7XKPAIO+fwFF7nMCjAZnApIKVwN7+kcDUdo7AAOuKwNJbh8CzyYPA/zSAwBU8ecBECnLAENVqwO+cY8BJYlzAeSVVwM/mTcCOpkbAmQanwEOvo8DVT6DA2+icwOd6mcCNBpbAX4ySwOsMj8C8iIvAUwCIwCl0hMCu5IDAk6R6wLB6c8BaTGzAJxplwJzkXcAurFbAQ3FPwDc0SMBY9UDAU+KjwAKToMAhO53AMduZwL9zlsBcBZPAnJCPwBAWjMBIlojAyxGFwByJgcBl+XvA/dl0wM20bcCOimbA5VtfwGkpWMCc81DA87pJwNV/QsCaQjvAELSgwFltncCjHZrAY8WWwBxlk8BZ/Y/Aq46MwKUZicDanoXA2B6CwEw0fcCNInbAYwlvwKzpZ8A0xGDAs5lZwNBqUsAfOEvAIgJEwE/JPMALjjXANnudwKA9msCq9pbAuKaTwEFOkMDH7YzA1IWJwPoWhsDMoYLAt01+wG1Nd8DKQ3DA0TFpwHEYYsCI+FrA49JTwDmoTMAweUXAXEY+wEAQN8BQ1y/ARTeawD8Dl8CNxZPAfn6QwHUujcDp1YnAW3WGwFcNg8DYPH/AXFJ4wF5cccD3W2rAOlJjwCZAXMCuJlXArgZOwPLgRsAztj/AFoc4wC9UMcACHirA2OeWwLy9k8C7iZDAEEyNwAgFisAItYbAhFyDwPz3f8ACKHnAO0pywMtfa8DVaWTAdmldwL1fVsCtTU/ANTRIwDUUQcB37jnAtcMywJSUK8CoYSTAYIeTwLVskMC7Qo3A3w6KwFfRhsB0ioPAlzqAwGrEecCfA3PA4DNswE5WZcAPbF7ARXZXwAx2UMB0bEnAf1pCwB9BO8AyITTAg/sswM3QJcC1oR7A8pjdwGIj2sAoq9bAmDDTwP2zz8CZNczAprXIwFg0xcDdscHAXS6+wPqpusDUJLfABJ+zwKIYsMDCkazAdQqpwMqCpcDO+qHAjHKewA7qmsBcYZfAV6TawCYv18BBt9PA/DzQwKHAzMB1QsnAssLFwI5BwsA3v77A1Tu7wIy3t8B8MrTAv6ywwG0mrcCan6nAWBimwLaQosDCCJ/Ah4CbwA/4l8Bib5TAEq/XwFo61MDewtDA9UjNwOvMycAET8bAfc/CwI1Ov8BizLvAJkm4wP7EtMAJQLHAY7qtwCQ0qsBirabALSajwJeen8CtFpzAeo6YwAkGlcBifZHAA7nUwN5E0cDlzc3AblTKwMfYxsA2W8PA+tu/wElbvMBV2bjASFa1wEfSscB0Ta7A6seqwMRBp8AVu6PA8jOgwGusnMCNJJnAZJyVwPsTksBbi47A/sHRwJBOzsA32MrATF/HwB/kw8D4ZsDAF+i8wLRnucAD5rXAL2OywF/frsC1WqvAT9WnwEZPpMCxyKDAo0GdwC26mcBeMpbAQaqSwOMhj8BMmYvA1MnOwERXy8Cu4cfAbmnEwNbuwMAwcr3Av/O5wL1ztsBe8rLA0G+vwDzsq8DFZ6jAiuKkwKVcocAv1p3AO0+awNvHlsAeQJPAEbiPwL8vjMAzp4jATdDLwMleyMAg6sTAsHLBwM34vcDEfLrA2/62wE1/s8BT/q/AG3yswND4qMCXdKXAke+hwNlpnsCI45rAtFyXwG/Vk8DITZDAzsWMwIw9icANtYXAJ9XIwOZkxcBa8cHA5Hq+wNwBu8CShrfATQm0wE6KsMDNCa3A/oepwAwFpsAfgaLAWvyewNh2m8C28JfACWqUwOTikMBZW43AdtOJwEdLhsDYwoLAF9jFwFhpwsAi977A2YG7wNgJuMBzj7TA9RKxwKGUrcC1FKrAZJOmwN8Qo8BOjZ/A1gicwJiDmMCu/ZTAMHeRwDPwjcDKaIrAA+GGwO1Yg8AjoX/AytjCwNRrv8A0+7vAUYe4wIsQtcA5l7HAqhuuwCWeqsDqHqfAM56jwDEcoMAQmZzA+BSZwAqQlcBkCpLAIISOwFX9isAUdofAcO6DwHZmgMBnvHnA3ta/wANsvMBD/bjACou1wLoVssCvna7APiOrwLGmp8BMKKTATaigwOgmncBPpJnAqiCWwB6cksDMFo/AzpCLwD4KiMAwg4TAtvuAwL/nesB113PA6tG8wIVpucD4/LXAs4yywB0Zr8CYoqvAeimowBSupMCwMKHAjrGdwOcwmsDxrpbA1yuTwMGnj8DTIozAK52IwOMWhcASkIHAlxF8wEECdcA/8m3AeMm5wO1jtsDw+bLA9YuvwGcarMCspajAIC6lwBq0ocDmN57AzLmawAk6l8DWuJPAYzaQwN2yjMBoLonAJ6mFwDcjgsBfOX3ATit2wGEcb8C4DGjACL22wMVas8C/86/AbYiswD4ZqcCcpqXA6TCiwIG4nsC3PZvA18CXwCNClMDZwZDAL0CNwFS9icByOYbArrSCwE5efsDyUXfAeERwwAs2acDNJmLAEKyzwItNsMDs6azAq4GpwDwVpsAMpaLAgzGfwAO7m8DjQZjAdsaUwARJkcDRyY3AFkmKwAjHhsDWQ4PATn9/wD91eMC7aXHA+VxqwCZPY8BqQFzA/5WwwLY7rcD226nAOHemwPMNo8CXoJ/Aky+cwEu7mMAfRJXAaMqRwHNOjsCJ0IrA61CHwNPPg8ByTYDA7pN5wBGLcsCRgGvAq3RkwJNnXcB1WVbAPXqtwLMkqsBRyabAkWijwOgCoMDNmJzAsCqZwP64lcAaRJLAYsyOwC1Si8DJ1YfAfVeEwIfXgMBCrHrA+aZzwIqfbMBDlmXAZ4tewC9/V8DPcVDAM1iqwOsHp8BssaPAKFWgwJnznMAzjZnAayKWwLOzksBzQY/AEcyLwOhTiMBN2YTAj1yBwOS7e8Bru3TAIbhtwGiyZsCXql/A+aBYwNCVUcBWiUrARi+nwMfko8Cvk6DAbTydwHffmcBDfZbASBaTwPiqj8DEO4zAFMmIwE1ThcDK2oHAvb98wLDFdcD2x27ACsdnwFrDYMBHvVnAJ7VSwEOrS8Dcn0TA5f6jwK26oMCBb53AyB2awPLFlsByaJPAwAWQwFGejMCYMonAA8OFwP5PgsDQs33APcJ2wOjLb8Bq0WjAS9NhwAXSWsAFzlPAq8dMwEu/RcAvtT7AhsagwA2JncBNRJrAofiWwHGmk8AsTpDAR/CMwDeNicBxJYbAarmCwB2TfsCPrHfA779wwPLNacA+12LAadxbwP3dVMBy3E3ANdhGwKTRP8ATyTjArIWdwF9PmsCBEZfAYcyTwFyAkMDaLY3ASNWJwBx3hsDKE4PAkld/wBV/eMD5nnHAD7hqwBzLY8DS2FzA2eFVwMfmTsAi6EfAZeZAwPrhOcBA2zLA8juawCsNl8CZ1pPAe5iQwCBTjcDkBorALbSGwGxbg8An+n/AMzN5wORicsAhimvAxalkwKHCXcB21VbA++JPwNTrSMCY8EHAzfE6wO3vM8Bi6yzABOmWwAvCk8Afk5DAa1yNwC4eisC22IbAX4yDwJE5gMBywXnAlwRzwHs9bMAIbWXAIpRewKazV8BizFDAG99JwITsQsBE9TvA7/k0wA77LcAZ+SbAYIeTwLNtkMCwRo3AvReKwAXhhsDFooPAS12AwOYhesBHfHPAl8pswLoNZsCbRl/AJXZYwDudUcC5vErAcNVDwCHoPMCD9TXAOv4uwN0CKMDzAyHAYmHfwBMG3MAzqNjAEUjVwPHl0cAVgs7AsxzLwP61x8AhTsTAQ+XAwIV7vcAFEbrA3qW2wCU6s8Dvza/ATGGswEv0qMD6hqXAYhmiwI6rnsCGPZvA91DcwNn12MAlmNXAKjjSwC/WzsBycsvALA3IwI+mxMDHPsHA+9W9wE1susDbAbfAv5azwBArsMDivqzARlKpwEvlpcD+d6LAawqfwJqcm8CVLpjAGkDZwDzl1cDCh9LA/CfPwC7Gy8CaYsjAeP3EwPqWwcBNL77AmMa6wP5ct8Cd8rPAj4ewwO0brcDJr6nANkOmwEPWosD8aJ/AbvubwKKNmMCgH5XAry7WwCXU0sD3ds/AcxfMwOK1yMCCUsXAje3BwDeHvsCsH7vAFLe3wJNNtMBI47DATXitwLoMqsCjoKbAGzSjwDHHn8DyWZzAauyYwKR+lcCnEJLAmRzTwHrCz8CsZczAfgbJwDilxcAaQsLAX92+wDp3u8DaD7jAaKe0wAY+scDW063A8miqwHL9psBskaPA8iSgwBO4nMDeSpnAX92VwJ9vksCoAY/AswnQwBywzMDHU8nABPXFwByUwsBRMb/A3sy7wPhmuMDN/7TAiZexwE8ursBAxKrAeVmnwBHuo8AggqDAtxWdwOeomcC+O5bASc6SwJJgj8Ci8ovA1PXMwOacycAnQcbA6uLCwHeCv8ATILzA+bu4wGBWtcB477HAbYeuwGQeq8B/tKfA20mkwJLeoMC6cp3AZwaawKmZlsCPLJPAJ7+PwHtRjMCU44jAzODJwKyIxsCnLcPADtC/wCxwvMBGDrnAmqq1wGFFssDM3q7AB3erwDsOqMCJpKTAETqhwO3OncA1Y5rA/PaWwFWKk8BOHZDA9q+MwFZCicB71IXAYcrGwD9zw8AbGcDASry8wBlducDO+7XAqZiywOQzr8C0zavAR2aowMX9pMBTlKHAESqewBu/msCJU5fAceeTwOZ6kMD2DY3AsaCJwCMzhsBUxYLAVbLDwGNcwMBRA73Acqe5wBdJtsCI6LLAB4avwNEhrMAcvKjAGVWlwPLsocDOg57AzhmbwBGvl8CvQ5TAv9eQwFZrjcCD/onAVpGGwNsjg8A9bH/AX5jAwNpDvcAO7LnAU5G2wPkzs8BM1K/AknKswAkPqcDpqaXAZ0OiwK/bnsDqcpvAOwmYwMOelMCbM5HA3ceNwJ1bisDu7obA34GDwH0UgMCpTXnAMHy9wFkpusAR07bAsHmzwIodsMDtvqzAIV6pwGj7pcD9lqLAFjGfwOXJm8CTYZjAR/iUwCKOkcBCI47AwbeKwLRLh8Aw34PARXKAwAMKesDlLnPAbV26wJAMt8AQuLPASWCwwJAFrcA2qKnAhkimwMXmosAzg5/ACB6cwHm3mMCyT5XA3eaRwB99jsCVEovAXaeHwI87hMA/z4DAAcV6wMXqc8DnD23Atzu3wCTts8C5mrDA0UStwMbrqcDpj6bAijGjwPHQn8BhbpzAFwqZwEqklcArPZLA59SOwKNri8CDAYjApJaEwCIrgcAkfnvAE6V0wDLLbcCg8GbApRa0wLTKsMCxeq3A9yaqwODPpsDCdaPA8BigwLW5nMBYWJnAGfWVwDWQksDfKY/AR8KLwJdZiMD274TAhIWBwLo0fMA2XXXAqYRuwDerZ8AD0WDAye2wwNikrcCWV6rAXganwIuxo8B2WaDAc/6cwNOgmcDfQJbA3t6SwA17j8CmFYzA3a6IwN9GhcDW3YHAzOd8wF0SdsCWO2/AqGNowL2KYcD7sFrAssCtwCF7qsD+MKfAo+KjwGqQoMCuOp3AxuGZwAWGlsC5J5PALMePwKFkjMBWAInAg5qFwFozgsAPln3AZ8N2wALvb8AfGWnA8kFiwKtpW8BykFTA6Y6qwB1Np8B8BqTAXrugwBtsncAPGZrAk8KWwPxok8CeDJDAxK2MwLlMicC86YXADIWCwL89fsDNbnfAnJ1wwHfKacCl9WLAYR9cwN9HVcBNb07A/FenwFkapMCe16DAH5CdwDNEmsA09JbAfKCTwGNJkMA/74zAYJKJwBMzhsCg0YLAjdx+wIgSeMCbRXHAJnZqwICkY8D10FzAyPtVwDQlT8BsTUjAexukwGDioMDvo53AdGCawEMYl8Czy5PAHnuQwNwmjcBFz4nArnSGwGgXg8B9b3/A76t4wKfkccAcGmvAt0xkwNh8XcDUqlbA9dZPwH4BScCpKkLA/digwMWkncD9aprA6yuXwNrnk8Adn5DADVKNwAEBisBSrIbAWFSDwNDyf8CgN3nAundywKeza8Do62TA8iBewC5TV8D6glDAqrBJwIjcQsDVBjzAI5CdwCBhmsBcLJfAEvKTwISykMAAbo3A2iSKwGfXhsAAhoPA/zCAwHKxecAH+3LAWj9swAJ/ZcCIul7AbfJXwCQnUcAVWUrAn4hDwBO2PMC84TXAn0CawBcXl8Cn55PAfLKQwNF3jcDqN4rAE/OGwJ6pg8DjW4DAdhR6wPlpc8D/uGzALQJmwCRGX8B3hVjAscBRwFD4SsDILETAgV49wNiNNsAfuy/AMeqWwFvGk8CDnJDAyGyNwFc3isBr/IbARryDwDZ3gMAZW3rAQr9zwJYbbcDGcGbAf79fwGcIWcAdTFLANYtLwDnGRMCn/T3A8jE3wIJjMMC0kinAYIeTwLFukMCmSo3AnSCKwLTwhsAZu4PABYCAwHh/esAU9XPAg2FtwHLFZsCQIWDAjnZZwBjFUsDVDUzAYlFFwFWQPsA2yzfAhAIxwLE2KsAmaCPAoCrhwKXp3cAwptrAimDXwPcY1MCwz9DA7YTNwNw4ysCo68bAdp3DwGZOwMCW/rzAHq65wBVdtsCPC7PAnLmvwEpnrMCnFKnAvcGlwJZuosA6G5/AX/7dwGW92sD0edfAVDTUwMfs0MCIo83AzFjKwMMMx8CVv8PAaXHAwF8ivcCU0rnAIYK2wBwxs8Ca36/AqY2swFo7qcC56KXA0ZWiwKxCn8BS75vA39HawO6Q18CITdTA9QfRwHTAzcBCd8rAkizHwJTgw8Bwk8DATUW9wEv2ucCHprbAG1azwBwFsMCes6zAsWGpwGYPpsDIvKLA4mmfwL8WnMBnw5jAD6XXwDJk1MDgINHAYtvNwPaTysDWSsfAOADEwEm0wMA0Z73AHhm6wCfKtsBterPACSqwwBHZrMCZh6nAszWmwGzjosDRkJ/A7z2cwM/qmMB5l5XA3HfUwB830cDv883Aj67KwEBnx8A7HsTAtdPAwN2HvcDbOrrA1uy2wO6ds8BBTrDA6P2swPusqcCLW6bAqwmjwGq3n8DVZJzA+BGZwNu+lcCIa5LALkrRwKIJzsChxsrAbYHHwEY6xMBm8cDAAae9wEZbusBeDrfAcMCzwJxxsMAAIq3AttGpwNWApsBwL6PAmd2fwGCLnMDSOJnA+uWVwOKSksCTP4/A6hvOwKPbysDimMfA6VPEwPkMwcBJxL3AEHq6wHsut8C14bPA5JOwwCpFrcCk9anAbaWmwJxUo8BFA6DAerGcwEtfmcDFDJbA9LmSwONmj8CZE4zA8ezKwAatx8CZasTA7yXBwEXfvcDVlrrA00y3wHABtMDVtLDAKmetwJEYqsAnyabACHmjwEwooMAH15zAS4WZwCkzlsCt4JLA5Y2PwNs6jMCY54jAHL3HwKl9xMCqO8HAZPe9wBSxusD1aLfAOx+0wBbUsMCzh63AODqqwMfrpsCBnKPAgUygwN/7nMCwqpnAB1mWwPUGk8CHtI/Ay2GMwMoOicCPu4XAQ4zEwGdNwcD0C77ALMi6wE6Ct8CUOrTAM/GwwF6mrcA/WqrAAA2nwMS+o8Cqb6DA0R+dwE/PmcA8fpbAqyyTwK3aj8BQiIzAoTWJwK3ihcB7j4LANFrBwBUcvsBP27rAJJi3wNNStMCXC7HApsKtwDJ4qsBpLKfAdN+jwHmRoMCXQp3A7fKZwJSilsCkUZPAMACQwEuujMADXInAZgmGwIG2gsC3xn7Auya+wIPpusCQqbfAJWe0wIEiscDf263Ad5OqwHxJp8Ac/qPAg7GgwNdjncA6FZrAy8WWwKR1k8DfJJDAkNOMwMmBicCcL4bAFd2CwIQUf8BabnjAmvG6wHm1t8CGdrTABDWxwDHxrcBKq6rAiGOnwCAapMBBz6DAGIOdwM01msCE55bAXZiTwHVIkMDk94zAwqaJwCJVhsAVA4PAU2F/wNq7eMDWFXLAkrq3wLx/tMD6QbHAjQGuwLW+qsCveafAtjKkwP7poMC7n53AGlSawEYHl8BjuZPAlGqQwPcajcCoyonAvXmGwEwog8DMrH/AOQh5wPlicsAlvWvAW4G0wApIscCuC67AicyqwNuKp8DhRqTA1gChwPO4ncBrb5rAbiSXwCjYk8DBipDAXTyNwB3ticAcnYbAdUyDwHr2f8AQU3nAz65ywNUJbMA7ZGXArEWxwBwOrsBh06rAvJWnwGpVpMCsEqHAvM2dwNSGmsArPpfA8vOTwFeokMCGW43Aow2KwNK+hsAxb4PA2x6AwNObecDg+HLABFVswF+wZcANC1/ANgeuwKjRqsDMmKfA4VykwCUeocDX3J3AMpmawHNTl8DRC5TAgcKQwLN3jcCUK4rATN6GwAGQg8DTQIDAweF5wIZAc8AknmzAwvplwIVWX8CKsVjAqcWqwF+Sp8CkW6TAsyGhwMnkncAkpZrAAWOXwJwelMAv2JDA8Y+NwBRGisDJ+obAOq6DwI9ggMDYI3rA4YRzwHPkbMC/QmbA8Z9fwDL8WMCjV1LAuICnwPRPpMCcG6HA5+OdwA+pmsBQa5fA6SqUwBXokMAQo43AElyKwFETh8AAyYPATH2AwL9gesDDxHPA6iZtwHCHZsCO5l/AdURZwE6hUsBA/UvAFDikwBgKocBm2J3AL6OawKtql8AUL5TApvCQwJ6vjcA4bIrAriaHwDnfg8AMloDAs5Z6wJ7+c8AqZG3ApcdmwFEpYMBriVnAKehSwLpFTMBJokXAdeugwH/AncCzkZrAPl+XwFIplMAl8JDA8rONwPR0isBpM4fAjO+DwJWpgMB7w3rAcTB0wG2abcDIAWfA1mZgwN7JWcAlK1PA5YpMwFTpRcCfRj/Am5qdwONymsA6R5fAxxeUwLXkkMA1ro3AgHSKwNA3h8Bf+IPAaraAwFfkesC7V3TAbcdtwNMzZ8BOnWDANQRawNtoU8CHy0zAeyxGwPKLP8Af6jjATEWawAMhl8C1+JPAgMyQwIicjcD5aIrABjKHwOX3g8DRuoDACfZ6wHdxdMBi6G3AOltnwG3KYMBgNlrAdJ9TwP4FTcBQakbAscw/wGMtOcCejDLAXeuWwKrKk8DnpZDAJn2NwINQisAkIIfANeyDwOi0gMDp9HrAJ3p0wAH6bcDtdGfAYOtgwMxdWsCczFPANjhNwPigRsA6B0DASms5wHDNMsDtLSzAYIeTwK5vkMCbTo3AfCmKwGQAh8Bw04PAxKKAwBrdesD7bXTAl/htwGJ9Z8DS/GDAXXdawHbtU8CRX03AFs5GwGw5QMDxoTnA+wczwNhrLMDRzSXARPTiwKrN38CtpNzAkXnZwJVM1sDwHdPA1u3PwHO8zMDxicnAc1bGwBkiw8D/7L/APbe8wOqAucAZSrbA2hKzwDvbr8BKo6zAEWupwJoypsDu+aLAK6zfwGKF3MBBXNnACTHWwPYD08BB1c/AGqXMwK1zycAkQcbAoA3DwELZv8AlpLzAYW65wA04tsA6AbPA+smvwFuSrMBpWqnAMCKmwLnposANsZ/ABmTcwA892cDKE9bAdujSwE+7z8CJjMzAVlzJwOEqxsBR+MLAycS/wGeQvMBHW7nAgiW2wCzvssBZuK/AGYGswHlJqcCHEabATtmiwNegn8AraJzAzhvZwKr01cBCy9LA1Z/PwJpyzMDHQ8nAiRPGwAziwsB3r7/A63u8wIZHucBlErbAn9yywEmmr8B1b6zANTipwJUApsCkyKLAa5CfwPRXnMBIH5nAetPVwCys0sClgs/AIFfMwNQpycD0+sXArsrCwCyZv8CSZrzABDO5wJ7+tcB9ybLAtpOvwGBdrMCNJqnATe+lwK+3osC+f5/AhkecwBAPmcBk1pXA/4rSwItjz8DoOczAUA7JwPfgxcAOssLAwoG/wDxQvMChHbnAEuq1wK21ssCMgK/Ax0qswHIUqcCg3aXAYqaiwMVun8DVNpzAnv6YwCnGlcB+jZLAUELPwL0azMAE8cjAXcXFwPqXwsAMab/Avji8wDgHucCe1LXAEaGywK5sr8CQN6zAzgGpwHzLpcCtlKLAcV2fwNYlnMDo7ZjAs7WVwD99ksCWRI/AX/nLwLTRyMDsp8XAPHzCwNZOv8DoH7zAnO+4wBq+tcCFi7LA/VevwKAjrMCH7qjAyrilwHyCosCyS5/AeRScwOHcmMD3pJXAxGySwFM0j8Cr+4vAGbDIwGCIxcCSXsLA4zK/wIEFvMCZ1rjAVqa1wNx0ssBRQq/A0g6swH7aqMBtpaXAt2+iwHE5n8CsApzAecuYwOaTlcD/W5LA0COPwGLri8C9sojAa2bFwK8+wsDnFL/AQem7wO27uMAUjbXA4FyywHYrr8D6+KvAicWowEKRpcA9XKLAkiafwFXwm8CZuZjAbYKVwOFKksAAE4/A1dqLwGuiiMDKaYXAOxzCwI30vsDXyrvASJ+4wAxytcBMQ7LAMROvwN7hq8B4r6jAHHylwOdHosDzEp/AVt2bwCenmMB2cJXAVDmSwNABj8D3yYvA0pGIwG5ZhcDRIILAb9G+wOCpu8BOgLjA5FS1wM0nssAy+a7AOsmrwAmYqMDBZaXAgTKiwGX+nsCHyZvA/5OYwOBdlcA/J5LAKvCOwLG4i8DigIjAxkiFwGgQgsCjr33A6YW7wI5euMAxNbXA/gmywB3drsC2rqvA7n6owOpNpcDKG6LAr+iewLS0m8D0f5jAhUqVwH0UksDv3Y7A66aLwIFviMC+N4XArf+BwLCOfcCSHXfAiDm4wHcStcBn6bHAfr6uwOWRq8DCY6jAOjSlwHADosCF0Z7Amp6bwMlqmMAuNpXA4QCSwPXKjsCAlIvAkl2IwDsmhcCI7oHACG19wHf8dsBsi3DAJuy0wHvFscDPnK7ASHKrwA1GqMBBGKXACemhwIq4nsDjhpvAM1SYwJkglcAt7JHACbeOwEKBi8DtSojAGhSFwNrcgcB2Sn3Aktp2wB1qcMAs+WnAnZ2xwHR3rsBJT6vAPSWowHf5pMAYzKHARp2ewCNtm8DQO5jAbAmVwBTWkcDkoY7A9GyLwFo3iMAsAYXAfMqBwLMmfcCmt3bA7UdwwJ3XacDKZmPAxE2uwD0oq8CvAKjAO9ekwASsocAsf57A1lCbwCQhmMA48JTAML6RwCuLjsBDV4vAlCKIwDLthMA1t4HAXgF9wGGTdsCUJHDAELVpwO1EY8BB1FzAcPyqwKvXp8DbsKTAHoihwJNdnsBdMZvAnAOYwHPUlMADpJHAbHKOwMo/i8A8DIjA2teEwL6igcD42XzAVG12wLH/b8AwkWnA7iFjwAOyXMCHQVbAd6mnwJaFpMClX6HAvjeewP8Nm8CI4pfAebWUwPOGkcAYV47ABiaLwN3zh8C6wITAt4yBwNuvfMDpRHbAw9hvwI1racBq/WLAeY5cwNMeVsCSrk/Ar1SkwNQxocDjDJ7A9OWawCK9l8CJkpTASmaRwIQ4jsBYCYvA5diHwEynhMCodIHALIJ8wGEZdsAer2/AkENpwN/WYsAuaVzAn/pVwE6LT8BVG0nA7/2gwDvcncBtuJrAmJKXwNNqlMA6QZHA6xWOwAPpisCkuofA64qEwPpZgcDaT3zAw+l1wOaBb8B1GGnAnq1iwIxBXMBl1FXATWZPwGL3SMDAh0LAE6WdwKaEmsAaYpfAgD2UwOsWkcB07o3ANcSKwE2Yh8DZaoTA+DuBwJUXfMDdtHXAA1BvwD/paMDFgGLAyRZcwHWrVcD0Pk/Aa9FIwPtiQsDD8zvA+kmawO8ql8DFCZTAhuaQwELBjcAOmorAAnGHwDpGhMDSGYHA0td7wDt5dcAcGG/As7RowDhPYsDj51vA6H5VwHYUT8C7qEjA3TtCwAHOO8BIXzXAiuyWwPrOk8BLr5DAhI2NwLFpisDhQ4fAKhyEwKTygMDUjnvAMjV1wJ/YbsBXeWjAlxdiwJuzW8CbTVXAzuVOwGd8SMCVEULAg6U7wFg4NcA3yi7AYIeTwKxwkMCRUo3AXDKKwBUQh8DI64PAhsWAwMc6e8Dz5nTAxo9uwHk1aMBH2GHAbnhbwCoWVcC2sU7ASUtIwBrjQcBbeTvAOQ41wN+hLsB0NCjA5r3kwLax4cA6o97AsZLbwFWA2MBbbNXA8VbSwEVAz8B8KMzAuQ/JwBv2xcC928LAt8C/wB6lvMAGibnAf2y2wJdPs8BbMrDA1xStwBL3qcAX2abA+lnhwGtN3sChPtvA2S3YwEob1cAmB9LAm/HOwNTay8D1wsjAIarFwHSQwsALdr/A/Fq8wFw/ucA+I7bAswazwMfpr8CIzKzAAa+pwDuRpsA+c6PANfbdwD/p2sAi2tfAFsnUwE+20cD/oc7AUIzLwGt1yMB1XcXAjkTCwNIqv8BdELzARPW4wJzZtcB4vbLA56CvwPiDrMC2ZqnALEmmwGQro8BlDaDAmJLawDSF18C9ddTAaGTRwGdRzsDmPMvAESfIwA0QxcD998HAAd++wDXFu8CzqrjAj4+1wN9zssC0V6/AHjuswCoeqcDkAKbAWOOiwI3Fn8CNp5zAJS/XwEwh1MB2EdHA0//NwJHsysDd18fA3sHEwLiqwcCOkr7AfHm7wJ5fuMANRbXA3imywCUOr8Dz8avAVtWowF64pcAUm6LAhH2fwLhfnMC1QZnA3svTwIm90MBMrc3AVpvKwNCHx8DlcsTAuVzBwG9FvsAnLbvA/RO4wA36tMBs37HAMcSuwG6oq8AzjKjAkW+lwJNSosBFNZ/AshecwOP5mMDe25XAxmjQwOxZzcBDScrA8zbHwCUjxMD/DcHAove9wDHgusDKx7fAh660wIGUscDQea7AiF6rwLpCqMB3JqXAzQmiwMrsnsB4z5vA4bGYwA+UlcAIdpLA3gXNwHj2ycBb5cbArNLDwJG+wMArqb3Am5K6wAB7t8B3YrTAGEmxwP0ursA6FKvA4/inwAndpMC9wKHADKSewAOHm8CsaZjAEUyVwDwuksAzEI/AJ6PJwC2TxsCWgcPAgm7AwBRavcBrRLrApC23wN0VtMAv/bDAs+OtwH/JqsCprqfAQ5OkwF13ocAHW57ATT6bwD0hmMDhA5XAQ+aRwGrIjsBeqovAokDGwA0ww8D0HcDAdwq9wLH1ucDA37bAvsizwMewsMDyl63AV36qwApkp8AfSaTAqC2hwLQRnsBT9ZrAkdiXwHq7lMAZnpHAdYCOwJlii8CKRIjAUN7CwBjNv8B4urzAiqa5wGiRtsAqe7PA6mOwwMBLrcDCMqrABBmnwJz+o8Cb46DAEsidwBCsmsCjj5fA2HKUwLpVkcBSOI7AqhqLwMn8h8C43oTAMXy/wE5qvMAhV7nAvUK2wDkts8CrFrDAKf+swMnmqcCezabAvbOjwDeZoMAffp3AgmKawHFGl8D3KZTAIg2RwPvvjcCN0orA4LSHwPuWhMDmeIHARBq8wLEHucDw87XAEd+ywCbJr8BEsqzAfJqpwOKBpsCIaKPAgE6gwNwzncCpGJrA+PyWwNbgk8BPxJDAb6eNwECKisDKbIfAF0+EwC4xgcAqJnzAh7i4wD+ltcDkkLLAhXuvwC9lrMD0TanA4jWmwAwdo8CAA6DAUOmcwInOmcA8s5bAdZeTwEF7kMCsXo3AwEGKwIckh8AKB4TAUemAwMWWe8CMWnXA+Fa1wPZCssD+La/AGRiswFQBqcC86aXAXdGiwEe4n8CHnpzAK4SZwEFplsDXTZPA+TGQwLIVjcAN+YnAFNyGwNG+g8BMoYDAGAd7wDLLdMDvjm7AlPWxwNTgrsA7y6vAzrSowJadpcCchaLA7WyfwJRTnMCcOZnAEx+WwAQEk8B76I/Ag8yMwCiwicByk4bAbXaDwB9ZgMAhd3rAlDt0wKH/bcBWw2fAVpSuwNd+q8CaaKjAoVGlwPI5osCVIZ/AkgicwPPumMDB1JXACLqSwNGej8Aog4zAFmeJwKRKhsDdLYPAyRCAwN/mecCwq3PAE3BtwBU0Z8DA92DAOTOrwPscqMAYBqXAke6hwGnWnsClvZvAS6SYwGOKlcD1b5LAClWPwKo5jMDeHYnAsAGGwCjlgsCbkH/AVFZ5wIgbc8BF4GzAmKRmwIxoYMAsLFrAONKnwDu7pMCyo6HAm4uewPhym8DLWZjAGUCVwOYlksA5C4/AGfCLwI7UiMCeuIXAUpyCwGP/fsCHxXjAH4tywDlQbMDgFGbAItlfwAidWcCdYFPASnGkwJFZocBjQZ7AvSibwJ4PmMAH9pTA+tuRwHrBjsCMpovANouIwH1vhcBoU4LA+W1+wIU0eMB/+nHA9L9rwPKEZcCCSV/AsQ1ZwIjRUsAQlUzAaBChwPj3ncAo35rA9MWXwFmslMBWkpHA7XeOwB9di8DuQYjAYCaFwHgKgsB33H3AX6N3wLVpccCCL2vA1PRkwLO5XsArfljARkJSwA0GTMCIyUXAiq+dwGmWmsD7fJfAOmOUwCRJkcC3Lo7A8ROLwNP4h8Bf3YTAl8GBwPxKfcAyEnfA1thwwPSeasCTZGTAvSlewH3uV8DbslHA4XZLwJY6RcAE/j7Ap06awNw0l8DVGpTAjACRwP3ljcAly4rAA7CHwJWUhMDceIHAs7l8wB+BdsAASHDAXw5qwEHUY8CvmV3AsV5XwFAjUcCT50rAgqtEwCVvPsCEMjjAtu2WwErTk8CwuJDA452NwN+CisCfZ4fAIUyEwGQwgcDMKHzAUPB1wFa3b8DifWnA+ENjwJ0JXcDZzlbAsZNQwCxYSsBSHETAKuA9wLqjN8AIZzHAYIeTwKpxkMCGVo3AOzuKwMYfh8AgBITASeiAwHmYe8D0X3XAASdvwKHtaMDVs2LAoXlcwAg/VsAOBFDAu8hJwBKNQ8AaUT3A2BQ3wFTYMMCRmyrAHYfmwFyV48BmoeDAdqvdwMCz2sB1utfAw7/UwNLD0cDIxs7AxsjLwOjJyMBLysXABcrCwCvJv8DRx7zABca5wNjDtsBUwbPAhr6wwHe7rcAvuKrAagfjwBgV4MCqIN3AVirawE4y18DBONTA2D3RwLpBzsCMRMvAa0bIwHVHxcDER8LAbUe/wIdGvMAhRbnATUO2wBhBs8CPPrDAvDutwKk4qsBeNafAD4jfwB2V3MAroNnAaqnWwAix08Awt9DACrzNwLu/ysBjwsfAIcTEwA/FwcBIxb7A38S7wOnDuMB4wrXAmsCywF2+r8DNu6zA9LipwN21psCPsqPAFwncwHYV2cDyH9bAuCjTwPIv0MDINc3AXjrKwNc9x8BRQMTA6UHBwLlCvsDYQrvAW0K4wFVBtcDVP7LA7D2vwKY7rMAPOanAMDamwBQzo8DCL6DAkIrYwC2W1cAIoNLASajPwBSvzMCOtMnA2bjGwBO8w8BavsDAyL+9wHbAusB4wLfA5L+0wMq+scA8va7ARrurwPW4qMBVtqXAcLOiwE6wn8D3rJzAhwzVwFAX0sB6IM/AJijMwHYuycCKM8bAgTfDwHU6wMCCPL3AwT26wEc+t8AqPrTAez2xwEw8rsCsOqvApziowEs2pcCiM6LAtDCfwIwtnMAwKpnADo/RwO2YzsBSocvAW6jIwCKuxcDFssLAXLa/wAK5vMDPurnA2Lu2wDK8s8Dwu7DAJLutwNy5qsAouKfAE7akwKmzocD0sJ7A/q2bwM+qmMBsp5XANxLOwBUby8ChIsjA9CjFwCMuwsBGMr/AdDW8wMI3ucBFObbAEjqzwDo6sMDPOa3A4TiqwH03p8CxNaTAijOhwBAxnsBPLpvATiuYwBYolcCtJJLAFZbKwNmdx8B3pMTAAKrBwIauvsAasrvA0bS4wLy2tcDtt7LAdbivwGW4rMDLt6nAtbamwDK1o8BMs6DADrGdwIOumsCzq5fApqiUwGSlkcDzoY7AwRrHwE8hxMDlJsHAjyu+wFgvu8BOMrjAfzS1wPs1ssDPNq/ACTeswLg2qcDoNabApjSjwP4yoMD5MJ3Aoy6awAMsl8AiKZTAByaRwLoijsA/H4vAUqDDwI2lwMABqr3AtK26wKuwt8DvsrTAi7SxwIm1rsDztavA1bWowDu1pcAutKLAubKfwOawnMC/rpnAS6yWwJOpk8CeppDAdKONwBigisCTnIfA5CbAwKwqvcDiLbrAgzC3wJEytMAPNLHAAzWuwHM1q8BmNajA5DSlwPUzosCiMp/A8zCcwO8umcCfLJbACiqTwDcnkMArJI3A7SCKwIIdh8DwGYTAk668wMiwucCgsrbAE7SzwB+1sMDAta3A+LWqwMi1p8A0taTAQLShwPGynsBOsZvAW6+YwCCtlcChqpLA5aePwPGkjMDKoYnAdp6GwPmag8BXl4DAfje5wP03tsBXOLPAfziwwGw4rcAXOKrAfDenwJg2pMBrNaHA9jOewDoym8A7MJjA+y2VwH4rksDJKI/A4CWMwMYiicCBH4bAExyDwIAYgMCZKXrAxMG1wGrAssAkv6/A4b2swJK8qcAsu6bApbmjwPe3oMAetp3AFrSawN2xl8B0r5TA26yRwBSqjsAgp4vAAqSIwL2ghcBSnYLAizN/wDMsecCiJHPAh02ywDBKr8AnR6zAV0SpwK1BpsAYP6PAizygwPo5ncBeN5rArzSXwOkxlMAHL5HACCyOwOooi8CuJYjAUyKFwNoegsCJNn7AKC94wJUncsDSH2zA5tquwG/Vq8CB0KjAAcylwNrHosD3w5/ARsCcwLm8mcBCuZbA1rWTwG6ykMADr43AjquKwA2oh8B8pITA2qCBwEs6fcC8MnfABytxwC0ja8AwG2XAAWqrwEliqMBSW6XAAFWiwDpPn8DoSZzA9USZwE1AlsDhO5PAoTeQwIEzjcB4L4rAfSuHwIknhMCXI4HART98wFA3dsBLL3DANCdqwAcfZMDEFl7A+PqnwN7wpMC956HAdt+ewO/Xm8AM0ZjAtcqVwNTEksBVv4/AJrqMwDi1icB8sIbA5quDwG+ngMAXRnvAbj11wNc0b8BJLGnAviNjwDAbXcCbElfA5Y2kwE6BocDjdZ7AhWubwBlimMCDWZXAp1GSwG1Kj8C9Q4zAgj2JwKo3hsAiMoPA3iyAwJ1PesDURXTATTxuwPkyaMDLKWLAtyBcwLcXVsDCDlDA4iKhwLUTnsDjBZvAT/mXwN3tlMBx45HA7dmOwDjRi8A2yYjA0cGFwPK6gsALaX/A8lx5wHpRc8CGRm3A/ztnwNAxYcDnJ1vANR5VwK0UT8BGC0nAArqdwCyomsDbl5fA9IiUwF17kcD4bo7Aq2OLwFdZiMDjT4XAM0eCwF5+fsCAb3jAo2FywKFUbMBYSGbAqjxgwH0xWsC6JlTAThxOwCkSSMA8CELAVVOawMk+l8DkK5TAkhqRwLgKjsA8/IrAA++HwO/ihMDl14HAkZt9wP+Id8Dgd3HABWhrwERZZcB1S1/AdD5ZwCMyU8BkJk3AIBtHwEIQQcC4BTvA4u6WwJnXk8AUwpDAQq6NwA2cisBdi4fAGHyEwCNugcDBwnzAa6t2wAqWcMBpgmrAVHBkwJtfXsARUFjAjUFSwOszTMAJJ0bAyxpAwBUPOsDTAzTAYIeTwKhykMB8Wo3AG0SKwHYvh8B5HITADAuBwCr2e8Dz2HXAOr5vwMelacBgj2PA0HpdwOFnV8BjVlHAKEZLwAU3RcDUKD/Acxs5wMMOM8CpAi3Af0/owC145cC/nuLAacPfwFvm3MDEB9rAzCfXwJxG1MBUZNHAFoHOwP6cy8AluMjAotLFwIvswsDxBcDA5R69wHQ3usCsT7fAl2e0wD9/scCtlq7AFrTkwADc4cDuAd/ADybcwJFI2cCbadbAVonTwOWn0MBpxc3A/+HKwMP9x8DNGMXAMzPCwAdNv8BdZrzAQ3+5wMiXtsD2r7PA2sewwHzfrcDl9qrAOBnhwEdA3sB+ZdvACInYwAqr1cCsy9LAEOvPwFcJzcCfJsrABEPHwJ9exMCIecHA0pO+wJCtu8DUxrjAq9+1wCL4ssBHELDAIiitwL4/qsAhV6fA937dwBOl2sB/ydfAXuzUwNMN0sD/Lc/AAU3MwPZqycD7h8bAKaTDwJa/wMBZ2r3AhPS6wCgOuMBXJ7XAHECywIZYr8CecKzAcIipwASgpsBht6PAbeXZwHoK18ADLtTAI1DRwPlwzsCgkMvAM6/IwM3MxcCF6cLAcwXAwK0gvcBEO7rAS1W3wNJutMDoh7HAmqCuwPO4q8D+0KjAxeilwE8Ao8ClF6DAskzWwJNw08Adk9DAaLTNwIvUysCb88fAsRHFwOMuwsBFS7/A62a8wOiBucBOnLbALLazwJLPsMCM6K3AJgGrwG0ZqMBoMaXAIkmiwKJgn8Dvd5zA6LTSwHnXz8Dn+MzAQhnKwJo4x8ACV8TAinTBwESRvsBDrbvAl8i4wFDjtcB9/bLALBewwGowrcBESarAxGGnwPR5pMDekaHAiamewP3Am8BA2JjAMR7PwEs/zMB7X8nAyH7GwD2dw8DkusDAy9e9wP7zusCMD7jAgSq1wOxEssDXXq/AUHiswGGRqcAWqqbAd8KjwI7aoMBi8p3A/AmbwGEhmMCYOJXAs4jLwC2oyMD5xsXAF+XCwIoCwMBYH73Ahzu6wCFXt8AtcrTAtoyxwMamrsBmwKvAoNmowH3ypcAGC6PAQyOgwDw7ncD4UprAfWqXwNKBlMD7mJHAnfTHwEYSxcCEL8LATky/wJ9ovMB2hLnA1Z+2wL66s8A11bDAQu+twOkIq8AyIqjAIzulwMNTosAabJ/ALYScwAOcmcCis5bAEMuTwFDikMBp+Y3AHWLEwMR9wcBFmb7AkLS7wJrPuMBZ6rXAywSzwOoesMC4OK3ANVKqwGRrp8BIhKTA5JyhwD61nsBZzZvAO+WYwOn8lcBmFJPAtyuQwOBCjcDmWYrAa9HAwNfqvcBoBLvABx64wJ83tcAjUbLAhmqvwMCDrMDLnKnAo7WmwEbOo8C15qDA7/6dwPYWm8DNLpjAdUaVwPJdksBIdY/AeIyMwIajicB0uobAwEK9wLZZusAgcbfA34i0wNmgscD3uK7AKNGrwFvpqMCGAabAoBmjwKMxoMCJSZ3AUWGawPh4l8B+kJTA46eRwCi/jsBO1ovAVu2IwEQEhsAYG4PAW7a5wJvKtsCj37PATPWwwHULrsAAIqvA1DiowNxPpcAHZ6LAR36fwJCVnMDZrJnAG8SWwFLbk8B58pDAjwmOwJEgi8B/N4jAWk6FwCFlgsCp937Afiy2wMY9s8AtULDAhGOtwKV3qsBqjKfAtaGkwGm3ocBvzZ7AtOObwCb6mMC4EJbAYCeTwBQ+kMDMVI3AhWuKwDmCh8DmmITAia+BwEWMfcBfuXfAbaWywHqzr8D9wqzAxdOpwKLlpsBr+KPA+QuhwCsgnsDjNJvACEqYwIRflcBDdZLAN4uPwFGhjMCJt4nA1M2GwCzkg8CL+oDA3CF8wKFOdsBge3DAbSGvwPsrrMBXOKnATUamwKhVo8A5ZqDA1HedwFKKmsCOnZfAa7GUwMrFkcCW2o7Aue+LwCIFicDCGobAjTCDwHhGgMD5uHrAJOV0wGcRb8C7PWnAxKCrwI+nqMCBsKXAYbuiwPjHn8AT1pzAgOWZwBL2lsChB5TABhqRwCAtjsDTQIvABVWIwJ9phcCPfoLAhyd/wF9SecCPfXPABKltwK/UZ8CBAGLAtSOowH0mpcDBK6LARzOfwNc8nMA5SJnAOVWWwKVjk8BOc5DACoSNwLGVisAiqIfAPruEwOjOgcAUxn3AHu93wMsYcsD9QmzAm21mwJCYYMDKw1rAf6qkwAipocBdqp7ARq6bwIu0mMDxvJXAQseSwEnTj8DR4IzArO+JwK7/hsCuEITAiSKBwD5qfMCkkHbAFbhwwGTgasBrCWXADDNfwCldWcCth1PAWzWhwHEvnsCbLJvApiyYwFwvlcCCNJLA4TuPwEBFjMBoUInAJ12GwExrg8CpeoDAKhZ7wNc4dcAWXW/AqoJpwF+pY8AJ0V3Af/lXwJ4iUsBLTEzAesSdwO+5msC6spfArK6UwJGtkcA0r47AXLOLwNC5iMBXwoXAusyCwIuxf8CPzHnAJOpzwPYJbsC4K2jAJE9iwP5zXMAOmlbAJcFQwBnpSsDIEUXAAliawLVIl8DzPJTAljSRwHEvjsBPLYvA/S2IwEExhcDiNoLAUH1+wLaQeMCMp3LAbsFswP7dZsDl/GDA1B1bwIZAVcC5ZE/ANopJwMuwQ8BM2D3AD/CWwOnbk8B5y5DAoL6NwDq1isAZr4fAC6yEwNyrgcCnXH3AcGZ3wKB0ccDJhmvAf5xlwF21X8AC0VnAFu9TwEoPTsBTMUjA8VRCwOp5PMALoDbAYIeTwKZzkMBxXo3A+0yKwCc/h8DRNITAzS2BwNVTfMDoUXbAZVVwwNhdasDPamTA2XtewIuQWMB9qFLAT8NMwKXgRsAvAEHAoiE7wLpENcA9aS/AoRbqwLtZ58DRmuTAFNrhwK4X38DKU9zAj47ZwB/I1sCcANTAJTjRwNRuzsDDpMvAB9rIwLUOxsDeQsPAlHbAwOKpvcDY3LrAfg+4wOBBtcAGdLLAnV/mwLyh48AB4uDAkyDewJtd28A9mdjAm9PVwNcM08AORdDAXHzNwNuyysCi6MfAxR3FwFhSwsBrhr/ADbq8wE3tucA1ILfA0lK0wCuFscBKt67AVKniwFvq38C1Kd3Ag2fawOaj18D+3tTA6hjSwMZRz8CticzAusDJwAL3xsCbLMTAmWHBwA2WvsAGyrvAlP24wMIwtsCcY7PALJawwHzIrcCT+qrA4/PewLMz3MAGctnA967WwKDq08AdJdHAhl7OwPaWy8CEzsjARQXGwE87w8C0cMDAh6W9wNjZusC0DbjAKUG1wEN0ssANp6/Aj9mswNQLqsDhPafAbT/bwOB92MAMu9XABPfSwNwx0MCpa83Af6TKwHTcx8CaE8XABkrCwMl/v8DztLzAlem5wL0dt8B3UbTA0ISxwNO3rsCK6qvA/RypwDRPpsA3gaPAGozXwAXJ1MDlBNLAxD/PwLB5zMC1ssnA5OrGwE0ixMD+WMHACI++wHjEu8Bf+bjAyC22wMFhs8BUlbDAjcitwHX7qsAWLqjAdmClwJ+SosCVxJ/AFdrTwEoV0cC1T87AV4nLwDbCyMBZ+sXAyTHDwJFowMC8nr3AVdS6wGgJuMAAPrXAKHKywOqlr8BQ2azAYwyqwC0/p8CzcaTA/6OhwBXWnsD9B5zAlSnQwN1izcCjm8rA39PHwI0LxcCuQsLARHm/wFWvvMDl5LnA/Rm3wKNOtMDggrHAvLauwD/qq8BxHanAWVCmwP6Co8BmtaDAmeedwJsZm8BxS5jA0XrMwPKxycDe6MbAhB/EwNlVwcDUi77AccG7wK/2uMCOK7bAEGCzwDmUsMANyK3AkfuqwMouqMC/YaXAc5SiwO7Gn8Az+ZzASCuawDJdl8D0jpTADM7IwMMCxsCaN8PAdmzAwEKhvcDu1brAbgq4wLo+tcDNcrLAoqavwDrarMCUDarAsUCnwJVzpMBCpqHAu9iewAMLnMAfPZnAEm+WwN+gk8CJ0pDAjyPFwJRVwsATiL/A6bq8wPjtucAmIbfAYFS0wJeHscC9uq7Ay+2rwLogqcCGU6bALYajwKy4oMAF653ANx2bwEVPmMAwgZXA+rKSwKXkj8A0Fo3AqnvBwKyqvsCM2rvAGgu5wDA8tsCsbbPAcZ+wwGnRrcCAA6vApzWowNJnpcD5maLAFMyfwB7+nMAVMJrA9WGXwL2TlMBvxZHACPeOwIsojMD5WYnAtda9wF8Cu8BOL7jATF21wCeMssC1u6/A0euswFscqsA5TafAVX6kwJ6vocAE4Z7AfBKcwP1DmcCAdZbA/6aTwHbYkMDjCY7ARDuLwJhsiMDdnYXADjW6wARdt8CthrTAy7GxwCLersCAC6zAtjmpwJ1opsAUmKPA/MegwD34ncDEKJvAflmYwF6KlcBZu5LAZuyPwH0djcCZTorAt3+HwNGwhMDo4YHAGJe2wPq6s8AC4bDA6QiuwG0yq8BRXajAX4mlwGi2osBB5J/AxhKdwNdBmsBZcZfANqGUwFrRkcC1AY/AOzKMwOFiicCek4bAa8SDwEP1gMBBTHzAPf2ywKYcsMCsPq3AAWOqwFqJp8B1saTAEtuhwPoFn8D5MZzA5V6ZwJaMlsDqupPAxemQwA0ZjsCtSIvAlXiIwLWohcAB2YLAbgmAwO1zesAj1XTA5mevwHKCrMASoKnAc8CmwEbjo8BBCKHAHC+ewJhXm8B8gZjAk6yVwK3YksCkBZDAUjONwJlhisBfkIfAjL+EwA7vgcCoPX7Aop14wPT9csCLXm3AfderwMfsqMCcBabApiGjwJJAoMAPYp3A0oWawJOrl8AQ05TADvyRwFYmj8C4UYzACn6JwCarhsDr2IPAPgeBwAxsfMBdynbATClxwLyIa8CV6GXAbUyowBNcpcC4b6LABYefwKWhnMBEv5nAkd+WwD8ClMAFJ5HAn02OwNF1i8Bin4jAIcqFwOH1gsB7IoDAnJ96wHb7dMBTWG/ABrZpwGsUZMBic17AFsekwL7QocDQ3p7A+/CbwOoGmcBGIJbAvDyTwPpbkMCwfY3AlqGKwGbHh8Di7oTA0BeCwPuDfsB52njAyDJzwKGMbcDI52fABkRiwC6hXMAY/1bA00ehwCpLnsBPU5vA9l+YwM5wlcCChZLAvJ2PwCe5jMBx14nASviGwGcbhMCCQIHAts58wG8fd8DGcnHAXMhrwN4fZsACeWDAidNawDovVcDmi0/A8c6dwLHLmsCXzZfAX9SUwL/fkcBl747A/QKMwDEaicCrNIbAGVKDwCpygMAkKXvAFHJ1wKK+b8BWDmrAw2BkwIq1XsBUDFnA1mRTwM6+TcABGkjAr1yawKFSl8ACTpTAmU6RwCZUjsBcXovA7GyIwIN/hcDJlYLA015/wCCYecDY1nPAYBpuwCpiaMCvrWLAdvxcwBFOV8AdolHAQfhLwDFQRsCoqUDAO/GWwDngk8Dd1JDA/s6NwGXOisDR0ofA+duEwIzpgcBv9n3ASiF4wP1ScsDfimzATMhmwKsKYcBoUVvA/JtVwOzpT8DIOkrAK45EwLnjPsAlOznAYIeTwKR0kMBmYo3A2lWKwNdOh8AnTYTAi1CBwHSxfMDKynbAcuxwwL8Va8AFRmXAmnxfwNm4WcAm+lPA7j9OwKaJSMDS1kLA/yY9wMd5N8DNzjHAGdzrwJQ56cAolebA/u7jwDxH4cAJnt7Ah/PbwNhH2cAam9bAau3TwOI+0cCaj87Apt/LwBsvycALfsbAhMzDwJUawcBKaL7ArrW7wMwCucCrT7bAmQnowOFl5cBzwOLAbxngwPdw3cAqx9rAKBzYwA5w1cD2wtLA/BTQwDZmzcC5tsrAmwbIwO1VxcC+pMLAH/O/wBtBvcC/jrrAFty3wCgptcD+dbLABTjkwPeS4cBo7N7AcETcwCub2cCy8NbAH0XUwIyY0cAP687AwDzMwLONycD93cbArS3EwNZ8wcCGy77Ayhm8wLBnucBAtbbAhwK0wIxPscBXnK7AhGfgwPjA3cAkGdvAGnDYwO3F1cCyGtPAe27QwF/BzcBvE8vAwGTIwGO1xcBpBcPA4lTAwN2jvcBm8rrAikC4wFWOtcDQ27LABCmwwPl1rcC4wqrAQ5jcwAnw2cDJRtfAipzUwFfx0cA/Rc/AT5jMwJfqycAkPMfAB43EwE/dwcAILb/AQXy8wAbLucBjGbfAY2e0wA61scBwAq/Aj0+swHOcqcAj6abAdsrYwFkg1sB+ddPA4cnQwIYdzsB0cMvAsMLIwEUUxsA9ZcPAo7XAwIEFvsDiVLvA0qO4wFrytcCDQLPAWI6wwODbrcAkKavAKnaowPrCpcCZD6PAV/7UwBxS0sBwpc/ASPjMwJ1KysBtnMfAuO3EwIE+wsDOjr/Ao968wAguusADfbfAnsu0wN4ZssDNZ6/AcLWswM8CqsDwT6fA2pykwJLpocAdNp/AKzTRwI2FzsDV1svA7CfJwMN4xsBNycPAhBnBwGRpvsDruLvAGgi5wPJWtsB5pbPAsfOwwJ9BrsBIj6vAsdyowOAppsDZdqPAosOgwD4QnsCyXJvAPmzNwPG6ysDpCcjABFnFwCeowsA+97/AOEa9wAyVusCv47fAHjK1wFWAssBTzq/AGBytwKZpqsD/tqfAJQSlwBtRosDmnZ/Ah+qcwAI3msBbg5fA5qbJwJbyxsDyPsTAzIvBwP/YvsBtJrzA/nO5wJzBtsA6D7TAylyxwEWqrsCl96vA5USpwAKSpsD93qPA1CuhwIl4nsAcxZvAjxGZwORdlsAdqpPAheTFwNQsw8A9dsDAisC9wIoLu8ATV7jABKO1wD/vssCuO7DAPoitwN/UqsCGIajAKm6lwMW6osBRB6DAzFOdwDOgmsCF7JfAwjiVwOmEksD80I/AhSXCwAtqv8AlsLzAj/e5wA5At8BuibTAgtOxwCUer8A3aazAnbSpwEEAp8ARTKTA/5ehwAHknsAMMJzAGnyZwCXIlsAqFJTAJ2CRwBmsjsD/94vAW2q+wKiqu8AK7bjAMzG2wNx2s8DFvbDAuQWuwIZOq8AFmKjAEuKlwJAso8Bmd6DAgMKdwM4Nm8BBWZjAz6SVwG/wksAZPJDAyoeNwHzTisAtH4jAhLO6wCHvt8BbLbXA222ywE6wr8Br9KzA7zmqwKKAp8BQyKTAzxCiwPdZn8Cqo5zAze2ZwEg4l8AJg5TAAM6RwCAZj8BgZIzAt6+JwB77hsCPRoTAhwG3wPQ3tMCPcbHA9K2uwMnsq8C5LanAeHCmwMK0o8Bb+qDADUGewKqIm8AK0ZjACxqWwJBjk8B/rZDAxfeNwE9Ci8ARjYjA/deFwAojg8AwboDA7lSzwKiFsMAkuq3A9/GqwLwsqMAXaqXAsamiwDvrn8BvLp3ADnOawOG4l8C4/5TAZ0eSwMuPj8DF2IzAOiKKwBRsh8A/toTArQCCwJ+WfsA4LHnASq6vwMvYrMCjB6rAZDqnwKFwpMD0qaHA/uWewGgknMDfZJnAHaeWwODqk8DuL5HAFXaOwCi9i8ACBYnAgk2GwIuWg8AF4IDAulN8wALodsDHfHHAKg6swOwxqcCbWqbAxIejwPi4oMDK7Z3A0yWbwLFgmMALnpXAj92SwPEekMDwYY3AT6aKwNrrh8BjMoXAw3mCwK2Df8AAFXrATad0wGk6b8AvzmnAHnWowJ2RpcCcs6LAp9qfwE0GncAdNprAqmmXwIqglMBb2pHAwxaPwGxVjMAKlonAWtiGwB0chMAdYYHAV059wDzcd8Cja3LATfxswAWOZ8CeIGLAquOkwGz4ocA3E5/AnjOcwC9ZmcB3g5bABrKTwG3kkMBDGo7AIlOLwK+OiMCUzIXAgwyDwDVOgMDYInvA4at1wCE3cMBExGrAAFNlwBPjX8BHdFrASVqhwN9mnsD8eZvAO5OYwDCylcBp1pLAdf+PwOEsjcA+XorAIZOHwCbLhMDuBYLAQ4Z+wOMEecAsh3PAnwxuwMiUaMBDH2PAuKtdwNk5WMBmyVLAaNmdwHHdmsBx6JfADfqUwOIRksCFL4/AhlKMwHB6icDTpobAPteDwEYLgcAGhXzAL/l2wFRyccDU72vAHXFmwKz1YMALfVvA1AZWwKuSUMBDIEvAXWGawI1cl8APX5TAmWiRwNV4jsBfj4vAzauIwK7NhcCQ9ILA/x+AwBmfesCVBXXApHJvwITlacCDXWTA/dlewFxaWcAb3lPAw2ROwOntSMAyeUPAaPKWwIjkk8BB3pDAWt+NwI3nisCE9ofA3AuFwC0ngsAKkH7A5dt4wAQxc8CGjm3AjvNnwE1fYsAA0VzA8UdXwHnDUcACQ0zAA8ZGwAJMQcCV1DvAYIeTwKJ1kMBcZo3AuV6KwIVeh8B6ZYTAQ3OBwAEPfcCQQ3fAVYNxwGrNa8DpIGbA73xgwJ/gWsAoS1XAw7tPwLoxSsBjrETAJis/wHetOcDcMjTAep/twEgX68BNjejArAHmwIZ048D95eDAMFbewD7F28BDM9nAWaDWwJkM1MAaeNHA8OLOwC1NzMDktsnAIiDHwPeIxMBu8cHAklm/wG3BvMAJKbrApbHpwAUo58DVnOTALhDiwCuC38Dn8tzAfmLawAfR18CdPtXAVqvSwEkX0MCIgs3AJ+3KwDdXyMDIwMXA5inDwKCSwMAB+73AE2O7wN/KuMBuMrbA7sTlwLc548AtreDAYB/ewGWQ28BQANnANW/WwCrd08BDStHAk7bOwC0izMAjjcnAhPfGwGFhxMDGysHAwDO/wFycvMCkBLrAoWy3wFvUtMDbO7LAhdnhwIZM38B4vtzAYS/awE+f18BNDtXAanzSwLfpz8BCVs3AG8LKwFEtyMDzl8XADgLDwK9rwMDj1L3AtT27wC6muMBZDrbAPnazwOTdsMBURa7Aoe/dwKJg28Df0NjAVUDWwAav08D4HNHANIrOwMH2y8CrYsnA/M3GwMA4xMABo8HAzAy/wCp2vMAl37nAyEe3wBqwtMAkGLLA7X+vwH3nrMDZTqrAgQfawEN218CT5NTAZFLSwLC/z8ByLM3ArJjKwF8EyMCRb8XARtrCwIdEwMBbrr3AyRe7wNqAuMCU6bXAAFKzwCW6sMAJIq7AsomrwCfxqMBtWKbAbiHWwKiN08DM+dDAwmXOwHfRy8DfPMnA86fGwKwSxMALfcHAD+e+wLlQvMAOurnAEiO3wMmLtMA49LHAZVyvwFXErMANLKrAkZOnwOj6pMAUYqLAuz3SwB2nz8DMEM3ApnrKwIzkx8BqTsXALbjCwMkhwMA1i73AbPS6wGlduMAsxrXAtC6zwASXsMAc/63AAGerwLLOqMA2NqbAkJ2jwMIEocDRa57AyVzOwPTCy8DdKcnAUpHGwCr5w8BFYcHAh8m+wNsxvMAwmrnAegK3wK9qtMDI0rHAwjqvwJiirMBLCqrA2nGnwEXZpMCNQKLAtKefwL0OncCodZrAAn/KwJDhx8BVRcXAEqrCwJMPwMCrdb3AM9y6wA5DuMAhqrXAWhGzwKZ4sMD7363AT0erwJmuqMDWFabAAX2jwBjkoMAaS57ABrKbwN0YmcCff5bA3aTGwFwDxMCVY8HAPsW+wBQovMDfi7nAbfC2wJZVtMA2u7HAMiGvwHKHrMDi7anAdFSnwBq7pMDNIaLAg4ifwDjvnMDoVZrAj7yXwCsjlcC8iZLA4M7CwNEowMAMhb3AOOO6wAVDuMAvpLXAeQazwK5psMCiza3AMDKrwDeXqMCe/KXATmKjwDXIoMBFLp7Ac5SbwLX6mMADYZbAWMeTwLAtkcAHlI7AnP2+wHVSvMAzqrnAbQS3wMpgtMD0vrHApR6vwJ1/rMCj4anAiUSnwCWopMBWDKLA/3CfwAbWnMBZO5rA5qCXwKAGlcB8bJLAcdKPwHc4jcCLnorArTG7wNyAuMCS07XAXCmzwNGBsMCU3K3ATTmrwLGXqMB+96XAelijwHK6oMA7HZ7Ar4CbwLHkmMAlSZbA9q2TwBATkcBleI7A6N2LwI5DicBRqYbAvGu3wKO0tMC9AbLAi1KvwJqmrMB+/anA1FanwEaypMCED6LASm6fwFrOnMCAL5rAj5GXwF70lMDNV5LAwLuPwB4gjcDThIrA0OmHwAVPhcBntILAd6yzwHPusMBTNa7AkYCrwK7PqMAxIqbAr3ejwMPPoMARKp7AS4abwCfkmMBnQ5bA06OTwD0FkcB6Z47AaMqLwOkticDikYbAP/aDwO1agcC8f33Ak/SvwP0urcAAb6rAD7SnwKP9pMA6S6LAXZyfwJrwnMCOR5rA2aCXwCr8lMA2WZLAvbePwIUXjcBdeIrAGdqHwJU8hcCwn4LAUQOAwL/OesCSl3XAx0SswPd2qcB1r6bAsO2jwBwxocAweZ7AacWbwE8VmcBuaJbAXr6TwMIWkcBDcY7Als2LwHgricCtiobAAuuDwEtMgcDDXH3ARyJ4wOvocsB+sG3AxZ2owBjHpcBn96LAJi6gwMVqncC1rJrAb/OXwG0+lcA0jZLAUd+PwFk0jcDri4rAsuWHwF5BhcCsnoLAvPp/wH66esBDfHXAuj9wwJ4Ea8C2ymXAOAClwBIgosCQR5/AKnacwFKrmcB55pbAESeUwJBskcBwto7AMwSMwGZVicCbqYbAcQCEwI9ZgcBLaX3A2yJ4wFPfcsBEnm3AUF9owCUiY8B65l3AvmyhwJGCnsChoJvAcsaYwHvzlcAvJ5PAAGGQwF2gjcC85IrAli2IwG16hcDKyoLAQB6AwNXoesDfmXXA+05wwJoHa8A8w2XAcIFgwNZBW8AYBFbA3uOdwDDvmsBGA5jAsh+VwPhDksCQb4/A76GMwITaicDAGIfAFlyEwAGkgcD9333AMH94wLwkc8DYz23Ayn9owO4zY8Cx613AkKZYwBhkU8DnI07ACmaawHhml8AacJTAlYKRwH2djsBVwIvAmOqIwLobhsArU4PAXJCAwHyle8CVM3bAAMpwwMpna8ATDGbADrZgwP9kW8A/GFbAOM9QwGWJS8BRRkbAlPOWwNfok8Ck55DAte+NwLIAi8AwGojAtDuFwLpkgsBrKX/ALZZ5wJwOdMCakW7AFx5pwA6zY8CJT17Ap/JYwJabU8CZSU7AB/xIwEWyQ8DOaz7AYIeTwKB2kMBRao3AmGeKwDNuh8DKfYTA9ZWBwHdsfcAwvHfA/xlywMWEbMBh+2bAtnxhwLEHXMBMm1bAjjZRwJTYS8CKgEbAsC1BwFnfO8DqlDbAVGDvwGDy7MDFgurAnxHowAmf5cAgK+PAALbgwMU/3sCHyNvAYFDZwGbX1sCuXdTATOPRwFJoz8DQ7MzA1XDKwG70x8Cod8XAjvrCwCh9wMCB/73AWlfrwLzn6MC1dubAWQTkwLuQ4cD0G9/AF6bcwDwv2sB3t9fA3j7VwITF0sB8S9DA1tDNwKNVy8Dw2cjAzV3GwEThw8BiZMHAMOe+wLZpvMD+67nAsU/nwDfe5MCaa+LA4/ffwCCD3cBeDdvArpbYwB8f1sDDptPAqi3RwOSzzsCBOczAjr7JwBpDx8Ayx8TA4UrCwDLOv8AvUb3A4tO6wFJWuMCH2LXAj0njwALW4MCeYd7AY+zbwFV22cB6/9bA24fUwIIP0sB7ls/A0RzNwJGiysDGJ8jAfazFwMAww8CatMDAFTi+wDu7u8AUPrnAp8C2wP5CtMAdxbHAN0XfwFbP3MDzWNrAA+LXwIBq1cBo8tLAu3nQwH0AzsCzhsvAZQzJwJqRxsBaFsTArZrBwJ0ev8AworzAcCW6wGSot8ATK7XAhK2ywL0vsMDEsa3A80LbwHTK2MDSUdbA9djTwMxf0cBM5s7AbGzMwCnyycCCd8fAefzEwA+BwsBJBcDAK4m9wLsMu8D+j7jA+hK2wLWVs8A0GLHAfZquwJQcrMB+nqnAG0PXwKrH1MB+TNLAc9HPwGtWzcBS28rAFWDIwKnkxcAFacPAJe3AwAVxvsCl9LvABXi5wCf7tsAOfrTAvACywDWDr8B9Ba3Al4eqwIYJqMBQi6XAEEbTwE7H0MBESc7AwMvLwJlOycCt0cbA4lTEwCHYwcBcW7/Ahd68wJVhusCD5LfATWe1wPDpssBsbLDAv+6twOxwq8D08qjA2HSmwJr2o8A9eKHAREzPwMXJzMB8SMrAK8jHwJlIxcCaycLABkvAwMDMvcCuTrvAvNC4wNpStsD81LPAGFexwCjZrsAoW6zAEt2pwOdep8Cj4KTASGKiwNbjn8BNZZ3ANlbLwIHPyMCOSsbADsfDwLxEwcBdw77Av0K8wLnCucAoQ7fA78O0wPZEssArxq/Af0etwOTIqsBTSqjAxMulwDFNo8CWzqDA8k+ewELRm8CEUpnAdWTHwATZxMDsT8LA0Mi/wFxDvcBHv7rAUzy4wEu6tcAAObPATriwwBM4rsA1uKvAnjipwD25psAEOqTA5rqhwNo7n8DavJzA3z2awOa+l8DsP5XAn3fDwNzmwMAZWb7A5s27wOFEucC1vbbAEzi0wLyzscB1MK/ADa6swF0sqsBAq6fAmSqlwFGqosBTKqDAjqqdwPUqm8B+q5jAHiyWwNCsk8COLZHAYZC/wKv5vMCmZrrA1Na3wMNJtcAPv7LAXTawwF6vrcDNKavAbaWowAwipsB8n6PAmR2hwEOcnsBfG5zA15qZwJkal8CVmpTAvhqSwAybj8B1G43AeK+7wCASucA1ebbALeSzwIZSscDOw67AmzeswJGtqcBdJafAt56kwF8ZosAhlZ/AzhGdwDyPmsBMDZjA34uVwN4Kk8A1ipDA0wmOwKqJi8CvCYnAq9W3wPcwtcB3kbLAlPavwMBfrcB4zKrARzyowMCupcCEI6PAPZqgwKISnsBwjJvAbweZwG6DlsBDAJTAyn2RwOX7jsB6eozAc/mJwL94h8BN+ITAzgO0wPtWscArsK7AvA6swBRyqcCl2abA6USkwGazocCwJJ/AY5icwCgOmsCzhZfAvv6UwBB5ksB29I/AwnCNwNHtisCCa4jAuemFwGBog8Bj54DAuzqwwAGFrcAc1qrAZS2owDiKpcD566LAGFKgwAy8ncBcKZvAlpmYwFUMlsBAgZPACPiQwGZwjsAe6ovA+2SJwM/ghsBzXYTAxdqBwFKxfsAOrnnATnuswOO7qcAhBKfAXVOkwOyoocArBJ/AfGScwE3JmcATMpfAUp6UwJcNksB7f4/Ao/OMwLxpisB/4YfArVqFwBDVgsB4UIDAeZl7wHaTdsCrjnHAYcaowH/8pcAVO6PAeoGgwADPncD9IpvAzXyYwNDblcBxP5PAJqeQwG4SjsDVgIvA9PGIwGplhsDm2oPAHVKBwJ+VfcCJiXjAmH9zwHd3bsDecGnAwRylwK1HosDWe5/AmLicwEv9mcBASZfAzpuUwE70kcAfUo/ArLSMwGYbisDOhYfAbPOEwNZjgsBZrX/AM5d6wKWEdcAqdXDATmhrwK9dZsD1VGHAL3+hwDyensA8x5vAl/mYwKo0lsDNd5PAUsKQwI4TjsDYaovAkceIwB8phsD0joPAjviAwOjKfMBzqnfA+45ywNF3bcBcZGjAFlRjwIdGXsBKO1nAU+6dwOwAm8AXHpjATkWVwP11ksCBr4/AMfGMwGA6isBjiofAj+CEwEQ8gsDPOX/A0wN6wIvVdMADrm/AYIxqwNtvZcDCV2DAe0NbwHoyVsBIJFHAt2qawGJwl8AjgZTAjZyRwBvCjsA78YvASimJwKFphsCSsYPAcACBwCWrfMCrYHfAPiBywLnobMARuWfAT5BiwJNtXcAVUFjAITdTwBciTsBrEEnAwPSWwCftk8AG8ZDADgCOwNMZi8DTPYjAfGuFwC+igsCDwn/AD1B6wKnrdMD6k2/AvEdqwLUFZcDBzF/A0JtawOlxVcAoTlDAwy9LwAIWRsBEAEHAYIeTwJ53kMBGbo3AdnCKwN59h8AWloTAn7iBwM/JfcChNHjAY7BywLw7bcBR1WfAzHtiwOMtXcBc6lfADrBSwOh9TcDtUkjAOC5DwPkOPsB59DjANx7xwGjK7sAWdezAVh7qwD7G58DnbOXAaBLjwNm24MBRWt7A5vzbwK2e2cC5P9fAHeDUwOl/0sAuH9DA+b3NwFdcy8BV+sjA/JfGwFc1xMBv0sHAUfrswJak6sCeTejAdfXlwCmc48DLQeHAbObewB+K3MD1LNrAAc/XwFNw1cD8ENPADLHQwJJQzsCa78vAM47JwGYsx8BAysTAyWfCwAoFwMAMor3A7dfowBCA5sBDJ+TAh83hwORy38BgF93AB7vawOVd2MAGANbAeKHTwEdC0cCC4s7ANILMwGohysAvwMfAj17FwJL8wsBDmsDAqje+wM7Uu8C3cbnATLfkwA1d4sAzAuDAtqbdwJJK28DF7djAU5DWwEIy1MCX09HAXHTPwJgUzcBWtMrAnlPIwHryxcD0kMPAEy/BwODMvsBjarzAowe6wKekt8B0QbXAuJjgwM473sCp3tvAM4HZwF4j18AfxdTAcGbSwFEH0MDAp83AwUfLwFfnyMCHhsbAVyXEwM7DwcDxYb/Ax/+8wFedusCmOrjAude1wJh0s8BGEbHAiHzcwKAc2sDmvNfAOF3VwHr90sCYndDAhD3OwDLdy8CcfMnAvhvHwJe6xMAmWcLAbve/wHGVvcAyM7vAtdC4wP5ttsARC7TA8qexwKZEr8Aw4azAIGPYwNv/1cA4ndPABzvRwCHZzsBkd8zAuRXKwAu0x8BMUsXAcPDCwHGOwMBILL7A9Mm7wHJnucDCBLfA5qG0wN4+ssCt26/AVHitwNcUq8A4sajA8UzUwOPl0cD3f8/A8BrNwJa2ysC+UsjAQ+/FwAiMw8D1KMHA98W+wAFjvMAFALrA/Zy3wOM5tcCy1rLAaHOwwAMQrsCDrKvA50ipwDLlpsBjgaTAfzrQwCzPzcCLZcvAS/3IwCmWxsDqL8TAX8rBwF5lv8DGAL3Ae5y6wGg4uMB61LXAo3CzwNkMscATqa7ASkWswHnhqcCdfafAtRmlwL61osC3UaDAWyzMwDu8ycBoTsfAguLEwDZ4wsA6D8DAUqe9wElAu8Dy2bjAKHS2wM0OtMDIqbHAA0WvwG3grMD6e6rAnReowFCzpcAKT6PAyOqgwIWGnsA+IpzALCPIwKOtxcAUO8PAC8vAwCVdvsAK8bvAboa5wBAdt8C4tLTANU2ywGDmr8AXgK3APhqrwLy0qMCAT6bAeeqjwJqFocDZIJ/ALrycwJJXmsAA85fApx/EwA2kwcAlLL/AbLe8wG9FusDE1bfAEWi1wAb8ssBfkbDA4CeuwFa/q8CXV6nAffCmwOqJpMDEI6LA9b2fwG1YncAc85rA942YwPMolsAJxJPAliLAwDCgvcBEIrvAP6i4wJwxtsDivbPApkyxwIrdrsA8cKzAcgSqwO+Zp8B+MKXA8MeiwB5goMDo+J3AMpKbwOQrmcDrxZbANmCUwLn6kcBnlY/A0yy8wNeiucArHrfALZ60wEYissDuqa/AqTStwAnCqsCtUajAP+OlwHV2o8AMC6HAzqCewIo3nMAXz5nAUmeXwBwAlcBemZLAATOQwPXMjcArZ4vASD+4wN+stcCpILPA9JmwwBsYrsCEmqvApSCpwP+ppsAiNqTAqcShwDxVn8CN55zAWXuawGYQmMCBppXAfz2TwDvVkMCVbY7AdAaMwMCficBnOYfA7Fq0wDS/scCaKq/AYZyswNcTqsBSkKfAOBGlwPqVosAZHqDAH6mdwKg2m8BXxpjA3VeWwPTqk8Bff5HA6xSPwGqrjMC2QorArdqHwDRzhcA0DIPAvYCwwM3arcDsPKvAVqaowEwWpsAYjKPAEQehwJmGnsAgCpzAIpGZwCkbl8DNp5TAsDaSwIDHj8D1WY3A0O2KwN2CiMDrGIbA06+DwHJHgcBXv33AvrGswKoAqsCYWKfAv7ikwFogosCojp/A8wKdwI18msDY+pfAQX2VwEIDk8BijJDAOBiOwGOmi8CPNonAcsiGwM1bhMBn8IHAIAx/wD05esDeZ3XA7u6owM8xpsCffqPAmdSgwPMynsDmmJvAsAWZwJp4lsD08JPAHm6RwILvjsCZdIzA6fyJwAOIh8CHFYXAH6WCwH82gMDLknvAMbt2wM3lccBKEm3AQzmlwDpvosAGsJ/A5fqcwBJPmsDCq5fALxCVwJV7ksA67Y/Ab2SNwI/gisAFYYjARuWFwNZsg8BG94DAZQh9wIcmeMBYSHPAUW1uwPyUacD0vmTAnpGhwOK5nsDK7ZvApyyZwLl1lsA7yJPAYSORwGSGjsCA8IvA+WCJwB/XhsBKUoTA5NGBwMGqfsCCuHnAKMx0wOvkb8AWAmvADSNmwEVHYcBHblzAyPidwKYSm8DhOJjA3mqVwO6nksBS74/ARUCNwPyZisCu+4fAl2SFwPnTgsAiSYDA1YZ7wHGEdsD9iXHAeJZswP6oZ8C/wGLACN1dwDb9WMC9IFTAY2+awEx6l8AqkpTAfraRwK/mjsAOIozA3meJwFu3hsC5D4TAMHCBwPGvfcCrjHjAJXVzwA5obsAtZGnAZWhkwLFzX8AqhVrA/ZtVwHO3UMDn1kvA7fWWwHbxk8Bo+pDAZRCOwO4yi8BsYYjAM5uFwIffgsCiLYDAdwl7wBDIdcCClXDAUHBrwA5XZsBnSGHAIENcwBlGV8BKUFLAxmBNwLt2SMBrkUPAYIeTwJx4kMA7co3AU3mKwIeNh8BdroTAP9uBwAYnfsDbrHjAdEZzwD3ybcCgrmjAEHpjwAtTXsAkOFnAAyhUwGohT8A1I0rAWSxFwOg7QMALUTvAsdjywOae8MC/Y+7ASyfswJvp6cDCqufA02rlwOMp48AE6ODATKXewMth3MCVHdrAudjXwEiT1cBRTdPA4AbRwALAzsDDeMzALDHKwEjpx8AfocXAIZruwCVe7MAbIerAB+PnwPKj5cDmY+PA8SLhwB/h3sCBntzAJFvawBcX2MBp0tXAJ43TwF9H0cAdAc/AbbrMwFpzysDtK8jAMOTFwCucw8DmU8HARV3qwNwe6MC63+XA2J/jwDZf4cDWHd/AvNvcwPGY2sB8VdjAaBHWwL/M08CMh9HA2EHPwK/7zMAbtcrAJW7IwNYmxsA238PATpfBwCRPv8C/Br3AZSLmwEnh48DSn+HA7l3fwJIb3cC12NrAVZXYwHJR1sAODdTALcjRwNWCz8AMPc3A2fbKwESwyMBTacbADSLEwHvawcCikr/AiUq9wDYCu8CuubjA1enhwLal38CkYd3AgR3bwDXZ2MCtlNbA30/UwMEK0sBQxc/AiX/NwGw5y8D68sjAOKzGwChlxMDOHcLAMNa/wFKOvcA5RrvA6f24wGe1tsC4bLTA+LPdwHls28B8JdnA0t7WwFeY1MDwUdLAhAvQwATFzcBjfsvAlzfJwJvwxsBrqcTABmLCwGsawMCb0r3AmIq7wGNCucAB+rbAc7G0wLxossDfH7DAP4HZwPY118Cv69TALaLSwD1Z0MC2EM7Ad8jLwGWAycBrOMfAd/DEwH6owsB2YMDAVxi+wB7Qu8DHh7nAUT+3wLr2tMAErrLAL2WwwDscrsAr06vAKVLVwJ8C08CjtNDA6mfOwDIczMBE0cnA8obHwBc9xcCU88LAUKrAwDZhvsA2GLzARM+5wFaGt8BkPbXAavSywGSrsMBOYq7AJxmswO7PqcCjhqfASifRwPbSzsDMgMzAcDDKwJDhx8Dnk8XAOUfDwFb7wMASsL7ATWW8wOgausDN0LfA6Ia1wCs9s8CI87DA9qmuwG9grMDqFqrAZs2nwN2DpcBOOqPASQHNwI+nysCuUMjANPzFwL+pw8D6WMHAnAm/wGW7vMAhbrrAoiG4wMLVtcBhirPAZj+xwLn0rsBKqqzACmCqwO0VqMDqy6XA+YGjwBM4ocA17p7A3+DIwBSBxsDfJMTAu8vBwDV1v8DmIL3Ads66wJd9uMAHLrbAjd+zwPmRscAhRa/A5PiswCStqsDJYajAvxamwPXLo8BegaHA7zafwJ/snMBmoprA3MbEwEFgwsAJ/r/Anp+9wHlEu8Aj7LjAMZa2wEdCtMAU8LHAVJ+vwMlPrcBBAavAkLOowJFmpsAlGqTAMc6hwJ+Cn8BeN53AXeyawJChmMDsVpbAI7TAwOdFvsDs3LvAini5wCcYt8A6u7TAR2GywOEJsMCotK3ASmGrwHwPqcABv6bAom+kwDIhosCI05/AhYadwAo6m8AC7pjAVqKWwPhWlMDZC5LArqm8wOwyusBbwrfAP1e1wO3wssDIjrDAQzCuwODUq8AwfKnAziWnwGTRpMCofqLAWC2gwDvdncAijpvA4j+ZwFnylsBopZTA91iSwO8MkMA/wY3Ah6i4wEsotsA9r7PAkjyxwIzPrsB8Z6zAwwOqwNKjp8AnR6XATu2iwOOVoMCMQJ7A/OybwO6amcApSpfAevqUwLWrksC2XZDAXRCOwI/Di8A1d4nAx7G0wBEnssCRpK/AbimtwNy0qsAbRqjAedylwFV3o8AcFqHASbiewGddnMAPBZrA5K6XwJZalcDgB5PAhLaQwE9mjsAUF4zArMiJwPZ6h8DWLYXAksawwFgwrsBjo6vA0h6pwMqhpsB+K6TAK7uhwB1Qn8Cw6ZzAToeawHEomMCgzJXAcnOTwIgckcCQx47AQ3SMwGEiisC10YfAEIKFwEszg8BC5YDAEuiswEZFqsDQrKfAzB2lwFeXosCVGKDAtaCdwPMum8CZwpjAAVuWwJH3k8DCl5HAGTuPwCrhjMCUiYrAAjSIwCzghcDSjYPAujyBwG7ZfcA8O3nAbBepwARnpsAAwqPAfSehwJOWnsBgDpzAB46ZwLQUl8CioZTAGDSSwG3Lj8AIZ43AXAaLwO6oiMBPTobAHPaDwP+fgcBcl37AzPF5wNxOdcAqrnDAvVWlwLmWosAc5J/ACj2dwJ+gmsD0DZjAJISVwFICk8Coh5DAYBOOwL6ki8AXO4nAz9WGwFl0hMA2FoLA7HV/wGjEesAxF3bArW1xwFbHbMC3I2jACqShwH/VnsBKFJzAn1+ZwKK2lsBwGJTAIoSRwNL4jsChdYzAufmJwFGEh8CrFIXAGqqCwAFEgMChw3vADgZ3wGROcsDZm23Aue1owGdDZMBanF/AOwOewFwkm8CkU5jAYZCVwMjZksD/LpDAI4+NwEz5isCUbIjAG+iFwAlrg8CT9IDA9Qd9wCExeMBpY3PAq51uwOPeacAmJmXAp3JgwLDDW8CfGFfAEHSawDSEl8Auo5TAadCRwDULj8DLUozAUKaJwOEEh8CYbYTAjd+BwL2zfsBot3nAgch0wInlb8AcDWvA9z1mwPR2YcAKt1zATf1XwOtIU8ArmU7AGfeWwMX1k8DJA5HAuSCOwANMi8D4hIjA1MqFwL0cg8DReYDAUMJ7wLejdsAQlnHAqJdswOKmZ8A6wmLAS+hdwM4XWcCYT1TAno5PwPDTSsC5HkbAYIeTwJl5kMAwdo3AMIKKwC6dh8CfxoTA1P2BwBSEfsDUJHnAJNxzwDSobsA1h2nAX3dkwP12X8BuhFrALJ5VwM/CUMAK8UvAsSdHwLVlQsAjqj3AT4/0wF9v8sA/TvDA9yvuwJII7MAd5OnAp77nwEKY5cD8cOPA6EjhwBQg38CR9tzAbszawLqh2MCBdtbA0ErUwLMe0sA18s/AX8XNwDuYy8DRasnAYTbwwPgT7sCz8OvAkMzpwJCn58C5geXAElvjwKUz4cB9C9/ApuLcwCu52sAYj9jAemTWwFs51MDHDdLAyeHPwGm1zcCyiMvAq1vJwF0ux8DPAMXAV9/rwDO66cCQlOfAYG7lwJtH48A8IOHAQ/jewLTP3MCRptrA4nzYwK5S1sD8J9TA1fzRwEHRz8BIpc3A83jLwEpMycBTH8fAF/LEwJrEwsDklsDAgornwFdi5cAUOuPAnhHhwOHo3sDPv9zAX5bawIts2MBSQtbAsxfUwLDs0cBNwc/AjpXNwHdpy8APPcnAWRDHwF7jxMAgtsLAp4jAwPdavsAVLbzAQDjjwLgM4cCI4d7AiLbcwJmL2sChYNjAjTXWwE8K1MDe3tHAM7PPwEmHzcAfW8vAtS7JwAwCx8Am1cTABajCwK16wMAgTb7AYx+8wHnxucBlw7fA/+jewLO53MA+i9rAZ13YwAIw1sDpAtTA/tXRwCmpz8BZfM3AgE/LwJIiycCJ9cbAX8jEwBGbwsCdbcDAA0C+wEISvMBd5LnAU7a3wCiItcDcWbPAOp3awLhp2MCXN9bAkAbUwGbW0cDnps/A6XfNwElJy8DuGsnAv+zGwKu+xMClkMLAomLAwJk0vsCFBrzAYti5wCuqt8Dge7XAgE2zwAofscB/8K7AglXWwEUd1MAE59HAZbLPwBt/zcDmTMvAjxvJwOnqxsDMusTAG4vCwLpbwMCVLL7Amv27wL3OucDzn7fAM3G1wHZCs8C4E7HA9eSuwCq2rMBXh6rAeRLSwOzUz8AEms3AVmHLwIQqycA+9cbAPsHEwEmOwsAvXMDAxSq+wOj5u8B8ybnAaJm3wJlptcD+ObPAiwqxwDXbrsDzq6zAv3yqwJRNqMBtHqbA2NTNwFGRy8ArUcnA5xPHwBXZxMBToMLATGnAwLgzvsBY/7vA+Mu5wGmZt8CGZ7XAMDazwEwFscDC1K7AgqSswHx0qsCjRKjA7hSmwFPlo8DNtaHAbp3JwC9Tx8AgDcXArcrCwFGLwMCaTr7AIRS8wI/bucCXpLfA9261wHg6s8DoBrHAINSuwP2hrMBhcKrANT+owGQOpsDe3aPAk62hwHh9n8CETZ3AI23FwFkbw8CgzsDAUIa+wM9BvMCYALrAM8K3wDaGtcBGTLPAExSxwFndrsDdp6zAa3OqwNk/qMACDabAxtqjwAupocC7d5/AxEadwBUWm8Ci5ZjA9UTBwLfqvsB/lrzAj0e6wDr9t8DmtrXAB3SzwCM0scDN9q7Ap7uswF6CqsCqSqjATxSmwBXfo8DRqqHAW3efwJJEncBaEpvAm+CYwEGvlsA7fpTA+SW9wEvCusCpZbjAQQ+2wFS+s8AwcrHAOSqvwN/lrMCmpKrAHGaowOIppsCi76PAEbehwO9/n8AFSp3AIxWbwCHhmMDcrZbANXuUwBRJksBiF5DAWhG5wCyjtsAgPbTAVN6xwPSFr8A7M63AeOWqwAecqMBaVqbA7hOkwFLUocAil5/ABFydwK4im8Dc6pjAVbSWwOd+lMBpSpLAtRaQwKzjjcA0sYvAVgi1wIeOssD/HbDAzrWtwAtVq8Dh+qjAiKamwExXpMCIDKLAqMWfwCmCncCWQZvAiAOZwKXHlsCejZTAL1WSwBsekMAx6I3ARLOLwC5/icDOS4fANAyxwJqFrsB2CazAyZapwKEsp8ATyqTASG6iwHUYoMDjx53A6nubwPUzmcB975bAC66UwDVvksCgMpDA+veNwP2+i8Bsh4nAE1GHwMIbhcBU54LARh6twLGJqsDDAKjAeYKlwNMNo8DdoaDAqj2ewGHgm8A0iZnAaTeXwFfqlMBmoZLAC1yQwM4ZjsBE2ovADZ2JwNdhh8BbKIXAWfCCwJq5gMDiB33A2D+pwBucpsAyBaTAHXqhwNb5nsBeg5zAvBWawAawl8BbUZXA8PiSwAamkMDzV47AGQ6MwO/HicD5hIfAykSFwAAHg8BIy4DAryJ9wN2xeMCrQ3TALXKlwCe+osAWGKDAAn+dwOvxmsDKb5jAoPeVwHKIk8BTIZHAYsGOwNBnjMDdE4rA28SHwCx6hcBDM4PAo++AwLhdfcAX4XjAuGh0wAT0b8B2gmvAcbahwBXxnsC6OpzAe5KZwGD3lsBnaJTAi+SRwMpqj8Aq+ozAupGKwJkwiMD01YXACoGDwCoxgcBqy33ANzx5wLyzdMAWMXDAfrNrwEI6Z8DLxGLArQ2ewA82m8BgbpjA1LWVwIcLk8CCbpDAxN2NwEZYi8AH3YjACmuGwF4BhMAen4HA74Z+wEzbecDuOXXAk6FwwBYRbMB2h2fAzANjwE2FXsBGC1rAvHiawBuOl8AutJTATeqRwK4vj8Bug4zAmeSJwCxSh8Ajy4TAek6CwGa2f8C24HrAGxp2wOhgccCQs2zArRBowPV2Y8BD5V7AkVpawPPVVcCcVlHARfiWwBP6k8ApDZHACTGOwBBli8B3qIjAXfqFwM1Zg8DHxYDAiXp8wIR+d8CClXLAmb1twPz0aMD7OWTABotfwLHmWsCwS1bA2rhRwCMtTcChp0jAYIeTwJd6kMAleo3AC4uKwNKsh8DZ3oTAXCCCwPXgfsCEnHnAZnF0wI9db8D1XmrAmXNlwI+ZYMAHz1vATBJXwM1hUsAXvE3A3R9JwPGLRMBE/z/AnEH2wFY79MAQNPLAyyvwwIwi7sBbGOzAQw3qwE8B6MCM9OXACefjwNHY4cD0yd/AfbrdwHuq28D4mdnAAInXwJ931cDdZdPAxVPRwF9Bz8CyLs3Apc7xwJrF78Dqu+3Ai7HrwHmm6cCxmufAOI7lwBOB48BHc+HA3mTfwOFV3cBYRtvATTbZwMol18DZFNXAggPTwM7x0MDF387Ab83MwNS6ysD5p8jAwl3twKxR68BVRenApjjnwJEr5cALHuPADxDhwJkB38Cq8tzARePawG3T2MAnw9bAerLUwGqh0sD/j9DAPn7OwDBszMDZWcrAQEfIwGo0xsBdIcTATO/owNnf5sCT0OTAV8HiwAqy4MCWot7A7JLcwAOD2sDSctjAVmLWwIxR1MB2QNLAFC/QwGgdzsB2C8zAQvnJwM7mx8Ah1MXAPcHDwCeuwcDimr/Aq4PkwH1w4sD2XeDA5EvewB463MCGKNrA/xbYwHgF1sDh89PALuLRwFjQz8Bavs3ALqzLwNWZycBNh8fAl3TFwLRhw8CmTsHAbzu/wBEovcCPFLvAVRvgwAAE3sDY7dvAnNjZwBbE18AYsNXAfZzTwCiJ0cAAds/A8mLNwO9Py8DsPMnA4CnHwMUWxcCVA8PATvDAwO7cvsB0ybzA4LW6wDGiuMBqjrbA1bbbwNua2cCkgNfA3mfVwEFQ08CTOdHAoyPPwEYOzcBc+crAyOTIwHTQxsBNvMTARKjCwE2UwMBhgL7Ad2y8wIpYusCWRLjAmTC2wJEctMB7CLLAxlbXwJo11cDVFtPAFPrQwP/ezsBLxczAuazKwBSVyMAufsbA4mfEwBBSwsCePMDAeCe+wIoSvMDI/bnAJum3wJrUtcAdwLPAqauxwDqXr8DMgq3A3PvSwNrU0MD4sM7AvI/MwLxwysCfU8jAFDjGwNkdxMC0BMLAdey/wPPUvcALvrvAoKe5wJuRt8Dme7XAcmazwDJRscAYPK/AHietwDsSq8Bp/ajA4abOwFJ5zMCtT8rAYynIwPgFxsD95MPAFMbBwOqov8A5jb3Aw3K7wFZZucDEQLfA6Ci1wKMRs8Db+rDAeOSuwGnOrMCeuKrACqOowKKNpsBeeKTAuljKwM4jyMCs88XArcfDwEGfwcDmeb/AKle9wKs2u8ATGLnAGPu2wHnftMABxbLAgKuwwM+SrsDKeqzAV2OqwFxMqMDFNabAgR+kwIIJosC685/AYxLGwDXVw8DEncHAVGu/wD49vcDrErvA1uu4wIzHtsClpbTAyYWywKpnsMAGS67Aoy+swE8VqsDh+6fANeOlwCzLo8Crs6HAnZyfwO+FncCRb5vA9dTBwIeOv8DeTr3AKRW7wKnguMCzsLbAroS0wBBcssBjNrDAPBOuwEDyq8Af06nAk7WnwGCZpcBSfqPAPmShwP5Kn8BwMp3AehqbwAMDmcD465bAo6G9wN5Qu8D8B7nAFsa2wFeKtMD9U7LAWSKwwM70rcDRyqvA5qOpwKJ/p8ClXaXAnj2jwEMfocBYAp/ApuacwP/LmsA7spjAOJmWwNqAlMAHaZLAt3m5wHAdt8A9yrTAIn+ywDU7sMCe/a3Al8WrwG+SqcCGY6fATDilwEUQo8AB66DAH8iewEqnnMA4iJrAqGqYwGNOlsA5M5TAARmSwJf/j8Dc5o3AkV61wIn1ssDXlrDAbEGuwEv0q8CGrqnAQm+nwLY1pcAvAaPACNGgwLGknsCqe5zAgFWawM8xmMBCEJbAivCTwGfSkcCftY/AAZqNwGB/i8CaZYnAnlGxwIvarsAZb6zALg6qwLu2p8C/Z6XASiCjwH3foMCQpJ7AyG6cwIE9msAnEJjAN+aVwD2/k8DSmpHAnniPwFJYjcCrOYvAbRyJwGUAh8Bo5YTAV1StwObNqsBnVKjAuealwMGDo8BtKqHAvNmewLmQnMCFTprAUhKYwGXblcAXqZPA0XqRwA1Qj8BVKI3AQQOLwHbgiMCkv4bAhaCEwNyCgsB2ZoDAMGipwBDRpsAxSKTAccyhwK9cn8DQ95zAv5yawHhKmMAGAJbAhbyTwCZ/kcAsR4/A6xONwMzkisBGuYjA4JCGwDJrhMDdR4LAkCaAwAgOfMD10XfAlI6lwIHlosDvS6DAycCdwO1Cm8A70ZjAlGqWwOQNlMAjupHAWm6PwKUpjcAv64rAO7KIwBp+hsAyToTA+CGCwObxf8BtpXvAxl13wEsac8Br2m7A1MihwKAMn8AYYZzAOcWZwO43l8AXuJTAkUSSwD7cj8AIfo3A5SiLwNzbiMAFlobAi1aEwK0cgsB2z3/AMW57wHEUd8A/wXLAvnNuwC0rasDi5mXAHRiewL1Hm8ASiZjAN9uVwCo9k8DXrZDAICyOwOG2i8D5TInAUu2GwOGWhMCpSILAwgGAwKiCe8A1DXfAyqFywCc/bsAw5GnA6Y9lwHJBYcAH+FzAaH2awAGYl8ArxZTAKASSwBZUj8D2s4zAtiKKwDWfh8BSKIXA6ryCwORbgMBrCHzAvml3wOzZcsBAV27AL+BpwFJzZcBmD2HASrNcwP9dWMCiDlTAcvmWwGL+k8CIFpHAV0GOwBZ+i8Dny4jAzCmGwLKWg8B9EYHADTJ9wF1YeMC2k3PA+eFuwClBasBqr2XABithwGuyXMAvRFjACt9TwNmBT8CYK0vAYIeTwJV7kMAZfo3A5pOKwHO8h8AN94TA1UKCwKI9f8DiE3rALQZ1wDsScMDINWvAnG5mwJm6YcC8F13AJoRYwBv+U8AHhE/AexRLwCuuRsDyT0LAH+/3wEsC9sCqFPTAOCbywPM28MDdRu7A/VXswFpk6sD+cejA8n7mwECL5MD1luLAGqLgwLus3sDittzAmcDawOrJ2MDe0tbAfNvUwM7j0sDb69DAgmLzwJly8cBFgu/AdZHtwB+g68A7runAx7vnwMPI5cAz1ePAG+HhwIDs38Bp993A3QHcwOQL2sCFFdjAxx7WwLMn1MBPMNLAoTjQwLBAzsCDSMzAJtjuwN7k7MCW8erAMP7owJcK58C5FuXAiyLjwAYu4cAmOd/A6EPdwE5O28BZWNnADGLXwGpr1cB5dNPAPH3RwLmFz8D1jc3A9JXLwLqdycBOpcfAbVDqwHBZ6MDoYubAqmzkwJN24sCJgODAdYrewEiU3MD2ndrAd6fYwMSw1sDbudTAucLSwF/L0MDM087ABNzMwAfkysDZ68jAfPPGwPP6xMBCAsPAyMvlwLHQ48CR1uHALt3fwFfk3cDl69vAuPPZwLb718DMA9bA6AvUwP8T0sAHHNDA+iPOwNMrzMCPM8rALDvIwKlCxsAHSsTARFHCwGNYwMBlX77AuErhwBRL38D2TN3AFFDbwC5U2cAQWdfAjl7VwINk08DSatHAYnHPwCB4zcD8fsvA6YXJwN+Mx8DWk8XAx5rDwK6hwcCKqL/AVq+9wBS2u8DAvLnA0s3cwBzJ2sCLxtjAw8XWwHPG1MBZyNLAO8vQwOnOzsA808zAEtjKwE7dyMDa4sbApOjEwJzuwsC19MDA5vq+wCcBvcBxB7vAwA25wBAUt8BdGrXAwlXYwGFL1sDVQ9TArj7SwIs70MAYOs7ADjrMwC87ysBIPcjALEDGwLhDxMDLR8LATUzAwCdRvsBIVrzAoVu6wCZhuMDOZrbAj2y0wGRyssBHeLDAR+PTwI7S0cBsxc/AXrvNwO6zy8C4rsnAY6vHwKSpxcA6qcPA7qnBwJKrv8D8rb3ADLG7wKS0ucCtuLfAE721wMXBs8C0xrHA1suvwCDRrcCK1qvAQHfPwGdfzcAATMvAbTzJwCUwx8CvJsXAox/DwKQawcBkF7/AnxW9wBoVu8CjFbnAEBe3wDwZtcAIHLPAWh+xwBwjr8A7J63AqCurwFUwqcA3NafAoRLLwMzyyMBW2MbAi8LEwMuwwsCIosDAR5e+wJuOvMAjiLrAkIO4wJiAtsD/frTAkH6ywB1/sMCBgK7AmoKswEyFqsB+iKjAHYymwBiQpMBflKLAgbbGwLaNxMBQa8LAgU7AwJQ2vsDjIrzA3RK6wAMGuMDl+7XAIPSzwF/uscBY6q/Ay+etwIHmq8BK5qnA/eanwHjopcCd6qPAUe2hwIDwn8AW9J3AEGTCwDwxwMDpBb7AM+G7wErCucByqLfABJO1wGuBs8Alc7HAvWevwM9ercACWKvAC1OpwKVPp8CZTaXAtUyjwMxMocC8TZ/AZE+dwKpRm8B1VJnAnRy+wJHeu8A8qbnAoHu3wNRUtcAENLPAcxixwHUBr8Bz7qzA5t6qwFfSqMBgyKbApMCkwNa6osCxtqDA+LOewHmynMAHsprAe7KYwLWzlsCYtZTAkeG5wAiXt8CAVrXA4x6zwDLvsMCCxq7A+qOswNqGqsBzbqjAK1qmwHdJpMDgO6LA+zCgwGoonsDcIZzACh2awLgZmMCvF5bAwhaUwMkWksChF5DAb7S1wA1cs8AHD7HANsyuwISSrMDtYKrAgzaowGsSpsDg86PAMtqhwMLEn8AFs53Af6SbwMOYmcBxj5fAN4iVwMuCk8DvfpHAa3yPwBB7jcC1eovAypaxwCMvr8BB1KzA8ISqwAZAqMBpBKbAFNGjwBWlocCOf5/AuF+dwN9Em8BjLpnAtBuXwFUMlcDW/5LA1/WQwAHujsAK6IzAseOKwL7giMAB34bAQYqtwN8Rq8C0p6jAgUqmwBD5o8A0sqHA0nSfwOE/ncBsEpvAlOuYwI3KlsCjrpTAMJeSwKSDkMB/c47AT2aMwLFbisBOU4jA2UyGwA9IhMC4RILAcZCpwOEFp8D1iqTAcR6iwBW/n8Coa53A/SKbwPXjmMCFrZbAtn6UwKZWksCGNJDAnheOwEn/i8Dy6onAF9qHwEXMhcAWwYPAMbiBwJBif8AwWHvA76qlwMYMo8Clf6DAVwKewJ+Tm8A7MpnA89yWwJWSlMACUpLALRqQwBvqjcDowIvAw52JwPB/h8DIZoXAtVGDwDJAgcCTY37AKUx6wHE5dsDMKnLAM9uhwCEon8Bih5zA1feZwEZ4l8B4B5XAK6SSwCFNkMAqAY7AJL+LwP+FicC+VIfAeSqFwF8Gg8Cx54DAiZt9wARwecDFS3XA3S1xwHsVbcDmAWnAjCKewGhZm8C7o5jAhgCWwKxuk8D57JDAMXqOwBIVjMBevInA426HwH4rhcAa8YLAur6AwOkmfcDm3HjA7Z10wKNocMDVO2zAcBZowIT3Y8A73l/AFIKawOahl8Ak1pTA+h2SwGx4j8Bf5IzAomCKwPbrh8AahYXAzyqDwOPbgMBbLn3AN7d4wFZQdMDh92/AKaxrwKhrZ8ABNWPA/AZfwIPgWsChwFbAnvqWwLAClMDlH5HAoVGOwBSXi8BG74jAHVmGwGnTg8DsXIHAyuh9wCoxecCLkHTAngRwwDaLa8BMImfAA8hiwKl6XsCzOFrAwABWwJPRUcAUqk3AYIeTwJN8kMANgo3Av5yKwBHMh8A4D4XAPmWCwBiaf8DminrAbJp1wCbGcMCVC2zASmhnwPLZYsBbXl7Ae/NZwHGXVcCGSFHAKgVNwPnLSMCym0TAYpf5wLzD98CC7/XAqBr0wCZF8sD7bvDAJ5juwK3A7MCR6OrA3A/pwJM258C/XOXAaYLjwJmn4cBYzN/ArvDdwKQU3MBBONrAjlvYwJB+1sBOodTAi/H0wH0a88BDQ/HAxWvvwPGT7cC6u+vAGuPpwAsK6MCNMObAoFbkwEV84sCCoeDAWsbewNLq3MDvDtvAuDLZwDNW18BkedXAUZzTwAC/0cB24c/AIE7wwF5z7sDgmOzAgb7qwCbk6MC2CefAIi/lwFxU48BceeHAHJ7fwJrC3cDS5tvAxgrawHYu2MDlUdbAFXXUwAmY0sDFutDAS93OwKD/zMDIIcvAja3rwLrO6cCo8OfAJBPmwAQ25MAlWeLAbnzgwMif3sAjw9zAcubawKsJ2cDHLNfAwk/VwJly08BJldHA0rfPwDPazcBv/MvAhh7KwHlAyMBKYsbASRDnwP4s5cD7SuPAAGrhwNOJ38BHqt3ANsvbwIDs2cAMDtjAxS/WwJpR1MB+c9LAaJXQwE+3zsAu2czA//rKwMAcycBvPsfAC2DFwJOBw8AGo8HA4nbiwKOO4MBFqN7Ac8PcwOff2sBl/djAuxvXwL061cBIWtPAQHrRwIyaz8AYu83A1NvLwLP8ycCqHcjAsT7GwMFfxMDVgMLA6aHAwPrCvsAF5LzA+OHdwDn028ABCdrA7B/YwKE41sDUUtTARm7SwL6K0MARqM7AFsbMwKzkysC6A8nAJiPHwOBCxcDWYsPA/ILBwEejv8Cvw73ALeS7wLoEusBTJbjAQVLZwGBe18DBbdXA6n/TwG+U0cD1qs/ALMPNwNHcy8Cn98nAfxPIwC4wxsCQTcTAhmvCwPiJwMDQqL7A+8e8wGvnusATB7nA6Sa3wORGtcD8ZrPAj8jUwNPN0sAo19DA/ePOwNLzzMA5BsvA0hrJwEoxx8BYScXAv2LDwEp9wcDNmL/AILW9wCPSu8C577nAzA24wEYstsAXS7TAMWqywIeJsMAPqa7AzUXQwGVDzsDyRczAy0zKwFxXyMAiZcbAqXXEwI6IwsB6ncDAIrS+wEXMvMCt5brAJwC5wI0bt8C6N7XAkFSzwPVxscDVj6/AG66twLjMq8Cf66nAB8vLwATAycD0usfAE7vFwLa/w8BDyMHAM9S/wBDjvcBz9LvAAQi6wG0duMByNLbA2Ey0wGpmssD/gLDAcJyuwJ24rMBr1arAwvKowI4Qp8C/LqXAZVnHwL5ExcAfN8PArS/BwKAtv8BIML3ACDe7wFZBucC3TrfAwl61wBpxs8BthbHAdpuvwPiyrcC9y6vAmeWpwGQAqMD8G6bARTikwCVVosCGcqDAMfLCwL7SwMCEu77Ai6u8wPOhusDynbjA0562wPajtMDNrLLA3LiwwLXHrsD52KzAU+yqwHsBqcAyGKfAQjClwHpJo8CzY6HAyH6fwJqancARt5vA1pa+wFJrvMBRSbrAwC+4wKYdtsAdErTAWAyywKALsMBPD67A1xaswLYhqsB9L6jAyT+mwERSpMCkZqLAp3ygwBWUnsC9rJzAc8aawBPhmMB+/JbA3Ui6wOYPuMDW4bXAf72zwM6hscDDja/Ad4CtwBh5q8DtdqnATXmnwKV/pcBziaPAQ5ahwLGln8Blt53AEsubwHTgmcBR95fAdw+WwLkolMDxQpLA6Am2wAfCs8CChrHAGlavwJ8vrcD7EavAKvyowELtpsBu5KTA8eCiwCDioMBm557APPCcwC38msDTCpnA0xuXwN4ulcCvQ5PAC1qRwLxxj8CXio3AstuxwFmDr8DkOK3AAvuqwHDIqMD8n6bAi4CkwBlposC3WKDAjU6ewNtJnMD1SZrAP06YwDRWlsBbYZTAS2+SwKd/kMAgko7Ab6aMwFW8isCe04jAAMCtwJdVq8Cj+qjAyK2mwLNtpMAeOaLA1g6gwLvtncDH1JvAB8OZwKO3l8DVsZXA7rCTwFO0kcB5u4/A58WNwDHTi8D54onA7fSHwMQIhsBAHoTAmripwIg6p8B7zaTAFnCiwP0goMDZ3p3AY6ibwGV8mcC+WZfAYj+VwF4sk8DVH5HAABmPwC0XjcC+GYvAJiCJwOkph8CbNoXA20WDwFVXgcB/1X7APselwPQzo8A0s6DAqkOewPnjm8DCkpnArk6XwHQWlcDb6JLAwMSQwBSpjsDhlIzAR4eKwH1/iMDOfIbAmX6EwFGEgsB3jYDANjN9wLpQecDNcnXAjO2hwJZDn8CVrZzASyqawGW4l8CFVpXATQOTwGS9kMB/g47AYlSMwOguisD/EYjArvyFwBTug8Bk5YHAzsN/wPXFe8Ab0HfAQOFzwIL4b8AcFWzA+SyewA1rm8BYvpjAwCWWwAqgk8DkK5HA8MeOwM9yjMAoK4rArO+HwB6/hcBWmIPAQXqBwMXHfsCsqHrAmZV2wBuNcsDnjW7A15ZqwOmmZsA2vWLAv4aawMmrl8AY55TAwTeSwK6cj8CmFI3AWJ6KwGY4iMBy4YXAHpiDwB1bgcBfUn7AUgJ6wOrDdcArlXHARHRtwJVfacCnVWXAKlVhwPVcXcACbFnAyvuWwP4GlMBBKZHA5mGOwAiwi8CSEonATYiGwOsPhMAPqIHArp5+wNEIesDii3XAYCVxwPDSbMBjkmjAtmFkwBY/YMDdKFzAjh1YwNgbVMCNIlDAYIeTwJF9kMABho3Al6WKwKvbh8BaJ4XAlYeCwE/2f8CGAXvAFi52wD55ccBE4GzAgWBowHH3Y8Cyol/AEmBbwIotV8BBCVPAjfFOwO3kSsAK4kbA6zn7wCZ/+cAJxPfAggj2wIVM9MAJkPLACtPwwIYV78B+V+3A9JjrwO7Z6cBvGujAf1rmwCKa5MBh2eLAQRjhwMhW38D+lN3A6dLbwI4Q2sD0TdjAVHv2wNK89MBl/vLA8D/xwFqB78CRwu3AiQPswDlE6sCZhOjAqMTmwGQE5cDNQ+PA5YLhwK7B38ArAN7AYT7cwFJ82sAEutjAevfWwLg01cDDcdPAUr/xwML878C/Ou7AHHnswLe36sBy9ujANzXnwPVz5cCesuPAKfHhwI8v4MDJbd7A1qvcwLTp2sBhJ9nA4GTXwDCi1cBT39PASxzSwBtZ0MDElc7AVgbtwFs/68BueenAVbTnwN/v5cDmK+TAR2jiwOmk4MC14d7Amx7dwIxb28B/mNnAa9XXwEkS1sAWT9TAzYvSwG7I0MD3BM/AaEHNwL99y8D/ucnA5FDowA+F5sDXuuTA8vHiwCMq4cAzY9/A95zdwEnX28AMEtrAJk3YwIGI1sAOxNTAvv/SwIY70cBdd8/APbPNwCDvy8AAK8rA3WbIwLKixsB/3sTAkp/jwGPO4cBv/9/AXDLewNtm3MCpnNrAjNPYwFQL18DaQ9XA+nzTwJi20cCb8M/A8SrOwIhlzMBSoMrARNvIwFYWx8B/UcXAuYzDwP/HwcBOA8DAC/PewO4b3cC9R9vACHbZwHCm18Ci2NXAVgzUwFBB0sBbd9DATa7OwP7lzMBQHsvAJ1fJwG2Qx8APysXA/APEwCg+wsCGeMDADbO+wLbtvMB7KLvAEkzawF5u2MBZlNbAfr3UwFnp0sCIF9HAskfPwI15zcDZrMvAXuHJwO0WyMBdTcbAjITEwF28wsC29MDAgS2/wK5mvcAroLvA7dm5wOgTuMATTrbAh6vVwHnG08Dy5dHAVwnQwCAwzsDTWczACobKwGm0yMCk5MbAdRbFwKJJw8D6fcHAUbO/wIHpvcBsILzA9Ve6wAWQuMCJyLbAbwG1wKg6s8ApdLHAZhLRwCAlz8BSPc3AR1rLwF97ycAOoMfA2MfFwFDyw8AbH8LA5U3AwGh+vsBnsLzArOO6wAsYucBcTbfAfYO1wFC6s8C88bHArCmwwA1irsDPmqzAzIHMwFKLysBbm8jAF7HGwMzLxMDX6sLApw3BwL0zv8CqXL3ADYi7wJG1ucDt5LfA4BW2wDRItMC5e7LARbCwwLTlrsDnG63Aw1KrwDKKqcAewqfA9frHwC76xcAPAcTArQ7CwDMiwMDkOr7AGVi8wD55usDPnbjAW8W2wH/vtMDhG7PAN0qxwD56r8C8q63AgN6rwF0SqsAwR6jA1nymwDOzpMAv6qLARX/DwPVywcCQb7/ADHS9wHt/u8ADkbnA5Ke3wHPDtcAY47PATgaywKAssMClVa7ABoGswHOuqsCn3ajAZw6nwIBApcDDc6PAC6ihwDTdn8AhE57AQRC/wAz3vMAi6LrAW+K4wKvktsAf7rTA2f2ywBcTscAqLa/AdkutwHNtq8CqkqnAsLqnwCrlpcDGEaTAP0CiwFZwoMDWoZ7AkNScwFwIm8AWPZnAj6+6wPuHuMAsbLbA31q0wOtSssBAU7DA5lquwP1orMC/fKrAeJWowIyypsBw06TAp/eiwMceocBySJ/AU3SdwCOim8Ci0ZnAmgKYwNo0lsA4aJTA9F62wGsntMA5/bHAA9+vwIXLrcCSwavAFcCpwBTGp8Cs0qXAEuWjwJL8ocCKGKDAbTiewL5bnMAOgprA/KqYwDXWlsBtA5XAZDKTwOFikcCzlI/AUSCywCXXr8D2nK3AVXCrwOVPqcBgOqfAlC6lwGoro8DjL6HAGzufwENMncCjYpvAmH2ZwJGcl8APv5XAouSTwOYMksCFN5DANGSOwK+SjMC9worAkfWtwAiZq8AsTanAgxCnwJ3hpMAbv6LAsqegwC6ansB2lZzAh5iawHmimMB7spbA0seUwNjhksD7/5DAuCGPwJ1GjcBFbovAWZiJwIrEh8CV8oXAqeCpwARvp8C9D6XAWcGiwFyCoMBVUZ7A4SycwLQTmsCWBJjAav6VwCsAlMDuCJLA3xeQwEAsjsBqRYzAxmKKwNGDiMAWqIbAL8+EwML4gsCAJIHAf+OlwAlbo8CZ5qDAu4SewPMznMDD8pnAub+XwHCZlcCYfpPA+G2RwG9mj8D1Zo3AnG6LwI58icAKkIfAZqiFwArFg8Bv5YHAIAmAwGlffMCisXjA3/+hwP9en8Cx05zAmVyawET4l8A1pZXA72GTwPwskcD2BI/AiuiMwH3WisCpzYjABs2GwKLThMCk4ILASfOAwMcVfsC1TXrASo12wJjTcsDJH2/AZDeewK18m8Dq2JjA5EqWwELRk8CRapHAVRWPwBDQjMBKmYrAnG+IwK9RhsBFPoTAODSCwHsygMAzcHzAcIh4wCKsdMDr2XDAkxBtwAZPacBPlGXAaouawKu1l8AH+JTAflGSwNvAj8DIRI3A1NuKwIGEiMBQPYbAygSEwITZgcBMdH/A3kp7wGw0d8DXLnPAMDhvwLxOa8DrcGfAWp1jwMzSX8ArEFzA9vyWwEsLlMCcMpHAJ3KOwPHIi8DJNYnAW7eGwDZMhMDe8oHAp1N/wDrfesCbhXbAGERywCgYbsB0/2nA2fdlwGL/YcBOFF7ACzVawC9gVsB7lFLAYIeTwI9+kMD1iY3Abq6KwEDrh8BzP4XA2qmCwCIpgMC6d3vAH8F2wHIrcsC9s23AJFdpwPASZcCT5GDAsclcwCDAWMDqxVTARtlQwJ34TMCDIknAQtb8wAQ0+8CwkfnALe/3wGlM9sBVqfTA6AXzwB1i8cDvve/AXRnuwGl07MAUz+rAYSnpwFSD58Dw3OXAPDbkwDqP4sDx5+DAZEDfwJmY3cCV8NvAcv/3wCBZ9sAqs/TAag3zwMNn8cAdwu/AZxzuwJJ27MCU0OrAZirpwAOE58Bo3eXAkjbkwIOP4sA76ODAukDfwASZ3cAZ8dvA/kjawLSg2MA/+NbAWSvzwKGA8cC/1u/Agi3uwMCE7MBX3OrALDTpwCeM58A45OXAUDzkwGOU4sBq7ODAX0TfwDyc3cD+89vApEvawCyj2MCW+tbA4lHVwBGp08AjANLAdFruwPKq7MDP/OrAyU/pwKqj58BD+OXAcE3kwA+j4sAG+eDAQU/fwK2l3cA7/NvA4VLawJWp2MBQANfADFfVwMSt08B1BNLAHlvQwLuxzsBMCM3ATo3pwJDY58DHJebAoHTkwNbE4sAuFuHAdWjfwIO73cAzD9zAaGPawAi42MD+DNfAOmLVwKy308BJDdLACGPQwN+4zsDJDs3AwGTLwMC6ycDGEMjAhcTkwAgK48AkUuHAdZzfwKXo3cBrNtzAiYXawMfV2MD5JtfA+HjVwKLL08DbHtLAi3LQwJ/GzsAFG83AsG/LwJPEycCjGcjA2m7GwC/ExMCeGcPA0gDgwPw/3sB1gtzAxcfawIYP2cBeWdfA/6TVwCfy08CbQNLALJDQwK/gzsD/Mc3A/4PLwJLWycCkKcjAIX3GwPjQxMAbJcPAf3nBwBrOv8DiIr7ABEPbwCJ72cBct9fAIvfVwPo51MB3f9LAPcfQwPkQz8BnXM3ASanLwGz3ycChRsjAw5bGwK/nxMBKOcPAeovBwCrev8BJMb7AxYS8wJLYusClLLnAB4zWwE+81MCU8dLALyvRwJBoz8A2qc3AsuzLwKMyysC0esjAnMTGwBwQxcD8XMPADavBwCX6v8AhSr7A4Zq8wEvsusBJPrnAxpC3wLDjtcD6NrTA59zRwHAE0MDxMc7AqWTMwPCbysAu18jA4RXHwJZXxcDnm8PAfuLBwA8rwMBWdb7AGsG8wCkOu8BXXLnAf6u3wH/7tcA9TLTAnZ2ywIzvsMD3Qa/A0jbNwJNUy8BjecnAZqTHwNfUxcAHCsTAXkPCwFWAwMB1wL7AVgO9wJ1Iu8D9j7nAL9m3wPgjtsAjcLTAg72ywPELscBJW6/AbautwET8q8C3TarAG5vIwOqtxsD9yMTAWevCwB4UwcCCQr/A1HW9wHetu8Dg6LnAlye4wC9ptsBMrbTAnfOywNo7scDEha/AJtGtwM8drMCYa6rAW7qowPgJp8BWWqXAOQvEwMoRwsDxIcDAlzq+wLtavMB4gbrABK64wKfftsDCFbXAx0+zwDqNscCsza/AvxCuwB5WrMCAnarApOaowFMxp8BbfaXAkcqjwM8YosD2Z6DAzYi/wK2BvcCYhbvAVJO5wMOpt8Dix7XAyuyzwKkXssDHR7DAgHyuwEW1rMCU8arA/zCpwCNzp8Cqt6XASP6jwLtGosDKkKDAQdyewPUoncC+dpvAnBW7wDj/uMBw9bbA7Pa0wHACs8DZFrHAITOvwFtWrcC1f6vAca6pwOrhp8CMGabA1FSkwFGTosCe1KDAYhifwFBencAlppvApO+ZwJo6mMDZhpbAi7O2wDCMtMAdc7LA4WawwB9mrsCXb6zAJIKqwLucqMBtvqbAYuakwNwTo8AxRqHAynyfwCO3ncDI9JvAUjWawGZ4mMC1vZbA+gSVwPhNk8B5mJHAoGSywIAqsMBsAK7A2+SrwFbWqcB/06fAE9ulwOfro8DuBKLANSWgwONLnsA0eJzAfamawCXfmMCkGJfAg1WVwFuVk8DP15HAjhyQwFFjjsDaq4zA8SquwC7cq8BHn6nApnKnwL5UpcAYRKPAUD+hwB9Fn8BZVJ3A7WubwOWKmcBjsJfAo9uVwPULlMC9QJLAc3mQwJ61jsDT9IzAtDaLwO96icA7wYfAmwiqwFCjp8C2UaXAMhKjwCnjoMAPw57AZrCcwMupmsDzrZjArbuWwOfRlMCl75LACRSRwEo+j8C2bY3AsKGLwKzZicAwFYjAz1OGwCmVhMDq2ILAsv+lwASCo8DRGaHAhsWewIaDnMA3UprABzCYwHkblsAlE5TAvRWSwA4ikMABN47AmVOMwPR2isBHoIjA3c6GwBYChcBmOYPATnSBwMJkf8B75nvALBKiwFp6n8C0+ZzAvI6awOA3mMCC85XAB8CTwNubkcB/hY/AiHuNwKV8i8Cfh4nAXpuHwOC2hcBB2YPAswGCwIAvgMAJxHzAYzF5wBGmdcAyIXLAzkGewEeOm8Bv85jA8G+WwFAClMD+qJHAW2KPwMssjcC5BovAo+6IwBvjhsDO4oTAguyCwBr/gMApM37AEXZ6wEzFdsBnH3PAG4NvwEPva8DfYmjAFZCawIq/l8DxCJXALmuSwPLkj8DDdI3AERmLwD7QiMCtmIbAx3CEwAdXgsD+SYDAq5B8wKGheMCgxHTAm/dwwL04bcBihmnAE99lwIFBYsCHrF7AIv6WwJkPlMD1O5HAY4KOwM/hi8DrWInAQuaGwESIhMBTPYLA0QOAwE20e8CXfXfAnmBzwK1ab8BHaWvAJ4pnwDy7Y8Cs+l/Ay0ZcwB+eWMBX/1TAYIeTwIx/kMDojY3ARLeKwNL6h8CBV4XACcyCwPhWgMB77XvAelN3wLDccsDphW7AFUxqwEksZsDNI2LAHjBewPFOWsAwflbA+7tSwKIGT8CnXEvA7mv+wNPh/MDnV/vAC875wCdE+MAouvbA/y/1wKKl88AIG/LALpDwwBAF78Csee3AA+7rwBVi6sDl1ejAc0nnwMS85cDaL+TAuaLiwGIV4cDbh9/AeH35wPHu98AOYfbApNP0wJFG88C4ufHAAC3wwFmg7sCzE+3AAofrwD/66cBibejAZ+DmwEtT5cAMxuPAqTjiwCGr4MB1Hd/Apo/dwLQB3MCic9rA2ZH0wI/+8sBrbPHAMtvvwLZK7sDPuuzAXSvrwESc6cBuDejAyH7mwEXw5MDXYePAdtPhwBlF4MC6tt7AVijdwOmZ28BvC9rA6HzYwFLu1sCsX9XAk6nvwCMR7sBkeuzAD+XqwOZQ6cC2vefAUyvmwJqZ5MBsCOPArXfhwEnn38AuV97ATcfcwJk328AIqNnAkRjYwC6J1sDZ+dTAjmrTwEnb0cAGTNDAO8XqwDAn6cBwi+fAovHlwHxZ5MC8wuLALC3hwJyY38DkBN7A4nHcwHjf2sCPTdnAELzXwOsq1sAQmtTAcgnTwAh50cDH6M/AqljOwKjIzMC+OMvAfOXlwExB5MARoOLAYQHhwOBk38A/yt3AODHcwJGZ2sAYA9nAoG3XwATZ1cAlRdTA57HSwDIf0cDyjM/AFfvNwI5pzMBQ2MrAT0fJwIK2x8DiJcbAFwvhwCNg38DhuN3A0xTcwIpz2sCm1NjA1DfXwMyc1cBPA9TAJ2vSwCfU0MAlPs/A/qjNwJYUzMDRgMrAmu3IwN5ax8CLyMXAkzbEwOqkwsCGE8HA5jbcwHeE2sCM1tjAkCzXwAGG1cBr4tPAa0HSwKqi0MDdBc/AwmrNwCDRy8DGOMrAiaHIwEQLx8DWdcXAJOHDwBVNwsCVucDAkCa/wPaTvcC7AbzA5WnXwCav1cDW+dPARknSwN2c0MAU9M7Ac07NwJWry8AfC8rAwmzIwDrQxsBLNcXAwZvDwG8DwsAubMDA3NW+wFlAvcCNq7vAYRe6wMCDuMCZ8LbALqXSwCzh0MCfI8/AvGvNwNC4y8A9CsrAeF/IwAe4xsCBE8XAh3HDwMjRwcD9M8DA6Je+wFL9vMANZLvA7su5wNI0uMCZnrbAJgm1wGN0s8A64LHA/+nNwKYbzMDlVMrA05TIwKHaxsCXJcXAFXXDwIvIwcB9H8DAfXm+wCrWvMAyNbvASZa5wC/5t8CtXbbAkMO0wK4qs8DgkrHABfyvwABmrsC50KzAvjnJwNZfx8DIjsXAjMXDwDQDwsDtRsDA/o++wL/dvMCgL7vAIIW5wM/dt8BJObbAOZe0wFL3ssBRWbHA/byvwCEirsCRiKzAJvCqwLxYqcA3wqfA+5XEwCWvwsCM0sDACP++wIszvcAlb7vA/bC5wFf4t8CIRLbA/ZS0wDHpssCyQLHAGpuvwBD4rcBFV6zAd7iqwGcbqcDhf6fAt+WlwMFMpMDZtKLAbgDAwCMLvsCdIbzAkEK6wMxsuMBCn7bA/di0wCEZs8DtXrHAtamvwOD4rcDpS6zAWqKqwMv7qMDhV6fAS7alwMQWpMANeaLA79ygwDxCn8DIqJ3A+Xq7wI51ucCPfbfAkJG1wECws8Bt2LHAAgmwwAdBrsCdf6zAAMSqwH8NqcCAW6fAeq2lwPUCpMCHW6LA07agwIYUn8BYdJ3ACtabwGU5msA2npjApge3wErwtMAi6LLAoe2wwFj/rsDyG63AOEKrwBNxqcCGp6fAr+SlwMcnpMAZcKLACr2gwA0On8CpYp3AcLqbwAUVmsAScpjATtGWwHgylcBYlZPAnKiywGN9sMA9Y67AhliswLBbqsBFa6jA7oWmwHGqpMCz16LAsgyhwItIn8Bxip3AsNGbwKcdmsDIbZjAl8GWwKYYlcCTcpPACc+RwLwtkMBrjo7AHGCuwAIfrMDu8KnAKdSnwAzHpcAEyKPAm9WhwHTun8BTEZ7AFz2cwL1wmsBeq5jAKuyWwGkylcB5fZPAysyRwN0fkMBCdo7Alc+MwIAri8C3iYnAbzCqwGnXp8Bhk6XAmWKjwFpDocD5M5/A4TKdwJc+m8C8VZnAEHeXwG6hlcDS05PATw2SwBNNkMBlko7An9yMwC8ri8CTfYnAWtOHwCAshsCLh4TA1RumwOGoo8DYTKHABgafwK3SnMASsZrAip+YwH2clsBsppTA9buSwNPbkMDhBI/AFTaNwH9ui8BNrYnAwPGHwDI7hsANiYTAz9qCwAQwgcCLEH/AciSiwKeVn8CbH53AscCawDR3mMBmQZbAix2UwPUJksAKBZDARw2OwEchjMDEP4rAkmeIwKWXhsANz4TA8QyDwJNQgcCPMn/A8sx7wEVveMCdGHXANUyewNyfm8DmDZnA4ZSWwDIzlMAl55HA+q6PwPaIjcBnc4vAsWyJwE9zh8DYhYXAAaODwJ/JgcA/8X/AIV58wC/YeMDkXXXA6O1xwAqHbsA9KGvAv5SawGjJl8DVGZXA0oSSwO8IkMCTpI3AC1aLwJkbicB+84bACNyEwJjTgsCl2IDAidN9wFILesBCVnbANrJywEAdb8CllWvA3hlowI6oZMB/QGHAT/+WwOUTlMBMRZHAmpKOwKL6i8D2e4nAAhWHwBLEhMBph4LASF2AwPOHfMC5c3jAzHp0wFGacMCkz2zAXxhpwFhyZcCb22HAaVJewDXVWsCeYlfAYIeTwIqAkMDckY3AGMCKwF4KiMCEb4XAI+6CwKeEgMC/YnzAHeV3wOeMc8CyVm/ANT9rwFdDZ8AzYGPAI5NfwLrZW8DIMVjAUplUwJYOUcACkE3Ad/r/wA2I/sAcFv3AfaT7wBMz+sDHwfjAhVD3wD7f9cDlbfTAc/zywOGK8cApGfDASafuwD417cAHw+vApVDqwBje6MBga+fAgPjlwHiF5MBKEuPA/vT6wM99+cCQB/jAEpL2wCod9cC4qPPAnzTywMnA8MAjTe/AndntwCpm7MDC8urAXH/pwPEL6MB+mObA/iTlwHCx48DQPeLAH8rgwFpW38CD4t3AcvL1wCd29MBQ+/LAroHxwA4J8MBCke7AJhrtwJmj68CALerAx7fowFlC58AozeXAJljkwEjj4sCHbuHA2/nfwD2F3sCpEN3AHJzbwJEn2sAIs9jAYPPwwJJx78DI8e3AtHPswBb36sCze+nAXQHowOmH5sA1D+XAI5fjwJkf4sCBqODAyjHfwGO73cA/RdzAU8/awJZZ2cAA5NfAiW7WwC351MDng9PAZvjrwJ1w6sB26+jAlGjnwKXn5cBkaOTAlOriwAFu4cCA8t/A6XfewBv+3MD7hNvAbwzawGOU2MDEHNfAhKXVwJQu1MDqt9LAfEHRwEDLz8AxVc7AOALnwOdz5cDo6OPAyWDiwCrb4MC1V9/AIdbdwC5W3MCl19rAVlrZwBje18DGYtbAQujUwHFu08A79dHAjXzQwFQEz8CCjM3ACRXMwN+dysD4JsnAohHiwCV84MC96t7A41zdwCTS28AYStrAacTYwMhA18D0vtXAsD7UwMy/0sAZQtHAc8XPwLhJzsDKzszAkVTLwPXaycDjYcjATOnGwB9xxcBQ+cPAiyfdwCWK28Cs8dnAg13YwCHN1sAMQNXA3LXTwDQu0sDEqNDARiXPwH2jzcA0I8zAO6TKwGomycCeqcfAty3GwJmyxMAtOMPAXr7BwBpFwMBQzL7A+0TYwNCe1sCE/tTAYWPTwMTM0cAgOtDA+KrOwOEezcB6lcvAcQ7KwHyJyMBbBsfA14TFwL8ExMDohcLAKwjBwGmLv8CDD77AYZS8wOwZu8AQoLnAGWvTwC670cAwEtDATG/OwMXRzMD3OMvAUKTJwFETyMCJhcbAlfrEwCFyw8Df68HAj2fAwPXkvsDgY73AIOS7wJBlusAN6LjAeGu3wLbvtcCvdLTANZvOwGrgzMC6LcvAMYLJwPfcx8BNPcbAiKLEwBUMw8BwecHAJuq/wNJdvsAa1LzAsky7wFTHucDFQ7jAzsG2wEJBtcD3wbPAykOywJnGsMBKSq/AydbJwNcPyMBQUsbAHp3EwEnvwsD0R8HAXKa/wNQJvsDDcbzApd26wAJNucByv7fAmzS2wCystMDeJbPAdKGxwLYesMB0na7AhB2twMCeq8AGIarAdx/FwPBKw8BHgcHAQsG/wMgJvsDdWbzAoLC6wEoNucAqb7fAptW1wDRAtMBbrrLAsR+xwNiTr8B+Cq7AWoOswC3+qsC9eqnA2finwFZ4psAL+aTAE3fAwFyTvsAcvLzA9O+6wKgtucAZdLfAR8K1wE4XtMBjcrLA09KwwP43r8BZoa3AaQ6swMB+qsD/8ajA0menwO7fpcASWqTAA9aiwI5TocCH0p/AnN+7wPHqucB6BLjAtSq2wEJctMDel7LAZtywwNYor8BIfK3A69WrwAo1qsAEmajASAGnwFptpcDL3KPAOU+iwE3EoMC8O5/AQrWdwKQwnMCtrZrAO1u3wK9TtcA5XLPANHOxwBqXr8CHxq3AMgCswPdCqsDOjajAyt+mwBo4pcAGlqPA5/ihwC1goMBZy57A+DmdwKerm8AOIJrA4JaYwNcPl8C3ipXAPuyywMTPsMBexa7ASsuswOLfqsCcAanADS+nwOtmpcAOqKPAaPGhwAxCoMAjmZ7A8/WcwNNXm8AwvpnAhyiYwGaWlsBnB5XAMHuTwHPxkcDoaZDAD5WuwIBhrMAYQqrAATWowHc4psDRSqTAf2qiwBWWoMBFzJ7A4QudwNlTm8A7o5nAMfmXwPlUlsDrtZTAcBuTwASFkcAy8o/Ak2KOwMvVjMCJS4vAI1iqwE0LqMC51KXAiLKjwOSiocAHpJ/AQbSdwAPSm8DZ+5nAczCYwJ9ulsBMtZTAggOTwGhYkcA6s4/AThOOwAt4jMDq4IrAdE2JwEC9h8DyL4bA6DemwJ/Po8Csf6HANkafwF4hncBMD5vANw6ZwG4cl8BaOJXAiGCTwKKTkcB00I/A5xWOwAJjjMDotorA1RCJwBlwh8Aa1IXATzyEwECogsCCF4HAsjaiwOSwn8BlRZ3AdPKawDq2mMDYjpbAc3qUwD53ksCHg5DAtJ2OwE7EjMD69YrAgTGJwMt1h8DawYXAzxSEwOFtgsBhzIDAYl9+wI4ue8BQBXjAmVaewGmxm8BPKJnAt7mWwOVjlMABJZLALPuPwInkjcBK34vAuOmJwDgCiMBNJ4bAm1eEwOeRgsAU1YDAR0B+wGTkesDslHfAdlB0wMcVccDE423AaJmawEPTl8C0KpXAaJ6SwNIskMA21I3AvpKLwIpmicC7TYfAg0aFwCZPg8AHZoHATBN/wEZxe8B+43fAtmd0wOv7cMBPnm3ASk1qwHAHZ8CBy2PAewCXwDIYlMChTpHAzKKOwGcTjMDononAlUOHwJv/hMAZ0YLAL7aAwBZafcDjZ3nAgJJ1wOfWccBUMm7AQaJqwGokZ8DFtmPAgFdgwP4EXcDOvVnAYIeTwIiBkMDOlY3A6siKwOUZiMB7h4XAJRCDwC2ygMB/13zA+XV4wAc8dMACJnDAajBswPZXaMCbmWTAi/JgwD5gXcBn4FnA9nBWwBYQU8AjvE/AtMAAwRkTAMG/y/7A5HH9wIAY/MB2v/rArmb5wBUO+MCatfbAMV31wNAE9MBurPLABVTxwJH778ANo+7AdkrtwMvx68ALmerANUDpwEjn58BFjubAm2X8wEcF+8AxpvnAJEj4wPLq9sB0jvXAizL0wBvX8sAOfPHATyHwwM/G7sCBbO3AWhLswFC46sBbXunAdwTowJ2q5sDKUOXA+vbjwCqd4sBZQ+HAy0z3wAHn9cD8gvTAeCDzwDy/8cAXX/DA3//uwHGh7cCsQ+zAeObqwL6J6cBrLejAb9HmwLt15cBGGuTABL/iwO1j4cD6CODAJa7ewGlT3cDB+NvAjTfywOXL8MCVYu/ASvvtwL+V7MC0MevA987pwFlt6MCzDOfA5KzlwM1N5MBX7+LAbJHhwPgz4MDs1t7AOXrdwNUd3MCzwdrAzGXZwBcK2MCOrtbAiSbtwIm068CCRerAEtnowONu58CqBubAJqDkwCA748Bm1+HAznTgwDUT38B4st3AflLcwC3z2sBylNnAODbYwHLY1sAQe9XABh7UwErB0sDSZNHAfRrowJWh5sBZLOXAVbrjwCBL4sBi3uDAzHPfwBoL3sAQpNzAfD7bwDDa2cADd9jA1RTXwIez1cD+UtTAJPPSwOST0cAsNdDA7dbOwBl5zcCkG8zAQRTjwMiT4cDEF+DAqZ/ewP0q3cBUudvAUkrawKbd2MAHc9fAOArWwAKj1MA1PdPAqNjRwDZ10MC+Es/AJLHNwE9QzMAp8MrAnpDJwJ4xyMAa08bAxhTewPuL3MCCCNvAuYnZwA8P2MAGmNbAMCTVwC2z08CoRNLAV9jQwPdtz8BSBc7AM57MwG84y8Dg08nAY3DIwNkNx8AorMXAOUvEwPbqwsBNi8HAIR3ZwCGL18Bs/9XARHnUwAH40sAPe9HA7QHQwCmMzsBfGc3AN6nLwGQ7ysCkz8jAuWXHwHD9xcCblsTAETHDwK7MwcBSacDA4Aa/wEClvcBbRLzAiS7UwFCS0sB5/dDAJm/PwJbmzcAcY8zAIeTKwB9pycCi8cfAQ33GwKgLxcCAnMPAhi/CwHzEwMAsW7/AZvO9wP6MvMDQJ7vAusO5wJ9guMBj/rbAXErPwMCizcC9A8zAVmzKwKnbyMDvUMfAeMvFwKlKxMD7zcLA9VTBwC3fv8BGbL7A7/u8wN+Nu8DWIbrAnbe4wAFPt8DV57XA9IG0wDods8CIubHAJXLKwNO9yMB2E8fA7HHFwDLYw8BkRcLAtrjAwHUxv8ADr73A1DC8wG22usBiP7nAVMu3wO5ZtsDm6rTA+n2zwPESssCXqbDAvUGvwD3brcDxdazAnqfFwBflw8AGLsLAJYHAwE3dvsB3Qb3Auqy7wEgeusBplbjAfBG3wPKRtcBOFrTAIZ6ywAopscCxtq/Ay0auwBTZrMBRbavATQOqwNmaqMDLM6fAsuzAwEcav8D/VL3AaJu7wDjsucBERrjAgai2wAEStcDzgbPAnPexwFhysMCU8a7A0nStwJ/7q8CYharAZRKpwLehp8BKM6bA4MakwERco8BF86HAe0O8wFJfusAeirjASMK2wF0GtcANVbPAKK2xwKANsMCEda7A/uOswE9Yq8DS0anA8U+owCrSpsAJWKXAKeGjwDBtosDO+6DAvYyfwL0fnsCXtJzARa63wFa2tcBVz7PAiPexwFItsMA+b67A9buswEUSq8AccanAg9enwKJEpsC5t6TAHDCjwDatocCBLqDAiLOewOM7ncA2x5vAMFWawIjlmMAAeJfAgi+zwJ8hscDFJq/AGj2twN1iq8BwlqnAV9anwDghpsDddaTAL9OiwDY4ocAVpJ/ACRaewGSNnMCNCZvA/YmZwD0OmMDjlZbAkSCVwPWtk8DGPZLAxsmuwKSjrMC/kqrAJJWowPSopsBszKTA6f2iwOs7ocAThZ/AKdidwBA0nMDOl5rAgwKZwGhzl8DO6ZXAGWWUwL/kksBHaJHARu+PwFx5jsA2Bo3AtH+qwPc+qMC5FabA+QGkwMABosAtE6DAeDSewPxjnMAyoJrAvOeYwFk5l8Dsk5XAdvaTwBNgksD7z5DAfEWPwPe/jcDhPozAvsGKwCJIicCs0YfA6VOmwD32o8BJsqHAEYafwJVvncDdbJvAAnyZwDubl8DdyJXAYQOUwGBJksCYmZDA6fKOwFBUjcDmvIvA4SuKwIqgiMBCGofAe5iFwLkahMCMoILA6UiiwBHMn8APa53AAySbwO/0mMDU25bAtdaUwKvjksDoAJHAvSyPwKBljcAnqovADPmJwCpRiMB8sYbAGRmFwDKHg8AQ+4HAEHSAwEbjfcCV5nrA/GCewPDCm8CoQpnAcN6WwGaUlMCQYpLA60aQwHs/jsBWSozAqWWKwMSPiMAWx4bANAqFwNRXg8DMroHAFg6AwInpfMANxHnARap2wOiac8DTlHDAEZ6awBzdl8CLO5XA8LeSwJlQkMCpA47AJc+LwAuxicBcp4fALLCFwKXJg8AT8oHA4yeAwEnTfMAUbHnA0Rd2wGjUcsD8n2/A5HhswKldacD+TGbApwGXwH4clMD0V5HA97KOwB8sjMC/wYnA+3GHwNw6hcBcGoPAfg6BwKAqfsD5WXrAlad2wEUQc8AjkW/AjydswCnRaMDVi2XAr1ViwAstX8BqEFzAYIeTwIaCkMDBmY3AutGKwGcpiMBln4XADjKDwIffgMC0S33ABQZ5wAHqdMDC83DAlh9twARqacDYz2XAI05iwD/iXsDGiVvAlEJYwMIKVcCd4FHAJ4ABweDdAMEhPADBpDX/wMLz/cB5svzArXH7wEgx+sA18fjAZLH3wMhx9sBUMvXAAPPzwMOz8sCXdPHAdjXwwFz27sBHt+3AMnjswBw568AD+unA7M79wOmE/MBzPPvAUPX5wE6v+MBDavfACyb2wIXi9MCZn/PALV3ywDAb8cCR2e/AQZjuwDRX7cBgFuzAvdXqwEKV6cDpVOjArRTnwInU5cB5lOTAi6D4wLtQ98AAA/bAFLf0wLhs88C3I/LA5NvwwBaV78AsT+7ABgrtwI3F68CpgerASD7pwFj758DLuObAlHblwKo05MAB8+LAkrHhwFZw4MBGL9/Ay3XzwMUf8sBpzPDAY3vvwGYs7sAx3+zAjJPrwEVJ6sAyAOnALbjnwBVx5sDPKuXAQeXjwFag4sD7W+HAHxjgwLPU3sCrkd3A/E7cwJwM28CBytnAYE/uwKfy7MA9mevAvULqwMru6MAXnefAXk3mwGX/5MD2suPA42fiwAUe4cA51d/AX43ewFxG3cAZANzAgLrawIB12cAGMdjABu3WwHKp1cA/ZtTAES7pwBPK58AbaubArw3lwGS048DbXeLAwgnhwNG338DJZ97AdBndwKDM28AjgdrA1zbZwJvt18BRpdbA4V3VwDMX1MAz0dLAzovRwPVG0MCaAs/AwRLkwNKm4sC1P+HA2tzfwMF93sD7Id3AJ8nbwO9y2sAIH9nAMc3XwC991sDPLtXA5OHTwEiW0sDVS9HAbQLQwPW5zsBUcs3AdCvMwELlysCsn8nAbf7ewMaJ3cDVGtzA77DawIBL2cAG6tfADIzWwC8x1cAW2dPAc4PSwAIw0cCG3s/Ayo7OwJ5AzcDY88vAVajKwPJdycCSFMjAHMzGwHiExcCRPcTANfLZwPBz2MBd/NbAuYrVwFYe1MCattLAAFPRwBHzz8Blls7AoTzNwHXly8CZkMrAzz3JwN7sx8CXncbAzE/FwFgDxMAYuMLA7W3BwLskwMBr3L7AX+/UwG5m08BP5dHAHGvQwAv3zsBsiM3AoR7MwCK5ysBzV8nAK/nHwOydxsBiRcXARO/DwFKbwsBRScHADvm/wF2qvsAUXb3AERG8wDLGusBcfLnAWffPwIpizsDL1szAGFPLwIXWycBGYMjApe/GwAKExcDPHMTAkLnCwNlZwcBH/b/AhaO+wElMvcBP97vAXKS6wDtTucC9A7jAuLW2wAhptcCKHbTAvwvLwLFpycAc0sfA0kPGwMe9xMAPP8PA18bBwGZUwMAZ577AX369wLkZvMC4uLrA91q5wB8AuMDjp7bA/lG1wDP+s8BLrLLAF1yxwGsNsMAhwK7AXy7GwIV9xMCz2MLAlD7BwPatv8DKJb7AHqW8wBwru8AIt7nAOUi4wB7etsA1eLXACha0wDi3ssBmW7HARQKwwI2rrsABV63AaASswJGzqsBQZKnAO2HBwNWfv8Ay7L3A00S8wF+ousCgFbnAgYu3wAwJtsBojbTA1RezwKmnscBOPLDAP9WuwAdyrcBAEqzAjLWqwJxbqcAnBKjA7K6mwLRbpcBLCqTAi6a8wKbSusBsDrnANFi3wHqutcDeD7TAKHuywD3vsMAla6/AA+6twBJ3rMCmBavAJ5mpwA0xqMDhzKbAOmylwLoOpMAOtKLA7luhwBYGoMBOsp7AuwC4wDMYtsBqQbTAjXqywOzBsMAAFq/AZXWtwNzeq8BJUarArsuowCpNp8D41KXAZ2KkwNv0osDNi6HAwiagwE7FnsAUZ53AvQucwAGzmsCbXJnAYnKzwOtyscBqh6/A6a2twJLkq8CvKarAtXuowDzZpsAAQaXA4bGjwN8qosAUq6DAuDGfwBi+ncCWT5zApuWawM1/mcCeHZjAuL6WwMZilcB6CZTAPv6uwGflrMDc4qrAivSowHgYp8DJTKXAxo+jwN3focCiO6DAz6GewD4RncDriJvA8AeawH6NmMDiGJfAeqmVwLk+lMAj2JLARnWRwMIVkMBAuY7AIKeqwGZyqMBdVqbA41CkwONfosBfgaDAd7OewG/0nMCyQpvAz5yZwHoBmMCNb5bA/uWUwORjk8Bv6JHA53KQwKkCj8All43A3S+MwGDMisBJbInA2G+mwLgcpMCs5KHAk8WfwEq9ncC5yZvA3+iZwNcYmMDjV5bAZ6SUwPD8ksAvYJHA98yPwD5CjsAVv4zAq0KLwETMicA9W4jAA++GwBSHhcAAI4TAGVuiwCznn8CZkJ3AWlWbwE8zmcBSKJfASTKVwC9Pk8AefZHAUbqPwCoFjsAxXIzAE76KwKApicDKnYfAoBmGwE2chMAUJYPATrOBwGdGgMC4u33AW2uewG/Um8DxXJnACQOXwLLElMDLn5LAMJKQwMSZjsB/tIzAduCKwOEbicAfZYfAs7qFwEYbhMClhYLAvviAwD3nfsDb6nvA2Pp4wOAVdsDJOnPAuqKawPPml8BdTJXAaNGSwEN0kMDpMo7APQuMwBf7icBZAIjA+BiGwAZDhMC4fILAaMSAwCkxfsDI73rAQMJ3wGemdMBOmnHAQZxuwL2qa8BqxGjA0wKXwMkglMBFYZHAHcOOwMlEjMB65InAMaCHwNB1hcAuY4PALWaBwHz5fsDhSXvA6bl3wEFGdMDh63DADKhtwFB4asB6WmfAmExkwPBMYcD4WV7AYIeTwIODkMCznY3AidqKwOM4iMBCt4XA3FODwLMMgcBVv33ANZV5wMSWdcDgv3HAoAxuwGB5asDDAmfAuqVjwIJfYMCfLV3A2w1awD3+VsAF/VPAXjsCwR6kAcGNDQHBkncAwS3E/8ATmv7AtHD9wPdH/MDDH/vABvj5wK7Q+MCrqffA84L2wHpc9cA2NvTAIRDzwDLq8cBmxPDAtZ7vwB157sCZU+3AjzD/wEf8/cDbyfzADZn7wKhp+sB+O/nAZg74wD7i9sDotvXASoz0wE1i88DdOPLA6Q/xwGLn78A8v+7AapftwONv7MCeSOvAlCHqwL766MAV1OfAXu35wPSy+MDxevfACUX2wPoQ9cCN3vPAj63ywNR98cA5T/DAmyHvwN307cDnyOzAop3rwPty6sDgSOnAQx/owBb25sBNzeXA3qTkwL9848DpVOLA0630wN5s88DnLvLAk/PwwJS678Clg+7AiU7twAwb7MAA6erAPLjpwJ2I6MACWufAUizmwHL/5MBO0+PA06fiwO584cCSUuDAsSjfwD7/3cAv1tzArHLvwK4q7sBV5uzANqXrwPFm6sA1K+nAuvHnwEC65sCQhOXAeFDkwM8d48Bt7OHAMLzgwPyM38C1Xt7ARDHdwJQE3MCR2NrALa3ZwFaC2MABWNfAvTzqwCLt6MDloefAh1rmwJgW5cC31ePAj5fiwNNb4cBCIuDAoerewL203cBogNzAek3bwM4b2sBG69jAxLvXwC+N1sBwX9XAdDLUwCkG08B82tHA8gzlwAy148BSYuLALxThwCDK38Cyg97AgEDdwDEA3MB3wtrADYfZwLZN2MA8FtfAb+DVwCSs1MA2edPAg0fSwOwW0cBY58/ArbjOwNaKzcDAXczAVuTfwFiD3sBuKN3A6dLbwDCC2sC7NdnAFO3XwNSn1sCdZdXAHybUwBPp0sA4rtHAV3XQwD4+z8DACM7AttTMwPyhy8BzcMrA/j/JwIMQyMDt4cbAFMTawBNZ2cAo9dfAipfWwIQ/1cB67NPA4Z3SwEBT0cAqDNDAQcjOwDKHzcCzSMzAgQzLwGPSycAlmsjAmGPHwJMuxsDy+sTAksjDwFeXwsAmZ8HAf63VwGc31MCKydLA/WLRwO8C0MCqqM7AjVPNwAoDzMCjtsrA623JwIAoyMAM5sbAQ6bFwOFoxMCqLcPAZ/TBwOq8wMAIh7/AmlK+wH0fvcCU7bvAFaLQwKofz8DDps3ATzbMwF/NysAfa8nA1A7IwNq3xsCeZcXAoRfEwHPNwsCvhsHA/ELAwA0Cv8Ccw73Aaoe8wEFNu8DvFLrAR964wCSpt8BgdbbAgqPLwFoTysAmjsjArxLHwOGfxcDINMTAi9DCwGtywcDCGcDA+cW+wJB2vcARK7zAF+O6wEeeucBRXLjA7Ry3wNzftcDkpLTA1GuzwH40ssC4/rDAqbPGwCYUxcA1gcPAc/nBwKV7wMCxBr/An5m9wJMzvMDL07rAm3m5wGwkuMC407bACoe1wPk9tMAo+LLARrWxwAh1sMAuN6/AfvutwMTBrMDRiavAo9TBwPQjwMCigb7AH+y8wAJiu8AN4rnAIWu4wEL8tsCPlLXAQzO0wLDXssA7gbHAXC+wwJvhrsCNl63A1FCswBwNq8AazKnAi42owDVRp8DiFqbAxAi9wOBEu8BVkbnAZuy3wIBUtsA3yLTARUazwIjNscAAXbDAyfOuwBmRrcBBNKzAotyqwLKJqcD2OqjAA/CmwHeopcD9Y6TASCKjwBbjocAppqDAl1K4wD95tsBtsrTANfyywNZUscC3uq/AZyyuwJyorMAwLqvAH7ypwIFRqMCK7abAho+lwNU2pMDq4qLASZOhwINHoMA2/57AC7qdwLV3nMDtN5vA2rSzwKHDscBD56/ArR2uwPBkrMBGu6rAER+pwNyOp8BXCabAWo2kwNsZo8DvraHAyUigwK/pnsABkJ3ALzucwLrqmsAznpnANVWYwGcPl8B7zJXAdTKvwMUmrcBoMqvAKlOpwPWGp8DXy6XAAyCkwNaBosDX76DAtGifwD3rncBodpzARQmbwAOjmcDnQpjATeiWwKSSlcBrQZTAMPSSwI6qkcAqZJDAZ86qwJWlqMCflqbAQZ+kwEa9osCS7qDALzGfwEuDncBB45vAkk+awObGmMAMSJfA89GVwKtjlMBf/JLAUZuRwNo/kMBo6Y7AeJeNwJZJjMBa/4rAs4umwA9DpMDSFqLAtwSgwHgKnsDbJZzAw1SawDSVmMBZ5ZbAh0OVwDuuk8AaJJLA7qOQwKMsj8BGvY3A/lSMwAvzisDFlonAlj+IwPrshsB6noXAQG2iwDQCoMABtp3AeIabwFRxmcBMdJfAJo2VwMC5k8Ab+JHAXEaQwNWijsD+C43AeICLwAn/icCahojANRaHwP2shcAySoTAJ+2CwESVgcAFQoDAuHWewOflm8Apd5nAgieXwMb0lMCw3JLA99yQwFzzjsC7HY3AEVqLwH+micBSAYjA/miGwCDchMB7WYPA9d+BwJJugMDrCH7AtUF7wCeGeMAO1XXAYqeawMjwl8AmXZXA0OqSwM2XkMD0YY7AAUeMwKhEisCpWIjA3YCGwDy7hMDlBYPAH1+BwLSKf8BgbnzAwGZ5wJdxdsDqjHPA+LZwwDTubcA9MWvA/wOXwBQllMCUapHAO9OOwGNdjMAYB4rANM6HwHOwhcCJq4PANb2BwJbGf8B/N3zAXMl4wLJ4dcBcQnLAgiNvwJwZbMBnImnA4jtmwEZkY8ABmmDAYIeTwIGEkMCkoY3AVeOKwFlIiMARz4XAj3WDwK45gcBbMn7AfyN6wEFCdsBGinLAb/duwOmFa8A0MmjAIPlkwM/XYcCyy17Af9JbwC/qWMD1EFbAJfICwZllAsHi2QHB5k4BwY7EAMHGOgDB+WL/wERR/sBSQP3ADjD8wGMg+8A/EfrAlAL5wFP098Bx5vbA49j1wKLL9MCjvvPA4bHywFal8cD6mPDAFUUAwflq/8DzTf7A1zL9wGwZ/MCAAfvA6er5wH/V+MAjwffAt632wCKb9cBNifTAJHjzwJZn8sCSV/HADEjwwPg478BJKu7A9xvtwPgN7MBFAOvA9DL7wFIN+sBn6vjA48n3wIKr9sAHj/XAPnT0wPpa88AQQ/LAXyzxwMUW8MAmAu/Aa+7twH3b7MBIyevAu7fqwMem6cBclujAb4bnwPV25sDiZ+XAXt/1wOGy9MCzifPAdmPywNg/8cCQHvDAYP/uwBDi7cBvxuzAUazrwJGT6sANfOnApmXowEBQ58DFO+bAHyjlwDkV5MAEA+PAb/HhwGzg4MDwz9/AMZDwwFtc78B7LO7AJADtwPPW68CTsOrAuozpwCRr6MCYS+fA4i3mwNQR5cBF9+PAEt7iwBnG4cA+r+DAZ5nfwHyE3sBqcN3AHF3cwINK28COONrATUbrwIYK6sBy0+jAjaDnwGRx5sCUReXAwxzkwKL24sDu0uHAabHgwNyR38AYdN7A8lfdwEQ93MDqI9vAxwvawL/02MC53tfAn8nWwFy11cDeodTAqQLmwEK+5MBef+PAY0XiwMwP4cAh3t/A/K/ewP+E3cDaXNzARTfbwAIU2sDW8tjAkNPXwAO21sAGmtXAd3/UwDNm08AfTtLAIDfRwB8h0MAFDM/AXMbgwIV438AbMd7AbO/cwNmy28DaetrA80bZwLoW2MDP6dbA4L/VwKKY1MDSc9PAN1HSwJww0cDSEdDAsPTOwA/ZzcDOvszAzqXLwPSNysAod8nAnpLbwGU62sCh6djAg5/XwFJb1sBsHNXAReLTwGCs0sBNetHAq0vQwCQgz8Bs983APdHMwF2ty8CUi8rAsmvJwItNyMD5MMfA2BXGwAn8xMBu48PAzmjWwBsF1cAGqtPAn1bSwBAK0cCdw8/AooLOwI1GzcDeDszAI9vKwPmqycAHfsjA/lPHwJgsxsCWB8XAweTDwOfDwsDapMHAcofAwIprv8ADUb7AeErRwAbaz8CDc87A1xXNwAzAy8BIccrAzCjJwPDlx8AeqMbA1G7FwJ45xMAVCMPA3tnBwKiuwMAshr/AKGC+wGQ8vcCtGrzA0/q6wK3cucAWwLjAXDnMwLa6ysB4R8nAY97HwFt+xsBjJsXAn9XDwEuLwsC8RsHAWgfAwJ7MvsASlr3ATWO8wPIzu8CvB7rAOd64wE+3t8C2krbAOXC1wKhPtMDZMLPAbTfHwOioxcB2J8TAp7HCwDhGwcAG5L/AE4q+wHw3vcB767vAYaW6wJNkucCIKLjAx/C2wOa8tcCEjLTATl+zwPg0ssA/DbHA5uevwLfErsCDo63A3kbCwJemwMA9Fb/ANJG9wAcZvMBtq7rAP0e5wHnrt8A3l7bAr0m1wC0CtMATwLLA2IKxwP5JsMAaFa/Ay+OtwLm1rMCYiqvAI2KqwB48qcBPGKjAHGq9wPS1u8DJErrAzX64wFz4tsD9fbXAYQ60wF2ossDqSrHAH/WvwC6mrsBiXa3AGRqswMfbqsDuoanAHmyowPU5p8AcC6bAQ9+kwCS2o8CCj6LA0qO4wHHZtsBQIrXAcXyzwP3lscBMXbDA4OCuwGZvrcCuB6zArqiqwHdRqcA5AajAPLemwNxypcCKM6TAxfiiwB3CocAuj6DAnV+fwBwznsBiCZ3A5fazwLwTssBHRrDAWIyuwOvjrMAkS6vAVsCpwP9BqMDFzqbAdmWlwAEFpMB4rKLABVuhwO0PoMCKyp7AS4qdwK1OnMA+F5vAmOOZwF+zmMBChpfAZmavwLtnrcBdgavA+7CpwGL0p8CJSabAj66kwMIho8CaoaHAuyygwO3BnsAcYJ3AVQacwMGzmsChZ5nATSGYwDHglsDJo5XAoWuUwFE3k8B8BpLAhfWqwILYqMB81qbADe2kwN8Zo8C7WqHAkq2fwIAQnsDNgZzA7f+awH6JmcBGHZjALLqWwDpflcCVC5TAfb6SwEh3kcBdNZDAOPiOwGO/jcB0iozAeaemwEBppMC5SKLAekOgwBdXnsA4gZzAo7+awEMQmcAwcZfArOCVwChdlMA95ZLArHeRwFkTkMBMt47ApmKNwKMUjMCXzIrA6omJwBNMiMCbEofAXn+iwCodoMBE253AWLebwPqumcC9v5fAReeVwFUjlMDScZLA0dCQwI8+j8B3uY3AH0CMwETRisDHa4nAqw6IwA+5hsAuaoXAVyGEwPHdgsBxn4HAEoCewFb3m8BOkZnA2EuXwKAklcA6GZPAOCeRwDtMj8ABho3AbdKLwI0visCbm4jA/hSHwEeahcAvKoTAk8OCwHNlgcDsDoDAan59wDnresALY3jACayawJn6l8DpbZXAJwSTwDe7kMDIkI7AbYKMwLeNisBFsIjA0ueGwDsyhcCKjYPA9feBwN9vgMCm533ADwV7wK01eMB5d3XApchywJwncMD2km3AKwWXwF8plMDhc5HAU+OOwO11jMCXKYrAAfyHwMLqhcBn84PAjhOCwOxIgMC8In3Az9V5wHSndsBnlHPAuJlwwMy0bcBR42rANiNowKtyZcAV0GLAYIeTwH+FkMCVpY3AIOyKwMlXiMDR5oXAJJeDwHdmgcC+pH7A17B6wGvsdsDiUnPA6d9vwIKPbMAGXmnAKEhmwPJKY8C/Y2DANpBdwELOWsAMHFjAS6QDwRciA8HgoALBiSACwfmgAcEbIgHB3KMAwSsmAMH1Uf/AeVj+wM1f/cDcZ/zAlXD7wOd5+sDFg/nAIY74wPKY98AspPbAxq/1wLi79MD8x/PAs+0AwU9oAMFPyP/AMsL+wA6+/cCuu/zA5Lr7wIe7+sB0vfnAi8D4wLDE98DLyfbAxM/1wIjW9MAF3vPAK+bywOzu8cA6+PDACwLwwFMM78AIF+7AAXH8wIBf+8ABUfrANEX5wNI7+MCbNPfAWS/2wNor9cD0KfTAgSnzwF4q8sBtLPHAky/wwLcz78DEOO7Apj7twEtF7MCkTOvAoVTqwDZd6cBXZujAKgr3wITx9cB53PTAqsrzwMK78sB3r/HAhqXwwLad78DUl+7AsZPtwCWR7MAMkOvARZDqwLOR6cA8lOjAyJfnwEKc5sCXoeXAtKfkwIuu48ANtuLAtqfxwGuH8MBla+/AM1PuwHA+7cDFLOzA5B3rwIkR6sB3B+nAeP/nwFv55sD39OXAJPLkwL/w48Cr8OLAy/HhwAX04MBE99/AcfvewHsA3sBQBt3Aj0rswAgi68CC/unAeN/owHXE58ASrebA85jlwMeH5MBIeePANm3iwFlj4cB+W+DAeVXfwCBR3sBQTt3A6EzcwMtM28DdTdrAB1DZwDJT2MBKV9fAu/PmwETC5cChluTAN3DjwHxO4sD2MOHAOxfgwO0A38C57d3AVN3cwH3P28D5w9rAk7rZwB6z2MBurdfAXqnWwMum1cCWpdTApKXTwNum0sAjqdHAW6ThwCJp4MCrNN/APwbewD3d3MAZudvAVZnawIR92cBEZdjAQVDXwCw+1sDDLtXAySHUwAYX08BMDtLAbAfRwEEC0MCn/s7AfPzNwKX7zMAF/MvAs13cwMIX28Cf2dnAdaLYwIdx18AyRtbA5R/VwB/+08Bx4NLAdsbRwNav0MBBnM/Ac4vOwCx9zcA0cczAWWfLwG1fysBIWcnAxVTIwMFRx8AfUMbAMCHXwGrP1cCfhtTA2UXTwD4M0sAO2dDAoqvPwGSDzsDSX83AeEDMwPAky8DfDMrA9ffIwOjlx8B51sbAbsnFwJO+xMC5tcPAtq7CwGSpwcCgpcDAbvDRwIWR0MDuPM/AjPHNwGGuzMCRcsvAVj3KwAYOycAJ5MfA2b7GwP+dxcATgcTAuWfDwJxRwsBzPsHA+y3AwPsfv8A7FL7AjQq9wMQCvMC6/LrAOs3MwLBfy8D7/cnA0qbIwBFZx8C5E8bA5tXEwNGew8DLbcLAOkLBwJQbwMBg+b7ANNu9wLDAvMCAqbvAV5W6wPODucAXdbjAi2i3wB9etsClVbXAnrnHwLo7xsBhy8TAGGfDwJMNwsCnvcDAUXa/wKg2vsDj/bzAT8u7wE6eusBVdrnA6FK4wJozt8AKGLbA4f+0wNPqs8CZ2LLA98ixwLO7sMCcsK/A4LfCwK8nwcDypr/A/jO+wFXNvMChcbvAth+6wIvWuMA0lbfA5Fq2wOMmtcCT+LPAZc+ywNqqscCFirDAAm6vwPhUrsAZP63AHiyswMkbq8DfDarAisq9wNclvMC8krrAVw+5wPeZt8AXMbbAXtO0wJp/s8C9NLLA2vGwwB22r8DPgK7AS1GtwAEnrMByAavALOCpwMrCqMDzqKfAVpKmwKt+pcCzbaTAZvS4wL84t8ALkbXAM/uzwFF1ssCs/bDAupKvwB8zrsCi3azAM5GrwN9MqsDSD6nATtmnwK6opsBffaXA4FakwL00o8CPFqLA/PugwLHkn8Bl0J7Afji0wDRjssBtpLDA4fmuwHRhrcA42avAcF+qwI3yqMAtkafAFDqmwC3spMCCpqPAOmiiwJcwocDv/p/Ar9KewFGrncBhiJzAd2mbwDZOmsBKNpnAD5qvwEKorcC1z6vA9A2qwLRgqMDRxabAWjulwIy/o8DUUKLAyO2gwCuVn8DiRZ7A9f6cwIe/m8DWhprAOVSZwBcnmMDq/pbAO9uVwKK7lMC/n5PAehyrwCkLqcDwFafAQDqlwKZ1o8DPxaHAkyigwPybnsBBHp3Aya2bwChJmsAb75jAhJ6XwGZWlsDiFZXANdyTwLCoksC6epHAy1GQwGotj8AtDY7AKsOmwEmPpMBeeqLA14GgwCOjnsDK25zAdSmbwPmJmcBX+5fAw3uWwKAJlcB8o5PAEEiSwDv2kMD8rI/AcWuOwNQwjcB0/IvAtc2KwA+kicAHf4jAdJGiwAs4oMBiAJ7A+uebwD/smcCfCpjAnkCWwOGLlMA36pLAnlmRwEPYj8CFZI7A7vyMwDKgi8AsTYrA2AKJwFLAh8DRhIbAoE+FwCQghMDP9YLAaYqewLwInMBgq5nACnCXwD1UlcBlVZPA7nCRwFikj8BF7Y3AfkmMwPy2isDpM4nAnr6HwKBVhsCg94TAdaODwBhYgsChFIHAibB/wJlEfcA05HrAsLCawGgEmMCjfpXAbB2TwH/ekMBhv47Afr2MwEHWisAmB4nAy02HwPWnhcCYE4TA2Y6CwAwYgcBlW3/A8Zx8wGTyecCoWXfA6dB0wIlWcsAZ6W/AVwaXwKktlMArfZHAY/OOwGeOjMD1S4rAlymIwLkkhsDDOoTAMWmCwJqtgMCAC37AJd96wGLSd8DW4XTAfQpywKZJb8DxnGzAQwJqwMF3Z8DI+2TAYIeTwHyGkMCGqY3A6PSKwDFniMCB/oXAmriDwAqTgcB4Fn/AMz17wDKVd8ChGXTA98VwwAyWbcAVhmrAqJJnwLa4ZMCK9WHAukZfwCaqXMDtHVrAolEEwWfZA8FNYgPBOOwCwQx3AsG0AgLBG48BwTAcAcHiqQDBJTgAwdeN/8BUrP7Arsv9wNLr/MCyDPzAPS77wGdQ+sAjc/nAZ5b4wCm698Bg3vbA+pEBwW4WAcFDnADBVSMAwQpX/8Bzaf7Asn39wJ2T/MAOq/vA5MP6wADe+cBH+fjAoRX4wPcy98A3UfbATXD1wCqQ9MC/sPPA/9HywN3z8cBOFvHAQqf9wC6p/MBlrvvAlrb6wHbB+cDGzvjASt73wNHv9sAuA/bAOBj1wMou9MDGRvPADGDywIR68cAWlvDArLLvwDLQ7sCW7u3AyQ3twLwt7MBgTuvA/C34wIAo98DqJvbA1ij1wO8t9MDnNfPAe0DywG9N8cCOXPDAp23vwJGA7sAlle3AQKvswMXC68CV2+rAmfXpwLkQ6cDfLOjA+knnwPdn5sDGhuXAB7nywKKr8cDNovDAE57vwA6d7sBln+3Ax6TswO+s68Cdt+rAmsTpwLTT6MC95OfAjvfmwAMM5sD6IeXAVjnkwP1R48DUa+LAx4bhwMCi4MCuv9/AWEntwHIz7MDZIuvABBfqwHwP6cDYC+jAugvnwNAO5sDRFOXAex3kwJQo48DpNeLASkXhwI5W4MCOad/AJ37ewDyU3cCvq9zAZsTbwEre2sBG+dnAAeDnwOTA5sDpp+XAb5TkwOyF48Die+LA53XhwJlz4MCjdN/Au3jewJt/3cAIidzAzJTbwLai2sCastnAUcTYwLfX18Cq7NbADgPWwMga1cC/M9TAMH7iwAhV4cDxMuDALxffwCAB3sA18NzA7ePbwNrb2sCZ19nA0dbYwDXZ18B/3tbAcObVwNHw1MBu/dPAHAzTwLAc0sAFL9HA+ULQwG9Yz8BJb87ANyXdwArx28D7xNrAM6DZwPGB2MCQadfAfFbWwDJI1cBAPtTAQDjTwNk10sC5NtHAmDrQwDdBz8BcSs7A01XNwGxjzMD/csvAY4TKwHaXycAYrMjAj9bXwDiW1sA0X9XAhDDUwE0J08DK6NHAUc7QwEu5z8Azqc7AlJ3NwASWzMAoksvArZHKwEqUycC7mcjAx6HHwDesxsDbuMXAiMfEwBbYw8Bh6sLA4pPSwA5G0cDpAtDATsnOwDuYzcDObszAQEzLwOMvysAcGcnAYwfIwEH6xsBK8cXAIOzEwG/qw8Dp68LATfDBwF33wMDjAMDArQy/wI0avsBcKr3ADV/NwDQCzMCVscrA3mvJwOUvyMCk/MbANNHFwMusxMC2jsPAWHbCwCdjwcCoVMDAbUq/wBVEvsBMQb3AwkG8wDRFu8BiS7rAFlS5wBtfuMBFbLfALTrIwIvMxsDibMXArxnEwJrRwsB0k8HANF7AwO0wv8DSCr7ALeu8wF3Ru8DVvLrAGa25wLihuMBQmrfAipa2wBWWtcCsmLTAD56zwAWmssBZsLHAnyfDwC6nwcCwNsDAatS+wNR+vcCPNLzAafS6wFG9ucBajrjAsGa3wJxFtsB6KrXAuhS0wNwDs8Bw97HAEe+wwGTqr8Aa6a7A6uqtwJXvrMDf9qvABiq+wH6UvMAfEbvA9Z25wD85uMBv4bbAI5W1wCBTtMBVGrPAzumxwLXAsMBPnq/A9oGuwBdrrcAwWazAz0urwIxCqsANPanAATuowBw8p8AfQKbATES5wCGXt8CR/rXAb3i0wMICs8DDm7HA3kGwwKvzrsDtr63AjHWswJFDq8AkGarAhfWowAzYp8AkwKbASa2lwAafpMDzlKPAs46iwPOLocBpjKDAoXm0wASyssCvAbHAPmavwH/drcByZazAS/yqwHCgqcB1UKjAFgunwDnPpcDjm6TAOHCjwHZLosDxLKHAExSgwFUAn8BB8Z3AbeacwHrfm8AV3JrAbc2vwFjorcBpHazAD2qqwODLqMCkQKfAVcalwCNbpMBt/aLAwauhwNpkoMCXJ5/A+/KdwCXGnMBRoJvA0oCawA5nmcB8UpjApUKXwB03lsCFL5XAQ0OrwIk9qcD1VKfA1YalwJXQo8DFL6LAJ6KgwLEln8CKuJ3AD1mcwMkFm8BtvZnA136YwAZJl8AWG5bAQfSUwNbTk8A5uZLA4aORwFOTkMAih4/Axd6mwCm1pMC+q6LAyb+gwJbunsCJNZ3AMJKbwEgCmsC/g5jAuhSXwI2zlcC+XpTA/hSTwCXVkcAunpDAMm+PwGlHjsAeJo3AtAqMwKD0isBl44nAf6OiwNdSoMBYJZ7AWRicwBwpmsDsVJjAKpmWwF3zlMA+YZPAteCRwOFvkMATDY/Ay7aNwLVrjMCmKovAlfKJwJrCiMDmmYfAxneGwJpbhcDTRITAvJSewBoanMBfxZnAF5SXwJuDlcAtkZPAFLqRwK77j8B/U47AOL+MwL48i8AqyonAyGWIwBMOh8CzwYXAeX+EwFpGg8BoFYLA1euAwNGRf8ACWH3AVrWawDUOmMBVj5XAnzaTwKMBkcC+7Y7AMPiMwD8ei8BFXYnAwbKHwGAchsACmITAuSODwM69gcC2ZIDALS5+wHene8ArM3nAbM92wJV6dMAyM3LAgweXwPIxlMByhpHAbAOPwM+mjMAyborA81aIwFRehsCYgYTAFr6CwEkRgcCy8X7AQOV7wFr5eMCDKnbAoHVzwPHXcMAHT27AvdhrwDBzacC1HGfAYIeTwHqHkMB2rY3Arv2KwJN2iMAgFobA8dmDwGW/gcCCh3/Aish7wIo8eMBx3nTAg6lxwG2ZbsBAqmvAd9howO4gZsDdgGPAzPVgwJF9XsBBFlzAAfoEwVmLBMH0HQTBtrEDwYNGA8FE3ALB43ICwU8KAsF2ogHBSjsBwb3UAMHDbgDBUgkAwb1I/8DBf/7AoLf9wErw/MCxKfzAy2P7wIqe+sDk2fnAxzECwbC/AcEdTwHB6N8AwfRxAMEjBQDBuTL/wBVd/sAyif3A7bb8wCXm+8C+FvvAnUj6wKx7+cDUr/jAAuX3wCQb98AqUvbABYr1wKfC9MAD/PPAd9X+wBPq/cBBAv3Aqh38wAU8+8AOXfrAi4D5wEam+MASzvfAxPf2wDcj9sBIUPXA2X70wM2u88AM4PLAfxLywBBG8cCsevDAQbDvwMDm7sAYHu7Ankr5wJhX+MC8aPfAp332wP6V9cB1sfTAxc/zwLLw8sAEFPLAijnxwBhh8MCHiu/AsbXuwHfi7cC7EO3AYkDswFRx68B6o+rAv9bpwBEL6cBfQOjA88PzwMrI8sB00vHAfeDwwHzy78AVCO/A+SDuwN087cCEW+zAsnzrwDWg6sDexenAg+3owAAX6MAxQufA+G7mwDid5cDXzOTAvv3jwNcv48ANY+LAfULuwJU+7cA/QOzA8UbrwDFS6sCUYenAu3TowFOL58AQpebAscHlwPng5MCzAuTArybjwMFM4sDCdOHAjp7gwAXK38AI997AfiXewExV3cBchtzAWMfowPu558AFs+bA1bHlwNy15MCevuPArMviwKTc4cAw8eDAAwngwNgj38BwQd7AlWHdwBWE3MDCqNvAc8/awAP42cBRItnAPk7YwKx718CDqtbAv1PjwBU84sDDK+HADSLgwEwe38DvH97AdCbdwGwx3MBxQNvAKlPawEdp2cCCgtjAm57XwFi91sCG3tXA9gHVwH4n1MD4TtPAP3jSwDWj0cC8z9DAEendwBzG3MCSq9vAlJjawGGM2cBRhtjAzIXXwFGK1sBpk9XAr6DUwMax08BdxtLAK97RwO740MBqFtDAbDbPwMNYzsBDfc3AxKPMwCPMy8A+9srA1IjYwG1Z18ClM9bAfRbVwBMB1MCi8tLAe+rRwAbo0MC86s/AJvLOwNr9zcB7Dc3AtCDMwDs3y8DNUMrALG3JwCKMyMB+rcfAE9HGwLf2xcBHHsXAwTTTwIz30cBZxdDA/pzPwHR9zsDXZc3AW1XMwFBLy8AaR8rAL0jJwBVOyMBgWMfAsGbGwK94xcARjsTAkKbDwO/BwsD238HAcQDBwDQjwMAUSL/Axe7NwDGizMAyYsvAbi3KwLcCycAA4cfAYMfGwAm1xcBGqcTAeaPDwBOjwsCap8HAnrDAwL69v8Cizr7A/OK9wIT6vMD9FLzALDK7wN5RusDkc7nAD7nIwEtbx8DnC8bAVMnEwDOSw8BQZcLAmkHBwCImwMAZEr/AxAS+wIP9vMDF+7vADP+6wOgGusD0ErnA1yK4wEI2t8DrTLbAlGa1wAGDtMD9obPAEJbDwAklwsBoxMDAZnK/wG8tvsAe9LzAOMW7wKqfusCBgrnA6Gy4wCNet8CMVbbAlFK1wLdUtMCEW7PAlWaywI51scAfiLDA/p2vwOq2rsCm0q3AiIi+wOABvcDmjbvAliq6wCLWuMDwjrfAlVO2wNIitcCO+7PA09yywMnFscCvtbDA36uvwMWnrsDcqK3Asa6swNu4q8D+xqrAyNipwO7tqMAtBqjAf5O5wJD0t8DZarbAF/S0wECOs8CAN7LANu6wwPKwr8Bxfq7AlVWtwGU1rMADHavArguqwLsAqcCU+6fAtPumwKMApsD5CaXAVxekwGooo8DmPKLASbq0wCUAs8ADXrHAZNGvwP9XrsDE76zA15arwJRLqsCEDKnAYNinwAWupsB2jKXA03KkwFhgo8BWVKLANk6hwG9NoMCJUZ/AGlqewMJmncArd5zAfQCwwPgnrsB1aqzAQsWqwN01qcD0uafAcU+mwHT0pMBRp6PAjmaiwN0wocAZBaDAQeKewHDHncDgs5zA4KabwNafmsA3npnAi6GYwGSpl8BhtZbA32mrwJ5vqcCIk6fAx9KlwKMqpMCSmKLAQRqhwI+tn8CZUJ7ArQGdwEu/m8AhiJrABluZwPU2mMAGG5fAcQaWwIH4lMCb8JPAMu6SwMrwkcD295DASPqmwN3apMDW3KLATf2gwGk5n8Btjp3AyvmbwCV5msBbCpnAf6uXwNxalsDsFpXAWt6TwPivksC9ipHAvm2QwDBYj8BdSY7ApkCNwH09jMBkP4vAgLWiwI1toMAlSp7Ac0icwJBlmsCgnpjA4fCWwL9ZlcDa1pPACGaSwFcFkcANs4/An22OwLIzjcAWBIzAvd2KwLq/icA+qYjAkpmHwBOQhsAzjIXADJ+ewG4rnMBJ35nA/beXwLeylcCPzJPApQKSwDVSkMCmuI7AkDONwMXAi8BNXorAaAqJwIjDh8BMiIbAgFeFwBQwhMAWEYPAtvmBwDnpgMD3vX/A+7mawP4XmMD+n5XAvk+TwKMkkcDbG4/AfzKNwKxli8CasonAqhaIwHGPhsC4GoXAhbaDwBBhgsDHGIHAjbh/wKlUfcC5A3vA2sN4wGCTdsDTcHTArwiXwDs2lMC3j5HAbBOPwCW/jMBMkIrAEoSIwJCXhsDhx4TAOBKDwPNzgcA/1X/ACOh8wDwcesBFbnfA89p0wHdfcsBU+W/AXaZtwKZka8B/MmnAYIeTwHeIkMBmsY3AcQaLwO6FiMCvLYbAJvuDwIfrgcDU93/A0VJ8wGbieMBCoXXAeIpywIqZb8BoymzAcRlqwG2DZ8CCBWXALp1iwDtIYMC4BF7ARp0FwcQ3BcGm0wTBznAEwSEPBMGGrgPB504DwTLwAsFUkgLBPjUCweLYAcE0fQHBJyIBwbHHAMHIbQDBZBQAwfd2/8ARxv7ABRb+wMlm/cBQuPzA+cwCwfFjAsGM/AHBpZYBwR0yAcHWzgDBt2wAwaoLAMExV//A4pj+wEbc/cA/If3AsGf8wIKv+8Cd+PrA7UL6wF2O+cDe2vjAXSj4wM1298AfxvbAaPv/wPEh/8BKTP7AHXr9wB2r/MAH3/vAnxX7wK5O+sAFivnAeMf4wOEG+MAcSPfACIv2wIrP9cCFFfXA41z0wIyl88Bt7/LAcjrywIqG8cCk0/DA3V/6wJN++cCxofjA0sj3wJzz9sDAIfbA+FL1wASH9MCsvfPAvvbywA0y8sBwb/HAwK7wwN3v78CpMu/ABnfuwNu87cAQBO3AkUzswEiW68Ak4erAUsj0wLHe88Aj+vLALxrywG4+8cCBZvDAF5LvwOfA7sCv8u3ANSftwENe7MCsl+vAQ9PqwOIQ6sBmUOnArpHowJ3U58AYGefABl/mwFGm5cDj7uTA2TXvwEZD7sCEVu3ABm/swFKM68D7rerAodPpwPD86MCbKejAXlnnwP6L5sBDweXA+/jkwPwy5MAbb+PANa3iwCft4cDTLuHAHXLgwOu238Ak/d7An6npwGGt6MDKt+fANsjmwBTe5cDo+OTAQBjkwLs748AAY+LAwo3hwLm74MCo7N/AViDfwJBW3sAnj93A88ncwMwG3MCPRdvAHobawFrI2cApDNnA6yTkwCge48D+HuLArSbhwI404MAOSN/AqWDewO993cB4n9zA68TbwPft2sBVGtrAwknZwAZ82MDrsNfAQujWwOAh1sCcXdXAVJvUwOba08AzHNPAKKnewN+W3cBDjdzAc4vbwKyQ2sBBnNnAna3YwDrE18Ci39bAbv/VwD8j1cDEStTAs3XTwMmj0sDJ1NHAfwjRwLk+0MBKd8/ACbLOwNPuzcCELc3A6zfZwO8Y2MDZA9fApPfVwG3z1MBq9tPA7f/SwFsP0sArJNHA5j3QwCBcz8B6fs7AoKTNwEbOzMAo+8vACCvLwK5dysDpksnAisrIwGkEyMBeQMfA+tLTwOql0sAmhNHAgWzQwO5dz8CGV87AfFjNwB1gzMDLbcvA+4DKwDGZycABtsjACtfHwPT7xsBzJMbAQFDFwBx/xMDPsMPAJuXCwPAbwsAFVcHAU3zOwJQ/zcC8D8zAbOvKwGzRycCvwMjARrjHwGO3xsBMvcXAY8nEwBjbw8Du8cLAdw3CwE0twcAaUcDAjni/wGGjvsBU0b3ALAK9wLU1vMC/a7vANjbJwOznx8BeqMbA9XXFwEhPxMAeM8PAYyDCwCQWwcCOE8DA5he/wIgivsDkMr3Aeki8wNhiu8CZgbrAYqS5wOTKuMDV9LfA9SG3wAZStsDWhLXAKgPEwDOhwsAMUMHA4A3AwBLZvsA2sL3ACpK8wHd9u8CGcbrAYG25wEdwuMCTebfAs4i2wCOdtcBwtrTAM9SzwBH2ssC2G7LA2USxwDhxsMCVoK/ACOa+wPJtvcAGCbzALrW6wI9wucCFObjAng63wJTutcBL2LTAyMqzwC/FssDAxrHA0s6wwM7cr8Aw8K7AggiuwFwlrcBgRqzAO2urwKKTqsBQv6nA+OG5wARRuMDa1bbAIW61wL8XtMDS0LLAr5exwN1qsMAUSa/AMTGuwDcircBFG6zAmRurwIYiqsBzL6nA20GowEVZp8BIdabAhJWlwKW5pMBd4aPAc/q0wJNNs8BjubHASjuwwOrQrsAgeK3AAy+swOTzqsBExanA1qGowHKIp8AXeKbA42+lwA5vpMDpdKPA24CiwFmSocDsqKDAJsSfwKjjnsAcB57APDOwwB1nrsDStqzAiB+rwKGeqcC3MajAodamwHCLpcBuTqTAGB6jwBv5ocBL3qDApMyfwD/DnsBTwZ3ALsacwDLRm8DW4ZrAn/eZwB4SmcDzMJjAS5CrwGWhqcCl0afADh6mwMmDpMAvAKPA1ZChwIszoMBd5p7AjaedwJV1nMAcT5vA8zKawBAgmcCLFZjAlhKXwH4WlsCjIJXAeTCUwINFk8BSX5LAsxWnwGQApcCkDaPAYDqhwJiDn8Bw5p3AOmCcwIbumsAdj5nAA0CYwHn/lsDwy5XACqSUwJaGk8CGcpLA7maRwP5ikMD/ZY/AUG+OwGJ+jcC4kozAdseiwCyIoMDHbp7ARnicwJahmsC055jAvEeXwP++lcACS5TAi+mSwJeYkcBgVpDAVCGPwBH4jcBe2YzALcSLwI23isCssonA0LSIwFa9h8Cuy4bAWamewLk8nMAd+ZnAutuXwI7hlcCHB5TAnEqSwOenkMCxHI/Ae6aNwARDjMBD8IrAbayJwOl1iMBTS4fAbSuGwCUVhcCGB4TAvQGDwAwDgsDQCoHAoL6awMMhmMCesJXAyWiTwHtHkcC3SY/AaGyNwISsi8AgB4rAf3mIwBwBh8Cwm4XALUeEwMEBg8DRyYHA8J2AwMD5fsARy3zA5616wJOgeMCYoXbA2wmXwIQ6lMD5mJHAZSOPwGjXjMBBsorA87CIwGrQhsCZDYXAkGWDwI7VgcAJW4DAYud9wOo6e8D5rHjATjp2wAjgc8Chm3HA4mpvwNlLbcDPPGvAYIeTwHWJkMBVtY3AMg+LwECViMAsRYbAOByEwG0XgsC1M4DAANx8wLmGecAEYnbAwmhzwEuWcMBu5m3AclVrwAngaMBLg2bAqTxkwOUJYsAG6V/AUzsGwYbeBcE7gwXBUikFwbHQBME+eQTB4iIEwYrNA8EleQPBoSUDwe/SAsEEgQLB0i8CwU7fAcFvjwHBKkABwXbxAMFNowDBp1UAwXwIAMGMd//Ad2MDwRIDA8FspALBYkcCwdHrAcGekQHBrTgBwefgAME3igDBizQAwaK//8DyF//A6nH+wHHN/cBuKv3AzIj8wHbo+8BaSfvAZqv6wIwO+sC7cvnAdIwAwUgoAMFCjP/Apcv+wGwO/sBSVP3AG538wI7o+8B9NvvAuYb6wBvZ+cB/LfnAxIP4wMvb98B6NffAtpD2wGnt9cB+S/XA4Kr0wH0L9MBEbfPAkW37wECd+sCP0fnAFwr5wH9G+MB1hvfAs8n2wPgP9sALWfXAuaT0wNTy88AyQ/PArZXywCLq8cBxQPHAfpjwwC7y78BpTe/AGKruwCUI7sB/Z+3A/cX1wC3t9MCnGfTA8UrzwKOA8sBeuvHAz/fwwKw48MCzfO/AqMPuwFYN7sCMWe3AIKjswOn468DDS+vAjKDqwCj36cB6T+nAaKnowNsE6MC9YefATSPwwGFB78B8Ze7AEo/twKe97MDM8OvAIijrwFJj6sAPounAFeTowCcp6MANcefAlbvmwJEI5sDZV+XAR6nkwLj848ANUuPAKaniwPEB4sBOXOHAuobqwPea6cAStujAZ9fnwGP+5sCHKubAY1vlwJOQ5MC+yePAlgbjwNNG4sA2iuHAhdDgwI4Z4MAhZd/AE7PewD0D3sB9Vd3AsKncwLr/28B/V9vAmvHkwCT748B/DOPA6iTiwLxD4cBgaODAU5LfwCHB3sBj9N3AwCvdwOVm3MCJpdvAbOfawFEs2sAEdNnAVb7YwBcL2MAiWtfAUqvWwIX+1cCbU9XAZ2XfwDlj3sDxad3ArnjcwKqO28A3q9rAvc3ZwLb12MCqItjAMlTXwO+J1sCOw9XAxQDVwE9B1MDxhNPAc8vSwKQU0sBXYNHAYq7QwKH+z8DvUM/AwePZwKnU2MC1z9fA3NPWwDjg1cD+89TAfQ7UwBgv08BHVdLAkYDRwImw0MDR5M/AEh3PwP9YzsBVmM3A1NrMwEYgzMB2aMvANrPKwF0AysDDT8nAfW7UwBVR08A8P9LAvjfRwIw50MC8Q8/AflXOwB5uzcD9jMzAjrHLwFXbysDkCcrA2jzJwN9zyMCkrsfA5OzGwF4uxsDacsXAI7rEwAsExMBkUMPAqgfPwE7azcAiuszAwKXLwOybysCTm8nAxqPIwLGzx8CcysbA5efFwP0KxcBkM8TArGDDwHCSwsBXyMHAEALBwFU/wMDjf7/AgsO+wPsJvsAeU73Al7HJwGFyyMA5QsfAfh/GwMMIxcDH/MPAcvrCwNAAwsALD8HAZiTAwDtAv8D6Yb7AIom9wD+1vMDs5bvAzhq7wJRTusD1j7nArc+4wIMSuMA/WLfA5G7EwKEbw8CO2cHAyabAwKyBv8DCaL7AxVq9wJtWvMBIW7vA82e6wN17ucBdlrjA4La3wOHctsDsB7bAmje1wI5rtMB2o7PABt+ywPwdssAbYLHAf0K/wK3YvcBzgrzArj27wHYIusAd4bjAKca3wE+2tsBusLXAirO0wMO+s8BX0bLAm+qxwPkJscDrLrDA+livwL2HrsDXuq3A8vGswMMsrMAGa6vAsi+6wHasuMCKP7fAgua1wDKftMCqZ7PANj6ywFghscC+D7DARAivwOcJrsDGE63AHSWswDs9q8CKW6rAgH+pwKWoqMCP1qfA3ginwDw/psBdeaXAGzq1wEeas8DIE7LA6KOwwDRIr8B5/q3AwMSswE+Zq8CheqrAYWepwGVeqMCnXqfAQmemwG53pcB6jqTAyqujwNXOosAh96HAQSShwNNVoMCCi5/AqGWwwMSlrsB7Aq3A2XirwCUGqsDjp6jA2FunwAcgpsCx8qTAS9KjwHu9osARs6HABbKgwG+5n8CCyJ7Ai96dwO36nMAbHZzAm0SbwP1wmsDfoZnAh7arwNzSqcBJD6jAqGimwAHcpMCTZqPA2wWiwJi3oMDGeZ/AoEqewJUoncBHEpzAgQabwDgEmsB/CpnAhxiYwJwtl8AcSZbAemqVwDiRlMDovJPABDGnwL4lpcAlPqPA/XahwB/Nn8CKPZ7AecWcwGBim8D4EZrAONKYwFShl8C1fZbA+GWVwOVYlMBsVZPAnVqSwKhnkcDTe5DAfJaPwBS3jsAc3Y3AYtmiwLOioMA9k57Az6ecwCvdmsAkMJnAtp2XwBMjlsCsvZTAMGuTwJEpksD99pDA19GPwLm4jsBlqo3AyKWMwO+pi8AGtorAUsmJwC3jiMAIA4jAorOewPlNnMDbEprATf+XwB8QlsARQpTA9JGSwL38kMCZf4/A8BeOwG7DjMD9f4vAxUuKwCUlicCwCojAJvuGwG71hcCU+ITAwAOEwDQWg8BLL4LARMOawIYrmMA1wZXAv4GTwCxqkcBPd4/A6KWNwMLyi8DQWorANtuIwFlxh8DcGobAo9WEwNGfg8DAd4LA/VuBwEVLgMD3iH7AT418wN+hesAnxXjABguXwMs+lMA4opHAVDOPwJfvjMAQ1IrAk92IwN4Ih8C8UoXAGLiDwBQ2gsALyoDAOON+wEhVfMCA5nnAipN3wHhZdcC6NXPAECZxwIIob8BXO23AYIeTwHKKkMBEuY3A8BeLwIukiMCWXIbAJz2EwBRDgsAda4DADmR9wHcpesCnIHfATkR0wJmPccA5/m7AWoxswJ02asAK+mfACdRlwFPCY8DpwmHAD9QGwYJ/BsGSLAbBHdsFwQmLBcE7PAXBne4EwRqiBMGhVgTBIAwEwYnCA8HNeQPB4TEDwbjqAsFHpALBhl4CwWsZAsHu1AHBBpEBwaxNAcHaCgHBKvUDwfmcA8GhRgPB/fECweueAsFNTQLBCv0BwQmuAcE1YAHBexMBwcnHAMEPfQDBPjMAwZLU/8BIRP/Ah7X+wDko/sBMnP3ArhH9wE2I/MAbAPzA5hYBweG6AMH6YADBAwkAwatl/8CfvP7Aoxb+wIBz/cAE0/zAATX8wFCZ+8DL//rAUWj6wMPS+cAEP/nA+qz4wI8c+MCqjffAOgD3wCl09sBm6fXAlnP8wHez+8Ao+PrAQUH6wGmO+cBM3/jApTP4wDGL98C45fbABEP2wOii9cA5BfXA0Gn0wIrQ88BGOfPA5qPywFEQ8sBsfvHAIO7wwFhf8MAB0u/A1bz2wBn09cDWMPXAk3L0wOW488BtA/PA11HywNqj8cAx+fDAoVHwwPSs78D5Cu/AhGvuwGzO7cCNM+3AxJrswPQD7MAAb+vAzdvqwENK6sBMuunAuwrxwMQ48MADbe/A66buwP7l7cDPKe3A/XHswC++68AaDuvAeGHqwAu46cCbEenA9W3owOzM58BVLufACpLmwOr35cDSX+XAp8nkwEw15MCpouPAkF7rwKCC6sC+renAQt/owJsW6MBJU+fA2pTmwOva5cAgJeXAK3PkwMbE48CuGePAq3HiwInM4cAXKuHAK4rgwJ7s38BLUd/AEbjewNIg3sBxi93AubnlwPHS5MAq9OPAoxzjwK9L4sC6gOHAPrvgwMn638DyPt/AX4fewLzT3cDBI93ALHfcwMLN28BLJ9vAmYPawH3i2cDQQ9nAbKfYwDAN2MD7dNfAux3gwBMr38CEQd7AKmDdwDyG3MALs9vA/+XawJEe2sBIXNnAu57YwIzl18BnMNfAAX/WwBbR1cBpJtXAw37UwPHZ08DGN9PAGJjSwMH60cCeX9HARozawImM2cAkl9jADavXwFjH1sA769XAAxbVwBJH1MDffdPA8LnSwNf60cA2QNHAtYnQwAjXz8DpJ8/AG3zOwGPTzcCQLc3AcorMwN7py8CuS8vAPQfVwP3408CG9tLAnv7RwDQQ0cBaKtDAP0zPwC11zsCEpM3AttnMwEcUzMDIU8vA15fKwBzgycBILMnAFHzIwEDPx8CTJcfA2H7GwN/axcB8OcXAvZDPwFFyzsBTYc3AWFzMwCBiy8CUccrAwYnJwNOpyMAP0cfA1P7GwI8yxsDDa8XA/qnEwNzsw8AENMPAJH/CwPXNwcA1IMHAqnXAwB3Ov8BfKb/AKivKwJ76yMBp2cfA4cXGwJC+xcA0wsTAr8/DwAvmwsBvBMLAHirBwHJWwMDWiL/Ay8C+wNz9vcClP73AyIW8wPTPu8DgHbvASm+6wPXDucCqG7nANdnEwEqUw8DjYMLAEz3BwCsnwMCvHb/AVB++wPwqvcCpP7zAgVy7wMCAusC/q7nA6dy4wLgTuMC4T7fAgZC2wLbVtcADH7XAHmy0wMO8s8C1ELPA552/wAZCvsAk+rzADMS7wMqdusCnhbnAI3q4wO15t8Dgg7bA/Za1wGOytMBO1bPAEv+ywBcvssDWZLHA2p+wwLjfr8ARJK/AkWyuwOy4rcDdCK3AqHy6wN8GucDip7fAMF22wIsktcD6+7PAveGywE7UscBZ0rDAtNqvwFnsrsBmBq7AEyitwLFQrMCnf6vAarSqwITuqcCHLanAFXGowNe4p8B/BKfAPHm1wD3ms8ArbbLANguxwNW9r8DDgq7A/1etwMQ7rMCHLKvA6yiqwMQvqcAIQKjA0FinwFN5psDeoKXA1c6kwK0CpMDrO6PAI3qiwPO8ocAEBKHAvpewwOnjrsBrTa3AL9GrwGBsqsBtHKnACd+nwC2ypsAMlKXAFYOkwOh9o8BTg6LASJKhwN6poMBHyZ/Az++ewNYcnsDQT53AQYicwLnFm8DXB5vAkNyrwAEEqsBvTKjAjrKmwEUzpcC2y6PASHmiwKk5ocDJCqDA1uqewDnYncCN0ZzAmtWbwFHjmsDE+ZnAIRiZwLI9mMDWaZfA/puWwK3TlcBxEJXAO0ynwOdKpcBWbqPAIbOhwPcVoMC3k57AfSmdwKrUm8DikprAEGKZwFxAmMApLJfADSSWwMwmlcBSM5TArUiTwAtmksCxipHA/bWQwF3nj8BTHo/AQuuiwCG9oMCGt57ADNecwEoYm8Drd5nAyPKXwPaFlsDNLpXA7eqTwDm4ksDSlJHAFn+QwJZ1j8ASd47AcoKNwMGWjMAqs4vA79aKwGsBisAMMonA572ewC5fnMCCLJrAtSKYwGc+lsArfJTAqNiSwLFQkcBV4Y/A5YeOwPpBjcBvDYzAYeiKwCjRicBPxojAksaHwNXQhsAh5IXAnf+EwIgihMA9TIPA58eawEU1mMDC0ZXAn5qTwLSMkcCipI/A+96NwGE4jMCkrYrAyjuJwB7gh8AzmIbA3GGFwDA7hMCCIoPAWBaCwGsVgcCaHoDA1GF+wP6WfMAw23rAMgyXwBJDlMB0q5HAO0OPwLIHjcC49YrA7wmJwOlAh8BFl4XAywmEwHyVgsCeN4HAdNt/wD5rfcC7GnvAhOZ4wJ/LdsBwx3TAstdywGf6cMDRLW/AYIeTwHCLkMAyvY3ArCCLwM6ziMDtc4bA8F2EwHxugsAgooDA8+p9wJXKesAe3XfACh11wF+FcsCuEXDAC75twAaHa8CZaWnAImNnwFJxZcAlkmPAaGcHwaUaB8GTzwbBE4YGwQg+BsFY9wXB7LEFwbBtBcGQKgXBfegEwWenBME/ZwTB+CcEwYjpA8HiqwPB/W4Dwc8yA8FP9wLBdrwCwT2CAsGbSALBAoIEwZQxBMEU4wPBXJYDwUtLA8HCAQPBqLkCweNyAsFfLQLBB+kBwcqlAcGXYwHBYCIBwRfiAMGuogDBHGQAwVQmAMGa0v/A/Vn/wL3i/sDMbP7A/JwBwbNIAcGb9gDBiKYAwVNYAMHYCwDB8YH/wDHv/sA9X/7A6NH9wAlH/cB6vvzAGTj8wMez+8BmMfvA3bD6wBMy+sDytPnAZDn5wFa/+MC2RvjA0XH9wBfB/MBWFfzAJW77wCjL+sAOLPrAjpD5wGb4+MBeY/jAQdH3wN5B98ALtfbAoCr2wHui9cB6HPXAf5j0wG4W9MAvlvPAqBfzwMaa8sByH/LAwqz3wFnz9sCRP/bA7pD1wAfn9MB7QfTA9p/zwC4C88DeZ/LAy9DxwL488cCFq/DA9BzwwOKQ78AqB+/AqX/uwEH67cDVdu3ASvXswId17MB39+vADuzxwFUp8cD5bPDAbLbvwDAF78DXWO7A/rDtwE4N7cB5bezAOtHrwFM468CKourArg/qwI9/6cAD8ujA5GbowA7e58BiV+fAwdLmwBBQ5sA0z+XADTHswEVk68CwnurAqd/pwJsm6cAHc+jAecTnwI0a58DqdObAP9PlwEQ15cC5muTAZAPkwBBv48CO3eLAsU7iwFPC4cBNOOHAgLDgwM0q4MAWp9/AM33mwHml5cDo1eTAuw3kwEhM48D3kOLAQ9vhwLkq4cDvfuDAitffwDg038CvlN7ArPjdwPRf3cBRytzAkDfcwIen28AKGtvA9o7awCgG2sB/f9nAE9LgwFzu38DnE9/AzUHewEV33cCfs9zAQPbbwKI+28BLjNrA0t7ZwNk12cAKkdjAGvDXwMZS18DPuNbA/iHWwCGO1cAK/dTAjm7UwIji08DTWNPAazHbwH1A2sATWtnAH33YwLSo18AG3NbAYBbWwCRX1cDIndTA0enTwNI608BrkNLAROrRwBFI0cCMqdDAdg7QwJd2z8C64c7AsU/OwFDAzcBwM83ALJ3VwJSd1MD1qdPAEMHSwNHh0cBIC9HAozzQwCl1z8A7tM7ASfnNwNhDzcB2k8zAw+fLwGVAy8AOncrAdv3JwF1hycCJyMjAxTLIwOKfx8CyD8fAghfQwI8Hz8BBBc7AJA/NwPUjzMCaQsvAHmrKwKuZycCG0MjACg7IwKZRx8DbmsbAN+nFwFU8xcDdk8TAfO/DwOpOw8DmscLANBjCwJ+BwcD27cDA46LKwJiAycDhbcjADWnHwKBwxsBSg8XABKDEwLvFw8Cf88LA7yjCwAZlwcBOp8DARu+/wHs8v8CFjr7ACuW9wLY/vcBBnrzAZwC8wOtlu8CYzrrAFULFwCMLxMAA5sLAstDBwIHJwMDszr/ApN++wIb6vcCSHr3A7Eq8wNB+u8CVubrApPq5wHhBucCdjbjAqt63wEE0t8APjrbAyeu1wCpNtcD2sbTAOfi/wPipvsAQcL3APEi8wH4wu8AVJ7rAeyq5wFo5uMCKUrfACHW2wPOftcCE0rTAEAy0wPxLs8DDkbLA7NyxwA4tscDKgbDAy9qvwMQ3r8BxmK7A1ci6wDlgucDaDrjAIdK2wMGntcC1jbTANIKzwLGDssDTkLHAa6iwwHTJr8AH867AXCSuwMNcrcCgm6zAbOCrwKsqq8DzearA5M2pwCYmqcBtgqjA07e1wHAxtMCGxbLAK3GxwMExsMD0BK/AteitwDfbrMDm2qvAYuaqwHr8qcAiHKnAckSowJ10p8Dxq6bA0emlwLAtpcAVd6TAkcWjwMQYo8BUcKLAfMmwwIohr8Cel63AhCiswEvRqsBNj6nALGCowNNBp8BvMqbAZDClwFA6pMD6TqPAVG2iwHKUocCEw6DA1PmfwMQ2n8DFeZ7AXMKdwBkQncCYYpzAZgKswNE0qsAUiajAvPumwI6JpcCPL6TAE+uiwLW5ocBXmaDAIIifwG+EnsDajJ3AKKCcwEO9m8A945rAQxGawJ1GmcCpgpjA2MSXwKsMl8CzWZbAV2enwN5vpcA2nqPAye6hwB1eoMDv6J7AQYydwFpFnMDREZvAf++ZwIXcmMA915fAON6WwDbwlcAfDJXAAjGUwAdek8B2kpLAqc2RwA8PkcAoVpDAFv2iwHfXoMCf257A+wWdwPJSm8AFv5nA7EaYwJ7nlsBenpXAuGiUwIJEk8DTL5LAACmRwJYukMBQP4/AE1qOwOh9jcD3qYzAg92LwOYXi8CMWIrAKMiewFlwnMARRprA8EWYwGRslsDRtZTAtB6TwL6jkcDfQZDAUvaOwJ2+jcCNmIzANIKLwOJ5isAefonAnY2IwEOnh8ATyobANPWFwOYnhcB/YYTAicyawAE/mMBF4pXAaLOTwBCvkcCs0Y/AnheOwF59jMCX/4rAMpuJwGRNiMCpE4fAyuuFwNDThMAIyoPA8cyCwD7bgcDN84DAoBWAwLN/fsBu43zAXg2XwFhHlMCttJHAGFOPwLgfjcA3F4vABzaJwIl4h8Aw24XAolqEwMHzgsC5o4HAAWiAwLN8fsCPSXzAHjN6wFk2eMCcUHbAmn90wFHBcsAAFHHAYIeTwG2MkMAgwY3AZCmLwAjDiMAxi4bAk36EwKKZgsC82IDApXB+wAlqe8Bbl3jA5vJ1wIl3c8C2IHHAbOpuwCbRbMDV0WrAy+lowLMWZ8CFVmXAVPUHweGvB8EwbAfBIioHwZnpBsF8qgbBs2wGwSowBsHO9AXBjboFwVeBBcEgSQXB2REFwXbbBMHspQTBMHEEwTo9BMEBCgTBe9cDwaGlA8FsdAPB9AkFwdbABMG2eQTBbzQEwd7wA8HmrgPBa24DwVYvA8GR8QLBBrUCwaV5AsFdPwLBHwYCwd3NAcGKlgHBGmABwYIqAcG59QDBtMEAwWyOAMHYWwDBqx4CwbHRAcH3hgHBUj4BwZr3AMGssgDBaW8AwbQtAMHn2v/AIl3/wO/h/sApaf7ArfL9wFt+/cAVDP3Awpv8wEgt/MCQwPvAhlX7wBTs+sAqhPrAK2j+wArG/cD/KP3Ao5D8wJn8+8CQbPvAPuD6wGJX+sDB0fnAJ0/5wGTP+MBMUvjAuNf3wINf98CN6fbAt3X2wOYD9sD/k/XA6iX1wJG59MDgTvTArpX4wNbq98C8RffA5qX2wOgK9sBidPXAAeL0wHdT9MCDyPPA5kDzwGq88sDdOvLAErzxwOE/8cAjxvDAt07wwHzZ78BWZu/AKvXuwN6F7sBdGO7AM8fywAAT8sBIZfHAfb3wwCAb8MDBfe/A/uTuwH9Q7sD4v+3AITPtwLyp7MCQI+zAaaDrwBog68B4ourAWyfqwKGu6cAoOOnA0sPowIVR6MAl4efAIf7swNI/7MDWiOvAg9jqwEcu6sCgienAG+rowFNP6MDtuOfAmybnwBKY5sAUDebAZIXlwM8A5cAkf+TANwDkwOGD48D8CePAZ5LiwAQd4sC0qeHA+jvnwKty5sCjseXAHvjkwG1F5MD7mOPAQfLiwMtQ4sAwtOHAFBzhwCOI4MAV+N/ApmvfwJvi3sC8XN7A2tndwMVZ3cBW3NzAZ2HcwNXo28B/ctvAYoLhwASt4MAH4d/Agx3fwK5h3sDXrN3AYv7cwMhV3MCPstvAThTbwKV62sA/5dnA0lPZwBjG2MDTO9jAzbTXwNIw18C0r9bASjHWwGu11cD2O9XAJNPbwHjw2sByGNrAAkrZwDiE2MBHxtfAeg/XwDFf1sDhtNXAEBDVwE9w1MA/1dPAiD7TwN2r0sD4HNLAmZHRwIgJ0cCRhNDAhALQwDeDz8CCBs/APzDWwM0+1cB6WdTAAn/TwFGu0sBy5tHAkibRwPlt0MAEvM/AJhDPwOFpzsDEyM3AbizNwISUzMC5AMzAxHDLwGbkysBkW8rAidXJwKRSycCL0sjA8JvQwP+Zz8Depc7AFb7NwFvhzMCVDszAy0TLwCSDysDlyMnAaRXJwB5oyMCEwMfAKh7HwKmAxsCp58XA2FLFwOzBxMCmNMTAyKrDwB4kw8B2oMLAuxjLwEUEysCW/8jA9gjIwOMex8ARQMbAXWvFwMyfxMCB3MPAviDDwNlrwsA/vcHAbBTBwO5wwMBd0r/AXTi/wJyivsDPEL7AtIK9wA/4vMCocLzAfanFwCWAxMDaaMPAmWHCwKFowcBrfMDApJu/wCXFvsDt973AHTO9wPF1vMC/v7vA7w+7wPxlusBxwbnA5CG5wPmGuMBb8LfAwF23wOLOtsCFQ7bAb1HAwHoQv8At5L3ANcq8wIfAu8BaxbrAI9e5wIb0uMBZHLjAl023wFuHtsDgyLXAdxG1wIdgtMCJtbPABBCzwI9vssDK07HAYTyxwAapsMB1GbDANRS7wH+4ucBrdLjATUW3wMsotsDQHLXAjh+0wHEvs8AaS7LAWHGxwCOhsMCT2a/A3RmvwFJhrsBVr63AXQOtwPBcrMCju6vAEx+rwOyGqsDg8qnA3fW1wNt7tMDTHLPAwdWxwPKjsMADha/A13auwJl3rcCvhazAtZ+rwHXEqsDh8qnADyqpwDJpqMCWr6fAnPymwLlPpsBzqKXAWgalwA5ppMA10KPA3vqwwKFer8AP4a3A0n6swN80q8B6AKrANt+owPHOp8DNzabALNqlwKLypMD1FaTAFUOjwBJ5osAct6HAfvygwJVIoMDVmp/AwfKewOlPnsDqsZ3ABiiswEllqsA1xajALkSnwNbepcAakqTANVujwLI3osBnJaHAcSKgwCktn8AgRJ7AGGadwPmRnMDTxpvA0wObwD5ImsByk5nA4OSYwAk8mMB8mJfAWIKnwKOUpcDDzaPA8CmiwIuloMAuPZ/Ave2dwGq0nMC6jpvAe3qawMF1mcDifpjAaJSXwBG1lsDB35XAhBOVwINPlMADk5PAXt2SwAQuksBzhJHA3g6jwLHxoMCI/57AmjSdwB6Nm8BuBZrAHZqYwAdIl8BXDJbAiOSUwGLOk8Dyx5LAiM+RwKrjkMAOA5DAlyyPwE1fjsBVmo3A89yMwH4mjMBidovAZtKewHmBnMCHX5rA/WiYwBSalsAA75TAFGSTwN71kcAwoZDAL2OPwE45jsBMIY3AMhmMwEcfi8ANMorANlCJwKJ4iMBSqofAbOSGwC8mhsDwboXAK9GawLlImMC+8pXAG8yTwEHRkcBt/o/Azk+OwLTBjMCjUIvAafmJwCG5iMA3jYfAY3OGwKdphcBEboTAtn+DwKycgsABxIHAs/SAwOUtgMCm3X7AiQ6XwJ5LlMDivZHA7GKPwKg3jcCNOIvA2GGJwLmvh8B6HobAmaqEwNtQg8BUDoLAaeCAwJSJf8Dkcn3APHl7wIeZecAZ0XfAoB12wBV9dMCz7XLAYIeTwGuNkMANxY3AGjKLwDnSiMBgoobAD5+EwITEgsDtDoHAHvV+wMgHfMBST3nA1MV2wAZmdMA+K3LAYxFwwOIUbsCdMmzA4GdqwE+yaMDcD2fAzn0IwTE/CMFiAgjBQscHwbONB8GcVQfB5R4HwXnpBsFFtQbBN4IGwUFQBsFSHwbBXu8FwVjABcE2kgXB7GQFwXI4BcG9DAXBxeEEwYO3BMHvjQTB+owFwbhKBcGACgXBLMwEwZqPBMGsVATBRhsEwVHjA8G2rAPBYncDwUFDA8FDEAPBWN4CwXStAsGIfQLBiU4CwWwgAsEn8wHBr8YBwf2aAcEHcAHB7ZsCwdNVAsEFEgLBV9ABwaGQAcHAUgHBlBYBwQHcAMHtogDBQWsAweg0AMGd///AyJf/wDEy/8C4zv7ARW3+wLwN/sAJsP3AE1T9wMn5/MAWofzAmlb/wEDC/sASM/7Aqaj9wKci/cC7oPzAmiL8wAOo+8C7MPvAjrz6wEpL+sDF3PnA1nD5wFkH+cAtoPjAMzv4wE7Y98Bld/fAYBj3wCi79sCoX/bAjnf5wIHa+MBHQ/jAZ7H3wHIk98ALnPbA2xf2wJaX9cD5GvXAx6H0wMkr9MDMuPPAo0jzwCXb8sAscPLAlgfywEOh8cAVPfHA8trwwL968MBnHPDAHJzzwLb18sDgVfLAC7zxwLcn8cB1mPDA4g3wwKeH78B1Be/ABYfuwBoM7sB5lO3A8B/twE+u7MBrP+zAH9PrwEVp68C9AevAaZzqwCw56sDu1+nAvcXtwDoV7cAebOzAwMnrwIst68D/lurApwXqwB556cAL8ejAG23owAjt58CPcOfAdvfmwImB5sCWDubAcp7lwPUw5cD5xeTAXl3kwAL348DLkuPAAvbnwHo658BPh+bAutvlwA435cCymOTAIgDkwOZs48CY3uLA2VTiwFjP4cDJTeHA6s/gwIBV4MBS3t/AMGrfwO343sBeit7AXh7ewMu03cCFTd3AnS7iwP5m4cDXqODAPvPfwGhF38Cint7AUf7dwOxj3cD5ztzADz/cwM6z28DhLNvA/KnawNsq2sA/r9nA8TbZwL7B2MB3T9jA89/XwApz18CZCNfAZnHcwG6c28A00trAphHawNRZ2cDuqdjAPAHYwCJf18ARw9bAkCzWwDCb1cCQDtXAWobUwD8C1MD5gdPASQXTwPeL0sDNFdLAnaLRwDsy0cCAxNDAbcDWwJ7c1cAJBdXAaTjUwKR108DGu9LA+wnSwIdf0cDKu9DANB7QwEaGz8CR887AsmXOwFDczcAbV83AzNXMwCJYzMDj3cvA2mbLwNfyysCsgcrA/B3RwJUp0MAgQ8/AH2nOwEaazcB11czAtRnMwCpmy8AZusrA2xTKwN91ycCk3MjAt0jIwLS5x8BAL8fACqnGwMkmxsA7qMXAJS3FwFG1xMCNQMTAq4zLwJyFysB/jsnAkaXIwE7Jx8Bj+MbArTHGwCx0xcAFv8TAdhHEwNVqw8CPysLAITDCwBabwcAHC8HAl3/AwHb4v8BXdb/A+fW+wB56vsCQAb7AZw/GwEjzxMBq6cPAwO/CwIAEwsAgJsHAR1PAwMuKv8Cqy77AAhW+wBBmvcAnvrzAsBy8wCWBu8AR67rAC1q6wLTNucC5RbnAz8G4wLBBuMAhxbfAhKnAwIZ1v8B0Vr7A7Um9wNpNvMBsYLvADoC6wGSrucA/4bjAmCC4wIpot8BMuLbAMQ+2wJ5stcAL0LTAATm0wBWns8DoGbPAJJGywH0MssCti7HAwl67wKsPusCO2LjArba3wJ6ntsBCqbXAwbm0wILXs8AiAbPAbDWywFZzscD2ubDAggiwwEder8Cquq7AIR2uwDKFrcBv8qzAemSswPvaq8CjVavAVjO2wHvFtMANc7PA8jiywGEUscDlArDAWgKvwOAQrsDXLK3A11SswKaHq8A0xKrAlgmqwPxWqcCzq6jAHAeowKtop8Dkz6bAWDymwKetpcB4I6XA5CuxwC2br8C6Ka7AFNSswBWXq8Dtb6rAHlypwHtZqMAdZqfAX4CmwNGmpcA12KTAeROkwKxXo8D9o6LAs/ehwC9SocDisqDATxmgwAeFn8Ck9Z7Ab02swGiVqsDPAKnA4IunwBozpsBP86TApcmjwJezosDvrqHAwLmgwFzSn8BR957AWyeewGNhncB1pJzAu++bwH5Cm8AYnJrA+/uZwKZhmcCpzJjAO52nwDO5pcD5/KPAlmSiwEDsoMBvkJ/A602ewNEhncCVCZzA+AKbwAYMmsAMI5nAkUaYwE11l8AlrpbAIfCVwGk6lcBBjJTAA+WTwB5Ek8AQqZLAmiCjwNELocA/I5/A5WKdwMzGm8AiS5rAVuyYwCmnl8CveJbAU16VwM5VlMAmXZPAonKSwMKUkcA7wpDA7fmPwNw6j8AvhI7AJdWNwBgtjcByi4zAntyewIySnMDjeJrA2ouYwHTHlsC1J5XAxaiTwAxHksBD/5DAdc6PwASyjsCjp43AT62MwErBi8AP4orATg6KwOJEicDNhIjAMc2HwE0dh8B2dIbAzNWawG1SmMAsA5bAteSTwEXzkcDhKpDAiIeOwF4FjcDEoIvAaVaKwFAjicDUBIjAnviGwKj8hcAqD4XAmy6EwKdZg8Akj4LAEc6BwI4VgcDVZIDAtQ+XwONPlMAUx5HAtnKPwIFPjcC4WYvAYI2JwHnmh8AeYYbAq/mEwMWsg8Bpd4LA6FaBwOZIgMCmln7Axrh8wA71esDLSHnAo7F3wI0tdsDAunTAYIeTwGiOkMD5yI3AzTqLwGHhiMB6uYbAYb+EwB/vgsCwRIHAV3h/wMqjfMD3BHrAxJV3wMVQdcAyMXPA3TJxwCJSb8DZi23ARd1rwAVEasAGvmjA2QAJwZfICMEskgjBdl0IwVkqCMG7+AfBhMgHwZ6ZB8H3awfBfT8HwSAUB8HR6QbBg8AGwSiYBsG3cAbBJEoGwWQkBsFw/wXBPtsFwce3BcEClQXBFAsGwTrPBcFxlQXBk10FwX4nBcET8wTBN8AEwdOOBMHOXgTBFTAEwZYCBMFA1gPBA6sDwdGAA8GdVwPBWy8DwQAIA8GB4QLB1LsCwfKWAsHQcgLBvxQDwRjVAsHElwLBlVwCwWYjAsEQ7AHBd7YBwXuCAcEFUAHB/B4BwUzvAMHiwADBq5MAwZdnAMGYPADBoRIAwUfT/8Apg//A1DT/wDHo/sAwnf7Aix4AwbO1/8CJM//AMLb+wEo9/sCFyP3Allf9wD3q/MA+gPzAZBn8wH61+8BfVPvA4vX6wN+Z+sA3QPrAyuj5wHuT+cAwQPnA0e74wEif+MB/UfjAWlL6wFPC+cAsOPnAabP4wJ4z+MBquPfAeUH3wH3O9sA0X/bAX/P1wMeK9cA6JfXAi8L0wI9i9MAiBfTAH6rzwGhR88De+vLAZ6bywOlT8sBMA/LAw2r0wHDR88C4PvPADLLywOwq8sDpqPHAnyvxwLay8MDgPfDA1szvwFlf78Av9e7AJo7uwA4q7sC7yO3ACGrtwM8N7cDws+zATFzswMcG7MBIs+vA24fuwHTk7cB/SO3AVLPswF0k7MAXm+vAEBfrwOKX6sAyHerArqbpwA806cAUxejAgVnowCHx58DEi+fAPSnnwGTJ5sAVbObALRHmwIy45cAWYuXAQ6vowN3858DgVufAhrjmwB4h5sAQkOXA1wTlwPx+5MAW/uPAyYHjwMEJ48C0leLAXyXiwIa44cDxTuHAb+jgwNOE4MDzI+DAqcXfwNJp38BPEN/AutbiwEEc4sBNa+HA88LgwGYi4MDziN/A/vXewP5o3sB54d3ABF/dwEHh3MDZZ9zAgfLbwPOA28DzEtvAR6jawL5A2sAn3NnAWnrZwC4b2cCBvtjAKgzdwFZE3MBRh9vAA9TawH4p2sDthtnAnOvYwOlW2MBKyNfAQT/XwGG71sBJPNbAocHVwBxL1cBz2NTAZ2nUwL/908BGldPAzi/TwCrN0sAybdLArk3XwP121sCZrNXAOe3UwME31MA7i9PA0ebSwMhJ0sB9s9HAYSPRwPWY0MDKE9DAe5PPwLAXz8AZoM7AbizOwG+8zcDhT83Aj+bMwEmAzMDiHMzAoZ3RwEu20MD/3M/AORDPwKpOzsAwl83A0ejMwLFCzMATpMvAUQzLwNh6ysAm78nAymjJwF/nyMCJasjA9/HHwGF9x8CEDMfAJJ/GwA01xsALzsXAqv7LwJcEy8CTGsrA1j7JwNdvyMA/rMfA6PLGwNFCxsAcm8XACPvEwOphxMAuz8PAUELDwNy6wsBrOMLAn7rBwCdBwcC5y8DAEFrAwPHrv8Akgb/AzXPGwIRkxcCnZ8TAHXvDwBedwsABzMHAggbBwGxLwMC7mb/AjfC+wBxPvsC8tL3A1SC9wOCSvMBpCrzABYe7wFcIu8ALjrrA1Re6wHClucCgNrnAcgDBwBbZv8Dfxr7AXse9wHHYvMBA+LvAMyW7wOldusAwobnA/+24wHBDuMC5oLfALAW3wC5wtsA24bXAzle1wInTtMAIVLTA9tizwAdis8D17rLAeqi7wLhlusA+O7nAOya4wDQkt8ACM7bAxFC1wNp7tMDfsrPAmvSywP8/ssAjlLHAOvCwwJJTsMCOva/ApC2vwFmjrsBCHq7A/J2twDMircCXqqzAO3C2wEoOtcAwyLPAt5qywAWDscCVfrDAN4uvwASnrsBU0K3AvAWtwABGrMANkKvA9+KqwO09qsA6oKnAPwmpwHB4qMBR7afAc2enwHXmpsD/aabAiVyxwCnXr8Caca7ARSitwOj3q8Cf3arA3tapwGrhqMBV+6fA8yKnwNFWpsCulaXAdN6kwDIwpMAViqPAZeuiwIBTosDYwaHA8DWhwFevoMCrLaDAn3KswCvFqsDfO6nAzdKnwFSGpsApU6XAXjakwF4to8DnNaLAAk6hwP5zoMBhpp/A5uOewHMrnsASfJ3A7tScwEw1nMCInJvAEgqbwGp9msAf9pnAArinwI7dpcDWK6TAtZ6iwDUyocCs4p/AxayewIqNncBbgpzA8IibwEufmsCyw5nAp/SYwOAwmMA/d5fAy8aWwKoelsAgfpXAhuSUwEpRlMDrw5PASDKjwNUlocDCRp/A3JCdwPn/m8AckJrAkz2ZwAAFmMBi45bAE9aVwMDalMBm75PAQxKTwNZBksDOfJHACMKQwIkQkMB0Z4/ACsaOwKIrjsCnl43A0+aewJSjnMAmkprAhq6YwIP0lsDtX5XAweyTwEWXksARXJHAHTiQwLgoj8CIK47Agz6NwOFfjMAZjovA2MeKwPYLisB0WYnAcq+IwC8NiMD/cYfAa9qawB1cmMCOE5bAN/2TwBsVksAHV5DAyr6OwFtIjcD274vALLKKwOqLicB4eojAdHuHwMuMhsCwrIXAltmEwCIShMArVYPArKGCwMT2gcCtU4HA4RCXwCdUlMBD0JHAdYKPwENnjcC3eovAnriJwMMciMAZo4bA00eFwHoHhMDx3oLAecuBwKfKgMDCtH/AqPF9wNpIfMCat3rAijt5wJ3Sd8AJe3bAYIeTwGWPkMDlzI3AfEOLwH/wiMB+0IbAit+EwHQZg8ADeoHAR/p/wAU+fcA/uHrArGJ4wLk3dsCCMnTAx05ywNOIcMBz3W7A40ltwLzLa8DoYGrAPC4uwT8kLsH5Gi7BXRIuwV4KLsHxAi7BDPwtwab1LcG07y3BMOotwRHlLcFR4C3B59stwc/XLcEB1C3BetAtwTTNLcEqyi3BWMctwbrELcFMwi3BGtQqwUfJKsE6vyrB5LUqwTmtKsEtpSrBtJ0qwcOWKsFSkCrBV4oqwcmEKsGifyrB2XoqwWh2KsFJcirBdW4qwehqKsGcZyrBjWQqwbZhKsETXyrB83onwTlvJ8FUZCfBNlonwdFQJ8EXSCfB/T8nwXc4J8F7MSfB/yonwfokJ8FjHyfBMxonwWIVJ8HqECfBwwwnwekIJ8FWBSfBBQInwfD+JsEU/CbB3CIkwScWJMFZCiTBYv8jwTT1I8G+6yPB9uIjwc/aI8E80yPBNMwjwa3FI8GevyPB/rkjwcW0I8HsryPBbKsjwT6nI8FeoyPBxZ8jwW6cI8FUmSPB7MsgwSi+IMFdsSDBfKUgwXKaIMEykCDBroYgwdd9IMGhdSDBAm4gwe5mIMFcYCDBQ1ogwZlUIMFXTyDBdkogwe9FIMG6QSDB0z0gwTQ6IMHXNiDBO3YdwVFnHcF1WR3BlUwdwaBAHcGENR3BMysdwZ4hHcG4GB3BdRAdwckIHcGpAR3BDPscwen0HME17xzB6+kcwQHlHMFy4BzBN9wcwUnYHMGj1BzB4iEawboRGsG3AhrBxPQZwc/nGcHF2xnBl9AZwTXGGcGQvBnBm7MZwUqrGcGRoxnBZpwZwb2VGcGPjxnB0okZwX+EGcGNfxnB9noZwbN2GcG/chnB/s4WwX69FsE7rRbBH54WwRWQFsEKgxbB7XYWwaxrFsE4YRbBg1cWwX9OFsEgRhbBWj4WwSM3FsFvMBbBNyoWwXAkFsEUHxbBGhoWwXsVFsExERbBrX0TwbpqE8EdWRPBv0gTwYo5E8FoKxPBSB4TwRYSE8HCBhPBPfwSwXfyEsFk6RLB9+ASwSTZEsHh0RLBIssSwd/EEsEPvxLBqbkSwae0EsEAsBLBDy4QwYoZEMF4BhDBvvQPwUXkD8H21A/BvcYPwYe5D8FBrQ/B2qEPwUOXD8FtjQ/BS4QPwdB7D8Hwcw/BoGwPwdZlD8GIXw/BrlkPwUBUD8E1Tw/BR+AMwRHKDMFrtQzBOaIMwWKQDMHNfwzBZXAMwRViDMHIVAzBbUgMwfM8DMFLMgzBZSgMwTMfDMGqFgzBvA4MwWAHDMGLAAzBM/oLwU/0C8HX7gvBwpUJwXl8CcEXZgnBT1EJwf09CcEILAnBWBsJwdYLCcFu/QjBC/AIwZzjCMEP2AjBVM0IwV3DCMEcugjBhbEIwYqpCMEhogjBQZsIwd6UCMHwjgjBj00GwTQyBsHCGAbBIAIGwTXtBcHE2QXBsccFweW2BcFKpwXByZgFwVCLBcHMfgXBK3MFwV9oBcFXXgXBB1UFwWFMBcFZRAXB5DwFwfc1BcGKLwXBygcDwTLqAsGqzgLBD7UCwSyeAsEfiQLBkXUCwWRjAsF/UgLBzUICwTc0AsGpJgLBExoCwWEOAsGEAwLBbvkBwRDwAcFd5wHBSd8BwcjXAcHR0AHBd4n/wIBJ/8D8Df/AnNb+wBuj/sDXdP7Afkr+wCEj/sCK/v3Aidz9wO+8/cCSn/3AS4T9wPNq/cBpU/3Aiz39wDwp/cBgFv3A3QT9wJr0/MCA5fzA/w35wP/D+MCgg/jAukf4wAAQ+MAq3PfAXq33wMCC98AhW/fATjb3wBQU98BF9PbAuNb2wEK79sDAofbAD4r2wAx09sCcX/bAoEz2wP869sCgKvbASKTywFxK8sCN/vHAxb3xwH2B8cBnSfHAPBXxwOjl8MADu/DAI5PwwBJu8MCfS/DAnCvwwN0N8MA68u/AjtjvwLTA78CNqu/A+pXvwN6C78Agce/AWELswDzh68DAhuvAIDnrwO/36sBEu+rA04LqwFFO6sB1HurASfPpwCfL6cDYpenALIPpwPRi6cADRenAMinpwFoP6cBZ9+jADeHowFfM6MAcuejADublwPF/5cA5HuXALMPkwLlz5MAeMuTAEPXjwEK848Bqh+PABFfjwJEr48AsA+PAoN3iwLq64sBMmuLAKnziwCpg4sAnRuLA/i3iwIwX4sC0AuLA1JDfwPsj38CVvd7AP1vewKD/3cBYrt3AUmzdwOEu3cC19dzAh8DcwJeP3MDcY9zANDvcwGoV3MBK8tvAptHbwFGz28Ajl9vA9HzbwKJk28ALTtvAcEbZwHfP2MDxYdjAQvvXwE6Y18AcPNfA/ujWwIym1sC2aNbALS/WwKj51cAtyNXAKZzVwD5z1cA1TdXA2ynVwAEJ1cB56tTAHM7UwMKz1MBHm9TAvxnTwA2G0sAmDtLA85/RwPo40cBm1dDAoXjQwKkj0MDM4M/AkaLPwKpoz8DMMs/AxgDPwHrUzsBLq87AA4XOwG5hzsBdQM7AoyHOwBYFzsCQ6s3AlwXNwGRczMC3xcvA4EzLwP/dysCZdsrAhxLKwC61ycBcXsnAERvJwHHcyMArosjA9WvIwIk5yMDNDMjAWuPHwNO8x8ADmcfAu3fHwM1Yx8ARPMfAHhbHwFJJxsAfn8XAJQXFwMOLxMAWHMTADLTDwLNPw8DE8cLAPprCwF1VwsBWFsLAsdvBwCKlwcBjcsHAJEXBwG0bwcCl9MDAmtDAwBqvwMD5j8DApY3BwGFdwMAljb/A8OG+wIFEvsCmyr3AOVq9wIrxvMDojLzAYy68wFDWu8Cvj7vAQVC7wDwVu8BU3rrAQau6wH59usCCU7rAeiy6wDMIusB85rnAnGAuwWlYLsHaUC7B40kuwXhDLsGOPS7BGjguwRUzLsF0Li7BMSouwUMmLsGlIi7BTx8uwT0cLsFpGS7BzhYuwWcULsExEi7BKBAuwUgOLsGNDC7BdAQrwX77KsE88yrBn+sqwZvkKsEk3irBL9gqwbLSKsGjzSrB+cgqwa7EKsG5wCrBFL0qwbm5KsGhtirBx7MqwSexKsG8rirBgqwqwXWqKsGRqCrBM6knwWifJ8FilifBEI4nwWWGJ8FUfyfB0XgnwdFyJ8FKbSfBMWgnwX9jJ8EsXyfBMFsnwYRXJ8EiVCfBBVEnwSZOJ8GBSyfBEUknwdNGJ8HCRCfB7U4kwTpEJMFeOiTBRzEkweYoJMEtISTBDxokwYATJMF0DSTB4gckwcECJMEG/iPBq/kjwaf1I8H18SPBjO4jwWnrI8GF6CPB2+UjwWfjI8Ek4SPBufUgwQrqIMFE3yDBVdUgwS3MIMG9wyDB9bsgwcq0IMEvriDBGKggwXyiIMFRnSDBjpggwSqUIMEfkCDBZowgwfeIIMHOhSDB5IIgwTaAIMG9fSDBsZ0dwe2QHcEphR3BT3odwU5wHcEVZx3BlV4dwb9WHcGHTx3B30gdwb1CHcEXPR3B4jcdwRYzHcGqLh3BmCodwdcmHcFiIx3BMyAdwUQdHcGQGh3B70Yawf84GsEkLBrBSSAawVsVGsFICxrB/gEawW75GcGK8RnBROoZwZHjGcFj3RnBstcZwXTSGcGfzRnBK8kZwRHFGcFJwRnBzr0ZwZm6GcGltxnBkvEWwVniFsFP1BbBXMcWwWy7FsFqsBbBRKYWwemcFsFJlBbBV4wWwQOFFsFDfhbBCngWwU9yFsEGbRbBKGgWwaxjFsGLXxbBvFsWwTpYFsH/VBbBuJ0TwRmNE8HFfRPBoW8TwZZiE8GQVhPBeksTwUFBE8HVNxPBJi8TwSQnE8HDHxPB9hgTwbISE8HsDBPBmgcTwbMCE8Ev/hLBBfoSwTD2EsGn8hLBuksQwWE5EMGkKBDBMxkQwfUKEMHT/Q/BtvEPwYzmD8FA3A/Bw9IPwQPKD8HzwQ/BhLoPwauzD8FbrQ/BiqcPwS6iD8E+nQ/BsZgPwYCUD8GkkA/BcvwMwZ3nDMEN1QzBMcQMwaS0DMFMpgzBEZkMwd6MDMGfgQzBQXcMwbJtDMHiZAzBw1wMwUdVDMFhTgzBBUgMwSlCDMHDPAzByjcMwTUzDMH8LgzBOq8JwX6YCcGDgwnBu3AJwcBfCcEXUAnBpEEJwVI0CcEJKAnBtRwJwUMSCcGiCAnBwv8IwZT3CMEK8AjBF+kIwbDiCMHJ3AjBWdcIwVfSCMG5zQjBPmQGwXJLBsGONAbBbR8GwWwMBsFS+wXBjOsFwf/cBcGUzwXBNMMFwcy3BcFHrQXBlKMFwaSaBcFnkgXBz4oFwc+DBcFcfQXBancFwfBxBcHlbAXBsxsDwagAA8Gv5wLBodACwVm7AsEgqALB55YCwQWHAsFgeALB32oCwWteAsHvUgLBWUgCwZY+AsGXNQLBTC0CwaclAsGcHgLBHhgCwSMSAsGgDALBx6v/wNlw/8BrOv/AKAj/wMLZ/sDtrv7AC4j+wGFl/sBmRf7A5yf+wLMM/sCd8/3Ae9z9wCfH/cB+s/3AXqH9wKqQ/cBEgf3AE3P9wABm/cDzWf3A5TD5wN/l+MCHqvjAt3P4wBlB+MBeEvjAO+f3wOK/98D4nPfAw3z3wA1f98CnQ/fAYyr3wBYT98Cc/fbAzun2wI3X9sC5xvbAN7f2wOyo9sDAm/bA/sDywL9s8sD8H/LAOeTxwAat8cANevHA/UrxwIwf8cC69/DAkNTwwCC08MA0lvDAm3rwwClh8MCxSfDADzTwwB0g8MC6DfDAx/zvwCjt78DD3u/AMFnswHX968CgqOvALFrrwPAd68BZ5urABLPqwJ6D6sDeV+rAlC/qwCoM6sB+6+nAW83pwJCx6cDul+nATIDpwIFq6cBqVunA5kPpwNQy6cAYI+nAkvflwFOW5cD0OeXAieTkwIqV5MCsV+TAsR/kwP7r48BDvOPANJDjwIln48DFQ+PA3SLjwIME48CF6OLAtM7iwOa24sDzoOLAt4ziwBB64sDfaOLAgZ3fwBQ138B/097AfHbewHog3sDu0N3AbZHdwA1Z3cD9JN3A6/TcwIzI3MCXn9zAYXvcwD1a3MCsO9zAeh/cwHoF3MCA7dvAZdfbwAPD28A6sNvABE/ZwMTb2MChctjAthDYwA6z18BzXNfAWgzXwDTL1sBuktbAAF7WwJct1sDnANbAqNfVwACz1cCfkdXA1nLVwHBW1cBAPNXAGiTVwNYN1cBP+dTA3x/TwEyO0sAUGtLAOLDRwPdN0cCp79DAdZjQwM5H0MAABdDA1MvPwAeXz8BGZs/ARTnPwLsPz8Cg6s7AA8nOwAGqzsBnjc7AB3POwLRazsBIRM7AZwjNwDVizMCjzcvAkFjLwNztysAwi8rATSzKwIDUycBJg8nA0j7JwD8FycAT0MjA+p7IwKdxyMDRR8jAQyLIwGgAyMAt4cfAX8THwM6px8BPkcfA8RbHwOtLxsCipMXAwgzFwCGXxMCKK8TAMsjDwPxow8CTEMPAzb7CwKp4wsCwPsLAIwnCwLHXwcAMqsHA6n/BwOlZwcDQN8HAXBjBwFn7wMCX4MDApY3BwBRewMCHj7/AKOe+wM9LvsCp1b3ARWm9wD4FvcC3pbzAsEy8wFn6u8CJsrvAJni7wDlCu8BtELvAdeK6wAa4usCRkbrAOm+6wIxPusBTMrrAFY4uwVqHLsEygS7BkXsuwWp2LsG0cS7BZW0uwXVpLsHbZS7BkGIuwY1fLsHMXC7BR1ouwfpXLsHfVS7B8lMuwTBSLsGUUC7BHE8uwcRNLsGJTC7BQDArwdUoK8ENIivB2BsrwSsWK8H6ECvBOwwrweMHK8HrAyvBSgArwfj8KsHu+SrBKPcqwZ70KsFM8irBLfAqwT3uKsF37CrB2OoqwVzpKsEB6CrBPNMnwRDLJ8GXwyfBwLwnwX+2J8HHsCfBi6snwcKmJ8FioifBYp4nwbmaJ8FglyfBUZQnwYWRJ8H2jifBn4wnwXyKJ8GHiCfBvoYnwRuFJ8GdgyfBHnckwR5uJMHiZSTBWV4kwXVXJMEoUSTBY0skwR1GJMFLQSTB4jwkwdk4JMEpNSTByTEkwbQuJMHiKyTBTikkwfImJMHLJCTB0iIkwQUhJMFfHyTB/hshwRQSIcECCSHBtQAhwR35IMEr8iDB0esgwQHmIMGw4CDB1NsgwWLXIMFR0yDBmc8gwTPMIMEXySDBQMYgwabDIMFGwSDBGr8gwR69IMFNuyDB9MEdwQm3HcELrR3B56MdwYqbHcHjkx3B4owdwXuGHcGggB3BRHsdwV52HcHjcR3Bym0dwQpqHcGdZh3Be2MdwZ5gHcH/XR3BmlsdwWpZHcFpVx3BHWkawRddGsEXUhrBBUgawc4+GsFgNhrBqS4awZsnGsEnIRrBPxsawdkVGsHpEBrBZAwawUMIGsF8BBrBCAEaweD9GcH9+hnBWfgZwe/1GcG68xnBlxEXwVsEF8E9+BbBJu0WwQDjFsG22RbBN9EWwXHJFsFUwhbB07sWweC1FsFvsBbBdKsWweemFsG9ohbB754WwXSbFsFFmBbBXJUWwbKSFsFEkBbBQbwTwfKsE8GanxPBZJMTwTeIE8H8fRPBoHQTwRBsE8E6ZBPBD10TwYFWE8GBUBPBBUsTwQFGE8FqQRPBOD0TwWI5E8HgNRPBqjITwbsvE8ENLRPBrWgQwc1XEMFYSBDB3DoQwY0uEMFKIxDB+xgQwYwPEMHqBhDBBf8Pwcv3D8Ev8Q/BJOsPwZ3lD8GO4A/B7tsPwbTXD8HW0w/BTNAPwRHND8Ecyg/B8BYNwV4EDcFb8wzByOMMwSDWDMG5yQzBX74MwfuzDMF5qgzBxqEMwdCZDMGIkgzB34sMwciFDME1gAzBHHsMwXN2DMEwcgzBSm4MwbpqDMF3ZwzBN8cJwciyCcERoAnB7Y4JwTp/CcFncQnB52QJwXVZCcH9TgnBaEUJwaM8CcGdNAnBRy0JwZAmCcFsIAnBzhoJwasVCcH5EAnBrQwJwb8ICcEnBQnBtHkGwTtjBsGkTgbByDsGwYEqBsGvGgbBsAwGwRYABsGO9AXBAOoFwVjgBcGC1wXBbM8FwQfIBcFCwQXBErsFwWm1BcE7sAXBf6sFwSunBcE1owXBni4DwegVA8FD/wLBhOoCwYHXAsEYxgLBJ7YCwfunAsFImwLBqY8CwQeFAsFNewLBZ3ICwUJqAsHPYgLB/1sCwcNVAsEPUALB2EoCwRRGAsG3QQLBs8//wD6W/8B7ZP/A4Db/wBYN/8DO5v7AvcP+wKCj/sDvhv7AW23+wPJV/sCFQP7A6iz+wPka/sCPCv7Ai/v9wM7t/cA94f3Av9X9wDzL/cCfwf3AZlL5wIEK+cCDz/jAXp34wGhv+MBLRfjAth74wGD798AD2/fA8b33wCqk98CSjPfA+nb3wDdj98AiUffAl0D3wHUx98CcI/fA8hb3wF0L98DEAPfAsNzywMWN8sBURfLAzAjywEPW8cDzp/HAgn3xwKBW8cADM/HAZhLxwPT08MD52vDAMsPwwG6t8MCEmfDASofwwJ528MBdZ/DAaFnwwKRM8MD3QPDAU2/swLAY7MAsyevALoDrwBlC68AtD+vAgODqwLu16sCMjurAqGrqwMlJ6sD3K+rAyBHqwNH56cDh4+nAz8/pwHG96cCirOnAQp3pwDKP6cBUgunAngjmwASs5cC4VOXAmwTlwA675MBre+TAGkjkwBEZ5MD37ePAesbjwE+i48AugePA+mLjwJdI48BvMOPAVBrjwBkG48CW8+LApuLiwCfT4sD6xOLA5qnfwLlF38DA6N7AypDewBFA3sD19d3AwrTdwAyB3cCmUd3ANibdwGv+3MD32dzAlLjcwAKa3MBmf9zADmfcwMZQ3MBiPNzAuincwKgY3MAJCdzAcFfZwMzn2MDggtjAhSXYwOXM18CPe9fA5DDXwB7u1sACutbAPorWwHhe1sBdNtbAoRHWwPzv1cAs0dXANrbVwK2d1cA4h9XArHLVwN1f1cCpTtXA6yXTwGaW0sDmJdLAE8DRwFZi0cALCdHAFrfQwNlr0MB/J9DA/PLPwNrCz8C9ls/AU27PwE1Jz8BlJ8/AWAjPwAftzsBN1M7Aq73OwPSozsAAls7AMQvNwPNnzMBr1cvADWTLwFH9ysArn8rAO0XKwKbyycDXpsnAQ2HJwPwrycB6+8jABs/IwEymyMD8gMjA0F7IwIU/yMDZI8jA7QrIwB30x8A938fAxBfHwH1OxsAVqsXAPRTFwEOixMCbOsTAwdvDwHWBw8A/LsPA3OHCwMGbwsABZcLAHzTCwFMHwsBI3sHArrjBwD2WwcC0dsHAq1rBwI5BwcCQKsHApY3BwMZewMDlkb/AUOy+wJtTvsBx4L3A8ne9wGIYvcC6vbzA4Wm8wOscvMBH1rvAC567wMlsu8CkP7vARxa7wGLwusCtzbrA5a26wICRusAveLrANbcuwa+xLsGrrC7BHqguwfyjLsE8oC7B1Zwuwb6ZLsHxli7BZZQuwRaSLsH+jy7BF44uwV6MLsHNii7BYYkuwReILsHshi7B3IUuweaELsEGhC7B+1crwdlRK8FHTCvBOEcrwaFCK8F2PivBrjorwT83K8EiNCvBTjErwb0uK8FpLCvBTCorwWEoK8GjJivBDyUrwaAjK8FUIivBJiErwRQgK8EbHyvBf/knwa7yJ8F+7CfB4OYnwcbhJ8El3SfB8dgnwSDVJ8Gq0SfBhs4nwazLJ8EVySfBvMYnwZrEJ8GrwifB6sAnwVK/J8HgvSfBkLwnwWC7J8FLuifB05skwUKUJMFijSTBJIckwXqBJMFVfCTBqXckwWxzJMGTbyTBFWwkwepoJMEKZiTBbmMkwQ9hJMHpXiTB9VwkwTBbJMGVWSTBIFgkwc1WJMGaVSTBED8hwag2IcEGLyHBFyghwcwhIcEVHCHB5BYhwS8SIcHoDSHBBwohwYEGIcFPAyHBaAAhwcb9IMFj+yDBOPkgwUD3IMF39SDB2PMgwWDyIMEK8SDBiOMdwfnZHcF+0R3By8kdwc3CHcF0vB3BsbYdwXWxHcG1rB3BZagdwXukHcHuoB3BtZ0dwciaHcEgmB3Bt5UdwYeTHcGLkR3Bvo8dwRyOHcGgjB3BfIkawZJ+GsHjdBrBVmwawZJkGsGFXRrBHlcawU5RGsEHTBrBPEcaweNCGsHxPhrBWzsawRs4GsEoNRrBejIawQwwGsHXLRrB1ysawQYqGsFgKBrBvTAXwaAkF8GfGRfBzw8XwTAHF8Fb/xbBPvgWwcnxFsHs6xbBmeYWwcThFsFi3RbBZtkWwcnVFsGC0hbBiM8WwdTMFsFhyhbBJ8gWwSLGFsFOxBbBb9kTwf7LE8HGvxPBrbQTwb2qE8ELohPBJJoTwfiSE8F1jBPBi4YTwS2BE8FNfBPB4XcTwd1zE8E4cBPB6WwTwelpE8EvZxPBtmQTwXhiE8FvYBPBuoMQwc90EMFBZxDB71oQwb5PEMGtRRDB5zwQwfA0EMG0LRDBIicQwSwhEMHBGxDB1xYQwWESEMFUDhDBpwoQwVEHEMFKBBDBiwEQwQz/D8HJ/A/Byy8NwT4fDcEyEA3BhgINwRr2DMHQ6gzBnuAMwcXXDMG8zwzBccgMwdHBDMHNuwzBV7YMwWKxDMHirAzBzKgMwRelDMG6oQzBrJ4MweebDMFjmQzB0d0JwXXLCcHEugnBmKsJwc6dCcFHkQnB5YUJwZF7CcGlcgnBi2oJwS9jCcGAXAnBb1YJwe5QCcHuSwnBZEcJwUVDCcGIPwnBIzwJwQ85CcFDNgnBAY4GwaZ5BsEiZwbBTlYGwQFHBsEZOQbBdiwGwfsgBsGNFgbBhg0GwVoFBsHu/QXBMfcFwRPxBcGF6wXBeuYFwefhBcG/3QXB+dkFwY3WBcFy0wXBmEADwQYqA8F/FQPB0wIDwdrxAsFs4gLBZtQCwajHAsEUvALBj7ECwWmoAsEroALBr5gCweSRAsG4iwLBH4YCwQqBAsFtfALBPXgCwXB0AsH9cALBbvX/wMq5/8BPjP/A72L/wFA9/8AaG//AAfz+wL7f/sAPxv7Aua7+wIaZ/sD7hv7AXnb+wEhn/sCVWf7AJU3+wNpB/sCaN/7ASy7+wNkl/sAuHv7AkXL5wMgv+cD08vjA0cT4wBmb+MAodfjAqFL4wEwz+MDLFvjA5fz3wFzl98D7z/fAK733wGms98AynffAYY/3wNaC98Bzd/fAHG33wLlj98A0W/fAZvfywH6t8sAoavLA0yzywFb98cBE0/HAAa3xwDeK8cCXavHA2E3xwLkz8cD9G/HAbQbxwFnz8MBz4vDAG9PwwCvF8MCFuPDACK3wwJqi8MAjmfDAxoTswPcy7MBy6OvAjaTrwLZm68DfNevAcgvrwNzk6sDHwerA4qHqwOWE6sCNaurAnlLqwN886sCGKerAexjqwAEJ6sDz+unAMO7pwJvi6cAW2OnANBnmwAvB5cCRbuXAbSPlwPje5MCeoOTAam7kwKJD5MC6HOTAWPnjwC/Z48Dzu+PAYqHjwD6J48BPc+PAsV/jwIFO48DlPuPAuTDjwNoj48ArGOPADLbfwO5V38Bb/d7AM6rewHBe3sBqGd7Ai9rdwPqm3cDWe93AmVTdwOww3cB8EN3AAfPcwDbY3MDev9zAv6ncwNyV3MCGhNzAyHTcwH1m3MCCWdzAtV/ZwL7z2MCzktjAtTnYwN/l18B7mdfA41PXwH8U18CO39bADbTWwHyM1sCBaNbAy0fWwBAq1sALD9bAffbVwC/g1cAGzNXAirrVwKqq1cA/nNXA4yvTwFue0sB+MdLAhM/RwBp20cCVIdHAj9TQwGSO0MB4TtDAJhjQwEjsz8BhxM/AGaDPwBx/z8AgYc/A4EXPwB4tz8CfFs/AMALPwI7wzsCL4M7A9Q3NwKBtzMAR3cvATG/LwGEMy8CLssrAVV3KwKsPysDsyMnAeYjJwMNQycCGJMnASvzIwLPXyMBvtsjAMpjIwLd8yMC+Y8jADk3IwHI4yMCRJsjAlhjHwAtRxsB3r8XAmBvFwCitxMBLScTAv+7DwB+Zw8DQSsPAfAPDwIDCwsBlicLAyVzCwDY0wsBQD8LAxO3BwEbPwcCPs8HAYJrBwH+DwcC2bsHApY3BwHdfwMBIlL/AafG+wEdcvsAA673AQoa9wPkqvcD01LzA/4W8wBQ+vMCP/LvADMK7wBGVu8AmbLvA8Ua7wBwlu8BbBrvAaOq6wAPRusDvubrAd9wuwe/XLsHa0y7BLNAuwdzMLsHgyS7BMMcuwcTELsGWwi7Bn8Auwdq+LsFCvS7B0rsuwYe6LsFduS7BUbguwV+3LsGFti7BwbUuwRG1LsFytC7BYnwrwQp3K8FxcivBUm4rwZxqK8FEZyvBQWQrwYphK8EZXyvB5VwrwepaK8EgWSvBhVcrwRJWK8HEVCvBl1MrwYhSK8GUUSvBuFArwfJPK8FATyvB/hwowQIXKMGdESjB9AwowcwIKMENBSjBrQEowaP+J8Hm+yfBbvknwTX3J8E19SfBZ/MnwcjxJ8FS8CfBAO8nwdHtJ8G/7CfByesnwevqJ8Ek6ifBYr4kwa63JMGksSTBMqwkwXinJMFGoyTBfp8kwRacJMEFmSTBQZYkwcSTJMGGkSTBgY8kwa+NJMELjCTBkookwT2JJMELiCTB94Ykwf6FJMEfhSTBpGAhwSJZIcFfUiHBRkwhwchGIcH9QSHBwT0hwfA5IcGANiHBZzMhwZ0wIcEaLiHB1yshwc0pIcH3JyHBTyYhwdIkIcF7IyHBRSIhwS8hIcE0ICHB3gMewXf7HcHl8x3BEe0dwermHcFf4R3Bg9wdwT3YHcFj1B3B69AdwcrNHcH6yh3BccgdwSjGHcEZxB3BP8IdwZPAHcETvx3BuL0dwYC8HcFnux3BMKgawcieGsFNlhrBqI4awcWHGsGPgRrB93sawQl3GsG5chrB1m4awVZrGsEuaBrBV2UawchiGsF6YBrBZl4awYdcGsHYWhrBVFkawfZXGsG7VhrBuE0XwTFDF8GzORfBJDEXwW0pF8F5IhfBNRwXwZAWF8GRERfBNw0XwUoJF8HCBRfBkwIXwbX/FsEf/RbBzPoWwbP4FsHQ9hbBHfUWwZXzFsE08hbBnPQTwdToE8E03hPBoNQTwf3LE8E0xBPBML0Twd22E8EqsRPBGqwTwbWnE8G/oxPBLqATwficE8ETmhPBeJcTwR+VE8EBkxPBGZETwWKPE8HWjRPBBZ0QwdaPEMHygxDBOnkQwY9vEMHYZhDB/F4QwedXEMGGURDBxUsQwaNGEME0QhDBNT4QwZw6EMFeNxDBcjQQwdAxEMFyLxDBTy0QwWMrEMGoKRDBH0cNwWA4DcETKw3BEx8NwUEUDcGACg3BtAENwcb5DMGh8gzBMOwMwWLmDMEu4QzBtNwMwazYDMEK1QzBxNEMwdHODMEqzAzBxckMwZ7HDMGtxQzBHfMJwaDiCcG+0wnBUsYJwTa6CcFLrwnBcqUJwZKcCcGRlAnBW40JwduGCcH/gAnBuXsJwTV3CcEjcwnBeW8JwStsCcEyaQnBg2YJwRlkCcHtYQnBOKEGwciOBsEkfgbBH28GwZRhBsFbVQbBV0oGwWdABsFyNwbBXi8GwRcoBsGHIQbBnhsGwUoWBsG3EQbBnA0GwegJBsGTBgbBkgMGwd4ABsFu/gXBb1QDwRE9A8F2KgPBqxkDwYQKA8HY/ALBg/ACwWTlAsFd2wLBU9ICwS3KAsHUwgLBNbwCwT62AsHdsALBOqwCwRWoAsFZpALB+6ACwfOdAsE5mwLBvwwAwe3h/8AFsv/AgIz/wKJq/8ATTP/AgTD/wKMX/8A2Af/A/Oz+wMHa/sBRyv7AgLv+wCWu/sAcov7ARJf+wNiN/sB8hf7A9H3+wCp3/sANcf7AdJH5wG5T+cBcG/nAMOr4wFPE+MAnovjAUIP4wH5n+MBlTvjAwzf4wFoj+MD0EPjAXQD4wGnx98Dv4/fAytf3wNjM98BFw/fA1br3wDuz98BhrPfALhHzwPbL8sBijfLAz1TywF0i8sAo/PHArNnxwI268cB6nvHAJoXxwE9u8cC2WfHAJEfxwGc28cBPJ/HAthnxwHQN8cBoAvHArvjwwCrw8MB96PDAjpnswFZM7MB/BuzAW8frwEaO68CxWuvA/zPrwDIR68DL8erAdtXqwOe76sDapOrAEZDqwFN96sBubOrAM13qwHlP6sAaQ+rA9DfqwBMu6sB7JerAWCnmwG3V5cCFh+XADkHlwFoB5cDCx+TAtpPkwNhr5MC6SOTACinkwHIM5MCo8uPAZdvjwGvG48CBs+PAdKLjwBWT48A7hePAvnjjwH5t48B2Y+PAE8LfwLRl38BWEd/AvsLewKV73sBfO97AQwHewL/M3cC0o93ARIDdwEpg3cBvQ93AaCndwO8R3cDD/NzArencwHjY3MD1yNzA+rrcwGCu3MAFo9zA1GfZwG3/2MAcotjASk3YwAD+18BEttfAa3XXwMk618DNBdfAktvWwNC31sCLl9bAbXrWwClg1sB5SNbAGzPWwNgf1sB7DtbA0/7VwLfw1cD/49XAyDHTwCym0sDWPNLAj97RwEmJ0cBLOdHA6/DQwH2v0MBWdNDA3z7QwHQT0MBf78/Az87PwG2xz8Drls/AA3/PwHRpz8ADVs/AfETPwLA0z8ByJs/AsxDNwDpzzMCV5MvATXrLwBAby8BTxcrAoXTKwJorysCY6cnA6K3JwPZ3ycBaS8nA8SbJwBQGycBu6MjArs3IwI61yMDMn8jALYzIwH16yMCMasjAZxnHwJNTxsDItMXAXyTFwNO3xMCdV8TALgHEwAGww8BTZsPAuiPDwILnwsAUscLAQ4PCwIVewsBcPcLAcB/CwHIEwsAZ7MHAJNbBwFjCwcB+sMHApY3BwChgwMDylr/Ac/a+wNFkvsBY9b3AN5S9wAY9vcBs67zAFqG8wORdvMAiIbzAN+q7wDG7u8AdlrvAp3S7wHVWu8A4O7vApiK7wH0Mu8CC+LrAFwAvwS38LsGt+C7BjPUuwcDyLsFA8C7BA+4uwQTsLsE66i7BoeguwTPnLsHt5S7ByOQuwcPjLsHa4i7BCeIuwU/hLsGo4C7BE+AuwY7fLsEX3y7BAZ8rwZaaK8GilivBGZMrwfCPK8EdjSvBloorwVSIK8FPhivBgYQrweSCK8FzgSvBKYArwQF/K8H6fSvBDn0rwTt8K8F/eyvB1norwUB6K8G5eSvBiT4owYw5KMEVNSjBFzEowYYtKMFVKijBeicowe0kKMGlIijBmyAowcgeKMEnHSjBshsowWUaKME7GSjBMBgowUIXKMFtFijBrxUowQUVKMFtFCjBxN4kwSHZJMEX1CTBlc8kwY3LJMHzxyTBusQkwdjBJMFEvyTB97wkwee6JMEQuSTBa7ckwfK1JMGhtCTBdLMkwWeyJMF3sSTBoLAkweCvJME0ryTByH8hwWx5IcG7cyHBpG4hwRdqIcEFZiHBYWIhwR9fIcE2XCHBnFkhwUlXIcE0VSHBWFMhwa9RIcEyUCHB3k4hwa5NIcGeTCHBrEshwdNKIcEQSiHBsCEewYIaHsEVFB7BVg4ewTIJHsGZBB7BfAAewc/8HcGG+R3BlfYdwfXzHcGb8R3Bge8dwaHtHcHz6x3Bc+odwRvpHcHo5x3B1uYdweHlHcEF5R3BmMQawX28GsE8tRrBv64awfKoGsHBoxrBHJ8awfWaGsE/lxrB7ZMawfWQGsFOjhrB7osawc+JGsHphxrBN4YawbOEGsFZgxrBI4IawQ2BGsEWgBrBoWgXwXtfF8FLVxfB+E8XwWtJF8GPQxfBUT4XwaA5F8FvNRfBrzEXwVUuF8FVKxfBpygXwUImF8EdJBfBMyIXwXwgF8H1HhfBlh0XwV0cF8FFGxfB7w0UwZ0DFMFg+hPBHPITwbbqE8EY5BPBLd4TweLYE8Em1BPB6c8TwSDME8G9yBPBtsUTwQHDE8GWwBPBbL4TwXy8E8HCuhPBNrkTwdS3E8GYthPBrbQQwQipEMGbnhDBR5UQwe6MEMF2hRDBx34Qwc14EMF0cxDBrG4QwWVqEMGSZhDBJmMQwRhgEMFcXRDB6loQwbtYEMHHVhDBB1UQwXhTEMESUhDBB10NweRPDcEiRA3BmzkNwTAwDcHBJw3BNiANwXcZDcFtEw3BBw4NwTMJDcHhBA3BBQENwZD9DMF6+gzBt/cMwT/1DMEK8wzBEfEMwU3vDMG67QzBMgcKwWL4CcEf6wnBP98JwZ7UCcEaywnBl8IJwfm6CcEotAnBEK4JwZyoCcG7ownBXp8JwXibCcH7lwnB3ZQJwROSCcGVjwnBWo0JwVyLCcGUiQnBULUGwbWiBsHBkwbBXIYGwV96BsGjbwbBB2YGwW5dBsG9VQbB204GwbNIBsExQwbBRD4Gwd05BsHsNQbBZzIGwUAvBsFvLAbB6ykGwaonBsGnJQbBFWgDwVVRA8E9PgPBIy8DwZwhA8GBFQPBqgoDwfYAA8FH+ALBg/ACwY/pAsFY4wLByN0Cwc/YAsFc1ALBYdACwdPMAsGkyQLBzMYCwUHEAsH7wQLB/R0AwWYEAMHm2v/AubP/wD+V/8D0ef/AhGH/wKRL/8AQOP/Aiib/wNwW/8DVCP/ASfz+wBDx/sAG5/7AC97+wATW/sDWzv7Aasj+wK3C/sCLvf7AHa/5wIV1+cDZQfnAghP5wD7r+MB4zPjA6bD4wDyY+MAkgvjAX274wK1c+MDXTPjArT74wAEy+MCrJvjAhxz4wHYT+MBaC/jAGgT4wJ7998DS9/fADCrzwDvp8sAVr/LA6XrywB9M8sDFIvLAsgPywN3n8cDyzvHAo7jxwKuk8cDNkvHA0ILxwIF08cC1Z/HAQlzxwAVS8cDdSPHArUDxwFo58cDOMvHAsa3swNBk7MBeI+zAqujrwP2z68C/hOvAZFrrwOw668DSHuvAqAXrwCHv6sD32urA68jqwMW46sBTqurAZp3qwNaR6sB/h+rAQH7qwPt16sCVburADTnmwC7p5cCcn+XAiV3lwEQi5cAV7eTAYr3kwJ6S5MAncuTAxlXkwF085MCdJeTAQRHkwAf/48C57uPAIuDjwBTT48Bnx+PA9rzjwJ+z48BFq+PA1M3fwA9138C2JN/AcNrewLqX3sDjW97AMibewAj23cDayt3AY6ndwLuM3cASc93AGlzdwIlH3cAiNd3AqiTdwO8V3cDACN3A9vzcwGry3MD76NzAzW/ZwNoK2cAdsdjASGDYwE0V2MD10dfAiZXXwFNf18CzLtfAGQPXwKLg1sCyw9bAyKnWwJaS1sDSfdbAPGvWwJta1sC6S9bAaj7WwIEy1sDbJ9bAmjfTwNqt0sDuR9LAN+3RwOWb0cA0UNHANwzRwDbP0MB6mNDAYmfQwFw70MDiF9DAqvrPwH/gz8ASyc/AGrTPwFWhz8CKkM/Ag4HPwBJ0z8ALaM/AaxPNwMN4zMDt7MvAEYXLwF4py8CO18rAJYvKwIJGysDqCMrAp9HJwBWgycCic8nAJE/JwKMxycA3F8nAj//IwGLqyMBu18jAeMbIwEy3yMC4qcjANxrHwBVWxsAJusXAGy3FwEXCxMCSZcTAFBPEwCHGw8DWgMPApkLDwNsKw8DO2MLA7avCwGqGwsCfaMLA8E3CwA02wsCqIMLAhw3CwGb8wcAT7cHApY3BwNhgwMCYmb/Abvu+wDltvsCA/73A1KG9wI9OvcAnAb3AM7u8wGl8vMAVRLzAjRG8wDzku8CyvbvAnJ+7wKuEu8CMbLvA81a7wKBDu8BUMrvAgiAvwU0dL8FzGi/B7Bcvwa4VL8GxEy/B7REvwVwQL8H4Di/BvA0vwaQML8GrCy/BzwovwQsKL8FdCS/BwwgvwTsIL8HCBy/BVgcvwfcGL8GiBi/Bl74rwfC6K8GytyvB0bQrwUOyK8H/ryvB/K0rwTOsK8GeqivBNqkrwfenK8HcpivB4aUrwQKlK8E8pCvBjaMrwfGiK8FnoivB7KErwYChK8EfoSvBOV0owRBZKMFfVSjBGFIowS9PKMGaTCjBUEoowUhIKMF6RijB4EQowXVDKMEyQijBFEEowRZAKME1PyjBbT4owbw9KMEfPSjBkzwowRc8KMGpOyjBe/wkwb73JMGK8yTBzu8kwX7sJMGO6STB8uYkwaHkJMGU4iTBweAkwSPfJMG03STBbtwkwUzbJMFM2iTBaNkkwZ7YJMHr1yTBTNckwb/WJMFC1iTBcZwhwQ2XIcFEkiHBBI4hwT+KIcHmhiHB7YMhwUqBIcH0fiHB4HwhwQl7IcFmeSHB83chwal2IcGFdSHBgnQhwZxzIcHQciHBG3IhwXpxIcHscCHBNz0ewRQ3HsGhMR7ByywewYAoHsGwJB7BTiEewU0eHsGjGx7BRhkewS0XHsFRFR7BqhMewTISHsHmEB7Bvg8ewbgOHsHQDR7BAQ0ewUoMHsGoCx7B594awevXGsG40RrBNswawVPHGsH8whrBIr8awbe7GsGuuBrB/bUawZmzGsF7sRrBma8awe6tGsFyrBrBIqsawfepGsHvqBrBBKgawTOnGsF6phrBo4EXwbB5F8GhchfBXWwXwcxmF8HcYRfBeV0XwZVZF8EhVhfBEFMXwVdQF8HtTRfByEsXweJJF8EySBfBs0YXwV9FF8ExRBfBJUMXwThCF8FlQRfBjSUUwYMcFMF7FBTBWQ0UwQQHFMFkARTBZvwTwfj3E8EJ9BPBi/ATwXLtE8Gy6hPBQegTwRfmE8Er5BPBd+ITwfPgE8Gc3xPBa94TwVzdE8Fs3BPB0MoQwYjAEMFltxDBR68QwRKoEMGsoRDB/ZsQwfGWEMF3khDBfY4QwfaKEMHVhxDBDYUQwZaCEMFmgBDBdX4Qwbx8EME0exDB2XkQwaV4EMGUdxDBm3ENwellDcGEWw3BSVINwRVKDcHNQg3BVTwNwZc2DcF+MQ3B9ywNwfMoDcFiJQ3BOCINwWkfDcHrHA3BtRoNwb8YDcEBFw3BdRUNwRcUDcHfEg3BOxwKwdUMCsEDAQrBg/YJwS/tCcHl5AnBid0JwQDXCcEy0QnBC8wJwXnHCcFpwwnBz78JwZy8CcHGuQnBQbcJwQW1CcEJswnBR7EJwbevCcFUrgnBKsoGwd+3BsESqAbBIZwGwYSRBsEXiAbBt38GwUd4BsGscQbBz2sGwZpmBsH7YQbB4V0GwT1aBsEBVwbBI1QGwZhRBsFVTwbBVE0GwY1LBsH5SQbByXoDwQNmA8GHUwPBUkMDwUE3A8GILAPBASMDwYsaA8EHEwPBWgwDwW0GA8EqAQPBfvwCwVn4AsGr9ALBZ/ECwYHuAsHv6wLBpukCwaDnAsHU5QLBeC4AwekWAMHwAQDBkN7/wF+9/8D1pP/ATY//wBB8/8D5av/Ay1v/wFFO/8BZQv/AuTf/wEou/8DrJf/AfB7/wOQX/8AJEv/A1wz/wDsI/8AkBP/Amcv5wCCW+cCEZvnAJDz5wHAW+cDn9PjAqdv4wMfF+MBWsvjAEaH4wLuR+MAchPjABHj4wEdt+MC/Y/jASVv4wMZT+MAbTfjAMUf4wPFB+MBIPfjACELzwFoF88BTz/LAOp/ywGl08sBRTvLAbyzywF0S8sBA/PHAm+jxwCfX8cCnx/HA47nxwKut8cDRovHAL5nxwKKQ8cALifHAToLxwFN88cAFd/HAM8HswG587MAhP+zAiwjswPLX68CwrOvAMobrwPZj68APSevAtzLrwN0e68A6DevAkf3qwKjv6sBO4+rAV9jqwJvO6sD2xerAS77qwHy36sBxserAVUjmwFT85cDbtuXA7njlwMdB5cCuEOXA+eTkwBW+5MB9m+TAwn/kwC1p5MAeVeTATEPkwHgz5MBpJeTA7hjkwNkN5MADBOTAR/vjwIfz48Cl7OPAUtnfwAGE38B+N9/AUfHewMGy3sAIe97AbknewEUd3sD69d3ABtPdwHS23cCjn93AXovdwFx53cBdad3AKVvdwIxO3cBZQ93AaDndwJQw3cC/KN3AoXfZwAYW2cC5v9jAs3LYwNAr2MCc7NfAULTXwDKC18CVVdfA4S3XwJAK18An7dbAGdbWwJ3B1sBrr9bAQZ/WwOaQ1sAnhNbA1njWwMpu1sDfZdbAWT3TwNG10sDJUtLAffvRwPSt0cBYZtHAfybRwJ3t0MD8utDA6I3QwMtl0MAcQtDA2yPQwI8M0MDc98/AeeXPwCPVz8Cixs/AwLnPwFGuz8AppM/AHRbNwDp+zMDa9cvAno/LwE43y8BA6crA6qDKwGpgysDyJsrAy/PJwEDGycC4ncnAqnnJwJBaycAGQ8nAGy7JwIYbycAFC8nAXPzIwFjvyMDJ48jABhvHwJNYxsA6v8XAtDXFwIfMxMAtc8TAdSTEwIbbw8BemsPATmDDwKAsw8Cd/sLAqtXCwDuxwsBHkcLAfnnCwFtkwsCUUcLA5kDCwBYywsDuJMLApY3BwIdhwMA4nL/AWgC/wH91vsBzCb7AGq+9wJZfvcAtFr3AW9S8wLKZvMB7ZbzA/za8wJ8NvMDQ6LvAE8i7wPevu8CbmrvAoYe7wMd2u8DOZ7vAET4vwXA7L8EfOS/BFDcvwUg1L8GyMy/BTTIvwRMxL8H+Ly/BCy8vwTQuL8F3LS/B0CwvwT4sL8G9Ky/BSysvwecqL8GPKi/BQSovwf0pL8HBKS/Bd9srwXLYK8HJ1SvBcdMrwWDRK8GPzyvB9c0rwYzMK8FOyyvBNsorwT/JK8FmyCvBp8crwf/GK8FrxivB6MUrwXXFK8EQxSvBt8QrwWnEK8EjxCvBWHkoweF1KMHTcijBInAowcNtKMGtayjB1mkowTdoKMHKZijBiWUowW5kKMF1YyjBmWIowdhhKMEtYSjBmGAowRRgKMGfXyjBOV8owd9eKMGQXijByBclwc0TJcFLECXBNA0lwXwKJcEWCCXB+gUlwR4EJcF7AiXBCQElwcT/JMGm/iTBqv0kwcz8JMEI/CTBXPskwcX6JME/+iTByvkkwWL5JMEH+STB2rYhwUmyIcFCriHBtqohwZenIcHWpCHBaqIhwUegIcFmniHBvpwhwUmbIcEAmiHB3pghwd+XIcH/liHBOZYhwYuVIcHylCHBa5QhwfSTIcGLkyHBqFYewWlRHsHLTB7BuUgewSNFHsH6QR7BMj8ewb48HsGVOh7BrzgewQI3HsGINR7BPDQewRczHsEVMh7BMjEewWowHsG6Lx7BHy8ewZcuHsEfLh7BS/cawUfxGsH66xrBTucawTDjGsGQ3xrBXtwawY3ZGsET1xrB5NQawfjSGsFG0RrByM8awXjOGsFQzRrBS8wawWbLGsGcyhrB6skawU3JGsHDyBrB5ZgXwf2RF8HoixfBi4YXwdKBF8GofRfB/XkXwcJ2F8HqcxfBaHEXwTNvF8FBbRfBi2sXwQlqF8G1aBfBiWcXwYJmF8GZZRfBzWQXwRlkF8F6YxfBlzsUwawzFMGxLBTBiiYUwR4hFMFXHBTBIhgUwWwUFMEoERTBRw4Uwb4LFMGDCRTBiwcUwdAFFMFJBBTB8gIUwcMBFMG4ABTBzf8Twf/+E8FJ/hPBUeAQwXfWEMF1zhDBZscQwS7BEMGyuxDB3rYQwZyyEMHcrhDBjqsQwaWoEMEVphDB06MQwdahEMEVoBDBi54QwS+dEMH9mxDB75oQwQGaEMEwmRDBGogNwXx7DcFZcQ3BQWkNwR1iDcHTWw3BSFYNwWVRDcEXTQ3BTEkNwfVFDcEEQw3BbEANwSQ+DcEhPA3BWzoNwcw4DcFsNw3BNzYNwSY1DcE2NA3B4jEKwWwjCsGqFgrBPgwKwQ4ECsHW/AnBevYJwd7wCcHu6wnBk+cJwb7jCcFd4AnBY90JwcTaCcF12AnBbNYJwaLUCcEO0wnBqtEJwXHQCcFdzwnB8N0GwWDNBsHBvgbB2rEGwSSnBsHdngbBkJcGwSKRBsF2iwbBeIYGwRGCBsEwfgbBxXoGwcN3BsEcdQbBx3IGwbhwBsHobgbBUG0GwehrBsGsagbBmIwDwaF5A8HhaAPBGVoDwQ5NA8ENQgPBrjkDwU0yA8HLKwPBECYDwQMhA8GPHAPBoxgDwS8VA8EkEgPBdQ8DwRkNA8EECwPBMAkDwZMHA8EnBgPBOz4AwYsoAMFiFQDBdwQAwRHr/8C20P/AGbr/wC6p/8BFmv/AH43/wIqB/8BUd//AVW7/wGhm/8BtX//AR1n/wNxT/8AWT//A4kr/wC5H/8DsQ//A+Ob5wFG1+cB1ifnAuGL5wIJA+cBQIvnAqgf5wF7w+MBC3/jALtD4wOPC+MAst/jA2az4wMCj+MC8m/jArZT4wHWO+MD6iPjAJ4T4wOd/+MAofPjAKlnzwGEg88Au7vLA18HywKya8sAVePLAjVnywJw+8sDWJvLAUxXywBMG8sCi+PHAyuzxwFni8cAm2fHAC9HxwOfJ8cCdw/HAE77xwDG58cDltPHAGdTswDiT7MDQWezADyfswDv668Ch0uvAqa/rwMqQ68CMdevAg13rwGJL68D2O+vAXi7rwGQi68DVF+vAiA7rwFUG68Ad/+rAwfjqwCbz6sA37urANFfmwOIO5sBMzeXARJPlwPRf5cCiMuXAmArlwD3n5MAGyOTAeqzkwC2U5MBugeTA1nHkwBdk5MD6V+TATU3kwOVD5MCbO+TATjTkwN8t5MA1KOTAjeTfwI2S38C0Sd/AaAffwL/M3sDemN7ADGvewJFC3sDSHt7AQ//dwGnj3cDWyt3AebfdwLSn3cDOmd3Ajo3dwMKC3cA/ed3A3XDdwHtp3cD6Yt3AUn/ZwPIg2cDzzdjAkYTYwI1B2MBABtjAztHXwHqj18COetfAaVbXwIA218BXGtfAfgHXwILt1sCQ3dbAg8/WwB/D1sA1uNbAlq7WwBym1sClntbABEPTwO++0sBrXdLAZQnSwHm/0cC8e9HAyT/RwMQK0cDu29DAjbLQwAKO0MC/bdDARlHQwCY40MCLI9DAbBPQwDUF0MCu+M/ApO3PwOrjz8BY28/AyRjNwJ+DzMCh/svA9pnLwOREy8Bt+srA9LXKwFp5ysDBQ8rAZhTKwJHqycCfxcnAAKXJwDWIycDObsnAk1nJwEZJycDnOsnAPC7JwBIjycA8GcnA1RvHwAtbxsBaxMXAKj7FwJDWxMBwgMTAUzXEwDbww8D0ssPAxXzDwONMw8CZIsPAPv3CwEPcwsAnv8LAd6XCwJyPwsAff8LAl3DCwMhjwsB+WMLApY3BwDZiwMDUnr/ANwW/wKN9vsAwE77AGLy9wB9wvcCDKr3Aluy8wNC1vMBnhbzAplq8wOE0vMCJE7zAGva7wCHcu8CkxbvA+bS7wEemu8BTmbvAFFkvwexWL8EJVS/BY1MvwfJRL8GvUC/Blk8vwZ9OL8HITS/BDE0vwWdML8HYSy/BWksvwexKL8GMSi/BOUovwe9JL8GvSS/Bd0kvwUZJL8EcSS/B6PUrwWnzK8E68SvBUe8rwabtK8Ex7CvB6+orwc7pK8HU6CvB++crwTznK8GW5ivBBOYrwYXlK8EW5SvBteQrwWDkK8EW5CvB1eMrwZ3jK8Fr4yvBKZMowUWQKMG+jSjBiYsowZuJKMHqhyjBcYYowSaFKMEGhCjBCoMowS2CKMFtgSjBxIAowTGAKMGwfyjBQH8owd5+KMGIfijBPX4owft9KMHCfSjB6DAlwZAtJcGjKiXBFSglwdglJcHkIyXBLyIlwbEgJcFiHyXBPh4lwT8dJcFgHCXBnRslwfMaJcFeGiXB3BklwWoZJcEGGSXBrxglwWQYJcEhGCXBOc8hwVrLIcH3xyHBAsUhwWvCIcEowCHBLr4hwXS8IcHxuiHBn7khwXe4IcF1tyHBk7Yhwc61IcEhtSHBi7QhwQe0IcGUsyHBL7MhwdeyIcGKsiHBMm4ewbdpHsHNZR7BYGIewWFfHsHDXB7BeVoewXlYHsG5Vh7BMlUewdtTHsGwUh7Bq1EewcZQHsH/Tx7BUE8ewbhOHsEyTh7Bvk0ewVhNHsH/TB7BBA4bwb8IG8E3BBvBQAAbwcn8GsHB+RrBG/cawcr0GsHE8hrB//AawXPvGsEY7hrB6uwaweHrGsH66hrBMOoawX/pGsHl6BrBXugawejnGsGB5xrBA7AXwb2oF8FOoxfBuJ4XwbWaF8EzlxfBIpQXwXSRF8EcjxfBD40XwUWLF8G0iRfBVogXwSOHF8EYhhfBLoUXwWGEF8GvgxfBEoMXwYqCF8ETghfBPVMUwdRKFMF4QxTB3j0UwTo5FMErNRTBnjEUwYQuFMHOKxTBbikUwVwnFMGMJRTB9iMUwZMiFMFdIRTBTyAUwWIfFMGTHhTB3h0UwUAdFMG2HBTB4vcQwSnuEMGn5RDBNd4QwW/YEMG90xDBos8QwQrMEMHnyBDBKMYQwcHDEMGowRDB078QwTi+EMHRvBDBmLsQwYa6EMGWuRDBxbgQwQ64EMFutxDBK54Nwe+SDcEYiQ3BfIANwfR4DcECcw3BQW4NwRlqDcF3Zg3BSmMNwYNgDcEVXg3B9VsNwRpaDcF7WA3BEFcNwdJVDcG9VA3By1MNwfdSDcE9Ug3BWEYKwVw5CsH+LQrBCiQKwVQbCsG0EwrBlg0KwccICsGSBArB5QAKwa79CcHe+gnBafgJwUP2CcFi9AnBvvIJwU7xCcEN8AnB9e4Jwf/tCcEp7QnBs/AGwbThBsGR1AbBEMkGwf6+BsEttgbBd64GwSuoBsFNowbBDJ8GwVSbBsETmAbBOpUGwb6SBsGRkAbBq44GwQGNBsGNiwbBSIoGwSyJBsE0iAbBj50DwT+MA8ETfQPByG8DwSVkA8H0WQPBCVEDwTtJA8HCQgPB1T0DwYc5A8HDNQPBeDIDwZcvA8ETLQPB4CoDwfQoA8FFJwPBzSUDwYQkA8FlIwPBUE0AwVc5AMHXJwDBgRgAwRILAMGc/v/AAur/wPrX/8AyyP/A3br/wOmw/8A0qP/AlqD/wO6Z/8AblP/ABY//wJGK/8Cuhv/AR4P/wE6A/8C1ff/AQQH6wCrT+cDDqvnAWYf5wFFo+cAhTfnAUzX5wHog+cA7DvnARP74wHvw+MBo5vjAmN34wOPV+MAnz/jAQ8n4wBzE+MCbv/jArLv4wDu4+MA5tfjAe2/zwFk688C4C/PA1+LywAS/8sCen/LAHYTywAZs8sDvVvLAeETywFA08sAtJvLA4hvywPcS8sArC/LAWgTywGT+8cAt+fHAn/TxwKPw8cAo7fHAaebswDSp7MB1c+zASkTswO4a7MCv9uvA69brwBa768C3ouvAYI3rwLF668BYauvAClzrwFdR68BRSOvAbkDrwIc568B/M+vAOS7rwJ0p68CVJevArGXmwN4g5sD14uXAlqzlwN985cAGU+XAWy7lwDcO5cAP8uTAZtnkwM7D5MDnsOTAXKDkwOKR5MDJhuTAqH3kwKx15MCwbuTAlmjkwD9j5MCVXuTAiO/fwLag38BdW9/AvRzfwL3l3sB4td7AIovewAhm3sCERd7ABynewBMQ3sA6+t3AGufdwF3W3cC3x93AN7zdwPqy3cDmqt3A1aPdwKid3cBBmN3AnYjZwKcr2cDN29jA5pXYwI1W2MDrHtjAFu7XwEDD18C4ndfA0nzXwP9f18DARtfApTDXwEsd18BbDNfAif3WwKLx1sBJ6NbAHODWwPbY1sC20tbAnUjTwOXH0sDWZ9LA8BbSwHrQ0cBnkNHAIFjRwLkm0cBk+9DAa9XQwCK00MD5ltDAbX3QwA9n0MB7U9DAV0LQwFgz0MALJ9DAlR3QwE8V0MATDtDAbxvNwPOIzMBEB8zAFaTLwCdSy8AZC8vASsrKwFyRysBjX8rAizPKwCENysB068nA883JwBu0ycB5ncnAqYnJwFJ4ycAlacnAcVzJwN9SycCASsnAohzHwH5dxsBrycXAfUbFwGTgxMCCjcTAs0XEwDcExMChysPAFJjDwLlrw8DbRMPAySLDwO8Ew8DJ6sLA49PCwNe/wsBLrsLA8Z7CwNaRwsAniMLApY3BwORiwMBqob/ABQq/wKeFvsC6HL7A68i9wC6AvcAvPr3A7wO9wMvQvMDto7zAmXy8wCJavMDuO7zAeSG8wE4KvMAF9rvAROS7wLvUu8A6x7vAB3IvwQpwL8GBbi/BLG0vwQVsL8EEay/BJmovwWVpL8G9aC/BLGgvwa5nL8FBZy/B4mYvwZBmL8FIZi/BCmYvwdVlL8GmZS/BfmUvwVtlL8E9ZS/B3g4swVwMLMFQCizBwggswWkHLME+BizBOgUswVkELMGVAyzB7AIswVkCLMHZASzBagEswQoBLMG3ACzBbwAswTAALMH6/yvBy/8rwaL/K8F+/yvBKKwowTypKMGypijBlqQowQOjKMGmoSjBd6AowXCfKMGMnijBxp0owRqdKMGFnCjBBJwowZSbKMEzmyjB35oowZWaKMFWmijBH5oowe+ZKMHGmSjB+kklwZBGJcGaQyXBCEElwd0+JcFFPSXB5DslwbE6JcGmOSXBvzglwfc3JcFJNyXBsjYlwS82JcG+NSXBXDUlwQY1JcG8NCXBfDQlwUQ0JcEUNCXBaeghwW7kIcH54CHB+d0hwV/bIcEl2SHBiNchwSHWIcHr1CHB3dMhwfPSIcEo0iHBeNEhwd/QIcFb0CHB6M8hwYTPIcEuzyHB484hwaLOIcFpziHBj4ceweqCHsHifh7BY3sewVl4HsG3dR7BbnMewcpxHsFgcB7BJW8ewRRuHsEnbR7BWWwewadrHsENax7BhmoewRJqHsGtaR7BVmkewQppHsHIaB7BiycbwSEiG8FtHRvBWBkbwc0VG8G6EhvBDxAbwb8NG8EODBvBngobwV8JG8FLCBvBWwcbwYsGG8HWBRvBOgUbwbIEG8E8BBvB1gMbwX0DG8EwAxvBgcgXwTDCF8G0vBfB8bcXwc+zF8E5sBfBHK0XwWiqF8EQqBfBUaYXwd2kF8GaoxfBgqIXwY+hF8G9oBfBBqAXwWefF8HenhfBZ54Xwf+dF8GlnRfBmWoUwTtjFMHWXBTBSVcUwXdSFMFHThTBpUoUwX5HFMHCRBTBYkIUwZVAFMEcPxTB1j0Uwbo8FMHEOxTB7zoUwTY6FMGVORTBCjkUwZE4FMEoOBTBAg4RwW0FEcH4/RDBfvcQwd/xEMH97BDBwOgQwRPlEMHi4RDBHd8QwbXcEMHa2hDBXNkQwRHYEMHy1hDB+dUQwSHVEMFm1BDBw9MQwTbTEMG80hDB9bINwfSoDcFDoA3BtpgNwSiSDcF2jA3BhYcNwTuDDcGBfw3BRnwNwXh5DcEJdw3BH3UNwZxzDcFNcg3BKnENwS5wDcFTbw3Blm4NwfFtDcFibQ3BsVkKwQlOCsHoQwrBGzsKwXczCsHTLArBDycKwQ4iCsG2HQrB8RkKwasWCsHUEwrBXREKwWQPCsHdDQrBiQwKwWMLCsFkCgrBhgkKwcYICsEfCArBgAIHwe30BsEg6QbB394GwfbVBsE5zgbBgMcGwarBBsGZvAbBMrgGwWG0BsERsQbBMK4GwbGrBsGqqQbBHqgGwcamBsGcpQbBmaQGwbmjBsH2ogbBua0DweudA8EtkAPBO4QDwdl5A8HTcAPB/WgDwS9iA8FGXAPBJFcDwbBSA8HSTgPBd0sDwY5IA8EHRgPB8EMDwV9CA8EDQQPB1T8Dwc8+A8HsPQPBwVsAwVpJAMFeOQDBeCsAwWIfAMHiFADBwQsAwdQDAMHj+f/A7u3/wIzj/8CJ2v/At9L/wO3L/8AIxv/A68D/wJe8/8Bsuf/ArLb/wEm0/8A3sv/AgRr6wL3v+cCDyvnAJar5wACO+cCHdfnAQ2D5wMhN+cC7PfnAyS/5wK4j+cArGfnACxD5wB8I+cA/AfnAR/v4wBr2+MCc8fjAWu74wJHr+MAn6fjAAYXzwExT88ABKPPAUgLzwIzh8sANxfLAR6zywL+W8sAJhPLAyHPywKpl8sBnWfLAw07ywIVF8sCAPfLAiTbywH8w8sBAK/LAtCbywEIj8sBwIPLAJ/jswGy+7MAbjOzASGDswCE67MDzGOzAGvzrwATj68A3zevARbrrwNCp68CFm+vAG4/rwFSE68D5euvA2nLrwM1r68CvZevAX2DrwMRb68AjWOvAv3PmwE0y5sDd9+XA78TlwJGY5cDyceXAWlDlwCUz5cDAGeXArQPlwH/w5MDV3+TAW9HkwMrE5MDgueTAZ7DkwC2o5MAKoeTA2JrkwHiV5MDNkOTAS/rfwH+u38B8bN/AVjHfwMj93sDf0N7AxanewMKH3sAwat7AelDewCE63sC1Jt7A1hXewC4H3sB0+t3AZ+/dwM/l3cB83d3AQdbdwPvP3cCKyt3AvpHZwCE22cBP6djAtabYwNdq2MCnNtjAMQnYwJzh18Asv9fAPKHXwDSH18CUcNfA6lzXwNRL18D+PNfAGzDXwOok18A0G9fAxRLXwHML18AZBdfAIk7TwLTQ0sAHctLAQiTSwPjg0cBgpNHAjW/RwIdB0cB2GdHAmfbQwEnY0MDuvdDABqfQwB2T0MDRgdDAy3LQwL5l0MBqWtDAlFDQwApI0MChQNDAEB7NwDeOzMDCD8zA/K3LwEJfy8BHG8vA8t3KwHqoysDkecrAVFHKwAguysBYD8rAqfTJwHfdycBPycnAzLfJwJWoycBfm8nA5o/JwPGFycBLfcnAbx3HwPRfxsBszsXArU7FwALqxMBPmsTAmVXEwI8XxMBv4cPAR7LDwDeJw8B6ZcPAakbDwGYrw8DqE8PAgf/CwMXtwsBe3sLA/tDCwGDFwsBKu8LApY3BwJJjwMD8o7/AxA6/wIqNvsARJr7AbNW9wMaPvcA2Ub3AbRq9wLHqvMAfwbzA8Zy8wH59vMAkYrzAXUq8wLM1vMC/I7zAJhS8wJsGvMDY+rvAmY0vwdeLL8FTii/BBIkvweWHL8Hthi/BF4YvwWCFL8HChC/BOYQvwcSDL8Ffgy/BCIMvwb2CL8F9gi/BRYIvwRaCL8HtgS/ByYEvwauBL8GRgS/B9yksweUnLMEcJizBkyQswUAjLMEdIizBIiEswUogLMGPHyzB7x4swWUeLMHuHSzBiB0swTAdLMHkHCzBoxwswWscLME6HCzBERwswe0bLMHOGyzBu8YowUvEKMExwijBY8AowdS+KMF9vSjBVbwowVe7KMF8uijBv7kowR25KMGRuCjBGbgowbG3KMFYtyjBC7cowcm2KMGQtijBX7YowTW2KMEQtijB9WMlwRdhJcGfXiXBflwlwalaJcEWWSXBulclwY5WJcGNVSXBr1Qlwe9TJcFLUyXBvVIlwUNSJcHaUSXBgFElwTJRJcHvUCXBtVAlwYRQJcFZUCXBuwEiwVv+IcF0+yHB8/ghwcz2IcHx9CHBV/MhwffxIcHI8CHBwu8hweLuIcEg7iHBee0hwensIcFu7CHBA+whwajrIcFZ6yHBFeshwdvqIcGo6iHBJaAewS6cHsHDmB7B0pUewUmTHsEakR7BOI8ewZqNHsE1jB7BAYsewfmJHsEViR7BUIgewaeHHsEWhx7BmYYewS2GHsHQhR7BgIUewTuFHsEAhR7BUT8bwac6G8GiNhvBLDMbwTAwG8GfLRvBaCsbwYEpG8HcJxvBcyYbwTslG8EvJBvBSCMbwYEiG8HWIRvBQiEbwcQgG8FWIBvB+B8bwacfG8FhHxvBYN8XweTZF8Eq1RfBF9EXwZXNF8GQyhfB9ccXwbjFF8HJwxfBIMIXwbHAF8F1vxfBZr4XwXy9F8GyvBfBBbwXwW+7F8HvuhfBgLoXwSG6F8HOuRfBeYAUwQd6FMF4dBTBrm8UwY5rFMEAaBTB8GQUwU1iFMEHYBTBE14UwWNcFMHwWhTBsFkUwZ1YFMGvVxTB41YUwTRWFMGcVRTBGlUUwapUFMFJVBTBzCIRwTgbEcGvFBHBDg8RwTQKEcEGBhHBbAIRwVH/EMGl/BDBWPoQwVz4EMGn9hDBL/UQwevzEMHU8hDB5PEQwRXxEMFj8BDBye8QwUXvEMHT7hDBjcYNwaa9DcH4tQ3BWq8NwaWpDcG7pA3BfqANwdicDcGzmQ3B/pYNwamUDcGnkg3B7JANwW+PDcEmjg3BC40NwRiMDcFGiw3BkooNwfaJDcFxiQ3B/msKwYhhCsGCWArBu1AKwQZKCsE+RArBQz8Kwfg6CsFGNwrBFjQKwVgxCsH7LgrB8iwKwTErCsGvKQrBYigKwUMnCsFNJgrBeCUKwcEkCsEkJArBZxMHwR4HB8GF/AbBYfMGwX/rBsG05AbB2N4GwczZBsFz1QbBtNEGwXrOBsGyywbBTckGwT3HBsF3xQbB78MGwZ7CBsF8wQbBgsAGwaq/BsHxvgbBIr0DwbSuA8FCogPBhZcDwUKOA8FGhgPBZH8DwXV5A8FYdAPB8G8DwSRsA8HfaAPBDWYDwaBjA8GJYQPBvV8DwTBeA8HaXAPBtFsDwbdaA8HdWQPBkmkAwaRYAMEFSgDBbD0AwY4yAMEuKQDBGCEAwSAaAMEfFADB8g4AwXwKAMGkBgDBVQMAwXsAAMEM/P/A0Pf/wCz0/8AI8f/AVe7/wAHs/8AA6v/AwjL6wBUL+sDP6PnANsv5wK+x+cCqm/nAq4j5wEp4+cAravnA/135wIFT+cB3SvnArkL5wPg7+cAxNvnANjH5wO0s+cA8KfnADib5wFEj+cD1IPnAxZnzwEZr88AVQ/PAXCDzwGEC88CD6PLANNLywPW+8sBdrvLADqDywLmT8sAYifLA73/ywAt48sA/cfLAZGvywFhm8sAAYvLAQ17ywApb8sBEWPLAWAntwObS7MDNo+zAFnvswOpX7MCKOezAVR/swLsI7MA79evAa+TrwOzV68BtyevAqL7rwGC168BhrevAfqbrwI+g68Bzm+vADJfrwEGT68D9j+vAe4HmwDJD5sAMDObAWNzlwBqz5cB4j+XAs3DlwCZW5cA/P+XAfivlwHUa5cDFC+XAG//kwDL05MDL6uTAseLkwLbb5MCz1eTAhdDkwBDM5MA4yOTA0QTgwAu838AVfd/AOkXfwOgU38Ah697ACcfewNyn3sD2jN7AwnXewL5h3sB8UN7AmkHewMY03sC3Kd7AMCDewPsX3sDpEN7A0QrewJIF3sANAd7AuJrZwGBA2cCo9tjAArfYwG9+2MB9TdjALCPYwJv+18AH39fAxcPXwESs18D9l9fAgIbXwGx318BsatfAOF/XwJFV18BATdfAFUbXwOk/18CYOtfAllPTwF7Z0sD+e9LAUDHSwPrw0cCtt9HAGYbRwDtb0cAxNtHAMxbRwJb60MDF4tDAOs7QwIK80MA7rdDAEKDQwLaU0MDuitDAgILQwD570MD8dNDAqiDNwGmTzMAcGMzArLfLwAZsy8D8KsvA8/DKwLy+ysBQk8rAym3KwGFNysBnMcrARxnKwHYEysCD8snACOPJwLDVycAwysnAR8DJwL23ycBhsMnAOx7HwLdixsBd08XAu1bFwGzzxMDLpsTACWXEwEMqxMBm98PAa8vDwGilw8CThMPAO2jDwMlPw8CzOsPAgijDwNQYw8BPC8PAqP/CwJ31wsD27MLApY3BwD5kwMCIpr/AdhO/wE2VvsA2L77AnuG9wOyevcCeY73AGTC9wIwDvcAL3bzAyLu8wBGfvMBNhrzA73C8wIJevMCeTrzA7EC8wB01vMDxKrzA+aYvwYilL8FMpC/BPqMvwViiL8GSoS/B6qAvwVqgL8Hfny/Bdp8vwRyfL8HPni/Bjp4vwVaeL8Emni/B/Z0vwdqdL8G8nS/Bo50vwY2dL8F6nS/B9EIswT1BLMHHPyzBhz4swXU9LMGLPCzBwzsswRg7LMGHOizBCjoswZ85LMFEOSzB9jgswbQ4LMF7OCzBSjgswSE4LMH9NyzB3zcswcU3LMGvNyzBRt8owT7dKMGC2yjBBtoowcHYKMGs1yjBv9YowfTVKMFH1SjBs9QowTXUKMHJ0yjBbNMowR3TKMHa0ijBoNIowW/SKMFF0ijBIdIowQLSKMHo0SjBAXwlwZl5JcGJdyXBx3UlwUZ0JcH9ciXB43ElwfNwJcElcCXBdm8lweBuJcFgbiXB8m0lwZRtJcFEbSXBAG0lwcZsJcGUbCXBaWwlwUVsJcElbCXBOBkiwV0WIsHsEyLB1REiwQwQIsGGDiLBOA0iwRsMIsEnCyLBVwoiwaUJIsENCSLBiwgiwRwIIsG9ByLBbAciwSYHIsHrBiLBuAYiwY0GIsFoBiLBArcewZ+zHsG5sB7BQK4ewSKsHsFTqh7Bx6gewXSnHsFTph7BXKUewYmkHsHUox7BOqMewbaiHsFFoh7B5aEewZOhHsFNoR7BEKEewd2gHsGxoB7BelUbwXZRG8EHThvBF0sbwZRIG8FvRhvBmUQbwQhDG8GxQRvBi0AbwZE/G8G7PhvBBD4bwWc9G8HhPBvBbzwbwQ48G8G6OxvBczsbwTY7G8ECOxvBwfQXwf3vF8Hr6xfBb+gXwXXlF8Hq4hfBveAXweDeF8FJ3RfB7dsXwcTaF8HG2RfB7dgXwTPYF8GV1xfBDdcXwZnWF8E21hfB4tUXwZnVF8Fc1RfB+5QUwVaPFMGCihTBYYYUwdmCFMHUfxTBQH0UwQt7FMEoeRTBi3cUwSt2FMH9dBTB+3MUwR9zFMFjchTBwnEUwTlxFMHDcBTBX3AUwQlwFMHAbxTBVzYRwaYvEcHtKRHBCCURwdggEcFEHRHBNBoRwZYXEcFaFRHBcBMRwc4REcFoEBHBNg8RwTEOEcFSDRHBkwwRwfALEcFlCxHB7goRwYgKEcExChHBCdkNwRzRDcFUyg3BhsQNwZC/DcFRuw3BsLcNwZW0DcHusQ3Bqa8NwbmtDcERrA3BpqoNwXCpDcFnqA3BhacNwcOmDcEepg3BkaUNwRilDcGxpA3BUH0KwexzCsHjawrBA2UKwSFfCsEYWgrBy1UKwR1SCsH3TgrBRkwKwfpJCsECSArBVEYKweRECsGqQwrBnUIKwbhBCsH0QArBTEAKwb0/CsFCPwrBdyMHwVcYB8HSDgfBrAYHwbT/BsG9+QbBo/QGwUbwBsGL7AbBWukGwZ/mBsFL5AbBTOIGwZjgBsEj3wbB5N0GwdTcBsHr2wbBJNsGwXraBsHp2QbB08sDwam+A8FhswPBuqkDwXihA8FnmgPBW5QDwS+PA8HCigPB+oYDwb2DA8H5gAPBnH4DwZd8A8HcegPBYnkDwR94A8ELdwPBH3YDwVV1A8GpdAPBy3YAwTdnAMHeWQDBb04AwadEAMFJPADBITUAwQEvAMHDKQDBSCUAwXMhAMEsHgDBXxsAwfoYAMHuFgDBLhUAwa8TAMFnEgDBUBEAwWEQAMGUDwDBD0r6wEEl+sC0BfrAqur5wIHT+cCtv/nAt675wDOg+cDHk/nAJ4n5wBGA+cBLePnApnH5wPhr+cAcZ/nA9WL5wGlf+cBgXPnAyFn5wJFX+cCsVfnAza3zwFCC88ACXfPABj3zwJ0h88AiCvPACPbywNXk8sAd1vLAhcnywMC+8sCJtfLAqK3ywOum8sAoofLAO5zywAaY8sBslPLAWZHywLiO8sB5jPLAABrtwKjm7MCUuuzAw5TswFd07MCNWOzAwEDswF4s7MDuGuzAAgzswD7/68BS9OvA+urrwP3i68Ao3OvAUdbrwFLR68ANzevAZ8nrwEnG68Cew+vABo/mwJNT5sCJH+bA2/LlwIbM5cCoq+XAfY/lwFt35cCxYuXAA1HlwOJB5cDxNOXA3inlwGUg5cBLGOXAXhHlwHIL5cBiBuXADgLlwFr+5MAx++TAGg/gwFDJ38Aujd/AcFjfwCcr38BMBN/A+uLewGzG3sD1rd7AApnewBWH3sC/d97An2rewGVf3sDKVd7Ak03ewI5G3sCMQN7AajvewAc33sBGM97AiaPZwGRK2cCmA9nA0sbYwF6R2MB3Y9jAFTzYwE4a2MBb/dfAjuTXwFHP18AlvdfAmK3XwEmg18DnlNfAKovXwNeC18C4e9fAoXXXwGxw18D5a9fA+FjTwOLh0sC+hdLACD7SwIEA0sBUytHAzpvRwOJz0cClUdHATDTRwCgb0cCfBdHAMvPQwG7j0MDx1dDAZsrQwIfA0MAVuNDA3bDQwLCq0MBppdDAPyPNwIqYzMBTIMzAKMHLwHh4y8A7OsvAUgPLwCvUysCzq8rA/4jKwD9rysDCUcrA7jvKwD8pysBDGcrAlQvKwOL/ycDf9cnAUO3JwP7lycC738nABh/HwHVlxsA/2MXAqF7FwKP8xMD2ssTAAXTEwFs8xMCPDMTAi+PDwF3Aw8A0osPAXojDwDxyw8BLX8PAFk/DwDhBw8BbNcPANSvDwIciw8AbG8PApY3BwOtkwMAQqb/AGRi/wPGcvsAqOL7Agu29wKKtvcBtdb3A/ES9wGgbvcC/97zALdm8wPu+vMCLqLzAV5W8wOmEvMDadrzA0mq8wIhgvMC7V7zAYL4vwTG9L8EwvC/BVrsvwZ66L8EBui/BfLkvwQu5L8GruC/BWrgvwRW4L8Hbty/BqrcvwYC3L8Fcty/BPrcvwSS3L8EPty/B/LYvwey2L8Hfti/BCFoswZ5YLMFqVyzBZlYswYlVLMHNVCzBLlQswadTLME1UyzB1FIswYJSLME8UizBAFIswc5RLMGkUSzBgFEswWFRLMFHUSzBMVEswR5RLMEOUSzB/PUowUv0KMHc8ijBpPEowZzwKMG77yjB/e4owVzuKMHT7SjBX+0owfzsKMGp7CjBYuwowSbsKMHz6yjByOsowaPrKMGE6yjBausowVPrKMFA6yjBTZIlwUeQJcGPjiXBGo0lwd6LJcHSiiXB7oklwS2JJcGKiCXB/4clwYmHJcElhyXB0IYlwYiGJcFLhiXBGIYlweyFJcHHhSXBp4UlwYyFJcF2hSXBCy8iwZ8sIsGSKiLB1CgiwVonIsEZJiLBCCUiwSIkIsFeIyLBuCIiwSsiIsGzISLBTiEiwfggIsGvICLBcSAiwT0gIsEQICLB6h8iwcofIsGvHyLBS8wewWfJHsHyxh7B3cQewRnDHsGZwR7BVMAewT+/HsFVvh7Bjr0ewea8HsFXvB7B3rsewXe7HsEfux7B1boewZe6HsFhuh7BNLoewQ66HsHuuR7BKWobwbNmG8HEYxvBRmEbwSlfG8FeXRvB2VsbwY9aG8F3WRvBiVgbwb9XG8EUVxvBg1YbwQhWG8GgVRvBR1UbwfxUG8G8VBvBhlQbwVlUG8EyVBvBwQgYwZ8EGMEcARjBIv4XwZv7F8F2+RfBpfcXwRr2F8HK9BfBrvMXwb3yF8Hw8RfBQ/EXwbDwF8Ez8BfBye8XwW/vF8Ej7xfB4u4XwavuF8F97hfBOKgUwUejFMEWnxTBhpsUwYGYFMHxlRTBxJMUweuRFMFakBTBBo8UweaNFMHxjBTBIowUwXKLFMHcihTBXooUwfKJFMGXiRTBSokUwQiJFMHRiBTBu0gRwdNCEcHPPRHBjjkRwfI1EcHhMhHBRzARwRIuEcEzLBHBnCoRwUMpEcEeKBHBJicRwVMmEcGhJRHBCSURwYgkEcEbJBHBvyMRwXEjEcEuIxHBfOoNwW3jDcFv3Q3BWdgNwQjUDcFe0A3BQs0NwZ7KDcFhyA3BesYNwd7EDcGAww3BV8INwVvBDcGFwA3B0L8NwTa/DcG0vg3BRb4Nwee9DcGYvQ3BuY0KwUuFCsEhfgrBDXgKweRyCsGDbgrBy2oKwaNnCsH2ZArBsGIKwcNgCsEgXwrBvV0KwY9cCsGQWwrBt1oKwf9ZCsFjWQrB31gKwW9YCsEPWArBujIHwakoB8EcIAfB2BgHwa0SB8FxDQfB/wgHwTkFB8EGAgfBTv8GwQD9BsEM+wbBY/kGwfr3BsHJ9gbBxfUGwen0BsEv9AbBkfMGwQrzBsGY8gbB1tkDwdPNA8GdwwPB8LoDwZGzA8FOrQPB/6cDwX2jA8GpnwPBapwDwaiZA8FRlwPBVZUDwaaTA8E5kgPBApEDwfuPA8EcjwPBX44Dwb6NA8E2jQPBcoMAwR51AMHvaADBk14AwcZVAMFMTgDB8kcAwZBCAMH+PQDBHToAwdM2AMEHNADBqDEAwaUvAMHwLQDBfiwAwUMrAME5KgDBVikAwZYoAMH0JwDBcmD6wFA++sBFIfrAkgj6wJPz+cC74fnAk9L5wLPF+cDHuvnAgbH5wKKp+cD0ovnASJ35wHmY+cBklPnA7ZD5wP2N+cB/i/nAYYn5wJaH+cARhvnAIMHzwHaY88DWdfPAYFjzwFI/88AFKvPA6xfzwIoI88B6+/LAZfDywP3m8sAA3/LAOdjywHjS8sCXzfLAcsnywO/F8sD0wvLAbMDywEe+8sB1vPLAJCrtwLr57MB70OzAXK3swHqP7MAPduzAc2DswBZO7MB8PuzAOzHswPwl7MBxHOzAVhTswHYN7MCgB+zArALswHj+68Dn+uvA4ffrwFD168Aj8+vANJzmwHJj5sBZMubAgwjmwOPk5cCSxuXAyqzlwN6W5cA8hOXAaHTlwPdm5cCOW+XA3lHlwKZJ5cCrQuXAwDzlwLk35cB2M+XA2C/lwMYs5cArKuXAJxngwDvW38DJnN/A/WrfwI5A38BsHN/Aq/3ewITj3sBHzd7AYLrewFGq3sCunN7AGpHewEaH3sDvft7A23fewNlx3sC/bN7AbGjewMBk3sCjYd7ANKzZwC9U2cBOENnAKdbYwKij2MCeeNjA91PYwMY02MA9GtjArgPYwILw18A34NfAYdLXwKHG18CpvNfAM7TXwASt18DsptfAv6HXwFyd18CimdfAR17TwEHq0sBGj9LAbErSwJMP0sBa3NHAs7DRwIaL0cDia9HA+FDRwBU60cCiJtHAGxbRwBEI0cAl/NDACPLQwHLp0MAp4tDA+dvQwLrW0MBF0tDAziXNwJudzMBnKMzAbsrLwJiEy8AIScvAFRXLwM/oysAaw8rAAaPKwLSHysB8cMrAwVzKwP1LysC+PcrApjHKwGMnysCtHsrASRfKwAIRysCvC8rA0B/HwC1oxsAR3cXAdGbFwKgFxcDSvsTAiILEwNlNxMDyIMTAsvrDwCTaw8ByvsPA5abDwOCSw8DdgcPAanPDwCVnw8C8XMPA5VPDwGVMw8AHRsPApY3BwJZlwMCTq7/Arhy/wHakvsDuQL7AHvm9wPe7vcCnhr3AHFm9wFEyvcBLEb3AMvW8wE7dvMD/yLzAvre8wBWpvMCinLzAEpK8wBqJvMB+gbzAANQvwQfTL8E30i/Bh9EvwfPQL8F20C/BDdAvwbXPL8Fqzy/BLM8vwffOL8HLzi/Bpc4vwYbOL8Frzi/BVc4vwULOL8Eyzi/BJc4vwRrOL8ERzi/BY28swThuLME8bSzBaGwswbZrLMEfayzBoWoswTZqLMHcaSzBkWkswVFpLMEcaSzB72gswcloLMGpaCzBjmgswXdoLMFkaCzBVGgswUdoLME8aCzBCgspwaEJKcFxCCnBcQcpwZoGKcHlBSnBTAUpwcwEKcFfBCnBBAQpwbgDKcF3AynBQQMpwRMDKcHtAinBzAIpwbECKcGaAinBhwIpwXYCKcFpAinBAKclwU2lJcHfoyXBq6IlwaehJcHMoCXBFKAlwXmfJcH3niXBiZ4lwSyeJcHenSXBnZ0lwWadJcE3nSXBEJ0lwe+cJcHUnCXBvJwlwamcJcGYnCXBWEMiwUtBIsGRPyLBHj4iweQ8IsHdOyLB/zoiwUQ6IsGmOSLBIjkiwbI4IsFUOCLBBTgiwcM3IsGLNyLBXDciwTQ3IsETNyLB9zYiwd82IsHLNiLBJOAewavdHsGW2x7B1tkewVzYHsEe1x7BE9YewTHVHsF01B7B1NMewU3THsHc0h7BfdIewSzSHsHp0R7BsNEewYDRHsFY0R7BNtEewRnRHsEB0R7BfX0bwYJ6G8H/dxvB4nUbwRt0G8GcchvBWXEbwUlwG8FkbxvBpG4bwQFuG8F5bRvBBm0bwaVsG8FUbBvBD2wbwdVrG8GlaxvBfGsbwVlrG8E8axvBfhsYwecXGMHgFBjBVBIYwS8QGMFhDhjB3AwYwZQLGMGAChjBmAkYwdQIGMEvCBjBpQcYwTAHGMHOBhjBewYYwTUGGMH7BRjByQUYwaAFGMF9BRjBTLoUwfi1FMFSshTBQK8UwaqsFMF8qhTBp6gUwRynFMHPpRTBt6QUwcujFMEEoxTBXaIUwdChFMFaoRTB9qAUwaKgFMFcoBTBIKAUwe6fFMHEnxTBD1oRwdhUEcFzUBHBv0wRwaFJEcEARxHBykQRwe5CEcFdQRHBC0ARwe4+EcH/PRHBNT0RwYs8EcH9OxHBhDsRwR87EcHKOhHBgjoRwUU6EcETOhHB+PoNwbD0DcFl7w3B7+oNwS3nDcED5A3BWOENwRnfDcE13Q3BntsNwUfaDcEm2Q3BM9gNwWbXDcG61g3BKdYNwa/VDcFI1Q3B8dQNwajUDcFr1A3BRZ0KwbSVCsFUjwrB9IkKwW2FCsGcgQrBZX4KwbB7CsFpeQrBfXcKweB1CsGEdArBXnMKwWdyCsGYcQrB6XAKwVVwCsHZbwrBcW8KwRlvCsHPbgrBO0EHwSA4B8FzMAfB+ikHwYUkB8HsHwfBDBwHwckYB8EJFgfBuRMHwcYRB8EiEAfBwQ4HwZcNB8GcDAfByQsHwRcLB8GCCgfBBAoHwZoJB8FBCQfBMucDwT3cA8H/0gPBNMsDwaHEA8EXvwPBbLoDwX62A8EtswPBY7ADwQquA8EPrAPBZaoDwf6oA8HQpwPB0aYDwfulA8FGpQPBr6QDwS+kA8HDowPBj48AwWKCAMFDdwDB4W0AwfdlAMFLXwDBq1kAwe5UAMHwUADBk00Awb5KAMFbSADBWkYAwalEAME9QwDBC0IAwQhBAMEvQADBeD8Awd4+AMFcPgDB93X6wE9W+sCUO/rABSX6wP0R+sDwAfrAZ/T5wP/o+cBi3/nASdf5wHbQ+cC3yvnA38X5wM3B+cBevvnAe7v5wAy5+cAAt/nAR7X5wNOz+cCasvnAx9PzwMCt88CfjfPAfXLzwJZb88BESPPA+TfzwDwq88CnHvPA5BTzwKsM88C+BfPA6P/ywP768sDb9vLAX/PywHHw8sD47fLA5OvywCTq8sCr6PLAxzntwCMM7cCK5ezA7sTswGOp7MAkkuzAh37swPxt7MAJYOzASFTswF9K7MAGQuzA/TrswBE17MATMOzA4CvswFco7MBcJezA2yLswL4g7MD3HuzACKnmwNVy5sCDRObAVx3mwD385cBI4OXAr8jlwMa05cD6o+XA0pXlwOKJ5cDTf+XAWXflwDVw5cAxauXAIGXlwNxg5cBFXeXAP1rlwLRX5cCPVeXA+iLgwM7i38Drq9/A6HzfwCZV38CNM9/ALBffwDj/3sAC697A9dnewJXL3sB3v97AQbXewKas3sBmpd7AS5/ewCaa3sDRld7ALJLewBqP3sCFjN7AuLTZwMJd2cCgHNnACuXYwFS12MD6jNjA32rYwBFO2MDBNdjAPCHYwO0P2MBWAdjACPXXwKrq18Du4dfAkdrXwF7U18Alz9fAv8rXwAzH18Duw9fAhmPTwHzy0sCamNLAflbSwDse0sDH7dHA0sTRwDWi0cD4hNHASWzRwHVX0cDjRdHAEzfRwJYq0cAPINHAMRfRwLgP0cBsCdHAHwTRwKj/0MDm+9DAWCjNwJyizMBZMMzAgtPLwG2Qy8CCV8vAQibLwLH8ysCO2crA4bvKwNOiysCujcrA2HvKwM5sysAgYMrAcVXKwHBMysDZRMrAdT7KwBM5ysCLNMrAmiDHwOBqxsDV4cXAIG7FwHwOxcBqysTA1pDEwMVexMCWNMTA7RDEwM3yw8Be2cPA58PDwMyxw8CIosPAqZXDwNCKw8CrgcPA93nDwHpzw8ADbsPApY3BwEFmwMARrr/ANSG/wNyrvsCESb7AdwS+wBLKvcBTl73Agmy9wFBIvcC9Kb3A6w+9wCL6vMDB57zAQdi8wDDLvMAswLzA5La8wBKvvMB8qLzACOgvwTznL8GS5i/BBOYvwY7lL8Eq5S/B1+QvwZLkL8FY5C/BKOQvwf/jL8He4y/BwuMvwarjL8GW4y/BhuMvwXjjL8Ft4y/BY+MvwVvjL8FU4y/BNIMswTyCLMFugSzBwYAswTCALMG4fyzBU38swf9+LMG4fizBfn4swUx+LMEjfizBAX4sweR9LMHMfSzBuH0swah9LMGafSzBjn0swYR9LMF8fSzBmR4pwW0dKcFxHCnBnxspwe8aKcFdGinB4hkpwXwZKcEmGSnB3xgpwaMYKcFxGCnBRxgpwSQYKcEHGCnB7xcpwdsXKcHKFynBvBcpwbAXKcGmFynBRbolwde4JcGmtyXBprYlwdG1JcEetSXBibQlwQ20JcGlsyXBTrMlwQWzJcHIsiXBlrIlwWuyJcFIsiXBKrIlwRKyJcH9sSXB7LElwd2xJcHRsSXBRlYiwYlUIsEVUyLB31EiwdtQIsEDUCLBTU8iwbZOIsE3TiLBzk0iwXVNIsEsTSLB7kwiwbpMIsGPTCLBa0wiwU1MIsE0TCLBH0wiwQ5MIsH/SyLBrvIewZHwHsHO7h7BVO0ewRnsHsER6x7BNeoewX3pHsHj6B7BYugewffnHsGd5x7BUucewRTnHsHf5h7Bs+YewY/mHsFw5h7BV+YewULmHsEw5h7BlI8bwQONG8HeihvBE4kbwZOHG8FThhvBR4UbwWeEG8GsgxvBEIMbwY2CG8EgghvBxYEbwXmBG8E5gRvBBIEbwdiAG8GygBvBk4AbwXqAG8FkgBvBEi0YwfQpGMFZJxjBKyUYwVkjGMHTIRjBjiAYwX0fGMGaHhjB3B0YwT0dGMG5HBjBShwYwe0bGMGgGxjBXxsYwSkbGMH8GhjB1hoYwbcaGMGcGhjBSssUwYDHFMFVxBTBsMEUwXm/FMGfvRTBE7wUwcm6FMG0uRTBzbgUwQy4FMFrtxTB5LYUwXO2FMEVthTBx7UUwYW1FMFOtRTBILUUwfq0FMHatBTBYmoRwchlEcHvYRHBuF4RwQdcEcHIWRHB5lcRwVRWEcEEVRHB61MRwQBTEcE8UhHBmFERwQ9REcGdUBHBPVARwe5PEcGrTxHBc08RwURPEcEdTxHBjAoOwfUEDsFJAA7BYPwNwRv5DcFg9g3BF/QNwS7yDcGV8A3BQO8NwSPuDcE07Q3BbewNwcbrDcE76w3Bx+oNwWbqDcEV6g3B0ekNwZjpDcFp6Q3BAKwKwTelCsGKnwrBypoKwdKWCsGAkwrBuZAKwWeOCsF2jArB14oKwXyJCsFaiArBaIcKwZ6GCsH0hQrBZ4UKwfGECsGOhArBPIQKwfeDCsG9gwrBBk8HwcpGB8HlPwfBIToHwU41B8FFMQfB5S0HwRMrB8G4KAfBvyYHwRolB8G5IwfBkyIHwZwhB8HPIAfBIyAHwZMfB8EbHwfBtx4HwWMeB8EdHgfB8vMDwfPpA8GW4QPBldoDwbnUA8HTzwPBucsDwUzIA8FvxQPBCcMDwQnBA8FcvwPB9r0Dwcu8A8HRuwPBALsDwVG6A8G/uQPBRrkDweC4A8GLuAPBKZsAwQqPAMHkhADBZHwAwUd1AMFUbwDBWWoAwS9mAMG0YgDBy18AwVxdAMFTWwDBoFkAwTRYAMEEVwDBBlYAwTJVAMGAVADB7FMAwXBTAMEJUwDBpYr6wEtt+sCyVPrAGED6wNcu+sBnIPrAUxT6wDgK+sDEAfrAsvr5wMr0+cDZ7/nAuOv5wETo+cBi5fnA+eL5wPXg+cBG3/nA3t35wLHc+cC12/nAxuXzwDjC88BopPPAbIvzwH5288D4ZPPATlbzwAhK88DEP/PALTfzwP8v88D+KfPA+STzwMcg88BGHfPAVxrzwOQX88DYFfPAIhTzwLQS88CDEfPA70jtwOgd7cDM+ezAhNvswCPC7MDhrOzAFJvswC2M7MC2f+zASHXswI5s7MBDZezAKl/swBBa7MDNVezAPVLswENP7MDGTOzAsUrswPRI7MCAR+zAg7XmwMqB5sANVubAYTHmwJ8S5sDY+OXAQOPlwCvR5cAIwuXAXbXlwMWq5cDooeXAf5rlwE2U5cAej+XAyorlwCuH5cAlhOXAnYHlwIF/5cC9feXAlCzgwAzv38C1ut/AOI7fwPho38C7Sd/AjC/fwJwZ38A+B9/A3vfewADr3sA84N7APNfewLTP3sBpyd7AJcTewL+/3sARvN7A/7jewG223sBHtN7AF73ZwB5n2cCkKNnAqfPYwGfG2MCToNjA2YDYwEBm2MD4T9jATz3YwLEt2MCfINjArxXYwIoM2MDjBNjAfv7XwCX518Ct9NfA8fDXwNHt18A169fAsmjTwJP60sC5odLASWLSwKcs0sCe/tHAM9jRwPm30cD1nNHAU4bRwF9z0cCBY9HAOlbRwB5L0cDTQdHADjrRwI4z0cAgLtHAlSnRwMkl0cCdItHA3CrNwI2nzMApOMzAY9zLwPqby8CuZcvA3DbLwNgPy8Ac78rArNPKwK68ysBuqcrAT5nKwNKLysCJgMrAGHfKwDNvysCaaMrAFWPKwHheysCcWsrAYiHHwI1txsCJ5sXArHXFwCAXxcC61cTAwp7EwCNvxMCDR8TARCbEwGUKxMAL88PAfN/DwB3Pw8BpwcPA8rXDwFusw8BWpMPAoZ3DwAWYw8BWk8PApY3BwOtmwMCKsL/AriW/wCSzvsBNUr7AiA++wMTXvcB0p73ANX+9wHFdvcAiQb3Aaim9wIwVvcDqBL3A/va8wFnrvMCb4bzAddm8wKXSvMDyzLzAn/ovwfj5L8Fu+S/B+/gvwZz4L8FN+C/BDPgvwdX3L8Go9y/Bg/cvwWT3L8FK9y/BNfcvwST3L8EV9y/BCfcvwf/2L8H29i/B7/Yvwer2L8Hl9i/BnJUswdCULMEmlCzBmpMswSWTLMHEkizBdJIswTKSLMH6kSzBzZEswaeRLMGHkSzBbZEswVeRLMFGkSzBN5EswSqRLMEgkSzBGJEswRGRLMELkSzBzDApwdEvKcEBLynBVS4pwcYtKcFPLSnB7SwpwZssKcFYLCnBHywpwfErKcHKKynBqispwZArKcF6KynBaCspwVgrKcFMKynBQispwTkrKcEyKynBOMwlwQXLJcEGyiXBMsklwYPIJcHyxyXBecclwRXHJcHCxiXBfsYlwUXGJcEVxiXB7sUlwc7FJcGzxSXBnMUlwYrFJcF6xSXBbsUlwWPFJcFaxSXB72ciwXZmIsE+ZSLBO2QiwWRjIsGyYiLBHmIiwaRhIsE+YSLB6mAiwaRgIsFqYCLBOmAiwRJgIsHxXyLB1V8iwb9fIsGsXyLBnF8iwY9fIsGEXyLBAQQfwTQCH8G1AB/BeP8ewXH+HsGW/R7B4fwewUv8HsHO+x7BZ/sewRH7HsHK+h7Bj/oewV76HsE2+h7BFPoewfj5HsHh+R7Bzvkewb75HsGx+R7BhKAbwU+eG8F6nBvB9ZobwbKZG8GmmBvByJcbwRCXG8F4lhvB+ZUbwZCVG8E5lRvB8JQbwbSUG8GDlBvBWpQbwTeUG8EblBvBBJQbwfCTG8HgkxvBkT0Ywdw6GMGdOBjBwTYYwTU1GMHtMxjB3TIYwfsxGMFAMRjBpDAYwSQwGMG5LxjBYC8YwRcvGMHaLhjBpy4YwX4uGMFbLhjBPi4YwSYuGMESLhjBRdsUwfXXFME11RTB7NIUwQjRFMF2zxTBKM4UwRPNFMEuzBTBcMsUwdLKFMFPyhTB4skUwYjJFME9yRTB/8gUwczIFMGhyBTBfsgUwWHIFMFJyBTByHkRwbl1EcFachHBjm8RwTxtEcFQaxHBt2kRwWRoEcFKZxHBYWYRwaBlEcH/ZBHBemQRwQxkEcGwYxHBZGMRwSVjEcHxYhHBxmIRwaJiEcGEYhHBRxkOwU4UDsEtEA7BwAwOwekJDsGNBw7BmAUOwfgDDsGgAg7BggEOwZUADsHQ/w3BLf8NwaX+DcE1/g3B2P0NwYv9DcFL/Q3BFv0Nwer8DcHF/A3B+bkKweOzCsHVrgrBo6oKwSinCsFEpArB3qEKweGfCsE7ngrB3JwKwbmbCsHImgrBAJoKwVqZCsHRmArBX5gKwQCYCsGylwrBcZcKwTuXCsEOlwrBJVwHwbJUB8GCTgfBX0kHwRtFB8GRQQfBoT4HwTE8B8ErOgfBfTgHwRk3B8HyNQfB/DQHwTE0B8GIMwfB/TIHwYkyB8EoMgfB2TEHwZYxB8FgMQfBHAAEwf/2A8Ft7wPBI+kDwerjA8GU3wPB+9sDwf7YA8GE1gPBddQDwcHSA8FX0QPBKtADwTHPA8FizgPBt80DwSjNA8GzzAPBUcwDwQDMA8G8ywPBRaYAwSCbAMHdkQDBKooAwcaDAMF3fgDBDnoAwWZ2AMFdcwDB2HAAwcFuAMEFbQDBlGsAwWNqAMFmaQDBk2gAweVnAMFVZwDB3WYAwXlmAMEnZgDBh576wFCD+sCubPrA3Vn6wDtK+sA/PfrAdjL6wIIp+sAUIvrA6Rv6wMsW+sCMEvrABw/6wBsM+sCuCfrAqwf6wAAG+sCeBPrAeQP6wIUC+sC7AfrAJPfzwOjV88A/uvPAPaPzwB2Q88A5gPPABnPzwBBo88D2XvPAaFfzwCNR88DvS/PAnkfzwAlE88ARQfPAmj7zwI8888DdOvPAdTnzwEo488BSN/PA01ftwBAv7cBIDe3AK/HswMnZ7MBYxuzAMbbswMao7MChnezAYZTswLOM7MBThuzACYHswKZ87MACeezA/HXswHtz7MBncezArm/swEBu7MAQbezArsHmwHyQ5sD+ZubAqUTmwBYo5sBSEObAj/zlwCTs5cCA3uXALNPlwMTJ5cD1weXAe7vlwBq25cCkseXA8K3lwN6q5cBSqOXANablwHWk5cABo+XA9jXgwAH738Asyd/A8J7fwAx838ACX9/A2UbfwMMy38ASIt/ANRTfwLEI38Ah/97AMffewJvw3sAk697AmubewNfi3sC4397AId3ewPva3sAz2d7AUMXZwEVw2cBeNNnA5AHZwOjW2MBys9jA7pXYwGB92MD2aNjA/lfYwOZJ2MAxPtjAeTTYwGcs2MC1JdjAJiDYwIob2MC3F9jAihTYwOgR2MC5D9jAzm3TwIcC08CkqtLAx23SwKU60sDmDtLA3OrRwNzM0cDns9HAJ5/RwOiN0cCUf9HArXPRwMxp0cCYYdHAyVrRwCNV0cBzUNHAj0zRwFVJ0cCoRtHAoi3NwG2szMDXP8zAFOXLwD2ny8Bxc8vA60bLwEsiy8DOA8vAcOrKwFjVysDQw8rAP7XKwCepysAbn8rAxZbKwNmPysAbisrAV4XKwGOBysAbfsrAKiLHwDVwxsAv68XAGH3FwGsgxcDA4MTAR6zEwPl+xMDAWcTAwzrEwPsgxMCKC8TAuPnDwOrqw8Ce3sPAaNTDwO7Lw8DlxMPADr/DwDa6w8AxtsPApY3BwJVnwMD/sr/AGSq/wE66vsB6XL7AUhq+wBPlvcAPt73APJG9wL1xvcCIV73AvUG9wKAvvcCTIL3AExS9wLIJvcAUAb3A7fm8wP7zvMAR77zA5gswwV4LMMHtCjDBkQowwUQKMMEGCjDB0gkwwacJMMGECTDBaAkwwVAJMME8CTDBLAkwwR8JMMEUCTDBCwkwwQQJMMH+CDDB+QgwwfUIMMHxCDDBvaYswRSmLMGJpSzBF6UswbmkLMFrpCzBK6QswfejLMHLoyzBqKMswYujLMFyoyzBX6MswU6jLMFBoyzBNqMswS2jLMEloyzBH6MswRqjLMEWoyzBv0Epwe5AKcFDQCnBtT8pwUE/KcHhPinBkj4pwVE+KcEcPinB8D0pwcs9KcGtPSnBlT0pwYE9KcFwPSnBYj0pwVc9KcFOPSnBRj0pwUA9KcE7PSnB9twlwfTbJcEg2yXBcdolweHZJcFr2SXBCdklwbnYJcF32CXBQNglwRTYJcHv1yXB0NclwbjXJcGj1yXBktclwYTXJcF51yXBb9clwWjXJcFh1yXBb3giwTB3IsEqdiLBUnUiwaB0IsENdCLBlXMiwTJzIsHgciLBnXIiwWVyIsE4ciLBEnIiwfRxIsHacSLBxXEiwbRxIsGmcSLBmnEiwZFxIsGJcSLBORQfwa8SH8FqER/BXxAfwYQPH8HPDh/BOg4fwb8NH8FaDR/BBw0fwcMMH8GKDB/BXAwfwTYMH8EXDB/B/QsfwegLH8HWCx/ByAsfwbwLH8GyCx/BZrAbwYCuG8HvrBvBpasbwZaqG8G2qRvB/qgbwWaoG8HqpxvBg6cbwS6nG8HpphvBsKYbwYCmG8FaphvBOqYbwR+mG8EKphvB+KUbwemlG8HdpRvBEE0YwbZKGMHHSBjBMEcYweBFGMHMRBjB6UMYwS1DGMGTQhjBFEIYwaxBGMFWQRjBD0EYwdVAGMGlQBjBfUAYwV1AGMFCQBjBLEAYwRpAGMELQBjBUuoUwWvnFMEI5RTBEOMUwXHhFMEc4BTBA98UwRveFMFd3RTBwNwUwT/cFMHV2xTBfdsUwTXbFMH62hTBydoUwaHaFMGA2hTBZdoUwU/aFME82hTBUIgRwbuEEcHIgRHBWX8RwVl9EcGzexHBWHoRwTp5EcFPeBHBjXcRwe12EcFqdhHB/nURwaV1EcFcdRHBIHURwe50EcHFdBHBo3QRwYh0EcFxdBHBNicOwcoiDsElHw7BJRwOwawZDsGjFw7B9hUOwZUUDsFyEw7BghIOwb0RDsEbEQ7BlRAOwScQDsHNDw7Bgg8OwUUPDsESDw7B6Q4OwccODsGrDg7BO8cKwcbBCsFGvQrBkbkKwYS2CsEAtArB7rEKwTmwCsHSrgrBqq0KwbasCsHuqwrBSasKwcGqCsFRqgrB9akKwampCsFrqQrBN6kKwQ2pCsHqqArBoWgHweRhB8FXXAfBw1cHwf5TB8HjUAfBVE4HwTlMB8F9SgfBD0kHweJHB8HqRgfBHkYHwXZFB8HsRAfBekQHwR1EB8HQQwfBkEMHwVxDB8ExQwfBugsEwWoDBMGQ/APB6vYDwULyA8Ft7gPBROsDwaroA8GF5gPBweQDwU3jA8Eb4gPBH+EDwU/gA8Gl3wPBGN8DwaTeA8FF3gPB9t0DwbbdA8GB3QPB6bAAwaqmAME3ngDBPpcAwX+RAMHDjADB3IgAwaaFAMEAgwDB0oAAwQZ/AMGMfQDBVHwAwVR7AMGBegDB03kAwUR5AMHOeADBbXgAwR14AMHcdwDBpLH6wGqY+sCXg/rAaXL6wD5k+sCRWPrA8U76wANH+sB6QPrAGTv6wKo2+sAEM/rAAzD6wIot+sCAK/rA0yn6wHIo+sBPJ/rAXyb6wJol+sD4JPrA6Af0wNfo88Auz/PA/7nzwIao88AdmvPAPI7zwHGE88BgfPPAu3XzwEJw88DAa/PACWjzwPtk88B3YvPAZGDzwK9e88BIXfPAIFzzwC1b88BkWvPAS2btwKA/7cAHIO3A7gXtwGPw7MCd3uzA9c/swN/D7MDquezAtbHswPKq7MBhpezAyqDswASd7MDomezAWJfswD2V7MCAk+zAE5LswOaQ7MDuj+zAi83mwLye5sBbd+bAOFfmwK085sDEJubArxTmwMYF5sB8+eXAWu/lwAHn5cAh4OXAdtrlwMzV5cD00eXAy87lwDDM5cALyuXAR8jlwNPG5cChxeXAIj/gwKUG4MA019/AGa/fwGqO38Brc9/AIl3fwL5K38CUO9/AEy/fwMQk38BHHN/ASBXfwIQP38DFCt/A3QbfwKUD38D/AN/A0P7ewAT93sCK+97AZc3ZwDh52cDJP9nAsw/ZwNvm2MCfxdjAKqrYwH+T2MDLgNjAXXHYwKVk2MAqWtjAhlHYwGhK2MCMRNjAuD/YwL472MB4ONjAxTXYwI0z2MC6MdjA2XLTwFkK08Bes9LA+XjSwDtI0sCuHtLA1/zRwOrg0cDcydHA1rbRwCSn0cA0mtHAio/RwMGG0cCEf9HAjXnRwKN00cCYcNHAQ23RwIVq0cBDaNHAeTDNwD6xzMBmR8zA8+7LwDayy8DNgMvAjFbLwBM0y8CtF8vAOgDLwODsysDq3MrAwc/KwOjEysD4u8rAmrTKwImuysCKqcrAbaXKwAmiysA/n8rA8SLHwNhyxsDF78XAZYTFwKkqxcCA68TAarnEwHOOxMBVa8TAc07EwJk2xMDrIsTArhLEwEsFxMBD+sPAK/HDwK3pw8CB48PAbN7DwDzaw8DK1sPApY3BwD5owMButb/Ady6/wFvBvsB0Zr7A2CS+wADyvcBixr3AnaK9wD2FvcD7bL3A9li9wHNIvcDVOr3AnC+9wFwmvcC9Hr3AdRi9wEoTvcAID73A/RswwY0bMMEyGzDB5xowwaoaMMF4GjDBTxowwS4aMMETGjDB/RkwweoZMMHcGTDBzxkwwcYZMMG9GTDBtxkwwbEZMMGtGTDBqRkwwaYZMMGkGTDBtbYswSm2LMG3tSzBWrUswQ61LMHPtCzBnbQswXO0LMFRtCzBNrQswR+0LMEMtCzB/bMswfGzLMHnsyzB37MswdizLMHSsyzBzrMswcqzLMHHsyzBkVEpweNQKcFVUCnB4U8pwYJPKcE0TynB9U4pwcFOKcGXTinBdU4pwVhOKcFBTinBL04pwR9OKcETTinBCE4pwQBOKcH5TSnB800pwe9NKcHrTSnBm+wlwcLrJcER6yXBgeolwQvqJcGq6SXBW+klwRvpJcHm6CXBu+glwZjoJcF76CXBZOglwVHoJcFB6CXBNOglwSroJcEh6CXBGuglwRXoJcEQ6CXB34ciwdGGIsH0hSLBQIUiwa2EIsE1hCLB0oMiwYKDIsFBgyLBC4Miwd+CIsG7giLBnoIiwYaCIsFzgiLBY4IiwVaCIsFLgiLBQ4IiwTuCIsE2giLBaiMfwRoiH8EHIR/BJyAfwW8fH8HZHh/BXx4fwfsdH8GpHR/BZh0fwTAdH8EDHR/B3xwfwcEcH8GpHB/BlRwfwYUcH8F3HB/BbRwfwWQcH8FdHB/BT78bway9G8FWvBvBPrsbwVm6G8GfuRvBBrkbwYm4G8EkuBvB0LcbwYy3G8FVtxvBJ7cbwQK3G8HkthvBy7Ybwbe2G8GnthvBmbYbwY62G8GFthvBolsYwZhZGMHuVxjBklYYwXVVGMGMVBjBzlMYwTNTGMG0UhjBTFIYwfhRGMGyURjBelEYwUxRGMEmURjBB1EYwe5QGMHZUBjByVAYwbtQGMGwUBjBgPgUwfb1FMHj8xTBMfIUwc7wFMGs7xTBwO4Uwf7tFMFg7RTB3+wUwXXsFMEf7BTB2esUwZ/rFMFw6xTBSusUwSrrFMER6xTB/OoUwevqFMHd6hTBCZYRweCSEcFLkBHBLo4RwXSMEcELixHB5IkRwfOIEcEuiBHBjYcRwQqHEcGehhHBR4YRwf+FEcHEhRHBlIURwW2FEcFNhRHBM4URwR6FEcEMhRHBaDQOwXkwDsFCLQ7BoSoOwXooDsG5Jg7BSSUOwR0kDsEnIw7BXyIOwbshDsE1IQ7ByCAOwW4gDsElIA7B6h8OwbkfDsGRHw7BcB8OwVYfDsFAHw7B0dMKwezOCsHrygrBpMcKwffECsHHwgrB/cAKwYe/CsFVvgrBXL0KwY+8CsHpuwrBYLsKwfG6CsGWugrBTLoKwQ+6CsHduQrBtbkKwZS5CsF5uQrBhHQHwW1uB8FxaQfBXmUHwQhiB8FPXwfBFV0HwUNbB8HGWQfBj1gHwZBXB8HAVgfBF1YHwYxVB8EbVQfBvlQHwXJUB8E0VAfBAlQHwdlTB8G3UwfB0hYEwT4PBMELCQTB+AMEwdL/A8Fu/APBqPkDwWP3A8GJ9QPBBfQDwcjyA8HF8QPB8vADwUXwA8G47wPBRO8DwebuA8GZ7gPBWu4DwSfuA8H97QPBHLsAwbGxAMH7qQDBq6MAwYGeAMFImgDB1JYAwQGUAMGykQDBz48AwUWOAMECjQDB+4sAwSOLAMFzigDB5IkAwW6JAMEOiQDBwIgAwYCIAMFLiADBB8T6wKSs+sB7mfrAzIn6wPZ8+sB1cvrA3mn6wNhi+sAaXfrAaFj6wJJU+sBvUfrA3076wMdM+sARS/rAq0n6wIdI+sCYR/rA1Ub6wDVG+sCzRfrAHRj0wA3788BA4/PAwM/zwMm/88C4svPACKjzwEmf88AjmPPASpLzwION88CbifPAaobzwM6D88CsgfPA7n/zwIJ+88BYffPAZXzzwJ5788D8evPAUXTtwLNP7cASMu3A2BntwP8F7cC/9ezAc+jswJHd7MCr1OzAY83swHDH7MCTwuzAmb7swFm77MCxuOzAhbbswL+07MBMs+zAHbLswCax7MBbsOzAFtnmwI6s5sBKh+bAFWnmwG1Q5sA6PObAsCvmwCce5sATE+bABArmwJsC5sCN/OXAmfflwI3z5cA+8OXAiu3lwFTr5cCG6eXADOjlwNjm5cDc5eXAGUjgwPoR4MDQ5N/A5L7fwBmg38ACh9/Ac3LfwJ1h38DWU9/Aj0jfwFc/38DMN9/AoTHfwJcs38B4KN/AGiXfwFki38AZIN/AQx7fwMMc38CJG9/AVtXZwJyC2cDoStnAGR3ZwIP22MAg19jAlr3YwKmo2MCHl9jAgInYwAd+2MCjdNjA9mzYwK9m2MCOYdjAXF3YwO5Z2MAhV9jA11TYwPhS2MBwUdjA03fTwAgS08DkvdLA4oPSwGpV0sAmLtLAKQ7SwCv00cDf3tHAb83RwCi/0cB6s9HA7KnRwBui0cC3m9HAfpbRwDmS0cC7jtHA4YvRwI2J0cClh9HASjPNwP+1zMDTTszAQPnLwOe8y8DHjcvA0WXLwDZFy8DCKsvAFhXLwFUDy8DO9MrA6ujKwDDfysA718rAutDKwGnLysAQx8rAg8PKwJzAysA8vsrAuCPHwHV1xsBO9MXAlIvFwLI0xcD69cTAMMbEwIOdxMBIfMTAXGHEwE1LxMA8OcTAcirEwFgexMBxFMTAWAzEwLkFxMBQAMTA4/vDwEX4w8BQ9cPApY3BwOZowMDat7/AyDK/wEvIvsA6cL7AGy++wJf+vcA+1b3AYLO9wPqXvcCHgb3AJG+9wBZgvcDEU73AsEm9wHJBvcC1Or3AMjW9wLEwvcADLb3AACswwaQqMMFaKjDBHSowwewpMMHFKTDBpCkwwYopMMF1KTDBZCkwwVYpMMFLKTDBQikwwTopMME0KTDBLykwwSspMMEoKTDBJikwwSMpMMEiKTDBncUswSnFLMHMxCzBgMQswUPELMERxCzB6MMswcjDLMGtwyzBl8MswYbDLMF4wyzBbMMswWPDLMFbwyzBVcMswVDDLMFMwyzBScMswUbDLMFEwyzBWmApwclfKcFTXynB9F4pwadeKcFoXinBNV4pwQxeKcHrXSnB0F0pwbpdKcGoXSnBml0pwY5dKcGEXSnBfV0pwXZdKcFxXSnBbV0pwWpdKcFnXSnBPvslwYj6JcH1+SXBffklwRz5JcHO+CXBjvglwVr4JcEw+CXBDvglwfL3JcHc9yXByvclwbv3JcGv9yXBpvclwZ73JcGX9yXBkvclwY73JcGL9yXBVZYiwXGVIsG4lCLBIZQiwaeTIsFFkyLB9JIiwbOSIsF/kiLBVJIiwTGSIsEVkiLB/5EiweyRIsHdkSLB0ZEiwceRIsG/kSLBuZEiwbORIsGvkSLBrDEfwY0wH8GkLx/B5y4fwU4uH8HSLR/BbS0fwRstH8HZLB/BpCwfwXgsH8FVLB/BOCwfwSEsH8EOLB/B/ysfwfIrH8HoKx/B4CsfwdorH8HUKx/BUc0bwenLG8HEyhvB18kbwRfJG8F7yBvB/McbwZbHG8FDxxvB/8YbwcjGG8GcxhvBeMYbwVvGG8FDxhvBMMYbwSHGG8EUxhvBCsYbwQLGG8H7xRvBWmkYwZVnGMEmZhjB/GQYwQtkGMFHYxjBqGIYwSdiGMG/YRjBamEYwSVhGMHtYBjBwGAYwZxgGMF+YBjBZmAYwVJgGMFDYBjBNmAYwStgGMEjYBjB4AUVwacDFcHaARXBZAAVwTX/FME//hTBd/0UwdX8FMFS/BTB6PsUwZH7FMFL+xTBE/sUweX6FMG/+hTBofoUwYj6FMF1+hTBZPoUwVf6FMFN+hTBAqMRwTigEcH1nRHBIJwRwaOaEcFumRHBc5gRwaiXEcEDlxHBfZYRwRGWEcG5lRHBcZURwTiVEcEJlRHB45QRwcSUEcGrlBHBl5QRwYaUEcF5lBHB6EAOwWk9DsGSOg7BRDgOwWY2DsHiNA7BpzMOwagyDsHZMQ7BMTEOwagwDsE6MA7B4C8OwZgvDsFdLw7BLS8OwQYvDsHnLg7Bzi4OwbkuDsGoLg7Bxd8KwWHbCsHR1wrB7dQKwZTSCsGt0ArBIc8KweHNCsHdzArBCswKwV/LCsHUygrBY8oKwQjKCsG+yQrBgskKwVLJCsEqyQrBCskKwfDICsHbyArB138HwVV6B8HcdQfBO3IHwUlvB8HlbAfB9GoHwWJpB8EbaAfBEmcHwTtmB8GNZQfBAGUHwY1kB8EwZAfB5WMHwahjB8F2YwfBTmMHwS1jB8ETYwfBayEEwYMaBMHmFATBWBAEwaYMBMGmCQTBNgcEwT0FBMGiAwTBVgIEwUgBBMFtAATBu/8DwSz/A8G3/gPBWP4DwQv+A8HN/QPBm/0DwXL9A8FR/QPB48QAwTq8AMExtQDBeq8AwdaqAMESpwDBBKQAwYmhAMGGnwDB5J0AwZGcAMF+mwDBn5oAweqZAMFYmQDB4ZgAwYCYAMEymADB85cAwb+XAMGWlwDBttX6wAjA+sBprvrAF6D6wHaU+sAEi/rAWoP6wCF9+sAVePrA/XP6wKpw+sD4bfrAyWv6wANq+sCTaPrAaGf6wHZm+sCyZfrAE2X6wJJk+sApZPrAACj0wJQM9MCA9vPAjeTzwPfV88AeyvPAgMDzwLG488BbsvPAN63zwAup88CopfPA6aLzwK+g88DhnvPAap3zwDqc88BEm/PAfJrzwNqZ88BWmfPA6oHtwGdf7cBvQ+3A8iztwKoa7cDPC+3Av//swPL17MD+7ezAiufswE3i7MAN3uzAm9rswM/X7MCK1ezAs9PswDXS7MAA0ezABNDswDnP7MCTzuzAUuTmwPS55sDQlubASHrmwGFj5sDDUObAokHmwFg15sBdK+bAQyPmwLAc5sBaF+bABhPmwIMP5sCpDObAWgrmwHoI5sD1BubAugXmwLoE5sDqA+bAQVLgwAMd4MAF8t/AOs7fwCGx38DPmd/A2IbfwG9338Drat/AwWDfwIBY38DOUd/AXkzfwPVH38BiRN/Ae0HfwCA/38A4Pd/AqzvfwGo638BlOd/AJN3ZwDWN2cC9VdnAHyrZwKkF2cD859jAPNDYwOy82MA6rdjAeqDYwB+W2MC3jdjA5YbYwFyB2MDefNjAOXnYwER22MDec9jA7XHYwFlw2MARb9jAvHzTwJYZ08A8yNLAgo7SwEBi0sAcPdLA5R7SwKkG0sD+8tHAAePRwAXW0cB5y9HA6cLRwPa70cBTttHAv7HRwAmu0cAGq9HAlajRwJqm0cD/pNHAFTbNwLC6zMAiVszAVwPMwFPHy8BqmsvAlnTLwNFVy8AYPcvADynLwMcYy8CNC8vAzwDLwBf4ysAD8crAROvKwJvmysDT4srAwt/KwEXdysBB28rAfSTHwA14xsDI+MXApZLFwIc+xcAxAMXAn9LEwBesxMDBjMTAiXPEwCJfxMCNTsTAFEHEwCM2xMBBLcTADCbEwDIgxMByG8TAmBfEwHkUxMDwEcTApY3BwI5pwMBAur/ACze/wB/PvsDOeb7AHjm+wNUKvsCg473At8O9wP6pvcA3lb3AU4S9wJp2vcB2a73AaWK9wBFbvcAbVb3ARVC9wFlMvcAqSb3ABzkwwbs4MMF/ODDBTjgwwSc4MMEHODDB7jcwwdk3MMHJNzDBvDcwwbE3MMGpNzDBojcwwZw3MMGYNzDBlDcwwZE3MMGPNzDBjTcwwYs3MMGKNzDBjtMswS/TLMHi0izBpNIswXPSLMFL0izBKtIswRHSLMH80SzB69Eswd3RLMHT0SzBytEswcPRLMG90SzBudEswbXRLMGy0SzBsNEswa7RLMGs0SzBMW4pwbhtKcFXbSnBCW0pwcpsKcGXbCnBbmwpwU5sKcEzbCnBHmwpwQ1sKcH/aynB9GspwetrKcHkaynB3mspwdprKcHWaynB02spwdBrKcHOaynB9ggmwV0IJsHiBybBfwcmwS8HJsHvBibBvAYmwZIGJsFxBibBVgYmwUAGJsEvBibBIQYmwRYGJsEMBibBBQYmwf8FJsH6BSbB9wUmwfQFJsHxBSbB56MiwSajIsGKoiLBDaIiwaihIsFWoSLBFaEiweCgIsG2oCLBlKAiwXmgIsFjoCLBUaAiwUOgIsE3oCLBLqAiwSagIsEgoCLBG6AiwRigIsEUoCLBED8fwRs+H8FWPR/BtzwfwTc8H8HQOx/BfTsfwTs7H8EFOx/B2jofwbc6H8GbOh/BhTofwXM6H8FkOh/BWTofwU86H8FHOh/BQTofwTw6H8E5Oh/Bf9obwUnZG8FP2BvBhtcbweTWG8Fi1hvB+dUbwaXVG8Fh1RvBKtUbwf7UG8Hb1BvBvtQbwafUG8GV1BvBhtQbwXrUG8Fw1BvBadQbwWLUG8Fd1BvBR3YYwb50GMGCcxjBhHIYwbdxGMEScRjBjXAYwSJwGMHMbxjBh28YwU9vGMEibxjB/m4YweFuGMHKbhjBt24YwahuGMGcbhjBkm4YwYpuGMGEbhjBgBIVwY8QFcH+DhXBvA0VwbgMFcHoCxXBPwsVwbgKFcFLChXB9AkVwa0JFcF0CRXBRgkVwSIJFcEECRXB7AgVwdkIFcHKCBXBvQgVwbMIFcGrCBXBR68RwdKsEcHXqhHBP6kRwfanEcHuphHBGaYRwW2lEcHjpBHBdKQRwRukEcHToxHBmaMRwWujEcFFoxHBJ6MRwQ+jEcH7ohHB66IRwd+iEcHVohHBw0wOwaZJDsElRw7BIEUOwYBDDsExQg7BI0EOwUpADsGcPw7BDz8OwZ4+DsFDPg7B+j0Owb89DsGPPQ7BaT0OwUo9DsExPQ7BHT0OwQ09DsEAPQ7BIusKwTLnCsEG5ArBeOEKwWrfCsHC3QrBbNwKwVrbCsF82grBytkKwTvZCsHI2ArBa9gKwSDYCsHk1wrBs9cKwYzXCsFt1wrBVNcKwUDXCsEv1wrBoooHwaeFB8GjgQfBaH4Hwc17B8G0eQfBBHgHwah2B8GQdQfBr3QHwflzB8FncwfB8XIHwZNyB8FHcgfBCXIHwdhxB8GwcQfBkHEHwXZxB8FicQfBjSsEwUAlBMEtIATBFhwEwcoYBMEjFgTBABQEwUcSBMHlEATBxw8EweEOBMEoDgTBkw0EwRsNBMG7DATBbQwEwS8MBMH8CwTB1AsEwbMLBMGZCwTBQ84AwU3GAMHivwDBtboAwYq2AMEuswDBerAAwUyuAMGLrADBIasAwf6pAMEUqQDBWKgAwcCnAMFGpwDB46YAwZSmAMFUpgDBIaYAwfilAMHXpQDBy+b6wKLS+sBswvrAWbX6wNCq+sBSovrAe5v6wPmV+sCJkfrA9o36wBaL+sDFiPrA6Ib6wGiF+sAzhPrAOoP6wHGC+sDQgfrAToH6wOaA+sCSgPrAVzf0wI0d9MD3CPTAcvjzwB/r88Bi4PPAutfzwMHQ88Aky/PAnsbzwPrC88ALwPPAr73zwMi788BBuvPABbnzwAi488A8t/PAl7bzwBO288CotfPAH4/twJNu7cBMVO3ARz/twHAu7cDcIO3A6hXtwBgN7cD9Be3AQwDtwKf77MDx9+zA9PTswIzy7MCc8OzADe/swMvt7MDJ7OzA+OvswFHr7MDK6uzAQu/mwP3G5sDPpebACIvmwJN15sBqZObAk1bmwGtL5sBtQubALzvmwFk15sCmMObA3SzmwNEp5sBdJ+bAZCXmwM0j5sCGIubAfiHmwKog5sD/H+bA31zgwMIn4MDf/t/ADt3fwMTB38Dcq9/AX5rfwESM38DlgN/Au3ffwFlw38Bmat/AnGXfwMFh38CmXt/AJlzfwCJa38CEWN/ANlffwClW38BRVd/Az+TZwJWX2cBKYNnAxzbZwE8U2cCA+NjAJOLYwFHQ2MDxwdjAWrbYwAOt2MB8pdjAbJ/YwIqa2MCcltjAcpPYwOWQ2MDYjtjAMY3YwN2L2MDLitjAlYHTwAMh08Bd0tLA3ZjSwLdu0sCVS9LAPy/SwGwY0sBCBtLAm/fRwMvr0cBG4tHAmtrRwGzU0cByz9HAccvRwDbI0cCdxdHAhsPRwNfB0cB8wNHA2jjNwFO/zMBRXczAOA3MwHzRy8CwpsvA4ILLwAFmy8C2TsvAMjzLwEQty8A5IcvAhRfLwLQPy8BnCcvAVQTLwD8Ay8D1/MrAT/rKwC74ysB29srAQiXHwJ96xsA0/cXAmJnFwClIxcAnCsXAst7EwDO6xMDHnMTAA4XEwCNyxMDrYsTAplbEwMJMxMDKRMTAXj7EwDM5xMAJNcTArjHEwPsuxMDPLMTApY3BwDVqwMCivL/AQTu/wNfVvsAxg77A4UK+wLoWvsCN8b3AktO9wFq7vcAVqL3Akpi9wBGMvcD8gb3A3Xm9wFJzvcAMbr3Azmm9wGNmvcCjY73AKEYwwepFMMG5RTDBkkUwwXJFMMFZRTDBRUUwwTVFMMEoRTDBHkUwwRZFMMEPRTDBCkUwwQZFMMEDRTDBAEUwwf5EMMH8RDDB+0QwwfpEMMH5RDDBneAswU/gLMEQ4CzB3d8swbXfLMGV3yzBfN8swWffLMFX3yzBSt8swT/fLME33yzBMN8swSvfLMEn3yzBJN8swSHfLMEf3yzBHd8swRzfLMEa3yzBKnspwcZ6KcF1einBNXopwQJ6KcHZeSnBuHkpwZ55KcGJeSnBeXkpwWx5KcFheSnBWHkpwVJ5KcFMeSnBSHkpwUR5KcFCeSnBP3kpwT55KcE8eSnB1RUmwVUVJsHuFCbBnBQmwVsUJsEnFCbB/RMmwdwTJsHBEybBrBMmwZsTJsGNEybBghMmwXoTJsFzEybBbRMmwWkTJsFlEybBYhMmwWATJsFeEybBprAiwQKwIsGAryLBF68iwcSuIsGBriLBS64iwSGuIsH/rSLB5K0iwc6tIsG9rSLBr60iwaStIsGbrSLBlK0iwY6tIsGKrSLBhq0iwYOtIsGBrSLBqEsfwddKH8EwSh/Bq0kfwUBJH8HrSB/Bp0gfwXBIH8FFSB/BIkgfwQdIH8HwRx/B30cfwdFHH8HFRx/BvEcfwbVHH8GvRx/Bq0cfwadHH8GkRx/B6eYbwd7lG8EI5RvBXuQbwdbjG8Fp4xvBEuMbwc3iG8GV4hvBaeIbwUbiG8Ep4hvBE+IbwQHiG8Hy4RvB5+Ebwd7hG8HW4RvB0OEbwczhG8HI4RvBeYIYwSSBGMEUgBjBOn8YwYx+GMEBfhjBkn0YwTp9GMHzfBjBunwYwY18GMFpfBjBTHwYwTV8GMEjfBjBFHwYwQh8GMH/exjB93sYwfF7GMHtexjBbh4VwbscFcFgGxXBShoVwWwZFcG7GBXBLRgVwbwXFcFhFxXBGRcVwd8WFcGxFhXBjBYVwW8WFcFYFhXBRRYVwTYWFcEqFhXBIBYVwRkWFcETFhXB5boRwbq4EcH+thHBnLURwYC0EcGesxHB6bIRwVmyEcHlsRHBibERwT+xEcEFsRHB1rARwbCwEcGSsBHBerARwWewEcFYsBHBS7ARwUKwEcE6sBHBAlgOwT1VDsEHUw7BQlEOwdlPDsG4Tg7B0U0OwRhNDsGFTA7BD0wOwbFLDsFmSw7BKksOwfpKDsHUSg7BtUoOwZ1KDsGJSg7BeUoOwW1KDsFjSg7B8PUKwWnyCsGW7wrBVO0KwYfrCsEW6grB7+gKwQToCsFH5wrBseYKwTnmCsHZ5QrBjOUKwU/lCsEe5QrB9+QKwdjkCsG/5ArBq+QKwZvkCsGP5ArB7JQHwWuQB8HRjAfB8IkHwaOHB8HMhQfBVIQHwSeDB8E3ggfBd4EHwd6AB8FjgAfBAYAHwbN/B8F1fwfBQ38HwRt/B8H7fgfB4n4Hwc1+B8G9fgfBPTUEwX8vBMHnKgTBOycEwUskBMHyIQTBEiAEwZIeBMFgHQTBaxwEwacbBMEKGwTBjhoEwSoaBMHaGQTBmhkEwWcZBME/GQTBHhkEwQQZBMHwGATBQdcAwe/PAMEUygDBZcUAwabBAMGovgDBQ7wAwVm6AMHRuADBmbcAwZ+2AMHXtQDBOLUAwbi0AMFStADBAbQAwcCzAMGMswDBY7MAwUGzAMEnswDBcPf6wILk+sCR1frAosn6wBfA+sB0uPrAWrL6wHmt+sCSqfrAdKb6wPej+sD6ofrAY6D6wB2f+sAanvrASp36wKSc+sAgnPrAtpv6wGKb+sAem/rAKEb0wA8u9MDAGvTAewv0wFD/88CT9fPAyu3zwJDn88CW4vPAnN7zwG7b88Dk2PPA3NbzwD3V88Dx0/PA6NLzwBXS88Bs0fPA5dDzwHnQ88Ai0PPA8pvtwDt97cCpZO3A+FDtwF1B7cD0NO3ABivtwBUj7cC7HO3AqBftwJkT7cBbEO3AxA3twLIL7cAKCu3AuAjtwKoH7cDSBu3AJQbtwJwF7cAtBe3A5/nmwKLT5sBOtObAP5vmwCuH5sA6d+bAkWrmwHBg5sBXWObA3VHmwK9M5sCMSObAPUXmwJlC5sB8QObAzD7mwHM95sBfPObAgzvmwNM65sBGOubAQ2fgwDgy4MBXC+DAYuvfwNXR38Bbvd/AEa3fwCig38DUld/AkY3fwPaG38Cugd/AdX3fwBZ638Bkd9/APHXfwINz38Ajct/ACnHfwCpw38B2b9/AWOzZwLyh2cCRatnAEEPZwHki2cBrCNnAifPYwOXi2MC71djAMsvYwMXC2MAIvNjApbbYwFey2MDmrtjAJqzYwPOp2MAyqNjAy6bYwKyl2MDHpNjAXYbTwE8o08BH3NLA9KLSwNJ60sCVWdLAAj/SwLcp0sC4GNLASgvSwIsA0sDz99HAFPHRwJXr0cAx59HAr+PRwOHg0cCj3tHA2dzRwGrb0cBG2tHAmTvNwObDzMBhZMzA5hbMwGLby8CbssvAuJDLwJ11y8DmX8vAiU7LwNdAy8DiNcvAHi3LwBsmy8CBIMvABhzLwHIYy8CVFcvATBPLwHgRy8ADEMvABSbHwC19xsCSAcbAbqDFwJpRxcDdE8XAburEwOHHxMA7rMTAFpbEwFqExMBjdsTANWvEwEVixMAfW8TAZ1XEwNZQxMAvTcTARErEwO9HxMASRsTApY3BwNtqwMD/vr/Aaz+/wHTcvsBkjL7AZ0y+wEkivsAS/73A3eK9wEnMvcAyur3A7qu9wIigvcBql73AH5C9wEuKvcCihb3A6IG9wO5+vcCNfL3AeFIwwUVSMMEdUjDB/VEwweRRMMHQUTDBwFEwwbRRMMGqUTDBolEwwZxRMMGXUTDBk1EwwZBRMMGNUTDBi1EwwYpRMMGIUTDBh1EwwYdRMMGGUTDB3uwswZ3sLMFq7CzBQewswSDsLMEH7CzB8ussweLrLMHV6yzBy+sswcPrLMG96yzBuOsswbTrLMGw6yzBrusswazrLMGq6yzBqesswajrLMGn6yzBWYcpwQWHKcHDhinBjoYpwWWGKcFEhinBKYYpwRSGKcEEhinB94Upwe2FKcHkhSnB3oUpwdmFKcHVhSnB0YUpwc+FKcHNhSnBy4UpwcqFKcHJhSnB7iEmwYIhJsEtISbB6SAmwbMgJsGIICbBZyAmwUwgJsE3ICbBJiAmwRkgJsEOICbBBiAmwf8fJsH6HybB9h8mwfIfJsHwHybB7R8mwewfJsHrHybBpLwiwRm8IsGruyLBVLsiwQ+7IsHYuiLBrLoiwYq6IsFvuiLBWboiwUi6IsE6uiLBL7oiwSe6IsEguiLBG7oiwRa6IsETuiLBELoiwQ66IsENuiLBhVcfwdJWH8FFVh/B1FUfwXtVH8E1VR/B/VQfwdFUH8GtVB/BkVQfwXtUH8FqVB/BXFQfwVFUH8FIVB/BQVQfwTxUH8E3VB/BNFQfwTFUH8EvVB/BnfIbwbfxG8EB8RvBcPAbwf7vG8Gj7xvBW+8bwSLvG8H17hvB0e4bwbTuG8Ge7hvBjO4bwX7uG8Fy7hvBae4bwWLuG8Fd7hvBWO4bwVXuG8FS7hvB/I0YwdSMGMHqixjBMIsYwZyKGMEoihjBy4kYwYGJGMFHiRjBGYkYwfSIGMHXiBjBwIgYwa6IGMGfiBjBlIgYwYuIGMGEiBjBfogYwXmIGMF2iBjBtykVwTooFcENJxXBHSYVwV8lFcHJJBXBUSQVwfMjFcGoIxXBbCMVwT0jFcEYIxXB+iIVweMiFcHQIhXBwSIVwbUiFcGsIhXBpSIVwZ8iFcGaIhXB58URwf7DEcF5whHBRcERwVHAEcGPvxHB9b4RwXu+EcEbvhHBzr0RwZK9EcFhvRHBO70RwR29EcEFvRHB8rwRweO8EcHXvBHBzbwRwca8EcHAvBHBr2IOwTlgDsFFXg7BuFwOwX5bDsGFWg7Bv1kOwSJZDsGmWA7BQ1gOwfVXDsG3Vw7BhlcOwV9XDsFAVw7BJ1cOwRRXDsEFVw7B+FYOwe9WDsHnVg7BOQALwQ79CsGL+grBjfgKwfj2CsG49QrBufQKwe/zCsFP8wrB0PIKwWzyCsEc8grB3PEKwarxCsGD8QrBY/EKwUrxCsE28QrBJvEKwRrxCsEQ8QrBvJ4HwaqaB8FvlwfB35QHwdaSB8E5kQfB8o8Hwe6OB8EgjgfBfI0HwfuMB8GUjAfBQ4wHwQKMB8HPiwfBposHwYaLB8FtiwfBWIsHwUiLB8E8iwfBhz4EwUU5BMEdNQTB0TEEwTMvBMEgLQTBeisEwSwqBMEjKQTBUSgEwaonBMEmJwTBvSYEwWomBMEoJgTB9CUEwcolBMGpJQTBjyUEwXslBMFqJQTBBuAAwS/ZAMHQ0wDBks8AwTXMAMGJyQDBa8cAwbzFAMFnxADBWcMAwYLCAMHYwQDBUcEAwebAAMGRwADBTsAAwRjAAMHuvwDBzL8AwbK/AMGdvwDBdgf7wOv1+sD65/rA/9z6wFnU+sB8zfrACsj6wLjD+sBKwPrAkr36wGu7+sC1ufrAWrj6wEa3+sBstvrAv7X6wDa1+sDJtPrAc7T6wC+0+sD4s/rAeVT0wPM99MAMLPTA0R30wJYS9MDDCfTAwgL0wDP988DK+PPASvXzwITy88BR8PPAku7zwC/t88AX7PPAOOvzwIfq88D76fPAjOnzwDTp88Du6PPAYajtwGmL7cBrdO3AJWLtwKBT7cAkSO3AIj/twPw37cBQMu3Azy3twD0q7cBoJ+3AKSXtwGEj7cD4Ie3A2SDtwPUf7cBBH+3Ash7twEEe7cDnHe3ARATnwOff5sBXwubA36rmwDmY5sBoiebAqn3mwHh05sAsbebAYmfmwMpi5sAlX+bAQVzmwPZZ5sAlWObAs1bmwI9V5sCnVObA71PmwF1T5sDpUubAbXHgwGg84MBvF+DARvnfwFHh38BKzt/AKr/fwCmz38DHqd/AVaLfwGyc38C7l9/AA5TfwBCR38C5jt/A3ozfwGWL38A6it/ATYnfwJGI38D8h9/Av/PZwKyr2cCTdNnA/U7ZwDcw2cDDF9nAWATZwOn02MCn6NjAEN/YwHbX2MBu0djApczYwNnI2MDWxdjAcsPYwI7B2MANwNjA3L7YwOq92MAqvdjAFovTwHwv08D85dLAyKzSwJKG0sAsZ9LANU7SwGU60sClKtLAIh7SwFQU0sCSDNLAagbSwIgB0sCo/dHAlfrRwCX40cA29tHArfTRwHbz0cB/8tHAUj7NwGrIzMBTa8zAYCDMwAnly8AuvsvAJZ7LwKuEy8BzcMvAYGDLwJtTy8CUScvAqkHLwGE7y8BlNsvAcDLLwE0vy8DQLMvA1yrLwEYpy8AIKMvAyCbHwLV/xsDiBcbAJ6fFwNlaxcClHcXA1PXEwCXVxMAju8TAgabEwBqWxMATicTA0n7EwL12xMBUcMTAPWvEwDRnxMAAZMTAdmHEwHJfxMDZXcTApY3BwIFrwMBXwb/Ah0O/wPXivsBolb7A/Va+wIQtvsArDL7AoPG9wJLcvcDWy73Aib69wA60vcDPq73AQ6W9wBKgvcDzm73Arpi9wBeWvcAIlL3AB14wwd5dMMG9XTDBpF0wwZBdMMGAXTDBc10wwWldMMFiXTDBXF0wwVddMMFTXTDBUF0wwU5dMMFMXTDBSl0wwUldMMFIXTDBSF0wwUddMMFHXTDBYvgswSz4LMEC+CzB4fcswcb3LMGy9yzBovcswZX3LMGL9yzBg/cswX33LMF49yzBdPcswXH3LMFv9yzBbfcswWv3LMFq9yzBafcswWj3LMFo9yzBzpIpwYiSKcFRkinBJpIpwQSSKcHpkSnB1JEpwcSRKcG2kSnBrJEpwaSRKcGekSnBmZEpwZWRKcGSkSnBj5EpwY2RKcGMkSnBi5EpwYqRKcGJkSnBUC0mwfUsJsGuLCbBdiwmwUosJsEnLCbBDCwmwfYrJsHlKybB2Csmwc4rJsHFKybBvysmwborJsG2KybBsysmwbArJsGuKybBrSsmwasrJsGqKybB78ciwXnHIsEdxyLB1MYiwZvGIsFuxiLBSsYiwS/GIsEZxiLBB8YiwfrFIsHvxSLB58UiweDFIsHbxSLB18UiwdPFIsHRxSLBz8Uiwc3FIsHMxSLBs2IfwRtiH8GjYR/BRWEfwftgH8HAYB/BkmAfwW5gH8FRYB/BO2AfwSlgH8EbYB/BEWAfwQhgH8EBYB/B/F8fwfhfH8H0Xx/B8l8fwfBfH8HuXx/Bqf0bweP8G8FI/BvBzfsbwW37G8Eh+xvB5fobwbb6G8GR+hvBdPobwV36G8FL+hvBPfobwTL6G8Ep+hvBIvobwR36G8EZ+hvBFfobwRP6G8EQ+hvB3pgYwd6XGMEUlxjBdZYYwfiVGMGVlRjBSJUYwQuVGMHblBjBtZQYwZeUGMGAlBjBbZQYwV+UGMFTlBjBSpQYwUOUGME+lBjBOpQYwTaUGMEzlBjBZTQVwRgzFcESMhXBRDEVwaIwFcEiMBXBvS8VwW4vFcEwLxXB/y4VwdguFcG6LhXBoi4VwY8uFcGBLhXBdS4VwWwuFcFlLhXBXy4VwVouFcFXLhXBV9ARwafOEcFTzRHBSMwRwXXLEcHPyhHBTcoRwebJEcGVyRHBVskRwSPJEcH8yBHB3cgRwcXIEcGxyBHBosgRwZbIEcGNyBHBhsgRwYDIEcF7yBHB02wOwaNqDsHqaA7Bj2cOwX1mDsGmZQ7B/WQOwXhkDsEPZA7BvGMOwXtjDsFIYw7BIGMOwQBjDsHnYg7B1GIOwcRiDsG4Yg7BrmIOwadiDsGhYg7BCAoLwSwHC8HwBAvBLQMLwcsBC8G0AAvB2P8KwSv/CsGj/grBOP4KweP9CsGh/QrBbf0KwUT9CsEj/QrBCv0Kwfb8CsHm/ArB2vwKwdD8CsHI/ArBMagHwXOkB8GGoQfBPp8HwXKdB8EHnAfB6poHwQqaB8FZmQfBzpgHwWGYB8EKmAfBx5cHwZGXB8FnlwfBRpcHwSyXB8EYlwfBCJcHwfuWB8HxlgfBi0cEwbFCBMHfPgTB4TsEwYw5BMG3NwTBRTYEwSE1BME8NATBiDMEwfoyBMGKMgTBMjIEwe0xBMG2MQTBizEEwWoxBMFPMQTBOjEEwSoxBMEdMQTBcOgAwSjiAME03QDBTdkAwT7WAMHc0wDB/NEAwYLQAMFZzwDBb84AwbbNAMElzQDBs8wAwVnMAMETzADB28sAwa/LAMGNywDBcssAwVzLAMFMywDB5Bb7wKEG+8DP+frAtO/6wL3n+sB84frAoNz6wMzY+sDJ1frAatP6wIzR+sAU0PrA7M76wAPO+sBMzfrAu8z6wErM+sDwy/rAqsv6wHPL+sBHy/rAWWL0wEJN9MCnPPTAjy/0wD0l9MAaHfTAsxb0wLwR9MDUDfTAwAr0wFQI9MBsBvTA7AT0wL4D9MDQAvTAFAL0wIEB9MANAfTAsgD0wGoA9MAxAPTAcLTtwCWZ7cCZg+3ApXLtwEZl7cC7Wu3AbFLtwOFL7cDMRu3Az0LtwKo/7cAxPe3APjvtwLY57cCBOO3AjjftwM827cA4Nu3AwjXtwGU17cAbNe3AWw7nwM3r5sDvz+bA7bnmwJyo5sD0mubAMJDmwLWH5sAGgebA0XvmwL535sCIdObAAXLmwARw5sB0bubAOG3mwEBs5sB9a+bA42rmwGpq5sALaubAX3vgwFNG4MAsI+DAuAbgwD7w38CP3t/AndDfwJ/F38D1vN/AIrbfwM2w38CkrN/AXKnfwMim38DApN/AJqPfwOSh38DnoN/AH6DfwIKf38AHn9/ABfvZwGa12cBTftnAkFrZwIM92cCQJtnAgBTZwEIG2cAI+9jAL/LYwDbr2MDB5djAgeHYwCje2MCF29jActnYwNDX2MCH1tjAhNXYwLjU2MAY1NjAv4/TwIk208B979LADLfSwPuR0sBRdNLA4lzSwG5K0sDkO9LAbDDSwGMn0sBEINLArxrSwFcW0sDsEtLAOxDSwBwO0sBxDNLAIQvSwBkK0sBJCdLABUHNwODMzMAocszAqCnMwA3wy8BtycvAJKvLwDeTy8BdgMvAg3HLwM5ly8CTXMvATlXLwJdPy8AoS8vAqkfLwOpEy8DAQsvADEHLwLQ/y8CmPsvAiyfHwDiCxsAkCsbAxK3FwOhjxcAdKcXA5wDFwPzhxMCOycTATbbEwCOnxMAtm8TAwZHEwFSKxMB7hMTA83/EwGJ8xMCTecTAXXfEwKB1xMBBdMTApY3BwCZswMCrw7/Al0e/wFvpvsA+nr7APmK+wGw4vsDbGL7A6f+9wD/svcDC3L3AjNC9wOzGvcBXv73AXbm9wLu0vcAWsb3AOK69wParvcAvqr3A52gwwcVoMMGraDDBlmgwwYZoMMF6aDDBcGgwwWhoMMFiaDDBXWgwwVpoMMFXaDDBVWgwwVNoMMFRaDDBUGgwwU9oMMFPaDDBTmgwwU5oMMFOaDDBOAMtwQsDLcHpAi3BzgItwbkCLcGoAi3BmwItwZECLcGJAi3BgwItwX4CLcF6Ai3BeAItwXUCLcFzAi3BcgItwXECLcFwAi3BbwItwW8CLcFvAi3Bl50pwV2dKcEwnSnBDJ0pwfCcKcHbnCnBypwpwb2cKcGynCnBqpwpwaScKcGfnCnBm5wpwZicKcGWnCnBlJwpwZOcKcGSnCnBkZwpwZCcKcGQnCnBCzgmwb03JsGCNybBVDcmwS83JsETNybB/TYmwew2JsHeNibB1DYmwcw2JsHFNibBwDYmwbw2JsG5NibBtzYmwbU2JsG0NibBsjYmwbI2JsGxNibBmNIiwTPSIsHk0SLBp9EiwXjRIsFT0SLBNtEiwR/RIsEO0SLBANEiwfXQIsHt0CLB5tAiweHQIsHd0CLB2tAiwdjQIsHW0CLB1NAiwdPQIsHS0CLBR20fwcNsH8FbbB/BC2wfwc1rH8Gcax/BdmsfwVlrH8FCax/BMGsfwSJrH8EXax/BDmsfwQdrH8ECax/B/mofwftqH8H4ah/B9mofwfVqH8H0ah/BIggcwXUHHMHuBhzBhAYcwTIGHMHyBRzBwQUcwZoFHMF8BRzBZAUcwVIFHMFDBRzBOAUcwS8FHMEpBRzBIwUcwR8FHMEcBRzBGQUcwRcFHMEWBRzBNqMYwVSiGMGjoRjBGaEYwa2gGMFZoBjBGKAYweWfGMG+nxjBn58YwYefGMF0nxjBZZ8YwVqfGMFRnxjBSp8YwUSfGMFAnxjBPZ8YwTqfGME4nxjBlj4VwW49FcGGPBXB0jsVwUQ7FcHWOhXBgDoVwT06FcEKOhXB4TkVwcI5FcGpORXBljkVwYc5FcF7ORXBcjkVwWs5FcFlORXBYTkVwV45FcFbORXBWNoRwdTYEcGm1xHBudYRwQDWEcFw1RHB/9QRwafUEcFj1BHBLtQRwQXUEcHl0xHBzNMRwbjTEcGp0xHBndMRwZPTEcGM0xHBhtMRwYLTEcF+0xHBmnYOwZ90DsETcw7B3nEOwexwDsEwcA7BnG8OwSlvDsHPbg7BiW4OwVNuDsEpbg7BCG4Owe5tDsHabQ7By20Owb5tDsG1bQ7BrW0OwadtDsGjbQ7BhBMLwe0QC8HoDgvBUw0LwRcMC8EgCwvBXwoLwcgJC8FTCQvB9wgLwa8IC8F4CAvBTQgLwSsIC8ERCAvB/AcLwewHC8HgBwvB1gcLwc4HC8HIBwvBSbEHweetB8FCqwfBMakHwZSnB8FQpgfBVKUHwY+kB8H1owfBfKMHwR6jB8HVogfBnaIHwXGiB8FPogfBNKIHwR+iB8EOogfBAaIHwfehB8HwoQfBLFAEwcFLBMFMSATBmEUEwXtDBMHVQQTBikAEwYg/BMG/PgTBIT4Ewac9BMFGPQTB/DwEwcI8BMGVPATBcjwEwVY8BMFBPATBMDwEwSM8BMEZPATBhfAAwb/qAME65gDBsuIAwe/fAMHG3QDBFtwAwcXaAMG92QDB79gAwU7YAMHR1wDBb9cAwSLXAMHn1gDBudYAwZXWAMF51gDBY9YAwVLWAMFF1gDBxiX7wK4W+8DkCvvAqgH7wHP6+sDQ9PrAZ/D6wPXs+sBE6vrAKuj6wIXm+sA95frAPOT6wHPj+sDX4vrAXeL6wP/h+sC24frAfeH6wFDh+sAt4frAwm/0wAhc9MCbTPTAjkD0wCE39MDBL/TA/in0wH0l9MD3IfTANx/0wBEd9MBjG/TAExr0wA0Z9MBAGPTAoBf0wCMX9MDBFvTAdhb0wDwW9MAOFvTAI8DtwGym7cBEku3Af4LtwC527cCMbO3AA2XtwB9f7cCEWu3A61btwBtU7cDpUe3AMlDtwNpO7cDOTe3A/UztwFlM7cDZS+3AdkvtwChL7cDrSu3AhRjnwFj35sAT3ebAesjmwFu45sDGq+bA7qHmwDua5sA1lObAgY/mwNOL5sD0iObAtYbmwPSE5sCVg+bAg4LmwK2B5sAGgebAg4DmwB2A5sDNf+bAGoXgwDFR4MCRLuDAuRPgwK7+38Az7t/AV+HfwEjX38Bpz9/AQsnfwHPE38CxwN/Awb3fwHa738Crud/ARLjfwCy338BRtt/AprXfwCG138C5tN/AKwLawOq+2cDmidnAzWXZwGBK2cDgNNnACCTZwOQW2cCcDNnAkQTZwEj+2MBd+djAhvXYwIby2MAt8NjAWO7YwOrs2MDL69jA7OrYwD3q2MC16djAWJTTwHg908DM+NLApsLSwA+d0sAKgdLAEmvSwNxZ0sBtTNLA60HSwLQ50sBHM9LAQS7SwFQq0sBCJ9LA3STSwP0i0sCHIdLAYiDSwH0f0sDLHtLAs0PNwEfRzMDfeMzAwDLMwHP7y8BZ1MvAuLfLwEahy8Cwj8vA9IHLwDd3y8DRbsvAQGjLwB5jy8AbX8vA+FvLwIVZy8CbV8vAHFbLwPFUy8AIVMvATCjHwLaExsBZDsbARrTFwMlsxcBONMXAqwvFwGvuxMB818TAhMXEwHq3xMCBrMTA7KPEwDadxMD3l8TA3ZPEwKmQxMAojsTAM4zEwKyKxMB6icTApY3BwMtswMD6xb/Amku/wKjvvsDopr7AOm2+wAZDvsAlJb7Atg2+wFr7vcAA7b3AyuG9wATZvcAp0r3AzMy9wJvIvcBVxb3AxsK9wMbAvcA2v73AUHMwwTRzMMEeczDBDXMwwQBzMMH2cjDB7nIwwehyMMHjcjDB33IwwdxyMMHacjDB2HIwwddyMMHWcjDB1XIwwdVyMMHUcjDB1HIwwdNyMMHTcjDBmQ0twXQNLcFXDS3BQA0twS8NLcEhDS3BFw0twQ8NLcEJDS3BBA0twQANLcH9DC3B+wwtwfkMLcH4DC3B9wwtwfYMLcH1DC3B9QwtwfQMLcH0DC3B7qcpwb2nKcGXpynBeqcpwWOnKcFRpynBQ6cpwTinKcEwpynBKqcpwSWnKcEhpynBHqcpwRynKcEapynBGKcpwRenKcEWpynBFqcpwRWnKcEVpynBVUImwRRCJsHiQSbBu0EmwZxBJsGFQSbBc0EmwWVBJsFaQSbBUUEmwUtBJsFGQSbBQkEmwT9BJsE8QSbBO0EmwTlBJsE4QSbBN0EmwTZBJsE2QSbB0twiwXzcIsE63CLBBtwiwd7bIsG/2yLBp9siwZXbIsGG2yLBe9siwXPbIsFs2yLBZ9siwWPbIsFg2yLBXdsiwVvbIsFa2yLBWdsiwVjbIsFX2yLBbHcfwft2H8Gjdh/BX3YfwSt2H8ECdh/B4nUfwcp1H8G3dR/BqHUfwZ11H8GUdR/BjXUfwYh1H8GEdR/BgHUfwX51H8F8dR/Be3UfwXl1H8F4dR/BLRIcwZgRHMEkERzByxAcwYUQHMFQEBzBJhAcwQYQHMHsDxzB2Q8cwcoPHMG+DxzBtQ8cwa4PHMGpDxzBpQ8cwaEPHMGfDxzBnQ8cwZsPHMGaDxzBIa0YwVysGMHEqxjBTqsYwfKqGMGrqhjBdKoYwUqqGMEpqhjBD6oYwfupGMHsqRjB4KkYwdepGMHPqRjByqkYwcWpGMHCqRjBwKkYwb6pGMG8qRjBWEgVwVVHFcGMRhXB8UUVwXhFFcEaRRXB0kQVwZlEFcFuRBXBTEQVwTJEFcEdRBXBDkQVwQFEFcH4QxXB8UMVwetDFcHmQxXB40MVweBDFcHeQxXB6eMRwZPiEcGK4RHBveARwR3gEcGi3xHBQt8RwfjeEcG+3hHBkt4RwW/eEcFU3hHBQN4RwS/eEcEj3hHBGd4RwRLeEcEM3hHBB94RwQTeEcEB3hHB7n8OwSx+DsHOfA7Bv3sOwe16DsFKeg7BzHkOwWp5DsEeeQ7B43gOwbZ4DsGSeA7Bd3gOwWJ4DsFReA7BRHgOwTt4DsEzeA7BLXgOwSh4DsEleA7BjhwLwTwaC8FwGAvBChcLwfUVC8EeFQvBeBQLwfcTC8GSEwvBRRMLwQkTC8HaEgvBthILwZoSC8GEEgvBcxILwWYSC8FcEgvBVBILwU4SC8FJEgvB+rkHweu2B8GLtAfBtLIHwUexB8EssAfBUK8HwaWuB8EhrgfBu60HwWytB8EurQfB/qwHwdmsB8G9rAfBpqwHwZWsB8GIrAfBfawHwXWsB8FvrAfBcVgEwWlUBMFJUQTB3E4EwfpMBMGESwTBYkoEwYJJBMHTSATBTEgEweRHBMGSRwTBU0cEwSNHBMH9RgTB30YEwclGBMG3RgTBqUYEwZ9GBMGXRgTBS/gAwfnyAMHb7gDBqOsAwS3pAMFA5wDBwuUAwZrkAMG04wDBAuMAwXfiAMEM4gDBueEAwXnhAMFH4QDBIOEAwQLhAMHr4ADB2eAAwcvgAMHA4ADBIjT7wCAm+8BBG/vA1hL7wE4M+8A8B/vATQP7wEAA+8Di/frADfz6wKH6+sCG+frAq/j6wAL4+sB+9/rAGPf6wMn2+sCM9vrAXPb6wDf2+sAb9vrAt3z0wEpq9MD3W/TA2FD0wDxI9MCNQfTAXjz0wFk49MA6NfTAzjL0wO4w9MB6L/TAWS70wHkt9MDMLPTARSz0wN0r9MCMK/TATSv0wBwr9MD3KvTAe8vtwEGz7cBpoO3AxJHtwGSG7cCWfe3AwHbtwHNx7cBWbe3AJWrtwKxn7cDBZe3ARGTtwBxj7cA3Yu3AhmHtwPxg7cCRYO3AP2DtwP9f7cDNX+3AaSTnwIwC58DI6ebAg9bmwInH5sDnu+bA5bLmwOmr5sB8pubAR6LmwASf5sB8nObAhprmwACZ5sDSl+bA6JbmwDOW5sCmlebAOZXmwOSU5sCilObAn47gwOVc4MCfOeDATSDgwJoM4MBJ/d/AZPHfwC3o38AI4d/AfNvfwC/X38DY09/AQtHfwEDP38Cyzd/AfczfwI3L38DTyt/ARMrfwNTJ38B9yd/AMQnawDvI2cBpldnAtnDZwNNW2cCuQtnABjPZwNsm2cBuHdnAHxbZwHQQ2cANDNnApAjZwP4F2cDwA9nAWQLZwB0B2cAoANnAav/YwNf+2MBl/tjA4pjTwEhE08DoAdPA983SwNKn0sBajdLAwnjSwL9o0sBPXNLAqlLSwDFL0sBkRdLA5EDSwGc90sCyOtLAmTjSwPg20sC1NdLAujTSwPgz0sBhM9LAW0bNwKDVzMB5f8zApzvMwJIGzMD13svA5sPLwNeuy8B4nsvAwJHLwOOHy8A+gMvAUHrLwLZ1y8AkcsvAX2/LwDpty8CQa8vARWrLwEVpy8B+aMvADSnHwC+HxsCBEsbArLrFwHt1xcA7P8XAIBbFwHb6xMDv5MTAMdTEwDDHxMAYvcTASLXEwDevxMCCqsTA3KbEwAekxMDVocTAIaDEwM+exMDJncTApY3BwG9twMBFyL/AkU+/wNr1vsBlr77A9He+wFRNvsANMb7AChu+wOwJvsCf/L3ATfK9wE/qvcAb5L3AS9+9wI/bvcCq2L3Aa9a9wK3UvcBU073AJH0wwQ19MMH7fDDB7XwwweN8MMHbfDDB1HwwwdB8MMHMfDDByXwwwcd8MMHFfDDBxHwwwcN8MMHCfDDBwXwwwcF8MMHBfDDBwHwwwcB8MMHAfDDBZhctwUcXLcEvFy3BHRctwQ8XLcEEFy3B/BYtwfUWLcHxFi3B7RYtweoWLcHoFi3B5hYtweUWLcHkFi3B4xYtweIWLcHiFi3B4RYtweEWLcHhFi3BsrEpwYmxKcFqsSnBUrEpwT+xKcExsSnBJrEpwR2xKcEXsSnBErEpwQ6xKcELsSnBCLEpwQexKcEFsSnBBLEpwQOxKcEDsSnBArEpwQKxKcECsSnBDkwmwddLJsGtSybBjUsmwXRLJsFhSybBUksmwUdLJsE+SybBOEsmwTJLJsEvSybBK0smwSlLJsEnSybBJksmwSVLJsEkSybBI0smwSNLJsEjSybBfOYiwTTmIsH85SLB0eUiwbDlIsGX5SLBg+UiwXTlIsFp5SLBYOUiwVnlIsFU5SLBT+UiwUzlIsFK5SLBSOUiwUflIsFG5SLBReUiwUTlIsFE5SLBBIEfwaSAH8FagB/BIYAfwfV/H8HTfx/BuX8fwaV/H8GWfx/Bin8fwYF/H8F6fx/BdX8fwXB/H8Ftfx/Ba38fwWl/H8Fnfx/BZn8fwWV/H8Flfx/BrxscwS8bHMHMGhzBgBocwUYaHMEZGhzB9hkcwdwZHMHHGRzBuBkcwawZHMGiGRzBmxkcwZYZHMGRGRzBjhkcwYwZHMGKGRzBiBkcwYcZHMGGGRzBh7YYwd21GMFZtRjB9bQYwae0GMFrtBjBPbQYwRq0GMH/sxjB6rMYwdqzGMHNsxjBxLMYwbyzGMG3sxjBsrMYwa+zGMGssxjBqrMYwamzGMGosxjBnFEVwblQFcELUBXBhE8VwR1PFcHOThXBkE4VwWFOFcE9ThXBIU4VwQxOFcH7TRXB700VweVNFcHdTRXB2E0VwdNNFcHQTRXBzU0VwctNFcHKTRXBAO0RwdPrEcHr6hHBOeoRwa/pEcFG6RHB9OgRwbboEcGG6BHBYegRwUToEcEu6BHBHegRwRDoEcEG6BHB/+cRwfnnEcH05xHB8ecRwe7nEcHs5xHB0IgOwUCHDsELhg7BHoUOwWeEDsHbgw7Bb4MOwRuDDsHbgg7BqoIOwYSCDsFngg7BUIIOwT+CDsEygg7BKIIOwSCCDsEagg7BFYIOwRKCDsEPgg7BLiULwRkjC8F/IQvBRCALwVEfC8GWHgvBBh4LwZgdC8FCHQvBAR0Lwc4cC8GoHAvBihwLwXMcC8FhHAvBVBwLwUkcC8FBHAvBOxwLwTYcC8EyHAvBScIHwYS/B8FkvQfBwLsHwX26B8GFuQfBxbgHwTK4B8HBtwfBarcHwSe3B8HztgfBy7YHwa22B8GVtgfBg7YHwXW2B8FqtgfBYrYHwVy2B8FXtgfBYWAEwbJcBMHcWQTBr1cEwQFWBMG3VATBuVMEwfVSBMFeUgTB6lEEwZFRBMFMUQTBGFEEwe9QBMHQUATBuFAEwaVQBMGXUATBjFAEwYNQBMF9UATBxv8AweH6AMEc9wDBNfQAwfvxAMFE8ADB8e4Awe3tAMEl7QDBi+wAwRTsAMG56wDBcusAwTzrAMET6wDB8+oAwdrqAMHH6gDBueoAwa3qAMGl6gDB+EH7wP40+8D8KvvARyP7wFgd+8DJGPvARxX7wJMS+8B/EPvA5Q77wKoN+8C4DPvA/Qv7wG0L+8D/CvvAqgr7wGgK+8A2CvvADwr7wPEJ+8DaCfvAPon0wAd49MC/avTAgmD0wJ5Y9MCLUvTA4U30wEpK9MCGR/TAZUX0wMJD9MCAQvTAh0H0wMhA9MA1QPTAxD/0wG0/9MAqP/TA9z70wM8+9MCwPvTAfNbtwKq/7cANru3AdqDtwPyV7cDpje3AsYftwOuC7cA+f+3AanztwDx67cCPeO3ARXftwEd27cCEde3A7XTtwHl07cAgdO3A3HPtwKdz7cB+c+3AADDnwGsN58AS9ubADOTmwCTW5sBsy+bAKcPmwMy85sDot+bAJrTmwEGx5sAGr+bAT63mwP2r5sD5qubAMarmwJep5sAgqebAxajmwH+o5sBJqObA8JfgwE1o4MBbRODAeCzgwAca4MDNC+DA1QDgwGH438De8d/A3OzfwAPp38AM5t/AxOPfwAPi38Cp4N/An9/fwNLe38A13t/AvN3fwF7d38AW3d/AGBDawFrR2cCioNnATnvZwN5i2cAAUNnAcUHZwDg22cCRLdnA5ybZwMch2cDXHdnAzxrZwHkY2cCtFtnASxXZwDsU2cBpE9nAyBLZwEwS2cDtEdnAXZ3TwPtK08DUCtPAAdnSwEay0sBGmdLA+IXSwBN30sCWa9LAvGLSwOtb0sCrVtLAo1LSwIlP0sAmTdLAT0vSwOVJ0sDOSNLA+EfSwFNH0sDURtLA/UjNwOrZzMD4hczAYETMwGwRzMCg6cvAsc/LwPC7y8CzrMvA8qDLwOOXy8DpkMvAiovLwGqHy8A9hMvAy4HLwOp/y8B3fsvAWn3LwH58y8DVe8vAzSnHwKKJxsCbFsbA+MDFwAF+xcDlScXAUyHFwCAGxcDr8cTAU+LEwEzWxMAIzcTA48XEwGTAxMArvMTA67jEwGu2xMB+tMTAA7PEwN+xxMD+sMTApY3BwBJuwMCLyr/Ae1O/wPP7vsC3t77AboK+wBJZvsCVPL7A6Ce+wPQXvsCmC77AKgK+wNv6vcA69b3A6PC9wJXtvcAG673ADem9wInnvcBe5r3AbYYwwVqGMMFLhjDBQIYwwTiGMMExhjDBLIYwwSmGMMEmhjDBI4YwwSKGMMEhhjDBIIYwwR+GMMEehjDBHoYwwR2GMMEdhjDBHYYwwR2GMMEdhjDBqSAtwY8gLcF8IC3BbSAtwWIgLcFZIC3BUiAtwU0gLcFJIC3BRiAtwUQgLcFDIC3BQSAtwUAgLcE/IC3BPyAtwT4gLcE+IC3BPiAtwT4gLcE9IC3B7ropwcy6KcGyuinBnropwY+6KcGDuinBeropwXO6KcFuuinBaropwWe6KcFluinBY7opwWK6KcFhuinBYLopwWC6KcFfuinBX7opwV66KcFeuinBQFUmwRJVJsHvVCbB1FQmwcBUJsGwVCbBpVQmwZxUJsGVVCbBj1QmwYtUJsGIVCbBhlQmwYRUJsGDVCbBglQmwYFUJsGAVCbBgFQmwX9UJsF/VCbBou8iwWXvIsE27yLBEu8iwffuIsHi7iLB0u4iwcbuIsG97iLBtu4iwbDuIsGs7iLBqe4iwafuIsGl7iLBo+4iwaLuIsGh7iLBoe4iwaDuIsGg7iLBHIofwcmJH8GKiR/BWokfwTaJH8EaiR/BBIkfwfSIH8HoiB/B3ogfwdeIH8HRiB/BzYgfwcqIH8HHiB/BxYgfwcSIH8HDiB/BwogfwcGIH8HBiB/BsyQcwUUkHMHwIxzBsCMcwX8jHMFZIxzBPSMcwScjHMEWIxzBCSMcwf8iHMH4IhzB8iIcwe4iHMHrIhzB6CIcweYiHMHlIhzB5CIcweMiHMHiIhzBdL8Ywd++GMFuvhjBF74Ywda9GMGjvRjBfb0YwV+9GMFJvRjBOL0YwSu9GMEhvRjBGb0YwRO9GMEPvRjBDL0YwQm9GMEHvRjBBb0YwQS9GMEDvRjBaloVwaNZFcELWRXBl1gVwT9YFcH7VxXByFcVwaBXFcGCVxXBa1cVwVpXFcFMVxXBQlcVwTpXFcE0VxXBMFcVwSxXFcEqVxXBKFcVwSZXFcElVxXBqvURwZ/0EcHT8xHBOPMRwcHyEcFm8hHBIfIRwezxEcHE8RHBpfERwY7xEcF88RHBbvERwWTxEcFc8RHBVvERwVHxEcFN8RHBS/ERwUnxEcFH8RHBS5EOweWPDsHUjg7BBI4OwWSNDsHrjA7BjowOwUeMDsERjA7B6IsOwciLDsGwiw7BnosOwZCLDsGFiw7BfYsOwXeLDsFyiw7BbosOwWuLDsFpiw7Bby0LwZArC8EiKgvBCikLwTUoC8GRJwvBFScLwbYmC8FtJgvBNiYLwQwmC8HrJQvB0yULwcAlC8GxJQvBpiULwZ4lC8GYJQvBkyULwY8lC8GMJQvBQsoHwcDHB8HWxQfBX8QHwUHDB8FmwgfBv8EHwT/BB8HewAfBk8AHwVvAB8EvwAfBDsAHwfW/B8HivwfB078Hwci/B8G/vwfBub8HwbS/B8GwvwfB/2cEwaRkBMETYgTBHGAEwZ1eBMF3XQTBl1wEwexbBMFqWwTBBlsEwbpaBMGAWgTBU1oEwTJaBMEYWgTBBFoEwfVZBMHpWQTB4VkEwdpZBMHVWQTB9wYBwXgCAcEH/wDBZvwAwWT6AMHb+ADBr/cAwcn2AMEa9gDBlPUAwS71AMHg9ADBpfQAwXf0AMFV9ADBOvQAwSb0AMEX9ADBC/QAwQL0AMH78wDBTk/7wEhD+8AVOvvADDP7wKst+8CPKfvAayb7wAQk+8AvIvvAyCD7wLcf+8DlHvvARh77wMwd+8BvHfvAKB37wPIc+8DJHPvAqRz7wJEc+8B/HPvAW5X0wEWF9MD1ePTAim/0wFZo9MDUYvTAnl70wGdb9MDxWPTAEVf0wKJV9MCJVPTAs1P0wA9T9MCTUvTAM1L0wOtR9MCzUfTAiVH0wGlR9MBQUfTAKuHtwKvL7cAzu+3AmK7twPKk7cCSne3A7pftwJ6T7cBTkO3Az43twOOL7cBriu3AS4ntwHCI7cDJh+3ASYftwOeG7cCchu3AZIbtwDiG7cAXhu3ATDvnwEMY58D2AefAGvHmwDHk5sBQ2ubAw9LmwPzM5sCSyObAM8XmwJ/C5sCnwObAJr/mwAC+5sAfvebAc7zmwPC75sCMu+bAQLvmwAa75sDZuubADqHgwG1z4MCxT+DAPzjgwPsm4MDEGeDApw/gwOoH4MAAAuDAe/3fwAf638Bj99/AX/XfwNXz38Co8t/AwvHfwBLx38CM8N/AJfDfwNfv38Cb79/A4BbawEfa2cCVq9nAI4fZwIdu2cDaXNnAUk/ZwPdE2cALPdnA/TbZwFwy2cDSLtnAHizZwA4q2cB6KNnARSfZwFom2cCmJdnAHCXZwLMk2cBjJNnAyKHTwJBR08CQE9PAxuPSwJq+0sDQpNLAuJLSwNyE0sBCetLAJnLSwPJr0sA1Z9LAlWPSwNFg0sC0XtLAFl3SwNpb0sDpWtLAMVrSwKRZ0sA4WdLAmkvNwCbezMBajMzA60zMwAQczMAY9svAHNvLwJXIy8BmusvAiq/LwDyny8DjoMvACJzLwFKYy8B9lcvAUpPLwKuRy8BnkMvAcI/LwLSOy8AkjsvAjCrHwBGMxsCoGsbAKcfFwFqGxcBOVMXAoC3FwGwRxcB1/sTA7u/EwNDkxMBP3MTAz9XEwNbQxMAKzcTAI8rEwOvHxMA6xsTA7sTEwPHDxMAww8TApY3BwLVuwMDNzL/AWle/wPMBv8Dfv77AqIy+wDJlvsDCR77AVzS+wHglvsAWGr7AYRG+wLgKvsChBb7AvQG+wMT+vcB//L3Aw/q9wHD5vcBt+L3API8wwSyPMMEhjzDBGI8wwRGPMMEMjzDBCI8wwQWPMMEDjzDBAY8wwQCPMMH/jjDB/o4wwf2OMMH9jjDB/Y4wwfyOMMH8jjDB/I4wwfyOMMH8jjDBcyktwV4pLcFOKS3BQiktwTkpLcEyKS3BLSktwSkpLcEmKS3BIyktwSIpLcEgKS3BHyktwR8pLcEeKS3BHSktwR0pLcEdKS3BHSktwR0pLcEcKS3Bs8MpwZbDKcGAwynBcMMpwWTDKcFawynBU8MpwU7DKcFKwynBRsMpwUTDKcFCwynBQcMpwUDDKcE/wynBP8MpwT7DKcE+wynBPsMpwT3DKcE9wynB/V0mwdZdJsG5XSbBo10mwZJdJsGFXSbBfF0mwXRdJsFvXSbBal0mwWddJsFlXSbBY10mwWJdJsFhXSbBYF0mwV9dJsFfXSbBXl0mwV5dJsFeXSbBVfgiwSH4IsH69yLB3PciwcX3IsG09yLBp/ciwZ33IsGV9yLBkPciwYv3IsGI9yLBhvciwYT3IsGC9yLBgfciwYD3IsGA9yLBf/ciwX/3IsF/9yLBwpIfwXuSH8FGkh/BHZIfwf+RH8HnkR/B1pEfwciRH8G+kR/Bt5EfwbGRH8GskR/BqZEfwaaRH8GlkR/Bo5EfwaKRH8GhkR/BoZEfwaCRH8GgkR/BSS0cweksHMGhLBzBaywcwUEsHMEiLBzBCiwcwfgrHMHqKxzB4CscwdgrHMHSKxzBzSscwcorHMHHKxzBxSscwcQrHMHDKxzBwiscwcErHMHBKxzB9McYwXPHGMERxxjBx8YYwY/GGMFlxhjBRcYYwSzGGMEaxhjBDMYYwQHGGMH5xRjB88UYwe7FGMHrxRjB6MUYwebFGMHlxRjB48UYwePFGMHixRjBz2IVwSFiFcGeYRXBOmEVwe5gFcG0YBXBiWAVwWhgFcFPYBXBPGAVwS1gFcEiYBXBGmAVwRRgFcEPYBXBDGAVwQlgFcEHYBXBBWAVwQRgFcEDYBXB7f0RwQL9EcFQ/BHByPsRwWL7EcEU+xHB2foRwa36EcGL+hHBcfoRwV76EcFP+hHBRPoRwTv6EcE1+hHBMPoRwS36EcEq+hHBKPoRwSb6EcEl+hHBY5kOwSaYDsE1lw7BfpYOwfOVDsGKlQ7BO5UOwf+UDsHRlA7BrpQOwZSUDsGAlA7BcZQOwWWUDsFdlA7BVpQOwVGUDsFNlA7BS5QOwUiUDsFHlA7BUjULwaQzC8FfMgvBaDELwa0wC8EfMAvBsy8LwWIvC8EkLwvB9S4LwdEuC8G3LgvBoi4LwZMuC8GHLgvBfi4LwXcuC8FyLgvBbi4LwWsuC8FpLgvB4tEHwZ7PB8HmzQfBmcwHwZzLB8HcygfBSsoHwdzJB8GJyQfBSckHwRnJB8H1yAfB2cgHwcTIB8G0yAfBqMgHwZ/IB8GYyAfBk8gHwY/IB8GMyAfBTm8EwT5sBMHsaQTBKWgEwdNmBMHQZQTBC2UEwXZkBMEFZATBsGMEwW9jBME+YwTBGGMEwfxiBMHnYgTB1mIEwcpiBMHBYgTBumIEwbRiBMGwYgTB4A0Bwb4JAcGcBgHBOwQBwW0CAcEOAQHBBQABwTv/AMGi/gDBL/4Awdf9AMGU/QDBYv0AwTz9AMEf/QDBCf0Awfj8AMHs/ADB4vwAwdv8AMHV/ADBKlz7wAZR+8CQSPvAJUL7wEY9+8CUOfvAxjb7wKY0+8AKM/vA0TH7wOQw+8AxMPvAqC/7wEEv+8DzLvvAty77wIou+8BoLvvATy77wDsu+8AsLvvAEaH0wAuS9MChhvTA9n30wGJ39MBkcvTAm270wLxr9MCOafTA52f0wKdm9MC0ZfTA/GT0wHBk9MAGZPTAtmP0wHlj9MBLY/TAKGP0wA5j9MD6YvTAvO3twEfX7cDix+3AMLztwE6z7cCQrO3Ac6ftwJKj7cChoO3AZZ7twLSc7cBsm+3Ac5rtwLaZ7cAnme3Au5jtwGmY7cAqmO3A+5ftwNeX7cC8l+3ATkbnwAQl58B3DefAsf3mwLXx5sCc6ObAtOHmwHbc5sB82ObAeNXmwC/T5sBz0ebAI9DmwCPP5sBizubAz83mwGDN5sAMzebAzMzmwJzM5sB3zObA+angwEV+4MBLXODApEPgwHsz4MA0J+DA4R3gwM0W4MBuEeDAWw3gwEQK4MDtB+DAJgbgwM0E4MDHA+DAAQPgwGsC4MD5AeDAowHgwGEB4MAwAeDAih3awATj2cBCttnAlZPZwNB52cBCadnArVzZwB9T2cDfS9nAXkbZwDJC2cAHP9nAoDzZwM462cBtOdnAYTjZwJY32cD8NtnAhzbZwC822cDsNdnAJabTwAlY08AeHNPASO7SwOPK0sD8r9LAB5/SwCOS0sBZiNLA64DSwEd70sAAd9LAwnPSwExx0sBub9LABG7SwPFs0sAhbNLAg2vSwAxr0sCxatLAMU7NwFXizMChkszASVXMwFkmzMA5AszALObLwMvUy8CXx8vAj73LwPK1y8ArsMvAyavLwHWoy8DwpcvAB6TLwJSiy8B6ocvApaDLwAOgy8CJn8vASivHwHuOxsCpHsbAQM3FwIiOxcB4XsXAlznFwHMcxcCRCsXACv3EwMPyxMD26sTACuXEwIzgxMAk3cTAj9rEwJnYxMAd18TA/NXEwCLVxMB81MTApY3BwFdvwMALz7/ALFu/wNsHv8Ddx77Appa+wABxvsAmU77AWUC+wH0yvsD1J77A9x++wOYZvsBMFb7AzhG+wCgPvsAmDb7AoQu+wHkKvsCZCb7AlZcwwYiXMMF/lzDBd5cwwXKXMMFulzDBa5cwwWiXMMFnlzDBZZcwwWSXMMFklzDBY5cwwWOXMMFilzDBYpcwwWKXMMFilzDBYpcwwWKXMMFilzDByDEtwbcxLcGqMS3BoDEtwZgxLcGTMS3BjzEtwYwxLcGJMS3BhzEtwYYxLcGFMS3BhDEtwYQxLcGDMS3BgzEtwYMxLcGDMS3BgjEtwYIxLcGCMS3BAswpwevLKcHZyynBy8spwcHLKcG6yynBtMspwbDLKcGsyynBqsspwajLKcGnyynBpsspwaXLKcGkyynBpMspwaTLKcGjyynBo8spwaPLKcGjyynBRmYmwSVmJsENZibB+2Umwe1lJsHjZSbB22UmwdVlJsHRZSbBzWUmwctlJsHJZSbBx2UmwcZlJsHGZSbBxWUmwcVlJsHEZSbBxGUmwcRlJsHEZSbBlgAjwWoAI8FJACPBMAAjwR0AI8EPACPBBAAjwfz/IsH2/yLB8v8iwe7/IsHs/yLB6v8iwej/IsHn/yLB5v8iweb/IsHl/yLB5f8iweX/IsHk/yLB95ofwbuaH8GOmh/BbJofwVKaH8E/mh/BMJofwSWaH8Edmh/BF5ofwRKaH8EPmh/BDJofwQqaH8EJmh/BCJofwQeaH8EGmh/BBpofwQWaH8EFmh/BcDUcwR41HMHgNBzBsjQcwY80HMF1NBzBYTQcwVI0HMFHNBzBPzQcwTg0HMEzNBzBMDQcwS00HMErNBzBKjQcwSg0HMEoNBzBJzQcwSY0HMEmNBzBCdAYwZnPGMFFzxjBBs8YwdbOGMGyzhjBl84YwYPOGMF0zhjBaM4YwWDOGMFZzhjBVM4YwVHOGMFOzhjBTM4YwUrOGMFJzhjBSM4YwUjOGMFHzhjBzWoVwTVqFcHCaRXBbGkVwStpFcH6aBXB1mgVwbpoFcGlaBXBlmgVwYpoFcGBaBXBemgVwXVoFcFyaBXBb2gVwW1oFcFraBXBamgVwWloFcFoaBXBzAUSwf0EEsFhBBLB7AMSwZMDEsFRAxLBHwMSwfkCEsHdAhLBxwISwbcCEsGrAhLBogISwZwCEsGWAhLBkwISwZACEsGNAhLBjAISwYsCEsGKAhLBHaEOwQKgDsEunw7Bjp4OwRWeDsG7nQ7Bdp0OwUOdDsEdnQ7BAJ0OweqcDsHZnA7BzZwOwcScDsG9nA7Bt5wOwbOcDsGwnA7BrpwOwa2cDsGrnA7B2zwLwVo7C8E5OgvBXzkLwbs4C8E/OAvB4jcLwZw3C8FoNwvBQDcLwSI3C8EMNwvB+zYLwe42C8HlNgvB3jYLwdg2C8HUNgvB0TYLwc82C8HNNgvBMNkHwSPXB8GZ1QfBcNQHwZDTB8Ho0gfBadIHwQrSB8HC0QfBjNEHwWTRB8FF0QfBLtEHwR3RB8EQ0QfBBtEHwf/QB8H50AfB9dAHwfLQB8Hw0AfBUHYEwYZzBMFtcQTB2G8EwaduBMHCbQTBFW0EwZRsBMEybATB6GsEwbFrBMGIawTBaGsEwVFrBME/awTBMmsEwShrBMEgawTBGmsEwRZrBMETawTBhhQBwboQAcHeDQHBtwsBwRgKAcHfCAHB9AcBwUMHAcG+BgHBWgYBwQ8GAcHWBQHBqwUBwYsFAcFzBQHBYQUBwVMFAcFJBQHBQQUBwTsFAcE3BQHBj2j7wD1e+8B2VvvAmlD7wDFM+8DfSPvAX0b7wH1E+8ATQ/vAAkL7wDVB+8CaQPvAJkD7wM8/+8CNP/vAXD/7wDY/+8AaP/vABT/7wPU++8DqPvvAZaz0wFye9MDHk/TAzov0wMyF9MBGgfTA3n30wE579MBgefTA7Hf0wNV29MACdvTAZHX0wO109MCTdPTAUHT0wB109MD3c/TA2nP0wMRz9MC0c/TARfrtwILi7cAe1O3ARcntwBfB7cDvuu3AS7btwM2y7cAssO3AMq7twLWs7cCWq+3AvqrtwByq7cCiqe3ARqntwAGp7cDNqO3ApajtwIio7cByqO3AClHnwGgx58AMGefA2AnnwLj+5sBW9ubABfDmwETr5sCv5+bA/eTmwPbi5sBv4ebASeDmwGvf5sDF3ubASN7mwOnd5sCi3ebAbd3mwEXd5sAn3ebAtLLgwNiI4MCKaODAkk/gwIw/4MAkNODAiyvgwBEl4MAxIODAhRzgwMIZ4MCtF+DAHBbgwO8U4MAMFODAYRPgwOES4MCAEuDANxLgwAES4MDXEeDAFiTawJHr2cCswNnArp/ZwBWG2cA7ddnAimnZwLpg2cAWWtnAFlXZwFJR2cB8TtnAWkzZwL9K2cCKSdnAokjZwPJH2cBvR9nADEfZwMFG2cCJRtnAc6rTwGVe08B+JNPAiPjSwNbW0sCavNLA6arSwOye0sDjldLAFI/SwPOJ0sAXhtLAL4PSwP+A0sBaf9LAHX7SwC590sB7fNLA83vSwI570sBBe9LAwlDNwHbmzMDOmMzAe13MwHAwzMAFDszAIPPLwJbgy8BM1MvACMvLwA3Ey8DLvsvA1rrLwNu3y8CdtcvA7bPLwKiyy8CzscvA+7DLwHCwy8AIsMvAByzHwOCQxsCcIsbAPdPFwI2WxcBkaMXAPEXFwKspxcBFFsXAqgnFwCsAxcAC+cTAnvPEwI/vxMCB7MTANOrEwHnoxMAs58TAMebEwHTlxMDm5MTApY3BwPhvwMBE0b/A816/wKoNv8Czz77AZ6C+wH18vsA8YL7A9Uu+wAk/vsBMNb7A9S2+wG4ovsBFJL7AIyG+wMcevsABHb7Aqxu+wKoavsDoGb7AgJ8wwXWfMMFtnzDBZ58wwWOfMMFgnzDBXZ8wwVyfMMFanzDBWZ8wwVmfMMFYnzDBWJ8wwVefMMFXnzDBV58wwVefMMFXnzDBVp8wwVafMMFWnzDBsDktwaE5LcGXOS3BjzktwYk5LcGEOS3BgTktwX45LcF8OS3BezktwXo5LcF5OS3BeTktwXg5LcF4OS3BeDktwXc5LcF3OS3BdzktwXc5LcF3OS3B5tMpwdLTKcHD0ynBuNMpwbDTKcGq0ynBpdMpwaLTKcGf0ynBndMpwZzTKcGb0ynBmtMpwZnTKcGZ0ynBmNMpwZjTKcGY0ynBmNMpwZjTKcGY0ynBI24mwQhuJsH0bSbB5W0mwdltJsHRbSbBy20mwcZtJsHCbSbBwG0mwb5tJsG8bSbBu20mwbptJsG6bSbBuW0mwbltJsG5bSbBuW0mwbltJsG4bSbBbAgjwUcII8ErCCPBFggjwQcII8H7ByPB8gcjwewHI8HnByPB4wcjweEHI8HfByPB3QcjwdwHI8HbByPB2wcjwdoHI8HaByPB2QcjwdkHI8HZByPBxKIfwZGiH8Fqoh/BTqIfwTiiH8Eooh/BHKIfwRSiH8ENoh/BCKIfwQSiH8EBoh/B/6Efwf6hH8H9oR/B/KEfwfuhH8H7oR/B+qEfwfqhH8H6oR/BMD0cweo8HMG1PBzBjjwcwXA8HMFbPBzBSjwcwT48HME1PBzBLjwcwSk8HMElPBzBIjwcwSA8HMEfPBzBHTwcwRw8HMEcPBzBGzwcwRs8HMEbPBzBudcYwVjXGMEQ1xjB2tYYwbHWGMGT1hjBfdYYwWzWGMFf1hjBVtYYwU/WGMFK1hjBRtYYwUPWGMFB1hjBP9YYwT7WGME91hjBPNYYwTzWGME81hjBaXIVweRxFcGAcRXBNnEVwf9wFcHVcBXBtnAVwZ9wFcGOcBXBgXAVwXdwFcFwcBXBa3AVwWdwFcFkcBXBYnAVwWBwFcFfcBXBXnAVwV1wFcFdcBXBTg0SwZcMEsEPDBLBqQsSwVwLEsEjCxLB+QoSwdkKEsHCChLBsAoSwaMKEsGZChLBkQoSwYwKEsGIChLBhQoSwYIKEsGBChLBfwoSwX8KEsF+ChLBfagOwYGnDsHGpg7BOqYOwdGlDsGDpQ7BSKUOwR2lDsH8pA7B5KQOwdKkDsHEpA7BuqQOwbOkDsGtpA7BqaQOwaakDsGjpA7BoaQOwaCkDsGfpA7BEEQLwbdCC8G1QQvB9UALwWVAC8H6PwvBqT8LwW4/C8FBPwvBHz8LwQY/C8H0PgvB5j4Lwdw+C8HUPgvBzj4Lwco+C8HGPgvBxD4LwcI+C8HBPgvBLuAHwVTeB8Hy3AfB6tsHwSTbB8GR2gfBItoHwdDZB8GT2QfBZdkHwUPZB8Ep2QfBFtkHwQjZB8H92AfB9dgHwe/YB8Hr2AfB59gHweXYB8Hj2AfBCn0EwYB6BMGZeATBLncEwR92BMFUdQTBvXQEwUx0BMH3cwTBuHMEwYlzBMFmcwTBTHMEwThzBMEpcwTBHnMEwRZzBMEQcwTBDHMEwQhzBMEGcwTB6xoBwW4XAcHSFAHB3xIBwWsRAcFUEAHBhA8BwekOAcF1DgHBHg4Bwd4NAcGtDQHBiQ0BwW4NAcFaDQHBSw0BwUANAcE3DQHBMQ0BwSwNAcEpDQHBhXT7wPVq+8DOY/vAdl77wHda+8B7V/vAQFX7wJVT+8BXUvvAaVH7wLdQ+8AzUPvA0E/7wIZP+8BOT/vAJU/7wAZP+8DvTvvA3k77wNFO+8DITvvAmrn0wD+q9MBvoPTAGZn0wJ2T9MCDj/TAc4z0wCmK9MB0iPTALYf0wDmG9MCDhfTA+oT0wJWE9MBJhPTAEIT0wOaD9MDGg/TAr4P0wJ2D9MCQg/TAcgbuwA/w7cDt3+3A3NXtwFXO7cC0yO3AgMTtwFvB7cACv+3AQb3twPK77cD3uu3APLrtwLC57cBIue3A+rjtwMC47cCVuO3AdLjtwFy47cBKuO3AgFvnwHI958B8JufAkhXnwD8L58CFA+fAv/3mwG755sA19ubAzPPmwP/x5sCn8ObApu/mwObu5sBX7ubA7O3mwJzt5sBg7ebANO3mwBLt5sD67ObAP7vgwCeT4MBxdODA41zgwDxL4MCZQODArDjgwMAy4MBSLuDAAyvgwIoo4MCxJuDAUCXgwEgk4MCEI+DA8CLgwIMi4MAxIuDA8yHgwMYh4MCjIeDAhSrawPHz2cDUytnAcavZwEiT2cAsgdnA7XXZwMxt2cC4Z9nALGPZwMdf2cA+XdnAWVvZwO9Z2cDgWNnAFljZwH9X2cAOV9nAulbZwHtW2cBMVtnAsq7TwKZk08CxLNPAiQLTwHXi0sCtydLAGbfSwD2r0sDmotLAqZzSwACY0sCElNLA6ZHSwPiP0sCEjtLAbo3SwJ+M0sAEjNLAkIvSwDqL0sD5itLATlPNwInqzMDgnszAg2XMwEg6zMB/GczAEwDMwAXty8CK4MvA+9fLwJXRy8DNzMvAOsnLwI7Gy8CPxMvAEsPLwPXBy8AgwcvAgcDLwArAy8Cyv8vAxCzHwECTxsCDJsbAItnFwGeexcAUcsXAkFDFwH42xcDxIsXA1hXFwA4NxcB+BsXAlQHFwOr9xMAt+8TAIfnEwJn3xMB19sTAm/XEwPj0xMB+9MTApY3BwJlwwMB407/ArmK/wGETv8Bh177A7qm+wKuHvsDubL7A4Fi+wCJLvsAgQr7AYzu+wFo2vsCXMr7Axy++wK0tvsAcLL7A8Cq+wBAqvsBoKb7ABKcwwfumMMH1pjDB8KYwwe2mMMHqpjDB6KYwweemMMHmpjDB5aYwweSmMMHkpjDB5KYwweSmMMHjpjDB46YwweOmMMHjpjDB46YwweOmMMHjpjDBMUEtwSVBLcEdQS3BFkEtwRFBLcEOQS3BC0EtwQlBLcEIQS3BB0EtwQZBLcEFQS3BBUEtwQRBLcEEQS3BBEEtwQRBLcEEQS3BBEEtwQRBLcEEQS3BZNspwVPbKcFH2ynBPtspwTfbKcEy2ynBL9spwSzbKcEq2ynBKNspwSfbKcEm2ynBJtspwSXbKcEl2ynBJdspwSXbKcEk2ynBJNspwSTbKcEk2ynBnXUmwYZ1JsF1dSbBaXUmwV91JsFYdSbBU3UmwU91JsFNdSbBS3UmwUl1JsFIdSbBR3UmwUZ1JsFGdSbBRnUmwUV1JsFFdSbBRXUmwUV1JsFFdSbB3w8jwcAPI8GoDyPBlw8jwYoPI8GBDyPBeQ8jwXQPI8FwDyPBbQ8jwWsPI8FqDyPBaQ8jwWgPI8FnDyPBZw8jwWYPI8FmDyPBZg8jwWYPI8FmDyPBL6ofwQOqH8HjqR/By6kfwbmpH8GsqR/BoqkfwZupH8GVqR/BkakfwY6pH8GMqR/Bi6kfwYmpH8GIqR/BiKkfwYepH8GHqR/Bh6kfwYapH8GGqR/BkUQcwVREHMEnRBzBBkQcwe1DHMHbQxzBzUMcwcNDHMG8QxzBtkMcwbJDHMGvQxzBrUMcwatDHMGqQxzBqUMcwahDHMGoQxzBqEMcwadDHMGnQxzBDN8YwbjeGMF53hjBS94YwSneGMEQ3hjB/d0Ywe/dGMHl3RjB3d0YwdfdGMHT3RjB0N0Ywc7dGMHM3RjBy90YwcrdGMHJ3RjByd0YwcjdGMHI3RjBqnkVwTV5FcHfeBXBn3gVwW94FcFMeBXBMngVwR94FcEReBXBBngVwf53FcH4dxXB9HcVwfF3FcHudxXB7XcVwet3FcHqdxXB6ncVwel3FcHpdxXBdxQSwdYTEsFfExLBBhMSwcQSEsGUEhLBcBISwVUSEsFBEhLBMhISwScSEsEfEhLBGRISwRUSEsESEhLBDxISwQ0SEsEMEhLBCxISwQoSEsEKEhLBiK8OwamuDsEDrg7BiK0OwS2tDsHqrA7BuKwOwZOsDsF3rA7BY6wOwVSsDsFJrA7BQawOwTqsDsE2rA7BM6wOwTCsDsEurA7BLawOwSysDsErrA7B9UoLwcBJC8HaSAvBMEgLwbJHC8FVRwvBEEcLwdxGC8G2RgvBmkYLwYVGC8F2RgvBakYLwWJGC8FcRgvBV0YLwVNGC8FRRgvBT0YLwU5GC8FMRgvB4uYHwTblB8H44wfBDeMHwV7iB8Hd4QfBfeEHwTbhB8EB4QfB2uAHwb3gB8Go4AfBmOAHwYzgB8GD4AfBfeAHwXjgB8F04AfBcuAHwXDgB8Fu4AfBgIMEwS+BBMF3fwTBMX4EwT99BMGMfATBB3wEwaV7BMFcewTBJnsEwf56BMHgegTBynoEwbl6BMGtegTBpHoEwZ56BMGZegTBlXoEwZJ6BMGQegTBEiEBwd4dAcF9GwHBuhkBwWsYAcFyFwHBuhYBwTIWAcHNFQHBghUBwUoVAcEhFQHBAxUBwewUAcHbFAHBzxQBwcYUAcG/FAHBuhQBwbYUAcGzFAHBjoH7wDJ3+8CfcPvAvmv7wCBo+8BxZfvAdGP7wPth+8DjYPvAE2D7wHlf+8AHX/vAs177wHRe+8BGXvvAJF77wApe+8D3XfvA6V37wN9d+8DXXfvA1sb0wI+39MCerPTA3qX0wNyg9MAlnfTAZJr0wFmY9MDVlvTAtpX0wOGU9MBDlPTAzpP0wHeT9MA3k/TAB5P0wOSS9MDKkvTAtpL0wKiS9MCdkvTARhLuwDD97cCB7e3A/OHtwA7b7cDq1e3AGdLtwEXP7cAsze3AnsvtwHfK7cCcye3A+sjtwILI7cApyO3A58ftwLbH7cCSx+3Ad8ftwGPH7cBUx+3As2XnwCZJ58CBM+fAaCPnwHEX58AyEOfA6grnwP8G58AYBOfA8QHnwFgA58Ap/+bASP7mwKL95sAm/ebAy/zmwIf85sBV/ObAMPzmwBT85sAA/ObAm8PgwDWd4MADgODAzGngwEVZ4MD9TODAS0XgwN8/4MDaO+DA3zjgwKk24MAFNeDAzjPgwOcy4MA8MuDAvTHgwGAx4MAaMeDA5jDgwMAw4MCkMODA1zDawCP82cC91NnA4bbZwBOg2cAcj9nAgYLZwF162cDMdNnAq3DZwJtt2cBWa9nAp2nZwGho2cB7Z9nAy2bZwElm2cDpZdnAoWXZwGxl2cBFZdnA5LLTwMtq08C5NNPATAzTwMLt0sBa1tLA8MTSwP+30sBpr9LAsqnSwHWl0sBQotLA+5/SwEGe0sD5nNLABZzSwFGb0sDMmtLAaZrSwB+a0sDpmdLA1VXNwI/uzMDYpMzAYG3MwORDzMCpJMzAowzMwMP6y8B57cvAcOTLwJLey8A42svA/tbLwJnUy8DT0svAgtHLwIjQy8DPz8vARs/LwODOy8CVzsvAgC3HwJqVxsBdKsbA7d7FwBqmxcCJe8XAl1vFwO5CxcCVMMXA8SLFwHQZxcBuE8XA9w7FwKYLxcAxCcXAXwfFwAUGxcAEBcXARgTFwLoDxcBRA8XApY3BwDlxwMCp1b/AXWa/wAEZv8Dp3r7APLO+wI6SvsA/eb7AaWa+wGlYvsB3Tr7ASEi+wLFDvsBKQL7AxD2+wOU7vsCCOr7Aezm+wLg4vsAnOL7AKa4wwSKuMMEdrjDBGa4wwRauMMEUrjDBE64wwRKuMMERrjDBEK4wwRCuMMEQrjDBD64wwQ+uMMEPrjDBD64wwQ+uMMEPrjDBD64wwQ+uMMEPrjDBVEgtwUtILcFDSC3BPkgtwTpILcE3SC3BNUgtwTRILcEySC3BMkgtwTFILcExSC3BMEgtwTBILcEwSC3BMEgtwTBILcEwSC3BL0gtwS9ILcEvSC3BhOIpwXbiKcFs4inBZeIpwV/iKcFb4inBWOIpwVbiKcFU4inBU+IpwVLiKcFS4inBUeIpwVHiKcFR4inBUOIpwVDiKcFQ4inBUOIpwVDiKcFQ4inBuXwmwaZ8JsGYfCbBjXwmwYZ8JsGAfCbBfHwmwXl8JsF3fCbBdXwmwXR8JsFzfCbBcnwmwXJ8JsFyfCbBcXwmwXF8JsFxfCbBcXwmwXF8JsFxfCbB9hYjwdwWI8HIFiPBuRYjwa8WI8GnFiPBoRYjwZ0WI8GaFiPBmBYjwZYWI8GVFiPBlBYjwZMWI8GSFiPBkhYjwZIWI8GSFiPBkhYjwZEWI8GRFiPBP7EfwRqxH8H+sB/B6rAfwduwH8HQsB/ByLAfwcKwH8G+sB/Bu7AfwbiwH8G3sB/BtbAfwbSwH8G0sB/Bs7AfwbOwH8GysB/BsrAfwbKwH8GysB/BmEscwWRLHME9SxzBIUscwQxLHMH9ShzB8kocwelKHMHjShzB30ocwdtKHMHZShzB10ocwdZKHMHVShzB1EocwdRKHMHTShzB00ocwdNKHMHTShzBB+YYwb7lGMGI5RjBYeUYwUTlGMEu5RjBH+UYwRPlGMEL5RjBBOUYwQDlGMH85BjB+uQYwfjkGMH35BjB9uQYwfXkGMH05BjB9OQYwfTkGMH05BjBlYAVwS+AFcHkfxXBrX8VwYR/FcFnfxXBUX8VwUB/FcE1fxXBLH8VwSV/FcEhfxXBHX8VwRt/FcEZfxXBF38VwRZ/FcEWfxXBFX8VwRV/FcEUfxXBThsSwcAaEsFXGhLBChoSwdIZEsGoGRLBiRkSwXMZEsFiGRLBVhkSwU0ZEsFHGRLBQhkSwT4ZEsE7GRLBOhkSwTgZEsE3GRLBNhkSwTYZEsE1GRLBRLYOwX61DsHrtA7BgLQOwTG0DsH3sw7BzLMOwayzDsGVsw7BhLMOwXizDsFusw7BaLMOwWOzDsFfsw7BXLMOwVqzDsFZsw7BWLMOwVezDsFWsw7Bj1ELwXlQC8GtTwvBF08LwalOC8FXTgvBHE4LwfBNC8HPTQvBuE0LwaZNC8GZTQvBkE0LwYlNC8GETQvBgE0LwX1NC8F7TQvBek0LwXhNC8F4TQvBT+0HwczrB8Gv6gfB3ukHwUPpB8HS6AfBfugHwUHoB8EU6AfB8ucHwdrnB8HI5wfBu+cHwbHnB8Gq5wfBpecHwaHnB8Ge5wfBnOcHwZrnB8GZ5wfB8YkEwZiHBMEKhgTB5oQEwQ6EBMFwgwTB+4IEwaWCBMFmggTBOIIEwRaCBMH8gQTB6oEEwdyBBMHSgQTBy4EEwcaBBMHCgQTBv4EEwb2BBMG7gQTBBSgBwVgkAcHiIQHBSSABwR0fAcE/HgHBnB0BwSUdAcHMHAHBjBwBwVwcAcE5HAHBHxwBwQwcAcH+GwHB9BsBwewbAcHnGwHB4xsBweAbAcHdGwHBdY/7wDeF+8CrffvAfXj7wDZ1+8DMcvvABnH7wLhv+8DCbvvADW77wIht+8AmbfvA3mz7wKls+8CCbPvAZWz7wFBs+8BBbPvANWz7wC1s+8AnbPvAp9P0wGLF9MDduvTAHLP0wJKt9MA0qvTAuqf0wOel9MCPpPTAk6P0wNmi9MBQovTA66H0wKGh9MBrofTAQ6H0wCWh9MAQofTAAKH0wPSg9MDroPTAxR3uwOgJ7sA/++3AcPDtwHno7cCa4u3AId/twJXc7cC12u3AVNntwFHY7cCS1+3ABdftwJ7W7cBS1u3AGtbtwPHV7cDS1e3AvNXtwKzV7cCg1e3ApW/nwIVU58AeQOfADzHnwPUl58DFHefAvhfnwP8T58BhEefAdA/nwAoO58D/DOfAOwznwKoL58BAC+fA8grnwLgK58COCufAbwrnwFgK58BHCufAycvgwASn4MBDi+DATnbgwNZm4MBuW+DABVPgwNRM4MDRSODAIUbgwCdE4MCyQuDAoEHgwNdA4MBCQODA1T/gwIU/4MBKP+DAHj/gwP4+4MDnPuDADTfawCkE2sBn3tnAAMLZwHqs2cCXnNnA3pDZwDuI2cDegdnAmn3ZwNd62cDPeNnAUHfZwDZ22cBnddnAz3TZwF902cAMdNnAz3PZwKNz2cCCc9nAB7fTwNVw08CXPNPA0hXTwMH40sCl4tLAU9LSwEnG0sBpvdLA4LbSwFuy0sCEr9LAbq3SwOWr0sDDqtLA7qnSwFKp0sDeqNLAiqjSwEuo0sAdqNLAVljNwIfyzMC2qszAFXXMwEZNzMCGL8zA0RjMwA0IzMCv+8vAkfLLwNrry8AV58vAK+TLwAbiy8By4MvASN/LwG7ey8DN3cvAVt3LwP/cy8C/3MvAOy7HwPGXxsAsLsbAoeTFwKWtxcDFhMXAUmbFwABPxcDHPcXAEzHFwLYnxcDPIMXAyxvFwMwYxcCYFsXA+BTFwMcTxcDmEsXAQRLFwMcRxcBuEcXApY3BwNlxwMDV17/AAWq/wIoev8BK5r7AUry+wCedvsA0hb7Ag3O+wHZmvsDXXL7AwFW+wIhQvsBoTb7AJUu+wHpJvsBASL7AWUe+wK9GvsAyRr7A9rQwwfC0MMHstDDB6bQwwee0MMHltDDB5LQwweO0MMHjtDDB4rQwweK0MMHitDDB4bQwweG0MMHhtDDB4bQwweG0MMHhtDDB4bQwweG0MMHhtDDBIE8twRdPLcERTy3BDU8twQpPLcEITy3BBk8twQVPLcEETy3BA08twQNPLcECTy3BAk8twQJPLcECTy3BAk8twQJPLcECTy3BAk8twQJPLcECTy3BTOkpwUHpKcE56SnBM+kpwS7pKcEr6SnBKOkpwSfpKcEl6SnBJekpwSTpKcEj6SnBI+kpwSPpKcEj6SnBIukpwSLpKcEi6SnBIukpwSLpKcEi6SnBf4MmwW6DJsFigybBWoMmwVSDJsFPgybBTIMmwUmDJsFHgybBRoMmwUWDJsFFgybBRIMmwUSDJsFDgybBQ4MmwUODJsFDgybBQ4MmwUODJsFDgybBvh0jwaIdI8GQHSPBhB0jwXsdI8F1HSPBcB0jwW0dI8FqHSPBaB0jwWcdI8FmHSPBZR0jwWUdI8FkHSPBZB0jwWQdI8FkHSPBZB0jwWMdI8FjHSPBCrgfweK3H8HFtx/BsrcfwaW3H8Gctx/BlrcfwZG3H8GNtx/Bi7cfwYm3H8GItx/Bh7cfwYa3H8GFtx/BhbcfwYW3H8GEtx/BhLcfwYS3H8GEtx/BZ1IcwS9SHMEGUhzB6FEcwdRRHMHHURzBvlEcwbdRHMGyURzBrlEcwaxRHMGqURzBqFEcwadRHMGnURzBplEcwaZRHMGlURzBpVEcwaVRHMGlURzB3OwYwY3sGMFU7BjBKewYwQvsGMH26xjB6esYwd/rGMHY6xjB0+sYwc/rGMHM6xjByusYwcnrGMHI6xjBx+sYwcfrGMHG6xjBxusYwcbrGMHG6xjBdYcVwQWHFcG0hhXBeYYVwU2GFcEuhhXBGIYVwQqGFcEAhhXB+YUVwfSFFcHwhRXB7YUVweuFFcHqhRXB6YUVweiFFcHnhRXB54UVweeFFcHmhRXBPiISwaEhEsEuIRLB2yASwZ4gEsFxIBLBUSASwTogEsEsIBLBIiASwRogEsEVIBLBESASwQ4gEsEMIBLBCiASwQkgEsEIIBLBCCASwQcgEsEHIBLBS70OwW68DsHNuw7BWLsOwQK7DsHDug7BlboOwXS6DsFcug7BTboOwUO6DsE7ug7BNroOwTK6DsEvug7BLboOwSu6DsEqug7BKboOwSm6DsEoug7BuVgLwYNXC8GgVgvB+lULwYFVC8EpVQvB6FQLwblUC8GXVAvBflQLwW9UC8FkVAvBXVQLwVdUC8FTVAvBUFQLwU1UC8FMVAvBS1QLwUpUC8FJVAvBsPQHwfryB8G78QfB0vAHwSfwB8Gr7wfBUO8HwQ7vB8Hd7gfBuu4HwaDuB8GR7gfBhu4HwX7uB8F47gfBdO4HwXHuB8Fu7gfBbe4HwWvuB8Fq7gfBZZEEwf6OBME8jQTB9IsEwQSLBMFVigTB1YkEwXiJBMEziQTBAokEwd2IBMHDiATBs4gEwaeIBMGfiATBmYgEwZWIBMGRiATBj4gEwY2IBMGMiATBJi8BwcUrAcFNKQHBfycBwS4mAcE3JQHBgyQBwf8jAcGfIwHBWSMBwSYjAcEBIwHB5SIBwdQiAcHJIgHBwCIBwboiAcG2IgHBsiIBwbAiAcGuIgHB45z7wGaT+8B1jPvAY4f7wK6D+8D5gPvA/n77wI19+8B/fPvAuXv7wCl7+8DAevvAc3r7wDt6+8ASevvA93n7wOZ5+8DZefvA0Hn7wMl5+8DEefvAEuD0wL7S9MD9yPTA2sH0wKO89MDUuPTAC7b0wAK09MCGsvTAcLH0wKaw9MARsPTApa/0wFav9MAdr/TA8670wNSu9MC9rvTAra70wKGu9MCYrvTA8CjuwDsW7sCHCO7AgP7twCr37cDO8e3A4+3twAbr7cDv6O3AaOftwErm7cB65e3A4eTtwHLk7cAh5O3A5uPtwLvj7cCb4+3AhOPtwHPj7cBn4+3AV3nnwJNf58BZTOfAQz7nwPQz58BqLOfA5ibnwN8i58DuH+fAyB3nwDYc58AQG+fAOhrnwJ0Z58ArGefA1xjnwJoY58BuGOfATRjnwDYY58AkGOfAy9PgwJWw4MAzluDAb4LgwPVz4MBcaeDAm2HgwPFb4MDNV+DAxlTgwJBS4MDzUODAxU/gwOlO4MBITuDA0k3gwHxN4MA+TeDAEE3gwO5M4MDWTODAKD3awAQM2sDW59nA0szZwIG42cCfqdnAu57ZwMOW2cDvkNnArYzZwJGJ2cBLh9nAooXZwGyE2cCJg9nA5ILZwGuC2cATgtnA0oHZwKOB2cCBgdnAHLvTwMZ208BLRNPAHh/TwHMD08CS7tLARt/SwBPU0sDiy9LA5MXSwITB0sBRvtLA+7vSwEa60sAHudLAHrjSwHS30sD4ttLAnbbSwFu20sAqttLA0VrNwHP2zMB8sMzAoXzMwG5WzMAYOszAoyTMwOkUzMBnCczA+wDMwNL6y8BS9svACfPLwKLwy8Dg7svAmO3LwKnsy8D668vAeuvLwB3ry8DZ6svA9S7HwEKaxsDuMcbAPOrFwAm1xcDKjcXAxHDFwLZaxcCNSsXAuD7FwA82xcC7L8XAGivFwLknxcBBJcXAcyPFwCIixcArIcXAeCDFwPQfxcCUH8XApo3BwHhywMD82b/Amm2/wPwjv8CG7b7AM8W+wHmnvsDOkL7AMYC+wAd0vsAha77An2S+wN5fvsBkXL7A2lm+wP9XvsCkVr7Ap1W+wO5UvsBnVL7ACL0wwQK9MMH+vDDB+rwwwfi8MMH3vDDB9bwwwfW8MMH0vDDB87wwwfO8MMHzvDDB87wwwfO8MMHzvDDB8rwwwfK8MMHyvDDB8rwwwfK8MMHyvDDBMVctwSlXLcEjVy3BHlctwRtXLcEZVy3BF1ctwRZXLcEVVy3BFVctwRRXLcEUVy3BFFctwRNXLcETVy3BE1ctwRNXLcETVy3BE1ctwRNXLcETVy3BX/EpwVPxKcFK8SnBRPEpwT/xKcE88SnBOvEpwTjxKcE38SnBNvEpwTXxKcE18SnBNPEpwTTxKcE08SnBNPEpwTTxKcE08SnBNPEpwTTxKcE08SnBkYsmwYGLJsF0iybBa4smwWWLJsFgiybBXYsmwVuLJsFZiybBV4smwVeLJsFWiybBVYsmwVWLJsFViybBVYsmwVSLJsFUiybBVIsmwVSLJsFUiybBzCUjwbQlI8GiJSPBliUjwY0lI8GGJSPBgSUjwX4lI8F7JSPBeSUjwXglI8F3JSPBdyUjwXYlI8F2JSPBdSUjwXUlI8F1JSPBdSUjwXUlI8F1JSPBEcAfwe+/H8HWvx/BxL8fwbe/H8Guvx/Bp78fwaK/H8Gfvx/BnL8fwZq/H8GZvx/BmL8fwZe/H8GXvx/Blr8fwZa/H8GWvx/Blr8fwZa/H8GVvx/BZVocwTVaHMESWhzB+VkcweZZHMHZWRzBz1kcwchZHMHDWRzBwFkcwb1ZHMG7WRzBulkcwblZHMG4WRzBt1kcwbdZHMG3WRzBtlkcwbZZHMG2WRzB0PQYwYv0GMFZ9BjBNfQYwRv0GMEI9BjB+/MYwfHzGMHp8xjB5PMYweDzGMHe8xjB3PMYwdrzGMHZ8xjB2PMYwdjzGMHY8xjB1/MYwdfzGMHX8xjBWY8VwfiOFcGxjhXBfo4VwVmOFcE+jhXBKo4VwRyOFcESjhXBC44VwQWOFcEBjhXB/40VwfyNFcH7jRXB+o0VwfmNFcH5jRXB+I0VwfiNFcH4jRXBDioSwYQpEsEgKRLB1ygSwaIoEsF8KBLBYCgSwUwoEsE+KBLBMygSwSwoEsEmKBLBIigSwR8oEsEdKBLBHCgSwRsoEsEaKBLBGSgSwRkoEsEZKBLBAcUOwT3EDsGvww7BSMMOwf3CDsHHwg7BoMIOwYPCDsFvwg7BYMIOwVXCDsFNwg7BR8IOwUPCDsFAwg7BPsIOwTzCDsE7wg7BOsIOwTrCDsE5wg7BTWALwTZfC8FtXgvB2l0LwXBdC8EjXQvB7FwLwcNcC8GmXAvBkVwLwYFcC8F2XAvBblwLwWhcC8FkXAvBYVwLwV9cC8FdXAvBXFwLwVtcC8FbXAvBFvwHwYv6B8Fs+QfBnPgHwQb4B8GZ9wfBSvcHwRD3B8Hn9gfByfYHwbP2B8Gj9gfBmPYHwY/2B8GJ9gfBhfYHwYL2B8GA9gfBfvYHwX32B8F89gfBkJgEwWCWBMHJlATBopMEwc2SBMEykgTBwpEEwXCRBME1kQTBC5EEweyQBMHVkATBxZAEwbmQBMGxkATBqpAEwaaQBMGjkATBoJAEwZ+QBMGdkATBBjYBwesyAcGrMAHBCS8BwdktAcH+LAHBXiwBwesrAcGXKwHBWisBwS4rAcEPKwHB9yoBwecqAcHbKgHB0ioBwcsqAcHHKgHBxCoBwcEqAcG/KgHB3an7wBOh+8CymvvAEZb7wLaS+8BHkPvAg477wDuN+8BOjPvAoov7wCWL+8DLivvAior7wFqK+8A4ivvAH4r7wA2K+8AAivvA9on7wO+J+8DqifvAGuz0wKff9MCc1vTADND0wEnL9MDVx/TAU8X0wIPD9MAywvTAPsH0wI3A9MAMwPTAr7/0wGy/9MA7v/TAGL/0wP6+9MDsvvTA3r70wNS+9MDNvvTAyzPuwCwi7sBeFe7AEAzuwFAF7sBqAO7A3PztwEn67cBq+O3AEPftwBX27cBe9e3A2/TtwHv07cA29O3AA/TtwN/z7cDF8+3AsfPtwKTz7cCa8+3AzILnwFJq58AzWOfABkvnwHVB58CCOufAeDXnwNEx58AqL+fAPi3nwNkr58DXKufAHCrnwJQp58AxKefA6ijnwLYo58CRKOfAdijnwGIo58BUKOfAodvgwOm54MDVoODAMo7gwKSA4MDMduDAp2/gwHhq4MC1ZuDA+2PgwAFi4MCSYODAiF/gwMde4MA8XuDA113gwI1d4MBYXeDAMV3gwBZd4MABXeDAKEPawLUT2sAK8dnAV9fZwCvE2cA7ttnAG6zZwMGk2cBsn9nAjZvZwL+Y2cC2ltnAPZXZwCuU2cBlk9nA1ZLZwG2S2cAiktnA65HZwMOR2cCmkdnAI7/TwJx808DWS9PAMCjTwNsN08Aj+tLAzevSwGLh0sDS2dLAVtTSwFvQ0sB4zdLAYMvSwNzJ0sDCyNLA9sfSwGLH0sD3xtLAqsbSwHHG0sBJxtLASF3NwFL6zMAptszABoTMwF9fzMBiRMzAGzDMwFshzMClFszA3Q7MwDgJzMAgBczAKALMwAEAzMBx/svAUP3LwH78y8Dm+8vAd/vLwCf7y8Dt+svAry/HwI6cxsCkNcbAwO/FwEi8xcCZlsXA8HrFwBRmxcDpVsXA5EvFwORDxcAVPsXA3znFwNE2xcCaNMXA/zLFwNUxxcD9MMXAYDDFwO8vxcCdL8XApo3BwBdzwMAg3L/AJ3G/wFgpv8Ce9L7A382+wIWxvsASnL7AeIy+wCKBvsDneL7A7nK+wJhuvsB0a77ALGm+wIZnvsBTZr7AdWW+wNRkvsBfZL7Aw8Qwwb7EMMG7xDDBuMQwwbbEMMG1xDDBtMQwwbPEMMGzxDDBs8QwwbLEMMGyxDDBssQwwbLEMMGyxDDBssQwwbLEMMGyxDDBssQwwbLEMMGyxDDB614tweReLcHfXi3B214twdleLcHXXi3B1l4twdVeLcHUXi3B1F4twdNeLcHTXi3B014twdNeLcHSXi3B0l4twdJeLcHSXi3B0l4twdJeLcHSXi3BFvkpwQz5KcEF+SnBAPkpwfz4KcH6+CnB+Pgpwfb4KcH1+CnB9fgpwfT4KcH0+CnB9PgpwfP4KcHz+CnB8/gpwfP4KcHz+CnB8/gpwfP4KcHz+CnBRpMmwTiTJsEukybBJpMmwSGTJsEdkybBGpMmwRiTJsEXkybBFpMmwRWTJsEVkybBFJMmwRSTJsEUkybBFJMmwRSTJsEUkybBFJMmwRSTJsEUkybBfC0jwWgtI8FZLSPBTy0jwUctI8FCLSPBPi0jwTstI8E5LSPBOC0jwTctI8E2LSPBNS0jwTUtI8E1LSPBNS0jwTQtI8E0LSPBNC0jwTQtI8E0LSPBvMcfwZ/HH8GKxx/Be8cfwXDHH8Fpxx/BY8cfwV/HH8Fcxx/BWscfwVjHH8FXxx/BV8cfwVbHH8FWxx/BVccfwVXHH8FVxx/BVccfwVXHH8FVxx/BCWIcweBhHMHCYRzBrGEcwZ1hHMGSYRzBimEcwYRhHMGAYRzBfWEcwXthHMF5YRzBeGEcwXdhHMF3YRzBdmEcwXZhHMF2YRzBdmEcwXZhHMF1YRzBavwYwS78GMEE/BjB5fsYwc/7GMG/+xjBs/sYwav7GMGl+xjBofsYwZ77GMGc+xjBmvsYwZn7GMGY+xjBl/sYwZf7GMGX+xjBlvsYwZb7GMGW+xjB5pYVwZGWFcFTlhXBJ5YVwQiWFcHxlRXB4JUVwdWVFcHMlRXBxpUVwcKVFcG/lRXBvJUVwbuVFcG5lRXBuZUVwbiVFcG4lRXBt5UVwbeVFcG3lRXBiTESwRAxEsG4MBLBeTASwUswEsErMBLBEzASwQIwEsH2LxLB7S8SwecvEsHjLxLB3y8Swd0vEsHbLxLB2i8SwdkvEsHZLxLB2C8SwdgvEsHYLxLBZcwOwbfLDsE5yw7B38oOwZ7KDsFvyg7BTsoOwTbKDsEkyg7BGMoOwQ/KDsEIyg7BBMoOwQDKDsH+yQ7B/MkOwfvJDsH6yQ7B+ckOwfnJDsH5yQ7BkmcLwZhmC8HlZQvBY2ULwQZlC8HEZAvBlGQLwXFkC8FYZAvBRmQLwTlkC8EwZAvBKWQLwSVkC8EhZAvBH2QLwR1kC8EcZAvBG2QLwRpkC8EZZAvBMgMIwc0BCMHMAAjBEwAIwY7/B8Eu/wfB6f4Hwbj+B8GU/gfBe/4HwWj+B8Fb/gfBUf4HwUr+B8FG/gfBQv4HwT/+B8E+/gfBPP4HwTv+B8E7/gfBd58EwXidBMEInATBAJsEwUGaBMG4mQTBVpkEwQ+ZBMHcmATBt5gEwZ2YBMGKmATBfJgEwXOYBMFsmATBZpgEwWOYBMFgmATBXpgEwV2YBMFcmATBpzwBwc05AcG/NwHBRTYBwTQ1AcFwNAHB4zMBwX4zAcE1MwHBATMBwdsyAcHAMgHBrDIBwZ4yAcGUMgHBjTIBwYcyAcGEMgHBgTIBwX8yAcF+MgHBabb7wESu+8BnqPvALqT7wCOh+8DznvvAYJ37wD6c+8Bum/vA2Jr7wGya+8AemvvA5pn7wL6Z+8ChmfvAjZn7wH6Z+8BzmfvAa5n7wGaZ+8BimfvAw/f0wCLs9MDA4/TAtt30wF3Z9MA81vTA/NP0wF3S9MAy0fTAW9D0wMHP9MBSz/TAAs/0wMjO9MCfzvTAgc70wGzO9MBdzvTAUs70wErO9MBEzvTAWT7uwMAt7sDIIe7AJxnuwO8S7sB2Du7APQvuwOsI7sBAB+7ADQbuwDAF7sCRBO7AHgTuwMwD7sCRA+7AZgPuwEgD7sAyA+7AIgPuwBYD7sAOA+7ABYznwMZ058CxY+fAX1fnwH1O58AXSOfAe0PnwCpA58DHPefADzznwNM658DvOefASznnwNY458CBOOfARDjnwBg458D5N+fA4jfnwNI358DGN+fATePgwATD4MAtq+DAmZngwOqM4MDGg+DAL33gwHF44MAHdeDAknLgwM1w4MCHb+DAnW7gwPVt4MB7beDAJG3gwOVs4MC4bODAmGzgwIBs4MBwbODADUnawD0b2sAF+tnAlOHZwHzP2cBuwtnABbnZwD2y2cBbrdnA16nZwE+n2cB9pdnALqTZwD2j2cCPotnAEqLZwLih2cB4odnASaHZwCih2cAQodnAHcPTwFmC08A5U9PACzHTwPsX08BcBdPA7PfSwDzu0sBB59LAOuLSwJze0sAB3NLAIdrSwMjY0sDQ19LAHdfSwJ3W0sBA1tLA/tXSwM7V0sCs1dLAuV/NwCT+zMC+u8zARYvMwBpozMBmTszAPDvMwGctzMBuI8zAPxzMwBIXzMBZE8zAqhDMwLwOzMBZDczAWQzMwKELzMAdC8zAvgrMwHkKzMBICszAaDDHwNaexsBOOcbALfXFwGHDxcAzn8XA1oTFwB1xxcDhYsXAnljFwDhRxcDkS8XAD0jFwExFxcBQQ8XA4kHFwNtAxcAdQMXAlT/FwDM/xcDsPsXApo3BwLRzwMA/3r/AqXS/wJ0uv8CS+77AWNa+wE67vsACp77AXJi+wMuNvsAuhr7AsoC+wMB8vsDoeb7A3Xe+wGR2vsBVdb7AknS+wAZ0vsChc77AJcwwwSHMMMEfzDDBHcwwwRvMMMEazDDBGcwwwRnMMMEZzDDBGMwwwRjMMMEYzDDBGMwwwRjMMMEYzDDBGMwwwRjMMMEYzDDBGMwwwRjMMMEYzDDBTGYtwUZmLcFCZi3BP2YtwT1mLcE8Zi3BO2YtwTpmLcE6Zi3BOWYtwTlmLcE5Zi3BOWYtwThmLcE4Zi3BOGYtwThmLcE4Zi3BOGYtwThmLcE4Zi3BdgAqwW0AKsFnACrBYwAqwWAAKsFeACrBXQAqwVwAKsFbACrBWgAqwVoAKsFaACrBWQAqwVkAKsFZACrBWQAqwVkAKsFZACrBWQAqwVkAKsFZACrBo5omwZeaJsGPmibBiZomwYSaJsGBmibBf5omwX2aJsF8mibBe5omwXuaJsF6mibBepomwXqaJsF6mibBepomwXqaJsF6mibBeZomwXmaJsF5mibB1jQjwcU0I8G5NCPBsDQjwao0I8GlNCPBojQjwaA0I8GeNCPBnTQjwZw0I8GbNCPBmzQjwZs0I8GbNCPBmjQjwZo0I8GaNCPBmjQjwZo0I8GaNCPBEc8fwfnOH8Hnzh/B2s4fwdHOH8HLzh/Bxs4fwcPOH8HAzh/Bv84fwb7OH8G9zh/BvM4fwbzOH8G7zh/Bu84fwbvOH8G7zh/Bu84fwbvOH8G7zh/BWGkcwTVpHMEbaRzBCWkcwfxoHMHyaBzB7GgcwedoHMHkaBzB4WgcweBoHMHeaBzB3Wgcwd1oHMHcaBzB3GgcwdxoHMHcaBzB22gcwdtoHMHbaBzBsAMZwX0DGcFYAxnBPQMZwSsDGcEdAxnBFAMZwQ0DGcEIAxnBBQMZwQIDGcEAAxnB/wIZwf4CGcH9AhnB/QIZwf0CGcH8AhnB/AIZwfwCGcH8AhnBIZ4VwdadFcGhnRXBe50VwWCdFcFNnRXBP50VwTWdFcEunRXBKZ0VwSWdFcEjnRXBIZ0VwSCdFcEfnRXBHp0VwR6dFcEdnRXBHZ0VwR2dFcEdnRXBtTgSwUk4EsH9NxLBxjcSwZ83EsGDNxLBbzcSwWE3EsFWNxLBTzcSwUo3EsFGNxLBRDcSwUI3EsFANxLBPzcSwT83EsE+NxLBPjcSwT43EsE9NxLBfNMOweHSDsFy0g7BI9IOwevRDsHC0Q7BpdEOwZHRDsGC0Q7BeNEOwXDRDsFr0Q7BZ9EOwWTRDsFi0Q7BYdEOwWDRDsFf0Q7BX9EOwV/RDsFe0Q7BjW4Lwa1tC8ENbQvBm2wLwUpsC8EPbAvB5msLwchrC8GzawvBpGsLwZlrC8GRawvBjGsLwYhrC8GFawvBg2sLwYJrC8GBawvBgGsLwYBrC8F/awvBCAoIwcUICMHeBwjBOgcIwcQGCMFwBgjBNAYIwQoGCMHrBQjB1QUIwcYFCMG7BQjBswUIwa0FCMGpBQjBpgUIwaQFCMGjBQjBoQUIwaEFCMGgBQjBHKYEwUqkBMH+ogTBEKIEwWehBMHuoATBl6AEwVmgBMEtoATBDqAEwfefBMHnnwTB3J8EwdSfBMHOnwTByp8EwcefBMHFnwTBw58EwcKfBMHBnwTBDEMBwW1AAcGOPgHBNz0BwUM8AcGUOwHBFzsBwb46AcF/OgHBUToBwTE6AcEaOgHBCToBwf05AcH1OQHB7zkBwes5AcHoOQHB5TkBweQ5AcHjOQHBisL7wP+6+8CatfvAwLH7wP+u+8AIrfvAoKv7wKCq+8DoqfvAZan7wAip+8DFqPvAlqj7wHSo+8BbqPvASqj7wD6o+8A1qPvAL6j7wCqo+8AnqPvAEQP1wDT49MBv8PTA4er0wOjm9MAS5PTADOL0wJrg9MCR3/TA1N70wE3e9MDt3fTAqN30wHfd9MBU3fTAO930wCrd9MAd3fTAFN30wA3d9MAJ3fTAm0juwPo47sDKLe7AySXuwBAg7sD5G+7ADRnuwPcW7sB5Fe7AaRTuwKYT7sAbE+7AuBLuwHES7sA/Eu7AGxLuwAES7sDvEe7A4hHuwNgR7sDREe7ABJXnwO9+58DWbufAUGPnwBFb58AsVefA9lDnwPNN58DNS+fARErnwCtJ58BjSOfA1EfnwG5H58AlR+fA8UbnwMxG58CxRufAnkbnwJBG58CHRufAz+rgwOXL4MA9teDAqaTgwMqY4MBMkODAOorgwOOF4MDJguDAkoDgwP1+4MDcfeDADn3gwHp84MARfODAxnvgwJB74MBqe+DAT3vgwDt74MAte+DA2E7awJ0i2sDIAtrAievZwHba2cA8ztnAfcXZwDy/2cDDutnAkrfZwEq12cCps9nAf7LZwKqx2cASsdnAprDZwFiw2cAhsNnA+q/ZwN2v2cDJr9nACsfTwP2H08B2WtPAsDnTwNYh08BAENPAqAPTwKb60sA09NLAmu/SwE/s0sD26dLASOjSwBXn0sA65tLAnuXSwC7l0sDe5NLApeTSwHzk0sBf5NLAJGLNwOkBzcA6wczAXpLMwKBwzMAlWMzACUbMwBE5zMDJL8zAJinMwGgkzMAEIczAmB7MwN4czMCiG8zAwBrMwB8azMCsGczAWhnMwB8ZzMD1GMzAIDHHwBmhxsDsPMbAhPrFwFbKxcCap8XAeo7FwNR7xcB4bsXA6WTFwBNexcAwWcXAslXFwDRTxcBsUcXAJlDFwD5PxcCYTsXAIU7FwMxNxcCQTcXApo3BwFJ0wMBa4L/AIXi/wM4zv8BjAr/An96+wNbEvsCisb7A4KO+wAeavsD8kr7A9I2+wFuKvsDJh77A9IW+wKSEvsC1g77ACoO+wI+CvsA4gr7ANdMwwTLTMMEw0zDBLtMwwS3TMMEs0zDBK9MwwSvTMMEr0zDBK9MwwSrTMMEq0zDBKtMwwSrTMMEq0zDBKtMwwSrTMMEq0zDBKtMwwSrTMMEq0zDBW20twVZtLcFTbS3BUG0twU9tLcFObS3BTW0twUxtLcFMbS3BS20twUttLcFLbS3BS20twUttLcFLbS3BS20twUttLcFLbS3BS20twUttLcFLbS3BgwcqwXwHKsF3ByrBdAcqwXEHKsFvByrBbgcqwW0HKsFtByrBbAcqwWwHKsFsByrBbAcqwWsHKsFrByrBawcqwWsHKsFrByrBawcqwWsHKsFrByrBrqEmwaShJsGdoSbBmKEmwZShJsGSoSbBkKEmwY+hJsGOoSbBjaEmwY2hJsGNoSbBjKEmwYyhJsGMoSbBjKEmwYyhJsGMoSbBjKEmwYyhJsGMoSbB3jsjwdA7I8HGOyPBvjsjwbk7I8G1OyPBszsjwbE7I8GwOyPBrzsjwa47I8GuOyPBrTsjwa07I8GtOyPBrTsjwa07I8GtOyPBrTsjwa07I8GsOyPBFtYfwQHWH8Hy1R/B59Ufwd/VH8Ha1R/B1tUfwdTVH8HS1R/B0NUfwc/VH8HP1R/BztUfwc7VH8HO1R/BzdUfwc3VH8HN1R/BzdUfwc3VH8HN1R/BV3AcwTlwHMEjcBzBE3AcwQhwHMEBcBzB+28cwfdvHMH0bxzB8m8cwfFvHMHwbxzB728cwe9vHMHubxzB7m8cwe5vHMHubxzB7m8cwe5vHMHubxzBqAoZwXsKGcFbChnBRQoZwTUKGcEqChnBIgoZwRwKGcEYChnBFQoZwRMKGcESChnBEQoZwRAKGcEPChnBDwoZwQ8KGcEPChnBDwoZwQ4KGcEOChnBD6UVwc2kFcGfpBXBfqQVwWekFcFXpBXBS6QVwUOkFcE9pBXBOaQVwTakFcE0pBXBMqQVwTGkFcExpBXBMKQVwTCkFcEvpBXBL6QVwS+kFcEvpBXBlT8SwTY/EsHzPhLBwz4SwaE+EsGKPhLBeT4SwW0+EsFkPhLBXj4SwVo+EsFXPhLBVT4SwVM+EsFSPhLBUT4SwVE+EsFQPhLBUD4SwVA+EsFQPhLBSdoOwb/ZDsFe2Q7BGNkOwefYDsHF2A7BrNgOwZvYDsGO2A7BhdgOwX/YDsF72A7BeNgOwXXYDsF02A7Bc9gOwXLYDsFx2A7BcdgOwXHYDsFx2A7BQXULwXl0C8HqcwvBhnMLwT5zC8EMcwvB6HILwc5yC8G8cgvBsHILwadyC8GgcgvBnHILwZhyC8GWcgvBlXILwZNyC8GTcgvBknILwZJyC8GRcgvBmxAIwXcPCMGoDgjBFg4Iwa4NCMFkDQjBMA0IwQsNCMHxDAjB3gwIwdEMCMHIDAjBwQwIwb0MCMG5DAjBtwwIwbUMCMG0DAjBswwIwbMMCMGyDAjBgqwEwdqqBMGtqQTB2KgEwUGoBMHWpwTBiqcEwVWnBMEvpwTBFKcEwQCnBMHzpgTB6aYEweKmBMHepgTB2qYEwdimBMHWpgTB1aYEwdSmBMHTpgTBOEkBwdBGAcEbRQHB5UMBwQlDAcFtQgHB/0EBwbFBAcF5QQHBUkEBwTZBAcEiQQHBFEEBwQtBAcEEQQHB/0ABwftAAcH5QAHB90ABwfZAAcH1QAHBRc77wEjH+8BTwvvAz777wFG8+8CMuvvATLn7wGi4+8DHt/vAVbf7wAS3+8DLtvvAorb7wIa2+8BxtvvAY7b7wFi2+8BRtvvATLb7wEi2+8BGtvvABg71wOED9cCt/PTAkff0wPHz9MBf8fTAje/0wELu9MBY7fTAsuz0wDzs9MDp6/TAruv0wITr9MBm6/TAUev0wELr9MA46/TAMOv0wCvr9MAn6/TAlVLuwN1D7sBoOe7A+zHuwLcs7sD6KO7AVCbuwHMk7sAeI+7ALSLuwIIh7sAIIe7AsiDuwHYg7sBKIO7ALCDuwBYg7sAHIO7A/B/uwPQf7sDvH+7Ayp3nwNGI58CmeefA3m7nwDdn58DJYefA713nwDRb58BFWefA5VfnwOxW58A8VufAv1XnwGZV58AnVefA+1TnwNtU58DFVOfAtVTnwKpU58CiVOfAKfLgwI/U4MAHv+DAZa/gwEmk4MBlnODAzZbgwNSS4MAEkODABY7gwJuM4MCai+DA5IrgwGOK4MAIiuDAx4ngwJmJ4MB5ieDAYongwFGJ4MBGieDAiVTawNUp2sBWC9rAOvXZwB3l2cCq2dnAidHZwMTL2cCsx9nAxcTZwLfC2cBBwdnAOcDZwH2/2cD4vtnAmr7ZwFe+2cAovtnAB77ZwO+92cDevdnA6crTwImN08CMYdPAIULTwG0r08DSGtPABQ/TwKQG08CyANPAevzSwHz50sBd99LA3PXSwMv00sAK9NLAgfPSwCDz0sDb8tLAqvLSwIjy0sBv8tLAi2TNwKIFzcCgxszAUpnMwPN4zMCjYczAhlDMwF1EzMC6O8zAmDXMwD8xzMAqLszA+ivMwG0qzMBUKczAjSjMwAAozMCcJ8zAVSfMwCInzMD/JszA1zHHwFejxsB/QMbAxP/FwCjRxcDPr8XA3pfFwDuGxcCyecXAy3DFwHpqxcD+ZcXA0WLFwJBgxcD3XsXA1V3FwAddxcB2XMXAD1zFwMVbxcCSW8XApo3BwO50wMBx4r/Ajnu/wOk4v8ASCb/Atua+wB/OvsDzu77ACK++wNulvsBYn77AuZq+wHKXvsAflb7AepO+wE+SvsB7kb7A5ZC+wHuQvsAvkL7A99kwwfXZMMHz2TDB8dkwwfDZMMHw2TDB79kwwe/ZMMHv2TDB79kwwe/ZMMHu2TDB7tkwwe7ZMMHu2TDB7tkwwe7ZMMHu2TDB7tkwwe7ZMMHu2TDBHHQtwRh0LcEVdC3BE3QtwRJ0LcERdC3BEHQtwRB0LcEQdC3BD3QtwQ90LcEPdC3BD3QtwQ90LcEPdC3BD3QtwQ90LcEPdC3BD3QtwQ90LcEPdC3BQw4qwT0OKsE5DirBNg4qwTQOKsEzDirBMg4qwTEOKsExDirBMA4qwTAOKsEwDirBMA4qwTAOKsEwDirBMA4qwTAOKsEwDirBMA4qwTAOKsEwDirBbKgmwWSoJsFeqCbBWqgmwVeoJsFVqCbBVKgmwVOoJsFSqCbBUagmwVGoJsFRqCbBUagmwVCoJsFQqCbBUKgmwVCoJsFQqCbBUKgmwVCoJsFQqCbBmkIjwY5CI8GFQiPBf0IjwXtCI8F4QiPBdkIjwXRCI8FzQiPBckIjwXJCI8FyQiPBcUIjwXFCI8FxQiPBcUIjwXFCI8FxQiPBcUIjwXFCI8FxQiPBztwfwbzcH8Gv3B/BptwfwaDcH8Gc3B/BmdwfwZbcH8GV3B/BlNwfwZPcH8GT3B/BktwfwZLcH8GS3B/BktwfwZLcH8GR3B/BkdwfwZHcH8GR3B/BC3ccwfF2HMHedhzB0XYcwch2HMHBdhzBvXYcwbp2HMG3dhzBtnYcwbV2HMG0dhzBs3YcwbN2HMGzdhzBsnYcwbJ2HMGydhzBsnYcwbJ2HMGydhzBVhEZwS8RGcETERnBABEZwfMQGcHpEBnB4hAZwd4QGcHaEBnB2BAZwdYQGcHVEBnB1BAZwdQQGcHTEBnB0xAZwdMQGcHTEBnB0xAZwdMQGcHTEBnBs6sVwXqrFcFSqxXBNqsVwSKrFcEUqxXBCqsVwQOrFcH/qhXB+6oVwfmqFcH3qhXB9qoVwfWqFcH1qhXB9KoVwfSqFcH0qhXB86oVwfOqFcHzqhXBLkYSwdpFEsGfRRLBdkUSwVlFEsFERRLBNkUSwSxFEsElRRLBIEUSwRxFEsEaRRLBGEUSwRdFEsEWRRLBFUUSwRVFEsEURRLBFEUSwRRFEsEURRLB0uAOwVfgDsEB4A7BxN8OwZnfDsF73w7BZt8OwVffDsFN3w7BRt8OwUHfDsE93w7BOt8OwTnfDsE33w7BNt8OwTbfDsE13w7BNd8OwTXfDsE13w7Bs3sLwf96C8GBegvBKHoLwel5C8G9eQvBnnkLwYl5C8F5eQvBbnkLwWd5C8FieQvBXnkLwVt5C8FZeQvBWHkLwVd5C8FWeQvBVnkLwVZ5C8FVeQvB7hYIwecVCMEtFQjBqxQIwU8UCMEPFAjB4RMIwcETCMGrEwjBmxMIwZATCMGIEwjBgxMIwX8TCMF8EwjBehMIwXkTCMF4EwjBdxMIwXcTCMF2EwjBrbIEwSuxBMEbsATBXK8EwdWuBMF3rgTBNK4EwQWuBMHkrQTBza0Ewb2tBMGxrQTBqa0EwaStBMGgrQTBna0EwZutBMGZrQTBmK0EwZitBMGXrQTBLU8BwfdMAcFoSwHBUEoBwYtJAcEASQHBnkgBwVpIAcEpSAHBB0gBwe9HAcHfRwHB00cBwcpHAcHFRwHBwEcBwb5HAcG8RwHBukcBwblHAcG4RwHBntn7wCXT+8CWzvvAYcv7wB/J+8CIx/vAasb7wKHF+8AUxfvAsMT7wGrE+8A5xPvAFsT7wP7D+8Dtw/vA4cP7wNjD+8DSw/vAzsP7wMvD+8DJw/vApxj1wC0P9cCACPXAzAP1wH0A9cAp/vTAhfz0wF779MCP+vTA/fn0wJb59MBO+fTAG/n0wPf49MDe+PTAzfj0wMD49MC3+PTAsfj0wK349MCq+PTASFzuwGxO7sCmRO7Awz3uwOo47sCANe7AGTPuwGgx7sA4MO7AYi/uwMsu7sBhLu7AFy7uwOIt7sC9Le7Aoy3uwJEt7sCELe7Aey3uwHUt7sBxLe7AWqbnwG6S58AjhOfADnrnwPRy58DzbefAbmrnwPRn58A1ZufA+2TnwB5k58CDY+fAFmPnwMli58CTYufAbWLnwFJi58A/YufAMmLnwCli58AiYufAW/ngwATd4MCNyODAz7ngwGmv4MAWqODA7aLgwEuf4MC9nODA8JrgwK2Z4MDJmODAKJjgwLiX4MBol+DAMZfgwAmX4MDuluDA2pbgwM2W4MDDluDAIVrawOcw2sCvE9rAqP7ZwHTv2cC75NnALd3ZwNrX2cAb1NnAeNHZwJ3P2cBPztnAZM3ZwL/M2cBLzNnA+cvZwL/L2cCXy9nAesvZwGbL2cBYy9nAu87TwPyS08B+aNPAXkrTwMM008AWJdPABhrTwDsS08C+DNPA4QjTwCkG08A/BNPA5gLTwPMB08BJAdPA0QDTwH0A08BBANPAGADTwPr/0sDm/9LA7GbNwE8JzcDvy8zAIqDMwBSBzMDhaszAtVrMwE5PzMBER8zAmkHMwJ49zMDQOszA1jjMwHM3zMB5NszAyTXMwE01zMD2NMzAuTTMwI40zMBwNMzAjjLHwJGlxsAHRMbA7gTGwNfXxcDTt8XAAqHFwFaQxcCThMXASHzFwHF2xcBVcsXAcG/FwGdtxcD4a8XA9mrFwEBqxcDBacXAZ2nFwChpxcD7aMXApo3BwIp1wMCD5L/A8H6/wO89v8CfD7/Ane6+wCvXvsD5xb7A2Lm+wEqxvsBEq77AB6e+wAukvsDxob7Ad6C+wG2fvsCxnr7ALp6+wNGdvsCQnb7AceAwwW7gMMFt4DDBbOAwwWvgMMFr4DDBauAwwWrgMMFq4DDBauAwwWrgMMFp4DDBaeAwwWngMMFp4DDBaeAwwWngMMFp4DDBaeAwwWngMMFp4DDBlXotwZF6LcGPei3BjnotwYx6LcGMei3Bi3otwYt6LcGLei3BinotwYp6LcGKei3BinotwYp6LcGKei3BinotwYp6LcGKei3BinotwYp6LcGKei3BuhQqwbYUKsGyFCrBsBQqwa4UKsGtFCrBrBQqwawUKsGrFCrBqxQqwasUKsGrFCrBqxQqwasUKsGrFCrBqxQqwasUKsGrFCrBqxQqwasUKsGrFCrB4q4mwduuJsHXribB064mwdGuJsHPribBzq4mwc2uJsHMribBzK4mwcyuJsHMribBy64mwcuuJsHLribBy64mwcuuJsHLribBy64mwcuuJsHLribBDkkjwQRJI8H9SCPB90gjwfRII8HxSCPB8Egjwe9II8HuSCPB7Ugjwe1II8HsSCPB7EgjwexII8HsSCPB7EgjwexII8HsSCPB7EgjwexII8HsSCPBP+MfwTDjH8El4x/BHuMfwRjjH8EV4x/BEuMfwRDjH8EP4x/BDuMfwQ7jH8EN4x/BDeMfwQ3jH8EN4x/BDeMfwQzjH8EM4x/BDOMfwQzjH8EM4x/BeH0cwWJ9HMFSfRzBR30cwT99HME5fRzBNn0cwTN9HMExfRzBMH0cwS99HMEufRzBLn0cwS59HMEtfRzBLX0cwS19HMEtfRzBLX0cwS19HMEtfRzBvRcZwZsXGcGEFxnBdBcZwWgXGcFgFxnBWhcZwVcXGcFUFxnBUhcZwVEXGcFQFxnBTxcZwU8XGcFOFxnBThcZwU4XGcFOFxnBThcZwU4XGcFOFxnBE7IVweGxFcG/sRXBprEVwZWxFcGKsRXBgbEVwXuxFcF3sRXBdbEVwXOxFcFxsRXBcLEVwXCxFcFvsRXBb7EVwW+xFcFvsRXBbrEVwW6xFcFusRXBg0wSwTlMEsEGTBLB4ksSwclLEsG3SxLBq0sSwaJLEsGdSxLBmEsSwZVLEsGTSxLBkksSwZFLEsGQSxLBkEsSwZBLEsGPSxLBj0sSwY9LEsGPSxLBGOcOwavmDsFf5g7BKuYOwQXmDsHr5Q7B2eUOwc3lDsHE5Q7BvuUOwbnlDsG25Q7BtOUOwbPlDsGy5Q7BseUOwbDlDsGw5Q7BsOUOwbDlDsGw5Q7B5oELwUWBC8HUgAvBhoALwU+AC8EogAvBDoALwft/C8HufwvB5X8Lwd9/C8HafwvB138LwdV/C8HTfwvB0n8LwdJ/C8HRfwvB0X8LwdF/C8HQfwvBBh0IwRgcCMFxGwjB/RoIwawaCMFzGgjBTBoIwTAaCMEdGgjBEBoIwQYaCMEAGgjB+xkIwfgZCMH2GQjB9BkIwfMZCMHyGQjB8hkIwfEZCMHxGQjBoLgEwUC3BMFKtgTBnrUEwSa1BMHTtATBmLQEwW+0BMFTtATBP7QEwTG0BMEotATBIbQEwRy0BMEZtATBFrQEwRW0BMEUtATBE7QEwRK0BMEStATB7lQBweZSAcF7UQHBfVABwcxPAcFQTwHB+k4Bwb1OAcGTTgHBdk4BwWFOAcFTTgHBSU4BwUJOAcE9TgHBOk4BwTdOAcE2TgHBNE4BwTROAcEzTgHBmeT7wJre+8Bq2vvAfNf7wHHV+8AD1PvABNP7wFLS+8DW0fvAf9H7wELR+8AY0fvA+9D7wObQ+8DY0PvAzdD7wMbQ+8DC0PvAvtD7wLzQ+8C60PvA9iL1wBwa9cDsE/XAmQ/1wJMM9cB3CvXA/gj1wPYH9cA+B/XAvgb1wGQG9cAmBvXA+gX1wNwF9cDGBfXAuAX1wK0F9cCmBfXAoQX1wJ0F9cCbBfXAuGXuwKpY7sCIT+7AJUnuwK5E7sCQQe7AYj/uwN097sDNPO7ADzzuwIs77sAuO+7A7TruwMA67sChOu7AizruwHw67sBxOu7AaTruwGQ67sBhOu7AtK7nwMmb58BQjufA44TnwEt+58CveefAd3bnwDh058CmcufAjXHnwMlw58BAcOfA4W/nwJ5v58Bwb+fAT2/nwDlv58Apb+fAHm/nwBZv58ARb+fAZwDhwETl4MDR0eDA68PgwDC64MBis+DAoK7gwE6r4MD8qODAXafgwDum4MBxpeDA5KTgwIGk4MA8pODADKTgwOuj4MDTo+DAw6PgwLej4MCvo+DAoV/awNQ32sDVG9rA1gfawH752cBz79nAbejZwIXj2cAX4NnAsd3ZwAXc2cDa2tnACdrZwHjZ2cAS2dnAy9jZwJnY2cB32NnAXtjZwE3Y2cBC2NnAgNLTwFiY08BLb9PAalLTwNo908AML9PAsCTTwHAd08BfGNPA1RTTwFwS08CiENPAbQ/TwJUO08D/DdPAlg3TwE0N08AZDdPA9gzTwN0M08DLDNPASGnNwPAMzcAn0czA0KbMwASJzMDgc8zAmWTMwOhZzMBsUszAMk3MwIpJzMD9RszANUXMwPZDzMAYQ8zAfELMwBBCzMDEQczAj0HMwGpBzMBRQczAQzPHwManxsCDR8bAAwrGwGXexcCov8XA66nFwCeaxcAdj8XAZYfFwP+BxcA5fsXAl3vFwMB5xcB3eMXAkXfFwPF2xcCBdsXAM3bFwP11xcDXdcXApo3BwCZ2wMCS5r/AR4K/wOBCv8AMFr/AV/a+wPvfvsC2z77AUsS+wFq8vsDItr7A5LK+wCywvsBFrr7A8qy+wAWsvsBfq77A7Kq+wJuqvsBjqr7ApeYwwaTmMMGi5jDBouYwwaHmMMGh5jDBoOYwwaDmMMGg5jDBoOYwwaDmMMGg5jDBoOYwwaDmMMGg5jDBoOYwwaDmMMGg5jDBoOYwwaDmMMGg5jDByYAtwcaALcHEgC3Bw4AtwcKALcHCgC3BwYAtwcGALcHBgC3BwYAtwcCALcHAgC3BwIAtwcCALcHAgC3BwIAtwcCALcHAgC3BwIAtwcCALcHAgC3B7hoqweoaKsHnGirB5RoqweQaKsHjGirB4hoqweIaKsHiGirB4RoqweEaKsHhGirB4RoqweEaKsHhGirB4RoqweEaKsHhGirB4RoqweEaKsHhGirBFbUmwQ+1JsELtSbBCLUmwQa1JsEFtSbBBLUmwQO1JsECtSbBArUmwQK1JsECtSbBArUmwQK1JsECtSbBArUmwQG1JsEBtSbBAbUmwQG1JsEBtSbBP08jwTZPI8EwTyPBLE8jwSlPI8EnTyPBJU8jwSRPI8EkTyPBI08jwSNPI8EjTyPBIk8jwSJPI8EiTyPBIk8jwSJPI8EiTyPBIk8jwSJPI8EiTyPBbekfwWDpH8FX6R/BUekfwU3pH8FJ6R/BR+kfwUbpH8FF6R/BROkfwUTpH8FD6R/BQ+kfwUPpH8FD6R/BQ+kfwUPpH8FD6R/BQ+kfwUPpH8FD6R/Bo4McwZCDHMGCgxzBeIMcwXKDHMFtgxzBaoMcwWiDHMFngxzBZoMcwWWDHMFkgxzBZIMcwWSDHMFkgxzBY4McwWODHMFjgxzBY4McwWODHMFjgxzB4x0ZwcYdGcGyHRnBpB0ZwZodGcGTHRnBjh0ZwYsdGcGJHRnBhx0ZwYYdGcGGHRnBhR0ZwYUdGcGEHRnBhB0ZwYQdGcGEHRnBhB0ZwYQdGcGEHRnBMrgVwQe4FcHptxXB1LcVwcW3FcG7txXBtLcVwa+3FcGstxXBqrcVwai3FcGntxXBprcVwaa3FcGltxXBpbcVwaW3FcGltxXBpbcVwaW3FcGltxXBmVISwVhSEsErUhLBC1ISwfZREsHnURLB3FESwdVREsHQURLBzVESwcpREsHJURLByFESwcdREsHGURLBxlESwcZREsHFURLBxVESwcVREsHFURLBIe0OwcDsDsF97A7BT+wOwS7sDsEY7A7BCewOwf7rDsH26w7B8esOwe7rDsHr6w7B6usOwejrDsHo6w7B5+sOwefrDsHm6w7B5usOwebrDsHm6w7B3YcLwUyHC8HohgvBo4YLwXOGC8FRhgvBOoYLwSqGC8EfhgvBGIYLwRKGC8EPhgvBDIYLwQqGC8EJhgvBCIYLwQiGC8EHhgvBB4YLwQeGC8EHhgvB5CIIwQ0iCMF4IQjBECEIwcggCMGXIAjBdCAIwV0gCMFMIAjBQSAIwTkgCMEzIAjBLyAIwS0gCMErIAjBKiAIwSkgCMEoIAjBKCAIwSggCMEnIAjBXb4EwRy9BME9vATBo7sEwTi7BMHuugTBu7oEwZi6BMF/ugTBbroEwWK6BMFaugTBVLoEwVC6BMFOugTBTLoEwUq6BMFKugTBSboEwUi6BMFIugTBfVoBwZ9YAcFUVwHBblYBwc9VAcFhVQHBFVUBweBUAcG7VAHBoVQBwZBUAcGEVAHBe1QBwXVUAcFxVAHBblQBwWxUAcFrVAHBalQBwWpUAcFpVAHBOu/7wKzp+8DS5fvAJ+P7wE3h+8AE4PvAId/7wIPe+8AW3vvAyt37wJXd+8Bx3fvAWN37wEbd+8A63fvAMt37wCzd+8Ao3fvAJd37wCPd+8Ai3fvA9iz1wLIk9cD1HvXA+xr1wDkY9cBPFvXA/BT1wBEU9cBuE/XA/RL1wK8S9cB5EvXAUxL1wDkS9cAnEvXAGxL1wBIS9cAMEvXACBL1wAUS9cADEvXA5m7uwJti7sASWu7AJVTuwAlQ7sAwTe7ANkvuwNhJ7sDlSO7APUjuwMhH7sB3R+7AP0fuwBlH7sD+Ru7A60buwN5G7sDVRu7Az0buwMtG7sDIRu7A2rbnwOKk58AxmOfAYI/nwEGJ58ADhefAEYLnwAeA58CdfufAon3nwPV858B8fOfAKXznwO9758DHe+fAq3vnwJh758CKe+fAgXvnwHt758B2e+fATQfhwFLt4MDW2uDAu83gwKDE4MBOvuDA7LngwOK24MDGtODAULPgwE2y4MCaseDAHbHgwMew4MCLsODAYrDgwEWw4MAxsODAI7DgwBqw4MATsODACGXawJw+2sDKI9rAxhDawD0D2sDV+dnAT/PZwMfu2cCk69nAd+nZwPTn2cDp5tnAL+bZwK/l2cBW5dnAGOXZwO3k2cDQ5NnAu+TZwK3k2cCj5NnAOdbTwJ2d08D1ddPARVrTwLRG08C6ONPABC/TwEYo08CZI9PAWyDTwBse08CNHNPAeBvTwLka08A0GtPA2BnTwJgZ08BsGdPATRnTwDgZ08ApGdPAn2vNwIUQzcBJ1szAW63MwMaQzMCkfMzANW7MwC5kzMA3XczAY1jMwApVzMC3UszAG1HMwP5PzMA4T8zAr07MwFBOzMAOTszA4E3MwMFNzMCrTczA+DPHwPapxsD0SsbAAw/GwNHkxcBPx8XAmLLFwLCjxcBVmcXAJJLFwCeNxcCyicXATIfFwKKFxcB7hMXAr4PFwCGDxcC/gsXAe4LFwEyCxcArgsXApo3BwMB2wMCc6L/AlIW/wL5Hv8BZHL/A4/2+wJHovsAt2b7Ae86+wA7HvsDnwb7AVb6+wNq7vsAjur7A8ri+wB+4vsCNt77AJ7e+wOG2vsCxtr7AmuwwwZnsMMGY7DDBl+wwwZbsMMGW7DDBluwwwZbsMMGW7DDBluwwwZXsMMGV7DDBlewwwZXsMMGV7DDBlewwwZXsMMGV7DDBlewwwZXsMMGV7DDBvYYtwbuGLcG5hi3BuIYtwbiGLcG3hi3Bt4YtwbaGLcG2hi3BtoYtwbaGLcG2hi3BtoYtwbaGLcG2hi3BtoYtwbaGLcG2hi3BtoYtwbaGLcG2hi3B4SAqwd4gKsHcICrB2iAqwdkgKsHYICrB2CAqwdcgKsHXICrB1yAqwdcgKsHXICrB1yAqwdcgKsHXICrB1yAqwdcgKsHXICrB1yAqwdcgKsHXICrBB7smwQK7JsH/uibB/Lomwfu6JsH6uibB+bomwfi6JsH4uibB+Lomwfi6JsH3uibB97omwfe6JsH3uibB97omwfe6JsH3uibB97omwfe6JsH3uibBMFUjwShVI8EjVSPBIFUjwR1VI8EbVSPBGlUjwRpVI8EZVSPBGVUjwRhVI8EYVSPBGFUjwRhVI8EYVSPBGFUjwRhVI8EYVSPBGFUjwRhVI8EYVSPBXO8fwVHvH8FJ7x/BRO8fwUDvH8E+7x/BPO8fwTvvH8E67x/BOu8fwTnvH8E57x/BOe8fwTnvH8E57x/BOe8fwTjvH8E47x/BOO8fwTjvH8E47x/Bj4kcwX6JHMFziRzBa4kcwWWJHMFhiRzBX4kcwV2JHMFciRzBW4kcwVqJHMFaiRzBWokcwVmJHMFZiRzBWYkcwVmJHMFZiRzBWYkcwVmJHMFZiRzByyMZwbEjGcGgIxnBlCMZwYwjGcGGIxnBgiMZwX8jGcF+IxnBfCMZwXwjGcF7IxnBeiMZwXojGcF6IxnBeiMZwXojGcF6IxnBeiMZwXojGcF6IxnBFL4Vwe69FcHUvRXBwr0Vwba9FcGtvRXBp70VwaO9FcGgvRXBnr0VwZ29FcGcvRXBnL0VwZu9FcGbvRXBm70VwZq9FcGavRXBmr0VwZq9FcGavRXBclgSwTlYEsESWBLB9lcSweRXEsHXVxLBzlcSwchXEsHEVxLBwVcSwb9XEsG+VxLBvVcSwbxXEsG8VxLBu1cSwbtXEsG7VxLBu1cSwbtXEsG7VxLB7/IOwZnyDsFe8g7BNfIOwRnyDsEG8g7B+fEOwe/xDsHp8Q7B5fEOweLxDsHg8Q7B3vEOwd7xDsHd8Q7B3PEOwdzxDsHc8Q7B3PEOwdzxDsHc8Q7Bm40LwRmNC8HAjAvBg4wLwVmMC8E8jAvBKIwLwRqMC8ERjAvBCowLwQaMC8EDjAvBAYwLwf+LC8H+iwvB/osLwf2LC8H9iwvB/IsLwfyLC8H8iwvBjCgIwcknCMFDJwjB5yYIwagmCMF8JgjBXyYIwUomCME8JgjBMiYIwSsmCMEnJgjBJCYIwSEmCMEgJgjBHyYIwR4mCMEeJgjBHSYIwR0mCMEdJgjB5sMEwcHCBMH4wQTBbsEEwQ/BBMHNwATBoMAEwYHABMFswATBXcAEwVPABMFMwATBSMAEwUTABMFCwATBQcAEwUDABME/wATBPsAEwT7ABME+wATB3V8BwSZeAcH4XAHBKFwBwZlbAcE2WwHB81oBwcRaAcGkWgHBjloBwX9aAcF1WgHBbloBwWlaAcFlWgHBY1oBwWFaAcFgWgHBX1oBwV9aAcFfWgHBhfn7wGD0+8DV8PvAZu77wLjs+8CR6/vAxur7wDvq+8Da6fvAmOn7wGvp+8BM6fvANun7wCjp+8Ad6fvAFun7wBLp+8AO6fvADOn7wArp+8AJ6fvAqjb1wPIu9cChKfXA+CX1wHMj9cC4IfXAhyD1wLUf9cAkH/XAwR71wH0e9cBOHvXALh71wBce9cAIHvXA/h31wPYd9cDyHfXA7h31wOwd9cDqHfXA1HfuwEFs7sBHZO7AyF7uwABb7sBmWO7Am1buwGBV7sCHVO7A8lPuwItT7sBEU+7AFFPuwPJS7sDcUu7AzFLuwMFS7sC5Uu7AtFLuwLFS7sCuUu7Azb7nwL6t58DHoefAiZnnwNuT58Dyj+fAQY3nwGiL58AiiufAQYnnwKeI58A9iOfA9IfnwMKH58Cgh+fAiIfnwHiH58Bsh+fAZYfnwF+H58Bch+fADQ7hwC714MCe4+DAQtfgwLzO4MDeyODA1MTgwAzC4MAiwODA0b7gwOm94MBKveDA3LzgwJG84MBdvODAObzgwCG84MAQvODABLzgwPy74MD3u+DAV2rawEBF2sCOK9rAeRnawLQM2sDlA9rA1f3ZwKj52cDI9tnAzvTZwHHz2cCC8tnA3fHZwGzx2cAe8dnA6PDZwMPw2cCq8NnAmfDZwI3w2cCE8NnA5dnTwMui08B8fNPA8WHTwFNP08AgQtPABznTwMIy08BxLtPAeSvTwG0p08AFKNPADifTwGQm08DuJdPAniXTwGcl08BAJdPAJiXTwBQl08AIJdPA8W3NwA4UzcBV28zAxbPMwFmYzMAuhczAi3fMwCNuzMCpZ8zAM2PMwCFgzMAEXszAkFzMwJBbzMDgWszAZ1rMwBRazMDbWczAs1nMwJhZzMCFWczArDTHwCKsxsBaTsbA7RPGwB3rxcDJzsXADLvFwPWsxcA9o8XAi5zFwO+XxcDClMXAk5LFwBORxcAKkMXAVI/FwNeOxcCBjsXARo7FwB2OxcABjsXApo3BwFt3wMCj6r/A14i/wIdMv8CGIr/ARAW/wPDwvsBg4r7AVdi+wGrRvsCmzL7AX8m+wB3HvsCQxb7AfsS+wMLDvsBBw77A6MK+wKvCvsCBwr7AUvIwwVHyMMFQ8jDBUPIwwU/yMMFP8jDBT/IwwU/yMMFP8jDBTvIwwU7yMMFO8jDBTvIwwU7yMMFO8jDBTvIwwU7yMMFO8jDBTvIwwU7yMMFO8jDBdYwtwXOMLcFyjC3BcYwtwXCMLcFwjC3BcIwtwW+MLcFvjC3Bb4wtwW+MLcFvjC3Bb4wtwW+MLcFvjC3Bb4wtwW+MLcFvjC3Bb4wtwW+MLcFvjC3BmCYqwZUmKsGUJirBkiYqwZEmKsGRJirBkCYqwZAmKsGQJirBkCYqwZAmKsGQJirBkCYqwZAmKsGQJirBkCYqwZAmKsGQJirBkCYqwZAmKsGQJirBvcAmwbnAJsG2wCbBtMAmwbPAJsGywCbBssAmwbHAJsGxwCbBscAmwbDAJsGwwCbBsMAmwbDAJsGwwCbBsMAmwbDAJsGwwCbBsMAmwbDAJsGwwCbB5Vojwd5aI8HaWiPB11ojwdVaI8HUWiPB01ojwdJaI8HSWiPB0VojwdFaI8HRWiPB0VojwdFaI8HRWiPB0VojwdFaI8HRWiPB0VojwdFaI8HRWiPBEPUfwQb1H8H/9B/B+/Qfwfj0H8H29B/B9PQfwfP0H8Hz9B/B8vQfwfL0H8Hy9B/B8vQfwfL0H8Hy9B/B8fQfwfH0H8Hx9B/B8fQfwfH0H8Hx9B/BQI8cwTGPHMEnjxzBIY8cwRyPHMEZjxzBF48cwRWPHMEUjxzBE48cwROPHMETjxzBEo8cwRKPHMESjxzBEo8cwRKPHMESjxzBEo8cwRKPHMESjxzBeCkZwWIpGcFTKRnBSSkZwUIpGcE9KRnBOikZwTcpGcE2KRnBNSkZwTQpGcE0KRnBMykZwTMpGcEzKRnBMykZwTMpGcEzKRnBMykZwTMpGcEzKRnBvMMVwZvDFcGEwxXBdcMVwWrDFcFjwxXBXsMVwVrDFcFYwxXBV8MVwVXDFcFVwxXBVMMVwVTDFcFUwxXBVMMVwVPDFcFTwxXBU8MVwVPDFcFTwxXBE14SweFdEsG+XRLBpl0SwZZdEsGLXRLBhF0SwX9dEsF7XRLBeV0SwXddEsF2XRLBdV0SwXVdEsF1XRLBdF0SwXRdEsF0XRLBdF0SwXRdEsF0XRLBhvgOwTn4DsEF+A7B4fcOwcn3DsG49w7BrfcOwaX3DsGg9w7BnPcOwZr3DsGY9w7Bl/cOwZb3DsGW9w7BlfcOwZX3DsGV9w7BlfcOwZX3DsGV9w7BI5MLwa+SC8FfkgvBKZILwQSSC8HrkQvB2pELwc6RC8HGkQvBwZELwb2RC8G6kQvBuZELwbiRC8G3kQvBtpELwbaRC8G2kQvBtZELwbWRC8G1kQvBAC4IwVAtCMHYLAjBhiwIwU4sCMEoLAjBDiwIwfwrCMHwKwjB5ysIweIrCMHeKwjB2ysIwdkrCMHYKwjB1ysIwdcrCMHWKwjB1isIwdYrCMHWKwjBPskEwTPIBMF9xwTBAccEwazGBMFzxgTBS8YEwTDGBMEexgTBEcYEwQnGBMEDxgTB/8UEwfzFBMH6xQTB+cUEwfjFBMH3xQTB98UEwffFBMH3xQTBDmUBwXtjAcFnYgHBq2EBwSthAcHTYAHBl2ABwW9gAcFTYAHBQGABwTNgAcEqYAHBJGABwSBgAcEdYAHBG2ABwRpgAcEZYAHBGGABwRhgAcEXYAHBfAP8wLj++8B3+/vAPvn7wLn3+8Cw9vvA+/X7wH/1+8Ar9fvA8fT7wMr0+8Cv9PvAnfT7wJD0+8CI9PvAgvT7wH70+8B79PvAevT7wHj0+8B39PvAFUD1wOA49cDyM/XAlTD1wEgu9cC2LPXApCv1wOgq9cBoKvXAESr1wNYp9cCtKfXAkSn1wH4p9cBxKfXAaCn1wGIp9cBeKfXAWyn1wFop9cBYKfXAhYDuwJ917sAqbu7AEmnuwJZl7sA2Y+7AlmHuwHpg7sC4X+7ANF/uwNpe7sCcXu7Acl7uwFVe7sBCXu7ANF7uwCte7sAlXu7AIV7uwB5e7sAcXu7AkMbnwFy258AXq+fAYaPnwBye58CCmufADJjnwF6W58A5lefAcJTnwOiT58CKk+fAS5PnwB+T58ABk+fA7ZLnwN+S58DWkufAz5LnwMuS58DIkufAqhThwNv84MAq7ODAguDgwInY4MAW0+DAXM/gwNHM4MAUy+DA5cngwBbJ4MCIyODAJ8jgwObH4MC5x+DAmsfgwIXH4MB3x+DAbcfgwGbH4MBix+DAkG/awMFL2sAkM9rA8iHawOUV2sCmDdrAAwjawCkE2sCIAdrAvP/ZwIL+2cCr/dnAGf3ZwLX82cBx/NnAQvzZwCL82cAN/NnA/vvZwPT72cDt+9nAhd3TwOOn08DhgtPAb2nTwLhX08BCS9PAu0LTwOc808DrONPAMzbTwFc008ASM9PANDLTwJ0x08A2MdPA7zDTwL8w08CeMNPAiDDTwHgw08BuMNPAPnDNwIsXzcBM4MzADbrMwMCfzMB/jczAnYDMwMt3zMDEcczApW3MwNVqzMDpaMzAmWfMwLRmzMAXZszArGXMwGNlzMAxZczAD2XMwPhkzMDoZMzAYDXHwEmuxsC1UcbAxBjGwEnxxcAY1sXAScPFwPa1xcDYrMXAnKbFwFmixcBwn8XAc53FwBicxcArm8XAiZrFwBqaxcDPmcXAm5nFwHiZxcBgmcXApo3BwPR3wMCl7L/AEIy/wD5Rv8CVKL/Aegy/wBj5vsBR677A5OG+wHHbvsAJ177AB9S+wPjRvsCR0L7AnM++wPTOvsCCzr7ANM6+wP/NvsDazb7A0fcwwdD3MMHQ9zDBz/cwwc/3MMHP9zDBzvcwwc73MMHO9zDBzvcwwc73MMHO9zDBzvcwwc73MMHO9zDBzvcwwc73MMHO9zDBzvcwwc73MMHO9zDB85EtwfKRLcHxkS3B8JEtwfCRLcHvkS3B75Etwe+RLcHvkS3B75Etwe+RLcHvkS3B75Etwe+RLcHvkS3B75Etwe+RLcHvkS3B75Etwe+RLcHvkS3BFiwqwRQsKsETLCrBEiwqwREsKsEQLCrBECwqwRAsKsEQLCrBECwqwRAsKsEPLCrBDywqwQ8sKsEPLCrBDywqwQ8sKsEPLCrBDywqwQ8sKsEPLCrBO8YmwTfGJsE1xibBM8YmwTLGJsEyxibBMcYmwTHGJsEwxibBMMYmwTDGJsEwxibBMMYmwTDGJsEwxibBMMYmwTDGJsEwxibBMMYmwTDGJsEwxibBYWAjwVxgI8FYYCPBVmAjwVRgI8FTYCPBUmAjwVJgI8FRYCPBUWAjwVFgI8FRYCPBUWAjwVFgI8FRYCPBUWAjwVFgI8FRYCPBUWAjwVFgI8FRYCPBi/ofwYL6H8F9+h/BefofwXf6H8F1+h/BdPofwXP6H8Fy+h/BcvofwXL6H8Fy+h/BcfofwXH6H8Fx+h/BcfofwXH6H8Fx+h/BcfofwXH6H8Fx+h/BuZQcwayUHMGklBzBnpQcwZqUHMGXlBzBlpQcwZSUHMGUlBzBk5QcwZOUHMGSlBzBkpQcwZKUHMGSlBzBkpQcwZKUHMGSlBzBkpQcwZKUHMGSlBzB7i4ZwdsuGcHOLhnBxS4Zwb8uGcG7LhnBuC4ZwbYuGcG1LhnBtC4ZwbQuGcGzLhnBsy4ZwbMuGcGzLhnBsy4ZwbMuGcGyLhnBsi4ZwbIuGcGyLhnBLckVwRDJFcH9yBXB78gVwebIFcHgyBXB3MgVwdnIFcHXyBXB1sgVwdXIFcHUyBXB1MgVwdTIFcHTyBXB08gVwdPIFcHTyBXB08gVwdPIFcHTyBXBfmMSwVFjEsEzYxLBH2MSwRFjEsEHYxLBAWMSwf1iEsH6YhLB+GISwfZiEsH2YhLB9WISwfRiEsH0YhLB9GISwfRiEsH0YhLB9GISwfRiEsH0YhLB5/0OwaP9DsF1/Q7BVv0OwUH9DsEy/Q7BKf0OwSL9DsEe/Q7BG/0OwRn9DsEX/Q7BFv0OwRb9DsEV/Q7BFf0OwRX9DsEU/Q7BFP0OwRT9DsEU/Q7Bd5gLwQ+YC8HJlwvBmZcLwXmXC8FjlwvBVJcLwUqXC8FDlwvBP5cLwTuXC8E5lwvBOJcLwTeXC8E2lwvBNpcLwTWXC8E1lwvBNZcLwTWXC8E1lwvBQjMIwaMyCME4MgjB7zEIwb0xCMGcMQjBhTEIwXYxCMFrMQjBZDEIwV8xCMFcMQjBWjEIwVkxCMFYMQjBVzEIwVYxCMFWMQjBVjEIwVYxCMFWMQjBZ84EwXTNBMHQzATBYMwEwRXMBMHhywTBv8sEwafLBMGXywTBjcsEwYXLBMGAywTBfcsEwXvLBMF5ywTBeMsEwXfLBMF3ywTBd8sEwXbLBMF2ywTBFGoBwaJoAcGmZwHB/GYBwYlmAcE7ZgHBBmYBweJlAcHKZQHBuWUBwa5lAcGmZQHBoWUBwZ5lAcGcZQHBmmUBwZllAcGYZQHBmGUBwZdlAcGXZQHBJQ38wLoI/MC8BfzAtQP8wFUC/MBnAfzAxQD8wFgA/MAOAPzA2//7wLn/+8Ci//vAk//7wIj/+8CB//vAfP/7wHn/+8B3//vAdf/7wHT/+8Bz//vAOkn1wH9C9cDuPfXA1Tr1wLs49cBPN/XAWDb1wLE19cBANfXA8zT1wL809cCcNPXAhDT1wHQ09cBpNPXAYjT1wF009cBZNPXAVzT1wFU09cBUNPXA+ojuwLd+7sC/d+7ABnPuwNFv7sClbe7ALGzuwCxr7sB/au7ACmruwLtp7sCFae7AYGnuwEhp7sA3ae7ALGnuwCRp7sAfae7AG2nuwBlp7sAXae7AI87nwMC+58AitOfA7KznwAio58C3pOfAd6LnwPGg58Dpn+fANZ/nwLye58BqnufAMp7nwAye58DznefA4p3nwNad58DOnefAyJ3nwMWd58DCnefAJBvhwFgE4cB89ODAf+ngwAni4MD53ODAi9ngwDfX4MCj1eDAkdTgwNjT4MBa0+DABdPgwMzS4MCl0uDAitLgwHjS4MBs0uDAZNLgwF7S4MBb0uDAsXTawCBS2sCMOtrAMirawNQe2sAbF9rA3hHawFEO2sDoC9rARgrawCsJ2sBrCNrA6QfawJEH2sBVB9rALQfawBEH2sD/BtrA8gbawOoG2sDkBtrAGOHTwOSs08AlidPAwXDTwOZf08AiVNPAJUzTwLlG08AMQ9PAjkDTwN0+08C4PdPA8TzTwGs808AQPNPA0jvTwKg708CMO9PAeTvTwGw708BjO9PAhXLNwP0azcAu5czANsDMwPumzMCalczAbYnMwCmBzMCNe8zAv3fMwCp1zMBrc8zAO3LMwG5xzMDjcMzAhHDMwERwzMAZcMzA/G/MwOhvzMDab8zAEzbHwGywxsAFVcbAhh3GwFX3xcA83cXAUcvFwLi+xcAqtsXAXLDFwGysxcDAqcXA8afFwLemxcDipcXAUqXFwPGkxcCupMXAgqTFwGOkxcBPpMXApo3BwI14wMCj7r/APo+/wOFVv8CGLr/AhhO/wAwBv8AE9L7AKeu+wCflvsAU4b7AUd6+wHHcvsAs277AUNq+wLvZvsBW2b7AEtm+wOPYvsDE2L7AGv0wwRr9MMEZ/TDBGf0wwRn9MMEY/TDBGP0wwRj9MMEY/TDBGP0wwRj9MMEY/TDBGP0wwRj9MMEY/TDBGP0wwRj9MMEY/TDBGP0wwRj9MMEY/TDBPJctwTuXLcE6ly3BOpctwTmXLcE5ly3BOZctwTmXLcE5ly3BOZctwTmXLcE5ly3BOZctwTmXLcE5ly3BOZctwTmXLcE5ly3BOZctwTmXLcE5ly3BXzEqwV0xKsFcMSrBWzEqwVoxKsFaMSrBWjEqwVoxKsFZMSrBWTEqwVkxKsFZMSrBWTEqwVkxKsFZMSrBWTEqwVkxKsFZMSrBWTEqwVkxKsFZMSrBg8smwYDLJsF+yybBfcsmwXzLJsF7yybBe8smwXrLJsF6yybBessmwXrLJsF6yybBessmwXrLJsF6yybBessmwXrLJsF6yybBessmwXrLJsF6yybBqGUjwaRlI8GhZSPBn2UjwZ1lI8GcZSPBnGUjwZtlI8GbZSPBm2UjwZtlI8GbZSPBm2UjwZtlI8GaZSPBmmUjwZplI8GaZSPBmmUjwZplI8GaZSPB0P8fwcn/H8HF/x/Bwv8fwb//H8G+/x/Bvf8fwbz/H8G8/x/BvP8fwbv/H8G7/x/Bu/8fwbv/H8G7/x/Bu/8fwbv/H8G7/x/Bu/8fwbv/H8G7/x/B/JkcwfKZHMHqmRzB5pkcweKZHMHgmRzB35kcwd6ZHMHdmRzB3ZkcwdyZHMHcmRzB3JkcwdyZHMHcmRzB3JkcwdyZHMHcmRzB3JkcwdyZHMHcmRzBLzQZwR40GcETNBnBDDQZwQc0GcEDNBnBATQZwf8zGcH+MxnB/jMZwf0zGcH9MxnB/TMZwf0zGcH8MxnB/DMZwfwzGcH8MxnB/DMZwfwzGcH8MxnBa84VwVHOFcFAzhXBNc4VwS3OFcEozhXBJM4VwSLOFcEgzhXBH84VwR7OFcEezhXBHs4VwR3OFcEdzhXBHc4VwR3OFcEdzhXBHc4VwR3OFcEdzhXBtWgSwY5oEsF0aBLBYmgSwVZoEsFOaBLBSWgSwUVoEsFCaBLBQWgSwUBoEsE/aBLBPmgSwT5oEsE+aBLBPmgSwT5oEsE+aBLBPmgSwT5oEsE9aBLBFwMPwdoCD8GyAg/BlgIPwYQCD8F3Ag/BbwIPwWoCD8FmAg/BYwIPwWICD8FgAg/BYAIPwV8CD8FfAg/BXwIPwV4CD8FeAg/BXgIPwV4CD8FeAg/Bm50LwT6dC8H/nAvB1ZwLwbmcC8GmnAvBmZwLwZCcC8GLnAvBh5wLwYScC8GCnAvBgZwLwYCcC8GAnAvBf5wLwX+cC8F/nAvBf5wLwX+cC8F/nAvBVjgIwcY3CMFmNwjBJTcIwfk2CMHcNgjByDYIwbs2CMGyNgjBrDYIwag2CMGlNgjBozYIwaI2CMGhNgjBoDYIwaA2CMGgNgjBoDYIwZ82CMGfNgjBY9MEwYbSBMHx0QTBjdEEwUrRBMEd0QTB/tAEwerQBMHc0ATB09AEwc3QBMHI0ATBxtAEwcTQBMHC0ATBwtAEwcHQBMHB0ATBwNAEwcDQBMHA0ATB8G4BwZxtAcG3bAHBHWwBwbVrAcFvawHBQWsBwSFrAcEMawHB/moBwfRqAcHuagHB6WoBweZqAcHkagHB42oBweJqAcHiagHB4WoBweFqAcHhagHBgxb8wGsS/MCqD/zA0A38wJEM/MC7C/zAKgv8wMkK/MCICvzAXAr8wD8K/MArCvzAHgr8wBUK/MAPCvzACwr8wAgK/MAGCvzABQr8wAQK/MADCvzAG1L1wNJL9cCWR/XAvUT1wNJC9cCIQfXAqkD1wBVA9cCxP/XAbT/1wEA/9cAhP/XADT/1wP8+9cD2PvXA8D71wOs+9cDpPvXA5z71wOU+9cDlPvXANpHuwIyH7sAJge7Ap3zuwLR57sC4d+7AYnbuwHx17sDidO7AenTuwDR07sAFdO7A5XPuwNBz7sDCc+7AuHPuwLJz7sCtc+7AqnPuwKhz7sCnc+7AiNXnwOzG58DqvOfALLbnwKKx58CUrufAhqznwCSr58A2qufAlqnnwCqp58DiqOfAsajnwJCo58B6qOfAa6jnwGGo58BbqOfAVqjnwFOo58BRqOfAeyHhwKkL4cCX/ODAO/LgwD/r4MCM5uDAYuPgwEHh4MDS3+DA3N7gwDbe4MDG3eDAe93gwEnd4MAn3eDAEN3gwAHd4MD33ODA8NzgwOvc4MDo3ODAu3nawF5Y2sDHQdrAPDLawIEn2sBHINrAaBvawCIY2sDtFdrAchTawHIT2sDGEtrAUxLawAUS2sDREdrArhHawJYR2sCHEdrAfBHawHUR2sBwEdrAoOTTwNCx08BJj9PA53fTwN5n08DCXNPARlXTwDtQ08DWTNPAjkrTwAVJ08D8R9PASkfTwNNG08CCRtPATEbTwChG08APRtPA/0XTwPRF08DtRdPAyHTNwGQezcD76czAQMbMwAuuzMCAnczA/5HMwD+KzMAGhczAg4HMwCZ/zMCOfczAfHzMwMR7zMBIe8zA9XrMwL16zMCXeszAfnrMwG16zMBieszAxTbHwIuyxsBLWMbANCLGwET9xcA25MXAJNPFwDvHxcA1v8XAzbnFwCm2xcC2s8XAEbLFwPWwxcA2sMXAtq/FwGCvxcAmr8XA/67FwOSuxcDTrsXApo3BwCZ5wMCe8L/AY5K/wHFav8BZNL/Aaxq/wM0Iv8B4/L7AKfS+wI/uvsDL6r7AQui+wI3mvsBn5b7AouS+wB3kvsDD477Ah+O+wF/jvsBE477AMQIxwTACMcEwAjHBMAIxwS8CMcEvAjHBLwIxwS8CMcEvAjHBLwIxwS8CMcEvAjHBLwIxwS8CMcEvAjHBLwIxwS8CMcEvAjHBLwIxwS8CMcEvAjHBU5wtwVKcLcFRnC3BUJwtwVCcLcFQnC3BUJwtwVCcLcFQnC3BUJwtwVCcLcFQnC3BUJwtwVCcLcFQnC3BUJwtwVCcLcFQnC3BUJwtwVCcLcFQnC3BdTYqwXM2KsFyNirBcjYqwXE2KsFxNirBcTYqwXA2KsFwNirBcDYqwXA2KsFwNirBcDYqwXA2KsFwNirBcDYqwXA2KsFwNirBcDYqwXA2KsFwNirBmNAmwZbQJsGU0CbBk9AmwZLQJsGS0CbBkdAmwZHQJsGR0CbBkdAmwZHQJsGR0CbBkdAmwZHQJsGR0CbBkdAmwZHQJsGR0CbBkdAmwZHQJsGR0CbBvWojwblqI8G3aiPBtWojwbRqI8GzaiPBsmojwbJqI8GyaiPBsmojwbJqI8GyaiPBsWojwbFqI8GxaiPBsWojwbFqI8GxaiPBsWojwbFqI8GxaiPB5AQgwd4EIMHaBCDB1wQgwdYEIMHUBCDB1AQgwdMEIMHTBCDB0gQgwdIEIMHSBCDB0gQgwdIEIMHSBCDB0gQgwdIEIMHSBCDB0gQgwdIEIMHSBCDBDp8cwQWfHMH/nhzB+54cwfieHMH2nhzB9Z4cwfSeHMH0nhzB854cwfOeHMHznhzB854cwfOeHMHznhzB854cwfOeHMHznhzB854cwfOeHMHznhzBPjkZwTA5GcEmORnBIDkZwRw5GcEZORnBFzkZwRY5GcEVORnBFDkZwRQ5GcEUORnBFDkZwRM5GcETORnBEzkZwRM5GcETORnBEzkZwRM5GcETORnBd9MVwWHTFcFS0xXBSNMVwUHTFcE90xXBOtMVwTjTFcE20xXBNtMVwTXTFcE10xXBNNMVwTTTFcE00xXBNNMVwTTTFcE00xXBNNMVwTTTFcE00xXBvW0SwZptEsGDbRLBc20SwWltEsFibRLBXm0SwVttEsFYbRLBV20SwVZtEsFWbRLBVW0SwVVtEsFVbRLBVW0SwVVtEsFVbRLBVG0SwVRtEsFUbRLBFwgPweEHD8G9Bw/BpQcPwZUHD8GKBw/BgwcPwX8HD8F7Bw/BeQcPwXgHD8F3Bw/BdgcPwXYHD8F2Bw/BdQcPwXUHD8F1Bw/BdQcPwXUHD8F1Bw/BkaILwT2iC8EGogvB4KELwcehC8G3oQvBrKELwaShC8GfoQvBnKELwZqhC8GZoQvBmKELwZehC8GWoQvBlqELwZahC8GWoQvBlqELwZahC8GWoQvBPD0Iwbs8CMFkPAjBKjwIwQQ8CMHqOwjB2TsIwc07CMHGOwjBwDsIwb07CMG7OwjBuTsIwbg7CMG4OwjBtzsIwbc7CMG3OwjBtjsIwbY7CMG2OwjBNdgEwWvXBMHl1gTBi9YEwU/WBMEn1gTBDNYEwfvVBMHv1QTB59UEweHVBMHe1QTB3NUEwdrVBMHZ1QTB2NUEwdjVBMHX1QTB19UEwdfVBMHX1QTBpHMBwWtyAcGbcQHBD3EBwbJwAcF0cAHBS3ABwS9wAcEccAHBEHABwQhwAcECcAHB/28BwfxvAcH7bwHB+m8BwflvAcH4bwHB+G8BwfhvAcH4bwHBmB/8wM4b/MBFGfzAlRf8wHQW/MCzFfzAMhX8wNwU/MCjFPzAfRT8wGMU/MBSFPzARxT8wD8U/MA6FPzANxT8wDUU/MAzFPzAMhT8wDEU/MAxFPzAu1r1wNxU9cDwUPXAUU71wJFM9cBmS/XAnkr1wBlK9cDASfXAhUn1wF1J9cBDSfXAMUn1wCVJ9cAeSfXAGEn1wBVJ9cATSfXAEUn1wBBJ9cAPSfXAOpnuwCGQ7sALiu7A+oXuwEOD7sBzge7APYDuwG5/7sDkfu7AiH7uwEt+7sAhfu7ABn7uwPR97sDofe7A333uwNp97sDWfe7A1H3uwNJ97sDRfe7AwNznwOHO58BzxefAJb/nwO6658AeuOfAPbbnwPy058AltOfAlrPnwDez58D3sufAzbLnwLCy58CdsufAkbLnwIiy58CCsufAf7LnwHyy58B7sufAsSfhwM4S4cB8BOHAt/rgwC/04MDR7+DA5uzgwPTq4MCn6eDAyejgwDTo4MDR5+DAj+fgwGPn4MBG5+DAMufgwCXn4MAc5+DAF+fgwBPn4MAQ5+DAsH7awHxe2sDYSNrAEDrawPEv2sAsKdrApiTawKAh2sCcH9rAQx7awFwd2sDDHNrAXBzawBgc2sDqG9rAyxvawLcb2sCqG9rAoBvawJob2sCWG9rAG+jTwKe208BOldPA437TwKFv08AlZdPAIV7TwHFZ08BPVtPAOFTTwNJS08DkUdPARFHTwNpQ08CTUNPAZFDTwERQ08AvUNPAIVDTwBdQ08ARUNPABnfNwMAhzcC07szAKszMwPO0zMAypczAVJrMwBCTzMA0jszA9YrMwMuIzMBYh8zAYYbMwLyFzMBOhczABIXMwNOEzMCyhMzAnITMwI6EzMCEhMzAdjfHwKW0xsCGW8bA0CbGwBUDxsAJ68XAxdrFwIPPxcD7x8XA8sLFwJW/xcBWvcXA17vFwNa6xcArusXAubnFwG25xcA6ucXAGLnFwAG5xcDyuMXApo3BwL55wMCU8r/AvJW/wO5ev8AQOr/AKCG/wFwQv8CyBL/A5Py+wK33vsAx9L7A3fG+wE/wvsBG777AlO6+wB7uvsDP7b7Amu2+wHftvsBg7b7AFwcxwRcHMcEWBzHBFgcxwRYHMcEWBzHBFgcxwRYHMcEWBzHBFgcxwRYHMcEWBzHBFgcxwRYHMcEWBzHBFgcxwRYHMcEWBzHBFgcxwRYHMcEWBzHBOaEtwTihLcE3oS3BN6EtwTehLcE3oS3BN6EtwTehLcE2oS3BNqEtwTahLcE2oS3BNqEtwTahLcE2oS3BNqEtwTahLcE2oS3BNqEtwTahLcE2oS3BWzsqwVo7KsFZOyrBWDsqwVg7KsFXOyrBVzsqwVc7KsFXOyrBVzsqwVc7KsFXOyrBVzsqwVc7KsFXOyrBVzsqwVc7KsFXOyrBVzsqwVc7KsFXOyrBftUmwXzVJsF61SbBedUmwXnVJsF41SbBeNUmwXjVJsF41SbBeNUmwXjVJsF41SbBeNUmwXjVJsF41SbBeNUmwXjVJsF41SbBeNUmwXjVJsF41SbBom8jwZ9vI8GcbyPBm28jwZpvI8GZbyPBmW8jwZlvI8GZbyPBmG8jwZhvI8GYbyPBmG8jwZhvI8GYbyPBmG8jwZhvI8GYbyPBmG8jwZhvI8GYbyPByAkgwcMJIMG/CSDBvQkgwbwJIMG7CSDBugkgwboJIMG5CSDBuQkgwbkJIMG5CSDBuQkgwbkJIMG5CSDBuQkgwbkJIMG5CSDBuQkgwbkJIMG5CSDB8aMcwemjHMHkoxzB4KMcwd6jHMHcoxzB26McwdujHMHaoxzB2qMcwdqjHMHaoxzB2qMcwdqjHMHZoxzB2aMcwdmjHMHZoxzB2aMcwdmjHMHZoxzBHz4ZwRI+GcEKPhnBBT4ZwQE+GcH/PRnB/T0Zwfw9GcH7PRnB+z0Zwfs9GcH6PRnB+j0Zwfo9GcH6PRnB+j0Zwfo9GcH6PRnB+j0Zwfo9GcH6PRnBVNgVwUHYFcE02BXBK9gVwSbYFcEi2BXBH9gVwR7YFcEd2BXBHNgVwRzYFcEb2BXBG9gVwRvYFcEb2BXBG9gVwRvYFcEb2BXBG9gVwRvYFcEb2BXBlnISwXdyEsFjchLBVnISwU1yEsFHchLBQ3ISwUByEsE/chLBPXISwT1yEsE8chLBPHISwTxyEsE7chLBO3ISwTtyEsE7chLBO3ISwTtyEsE7chLB6gwPwboMD8GaDA/BhQwPwXcMD8FuDA/BaAwPwWQMD8FhDA/BXwwPwV4MD8FdDA/BXQwPwVwMD8FcDA/BXAwPwVwMD8FcDA/BXAwPwVwMD8FcDA/BWqcLwQ+nC8HepgvBvaYLwaemC8GZpgvBj6YLwYmmC8GFpgvBgqYLwYCmC8F/pgvBfqYLwX2mC8F9pgvBfaYLwX2mC8F9pgvBfaYLwX2mC8F8pgvB+UEIwYNBCME2QQjBAkEIweBACMHJQAjBukAIwbBACMGqQAjBpkAIwaNACMGhQAjBoEAIwZ9ACMGeQAjBnkAIwZ1ACMGdQAjBnUAIwZ1ACMGdQAjB3twEwSbcBMGs2wTBXNsEwSbbBMED2wTB7NoEwdzaBMHS2gTBy9oEwcbaBMHD2gTBwtoEwcDaBMG/2gTBv9oEwb7aBMG+2gTBvtoEwb7aBMG+2gTBMngBwRJ3AcFUdgHB1nUBwYJ1AcFLdQHBJnUBwQ51AcH+dAHB83QBwex0AcHndAHB5HQBweJ0AcHhdAHB4HQBwd90AcHfdAHB33QBwd90AcHedAHBZij8wOMk/MCPIvzABSH8wP8f/MBSH/zA3x78wJMe/MBhHvzAPx78wCke/MAaHvzAER78wAoe/MAGHvzAAx78wAEe/MAAHvzA/x38wP8d/MD+HfzAHGP1wKBd9cD+WfXAlFf1wPxV9cDtVPXAOVT1wMJT9cBzU/XAP1P1wB1T9cAGU/XA91L1wOxS9cDmUvXA4VL1wN9S9cDdUvXA21L1wNpS9cDaUvXACKHuwHeY7sDIku7AAo/uwIKM7sDaiu7AwYnuwAeJ7sCMiO7AOojuwASI7sDgh+7AyIfuwLmH7sCuh+7Ap4fuwKOH7sCgh+7AnofuwJyH7sCch+7AzePnwKDW58C+zefA2cfnwPDD58BYwefAob/nwH2+58C8vefAPL3nwOe858CvvOfAirznwHG858BhvOfAVrznwE+858BKvOfAR7znwEW858BEvOfAxy3hwMcZ4cAsDOHA9gLhwNn84MDM+ODAG/bgwFP04MAl8+DAXfLgwNjx4MCA8eDARvHgwCDx4MAG8eDA9fDgwOrw4MDj8ODA3vDgwNrw4MDY8ODAj4PawHlk2sC/T9rAsUHawCQ42sDOMdrAmS3awNAq2sD3KNrAvifawO4m2sBkJtrACSbawM0l2sClJdrAiiXawHkl2sBtJdrAZiXawGEl2sBdJdrAi+vTwGq708Azm9PAt4XTwDJ308BMbdPAuWbTwF1i08B5X9PAj13TwEpc08ByW9PA5FrTwIVa08BHWtPAHVrTwAJa08DwWdPA5FnTwNxZ08DWWdPAP3nNwBAlzcBZ88zA99HMwLK7zMCzrMzAb6LMwJ6bzMAZl8zAGpTMwB2SzMDMkMzA7Y/MwFmPzMD3jszAto7MwIuOzMBvjszAXI7MwE+OzMBHjszAJjjHwLq2xsC3XsbAWCvGwMkIxsC08cXANeLFwJHXxcCA0MXA0MvFwLTIxcClxsXAR8XFwGDExcDGw8XAYcPFwB3DxcDxwsXA08LFwMDCxcCzwsXApo3BwFV6wMCH9L/ASZm/wFpjv8CrP7/Avie/wLsXv8CzDL/AXwW/wIMAv8BK/b7AJ/u+wL35vsDM+L7ALfi+wMT3vsB+977AUPe+wDH3vsAd977A0AsxwdALMcHQCzHBzwsxwc8LMcHPCzHBzwsxwc8LMcHPCzHBzwsxwc8LMcHPCzHBzwsxwc8LMcHPCzHBzwsxwc8LMcHPCzHBzwsxwc8LMcHPCzHB8qUtwfGlLcHxpS3B8KUtwfClLcHwpS3B8KUtwfClLcHwpS3B8KUtwfClLcHwpS3B8KUtwfClLcHwpS3B8KUtwfClLcHwpS3B8KUtwfClLcHwpS3BFEAqwRJAKsESQCrBEUAqwRFAKsERQCrBEUAqwRBAKsEQQCrBEEAqwRBAKsEQQCrBEEAqwRBAKsEQQCrBEEAqwRBAKsEQQCrBEEAqwRBAKsEQQCrBNtomwTTaJsEz2ibBMtomwTLaJsEy2ibBMdomwTHaJsEx2ibBMdomwTHaJsEx2ibBMdomwTHaJsEx2ibBMdomwTHaJsEx2ibBMdomwTHaJsEx2ibBWnQjwVd0I8FVdCPBVHQjwVN0I8FSdCPBUnQjwVJ0I8FSdCPBUnQjwVJ0I8FSdCPBUnQjwVJ0I8FSdCPBUnQjwVF0I8FRdCPBUXQjwVF0I8FRdCPBfw4gwXoOIMF4DiDBdg4gwXQOIMF0DiDBcw4gwXMOIMFzDiDBcg4gwXIOIMFyDiDBcg4gwXIOIMFyDiDBcg4gwXIOIMFyDiDBcg4gwXIOIMFyDiDBp6gcwaCoHMGbqBzBmKgcwZaoHMGVqBzBlKgcwZSoHMGTqBzBk6gcwZOoHMGTqBzBk6gcwZOoHMGTqBzBk6gcwZOoHMGTqBzBk6gcwZOoHMGTqBzB00IZwchCGcHBQhnBvEIZwblCGcG3QhnBtkIZwbVCGcG0QhnBtEIZwbRCGcG0QhnBtEIZwbNCGcGzQhnBs0IZwbNCGcGzQhnBs0IZwbNCGcGzQhnBBt0VwfXcFcHp3BXB4twVwd3cFcHa3BXB2NwVwdfcFcHW3BXB1dwVwdXcFcHU3BXB1NwVwdTcFcHU3BXB1NwVwdTcFcHU3BXB1NwVwdTcFcHU3BXBQ3cSwSh3EsEXdxLBC3cSwQN3EsH+dhLB+3YSwfl2EsH3dhLB9nYSwfZ2EsH1dhLB9XYSwfV2EsH1dhLB9XYSwfV2EsH1dhLB9XYSwfV2EsH1dhLBkREPwWcRD8FLEQ/BOBEPwSwRD8EkEQ/BHxEPwRwRD8EZEQ/BGBEPwRcRD8EWEQ/BFhEPwRYRD8EVEQ/BFREPwRURD8EVEQ/BFREPwRURD8EVEQ/B+qsLwberC8GKqwvBbasLwVqrC8FOqwvBRqsLwUCrC8E9qwvBOqsLwTmrC8E4qwvBN6sLwTerC8E2qwvBNqsLwTarC8E2qwvBNqsLwTarC8E2qwvBjEYIwSJGCMHcRQjBrkUIwZBFCMF8RQjBb0UIwWdFCMFhRQjBXUUIwVtFCMFZRQjBWEUIwVhFCMFXRQjBV0UIwVdFCMFXRQjBVkUIwVZFCMFWRQjBX+EEwbjgBMFK4ATBAuAEwdLfBMGz3wTBnt8EwZHfBMGI3wTBgt8EwX7fBMF83wTBet8EwXnfBMF43wTBeN8EwXjfBMF33wTBd98EwXffBMF33wTBmnwBwZJ7AcHlegHBc3oBwSh6AcH2eQHB1nkBwcB5AcGyeQHBqXkBwaN5AcGfeQHBnXkBwZt5AcGaeQHBmXkBwZh5AcGYeQHBmHkBwZh5AcGYeQHB8DD8wLAt/MCMK/zAJCr8wDcp/MCbKPzANSj8wPIn/MDFJ/zAqCf8wJUn/MCIJ/zAgCf8wHsn/MB3J/zAdSf8wHMn/MByJ/zAcif8wHEn/MBxJ/zAQGv1wCFm9cDDYvXAi2D1wBZf9cAgXvXAf131wBVd9cDPXPXAoVz1wINc9cBvXPXAYlz1wFlc9cBUXPXAUFz1wE1c9cBMXPXAS1z1wEpc9cBKXPXAoqjuwJGg7sBBm+7AwpfuwHWV7sDxk+7A85LuwEuS7sDdke7AlZHuwGWR7sBGke7AMZHuwCOR7sAbke7AFZHuwBGR7sAOke7ADZHuwAyR7sALke7ArurnwCze58DO1efAStDnwKnM58BGyufAtMjnwKzH58D+xufAjMbnwEDG58APxufA78XnwNnF58DLxefAwsXnwLzF58C4xefAtcXnwLTF58CyxefAvDPhwJcg4cCqE+HA+wrhwEMF4cB/AeHABf/gwGP94MBR/ODAnfvgwCb74MDY+uDApfrgwIP64MBt+uDAXvrgwFX64MBO+uDASvrgwEf64MBG+uDAWYjawFhq2sB9VtrAIEnawB5A2sAuOtrARjbawLQz2sADMtrA5jDawCsw2sCwL9rAXy/awCov2sAHL9rA8C7awOEu2sDXLtrA0C7awMwu2sDJLtrA8O7TwBfA08D6oNPAYozTwJJ+08A5ddPAEW/TwANr08BYaNPAl2bTwHBl08CtZNPALWTTwNlj08CiY9PAfmPTwGZj08BWY9PATGPTwEVj08BBY9PAdHvNwFYozcDq98zAp9fMwEvCzMADtMzAUarMwO2jzMC4n8zA9JzMwCGbzMDvmczAJZnMwKGYzMBKmMzAEJjMwOuXzMDSl8zAwZfMwLeXzMCwl8zA1jjHwMu4xsA2YsbAzS/GwGEOxsA5+MXAdunFwGbfxcDF2MXAaNTFwInRxcClz8XAZ87FwJbNxcAMzcXAsszFwHbMxcBPzMXANczFwCTMxcAZzMXApo3BwOx6wMB19r/Ay5y/wLNnv8AqRb/AMC6/wOwev8B8FL/Amw2/wBQJv8AZBr/AIwS/wNkCv8AAAr/AcQG/wBMBv8DVAL/ArQC/wJIAv8CBAL/AXhAxwV4QMcFeEDHBXhAxwV0QMcFdEDHBXRAxwV0QMcFdEDHBXRAxwV0QMcFdEDHBXRAxwV0QMcFdEDHBXRAxwV0QMcFdEDHBXRAxwV0QMcFdEDHBgKotwX+qLcF/qi3BfqotwX6qLcF+qi3BfqotwX6qLcF+qi3BfqotwX6qLcF+qi3BfqotwX6qLcF+qi3BfqotwX6qLcF+qi3BfqotwX6qLcF+qi3BoUQqwaBEKsGgRCrBn0QqwZ9EKsGfRCrBn0QqwZ9EKsGfRCrBn0QqwZ9EKsGeRCrBnkQqwZ5EKsGeRCrBnkQqwZ5EKsGeRCrBnkQqwZ5EKsGeRCrBw94mwcLeJsHB3ibBwN4mwcDeJsHA3ibBv94mwb/eJsG/3ibBv94mwb/eJsG/3ibBv94mwb/eJsG/3ibBv94mwb/eJsG/3ibBv94mwb/eJsG/3ibB5ngjweR4I8HjeCPB4ngjweF4I8HgeCPB4HgjweB4I8HgeCPB4HgjweB4I8HgeCPB4HgjweB4I8HgeCPB4HgjweB4I8HgeCPB4HgjweB4I8HgeCPBCxMgwQcTIMEFEyDBAxMgwQITIMECEyDBARMgwQETIMEBEyDBARMgwQATIMEAEyDBABMgwQATIMEAEyDBABMgwQATIMEAEyDBABMgwQATIMEAEyDBMq0cwSytHMEorRzBJq0cwSStHMEjrRzBIq0cwSKtHMEhrRzBIa0cwSGtHMEhrRzBIa0cwSGtHMEhrRzBIa0cwSGtHMEhrRzBIa0cwSGtHMEhrRzBXUcZwVNHGcFNRxnBSUcZwUZHGcFFRxnBREcZwUNHGcFCRxnBQkcZwUJHGcFCRxnBQkcZwUJHGcFCRxnBQkcZwUJHGcFCRxnBQkcZwUFHGcFBRxnBjeEVwX7hFcF04RXBbuEVwWrhFcFn4RXBZeEVwWThFcFk4RXBY+EVwWPhFcFi4RXBYuEVwWLhFcFi4RXBYuEVwWLhFcFi4RXBYuEVwWLhFcFi4RXBx3sSwa97EsGgexLBlnsSwY97EsGLexLBiHsSwYZ7EsGFexLBhHsSwYR7EsGDexLBg3sSwYN7EsGDexLBg3sSwYN7EsGDexLBg3sSwYN7EsGDexLBEBYPweoVD8HSFQ/BwhUPwbcVD8GwFQ/BrBUPwakVD8GnFQ/BphUPwaUVD8GkFQ/BpBUPwaQVD8GkFQ/BoxUPwaMVD8GjFQ/BoxUPwaMVD8GjFQ/BcbALwTWwC8EOsAvB9K8LweOvC8HYrwvB0a8Lwc2vC8HKrwvByK8LwcavC8HFrwvBxa8LwcWvC8HErwvBxK8LwcSvC8HErwvBxK8LwcSvC8HErwvB+EoIwZhKCMFaSgjBMUoIwRdKCMEFSgjB+kkIwfJJCMHuSQjB6kkIwehJCMHnSQjB5kkIweZJCMHlSQjB5UkIweVJCMHlSQjB5UkIweVJCMHlSQjBvOUEwSPlBMHA5ATBf+QEwVXkBME55ATBJ+QEwRvkBMEU5ATBD+QEwQvkBMEJ5ATBCOQEwQfkBMEG5ATBBuQEwQbkBMEF5ATBBeQEwQXkBMEF5ATB4IABwe1/AcFPfwHB6H4BwaR+AcF4fgHBXH4BwUl+AcE9fgHBNX4BwS9+AcEsfgHBKn4BwSh+AcEnfgHBJ34BwSZ+AcEmfgHBJn4BwSZ+AcEmfgHBOTn8wDY2/MA/NPzA9jL8wCAy/MCUMfzAODH8wP0w/MDWMPzAvDD8wKww/MChMPzAmjD8wJUw/MCSMPzAkDD8wI8w/MCOMPzAjjD8wI0w/MCNMPzAKnP1wGJu9cBCa/XAOGn1wONn9cAFZ/XAc2b1wBVm9cDXZfXArmX1wJRl9cCDZfXAeGX1wHBl9cBsZfXAaGX1wGZl9cBlZfXAZGX1wGRl9cBjZfXACrDuwHGo7sB6o+7APKDuwB6e7sC8nO7A1ZvuwD6b7sDcmu7AnJruwHKa7sBWmu7ARZruwDma7sAxmu7ALJruwCma7sAnmu7AJpruwCWa7sAkmu7AZ/HnwIfl58Ck3efAfNjnwB7V58Dr0ufAfNHnwIzQ58Dvz+fAic/nwEbP58Abz+fA/87nwOzO58DgzufA2M7nwNPO58DPzufAzc7nwMzO58DLzufAkjnhwD8n4cD3GuHAxxLhwG0N4cDuCeHApQfhwCcG4cAuBeHAjAThwCIE4cDcA+HArwPhwJID4cB/A+HAcgPhwGoD4cBkA+HAYQPhwF8D4cBdA+HADo3awBhw2sATXdrAX1DawN9H2sBQQtrArz7awFA82sDEOtrAwTnawBg52sCqONrAYjjawDM42sAVONrAATjawPM32sDrN9rA5TfawOI32sDfN9rASPLTwLHE08CkptPA55LTwMOF08DwfNPAKnfTwGVz08DvcNPAVG/TwEdu08CYbdPAJW3TwNts08CqbNPAimzTwHVs08BobNPAX2zTwFls08BWbNPAo33NwJYrzcBp/MzAOt3MwL3IzMAlu8zA/LHMwP6rzMAUqMzAhqXMwNqjzMDEoszADqLMwJehzMBJoczAF6HMwPagzMDgoMzA0qDMwMmgzMDDoMzAhTnHwNi6xsDQZcbAMDTGwN0TxsCZ/sXAifDFwAbnxcDO4MXAvdzFwBbaxcBa2MXAOdfFwHvWxcAA1sXAsNXFwHvVxcBZ1cXAQtXFwDTVxcAq1cXApo3BwIJ7wMBg+L/AQ6C/wPtrv8CPSr/AfTS/wPAlv8AQHL/AmxW/wGMRv8ChDr/A1Ay/wKgLv8DjCr/AYwq/wBAKv8DZCb/Atgm/wJ4Jv8CPCb/AwxQxwcMUMcHDFDHBwxQxwcMUMcHDFDHBwxQxwcMUMcHDFDHBwxQxwcMUMcHDFDHBwxQxwcMUMcHDFDHBwxQxwcMUMcHDFDHBwxQxwcMUMcHDFDHB5a4tweSuLcHkri3B5K4tweOuLcHjri3B464tweOuLcHjri3B464tweOuLcHjri3B464tweOuLcHjri3B464tweOuLcHjri3B464tweOuLcHjri3BBkkqwQVJKsEFSSrBBEkqwQRJKsEESSrBBEkqwQRJKsEESSrBBEkqwQRJKsEESSrBBEkqwQRJKsEESSrBBEkqwQRJKsEESSrBBEkqwQRJKsEESSrBKOMmwSfjJsEm4ybBJeMmwSXjJsEl4ybBJeMmwSXjJsEl4ybBJOMmwSTjJsEk4ybBJOMmwSTjJsEk4ybBJOMmwSTjJsEk4ybBJOMmwSTjJsEk4ybBS30jwUl9I8FHfSPBR30jwUZ9I8FGfSPBRX0jwUV9I8FFfSPBRX0jwUV9I8FFfSPBRX0jwUV9I8FFfSPBRX0jwUV9I8FFfSPBRX0jwUV9I8FFfSPBbxcgwWsXIMFpFyDBaBcgwWcXIMFnFyDBZhcgwWYXIMFmFyDBZhcgwWYXIMFmFyDBZhcgwWYXIMFmFyDBZhcgwWYXIMFmFyDBZhcgwWYXIMFmFyDBlbEcwZCxHMGMsRzBirEcwYmxHMGIsRzBh7EcwYexHMGHsRzBh7EcwYaxHMGGsRzBhrEcwYaxHMGGsRzBhrEcwYaxHMGGsRzBhrEcwYaxHMGGsRzBvksZwbZLGcGxSxnBrUsZwatLGcGpSxnBqUsZwahLGcGoSxnBp0sZwadLGcGnSxnBp0sZwadLGcGnSxnBp0sZwadLGcGnSxnBp0sZwadLGcGnSxnB7eUVwd/lFcHX5RXB0uUVwc7lFcHM5RXByuUVwcnlFcHJ5RXByOUVwcjlFcHI5RXByOUVwcjlFcHI5RXBx+UVwcflFcHH5RXBx+UVwcflFcHH5RXBJIASwQ+AEsEBgBLB+H8SwfN/EsHvfxLB7H8Swet/EsHqfxLB6X8Swel/EsHpfxLB6H8Sweh/EsHofxLB6H8Sweh/EsHofxLB6H8Sweh/EsHofxLBaBoPwUYaD8ExGg/BIxoPwRkaD8EUGg/BEBoPwQ0aD8EMGg/BCxoPwQoaD8EJGg/BCRoPwQkaD8EJGg/BCRoPwQkaD8EJGg/BCRoPwQkaD8EJGg/BwrQLwYy0C8FqtAvBU7QLwUS0C8E7tAvBNbQLwTG0C8EutAvBLLQLwSu0C8ErtAvBKrQLwSq0C8EqtAvBKbQLwSm0C8EptAvBKbQLwSm0C8EptAvBQE8IwelOCMGxTgjBjU4IwXVOCMFmTgjBXE4IwVZOCMFRTgjBT04IwU1OCMFMTgjBS04IwUtOCMFKTgjBSk4IwUpOCMFKTgjBSk4IwUpOCMFKTgjB9ekEwWrpBMEQ6QTB1ugEwbDoBMGX6ATBiOgEwX3oBMF36ATBcugEwXDoBMFu6ATBbegEwWzoBMFr6ATBa+gEwWvoBMFr6ATBa+gEwWvoBMFr6ATBA4UBwSWEAcGUgwHBN4MBwfqCAcHTggHBuoIBwamCAcGfggHBmIIBwZOCAcGQggHBjoIBwY2CAcGMggHBjIIBwYyCAcGLggHBi4IBwYuCAcGLggHBQ0H8wHk+/MCqPPzAfzv8wLw6/MA/OvzA7Tn8wLg5/MCWOfzAgDn8wHI5/MBoOfzAYjn8wF45/MBcOfzAWjn8wFk5/MBZOfzAWDn8wFg5/MBYOfzA23r1wGR29cB/c/XAnnH1wGdw9cCeb/XAG2/1wMZu9cCQbvXAbG71wFVu9cBGbvXAPW71wDZu9cAybvXAMG71wC5u9cAtbvXALG71wCxu9cArbvXAQLfuwBqw7sB2q+7AdKjuwIGm7sA+pe7AbKTuwOWj7sCNo+7AVKPuwC+j7sAXo+7AB6PuwP2i7sD3ou7A86LuwPCi7sDuou7A7aLuwOyi7sDsou7A+PfnwLHs58BD5efAceDnwFHd58BK2+fA+tnnwCHZ58CU2OfAONjnwP3X58DX1+fAvtfnwK7X58Ck1+fAndfnwJnX58CW1+fAlNfnwJPX58CS1+fASj/hwMAt4cAUIuHAXBrhwFoV4cAbEuHAABDhwKMO4cDBDeHALg3hwM8M4cCSDOHAagzhwFAM4cBADOHANQzhwC4M4cApDOHAJgzhwCQM4cAjDOHArpHawLt12sCDY9rAb1fawGpP2sA2StrA1kbawKdE2sA8Q9rAUULawLlB2sBWQdrAFkHawO1A2sDSQNrAwUDawLVA2sCuQNrAqUDawKZA2sCkQNrAlvXTwDjJ08AxrNPARZnTwMWM08BwhNPACH/TwId708BBedPAyHfTwNR208A2dtPA0HXTwI1108BiddPARnXTwDR108ApddPAIXXTwBx108AZddPAzn/NwEcvzcDUAM3AseLMwArPzMAZwszAcrnMwNSzzMAwsMzA063MwEyszMBOq8zAqqrMwD+qzMD6qczAzanMwLGpzMCeqczAkqnMwIqpzMCFqczAMzrHwOG8xsBgacbAgTjGwD4ZxsDVBMbAb/fFwHHuxcCb6MXA0+TFwF/ixcDI4MXAwN/FwBXfxcCn3sXAX97FwDHexcAT3sXA/93FwPPdxcDq3cXApo3BwBd8wMBH+r/AsKO/wDJwv8DZT7/Apjq/wMcsv8BwI7/AYB2/wHIZv8DlFr/APxW/wC0Uv8B7E7/ACBO/wL4Sv8COEr/AbhK/wFoSv8BNEr/AAhkxwQIZMcEBGTHBARkxwQEZMcEBGTHBARkxwQEZMcEBGTHBARkxwQEZMcEBGTHBARkxwQEZMcEBGTHBARkxwQEZMcEBGTHBARkxwQEZMcEBGTHBI7MtwSKzLcEisy3BIrMtwSKzLcEisy3BIrMtwSKzLcEisy3BIrMtwSKzLcEisy3BIrMtwSKzLcEisy3BIrMtwSKzLcEisy3BIrMtwSKzLcEisy3BRE0qwURNKsFDTSrBQ00qwUNNKsFDTSrBQ00qwUJNKsFCTSrBQk0qwUJNKsFCTSrBQk0qwUJNKsFCTSrBQk0qwUJNKsFCTSrBQk0qwUJNKsFCTSrBZucmwWXnJsFk5ybBZOcmwWPnJsFj5ybBY+cmwWPnJsFj5ybBY+cmwWPnJsFj5ybBY+cmwWPnJsFj5ybBY+cmwWPnJsFj5ybBY+cmwWPnJsFj5ybBiIEjwYeBI8GGgSPBhYEjwYSBI8GEgSPBhIEjwYSBI8GEgSPBhIEjwYSBI8GEgSPBhIEjwYSBI8GEgSPBhIEjwYSBI8GEgSPBhIEjwYSBI8GEgSPBrBsgwakbIMGnGyDBphsgwaUbIMGlGyDBpRsgwaUbIMGkGyDBpBsgwaQbIMGkGyDBpBsgwaQbIMGkGyDBpBsgwaQbIMGkGyDBpBsgwaQbIMGkGyDB0bUcwc21HMHKtRzByLUcwce1HMHGtRzBxrUcwcW1HMHFtRzBxbUcwcW1HMHFtRzBxbUcwcW1HMHFtRzBxbUcwcW1HMHFtRzBxbUcwcW1HMHFtRzB+U8ZwfJPGcHuTxnB608ZwelPGcHoTxnB508ZweZPGcHmTxnB5k8ZweZPGcHmTxnB5U8ZweVPGcHlTxnB5U8ZweVPGcHlTxnB5U8ZweVPGcHlTxnBJuoVwRvqFcET6hXBD+oVwQvqFcEK6hXBCOoVwQfqFcEH6hXBB+oVwQbqFcEG6hXBBuoVwQbqFcEG6hXBBuoVwQbqFcEG6hXBBuoVwQbqFcEG6hXBWoQSwUiEEsE8hBLBNIQSwS+EEsEshBLBKoQSwSmEEsEohBLBKIQSwSeEEsEnhBLBJ4QSwSeEEsEnhBLBJ4QSwSeEEsEnhBLBJ4QSwSeEEsEnhBLBmx4PwX0eD8FqHg/BXR4PwVYeD8FQHg/BTR4PwUseD8FKHg/BSR4PwUgeD8FIHg/BSB4PwUceD8FHHg/BRx4PwUceD8FHHg/BRx4PwUceD8FHHg/B77gLwb+4C8GguAvBjLgLwX+4C8F3uAvBcbgLwW64C8FsuAvBargLwWm4C8FpuAvBaLgLwWi4C8FouAvBaLgLwWi4C8FouAvBaLgLwWi4C8FouAvBY1MIwRVTCMHjUgjBw1IIwa5SCMGgUgjBmFIIwZJSCMGPUgjBjVIIwYtSCMGKUgjBilIIwYlSCMGJUgjBiVIIwYlSCMGJUgjBiFIIwYhSCMGIUgjBC+4EwY3tBME77QTBB+0EwebsBMHQ7ATBwuwEwbnsBMGz7ATBsOwEwa3sBMGs7ATBq+wEwarsBMGq7ATBqewEwansBMGp7ATBqewEwansBMGp7ATBB4kBwTqIAcG2hwHBYocBwSyHAcEJhwHB8oYBweSGAcHahgHB1IYBwdGGAcHOhgHBzIYBwcuGAcHLhgHByoYBwcqGAcHKhgHByoYBwcqGAcHKhgHBEUn8wHxG/MDSRPzAwUP8wBFD/MCgQvzAV0L8wClC/MALQvzA90H8wOtB/MDjQfzA3kH8wNpB/MDYQfzA10H8wNZB/MDVQfzA1UH8wNVB/MDVQfzAVYL1wCp+9cB7e/XAwXn1wKV49cDvd/XAeXf1wC539cD9dvXA3nb1wMp29cC9dvXAtXb1wK929cCsdvXAqnb1wKh29cCndvXAp3b1wKZ29cCmdvXASL7uwIy37sA2s+7AbLDuwKGu7sB5re7Au6zuwEGs7sDzq+7AwKvuwKCr7sCLq+7AfqvuwHWr7sBwq+7AbKvuwGqr7sBoq+7AZ6vuwGer7sBmq+7AYf7nwKzz58Cs7OfAK+jnwETl58Bn4+fAM+LnwG7h58Dv4OfAneDnwGng58BH4OfAMeDnwCPg58Ab4OfAFeDnwBHg58AP4OfADeDnwAzg58AM4OfA5EThwBo04cADKeHAvCHhwA0d4cAJGuHAGBjhwNkW4cAMFuHAiBXhwDMV4cD8FOHA2RThwMMU4cC0FOHAqxThwKUU4cChFOHAnhThwJ0U4cCcFOHAO5bawEB72sDNadrAUl7awMFW2sDiUdrAv07awLtM2sBvS9rAmUrawBBK2sC4SdrAf0nawFpJ2sBDSdrANEnawCpJ2sAkSdrAIEnawB1J2sAcSdrAHPnTwKrN08CisdPAf5/TwJuT08C9i9PArYbTwGqD08BRgdPA+H/TwBp/08CLftPAMH7TwPV908DPfdPAtn3TwKd908CdfdPAln3TwJJ908CPfdPA9IHNwO0yzcAtBc3ADejMwDTVzMDiyMzAtcDMwHG7zMANuMzA37XMwHi0zMCRs8zA/bLMwJ6yzMBgsszAObLMwB+yzMAPsszABbLMwP6xzMD6sczA4TrHwOW+xsDkbMbAwTzGwIQexsDtCsbAKv7FwKr1xcAx8MXAq+zFwGbqxcDx6MXAAejFwGfnxcAE58XAxObFwJvmxcCA5sXAb+bFwGXmxcBe5sXApo3BwKx8wMAq/L/AE6e/wFh0v8AJVb/ArkC/wHUzv8CfKr/A7iS/wEQhv8DpHr/AZR2/wGscv8DLG7/AYxu/wCEbv8D2Gr/A2xq/wMkav8C+Gr/AGx0xwRsdMcEbHTHBGx0xwRsdMcEbHTHBGx0xwRsdMcEbHTHBGx0xwRsdMcEbHTHBGx0xwRsdMcEbHTHBGx0xwRsdMcEbHTHBGx0xwRsdMcEbHTHBPLctwTy3LcE8ty3BPLctwTy3LcE8ty3BPLctwTy3LcE8ty3BPLctwTy3LcE8ty3BPLctwTy3LcE8ty3BPLctwTy3LcE8ty3BPLctwTy3LcE8ty3BXlEqwV1RKsFdUSrBXVEqwVxRKsFcUSrBXFEqwVxRKsFcUSrBXFEqwVxRKsFcUSrBXFEqwVxRKsFcUSrBXFEqwVxRKsFcUSrBXFEqwVxRKsFcUSrBf+smwX7rJsF+6ybBfesmwX3rJsF96ybBfesmwX3rJsF96ybBfesmwX3rJsF96ybBfesmwX3rJsF96ybBfesmwX3rJsF96ybBfesmwX3rJsF96ybBoYUjwaCFI8GfhSPBnoUjwZ6FI8GehSPBnoUjwZ6FI8GdhSPBnYUjwZ2FI8GdhSPBnYUjwZ2FI8GdhSPBnYUjwZ2FI8GdhSPBnYUjwZ2FI8GdhSPBxB8gwcIfIMHBHyDBwB8gwb8fIMG/HyDBvh8gwb4fIMG+HyDBvh8gwb4fIMG+HyDBvh8gwb4fIMG+HyDBvh8gwb4fIMG+HyDBvh8gwb4fIMG+HyDB6bkcweW5HMHjuRzB4bkcweC5HMHguRzB37kcwd+5HMHfuRzB37kcwd+5HMHfuRzB37kcwd+5HMHfuRzB37kcwd+5HMHfuRzB37kcwd+5HMHfuRzBEFQZwQpUGcEGVBnBBFQZwQJUGcEBVBnBAFQZwQBUGcEAVBnB/1MZwf9TGcH/UxnB/1MZwf9TGcH/UxnB/1MZwf9TGcH/UxnB/1MZwf9TGcH/UxnBO+4VwTHuFcEr7hXBJ+4VwSTuFcEj7hXBIu4VwSHuFcEh7hXBIO4VwSDuFcEg7hXBIO4VwSDuFcEg7hXBIO4VwSDuFcEg7hXBIO4VwSDuFcEg7hXBbYgSwV2IEsFTiBLBTIgSwUiIEsFFiBLBQ4gSwUKIEsFCiBLBQYgSwUGIEsFBiBLBQYgSwUCIEsFAiBLBQIgSwUCIEsFAiBLBQIgSwUCIEsFAiBLBqiIPwZAiD8F/Ig/BdCIPwW0iD8FpIg/BZiIPwWQiD8FjIg/BYiIPwWIiD8FhIg/BYSIPwWEiD8FhIg/BYSIPwWEiD8FhIg/BYSIPwWEiD8FhIg/B+bwLwc68C8GyvAvBobwLwZW8C8GOvAvBirwLwYe8C8GFvAvBhLwLwYO8C8GCvAvBgrwLwYK8C8GCvAvBgrwLwYK8C8GCvAvBgrwLwYK8C8GCvAvBZlcIwR9XCMHyVgjB1VYIwcNWCMG3VgjBr1YIwatWCMGoVgjBplYIwaRWCMGkVgjBo1YIwaNWCMGjVgjBolYIwaJWCMGiVgjBolYIwaJWCMGiVgjBAfIEwY7xBMFE8QTBFvEEwfjwBMHk8ATB2PAEwdDwBMHM8ATByPAEwcbwBMHF8ATBxPAEwcTwBMHD8ATBw/AEwcPwBMHD8ATBw/AEwcPwBMHD8ATB64wBwS+MAcG3iwHBaosBwTmLAcEaiwHBBosBwfqKAcHyigHB7IoBwemKAcHnigHB5ooBweWKAcHkigHB5IoBweSKAcHkigHB5IoBweOKAcHjigHBpVD8wEFO/MC6TPzAwEv8wCFL/MC7SvzAekr8wFFK/MA3SvzAJkr8wBtK/MAUSvzAEEr8wA1K/MALSvzACkr8wAlK/MAJSvzACEr8wAhK/MAISvzAm4n1wLaF9cA6g/XApIH1wKCA9cD7f/XAkX/1wE5/9cAjf/XAB3/1wPZ+9cDrfvXA4371wN9+9cDcfvXA2n71wNl+9cDYfvXA2H71wNd+9cDXfvXAIcXuwMq+7sC9uu7AJ7juwIC27sByte7AxrTuwFi07sAStO7A5bPuwMmz7sC3s+7Aq7PuwKSz7sCfs+7AnLPuwJqz7sCZs+7AmLPuwJez7sCXs+7ApQTowHv658Di8+fArO/nwPvs58BD6+fAKurnwHfp58AE6efAu+jnwI3o58Bv6OfAXOjnwFDo58BI6OfAQ+jnwEDo58A+6OfAPejnwDzo58A86OfAYUrhwE864cDGL+HA6ijhwIck4cC7IeHA8R/hwM0e4cASHuHAmx3hwE8d4cAfHeHAAB3hwOwc4cDgHOHA2BzhwNMc4cDPHOHAzRzhwMwc4cDLHOHAs5rawKqA2sDzb9rACGXawOVd2sBVWdrAbFbawI9U2sBfU9rAnlLawCJS2sDTUdrAoFHawIBR2sBsUdrAX1HawFZR2sBRUdrATVHawEtR2sBKUdrA1/zTwArS08D3ttPAlqXTwEWa08DYktPAGo7TwBKL08AiidPA5ofTwByH08CbhtPASYbTwBWG08DzhdPA3oXTwNCF08DIhdPAwoXTwL6F08C8hdPAFYTNwIc2zcB0Cc3ATu3MwDrbzMCAz8zAx8fMwNfCzMCvv8zArL3MwGO8zMCRu8zAC7vMwLW6zMB/uszAXLrMwEa6zMA4uszAL7rMwCm6zMAluszAjjvHwOXAxsBecMbA70DGwLAjxsDjEMbAuwTGwLL8xcCP98XAR/TFwC/yxcDZ8MXA/u/FwHPvxcAa78XA4e7FwL3uxcCm7sXAl+7FwI7uxcCI7sXApo3BwEF9wMAJ/r/AbKq/wG14v8AhWr/Ak0a/wPg5v8CdMb/ARSy/wNsov8CtJr/ASSW/wGYkv8DVI7/AeCO/wD0jv8AYI7/AACO/wPAiv8DmIr/ARmkKwQwKCsFcsgnBXmAJwbETCcEpzQjBN4wIwbJPCMGbFwjBRuMHwXiyB8H3hAfBjloHwQozB8E8DgfB9esGwQ3MBsFargbBtpIGwQB5BsEVYQbBnZkHwf80B8G71gbB3n8GwbQvBsE25QXBxJ8FweReBcFPIgXBxOkEwQK1BMHNgwTB7VUEwSorBMFTAwTBN94Dwai7A8F7mwPBiX0DwathA8G9RwPBmNIEwZxmBMEvBATBX6gDwctSA8G3AgPB1LcCwdVxAsFxMALBYPMBwV+6AcEwhQHBlVMBwVUlAcE5+gDBD9IAwaSsAMHMiQDBXGkAwSpLAMEQLwDBlRMCwdOiAcHMOQHBetcAwVx7AMEeJQDB1Kj/wOER/8DHhP7A9AD+wNmF/cDvEv3Ataf8wLND/MBz5vvAiI/7wIs++8Aa8/rA2Kz6wG5r+sCLLvrAa77+wC3O/cDl7PzAixn8wGVT+8DBmfrA7uv5wEZJ+cAlsfjA8SL4wBOe98D+IffAKq72wBVC9sBF3fXARX/1wKcn9cAC1vTA9In0wCBD9MAtAfTAg2f5wEBm+MCEdPfAjpH2wJ289cD49PTA6Tn0wMKK88DY5vLAiU3ywDm+8cBROPHAQrvwwING8MCT2e/A9XPvwDUV78DjvO7AlmruwOod7sCD1u3AQCL0wLQO88CRC/LADxjxwGsz8MDjXO/AvpPuwEXX7cDIJu3AnIHswB/n68CyVuvAv8/qwLZR6sAN3OnAQW7pwNUH6cBUqOjATU/owFj858APr+fAg+/uwLHI7cAss+zAKa7rwOG46sCO0unAb/rowMkv6MDmcefAE8DmwKUZ5sD5feXAcOzkwHJk5MBu5ePA2W7jwDEA48D3mOLAtTjiwPre4cBbi+HAdNDpwF+V6MB6bOfA/FTmwBlO5cAKV+TACG/jwFOV4sAsyeHA3gnhwLVW4MAFr9/AKhLfwIR/3sB69t3Ae3bdwPv+3MB2j9zAbSfcwGrG28D6a9vAL8XkwOJ148ClOOLArQ3hwDb038B0697AnvLdwO4I3cChLdzA+V/bwD+f2sDA6tnAzkHZwMSj2MAAENjA64XXwPAE18CEjNbAIhzWwEuz1cCFUdXAXtLfwF9q3sDLGN3AZ9nbwFys2sDskNnAS4bYwK6L18BPoNbAasPVwEL01MAdMtTAR3zTwBLS0sDYMtLA953RwNUS0cDfkNDAhxfQwEemz8ChPM/AdxnbwBp62cAbDdjAQLnWwLd31cCZSNTAMCvTwK8e0sBMItHAPjXQwMJWz8AZhs7AiMLNwFoLzcDjX8zAeb/LwHopy8BLncrAWRrKwBWgycD3LcnAcaLWwOHK1MC+ItPAdK3RwFRX0MCmE8/AdeLNwBTDzMC0tMvAirbKwM3HycC558jAjhXIwJFQx8ANmMbAUuvFwLdJxcCassTAXyXEwHChw8A/JsPApubSwP1j0MBpes7A4s7MwDJNy8AX88nARa3IwAJ6x8CpWMbAaUjFwHhIxMAMWMPAYXbCwLSiwcBL3MDAbyLAwHF0v8Cm0b7Aajm+wCGrvcA2Jr3AQCnQwMTuzMBTJMrA4izIwJt4xsBs68TAmozDwKVEwsBRD8HA/+u/wOHZvsAp2L3ADua8wMoCvMCcLbvAx2W6wJOqucBR+7jAVFe4wPq9t8CkLrfAcI3NwE8yysB888bAhOjDwGbhwcD5H8DAbIe+wO8jvcDZ2bvAc6K6wCl9ucAsabjArWW3wONxtsAHjbXAV7a0wBTts8CJMLPAAoCywNXascBbQLHAmSXLwBmVx8ACOMTA4PTAwBHMvcBek7vAFsW5wM0ouMDEubbA72y1wHkztMA3DLPAWvaxwBXxsMCb+6/AJxWvwPQ8rsBFcq3AYrSswJYCrMA3XKvANPHIwE8dxcDXm8HAajq+wP7yusDzxbfAxki1wJdos8D8yLHANE+wwPr9rsBywq3AOJmswH2Bq8BweqrASIOpwDubqMCGwafAavWmwC42psAdg6XAYBzHwKXZwsCjHr/AUp+7wJc5uMDn7bTApbyxwNL7rsCbEK3A8GarwJ3iqcAIjajAcE+nwD8kpsCkCqXA0QGkwPkIo8BTH6LAG0ShwJJ2oMD9tZ/AmJzFwDHQwMBVz7zAPiO5wJuftcCXNbLAquWuwDiwq8DSsajAtLimwMoCpcBEdaPAKhqiwIHaoMBZrZ/A35GewEWHncC+jJzAf6GbwMXEmsDO9ZnAoTTEwNU/v8DrsrrAj8e2wK4ks8DAnK/Aey6swFjaqMC9oKXA/IGiwJ5eoMC6nJ7AkgydwKimm8C3Y5rAlzSZwD8XmMDeCpfApw6WwM8hlcCRQ5TAYOPCwMDZvcA647jABZ+0wFvIsMAEI63A05apwFUkpsACzKLARI6fwG1rnMCDB5rATjWYwOihlsAcMpXAF+uTwAm6ksDSmpHAqoyQwMOOj8BSoI7AcqrBwEqKvMAGf7fAnKyywCCRrsDqx6rAUB6nwOSNo8AzF6DAuLqcwN14mcD3UZbAm66TwIbRkcBfNZDAybuOwKtwjcC7PYzApxyLwLgMisAhDYnAu6O/wFRTu8BZMbbAcSSxwCKPrMDriqjAdsSkwKIWocACgp3AJgeawIumlsCaYJPAqzWQwKFTjcCAbovA/caJwPREiMCR9IbAqr+FwM6chMAXi4PAO8S7wMgpucCx9LTAvtivwFTMqsCnfKbAtIiiwBC+nsAJDJvAPnOXwED0k8CLj5DAi0WNwJkWisA5DIfAjQmFwNNWg8Bw0oHAJ3iAwPN/fsCFNnzALGoLwSYYC8EozArBmIYKwQ9GCsF9CwrBttUJwfqjCcHudQnBUksJweYjCcFy/wjBY94IwTnACMFbpAjBnYoIwddyCMHmXAjB1UgIwVA2CME5JQjB/4UIwXsuCMG83QfBX5QHwWlQB8FeEQfB7dYGwS6hBsGRcAbBj0MGweoZBsG/8wXBdNAFwdOvBcGskQXB0HUFwRVcBcFRRAXBYC4FwR8aBcFtBwXBDKsFweBOBcFU+QTB06kEwUxgBMHVHQTBL+ADwXWnA8H8cgPBY0IDwWYVA8HE6wLBQMUCwaKhAsG1gALBR2ICwSlGAsEwLALBNBQCwQ/+AcGe6QHBZdsCwcB3AsFYGwLBoscBwQ96AcF3MgHBBvAAwWSyAMFCeQDBUUQAwUgTAMHFy//AwHf/wAYq/8Ak4v7AsJ/+wEVi/sCGKf7AGvX9wLHE/cD+l/3AgBMAwbZS/8C4j/7AvNv9wF40/cDWmPzAZwj8wFmC+8ABBvvAuZL6wOYn+sD1xPnAWmn5wJQU+cAmxvjAnn34wJA6+MCW/PfAU8P3wG2O98CSXffA1av6wOTJ+cB7+PjAcDX4wO1/98Ah1/bAQzr2wJOo9cBcIfXA7aP0wKIv9MDew/PADGDzwKED88AZrvLA+F7ywMkV8sAg0vHAl5PxwM9Z8cBvJPHADkX1wEpS9MDIb/PAopzywPXX8cDrIPHAsHbwwHvY78CLRe/AKb3uwKM+7sBVye3An1ztwO337MCxmuzAZkTswJH068C7quvAeGbrwF8n68AS7erAr/HvwKfr7sDs9u3AkBLtwKw97MBed+vAy77qwCET6sCVc+nAZd/owNdV6MA61ufA6F/nwEDy5sCsjObAny7mwJPX5cAJh+XAjDzlwK335MAFuOTA07HqwFiX6cA6j+jAh5jnwFKy5sCw2+XAwBPlwKVZ5MCMrOPAqAvjwDd24sB96+HAyWrhwHLz4MDXhODAYh7gwIO/38C0Z9/AdRbfwFHL3sDWhd7ABoblwMFW5MAQOuPA3S/iwDM34cAkT+DAxXbfwDKt3sCO8d3ABUPdwMmg3MAWCtzAMH7bwGX82sAJhNrAexTawCSt2cBzTdnA4fTYwO2i2MAgV9jAs3bgwGcq38DU+N3A79ncwKbN28AF09rAHOnZwP8O2cDJQ9jAnYbXwKPW1sAPM9bAGpvVwAgO1cAki9TAwhHUwEKh08AIOdPAhdjSwC9/0sCFLNLAjKnbwCsl2sA1zdjAI5jXwAp31sCsaNXAE2zUwFCA08B0pNLAm9fRwOYY0cB8Z9DAj8LPwFgpz8AZm87AHBfOwLWczcBAK83AJMLMwM5gzMC0BszA5SDXwNNa1cDD0tPAtW7SwMM00cB2EdDAAgHPwHMCzsDVFM3AOzfMwL9oy8CAqMrApvXJwF9PycDmtMjAeSXIwGKgx8D1JMfAjbLGwI5IxsBk5sXAEXrTwGPj0MCAEM/AkX3NwI8NzMDJzsrASKnJwL+WyMA5lsfAwKbGwGjHxcBI98TAfzXEwDSBw8CU2cLA2D3CwD2twcANJ8HAmarAwD03wMBazL/Al53QwPKEzcAmp8rATsbIwKElx8BLsMXAc2fEwJY+w8D4KcLAeifBwCc2wMAQVb/ATYO+wPq/vcA9Cr3ARGG8wEPEu8B6MrvAMKu6wLYtusBkubnAKefNwF2pysD2i8fAqIvEwH16wsCCy8DA9lK/wN7+vcB00bzAwbq7wEy2usAew7nASOC4wOEMuMAESLfA1ZC2wIHmtcA9SLXARrW0wOEstMBfrrPAP2rLwEzwx8BYscTANo/BwECKvsCtMLzAzHG6wBXzuMDhk7fA9mG2wC9JtcDCQrTAuk2zwCVpssAZlLHAsc2wwBAVsMBiaa/A2smuwLM1rsA0rK3AESTJwN1jxcBT+cHAmrW+wMOOu8ArhbjAF+S1wCgctMC5kLLATCqxwOfwr8BV1a7A8cytwA7WrMC676vACRmrwBZRqsADl6nA+umowC1JqMDXs6fAw0THwKkMw8BCZL/Arf67wDa2uMCxirXAfnyywB6hr8Dsw63A8iuswO/CqsAgf6nASF+owOxUp8AuXKbAG3SlwMWbpMBH0qPAwRajwFxoosBKxqHAZbfFwGXywMA9Ar3AJGq5wG0AtsA/s7LAFIOvwExwrMAse6nAAWynwH3FpcAzWaTALgujwBrnocDH2qDALuCfwFv2nsBgHJ7AVlGdwF2UnMCc5JvA1kTEwKpZv8CK1brAA/q2wBhts8Cl/q/AyayswP93qcCpYKbAD2ejwG8UocD0YZ/AMO2dwB6VnMDfbJvAlF6awCBimcCNdpjA7ZqXwFfOlsDqD5bAwevCwDrpvcAd/LjAkcG0wMP7sMCQbK3AavmpwOeipsCGaaPAqk2gwJxPncBtuprAi/+YwAJ/l8AmJJbAlvKUwGfgk8AX4pLAxPSRwH4XkcBcSZDAka3BwCWSvMDIjbfAacKywLy0rsCI/KrAn2inwM/wo8CulaDAvVedwGI3msDoNJfA0miUwOCaksDrDpHAdLGPwF12jsBRYI3AJWCMwBJxi8AmkorA7KS/wCBWu8CzOLbAgDKxwE6lrMBbrqjA7fmkwFlhocDn5J3AMIWawLhCl8DmHZTABheRwEkujsCWNozAUJ2KwMI8icBE+IfAWN6GwF3chcCJ64TAO8S7wPIqucAF+LTAoN+vwPXYqsDkkqbAtqyiwAf0nsDRVpvAxtWXwINxlMCMKpHASgGOwAv2isADCYjAutKFwKYuhMAhxoLAqHmBwDdbgMCSrX7AAG0MwUofDMGo1wvBdpkLwRZjC8EFMgvB6wQLwXrbCsEFtgrBsJMKwS90CsFIVwrBxjwKwQMlCsFoDwrBnvsJwX/pCcHv2AnBxMkJweG7CcEqrwnB7GUJwQsZCcEQ1AjBg5QIwftaCMEMJgjBX/UHwdvJB8H8oQfBdX0Hwe1bB8EoPQfB7iAHwQwHB8FS7wbBk9kGwaXFBsFjswbBCKMGwTaUBsGjhgbBQ3gGwSEnBsHi3AXBEZkFwdlbBcGgIwXB5u8EwVXABMGflATBdmwEwaxIBMHiJwTBzQkEwTXuA8Hp1APB770DweCoA8GUlQPB5oMDwbVzA8HhZAPBjZUDwdw+A8EU8ALBeacCwY1kAsHpJgLB4u8BwUe9AcHHjgHBaWQBwX49AcHCGQHB9PgAwdvaAMFAvwDB7qUAwbmOAMFzeQDB9GUAwRlUAMG9QwDB8L0AwdJgAMHKCgDBEXn/wOzq/sBjaP7A0PD9wL6C/cB8Hf3AYcD8wM9q/MA0HPzABdT7wMOR+8D2VPvAMR37wAzq+sAou/rALpD6wM1o+sC5RPrAGN/7wCQV+8C8XvrADLf5wN4c+cCpjvjAlwv4wNyS98C6I/fAe732wHdf9sAOCfbArLn1wMdw9cDcLfXAdfD0wCK49MB6hPTAHlX0wLYp9MDvAfTADFb2wBl/9cC/ufTAQwP0wKta88AKv/LAfC/ywCur8cBIMfHAFMHwwNhZ8MDq+u/AqqPvwIFT78DlCe/AUsbuwFCI7sBtT+7AQhvuwG7r7cCXv+3AnePwwGf778A/JO/AGF3uwO6k7cDG+uzAsV3swMrM68A4R+vALszqwOda6sCu8unA1pLpwL466cDO6ejAep/owD5b6MCgHOjALuPnwICu58AzfufA6IXrwFqJ6sAUn+nA/cXowAn958AwQ+fAeJfmwO745cCuZuXA29/kwKhj5MBO8ePAF4jjwFQn48BkzuLArHziwKAx4sC77OHAga3hwIBz4cBOPuHAbzzmwIwq5cDKK+TAcz/jwG5k4sCrmeHAJN7gwNow4MDckN/AQf3ewC513sDR993AZITdwC4a3cCBuNzAt17cwDcM3MBzwNvA5HrbwA4728B9ANvAOR7hwPXi38D9y97AB8vdwJ7c3MCr/9vAGjPbwON12sAIx9nAlSXZwJ+Q2MBKB9jAw4jXwEMU18AOqdbAdUbWwNHr1cCJmNXADEzVwNMF1cBgxdTARjTcwDHO2sBRhtnAVWrYwCpn18CxdtbAzpfVwG/J1MCJCtTAHFrTwDO30sDiINLAS5bRwJkW0cAFodDA0TTQwEvRz8DOdc/AvSHPwIbUzsCjjc7Ak5zXwJDt1cDuetTA3SrTwBAH0sBPANHAxA3QwPIsz8DEXM7ALpzNwC/qzMDQRczAI67LwEoiy8BtocrAxCrKwJC9ycAeWcnAxvzIwOynyMD7WcjAZg3UwD9f0cB2pc/AjyTOwKPRzMAKosvAjZbKwPKhycAwv8jAMu3HwO0qx8Bbd8bAhdHFwHw4xcBgq8TAWCnEwJmxw8BlQ8PABt7CwNOAwsAvK8LAAxLRwE8bzsBMRMvAblzJwPLLx8BidcbAKjrFwP8pxMBSM8PAoU7CwNR6wcDetsDAuQHAwGxav8AHwL7ApjG+wHOuvcCeNb3Aaca8wB1gvMAPArzA2ETOwLMgy8DWJMjAzEjFwEYUw8DEd8HAMRbAwPXUvsDGvL3A/8G8wF7bu8DBBbvAGkC6wGKJucCd4LjA20S4wDe1t8DWMLfA7La2wLVGtsB737XAeK/LwPBLyMAiK8XAIyrCwBFJv8DXyLzA/yK7wCa0ucBNcLjAOE23wBBOtsB/ZbXAEo60wLrGs8BuDrPAMWSywBLHscApNrHAm7CwwJo1sMBixK/AZ1fJwOyqxcA5V8LAZzG/wE0rvMA5RbnAd422wFPLtMAUULPA6giywBnbsMC316/AHO2uwN8TrsDVSq3A9ZCswEDlq8DCRqvAlbSqwNotqsDBsanA8W3HwFxAw8Bwqr/Ak168wJczucBpKLbAWj2zwJdysMCDdq7AuO2swOOeq8CAa6rAAWGpwE1yqMBAl6fAhMymwA8RpsDhY6XABcSkwJEwpMCpqKPAp9LFwMYWwcCINb3AdLG5wOdhtsDJMbPAjyGwwI0xrcDwYarA1B6owEONpsBKMqXAbPyjwOjnosAp9aHASxihwN1LoMDSjp/AK+CewPA+nsA2qp3ASFXEwPBzv8B2+LrAyCy3wAS2s8BLYbDAFCytwNYWqsDnIafAeE2kwF7EocAkKqDAgcOewOOKncCFbJzA6nWbwBeXmsD2yJnAVgqZwDVamMCat5fAOvTCwOv4vcBqFbnAbeS0wIMvscCytq3A11yqwI8ip8BWCKTAgg6hwEg1nsAfgpvAucaZwLVSmMDtFpfAFvKVwFT2lMC7E5TA5kOTwLCDksAU0pHAt7DBwBeavMC+nLfAaNiywKfYrsCNMavAlbOnwKFUpMBTFaHAJvadwHX3msB3GZjAPVyVwOFjk8Bp55HAq6CQwId5j8CgdI7AS46NwMO8jMD2+ovAH6a/wPJYu8AhQLbAwECxwK27rMAP0qjA2C+lwMOsocDCSJ7AdgSbwF7gl8DZ3JTAHvqRwEI4j8CN/ozACXqLwDkoisC7/ojA3/CHwNwGh8CgM4bAO8S7wB0sucBf+7TAleavwLjlqsBQqabAANGiwHwqn8BVopvAUDmYwBDwlMAXx5HAxr6OwFbXi8DfEInA1JaGwF8KhcBHroPA2YGCwDFrgcAff4DACWINwTohDcH85QzB3a8MwXV+DMFfUQzBQigMwccCDMGf4AvBz8ILwTaoC8EBkAvBH3sLwX5oC8GOVwvBKEgLwSk6C8FxLQvB4iELwWIXC8HYDQvBq0kKwUMCCsHwwAnBB4YJwbFSCcEtJgnBWP4IwQfaCMHuuAjByJoIwbF/CMEkZwjBzFAIwXg8CMH7KQjBLBkIweMJCMH/+wfBd+8HwVjkB8E+2gfBVzoHwW7xBsEVsgbBKXgGwXVDBsHzEwbBmOgFwQ3BBcGEnQXBpH0FwaFgBcFFRgXBRy4FwXIYBcGWBAXBhvIEwRniBMEr0wTBmcUEwUS5BMEPrgTBaEUEwWf5A8GotAPBwXUDwZU9A8GhCgPBLdwCwcqxAsEgiwLB42cCwcZHAsGFKgLBmhACwSH5AcHG4wHBWdABwa6+AcGdrgHBAqABwbySAcHIhgHB8VwBwQoLAcF1wQDBM34AwalAAMFoCADB2qr/wOlP/8Dt/P7AP7H+wLZs/sBxLv7Au/X9wBfC/cAXk/3AUmj9wGpB/cAIHv3A3P38wJzg/MAHxvzArf/8wCxP/MBFrfvA/Bn7wDqW+sCxHfrAbrD5wLFM+cCi8fjAjJ74wMVS+MCxDfjAwM73wGuV98A3YffAszH3wHcG98Ah3/bAW7v2wNSa9sBCffbAEVn3wOGX9sDl6vXAz0z1wLi89MDNOPTAHsDzwMtR88AA7fLA+pDywAE98sBq8PHAmKrxwPlq8cAGMfHAQfzwwDnM8MCEoPDAwXjwwJdU8MC1M/DAD8fxwCX48MCCO/DAUo7vwHjv7sDnXe7An9jtwLBe7cA17+zAXInswF4s7MCB1+vAG4rrwIpD68A9A+vAq8jqwFWT6sDJYurAmzbqwGoO6sDc6enAskzswHhr68A0nOrAst3pwMYu6cBRjujARfvnwKB058Bv+ebAzojmwOYh5sDuw+XALm7lwPYf5cCn2OTArJfkwHpc5MCTJuTAgfXjwNrI48A7oOPALezmwEbx5cDeDeXAlTzkwDN848CJy+LAeiniwPOU4cDwDOHAfZDgwLMe4MC7tt/Ay1ffwCYB38Adst7AD2rewGQo3sCS7N3AGbbdwIOE3cBiV93AV7/hwLGS4MBuk9/AtazewGbZ3cAjF93AvGTcwBHB28AOK9vAraHawPcj2sAFsdnA/UfZwBLo2MCIkNjArkDYwOD318CFtdfAE3nXwAhC18DsD9fAPsLcwPRu28B3P9rAuDPZwBxI2MDGctfAoa7WwH361cA2VdXAtr3UwPYy1MD9s9PA4j/TwMnV0sDkdNLAdBzSwMjL0cA5gtHALz/RwBwC0cB+ytDAqxPYwC191sBMG9XAoujTwKDQ0sCm4NHA0wjRwM1C0MDqjM/ABubOwAlNzsDqwM3ArUDNwGnLzMA+YMzAXv7LwAily8CJU8vAOQnLwH/FysDLh8rAQKDUwGXz0cCIN9DAQsbOwFaOzcAfcMzADHjLwKybysDE08nAIhzJwKFzyMAm2cfAp0vHwCbKxsC3U8bAeufFwJ+ExcBjKsXAENjEwP+MxMCUSMTACofRwHCxzsDY/svAyfHJwJR2yMCqMMfA0Q/GwE0MxcBuK8TAo2HDwEOowsAk/sHAK2LBwEvTwMCGUMDA7Ni/wJxrv8DFB7/Aoay+wHtZvsCoDb7APaPOwAmYy8C2vcjAzgXGwGiow8BnI8LAStDAwEmsv8Btnr7AQbq9wInsvMBpMbzArIW7wDTousDzV7rA6NO5wCNbucDA7LjA7Ie4wOEruMDn17fAQfXLwL+oyMAdpcXAR8XCwP4HwMDSdL3A3s+7wLVvusChRbnASDW4wHdGt8CSdLbAsre1wFYKtcBfa7TAvNmzwGtUs8B62rLABGuywDIFssA/qLHAKYvJwGTyxcBdtcLAka2/wD7IvMCaBbrArGW3wCh8tcDXErTA89uywB7JscDdz7DA4fqvwDo7r8A/jK7AyOutwMJYrcAr0qzADVeswILmq8Czf6vA6ZfHwHp0w8Dm8L/A2768wHyxucC1xrbAvP6zwJ5ZscAZJa/A1LKtwPRvrMAUWqvAN1qqwKJ/qcAcvKjAgQuowIppp8Ah1abAQ02mwPjQpcBYX6XAX+7FwMw8wcApab3AFvm5wOLDtsD6sLPAxcCwwIDzrcA4SavAENmowGBRp8A8A6bAPuikwA/mo8DLAaPAdDqiwDmIocDA5KDA9E6gwM7Fn8BVSJ/A9GXEwKWOv8DVG7vA0mC3wFr/s8COxLDAJaytwIy2qsAB5KfAljSlwCuoosDw8KDAZJqfwLlznsA4b53AdoGcwEW4m8CAApvAhl2awFXGmcDnO5nAy/zCwNUIvsAiL7nAjQe1wI5jscBTAa7A+MCqwBijp8AjqKTAW9ChwNMbn8BxipzAlY2awLwumcAN/ZfA0/WWwJUDlsC+M5XAcHqUwPTTk8BfO5PA5LPBwB+ivMDpq7fAlu6ywNz8rsDuZqvAG/+nwDy5pMDvlaHAp5WewKq4m8AO/5jAu2iWwGwnlMBmwJLAIYSRwPR5kMCNhY/A7KyOwMbwjcAjSI3AUae/wMpbu8CkR7bAMk+xwD3SrMAB9qjALGalwM74ocB1rZ7AxoSbwDV/mMALnZXAYt6SwCVDkMCi1o3A0VOMwO8Pi8Ck+4nAJAWJwOkjiMAVZofAO8S7wEgtucC+/rTAnu2vwK/yqsDnv6bAjfWiwGRhn8CG7pvAwJ2YwLhvlcDoZJLAmn2PwO25jMDNGYrA/JyHwGblhcDcmYTATHuDwHCCgsBynYHAlEEOwbELDsHW2g3BlK4NwYGGDcE8Yg3BbkENwcUjDcH2CA3BvvAMwd7aDMEexwzBSbUMwTKlDMGulgzBlYkMwcV9DMEecwzBg2kMwdtgDMENWQzBuxwLwdHgCsF2qgrBL3kKwYlMCsEbJArBhP8JwWveCcF+wAnBcqUJwV2NCcGmeAnB8mUJwRBVCcHdRQnBFzkJwZItCcEvIwnB0RkJwV8RCcHBCQnBE/8HwYW8B8EYgAfBmkkHwdgaB8G38QbBAM4GwbCtBsF3kAbBDXYGwS9eBsHCSAbBojUGwV4kBsHJFAbBuQYGwQn6BcGY7gXBR+QFwfnaBcGV0gXBQesEwUqnBMFBbATBrDYEwTEGBMHp2gPBtrMDwTuQA8EhcAPBzlMDwVo6A8FeIwPBpQ4DwfL7AsEQ6wLB1NsCwRXOAsGuwQLBfrYCwWisAsFPowLBq/IBweuqAcFUagHBqi8Bwbb7AMHlzADBjKIAwTJ8AMF8WQDBFjoAwbEdAMEHBADBrdn/wHWw/8DZi//AzGr/wPlM/8APMv/AyBn/wOMD/8Ak8P7AjAz+wC1x/cDd5fzAY2f8wIn0+8BSjPvASi77wFXb+sA1kPrAN0z6wMIO+sCs1/nA4qX5wOV4+cBDUPnAkyv5wHQK+cCQ7PjAmNH4wES5+MBSo/jA0Ev4wBWi98CCB/fAonz2wK0A9sAdkPXA4yr1wCTP9MACfPTAujD0wJjs88D1rvPAOXfzwNlE88BUF/PAOO7ywBjJ8sCVp/LAVonywAtu8sBtVfLAIp7ywEPk8cDPPfHAEqfwwGge8MAzou/AaTHvwBHL7sBFbu7ALxruwAnO7cAdie3Aw0rtwGES7cBq3+zAXbHswMWH7MA2YuzATkDswLMh7MAXBuzAxwftwOo97MD8huvANuDqwFRI6sAnvunAj0DpwIHO6MACZ+jAKQnowB6058AZZ+fAYyHnwFHi5sBIqebAunXmwCVH5sARHebAEfflwMTU5cDOteXAP5bnwDeu5sCD4OXAnyflwAt/5MCB5ePA0FnjwNXa4sCCZ+LA2/7hwPSf4cDzSeHAD/zgwI614MDEdeDAFDzgwO8H4MDQ2N/AP67fwNCH38AcZd/A31fiwOxG4cDfUeDA13/fwFLE3sDvGd7AvX7dwIfx3MAocdzAkPzbwMCS28DLMtvA1NvawBCN2sDCRdrAQAXawOjK2cArltnAg2bZwHY72cCVFNnApEvdwOIH3MCC89rAGvbZwHEd2cA5XdjACLHXwC0U18BwhdbArQPWwM+N1cDWItXA0cHUwONp1MA+GtTAJdLTwOmQ08DpVdPAlCDTwGHw0sDXxNLAFZ7YwPMJ18AjudXAHpzUwBac08BQt9LAcPPRwHdE0cDypdDAsBXQwIeSz8BjG8/AP6/OwCtNzsBF9M3Av6PNwNlazcDjGM3AO93MwE2nzMCQdszAMDLVwHOp0sCWx9DAc2zPwCRBzsBAPs3A5lDMwLKHy8Bh1MrAMjTKwGmiycDaHcnAbqXIwCA4yMD71MfAHXvHwLYpx8AD4MbAUp3GwAFhxsB5KsbAiPzRwOdGz8BuuMzAFoHKwMcbycAd48fAudzGwOzsxcB/GMXADmLEwA+/w8C+K8PAyKXCwBUswsCbvcHAZVnBwI7+wMBErMDAxGHAwFgewMBe4b/A2AHPwBcPzMAtVsnAHsLGwOZUxMDxzMLACovBwKJ3wMBjhb/Awqe+wKvtvcCqRr3A0bG8wHQqvMB4r7vA0j+7wIrausC6frrAjiu6wD7gucAYnLnAFT7MwJAFycAEH8bAPGDDwHvGwMCUUb7AJHu8wMEvu8DJD7rAcxq5wIw6uMAYdrfAXMy2wMQ0tsD/q7XAui+1wOe+tMCNWLTAw/uzwLOns8CVW7PASL/JwCo6xsCUE8PA1SnAwDZlvcDIxbrAY0u4wKEltsBe0bTA4aezwDisssAKyrHAdfuwwABQsMC4tK/AiyqvwPusrsD7Oq7AjtOtwMl1rcDUIK3ArMLHwPaow8CHN8DAWx+9wKYvusA3ZbfAI8C0wEVAssDi6a/ADXWuwMRCrcACO6zAZlarwJ+FqsC10KnA+TKpwDamqMBcJ6jALbSnwKxLp8Dt7KbAjArGwFJjwcAUnb3A8EC6wDcmt8CWMLTAX2CxwKu1rsBbMKzAFdCpwDsVqMBe2qbAUcelwLrfpMDZDKTAmk6jwEivosAhH6LA+56hwJ4qocAJwaDA3XbEwMmpv8ATQLvATJa3wARJtMBHKLHAwiyuwMtWq8CApqjAxBumwEG2o8AXsqHAUG+gwFlVn8AmZp7ALZGdwMDOnMDmKJzAdpabwPgTm8BrnprAdgXDwPYYvsBESbnA5yq1wNmXscBeTK7AqSWrwEskqMCdSKXAwpKiwKECoMDol53AzmGbwAYGmsAX5JjAHeqXwLwSl8BdTpbA8Z+VwAsMlcBxhpTAGLfBwD6qvMBJu7fA8ASzwFYhr8CfnKvAH0uowH0epcBPF6LA9TWfwJJ6nMAU5ZnAKnWXwFMqlcC0mZPA3W+SwMVrkcChkZDAUMuPwHYWj8Aqf47Ahai/wKleu8A8T7bA1V2xwPvorMAtGqnA35ylwGVFosDiEp/A8AWcwPIemcARXpbAPcOTwCtOkcBZ/o7AeyqNwN34i8BE74rA+w2KwL1FicAYj4jAO8S7wHMuucAjArXAufSvwJoAq8Co1qbAVxqjwLeYn8BQO5zA+AKZwE3wlcC2A5PAYT2QwD+djcALI4vARs6IwCfBhsB+g4XAIXOEwDqIg8C7vYLA0wwPwSHgDsHxtw7B1ZMOwWhzDsFMVg7BLjwOwcIkDsHCDw7B8PwNwRTsDcH53A3Bcs8NwVXDDcF+uA3Byq4NwRumDcFVng3BYpcNwSqRDcGaiw3BX90LwTqrC8EcfgvBi1ULwRcxC8FaEAvB9/IKwZnYCsHzwArBv6sKwb6YCsG3hwrBdngKwc1qCsGSXgrBoFMKwdNJCsEOQQrBNTkKwTAyCsHoKwrBe7QIwUZ8CMGpSQjBHhwIwSvzB8FfzgfBUq0HwaaPB8EHdQfBJl0HwS9IB8EuNgfBDSYHwZoXB8GpCgfBUP8Gwa71BsEP7QbBWOUGwXHeBsFE2AbB4ZIFwfBTBcE2GwXBM+oEwfi+BMG9mgTBOHoEwQZdBMHSQgTBUSsEwT0WBMGCAwTB4PIDwfrjA8Gi1gPBr8oDwfy/A8FptgPB160DwSymA8FQnwPB0H0CwaY/AsHKBwLBedUBwb2oAcGzgAHBtlwBwWE8AcGTHwHBTgYBwaXvAMFW2wDBLMkAwee4AMFTqgDBRJ0AwZSRAMEchwDBvn0AwVx1AMHbbQDBYAn/wNmA/sCjBf7A6pf9wMk2/cCW3/zALpH8wLZK/MBpC/zAltL7wJef+8DZcfvA1Ej7wN0k+8D8BPvAbOj6wNjO+sDxt/rAcaP6wBaR+sCqgPrAZSz5wPKX+MAsEvjAdZn3wKQs98ChyvbAf3T2wKUn9sCS4vXAiKT1wCJt9cChO/XAOQ/1wGnn9MC6w/TAwKP0wBuH9MBzbfTAe1b0wOpB9MCCL/TAhGjzwOTC8sAcLfLA5KnxwH4z8cBSyfDAFmrwwGEU8MBOx+/ACILvwNBD78DzC+/A0tnuwNus7sCKhO7AZ2DuwAVA7sACI+7ABwnuwMPx7cDv3O3AZLvtwGMC7cD3X+zASM7rwLNK68D50+rA8mjqwI0I6sDLsenAxGPpwKQd6cCl3ujAFqbowFVz6MDORejA+xzowGT458CZ1+fAObrnwOqf58BbiOfAIUDowH1g58Anp+bAFAHmwK5t5cCJ6OTAZHDkwBME5MCDouPAs0rjwLn74sC8tOLA93TiwLY74sBUCOLAPNrhwOiw4cDbi+HAqGrhwOlM4cBGMuHAjejiwHzw4cD8DuHAu0jgwGaf38DBCN/AC4LewHkI3sDemt3AIzjdwEXf3MBWj9zAfEfcwPAG3MD8zNvA+ZjbwFBq28B5QNvA9xrbwFr52sA+29rAxdHdwDeg3MAJndvA9rjawIbp2cDLOtnA0J/YwGIX2MBknNfAfi3XwJbJ1sCpb9bAxR7WwA7W1cC6lNXAElrVwG0l1cAy9tTA2MvUwOGl1MDbg9TAnEXZwNiT18CQV9bA9EXVwJle1MDFjNPAG9LSwFk10sC5qNHATCzRwBu80MAHV9DACfzPwC+qz8CaYM/Afh7PwCHjzsDarc7ADX7OwDBTzsDDLM7AycLVwAJe08A8UdHAcgvQwDLwzsAIAM7A0yvNwE5rzMD2xsvAqDfLwFy4ysDeRsrAnODJwI2EycC9McnASefIwGWkyMBTaMjAaTLIwAoCyMCo1sfAXXHSwEPbz8B5cM3AIyzLwNPAycCcm8jABp7HwNzGxsAjBMbAzlTFwODDxMABQcTA783DwH9mw8BfCcPAl7XCwERqwsCWJsLAz+nBwEGzwcBPgsHAdmDPwJSFzMDU7cnAH33HwAQzxcDXccPA1ELCwC87wcABXsDAGZm/wKzmvsB7TL7AIci9wHZRvcDX6LzApYq8wOU1vMCy6bvAOqW7wL1nu8CLMLvAPYfMwDViycCQmMbAn/rDwP2DwcA2NL/AZSm9wLnqu8CN27rA2fG5wFoqucDodbjAmdK3wMpLt8AJ07bAy2e2wIYItsDNsrXAumW1wHcgtcBD4rTAtfPJwCGCxsCvccPA8KXAwNQBvsA8hbvAxi+5wL8At8BDkLXADXi0wImCs8AGuLLAlAGywHFcscAjzLDACFKwwPXjr8Aog6/AdiyvwIHersBzmK7AN+7HwL/dw8AWgMDA53+9wNStusCUA7jADIG1wN4ls8Br8bDA7TGvwAISrsByGK3AhkKswNeJq8Da4qrA4kuqwNvNqcCNXqnAr/qowAOjqMAsVKjALifGwFOKwcBH0b3A6Yi6wLyIt8BesLTAAQCywJB3r8CwFq3AxtyqwN/gqMD5rKfADKumwD3KpcDTDqXAAWakwFvNo8CnRqPAHdaiwL5wosCaFqLAAYjEwF7Fv8CZZLvAFcy3wOiStMBQjLHAsK2uwD/3q8DraKnAXwKnwAPDpMACqqLAYEShwD86oMBtU5/AupCewAnmncCyS53AS8CcwMlKnMBL5JvAOQ7DwFApvsDQY7nAsU61wP/MscC8l67AxoqrwO6lqMBx6aXAQ1WjwBLpoMBKpJ7AGYacwEnYmsDdyJnA8tyYwDgQmMATY5fADceWwB46lsCzvJXAU7rBwHSyvMDeyrfAdBuzwA5Gr8CT0qvAipeowEGEpcA8maLAvtafwL08ncDvyprAwYCYwGVdlsBgeZTAw1aTwFpjksAxjZHAQ92QwJI/kMAWsY/Auam/wI5hu8DtVrbAqmyxwOX/rMCMPqnA5NOlwHWSosDleJ/AwIecwEm/mcCAH5fAG6iUwI5YksANMJDA7iyOwIbhjMDG5ovAZg6LwBhVisBdtYnAO8S7wJ8vucCNBbXA6PuvwLMOq8CQ7abAWT+jwGnQn8CiiJzA2WiZwJ1xlsA6o5PAsf2QwL6AjsDZK4zAOf6JwDP2h8BRaYbAUWqFwMaMhMCVyoPAE8UPwRSgD8EWfw/BsGEPwX9HD8EtMA/BbBsPwfUID8GJ+A7B7+kOwfTcDsFr0Q7BK8cOwRG+DsH6tQ7BzK4OwWuoDsHBog7Bu50OwUSZDsFOlQ7BpYwMwcViDMFmPQzBEhwMwV7+C8Hp4wvBWswLwWG3C8G5pAvBIZQLwWCFC8FDeAvBm2wLwUBiC8EMWQvB4FALwZ5JC8EsQwvBcz0LwV84C8HdMwvBKFoJwcsqCcF+AAnBvtoIwRS5CMESmwjBV4AIwYpoCMFaUwjBgEAIwbwvCMHUIAjBkxMIwcwHCMFV/QfBCfQHwcbrB8Fx5AfB7t0HwSXYB8ED0wfBVS4GwdD4BcH5yAXBP54FwR54BcEcVgXByzcFwcocBcEgBQXBCfEEwSrfBMFFzwTBI8EEwUe1BMHoqgTBsaEEwYGZBME8kgTBx4sEwQyGBMH1gATB9wkDwY7NAsFRmgLBzW0Cwf9HAsFEJgLBMQgCwWXtAcGH1QHBbcABwdqtAcFUnQHBoo4BwZKBAcH2dQHBpGsBwXpiAcFVWgHBGVMBwa1MAcH5RgHBVfX/wHJ9/8AiEv/AprP+wGBf/sAjFP7ABNH9wJ+W/cDmYv3A2zT9wPUL/cCU5/zAOMf8wHGq/MDbkPzAHnr8wOll/MD2U/zAA0T8wNo1/MBGKfzAAAH6wNl7+cAxBvnAi574wBlC+MCD7/fAyqX3wAdk98BmKffAKfX2wKPG9sD9nfbAU3r2wJla9sBiPvbATSX2wAMP9sA0+/XAm+n1wPnZ9cAXzPXARyb0wCCS88COD/PAlZrywOQx8sAM1/HAB4bxwLQ98cBD/fDATcTwwIuR8MBZZPDAHDzwwE8Y8MB2+O/AJNzvwPfC78CXrO/AtJjvwAqH78BZd+/Ad23uwDi+7cCbKu3ANanswAc37MA20evALnbrwN0k68BG3OrAhpvqwMxh6sBdLurAjwDqwMjX6cB/s+nAOJPpwIR26cD/XOnAUUbpwCky6cBBIOnAI+DowEgW6MDQYefAz83mwJ5J5sC71eXAmW7lwGIS5cABwOTAdnbkwNs05MBe+uPAQMbjwNaX48CDbuPAvknjwAgp48DxC+PAFfLiwBjb4sCrxuLAtHnjwIiP4sATxeHAow7hwNRt4MD259/A/W/fwEIH38Dbqd7AaVbewOkL3sBzyd3AMo7dwGRZ3cBdKt3AfwDdwD3b3MAYutzAnpzcwGmC3MAea9zAq1TewBY23cA5PdzAQ2/bwIW22sBXENrAroHZwDAI2cBpm9jAyTzYwETo18DQnNfAfVnXwHcd18D659bAVbjWwOuN1sAraNbAl0bWwLoo1sAsDtbAYPPZwAsX2MDp79bAN/DVwAYV1cCsWdTAY7HTwDYa08Dwm9LAyy3SwFrL0cDDddHAWCnRwCnl0MBdqNDAL3LQwO1B0MD1FtDAuPDPwLTOz8BzsM/AuFPWwCQQ1MCJ9tHAsanQwK6fz8Ajt87AP/jNwOFNzcDMtMzAbivMwOi7y8AkWMvAE//KwLGxysClbMrAEi/KwDP4ycBTx8nAzpvJwBN1ycCeUsnAe+vSwCNu0MBrJs7A2QbMwIxeysAxTMnAF1/IwPGSx8D85cbA/krGwOq/xcDvRcXA7uDEwKWGxMAJNsTAHvDDwMWxw8A0esPAtUjDwKIcw8Bp9cLA5b7PwBD8zMBDhMrAVTbIwMwQxsA5JMTAGPnCwH4CwsAuK8HA4HnAwADdv8AuUL/A99G+wM5lvsBnCr7Aw7i9wOZvvcCjML3AX/i8wEDGvMCgmbzAmtDMwB3DycB5EcfACpTEwP0/wsCGFMDAxxC+wHGhvMBQorvAqse6wGYKusD4arnAbty4wKZcuMA46rfAbIq3wMc3t8AC7rbANay2wOFytsAiQLbAJSvKwCzKxsDhz8PAnCHBwLadvsBzQ7zAKRK6wMUIuMDETLbAWUO1wPZftMAembPAIvWywNRkssB547HAo2+xwP4HscA3s7DAi2iwwO8lsMCM6q/AihrIwMgSxMBOysDAU+C9wMQru8BsobjA90C2wMAJtMDY+rHA6RKwwDLgrsBA9K3AEyutwER8rMCI6avAoGarwF3xqsB1iKrAQCuqwKvfqcA/nKnARkTGwAe0wcDJBb7Af9G6wEfrt8AUMLXAUp+ywLE4sMCS+63ACeerwOL5qcAJeajA1omnwDK5psDeAabA42qlwELmpMCVb6TAZQWkwHemo8CNU6PAYpnEwGHhv8BhibvAIQK4wO3ctMCA8LHAsy6vwI+XrMDKKqrAyOenwKPNpcAu26PAICOiwB8cocCpQ6DANIqfwGDpnsCIYp7AdOqdwPl+ncDmHp3AFRfDwOI5vsDGfrnA2nO1wFMCssBV467AJ/CrwMonqcBMiqbAaRekwIvOocDPrp/AC7edwOXkm8DAqprAsc2ZwAsPmcBHZpjA2duXwB9il8Bf9ZbAlr3BwMC6vMCn2rfAIDKzwP9qr8C+CKzAR+SowGTqpcCBG6PAs3egwLv+ncAHsJvAuYqZwKuNl8B9tpXAEjeUwFZWk8CPkJLA2eWRwH5SkcC/1pDA7qq/wHlku8C0XrbAr3uxwPgWrcAXY6nAMQumwOrfosBf35/AAgqdwO5fmsDq4JfAaIyVwI5hk8A7X5HACoOPwEfZjcCp24zAtg+MwEFii8Acx4rAO8S7wMowucD+CLXAKgOwwPscq8CdBKfAjGSjwG8IoMBo1pzAQs+ZwHjzlsApQ5TAIb6RwNpjj8B7M43A6CuLwLlKicAgj4fAxF2GwJePhcCm24TAq2sQwRpNEMEQMhDBKhoQwQsFEMFk8g/B6+EPwWLTD8GOxg/BPrsPwUOxD8F2qA/BtKAPwd6ZD8HXkw/Bh44PwdmJD8G5hQ/BF4IPweR+D8ETfA/BrysNwcUIDcHf6QzBis4MwWG2DMEGoQzBKo4MwYR9DMHRbgzB2WEMwWhWDMFRTAzBa0MMwZI7DMGoNAzBkC4MwTEpDMF2JAzBSiAMwZ4cDMFhGQzBB/EJwTDJCcHmpQnBqoYJwQlrCcGbUgnBBT0JwfQpCcEeGQnBQQoJwST9CMGT8QjBX+cIwV/eCMFx1gjBc88IwUnJCMHbwwjBEb8Iwdq6CMEjtwjBarwGwf6OBsG5ZgbBDkMGwXsjBsGNBwbB2+4FwQjZBcHAxQXBu7QFwbSlBcFymAXBv4wFwW6CBcFVeQXBT3EFwT1qBcECZAXBhF4Fwa1ZBcFpVQXBo44DweZaA8H9LAPBSgQDwTzgAsG7wALBOKYCwceOAsEaegLBGGkCwRVaAsHVTALBJEECwdQ2AsG8LQLBtyUCwaUeAsFqGALB7BICwRUOAsHRCQLBHmoAwfkyAMEZBQDB07j/wLdw/8DcMP/Apvj+wI3H/sAnnP7Az3X+wPFT/sAMNv7AqRv+wGEE/sDY7/3AvN39wMTN/cDfv/3A2LP9wD+p/cDon/3Ac8f6wP9Q+sAV6vnAuI75wLE9+cAE+PjAWbr4wOCD+MC/U/jANSn4wKAD+MBv4vfAIsX3wEar98B1lPfAVYD3wJZu98DxXvfAJlH3wP1E98BGOvfAY9n0wJVU9MCK3/PA9HnzwFcg88Dg0PLAd4rywB5M8sC5FfLAfubxwL+88cDel/HATXfxwIxa8cAtQfHAyirxwAsX8cChBfHAa/bwwATp8MAz3fDALx3vwEB47sBT6+3AaHbtwHQQ7cDvt+zAFWrswJgl7MD16OvATrPrwNyD68DtWevA4DTrwCgU68BG9+rAyd3qwEvH6sB1s+rA9qHqwImS6sDwhOrA43jpwNrA6MBjH+jAbJDnwDsY58DasebA9FbmwIoH5sAXwuXAmYTlwDBO5cARHuXAiPPkwPTN5MDFrOTAeI/kwJ115MDNXuTArUrkwO445MBIKeTA1gfkwKwm48CsbuLArczhwCc84cBsu+DAcU/gwEnz38CKod/AclnfwBgb38Dr497AH7PewP2H3sDhYd7AOUDewIIi3sBJCN7AJfHdwLzc3cC8yt3AptDewFfG3cDf4NzADRrcwAd128CH4trAAmDawOPr2cCXitnAtzfZwEPu2MAzrdjAuHTYwD5D2MCCF9jA3fDXwLzO18CasNfAApbXwIt+18DYadfA/57awHWy2MCwhdfAhZXWwAjH1cCWGNXAv4PUwHD/08C3idPAFiHTwBPJ0sCdftLAqTzSwEgC0sCkztHAS6LRwB570cCDWNHA9jnRwP8e0cA0B9HA8eLWwEu/1MCPydLAfj/RwHFJ0MClc8/AMrjOwAggzsDtmc3AlyLNwIe4zMBbWszAWQrMwH/Hy8BSjMvA+VfLwLApy8DYAMvAw93KwMq+ysB0o8rAGmXTwCD/0MC32c7A393MwKkRy8DA+snAIRvJwDldyMBnuMfAqC/HwLu2xsA3S8bAwuvFwBOXxcDsTcXA8hHFwOPcxMD5rcTAg4TEwONfxMCMP8TANR3QwIlyzcARGcvAN+3IwEHrxsDdEcXA7qbDwGnDwsBT/cHASlHBwFPBwMBRRsDAX9m/wJx4v8DIIr/Asta+wFuTvsCWXb7ACi6+wAQEvsDl3r3ADxrNwA8kysB6icfAGizFwO75wsDc8cDAshK/wHBovcDLZ7zA+5i7wHTqusAIT7rAwNG5wC5jucAjAbnAI6q4wAdduMC6GLjAQty3wBWqt8B/f7fALGbKwHESx8C1LsTAl5zBwH04v8Dq/7zA1vG6wOgMucCnT7fAdwe2wAY2tcAaf7TAe+GzwJtZs8DV6LLAgoWywFwtssA137HA/ZmxwLZcscCAJrHAokfIwPZIxMCeFMHAdEC+wDOpu8BjPrnAZ/+2wEbrtMCqALPA/j2xwEq3r8COzq7AnRCuwM9vrcBz4azAKWuswOsFrMCgrKvAcl2rwEoXq8Az2arA0mHGwLnfwcBzOr7AeBq7wK1NuMB3r7XA9z2zwJb4sMBi3q7AFu6swA4mq8Bfg6nAyWKowHWip8AG+qbA2WmmwNfppcDwgqXAHiilwOnXpMDXkKTA/qrEwNT9v8BjrrvAYji4wPsmtcCwVLLAja+vwGU3rcCl66rAYsuowFnVpsABCKXAPWCjwEYAosAxMKHADoKgwFPun8BHbJ/ArvyewDagnsDKTp7ACiDDwK1KvsAlmrnAP5m1wMg3ssASL6/AqFWswKKpqcDZKqfAwtikwHSyosC0tqDA+eOewDk3ncCxr5vAA7qawLcJmsAUb5nAZOuYwDp2mMBQFZjA38DBwCTDvMCl6rfA8UizwCGQr8ASP6zAPjGpwMJQpsDknaPAgxihwBvAnsDKk5zAVpKawDq6mMBrCJfARnyVwMRElMCnjZPAR+6SwPZmksBT8JHAI6y/wGpnu8CQZrbA54qxwDIurcDJh6nAuEKmwK0to8AsRqDAgYydwJIAm8DjoZjAlW+WwHNolMD3ipLAHtSQwE5Dj8Bl4Y3ADg6NwLhsjMAr34vAO8S7wPYxucB0DLXAgAqwwHErq8DOG6fA7ImjwL5AoMCNJJ3AFDaawKl1l8A445TASn6SwAZGkMA9OY7AZ1aMwImaisAHBYnAyJOHwBqLhsDO54XA9gERwb7oEMGd0hDBNr8QwTSuEMFMnxDBPpIQwdCGEMHNfBDBC3QQwWBsEMGrZRDBzV8QwataEMEuVhDBQVIQwdNOEMHSSxDBM0kQwedGEMHmRBDBobsNwZKeDcEPhQ3BrG4NwQtbDcHWSQ3BwjoNwYwtDcH7IQ3B2xcNwf0ODcE8Bw3BcgANwYL6DMFR9QzBxvAMwc3sDMFU6QzBS+YMwaPjDMFQ4QzBDXoKwZhYCsEzOwrBZCEKwb8KCsHj9gnBeuUJwTnWCcHcyAnBKL0JwemyCcHxqQnBF6IJwTmbCcE3lQnB9o8JwV2LCcFYhwnB1YMJwcKACcESfgnB6j0HwW0XB8GV9QbB2tcGwb+9BsHWpgbBv5IGwSKBBsGycQbBLWQGwVZYBsH4TQbB5EQGwfM8BsEANgbB7C8GwZsqBsH0JQbB4yEGwVQeBsE4GwbB/gcEwcLbA8HUtAPBmZIDwYZ0A8EeWgPB8UIDwZ4uA8HMHAPBLg0DwYD/AsGF8wLBCOkCwdnfAsHQ1wLByNACwaHKAsFdxQLB9MACwRm9AsG5uQLBmtoAwV+mAME1egDBNFUAwc80AME3GgDB3wIAwcnc/8DeuP/AYpn/wM19/8CjZf/Ae1D/wPU9/8C/Lf/Ajx//wCYT/8BOCP/A+/7+wNP2/sCx7/7AoYP7wCoa+8AuvfrA6Wz6wEMo+sDs6/nA7Lb5wGaI+cCVX/nA2jv5wG8d+cDJAvnAcuv4wAPX+MAixfjAe7X4wMmn+MDVm/jAYJH4wDuI+MA8gPjASpL1wCEO9cDVovTABEn0wAv688BDtfPAD3rzwA9G88BrGPPAYPDywEXN8sB/rvLAiZPywOx78sA+Z/LAJFXywExF8sBvN/LAXivywBoh8sAhGPLAYMDvwDUu78D9rO7A1TruwPfd7cC7ju3Ao0rtwMcO7cA12+zAYa7swAyH7MDMZOzA3kbswKQs7MCsFezAjwHswPTv68CM4OvAENPrwETH68DyvOvAVA7qwJRh6cAT0OjAjVHowP/h58BxgOfABy/nwJbq5sBsrubAk3nmwC5L5sDpIubAPQDmwNrh5cA6x+XA56/lwHyb5cCbieXA9nnlwEVs5cBLYOXAOZDkwEnB48BVDePAh3ziwHz94cA7jeHAMyrhwO7S4MDohuDA2EngwDQU4MAc5d/AyrvfwI2X38DJd9/APlzfwJFE38DWL9/AsB3fwM4N38Do/97Ao1/fwO9S3sBke93AxsTcwHUm3MCSpNvArDLbwCfO2sCQddrAkifawPTi2cBlqdnAmXnZwKlP2cDiKtnApArZwGPu2MCj1djA9r/YwPys2MBgnNjA00jbwIJ32cDhEtjAEzfXwDp31sC70tXA40bVwIbS1MCJbNTAoBLUwHTD08DSfdPAmkDTwNMK08BU3tLAAbnSwEiY0sCce9LAfmLSwH5M0sA8OdLA+3bXwPJq1cDbl9PAK+/RwPTt0MCmJtDAEn3PwCbpzsC2bc7AjwXOwFiqzcADWs3AUxPNwDLVzMCgnszAtm7MwKtEzMD0IMzA2wPMwF7qy8AL1MvApd3TwPyO0cDaic/AjrDNwDkAzMDAo8rA+tTJwOAhycDZi8jACgfIwBaax8DwPMfAcevGwLujxsCtZMbASS3GwKv8xcAC0sXAl6zFwMqLxcALb8XAZHvQwLjnzcDYq8vAQqHJwL7Bx8CWC8bAznzEwMZ9w8CHx8LAPynCwI2iwcB7K8HAPcvAwPt3wMA8L8DARu+/wBO3v8C7hb/Ab1q/wHg0v8AwE7/A6GTNwKSEysBMAMjAb8LFwFGxw8CTy8HAlw/AwFB7vsBXLr3Ag2i8wHfEu8D9OLvAPMC6wJ5VusB3ALrAEra5wDJ1ucAxPLnAIwq5wDbeuMCut7jAzaHKwKlax8D7jMTAmxbCwMnRv8Ajur3AOM67wGYMusChcrjA1/22wG8EtsAfXrXAtMq0wCRQtMAF5LPAtYSzwCE5s8DA9rLA3LyywBiKssCKXbLAfnXIwMh/xMDvXsHAHKC+wOElvMAd2rnA37u3wNTJtcAyArTA8GKywBjpsMDLrq/A8PKuwH5drsBu263Azm2twB4NrcARuKzArHSswIE5rMDRBazA0X/GwCYMwsBAcL7AUGO7wMSvuMBKLrbAmNuzwMa2scCGvq/AK/GtwG5MrMCHzarALXOpwCeDqMCr66fAlGWnwDLzpsAqkabAyjqmwMHupcCUsqXA1bzEwLUawMCZ07vAym64wPZwtcC2uLLAAzCwwGrWrcAKq6vAlqypwG3Zp8BQL6bAWqukwFVMo8BxJqLAdnWhwIztoMBpdaDACRGgwHe5n8BgbJ/AFynDwK9bvsDutbnA2b61wE5tssDYeq/AIbuswD4rqsDGyqfA3JilwDuUo8BCu6HAugugwMiCnsAXH53ARt6bwBb7msBZcZrAlfeZwPGMmcAtNJnAMMTBwJ7LvMDY+rfA41+zwG61r8CBdazAWX6pwDa3psAuIKTA37ihwHKAn8CodZ3A5ZabwOvhmcD/U5jArOuWwJCmlcCTlpTAMvGTwMt1k8DWCJPAWa2/wGFqu8CCbrbAUJqxwJFFrcCbrKnAbXqmwKp7o8ApraDABw+ewOqgm8ACYpnAFVGXwI1slcAnspPAMh+SwE6ykMDnaI/AmUCOwL9vjcBC8IzAO8S7wCIzucDvD7XA6RGwwBU6q8AwM6fAca+jwEt5oMD+cp3ALZ2awP73l8Adg5XAwz2TwLsmkcByPI/ApXyNwKrki8Agc4rAhiWJwEr5h8BlAIfARokRwX50EcFoYhHBq1IRwfxEEcEWORHBwC4RwcQlEcH2HRHBMBcRwU0REcExDBHBwgcRwegDEcGRABHBqv0QwSb7EMH3+BDBEvcQwW31EMEA9BDBoD0OwXglDsFvEA7BH/4NwTHuDcFW4A3BS9QNwdPJDcG7wA3B1LgNwfexDcECrA3B1aYNwViiDcFyng3BEJsNwSCYDcGUlQ3BXpMNwXKRDcHIjw3B8PYKwSPaCsGvwQrBY6wKwdqZCsG5iQrBsnsKwYBvCsHnZArBslsKwbJTCsG/TArBtkYKwXlBCsHtPArB+zgKwY41CsGVMgrBADAKwcMtCsHRKwrBq7UHwemTB8GrdgfB6l0HwVtIB8GXNQfBQyUHwRAXB8G3CgfB/P8Gwan2BsGQ7gbBh+cGwWvhBsEd3AbBgtcGwYPTBsEL0AbBCM0GwWvKBsEnyAbBNnoEwRRTBMHqMATBOBMEwSr6A8FY5APBWNEDwdHAA8FwsgPB8KUDwRObA8GikQPBb4kDwU+CA8EgfAPBwXYDwRdyA8ELbgPBiGoDwXtnA8HWZAPBikUBwR8YAcGF8ADB8c0AwcyvAMFvlgDBhYAAwXluAMHGXgDBH1EAwUBFAMHuOgDBTTIAwRErAMHJJADBVR8AwZkaAMF9FgDB6xIAwdMPAMEjDQDBVkT8wOrW+8BJhPvAZT77wGUB+8A0zPrA2J36wKZ2+sA1VfrAHjj6wNIe+sDUCPrAt/X5wBzl+cCw1vnAKcr5wEi/+cDXtfnApK35wIam+cBZoPnApED2wGrL9cDtZfXAGQ31wKHE9MBAifTA3lX0wB4p9MA5AvTAZODzwCXD88BRqvPAu5TzwPmB88CtcfPAhWPzwDlX88CMTPPASEPzwDw788BANPPArlnwwCvW78CyZO/AawHvwJCq7sCkXu7AUx3uwE/p7cD7u+3AEpXtwNtz7cD1Vu3A1D3twPsn7cD+FO3AfwTtwGL27MBN6uzA0N/swLTW7MDMzuzA9KPqwEb96cBldunA+QPpwMOi6MCwTejAWAPowPvC58D2iufAJVrnwMEz58BWEufARPXmwPvb5sABxubA57LmwE6i5sDjk+bAXofmwH585sANc+bA9hnlwChS5MB3r+PAHCHjwJ+v4sCKTeLACvjhwE2t4cAIbOHAGTPhwHcB4cA41uDAkLDgwMqP4MD8deDApl/gwD1M4MBfO+DAuCzgwP8f4MDyFODAgBPgwOHW3sA2E97AP2jdwHLY3MAOWtzAdfTbwBOd28AmUdvA1g7bwPnU2sCGotrAk3bawE9Q2sABL9rABxLawNX42cDt4tnA48/ZwLO/2cDFstnAtPXbwBs72sAsutjA5tDXwNcg18BPidbA8wjWwEyY1cDVPNXACe/UwJ+r1MDYcNTAlz3UwO0Q1MAJ6tPALsjTwL6q08AjkdPA4XrTwIln08C6VtPAdArYwMoT1sDSYNTA+tfSwC6W0cBm1dDAzzfQwKGxz8A6P8/A99rOwAiIzsD5Qs7A9AbOwOXSzcCHpc3ABX7NwKFbzcC1Pc3AsCPNwBANzcBn+czA1VTUwLQd0sBVNtDASn7OwKLvzMDNh8vAwYPKwMbjycD5VsnANODIwGN6yMBDIcjAbdXHwC+Yx8DZYsfAoDTHwH8Mx8CS6cbALsvGwL+wxsDEmcbA4N3QwBZizsBAPMzA+1HKwKiTyMAr/8bA45HFwC5OxMDMicPA3frCwEZ9wsAdFMLAnrnBwHtqwcBbJcHAPO7AwPm+wMDglcDAQ3LAwGZTwMCOOMDAeLDNwKfkysCldsjArFbGwLNlxMAUocLAvgbBwP+Tv8DfRb7AuDq9wBOZvMCXGbzAvKm7wIlMu8Ax/LrAALa6wL14usCvRLrA4hq6wH/2ucDi1rnA8OPKwLOlx8Ay68TAZ4/CwEBpwMCocb7AvKa8wIkGu8BSjrnANzu4wFcLt8CYM7bAerC1wPE+tcB127TAuIi0wHZBtMBDA7TABM2zwLyds8BBdrPAGqTIwMK2xMAiqcHAH/++wI2hvMBBdLrA7HW4wM6ktsC+/rTADoGzwPQossCF9LDA+uevwDNCr8D7zq7AAmquwKMRrsD+x63A24itwMlRrcDJIa3ARJ7GwE05wsCJp77A7au7wGIRucBMrLbA3ne0wNByssBsm7DAku+uwGhsrcBPD6zATdaqwKO+qcAr46jAGlqowKPzp8DzmafAikunwMUJp8Df0abA6c7EwAQ4wMD6+LvAR6W4wMW6tcBqHLPA16+wwEx0rsCHaKzA2IqqwDHZqMCaUKfAgO6lwOqwpMAWlaPAQJiiwLroocCaeKHAmB2hwAbOoMCEiKDAPjLDwOpsvsAf0rnAouS1wNmissCRxq/AayCtwGSsqsDBaajAS1emwFRzpMDSu6LA3C2hwMLGn8CYhJ7AmGSdwPpjnMCbhpvAJfmawNGcmsATTJrAh8fBwC/UvMBAC7jAaXizwN7ar8D/q6zAgMupwJsdp8AooqTAd1iiwFQ/oMAZVZ7Av5ecwFcEm8BVmJnAlVGYwGktl8ACKZbAoEGVwO6NlMDZF5TAj66/wF9tu8CIdrbA6qmxwBJdrcAL06nAQ7KmwMrJo8AyFKHAX5GewKdAnMDfIJrAZjCYwDdtlsBh1JTAZ2OTwCIYksDI75DAmOePwMv8jsCuLI7AO8S7wE40ucBwE7XAZRmwwOhIq8CvSqfAFtWjwAiyoMCmwZ3AawSbwER6mMCPIpbAKvyTwHgFksB5PJDAOZ6OwEIojcB42IvA+KuKwP6ficDEsYjAEgYSwVT0EcEB5RHBx9cRwV3MEcGFwhHBB7oRwbWyEcFyrBHBNacRwbGiEcHNnhHBc5sRwZCYEcETlhHB75MRwReSEcGAkBHBIo8RwfWNEcHxjBHBy7YOwf2hDsEDkA7BfYAOwRdzDsGHZw7BjV0OwfNUDsGITQ7BKkcOwdtBDsFIPQ7BVzkOwfI1DsEFMw7BgDAOwVQuDsF2LA7B2ioOwXcpDsFGKA7BXmsLwf5SC8HrPQvBtisLwfwbC8FpDgvBsgILwZf4CsHf7wrBXOgKweLhCsGB3ArB39cKweDTCsFv0ArBec0KwevKCsG4yArB08YKwTLFCsHKwwrBNScIwecHCME27wfB3dkHwWvHB8F9twfBvKkHwd6dB8GhkwfBzYoHwS+DB8GffAfBJ3cHwXVyB8FpbgfB7GoHwetnB8FVZQfBG2MHwTBhB8GJXwfBfeoEwYXEBMF1pATBc4sEwdR1BMEkYwTBAVMEwRJFBMEMOQTBrS4EwbolBMEEHgTBXRcEwc0RBMELDQTB8QgEwWkFBMFeAgTBv/8DwX39A8GL+wPBorQBwU+IAcHcYQHBCkEBwbYnAcHPEQHB4f4AwYjuAMFq4ADBPNQAwbrJAMGpwADB2LgAwRyyAMFzrADBoKcAwXmjAMHlnwDBz5wAwSeaAMHelwDBeQ39wBum/MDgT/zAgAf8wBjL+8ANnfvAfHb7wCpV+8BjOPvAjR/7wB4K+8Ch9/rAsOf6wPHZ+sAYzvrA4cP6wBW7+sCAs/rA+Kz6wFen+sB/ovrA5uL2wIB79sCeIfbAWNT1wA+S9cCkWPXA8ib1wPb79MCo2fTA9Lz0wLyk9MAIkPTALX70wMZu9MB/YfTADlb0wDNM9MC0Q/TAYzz0wBU29MCmMPTAj/LwwBl08MBoDfDA8rbvwA1s78AyK+/ABPPuwGrC7sBhmO7ADHTuwKtU7sCSOe7AliLuwH0Q7sDiAO7AbfPtwNTn7cDV3e3AONXtwMzN7cBnx+3Axy/rwHWa6sCiGOrAea3pwBNV6cC4CenAMcrowCuT6MCMY+jAXTrowMcW6MAL+OfAxd3nwB/H58CVs+fAuqLnwDKU58Crh+fA3nznwJBz58CLa+fAKZvlwP/j5MCzR+TA9sjjwLta48By/uLABbTiwLBz4sBWPOLAbgziwP/i4cAwv+HAQaDhwIyF4cB+buHAnFrhwHZJ4cCsOuHA7S3hwPAi4cB4GeHAsdzgwFdy38Dwod7ABAfewI2A3cCSEd3AALHcwBZd3MC5GdzA5ODbwMuv28CohdvAPGHbwMVB28CaJtvAJw/bwOv62sB46drAa9rawHLN2sBDwtrAoqLcwLP72sBEldnA43LYwBTD18BuOdfAd8HWwEdf1sDyCdbA4r/VwK5/1cCjTdXAWiLVwAD91MDU3NTAMsHUwFmp1MDFlNTABYPUwLdz1MCFZtTASpvYwFq61sDpI9XAALvTwAZ40sCWgdHAT+zQwDty0MDkB9DAJLDPwNZkz8CKI8/A+urOwAW6zsBek87AgHLOwB5WzsCoPc7AjSjOwGYWzsDWBs7A5crUwP6s0sC23tDAiEbPwNrXzcCGj8zAe2rLwGqbysB4HMrAYbDJwFxSycBoA8nAB8HIwIWHyMC9VcjAryrIwHcFyMCe5cfAtczHwDa3x8CrpMfAwz/RwHrbzsACyszA7/7KwHNgycD468fARZ7GwGR0xcD/a8TAWsDDwIFSw8Dx8sLA7Z/CwGtYwsD2HcLAXOvBwJa/wcDAmcHAD3nBwNRcwcB2RMHA6fvNwOdDy8B17MjAdOjGwKIWxcDUccPAhffBwG2kwMCxdb/A6Gi+wGiBvcCO7rzAco28wBQ5vMDd77vAZrC7wCx7u8CuTrvAOCi7wP0Gu8BK6rrA4SfLwEbxx8BoTcXAugbDwIr+wMD8Jb/A13q9wLH6u8AvorrAkm65wGBduMCca7fA5qO2wCoitsBwzLXACoK1wItBtcCuCbXAVtm0wCqxtMBkj7TAdNPIwNPtxMAZ88HAHF6/wPcbvcB4DLvAHy25wLB7t8Cv9bXAwZe0wEBfs8CgSbLA31OxwAl7sMA3zq/ATFqvwLYOr8Atza7AaZSuwEljrsDMOK7AKb3GwCtnwsDs3r7APfa7wFpyucBCKbfAdRK1wEUss8CPdLHAuOivwF2FrsDzR63A4S2swCA0q8C1V6rAwpWpwDn/qMB6lqjAllOowOoZqMAA6KfAOOHEwMBVwMB+HrzAy9u4wE4EtsChf7PAzy6xwLgQr8C0I63Ao2WrwAfUqcA/a6jA6iinwGQKpsCgDKXAmyykwHJno8BjuqLA4jWiwFHZocB4mqHAfTvDwF1+vsC57rnAkQq2wJrZssAiErDAXoWtwNksq8B8B6nAphOnwD5PpcDGt6PAp0miwGcCocBq35/An92ewAD6ncCeMZ3AsoGcwJ/nm8BDcZvA5srBwNfcvMDcG7jA+pGzwGsAsMB84qzAmxiqwMqDp8CaI6XA//aiwF38oMCeMZ/AS5SdwM0gnMCr1JrAN62ZwGWnmMAnwJfAivSWwL9BlsAgpZXAxq+/wGNwu8CkfrbAtbmxwLF0rcDN+anALeqmwPUXpMAke6HAVBOfwIHfnMAY3prACA2ZwNxpl8D38JXA/J+UwBF0k8A2apLAWH+RwH+wkMDS+o/AO8S7wHs1ucAsFrXA9SCwwOhXq8BNYqfA1PqjwOvqoMBvEJ7ArGubwEf8mMBGwZbAHbmUwMHhksC+OJHAdbqPwI9kjsBBNI3AWyaMwN03i8DFZYrA9n4SwUxuEsEEYBLByFMSwU5JEsGNQBLB1TkSwRY0EsEsLxLB+CoSwWAnEsFOJBLBrSESwW4fEsGCHRLB3hsSwXcaEsFEGRLBPhgSwV4XEsGeFhLBfS4PwcsaD8HnCQ/BbfsOwQbvDsFn5A7BatsOwZvUDsHIzg7BzMkOwYnFDsHkwQ7Bx74OwR28DsHWuQ7B47cOwTm2DsHNtA7BlrMOwYyyDsGpsQ7B3uELwZrKC8GjtgvBhKULwdeWC8FEigvBgH8LwUh2C8FhbwvBeWkLwWtkC8EZYAvBZ1wLwT9ZC8GLVgvBPFQLwUNSC8GTUAvBIk8LweZNC8HYTAvBypkIwVF+CMG7ZgjBf1IIwSRBCMFEMgjBhCUIwZoaCMFBEQjBJwoIwSoECMEK/wfBqfoHwer2B8G28wfB+fAHwaHuB8Gh7AfB6+oHwXXpB8E16AfBBlcFwaE2BcHJGgXB4gIFwV/uBMHH3ATBss0EwcbABMG1tQTBO6wEwe2kBMHbngTBqZkEwTiVBMFskQTBLI4EwWWLBMEGiQTB/oYEwUKFBMHHgwTBexoCwVT0AcGA0wHBSLcBwQ2fAcFCigHBbXgBwSRpAcEKXAHB0lABwTdHAcG0PwHBjDkBwUg0AcHHLwHB7SsBwaIoAcHRJQHBaSMBwVohAcGYHwHBssr9wKhw/cBWI/3AzOD8wJmn/MAPd/zA9U/8wG0u/MCuEfzADfn7wBXk+8CD0/vAVcX7wK65+8BtsPvAhKj7wMCh+8D3m/vABZf7wMqS+8Atj/vAxXv3wOId98Bxz/bAW4z2wKdS9sASIfbAj/b1wMjS9cActPXA05n1wE+D9cAHcPXAhV/1wGRR9cBORfXA9jr1wB4y9cCNKvXAFST1wI0e9cDTGfXAOYnxwBsT8cCUrfDAGl/wwEYc8MC45O/ACrXvwCWM78Ajae/AH0vvwGUx78BbG+/AfAjvwFX47sCD6u7Ar97uwJHU7sDqy+7AhMTuwDC+7sDHuO7AtrrrwC8s68AXuerA+1XqwHQA6sBPu+nAcYLpwKhR6cAWKOnAZQXpwPvn6MDHzujAL7nowLKm6MDelujAUonowLt96MDRc+jAVmvowBVk6MDhXejApzDmwOhu5cBU3+TABWXkwKED5MAfsOPAOWjjwAwr48C3+eLADNHiwC6u4sBQkOLAy3biwA5h4sBvTuLAfz7iwNsw4sAvJeLAMxviwKkS4sBcC+LAhZ/hwI8/4MC8ON/Ab5zewKQk3sAGvd3APGbdwN4d3cCT39zAA6rcwAB83MB/VNzAIjXcwAYb3MCpBNzAgfHbwCLh28Ag09vAI8fbwOK828AdtNvAEUvdwBS628AyatrAh0nZwFpq2MC/39fASHbXwDIb18CmzNbAqYzWwCJW1sBIJ9bAEP/VwI/c1cD5vtXAnqXVwOaP1cCOfdXARG/VwApj1cCVWNXAZinZwBNj18Dh4NXA35XUwElw08DBbNLAaKbRwB8o0cBsy9DAeXvQwJs20MBb+8/Ab8vPwH6iz8Bef8/AP2HPwG9Hz8BRMc/AYh7PwCsOz8BLAM/AUkPVwFI/08Cpg9HAywjQwFW4zsCEjc3AV4XMwAqdy8Ad6srAjHTKwDAjysAa3cnAzKDJwPVsycBuQMnAXBvJwLT8yMBt4sjA68vIwKS4yMAjqMjA2qDRwDVTz8BgV83AsqfLwKInysBx0cjAXaHHwICUxsADqMXAvdjEwCw0xMAexMPAznzDwHA/w8CvCsPAX93CwHq2wsAdlcLAg3jCwARgwsBmTMLAGUfOwJGiy8BuYMnAcHfHwLPDxcBTPcTAX+HCwP+rwcBsmsDAtqm/wK7WvsBDHr7AZoO9wL8gvcCc17zA76G8wNRzvMBATLzATSq8wDINvMBB9LvA5mzLwJw8yMDdrsXAVXzDwFORwcDC1r/ADEq+wE7ovMCerbvATJe6wFeiucCGy7jAwQ+4wBlst8DU3bbADIC2wFc1tsAgBLbA3du1wFO5tcC2m7XAiQPJwOkkxcC2PMLA/by/wOOUvcByorvADuG5wAJOuMB15rbAb6a1wFqLtMAgkrPAgbeywFz4scC6UbHA2MCwwChDsMAk4a/ArJ+vwF1nr8CBQq/Af9zGwL2VwsBYFr/APUK8wIXSucDvpLfADau1wMHis8BvSbLADtywwLGWr8DTdq7AT3mtwN2arMBU2KvAsy6rwC+bqsAwG6rAXaypwJNMqcADCqnAwvPEwOhzwMAeRLzARhK5wDdOtsA14rPAsKyxwGCrr8Ar3K3AfjyswFvJqsCkfqnA+VmowCdYp8DedabA7K+lwEkDpcAfbaTAz+qjwPR5o8BnGKPA1UTDwAeQvsC5C7rAnzC2wNYRs8ByXbDA1OmtwGWsq8Cpo6nAjc2nwIAnpsCVrqTAjF6jwBI1osDvLqHAy0igwG5/n8DFz57A8TaewEyyncBoP53ATM7BwJXlvMCtLLjAx6uzwA0msMARGa3AkmWqwKDpp8BPpKXALJSjwCy3ocDBCqDA/4uewLM2ncBoCJzA8f2awPATmsAkR5nAcpSYwPP4l8D1cZfA/rC/wG5zu8DWhrbAssmxwM6MrcCzIKrAHSKnwBdmpMDc4aHAspSfwC99ncBPmZvAieaZwPJhmMBPB5fARtSVwHrFlMCa15PAXAeTwJ9RksBxs5HAO8S7wKc2ucDfGLXAmCiwwBdnq8AFeqfAGSGkwOcjocBEX57AztKbwNV9mcD7XpfAQXSVwCS7k8C6MJLAwdCQwPGYj8DYhY7AF5SNwGbAjMCbB4zAbfMSwbflEsEP2hLBJtASwbrHEsGTwBLBgLoSwVi1EsH3sBLBP60SwRiqEsFrpxLBJqUSwTmjEsGXoRLBNKASwQefEsEInhLBL50SwXecEsHcmxLBVJ8PwfuOD8ETgQ/BP3UPwTFrD8GmYg/BZVsPwTtVD8H/Tw/BjksPwclHD8GWRA/B30EPwZI/D8GdPQ/B9TsPwY06D8FbOQ/BWDgPwX03D8HCNg/BnE4MwSE7DMGLKgzBcBwMwXAQDME9BgzBk/0LwTb2C8H17wvBpuoLwSXmC8FR4gvBEt8LwVHcC8H72QvBANgLwVHWC8Hk1AvBrtMLwafSC8HI0QvB5QEJwbPqCMHx1gjBHsYIwc+3CMGjqwjBSqEIwYCYCMEIkQjBsIoIwU2FCMG6gAjB2XwIwY15CMHCdgjBY3QIwWByCMGrcAjBOW8Iwf5tCMH0bAjBLboFwVaeBcHPhgXBxHIFwbRhBcEwUwXB10YFwVg8BcFtMwXB2SsFwWolBcHzHwXBTxsFwV8XBcEIFAXBMhEFwcoOBcHADAXBBAsFwYwJBcFNCAXBRHgCwQ9XAsHNOgLB8CICwZwOAsFO/QHBlO4BwQ7iAcFo1wHBXM4BwazGAcEkwAHBmboBweS1AcHlsQHBga4BwaGrAcEwqQHBHqcBwVylAcHfowHBq4H+wE8r/sDz5/3AlK79wC5+/cDxVP3A1TH9wPUT/cCM+vzA8uT8wJbS/MD9wvzAvrX8wH6q/MDxoPzA1pj8wPSR/MAejPzAKof8wPaC/MBmf/zAkCn4wD3D98B0cPfAqzT3wAUD98DU2PbAJbX2wMWW9sDtfPbA9Gb2wEdU9sBoRPbA7Db2wHkr9sDBIfbAgBn2wH8S9sCNDPbAgQf2wDkD9sCX//XAbhnywL2s8cCFUvHAbwbxwGTF8MBokfDAK2fwwDdD8MD8JPDAAAzwwN3278Dl5O/AodXvwKvI78Cqve/AUbTvwGOs78Cnpe/A8J/vwBeb78D5lu/AG0DswKm868BTT+vA0/XqwKGr6sA3bOrAEzbqwOYH6sDP4OnA1MLpwFOp6cCjk+nAN4HpwJRx6cBMZOnABVnpwHFP6cBZR+nAgkDpwLQ66cDHNenAjvXmwA8B5sDkb+XA7wHlwJij5MAJVuTAGBjkwDjj48AgtuPAs4/jwPpu48B1U+PAETzjwC4o48BIF+PAYgrjwG7/4sAh9uLAPO7iwIjn4sDY4eLAClziwIkZ4cAg/9/AKznfwLG83sDnYd7AKBTewKzR3cDjmN3A4mrdwDNE3cBCI93AOQfdwGHv3MAb29zA38ncwDu73MDMrtzAPaTcwEWb3MCpk9zAT+/dwB183MCKOtvAZzDawLhL2cA5ldjArBzYwHLN18CxidfA0E/XwG4e18BU9NbAdtDWwA6z1sC/mtbAFYbWwIR01sCXZdbA6ljWwCZO1sACRdbA77fZwAEM2MDgmtbAKGjVwO5d1MDUdNPAx6nSwIX50cA6i9HAzDnRwNP+0MB/zNDAl6HQwAp90MDrXdDAcUPQwOws0MDIGdDAgwnQwLH7z8B28M/ANb3VwJ7O08APJtLAp8TQwJ+Qz8BQgc7Av5PNwL3EzMAAEczAbnXLwAIAy8BUrsrA/3LKwEhHysAJIsrAUwLKwFjnycBl0MnA47zJwE+sycA6nsnAdgPSwP3Iz8CD4c3A50vMwMfoysAer8nAsJrIwJ2ox8Cd1cbAWx7GwLJ/xcC59sTAwoDEwAMvxMAg8sPAz7/DwIGfw8AEhMPAo2zDwMJYw8DeR8PA55HOwFIBzMCU2cnAWAPIwIdsxsAjA8XA0MPDwDqqwsCas8HAktzAwMMhwMD9f7/AS/S+wPd7vsCLFL7A0bu9wBB6vcDgTL3AXia9wJQFvcDA7bzA87LLwJaHyMBpD8bAFfHDwE0hwsCbg8DA6xO/wOXOvcAesLzA6rS7wNLZusBuG7rAg3a5wBPouMBcbbjA3gO4wFupt8DTW7fAghm3wNvgtsAYt7bAVTTJwPNbxcAlhsLAzhrAwBUMvsDgNbzAWJG6wFQbucCU0LfAl6y2wMastcCXzbTAlwu0wIJjs8BO0rLALlWywJrpscBJjbHAMj6xwIv6sMC+wLDARfzGwP/EwsC7Tb/A7I28wLkxusAZH7jAWkG2wOSVtMCbGbPAFcmxwOKfsMBvm6/AI7iuwILyrcA9R63AP7OswLIzrMADxqvA4GerwDgXq8A30qrAiAbFwHuSwMDRabzAuEi5wCGYtsD+Q7TAQimywPlDsMCPka7A+A6twKy4q8BFiqrAK4GpwLyZqMB00KfA+iGnwC6LpsAwCabAY5mlwGs5pcAu56TAR07DwOmhvsAgKbrAxFa2wBJKs8BoqLDApk2uwNMqrMAAPqrAooSowK77psCon6XACGykwENeo8CucqLAu6WhwAj0oMBqWqDA99WfwAhkn8A3Ap/AudHBwGvuvMCxPbjAz8WzwN5LsMA6UK3ATrKqwPZOqMAQJKbAuC+kwGdvosAV4KDAQn6fwHtFnsAHM53ASUOcwKdym8C3vZrARCGawFmamcBEJpnANrK/wH52u8Acj7bA4NmxwDqlrcC1R6rAB1qnwBi0pMA1SKLARRWgwGwZnsArUpzAfbyawNxUmcDlFpjAyf+WwN4LlsCMN5XAXH+UwBDgk8CqVpPAO8S7wNQ3ucCXG7XATzCwwHR2q8DSkafAgEekwO5cocAQrp7ArzmcwL7+mcBs+5fAPy2WwDiRlMDMI5PAmeCRwN7EkMDFzI/Av/SOwE05jsAml43AlFwTwS1RE8GQRxPBdT8TwaU4E8HyMhPBJS4TwRkqE8GwJhPB0SMTwWYhE8FdHxPBph0TwTQcE8H9GhPB9xkTwRoZE8FgGBPBxBcTwUAXE8HSFhPBpwUQwev3D8FX7A/BleIPwVraD8Ft0w/BpM0PwcTID8GpxA/BM8EPwUm+D8HUuw/Bw7kPwQW4D8GOtg/BUrUPwUi0D8Fosw/Bq7IPwQyyD8GGsQ/BtrEMwTShDMFDkwzBgocMwZp9DME/dQzBNW4MwVZoDMFjYwzBN18MwbRbDMG+WAzBQFYMwSdUDMFiUgzB5VAMwaRPDMGWTgzBs00MwfNMDMFSTAzBO2MJwYVNCcHEPAnBni4Jwa4iCcGgGAnBJBAJwf4ICcEHAwnBAf4IwcX5CME09gjBM/MIwavwCMGK7gjBvuwIwTvrCMH16QjB4+gIwfznCME65wjB+xoGwaf/BcFZ6QXBV9gFwfrJBcHcvQXBp7MFwQurBcHIowXBuZ0FwZ+YBcFTlAXBs5AFwaeNBcEViwXB64gFwRiHBcGQhQXBRYQFwS6DBcFEggXBkdgCwdW3AsEZnALBMYUCwe5zAsFaZQLBDFkCwa9OAsHyRQLBkz4CwWo4AsE8MwLB3y4CwTIrAsEZKALBfiUCwUsjAsFxIQLB4x8CwZMeAsF4HQLBKDr/wNrr/sBsqf7AInH+wBtC/sARH/7AeAH+wHzo/cBz0/3As8H9wL2y/cA4pv3AtJv9wNeS/cBgi/3AF4X9wMt//cBVe/3Ak3f9wGl0/cC/cf3AgdX4wBh2+MCnJvjA2uT3wHaw98AehPfA/mH3wBtI98CPMvfAYSD3wBMR98AsBPfATPn2wCLw9sBp6PbA6+H2wH3c9sDq1/bAEdT2wNPQ9sAYzvbAQKXywP9A8sAn7PHAs6jxwI9v8cA+QPHANRjxwFz28MDE2fDAn8HwwGqt8MAdnvDAN5HwwFiG8MAvffDAdnXwwPVu8MB7afDA3WTwwPtg8MC1XfDA/s3swJ9G7MDy4uvAII/rwBJK68AQEevA5uLqwNq76sDYmurA9X7qwGln6sCKU+rAx0LqwKQ06sC5KOrArh7qwDcW6sAVD+rAEwnqwAME6sDA/+nA583nwBfD5sAECebAOZTlwKxB5cCP++TAFsDkwA6O5MBOZeTAY0TkwCUp5MAkEuTAuv7jwFru48CL4OPA59TjwBfL48DSwuPA27vjwP2148ALsePAuBvjwFjq4cCv6eDA9wrgwBRo38BU+97AebXewD583sDCS97AuiLewAcA3sC14t3A88ndwA213cBro93Ai5TdwHiI3cCVft3AQHbdwDtv3cBRad3AQZjewEM33cDrC9zAHhDbwEY/2sCojtnAyPbYwF2K2MBGO9jAmwTYwL3a18BWt9fAapnXwCaA18DSatfA01jXwKVJ18DZPNfADzLXwPgo18BOIdfAgEnawPyv2MA6VNfAojPWwKJA1cDAb9TAcrvTwFog08Bam9LAmynSwJHV0cBgm9HAEmrRwLZH0cDuLdHAKxjRwM8F0cBS9tDAQ+nQwEHe0MD61NDAEDXWwIVa1MBBydLAvHrRwFpg0MCSas/AbJXOwGHdzcAHP83AM7fMwAJDzMDa38vAZovLwJlDy8AEEcvA+ezKwIPOysDJtMrAEJ/KwKKNysBngsrA/GXSwB890MAGcc7ABezMwIKjy8CfhMrA4onJwGywyMCY9MfA8FLHwD/IxsCVUcbAS+zFwASWxcCmTMXAXQ7FwIzZxMDQrMTA94bEwPZmxMBIUcTA1+bOwKNjzMA4UcrAf43IwMcQx8DjwsXAbZ7EwLuew8DowMLAQQHCwENcwcCszsDAgVXAwA/uv8Dtlb/A+kq/wFYLv8Bf1b7AqKe+wPqAvsBEYL7AAPrLwGbTyMDbbsbA1WTEwDCuwsAvLMHAEti/wPmtvsBMqb3AE8e8wJADvMAzW7vAr8q6wPtOusBb5bnAWou5wM0+ucDK/bjAqMa4wPSXuMBucLjA02XJwHGUxcAkz8LAe3nAwFeBvsB7xrzApD27wETjucCAs7jAz6m3wCjDtsDA+7XA/U+1wIS8tMBCPrTAbdKzwIh2s8BcKLPA+OWywKitssDzfbLAehzHwO70wsAGhb/AMdm8wM6PusCKl7jAFNW2wFdFtcC35LPAQa+ywIagscBotbDAFOqvwOM6r8BwpK7AmiOuwI21rcC/V63A8AetwCfErMCmiqzAiBnFwHixwMB9krzAL3+5wIfhtsDUpLTAUKSywD3asMCKQ6/AsNytwIShrMC3javAHZ6qwNbOqcAyHKnAv4KowFD/p8AFj6fASi+nwNbdpsCjmKbA0VfDwAO0vsDsRrrA+Hy2wD+Cs8Ds8rDAr7CuwO2nrMA81qrAkTipwGXLp8CTiqbAr3GlwJR9pMBWqqPAOvSiwMFXosC10aHAKV+hwH79oMBgqqDALtXBwFf3vMDqTrjADuCzwL1xsMBEh63Atv6qwKmzqMCsoqbAX8mkwLsko8A6saHAuWqgwMNMn8AiVJ7A6HydwFDDnMDOI5zAIJubwE8mm8CwwprAb7O/wJV5u8B4l7bAP+qxwMO9rcDObqrA3JGnwOEBpcAOrqLA3JSgwPaznsBaCJ3AhY6bwElCmsBKH5nAHyKYwOZGl8DOiZbAQOeVwO1blcDT5JTAO8S7wAE5ucBVHrXAGTiwwP6Fq8CzqafA822kwPWVocC9/J7ALqCcwNF+msBXlpjAx+OWwJ5jlcCpEZTAjumSwOjnkcCtCJHAEUiQwHOij8B5FI/AJcQTwVa5E8FKsBPBt6gTwWCiE8ETnRPBpJgTwe6UE8HUkRPBPY8TwRKNE8FCixPBv4kTwXuIE8FshxPBioYTweCFE8FXhRPB5YQTwYWEE8E1hBPBi2wQwXFfEMF3VBDBRksQwZRDEMEkPRDBwTcQwUAzEMF7LxDBVSwQwbIpEMF/JxDBqCUQwR4kEMHVIhDBwiEQwdwgEMEpIBDBnh8QwSofEMHJHhDB7hcNwQ4IDcG/+gzBmO8MwULmDMFx3gzB59cMwW7SDMHazQzBBsoMwdPGDMEmxAzB6cEMwQvADMF7vgzBLL0MwRW8DMEruwzBb7oMweK5DMFsuQzB7MYJwbOzCcGTownBDpYJwbqKCcE+gQnBTnkJwalyCcEabQnBc2gJwZBkCcFPYQnBmF4JwVJcCcFsWgnB1VgJwYFXCcFmVgnBeFUJwbRUCcEkVAnBQ3oGwQJjBsF7TwbBGj8GwV8xBsHeJQbBPBwGwSsUBsFrDQbBxQcGwQwDBsEY/wXBy/sFwQj5BcG59gXBy/QFwS7zBcHV8QXBtPAFwcPvBcH67gXBkTMDwboWA8Ec/wLBR+sCwaXaAsGzzALBA8ECwTq3AsEIrwLBLagCwXCiAsGknQLBoJkCwUWWAsF3kwLBHpECwSiPAsGFjQLBJowCwQGLAsEMigLBg+v/wH6h/8BwZv/Adzb/wDAO/8Bm7P7AEdD+wFS4/sBypP7AzJP+wN6F/sA2ev7AdnD+wE9o/sB9Yf7Aylv+wAZX/sAKU/7AtU/+wO1M/sCaSv7AMYD5wBMn+cDu2/jAep/4wMNu+MDbRfjAiSP4wMMG+MBU7/fA19z3wF3N98BqwPfAlLX3wISs98DvpPfAmZ73wEyZ98DelPfAKpH3wBKO98B8i/fAYi7zwIPN8sAIg/LASETywHsP8sAv5PHAkMHxwIak8cAvjPHAy3fxwPtm8cAGWfHAWU3xwJRD8cBoO/HAkzTxwNwu8cAWKvHAGCbxwMEi8cD3H/HAOpXtwHLc7MC4bezAnSPswC7l68CmsOvA74XrwHBi68CrROvAuivrwOUX68CYB+vA+/nqwJbu6sAO5erAFd3qwGrW6sDX0OrALszqwEnI6sAIxerA5aLowAio58Bs2ObAmzzmwIDZ5cB2leXAUWLlwFg35cBEE+XAAPXkwKDb5MBdxuTAjrTkwKal5MAsmeTADo/kwLiG5MDAf+TA7HnkwA115MD6cOTAl9jjwD+14sDsyeHAjALhwNRX4MAkzN/AJmnfwEYl38AE7t7ALcvewAyu3sChld7AK4HewAlw3sCxYd7AsVXewKZL3sA/Q97AOTzewFk23sBwMd7AQz7fwOrr3cA92tzAru3bwCkq28D4idrArQPawH+S2cCUMtnAeOHYwIGn2MDwftjA4VzYwE9A2MBbKNjAehnYwDYN2MD0AtjAX/rXwDLz18Ax7dfADdjawENP2cBYDtjAdvjWwM0Z1sBoXdXAor3UwHI11MCzwdPAl1/TwJwM08CQxtLAhovSwNZZ0sAQMNLA/AzSwCTx0cD139HAkdHRwIfF0cB0u9HA2a7WwIPj1MBtbdPA1SzSwDgn0cAQSdDAOYrPwPDmzsC2W87AXeXNwAaBzcAkLM3AeuTMwBKozMA6dczAekrMwJMmzMByCMzALu/LwAHay8BEyMvAUcfSwOuy0MAW/s7AmonNwIhXzMCLUcvAsW7KwMCrycDmBMnAmXbIwJr9x8AAl8fAMEDHwOP2xsAXucbAEYXGwFNZxsCWNMbAwBXGwOX7xcA55sXAij7PwMzEzMC5xsrAUBXJwCmwx8BDfMbA1XDFwDuJxMAiwsPArBfDwEGGwsCUCsLArqHBwOpIwcDy/cDAvb7AwIaJwMDHXMDAMDfAwKMXwMAu/b/AAkLMwO8fycAHzcbATtbEwLU3w8Ay0MHALpbAwEKFv8DbmL7Aj829wHMfvcDgirzAfQy8wEWhu8CFRrvA3vm6wDu5usDOgrrACVW6wJYuusBQDrrA/5fJwA/TxcDKGsPA2NrAwHL0vsAAVL3Aq+W7wH2lusAJj7nAyp24wEHOt8B2HLfAs4S2wJIDtsAAlrXAPzm1wOTqtMDPqLTAKXG0wFtCtMAJG7TAHT3HwIYlw8Avvb/A8CO9wO7tusANDrnA+WW3wM7wtcBuqrTAao6zwEqYssB8xLHA+A6xwP5zsMAY8K/AJ4CvwGAhr8BL0a7AwI2uwN1UrsAEJa7AwizFwN7QwMAjvbzAerW5wFAqt8CSBLXApR2zwOptscDP8a/ASKWuwK2DrcCliKzAibCrwEb3qsAOWarAXtKpwAhgqcA1/6jAY62owF5oqMA7LqjAc2HDwFPGvsAbZbrA3qO2wFC6s8DlPLHAyxKvwIIjrcAdbKvADempwE+WqMAib6fAK2+mwLuSpcC01aTAODSkwLeqo8D3NaPAFdOiwIJ/osD/OKLAqdjBwFoAvcBXYLjAgfqzwKGXsMAgvq3As0qrwJYXqcDxH6fA4WClwNrWo8DZfaLAIFGhwDVMoMBsa5/AmqqewNUFnsCAeZ3AUgKdwF2dnMAFSJzAqLS/wLJ8u8Dpn7bAzvqxwGfWrcD3larAkMmnwFxPpcBDE6PASBOhwI9Mn8CRu53ASVycwPEpm8AfIJrA+TqZwFl2mMBHzpfAGD+XwHrFlsBtXpbAO8S7wC46ucAZIbXA9j+wwLeVq8BgwqfAa5SkwO7OocA1S5/AKwadwN/9msCBL5nAjZeXwAAylsAH+pTAReuTwMYBk8BTOZLA8Y2RwOb7kMDSf5DAGScUwTgeFMHZFhTBuRAUwaMLFMFqBxTB6QMUwQABFMGW/hPBlvwTwe36E8GM+RPBZ/gTwXX3E8Gr9hPBBfYTwXr1E8EH9RPBqPQTwVn0E8EY9BPBE84QwTbCEMEwuRDBsbEQwXerEMFLphDBAaIQwXGeEMF8mxDBCJkQwf+WEMFPlRDB6JMQwb6SEMHIkRDB+5AQwVGQEMHFjxDBUI8Qwe+OEMGfjhDB/ncNwXtpDcFoXQ3BJ1QNwYlMDcE0Rg3B80ANwZY8DcH3OA3B9jUNwXczDcFlMQ3Bri8NwUEuDcETLQ3BGCwNwUgrDcGcKg3BDCoNwZYpDcEzKQ3BXCUKwaQTCsHkBArBn/gJwR/vCcFg5wnB8eAJwZrbCcEq1wnBfNMJwW7QCcHkzQnByssJwQvKCcGZyAnBZccJwWbGCcGTxQnB48QJwVLECcHZwwnB7NYGwU/BBsFNrwbBT6AGwdeTBsEYigbBOIIGwa57BsFAdgbBvXEGwf9tBsHkagbBUGgGwS1mBsFnZAbB7mIGwbVhBsGyYAbB218GwSlfBsGVXgbBlI0DwT5zA8FHXQPB+koDwb47A8ERLwPBEiUDwREdA8FrFgPB5RADwVAMA8GCCAPBWgUDwbsCA8GOAAPBwP4CwUH9AsEE/ALB/PoCwSH6AsFs+QLBZkoAwVkqAMGWDwDBh/L/wFXN/8Bdrv/AmZT/wBmA/8DUb//AT2L/wBZX/8DETf/ACEb/wJw//8BIOv/A3TX/wDIy/8AnL//AoSz/wIkq/8DNKP/ATh36wGzP+cBMjvnA6Vf5wIwq+cC/BPnAReX4wBXL+MAStvjAh6X4wMqX+MBhjPjA6IL4wAt7+MCEdPjAGW/4wJtq+MDgZvjAyWP4wDhh+MAXX/jATOzzwGFd88ARE/PAy9bywGWp8sCgg/LALGTywP1J8sA2NPLAGyLywBAT8sCQBvLAL/zxwJHz8cDZ7PHAVufxwMTi8cD53vHA1NvxwDjZ8cAN1/HA1IPuwOS07cBSFe3AXbnswO917MDUSOzAOiPswOgD7MDX6evAKNTrwCLC68Ans+vAtabrwM2c68CYlOvAyI3rwCGI68Bwg+vAi3/rwFB868CieevAJXXpwH6K6MDVyefAyifnwEep5sBoR+bApwrmwOXX5cBusuXAC5nlwO2D5cBfcuXAyWPlwKtX5cCcTeXAQUXlwFI+5cCROOXAyzPlwNUv5cCLLOXAk5bkwKWE48BboOLAhOzhwJVV4cDy1eDAYGrgwOwP4MB0yt/Ad5DfwFJt38AYUd/AmznfwBIm38DVFd/AVwjfwCL93sDT897ADu7ewGXp3sCH5d7AN+XfwPCk3sBin93AxsncwOwT3MCeetvABgPbwEee2sAiStrA+wTawBzL2cDBmtnAZ3LZwMNQ2cC+NNnAbB3ZwAYK2cDm+djAf+zYwF3h2MAf2NjAT2jbwDPx2cBHwdjAlMPXwEDr1sBsQNbAgLDVwCE51cCU1NTAGYDUwEQ51MD8/dPAcszTwBmj08CggNPA6mPTwANM08AiONPAmyfTwN4Z08B1DtPA2ibXwKVw1cBZDNTA0N/SwKDo0cCoHNHAH3LQwIbhz8BYZ8/AaADPwOepzsBcYc7ApCTOwOTxzcCIx83AN6TNwMuGzcBNbs3A7lnNwP5IzcDqOs3AvCjTwFMq0cCBh8/A8CXOwAwGzcDIFczA9UjLwImaysCaBsrAkonJwDQgycCkx8jAXH3IwC0/yMAyC8jAzt/HwKC7x8B7ncfAZITHwIRvx8ApXsfAuqHPwJ8kzcDTOcvAPJ3JwLFKyMAAL8fA7DrGwIxpxcAwt8TA3h/EwPCfw8AbNMPAc9nCwGeNwsC7TcLAgBjCwBDswcABx8HAIajBwG2OwcALecHA7YrMwONrycBDKsfAuEzFwM69w8Bgb8LA+U3BwJJUwMCYfr/AP8i+wH8tvsChqr3ATDy9wIXfvMCvkbzAgFC8wAEavMCA7LvAjca7wO+mu8CcjLvA1crJwOwRxsDbZsPA+jrBwFRmv8A03r3AJ4m8wLdhu8DxYrrAT4i5wO/NuMC2L7jA36m3wAI5t8AW2rbAboq2wLhHtsDvD7bAW+G1wIG6tcAhmrXAK17HwMJWw8Dq9b/ADG69wCNLu8BygrnAzvO3wP2XtsB3arXAR2a0wPSGs8CCyLLAxyaywO+dscCCKrHAasmwwOx3sMCpM7DAlPqvwOjKr8Ako6/AN0DFwKrwwMAO6LzABu25wBR1t8AUY7XAEpWzwMX+scAYnLDAgGivwN9ersDReq3AQ7iswP8SrMAfh6vAHBGrwNKtqsB5WqrAphSqwD/aqcB4qanAL2vDwNrYvsCug7rAPcu2wDXys8A7hrHA1nOvwGGdrcBm/6vA0JWqwCFcqcALTajAOWSnwIqdpsC19KXAxmWlwCjtpMCnh6TAbjKkwAbro8BLr6PALNzBwHUJvcD4cbjANBe0wH69sMC/9K3ALparwJp6qcCwm6fABPalwIKFpMCnRaPAJTGiwItDocCzeKDAR8yfwEQ6n8AFv57ASFeewCwAnsArt53A4rW/wNZ/u8BvqLbAjguywCLvrcApvarAFAGowHOcpcC1d6PAWpChwPzin8CLa57AgCWdwIcLnMAnGZvAIkqawBqamcD+BJnAGoeYwB0dmMAaxJfAO8S7wFs7ucDiI7XA50ewwJylq8B226fA4rqkwM0HosBkmZ/AhWudwL17m8CwxpnAT0iYwBP8lsCa3JXAeOWUwEESlMCZXpPAYMaSwNNFksCT2ZHAg4gUwYmAFMH1eRTBiXQUwRJwFMFjbBTBW2kUwdxmFMHOZBTBHGMUwbdhFMGRYBTBn18UwdheFME0XhTBrV0UwT5dFMHjXBTBl1wUwVpcFMEnXBTBYy0RwY0jEcFwGxHBvxQRwTsPEcGwChHB8QYRwdwDEcFSARHBOv8QwYH9EMEW/BDB6/oQwfX5EMEq+RDBhPgQwfr3EMGJ9xDBLPcQweD2EMGh9hDBt9QNwZjIDcGXvg3BVrYNwYivDcHsqQ3BTKUNwX2hDcFang3BxZsNwaSZDcHjlw3BcpYNwUKVDcFHlA3BeZMNwdCSDcFEkg3B0ZENwXKRDcEkkQ3BEX8KwSNwCsHOYwrBoVkKwTxRCsFQSgrBm0QKweg/CsEIPArB1zgKwTY2CsEMNArBQzIKwcswCsGWLwrBly4KwcYtCsEZLQrBiywKwRYsCsG2KwrBHy0HwcAaB8GQCwfBBv8Gwaz0BsEj7AbBGOUGwUrfBsGC2gbBkdYGwVLTBsGl0AbBcc4GwaHMBsEjywbB6MkGweXIBsEQyAbBYMcGwc/GBsFYxgbBVuEDwSHJA8FytgPBAacDwUCaA8G5jwPBCocDweB/A8H5eQPBG3UDwRlxA8HLbQPBE2sDwdVoA8H9ZgPBeGUDwThkA8EwYwPBV2IDwaVhA8ESYQPBY6oAwQp/AMEpZQDBKVIAwXVCAMF8NQDBxyoAwfEhAMGoGgDBpxQAwbQPAMGgCwDBRAgAwX8FAME4AwDBVwEAwZf//8AM/f/A9Pr/wDr5/8DP9//AYTD7wLCR+sCTOfrAbgL6wMnb+cDXu/nAdaH5wK2L+cC1efnA42r5wKte+cCZVPnATUz5wHdF+cDWP/nAMjv5wGE3+cA8NPnApTH5wIQv+cDCLfnACWD1wLF39MC5zvPAK3XzwFE/88CWG/PADv7ywKrl8sD40fLADcPywMC28sCcrPLAQaTywF+d8sCzl/LAB5PywC6P8sAEjPLAaInywEKH8sB+hfLArMDvwKS37sCSDu7ADpPtwLcr7cCD8OzAIMPswMCd7MBWguzAUXDswHRh7MAyVezAF0vswMRC7MDoO+zAQTbswJox7MDFLezAnSrswAMo7MDgJezArlrqwBRq6cBQt+jAACTowAqs58C2R+fAr/fmwBi45sBmg+bABljmwJY/5sBpK+bAwxrmwAcN5sC0AebAX/jlwK/w5cBZ6uXAIOXlwNTg5cBK3eXAVFDlwN5P5MCufOPA2s7iwO5D4sDX0+HAmHbhwOAo4cA86ODAlrLgwByG4MBJYeDA00LgwKYp4MDcFODAoATgwL/338Ah7d/AYOTfwCrd38A519/AZ4fgwIhZ38C8Yt7AoprdwET43MDgb9zAlP3bwA6e28BEU9vA0RbbwKbk2sAUu9rAq5jawDd82sC0ZNrAnVHawAVC2sApNdrAjirawNAh2sCcGtrAn/TbwNeR2sCmbdnA/4XYwJLB18ClG9fAQpnWwBou1sCj1NXAAIzVwJ9P1cCEHdXA//PUwKHR1MA1tdTAup3UwFeK1MBXetTAJW3UwENi1MBLWdTASJzXwPH71cAdptTAnpHTwKCl0sAZ6dHAMU3RwF7N0MBSYtDA7gjQwHe+z8COgM/ALU3PwJciz8BX/87AMOLOwBrKzsA3ts7AzaXOwEKYzsAYjc7Ak5jTwDuf0cBJDdDA1cTOwPmvzcB90czAmxjMwNN8y8Dk+crANozKwJowysBG5MnAzqTJwB9wycB0RMnATiDJwGgCycCz6cjATNXIwHbEyMCTtsjA6wXQwB2GzcDTqsvAiSfKwAnjyMDn2sfAh/zGwJU/xsAWoMXA/RnFwKKpxMDDS8TAif3DwHu8w8B5hsPAtFnDwKM0w8D6FcPApPzCwLjnwsBz1sLAtNTMwCW3ycAQiMfAZcHFwNVCxMCBCcPAPf/BwLsbwcBkWsDAIbe/wNItv8C+ur7AlFq+wG0KvsDCx73AZ5C9wINivcCDPL3AFB29wBoDvcCm7bzAUP7JwMJXxsBBssPAvpnBwO7Wv8DgZL7A3ye9wLgXvMAFL7vAPGm6wCfCucCYNbnAwr+4wERduMAoC7jA2sa3wCGOt8AZX7fAJzi3wPAXt8BP/bbAon/HwJ2Iw8BxLsDAa7e9wOCmu8CL9LnAW364wK06t8CUJLbApDa1wFxstMBrwbPAkTGzwPC4ssAYVLLAAACywAm6scDuf7HAvk+xwNcnscDTBrHA5VPFwNwQwcB/E73A1SW6wAjBt8A4wLXAaQq0wJeMssAoQrHAGSawwOIyr8AQZK7AObWtwAsircCYpqzAXT+swEXpq8CgoavAHmarwMM0q8DiC6vAA3XDwJjrvsChorrAovK2wN4ptMDcz7HAr9OvwF0VrsDhj6zAnT6rwJkcqsASJKnArlCowOmdp8BgB6fAE4mmwHAfpsBSx6XA+n2lwA1BpcCDDqXAtt/BwKUSvcDLg7jA8DS0wBjlsMAVK67AEOGrwJTcqcC+FajAkoimwHIwpcBkCKTAlQqjwJYyosDce6HA8eGgwMRgoMC09J/AipqfwHxPn8AgEZ/AHbe/wACDu8ALsbbAfhyywPEHrsBc5KrAWjiowBDppcBC26PA6AuiwAp3oMAKGJ/A6emdwM7mnMAxCpzAe0+bwCiymsAXLprAlL+ZwFtjmcCSFpnAO8S7wIk8ucCxJrXA7E+wwK+1q8Ci9KfAT+GkwIVAosA155/AHdCdwEH4m8CwW5rAz/WYwJjBl8AhuZbA7deVwDcZlcB3eJTAfPGTwIOAk8A3IpPA6OMUwcbZFMFr1BTBCdAUwXTMFMGGyRTBIccUwSzFFMGTwxTBRMIUwTLBFMFTwBTBnL8UwQe/FMGNvhTBKr4Uwdi9FMGWvRTBX70UwTO9FMEPvRTBLIwRwUN/EcGudBHBG28RwaVqEcEAZxHBBGQRwZRhEcGWXxHB9V0RwaFcEcGKWxHBp1oRwe1ZEcFVWRHB2VgRwXNYEcEhWBHB3VcRwaZXEcF4VxHBxzcOwcEnDsGdGg7B2A8OwcoJDsFABQ7BiQEOwYD+DcEF/A3B/vkNwVX4DcH69g3B3/UNwff0DcE69A3BoPMNwSHzDcG68g3BZvINwSHyDcHo8Q3BhecKwaXTCsFWwwrB9rUKwQGrCsF3pArB2J8KwRGcCsH6mArBc5YKwWOUCsGzkgrBUpEKwTGQCsFFjwrBhY4KweeNCsFnjQrB/owKwaiMCsFijArB8qcHwb6DB8GGbwfB7V4HwVBRB8EpRgfBJD8HwXA6B8GXNgfBcjMHweAwB8HGLgfBDi0HwaYrB8GBKgfBkSkHwc0oB8EsKAfBqScHwT4nB8HnJgfB638Ewd1GBMH9HwTBaQsEwYb6A8Gs7APBUuEDwdHZA8EH1QPBHNEDwenNA8FLywPBJ8kDwWfHA8H5xQPBzsQDwdrDA8ESwwPBb8IDwerBA8F9wQPBtmUBwdcfAcHV5QDBQbwAwVGnAMEhlgDBCIgAwXp8AMF9dADBnW8AwaFrAMFeaADBtGUAwYdjAMG/YQDBSmAAwRpfAMEhXgDBVl0AwbBcAMEoXADBKrj8wLQN/MCrf/vAtQn7wBWx+sB5hvrAfmP6wM1G+sBJL/rAUx76wGcU+sBJDPrApgX6wDoA+sDL+/nAK/j5wDT1+cDJ8vnAzvD5wDHv+cDe7fnAVsz2wFz99cAoUPXAy7/0wN9H9MC16fPAWr7zwMGa88COffPA6GbzwC9W88AFTfPAhkXzwGU/88BiOvPASjbzwPEy88A0MPPA+C3zwCQs88CmKvPA7w7xwP8U8MDHQu/AcaXuwDA57sBJ7+3ATLLtwA2A7cC5Vu3AxDTtwMAc7cD+De3A6gHtwAn47MDz7+zAXOnswCfk7MDm3+zAa9zswJPZ7MBA1+zAjYfrwGRc6sBknunAlBnpwBar6MBwUOjArAjowHbN58CxnOfAlXTnwKJT58CYOOfAbCLnwIYR58D7A+fA5fjmwNPv5sBo6ObAVuLmwGDd5sBS2ebASz3mwHgV5cA9U+TAbLLjwEwx48DqxeLAenDiwEAt4sDy9eHAscjhwH6j4cDxhOHA4WvhwFRX4cB/RuHAtjjhwG4t4cAzJOHAphzhwHkW4cBsEeHA0zzhwLsO4MDVJd/AwGjewOLP3cDyVt3ABvPcwD+g3MDYW9zAciPcwAP128DWztvAe6/bwMKV28AogdvAb3HbwJBk28AHWtvAaFHbwFxK28CYRNvAuI3cwGox28CyHtrApD/ZwHCO2MCM+tfAQH/XwM4Y18D8yNbA84jWwCpU1sC5KNbABAXWwLPn1cDPz9XAn7zVwOis1cAJoNXAgZXVwOSM1cDYhdXANCTYwBeG1sC8P9XAJDzUwI9l08CosNLA7CDSwDOt0cAiTdHAnf/QwJi/0MDTitDAZV/QwLM70MBkHtDAWgbQwKbyz8CC4s/AStXPwHnKz8Cgwc/AHxbUwC8V0sCBkdDAU17PwEZbzsB9iM3AQd7MwMBSzMAK38vA+X7LwHAvy8C87crAkrfKwP2KysBYZsrAQUjKwJIvysBWG8rAwwrKwDD9ycAV8snABGvQwKrmzcBsHMzAB67KwDJ3ycBkgcjAjrXHwFQLx8DufMbASAbGwL+jxcAnUsXAvQ7FwCfXxMBlqcTAx4PEwORkxMCNS8TAxzbEwMIlxMDSF8TATB/NwJUBysBr6MfAkjPGwPvDxMBmnsPA0KnCwJ7awcA2LMHARZrAwKIgwMCXu7/A5me/wL4iv8C16b7Awbq+wCeUvsBzdL7AcFq+wB1FvsClM77AaDLKwF+gxsDi/MPA+PbBwO9EwMDS577AocG9wFTHvMAj87vAgEC7wPaqusBKLrrAs8a5wOBwucDyKbnAce+4wEa/uMCql7jAIne4wHFcuMCPRrjAgqHHwBO7w8CyZsDARgC+wIUEvMAvZLrAcQW5wKzYt8CX2LbAWv+1wG1ItcA/r7TAfy+0wFLFs8BWbbPAnCSzwJ3ossA1t7LAlI6ywDVtssDTUbLAzWfFwHIxwcBYRL3AZ166wEoMuMDeG7bAgH20wC4Xs8DL47HA4N2wwIv/r8BKRK/AbKeuwI4krsDEt63AmF2twAsTrcCJ1azA4KKswDd5rMD9VqzA8H7DwIz+vsD0wbrAAxq3wDphtMAGGbLANDKwwE6LrsBeHa3AP+OrwITXqsAN9KnAbDSpwNWTqMDSDajAY56nwAFCp8Cb9abAkbamwKSCpsDuV6bASOPBwO0bvcDSlbjACFO0wNkMscCNY67AQyuswGQ9qsDxjajAWRinwHfXpcDcxaTAQd2jwDgZo8DgdKLAsOuhwJV5ocD3GqHAtcygwB6MoMDpVqDAWLi/wDCGu8C7ubbAni2ywNAgrsCHC6vAV2+owB01psDNPaTAyYWiwIUIocDawJ/ATqmewJO7ncAa85zA+kqcwJe+m8DLSZvA6+iawMiYmsCiVprAO8S7wLc9ucCFKbXABFiwwO/Fq8DhDajArQelwAh5osCSNKDA1TOewEJznMBQ7prA15+ZwFaCmMBsj5fAh8KWwJoWlsD/hpXAfA+VwFaslMBOWpTAxJkVwVyJFcEAfBXBI3EVwU5oFcEhYRXBTFsVwZFWFcG5UhXBm08VwRRNFcEGSxXBXEkVwQJIFcHqRhXBBkYVwU5FFcG4RBXBP0QVwd1DFcGNQxXBbkoSwew1EsE2JRLBnBcSwYsMEsGMAxLBPfwRwU32EcF78RHBke0RwWTqEcHQ5xHBueURwQfkEcGm4hHBieERwaHgEcHl3xHBTd8RwdHeEcFt3hHBigAPwfHmDsEP0g7BC8EOwTGzDsHspw7Bwp4OwVCXDsFEkQ7BW4wOwV+IDsEjhQ7Bg4IOwWGADsGnfg7BQH0OwR18DsExew7BcnoOwdZ5DsFZeQ7Bab0LwYSdC8F0gwvBMW4Lwd1cC8HBTgvBR0MLwfI5C8FdMgvBNCwLwTQnC8EkIwvB2B8LwSwdC8EAGwvBPhkLwdAXC8GoFgvBtxULwfQUC8FWFAvBo4IIwfhaCMF/OgjB9x8IwVEKCMGs+AfBTuoHwZ7eB8Ec1QfBY80HwR3HB8EFwgfB4r0HwYe6B8HNtwfBl7UHwcyzB8FYsgfBKrEHwTWwB8FvrwfBIlIFwewgBcGM+ATBf9cEwXy8BMFxpgTBeZQEwdiFBMHweQTBQnAEwWRoBMEAYgTB0FwEwZlYBMEuVQTBaFIEwSdQBMFUTgTB2EwEwaVLBMGrSgTBLy4CwVLxAcE/vwHBKJYBwYR0AcEEWQHBkkIBwUYwAcFgIQHBQBUBwWULAcFhAwHB3/wAwZb3AMFL8wDB0O8AwfzsAMGx6gDB1egAwVLnAMEZ5gDB9DL+wPWc/cAiIf3APLv8wJpn/MAcI/zAHuv7wGq9+8AnmPvAz3n7wB1h+8AITfvAtjz7wHQv+8CvJPvA8Rv7wNgU+8AWD/vAagr7wKAG+8CNA/vAPy74wD1298C13fbAwF/2wBL49cD1ovXAPV31wD0k9cC19fTAxM/0wN2w9MC3l/TARIP0wKRy9MAjZfTAK1r0wENR9MAJSvTAK0T0wGk/9MCNO/TAUFXywMZ08cC7ufDAoB7wwIGe78ADNe/AZuDuwPWp7sB/fe7AO1nuwNE/7sA1Le7AFB7uwMkR7sDNB+7Asf/twBz57cDF8+3Ab+/twOvr7cAR6e3A9q/swLGf68CPu+rA5xLqwAui6cDTUunA3RHpwLXc6MBHsejA2I3owPhw6MDwWejA30fowC856MBALejAjiPowK8b6MBMFejAHBDowOcL6MB9COjAAEbnwNz+5cDCIuXA2pHkwOsZ5MDeuOPA3GvjwLss48AU+eLA487iwHms4sD7kOLAMnziwEpr4sCMXeLAYVLiwFBJ4sD0QeLA+jviwCI34sA0M+LA8R/iwHa94MCr5t/AezXfwG+o3sC/M97AoNjdwHCQ3cCWVd3AnCXdwHH+3MCA3tzAe8TcwE6v3MAVntzAFZDcwLaE3MB5e9zA+XPcwONt3MDyaNzA30bdwMjN28A7ytrAKvrZwOhQ2cCczNjA4l/YwFYG2MDMvNfAjYDXwEdP18ALJ9fAOwbXwDDt1sBj2dbASsnWwDS81sCTsdbA8ajWwO+h1sA/nNbAoMLYwEAP18Cw2tXAF+DUwHUc1MDNedPA1fLSwEaD0sA0LtLAR+nRwNWw0cCwgtHABV3RwLg+0cBgJtHAkBLRwHQC0cBd9dDAuurQwBfi0MAU29DAypnUwJKJ0sCwGdHAS/LPwK4Ez8ALPc7Am53NwMIezcBotszAYGLMwGcdzMDr5MvAvrbLwA6Ry8BTcsvATVnLwPBEy8BgNMvA6ybLwPsby8AaE8vA7NDQwIlFzsBEkMzAfDDLwIkQysAoI8nA9mbIwNbMx8DkTcfAD+XGwMSOxsDtR8bA5g3GwHXexcC6t8XAJ5jFwG5+xcCAacXAe1jFwKVKxcBoP8XApmrNwKdVysAqR8jACaPGwAdJxcC+MMTAlU3DwCyRwsAX9MHA03HBwDgGwcCfrcDA32TAwEYpwMCK+L/AwNC/wE6wv8Dhlb/AX4C/wOFuv8CpYL/AGmfKwLzpxsD6R8TAlFLCwAm3wMAqaL/ARla+wGlwvcA3r7zAHg68wHqIu8ANGrvAHL+6wGt0usA4N7rAKwW6wE3cucD5urnA05+5wLqJucDBd7nAyMPHwB3uw8CcnsDAUki+wHVjvMAi0rrA5Yi5wNFxuMBbhrfAUcC2wCYbtsAVkrXAyyC1wHjDtMDOdrTA+ze0wJcEtMCg2rPAZrizwIScs8DShbPA7XvFwGpSwcDCdb3Aqpa6wMhWuMCtd7bAMu60wGCes8DQgLLAsY+xwMHEsMB3G7DA7o6vwLwar8D/uq7AVWyuwNorrsAb963AB8ytwOOorcBCjK3A9ojDwLURv8Cl4brAWUG3wDyYtMBYYbLASI+wwA3/rsCvp63AiYOswLqMq8DevKrAaQ+qwF5/qcA8CKnADKaowFtVqMA0E6jAFd2nwN+wp8DPjKfA4ObBwFIlvcAKqLjAeXG0wJQ0scCFnK7AsnSswO6cqsAjBKnALaWnwGJ6psDZfaXACqmkwGL3o8DKY6PAsOmiwAeFosBKMqLAcu6hwO22ocCTiaHAk7m/wGeJu8CBwrbA7T6ywLw5rsCkMqvAhKaowIaApsA3n6TA1/2iwEOXocDKZaDAcmOfwLaJnsDR053ApzydwI6/nMBmWJzAlgOcwAi+m8AchZvAO8S7wOQ+ucBfLLXAL2CwwFzWq8AxJ6jARy6lwEyxosBogaDAkpaewJvsnMBlfpvAOUaawAw+mcBXX5jAM6WXwG8Kl8BSipbApSCWwL/JlcB4gpXAPn4Wwb9wFsHaZRbBD10WwfdVFsFAUBbBpEsWwe5HFsHwRBbBiEIWwZhAFsEIPxbBxj0WwcM8FsHyOxbBSzsWwcM6FsFXOhbB/zkWwbk5FsGAORbBKCsTwSQaE8FjDBPBSAETwVL4EsEY8RLBROsSwZLmEsHJ4hLBvd8SwUjdEsFO2xLBt9kSwW/YEsFn1xLBktYSwefVEsFd1RLB7tQSwZXUEsFN1BLBydwPwVrHD8EDtg/BAKgPwa6cD8GMkw/BLowPwT6GD8F1gQ/BmX0PwX56D8H9dw/B+XUPwVp0D8EMcw/B/nEPwSZxD8F3cA/B628PwXpvD8Efbw/BVZQMwWB5DMGKYwzB31EMwZdDDMEOOAzBvy4MwT0nDMEvIQzBThwMwWAYDME1FQzBqBIMwZoQDMHzDgzBng0MwYwMDMGvCwzB/QoMwW4KDMH7CQzBRFMJwW4xCcH4FQnBuP8IwbftCMEq3wjBadMIwezJCMFFwgjBGbwIwSC3CMEeswjB5K8IwUutCMEzqwjBg6kIwSioCMEQpwjBL6YIwXmlCMHnpAjBYxsGwQHxBcGKzgXBkbIFweabBcGOiQXBuXoFwb9uBcEUZQXBR10Fwf1WBcHsUQXB1k0FwYxKBcHlRwXBw0UFwQtEBcGpQgXBjEEFwaZABcHtPwXB3e4Cwe+5AsHHjgLBrGsCwS1PAsEVOALBZCUCwUcWAsESCgLBNwACwUX4AcHc8QHBsewBwYfoAcEt5QHBeeIBwUzgAcGM3gHBI90BwQDcAcEW2wHBl6D/wNUc/8APsf7AKln+wKgR/sCZ1/3Aiqj9wHOC/cCnY/3Axkr9wLA2/cB8Jv3AbBn9wOMO/cBnBv3Akf/8wA/6/MCf9fzADfL8wC3v/MDd7PzAdoX5wCzi+MATXPjAW+73wNqU98AGTPfA4hD3wPHg9sAiuvbAwJr2wGWB9sDtbPbAalz2wBlP9sBdRPbAtjv2wL409sAhL/bAnCr2wPgm9sAKJPbAY5PzwA/K8sDvI/LAd5vxwMQr8cCh0PDAdIbwwDdK8MBfGfDA1PHvwNnR78ADuO/AJ6PvwFOS78DAhO/Az3nvwP5w78Dkae/AK2TvwI9f78DaW+/AUtLtwJ7b7MDjDuzA42XrwAHb6sBNaerAjR/qwIHl6cDxuenAX5zpwHiE6cAqcenAlWHpwARV6cDiSunAuELpwCM86cDWNunAkTLpwCEv6cBdLOnAo0rowN4e58AjJObAfHDlwEb85MAFpuTAuV/kwJAm5MAt+OPAA9PjwES248AJn+PARozjwCJ948DscOPAE2fjwCRf48C/WOPAmVPjwHNP48AcTOPA9gTjwCWc4cAZoODAvf/fwKB738DBEt/A0r7ewG563sDXQt7AuxXewNDz3cDh2N3AHcPdwIux3cBjo93A+JfdwMSO3cBZh93AX4HdwI983cCueN3ASgvewNZw3MCCdtvAcrHawC0V2sB+lNnAyzLZwCbk2MCFpNjA03DYwOdG2MDzJNjAfQnYwEzz18Bh4dfA7NLXwETH18DfvdfATLbXwDKw18BIq9fAZWbZwA2U18AActbA6ofVwP/K1MBDONTAMMDTwNJd08CDDdPAHszSwPqW0sDSbNLACE3SwFQz0sCQHtLAzA3SwEUA0sBd9dHAkuzRwHzl0cDH39HA7B3VwAT70sCnndHASoLQwN2mz8Cw8c7A0lvOwLzhzcBghc3AAzrNwK38zMDbyszAZqPMwJCDzMDSaczABVXMwDtEzMCvNszAwivMwPQizMDbG8zAhjfRwNOkzsBHAc3AVK/LwGikysCBxcnAFhPJwAiGyMA2E8jAtLbHwDhrx8DJLcfA4/vGwG/TxsCvssbAMpjGwMyCxsCFccbAlGPGwFZYxsBHT8bAtbbNwEysysAopMjAAhDHwELMxcAzvsTAw+vDwGY/w8AcssLA/j3CwOzewcBUkcHAK1LBwNwewcBB9cDAkdPAwFK4wMBOosDAiJDAwDGCwMCgdsDAXpzKwMwzx8Clk8TA46zCwN0nwcAg5r/AruW+wOISvsA8Y73AKNK8wOJavMA0+bvAdqm7wIhou8DJM7vAAQm7wF3musBYyrrAs7O6wGuhusCrkrrAcebHwLchxMAf1sDADpO+wMvAvMDOPrvAkgi6wPoFucC/LbjAgHm3wJLktsAXarbAwQW2wNOztcAacbXA4jq1wOgOtcBL67TAfM60wDS3tMBnpLTARZDFwMFzwcC4p73Ajs66wGaguMDi0bbAW1y1wAcitMAYGbPAWzuywHaCscCg6bDA5GuwwNsEsMC0sK/AKGyvwHI0r8BCB6/Ap+KuwArFrsAcra7AFJPDwBMlv8CyAbvAm2i3wPrOtMC8qLLAz+qwwHdwr8CuLq7AVR+twAw8rMByfqvAqeGqwKFgqsDc9qnAc6CpwA5aqcDVIKnAaPKowM3MqMBfrqjAgOrBwM8uvcB1urjAQ5C0wEBcscAu1a7ASL2swBP7qsAweKnA5y6owAwZp8A0MKbA222lwBPNpMC1SKTALNyjwHuDo8A2O6PAdQCjwMjQosAoqqLAz7q/wKSMu8Bcy7bAbFCywLJSrsCsWavAwN2owDbLpsBl/6TA8HOjwBwjosC1BqHAPhigwCNRn8BTrJ7AlySewEO1ncBEWp3AGRCdwMvTnMDaopzAO8S7wBJAucA+L7XAbmiwwPXmq8CPQKjAnFalwELposCkzaDANviewCpkncDGC5zAzOiawKn0mcDJKJnA6n+YwMj0l8CjgpfATyWXwDvZlsBcm5bA8VUXwdpKF8H4QRfB2zoXwSo1F8GcMBfB+CwXwQ8qF8G7JxfB3yUXwWMkF8EzIxfBQCIXwX4hF8HjIBfBZyAXwQQgF8G1HxfBdh8XwUMfF8EbHxfBvv8TwaLxE8FS5hPBQ90TwQLWE8E00BPBj8sTwdjHE8HgxBPBgcITwZvAE8EXvxPB4b0Twem8E8EjvBPBhbsTwQe7E8GiuhPBUboTwRG6E8HduRPBnK0Qwa6bEMFLjRDBwoEQwYR4EMEecRDBM2sQwXZmEMGsYhDBpV8QwTldEMFKWxDBvlkQwYJYEMGFVxDBu1YQwRpWEMGZVRDBMlUQweBUEMGeVBDBo2ANweFJDcGZNw3B7SgNwSodDcG9Ew3BMgwNwSgGDcFTAQ3Bdv0MwV/6DMHn9wzB7vUMwVr0DMEY8wzBFvIMwUjxDMGj8AzBIPAMwbfvDMFj7wzBLBoKwVf9CcEk5gnBgNMJwYvECcGMuAnB8K4JwT6nCcEVoQnBKJwJwTeYCcEQlQnBi5IJwYiQCcHsjgnBo40JwZyMCcHKiwnBIosJwZyKCcExignB5tsGwXK3BsEOmgbBZ4IGwWZvBsElYAbB6VMGwRxKBsFDQgbB+zsGwfU2BsHwMgbBuS8GwSctBsEaKwbBdikGwSYoBsEaJwbBQyYGwZglBsEPJQbB26cDweN5A8G8VAPBxzYDwaseA8FKCwPBvPsCwUPvAsFE5QLBQ90CwdvWAsG70QLBos0CwVvKAsG8xwLBpMUCwffDAsGhwgLBj8ECwbXAAsEGwALBiIAAwcFGAMHqFwDBHOT/wAqn/8Dhdf/AXk7/wKYu/8A1Ff/A0wD/wH/w/sBu4/7A+tj+wJ3Q/sDtyf7AlcT+wE/A/sDlvP7AKrr+wPy3/sA+tv7AydH6wB9B+sBqy/nA+Wv5wM8e+cCQ4PjAc674wCqG+MDSZfjA4Uv4wBc3+MBxJvjAHRn4wHQO+MDsBfjAGv/3wKb598BL9ffAz/H3wAbv98DN7PfA2Mj0wKMU9MBXgfPAcwnzwDeo8sCUWfLAIhrywAzn8cD6vfHAAJ3xwIyC8cBZbfHAXlzxwMdO8cDmQ/HAMzvxwD808cCvLvHAPSrxwK8m8cDZI/HAPu7uwBsP7sC0V+3Au8HswKBH7MCP5OvAbZTrwMNT68CwH+vA0PXqwDDU6sA3uerAmKPqwEiS6sBrhOrAU3nqwHRw6sBcaerAsGPqwClf6sBpXOrAzkrpwJ046MCkVefA/prmwE0C5sBtmOXAj0rlwOsW5cCM7+TA6M/kwIO25MAmouTA1pHkwMWE5MBReuTA83HkwEJr5MDpZeTAomHkwDde5MB8W+TAO+fjwPWZ4sBRg+HAvcLgwOBK4MCE69/APp7fwMtf38BzL9/AIgnfwFnq3sCk0d7A1b3ewPat3sBBod7AFpfewPOO3sBxiN7APYPewBR/3sDBe97AWc7ewAw83cAMG9zAW2fbwL7T2sD5YNrAEwTawNK42cD6fNnASFDZwFQs2cB/D9nAXfjYwOXl2MAn19jAWcvYwOjB2MBZutjAT7TYwHqv2MCeq9jA0wnawMkt2MBqCNfA3irWwIF71cAy7dTAqoHUwOAq1MDF5NPAKqzTwI9+08DfWdPAaTzTwMck08DUEdPApgLTwH/20sDG7NLA/uTSwMbe0sDM2dLAWKLVwJR508D/IdLAbhfRwHhC0MCXnc/ADxfPwGGpzsBSUM7ANQjOwN3QzcAaps3AuYPNwB1ozcD3Uc3ANkDNwP4xzcCcJs3AgR3NwDgWzcBkEM3AuZ7RwIISz8AOcs3ABS/MwKwyy8CmZsrA/73JwBY4ycD30MjAR33IwK45yMB1BMjAl9nHwB+3x8Bym8fAPoXHwHJzx8AxZcfAyFnHwKdQx8BZScfAagPOwDsRy8DkAsnA13vHwG9LxsAXT8XAkIXEwIrmw8BsZsPAC//CwCWrwsBDZ8LAeTDCwFgEwsDb4MHAWsTBwH2twcApm8HAe4zBwLqAwcBTd8HAL9LKwIF+x8BZ3sTAGQjDwPOVwcDFYMDAV3G/wKauvsA4D77AvIy9wGsivcAczLzAQ4a8wOBNvMB0ILzA6/u7wJPeu8AJx7vAKbS7wAulu8DxmLvAfAnIwNlVxMBlD8HA5N2+wGscvcCwqLvAWoS6wA2VucCyzrjA6Cq4wMukt8B7N7fAuN62wN6WtsDaXLbAHC62wIMItsBP6rXAE9K1wKa+tcAWr7XA1aTFwHeVwcAz2r3ABAa7wA3puMBSKrfA3se1wAKitMCJrLPA3+CywKY4ssDZrrHAfj6xwDzjsMBYmbDArF2wwJYtsMDnBrDA0+evwOPOr8Dluq/AS53DwKU4v8AZIrvAwI+3wGYFtcBt8rLArUSxwGzfr8A7sq7AhbatwH3lrMDFOKzAPKurwMo3q8D/2arACY6qwK5QqsA7H6rAcfepwHrXqcDSvanAJ+7BwGM4vcASzbjAY6+0wNaDscB8Da/A8QStwLpXq8D66anAZbWowFazp8Du3KbArCumwFqapcDII6XAa8OkwFt1pMBLNqTAdQOkwI3ao8CvuaPADLy/wOePu8BM1LbAGWKywK9rrsCVgKvAlRSpwBsVp8A9XqXA8+ejwO6rosB5o6HApMegwM4RoMCqfJ/A7gKfwPifnsDJT57A/w6ewMLancC3sJ3AO8S7wEBBucAjMrXAwHCwwLr3q8D2WajA5n6lwN8go8AzGaHAqVifwNDZncBSlpzAboebwBqmmsCy65nAslKZwMbVmMAwcJjA2x2YwFHbl8CppZfAsCEYwZMYGMFWERjBlgsYwQUHGMFlAxjBhQAYwTz+F8Ft/BfB/foXwdr5F8Hz+BfBO/gXwar3F8E39xfB2/YXwZP2F8FZ9hfBLPYXwQj2F8Hr9RfB58gUwTa9FMHqsxTBhqwUwaimFMH/oRTBTJ4UwVybFMEImRTBL5cUwbiVFMGOlBTBopMUweeSFMFSkhTB3ZEUwX+RFME1kRTB+5AUwcyQFMGnkBTBnnMRwaBkEcGyWBHBNU8RwatHEcGtQRHB7DwRwSU5EcEmNhHBxTMRweMxEcFkMBHBNC8RwUMuEcGELRHB7CwRwXQsEcEVLBHByisRwY4rEcFeKxHB0CIOwZ4PDsFTAA7BJvQNwXjqDcHG4g3BqNwNwc7XDcHz0w3B5NANwXfODcGKzA3BA8sNwc3JDcHXyA3BFMgNwXrHDcH/xg3BnsYNwVHGDcEUxg3BvNcKwTG/CsGbqwrBAJwKwZSPCsGzhQrB2H0KwZt3CsGmcgrBt24KwZhrCsEeaQrBJ2cKwZhlCsFcZArBYWMKwZpiCsH8YQrBf2EKwRthCsHNYArB7JMHwZp0B8GRWwfBlkcHwao3B8H9KgfB5yAHweMYB8GFEgfBdw0HwXMJB8FDBgfBvAMHwbsBB8EjAAfB4P4GweD9BsEV/QbBdPwGwfT7BsGP+wbBTVkEwW0xBMF8EQTB8vcDwZDjA8FR0wPBYcYDwRe8A8HpswPBaa0DwUCoA8EnpAPB56ADwVKeA8FGnAPBp5oDwV2ZA8FXmAPBiJcDweSWA8FhlgPBOyoBwZ/3AMH2zgDBYq4AwVWUAMGJfwDB9m4AwcNhAMFDVwDB6k4AwUhIAMEEQwDB1T4AwYQ7AMHiOADByzYAwSI1AMHSMwDBxzIAwfMxAMFMMQDBJBP8wCqT+8D7K/vAEdn6wJ2W+sB3YfrACjf6wDcV+sBH+vnA2eT5wNDT+cBGxvnAhrv5wP2y+cA3rPnA1qb5wJKi+cAwn/nAgZz5wGGa+cCxmPnAd/X1wGtU9cAC0vTA1Gj0wEkU9MCD0PPATprzwAVv88CDTPPABzHzwCkb88DGCfPA9fvywPzw8sBG6PLAXOHywN/b8sCF1/LAEdTywFTR8sAoz/LAawPwwO4578Dkle7AARHuwMul7cCYT+3AegrtwC/T7MAHp+zA0oPswMdn7MB2UezAuD/swJ8x7MBsJuzAiB3swHoW7MDgEOzAbgzswOgI7MAcBuzAFEbqwMZL6cCmfujAkdfnwClQ58Di4ubA/4rmwINE5sAdDObAEt/lwNjB5cAIrOXAr5rlwOaM5cDygeXAQHnlwFhy5cDdbOXAhWjlwBJl5cBVYuXAasbkwBiT48BylOLAocPhwH4l4cBxuuDARnbgwFlA4MA8FeDA0/LfwGXX38COwd/AL7DfwF+i38Bml9/AsI7fwMWH38BHgt/A7H3fwHd638C5d9/AwI/fwN0Y3sBt4NzAOhXcwACR28D+JdvAu8/awN2N2sBTWdrAUy/awM8N2sAZ89nA1d3ZwOrM2cB4v9nAybTZwE2s2cCRpdnAOaDZwPub2cCemNnAqqzawJHo2MDJmNfAPc3WwJMn1sCPptXAMT7VwOrr1MBArtTA8HzUwK9V1MB/NtTAph3UwN8J1MAk+tPAo+3TwLXj08DS29PAkNXTwJjQ08CnzNPA4ybWwK8M1MBPo9LAvKbRwN/f0MCDQdDAMMjPwMBmz8BOGM/AVtnOwO6mzsCnfs7AhV7OwOtEzsCJMM7AVCDOwHITzsA1Cc7AFQHOwKH6zcCC9c3AaAbSwNeOz8AN4s3Ajq/MwPa7y8C8AMvA7mfKwN7rycCZh8nACTvJwOj/yMCW0MjAyarIwKOMyMCfdMjAgmHIwE9SyMA7RsjArTzIwEM1yMBhL8jAtVDOwKt2y8AJYMnAYevHwGfGxsBS3cXAoR3FwGyIxMCZE8TAR7XDwFBrw8D7L8PAgADDwJLawsBSvMLAOaTCwAyRwsDLgcLArXXCwAxswsBnZMLAhAjLwM3Jx8D6J8XAH2XDwCEBwsCN4MDAXvm/wEtEv8A+s77ABT6+wFrfvcAsk73ADVa9wCElvcAL/rzA3d68wAfGvMBCsrzAiaK8wAuWvMAejLzA5SzIwH6KxMBNT8HAtie/wDN2vcDdFLzAKv66wPkeusA+abnAldS4wPRbuMCB+rfAEKy3wB1tt8C3OrfAcxK3wFPytsC62LbAW8S2wCe0tsBGp7bAm7nFwIe3wcAuDb7AhT67wKcwucBFhbfABTG2wDgetcANO7TAOYCzwFrnssBBa7LA+AaywDm2scBodbHAgkGxwAkYscDy9rDAlNywwJfHsMDltrDAmqfDwGxMv8DYQrvAvra3wFc7tcDFPLPA6pyxwNBLsMA6Mq/AAEmuwAGJrcDb66zAPGyswBEFrMD6savARG+rwNc5q8AjD6vAEe2qwOnRqsBLvKrA1fHBwA5CvcDf37jA2M60wEyrscBjRa/A0kytwMqyq8BkWarAizipwChJqMD4g6fAfeKmwExfpsA09aXAvZ+lwBpbpcAfJKXALfikwBrVpMAmuaTASb2/wDGTu8BS3bbA9HOywK2ErsBhp6vA9kqpwCFep8Clu6XAxFmkwJoxo8D8O6LAknGhwLfLoMDpRKDA29efwPt/n8BlOZ/A2ACfwKHTnsCLr57AO8S7wG9CucANNbXAJnmwwKoIrMBlc6jAG6elwBdYo8ACZKHA07efwG9NnsDpHZ3ABSKcwE1Sm8ARqJrAnR2awJKtmcBCU5nAswqZwI7QmMAQopjAQeIYwcbaGMHh1BjBO9AYwZHMGMGuyRjBaccYwZ/FGME2xBjBG8MYwTvCGMGMwRjBAcEYwZTAGME/wBjB+78Ywca/GMGcvxjBe78YwWK/GMFNvxjBVYcVwaZ9FcEDdhXB/W8VwT1rFcGAZxXBjmQVwTxiFcFoYBXB+F4VwdZdFcHyXBXBPlwVwbFbFcFBWxXB6loVwaVaFcFvWhXBRFoVwSNaFcEIWhXBaS8SweMiEsH/GBLBMhESwQwLEsEyBhLBYAISwV7/EcH//BHBIfsRwan5EcGB+BHBmPcRweH2EcFQ9hHB3/URwYX1EcE/9RHBCPURwdz0EcG69BHBX9sOwTHLDsFnvg7BTrQOwVesDsEPpg7BG6EOwTSdDsEhmg7BtpcOwc6VDsFNlA7BH5MOwTGSDsF2kQ7B4pAOwW6QDsETkA7By48OwZKPDsFmjw7BWIwLwXh3C8HzZgvB5FkLwZVPC8FyRwvBCEELwfk7C8H9NwvB2TQLwWEyC8FuMAvB5i4LwbEtC8G+LAvB/isLwWgrC8HxKgvBlCoLwUsqC8ERKgvBwUMIwd4oCMGPEwjBsQIIwVz1B8HV6gfBhuIHwfnbB8HP1gfBvdIHwYjPB8ECzQfBBcsHwXTJB8E4yAfBQMcHwX3GB8HjxQfBasUHwQrFB8G/xAfBZAMFwdfgBMFmxQTBpa8EwW2eBMHQkATBEIYEwZR9BMHjdgTBnXEEwXVtBMEuagTBmmcEwZJlBMH5YwTBt2IEwblhBMHyYATBVGAEwdlfBMF3XwTBe80BwTWhAcHzfQHB8GEBwbtLAcEnOgHBQSwBwUchAcGdGAHByBEBwWUMAcEmCAHBzgQBwSsCAcEZAAHBdv4AwS39AMEq/ADBXvsAwb76AMFA+gDBhkn9wHbY/MAffvzAKjb8wP38+8Cnz/vAwqv7wGGP+8D2ePvARGf7wE9Z+8BPTvvAo0X7wM4++8BtOfvAMDX7wNox+8A6L/vAKS37wIgr+8BBKvvAHBn3wGSJ9sAVFvbA7Ln1wH9w9cAlNvXA3Qf1wDnj9MA+xvTAWq/0wEmd9MAIj/TAzIP0wPF69MD3c/TAeG70wCRq9MC8ZvTADmT0wPFh9MBIYPTAmhHxwPFb8MBuye/A1lPvwNP17sDnqu7AWW/uwBtA7sCzGu7AHf3twL3l7cBK0+3AvMTtwEK57cA3sO3AF6ntwHqj7cAPn+3AlJvtwNeY7cCvlu3AJDzrwBpY6sACn+nAqAnpwL2R6MDVMejAYuXnwJuo58BjeOfAMlLnwP0z58AfHOfASAnnwGv65sCz7ubAd+XmwDDe5sB12ObA8dPmwGTQ5sCXzebAMaLlwBuH5MDmnuPAUOLiwBNK4sDKz+HA9W3hwAUr4cB5++DAy9XgwPm34MBopeDABJfgwKuL4MC4guDAq3vgwB524MC+ceDATG7gwJZr4MBzaeDANE/gwGny3sBx0t3AAebcwDRJ3MCj5NvA1ZjbwHRc28B7LNvAcAbbwFLo2sCC0NrAab7awGSw2sBUpdrAnZzawL6V2sBVkNrAEYzawLaI2sAShtrAr07bwKql2cASQ9jAQ2nXwCTS1sBSWNbAmfrVwKSw1cDAddXA+EbVwOEh1cCFBNXA5+7UwDfe1MAM0dTAqsbUwHu+1MAIuNTA87LUwPOu1MDMq9TAYavWwEys1MBSINPANTbSwIV60cDj5tDAkHDQwFgZ0MDr08/AAZ3PwGhxz8DbTs/AgzPPwOcdz8DWDM/AX//OwMD0zsBh7M7AyeXOwJfgzsB/3M7Ad27SwPcQ0MDjTs7AtSvNwOtGzMArlMvAiAnLwEyaysAuQcrAEPrJwHXBycCBlMnA4HDJwE9WycAJQsnABzLJwGYlycBwG8nAlxPJwGgNycCICMnAiJ7OwIHcy8Apu8nA41fIwNo9x8ASZsbAw7bFwH4oxcB7ucTAomXEwL8ixMCJ7cPATcPDwGGiw8CciMPAP3TDwCtkw8B8V8PAe03DwJlFw8BjP8PAVz/LwKEVyMBvcMXAN8DDwIBpwsBHXMHAR3/AwHXWv8BBUL/ANea+wACSvsDTTr7AYhm+wPfuvcBczb3AxbK9wMGdvcAqjb3AEoC9wMB1vcCdbb3Aq1DIwJ6/xMAPj8HAbXC/wB7OvcBGgbzAwnS7wLOjusBl/bnAn3a5wDwKucBys7jAMW64wBY3uMBXC7jArei3wD/Nt8CRt7fAc6a3wPGYt8BLjrfAmM7FwPHZwcCiQL7ADXe7wHl3ucCf4LfASZm2wJWWtcCYxLTAaBm0wKWOs8ABH7PAlMWywDR+ssBmRbLATBiywI30scBE2LHA6MGxwECwscBRorHAAbLDwGZgv8DtY7vAjt23wFVztcAhhrPAFPWxwIu1sMCTrq/AudauwJQmrsDCl63AzyStwLTIrMArf6zAokSswCUWrMBM8avAI9SrwBW9q8DhqqvAi/XBwNBLvcDd8rjAn+60wJ3SscDTfK/A4JOtwC0MrMBTxqrAP7ipwG/aqMBKJajAWpKnwAscp8A2vabAe3GmwC81psBKBabAUt+lwEXBpcCDqaXAhr6/wIGWu8Bs5rbA/oWywKqdrsAozqvA14CpwDimp8CIF6bAScmkwAi0o8Ar0KLA/xWiwOR+ocAtBaHAlaOgwKBVoMCKF6DAOOafwB2/n8ApoJ/AO8S7wJ1DucD9N7XAnoGwwMYZrMDWjKjAN8+lwN6Oo8AArqHAnBWgwO2+nsByop3AfLicwDf5m8DsXZvAw+CawGB8msApLJrAReyZwIC5mcA+kZnAZZgZwUGSGcFzjRnBsokZwcKGGcF2hBnBq4IZwUSBGcEsgBnBUX8ZwaZ+GcEgfhnBt30ZwWZ9GcEmfRnB9HwZwc58GcGvfBnBl3wZwYV8GcF3fBnBtDsWwbAzFsFqLRbBgSgWwaskFsGqIRbBUh8WwXwdFsENHBbB7xoWwQ8aFsFgGRbB1xgWwWwYFsEZGBbB2BcWwaUXFsF9FxbBXhcWwUYXFsEzFxbBk+ESwR7XEsHtzhLBhMgSwYDDEsGTvxLBgrwSwRy6EsE8uBLBxbYSwaC1EsG8tBLBCbQSwX2zEsEQsxLBu7ISwXiyEsFEshLBHLISwfyxEsHjsRLBzooPwS19D8F9cg/BH2oPwZFjD8FxXg/BbloPwUxXD8HYVA/B7lIPwW9RD8FDUA/BWU8PwaNOD8EUTg/BpE0PwU1ND8EJTQ/B1EwPwatMD8GKTA/BajgMwawmDMG/GAzB1A0MwUYFDMGU/gvBV/kLwT71C8EJ8gvBiO8LwZPtC8EL7AvB2eoLwerpC8Ev6QvBnegLwSvoC8HS5wvBjecLwVfnC8Es5wvBtesIwaXUCMGFwgjBS7QIwSOpCMFloAjBjpkIwTOUCMEDkAjBvIwIwS2KCMEtiAjBnYYIwWSFCMFwhAjBsYMIwRuDCMGnggjBTIIIwQWCCMHNgQjBV6YFwW6IBcHgcAXBXF4FwdNPBcFsRAXBfjsFwYA0BcEHLwXBwCoFwWcnBcHJJAXBvSIFwSQhBcHlHwXB6x4FwSgeBcGPHQXBGB0FwbscBcFzHAXBaGoCwbdDAsErJQLBHA0CwTH6AcFX6wHBst8BwZLWAcFszwHB1ckBwXXFAcEJwgHBXb8BwUa9AcGkuwHBXboBwV65AcGWuAHB+7cBwYG3AcEitwHBBXX+wEAR/sA9wv3A2oP9wLRS/cAOLP3Atg39wOn1/MBC4/zAqNT8wDrJ/MBJwPzATLn8wNSz/MCPr/zAOKz8wJyp/MCTp/zA+6X8wL2k/MDEo/zAtjP4wJ+z98DKTffAH/32wGq99sA3i/bAvGP2wLxE9sBqLPbAXBn2wG8K9sDC/vXAn/X1wHru9cDk6PXAhuT1wBzh9cBy3vXAXdz1wLza9cB32fXAnhjywBB18cBh8vDAcorwwBc48MAI9+/Aw8PvwG+b78DDe+/A6mLvwHFP78AxQO/AQjTvwOwq78CfI+/A6R3vwHMZ78D2Fe/APRPvwBwR78ByD+/A3izswGpd68CgturATTHqwDrH6cAnc+nAuDDpwFr86MAo0+jAzbLowGqZ6MCEhejA73XowL1p6MAyYOjAvFjowOdS6MBXTujAx0rowP5H6MDRRejATXrmwOp15cB9ouTAavjjwGZw48AkBOPAUK7iwHpq4sD+NOLA6griwNvp4cDrz+HAl7vhwKur4cA0n+HAdJXhwNSN4cDdh+HANIPhwJB/4cC3fOHAcwzhwGnI38BQv97A2ufdwG863cAftdzAzl/cwF4g3MD29tvAZ9bbwNa828DIqNvAEpnbwMSM28Aig9vAmnvbwLZ128AbcdvAgW3bwLFq28B/aNvAqu/bwKhg2sDzFtnAqRTYwEJ118BDCNfAl7HWwO1s1sBYN9bA8A7WwCvv1cA51tXAqcLVwFWz1cBUp9XA753VwJaW1cDYkNXAWozVwNeI1cAZhtXAqC/XwPNK1cDotdPAyMDSwF8S0sCGiNHABh7RwF/J0MBUhtDAuVTQwLUu0MDXENDAbPnPwA/nz8C62M/AjM3PwM3Ez8D2vc/AnLjPwG60z8Apsc/AzNbSwO2S0MAVwM7AEqnNwJDQzMDvJczAcqPLwEg/y8Av8MrAlbHKwC6AysBGWcrAsTrKwLIiysDhD8rAIgHKwJf1ycCP7MnAfuXJwPjfycCm28nA0+zOwKNCzMAtFcrATcLIwF+3x8Bz6cbALknGwG7IxcC8YcXAKBDFwPHQxMB/osTA8X3EwDZhxMCqSsTA/TjEwCQrxMBNIMTA0hfEwDARxMAADMTAoXbLwO5hyMAnwcXARBnEwE7PwsDh08HA9wfBwBFjwMCj6L/A2oe/wAY7v8CC/77A0tC+wBGsvsAwj77Ahni+wMFmvsDVWL7A8E2+wGlFvsC+Pr7AynTIwDP1xMDM18HAJ7m/wH0kvsDO6rzAWem7wFsmu8Ayi7rAIxG6wNmvucCfYrnAiCW5wFX1uMBiz7jAkLG4wCeauMDNh7jAbHm4wCtuuMBcZbjAyuPFwLH8wcCKdL7AD6+7wDm9ucAfOrjArP62wAgLtsAiSbXAcqy0wJ4utMBJyrPAn3qzwJU7s8DWCbPAq+KywOHDssC2q7LAw5iywOqJssBKfrLAgbzDwJJ0v8BWhbvAUQe4wKertcByzrPAYEuywIgcscA2J7DAp1+vwDm+rsCPPK7AINWtwPmCrcDyQa3AoA6twDTmrMBuxqzAfK2swO2ZrMCZiqzAR/nBwKlVvcALBrnAtw61wL75scC+s6/A2NmtwM1jrMCzMKvAbzSqwCBnqcDlwKjAVDuowL7Qp8AOfKfAAjmnwBQEp8Bj2qbAm7mmwN+fpsCwi6bAxL+/wNeZu8Cb77bANJiywKO2rsDC9KvAl7apwE3tp8DQcabAbDalwCMzpMD5X6PA67SiwGUrosCbvaHAWWahwD8hocCv6qDAs7+gwOadoMBcg6DAO8S7wMtEucDzOrXAKoqwwAwrrMBIpqjAMfelwCnFo8Ad96HA8XGgwDQun8DYI57Aw0qdwNSanMBQDZzASJybwGtCm8A8+5rABMOawLmWmsDic5rAzUQawcQ/GsHbOxrB0jgawXc2GsGjNBrBOTMawR8yGsFFMRrBnDAawRkwGsG0LxrBZS8awSgvGsH4LhrB1C4awbcuGsGhLhrBkC4awYMuGsF4LhrBp+YWwQXgFsHf2hbB39YWwcTTFsFc0RbBfs8WwQvOFsHrzBbBDMwWwV/LFsHZyhbBccoWwSDKFsHiyRbBsckWwYzJFsFvyRbBWMkWwUfJFsE5yRbBsIoTwfaBE8EtexPB6HUTwdFxE8GlbhPBLmwTwUVqE8HKaBPBpGcTwcBmE8EPZhPBhmUTwRtlE8HJZBPBiWQTwVdkE8ExZBPBE2QTwfxjE8HqYxPBnTEQwSQmEME3HRDBRxYQweQQEMG1DBDBdgkQwfEGEMH9BBDBeQMQwUwCEMFjARDBrgAQwSIAEMG1/w/BYf8PwR//D8Ht/g/Bxf4Pwaf+D8GP/g/BXNwMwUnNDMGOwQzBbbgMwVaxDMHTqwzBjKcMwTqkDMGnoQzBp58MwRqeDMHnnAzB+JsMwT+bDMGwmgzBQJoMweqZDMGnmQzBc5kMwUuZDMEsmQzBHIwJwVh4CcHvaAnB8FwJwZtTCcFbTAnBuEYJwVhCCcHzPgnBUTwJwUY6CcGwOAnBdTcJwYE2CcHENQnBMTUJwb80CcFnNAnBIzQJwe4zCcHFMwnBZUIGwYUoBsFRFAbBkQQGwU34BcHC7gXBWOcFwZXhBcEc3QXBo9kFwfHWBcHa1AXBO9MFwfnRBcH/0AXBPtAFwajPBcEzzwXB2c4FwZPOBcFdzgXBKgEDwWLfAsHxxALBSrACwS+gAsGlkwLB5IkCwU6CAsFqfALB13cCwUp0AsGJcQLBZW8Cwb1tAsF0bALBdGsCwa5qAsEVagLBnmkCwUJpAsH6aALBxpX/wNM9/8DJ+P7AvsL+wIaY/sCZd/7A9V3+wAJK/sCAOv7Acy7+wBgl/sDVHf7AMhj+wNMT/sBvEP7AzQ3+wMML/sAuCv7A9Aj+wAEI/sBEB/7ARUX5wD/T+MBoefjA3zL4wKP798B80PfA1K73wJ2U98A3gPfAW3D3wAlk98B4WvfAClP3wEdN98DOSPfAVkX3wKZC98CQQPfA8T73wLA998C3PPfAWhjzwEiF8sDbEPLAF7XxwAVt8cCUNPHAeAjxwBDm8MBDy/DAaLbwwDGm8MCXmfDAz4/wwDaI8MBRgvDAv33wwDN68MByd/DAUHXwwKlz8MBgcvDAEBjtwJdb7MB9xevAnE7rwOLw6sBAp+rAkW3qwHxA6sBRHerA6gHqwJfs6cAC3OnAIM/pwB/F6cBbvenAVLfpwKay6cAGr+nANqzpwAeq6cBWqOnAgE7nwFNf5sAVn+XA5gXlwIaM5MDLLOTAkOHjwJ6m48CLeOPAl1TjwJM448DGIuPA0hHjwKUE48Bq+uLAefLiwE/s4sCH5+LA0ePiwPDg4sC13uLAQMfhwKGa4MDspt/A2eLewIVG3sCayt3A02jdwPgb3cC839zAF7bcwAqa3MAzhNzANnPcwAFm3MC/W9zAyFPcwJlN3MDNSNzAFEXcwDFC3MD0P9zAZY/cwFEZ28As59nA3e7YwGMs2MA1sNfAZGHXwBcl18De9dbA99DWwC601sDBndbATozWwL5+1sAzdNbABGzWwKll1sC7YNbA6FzWwPBZ1sCjV9bAjrPXwG/o1cDia9TAQE/TwGGm0sBrJ9LA38LRwGd30cB7PNHAWA7RwE3q0MAwztDASrjQwECn0MACmtDAt4/QwLmH0MCFgdDAtXzQwPl40MAvdtDASj/TwJIU0cARQs/ATyLOwDlWzcDQuMzAnjzMwB/cy8BalcvA513LwMoyy8AnEcvA7fbKwILiysCf0srARcbKwK68ysA7tcrAc6/KwPaqysB7p8rAhjvPwPWozMASf8rAdi3JwA8wyMAqaMfA69TGwIdgxsCEBMbAD7zFwDaDxcC4VsXA+DPFwN4YxcDDA8XAWPPEwJXmxMDg3MTA4dXEwHPQxMA9zMTAWq7LwKauyMCGFcbAvXPEwMc4w8BFR8LAWovBwLP0wMCtfMDAtiLAwHrev8D0qL/AFH+/wGJev8DmRL/ADjG/wPchv8BKFr/AOQ2/wC8Gv8C4AL/AP5nIwDYrxcCOIsLAewLAwGF7vsBbUb3AkmG8wOaju8CEFbvARqS6wAZNusBdCLrAg9K5wGKoucB8h7nA1225wOBZucBYSrnARj65wOU0ucCeLbnAMPnFwMUfwsDdqL7Aeua7wFUFusCykbjAQ2O3wMt9tsCqyLXAZDm1wGjHtMBRbbTAaCa0wMbus8A9w7PAPqGzwLyGs8AZcrPAC2KzwJBVs8DfS7PAGMfDwPCIv8APp7vA8DO4wG/jtcCjFbTAup+ywLaAscAUnLDAxeOvwPtPr8Bf2q7AYn2uwCs0rsC3+q3Av82twKCqrcA9j63A6XmtwFJprcBsXK3ADP3BwJhfvcBoGbnAHi+1wKshssAZ6q/Aqh6uwJm5rMBwmKvADK2qwDPvqcDRVqnAhd2owJR9qMAEMqjAtPanwEXIp8AApKfAuIenwLBxp8CNYKfAA8G/wDSdu8De+LbAl6qywJLPrsAnG6zA+u6pwFMzqMBqyqbAF6GlwNuupMBc66PAW06jwFDRosBfbqLAayCiwDfjocBMs6HA3I2hwKlwocDqWaHAO8S7wPpFucDuPbXAyZKwwHw8rMC3v6jABR+mwO36o8BJP6LAvMygwC+bn8AJop7A0didwCU3ncBPtpzAU1CcwPP/m8DUwJvAZo+bwMZom8ClSpvAI+gawQHkGsHS4BrBX94awXzcGsEI2xrB6dkawQ3ZGsFj2BrB4dcawXzXGsEv1xrB9NYawcbWGsGj1hrBiNYawXPWGsFj1hrBVtYawU3WGsFG1hrByogXwU2DF8ETfxfB0XsXwU95F8FgdxfB43UXwb50F8HdcxfBL3MXwapyF8FDchfB9HEXwbdxF8GIcRfBZHEXwUhxF8EzcRfBInEXwRZxF8EMcRfBSysUwQMkFMFlHhTBERoUwbwWFMEqFBTBMBIUwasQFMF/DxTBmA4UweYNFMFeDRTB9AwUwaMMFMFlDBTBNQwUwRAMFMH0CxTB3gsUwc0LFMHACxTBSNAQwaDGEMEsvxDBbbkQwf+0EMGWsRDB9a4Qwe+sEMFhqxDBLqoQwUGpEMGMqBDBAKgQwZSnEMFBpxDBAacQwdCmEMGrphDBjaYQwXemEMFmphDBl3gNwctrDcHpYQ3BSVoNwWhUDcHgTw3BYkwNwbJJDcGgRw3BB0YNwc1EDcHcQw3BIUMNwZJCDcEkQg3Bz0ENwY5BDcFcQQ3BNUENwRdBDcEBQQ3BSyUKwV0UCsFGBwrBKf0JwVz1CcFY7wnBteoJwSLnCcFh5AnBQ+IJwaHgCcFg3wnBaN4JwardCcEX3QnBp9wJwVDcCcEN3AnB2tsJwbLbCcGU2wnBztcGwXHBBsEfsAbBu6IGwWKYBsFnkAbBP4oGwYCFBsHYgQbBB38Gwdx8BsEwewbB53kGwep4BsEneAbBkXcGwR53BsHFdgbBgHYGwUx2BsEjdgbB7pEDwXV0A8GWXQPB30sDwSs+A8GWMwPBaisDwR4lA8FDIAPBhRwDwaMZA8FrFwPBtRUDwWUUA8FhEwPBmhIDwQASA8GKEQPBLxEDweoQA8G0EAPB/lUAwUQvAMEhEQDBePP/wDrP/8Ays//AiZ3/wNKM/8Duf//A/XX/wFVu/8BvaP/A5GP/wGVg/8C0Xf/AoVv/wAla/8DPWP/A3Vf/wCNX/8CUVv/A2U36wHPo+cBFmfnAo1v5wMor+cC4BvnACur4wOLT+MDHwvjAlrX4wGur+MCVo/jAi534wOWY+MBRlfjAkJL4wHGQ+MDPjvjAjo34wJaM+MDYi/jAvxD0wKeM88AJJfPAGNTywBOV8sAkZPLAOD7ywOIg8sA3CvLAt/jxwDfr8cDP4PHAytjxwJ3S8cDbzfHAMsrxwGDH8cA0xfHAicPxwEDC8cBCwfHAkv3twI9S7cCiy+zAv2HswAIP7MCTzuvAiJzrwL5168C7V+vAikDrwKMu68DTIOvALRbrwPgN68CmB+vAyALrwAj/6sAm/OrA7fnqwDf46sDn9urAmB7owDBD58CblObAzArmwJqe5cAHSuXAJQjlwPjU5MBMreTAmI7kwN525MCMZOTAa1bkwIVL5MAgQ+TAqDzkwKw35MDWM+TA4jDkwJ0u5MDdLOTAZX/iwN5o4cAeieDA6NbfwCdK38Ca297AJ4XewMxB3sB1Dd7A4uTdwHrF3cA0rd3AdprdwACM3cDagN3AQnjdwKNx3cCKbN3AnWjdwJhl3cBEY93Ari3dwG3P28CKs9rAX8/ZwHcZ2cC3idjAuCHYwLXd18DLqNfAg4jXwN9v18DWXNfAI07XwM1C18AQOtfAVDPXwCQu18AlKtfAESfXwLMk18DgItfA7DbYwJCE1sDyH9XAn/7TwJ0408CtwNLAyGbSwIgg0sDR6dHAUr/RwPOf0cDeh9HAQnXRwOVm0cDRW9HAR1PRwLJM0cCgR9HAuUPRwLdA0cBnPtHAzqfTwL2V0cAH3M/A+5bOwDrbzcDARc3ArNTMwLZ8zMD9N8zAewLMwO3ay8CZvcvA6qbLwGOVy8Dih8vAeH3LwHB1y8BBb8vAfWrLwNJmy8D/Y8vAkYrPwF8PzcA59crAXpXJwF2kyMBb7MfAEVvHwCTxxsCPnsbAR17GwEIsxsBvBcbAW+fFwBjQxcAfvsXAQbDFwI+lxcBQncXA9pbFwBKSxcBNjsXAeebLwLj7yMCpd8bAiczEwHigw8A7t8LAbAnCwO9/wcBmE8HAU77AwON7wMCEScDA+CTAwKsIwMDJ8r/A4uG/wNfUv8DHyr/ABsO/wA29v8BzuL/AB77IwKBhxcCsbcLAjkrAwCjUvsDatL3AxNW8wFYjvMBVmrvA4DO7wJzjusAFpbrAlXW6wMZQusBGNLrAOx66wDUNusASALrA8PW5wCHuucAd6LnAyg7GwClDwsCX3b7APx28wJtNusBA57jA88q3wBPttsAiRLbAU8C1wChZtcBVCLXAQsm0wDGYtMAecrTAoFS0wNI9tMA0LLTAmx60wB8UtMAJDLTAx9HDwH+dv8AXybvAkGC4wJ4atsCgW7TAKPaywNDjscAmDbHAFmOwwOjbr8BUca/AzR2vwJrcrsDeqa7AfoKuwP1jrsBmTK7ALDquwBssrsBCIa7A1wDCwJ1pvcD0LLnA0E+1wMJJssDWH7DAf2WuwH8NrcB7/avACyKrwKdyqsAZ56nAC3mpwMIiqcBj36jA86qowD+CqMC1YqjAUUqowHg3qMDsKKjAQsK/wJegu8A3ArfAJ72ywJrprsDTQazA2yaqwDl4qMBFIafAPAmmwCMnpcBRcqTAV+KjwMBwo8CoF6PAE9KiwOebosDYcaLAQVGiwAo4osCPJKLAO8S7wClHucDuQLXAe5uwwBZOrMAe2ajAqkamwBUxpMB1hqLA7iWhwMwFoMD3HJ/AoWKewDHOncACWZ3AEf2cwDy1nMBNfZzA3lGcwDQwnMApFpzAA4MbwaB/G8EJfRvBDnsbwYp5G8FjeBvBgHcbwdR2G8FQdhvB63UbwZ51G8FjdRvBN3UbwRR1G8H6dBvB5nQbwdd0G8HLdBvBwnQbwbx0G8G2dBvBriIYwSQeGMGsGhjBBRgYwf4VGMFxFBjBQhMYwVoSGMGpERjBIhEYwbsQGMFsEBjBMBAYwQIQGMHfDxjBxA8YwbAPGMGgDxjBlA8YwYsPGMGEDxjB6cMUwda9FMEwuRTBo7UUweuyFMHXsBTBQa8UwQuuFMEerRTBaawUwd6rFMF1qxTBJKsUweaqFMG3qhTBk6oUwXiqFMFjqhTBU6oUwUeqFME9qhTBRmcRwSZfEcHtWBHBK1QRwYdQEcG/TRHBn0sRwf9JEcHBSBHBzkcRwRRHEcGHRhHBG0YRwchFEcGJRRHBWUURwTRFEcEYRRHBAkURwfJEEcHlRBHBgg0OwacCDsFV+g3B9vMNwRfvDcFd6w3Bg+gNwVbmDcGs5A3BZuMNwW7iDcGw4Q3BHuENwbDgDcFb4A3BGuANwenfDcHD3w3Bpt8NwZDfDcGA3w3BmrcKwRypCsH+nQrBeZUKwfOOCsH2iQrBJYYKwTqDCsH/gArBS38Kwf59CsH/fArBPHwKwah7CsE2ewrB4HoKwZ16CsFregrBRHoKwSd6CsEQegrB12YHwYVTB8GvRAfBTTkHwZQwB8HnKQfByyQHweIgB8HmHQfBnRsHwd4ZB8GJGAfBhBcHwb0WB8EkFgfBsBUHwVcVB8EUFQfB4BQHwbgUB8GaFAfB5RwEwTQDBMFu7wPBPuADwZfUA8GpywPB08QDwZe/A8GXuwPBh7gDwTG2A8FntAPBCrMDwf6xA8EysQPBl7ADwSCwA8HFrwPBf68DwUqvA8EirwPB8tsAwd65AMGTnwDBVosAwcp7AMHcbwDBuGYAwbhfAMFcWgDBQ1YAwSFTAMG8UADB6E4AwYJNAMFwTADBn0sAwf9KAMGGSgDBKEoAweFJAMGrSQDBjU37wHfz+sC8rfrA7Hf6wIBO+sCrLvrAPhb6wIYD+sAw9fnAOOr5wNPh+cBo2/nAgdb5wMHS+cDkz/nAtM35wAjM+cDByvnAx8n5wAjJ+cB3yPnAyQH1wESL9MAiL/TAzOfzwL2w88BXhvPAwmXzwMFM88CXOfPA6SrzwK0f88AWF/PAgxDzwH4L88CnB/PAuATzwHoC88DEAPPAdf/ywHX+8sCy/fLAS93uwExC7sAkye3A62rtwPEh7cCa6ezANr7swNyc7MBDg+zApG/swJ1g7MAcVezAUEzswJVF7MBwQOzAgjzswIE57MA2N+zAdTXswB407MAYM+zAaurowGMh6MAHg+fALgfnwNOm5sAsXObAhiLmwB725cD70+XAx7nlwLCl5cBNluXAhorlwIOB5cCfeuXAW3XlwFVx5cBBbuXA52vlwBxq5cC9aOXAsTTjwPUy4sDHZeHA/cPgwGVF4MDd4t/Af5bfwINb38ARLt/AIAvfwE3w3sC8297A+8vewOy/3sCytt7ApK/ewD+q3sAgpt7A+aLewJGg3sC7nt7AV8rdwMyC3MDge9vAearawDEF2sDMg9nACh/ZwO3Q2MCTlNjAEWbYwE1C2MDOLNjAxhzYwIAQ2MAbB9jA7P/XwG7618A79tfABvPXwJLw18Cy7tfAnLnYwCcf18Bg0dXAMMXUwHzv08DKX9PAagHTwDbD0sAtk9LALW7SwL1R0sDoO9LALCvSwFoe0sCLFNLACQ3SwEwH0sDoAtLAjv/RwP780cAJ+9HARhDUwEsW0sCLdNDAqiPPwH5azsBW0s3AnWfNwDIWzcBM2czASKrMwBOGzMA/aszA41TMwIREzMD6N8zAYS7MwAknzMBsIczAIh3MwNoZzMBYF8zA49nPwMR1zcCkc8vA8fnJwMIZycAJa8jAj+XHwAJ9x8DgMMfAaffGwCbLxsBNqcbATI/GwFh7xsANbMbAV2DGwGBXxsCFUMbASEvGwEZHxsA2RMbA+B7MwBZJycD428bAHCPFwPkExMD1KMPAmILCwNkEwsDPosHAnVbBwKEbwcAf7sDAFcvAwCmwwMB/m8DAqovAwIl/wMBBdsDAJ2/AwLppwMCTZcDAIOPIwGiYxcAaucLATJHAwNIqv8DTFb7A5kW9wI+hvMAGILzAeby7wJV0u8D3PLvAEBK7wAvxusCu17rAOMS6wE61usDjqbrATKG6wMuausDTlbrAlyTGwNxmwsCuEr/AUFO8wJ6UusC6OrnAti+4wOZZt8DNvLbAP0K2wAnktcCTm7XAg2O1wEQ4tcD7FrXAav20wMzptMDD2rTAQc+0wHLGtMC1v7TAjtzDwD+yv8Bq67vAzI24wCdRtsBboLTAL02zwJBEssBmerHAoN2wwBZisMCVAbDAnLavwJZ8r8DRT6/AWy2vwOESr8CQ/q7A/u6uwBLjrsDy2a7AqQTCwLlzvcCtQLnAy3C1wKFxssAoVbDAEq2uwExhrcDHX6zAZZOrwILxqsDQcarACg6qwH/AqcB3hKnAJFapwHkyqcARF6nACQKpwOvxqMCT5ajAgsO/wAGku8CkC7fA4c+ywAoGr8ASaqzAL16qwBa9qMBSdqfAzG6mwPObpcDb9KTA8XCkwNYJpMCsuaPAmXujwK9Lo8DKJqPAbgqjwKz0osD946LAO8S7wFdIucD1Q7XAQKSwwNlfrMB78qjAGW6mwMFmpMCUzKLAd32hwP1toMCZlJ/AMeiewAZgnsCI9Z3AtaKdwI1incAFMZ3A3wqdwIztnMAL15zAABYcwTkTHMEdERzBhA8cwU0OHMFiDRzBsAwcwSgMHMHCCxzBdAscwTkLHMEMCxzB6wocwdEKHMG9ChzBrwocwaMKHMGbChzBlQocwZAKHMGMChzB3LQYwRyxGMFDrhjBGqwYwXaqGME4qRjBR6gYwZCnGMEFpxjBnKYYwU2mGMEQphjB4qUYwcClGMGlpRjBkaUYwYKlGMF3pRjBbqUYwWilGMFjpRjBCVUVwflPFcEgTBXBNUkVwf5GFcFQRRXBCkQVwRNDFcFYQhXBykEVwV5BFcEMQRXBzkAVwaBAFcF8QBXBYUAVwU1AFcE9QBXBMUAVwShAFcEiQBXBCPcRwTPwEcEC6xHBEecRwRTkEcHP4RHBFuARwcjeEcHL3RHBC90RwXncEcEL3BHBt9sRwXjbEcFH2xHBI9sRwQfbEcHy2hHB49oRwdfaEcHN2hHBg5sOwU2SDsFNiw7B+4UOwfGBDsHhfg7BjnwOwcp6DsF0eQ7BcHgOwax3DsEWdw7BpXYOwU92DsEOdg7B3XUOwbh1DsGbdQ7BhnUOwXZ1DsFpdQ7BXkMLwfc2C8GHLQvBWiYLwecgC8HEHAvBoBkLwT4XC8FvFQvBERQLwQcTC8E9EgvBpBELwTARC8HYEAvBlRALwWMQC8E9EAvBIBALwQoQC8H5DwvBxe8HwRffB8Fi0gfBt8gHwV7BB8HIuwfBi7cHwVO0B8HisQfBCLAHwaCuB8GQrQfBwawHwSSsB8GtqwfBU6sHwQ+rB8HbqgfBtKoHwZaqB8GAqgfBRaIEweKLBMHNegTByG0EweFjBMFZXATBoFYEwUhSBMH8TgTBe0wEwZVKBMElSQTBDkgEwTpHBMGZRgTBH0YEwcNFBMF9RQTBSEUEwSBFBMEBRQTB41wBwew+AcH/JwHBgBYBwSoJAcEE/wDBTfcAwXDxAMH97ADBnOkAwQznAMEa5QDBoOMAwYLiAMGp4QDBBOEAwYfgAMEp4ADB4d8AwavfAMGC3wDBhUT8wI30+8Awt/vAPYj7wGVk+8AUSfvASTT7wHkk+8B2GPvAVw/7wGoI+8ApA/vALf/6wCf8+sDc+frAH/j6wM72+sDO9frADPX6wHn0+sAK9PrAf+v1wEKB9cBpL/XAlvD0wILA9MDMm/TA0H/0wINq9MBRWvTAAk70wKlE9MCRPfTALzj0wBk09MAAMfTApy70wN8s9MCFK/TAfyr0wLgp9MAiKfTAKbfvwNQq78Ajvu7AXmruwA0q7sDR+O3AONPtwI627cC7oO3AI5DtwIeD7cDzee3ArnLtwCpt7cD6aO3AzmXtwGZj7cCSYe3AMGDtwCRf7cBYXu3A1rHpwNr56MBbaujAKvvnwG6l58CWY+fALDHnwKoK58BN7ebA89bmwPLF5sAGuebANq/mwMOn5sAcoubA053mwJKa5sAbmObAPJbmwNGU5sC+k+bA+ubjwMP44sDSPOLAGqrhwFk44cCc4ODANJ3gwJRp4MAkQuDAESTgwCsN4MDA+9/Ag+7fwHXk38DT3N/ACNffwKPS38BOz9/Ax8zfwN3K38Bpyd/ANWXewEMz3cALQNzAFIDbwBHq2sC0ddrA6RvawOnW2cANotnAqXnZwNta2cBmQ9nAjjHZwP0j2cCwGdnA3hHZwO8L2cBuB9nABATZwG0B2cB2/9jAejvZwAu418ABgNbAtIfVwKLD1MBEKtTAVrTTwJpt08BVN9PArhHTwCL50sBy5tLAO9jSwG7N0sA6xdLAAL/SwEa60sCwttLA+LPSwOix0sBYsNLAlnjUwBeW0sBwC9HAN83PwEjkzsAkWM7A7ffNwLWtzcCwdM3ABUnNwEkozcA/EM3A8v3MwAfwzMB05czAbN3MwFPXzMCy0szAMM/MwIbMzMCCyszAbSnQwA3czcBd8cvAvG3KwBiLycBW58jAsGrIwFwMyMCfw8fAwIvHwJBhx8DNQ8fAHi3HwNobx8C5DsfAwgTHwDL9xsB098bAGfPGwMvvxsBK7cbAzFfMwLCWycAzQMfAYXfFwJ5pxMD0mcPAP/nCwPWDwsANK8LA4ebBwI6ywcCDisHA72vBwKFUwcDjQsHAZTXBwCUrwcBdI8HAdR3BwPkYwcCTFcHAhQjJwIfPxcDIBMPAoNbAwEt/v8A1dr7A8bG9wMAavcCRpLzA/ki8wGoCvMB/zLvAvqa7wOuJu8D1c7vAPmO7wIlWu8DhTLvAjEW7wPw/u8DDO7vAlTrGwNmKwsAdSL/A2ou8wE/ausCYjLnAhZG4wLbKt8CRMLfAw8C2wDRqtsCKJ7bAgvW1wGnPtcBUsrXAK5y1wE6LtcB7frXAvXS1wFdttcC5Z7XAbOfDwC7Hv8AHDrzAkMG4wP6GtsAT5LTAO6KzwGWissDH5bHAbVOxwJ7isMBNi7DADUiwwHIUsMD27K/A0c6vwNi3r8Bbpq/AD5mvwPWOr8BJh6/AgwjCwOt9vcCUVLnADpK1wD+ZssDeibDAdvOuwCqzrcBLv6zAFwGswMtrq8AL96rAqJyqwARXqsCRIarAqfipwG3ZqcCewanAfq+pwLahqcA9l6nAwsS/wHGnu8AmFbfAx+KywI0ir8AZkqzA65SqwBYBqcCDyafAu9GmwEcNpsD4cqXAOvqkwLWcpMChVKTASh2kwO7yo8CV0qPA7LmjwCWno8DemKPAO8S7wIZJucAAR7XAGK2wwMVxrMCODKnATJWmwM+bpMCZEaPASNOhwLbToMDoCKDAe2mfwLbsnsABjJ7AckGewC8InsBX3J3A27qdwFOhncDijZ3AoqEcwVqfHMGjnRzBWZwcwWCbHMGlmhzBGJocwa6ZHMFemRzBIpkcwfWYHMHTmBzBuZgcwaaYHMGYmBzBjZgcwYWYHMF+mBzBepgcwXaYHMF0mBzB1T8Zwbs8GcFlOhnBozgZwVA3GcFRNhnBkTUZwQA1GcGTNBnBQjQZwQQ0GcHWMxnBszMZwZkzGcGFMxnBdjMZwWszGcFjMxnBXDMZwVgzGcFUMxnBI98VweraFcG71xXBVtUVwYjTFcEs0hXBJ9EVwWLQFcHOzxXBXs8VwQrPFcHLzhXBnM4VwXjOFcFdzhXBSc4VwTrOFcEuzhXBJs4VwR/OFcEazhXB/H8SwT16EsHpdRLBpXISwTFwEsFXbhLB82wSweZrEsEcaxLBhGoSwRJqEsG8aRLBe2kSwUtpEsEmaRLBCmkSwfZoEsHmaBLB2mgSwdJoEsHLaBLB+yIPwSsbD8FHFQ/B1hAPwX4ND8H5Cg/BEwkPwaYHD8GSBg/BwwUPwSgFD8GyBA/BWgQPwRgED8HmAw/BwAMPwaQDD8GPAw/BfwMPwXMDD8FqAw/B68gLwU++C8FMtgvBQrALwbSrC8FGqAvBsaULwb+jC8FIogvBLqELwVqgC8G6nwvBQp8LweeeC8GjngvBcJ4LwUmeC8EtngvBF54LwQaeC8H6nQvB33IIwXpkCMGZWQjBY1EIwTJLCMGHRgjBAkMIwVxACMFdPgjB3TwIwbw7CMHiOgjBPjoIwcM5CMFmOQjBIDkIwew4CMHEOAjBpzgIwZA4CMF/OAjBQiIFwcQOBcEDAAXB3PQEwXHsBMEY5gTBTuEEwbPdBMH82gTB8NgEwWbXBME91gTBXtUEwbbUBME41ATB2dMEwZHTBMFb0wTBM9MEwRTTBMH90gTB99gBwaK+AcGoqgHBiZsBwRqQAcF5hwHB9oABwQ58AcFbeAHBknUBwXlzAcHlcQHBtXABwdBvAcEkbwHBom4BwUFuAcH3bQHBwG0BwZZtAcF3bQHB8DL9wADs/MAJtvzAGI38wBhu/MCpVvzA90T8wJ43/MCNLfzA+CX8wEIg/MD1G/zAuBj8wEgW/MByFPzAERP8wAcS/MA/EfzAqBD8wDcQ/MDiD/zA8832wM1u9sAkJvbA2u71wOXE9cAfpfXAGY31wPV69cBFbfXA9GL1wC1b9cBSVfXA6VD1wJdN9cAXS/XANkn1wMtH9cC7RvXA7kX1wFNF9cDfRPXAI4vwwDQM8MDIqu/AXGDvwLcn78C4/O7AJ9zuwIfD7sDusO7A5qLuwFKY7sBZkO7AWIruwNKF7sBqgu7A2n/uwO197sB5fO7AYnvuwI967sDxee7AsHTqwIvM6cClSunA5ubowKya6MCjYOjAlDTowDMT6MD1+efA5ebnwILY58CpzefAfcXnwFW/58CyuufANLfnwJO058CZsufAHLHnwP2v58Amr+fAHZbkwCq648A1DuPAR4niwCgj4sAW1eHAoZnhwHts4cBGSuHAZjDhwNsc4cAbDuHA/QLhwJv64MBL9ODAiu/gwPXr4MBE6eDAPOfgwLbl4MCQ5ODAI/7ewK7g3cDw/9zAJFDcwB7I28CSX9vAnQ/bwLPS2sBvpNrAYIHawNtm2sDSUtrAs0PawE042sC1L9rAPCnawFwk2sCwINrA7R3awNgb2sBIGtrAY7zZwBRP2MCxK9fADkbWwFqS1cAsB9XAJJzUwEFK1MDbC9TAc9zTwIS408Cyo9PAD5TTwEOI08Bff9PArHjTwKBz08DTb9PA92zTwM9q08AxadPApuDUwP8U08CSoNHAJ3fQwImMz8AB6c7AnIDOwFY+zsDbC87AhOXNwHfIzcB+ss3A5aHNwF6VzcDsi83AzoTNwHF/zcBne83AXXjNwBN2zcBadM3AHXnQwCBCzsBEbszAoPLKwAD4ycCYYcnA5OzIwGCUyMBfU8jA3iHIwEf8x8DN38fAQ8rHwP65x8C4rcfAdqTHwHydx8A6mMfARZTHwEuRx8AMj8fA75DMwHbkycBEpMfAs9jFwIfMxMC1BsTAAnPDwG4Aw8AercLAqG/CwPtAwsDHHcLAHQPCwPXuwcC738HAP9TBwJbLwcAPxcHAJcDBwHG8wcCoucHANC7JwPQGxsCnUMPARyDBwCXUv8AB2b7AkRq+wOuOvcA4I73AgNC8wE6RvMA2YbzAszy8wAwhvMAiDLzAV/y7wGzwu8Bv57vAquC7wJDbu8C517vAxFDGwB6vwsDbfb/A0cq8wBofu8BZ3bnAUPC4wJ03uMDKp7fAkzm3wGLrtsCvr7bAQoK2wMtftsCxRbbA9jG2wBAjtsADGLbAxA+2wI4JtsDgBLbAa/LDwEvcv8DqMLzApPW4wB2+tsCaJrXAQvWzwLsCs8AOTrLAusWxwJ1dscCpDrHAYNKwwIGksMCzgbDAV2ewwGpTsMBeRLDABDmwwHUwsMACKrDAZAzCwDOIvcCnaLnAlbO1wJPAssDdvbDAojivwAYDrsBPHK3AI2uswIXhq8DkdqvAESWrwJDmqsD/tqrA5ZKqwI13qsDgYqrAQ1OqwHxHqsCaPqrAAsa/wOequ8C8HrfA1/WywCA/r8DfuazABsuqwNpDqcDOGqjAAjKnwBx7psCy7KXASn6lwIYppcDB6KTAc7ekwAWSpMCrdaTAOmCkwAlQpMDRQ6TAO8S7wLVKucASSrXAA7awwNmDrMCoJqnAO7ymwDfQpMB4VaPAVSeiwO02ocDieaDAkuafwFZ0n8CTHJ/Af9mewGqmnsCif57AQGKewAdMnsA+O57AZSYdwYckHcEiIx3BFyIdwU8hHcG7IB3BSyAdwfgfHcG6Hx3BjB8dwWkfHcFQHx3BPB8dwS4fHcEjHx3BGx8dwRUfHcERHx3BDR8dwQsfHcEJHx3BEMQZwYDBGcGVvxnBJr4ZwRS9GcFIvBnBr7sZwT27GcHouhnBqLoZwXi6GcFVuhnBOroZwSe6GcEYuhnBDboZwQW6GcH+uRnB+rkZwfa5GcH0uRnBpWIWwSBfFsF+XBbBhloWwQ5ZFsH1VxbBI1cWwYZWFsERVhbBulUWwXlVFsFIVRbBI1UWwQhVFsH0VBbB5VQWwdlUFsHRVBbBy1QWwcZUFsHCVBbBiQITwbX9EsEY+hLBZfcSwWD1EsHe8xLBvfISwebxEsFF8RLBzfASwXPwEsEw8BLB/u8SwdnvEsG97xLBqO8SwZjvEsGN7xLBhO8SwX7vEsF57xLBRqQPwaadD8GxmA/B/JQPwTeSD8ElkA/BmY4PwXGND8GUjA/B74sPwXOLD8EXiw/B0ooPwZ+KD8F5ig/BXIoPwUeKD8E3ig/BK4oPwSKKD8Ebig/BkkgMwYA/DMG0OAzBnjMMwdEvDMH5LAzB2SoMwUIpDMETKAzBMCcMwYYmDMEIJgzBqSUMwWMlDMEuJQzBByUMwekkDMHTJAzBwyQMwbckDMGtJAzBaPAIwf3jCMGu2gjBttMIwX7OCMGXygjBrMcIwX7FCMHdwwjBpcIIwbzBCMEPwQjBjcAIwSzACMHjvwjBrb8IwYW/CMFnvwjBUL8IwT+/CMEzvwjBFJ0FwR2MBcFhfwXB1HUFwa1uBcFTaQXBUmUFwVRiBcEXYAXBa14FwStdBcE8XAXBilsFwQVbBcGhWgXBV1oFwR9aBcH2WQXB11kFwcBZBcGvWQXBVlACwTY5AsHQJwLBvxoCwfQQAsGdCQLBHwQCwQQAAsHy/AHBpvoBwe/4AcGn9wHBsfYBwfr1AcFy9QHBDPUBwb/0AcGG9AHBXPQBwTz0AcEk9AHBARn+wB/a/cCyqv3AAof9wDVs/cAdWP3ADkn9wMo9/cBcNf3ADi/9wFgq/cDTJv3AMiT9wDsi/cDDIP3Aqh/9wNke/cA8Hv3Axx39wHAd/cAvHf3AO6n3wBVU98CgE/fA/uL2wGW+9sDpovbAS472wNl+9sBKc/bAo2r2wCxk9sBWX/bAulv2wAdZ9sADV/bAgVX2wGFU9sCKU/bA6lL2wHJS9sAYUvbAO1nxwITm8MBEj/DAMU3wwFUb8MDN9e/Am9nvwHXE78CdtO/AwajvwOGf78A/me/ASZTvwJSQ78DPje/AvovvwDKK78ALie/ALojvwImH78AOh+/A8zLrwHWZ6sD4I+rAkMrpwNeG6cC3U+nAOi3pwFAQ6cCe+ujAXerowDLe6MAY1ejASc7owDLJ6MBkxejAjcLowG7A6MDYvujAqL3owMa86MAdvOjA+kHlwAd35MDs2ePAmGHjwP0F48CSwOLAKIziwLBk4sAIR+LAyDDiwBsg4sCfE+LASAriwEwD4sAT/uHALPrhwEL34cAU9eHAdPPhwD3y4cBU8eHA/ZTfwO6K3sBvu93AoxrdwGmf3MCNQdzAZ/rbwKrE28AxnNvAxn3bwPNm28DYVdvACknbwHU/28BKONvA7jLbwO0u28DwK9vAsynbwAgo28DJJtvANzzawCHk2MBP1NfAJwDXwJxb1sBs3dXAQ33VwFc01cA//dTAvtPUwIy01MAjndTAl4vUwHN+1MCedNTARG3UwMVn1MCpY9TAl2DUwExe1MCWXNTAXEjVwOaS08DOM9LAIB7RwC9F0MDcnM/AVCDPwGLUzsDmms7AbHjOwCRfzsAsTM7A9T3OwFAzzsBZK87AZCXOwPAgzsCcHc7AIBvOwEQZzsDhF87A5cjQwOSnzsA66szAB4TLwNh1ysBz1snAS2zJwFobycD53cjAm6/IwFuOyMCNdcjA8WLIwP5UyMCNSsjAvULIwOU8yMCHOMjARDXIwNMyyMABMcjAWMrMwFkyysARCMjAMkLGwCYsxcBLc8TAlufDwEl/w8DOL8PAjfPCwFTIwsAcqcLAqZHCwBOAwsDqcsLAEGnCwLFhwsAuXMLAEFjCwPxUwsCvUsLAKFTJwKk+xsConMPAenHBwBoowMCqOL/A44K+wJP+vcAOnL3AalG9wOAYvcAy7rzAEM68wOu1vMDPo7zAP5a8wBeMvMB+hLzA0H68wJB6vMBkd7zAI2fGwKjTwsDhs7/ATAm9wBZlu8BnMbrAMky5wKSguMBSHLjApLa3wDtpt8DLMLfAegi3wCPqtsBZ07bAQsK2wHS1tsDeq7bAsqS2wFaftsBUm7bAhP3DwJbxv8APVLzAASq5wLj0tsAzarXAMka0wLhis8COsrLAHTWywM/UscDai7HA11WxwBctscBrDrHAYvewwBrmsMAp2bDAeM+wwDjIsMDNwrDATBDCwJGSvcDlfLnAXdW1wJfnssCf9LDAh3yvwPZSrsBweK3AitGswMhSrMB48avAcKerwGBvq8AQRavANyWrwEoNq8BY+6rA5e2qwNTjqsBN3KrAQ8e/wGSuu8BmKLfADwmzwL9br8Bf4azAdACrwFeFqcAnaqjAm4+nwHTlpsAdYqbAOv2lwHKwpcBIdqXAX0qlwFAppcB5EKXA1/2kwOHvpMBt5aTAO8S7wORLucAoTbXAAL+wwBSWrMC1QKnA4eKmwO4DpcAnmKPAk3miwJuXocCF56DAgV+gwPz2n8Blp5/AFGufwIk9n8A+G5/AeQGfwCPunsCm357Av6QdwTejHcEVoh3BPaEdwZ2gHcEnoB3Bz58dwY6fHcFenx3BOp8dwSCfHcEMnx3B/p4dwfOeHcHrnh3B5Z4dweCeHcHdnh3B254dwdmeHcHYnh3B/EEawd0/GsFLPhrBID0awUM8GsGfOxrBJTsawcs6GsGIOhrBVzoawTI6GsEXOhrBAzoawfQ5GsHpORrB4Tkawdo5GsHWORrB0zkawdA5GsHOORrB+d8WwQrdFsHc2hbBP9kWwQ3YFsEp1xbBgdYWwQTWFsGn1RbBY9UWwTDVFsEK1RbB7tQWwdrUFsHK1BbBv9QWwbfUFsGw1BbBrNQWwajUFsGm1BbBEH8TwQF7E8H+dxPBwnUTwRl0E8HechPB9XETwUhxE8HIcBPBaXATwSJwE8HubxPBx28TwatvE8GWbxPBhm8TwXpvE8FxbxPBa28TwWZvE8FjbxPBvR8QwR8aEMH0FRDB3BIQwZEQEMHdDhDBmg0QwaoMEMH5CxDBdQsQwRMLEMHLChDBlQoQwW4KEMFQChDBOgoQwSoKEMEeChDBFQoQwQ8KEMEKChDBo8IMweG6DMEetQzB1rAMwamtDMFOqwzBjqkMwUKoDMFMpwzBlqYMwQ+mDMGqpQzBYKUMwSmlDMEApQzB4qQMwcykDMG7pAzBr6QMwaakDMGfpAzBpWgJwfBdCcH5VQnBDlAJwalLCcFmSAnB+0UJwS9ECcHbQgnB3kEJwSNBCcGYQAnBMUAJweU/CcGsPwnBgj8JwWM/CcFMPwnBOz8JwS8/CcElPwnB8xIGwTEEBsEz+QXBB/EFwfPqBcFw5gXBF+MFwZvgBcHD3gXBZt0FwWLcBcGi2wXBE9sFwaraBcFb2gXBIdoFwfbZBcHW2QXBv9kFwa3ZBcGg2QXBLMMCwd6uAsG5nwLBcZQCwQyMAsHQhQLBLoECwb59AsExewLBTHkCweV3AsHbdgLBFXYCwYN1AsEXdQLBxnQCwYt0AsFedALBPnQCwSV0AsETdALB8vb+wD2//sCTlf7AfHb+wFNf/sAYTv7ASkH+wMc3/sC4MP7Aeyv+wJgn/sC3JP7AlCL+wP4g/sDSH/7A8x7+wE4e/sDTHf7AeB3+wDUd/sADHf7AeX34wFIx+MAt+PfAbM33wISt98C+lffAD4T3wOl298AmbffA5mX3wIZg98CIXPfAk1n3wGFX98DBVffAjFT3wKdT98D+UvfAgFL3wCNS98DeUffAeCHywOG58cDKa/HAKjHxwEwF8cCO5PDAJ8zwwAC68MCBrPDAe6LwwAqb8MCElfDAa5HwwGKO8MAhjPDAdorwwDmJ8MBOiPDAoIfwwB+H8MC/hvDAnOzrwJ1g68Bv9urAW6bqwDhq6sA2PerAmxvqwJAC6sDt7+nAEuLpwMjX6cAk0OnAecrpwETG6cAmw+nA1sDpwB+/6cDZvenA6LzpwDW86cCxu+nAeerlwGQv5cD6n+TAJjPkwAjh48BZo+PAK3XjwK9S48D7OOPA2SXjwKAX48AQDePAOAXjwGb/4sAU++LA4ffiwIH14sC+8+LAcPLiwHjx4sDA8OLApCngwOox38B6ct7Ak9/dwAhw3cDVG93AkNzcwC6t3MDLidzAaW/cwMZb3MAtTdzAVELcwEc63MBNNNzA3i/cwJQs3MAkKtzAVSjcwP4m3MAAJtzA2brawBJ32cDCedjA4bXXwGof18AZrdbAxFbWwN4V1sBB5dXA8cDVwN2l1cC1kdXAuYLVwJZ31cBSb9XAL2nVwKJk1cBBYdXAwF7VwOVc1cCFW9XAoK/VwKsP1MAExdLABsLRwJ350MCCX9DAW+rPwNeRz8BGT8/A1yHPwGUFz8A08M7AcODOwLjUzsADzM7AjcXOwMLAzsA0vc7AkbrOwJy4zsApt87AsxjRwEQNz8AhZc3AgBPMwLgKy8DpVMrAeuXJwJOcycDFZcnAtzzJwAseycAtB8nAJ/bIwH/pyMAX4MjAHNnIwO3TyMAV0MjAO83IwB3LyMCMycjA/QPNwEmAysCFa8jAPrvGwK+IxcAr3cTA6lnEwCz4w8CHsMPAr3rDwFtSw8A7NMPAxR3DwA4Nw8CgAMPAZPfCwInwwsBy68LArOfCwN/kwsDM4sLAXnrJwJ12xsC96MPAkMrBwMJ5wMAnlb/AnOy+wIJrvsDTD77A/cu9wFmZvcCBc73AQFe9wDFCvcCFMr3A3ia9wDYevcDKF73ABRO9wHwPvcDcDL3AsH3GwHP4wsAo6r/AEVK9wKSpu8BFg7rAkqW5wMcFucAmjLjAgC+4wJrpt8AYtbfAxo23wGlwt8CHWrfAPEq3wPs+t8DPNrfAvjC3wD4st8DnKLfAtAjEwA0HwMB1d7zAoF65wI0qt8AKr7XAAJW0wNK/s8AeG7PA9p+ywDZIssAKBrLAWtSxwCqvscCAk7HAX3+xwGVwscBDZbHA/lyxwNtWscBNUrHAPBTCwAWdvcBOkbnAZPe1wEMOs8DZKrHAGL+vwE6lrsC/0a3ASjWtwKi/rMDmZqzA9iOswLPxq8AUzKvA/6+rwBGbq8B+i6vA6n+rwFB3q8DucKvAhci/wOexu8AkMrfAcRyzwGZ4r8CQCK3AKjWrwEPHqcCwuKjAgeqnwFNMp8BJ06bAJ3emwKUxpsBv/aXAWtalwCq5pcBqo6XAOZOlwDCHpcA/fqXAO8S7wBRNucBFULXAEMiwwHWorMCxWqnAOAmnwAo4pcCb2aPA+smiwLr1ocDVUaHAVdSgwMN0oMCfLKDAbPafwNXNn8CFr5/A7ZifwByIn8Cbe5/AHB0ewdobHsHuGh7BQBoewcAZHsFiGR7BHRkeweoYHsHEGB7BqBgewZQYHsGFGB7BehgewXIYHsFsGB7BaBgewWUYHsFiGB7BYRgewV8YHsFeGB7BALoawT+4GsH1thrBArYawVC1GsHMtBrBa7QawSS0GsHwsxrBybMawa2zGsGYsxrBibMawX2zGsF1sxrBb7MawWqzGsFnsxrBZbMawWOzGsFisxrBgFcXwQ5VF8FCUxfB7lEXwfVQF8E9UBfBtk8XwVJPF8EJTxfB004XwaxOF8GPThfBeU4XwWlOF8FeThfBVU4XwU9OF8FKThfBR04XwUVOF8FDThfB7fUTwYTyE8EB8BPBJ+4TwcvsE8HK6xPBDesTwYPqE8Ec6hPB0ekTwZrpE8Fx6RPBU+kTwT3pE8Et6RPBIekTwRjpE8ES6RPBDekTwQrpE8EH6RPBtJUQwfKQEMFxjRDB3IoQwfWIEMGPhxDBh4YQwcWFEME3hRDBzoQQwYCEEMFIhBDBHoQQwf+DEMHogxDB2IMQwcyDEMHDgxDBvIMQwbeDEMGzgxDBaTcNwccwDcHkKw3BSigNwaMlDcGvIw3BPyINwTAhDcFpIA3B1h8NwWofDcEbHw3B4B4NwbYeDcGWHg3Bfx4NwW4eDcFhHg3BWB4NwVEeDcFMHg3B19sJwZzSCcHMywnBx8YJwRPDCcFawAnBWL4Jwd68CcHIuwnB+7oJwWS6CcH1uQnBpLkJwWi5CcE7uQnBG7kJwQO5CcHyuAnB5bgJwdu4CcHUuAnBFoQGwUB3BsHFbQbBxWYGwZ1hBsHPXQbBA1sGwfNYBsFuVwbBUFYGwX5VBsHjVAbBcVQGwR5UBsHgUwbBslMGwZFTBsF5UwbBZ1MGwVlTBsFPUwbBojEDwdIfA8GjEgPB5ggDwbYBA8Fp/ALBgfgCwaD1AsGC8wLB8/ECwc3wAsH17wLBVu8CweHuAsGL7gLBS+4CwR3uAsH77QLB4e0Cwc/tAsHB7QLBAM3/wK2b/8AYd//ABFz/wAJI/8A9Of/AWS7/wFMm/8BqIP/ADxz/wNsY/8CAFv/AwxT/wHwT/8CMEv/A2xH/wFkR/8D5EP/AshD/wH8Q/8BZEP/A0Er5wMEG+cAd1PjAjK74wL2S+MAwfvjABW/4wNVj+MCWW/jAg1X4wAtR+MDATfjAVEv4wItJ+MA7SPjAREf4wI5G+MAJRvjApkX4wF5F+MAoRfjA5uPywG2G8sCUQPLAmAzywAXm8cB2yfHAWrTxwMWk8cBGmfHAzpDxwJGK8cD5hfHAl4LxwBmA8cBEfvHA63zxwO178cAze/HAqXrxwER68cD6efHApKHswA8i7MAswuvAfXrrwCBF68CEHevALwDrwIHq6sB/2urAsc7qwP3F6sCUv+rA3LrqwGK36sDTtOrA8rLqwI+x6sCKsOrAyq/qwD2v6sDVrurAho/mwDjj5cBrYOXAD/7kwIC05MC3feTADFXkwO025MCoIOTANxDkwBcE5MAm++PAkPTjwLfv48Ak7OPAhOnjwJXn48Ao5uPAHOXjwFfk48DG4+PA/rvgwIvV38AVJd/A/p7ewBo63sCe7t3AYrbdwKCM3cCxbd3A0lbdwO5F3cB5Od3ASjDdwIYp3cCKJN3A3yDdwCwe3cAvHN3AuRrdwKYZ3cDbGN3ALDjbwMsH2sD0G9nAQGfYwMvd18BPdtfA2ijXwCHv1sBBxNbAfaTWwP+M1sCme9bA2m7WwGtl1sB3XtbAWVnWwJRV1sDOUtbAw1DWwEJP1sAnTtbAXBbWwDWL1MAZVNPAw2LSwLqp0cDUHNHAsbLQwDZj0MD2J9DA8fvPwFPbz8Ayw8/AYLHPwDukz8CKms/AZZPPwCOOz8BEis/AaofPwFGFz8DGg8/AeGjRwCFyz8Df3s3A7KDMwPypy8CH7MrAR23KwCQZysAQ5snAu8HJwM+mycDmksnAMoTJwFl5ycBZccnAdWvJwB5nycDsY8nAkmHJwNdfycCRXsnA1j3NwDjOysCKzsjALTPHwKT4xcDUQsXAZsrEwFNvxMAcK8TAmfrDwOHWw8BqvMPA2KjDwGSaw8C7j8PA3ofDwBSCw8DQfcPArXrDwF14w8CpdsPA06DJwMeuxsDYNMTAtSvCwBHJwMDY8r/ATlK/wMDbvsAmgr7AP0G+wKkTvsDU8b3Azdi9wEzGvcCyuL3Asa69wFKnvcDkob3A5J29wPKavcDImL3Aa5TGwHsdw8CnIMDAWZy9wLXsu8Dp0rrA2/+5wGNnucBU97jAAKO4wOljuMDoNLjAAxK4wCz4t8AQ5bfA9Na3wIzMt8DgxLfAOb+3wA+7t8D/t7fA+xPEwLAcwMAXm7zAeZO5wJFft8B78rXA+eG0wAcatMAqgbPAJg2zwHK2ssC0erLAOU6ywDUtssDDFLLAsAKywFj1scCB67HAQOSxwOjescD52rHAMhjCwI6nvcDgpbnApxm2wI80s8BSYLHASwCwwKH1rsA8KK7ABpetwOIorcBP16zA0ZqswMdtrMBYTKzAljOswEkhrMDGE6zAzgmswHYCrMAM/avAxsm/wHC1u8D3O7fA+i+zwCuZr8BsL63AIGmrwFMLqsDxBanAs0KowMCvp8BGQKfAMeymwE2tpsB1fqbArlumwOxBpsDhLqbA0SCmwHIWpsDNDqbAO8S7wENOucBnU7XAMtGwwPy6rMCadKnAVi+nwChupcBnGqTAgxijwElRosDWuKHAHUWhwMftoMBurKDAvnugwJZXoMDOPKDAACmgwGAaoMCWD6DA3o8ewdeOHsEWjh7Bio0ewSONHsHYjB7BoowewXqMHsFdjB7BR4wewTiMHsEsjB7BJIwewR6MHsEajB7BFowewRSMHsESjB7BEYwewRCMHsEPjB7BfCwbwQorG8H7KRvBNSkbwaUoG8E7KBvB7icbwbYnG8GNJxvBbycbwVknG8FJJxvBPScbwTUnG8EvJxvBKicbwScnG8EkJxvBIycbwSEnG8EgJxvBl8kXwY7HF8EQxhfB+sQXwS/EF8GawxfBLsMXwd/CF8GlwhfBe8IXwVzCF8FFwhfBNcIXwSnCF8EgwhfBGsIXwRXCF8ERwhfBD8IXwQ3CF8EMwhfBd2cUwZlkFMGAYhTB+GAUwdpfFMEJXxTBcF4UwQFeFMGvXRTBdF0UwUldFMEpXRTBEl0UwQFdFMH1XBTB7FwUweVcFMHgXBTB3VwUwdpcFMHYXBTBfAYRwXQCEcGB/xDBWf0Qwcf7EMGg+hDByfkQwSz5EMG6+BDBZvgQwSn4EMH89xDB2/cQwcT3EMGy9xDBpvcQwZz3EMGW9xDBkfcQwY33EMGK9xDBK6cNwYGhDcFcnQ3BVJoNwR2YDcF/lg3BUJUNwXOUDcHSkw3BXJMNwQaTDcHHkg3BmZINwXiSDcFfkg3BTZINwUCSDcE3kg3BMJINwSuSDcEnkg3BPkoKwUpCCsF3PArBNDgKwRY1CsHPMgrBJTEKwe4vCsELLwrBZS4KwewtCsGTLQrBUi0KwSMtCsEBLQrB6CwKwdUsCsHILArBviwKwbcsCsGyLArBsvAGwYnlBsFc3QbBX9cGwf7SBsHKzwbBcs0GwbzLBsF8ygbBk8kGwejIBsFryAbBEMgGwc7HBsGdxwbBescGwWDHBsFNxwbBP8cGwTXHBsEuxwbB5JsDwUWMA8HNgAPBZXgDwT1yA8G8bQPBcWoDwQloA8FHZgPB/mQDwQ5kA8FeYwPB3mIDwYBiA8E8YgPBCmIDweZhA8HLYQPBuGEDwaphA8GfYQPBtk0AweM3AMHUJwDBCxwAwWcTAMETDQDBcggAwQ8FAMGWAgDBxwAAwen+/8D7/P/Akvv/wIv6/8DK+f/APvn/wNf4/8CM+P/AVvj/wC74/8AR+P/AaRH6wJ7U+cDFp/nAxYb5wItu+cDIXPnAxk/5wEFG+cBLP/nANDr5wH02+cDFM/nAyTH5wFYw+cBHL/nAgS75wPEt+cCHLfnAOi35wAIt+cDZLPnAmqDzwE9M88DfDfPAy9/ywOO98sD9pPLAu5LywFyF8sCTe/LAa3TywDBv8sBda/LAkmjywIhm8sAKZfLA9GPywChj8sCUYvLAJ2LywNhh8sCeYfLAClLtwNzd7MBSh+zAMkfswNwX7MAF9evAbtvrwKrI68DruuvA3LDrwIGp68AgpOvAMqDrwFOd68A6m+vAspnrwJOY68DCl+vAKpfrwLqW68BpluvAEzHnwIKS5sBNG+bAdsLlwJuA5cD6T+XALSzlwOER5cCX/uTAd/DkwB/m5MCP3uTACNnkwP7U5MAK0uTA4s/kwE/O5MAozeTAUczkwLTL5MBBy+TA8kvhwMR14MA/09/A8FjfwL793sAcut7AKIjewF9j3sBYSN7AhTTewAAm3sBeG97AmBPewOkN3sDCCd7AuQbewIEE3sDiAt7AtAHewNcA3sA1AN7AGLTbwDWW2sDUutnARBTZwMmW2MAsOdjAuPPXwGjA18CcmtfA1n7XwHZq18CIW9fAm1DXwJ1I18DFQtfAgD7XwGE718AZOdfAbzfXwDg218BUNdfAeXzWwGkF1cD14NPARgDTwJRV0sDa1NHAw3TRwHEt0cC7+NDA5dHQwFu10MBqoNDAEpHQwNaF0MCffdDAnXfQwDlz0MAEcNDArG3QwPZr0MC2atDAJLjRwG3Wz8BZV87ANizNwB5GzMAyl8vAJRPLwIWwysBudsrA9EzKwG4uysAEGMrAWAnKwA0AysBA+cnAR/TJwKXwycD+7cnADezJwKPqycCa6cnA23fNwBYcy8AKMcnA6qnHwPp3xsANrMXA4jXFwCPjxMCypcTARnjEwM1WxMAzPsTAJSzEwCsfxMAGFsTAVg/EwHIKxMDfBsTAQwTEwFoCxMD2AMTAgsfJwB/nxsDpgMTAY4zCwHgbwcCyTcDAV7W/wDdHv8C99b7AQbm+wI2MvsCda77A0VO+wKlDvsDTN77AKS++wNMovsAxJL7AziC+wFUevsCGHL7AUqvGwL1Cw8BXV8DAn+a9wD8uvMDsILvA1Vq6wKjFucA7XrnAPhG5wFbYuMBOrrjAWo+4wJt4uMDsZ7jAs1u4wMFSuMA2TLjAbUe4wO5DuMBgQbjAWh/EwH4ywMDzvrzAhci5wLmTt8B7NLbACS21wFFxtMCR47PA6HizwB8ps8Dr7bLALMKywKWkssAfj7LAVn+ywMdzssBQa7LAIGWywJpgssBLXbLAMBzCwC2yvcCburnAIzy2wHRas8AAlbHAOkCwwO5Dr8Aogq7AOPWtwPGPrcA/RK3AMwytwNvjrMAnxqzAVrCswFagrMCdlKzACYyswMOFrMAtgazACcu/wAC5u8DdRbfAqkOzwE26r8DtVa3ATpyrwBpOqsAzUanAoJiowMQPqMApqafAdlynwJYjp8CU+abApdqmwOzDpsBBs6bAC6emwBuepsCRl6bAO8S7wHJPucCOVrXAZ9qwwKjNrMBrjqnAMFWnwJijpcDKWqTAJ2WjwEWqosCPHKLA6rGhwCdiocD8JqHARfugwBPboMBrw6DAELKgwFmloMALnKDAYv0ewYr8HsHt+x7BfPsewSr7HsHu+h7Bw/oewaT6HsGN+h7BffoewXH6HsFo+h7BYvoewV36HsFa+h7BWPoewVb6HsFV+h7BVPoewVP6HsFT+h7ByZkbwZeYG8G5lxvBGJcbwaOWG8FPlhvBEpYbweWVG8HFlRvBrpUbwZ2VG8GRlRvBiJUbwYGVG8F9lRvBeZUbwXeVG8F1lRvBdJUbwXOVG8FylRvBkjYYweA0GMGlMxjBwDIYwRoyGMGiMRjBSzEYwQwxGMHfMBjBvTAYwaUwGMGUMBjBhzAYwX4wGMF4MBjBczAYwW8wGMFtMBjBazAYwWowGMFpMBjB/NMUwZTRFMHVzxTBkM4UwaXNFMH7zBTBf8wUwSbMFMHlyxTBtssUwZTLFMF7yxTBacsUwVzLFMFTyxTBTMsUwUfLFMFEyxTBQcsUwT/LFME+yxTBX3IRwfRuEcF6bBHBrmoRwWBpEcFuaBHBv2cRwUBnEcHkZhHBoWYRwXFmEcFOZhHBNGYRwSJmEcEUZhHBC2YRwQRmEcH/ZRHB+2URwfhlEcH2ZRHBMRIOwVkNDsHWCQ7BSQcOwXAFDsEZBA7BIAMOwWsCDsHpAQ7BigEOwUUBDsETAQ7B7wAOwdUADsHCAA7BtAAOwaoADsGjAA7BngAOwZoADsGXAA7BGLQKwT2tCsFDqArBpaQKwQaiCsEfoArBvZ4Kwb2dCsEEnQrBfZwKwRycCsHVmwrBopsKwX2bCsFimwrBTpsKwUCbCsE2mwrBLpsKwSmbCsElmwrB/VgHwUpPB8E9SAfBHUMHwWU/B8GyPAfBvToHwVI5B8FKOAfBizcHwQE3B8GdNgfBVDYHwR82B8H5NQfB3TUHwck1B8G7NQfBsDUHwak1B8GjNQfBHwIEwWz0A8Fy6gPBMeMDwezdA8EZ2gPBUtcDwU/VA8HZ0wPBytIDwQXSA8F30QPBENEDwcXQA8GP0APBZ9ADwUvQA8E20APBJ9ADwRzQA8EV0APBPLEAwe2dAMHWjwDBlIUAwR5+AMGyeADBw3QAwehxAMHVbwDBVW4AwT5tAMF0bADB4WsAwXdrAMEqawDB8moAwcpqAMGsagDBl2oAwYhqAMF9agDBcdH6wCqb+sB2c/rAfVb6wGJB+sAJMvrA4ib6wMke+sDpGPrAphT6wI4R+sBRD/rAsQ36wIMM+sCpC/rACgv6wJcK+sBECvrACAr6wNwJ+sC9CfrAqVf0wLIL9MDp0/PAFqvzwEuN88CXd/PAzmfzwFVc88ABVPPA9U3zwJJJ88BkRvPAFkTzwGpC88A0QfPAU0DzwLA/88A6P/PA5D7zwKY+88B5PvPA1P3twBmU7cANRu3AtgztwL7i7MAbxOzAya3swIyd7MDAkezALonswPaC7MBzfuzALXvswM547MAWd+zA13XswO907MBIdOzAznPswHZz7MA2c+zAFM/nwEY958C00ObAhIDmwJZF5sBxGubA8PrlwPzj5cBI0+XAJcflwFS+5cDut+XASrPlwO2v5cB8reXAt6vlwG6q5cCAqeXA1KjlwFeo5cD8p+XAbtnhwIkS4cD4fODAfQ3gwBu738CLft/AMFLfwMsx38AwGt/AAwnfwIb83sB1897A4OzewBro3sCk5N7AIeLewE/g3sD93t7ACN7ewFfd3sDW3N7AhC7cwDwi28BXVtrA7bzZwHdK2cDW9djAl7fYwP6J2MCwaNjAaVDYwL4+2MDmMdjAkyjYwM0h2MDkHNjAVBnYwL8W2MDfFNjAhBPYwIgS2MDREdjA4uHWwDF+1cCDa9TAgprTwCn90sCkh9LAtTDSwL7w0cDewdHAn5/RwKiG0cB8dNHARmfRwK5d0cC3VtHAqVHRwP9N0cBXS9HAaknRwARI0cABR9HAqQfSwBM60MB5zs7ARrXNwA/fzMCvPczACcXLwLtry8AAKsvA0fnKwJrWysDuvMrAPqrKwHifysD4l8rAhpLKwJSOysC3i8rAo4nKwCKIysAKh8rAArLNwNVpy8DxksnAXx/IwIj/xsD/I8bASqLFwFVRxcAFGsXAefHEwNjTxMA9vsTAg67EwBSjxMDFmsTAvpTEwF6QxMAyjcTA5YrEwDqJxMAEiMTAaO7JwJ0fx8DjzMTAhezCwNd4wcBepcDAVxjAwAWvv8DwY7/Aci2/wIEFv8BS6L7AC9O+wI7DvsBMuL7AHrC+wC+qvsDgpb7AwKK+wHygvsDYnr7AZMLGwDZow8AwjsDA1jC+wDZuvMDpb7vAxLK6wLAnusBAwbnA4Hq5wC9HucCAIbnADga5wA3yuMB+47jA6di4wDrRuMCmy7jAmse4wKvEuMCKwrjAzyrEwHRIwMAF47zAvf25wPzGt8ABdbbA5Xm1wNjFtMBYQrTAXOCzwLOXs8BEYrPAHTuzwIIes8CoCbPAe/qywHPvssBw57LAn+GywGfdssBY2rLANSDCwOG8vcB+z7nA1F62wGuEs8DZyLHABn+wwCqQr8C22q7AM1KuwNnyrcDora3AOHutwBlWrcD8Oq3AOietwNoYrcBsDq3ACwetwK8BrcDM/azATMy/wJa8u8DXT7fAgFezwKTbr8AMfK3A8M6rwJGPqsBymqnAlu2owGpsqMAGDqjAGcinwK+Up8AHb6fAh1OnwHs/p8DlMKfASyanwJgep8ACGafAO8S7wKJQucC7WbXAreOwwHngrMAiqKnAtHqnwFDYpcDimaTA4q+jwLEAo8AKfaLA0BqiwALSocB1nKHAOXWhwJBYocCsQ6HAeDShwGspocBlIaHA/GUfwUtlH8HMZB/BcGQfwS9kH8H/Yx/B3WMfwcVjH8GzYx/BpmMfwZ1jH8GXYx/BkmMfwY9jH8GMYx/BimMfwYljH8GIYx/BiGMfwYdjH8GHYx/BOgIcwT0BHMGHABzBBAAcwab/G8Fi/xvBMf8bwQ7/G8H1/hvB4/4bwdb+G8HM/hvBxf4bwcH+G8G9/hvBu/4bwbn+G8G3/hvBt/4bwbb+G8G1/hvBwZ4YwVedGMFSnBjBl5sYwRCbGMGvmhjBaZoYwTeaGMETmhjB+ZkYweaZGMHZmRjBz5kYwciZGMHDmRjBv5kYwb2ZGMG7mRjBupkYwbmZGMG4mRjByzsVwcU5FcFQOBXBQzcVwYI2FcH4NRXBlDUVwUw1FcEYNRXB8zQVwdg0FcHFNBXBtzQVwa00FcGmNBXBoTQVwZ00FcGaNBXBmDQVwZc0FcGWNBXBpNkRwcDWEcGq1BHBKtMRwRbSEcFP0RHBwNARwVrQEcEQ0BHB2s8RwbTPEcGZzxHBhc8RwXbPEcFszxHBZc8RwWDPEcFczxHBWc8RwVfPEcFWzxHBungOwZd0DsGccQ7Bd28OwextDsHQbA7BA2wOwXBrDsEGaw7BumoOwYNqDsFcag7BP2oOwStqDsEcag7BEmoOwQpqDsEEag7BAWoOwf5pDsH8aQ7BoBkLwbgTC8F2DwvBZQwLwTAKC8GZCAvBdAcLwaIGC8EKBgvBnQULwU4FC8EWBQvB7QQLwdAEC8G7BAvBrAQLwaEEC8GZBAvBlAQLwZAEC8GNBAvBKb0Hwby0B8GorgfBRqoHwR6nB8HYpAfBNaMHwQeiB8EuoQfBkqAHwSKgB8HRnwfBl58HwW2fB8FPnwfBOp8HwSqfB8EfnwfBF58HwRGfB8ENnwfBfGQEwXpYBMHNTwTBi0kEwQhFBMHJQQTBcT8EwcI9BMGMPATBrTsEwQw7BMGYOgTBRToEwQk6BMHeOQTBvzkEwak5BMGZOQTBjjkEwYU5BMF/OQTBMxEBwR8AAcHE8wDB1+oAwWbkAMHB3wDBadwAwQDaAMFE2ADBBNcAwR/WAMF51QDBAtUAwazUAMFv1ADBQ9QAwSPUAMEM1ADB+9MAwe/TAMHn0wDBF4v7wKda+8CEN/vAFR77wLUL+8Bz/vrA4/T6wADu+sAK6frAeOX6wObi+sAN4frAuN/6wMPe+sAT3vrAlN36wDnd+sD33PrAyNz6wKbc+sCO3PrAMAn1wMPE9MDxkvTAym70wJ5U9MC1QfTADzT0wDgq9MAhI/TABh70wFka9MCzF/TAzBX0wG0U9MBxE/TAvBL0wDkS9MDbEfTAmBH0wGcR9MBEEfTACaXuwOFE7sCG/u3AR8vtwBWm7cAni+3AsXftwKRp7cCDX+3AN1jtwPVS7cAtT+3Ac0ztwH5K7cAVSe3AEUjtwFZH7cDQRu3Ab0btwClG7cD3Re3AhGnowIrj58C5gOfAYjjnwK0D58Bo3ebAssHmwKqt5sA1n+bAyJTmwEWN5sDbh+bA9oPmwCiB5sAkf+bAsH3mwKV85sDke+bAWnvmwPZ65sCveubAYGTiwNGr4cBGIuHAurzgwFpy4MAkPODAxhTgwEL438Cl49/Aw9TfwAjK38BMwt/AurzfwLe438DUtd/AwbPfwEKy38Avsd/AabDfwNqv38B0r9/AXKfcwM6r28Bz7trAQWHawOj42cBxrNnAsHTZwDBM2cDZLtnAohnZwFEK2cBF/9jAT/fYwJPx2MBy7djAeurYwFbo2MDM5tjAseXYwOXk2MBS5NjAg0bXwHf11cCw89TAbjHUwH6g08BGNdPAqubSwFOt0sCpg9LAeGXSwKNP0sDgP9LAgTTSwE8s0sBoJtLAKCLSwBkf0sDlHNLAUBvSwCwa0sBaGdLA+FbSwACd0MApRM/ACjzOwMR0zcAB4MzA13HMwAchzMAP5svAM7vLwCKcy8CrhcvAcXXLwL1py8BOYcvAOlvLwNpWy8C0U8vAcFHLwM9Py8CiTsvAQ+zNwGa3y8As9MnAdpPIwOCEx8B6uMbA9x/GwIXIxcCGiMXAH2TFwOZJxcDuNsXAPCnFwFofxcA7GMXAGhPFwGgPxcDADMXA1grFwHUJxcB4CMXAgBXKwDlYx8C4GMXACUzDwFvjwcDd+cDAaHfAwNYWwMC/z7/A15u/wCl4v8BPXr/AnUu/wB0+v8BgNL/AWy2/wE0ov8CpJL/ACiK/wCcgv8DMHr/An9nGwOKNw8ArxcDA73q+wAm5vMCfvLvArQe7wO2GusChJ7rAhOG5wFWxucBzj7nA5na5wCtlucBfWLnAJE+5wH5IucCzQ7nAQEC5wMQ9ucD7O7nAWjbEwJNewMBKB73AGTO6wFD7t8D7tbbA68a1wPoXtcCJnbTAlEO0wHgBtMA+0bPAM66zwM+Us8B0grPAM3WzwKRrs8DAZLPAyl+zwDdcs8ClWbPAQSTCwKrHvcCH5LnAuIG2wLSws8DU+7HAaLywwFHar8CDMK/A67GuwDdUrsDvEq7ALuWtwPPDrcDgq63AeZqtwOiNrcDYhK3AUH6twJx5rcA5dq3Aj82/wDLAu8DkWbfAe2uzwC39r8BQo63AzwCswLTPqsAg5qnA4D+pwGjHqMD1bqjAPS+owMgAqMAJ36fAl8anwOq0p8AnqKfA9J6nwFKYp8CLk6fAO8S7wNFRucDuXLXABu2wwG3zrMC6wanA05+nwEoMpsCo16TAsfijwI5Uo8BR2qLA5H+iwHg9osAGDaLA0+mhwFHQocDgvaHAkLChwPWmocAJoKHA+8kfwWrJH8EDyR/BucgfwYTIH8FfyB/BRMgfwTDIH8EjyB/BGcgfwRLIH8ENyB/BCcgfwQfIH8EFyB/BBMgfwQPIH8ECyB/BAsgfwQHIH8EByB/BG2YcwUllHMG0ZBzBSWQcwf1jHMHHYxzBoGMcwYRjHMFxYxzBY2McwVhjHMFRYxzBTGMcwUhjHMFGYxzBRGMcwUNjHMFCYxzBQWMcwUBjHMFAYxzBbQIZwUABGcFoABnBzv8YwWH/GMES/xjB2v4YwbL+GMGW/hjBgf4YwXP+GMFo/hjBYf4YwVv+GMFY/hjBVf4YwVP+GMFS/hjBUf4YwVD+GMFQ/hjBKJ8VwXWdFcE+nBXBYJsVwcGaFcFQmhXB/5kVwcWZFcGcmRXBf5kVwWqZFcFbmRXBUJkVwUmZFcFDmRXBP5kVwTyZFcE6mRXBOZkVwTiZFcE3mRXBjzwSwRw6EsFcOBLBGzcSwTc2EsGTNRLBHzUSwcs0EsGQNBLBZTQSwUc0EsExNBLBIjQSwRc0EsEPNBLBCjQSwQY0EsEDNBLBATQSwf8zEsH+MxLBBNsOwXzXDsH21A7BKNMOwd7RDsHy0A7BStAOwdLPDsF8zw7BP88OwRPPDsH0zg7B3s4Owc7ODsHCzg7Bus4OwbTODsGwzg7Brc4OwavODsGqzg7BDnsLwfd1C8FUcgvBum8Lwd5tC8GKbAvBl2sLwepqC8FuagvBFmoLwddpC8GqaQvBiWkLwXNpC8FiaQvBVmkLwU5pC8FIaQvBRGkLwUFpC8E/aQvBaR0IwRcWCMHaEAjBGg0IwWwKCMGCCAjBJAcIwSoGCMF3BQjB+AQIwZ0ECMFcBAjBLQQIwQwECMH0AwjB5AMIwdcDCMHPAwjByQMIwcQDCMHBAwjBJcMEwZ+4BMEVsQTBr6sEwdOnBMEQpQTBF6MEwa+hBMGtoATB9Z8EwXKfBMEUnwTB0Z4EwaGeBMF/ngTBZp4EwVWeBMFJngTBQJ4EwTmeBME1ngTBvW0BwaReAcHOUwHBCkwBwXpGAcGAQgHBqD8BwaA9AcEtPAHBIzsBwWY6AcHeOQHBfjkBwTk5AcEHOQHB5DgBwcs4AcG5OAHBrDgBwaM4AcGdOAHBiz78wFYT/MBA9PvA7937wO/N+8B7wvvASrr7wG60+8A/sPvAQa37wB6r+8CXqfvAgaj7wLmn+8Arp/vAxqb7wH2m+8BJpvvAJKb7wAqm+8D3pfvATbX1wLJ39cA5S/XANyv1wDwU9cDCA/XA9vf0wIXv9MB86fTALOX0wBji9MDk3/TAUt70wDPd9MBl3PTA09v0wGrb9MAg2/TA6tr0wMTa9MCp2vTAtUfvwFDw7sDssO7AJYPuwDBi7sCGSu7AjjnuwGct7sC2JO7Afx7uwA0a7sDhFu7AnBTuwP4S7sDWEe7AAxHuwGwQ7sAAEO7Asw/uwHwP7sBVD+7AYQDpwFmF6MB2K+jAPOrnwB2758AvmefA0IDnwFdv58DTYufA31nnwHhT58DkTufAn0vnwElJ58CeR+fAbUbnwJNF58D4ROfAiUTnwDpE58ABROfAu+ziwJpB4sAzw+HAwWbhwKQj4cAk8+DANtDgwB634MAfpeDAO5jgwAKP4MBpiODAs4PgwFSA4MDsfeDANHzgwPp64MAaeuDAenngwAd54MC2eODAjh7dwN4y3MAlg9vARwHbwDai2sApXdrAPSvawEcH2sBw7dnA6NrZwKHN2cAhxNnAVr3ZwHu42cADtdnAiLLZwMOw2cB/r9nAmK7ZwPOt2cB9rdnAS6rXwClr1sBwedXAA8XUwJk/1MDX3dPAy5bTwGtj08BlPtPAyiPTwLQQ08AIA9PAP/nSwD/y0sA/7dLArOnSwB7n0sBL5dLA/uPSwBDj0sBm4tLAAqbSwCH/0MBXuM/AdcDOwDgHzsAsfs3AphnNwI/QzMCum8zAknXMwCxazMCERszAbzjMwFsuzMAmJ8zA/yHMwFAezMCvG8zAzhnMwHcYzMCBF8zAlSbOwLwEzMCpVMrAHQbJwPEHyMDIScfAA73GwKZVxsCeD8bA9eXFwPfHxcBsssXA+qLFwOuXxcABkMXAWIrFwJSGxcBZhMXAwoLFwJ+BxcDPgMXAxzzKwOqQx8BbZMXA3KrDwHtUwsBrX8HAmNLAwBl6wMCIOcDAywrAwBfpv8Db0L/Adr+/wACzv8AUqr/As6O/wCOfv8Dhm7/Aqpm/wBiYv8D5lr/AA/HGwL2zw8A+/MDA38S+wLsEvcAJB7zAY127wHTiusAOi7rAUku6wDEdusDv+7nABeS5wN3SucBvx7nAb7+5wLe5ucCgtbnAtLK5wJ2wucAfr7nA/EHEwNl0wMC+K73Akmi6wJY3uMCR9rbAxBG2wCRqtcC39bTAqKK0wIhmtMALO7TAsxu0wC0FtMAE9bPAcOmzwCfhs8A627PA/dazwPfTs8DN0bPAVSjCwIjSvcC2+bnAzKS2wL3cs8DaL7LABf2wwF8isMCVg6/APA6vwCS4rsBrea7ACEyuwHQsrsAVF67AwQeuwMb8rcDr9K3ATe+twEnrrcBq6K3A086/wNXDu8AFZLfAmn+zwOUesMA0yq3A1TGswHgOq8C6MarAhY+pwNYfqcDuzajATpKowA1oqMDSSajAGTSowIQkqMBbGajAXhGowKgLqMCTB6jAO8S7wAFTucAmYLXAcfawwIMGrcAx26nA7sWnwII/psAYFKXAMEGkwOGlo8BxNKPAPeGiwKmkosDaeKLASFmiwJdCosBQMqLApyaiwE8eosBXGKLA1ykgwWApIMELKSDBzyggwaUoIMGHKCDBciggwWMoIMFYKCDBUCggwUsoIMFHKCDBRCggwUIoIMFBKCDBQCggwT8oIME/KCDBPyggwT4oIME+KCDBscUcwQXFHMGKxBzBM8QcwfbDHMHKwxzBq8McwZbDHMGGwxzBe8McwXPDHMFuwxzBasMcwWfDHMFlwxzBZMMcwWPDHMFiwxzBYsMcwWHDHMFhwxzB3GEZweBgGcEuYBnBsF8ZwVdfGcEXXxnB6l4ZwcpeGcG0XhnBpF4ZwZheGcGQXhnBi14ZwYdeGcGEXhnBgl4ZwYBeGcF/XhnBf14ZwX5eGcF+XhnBVv4Vwej8FcHl+xXBLfsVwav6FcFP+hXBDvoVwd/5FcG++RXBp/kVwZf5FcGL+RXBg/kVwX35FcF5+RXBdvkVwXT5FcFy+RXBcfkVwXD5FcFw+RXBXpsSwUuZEsHSlxLBx5YSwQmWEsGDlRLBJJUSweGUEsGxlBLBj5QSwXeUEsFmlBLBWpQSwVGUEsFLlBLBR5QSwUSUEsFClBLBQJQSwT+UEsE+lBLBSzkPwUc2D8EjNA/BnzIPwYsxD8HIMA/BPjAPwdwvD8GWLw/BZS8PwUIvD8EpLw/BGC8PwQsvD8ECLw/B/C4PwfguD8H1Lg/B8i4PwfEuD8HwLg/Bl9gLwTXUC8EZ0QvB5M4LwVTNC8E4zAvBb8sLweDKC8F7ygvBM8oLwQDKC8HcyQvBw8kLwbHJC8GkyQvBm8kLwZXJC8GQyQvBjckLwYvJC8GJyQvB7XkIwZFzCMENbwjB2GsIwZJpCMH2ZwjB0WYIwQFmCMFuZQjBBmUIwbxkCMGIZAjBY2QIwUhkCME2ZAjBKWQIwR9kCMEZZAjBFGQIwRFkCMEOZAjBRB4FwQwVBcF/DgXB1wkFwYkGBcExBAXBhwIFwVkBBcGEAAXB7P8EwYH/BME0/wTB/v4Ewdj+BMG9/gTBqv4EwZz+BMGT/gTBjP4EwYf+BMGE/gTB+sYBwaO5AcEjsAHBYqkBwZWkAcEtoQHBw54BwQydAcHVmwHB+JoBwVyaAcHtmQHBn5kBwWeZAcFAmQHBJJkBwRCZAcECmQHB+JgBwfGYAcHsmAHBAOz8wHnF/MD6qfzAZpb8wHmI/MCVfvzAkHf8wJRy/MAMb/zAi2z8wMRq/MCCafzAnWj8wPtn/MCJZ/zAOGf8wP5m/MDVZvzAuGb8wKRm/MCVZvzAIFz2wK8k9sD//PXArOD1wH7M9cAkvvXA8rP1wLas9cCTp/XA76P1wFqh9cCFn/XAOZ71wE2d9cCmnPXAMJz1wNyb9cChm/XAd5v1wFmb9cBEm/XA6uXvwIWW78BuXe/AjDTvwF0X78CSAu/AyPPuwEXp7sDQ4e7AhdzuwMPY7sAa1u7AN9TuwODS7sDu0e7AQtHuwMjQ7sBy0O7ANNDuwAnQ7sDqz+7AqpPpwMEi6cAJ0ejAQJbowCNs6MARTujApDjowGYp6MCRHujA4RbowGwR6MCNDejAzwrowN0I6MB8B+jAggbowNAF6MBTBejA+gTowLoE6MCOBOjAdXLjwOTT4sDMX+LAsAviwCfP4cDHo+HAy4ThwLdu4cACX+HA2FPhwOtL4cBLRuHATkLhwHo/4cB5PeHADTzhwAs74cBUOuHA0znhwHc54cA2OeHACZTdwGC33MBqFNzADJ3bwHtG28AnCNvAedvawI672sDOpNrAnpTawByJ2sDxgNrAJXvawAh32sAedNrADXLawJZw2sCMb9rAz27awEpu2sDrbdrAKA3YwDbf1sC1/NXAP1XVwIba1MBvgdTAQkHUwD4T1MBb8tPA6trTwDvK08BgvtPA9LXTwPqv08C9q9PAvKjTwJqm08AYpdPABqTTwEOj08C6otPAufTSwGZg0cDyKtDAeULPwGeWzsA8GM7AjrzNwHt6zcAWS83ANSnNwA0RzcDc/8zAo/PMwPbqzMDN5MzAbuDMwFXdzMAj28zAlNnMwHrYzMCy18zA72DOwMpRzMBYtMrAQnfJwK+IyMDl18fAMVbHwNr3xsDTs8bAA4PGwBxgxsA5R8bAgTXGwOkoxsAbIMbASRvGwN4XxsBxFcbAuRPGwIESxsCkEcbAOGTKwKjJx8C9r8XA7gjEwCnEwsBcz8HArTXBwOjYwMBMnsDAOnTAwCNWwMCuQMDAZjHAwIomwMDTHsDAWRnAwHcVwMC1EsDAwRDAwF8PwMBkDsDAjQjHwMLZw8BiM8HAlw6/wEhevcAiT7zAv7C7wIE8u8A46rrAULC6wMGGusAKabrA2FO6wMJEusAIOrrAajK6wAEtusArKbrAcya6wIUkusAnI7rAtE3EwESLwMBeUL3AIJ66wCNzuMCeNbfAa1q2wM69tcDoSrXATf60wDTHtMDVn7TAz4O0wNVvtMCdYbTAgVe0wFRQtMA8S7TAn0e0wA9FtMA+Q7TAbyzCwHrdvcAKD7rAC8i2wOIJtMBgY7LAiDyxwMVosMDr06/AOmevwCUYr8AM367AFbauwMyYrsDqg67ADHWuwHtqrsD6Yq7Apl2uwN9ZrsAxV67AF9C/wH7Hu8A5brfA3ZOzwMpAsMCt8K3AP2WswNdLq8BZe6rAveCpwA11qcDMKanAf/OowI/MqMC7sKjA5JyowMaOqMDPhKjA4H2owPV4qMB4dajAO8S7wDBUucBkY7XA7f+wwLwZrcCC9KnA2+ynwO1xpsCOUqXA8IekwK70o8B3i6PA8T6jwLgHo8Ad4KLAz8OiwKCvosBEoaLADpeiwM6PosCpiqLA4YUgwX+FIME7hSDBCoUgweiEIMHQhCDBv4QgwbSEIMGrhCDBpYQgwaGEIMGehCDBnIQgwZuEIMGahCDBmYQgwZmEIMGYhCDBmIQgwZiEIMGYhCDBQSEdwbIgHcFNIB3BByAdwdUfHcGyHx3Bmh8dwYgfHcF8Hx3BdB8dwW4fHcFpHx3BZh8dwWQfHcFjHx3BYh8dwWEfHcFhHx3BYB8dwWAfHcFgHx3BTL0ZwXu8GcHnuxnBgLsZwTe7GcEEuxnB4LoZwca6GcG0uhnBqLoZwZ+6GcGZuhnBlboZwZG6GcGPuhnBjroZwY26GcGMuhnBi7oZwYu6GcGLuhnBklkWwV9YFsGHVxbB71YWwYRWFsE5VhbBBFYWwd9VFsHFVRbBslUWwaVVFsGcVRbBllUWwZFVFsGOVRbBjFUWwYtVFsGJVRbBiVUWwYhVFsGIVRbBS/YSwYn0EsFN8xLBbvISwdHxEsFj8RLBFfESwd/wEsG48BLBnfASwYrwEsF98BLBc/ASwW3wEsFo8BLBZfASwWPwEsFh8BLBYPASwV/wEsFf8BLBxpMPwTKRD8Fijw/BG44PwTWND8GUjA/BIowPwdKLD8GZiw/BcosPwVaLD8FCiw/BNYsPwSuLD8Ekiw/BH4sPwRyLD8Eaiw/BGIsPwReLD8EWiw/BbzIMwakuDMEALAzBISoMwdAoDMHjJwzBPCcMwccmDMF0JgzBOiYMwRImDMH1JQzB4SUMwdIlDMHIJQzBwSUMwbwlDMG5JQzBtyUMwbUlDMG0JQzB4tIIwV3NCMF4yQjBusYIwczECMFxwwjBfMIIwdDBCMFXwQjBAsEIwcbACMGcwAjBfsAIwWnACMFbwAjBUMAIwUnACMFEwAjBQMAIwT7ACME8wAjBAXYFwe5tBcE8aAXBOGQFwWRhBcFnXwXBAF4FwQRdBcFSXAXB1VsFwX1bBcFAWwXBFFsFwfZaBcHgWgXB0VoFwcZaBcG/WgXBuloFwbZaBcGzWgXBDR0CwUMRAsHwCALBEAMCwez+AcEB/AHB8/kBwYH4AcF99wHBxvYBwUX2AcHq9QHBq/UBwX71AcFe9QHBSPUBwTn1AcEu9QHBJvUBwSD1AcEd9QHBqJP9wFBx/cABWf3A1Ef9wLY7/cArM/3AJy39wOoo/cDvJf3A1iP9wFwi/cBSIf3AlyD9wBQg/cC3H/3Adh/9wEgf/cAoH/3AEh/9wAIf/cD2Hv3Ay/32wOzL9sCFqPbAdI/2wL599sA/cfbAcGj2wDti9sDcXfbAyVr2wJ9Y9sAZV/bAB1b2wEZV9sC+VPbAX1T2wBxU9sDsU/bAy1P2wLRT9sCjU/bAuH/wwKE38MA9BPDAvt/vwObF78Cis+/Av6bvwKid78BCl+/AwJLvwJSP78BYje/AxovvwKuK78Dkie/AWInvwPaI78CxiO/AgIjvwF6I78BGiO/AYCPqwNW76cCTcenAnDzpwP4W6cBY/OjAg+nowDjc6MDZ0ujAP8zowJnH6MBTxOjABcLowGbA6MBDv+jAdb7owOW96MB/vejAOL3owAa96MDivOjAh/XjwLJi48Ag+OLAo6viwA914sBITuLAzzLiwGMf4sCuEeLABAjiwDQB4sBp/OHACPnhwKj24cD89OHAz/PhwPzy4cBn8uHA/vHhwLTx4cCA8eHAvwfewEw53cBGotzAnTTcwNXl28CYrdvAn4XbwExp28BFVdvAIkfbwCo928AkNtvAMjHbwLct28BDK9vAiinbwFMo28B5J9vA3ybbwHMm28AnJtvACW/YwI9R18B4fdbAJeLVwFBx1cArINXAOebUwAW91MDSn9TAK4vUwJd81MBPctTAEWvUwPdl1MBfYtTA2F/UwBFe1MDRXNTA71vUwFFb1MDhWtTAEEPTwL7A0cDrm9DADcLPwFEiz8A7rs7AqVrOwPQezsB99M3AYtbNwBfBzcAOss3AdKfNwPufzcC4ms3AA5fNwGiUzcCSks3ASJHNwGCQzcC8j83ASZvOwIGezMAnE8vA1ebJwBAHycDQYsjAYevHwFGVx8DMV8fACCzHwP4Mx8AK98bAiefGwJncxsDk1MbAd8/GwKTLxsD0yMbAEMfGwLvFxsDLxMbAz4vKwGsCyMDU+sXAMGbEwFQyw8CFTMLAo6PBwB1CwcAx/sDAVtjAwH29wMB9qsDAE53AwJuTwMDwjMDAPYjAwO6EwMCagsDA94DAwNB/wMAAf8DAPSDHwO//w8CQasHADVi/wPm5vcBtnLzAIAG8wKeVu8ASSLvAoxC7wDbrusCr0LrA4726wKCwusBFp7rAraC6wAicusDDmLrAdpa6wNiUusC0k7rAglnEwNShwMAmdb3AvNO6wC62uMAdc7fA/KG2wKMOtsBPpLXAkVe1wBgktcBxALXALOe0wFLVtMC3yLTA07+0wI+5tMAltbTACrK0wNyvtMBWrrTAkTDCwIHovcCBJLrAc+u2wO89tMD8lbLAk3qxwDatsMCNIbDA7ryvwFd0r8BgQK/AZxuvwDEBr8Cm7q7Aj+GuwFPYrsDR0a7AO82uwAHKrsC8x67AW9G/wC3Lu8B/eLfAQaizwNdisMC3Fq7AWpiswMyHq8AAw6rAYjKqwFvJqcABgqnAklCpwGstqcB/FKnA3wKpwG72qMCn7ajAeOeowB3jqMAM4KjAO8S7wFtVucCnZrXAfAmxwBUtrcCsDarAYxOowIWjpsBskaXAxcykwLpCpMBy36PAGZmjwMZmo8D7QqPAnCmjwKkXo8D9CqPADgKjwMH7osBS96LAG94gwcvdIMGT3SDBbN0gwVHdIME+3SDBMd0gwSfdIMEh3SDBHN0gwRndIMEX3SDBFt0gwRXdIMEU3SDBE90gwRPdIMET3SDBEt0gwRLdIMES3SDBBXkdwY94HcE8eB3BA3gdwdt3HcG/dx3Bq3cdwZ13HcGUdx3BjXcdwYl3HcGFdx3Bg3cdwYJ3HcGAdx3BgHcdwX93HcF/dx3Bf3cdwX53HcF+dx3B+hQawUsUGsHRExrBfBMawUETGsEYExrB+xIawecSGsHYEhrBzxIawcgSGsHDEhrBwBIawb0SGsG8EhrBuxIawboSGsG5EhrBuRIawbkSGsG4EhrBFrEWwRWwFsFhrxbB464WwYuuFsFOrhbBI64WwQWuFsHwrRbB4q0WwditFsHQrRbBzK0WwcitFsHGrRbBxK0WwcOtFsHCrRbBwa0WwcGtFsHBrRbBjk0TwRFME8EHSxPBTUoTwctJE8FxSRPBMkkTwQVJE8HnSBPB0UgTwcJIE8G4SBPBsEgTwatIE8GoSBPBpUgTwaNIE8GiSBPBoUgTwaFIE8GgSBPBqOoPwXXoD8Hr5g/B2OUPwRnlD8GT5A/BNeQPwfTjD8HG4w/BpuMPwZDjD8GB4w/BduMPwW7jD8Fp4w/BZeMPwWPjD8Fh4w/BYOMPwV/jD8Fe4w/BxYgMwYaFDMFAgwzBqoEMwY+ADMHJfwzBPn8Mwd5+DMGafgzBa34MwUp+DMEzfgzBI34MwRh+DMEQfgzBC34MwQd+DMEEfgzBA34MwQF+DMEAfgzBdSgJwakjCcFPIAnB9x0JwVMcCcEvGwnBYhoJwdMZCcFwGQnBKhkJwfkYCcHYGAnBwBgJwa8YCcGkGAnBnBgJwZYYCcGSGAnBjxgJwY4YCcGMGAnBgsoFwXDDBcF9vgXBB7sFwZu4BcHrtgXBvLUFwem0BcFWtAXB77MFwaezBcF1swXBUrMFwTqzBcEoswXBHbMFwRSzBcEOswXBCrMFwQizBcEGswXBFnACwaxlAsFgXgLBRFkCwbFVAsEyUwLBc1ECwTtQAsFhTwLByU4CwV9OAsEVTgLB4U0Cwb1NAsGkTQLBkk0CwYZNAsF9TQLBd00CwXNNAsFwTQLBtjX+wBsX/sCeAf7AjvL9wAPo/cCj4P3Ae9v9wOHX/cBd1f3Am9P9wGHS/cCF0f3A7ND9wIHQ/cA30P3AA9D9wN7P/cDFz/3As8/9wKfP/cCez/3Ac5r3wJtt98AITvfA2zf3wFAo98BvHffA0hX3wIAQ98DIDPfALwr3wF8I98AbB/fAOAb3wJoF98AsBffA3wT3wKkE98CDBPfAaQT3wFcE98BKBPfANRXxwMjT8MCIpfDA9oTwwBVu8MALXvDA0FLwwPVK8MB3RfDAoEHwwPI+8MATPfDAxDvwwNo68MA3OvDAxTnwwHY58MA+OfDAFznwwPw48MDpOPDAiK/qwKdQ6sA0DerAgt3pwOi76cBOpOnAwJPpwCmI6cAOgOnAYnrpwGx26cCoc+nAuXHpwGBw6cBvb+nAxm7pwFFu6cD/benAxW3pwJ1t6cCBbenA63XkwAPu48BDjOPAu0bjwIwV48Dj8uLAiNriwHTJ4sB+veLAILXiwEav4sAvq+LAVKjiwFWm4sDxpOLA+KPiwEqj4sDRouLAfKLiwEGi4sAYouLAo3newJ243cC8LN3ADcjcwGGA3MCpTdzA6CncwMgQ3MAo/9vA0PLbwC3q28Aj5NvA69/bwPjc28Dp2tvAednbwHjY28DF19vAR9fbwPDW28Cz1tvA4c/YwCjC18Cx+9bAtmvWwAgE1sAputXA24XVwPtg1cAOR9XA3zTVwCIo1cA4H9XA/BjVwKEU1cCWEdXAdg/VwPoN1cDxDNXAOAzVwLYL1cBcC9XA9pDTwBsg0sA0C9HAKT/QwPmqz8A4QM/AFPTOwCa+zsAcmM7AXn3OwJpqzsB0Xc7AQVTOwNNNzsBUSc7AMEbOwP5DzsB2Qs7AZEHOwKVAzsAfQM7AmtXOwNbqzMAGccvAy1TKwAuDycCK6sjAn3zIwCYuyMCK9sfAT8/HwLezx8BaoMfAyZLHwEuJx8CngsfAA37HwMZ6x8CCeMfA7XbHwNJ1x8ANdcfAibPKwCo7yMCSRcbAk8LEwPKew8Bax8LAayrCwEC5wcCcc8HAq0fBwLUowcD0EsHAsgPBwIj6wMDE9MDAvPDAwOvtwMDz68DAlOrAwJ7pwMDz6MDAETjHwEAmxMDAocHANKG/wNgUvsDd8bzAj068wD7ru8AqpLvAqHG7wP5Nu8DlNLvARyO7wO4Wu8CZDrvA5Ai7wOcEu8AeArvALAC7wND+usDd/brAZWXEwIe4wMASmr3AXgm7wL39uMAGr7fA8um2wKdctsBR+rXA8bO1wPSBtcCpXrXADka1wDQ2tcAZK7XAUyO1wOQdtcAYGrXAcBe1wJYVtcBKFLXAujTCwJvzvcAaOrrAAA+3wAZytMCox7LAIrexwNbzsMAEbbDAZg+wwM3Mr8CLna/AMXyvwL1kr8BHVK/AvkivwKxAr8AHO6/AFTevwFM0r8BmMq/AoNK/wOPOu8DZgrfAx7yzwAuFsMBLPK7AlsqswIzCq8CtCKvAdYGqwCcgqsB82qnAqqmpwO+JqcCgc6nA+WOpwAFZqcBVUanA90upwDdIqcCYRanAO8S7wFpWucDwabXAGxOxwI5ArcCpJqrAgTmowEXUpsD3zqXAsA+lwJiOpMDGMaTAzO+jwPTBo8CeoaPA4IqjwOx6o8C+b6PA7GejwHRio8ChXqPAwDIhwX4yIcFRMiHBMTIhwRsyIcEMMiHBAjIhwfoxIcH1MSHB8jEhwe8xIcHuMSHB7TEhwewxIcHrMSHB6zEhwesxIcHqMSHB6jEhweoxIcHqMSHBSc0dwefMHcGkzB3BdcwdwVTMHcE+zB3BLswdwSPMHcEczB3BFswdwRPMHcEQzB3BD8wdwQ3MHcEMzB3BDMwdwQzMHcELzB3BC8wdwQvMHcELzB3BHGkawYpoGsEmaBrB4GcawbBnGsGOZxrBd2cawWdnGsFcZxrBVGcawU9nGsFLZxrBSGcawUdnGsFFZxrBRWcawURnGsFEZxrBQ2cawUNnGsFDZxrBGAUXwUAEF8GqAxfBQgMXwfoCF8HIAhfBpQIXwY0CF8F8AhfBcQIXwWkCF8FjAhfBYAIXwV0CF8FbAhfBWgIXwVkCF8FYAhfBWAIXwVgCF8FXAhfBW6ETwRigE8E4nxPBnZ4TwTKeE8HnnRPBtJ0TwZCdE8F3nRPBZp0TwVqdE8FSnRPBTJ0TwUidE8FGnRPBRJ0TwUKdE8FBnRPBQZ0TwUCdE8FAnRPBIz4QwUI8EMH0OhDBDToQwW05EMH+OBDBsTgQwXw4EMFXOBDBPTgQwSw4EMEfOBDBFzgQwRE4EMENOBDBCjgQwQg4EMEHOBDBBjgQwQU4EMEFOBDBydsMwf3YDMEM1wzBtNUMwcXUDMEg1AzBrdMMwV7TDMEn0wzBAdMMwebSDMHU0gzBx9IMwb7SDMG40gzBtNIMwbHSDMGv0gzBrtIMwa3SDMGs0gzBz3oJwaV2CcHBcwnBwHEJwVxwCcFmbwnBu24JwURuCcHybQnBuW0JwZJtCcF3bQnBZG0JwVdtCcFObQnBR20JwUNtCcFAbQnBPm0JwTxtCcE7bQnB7RsGwbwVBsFvEQbBcw4GwWEMBsHxCgbB8wkGwUIJBsHICAbBcwgGwTgIBsEQCAbB8wcGweAHBsHSBwbByQcGwcIHBsG+BwbBuwcGwbkHBsG3BwbBM8ACwQG3AsGcsALBK6wCwRapAsHzpgLBd6UCwXCkAsG6owLBO6MCweSiAsGnogLBfaICwWCiAsFMogLBPqICwTSiAsEtogLBKaICwSWiAsEjogLBXdL+wBm3/sAbpP7A5pb+wLqN/sBch/7A8YL+wOF//sDBff7ASXz+wEN7/sCPev7AEXr+wLp5/sB+ef7AVHn+wDh5/sAjef7AFnn+wAx5/sAFef7APDL4wOwJ+MDG7ffAKdr3wIbM98AMw/fAebz3wOm398C/tPfAjrL3wAmx98D7r/fAQK/3wL+u98BlrvfAJ673wPyt98DerffAya33wLut98CxrffAeKbxwBtr8cCAQfHAcSTxwDEQ8cAcAvHAU/jwwIjx8MDS7PDAjunwwErn8MC45fDAoeTwwODj8MBb4/DA/uLwwL7i8MCR4vDAcuLwwF3i8MBO4vDAMzjrwEzh6sAPpOrAH3nqwB9b6sA3RurArDfqwJEt6sCNJurAsCHqwFAe6sD5G+rAWhrqwDoZ6sByGOrA6BfqwIkX6sBGF+rAGBfqwPgW6sDiFurAn/PkwOF15MBIHOTAG93jwMuw48DTkePAPXzjwDht48DJYuPAilvjwIRW48AHU+PAnVDjwPBO48DHTePA+UzjwGpM48AHTOPAw0vjwJNL48ByS+PAq+newFA13sDOs93AbVfdwEIW3cCH6NzAj8jcwEay3MDEotzA/ZfcwIKQ3MBRi9zAuIfcwDmF3MB+g9zAS4LcwHaB3MDjgNzAfIDcwDaA3MAFgNzAoi/ZwPYw2MBdd9fA+fHWwMCS1sCHT9bAViDWwFf/1cBU6NXAUdjVwDDN1cB2xdXAGsDVwGK81cDOudXABLjVwMe21cDrtdXAU7XVwOq01cChtNXAZN7TwG9+0sDDeNHAyrnQwGQw0MBEzs/A7YjPwDtYz8ArNs/Aah7PwOENz8BjAs/AaPrOwN/0zsAI8c7AXu7OwIXszsA+687AW+rOwL7pzsBR6c7A2g/PwLw2zcDrzcvAF8HKwJz8ycAXb8nA+wnJwHbCyMA3kMjAD23IwIhUyMB2Q8jAmDfIwFovyMCiKcjAqiXIwOoiyMACIcjAsB/IwMUeyMAjHsjAYNvKwN5zyMDsj8bACR7FwPYJxMDWP8PAF67CwOlFwsAl/MHATMjBwAOkwcAKjsHAoIDBwE53wcDWcMHAWWzBwDxpwcATZ8HAlGXBwItkwcDTY8HACFDHwLBMxMDq2MHAAOq/wNhuvsBcU73AKaK8wFc9vMA//LvAZc67wEquu8Dhl7vARYi7wGt9u8DhdbvApnC7wAVtu8CBarvAwmi7wI1nu8C2ZrvAXnHEwFzPwMAgv73AAD+7wPtEucBX6bfAuS+3wHKptsD8TLbAewy2wA/ftcBCv7XAEKm1wJuZtcDcjrXAZoe1wDeCtcCgfrXAIny1wGh6tcA1ebXA6TjCwMr+vcDTT7rAsDK3wCGmtMBe+LLAMfKxwBs6scD+tbDAHV+wwKIhsMCq9q/AmNivwJ3Dr8ACta/A2qqvwM2jr8Donq/Ag5uvwCmZr8CHl6/A5tO/wJ7Su8BFjbfAbNGzwGKnsMBlYa7A7fuswBP8q8BeTKvAB86qwONzqsDqM6rA5gaqwGPnqcBm0anAFsKpwHG3qcAMsKnAYqupwCioqcDrpanAO8S7wFpXucA+bbXAzByxwCZUrcB3P6rAMV+owCgEp8AtC6bAelSlwAfYpMAIgqTABEWkwBwapMAu/KPAzuejwKDZo8DEz6PA68ijwCvEo8DgwKPABIQhwc6DIcGpgyHBj4MhwX6DIcFygyHBaoMhwWSDIcFggyHBXYMhwVuDIcFagyHBWYMhwVmDIcFYgyHBWIMhwViDIcFYgyHBWIMhwVeDIcFXgyHBex4ewSoeHsHyHR7BzB0ewbIdHsGgHR7Bkx0ewYsdHsGFHR7BgR0ewX4dHsF8HR7Bex0ewXodHsF5HR7BeR0ewXkdHsF4HR7BeB0ewXgdHsF4HR7B5rkawW25GsEZuRrB4Lgawbm4GsGeuBrBi7gawX64GsF1uBrBb7gawWu4GsFouBrBZrgawWW4GsFkuBrBY7gawWO4GsFjuBrBYrgawWK4GsFiuBrBylUXwRRVF8GXVBfBQVQXwQVUF8HdUxfBwVMXwa5TF8GgUxfBl1MXwZFTF8GNUxfBilMXwYhTF8GGUxfBhVMXwYVTF8GEUxfBhFMXwYRTF8GEUxfB4fETwc/wE8ET8BPBku8TwTnvE8H87hPB0u4TwbXuE8Gh7hPBk+4TwYruE8GD7hPBf+4TwXzuE8F67hPBeO4TwXfuE8F37hPBdu4TwXbuE8F27hPBZI4QwcqMEMGvixDB7YoQwWeKEMELihDBzIkQwaGJEMGDiRDBbokQwWCJEMFWiRDBUIkQwUuJEMFIiRDBRokQwUSJEMFDiRDBQokQwUKJEMFCiRDBpSsNwT0pDcGUJw3BcCYNwaclDcEdJQ3BviQNwX0kDcFQJA3BMSQNwRwkDcENJA3BAyQNwfwjDcH3Iw3B9CMNwfIjDcHwIw3B7yMNwe8jDcHuIw3BGMoJwXrGCcH9wwnBRsIJwRjBCcFJwAnBur8JwVi/CcEUvwnB5r4Jwca+CcGwvgnBob4JwZa+CcGPvgnBir4JwYe+CcGEvgnBg74JwYK+CcGBvgnBZWoGwflkBsE8YQbBql4GweRcBsGsWwbB1loGwUJaBsHdWQbBl1kGwWdZBsFGWQbBL1kGwR9ZBsEVWQbBDVkGwQhZBsEFWQbBAlkGwQFZBsH/WAbBhQ0DwWYFA8HM/wLB8PsCwUf5AsFy9wLBMPYCwVL1AsG59ALBUPQCwQj0AsHX8wLBtPMCwZ3zAsGN8wLBgvMCwXrzAsF18wLBcfMCwW/zAsFt8wLB0Gn/wIZR/8C+QP/AKjX/wC8t/8CwJ//A5yP/wEwh/8CCH//ARh7/wG0d/8DYHP/AcRz/wCsc/8D6G//A2Rv/wMIb/8CyG//Apxv/wKAb/8CbG//ATMX4wBKh+MD6h/jAo3b4wKxq+MBsYvjAvlz4wNVY+MAkVvjASlT4wART+MAkUvjAiVH4wB9R+MDWUPjApFD4wIJQ+MBqUPjAWVD4wE5Q+MBHUPjAlzPywMH98cBX2PHAa77xwICs8cAioPHAnJfxwL2R8cCzjfHA64rxwAGJ8cCwh/HAyIbxwCiG8cC7hfHAb4XxwDuF8cAYhfHA/4TxwO6E8cDjhPHAa73rwN1t68BINuvAow/rwNz06sBY4urAkdXqwMLM6sCxxurAhMLqwKS/6sCpverATbzqwF276sC4uurAR7rqwPm56sDDuerAn7nqwIW56sB0uerApG7lwFz65MBFqOTA427kwPpG5MBQK+TAMBjkwPwK5MDhAeTAnPvjwEv348BS9OPAR/LjwN/w48Dn7+PAPe/jwMfu48B37uPAP+7jwBnu48D/7ePAz1ffwGKv3sCIN97A1OLdwJen3cBfft3AzGHdwAlO3cBkQN3A/DbdwIEw3cALLN3A+CjdwNsm3cBnJd3AZyTdwLcj3cA+I93A6yLdwLEi3cCKIt3AP47ZwPCd2MB58NfA8XTXwI0d18Bm4NbA1bXWwFCY1sDlg9bAzXXWwBRs1sBhZdbAxWDWwJhd1sBpW9bA6FnWwOBY1sAqWNbArVfWwFdX1sAbV9bATivUwK/b0sCP5NHA7DHRwJiy0MByWNDAUxnQwF7tz8Dgzs/AyLnPwDerz8Aroc/AP5rPwHuVz8Azks/A8Y/PwGSOz8BSjc/AlozPwBWMz8C8i8/AAUrPwCmCzcDJKczAsCvLwL9zysB+8MnAiJPJwGBSycD8JMnAfQXJwLLvyMCl4MjAQ9bIwBzPyMAvysjAy8bIwHbEyMDbwsjAwMHIwP7AyMB4wMjAUQPLwICsyMDX2cbAhnjFwFdzxMD1tcPArC7DwNDOwsCPi8LAsFzCwCg8wsCkJcLAFxbCwF0LwsD4A8LA4f7BwGD7wcD3+MHATvfBwCr2wcBh9cHAIGjHwDxzxMAHEMLAaDLAwO7HvsCFu73A9v28wLORvMBuULzA0ia8wOwJvMDq9bvAF+i7wI7eu8D717vAdNO7wFfQu8AyzrvAuMy7wLTLu8ABy7vAa33EwFLmwMBK5L3AmXS7wN6LucCqLrjAUHO3wBH2tsBUnbbASWG2wAg4tsBiG7bAjAe2wNn5tcBl8LXA4em1wGTltcBN4rXALeC1wLfetcC13bXAID3CwAwKvsCtZbrAfla3wDratMAXKLPAyi2ywE9+scARArHAB6ywwIZzsMAmTLDA1jCwwAMesMAOEbDAHQiwwPQBsMC2/a/Ay/qvwMj4r8Bn96/AK9W/wGDWu8DDl7fAMeazwNjJsMD+ha7AWSytwDE0rMAWjqvAGBirwKbEqsDniarA8GCqwH9EqsDPMKrANSOqwNMZqsBcE6rA6A6qwNcLqsC7CarAPMS7wFtYucCRcLXAjSaxwN1nrcAUWKrAbYSowFQzp8ANRqbAopmlwBEfpcBsz6TAYZekwE9wpMAyVaTAbkKkwHg1pMCILKTAXyakwCAipMA1H6TAGNIhwezRIcHO0SHButEhwavRIcGi0SHBm9EhwZfRIcGU0SHBktEhwZDRIcGP0SHBj9EhwY7RIcGO0SHBjtEhwY7RIcGO0SHBjdEhwY3RIcGN0SHBgGwewT5sHsEQbB7B8WsewdxrHsHNax7Bw2sewbxrHsG4ax7BtWsewbNrHsGxax7BsGsewa9rHsGvax7Br2sewa5rHsGuax7Brmsewa5rHsGuax7BhwcbwSIHG8HdBhvBrgYbwY4GG8F4BhvBaQYbwV8GG8FYBhvBVAYbwVAGG8FOBhvBTQYbwUwGG8FLBhvBSgYbwUoGG8FKBhvBSgYbwUoGG8FKBhvBWaMXwcGiF8FYohfBEaIXweChF8G/oRfBqaEXwZmhF8GPoRfBh6EXwYOhF8F/oRfBfaEXwXuhF8F6oRfBeqEXwXmhF8F5oRfBeKEXwXihF8F4oRfBTT8UwWY+FMHIPRTBXD0UwRI9FMHgPBTBvjwUwaY8FMGXPBTBjDwUwYQ8FMF/PBTBfDwUwXk8FMF4PBTBdzwUwXY8FMF1PBTBdTwUwXU8FMF0PBTBmNsQwTraEMFK2RDBp9gQwTfYEMHr1xDBt9cQwZTXEMF71xDBa9cQwV/XEMFY1xDBU9cQwU/XEMFM1xDBS9cQwUrXEMFJ1xDBSNcQwUjXEMFI1xDBg3gNwXB2DcEFdQ3BDnQNwWVzDcHxcg3BonINwW1yDcFIcg3BL3INwR5yDcEScg3BCnINwQVyDcEBcg3B/nENwf1xDcH7cQ3B+3ENwfpxDcH6cQ3BdhYKwVMTCsEuEQrBtw8KwbYOCsEIDgrBkA0KwT8NCsEHDQrB4QwKwccMCsG1DArBqQwKwaEMCsGcDArBmAwKwZUMCsGTDArBkgwKwZEMCsGRDArBDLYGwU2xBsEOrgbB16sGwVOqBsFKqQbBlagGwRmoBsHFpwbBjKcGwWSnBsFJpwbBN6cGwSunBsEipwbBHKcGwRinBsEWpwbBFKcGwROnBsESpwbBKVgDwf5QA8EVTAPBukgDwW9GA8HeRAPBzEMDwRFDA8GRQgPBOkIDwf5BA8HWQQPBukEDwadBA8GaQQPBkUEDwYtBA8GHQQPBhEEDwYJBA8GBQQPBQPz/wJ7m/8DL1//ApM3/wLPG/8D0wf/At77/wIC8/8D9uv/A9bn/wEC5/8DFuP/Acbj/wDi4/8ARuP/A9rf/wOS3/8DXt//Az7f/wMm3/8DFt//AyVP5wD0z+cDgHPnAiw35wAwD+cDe+/jA9vb4wJzz+MBS8fjAwe/4wLDu+MD27fjAdu34wB/t+MDk7PjAu+z4wKDs+MCN7PjAgOz4wHfs+MBx7PjArbzywN+L8sA6avLAHFPywEJD8sBnOPLA+zDywOgr8sBwKPLAEibywHQk8sBZI/LAmCLywBQi8sC6IfLAfSHywFMh8sA3IfLAIyHywBYh8sANIfLAPT/swHD268ACxOvAPaHrwFeJ68DzeOvAum3rwAxm68DMYOvANl3rwMNa68AXWevA81frwCtX68CjVuvARlbrwAdW68DbVevAvlXrwKpV68CcVevA+eblwIB75cBRMOXAOPzkwEjY5MCTv+TAoa7kwAaj5MAVm+TAqJXkwPOR5MBqj+TAr43kwIGM5MCyi+TAJovkwMWK5MCEiuTAV4rkwDiK5MAjiuTACMTfwNYm38D4t97AVmrewIM03sBfD97A1fXdwFDk3cBP2N3AGdDdwHzK3cCnxt3ACMTdwD7C3cAFwd3AMMDdwJ6/3cA7v93A977dwMi+3cCpvt3AruvZwA8J2cAHZ9jAq/TXwIGk18DmbNfAhEbXwB4s18AAGtfAmA3XwBoF18BM/9bAVfvWwJ/41sDF9tbAgvXWwKX01sAO9NbAp/PWwGHz1sAx89bAqHfUwM4308CPTtLAjqfRwJox0cDW3tDAZaXQwLp90MBwYtDAtk/QwOFC0MAZOtDAGDTQwP4v0MAxLdDARyvQwPgp0MAUKdDAeCjQwA4o0MDFJ9DABoTPwBLNzcCVhMzAjZTLwHLoysDHbsrAWBnKwAHeycADtcnAzpjJwHGFycAteMnAGG/JwONoycClZMnAv2HJwMRfycBqXsnAfl3JwN1cycBvXMnAVyvLwAblyMBII8fA/tHFwA3bxMC0KcTAMqzDwAhUw8C8FsPAYezCwDnPwsA0u8LAfK3CwBmkwsCtncLASpnCwEqWwsA+lMLA2ZLCwOSRwsA+kcLAV4DHwN+ZxMAPR8LAYHrAwAwgv8ARIr7AWWu9wMbyvMCrrLzAA3y8wBNhvMA3T7zA+UK8wJg6vMDdNLzA8jC8wEUuvMBxLLzAMiu8wFgqvMDDKbzAjYnEwGb9wMCOCb7AJKq7wFvSucAudLjAu7S3wPY/t8D37bbAtrS2wBGNtsA0c7bAfGG2wFdVtsAGTbbAV0e2wHRDtsDMQLbA/D62wL89tsDnPLbAXkHCwGIVvsCle7rAZ3q3wEgOtcDOVrPAzWiywHTAscCGTLHAJPuwwE7CsMBUnrDAq4WwwL10sMAjabDAM2GwwMdbsMASWLDAilWwwM9TsMChUrDAcda/wCnau8BTorfAE/uzwGvssMATqq7A11utwFRvrMAqzqvAs1+rwHwSq8CU3KrATLeqwKCdqsD/i6rA6n+qwKV3qsD+carAIG6qwHxrqsCvaarAPMS7wFtZucDqc7XAYDCxwLB7rcDkdKrAMamowMNhp8CSf6bA7tylwI5ppcADGqXAjuakwP3CpMCCqqTAs5mkwC6OpMBMhqTA6ICkwDh9pMC0eqTALB0iwQcdIsHvHCLB3hwiwdMcIsHMHCLBxhwiwcMcIsHBHCLBvxwiwb4cIsG9HCLBvRwiwbwcIsG8HCLBvBwiwbwcIsG8HCLBvBwiwbwcIsG8HCLBh7cewVC3HsErtx7BEbcewQC3HsH1th7B7bYewee2HsHkth7B4bYeweC2HsHfth7B3rYewd22HsHdth7B3bYewd22HsHcth7B3LYewdy2HsHcth7BLFIbwdhRG8GfURvBeVEbwV9RG8FNURvBQVEbwTlRG8E0URvBMFEbwS1RG8EsURvBKlEbwSpRG8EpURvBKVEbwSlRG8EoURvBKFEbwShRG8EoURvB8+0XwXLtF8Eb7RfB4OwXwbnsF8Ge7BfBi+wXwX/sF8F27BfBcewXwW3sF8Fq7BfBaewXwWfsF8Fn7BfBZuwXwWbsF8Fl7BfBZewXwWXsF8Fl7BfBy4kUwQeJFMGDiBTBKYgUweyHFMHChxTBpocUwZOHFMGHhxTBfocUwXiHFMF0hxTBcYcUwW+HFMFuhxTBbYcUwW2HFMFshxTBbIcUwWyHFMFshxTB5yURwbwkEcHxIxHBZyMRwQojEcHLIhHBoCIRwYMiEcFwIhHBYiIRwVkiEcFTIhHBTyIRwUwiEcFKIhHBSSIRwUgiEcFIIhHBRyIRwUciEcFHIhHBiMINwb/ADcGJvw3Bt74NwSm+DcHIvQ3Bh70NwVu9DcE9vQ3BKb0NwRu9DcESvQ3BC70NwQe9DcEEvQ3BAr0NwQG9DcEAvQ3B/7wNwf+8DcH/vA3BDWAKwVRdCsF7WwrBO1oKwWFZCsHOWArBalgKwSdYCsH5VwrB2lcKwcVXCsG3VwrBrVcKwaZXCsGiVwrBn1cKwZ1XCsGcVwrBm1cKwZpXCsGaVwrBBP8Gwdz6BsEL+AbBIfYGwdb0BsH18wbBXPMGwfXyBsGv8gbBgPIGwWDyBsFK8gbBO/IGwTHyBsEq8gbBJvIGwSPyBsEh8gbBH/IGwR7yBsEd8gbBPKADweiZA8GblQPBsZIDwbaQA8FfjwPBdo4DwdiNA8FtjQPBJY0DwfSMA8HSjAPBvIwDwa2MA8GijAPBm4wDwZeMA8GTjAPBkYwDwZCMA8GPjAPB7kQAwU07AMHBNADBTjAAwUktAME9KwDB2SkAwegoAMFFKADB1icAwYsnAMFZJwDBNicAwR8nAMEPJwDBBCcAwf0mAMH4JgDB9SYAwfMmAMHxJgDB2d35wJzA+cCvrPnAIp/5wO2V+cCtj/nAcIv5wJGI+cCehvnATIX5wGeE+cDMg/nAY4P5wByD+cDrgvnAy4L5wLWC+cCmgvnAm4L5wJSC+cCQgvnA1EHzwJcV88Ba9/LAveLywLfU8sAwy/LAucTywFbA8sBdvfLAWbvywPu58sAOufLAbbjywAG48sC3t/LAhbfywGO38sBMt/LAPbfywDK38sArt/LAuL3swB977MBiTezAGy7swMgY7MBFCuzAagDswLn568Au9evAG/LrwATw68Ca7uvApe3rwP/s68CO7OvAQuzrwA7s68Dr6+vA1OvrwMTr68C56+vApFzmwFn55cCFtOXAO4XlwOJk5cDSTuXAzz/lwJw15cCvLuXA/SnlwM0m5cCkJOXALiPlwDAi5cCEIeXADyHlwMAg5cCLIOXAZyDlwE4g5cA9IOXAUS7gwK6b38AsNd/ADO7ewCe93sCym97A4ITewFh13sDKat7AoGPewMNe3sB3W97AO1newLdX3sCxVt7A/1XewIZV3sA0Vd7A/VTewNdU3sC+VN7A5EfawE5y2cAH29jANXHYwLYn2MAp9dfAj9LXwPS618DiqtfA9p/XwIyY18CEk9fAG5DXwMuN18A5jNfAKYvXwHGK18D0idfAoInXwGeJ18BAidfAacPUwMSS08C+ttLAsxrSwHit0cCGYdHAQy3RwHsJ0cAQ8dDAcODQwCPV0MB2zdDAQcjQwLrE0MBVwtDAtcDQwJy/0MDdvtDAXL7QwAW+0MDJvdDA473PwGsXzsBF3szAqPvLwLZay8D36crAf5vKwHllysB3QMrANSfKwAIWysBQCsrAYALKwPz8ycBV+cnA2/bJwC31ycAK9MnARPPJwL/yycBk8snAblPLwGodycA2bMfAaCrGwA9BxcATm8TAsSbEwKPVw8DLncPAhnfDwGZdw8CaS8PAgT/DwEk3w8C2McPA7i3DwF4rw8ChKcPAdCjDwKcnw8AdJ8PArJjHwJXAxMD7fcLA3sHAwCp3v8D4hr7Az9u9wKtjvcAuEL3A+eO8wLrFvMAXsbzADKO8wICZvMAGk7zAoI68wKWLvMCgibzAQYi8wFOHvMCyhrzAw5XEwJgUwcDoLr7Amd+7wGkYusCfxLjADPW3wCyHt8BwO7fAAAe3wADjtsBmyrbAorm2wDuutsB8prbAOqG2wKmdtsA+m7bAm5m2wH6YtsC+l7bAo0XCwMogvsC6kbrAaJ63wEdCtcA9i7PATaKywIwAssBtlLHAMEmxwBYVscBV8bDA5tiwwEDIsMA/vbDAQrawwISxsMBMrrDAHqywwKOqsMCjqbDAuNe/wPfdu8D2rLfAEhC0wBcPscCdza7AFIutwG2prMCBDKzA6KSrwHRdq8ABLKvAGQqrwPDyqsAp46rAbtiqwCTRqsAyzKrA2MiqwJHGqsAHxarAPMS7wFxaucBJd7XAQzqxwJ+PrcCykarAeM2owFSPp8C7t6bAYh6mwJWypcCfZ6XAsTOlwEYSpcAs/KTAHu2kwOHipMDu26TANtekwAPUpMDY0aTAaGUiwUtlIsE3ZSLBKWUiwSBlIsEaZSLBFmUiwRRlIsESZSLBEWUiwRBlIsEPZSLBD2UiwQ9lIsEOZSLBDmUiwQ5lIsEOZSLBDmUiwQ5lIsEOZSLBuv8ewYz/HsFu/x7BWf8ewUv/HsFC/x7BO/8ewTf/HsE0/x7BM/8ewTH/HsEw/x7BMP8ewS//HsEv/x7BL/8ewS//HsEv/x7BL/8ewS//HsEv/x7BJpobwd+ZG8GwmRvBkJkbwXuZG8FtmRvBY5kbwV2ZG8FYmRvBVZkbwVOZG8FSmRvBUZkbwVCZG8FQmRvBUJkbwVCZG8FPmRvBT5kbwU+ZG8FPmRvBvjUYwVM1GMEKNRjB2TQYwbk0GMGjNBjBlDQYwYo0GMGDNBjBfzQYwXw0GMF6NBjBeDQYwXc0GMF3NBjBdjQYwXY0GMF2NBjBdjQYwXY0GMF1NBjBgtEUwdzQFMFs0BTBIdAUwe/PFMHNzxTBts8UwafPFMGczxTBlc8UwZHPFMGOzxTBjM8UwYrPFMGJzxTBic8UwYjPFMGIzxTBiM8UwYfPFMGHzxTBd20RwXdsEcHLaxHBWGsRwQprEcHWahHBsmoRwZtqEcGLahHBgGoRwXlqEcF0ahHBcWoRwW9qEcFtahHBbGoRwWxqEcFrahHBa2oRwWtqEcFrahHB2QkOwVAIDsFHBw7BlQYOwR4GDsHNBQ7BlwUOwXMFDsFaBQ7BSgUOwT8FDsE3BQ7BMgUOwS8FDsEsBQ7BKwUOwSoFDsEpBQ7BKQUOwSgFDsEoBQ7BAKcKwaOkCsEMowrB+qEKwUGhCsHFoArBcqAKwTqgCsEUoArB+58KweqfCsHenwrB158KwdKfCsHOnwrBzJ8KwcqfCsHJnwrByJ8KwcifCsHInwrBbEUHwclBB8FWPwfBsD0HwZQ8B8HVOwfBVTsHwf86B8HFOgfBnjoHwYM6B8FyOgfBZjoHwV46B8FYOgfBVToHwVI6B8FROgfBUDoHwU86B8FOOgfB2uUDwUTgA8GA3APB99kDwULYA8Ec1wPBVtYDwdHVA8F41QPBPNUDwRPVA8H41APB5tQDwdnUA8HR1APBzNQDwcjUA8HF1APBxNQDwcPUA8HC1APBa4kAwdiAAMEQewDBKXcAwYl0AMHFcgDBlHEAwchwAME+cADB4W8AwaNvAMF5bwDBXW8AwUpvAME9bwDBNW8AwS9vAMErbwDBKG8AwSdvAMElbwDBoGP6wF9J+sCfN/rApCv6wJEj+sAhHvrAeBr6wAEY+sBZFvrAPBX6wHwU+sD7E/rApBP6wGoT+sBDE/rAKBP6wBYT+sAKE/rAAhP6wP0S+sD5EvrAJsPzwBGb88Dkf/PAhG3zwBxh88DAWPPAHlPzwFRP88DHTPPAD0vzwOhJ88AhSfPAnEjzwEJI88AFSPPA3UfzwMFH88CvR/PAo0fzwJpH88CVR/PA6zjtwAT87MCK0uzAabbswGOj7MCMluzA443swA6I7MAhhOzAfYHswLZ/7MCEfuzAtn3swCx97MDPfOzAkHzswGZ87MBKfOzAN3zswCp87MAhfOzAqc/mwPdz5sD6NObAEArmwPPs5cBC2eXA9svlwP/C5cD1vOXA5LjlwCi25cBRtOXAFLPlwD6y5cCvseXAT7HlwA6x5cDisOXAxbDlwLGw5cCksOXAp5bgwO4N4MAxr9/ADW7fwKdB38CFI9/AIg/fwF4B38AV+N7A1PHewJ/t3sDJ6t7A4ejewJnn3sC85t7AKObewMTl3sCB5d7AVOXewDXl3sAh5d7A26LawKjZ2cB+TNnAnurYwECn2MBQedjAIVrYwAZF2MDFNtjAKS3YwK8m2MBTItjAZB/YwGod2MAXHNjAMhvYwJga2MAxGtjA6xnYwLwZ2MCdGdjAhg7VwIbs08AXHdPAXIvSwEAm0sCW4NHAELHRwMmQ0cDxetHAL2zRwDxi0cCHW9HAA1fRwPlT0cDuUdHAjlDRwKFP0cACT9HAl07RwE9O0cAeTtHAjvfPwC1hzsDQNs3A/GDMwI3Ky8AbYsvAEhrLwOfoysCBx8rA5LDKwJ2hysBPl8rAXZDKwLCLysCLiMrAbYbKwACFysALhMrAZoPKwPeCysCtgsrAknvLwKRVycCVtMfAu4HGwFmlxcAUCsXAMp7EwLdTxMDaIMTASf7DwOHmw8AQ18PAZMzDwDTFw8BcwMPAGr3DwOm6w8BvucPAcbjDwMe3w8BUt8PAHrHHwFznxMDEtMLA2QjBwD3Nv8Az6r7A9Um+wIPavcCGjb3A6Fi9wCQ1vcDpHL3AlA29wC8FvcCH/7zAufu8wCn5vMBv97zARva8wH/1vMD49LzADaLEwOcrwcBUVL7A8RS8wP1dusBvGbnA1EK4wL3Lt8DRhbfAzVW3wB81t8D4HrfA/g+3wOMFt8AT/7bAfPq2wGb3tsBS9bbA7PO2wPvytsBZ8rbA70nCwEUsvsDsp7rAfcK3wC52tcDdwrPAR9qywNpBssDP2bHASJSxwIhkscALRLHABS6xwCIfscAXFbHAUQ6xwMEJscCwBrHAnwSxwDsDscBMArHA/9i/wMzhu8Cpt7fALCW0wNkxscAg9K7A9rqtwBnirMB2SqzAOOirwKilq8BJeKvAdFmrwJBEq8ByNqvA6yyrwH8mq8AsIqvAQx+rwE4dq8D9G6vAPMS7wF1bucCterXAN0SxwKmjrcBmrqrAPvGowO28p8CG7qbABF6mwE/5pcDms6XAO4SlwM5jpcDTTaXA+D6lwPI0pcAwLqXAoymlwLgmpcDaJKXA9qoiwd6qIsHOqiLBw6oiwbyqIsG3qiLBtKoiwbKqIsGwqiLBr6oiwa6qIsGuqiLBrqoiwa6qIsGtqiLBraoiwa2qIsGtqiLBraoiwa2qIsGtqiLBP0UfwRlFH8EARR/B70QfweREH8HdRB/B2EQfwdREH8HSRB/B0UQfwdBEH8HPRB/Bz0Qfwc5EH8HORB/BzkQfwc5EH8HORB/BzkQfwc5EH8HORB/Bnt8bwWTfG8E93xvBI98bwRHfG8EG3xvB/t4bwfneG8H13hvB894bwfLeG8Hw3hvB8N4bwe/eG8Hv3hvB794bwe/eG8Hv3hvB794bwe/eG8Hu3hvB4noYwYh6GMFLehjBI3oYwQh6GMH2eRjB6nkYweJ5GMHdeRjB2XkYwdd5GMHVeRjB1HkYwdR5GMHTeRjB03kYwdN5GMHTeRjB0nkYwdJ5GMHSeRjBlhYVwQoWFcGsFRXBbRUVwUQVFcEoFRXBFRUVwQkVFcEAFRXB+xQVwfcUFcH1FBXB8xQVwfIUFcHxFBXB8RQVwfAUFcHwFBXB8BQVwfAUFcHwFBXBa7IRwZGxEcEAsRHBnrARwV6wEcEysBHBFbARwQKwEcH1rxHB7a8RweevEcHjrxHB4a8Rwd+vEcHerxHB3a8RwdyvEcHcrxHB3K8RwdyvEcHcrxHBmU4OwUdNDsFlTA7BzksOwWlLDsEmSw7B+UoOwdtKDsHHSg7BukoOwbFKDsGrSg7Bp0oOwaRKDsGjSg7BoUoOwaFKDsGgSg7BoEoOwaBKDsGfSg7Bb+sKwWLpCsED6ArBGecKwX3mCsEU5grBz+UKwaDlCsGB5QrBbOUKwV7lCsFV5QrBT+UKwUvlCsFI5QrBRuUKwUXlCsFE5QrBROUKwUPlCsFD5QrBYYkHwTOGB8EShAfBp4IHwbSBB8ESgQfBpoAHwV2AB8EtgAfBDYAHwfh/B8HpfwfB4H8Hwdl/B8HVfwfB0n8HwdB/B8HPfwfBzn8Hwc5/B8HNfwfBHikEwS8kBMHjIATBrx4EwTYdBME7HATBkxsEwSIbBMHYGgTBphoEwYQaBMFuGgTBXxoEwVUaBMFPGgTBShoEwUcaBMFFGgTBRBoEwUMaBMFDGgTBrcsAwQzEAMHwvgDBhbsAwT25AMG2twDBsbYAwQO2AMGPtQDBQbUAwQ61AMHrtADB1LQAwcW0AMG6tADBtLQAwa+0AMGstADBqrQAwam0AMGotADBRuX6wLPN+sDjvfrATbP6wDis+sB9p/rAU6T6wDei+sDOoPrA3Z/6wDyf+sDRnvrAiZ76wFme+sA6nvrAJJ76wBae+sANnvrABp76wAKe+sD/nfrAv0D0wHAc9MAFBPTApPPzwKvo88BV4fPAbtzzwCfZ88D31vPAgdXzwIfU88Dg0/PAcdPzwCfT88D10vPA1NLzwL7S88Cw0vPAptLzwJ/S88Cb0vPA5rDtwDl57cCgU+3AVTrtwF0p7cAAHu3AZhbtwFER7cDrDe3ApwvtwCMK7cAhCe3AdAjtwAEI7cC0B+3AgAftwF4H7cBHB+3AOAftwC4H7cAnB+3ADkDnwGnr5sDJsebA24rmwKhw5sAUX+bATlPmwG1L5sApRubApELmwEtA5sC5PubArT3mwPo85sCCPObAMzzmwP475sDaO+bAwjvmwLI75sCoO+bACP3gwJx94MAXJuDAcurfwCPC38ABp9/Ay5TfwJiI38BvgN/A+nrfwFR338DldN/ARXPfwC9y38B1cd/A+nDfwKdw38BwcN/AS3DfwDJw38AicN/AifzawBo/2sBwu9nA8mDZwDkj2cB8+djAY93YwIXK2MDivdjAbLXYwMWv2MD+q9jAeKnYwMin2MCoptjA6KXYwGil2MASpdjA2aTYwLOk2MCapNjA91jVwA9F1MCYgdPAjvnSwACc0sAfXNLA6TDSwM8T0sBFANLALPPRwGnq0cCN5NHAo+DRwAXe0cBG3NHAHNvRwFXa0cDQ2dHAd9nRwDzZ0cAU2dHAAjHQwE2qzsAujs3AhcTMwPo3zMBD18vAKZXLwGxoy8BJSsvACzbLwHooy8BlH8vAUxnLwEQVy8COEsvAvxDLwIoPy8C8DsvAMg7LwNYNy8CYDcvAv6PLwK6NycBe/MfA7dfGwOYHxsC4dsXAvhLFwFjOxMAIoMTA0YDEwNlrxMDLXcTAY1TEwBhOxMDkScTAFUfEwDVFxMD1Q8TAH0PEwJBCxMAwQsTAqsnHwC0OxcBj68LASU/BwD0iwMDAS7/AzLW+wHROvsCvB77Avde9wGq3vcCyob3AIpO9wGOJvcDegr3Ag369wJp7vcCoeb3AXHi9wH53vcDqdr3Aaq7EwFBDwcDOeb7AJUq8wBGjusA5bbnADpC4wAwWuMAtzbfAOqG3wJGDt8Cgb7fAP2K3wEpZt8BNU7fATE+3wJ9Mt8DWSrfApEm3wNlIt8BQSLfAQU7CwNM3vsA3vrrAo+a3wPmptcCX+bPAuhCzwFaBssAgHrLAfNyxwL6wscA7k7HAY3+xwBRyscAqabHANGOxwDlfscCPXLHAyFqxwJlZscDOWLHARtq/wKblu8BuwrfAYTq0wK5UscA5Hq/A4+mtwFQZrcCPiqzARymswKjrq8DCwavAhKWrwKWSq8ADhqvAjn2rwOd3q8AfdKvAmHGrwOlvq8DJbqvAPMS7wF9cucAWfrXAOk6xwM23rcD7yqrA/hWpwGzsp8AGJKfA1JumwM89psCI/aXAydGlwEa0pcBuoKXAH5OlwDaKpcBBhKXARYClwJx9pcDVe6XA+u0iwebtIsHZ7SLB0O0iwcrtIsHG7SLBxO0iwcLtIsHB7SLBwO0iwcDtIsHA7SLBv+0iwb/tIsG/7SLBv+0iwb/tIsG/7SLBv+0iwb/tIsG/7SLBPIgfwR2IH8EIiB/B+ocfwfGHH8Hrhx/B54cfweWHH8Hjhx/B4ocfweGHH8Hhhx/B4IcfweCHH8Hghx/B4IcfweCHH8Hghx/B4IcfweCHH8Hghx/BkCIcwWAiHME/IhzBKiIcwRwiHMETIhzBDCIcwQgiHMEFIhzBBCIcwQIiHMECIhzBASIcwQEiHMEBIhzBACIcwQAiHMEAIhzBACIcwQAiHMEAIhzBgr0YwTa9GMEEvRjB4rwYwcy8GMG+vBjBtLwYwa68GMGpvBjBp7wYwaW8GMGjvBjBo7wYwaK8GMGivBjBorwYwaG8GMGhvBjBobwYwaG8GMGhvBjBK1kVwbRYFcFlWBXBMVgVwQ9YFcH4VxXB6FcVwd5XFcHYVxXB01cVwdBXFcHOVxXBzVcVwcxXFcHMVxXBy1cVwctXFcHLVxXBy1cVwctXFcHLVxXB5/QRwS30EcGx8xHBYPMRwSrzEcEG8xHB7vIRwd7yEcHU8hHBzfIRwcjyEcHF8hHBw/IRwcLyEcHB8hHBwPIRwcDyEcHA8hHBwPIRwcDyEcG/8hHB6ZAOwcaPDsEFjw7BhY4OwTCODsH4jQ7B0o0OwbqNDsGqjQ7Bn40OwZiNDsGTjQ7BkI0OwY6NDsGMjQ7Bi40OwYuNDsGKjQ7Bio0OwYqNDsGKjQ7BeS0LwbErC8GDKgvBuykLwTYpC8HeKAvBpCgLwX0oC8FkKAvBUygLwUgoC8FAKAvBOygLwTgoC8E2KAvBNSgLwTQoC8EzKAvBMygLwTIoC8EyKAvBAcsHwTjIB8FgxgfBJsUHwVbEB8HNwwfBcsMHwTXDB8ENwwfB88IHweHCB8HWwgfBzsIHwcnCB8HFwgfBw8IHwcLCB8HBwgfBwMIHwcDCB8G/wgfBIWoEwcdlBMHkYgTB+WAEwbRfBMHdXgTBTl4EwfBdBMGxXQTBh10EwWxdBMFaXQTBTl0EwUZdBMFAXQTBPV0EwTtdBME5XQTBOF0EwTddBME3XQTBywsBwQEFAcF+AAHBf/0AwYP7AMEy+gDBUvkAwb74AMFc+ADBG/gAwfD3AMHU9wDBwfcAwbT3AMGs9wDBp/cAwaP3AMGh9wDBn/cAwZ73AMGd9wDB7WL7wMRN+8CvP/vAVDb7wB4w+8AALPvARSn7wHUn+8BCJvvAdyX7wPAk+8CXJPvAXCT7wDUk+8AbJPvACiT7wP4j+8D3I/vA8iP7wO4j+8DsI/vAurr0wNiZ9MDog/TAT3X0wJxr9MArZfTA5mD0wBFe9MAxXPTA81r0wCBa9MCUWfTAN1n0wPpY9MDRWPTAt1j0wKVY9MCZWPTAkVj0wIxY9MCIWPTAvCXuwNny7cDG0O3ACbrtwOeq7cDYoO3AK5rtwL6V7cDOku3A3JDtwJKP7cC3ju3AJo7twMaN7cCHje3AXI3twECN7cAuje3AIo3twBqN7cAUje3A3K3nwMBf58AMK+fAvAfnwCvw5sB74ObADtbmwCHP5sCKyubAf8fmwHrF5sAkxObAQcPmwKrC5sBHwubABcLmwNnB5sC8webAqcHmwJzB5sCUwebAcmHhwL/q4MDrmeDAVGPgwL4+4MBRJuDADhbgwD4L4MARBODATv/fwCb838AO+t/Aq/jfwMD338Ak99/AvfbfwHj238BL9t/ALfbfwBn238AM9t/A6FTbwKSi2sDjJ9rAQtTZwLib2cDPddnAflzZwKJL2cBtQNnA/DjZwAw02cDGMNnAmi7ZwCot2cA2LNnAlCvZwCkr2cDjKtnAtCrZwJQq2cCAKtnAtKLVwFac1MA95NPATmXTwMYO08A41NLA8azSwLWS0sA6gdLAnHXSwORt0sDGaNLAYWXSwCFj0sCjYdLApmDSwP5f0sCPX9LARl/SwBVf0sD1XtLAN2rQwMPyzsBY5M3AQSbNwAOjzMB8SczA2QzMwCfky8D2yMvA2LbLwMyqy8DMosvAfZ3LwPiZy8Cjl8vAF5bLwBGVy8BjlMvA8JPLwKOTy8Bxk8vA8MvLwIDFycCJQ8jA9izHwLRoxsAF4cXAZ4TFwJxFxcBzG8XARf/EwH7sxMAA4MTAtdfEwDTSxMCNzsTAIszEwIfKxMB3ycTAw8jEwEzIxMD9x8TAT+LHwAc1xcDSIcPAJJXBwCN2wMCcq7/AWR+/wIq/vsCEfr7A11K+wKM1vsArIr7AORW+wJ8MvsDqBr7AIQO+wJ8AvsD1/r3A2/29wCD9vcCk/L3A27rEwNJawcBTn77AMH+8wJrnusD2v7nA9O64wL9nuMBCG7jAYOm3wHbOt8CDvLfAkbC3wKKot8Bdo7fA35+3wI6dt8AFnLfAAJu3wFSat8DhmbfAm1LCwHJDvsCc1LrA1gq4wKDdtcDwOrTAp0WzwNC+ssBbYrLAnCOywNL5scAE37HAI82xwD7BscBWubHAF7SxwJ2wscBOrrHAx6yxwMOrscAXq7HAjtu/wIfpu8BEzbfAr0+0wJN3scDkR6/A2BeuwCFPrcDCyKzApmyswBYvrMCnCKzA8e6rwMzdq8Bo0qvA2MqrwNLFq8B+wqvAScCrwNK+q8DavavAPMS7wGBducCFgbXATlixwAnMrcBv56rAYjqpwAYbqMB3WKfA1temwBeApsCdRKbAdhymwJgBpsCu76XAw+OlwNjbpcCX1qXAG9OlwMvQpcBDz6XAli4jwYUuI8F7LiPBdC4jwW8uI8FsLiPBai4jwWkuI8FoLiPBZy4jwWcuI8FnLiPBZi4jwWYuI8FmLiPBZi4jwWYuI8FmLiPBZi4jwWYuI8FmLiPB0sgfwbjIH8GnyB/BnMgfwZXIH8GQyB/BjcgfwYvIH8GJyB/BiMgfwYjIH8GHyB/Bh8gfwYfIH8GHyB/Bh8gfwYfIH8GHyB/Bh8gfwYfIH8GHyB/BHmMcwfViHMHbYhzByWIcwb1iHMG2YhzBsWIcwa5iHMGrYhzBqmIcwaliHMGoYhzBqGIcwahiHMGoYhzBqGIcwadiHMGnYhzBp2IcwadiHMGnYhzBv/0YwX/9GMFV/RjBOv0YwSf9GMEb/RjBFP0YwQ79GMEL/RjBCf0YwQf9GMEG/RjBBv0YwQX9GMEF/RjBBf0YwQX9GMEF/RjBBf0YwQX9GMEF/RjBYZkVwfyYFcG6mBXBj5gVwXKYFcFfmBXBU5gVwUuYFcFFmBXBQpgVwT+YFcE+mBXBPZgVwTyYFcE8mBXBPJgVwTuYFcE7mBXBO5gVwTuYFcE7mBXBCTUSwWo0EsECNBLBvTMSwZAzEsFyMxLBXjMSwVIzEsFJMxLBRDMSwUAzEsE+MxLBPDMSwTszEsE6MxLBOjMSwTkzEsE5MxLBOTMSwTkzEsE5MxLB5tAOwezPDsFHzw7B2s4OwZPODsFkzg7BRc4OwTHODsEjzg7BG84OwRXODsERzg7BD84OwQ3ODsEMzg7BC84OwQvODsEKzg7BCs4OwQrODsEKzg7BO20Lwa9rC8GragvBAGoLwY9pC8FFaQvBFGkLwfRoC8HfaAvB0WgLwchoC8HCaAvBvmgLwbxoC8G6aAvBuWgLwbhoC8G4aAvBt2gLwbdoC8G3aAvBZwoIwfcHCMFcBgjBTgUIwZwECMEoBAjB2wMIwagDCMGHAwjBcQMIwWMDCMFZAwjBUwMIwU8DCMFMAwjBSwMIwUoDCMFJAwjBSAMIwUgDCMFIAwjB/KgEwSWlBMGeogTB9KAEwdufBMEjnwTBqp4EwVqeBMEmngTBA54EweydBMHenQTB1J0Ewc2dBMHJnQTBxp0EwcSdBMHDnQTBwp0EwcKdBMHCnQTB20kBwdBDAcHUPwHBND0BwXo7AcFXOgHBmDkBwRo5AcHHOAHBkTgBwW04AcFWOAHBRjgBwTw4AcE1OAHBMTgBwS44AcEsOAHBKzgBwSo4AcEqOAHBu9z7wLzJ+8AyvfvA7rT7wHyv+8Dmq/vAi6n7wP6n+8D4pvvATab7wNyl+8CSpfvAYaX7wEGl+8AspfvAHqX7wBWl+8APpfvAC6X7wAil+8AGpfvAMzH1wGwT9cC4//TAtvL0wCLq9MB85PTAxOD0wFHe9MC13PTAptv0wPTa9MB/2vTAMtr0wP/Z9MDe2fTAyNn0wLrZ9MCw2fTAqtn0wKbZ9MCj2fTAfZfuwABp7sAfSu7ArzXuwDAo7sBKH+7AbRnuwJIV7sAIE+7AXBHuwEMQ7sCKD+7AEA/uwMAO7sCMDu7AaQ7uwFMO7sBEDu7AOg7uwDMO7sAvDu7AHBnowA3R58DcoOfA2IDnwKVr58ClXefAaVTnwFRO58BTSufAsUfnwPVF58DRROfAEkTnwJND58BAQ+fACkPnwOZC58DOQufAv0LnwLVC58CuQufA58PhwF9V4cDBCuHAzdjgwJq34MCdoeDAF5PgwIOJ4MA0g+DADH/gwFB84MCEeuDAVXngwI544MALeODAtXfgwHx34MBXd+DAP3fgwC934MAkd+DA9KvbwEYE28DgkdrAnETawNYQ2sBp7tnAm9fZwIrI2cCavtnADrjZwL6z2cDosNnAC6/ZwNCt2cACrdnAeqzZwCCs2cDmq9nAv6vZwKar2cCVq9nAtOvVwFby1MAHRdTAo87TwKJ+08D5SNPARyXTwKEN08AA/tLAsPPSwOXs0sBs6NLAe+XSwIvj0sBF4tLAb+HSwOLg0sCF4NLASODSwCDg0sAG4NLAJqPQwIc6z8BIOc7ALobNwK0LzcDWuMzAOYHMwDdczMCwQ8zAejPMwMgozMC7IczAFx3MwAkazMAHGMzAtRbMwNYVzMBEFczA5BTMwKQUzMB7FMzAIfTLwBT9ycANisjA0YDHwMHHxsD/SMbAPPPFwJq5xcA7k8XAy3nFwPpoxcDiXcXAkVbFwMFRxcCVTsXAgEzFwCFLxcA6SsXAoknFwD5JxcD8SMXADPvHwORbxcAJWMPAZNrBwOnIwMDDCcDAoIa/wNYtv8Ad8r7AVcq+wPSvvsCCnr7A/5K+wGmLvsBqhr7AIIO+wPaAvsCKf77Amn6+wP19vsCVfb7AXsfEwGxywcDexL7AC7S8wJMru8CfEbrANEy5wJDEuMApcLjAtEC4wCQhuMA6DLjAaf63wEz1t8B177fAaOy3wGfqt8AV6bfAN+i3wKXnt8BF57fA/FbCwCRPvsAZ67rAEy+4wB0RtsCdfbTAfn2zwE/6ssAtpLLAOGqywGdDssCgKbLAkRiywE4NssDgBbLAKQGywB/+scAf/LHAzvqxwPH5scBf+bHA1ty/wG7tu8Ar2LfAFGW0wISascAcca/A00SuwOKDrcAUBa3AMq+swGp1rMC4TqzAWjWswOUlrMCxG6zA+BSswIoQrMCfDazAtAuswHEKrMCdCazAPMS7wGNeucD5hLXAcmKxwF3grcA0B6vAQV6pwLZIqMCfi6fAEhKnwDXApsAuiabAWmSmwOhLpsC8O6bADzGmwAUqpsBiJabAVSKmwFMgpsABH6bA6mwjwdxsI8HUbCPBzmwjwcpsI8HIbCPBxmwjwcVsI8HFbCPBxGwjwcRsI8HEbCPBxGwjwcNsI8HDbCPBw2wjwcNsI8HDbCPBw2wjwcNsI8HDbCPBIQcgwQwHIMH+BiDB9QYgwe8GIMHrBiDB6QYgwecGIMHmBiDB5QYgweUGIMHkBiDB5AYgweQGIMHkBiDB5AYgweQGIMHkBiDB5AYgweQGIMHkBiDBZqEcwUShHMEuoRzBIKEcwRahHMEQoRzBDKEcwQmhHMEIoRzBB6EcwQahHMEFoRzBBaEcwQWhHMEFoRzBBaEcwQWhHMEFoRzBBaEcwQWhHMEFoRzBwDsZwYo7GcFnOxnBUDsZwUE7GcE3OxnBMTsZwS07GcEqOxnBKDsZwSc7GcEnOxnBJjsZwSY7GcElOxnBJTsZwSU7GcElOxnBJTsZwSU7GcElOxnBV9cVwQHXFcHK1hXBpdYVwY7WFcF+1hXBdNYVwW3WFcFp1hXBZtYVwWXWFcFj1hXBY9YVwWLWFcFi1hXBYtYVwWHWFcFh1hXBYdYVwWHWFcFh1hXB73ISwWhyEsEPchLB1XESwbBxEsGXcRLBh3ESwXxxEsF2cRLBcXESwW5xEsFscRLBa3ESwWpxEsFqcRLBaXESwWlxEsFpcRLBaXESwWlxEsFpcRLBrg4PwdYND8FJDQ/B7QwPwbEMD8GKDA/BcQwPwWAMD8FVDA/BTgwPwUkMD8FGDA/BRAwPwUMMD8FCDA/BQgwPwUEMD8FBDA/BQQwPwUEMD8FBDA/Bz6oLwXipC8GYqAvBBqgLwaanC8FopwvBP6cLwSWnC8ETpwvBCKcLwQGnC8H8pgvB+aYLwfemC8H1pgvB9KYLwfSmC8HzpgvB86YLwfOmC8HzpgvBq0cIwYlFCMElRAjBPEMIwaRCCMFBQgjBAEIIwdZBCMG6QQjBqEEIwZ1BCMGVQQjBkEEIwY1BCMGLQQjBiUEIwYhBCMGIQQjBh0EIwYdBCMGHQQjBx+UEwWTiBMEt4ATBu94EwcndBMEr3QTBxNwEwYHcBMFV3ATBOdwEwSbcBMEa3ATBEtwEwQzcBMEJ3ATBB9wEwQXcBMEF3ATBBNwEwQPcBMED3ATB8YUBwZCAAcEMfQHBv3oBwT95AcFEeAHBoHcBwTV3AcHvdgHBwXYBwaR2AcGQdgHBhHYBwXt2AcF2dgHBcnYBwXB2AcFvdgHBbnYBwW12AcFtdgHB0lL8wMZB/MCbNvzATS/8wIcq/MBpJ/zAYCX8wAsk/MAtI/zAnCL8wD4i/MAAIvzA2CH8wL0h/MCsIfzAoSH8wJoh/MCVIfzAkiH8wJAh/MCOIfzARaT1wFCJ9cCed/XABmz1wHFk9cB8X/XAP1z1wCJa9cDAWPXA2lf1wENX9cDhVvXAoVb1wHdW9cBcVvXASlb1wD5W9cA3VvXAMlb1wC5W9cAsVvXAPgbvwMbb7sDNv+7Ab63uwGah7sCHme7AYZTuwASR7sDSju7AY43uwHSM7sDYi+7AcovuwC+L7sAEi+7A54ruwNWK7sDJiu7AwYruwLyK7sC4iu7A1oHowGM/6MBVE+jATvbnwD3j58C/1ufAk87nwDvJ58C9xefAdcPnwPjB58AAwefAXcDnwPO/58Cuv+fAgb/nwGS/58BRv+fARL/nwDy/58A3v+fAaCTiwIW94cCoeOHA9UrhwNYs4cANGeHAFQzhwJkD4cAM/uDAbPrgwA744MCD9uDAgPXgwNj04MBq9ODAIvTgwPPz4MDV8+DAwfPgwLTz4MCr8+DApwHcwAFk28Bu+drAEbLawKuC2sBqY9rA4E7awGpB2sCbONrA2DLawBQv2sCfLNrABCvawPgp2sBJKdrA1yjawIwo2sBcKNrAPCjawCco2sAaKNrA8TPWwApH1cD2o9TAljXUwKLr08B5utPAC5rTwLqE08DBdtPAm23TwKBn08C4Y9PAKmHTwIBf08BpXtPAtF3TwD1d08DwXNPAvVzTwJxc08CHXNPAyNvQwJCBz8D6jM7ATuTNwP9xzcBeJc3AYvLMwLzQzMCcuszAG6zMwJyizMBmnMzAWJjMwLGVzMD2k8zA1ZLMwBmSzMCdkczATZHMwBmRzMD2kMzATxzMwGM0ysDjz8jAetPHwAwlx8CursbASV/GwGgqxsB+B8bAifDFwHrhxcCf18XALNHFwPbMxcA1ysXAasjFwD3HxcB5xsXA+cXFwKbFxcBvxcXA3xPIwMKCxcAEjsPAAB/CwIgawcA1ZsDApuu/wGSZv8COYr/AVT6/wIEmv8DgFr/ApAy/wPMFv8CTAb/AuP6+wNr8vsCi+77A1/q+wFL6vsD7+b7A9NPEwByKwcBt6r7AsOi8wPJuu8AuYrrAyqe5wOsoucCz07jA1Zq4wPR5uMAdZ7jAw1q4wK5SuMBkTbjA8Em4wK9HuMA2RrjAQEW4wJ9EuMA2RLjAY1vCwOdavsCsAbvAVlO4wGxEtsC9v7TAz7yzwNkzs8Ci47LAHq6ywJSKssAsc7LAzmOywLxZssAmU7LA2E6ywAdMssAxSrLA/kiywDZIssCzR7LAHt6/wFvxu8Aj47fAkHq0wH69scA8oa/A0HCuwJ25rcCMP63Afu+swBa6rMCglqzARX+swPBvrMDkZazAUl+swAZbrMA4WKzAYlaswDBVrMBoVKzAPMS7wGVfucBziLXApWyxwMj0rcDoKKvAmIGpwHp1qMCVvqfA6UqnwDL+psBNy6bAh6mmwEuTpsCzhKbAI3umwOJ0psDMcKbAIG6mwGJspsA/a6bAFKkjwQmpI8ECqSPB/agjwfqoI8H4qCPB96gjwfaoI8H2qCPB9agjwfWoI8H1qCPB9agjwfWoI8H1qCPB9agjwfWoI8H1qCPB9agjwfWoI8H1qCPBR0MgwTZDIMEqQyDBI0MgwR5DIMEbQyDBGUMgwRhDIMEXQyDBFkMgwRZDIMEWQyDBFkMgwRZDIMEWQyDBFkMgwRVDIMEVQyDBFUMgwRVDIMEVQyDBht0cwWrdHMFY3RzBTN0cwUTdHME/3RzBPN0cwTrdHME53RzBON0cwTfdHME33RzBNt0cwTbdHME23RzBNt0cwTbdHME23RzBNt0cwTbdHME23RzB13cZwap3GcGMdxnBeXcZwW13GcFldxnBYHcZwV13GcFbdxnBWXcZwVh3GcFYdxnBV3cZwVd3GcFXdxnBV3cZwVd3GcFXdxnBV3cZwVd3GcFXdxnBKBMWweASFsGxEhbBkxIWwX8SFsFzEhbBahIWwWUSFsFiEhbBXxIWwV4SFsFdEhbBXBIWwVwSFsFcEhbBXBIWwVsSFsFbEhbBWxIWwVsSFsFbEhbBtq4SwUKuEsH3rRLBxq0SwaetEsGTrRLBha0SwX2tEsF3rRLBdK0SwXGtEsFwrRLBb60SwW6tEsFurRLBbq0SwW2tEsFtrRLBba0SwW2tEsFtrRLBXEoPwaJJD8EqSQ/B3EgPwalID8GISA/Bc0gPwWVID8FdSA/BV0gPwVNID8FRSA/BT0gPwU5ID8FNSA/BTUgPwU1ID8FNSA/BTEgPwUxID8FMSA/BUuYLwSjlC8Fn5AvB6eMLwZjjC8Fk4wvBQuMLwSzjC8Ee4wvBFOMLwQ7jC8EL4wvBCOMLwQbjC8EF4wvBBeMLwQTjC8EE4wvBBOMLwQTjC8EE4wvB6IIIwQqBCMHVfwjBDH8IwYp+CME2fgjB/30Iwdx9CMHFfQjBtn0Iwa19CMGmfQjBon0IwaB9CMGefQjBnX0IwZx9CMGcfQjBnH0IwZt9CMGbfQjBmSAFwZsdBcGrGwXBaRoFwZkZBcESGQXBuhgFwYIYBcFdGAXBRRgFwTYYBcEsGAXBJRgFwSEYBcEfGAXBHRgFwRwYBcEbGAXBGhgFwRoYBcEaGAXBIcABwVi7AcE9uAHBOrYBweu0AcETtAHBhrMBwSyzAcHxsgHBy7IBwbKyAcGisgHBl7IBwZGyAcGMsgHBirIBwYiyAcGHsgHBhrIBwYWyAcGFsgHBVcX8wAm2/MAYrPzApKX8wHSh/MC9nvzA+5z8wNib/MAbm/zAoJr8wFGa/MAemvzA/Jn8wOeZ/MDZmfzA0Jn8wMqZ/MDGmfzAxJn8wMKZ/MDBmfzACxT2wKT79cDA6/XAbeH1wLja9cBf1vXAjdP1wLnR9cCK0PXAxs/1wEfP9cD0zvXAv871wJzO9cCGzvXAeM71wG7O9cBozvXAZM71wGLO9cBgzvXAEHLvwEhL78DxMe/AcCHvwLUW78C+D+/AOQvvwEsI78BlBu/AKgXvwF4E78DaA+/AhQPvwE0D78ApA+/AEgPvwAMD78D5Au/A8wLvwO8C78DsAu/AFujowNKq6MCQgujAQGjowBtX6MD2S+jAuUTowAdA6MD8POjAAzvowLw56MDoOOjAXzjowAY46MDMN+jApzfowI836MB/N+jAdTfowG436MBqN+jA+YLiwDwj4sCy4+HA57nhwJSe4cDGjOHAMoHhwK154cDMdOHAo3HhwJZv4cBCbuHAZm3hwNds4cB7bOHAP2zhwBhs4cD/a+HA72vhwORr4cDda+HAAFbcwNbB28CXXtvAsxzbwFHx2sDx1NrAc8LawGy22sCdrtrAi6nawEKm2sAhpNrAwKLawNuh2sBHodrA56DawKig2sCAoNrAZqDawFWg2sBKoNrAY3vWwHCa1cAMAdXALZrUwNhV1MDRKNTAWwvUwCb408Cn69PAiuPTwEbe08Dc2tPAptjTwDfX08BJ1tPAr9XTwEvV08AL1dPA4dTTwMbU08C01NPAGBTRwNvHz8Bo387An0DOwAHWzcAlj83AaWDNwNJBzcDfLc3A5SDNwHcYzcD/Es3Acw/NwCYNzcCpC83AsgrNwBIKzcCqCc3AZwnNwDsJzcAfCc3AdUTMwGdrysAEFcnA7STIwJWAx8AXEsfAnsjGwByYxsBaeMbAomPGwCdWxsBlTcbAtkfGwAdExsCjQcbAF0DGwBY/xsBwPsbABD7GwL89xsCRPcbAxSzIwJupxcC7w8PA82LCwPxqwcDywMDAc07AwEQCwMDtz7/A866/wG+Zv8Bvi7/AVoK/wG58v8CaeL/AH3a/wIN0v8B4c7/Ay3K/wFtyv8ATcr/Am+DEwOGhwcD8D7/AGB29wLKxu8CdsbrAuAG6wBeLucAbPLnA3Qe5wKDluMBIz7jAvcC4wEm3uMAnsbjALa24wJiquMDtqLjA16e4wCSnuMCwprjA0V/CwLtmvsBVGLvAnHe4wIV3tsBGAbXAqvqzwFxss8DGILPAYO+ywNjOssCYubLAwKuywMCissDpnLLAH5mywKqWssASlbLACpSywF+TssDwkrLAZ9+/wE71u8Aq7rfAIpC0wH3gscAF06/AzpuuwOztrcAueK3Ali2twDz8rMC/26zAhcaswLK4rMC2r6zA4KmswBemrMCjo6zADKKswAShrMBaoKzAPMS7wGhgucDxi7XA53axwEgJrsCkSqvAY6SpwFGhqMCT86fAJYKnwFo6p8ALC6fAFOymwNvXpsCwyqbAIcKmwJK8psD4uKbAoramwB61psAjtKbAMOMjwSfjI8Eh4yPBHuMjwRvjI8Ea4yPBGeMjwRjjI8EY4yPBF+MjwRfjI8EX4yPBF+MjwRfjI8EX4yPBF+MjwRfjI8EX4yPBF+MjwRfjI8EX4yPBYH0gwVJ9IMFIfSDBQn0gwT59IME8fSDBOn0gwTl9IME5fSDBOH0gwTh9IME4fSDBOH0gwTh9IME4fSDBOH0gwTh9IME4fSDBOH0gwTh9IME4fSDBmhcdwYIXHcFzFx3BahcdwWMXHcFfFx3BXRcdwVsXHcFaFx3BWRcdwVkXHcFZFx3BWBcdwVgXHcFYFx3BWBcdwVgXHcFYFx3BWBcdwVgXHcFYFx3B47EZwb2xGcGlsRnBlbEZwYuxGcGEsRnBgLEZwX6xGcF8sRnBe7EZwXqxGcF6sRnBebEZwXmxGcF5sRnBebEZwXmxGcF5sRnBebEZwXmxGcF5sRnB8UwWwbRMFsGMTBbBc0wWwWNMFsFYTBbBUkwWwU1MFsFLTBbBSUwWwUhMFsFHTBbBRkwWwUZMFsFGTBbBRkwWwUZMFsFGTBbBRkwWwUZMFsFGTBbBd+gSwRToEsHU5xLBrOcSwZHnEsGA5xLBducSwW/nEsFq5xLBZ+cSwWXnEsFk5xLBY+cSwWPnEsFj5xLBYucSwWLnEsFi5xLBYucSwWLnEsFi5xLBCYQPwWmDD8ECgw/BwIIPwZWCD8F6gg/BaIIPwV2CD8FWgg/BUYIPwU6CD8FMgg/BS4IPwUqCD8FKgg/BSYIPwUmCD8FJgg/BSYIPwUmCD8FJgg/B2R8MwdceDMExHgzBxh0MwYEdDMFVHQzBOB0MwSYdDMEaHQzBEx0MwQ4dDMELHQzBCR0MwQgdDMEHHQzBBh0MwQYdDMEGHQzBBh0MwQUdDMEFHQzBM7wIwZK6CMGFuQjB2LgIwWm4CMEhuAjB87cIwda3CMHDtwjBt7cIwa+3CMGqtwjBprcIwaS3CMGjtwjBorcIwaK3CMGhtwjBobcIwaG3CMGhtwjBhlkFweNWBcExVQXBGVQFwWVTBcHyUgXBp1IFwXhSBcFZUgXBRVIFwTlSBcEwUgXBK1IFwShSBcEmUgXBJFIFwSNSBcEjUgXBIlIFwSJSBcEiUgXBgPgBwT70AcGA8QHBvO8BwZruAcHf7QHBZ+0BwRntAcHo7AHByOwBwbPsAcGm7AHBnewBwZjsAcGU7AHBkuwBwZHsAcGQ7AHBj+wBwY/sAcGP7AHBZTT9wKsm/cDRHf3AHhj9wHIU/cAWEv3AkRD9wJcP/cD2Dv3Ajw79wE0O/cAiDv3ABg79wPUN/cDpDf3A4g39wN0N/cDaDf3A2A39wNcN/cDWDf3AoID2wIpq9sBGXPbAE1P2wCVN9sBVSfbA4Eb2wExF9sBIRPbAoUP2wDZD9sDwQvbAxEL2wKdC9sCVQvbAiUL2wIJC9sB9QvbAekL2wHhC9sB2QvbACNvvwJ6378CsoO/A15HvwEeI78Adgu/AJn7vwJh778D0ee/A5njvwDh478DId+/AgHfvwFJ378A1d+/AInfvwBV378ANd+/ACHfvwAV378ADd+/A50vpwHAT6cCm7ujAzdbowGPH6MBxvejACbfowOqy6MBCsOjAja7owHSt6MDArOjATKzowAGs6MDRq+jAsqvowJ6r6MCRq+jAiavowISr6MCBq+jAm9/iwI2G4sDxS+LAuiXiwPIM4sDt/OHAl/LhwO7r4cCk5+HA4uThwBzj4cD34eHAPOHhwMPg4cB14OHAQ+DhwCPg4cAO4OHAAeDhwPnf4cDz3+HA+qjcwMkd3MBlwdvAkoTbwN9c28AfQ9vAeDLbwLon28DNINvAWBzbwHoZ28ChF9vAcRbbwK4V28AxFdvA4BTbwKwU28CLFNvAdRTbwGcU28BeFNvABsLWwIPs1cBLXNXAc/zUwFS91MAYlNTAVnnUwAdo1MDcXNTAqlXUwAdR1MAMTtTAIEzUwOVK1MAaStTAl0nUwENJ1MANSdTA6kjUwNRI1MDGSNTAD0zRwGEN0MCQMM/AJpvOwL03zsA79s3AZsvNwJmvzcCdnc3AAZLNwIWKzcCzhc3AmoLNwJuAzcBTf83AgH7NwPh9zcCgfc3AaH3NwER9zcAtfc3Aj2zMwBqiysBrWcnAJHXIwF/ax8BEc8fASi/HwM4Cx8Dr5cbAOdPGwCjHxsBhv8bAXrrGwCW3xsAStcbAvbPGwOGyxsBUssbA+bHGwL+xxsCascbAvkXIwGzQxcAp+cPANabCwEK6wcD6GcHADa/AwIRowMBROsDATRzAwOAIwMBV/L/APvS/wAnvv8Cv67/Ah+m/wCTov8BA57/Area/wE/mv8AS5r/AVe3EwLm5wcCGNb/AP1G9wMzzu8Dq/7rA/Fm6wBvrucDsobnA8HG5wMFSucCQPrnAhzG5wB8pucC1I7nAOSC5wPsducCKHLnAnBu5wAQbucCiGrnARmTCwKByvsARL7vA4Zu4wGOqtsA1QrXALUa0wC2xs8CoW7PAEC6zwEsQs8AA/bLAifCywH7ossBQ47LA+t+ywNXdssB03LLAkduywP/assCh2rLAsOC/wEf5u8BB+bfAx6W0wIADssCaBLDAy8WuwNEgrsDnsa3AhmmtwO87rcAsHq3A4wqtwGz+rMBi9qzANfGswN/trMC666zAWeqswHbprMDk6KzAPMS7wGthucB2j7XAOIGxwNwdrsBmbKvAn8apwDnMqMA9J6jAWbinwLl0p8DXSKfAPCynwLQZp8DRDafAKAanwDgBp8AL/qbAAPymwK/6psDX+abAWBskwVEbJMFMGyTBSRskwUcbJMFGGyTBRRskwUUbJMFFGyTBRBskwUQbJMFEGyTBRBskwUQbJMFEGyTBRBskwUQbJMFEGyTBRBskwUQbJMFEGyTBhrUgwXq1IMFytSDBbbUgwWq1IMFotSDBZ7UgwWa1IMFltSDBZbUgwWW1IMFltSDBZbUgwWW1IMFltSDBZbUgwWW1IMFltSDBZbUgwWW1IMFltSDBu08dwahPHcGbTx3Bk08dwY5PHcGLTx3BiU8dwYhPHcGHTx3Bhk8dwYZPHcGGTx3BhU8dwYVPHcGFTx3BhU8dwYVPHcGFTx3BhU8dwYVPHcGFTx3B/ukZwd7pGcHK6RnBvekZwbTpGcGv6RnBrOkZwarpGcGo6RnBp+kZwafpGcGm6RnBpukZwabpGcGm6RnBpukZwabpGcGm6RnBpukZwabpGcGm6RnByYQWwZaEFsF1hBbBYIQWwVKEFsFKhBbBRIQWwUGEFsE+hBbBPYQWwTyEFsE7hBbBO4QWwTuEFsE7hBbBO4QWwTuEFsE7hBbBOoQWwTqEFsE6hBbBSyATwfcfE8HBHxPBnh8TwYkfE8F7HxPBch8TwWwfE8FoHxPBZh8TwWQfE8FkHxPBYx8TwWMfE8FiHxPBYh8TwWIfE8FiHxPBYh8TwWIfE8FiHxPBzbsPwUO7D8Hrug/Bs7oPwZC6D8F5ug/BaroPwWG6D8Fbug/BV7oPwVW6D8FTug/BUroPwVK6D8FRug/BUboPwVG6D8FRug/BUboPwVG6D8FRug/Bf1cMwZ5WDMEPVgzBtFUMwXlVDMFUVQzBPFUMwS1VDMEkVQzBHVUMwRlVDMEXVQzBFVUMwRRVDMEUVQzBE1UMwRNVDMETVQzBE1UMwRNVDMETVQzBpPMIwTfyCMFN8QjBuPAIwVnwCMEd8AjB9u8Iwd3vCMHN7wjBw+8Iwb3vCMG57wjBtu8IwbXvCMG07wjBs+8IwbLvCMGy7wjBsu8IwbLvCMGy7wjBpZAFwVGOBcHVjAXB4osFwUeLBcHkigXBpYoFwXyKBcFjigXBUooFwUiKBcFBigXBPYoFwTqKBcE4igXBN4oFwTeKBcE2igXBNooFwTaKBcE2igXBHy8CwVYrAsHqKALBXicCwWEmAsHAJQLBWSUCwRclAsHuJALB0yQCwcIkAsG3JALBsCQCwaskAsGpJALBpyQCwaYkAsGlJALBpCQCwaQkAsGkJALBIqD9wNKT/cDwi/3A54b9wLCD/cCigf3AUoD9wHx//cDzfv3AnH79wGR+/cBBfv3AKn79wBx+/cASfv3ADH79wAl+/cAGfv3ABX79wAR+/cADfv3AHur2wCLW9sBTyfbAIcH2wOS79sCLuPbAaLb2wAu19sAstPbAnbP2wEOz9sAJs/bA5LL2wMyy9sC9svbAtLL2wK2y9sCpsvbAp7L2wKWy9sCksvbAOEHwwOQg8MAcDPDAyv7vwEP278DP8O/AVO3vwBvr78Cv6e/Ax+jvwDPo78DV5+/AmefvwHLn78Ba5+/ASufvwEDn78A65+/ANufvwDPn78Ax5+/AVa3pwEx56cCxV+nAFELpwDk06cBaK+nAryXpwA8i6cC/H+nARR7pwFQd6cC6HOnAVxzpwBkc6cDxG+nA1xvpwMcb6cC8G+nAthvpwLIb6cCvG+nAVTrjwITn4sB4seLAiI7iwA944sCmaeLAbGDiwIVa4sDAVuLAWFTiwM9S4sDUUeLANFHiwM1Q4sCMUOLAYlDiwEhQ4sA3UOLALFDiwCVQ4sAhUOLAlPrcwN133MDiIdzAwOnbwG7F28AQrtvAEp/bwHmV28BWj9vAaovbwOmI28BQh9vAS4bbwKSF28A6hdvA9oTbwMuE28CvhNvAnYTbwJKE28CLhNvA1AfXwEI91sC2tdXAclzVwCYi1cBl/NTAGeTUwILU1MCGytTAJMTUwA/A1MB0vdTAyrvUwLu61MANutTAn7nUwFi51MArudTADrnUwPy41MDwuNTAqIPRwBxS0MBvgM/A5PPOwDqXzsCvWs7AcTPOwC0azsD2Cc7AlP/NwO/4zcCx9M3A+/HNwEDwzcAl783Ace7NwP7tzcC07c3Ahe3NwGftzcBU7c3AmZTMwHjYysATncnAH8TIwGsyyMA90sfAXZPHwJRqx8BOUMfAcT/HwKQ0x8C7LcfAUSnHwH8mx8CyJMfAjCPHwNAix8BYIsfADCLHwNshx8C8IcfAx17IwDL3xcBILsTAwujCwFUIwsBQccHAfQ3BwDTMwMDPocDAfobAwPR0wMC4acDAiGLAwPBdwMABW8DAIlnAwPBXwMAsV8DAsFbAwGBWwMAtVsDAH/rEwKLRwcAKW7/AH4W9wDs1vMAQTbvAmLC6wP9IusA0BbrAJdm5wL68ucCBqrnA0Z65wFeXucCQkrnAgo+5wJCNucBRjLnAhou5wASLucCxirnAwmjCwJV+vsDfRbvAI8C4wALdtsCCgrXAYJK0wBL0s8AMobPA22qzwAVPs8CCPbPASDKzwBkrs8CBJrPAkSOzwLIhs8B/ILPAvB+zwD8fs8DwHrPA+uG/wEf9u8BoBLjAf7u0wIImssD2NbDAcfKuwE5SrsAQ6q3AoaWtwD95rcD9Xa3AeEytwDxBrcALOq3AczWtwIMyrcCjMK3AcC+twK0urcAwLq3APMS7wG5iucD/krXAmIuxwIMyrsArjqvAS+ipwEn2qMCUWajAQ/GnwCatp8CRhKfAT2qnwG5Zp8CfTqfAtkenwEpDp8B4QKfAqj6nwIQ9p8DIPKfAZ863wMzjtMCet7HA/EKuwNBDqsCRTqbA63KiwH+xnsDdCpvAh3+XwOgPlMBbvJDAJoWNwHhqisBsbIfACouEwD/GgcDPO37AMSJ5wCdAdMA6lW/Amrm0wES0scCSxK7ALJGrwGITqMA2D6TAdhagwE43nMBgcpjAPsiUwGo5kcBRxo3AUG+KwKw0h8CZFoTAMhWBwPxgfMDg0HbAxnlxwOtZbMC3cWfAIcWxwJOgrsA7l6vAj6KowLhmpcDi4aHA7tidwLXcmcAT+pXAqzGSwBGEjsDF8YrAOXuHwMkghMC+4oDAk4J7wBd5dcAYqW/AfBJqwP60ZMDujl/AovCuwEqtq8CzhKjAX3elwNN9osDHOZ/Aia6bwAWhl8BcoZPASbuPwG/vi8BiPojAp6iEwK4ugcCroXvAzh51wDDVbsAPxWjAf+5iwGtRXcCR7VfANzuswB3aqMCkkqXACmaiwMBUn8BwVpzApgqZwGh5lcCJZ5HAeWSNwPx6icC3q4XAQPeBwDe8fMB4wXXAAf9uwGp1aMAfJWLAYw5cwEwxVsDIjVDAFIqpwKUdpsDRwKLAP3WfwKhEnMBwL5nAdiyWwGXZksCMQo/AhyyLwBgmh8A5OYPAIs1+wG1dd8BfJHDA3yJpwK9ZYsBoyVvAe3JVwCxVT8CXcUnAXbymwJA4o8DzzZ/Afn2cwPhEmcCgIJbAfweTwPb/j8ATpozAAgqJwAzwhMBF5oDAGux5wBNAcsClyWrA34ljwKuBXMDNsVXA4RpPwFu9SMCDmULAUfOjwEtVoMBE1JzAbGqZwJUdlsDl65LAYtCPwFvOjMAB0YnAwHCGwNjPgsBJZH3AHkp1wAljbcBZsGXAQDNewM/sVsDz3U/AcgdJwOxpQsDYBTzAxjahwIx6ncBM25nAX1mWwAv1ksBKrY/AlH6MwMJnicCgbYbA4H2DwF0sgMB5IXnAL+BwwJnAaMAA1WDADB5ZwFaaUcBITUrAzzdDwLdaPMChtjXAC5yewMTAmsAAApfALmCTwKfbj8C1dIzAiSuJwBn/hcCP74LAdfN/wHYiesD2mHPAjGxswIUsZMDuCFzAyhpUwExjTMC64kTAG5o9wGmKNsCyqy/AfSKcwL8omMD6SpTAromQwErljMArXonAmvSFwMyogsC7837Ae9B4wAHpcsD/LG3AIL9mwB2kX8CrZ1fAZz9PwCJNR8AKkj/ALA84wELFMMDysinAYsmZwNqxlcCstZHAatWNwJYRisChaobA6eCCwHXpfsCVTHjAu+lxwDPBa8B21GXAKBtgwGXAWcAovVLAx5RKwDloQsBrcjrA9rMywDouK8DS4SPA64+XwFhbk8BuQY/A0EKLwBJgh8C3mYPAZOB/wMbHeMAt6nHACkhrwDLgZMBjsl7AYcBYwDgIU8Buu0zAJsZFwHy4PcAohzXAeowtwJjJJcCIPx7AOXWVwGkkkcCD7YzAONGIwCzQhMDy6oDAI0R6wPrrcsAuzmvAW+tkwPZDXsAg11fACqRRwMKsS8AY8UXA+LU/wJnPOMCa3DDAg6YowPemIMAe3xjAW3iTwCsMj8AZuYrA43+GwDlhgsB+u3zAF+x0wEtVbcAF+GXADNVewADtV8BZQFHAhs5KwCeWRMCbmT7Asdg4wKOwMsCA2SvAIwEkwEvGG8DjwRPAU5iRwKwRjcBOo4jA/k2EwHgSgMDf4nfAE9dvwLoCaMDmZmDAhARZwF/cUcAb70rAMz1EwGPGPcC9iDfA6oYxwMHAK8DFqyXA3eMewBYmF8CA5g7AF9SPwO8zi8Auq4bApDqCwCvGe8CESnPAuQNrwBbzYsDOGVvA83hTwHcRTMAo5ETArPE9wIM6N8C4vjDAyXsqwLF0JMBHqR7AX6cYwK7uEcBzSwrAmSqOwOlxicC6z4TA4ESAwFWkd8DB8G7AgnBmwP4kXsCID1bAUjFOwHKLRsDeHj/AZew3wLP0MMBLOCrAg7cjwE1vHcDuYhfAQ5IRwGejC8DW9ATAv5qMwInKh8DnD4PAZ9d8wIW9c8DH02rAvhtiwOiWWcCwRlHAaCxJwEZJQcBknjnAuSwywBj1KsAx+CPAiTYdwH+wFsBIYxDAolEKwLV7BMC+P/2/cCOLwLc8hsCkaoHAJVx5wLcPcMCp8WbAnANewCBHVcC3vUzAzWhEwLVJPMCrYTTAyLEswAc7JcBA/h3AJfwWwD81EMDvqQnAulcDwJuB+r88y+6/kMOJwFnHhMCxvX/A1BV2wNSYbMBjSGPALSZawNMzUcDockjA7+Q/wFWLN8BxZy/Af3onwJ3FH8DJSRjA3QcRwI8ACsBrNAPArUf5v0eZ7L/gYOC/AnqIwFNpg8DT1nzARQJzwLZWacDc1V/Aa4FWwBBbTcBtZETAFp87wI8MM8BIrirAmoUiwMOTGsDk2RLA/lgLwO8RBMDdCvq/G2jsv2o8378IhNK/rEWHwIghgsB2HnrAQh9wwCxHZsDsl1zAPBNTwM+6ScBTkEDAaZU3wKnLLsCXNCbAptEdwDCkFcB3rQ3Ane4FwE7R/L/rOO6/hxXgv05o0r8VMsW/Pz6FwOTsgMBiknfAkWptwP9nY8BjjFnAeNlPwPVQRsCP9DzA9MUzwMfGKsCh+CHAB10ZwG71EMAzwwjAmccAwI4H8r+G8eK/4U7Uvx4hxr9uabi/omaBwLmGfcCyHHXA++FqwPa2YMAJsVbA7NFMwFgbQ8AFjznAqi4wwPP7JsCH+B3A/SUVwN+FDMChGQTAR8X3v1fE57/FMti/oxLJv8Blur+gLay/rgO7wLkIuMBNurTAaeawwGwmrcDKg6nAHv+lwOiYosCRUZ/AZCmcwJAgmcApN5bAJW2TwF7CkMCTNo7AZsmLwK15icB/R4fATjKFwGc5g8D2W4HAlqO3wPDgtMAS3rHAD4iuwAyvqsAi66bAlkSjwAS8n8DuUZzAvgaZwMHalcAqzpLADeGPwGITjcAHZYrAutWHwCFlhcAaEoPArtyAwLOIfcDSkHnAr2O0wNWCscAbu67AKrCrwK1TqMDKdaTA/K2gwI8DncAfd5nAMAmWwC+6ksBqio/AFXqMwEiJicD8t4bAEAaEwEZzgcCJ/n3A51F5wJjgdMCsqXDAcUexwBxErsD2XqvAQ5KowMB/pcA5HaLAsjqewAtvmsDFwJbAgDCTwMG+j8D1a4zAbjiJwGIkhsDqL4PAAluAwBVLe8COHnbAwS9xwJF8bMDRBGjAZE6uwCYpq8B4IajADDilwH5mosDnTJ/AxuSbwNX9l8BeLpTASnyQwDfojMCvconAIRyGwN/kgsBDmn/ACKp5wAr5c8AMh27AmlNpwApeZMBSpF/AOHirwIYxqMDXB6XA2PuhwCwOn8DfN5zAtBeZwGSqlcBEv5HAB+yNwCw2isBUnobACyWDwIKVf8CVH3nAxehywErxbMAnOWfAI8BhwM6FXMCBiVfAf5GowOM/pcCwC6LAmeOewE/Tm8Bs4ZjAfQaWwDjgksAlbo/AD3+LwBSoh8B77oPA51KAwMmrecDL73LAgnJswGc0ZsC4NWDAeXZawHj2VMBHtU/Amp6lwPwxosA15Z7AjrSbwGGemMApo5XA3rGSwGnSj8CHpozAGTCJwEQ9hcCWYoHAj0p7wP4LdMCVCm3AOkdmwKLCX8BIfVnAbndTwB6xTcAoKkjAfbGiwGopn8CkwZvAsHiYwFtKlcDUOZLAxUSPwHRpjMB3m4nAs2qGwFHwgsDo833ANDd2wD+1bsBVb2fAlmZgwO6bWcATEFPAhcNMwIu2RsAz6UDAG+KfwA03nMAgrJjAsEGVwP33kcAsz47AtcSLwI/TiMCV/4XA8DyDwIcfgMBzWHnAm2dxwGGmacAjHWLA8M9awOq/U8AB7kzA71pGwDkHQMAq8znAOjidwLxqmcDdvJXAFy+SwMbBjsAudYvAdUmIwO89hcBaUoLAwwp/wNSSecAVdHPAyptswIOuZMBL61zAmmRVwDsbTsDVEEfAjz1AwFSjOcCBSDPAIrOawN3DlsCb85LA7UKPwE6yi8AdQojAn/KEwADEgcBua33Ae453wO3yccCbkGzAd4xmwPnKX8At4lfAshpQwN6QSMCsRUHAMjg6wEBpM8Dq2CzA+1GYwLdBlMC+T5DAunyMwD3JiMDFNYXAtcKBwKbgfMCYfXbAgVtwwMV4asB312TAEHZfwPODWcCb4lLAoQhLwDQ9Q8DrrzvA8GE0wLlQLcDGfybA0hOWwHDjkcCJ0I3A3duJwBcGhsDNT4LA/HJ9wByHdsCQ3G/AtHNpwBhMY8CRY13AgrxXwGlWUsCldkzALuNFwBgkPsCqUzbAicEuwMxuJ8BcXCDAmfeTwBGoj8AgdYvAl1+HwDlog8BmH3/AOa13wO16cMBRiWnA/NhiwFNqXMAyPVbA305QwA6iSsBBNkXA52g/wEPkOMAIQDHAK2opwH7SIcAfehrAMPyRwI2OjcCKPInACweFwOLugMCm6XnAGzNywFe7asBgg2PAB4xcwOzVVcB1YU/Azi5JwLE6Q8AdiD3AmRY4wK1bMsDb5SvAclwkwCeBHMDy4xTAYiCQwL+Vi8C4JYfAPNGCwF8yfcDQ/HTAVANtwE5HZcD1yV3AU4xWwECPT8Bf00jAGllCwKcgPMAFJzbArG4wwHL3KsD2TiXA9ecewFR5F8CfmA/A7WKOwHO8icCEL4XAGr2AwE3MeMAeV3DAVBxowH0dYMD9W1jAEdlQwMeVScD7kkLAVNE7wENRNcAAEy/A2xMpwL5VI8DL2B3AvkIYwJDqEcCwlgrAhsKMwGYBiMC4WIPA+pJ9wGWpdMCT9mvAUXxjwFA8W8AgOFPAKXFLwK3oQ8C8nzzAOJc1wMzPLsDuSSjA3QUiwDQBHMBRPRbApLoQwP42C8A66ATA2D2LwEtjhsAQoIHAXup5wFbHcMAD2WfASSFfwPihVsDDXE7APFNGwNKGPsDH+DbAMaovwPabKMDGziHAHUMbwDz5FMAR7w7AZyUJwP+cA8CCV/y/jdOJwM7ghMA+BIDA1H12wLEjbcAc/GPADglbwHBMUsATyEnArX1BwNNuOcD3nDHAXwkqwCa1IsA2oRvAQ84UwM88DsAf7QfAb90BwPwb+L+0/+y/TYKIwJd4g8DeB33AwEpzwOm7acBpXWDASTFXwIU5TsAHeEXAoe48wA2fNMDjiizAmLMkwHYaHcCbwBXA96YOwEPOB8AENwHACsP1v6OY6b8v7t2/wUiHwFApgsCWO3rAek5wwGCNZsBe+lzAhZdTwN9mSsBpakHADqQ4wKMVMMDkwCfAbacfwLXKF8AKLBDAkcwIwDqtAcCLnfW/d2Pov92s279sd8+/bj+FwI/wgMD0oHfAUYZtwG2VY8Bc0FnAMzlQwAbSRsDdnD3AuJs0wITQK8AYPSPAMeMawG/EEsBN4grAHT4DwAyy97/9Z+m/lJ/bv+1Zzr+2l8G/omaBwAuJfcBGI3XAl+9qwGDRYMC33FbAsxNNwGh4Q8DqDDrAQ9MwwHPNJ8Bp/R7A/2QWwPQFDsDr4QXAwvT7v1uh7L/1y92/h3bPv6Giwb9pUbS/XQG+wJPpusDKRLfAdbazwAtJsMAS/azA7dKpwNvKpsDz5KPAKyGhwFB/nsAP/5vA8J+ZwF5hl8AfQpXArUGTwF9fkcAymo/AKfGNwCpjjMAS74rAeqK6wC/Vt8BgtbTATAuxwKJ4rcDqBqrArbamwFCIo8AUfKDAFJKdwEbKmsB8JJjAZKCVwIk9k8BX+5DAntiOwMvUjMBC74rAAyeJwP56h8An6oXAlhe3wLd5tMDtpbHAxn6uwKvPqsC2OKfAu8KjwENuoMC2O53AWCuawEU9l8B4cZTAxceRwNs/j8BI2YzAe5OKwEttiMAZZobAUX2EwPyxgsAIA4HAC7OzwJfwsMClTa7ArnOrwNxFqMD7kaTAx/agwJJ8ncDoI5rANO2WwLrYk8Cd5pDA1xaOwD9pi8CI3YjAQXOGwNsphMA5AILAVOt/wEwTfMBrdnjAXXWwwEqNrcBDxqrAXB6owIw+pcC3CqLAUFKewOeymsCCNJfAr9eTwNyckMBPhI3ALY6KwHS6h8D+CIXAfnmCwIgLgMAafXvA9iJ3wCQHc8CnKG/A5F2twP5QqsBGZKfAtJikwPbrocCdBp/Abc2bwL8QmMAsbZTAoOqQwK2JjcDCSorAKi6HwAo0hMBkXIHAKE59wKAneMBdRHPARKNuwEhCasDFH2bAbWeqwA47p8BsKaTAGDihwAFonsCKtpvA+suYwBGOlcBazZHApiWOwP6eisD0OYfA+faDwF3WgMCMsHvAcvl1wCiHcMAiWWvAjm5mwFnGYcCLXl3AwUunwCgSpMBA96DAFfqdwNcIm8BENJjAMX6VwLuOksC5TI/ANIiLwGvch8CuUYTAluiAwChDe8D0+XTA5fVuwAg3acAfvWPAo4dewMiVWcB95lTAPTakwDDhoMBGqZ3An5OawF6cl8DVwJTAlP2RwANDj8D1TozAeQmJwGBBhcCLkYHAiAV8wEordcBHlW7AJkRowEM4YsCvcVzAMfBWwEizUcAsukzAmTGhwNa3ncCvYZrAXS+XwC4flMCVK5HAHVeOwK2ei8BS/4jAwQyGwGLEgsDg8X3AL4p2wKBkb8BmgmjAdORhwHSLW8DId1XAiKlPwH8gSsAx3ETAJlaewAy2msApOZfA29+TwF6qkMDKmI3AxKqKwPrch8AgKYXA/JKCwJFnf8Dq8njADFtxwEfuacDGwGLAodZbwM4wVcD+z07AlrRIwLTeQsAqTj3AzaObwPXdl8DFOpTAwrqQwE5ejcCnJYrA6BCHwN4fhMALUYHAtEp9wIgseMBghXLA2ypswICYZMCmLF3AzANWwOkfT8B4ekjA5BFCwMzuO8BUETbAuxmZwOgulcAJZpHAxL+NwKI8isAI3YbAN6GDwE2JgMB+KnvAkoZ1wHEpcMA5EmvAMotlwDxFX8B7w1fAp1NQwMYoScCAQkLA7J87wBRCNcDEJS/A9baWwA+oksBGuo7AYe6KwApFh8DKvoPAClyAwB06esDyA3TAihVuwJtraMBECGPA7OpdwNV3WMCNR1LAeuFKwCduQ8ApQDzAJlY1wF2xLsCXUyjAWnqUwG1IkMCmNozA6UWIwP92hMCVyoDAb4J6wKW2c8BbMm3A2/VmwCABYcAxUVvAoudVwCjEUMDCYkvAx0BFwIL1PcCwfDbAfUkvwOFcKMBXtyHAqmKSwN0OjsAl2onAfsWFwM7RgcDD/3vAzKB0wNiHbcDFtWbAKStgwFLoWcBE7VPAVTdOwIvHSMDtnUPAPU4+wJA6OMASCjHAKospwMhRIsDpXhvAiW6QwBz6i8Cdo4fAHGyDwDCpfsDvu3bAERJvwPqsZ8DPjWDAdLVZwIUkU8BY20zA99lGwAYeQcAAqDvAPHg2wEI6McDnNCvAKx8kwC6aHMCfWhXAhJyOwM0IisDJkYXAmziBwKj8ecDnx3HAx9RpwOgkYsCzuVrAU5RTwLG1TMBxHkbA7s4/wDnHOcBFBTTAAokuwBRTKcDLJiTA/S0ewMs0F8C9qQ/AGOuMwHs5iMBJo4PAZFN+wK2bdcCWIW3AIedkwCXuXMBIOFXA98ZNwGObRsB8tj/A6xg5wBLDMsAJtSzAEe0mwI9qIcB3LhzA4hMXwBgjEcDzSgrAtViLwKKKhsCo1oHA/nt6wKyDccCfxmjAA0dgwN0GWMAJCFDAMExIwMbUQMABoznA1rcywPUTLMDGtyXAZ6MfwGzVGcCpTBTAZAoPwBL6CcDCGATAxuOJwLL6hMBfKoDAF+h2wNuxbcBqtGTADPJbwO9sU8AcJ0vAciJDwKFgO8Ag4zPAK6sswL65JcCNDx/ACa0YwFWSEsBUvgzAUC8HwNzmAcBBrfm/sIqIwBOIg8C+OX3AopRzwEsjasAq6GDAneVXwPMdT8BZk0bA3Ec+wGE9NsCadS7ABPImwOKzH8AzvBjAtAsSwNuiC8DRgQXAlU//vwYl9L+9h+m/3UuHwC4xgsAfWXrAfH5wwO3UZsDrXl3A6B5UwEYXS8BTSkLAQLo5wB5pMcDVWCnAG4shwHQBGsAlvRLAN78LwGoIBcB4Mv2/uuPwv54j5b+F7Nm/nkCFwED0gMCvr3fAdKJtwJvDY8CeFVrA95pQwBhWR8BkST7ALHc1wKXhLMDhiiTAzXQcwCShFMBtEQ3A9cYFwJCF/b9eC/C/WCDjv+7E1r/D+Mq/omaBwF+LfcDmKXXAWv1qwCbsYMAbCVfAtVZNwG7XQ8C3jTrA93sxwH+kKMCHCSDAJq0XwEqRD8C0twfA8CEAwKCi8b/OjeO/BQfWv1cPyb9Bp7y/KMjAwJ9avcB8+bnAmry2wF2ks8D7sLDAeuKtwLI4q8BNs6jAyVGmwHoTpMCP96HA6vyfwBMinsBwZpzAz8iawOJHmcBQ4pfAuJaWwLdjlcDoR5TAy3O9wPmTusCxH7fA1rmzwEh4sMBwW63AhmOqwJOQp8B04qTA1FiiwDXzn8DusJ3AL5GbwOOSmcCNtJfAl/WVwMJUlMDL0JLAWmiRwAwakMB+5I7ATtu5wLZCt8DCXLTAXOKwwNV3rcCmMarAPBCnwNMTpMB3PKHAB4qewDP8m8B+kpnAQ0yXwLQolcDFJpPA60SRwKGCj8Ci3o3Ao1eMwFLsisBPm4nASy+2wEmts8BRDrHAnCKuwLqiqsCRM6fAzeijwNrCoMD6wZ3APeaawIQvmMCBnZXAvC+TwJDlkMA1vo7ApriMwEvTisCnDYnAgWaHwIDchcBRboTApKyywGYCsMCqe63AutaqwKXlp8DjYKTAJO2gwNSdncBjc5rAFW6XwP6NlMAB05HA1jyPwAXLjMDufIrAylGIwJ5IhsDEX4TAyZaCwHPsgMDtvn7A7FOvwBKBrMD90anAjUanwA2cpMD2paHA7xyewKWkmsDTUJfA7SGUwDoYkcDPM47Al3SLwEjaiMBxZIbAcxKEwInjgcCJrX/A2tR7wDc8eMAv4XTAaySswOEpqcARUqbALZ6jwBAOocBmXp7Aq2ObwPPWl8AqWpTA4QGRwI/OjcB+wIrAydeHwFoUhcDvdYLALPh/wGpMe8AR53bAVcZywLjmbsBsR2vA+PmowLfwpcB5/KLAvh+gwBNnncBQ0prA4R2YwN0elcAIj5HAyg2OwBSxisBfeYfA+maEwAF6gcDFZH3Avx94wBQkc8CTcG7AvANqwMfbZcBM9WHAVbylwOiUosDRkZ/AV62cwKrmmcDMLJfAaZOUwJrakcCo147AQkWLwJu/h8CCXoTAcyKBwIEXfMAWNXbAh51wwF1Qa8DBTGbAipFhwDwdXcAU7ljAi4miwMdBn8DUH5zA4h+ZwORAlsAIgpPA4eCQwHpRjsCrlIvAIo6IwLj5hMCyb4HAfhR8wL+TdcDQXW/A+XJpwCXTY8DhfV7AXnJZwHivVMC6M1DAlnufwL4JnMCOvpjAOpqVwMmcksDUxI/AiwqNwItxisDW84fA7EqFwGZCgsD8WH3ARzx2wMBob8Bx32jACKFiwNOtXMDGBVfAcqhRwBKVTMCEykfA85qcwHz/mMA/ipXAozuSwOATj8ACE4zA4jiJwPaDhsCj8YPAYHqBwA3AfcBL0XfATrVwwMeVacDyuWLAJChcwE/hVcDL5U/AkDVKwDfQRMABtT/A5eaZwH0ilsCtg5LADAuPwAW5i8DUjYjAiImFwACsgsCy53/AVcJ6wJXldcDMynDAH/BqwDLmY8Ayx1zAW/JVwLxoT8DMHknABRtDwKhiPcBV9TfAel6XwANyk8BSqo/AKwiMwCeMiMC0NoXAFQiCwLYAfsDUPnjADshywAmcbcDYumjAmr9jwMn6XcCbB1fA0ORPwPgNScDigULAmz88wKRHNsAyjTDAiACVwBXtkMBq/YzAczKJwPWMhcCODYLAYml9wEcFd8D37nDAQiZrwAKpZcBSdmDAlo5bwESkVsDt71DAvBtKwFL2QsCEHDzAA401wO1IL8DDUCnAt8uSwIaSjsD3e4rAGomGwN66gsAUJH7AhB53wPZlcMD/+mnA091jwEkOXsCOiljAMFFTwOZiTsB+iUnA7uJDwEUpPcBO/TXA7h0vwOaLKMD8RiLAib6QwPpgjMDJJIjAIQuEwBQVgMAmh3jA1y5xwIUiasAmY2PAUvFcwEnNVsDr9lDAsWxLwKUsRsDKN0HAUG88wBbRNsBkNzDAuAQpwI0eIsCthRvAW9eOwPFWisCA9oXAUbeBwCI1e8CsQnPAJplrwDI6ZMAgJ13A72BWwEHoT8BbvUnAJuBDwG1PPsCvCDnAQA00wLdKL8D0vinAGkYjwLoMHMDGHxXAdRSNwMVyiMCY74PAkRh/wDqUdsCRVG7AwVtmwLqrXsAjRlfAVSxQwFNfScDK30LAB648wPvJNsDCMjHAT+UrwEnjJsBWICLAbK0cwGVVFsBVFQ/ACHSLwLyyhsBsDoLA/xB7wKVEcsBcumnAjHRhwGh1WcDjvlHArFJKwCIyQ8BSXjzA79c1wE6fL8BqtCnArxYkwIXCHsDmuRnAifYUwH+cD8BHZQnAO/SJwAUVhcA8UYDAnVR3wExDbsA9cWXAB+FcwBWVVMCfj0zAoNJEwMtfPcCIODbA610vwK7QKMAwkSLAc58cwBn7FsBSoBHAFpEMwB3MB8DnhQLALZOIwMiXg8BzbH3A7N9zwNyMasAXdmHAWJ5YwDkIUMAqtkfAZ6o/wPHmN8CBbTDAhz8pwB5eIsAIyhvAroMVwBeLD8Dv3wnAtn4EwLXR/r/JOvW//06HwCM5gsASd3rASK9wwNIdZ8CTxV3AYKlUwPbLS8DzL0PAy9c6wL/FMsDV+yrAznsjwB9HHMDrXhXA/sMOwMZ2CMBVdwLAvIr5v2K77r9nguS/zkGFwDj3gMCUvnfA+r5twInyY8AqXFrAwv5QwCbdR8AX+j7ANVg2wPj5LcCn4SXATBEewLCKFsBPTw/AUmAIwI6+AcDy1Pa/Wsjqv8xW37+GetS/omaBwLKNfcCRMHXAQgtrwEgHYcA1NlfA85pNwGc4RMBoETvAuSgywP2AKcCwHCHAHv4YwFcnEcApmgnAF1gCwKfE9r9yc+m/jr3cvz+j0L8OJMW/6iXDwO/sv8BM27zAOvG5wLgut8CIk7TANh+ywBnRr8BUqK3A36OrwIrCqcCHAqjArmKmwMLhpMA3fqPAczaiwNsIocDV85/Ay/WewDANnsCDOJ3AwhbAwEjqvMA1rLnAjZW2wI+ms8A737DAWz+uwH3Gq8D7c6nA+kanwHc+pcBDWaPAp5WhwE3yn8AUbp7AawedwLu8m8BojJrA1nSZwG10mMCfiZfAxYq8wHTeucD4q7bA2GizwDZNsMBVWa3AO42qwLLop8BPa6XAbBSjwDbjoMCo1p7Al+2cwFYmm8CNf5nABviXwEKOlsCnQJXAmA2UwHnzksCy8JHAeLe4wOpUtsDrorPAFWuwwPUircBmAqrArAmnwNM4pMCqj6HAxw2fwIuynMAjfZrAjmyYwKR/lsC/tJTAfQqTwLd/kcDXEpDAUcKOwIiMjcDcb4zA/PC0wNODssCQG7DAR2StwL0nqsCp2qbAN7WjwK+3oMAg4p3AXjSbwAOumMBzTpbA3hSUwEYAksCFD5DA/0COwEOTjMA4BYvAR5WJwNdBiMBSCYfAwVaxwIe+rsBnTKzA2d6pwKkip8AM4qPAEZCgwMZlncB6Y5rAPomXwOvWlMAeTJLAP+iPwIKqjcDrkYvAVp2JwDLLh8D9GYbAqIiEwKYVg8BSv4HAEemtwLklq8BliKjAVRGmwOSeo8Av3qDAHZqdwEZDmsAvFJfAKA2UwEgukcBqd47AMuiLwAqAicApPofAliGFwDApg8BwU4HAij1/wFAUfMAZKHnAg6WqwK+5p8Ad8aTAuE6iwMDSn8DUW53A+JaawAtQl8Bl9JPAi8CQwNO0jcBX0YrA9xWIwFqChcDtFYPA7M+AwMRefcBcZnnAqrN1wGhDcsCgE2/AZkOnwARLpMCydaHADrmewKERnMDIkJnAxxWXwCJNlMDvA5HAhqONwPRqisCUWofAhHKEwKmygcBaNX7ABFR5wMu/dMDNdnDAz3ZswO+8aMDFRWXA2uijwCLRoMB+253ATA2bwJpemMCQzpXAkEuTwN7MkMDLAI7A47WKwMJQh8CDE4TAhP6AwNIjfMAzm3bAiWJxwMB4bMBZ3GfAeYtjwOmDX8DgwlvAyaegwMNkncCdS5rATVyXwIaTlMCR6ZHAr2KPwH36jMA4gYrAD7KHwABmhMAy/IDAoHR7wHdBdcA5X2/AwM1pwHCMZMA9ml/AsfVawPScVsDXjVLAE5idwLYnmsAA4ZbAKMSTwCnRkMDGB47ANmaLwH7kiMB+hIbAAySEwAthgcC5KHzA2kt1wOO+bsChgmjAbJdiwCb9XMA7s1fAqLhSwP4LTsBrq0nAKLmawPsbl8D3p5PAkV2QwAY9jcBYRorATXmHwALVhMAhWILAVf1/wCNae8Cf7HXAInBvwLiXaMD+BWLAtMBbwJfMVcCRKVDAF9dKwC3URcBsH0HAMAqYwP1AlMA1oJDAiiiNwHXaicA4tobA2buDwCbrgMDGhnzA64V3wKXUcsCZVG7A8fZowLqWYsBpulvAlC5VwP3yTsDk/kjAKlNDwCz4PcD17DjABoqVwNuVkcAiyY3AwSSKwHCphsCsV4PAvS+AwF1jesCjunTAKWRvwDNcasD7o2XAUyphwK3tW8A4r1XA+81OwCw/SMDIAkLAkhQ8wNV1NsCkFjHASDeTwG4Zj8DVIYvAl1GHwKCpg8CpKoDAbqp5wCtTc8CsT23Anp9nwC5CYsAZM13A7HNYwGD5U8De1E7AorhIwBXVQcAnRDvAlAQ1wGEUL8BydSnAWhCRwE3KjMAjqYjAHq6EwF3agMCfXXrAaVhzwCqmbMCER2bAozxgwD6FWsCaIFXAnwpQwHhES8AHyUbAfbxBwLLAO8DW1TTAMD4uwD/6J8CfCSLAcROPwNmmisCcXYbAIzmCwGp1fMDmxnTAomhtwCVcZsCNol/AgzxZwD8qU8CDa03Anf9HwMXiQsCgFT7AyJY5wLWhNMDkyC7APNcnwDk4IcDj7BrAnT6NwEOtiMCfPYTAauJ/wN+Sd8A0j2/AsdlnwEh0YMCHYFnAlp9SwCkyTMCCGEbAblJAwELfOsCKuzXAZecwwLphLMD6fSfAMsUhwEnZGsDoMhTA0Y+LwJjbhsBZR4LAVql7wC0Kc8APtGrAmqliwBztWsCQgFPAjmVMwEadRcB3KD/AbAc5wP05M8CLvy3A8JQowMW5I8BELR/AL1oawCfCFMD62w3A6wSKwMkvhcDTeIDAYsN3wPrXbsCBMmbA1tVdwJvEVcAnAU7AfI1GwDprP8CcmzjAax8ywPz2K8AyIibAd6AgwPZuG8DCjBbAZvkRwFk2DcBhsAfAwpuIwLWng8D9n33AnCx0wJj4asAqB2LAZ1tZwDP4UMA34EjA0RVBwAmbOcCLcTLAmZorwAYXJcAz5x7ADAsZwAaCE8CdSQ7AXWAJwCHGBMAkEwDAKVKHwDBBgsBulXrA3uBwwA9oZ8BSLl7A5DZVwN2ETMAmG0TAbvw7wBkrNMA5qSzAgHglwDuaHsBIDxjAEdgRwIz0C8A5ZAbA5SQBwCpp+L/rJu+//0KFwA36gMCkzXfA49ttwDciZMD/o1rAkGRRwChnSMDjrj/Arz43wD8ZL8AAQSfACrgfwBqAGMCEmhHAMQgLwJbJBMBkvf2/II7yv5wB6L/WEt6/omaBwAeQfcBHN3XAURlrwMciYcAGZFfAbeBNwFKbRMD3lzvAedkywM1iKsCqNiLAhVcawH3HEsBXiAvAc5sEwIMD/L+Dd++//JLjvxdV2L+xus2/i5DFwIWkwsC84r/A8Uq9wJzcusD1lrjA93i2wGqBtMDgrrLAxf+wwO9xr8AYBK7Ai7SswHGBq8D0aKrAQ2mpwJWAqMAyrafAce2mwL0/psCXoqXAOGvCwINPv8AiXrzAIJe5wEH6tsADh7TAojyywBwasMA7Hq7Am0eswKeUqsAsA6nA45GnwB0/psADCaXAve2jwHjrosBpAKLA1iqhwBNpoMCIuZ/AKAy/wKgsvMCJC7nA2RS2wKlIs8DAprDAoS6uwIzfq8CDuKnAU7inwJrdpcDMJqTAt5GiwP4cocAAx5/A542ewNdvncD+apzAjn2bwMmlmsAD4pnAiEK7wAjQuMA867XAwcSywM7Ir8B596zAj1CqwJfTp8DUf6XATlSjwNRPocAFcZ/AWLadwKwdnMCLpZrAVkyZwD0QmMBk75bA9ueVwCT4lMAuHpTAbz63wHAItcBkkLLAFaevwEt7rMAheqnAsqOmwND3o8AHdqHAnR2fwJ/tnMDe5JrA/QGZwHVDl8Arp5XApiuUwD/PksAmkJHAhWyQwIFij8BNcI7A6GOzwHcFscBjyq7AYU2swFVgqcBJL6bA9CijwHVNoMCknJ3AEBabwAe5mMCWhJbAk3eUwKOQksBBzpDAWy6PwGmvjcDaT4zAww2LwFjnicC/2ojAlbivwDcsrcCRyKrAioiowCMHpsAaF6PA2uCfwGXVnMDh9JnAKj+XwNSzlMAwUpLAURmQwBAIjsAUHYzA21aKwFyziMD/MIfAOs6FwDGJhMD8X4PAZTyswHSCqcC48KbA5oekwApDosDQvZ/AhsucwB6QmcCVf5bAFpqTwIHfkMBvT47AOOmLwPCricB1lofAcKeFwGLdg8BLNoLAg7CAwBOVfsAJBXzA6cmowMj+pcCgSKPAkrGgwJxDnsAL+pvAinGZwLZ9lsAyPZPAoSeQwDA9jcDFfYrAAOmHwDt+hcCPPIPA3iKBwKZffsDkw3rAi253wCdcdMDMiXHAXkqlwMFbosAwl5/A2vScwOpumsDY+5fAs62VwHQik8DHLZDANeiMwKXNicBM3obAFRqEwKOAgcCrIn7AlZZ5wM1adcCybHHATsltwM5sasCXU2fA6NmhwPPFnsBd3pvAxR2ZwBmClsDRCJTAkq6RwCZej8Cx0IzA1duJwEGRhsC/cYPAh32AwBZpe8DnLHbAR0VxwHywbMBVbGjAOnZkwDjLYMCTZ13AnJqewNVVm8DqPZjAz1KVwDGUksDm/4/Al4uNwBw7i8AiB4nAYnyGwP6Hg8BzOIDAECh6wPc1dMCFmm7AF1VpwH1kZMAGx1/AiHpbwHJ8V8DVyVPAJ5CbwNYamMAb0pTAOraRwC7HjsCoBIzAFW6JwBIBh8A7toTAu4uCwI8agMCzZHrAybtzwDdpbcCFbWfAqshhwAp6XMCBgFfAZtpSwJiFTsCLf0rA3rmYwKMUlcBom5HAuk6OwOQui8DlO4jAdnWFwAvbgsCraoDAJ0h8wLYCeMBDQ3PA9ZJtwD/xZsCUpGDA7KFawLXzVMDxm0/Ag5lKwMzqRcC0jUHAtRaWwIpCksB3mY7AUxyLwLPLh8Dnp4TA9bCBwDrNfcCtkHjAp6hzwCAUb8Cu0WrAITNmwESqYMB8CFrAILpTwGHBTcAOG0jA+rpCwLKvPcBo+DjATKWTwHejj8CLy4vAoh6IwJedhMAFSYHAh0J8wLxMdsA2sHDA8WtrwKF8ZsC84GHAKZddwJMLWcAHrFPAlRJNwB7ARsDhxUDApCA7wJ3ONcA7wzDA9WORwAU2jcCOMInA41SFwCSkgcBmPnzAYo11wPM1b8BAOGnA4pNjwOJHXsBEUVnA/a1UwEJdUMDQ4EvAHqJGwEgPQMCdujnAgL4zwJMWLsDZxCjAwlCPwH/4isAPx4bA972CwCC9fcD8U3bAUEJvwGuJaMARKmLAdiRcwD94VsCBJFHAkSZMwOJ7R8D6I0PAtrY+wPWFOcATCzPAfa4swKarJsAuAiHAj2mNwPPoiMBXjYTAaViAwGeXeMAl0XDAXmBpwOtGYsAnhlvA4x5VwF8RT8BMXUnAzAFEwIf8PsBrSjrAUus1wEeNMcDaaCzAkQcmwBCjH8BQmBnAD6yLwDcFh8BtgYLA90R8wCjUc8CGs2vA1eVjwG5tXMA3TFXAloNOwGcUSMD5/kHACUM8wMbfNsAo0zHAmxktwEqzKMB2ZCTAcEwfwMEEGcBWmBLA2BWKwP1KhcAloYDAYDR4wNlvb8Ad+GbAS9BewC77VsAre0/AM1JIwLeBQcCfCjvARu00wHcpL8BtvinAc6okwHDpH8DiexvATTwXwLUwEsCjAgzAcKSIwNq3g8Bc1H3AsXp0wHlma8BVm2LAsRxawLTtUcAxEUrAl4lCwOBYO8CKgDTAiQEuwEbcJ8CWECLAw50cwGmCF8DsuRLAG0UOwIgQCsDmEgXAWlWHwFNJgsA0tHrAPxNxwKKzZ8AkmV7AacdVwORBTcDBC0XA3Sc9wK+YNcA9YC7AD4AnwCb5IMD4yxrAZ/gUwMh9D8DjWgrADosFwPUOAcAVsvm/MUSFwOj8gMDd3HfALvltwKVSZMAd7VrAYMxRwBb0SMC1Z0DAcyo4wDM/MMB1qCjASmghwEaAGsB28RPAXLwNwOjgB8B7XgLA0mf6v7C58L/jsue/omaBwFuSfcAJPnXAhidrwKM+YcCNklfAISdOwCwARcBZITzAJI4zwMhJK8AwVyPA57gbwAZxFMAvgQ3AeeoGwHStAMA3lPW/u3/qvzUb4L+SXta/zxnIwFR6xcAPB8PAKL/AwIChvsC3rLzAL9+6wBg3ucCZsrfAH0+2wCwLtcCz5LPAntmywOTnscCJDbHAo0iwwGGXr8AJ+K7A/miuwL3orcDgda3AdqXEwJLTwcCTLr/A+rW8wPZousBrRrjA+0y2wBB7tMDhzrLAfkaxwGjfr8AVmK7AfG6twIZgrMAmbKvAXo+qwELIqcD7FKnAz3OowBzjp8BbYafAwmLBwKJhvsAbirvApN+4wMFhtsCnD7TAPuixwC3qr8DgE67AlGOswFrXqsCqbKnA+CGowD/1psBo5KXAYu2kwCwOpMDYRKPAjY+iwIzsocAvWqHAuKG9wEkhu8CvGrjAkz21wK2NssCKCrDAYrOtwCKHq8B1hKnAyamnwF71pcBOZaTADfeiwPyoocAkeaDAa2WfwL5rnsAbip3Aj76cwD4HnMBlYpvA+pC5wJRht8CI3LTAxtCxwCDursDYOKzAfbCpwE9Up8A/I6XA+hujwPM8ocBshJ/Af/CdwLJ+nMBHLZvAUPqZwLXjmMBi55fAUAOXwIo1lsAyfJXAMHi1wOpRs8CDHbHAppSuwAuEq8Dpm6jASeGlwMBTo8CT8qDAuLyewOGwnMCDzZrA4xCZwBt5l8C6A5bA/66UwOl4k8BsX5LAcWCRwPB5kMDwqY/A8o+xwDA6r8CrDq3AstWqwMxJqMClNKXAE0eiwCWHn8B39JzAU46awLRTmMBPQ5bAnluUwOeaksBH/5DAUoaPwDsujsAT9YzAs9iLwBDXisAe7onAatmtwFxTq8Am+KjAacemwEyKpMAf/KHAuOKewMHvm8CQKpnAxpKWwLInlMBV6JHAZ9OPwGbnjcCbIozAJIOKwJ4GicAqq4fA5m6GwK1PhcBhS4TArU+qwI+ep8DfEqXAPbKiwFF8oMB6O57AxaubwGaOmMAXlpXArcuSwNAukMDTvo3AvXqLwEthicD+cIfAIKiFwNQEhMC+hILA7yWBwBjNf8DpiH3AI6imwPLno8A2TaHAp86ewKNonMCOLZrAZumXwOFYlcDRN5LANjqPwJ1qjMC0yInA1lOHwA0LhcAc7YLAhfiAwDFXfsDwCHvApwF4wFE9dcBNuHLADRGjwF0roMDebp3A9dqawIRrmMBaG5bAS9uTwDmUkcCYA4/AGd+LwD7ciMCAB4bAlWCDwNzmgMDLMn3A8e14wDj8dMBEWnHAXgRuwPn1asDsKmjA8aGfwPeInMDKn5nABeaWwA1ZlMCd7pHAi6mPwKyDjcAbPIvAGKmIwGCEhcBOfILA6kR/wB/tecAG8HTAyEtwwP/9a8DBA2jAtVlkwC38YMCu5l3Ae2ucwHQemcBBAZbA3hOTwPFVkMDIxo3AOWSLwJEkicBTCIfAft2EwABMgsCDT37ACzV4wDV3csCFFW3A0A5owExhY8CcCl/A3QdbwL9VV8CW8FPARG2ZwJLslcBWm5LA6XmPwFGIjMA6xonA+jKHwDfNhMD0koLA1XyAwPm/fMBHxHfAJ5FxwABua8AapmXAkzpgwE8qW8CQc1bA/xNSwMYITsCZTkrAb6aWwOPyksAIbo/AlxiMwPHyiMAj/YXA4TaDwIifgMDNa3zAhO93wNPJc8AKrm/Ar8dqwKysZMC5kl7ANdFYwIBcU8C6Qk7Ax4JJwF8aRcCvBkHArxWUwH4wkMDeeIzA3e+IwDiWhcBZbILAqOR+wMlPecDiGHTA4D1vwM25asCajGbAQodiwCu5XcA4t1fAKptRwAvaS8CWckbARFhBwCePPMDtHTjAUbmRwA6kjcDouonAN/+FwBBygsBvKH7AP8x3wMfPccCNMmzAbfNmwJ0QYsDDhF3AB1BZwBRZVcDCmFDASbZKwFuXRMC80j7A62o5wAdZNMDgmC/AS4+PwNpLi8DGMofArEWDwNkLf8BC6XfALSVxwIzAasCku2TADBZfwK/OWcDQ41TAZlBQwBsUTMAUH0jAvHNDwIKtPcB8hzfA/8AxwAJXLMDCQyfASpWNwM8licC33oTA1cGAwJahecD9GXLAIe9qwKkiZMCXtV3AP6hXwEj6UcCpqkzAuLdHwLgcQ8DW2D7AC+I6wJNMNsB6pTDAAncqwB2oJMAAOB/AwsiLwJcvh8CkvILA0eN8wHeidMCHuGzA2ihlwLz1XcDkIFfAYatQwJiVSsA/30TAXYc/wFOMOsC46TXAOp4xwKmlLcAgJinAMJ4jwEZnHcD5jxfAACeKwKFmhcAwyoDAk6d4wNsKcMDywWfALdBfwG84WMAT/VDA3B9KwOqhQ8Cwgz3A8sQ3wMlkMsCkYS3AaLcowEdkJMAwZiDAZQAcwKaXFsBJWBDAN62IwDjIg8CPCX7AKsp0wHzWa8CNMmPAG+JawIboUsC9SEvAJgVEwJMfPcAymTbAhnIwwGOrKsDvQiXAqTcgwMeFG8D9KhfAiSUTwMnSDsDakQnAkViHwI1RgsBk03rAa0ZxwIsAaMAFBl/A5VpWwPECTsCTAUbAw1k+wPQNN8AHIDDAOJEpwBpiI8CQkh3AziEYwGQOE8DXVA7AXfIJwIXlBcAiogHAZEWFwMn/gMBA7HfA3hZuwNSDZMCDN1vALDZSwOKDScBzJEHAURs5wH9rMcB+FyrAOSEjwP6JHMBtUhbAeXoQwGgBC8DU5QXAmCQBwNF0+b9KTPG/omaBwLCUfcDWRHXA4jVrwNxaYcDKwVfAD29OwPBmRcCFrTzAokY0wMI1LMDzfSTAwiEdwCkjFsCCgw/AfkMJwCBjA8B4w/u/93vxvxXq5789Bt+/T7vKwHpmyMDIPsbAwELEwKRwwsBtxsDAB0K/wDPhvcAbobzA63+7wFh7usAXkbnA8764wM8CuMCpWrfAn8S2wO8+tsD5x7XAPl61wF4AtcAZrbTAH/nGwDFwxMDKFcLAxui/wLPnvcDVELzANWK6wKPZuMDvdLfARTG2wMgMtcAtBbTAKRizwIFDssAVhbHA39qwwPlCsMCeu6/AKEOvwBXYrsACea7Aa27DwDuwwMCLIb7Am8G7wE6PucA2ibfAma21wIb6s8DZbbLARgWxwA2+r8BClq7AoIutwNibrMCsxKvA9wOrwLBXqsDtvanA5TSpwO+6qMCDTqjAwOG/wAoovcDxY7rAis+3wBtqtcCNMrPAdiexwCBHr8Cdj63Ay/6rwGeSqsCfR6nAhxyowN4Op8BRHKbAoEKlwKF/pMBJ0aPAqDWjwPKqosB6L6LABty7wJKcucBj3rbAbxS0wFx6scB3D6/AsNKswKDCqsCW3ajApSGnwLCMpcB2HKTAKM6iwMSfocATj6DAwZmfwIq9nsBB+J3A1UedwFaqnMDwHZzAVJC3wMiXtcCTU7PAopGwwODBrcAtIqvA3LGowONvpsDgWqTAJnGiwMywoMC0F5/AoKOdwNBRnMAkIJvAawyawFMUmcCUNZjAAG6XwIC7lsAhHJbAG22zwGdMscB+T6/A8gatwPJBqsBvbKfAJsekwHNRosBPCqDAYPCdwPsBnMA6PZrAA6CYwBcol8C80pXAzp2UwA6Hk8AvjJLA6aqRwAjhkMBzLJDAan2vwGIqrcAyBKvAvgKpwN62psB876PARRShwHJpnsBl7pvAH6KZwEiDl8A9kJXAGceTwMQlksABqpDAHFGPwOIYjsAl/4zAfwGMwLAdi8CAUYrAB8KrwEk8qcCK46bA57ekwKaxosCEY6DAaZqdwIu5msA5CZjA24iVwHk3k8DBE5HAExyPwI9OjcAfqYvAhSmKwBjNiMCSkYfAznSGwGh0hcAOjoTA/QeowLdvpcAx96LAxpigwLhnnsDKXJzAmwyawN9Cl8BmXJTAoKaRwPogj8CDyozA76GKwKSliMDC04bAOCqFwMqmg8DURoLAAQiBwGfQf8AUyn3AoUukwJ6OocDT/J7AE5OcwEZKmsDVE5jAWQSWwGGyk8AE6ZDA/fyNwMxBi8DntojAYluGwPgthMASLYLA1laAwGdSfcDjQ3rA6Xx3wKn4dMD5snLAZq2gwDDAncBgBZvAV3qYwE4VlsCU15PAzrqRwIKoj8BJVY3A/IyKwHObh8Dh2oTAxUqCwHTUf8D8b3vAA2V3wNuvc8BpTHDAPjZtwDVoasBb3WfAsUqdwDAmmsCBNJfARXWUwLnnkcAbio/AuVGNwKk+i8AxR4nAffWGwOkuhMDqN4HABOR8wG65d8BV7nLARYBuwCZsasBTrmbAt0JjwOYkYMDQT13AGySawFzIlsBfn5PANqmQwI3ljcCqU4vAcPKIwFu/hsAzsoTAUMWCwFSOgMDbnXvAB6V1wJ4OcMC52WrAqwRmwAuNYcDNb13AU6lZwI81VsAZEFPADDmXwKKmk8BtRpDA8xiNwFAeisA5VofA+7+EwIRagsB3I4DAGTN8wONqeMAqHHTA/sRuwNLTaMDNNWPAqvZdwLIXWcCMllTANHBQwBihTMAuJUnAW4iUwFrAkMCMKY3A48SJwOyShsDPk4PASMeAwFxZfMDthXfA2w9zwB70bsAvMGvAzAdnwHfRYcAu3lvAqEpWwHsQUcClJ0zAAZ1HwJZtQ8DblT/AYhCSwFUUjsALSIrA26yGwL5Dg8BLDYDAZRN6wHRxdMCEM2/AkFdqwIDZZcDStWHAT+pdwBLbWcDP0VTAMtpOwNhEScAhDkTAWzI/wKKgOsApaDbABs+PwN+gi8CtoIfAHtCDwI4wgMD8hXnAHxBzwPb/bMAhVWfAcA5iwPApXcDco1jANnhUwBalUMBTpEzAXsZHwB/LQcCeMzzA2vk2wGoeMsAJmy3Ay8GNwNVjicC2MYXAZS2BwCWxesBHaXPARoVswHIGZsBR7V/AlTlawCDqVMAP/U/A8W5LwEs7R8CGYEPAMm0/wL+tOsCotjTAdhcvwC7cKcB4/iTA6+WLwLZah8D7+ILA04V9wPZ0dcDRwm3AO3JmwFmFX8CQ/VjAdttSwNEeTcCUxkfA7dBCwL46PsAQ/znAnhw2wLE2MsAflS3A+6InwOX6IcDpthzAZTiKwLSChcDz84DA8Rx5wO+ocMDfj2jAP9VgwPV7WcA3hlLAefVLwGbKRcDVBEDAzKM6wIulNcBEBzHAh8MswF/ZKMDpACXAKmogwBiQGsAb3xTAGLaIwM7Yg8CXP37ABRt1wJlIbMDBzGPAhKtbwG/oU8B2hkzA3YdFwC3uPsAgujjAoesywMmBLcDoeijAhNQjwLGIH8DLlhvAzMsXwPU/E8D+fQ3A0FuHwN5ZgsD+8nrAYHpxwMhOaMDudF/AR/FWwObHTsBh/EbAvJE/wE2KOMCr5zHApaorwDbTJcCMYCDABlEbwEiiFsCOThLA4lQOwGWXCsCCFgbAl0aFwLECgcDO+3fA8DRuwMO1ZMAtg1vA7qFSwIEWSsAC5UHAFRE6wMmdMsCFjSvA9OEkwPSbHsCVuxjAFEATwOQnDsC6cAnAHxUFwKUTAcD4tvq/omaBwAaXfcCvS3XAZURrwHF3YcC+8VfANbhOwJnPRcBuPD3A2QI1wIgmLcCbqiXAh5EewAfdF8ANjhHAvKQLwGIgBsCF/wDAzn/4v8q4778opue/FG7NwKVgy8A9gMnAucrHwMM9xsDq1sTAl5PDwMFwwsAsbMHAX4PAwOWzv8Bh+77Am1e+wIHGvcAlRr3AwtS8wLlwvMCSGLzA9sq7wLOGu8C0SrvApGDJwIkex8CUC8XA+CXDwJxrwcAk2r/AF2++wOYnvcCIAbzAtfm6wPgNusDVO7nA7IC4wADbt8D4R7fA5MW2wPlStsCU7bXAN5S1wIpFtcBVALXAw4vFwAMTw8Afy8DArbK+wOLHvMCrCLvAt3K5wH0DuMBvuLbAiY61wHqDtMDMlLPA/7+ywLACssCcWrHAp8WwwNlBsMBlza/AomavwA8Mr8BPvK7AUPHBwHFAv8CuwbzADHS6wCNWuMAxZrbAI6K0wKwHs8BPlLHAZkWwwPsXr8CvCa7AEBitwJlArMDigKvApdaqwMA/qsA4uqnAOUSpwBjcqMBOgKjAXP29wKKou8CT8bjA2my2wIIZtMAs9rHAFwGwwDg4rsBAmazAtiGrwADPqcAQnqjAh4ynwPWXpsDTvaXAtfukwE5PpMB4tqPANC+jwKq3osAoTqLAIKm5wOmzt8CLXLXAWp+ywLcUsMC0u63A95KrwMiYqcAby6fApiemwPGrpMBiVaPA+iCiwDMMocCvFKDA4TefwFlznsDHxJ3A/ymdwP6gnMDnJ5zAa021wLFfs8AqZrHAPA2vwPlJrMB3uanA01qnwLgspcByLaPA/FqhwA6zn8AvM57AyNicwOCgm8DkiJrAbI6ZwPKumMD/55fAQDeXwIWalsDFD5bAyyWxwOcEr8C5Ea3AWBSrwOa6qMCd8aXASVujwA33oMCbw57ARb+cwAromsClO5nAn7eXwGBZlsD2HZXAwwKUwFsFk8AyI5LA01mRwOamkMA3CJDAPjStwK7eqsANuKjAc7+mwKu+pMC2ZaLAdpafwFv6nMCPkJrAzleYwG5OlsBycpTAmcGSwG05kcBX14/Aa5iOwPp5jcCmeYzAzpSLwAPJisDmE4rAI2SpwPXupsBqk6TAFGeiwBVpoMA2ZZ7A+gycwK84mcDYlpbAhyeUwH3pkcAY24/AX/qNwBRFjMDEuIrA2FKJwGoQiMC57obAcOuFwPEDhcC2NYTABIWlwLLvosCdhqDAxkKewDMSnMDWDprARwiYwGGwlcBy2JLA6jCQwBy8jcDReIvAbGWJwPp/h8BAxoXAzTWEwArMgsAbhoHAK2GAwNW1fsB54XzASLyhwIf6nsD9a5zAPAeawCTNl8DJtpXA67CTwBKokcA2UY/A6HWMwLvIicB4TofA8gWFwJPtgsBrA4HAh4p+wF5he8AthnjASvN1wOiic8B2kHHAUC2ewFsxm8DqapjAMNmVwLV6k8DRRZHAvTePwFpMjcDIRIvApO+IwDkRhsBwXoPAwt6AwA4ifcBj53jArgl1wIqEccAeU27AQnBrwFrWaMB1f2bAFt6awIynl8DZppTAtduRwGBFj8Cl4ozArrGKwLOpiMAexobAKtuEwNGLgsATVX/AXeR5wDnadMBoNHDA2e9rwMYIaMDPemTAI0FhwJtWXsCutVvAXM6XwH1dlMA0IpHAwhyOwOpMi8D3sYjAvkqGwJIVhMBHD4LAfTKAwJmqfMA5NnjA+4NywDUIbcBZ82fAOENjwM70XsBhBFvAm21XwK8rVMB7OVHAN/2UwOBSkcBO3Y3AR52KwBWTh8CJvoTA9h6CwHZmf8Cd83rAvt52wFAmc8DQiW/AsyprwC+VZcDXJGDAJQlbwL9OVsCD9lHAwfxNwC9dSsAEE0fAHWmSwL+GjsDO14rAi12HwMUYhMDUCYHAImF8wLYYd8A5OHLAo7xtwKafacA/32XA41ViwEkOXsBukVjADB9TwMMOTsA9V0nANvVEwCTyQMDHST3A7w+QwIL3i8CuEIjAJV2EwDHegMBdKXvA+wF1wAVGb8BR9GnAxAplwGyGYMBHYVzA3phYwIEaVcDv4FDAUoNLwCINRsA7+0DA7Uk8wCLxN8DF5DPAEu+NwP+iicBKhoXAA5uBwMnFe8CGvnTAByJuwCTxZ8C9K2LAu9BcwBneV8D3UFPAoiNPwC5TS8BO0kfARbFDwDlsPsCp8DjAHt0zwFIpL8D10yrAiAOMwJKGh8BtNoPA6Cp+wHxLdsAZ0m7AfsFnwIcbYcAj4VrASRJVwPWtT8A5skrARRxGwLjmQcAvDj7AyYo6wHR9NsCrVTHAvNArwBW1JsDe/yHABkqKwDefhcBsHoHAdJR5wAFKccC9YWnAO99hwErFWsDeFVTA+dFNwKn5R8AAjELAI4c9wFfoOMCKqjTA4skwwApDLcBnSinA8j8kwKGxHsDIjBnAEb+IwJzpg8Bzdn7APm11wMi8bMDeaWTAyXhcwCztVMDryU3ACxFHwKbDQMDe4TrA3Go1wNlcMMAttSvAGG8nwEiGI8C39x/AHxgcwA4rF8BZkxHAFl+HwEZigsACE3vAH69xwFSeaMDX5V/AfopXwJ+QT8Du+0fAYM9AwA4NOsAptjPA58otwIlKKMBbMyPAyYIewGM0GsBiQxbADq0SwLzfDsD/FgrAykeFwJ8FgcCGC3jAZlNuwHHoZMAb0FvAoA9TwOGrSsA/qULAgAs7wKnVM8DoCS3Ag6kmwMa0IMAIKxvAqgoWwCpREcBs+gzAMQEJwA9jBcBFowHAomaBwFyZfcCSUnXADlNrwGSUYcBnIljAkAJPwCE6RsAEzj3AqcI1wOEbLsDF3CbAmAcgwLOdGcB6nxPAWQwOwMbiCMBSIATAaIL/v2p/9795M/C/8yrQwI5gzsAQwszA00zLwAj+ycDI0sjA3sfHwJvaxsBpCMbApk7FwNeqxMCtGsTABpzDwO4sw8Cey8LAe3bCwBUswsAf68HAdbLBwA+BwcAHVsHAFtbLwIjXycDDB8jAUmTGwHnqxMBvl8PAT2jCwORZwcBxacDAYpS/wA3YvsDzMb7Av5+9wEkfvcCXrrzA3Uu8wH31u8D+qbvAE2i7wJEuu8Bv/LrArLnHwCWExcDhf8PAwarBwFUCwMDvg77AqSy9wKr5u8C+57rAHPS5wC0cucBGXbjA4LS3wKEgt8BanrbADSy2wOnHtcBJcLXAsSO1wNDgtMB2prTAjNjDwLZpwcAsLr/AOiS9wMZJu8BjnLnAZRm4wPG9tsAUh7XAqHG0wNZ6s8AIoLLAjt6xwNozscCOnbDAdhmwwI2lr8D8P6/AG+euwGqZrsCRVa7ATwXAwAKLvcDoFbvAZdS4wM3EtsAM5bTAtjKzwCKrscB6S7DAyRCvwN33rcDa/azALCCswB1cq8Acr6rAwRaqwNaQqcBPG6nAUbSowC5aqMBiC6jA4bm7wOK3ucDMObfAer60wAl3ssDUYbDAynyuwIfFrMBgOavAgdWpwPqWqMCVeqfAYX2mwNKcpcAt1qTA3CakwHKMo8CyBKPAjI2iwCAlosC6yaHATS63wKBrtcBEZrPAIuWwwKVjrsBQFqzAhfupwDoRqMAMVabAVsSkwEFco8DfGaLABfqgwKD5n8AwFp/A9EyewFKbncDX/pzAQXWcwHv8m8CekpvA99CywF7gsMCvGK/ArxCtwDmNqsCdBajAbrKlwBWSo8COoqHAe+GfwDdMnsDv35zAspmbwFp2msDNcpnAeoyYwKbAl8CxDJfAI26WwLbilcBNaJXAxKquwC2ErMDejarATsGowF+3psBGMqTAmKShwJlLn8C5JZ3A/DCbwAdrmcA40ZfAvmCWwKYWlcDP75PAEumSwOL/kcB1MZHAK3uQwInaj8BCTY/AS7yqwKJfqMAJM6bADTekwLtlosCLWqDAedSdwMVAm8AA4pjAoraWwLS8lMDg8ZLAiVORwN7ej8DrkI7AlmaNwKVcjMCVcIvAkJ+KwO/micA4RInAgbumwDJOpMAfDKLAx92fwCbcncAwBpzAefmZwAR0l8BW2pTA1HWSwP5EkMDkRY7ANnaMwFnTisB9WonAsAiIwN3ahsC2zYXAv96EwCQLhMAtUIPA282iwEo2oMAizZ3AypGbwHp9mcBlfZfA6qKVwDSVk8AVEZHAeHGOwEIHjMD70InAusyHwDT4hcDTUITAx9OCwCB+gcDOTIDA4Xh+wCKVfMCv6HrA2BKfwEA/nMCGo5nAXz6XwHcIlcCT+5LALxORwCA8j8DvLY3A16uKwFcGiMB1loXAxFqDwGFRgcAO8H7ARph7wNCVeMDM4nXAJ3lzwP1RccBoaG/A4ZqbwKaJmMAUsZXAeBCTwJGmkMClcY7AgGuMwLuKisCZy4jA3sOGwHREhMAcmYHALkd+wATFecACqHXAq+txwOCKbsAOgGvAUsVowKlUZsAOJ2TALWaYwCMXlcDkAJLAWCOPwNd9jMAtD4rAqNWHwIHOhcAE9YPAKj6CwGhQgMArtnvA3VN2wJ9dccC40GzAhKlowI/jZMDEeWHAk2ZewCCkW8BhLFnAJ3SVwN/nkcDXk47AlHiLwAyWiMCj64XAMniDwBI6gcBEXX7ASKZ6wHlHd8CDj3PAo8xuwEdxacCHcGTA8NhfwJCnW8AB2FfAN2VUwKlJUcB7f07AcsOSwDT7jsACaovA+xCIwLTwhMAvCYLAurN+wETDecDDPXXASR5xwOVebcA8/GnAo2dmwPLJYcAkblzAjnpXwPDdUsBsok7AR8lKwIFNR8CUKUTA/lGQwLZPjMCvgojAlOyEwJGOgcCM0nzAhvl2wAmRccD4lmzAMAhowBLgY8A7GGDAnq1cwA4oWcD9u1TA5VtPwLNmSsDL1EXAWppBwKS3PcDhMjrAGx2OwEfjicBk3IXAmAqCwCzffMAvGXbAksRvwI3hacA1b2TAg2tfwGrTWsCfolbAS9JSwK9fT8DU5UvAjqBHwMc/QsCBRz3AG7Q4wJ+BNMBTozDAmSGMwCuzh8D1dIPA+dJ+wNsld8AQ5m/AHxZpwHq3YsB1ylzAPU5XwORAUsBzn03A8mVJwBWNRcBvEkLAP6Q+wEt7OsCLHTXAXx4wwLCJK8BaVSfA4luKwCi8hcCaSYHAEA56wPztccBgN2rA0+1iwPATXMBGq1XAP7RPwCMuSsAdF0XAS2xAwN4pPMCcSDjA4MU0wGljMcDyTi3ALPwnwFvzIsBNVh7AI8iIwKP6g8Ahrn7A0sB1wAAzbcDRCWXAv0ldwHT2VcCkEk/A859IwOmeQsDmDj3ALe43wPM5M8B97i7A3wQrwAF6J8BIIyTANRggwKrbGsAvyRXAY2KHwMVqgsBwM3vApuRxwC/vaMC5WGDAeCZYwPdcUMD0/0jAORJCwISVO8B1ijXAh/AvwBXGKsBtCCbA5LMhwODBHcDWLhrA6eMWwETiEsAFvA3A/0iFwJMIgcBoG3jAQHJuwN0bZcBIHlzAOX9TwPBDS8AIcUPAUQo8wK8SNcD3iy7A4nYowAbTIsDXnh3At9cYwBR6FMCgfxDAXeQMwH6ZCcAhrQXAomaBwLObfcCCWXXA3mFrwLSxYcDGU1jAH05PwIGmRsA4Yj7A8IU2wI0VL8AGFCjATIMhwDFkG8BkthXAcXgQwNSnC8AOQQfAHz4DwDI1/7/Emfi/5erSwExe0cDB+8/AHMDOwCaozcCGsMzAEdbLwBsWy8DYbcrAstrJwEJaycBb6sjAA4nIwHE0yMAQ68fAdqvHwGF0x8C4RMfAgRvHwOP3xsAg2cbAcFPOwDuUzMCMAsvASJvJwFVbyMB6P8fAWkTGwL9mxcD4o8TAN/nDwNtjw8B54cLA3G/CwAMNwsAit8HAnGzBwAIswcAP9MDApMPAwMaZwMCXdcDAK/PJwLD9x8DwOMbAIKLEwDQ2w8D18cHANNLAwJbTv8DT8r7APC2+wPt/vcBo6LzAE2S8wL7wu8BkjLvAMTW7wITpusDpp7rAF2+6wOo9usBkE7rA6c3FwPSew8CNo8HAR9m/wFs9vsDAzLzAQIS7wJpgusB9XrnAk3q4wCuyt8BoArfAnWi2wFLitcBEbbXAZwe1wOKutMANYrTAcR+0wL7ls8DPs7PA4+bBwMp7v8CSRr3ASEW7wIN1ucB/1LfANF+2wHIStcDu6rPAUuWywD/+scAFM7HAv4CwwLvkr8B6XK/AseWuwFB+rsB3JK7AedatwNqSrcBGWK3A3qW9wFqXu8C2JbnASOq2wCPjtMDlDbPAzGexwNTtr8DMnK7AbnGtwFZorMAZfqvAC7CqwEL7qcADXanAydKowERaqMBd8afAL5anwAdHp8BkAqfATA25wMBTt8ANRLXA7MuywFKKsMBbfa7AqqKswIL3qsDfeKnAkSOowFD0psDE56XAXvqkwHsppMAscqPAsNGiwHxFosA7y6HAzGChwEcEocD0s6DA4Xy0wFa6ssAB/bDAOe2uwKhurMDtJqrALBSowA40psDag6TAjwCjwP2mocDac6DA0mOfwEhznsCPn53AueWcwP9CnMDPtJvAzzibwNfMmsD6bprAwyOwwL4qrsCUYqzA5KGqwN+SqMAlDqbAVMCjwNCnocBLwp/AEA2ewB+FnMBJJ5vARPCZwL7cmMAN6ZfAgBKXwCFWlsAnsZXA+iCVwDijlMC2NZTAtQSswBHTqcAN1KfATAamwKtCpMB9M6LAm6qfwL1WncCAOJvAmU2ZwFqTl8DGBpbAraSUwMVpk8C9UpLA4luRwISCkMCbw4/AXxyPwDOKjsCuCo7AJfKnwNqopcANfqPAEnmhwL+ln8CW353A/tCbwD9EmcBg6pbAcMaUwC3WksDtFpHAt4WPwF0fjsCR4IzAA8aLwADMisDI74nAWi6JwNqEiMCs8IfAX+GjwCZvocCaLJ/AGhWdwA8am8AwQZnA5XiXwJprlcBG25LAbnuQwNJRjsA4XIzA+5eKwCUCicCJl4fA21SGwMU2hcCZOYTAg1qDwImWgsDI6oHAw/qfwCNPncBd3ZrAwaGYwCaQlsBQp5TA39iSwNEOkcCFA4/A4G+MwBkKisDY2ofA7N+FwLQWhMBAfILAYw2BwKCNf8BiSn3AtEl7wMuFecC1+HfAJFqcwCZumcBavZbAi0aUwOsHksD4/Y/ARBuOwAdfjMCWoYrAqpSIwDsChsCPloPAsGGBwOvCfsCMJnvAaOh3wCsCdcA7bXLA6CJwwOIbbsA1UmzASgCZwEDTlcAA4pLABSyQwCiwjcCqbIvARV+JwD+Dh8BMzYXAzSaEwBQjgsALJX/A90F6wArNdcABwnHAtxtuwFnUasCZ5WfA3UhlwHH3YsAO6mDAC+2VwCR/ksDTTI/AUFaMwCSbicA2GofA1dGEwMS/gsBU4IDA8mB+wOQue8ARSXfAz0FywBJTbcAB02jAa71kwDoNYcClvF3AYMVawNQgWMBLyFXAUh+TwJVxj8B1/ovA3saIwBbLhcC3CoPAtYSAwNdufMBUQXjAz3l0wF0TccCi+m3AtitqwMpAZcD4XWDAk9VbwHi1V8Bj+1PAlqFQwMyhTcBt9UrALpWQwG2pjMCU9ojAPH6FwGBBgsCkgH7AfPV4wErfc8DeOm/A7wNrwLozZ8DixGPAuapgwNX/XMA4LljAuUlTwObNTsBvqkrAe+ZGwHaDQ8Aje0DA5UuOwKYkisD4M4bACHyCwPX8fcCxeHfAC2xxwHPWa8ANtmbAvwdiwFrHXcBo7lnAIHdWwNFZU8AWw0/AIRJLwMcpRsB+rEHA9JI9wMTOOcCIYjbAHUCMwHzgh8CMtIPA6n1/wOEDeMBe/nDAkm9qwF5YZMBVuF7As41ZwHzVVMCWi1DA3alMwBYqScCcB0bAe4RCwKDuPcBLADnA9IA0wLplMMB7qizA+22KwIbZhcB6dYHAu4l6wMWUcsCaEGvAtQBkwGFnXcCgRVfAIJtRwD1mTMAUpEfApFBDwBhmP8DG3TvAVbM4wK5GNcAFzDDAltMrwOpLJ8CgLyPAT9GIwOMLhMCh5n7AvRV2wDerbcCCrGXAOx5ewPcDV8AeYFDAzzNKwNZ+RMCsPz/AinM6wIUWNsAaIzLAMZIuwLxfK8DmBSjAU6ojwMKnHsBOFhrAt2WHwFxzgsBJVHvA9RpywFNBacCJzWDAHsVYwMMsUcAmCErAyllDwOwiPcB3YzfAABoywNxDLcA53SjA5uAkwFhHIcDRDB7Awr4awImJFsDPfBHAM0qFwI0LgcB0K3jAfZFuwAhQZcCzbVzAsvBTwJreS8AyPETAQQ09wGRUNsD4EjDAA0kqwDv1JMAOFSDAwqQbwHufF8A9/RPAl7oQwG93DcCoaQnAomaBwAqefcB8YHXA1XBrwGHPYcDYhVjA3ZpPwK8UR8D0+D7Ah0w3wEcTMMDsTynA8QMjwHsvHcBc0RfAHucSwCFtDsC+XgrA4bMGwA5pA8C5MADASafVwNlS1MDwJdPACR3SwKc00cAgadDAsbfPwGodz8CTl87AtCPOwJG/zcApac3AtB7NwJ7ezMCDp8zALXjMwIpPzMCuLMzAyg7MwC71y8A938vA1NLQwBpOz8DQ9M3AhcPMwKy2y8DHysrAHPzJwOdHycAuq8jAMiPIwHStx8CuR8fA2+/GwCqkxsAEY8bA/SrGwNz6xcCK0cXAF67FwLKPxcCmdcXAOTPMwNh5ysDR78jAvZHHwA9cxsBFS8XA3FvEwA6Kw8AR08LA5TPCwMOpwcAjMsHAusrAwHpxwMCNJMDAVOK/wGGpv8B0eL/Ack6/wGgqv8CBC7/ARs3HwDbbxcAWHMTAxYzCwOIpwcDc77/AIdu+wDDovcBBE73AfFm8wNu3u8CSK7vAD7K6wAFJusBS7rnAKKC5wNxcucD7IrnAQPG4wI7GuMDsobjAOKXDwOl2wcCxfr/A2Lm9wEMlvMCPvbrAMn+5wIpmuMAScLfAApi2wHLbtcBbN7XA6Ki0wIEttMDNwrPArmazwEUXs8Dk0rLAFZiywIxlssAoOrLAUIC/wCFRvcBKHLvA8x25wGhTt8CTubXAEE20wFUKs8DI7bHAyPOwwJYYsMA6Wa/ArLKuwA4irsDBpK3AZTitwNXarMAriqzAtUSswPYIrMCd1avA2ua6wLoqucAA+bbAr720wEG5ssAL6bDA+UmvwKvYrcCUkazAFnGrwJhzqsBDlanAG9OowBQqqMBJl6fAFBinwA6qpsAMS6bAH/mlwJOypcDidaXAjye2wLKPtMCC0LLAG52wwFpbrsDfUKzABHuqwLvWqMCjYKfAMRWmwMPwpMC/76PATQ6jwFZJosDUnaHA2wihwLyHoMAKGKDAlLefwGRkn8C/HJ/AjZ2xwGzQr8CaM67A8nGswLM9qsCP9afADuWlwJUJpMAXYKLAOOWgwGyVn8AObZ7AgGidwPCDnMArvJvALA6bwAN3msD585nAmYKZwKwgmcA3zJjAG06twJNHq8CGdKnAktKnwFAPpsAG26PAioyhwA12n8D7lJ3ATeabwKlmmsCCEpnANOaXwBzelsBm9pXA1yuVwFl7lMD94ZPABl2TwPbpksCShpLAjSSpwOv5psAZ7aTAKBSjwMNsocDiqJ/AUnWdwIggm8AWBJnAcR2XwJZplcAv5ZPAsIySwHBckcDLUJDA72WPwI2YjsCV5Y3ABEqNwBzDjMBcTozAU/SkwFukosA3hqDAaI6ewJqvnMDIApvA6T6ZwM8Ml8DCsZTAZI+SwDGjkMAs6o7ABGGNwCsEjMD6z4rAx8CJwMLSiMCKAojAEk2HwE2vhsBzJobAhuSgwElgnsDKFpzAJP2ZwNgQmMAhR5bA6JSUwKXRksC0oZDAbkCOwCsYjMBvJorARGiIwFvahsApeYXABUGEwEMug8AUPYLAA2qBwAWygMAMEoDAgxudwIhUmsD0ypfAAH2VwCxok8DvgJHA1sKPwGYjjsBSYYzANTSKwMHMh8CgnoXAX6eDwBDkgcBoUYDAuNd9wIhfe8DgMnnAKUp3wFCedcBFKXTAeJyZwHqRlsAFxZPAFjaRwPbijsBKyYzA8eWKwC4ticDRmofA6uuFwITEg8DrVoHA5UV+wGNMesCBu3bAsoxzwOe4cMDLOG7A/ARswOcVasBSZGjAwmeWwHYYk8DvB5DA/TWNwLChisBeSYjAvSqGwNJChMBZjYLAYACBwDDIfsCfpXrANb51wKFKccAmRm3ABatpwLhyZsA3lmPALA5hwDDTXsC53VzArHyTwMPpj8DylIzA4H6JwG+nhsDBDYTAOrCBwDoZf8A0QHvAasx3wI65dMAQmXHA2aRtwHjIaMDLS2TAXjxgwACXXMA2VVnA/G9WwP7fU8DQnVHAddmQwJUEjcBAbInA6xGGwE72gsBdGYDAk/R6wBIvdsDW3XHAX/ttwON+asDFY2fAoFpkwHqOYMDMs1vAbUNXwFsvU8DDf0/AezRMwIZGScCQrkbAbHuOwBZnisD2jIbAOO+CwMEef8Bx3HjAjBdzwJXObcCY/mjAT6NkwFG3YMAfMl3AsQ5awNkPV8BmZlPANZNOwAEhSsDyFkbAmGVCwNEQP8AdGjzAE1+MwIQOiMAr9YPA0BWAwFjleMCnGnLAQc1rwFb9ZcCIqWDABs9bwKVpV8AVdFPAHuZPwFG6TMCPxUnATSxGwC5pQcA79DzAYeg4wDhANcB/6jHAT4CKwFL3hcAKooHAZwd7wEM+c8A27WvAhxdlwAy/XsAW5FjAboVTwF+gTsDbMErAqjFGwOOaQsCnZj/ACnw8wLfqOMDIOzTAUr4vwPOwK8AeByjAlNqIwFsdhMDxH3/A+2t2wF8lbsDXUWbACvZewGAVWMDQsVHAz8tLwEZiRsChckHA8fg8wBTwOMBuUDXAthMywGEqL8D2qSvATQ8nwJyHIsBrcR7AE2mHwAl8gsCKdXvAClJywLyUacA8RGHAWGZZwNT/UcAzFEvAj6VEwIC0PsARQDnAz0U0wOfBL8BSryvAwAYowH3BJMDD1CHAC2oewL7jGcDIURXAaUuFwI0OgcCsO3jAHbFuwO+EZcBXvlzA/mNUwMh7TMCTCkXA/xM+wEmaN8AqnjHAzx4swOkZJ8DAiyLAZm8ewNu9GsD/bxfA2n8UwCAmEcAcuQzAomaBwGGgfcCCZ3XA8n9rwGvtYcCeuFjAyehPwKOER8Amkj/ARhY4wMUUMcD9jyrAzIgkwIL+HsDw7hnAfFYVwFEwEcDAdQ3APB8KwH4nB8B84gPASlrYwBw418B7OtbAp13VwM+d1MC+99PAemjTwCzt0sBEg9LAeCjSwL7a0cBMmNHAj1/RwCov0cDqBdHAyeLQwOLE0MBzq9DA0pXQwHCD0MDRc9DAzk7TwDj/0cCJ2NDA49bPwH72zsCDM87Ar4rNwAH5zMCae8zA4A/MwICzy8BrZMvAzyDLwBLnysDRtcrA1ovKwBRoysClScrAwC/KwLwZysAFB8rA+nTOwC/zzMCmnsvAd3PKwMxtycDWicjAt8PHwB4Yx8AFhMbAggTGwPSWxcABOcXAj+jEwMejxMAJacTA6zbEwDMMxMDQ58PA18jDwH2uw8AVmMPAetLJwK0ZyMBjksbA4DjFwDsJxMCL/8LAAxjCwL9OwcBgoMDA2gnAwDqIv8DXGL/ATrm+wH5nvsCJIb7AyOW9wM2yvcBXh73AUmK9wM9CvcD/J73AhmzFwEl4w8CAucHAvCzAwD7OvsAjmr3Acoy8wFihu8Dv1LrAySO6wNOKucAVB7nA25W4wLo0uMCL4bfAZ5q3wKNdt8DJKbfAlf22wO3XtsDet7bAPUPBwCwUv8CBGb3AxVS7wIvCucAVX7jAfia3wNMUtsAlJrXAl1a0wKeis8BCB7PAY4GywFAOssCWq7HABlexwLIOscDp0LDAL5ywwDtvsMDvSLDAIqi8wOfrusCAt7jAcra2wMnrtMAdVLPAs+uxwKGusMDymK/AuqauwAXUrcBKHa3Acn+swHH3q8CEgqvALx6rwDzIqsC3fqrA5z+qwEwKqsCY3KnAK8+3wAFOtsA2kLTAzlaywGZPsMDYfq7Av+GswGJ0q8DWMqrAIxmpwFkjqMCCTafA+5OmwK7zpcCJaaXAwPKkwM6MpMB3NaTAv+qjwOeqo8BqdKPA0hazwGJzscD/7q/Aei+uwF/yq8Cn5KnAOQ6owLhrpsBq+aTAZrOjwK6VosBOnKHAVcOgwAAHoMA+ZJ/A89eewEtfnsC7953A/Z6dwBFTncAwEp3A35iuwNy7rMChEqvAb4upwMHIp8B5iqXAeXajwDOaocBN8p/AEXuewJUwncDXDpzA4BGbwL01msCfdpnAZNGYwPFCmMBoyJfAN1+XwBIFl8Dvt5bAAlWqwHc/qMA6XKbAOa2kwJ0jo8ApXqHAXh+fwCAFncAHI5vAwHWZwJj5l8CjqpbA34SVwFCElMABpZPAEuOSwGI7ksDDqpHAWC6RwITDkMD1Z5DA1gKmwM3Xo8Br26HAOPifwHhDnsDVt5zA9++awE6xmMDakJbA9aiUwFD2ksA9dZHA0CGQwAX4jsDb843AXhGNwJpMjMBxoovAqA+LwFeRisDeJIrAls+hwPdxn8AATJ3ANFabwKeKmcCr1ZfA+keWwHJ+lMCFQJLA5BmQwDcsjsA3dIzAOu6KwFaWicCCaIjAvGCHwA97hsBzs4XAygaFwNZxhMCd8YPAnd6dwEQ8m8As2ZjA7bKWwEvDlMB9/pLAAWGRwB3Sj8DZCY7APM2LwHagicAHrYfAr++FwMlkhMBsCIPAjtaBwCnLgMCUxH/Api9+wE7RfMACo3vAejqawHVRl8BxqZTA2kCSwFkVkMD0I47A2GWMwL/OisB4V4nAa5KHwKtXhcDGJIPAmSuBwNjRfsA7snvAjPB4wLqEdsCtZnTAfY5ywNvzcMB2kG/AKuSWwJyzk8DPxJDAGxeOwAGpi8A6eInA1oGHwNTBhcBLMYTAI8OCwFgXgcAGwH3ADk55wEBQdcA+wHHA0JZuwCzMa8A+WGnA6DJnwDpUZcDjs2PAbduTwJxjkMBBLY3AqjiKwEWFh8CjEYXAj9uCwCbggMAeN37AQRN7wMNGeMAiDXXAf8lwwNBObMCWRWjA8KpkwLF3YcATpF7ABChcwGD7WcAsFljAzB6RwB1hjcCS44nAaaeGwAitg8Du84DAgPV8wLJ+eMDJfXTAYOtwwL2+bcDW8WrAVNlnwICzY8AKRF/AizdbwESSV8AyVVTAmHhRwGL0TsBpwEzArKuOwI6qisBN54bACWSDwBUigMDPQ3rALMZ0wLDIb8AxR2vAJDxnwHKgY8D5amDA9JVdwDeYWsB9klbAeCBSwHkcTsCMdkrApi9HwAtKRMCovUHAe36MwD89iMDLNoTA/W2AwAbKecCHOnPAky5twHylZ8DXnGLAnBBewF37WcBUVlbA9BdTwMI6UMBpS03A42dJwB3zRMBp7EDAYE49wFkHOsC4GDfA4JKKwIsVhsBGz4HAB4d7wFjqc8D9zGzA6jFmwF0aYMDNhVrA9nFVwPTaUMB2u0zA/gxJwLHFRcBA4ELA1/o/wMk6PMB/vDfAurMzwIITMMCa1CzA8eOIwAovhMAQWn/AhsN2wG2hbsC0+WbA+dBfwFQqWcArB1PAHmdNwA5ISMA7pkPAcXw/wEnEO8AxdDjAcoY1wDaqMsCnDi/Ao4UqwHNzJsDm0CLAdWyHwM6EgsA2l3vA5IlywGfpacDHvGHADQpawPjVUsDFI0zA//RFwHBJQMAgHzvAcXI2wE4+MsBofC7AdiMrwFgtKMBbWiXA09shwLRPHcBJMxnAn0yFwJQRgcANTHjAINFuwJK6ZcAvEF3AFNlUwGMbTcD620XAOx4/wNnjOMDELDPALfctwJg/KcAPASXAXTUhwIDTHcDz1BrAQgsYwGylFMC0GhDAomaBwLmifcANbnXAN49rwNILYsAX7FjA3TdQwFP2R8C0LUDA/+I4wLgZMsC40yvAGxEmwDXQIMCwDRzAtcQXwCjvE8BShBDARX0NwOy8CsCxXgfA3/7awBMJ2sCWNNnAfX3YwA7g18BFWdfAKObWwA6E1sCaMNbAuenVwJyt1cCtetXAk0/VwB8r1cBRDNXATvLUwFjc1MDRydTAMbrUwASt1MDpodTAbMLVwJui1MCtqNPAjdDSwEcW0sASdtHA4OzQwLB30MDME9DA0L7PwKF2z8BlOc/AhAXPwJvZzsB4tM7AFZXOwJR6zsA0ZM7AU1HOwGdBzsD5M87A5bPQwNZkz8BdQM7ATkLNwIpmzMAWqcvAGAbLwH16ysA3A8rAiJ3JwANHycCD/cjAKL/IwFOKyMCZXcjAxjfIwM4XyMDO/MfAA+bHwMjSx8CPwsfAgtnLwNdVysCZAcnAhNjHwFTWxsDr9sXASTbFwICQxMB5AsTAHInDwKEhw8CRycLAvn7CwEM/wsB4CcLA7tvBwGm1wcDblMHAXHnBwCViwcCPTsHAYjnHwO17xcCH8sPAG5nCwGZrwcAaZcDADIK/wDq+vsCmFb7AMoW9wLsJvcByoLzA1Ua8wK/6u8ASurvAT4O7wPNUu8C9LbvAmAy7wJjwusD12LrALdnCwCDdwMBqGb/AToq9wLYrvMBf+brA+u65wEcIucBEQbjA45W3wP8Ct8BuhbbAVBq2wCi/tcCtcbXA7S+1wDL4tMADybTAGaG0wFx/tMDcYrTAkVm+wAd/vMA+fLrAULK4wIMdt8DCubXAyIK0wEN0s8DyibLAvr+xwIwRscA4fLDAifyvwJ2Pr8DhMq/AEOSuwCqhrsB2aK7AcziuwNUPrsB/7a3AB3K5wNX7t8CLILbAERe0wPFGssB4rLDAkkOvwPcHrsBQ9azAWQeswPU5q8D2iKrALvGpwGFvqcChAKnAUqKowChSqMAcDqjAbdSnwJSjp8BBeqfAFY60wPURs8CgmLHACr6vwOmtrcCg16vAfzeqwHbJqMA6iafAcnKmwNGApcA5sKTAb/yjwDFio8BD3qLArG2iwMkNosBFvKHAEXehwGY8ocC2CqHArOOvwHQursCzrKzAqTCrwNBXqcAUQafAp2SlwOO+o8C5S6LA3gahwPPrn8Co9p7A1SKewEFsncCMz5zAekmcwAvXm8CSdZvAsCKbwFPcmsCqoJrAe3erwFaFqcD3yafAmUKmwD/EpMAn7qLA2tCgwFLunsDvQp3ApsqbwCuBmsAdYpnAJWmYwBSSl8Cw2JbAhjmWwE2xlcADPZXA8tmUwLKFlMApPpTAjxCnwDIGpcB0IqPA9GChwP/Tn8CSU57AV4GcwIJdmsDldJjA58OWwIBGlcBl+JPAM9WSwI3YkcA8/pDAA0KQwGCgj8ABFo/A2Z+OwCw7jsCM5Y3AaLuiwF+CoMCZfJ7A0qecwL/zmsA2YZnAD9+XwKIRlsBO55PAoviRwAxCkMCJv47Az2yNwHZFjMAfRYvAjGeKwHyoicBYBInA03eIwMv/h8CBmYfAEqOewNIknMBN55nA4OaXwAIXlsCHcpTAjuqSwAZnkcBHn4/Afm6NwMh5i8CdvYnA/jWIwKPehsAjs4XAGa+EwEDOg8BWDIPAr2WCwPzWgcAVXYHAEtqawNISmMC9jpXAn0uTwHdGkcA+e4/AG9yNwMZkjMDA64rAYyeJwEvzhsCR+ITA0zaDwBqqgcAdToDA5zx+wGYtfMAjZXrAk9t4wDiJd8BtZ3bAHGKXwFhQlMAZg5HAKvmOwG2wjMDxpYrAHtaIwIo7h8DYyYXA2GaEwN+sgsDvdYDAaOp8wM1becAkOHbA5XZzwDgPccBE+G7AaCltwBeaa8CoQmrAgTuUwP3ekMAox43A5fOKwBlkiMC3FYbA4AWEwAgxgsBakoDAj0p+wAmde8DJUnjAN+1zwMvfb8ASRmzAMxhpwKpNZsCf3WPAMb9hwLXpX8CbVF7AKGWRwPO+jcBnXIrAgD6HwDllhMCLz4HA+/Z+wIjMesDBGHfAQdJzwMjwcMAWXG7ACiRrwKzeZsCq0WLA1ixfwL/0W8DoIFnAeKhWwIiCVMBjplLAotyOwAXvisDsQofAWtqDwGG2gMAmrnvA/nZ2wITDccA+jm3ATtBpwJmAZsB5lmPAjAJhwOXnXcD2uVnAj7JVwHIQUsAhzk7A9/BLwBtwScCiQkfAU56MwKlsiMBkeYTAa8eAwKuxesCWXXTA6JJuwO1PacAHkWTA4lBgwLmIXMC+L1nA5TxWwCWlU8A0n1DA6YtMwOmASMAh5ETAq6RBwCi+PsDZNDzAq6WKwC40hsAt/YHAiwh8wOOYdMC0r23AfE9nwLl4YcDkKVzAiF9XwHUUU8AEQk/As99LwA7kSMD2R0bA51JDwKpVP8A5RzvAYKc3wMJtNMDHiDHAae2IwPJAhMD7lH/AWBx3wFIfb8D7o2fAz65gwHVCWsCZX1TA4wRPwAcvSsD42EXAL/xBwHeQPsD1izvAzec4wGgFNsCdHzLA5QYuwHpjKsBvJyfA32+HwKqNgsBKuXvAgcJywE0/asAbN2LAH7BawPquU8B/Nk3AiUdHwOvgQcCE/zzAbZ44wD23NMANQjHAnTQuwFKIK8C9uCjAieokwBXHIMDdGR3A1U2FwKEUgcCZXHjAhvFuwO7wZcA3Y13A5k9VwE29TcA2sEbAnStAwIkwOsD8vTTAAdEvwNZkK8AvcyfAd/QjwAXeIMCGKR7ATWgbwG62F8AxiBPAomaBwBGlfcB4c3XAop5rwJYqYsBAIFnAFYhQwLJpSMCHy0DAgrI5wMwhM8CZGi3AGZwnwICjIsAyLB7ABjAawI6nFsAxiBPAbMsQwGoTDsBPgwrA55DdwNbB3MDBENzAmnnbwBj52sAsjNrADTDawEri2cDBoNnAmWnZwDs72cBLFNnAnvPYwDjY2MBCwdjAB67YwOyd2MBykNjAK4XYwLx72MDYc9jAjCnYwBk018BKYdbA86zVwP4S1cAQkNTAECHUwCzD08Dnc9PAFzHTwNr40sCTydLA3qHSwIuA0sCaZNLAL03SwJE50sAlKdLAZRvSwOQP0sBFBtLA5uvSwI3K0cDT0NDARfrPwKxCz8Dmpc7AiSDOwHSvzcDJT83AAf/MwOi6zMCVgczAY1HMwOgozMDvBszAcerLwJDSy8CQvsvA0K3LwMufy8AQlMvAmN7NwKWLzMB/ZcvAfWfKwC+NycBR0sjAujLIwO2qx8DAN8fATNbGwP+DxsCcPsbAMgTGwBTTxcDRqcXAMIfFwCZqxcDPUcXAaz3FwFgsxcANHsXAfgjJwBp+x8C5JcbAvvrEwHz4w8BtGsPASlzCwOC5wcCgL8HAW7rAwBtXwMBHA8DAmby/wBaBv8AKT7/AACW/wLYBv8Ae5L7AT8u+wIe2vsAhpb7AJ3DEwLeowsBQGMHAhbq/wLSKvsAxhL3AY6K8wPngu8C6O7vABq+6wKU3usCZ0rnAPX25wEE1ucCk+LjAqcW4wNWauMDidrjAu1i4wHU/uMBIKrjAt/S/wAESvsD/Q7zAm626wGlKucDDFbjA+Qq3wHAltsC9YLXAqLi0wH4ptMAAsLPAJUmzwD7yssDzqLLAOmuywFA3ssCxC7LAFOexwF3IscCerrHAAQ27wI6UucA9r7fAstq1wFY+tMDA1bLAR5yxwDWNsMDpo6/A89uuwAYxrsBjn63AxiOtwBq7rMCnYqzACxiswDTZq8BYpKvA7nerwKVSq8BeM6vA9wG2wImptMBmL7PANUixwCltr8Dbyq3A41yswJgeq8A+C6rALB6pwO5SqMArpafADRGnwE6TpsDOKKbAzc6lwN+CpcDpQqXAGg2lwOPfpMDsuaTAOC2xwPydr8DBQK7AO8WswDzdqsC4+6jAflOnwCfgpcAKnaTAZ4WjwI+UosACxqHAaRWhwM9+oMDr/p/AlpKfwAQ3n8DB6Z7AqqiewOdxnsDhQ57AN5aswDLKqsD1NKnAytKnwClWpsCmbqTAsoaiwI/YoMDcX5/A7heewAH8nMBfB5zAgjWbwAuCmsD36JnA7GaZwL/4mMCam5jAAE2YwMYKmMAN05fAthuowFgxpsB5YqTAQMeiwK5focAI45/Av/ydwGIOnMBbWprATtyYwI+Pl8BXb5bA6naVwLihlMBh65PAzE+TwJvLksCTW5LA2PyRwOWskcCGaZHAcKejwJ+OocAZqp/AmfOdwDhVnMBB6JrAK2yZwNCHl8ASk5XAK9mTwMRVksAzBJHAr9+PwHTjjsDsCo7AslGNwJazjMA9LYzAV7uLwAVbi8C2CYvAfmifwKoNncCp9JrAuhWZwLlll8Dl3ZXA2WyUwOHxksAfEJHABRWPwEJVjcCDzIvAIHaKwExNicBBTYjAYHGHwD61hsCZFIbAD4yFwE4YhcBgtoTA/XqbwDLVmMBndJbAvFWUwH51ksCBy5DAG0uPwMjtjcB0dIzA65WKwHyUiMDfzobAyUCFwJLlg8BuuILAj7SBwFDVgMBEFoDAI+Z+wKjQfcBh5XzAceGXwG3ulMBvQpLAqduPwEu3jcC20YvAniaKwPyriMD5V4fAhvKFwHIZhMC0EYLAQEaAwKNlfcCMpXrAnEJ4wDAzdsDvbXTA++lywHSeccCJhHDA0pyUwL9bkcBqYo7AN7CLwG9DicBYGYfAYi6FwFZ+g8BzA4LAxbSAwMS/fsDZNXvAxxl3wDV3c8CpRXDA5HttwEYQa8Ak+WjAGC1nwDOjZcCNUmTAgKyRwAEejsCc1orA9daHwIkehcC5q4LA4nuAwAkXfcDprHnAJ652wNYSdMARf3HAeCJuwIAMasBHXmbACiJjwJNOYMA/2l3AX7tbwH/oWcCgWFjASg6PwHE0i8C+n4fACFKEwA5MgcDMGn3AFCl4wNe9c8A50m/A/11swC5WacB1smbAWDFkwJ38YMDw51zAFkJZwCf7VcD3HVPA5qBQwD96TsCBoEzAmr6MwMCciMDsvITACSKBwAice8Bqg3XAnPlvwMH7asDohGbAWI5iwPEPX8D+/lvAyVJZwJTZVsDbxlPAD7VPwB8QTMBX0UjAaOpFwJJkQ8AaNkHAsbiKwDtThsC5K4LA4ot8wMFJdcAdlW7A1W9owIPZYsB7z13A+ExZwGZLVcDBwlHAmahOwNPzS8B3gknAw4RGwJZ6QsDu0T7A9ZQ7wDm0OMCVJTbA+faIwBJThMCx0H/AanZ3wP6eb8CMUGjAUI9hwF5dW8CDulXARKRQwAoWTMBmCUjAb3ZEwP9SQcCVlT7AmCs8wFU0OcATOzXAzYwxwNNMLsCkbyvAUHOHwJ2WgsDI23vA4PtywGiWasAqs2LAb1hbwKGKVMAETE7Am5xIwBx6Q8Ae4D7AWMg6wP4qN8Az/jPAEjgxwBvKLsC/5CvAh/wnwLBDJMCB/iDADU+FwLUXgcBQbXjAThJvwAMoZsBpt13AZ8hVwGxhTsAPh0fAyDtBwMx/O8AEUTbANasxwD6ILcBw4CnAN6omwEvbI8BRaSHABJYewPK+GsB5+xbAomaBwGqnfcDteHXANK5rwLVJYsAZVVnAbdlQwLTeSMCCa0HAm4Q6wKosNMAWZC7A/igpwFJ3JMAZSSDAxZYcwA1XGcBBfxbAfwcUwMxEEcBXgg3AKA3gwI9f38CUzN7AZFDewOjn3cAykN3AuEbdwEQJ3cDw1dzAH6vcwHCH3MC5adzAAFHcwHA83MBZK9zAJR3cwFkR3MCOB9zAbP/bwKz428AS89vAtIDawHCw2cB7/9jAn2nYwPjq18BjgNfA5ybXwO3b1sA2ndbA02jWwB891sCyGNbAXfrVwB/h1cAhzNXArrrVwC6s1cAjoNXAI5bVwNWN1cDxhtXAbxnVwOQg1MC8TNPAapjSwKv/0cCKftHA2hHRwJa20MAbatDAHyrQwKz0z8ATyM/A56LPwPODz8Awas/Aw1TPwPNCz8AmNM/A2yfPwKYdz8AsFc/AVd7PwI+3zsCMus3AfuLMwMwqzMAqj8vAjgvLwMCcysCyP8rAs/HJwHGwycDsecnAbkzJwIImycDtBsnApOzIwMfWyMCbxMjAgbXIwPWoyMCKnsjAutbKwGl7ycCNT8jAHE7HwCZyxsAUt8XAjBjFwHGSxMCFIcTAqsLDwCZzw8CcMMPABPnCwJ/KwsDyo8LAu4PCwOxowsCfUsLAFEDCwKwwwsDgI8LA+QnGwNhzxMDREsPA4OHBwPjbwMAi/L/ArD2/wD2cvsCjE77AlaC9wOs/vcDg7rzADau8wGByvMATQ7zAoxu8wMr6u8Bz37vAtci7wM21u8AWprvALH7BwCeov8CvC77A9KS8wPFuu8CPZLrA1oC5wP++uMCnGrjAio+3wFkat8Dft7bAS2W2wC0gtsBp5rXAMra1wP+NtcCCbLXAo1C1wHM5tcAsJrXAvJO8wKIcu8BtQbnApJ63wDkytsAl97TASuizwKYAs8BxO7LALZSxwI0GscA2j7DA6SqwwMrWr8BfkK/Ag1WvwGEkr8Bp+67ASNmuwN+8rsA8pa7APXG3wDYutsA+trTALNaywBktscABu6/A3XquwIhnrcD5e6zAXbOrwC4Jq8ALearAjP+pwGmZqcC9Q6nAA/yowA3AqMD/jajAQWSowHpBqMCHJKjAo3SywDcJscBww6/AYUuuwMFmrMBqt6rAqj+pwHX6p8Cn4qbAK/OlwCQnpcAFeqTAYOejwLVro8C7A6PAgKyiwHRjosBjJqLAZvOhwOHIocBzpaHAxbStwDQNrMD2m6rA0VOpwAvap8CG86XA8T2kwIrAosBHdqHA/lmgwJJmn8Ael57ACeedwOJRncAK1JzANWqcwGgRnMAJx5vA2oibwO5Um8CfKZvAGCOpwOFOp8DroKXA3ymkwLrfosB9Y6HAz3yfwAHBncD2PZzApO6awN/NmcCC1pjAngOYwJBQl8DeuJbA2jiWwCjNlcDGcpXAEieVwMPnlMDlspTAP5KkwIeXosC40aDAKjCfwFKzncC0ZZzAJ+mawOsCmcDpQJfAPLiVwNxjlMCYPpPAR0OSwPBskcDltpDApRyQwHCaj8DgLI/A59COwNqDjsBqQ47Afy6gwEj2ncAlAJzA2z6awKmsmMCtOJfAzOaVwF9rlMAmhpLA9L2QwKYvj8A31o3Ac6yMwCuti8Bd04rAUhqKwIB9icAU+YjApImIwBEsiMCq3YfA+xycwDSYmcDuWZfAjl6VwFGhk8AqFJLAvrCQwDdkj8By6o3AxQaMwGc4isB6pIjA+kWHwLQXhsBxFIXAKTeEwBl7g8Cy24LAClWCwLTjgcCHhIHAAGKYwJmNlcB1ApPAGb6QwP28jsDI+ozAwnGLwKwTisBG2ojAq2aHwAuFhcCEsIPA9xaCwGazgMAzAX/AsfJ8wCMxe8DxsnnA8m54wCNdd8ChdnbASv+UwLvZkcDJ/o7ARG2MwMoiisDpG4jAWVSGwPvGhMA9bYPALjqCwJHdgMBpAn7ADU16wLUOd8BqPXTAv85xwDm4b8Cj723AVmtswBwia8DGC2rAyPSRwDN+jsAMUovAi3CIwKHYhcACiIPAVHuBwLxcf8BQOHzARH15wNEgd8BthHTAePRwwFA1bcC362nAPxBnwHqYZMDmeWLAP6pgwM0fX8BP0V3An0CPwMl6i8Cw/YfA8cqEwOHigcAYiX7Ag9t5wHu2dcCyEXLAgONuwGUfbMATvWnAej9nwEnLY8B6F2DAXMVcwLHfWcDKXlfAHThVwFxhU8C50FHATt+MwH7NiMBbAYXAwn2BwNaIfMCTq3bAC2JxwBOobMBPd2jAk8dkwGOPYcBJwl7AxVdcwFjrWcAimFbAIuFSwPeZT8AerEzADCJKwDzzR8BUFUbA88uKwLFyhsDnWoLA+hB9wND8dcD1fG/Ai5JpwBw8ZMC0dV/AIzlbwGN+V8APPFTA8WVRwCbzTsCDjkzAvFxJwD+iRcCsWELA7XQ/wJbiPMCYqzrAogCJwGhlhMCXBoDAt9F3wGAgcMBD/2jAPnJiwKp6XMBNF1fAaERSwPv7TcAkNkrAl+lGwGAKRMA5j0HAnTE/wF0fPMDbWzjAgg81wJwqMsC5oC/AyHaHwKefgsCt/nvA/TVzwLLuasDlMGPA3wJcwLFoVcDxY0/AnvNJwDAURcDXv0DA1u48wPyXOcCYrzbA/is0wHzVMcAC4y7AWhQrwKu/J8Bv2CTARFCFwM4agcAxfnjAeDNvwM5fZsC/DF7AiUJWwKEHT8BOYEjAYE5CwBDRPMAO5TfAuYQzwHuoL8BBRyzAmlUpwHnJJsAdeiTAtp0hwMzNHcDBbhrAomaBwMOpfcBtfnXA7r1rwDFpYsCgilnA3itRwEtVScCJDULAFVk7wPg5NcCkry/AArcqwKJKJsAWYyLAZ/cewGj8G8CqZxnAgh8XwFpSFMAziBDAS3HiwFvg4cDHZuHAJwHhwHms4MAPZuDAmyvgwCj738AL09/A37HfwHSW38DRf9/AIm3fwLhd38ADUd/AiUbfwOY938DJNt/A7TDfwBos38AgKN/AK8XcwDsV3MBOgdvAMgXbwG6d2sDzRtrAB//ZwFHD2cDRkdnA1WjZwO9G2cDrKtnAyBPZwLAA2cDv8NjA8uPYwD3Z2MBq0NjAJcnYwCfD2MA4vtjAlznXwBll1sCnsdXAuxrVwBWc1MAqMtTA4NnTwHCQ08B1U9PA5yDTwAr30sBq1NLAy7fSwCmg0sCnjNLAjnzSwElv0sBYZNLAVFvSwOZT0sDHTdLAvtXRwJfW0MAB/s/AC0fPwB2tzsDrK87A2L/NwLxlzcDGGs3AhtzMwOiozMApfszAzFrMwJM9zMBvJczAghHMwBIBzMCE88vAV+jLwCLfy8CL18vAPKHMwOFwy8AJbcrAXZDJwOHVyMDwOMjAMLXHwPJGx8AD68bAhJ7GwPxexsBNKsbAq/7FwJLaxcC7vMXAFqTFwL6PxcD1fsXAHnHFwLVlxcBNXMXADaTHwK07xsDxBcXAYf3DwKUcw8ChXsLAqr7BwFs4wcDvx8DAKmrAwCIcwMBQ27/AjqW/wAd5v8AwVL/AvDW/wJQcv8DRB7/Ar/a+wI7ovsDn3L7AEebCwOs+wcB80L/AYJW+wBqIvcBGo7zAveG7wL8+u8DetbrAQkO6wKbjucARlLnA9FG5wB4bucCx7bjAGsi4wAipuMBdj7jALHq4wLFouMBFWrjACg2+wHGCvMCS1LrAGWC5wJ8fuMCiDbfAsiS2wKRftcCeubTAKS60wFq5s8DkV7PAwQazwFfDssBqi7LAFl2ywL82ssANF7LA3fyxwD/nscBp1bHAztq4wBmkt8D9GbbAbWW0wO7qssAZpbHAZI6wwFihr8C72K7Ary+uwKShrcCgKq3ATceswJp0rMDhL6zA3ParwJ7Hq8CGoKvAM4CrwH5lq8ByT6vA6bizwA1vssCsNbHAHK2vwOLxrcBgcazAMSarwMQKqsCaGanAbU2owFOhp8C1EKfAeZemwEcypsAB3qXA9pelwNddpcCvLaXA0wWlwN7kpMCkyaTAQtKuwFhNrcDg/avAEsKqwC48qcBSeqfA0vOlwEmjpMAkg6PA2Y2iwBq+ocDuDqHAt3ugwEIAoMAumZ/AUkOfwPT7nsC6wJ7ApY+ewARnnsBsRZ7AiSeqwOxnqMDF3KbAtIelwNZJpMCQx6LAGP+gwJ5yn8C8HJ7A3fecwHD+m8AaK5vA2HiawAPjmcBWZZnAXPyYwOikmMA0XJjA2x+YwNjtl8ByxJfAPHqlwFCeo8D89KHAmmegwPIMn8BbzZ3Amk+cwIyAmsAZ7pjA35KXwERplsCya5XAw5SUwGjfk8DxRpPAAseSwCRcksAVA5LACLmRwI97kcCcSJHAsvSgwC3ensDZB53AHWSbwHnsmcD8jZjAAE2XwFPUlcD//pPAlWaSwAIGkcCq14/A79WOwGP7jcDqQo3AzaeMwJoljMDTuIvAJ16LwL4Si8Aj1IrAxr+cwHlbmsDTPpjAeWWWwJTHlMB2VpPAMAuSwBzJkMBPU4/Au3qNwF3ci8BwdorAV0OJwHA9iMBDX4fAqKOGwOIFhsBlgYXArhKFwGW2hMCdaYTAn+OYwJstlsDOwpPAAKCRwOjAj8B4II7ACLWMwP9xi8ADQorAps+IwAj0hsC2T4XAbuSDwJKsgsB7ooHAp8CAwOYBgMDbwn7ATrV9wPrTfMAfGHzA0WKVwMlYksAGnI/AtCqNwLQBi8DVHInAFXeHwGsKhsBszITA7ayDwGtFgsAna4DAw4F9wHmgesA0J3jAmwp2wJ8/dMDGu3LAY3VxwD1jcMD6fW/A9T2SwHHfjsCOzovACAuJwCmThsDvY4TAP3mCwCXOgMBzuX7ABz58wIcNesDQYXfAqsBzwDhgcMAudG3AVPFqwEjMaMDr+WbAsG9lwNMjZMAJDWPAnXOPwAHCi8CsXIjA7kSFwKB6gsBf+H/AaI17wE+sd8BRS3TA4l5xwK3absBSsWzA6B9qwOqbZsA6O2PAa0RgwPG3XcBnilvAnrBZwPYfWMCTzlbAbgCNwN/+iMCkRoXAg9qBwNB3fcCh1XfAj8tywARUbsAgZ2rAQvtmwCQFZMAOeGHAVEpfwDXTXMCjZFnAPglWwJMRU8Bxe1DAXUVOwBxkTMD6zErAbt+KwI6ShsC0ioLAwJd9wOexdsD5ZnDAMLdqwOOfZcC0G2HA8yJdwB+sWcA7rFbALRZUwH/gUcBseU/AiSVMwHDGSMD81EXAMDxDwIb9QMC/FD/AZQqJwPZ3hMA5JYDANS54wGajcMD+r2nAWFdjwPCZXcBddVjAeuRTwMjfT8DpXUzAKVRJwAy1RsBVd0TAoh9CwAHgPsCffDvATIg4wPj2NcA0szPAR3qHwMiogsD6IXzA2HBzwCRIa8A6sGPASq9cwOxIVsDhfVDA/UtLwFiuRsCjnULAoxA/wMb8O8CtVDnA1Q43wIvGNMABmzHAJS0uwCg1K8C6oSjAfVGFwO8dgcA9j3jABFVvwE6YZsA0Y17AO75WwMqvT8C3O0nAA2NDwMUjPsBQeTnAhFw1wE7EMcA1pi7AE/UrwAOnKcDjZSfAA1ckwC3eIMCx3B3AomaBwBysfcD4g3XAzs1rwAiJYsDTwFnAY39RwGnNScB+sULAuC88wFhJNsC2/DDAYUUswG0cKMDteCTAgFAhwD6WHsDfPxzAWgUawAgUF8AikBPAv7vkwCRD5MDr3uPAAozjwJFH48ArD+PAxeDiwKa64sBam+LAsIHiwKds4sBtW+LAUk3iwMdB4sBWOOLAnDDiwEwq4sAiJeLA6SDiwHYd4sCkGuLA6vTewNxg3sCe5d3AL3/dwG0q3cBy5NzAx6rcwFR73MBVVNzAUzTcwBIa3MCNBNzA7fLbwH/k28Cw2NvABs/bwB/H28CpwNvAYbvbwA+328CHs9vACErZwBiV2MDn/dfABoDXwF0X18DAwNbAOXnWwEY+1sDDDdbA5eXVwCrF1cBRqtXAUJTVwEqC1cCIc9XAdGfVwJJd1cB9VdXA4U7VwHpJ1cAPRdXATMLTwGTm0sDALdLAaJPRwOES0cD9p9DAgU/QwG0G0MAwys/AnZjPwN1vz8BoTs/A9zLPwHgcz8ALCs/A9PrOwJvuzsCB5M7APdzOwHvVzsD1z87AfWXOwPdbzcDAe8zAZb/LwOUhy8C1nsrAkzHKwDjXycCUjMnAC0/JwGUcycDD8sjAk9DIwIi0yMCLncjAtorIwEp7yMCrbsjAWGTIwOZbyMD+VMjAATzJwK39x8Aj78bAmgrGwIlKxcDfqcTAAiTEwKK0w8BkWMPALwzDwFjNwsCemcLAGG/CwCxMwsCGL8LAChjCwMwEwsAL9cHAJujBwJndwcD41MHAaU7EwO7TwsDej8HAUHzAwG+Tv8Crz77A1Su+wEijvcCoMb3AhdO8wLyFvMCWRbzAxRC8wFnlu8CxwbvAb6S7wHOMu8DMeLvAtWi7wIlbu8DCULvAdHa/wELnvcBSZrzAiRy7wPcDusC9FrnAPk+4wD6ot8D/HLfAHKm2wBJJtsCz+bXAO7i1wFOCtcAAVrXAmTG1wLsTtcA9+7TALee0wL7WtMBLybTAtz26wIQLucABe7fAofO1wCGktMCMhrPA+JSywLvJscCNH7HAnJGwwHMbsMCAua/Ah2ivwLwlr8C77q7Af8GuwFicrsDbfa7A3GSuwGFQrsCbP67AHfm0wInOs8Adm7LAFgqxwEx8r8AXJ67AfwStwI8OrMCQP6vALpKqwIoBqsAaianAOiWpwKbSqMCFjqjAaVaowEMoqMBaAqjAPuOnwLzJp8DVtKfAxO2vwLGJrsC9Wa3AsyWswOuUqsC7AKnA06WnwDZ+psDpg6XAJ7GkwIwApMAubaPAePKiwKiMosB3OKLA/vKhwMO5ocCxiqHABmShwElEocBDKqHALyOrwER/qcAbFajAyN+mwLOrpcDjG6TAUoGiwLggocAX9J/AafWewOAensAKa53A7dScwOxXnMAr8JvAWZqbwIVTm8ArGZvAK+mawLvBmsBdoZrAhF6mwJ+fpMAHDKPAzJuhwBthoMCGLZ/AXZ+dwG7+m8AkmJrAfGaZwGtjmMAXiZfAAtKWwCM5lsDQuZXAHVCVwKf4lMB2sJTA+XSUwAlElMDTG5TAubqhwN3En8DmCZ7AsoKcwC0em8Ag3pnAD6qYwLAfl8BneJXAbAyUwLzVksBFzpHAIvCQwMo1kMAjmo/AfBiPwNCsjsC2U47AIwqOwIPNjcCgm43AHGOdwKQem8CfIpnA7mmXwO7mlcC/kJTAOleTwDgiksAwnZDAj++OwON9jcAnQozARjaLwFFUisCwlonAPviIwD10iMCTBojA0auHwNxgh8AUI4fAImaZwDPOlsAfg5TA6ICSwIDCkMAPQo/AifCNwOnGjMD4lovAKBiKwDFkiMDS7IbACayFwLqbhMDttYPA/vSCwLtTgsBdzYHAsV2BwEABgcDotIDATseVwMDYksDjOZDALOiNwLjfi8COG4rA9pWIwKxHh8D6IobASAeFwN+Qg8CT1oHAgFmAwEwnfsDG/XvAcip6wO+heMC9WXfAPEh2wNZkdcCQqHTA+oeSwKVBj8D9S4zALaaJwMtNh8AQP4XAGXWDwDrqgcCxl4DAou1+wM7KfMCfDnrA7I12wFuIc8B68nDABMBuwOnkbMC1VWvAzAdqwHzxaMD/CWjAPaePwA0KjMCdvIjA2r+FwBETg8D9s4DA4z19wEKeecDffXbAbc9zwLSGccCdeG/AUd1swLZqacAoWmbAErpjwKB+YcCzm1/AwAVewBSyXMDqllvA+CGNwN8wicC/jIXANjiCwKtofsAhAXnAhTV0wLr+b8BQU2zALihpwEZwZsD8HmTAbRpiwMibX8AHMVzA1ShZwIB+VsAFOlTAOE9SwHmyUMD9WE/AJPOKwNGyhsAau4LAHyB+wN9od8DjUnHAV91rwDkEZ8CmwGLAXwlfwGXTW8DuEVnA+bdWwP+zVMBgRFLASu1OwI3kS8AlQEnAlPJGwNn/RMBBXEPAQBSJwLuKhMA8RIDA3Yt4wP0nccCVYmrAWz5kwMa6XsAY1FnAq4NVwG/AUcCGf07AZ7RLwK9RScBcSUfAWuhEwNCiQcBnlj7A7vM7wKeoOcDurTfAzn2HwAGygsCvRXzAbKxzwLaia8AXMWTAjV1dwBQrV8BtmVHAIqVMwMlHSMCCeETAkyxBwLNXPsAg7DvAU985wCqNN8CrVTTAY0IxwLWcLsClVSzAtVKFwBUhgcBzoHjA8XZvwH/RZsC/ul7AbTtXwMZZUMAOGUrAT3lEwFp3P8ADDTvAnDE3wI7aM8DV+zDATocuwKJyLMDCLyrAgQknwJnrI8B/QCHAomaBwHaufcCPiXXA1d1rwDupYsCv91nA9tNRwP1GSsBAV0PASAg9wGtaN8DASjLAWdMtwL7rKcB5iSbAyqAjwDojIcCYBh/ACNIcwFW+GcCzlRbAoOvmwIOH5sAtNebAsvHlwIC65cBsjeXAqGjlwLRK5cBSMuXAfR7lwF4O5cBEAeXAofbkwP3t5MD65uTASeHkwKvc5MDs2OTA4tXkwGvT5MBr0eTAjg7hwF+S4MDzK+DAstffwKKS38AhWt/A+yvfwFcG38Cr597AtM7ewGW63sDiqd7AeJzewJKR3sC5iN7Ai4HewLZ73sD8dt7AJXPewAhw3sCCbd7A90jbwHSv2sB8MNrAvsfZwJBx2cDoKtnAF/HYwN3B2MBXm9jA83vYwGRi2MCaTdjAszzYwPcu2MDQI9jAwRrYwGYT2MBvDdjAlwjYwKkE2MB5AdjA8KHVwCbl1MBOSNTAisbTwHhb08BZA9PAF7vSwPR/0sClT9LAOyjSwB0I0sD37dHAsdjRwGXH0cBXudHA7K3RwKek0cAhndHABZfRwBCS0cALjtHATyHQwJk6z8Dbec7Aq9nNwBlVzcCx58zAn43MwMBDzMBKB8zA49XLwJSty8C6jMvA+3HLwDlcy8CHSsvAJzzLwHkwy8D9JsvASh/LwAsZy8D5E8vArs/KwKq3ycBQzMjApAfIwBlkx8C23MbA9WzGwO4QxsBwxcXApIfFwCRVxcDvK8XAWQrFwADvxMDA2MTAqMbEwPS3xMACrMTAUKLEwHCaxMAMlMTAJLbFwAplxMCkR8PApVfCwAWPwcAh6MDA6l3AwM/rv8DPjb/AsEC/wIwBv8Dyzb7A1KO+wIGBvsCNZb7Azk6+wE88vsBHLb7AESG+wCcXvsAaD77AC9TAwMhLv8CH9L3AwNG8wB3du8CDELvARma6wDjZucDAZLnAxgS5wAS2uMCFdbjAzkC4wMgVuMC18rfAJNa3wOa+t8AArLfAo5y3wCmQt8AGhrfAS5a7wJ9musAJ3LjApX63wH9WtsA1XbXAn4y0wAHfs8AfT7PAR9iywFB2ssDnJbLADeSxwDeuscBFgrHAcl6xwERBscCGKbHANxaxwIUGscDF+bDAcTS2wIgktcCc87PAYWeywN0DscBY1q/AZtiuwNIDrsDPUq3AFMCswNtGrMDj4qvA0pCrwJlNq8CiFqvAxOmqwC7FqsBip6rAIo+qwGp7qsBia6rAfwaxwG7Br8AMra7Ae3utwEPuq8CihKrAvVGpwCFPqMCMdqfAIcKmwIUspsDrsKXA8EqlwDT3pMCZsqTAgHqkwLNMpMBaJ6TA7gikwCvwo8AI3KPAyReswAmUqsAZSanAVDCowLP+psAZcaXAXQGkwBnJosDSwaHAOOWgwGEtoMDhlJ/A3hafwOGunsB1WZ7AdxOewDjancB6q53AXIWdwE9mncAITZ3Ae0GnwCudpcC3HKTA6suiwNauocCxfaDAS/CewHZ6ncDRPJzA2zCbwDlQmsDylJnAivmYwBd5mMAUD5jA+LeXwJNwl8AtNpfAfAaXwJfflsDmv5bANYCiwM+ooMBWCZ/AppudwFNKnMBBKJvAS/iZwDZsmMBI8JbAQq2VwJqclMDst5PAMPmSwNtaksDz15HA5WuRwBcTkcBIypDAuI6QwBJekMBjNpDAuQaewFnhm8DgBJrAXmqYwPEBl8BFw5XAi52UwMpuk8Az5ZHALWOQwMIaj8BkBY7AphyNwHBajMApuYvAxzOLwKvFisAka4rA6yCKwC3kicCQsonAXumZwB5vl8APQ5XAYWCTwEHBkcD1XZDA4SSPwDkPjsAg4ozAk1uLwHXTicCjhYjAi2uHwLZ+hsABuYXAwxSFwOKMhMCzHITAb8CDwMd0g8DaNoPApyyWwHVZk8Af2JDAV6WOwGm8jMCUF4vAcLCJwKN8iMBAb4fAoVKGwKLPhMBrQYPALu6BwFfPgMDMvH/AWCp+wOHbfMAXx3vAieJ6wH4mesBFjHnAy9KSwLWkj8AvyozAvEGKwDIIiMD4GIbAYm6EwBECg8B8zIHAgMOAwJ9vf8BJg3zApVp5wE6pdsAXYnTA8XdywGXecMDoiW/ACXBuwEOHbcCrx2zAetuPwOFSjMBpHYnAjTuGwPirg8Cia4HAIex+wFeLe8BBqHjA/zN2wGYidMDTHXLAoFpvwNcubMCZcmnAzSFnwFUvZcCljmPAFDRiwBUVYcAKKGDA6UONwHdjicCe04XAxZaCwB5bf8ChLXrATZ91wGWnccDlOm7AQE1rwMvPaMD6tWbAbsBkwO8eYsAN+V7AsDhcwEHeWcBp41fAhjtWwNTaVMCntlPAEweLwHjThsAV7ILAAap+wI4heMBsQHLAkQRtwIJoaMDAY2TAcOtgwCHzXcBgbFvAPEpZwFtaV8B/21TAr7FRwFf4TsDbl0zAlJRKwG7lSMCMfkfANR6JwLadhMCeY4DApep4wBCuccDhFmvAAydlwMDcX8DmMlvAMiFXwPqcU8DomVDAvwlOwC7fS8Ch9EnA3Y5HwF9jRMD9pkHAAk4/wDFDPcC5jDvAXIGHwFC7gsDKaXzAuOhzwGD+a8Bqs2TAgg1ewOUOWMAvtlLAef5NwL/fScCGT0bAlUFDwOqnQMDTdD7ApY88wEs7OsA4DzfAS080wE/0McCX7y/A71OFwEIkgcDUsXjAPplvwGALZ8BZE1/ADbpXwHEFUcAT+ErA4JBFwD3LQMBonzzAFQM5wCvqNcDkRjPALAsxwGklL8Do3CzAabspwP/xJsBolCTAomaBwNCwfcAwj3XAA+5rwMjJYsAzL1rAjylSwPjBSsCt/kPAi+I9wNJsOMA0mTPAL2AvwKq3K8CtkyjAsOYlwDyiI8AMuCHAJH0fwJBoHMDZlBnAmgDpwLat6MA5aujAazPowPsG6MAC4+fA6sXnwGmu58Bvm+fAH4znwMd/58DTdefAzW3nwFdn58AjYufA8l3nwJJa58DaV+fAqlXnwOdT58B8UufAQRHjwGSp4sB8VOLAWA/iwC/X4cCmqeHAx4ThwPVm4cDdTuHAaTvhwLcr4cAPH+HA2hThwKEM4cABBuHAqwDhwF/84MDp+ODAIPbgwOHz4MAT8uDAITXdwEqz3MD3SNzACfLbwDur28C2cdvAEUPbwEsd28C+/trADubawB/S2sAJwtrAEbXawJyq2sAuotrAZJvawOyV2sCEkdrA+I3awB2L2sDRiNrAFXPXwI7R1sC9TNbA8t/VwPyG1cCCPtXAngPVwNrT1MAsrdTA4o3UwJl01MAuYNTAtE/UwGtC1MC1N9TAEi/UwB4o1MCDItTAAB7UwF4a1MBxF9TA5dLRwCAL0cAFZtDAN97PwPFuz8DwE8/Ax8nOwIKNzsCfXM7ABjXOwP4UzsAb+83AM+bNwFXVzcC6x83AwrzNwOuzzcDLrM3ADqfNwG+izcC3ns3AM13MwM9ny8DPm8rAHvPJwFBoycCN9sjAfpnIwKNNyMD8D8jA993HwHK1x8CrlMfALXrHwMdkx8CDU8fAlkXHwFw6x8BPMcfABSrHwCUkx8BqH8fAbxvHwFrwxcD19cTAsCXEwG55w8Cc68LAWXfCwDsYwsCsysHAn4vBwHdYwcAFL8HAfQ3BwGLywMB/3MDA1MrAwJS8wMAXscDA1afAwF+gwMBcmsDAZRfCwDKuwMBNfb/A5X2+wFupvcB/+bzArGi8wOXxu8C0kLvAb0G7wPsAu8CtzLrATaK6wAKAusBKZLrA5026wNU7usBCLbrAgSG6wAkYusBnELrAx9y8wB2ru8BGO7rAlAS5wCgAuMBWJ7fA3HO2wAXgtcC4ZrXAcwO1wHSytMCXcLTAIju0wNAPtMDC7LPAa9CzwIi5s8AOp7PAJ5izwCKMs8BzgrPALmq3wMBptsClObXAMMOzwLGGssBBfbHAJaCwwAnpr8AmUq/AVdauwPhwrsA9Hq7A89qtwFSkrcAReK3APVStwEY3rcDhH63A/wytwML9rMB68azA6BuywNjzsMAQ8a/AvcKuwGtGrcAgBKzAq/WqwEIUqsCBWanAj7+owDFBqMC82afAQoWnwIlAp8C/CKfAhtumwOy2psBUmabAbIGmwCBupsCOXqbA9AqtwLqlq8AHeKrAOXOpwMVFqMBsxabAVX2lwNhppMAghKPAtsWiwLAoosDBp6HAMT6hwPXnoMDLoaDA0migwKM6oMBAFaDABfefwJnen8Diyp/A7SCowDKVpsCQKqXAO/ejwLfwosDCxKHAn0CgwL7ynsA32p3AKvCcwBMunMD0jZvAcAqbwL6emsDARprAIf+ZwPbEmcDOlZnAoW+ZwMJQmcDQN5nAzkSjwIeIocCBA6DA46qewO5xncCpaJzAdzybwGy4mcC9ZJjAKUeXwMRYlsD7kpXAv++UwKBplMDJ+5PAA6KTwO1Yk8COHZPAa+2SwHHGksDsppLAW6qewEKjnMAr5ZrA2WSZwE8VmMCP6JbAStuVwEmwlMAvLZPAstORwA2xkMBLvo/Ay/SOwGxOjsCuxY3ArFWNwBf6jMCJr4zA83KMwNJBjMAKGozAJm2awB0QmMBIApbAAj6UwLS8ksCZcZHA11CQwFJKj8DzII7AP5+MwPI/i8A4GIrAFCGJwNZTiMBPqofA6x6HwLqshsBUT4bARgOGwHjFhcBXk4XAwpKWwL3ak8B8dpHA4GGPwF6XjcBwEIzA38WKwESpicDisYjAzo6HwO4OhsDNqYTA+XyDwGyBgsBqsIHAtAOBwKZ1gMBAAYDABkR/wOOofsDQKn7AWR6TwIgIkMD7SI3Ae92KwA3CiMBB8YbApGSFwB0VhMBo+oLAaAeCwLP4gMAG+X7AFSN8wC2/ecA2v3fAnRV2wMe1dMBIlHPABadywNbkccCjRnHATxCQwHGcjMD7fonA4LeGwBlFhMDOIoLArEuAwKVyfcB+yXrAn4t4wKCrdsCEpnTAOdBxwN3ubsCpgGzAxXdqwIjGaMA4YGfASjlmwH9HZcCWgWTAQWaNwKOWicA2G4bAGfaCwG4ngMCwWnvASgh3wEBNc8D3HHDAf2ltwLsia8ArPGnAnk9nwOmRZMBpt2HA2z5fwPssXcALdFvAMgdawMbaWMBn5FfAOxuLwID0hsCfHYPAUDV/wMnbeMBKL3PAcCxuwCbMacA9BGbAQshiwFsKYMCYul3AE8xbwLzsWcDdSVfA425UwDL6UcBF30/AkB5OwB+rTMAmeUvAQiiJwOewhMBfg4DAhUp5wIs1csC5zGvAChFmwHX/YMAykVzAUbxYwIl0VcAWrFLAN1NQwKNcTsCTgkzAbPtJwEQcR8C5qUTABI9CwHnGQMBfTD/A8YSHwLbEgsBKjnzAtyV0wBlbbMAeN2XAAr9ewB70WMDA01PAcFdPwH51S8DNIUjAsk5FwJvsQsDd7UDAfxg/wHiqPMAvxDnAG043wMA3NcAfbDPAKVWFwHUngcBfw3jA67tvwO1FZ8D6bF/ABzpYwKayUcCG2EvAUqlGwOIeQsDHLz7AEtA6wDHyN8DGhjXAwn8zwCevMcCKWi/ASGkswL7tKcCv1CfAomaBwCqzfcDclHXAWP5rwK/qYsBcZ1rAJ4BSwEg+S8Cjp0TAQ74+wC2AOcCK5zTALuswwFp/LcCXlirAuyEowFYSJsCIRiTAdAgiwEwPH8D+iRzAyPrqwFK26sAdf+rArFLqwPQu6sBIEurASfvpwNzo6cAa2unASs7pwNfE6cBIvenAPbfpwGiy6cCLrunAdavpwP6o6cAFp+nAcqXpwDCk6cAvo+nAqPzkwPal5MDBX+TAICfkwIr548Dk1OPAebfjwOCf48D3jOPA033jwLRx48ABaOPAP2DjwAta48AVVePAH1HjwPRN48BsS+PAZknjwMhH48B9RuPAtw3fwDCg3sBYR97AYf/dwFLF3cCTlt3A/nDdwNJS3cCeOt3AOSfdwLAX3cBBC93ATgHdwFn53MD88tzA5e3cwNTp3MCU5tzA++PcwOjh3MBA4NzAjzTZwMSq2MCYOtjAlt/XwNmV18BaWtfAcSrXwOsD18D95NbALczWwEq41sBdqNbAnZvWwGmR1sBAidbAuYLWwIJ91sBWedbAAXbWwFdz1sA2cdbAyXjTwF3M0sBaP9LAh8zRwFhv0cDTI9HA4ebQwMu10MBTjtDAoW7QwDRV0MDTQNDAgDDQwG4j0MD6GNDAnBDQwOwJ0MCTBNDATQDQwOL8z8An+s/A8+LNwKQMzcBdXMzAHszLwKBWy8BD98rA86nKwIxrysBIOcrA3BDKwGXwycBZ1snAeMHJwL+wycBco8nApZjJwBOQycA5icnAvoPJwF1/ycDde8nAq3zIwEN0x8BSmcbAK+XFwLJRxcCF2cTA93fEwNooxMD76MPAh7XDwCSMw8DnasPAO1DDwNo6w8C6KcPABBzDwAsRw8BECMPAQAHDwKP7wsAn98LALFDDwN4MwsAD/8DAcB/AwGJnv8Cu0L7A0VW+wAzyvcAgob3AyF+9wCIrvcDHAL3Awt68wHbDvMCTrbzAC5y8wAKOvMDGgrzAynm8wJpyvMDbbLzATRu+wLXgvMAXl7vAyYO6wJGfucCa47jAo0m4wBXMt8AXZrfAWxO3wIbQtsCrmrbAV2+2wIhMtsCaMLbANRq2wEQItsDn+bXAaO61wDbltcDb3bXAu5m4wIWlt8DOa7bA4Ru1wCADtMBCGrPAX1qywCC9scDePLHApNSwwBSAsMDBO7DArwSwwF/Yr8DFtK/AM5ivwEuBr8Dxbq/APmCvwHxUr8ATS6/AYi2zwFIgssDVKbHA/PGvwMSbrsCPfa3ACJCswDTMq8CqK6vArKiqwDY+qsDQ56nA+6GpwK9pqcBiPKnA+xepwMT6qMBX46jAktCowIrBqMCDtajAHvytwLezrMBFoavAu6iqwL5zqcA7F6jAkfOmwF4BpsCWOaXAvJWkwP4PpMBEo6PACEujwK4Do8AmyqLA2ZuiwKR2osDGWKLA00CiwKItosBEHqLA8PyowIeDp8DxNKbAHh2lwNMipMCJ8aLAvY6hwJxloMC5bp/A+KKewMn7ncBHc53ARASdwC6qnMBMYZzAhSacwDb3m8Aw0ZvAqrKbwC+am8CShpvAIwikwN1kosD7+KDAkbGfwFqUnsCYmJ3Ay2ucwLUCm8Aa1JnAg9iYwMUImMA9XpfA8NKWwKBhlsCoBZbAPbuVwDV/lcDhTpXACCiVwNgIlcDU75TAwk2fwAtkncADw5vAEluawNMimcBzB5jAfAqXwOjilcCIc5TAcD+TwCA/ksBfa5HAd72QwFwvkMC5u4/A212PwOIRj8CW1I7AOqOOwIx7jsCwW47ATvGawPCwmMB4wJbAaRmVwBS0k8BOgJLAInWRwOl4kMBuVI/Ak+GNwPqnjMDsoovAIcuKwNMZisDiiInA5xKJwCCziMCSZYjAACeIwJr0h8AUzIfAhfmWwG1clMC+FJLAeB2QwDhwjsC3BY3AQtWLwI7OisBC5InA8cKIwCtNh8ALDobAOASFwF0ohMCic4PA1t+CwH1ngsDHBYLAobaBwMJ2gcBQQ4HAlWqTwAZtkMA3yI3ALHmLwAt7icCMx4fAdleGwN8ihcAQIITAbT6DwH8qgsCctoDA4uN+wKTGfMC+BnvAYZZ5wANpeMCKc3fANKx2wK8KdsBQiHXAtUWQwK/mjMA44YnArDSHwDzehMA02YLAZx+BwFhTf8Bq4HzAg9V6wIQcecAfE3fAWzx0wOGnccD8gG/A17htwIJBbMBRDmvAAhRqwLlIacDwo2jA/IiNwF3KicB7Y4bAHFaDwM2hgMDbh3zA5G94wJLvdMC2+HHA6HtvwElobcDksGvA671pwKcAZ8CTaGTA9zdiwIFnYMAk6V7AELBdwN+wXMCV4VvAnC+LwOgVh8CzT4PA88F/wGOXecA0H3TAhlRvwI8ua8BpoWfABp9kwDoYYsDG+1/A0jxewKxeXMDctFnAeyJXwAfsVMAuE1PAuI1RwLBOUMCNSk/AaTKJwE3EhMB7o4DAcat5wFa+csDyg2zAKfxmwHkiYsBr7l3AVFRawE5GV8A5tVTA/Y9SwF3JUMD59k7AlWJMwKLMScConEfAQ7xFwKEvRMCU6kLAjYiHwDTOgsAvs3zAaGN0wNi4bMAevGXA5nFfwHnaWcC38VTAe69QwFcITcCO7knAElNHwPIkRcCJVkPAx49BwB4LP8DccDzAbj46wB1jOMA7zzbAY1aFwK4qgcAU1XjA995vwCOBZ8Cax1/ASrtYwD5hUsAmukzAQsJHwL9xQ8BzvT/AyZc8wMnxOcClujfAWeQ1wJIkNMAttDHABRAvwHLaLMBY/yrAomaBwIW1fcCUmnXA0w5swO8LY8AnoFrAttdSwNq7S8D8UUXAMZs/wBqUOsA7NTbArHMywARCL8BekSzAGlEqwM1yKMCOtybAO14kwHSvIcAGch/AqdrswD6i7MAmdezAKVHswHw07MCoHezAfwvswBD968CY8evAfOjrwELh68CF2+vA+NbrwFvT68B+0OvAOM7rwGvM68D9yuvA28nrwPXI68A+yOvAxtDmwIqI5sCdTubATiDmwFn75cDk3eXAccblwMmz5cD1pOXALZnlwNKP5cBliOXAf4LlwNJ95cAceuXAK3flwNV05cD7cuXAg3HlwFlw5cBtb+XAT9LgwCF24MAFLODAkvDfwArB38Aam9/A3XzfwMlk38ChUd/AZ0LfwE4238CzLN/AEiXfwAQf38A3Gt/AZxbfwGET38D7EN/AFQ/fwJMN38BgDN/AkOXawFBw2sDNEdrAzMXZwNKI2cAPWNnAIjHZwBoS2cBk+djAvOXYwBvW2MCxydjA1L/YwAC42MDJsdjA26zYwPGo2MDXpdjAYaPYwG2h2MDhn9jA3BHVwHp91MBZBdTAfaTTwJZW08AQGNPAEObSwCS+0sBQntLA+ITSwM5w0sDFYNLACFTSwOpJ0sDiQdLAgjvSwHM20sBvMtLAQC/SwLos0sC5KtLAnV/PwASlzsAfDc7AGpLNwOIuzcAR38zA/57MwL5rzMDSQszAMSLMwDUIzMCI88vAF+PLwAfWy8Cny8vAasPLwOC8y8Cwt8vAkrPLwE6wy8C3rcvAatjJwGvvyMCSMMjALJXHwEAXx8CpscbA7F/GwEoexsDI6cXA2b/FwGmexcDHg8XAlm7FwL1dxcBZUMXAtkXFwEQ9xcCRNsXAPzHFwActxcCuKcXAyYbEwGBmw8BOeMLAMrXBwEQWwcBxlcDAdy3AwMzZv8CYlr/A0mC/wN81v8CeE7/AVvi+wKDivsBc0b7ApMO+wL64vsAXsL7AOam+wMajvsBzn77Alky/wGwUvsAL7rzA5fq7wIQzu8AJkbrATQ26wO2iucBQTbnAhwi5wHvRuMCBpbjAb4K4wH5muMBCULjAlD64wIYwuMBdJbjAgBy4wHcVuMDiD7jAmcK5wG/VuMBdnLfABXC2wMl3tcAgrLTAEwa0wGV/s8CgErPAD7uywK50ssBZPLLAVw+ywHHrscDXzrHAE7ixwPmlscCWl7HAKIyxwBWDscDhe7HAYjq0wFpGs8BvWLLAKh+xwNvsr8CH767Akh+uwPB1rcBM7KzAHX2swJYjrMCa26vA+aGrwO1zq8AwT6vA6zGrwJ8aq8AYCKvAXvmqwKztqsBh5KrAv+quwHW9rcBQxKzAJ9arwFudqsAVZanApmKowGGOp8Am4abAiFSmwObipcBoh6XAzj2lwN4CpcDF06TAMa6kwD+QpMBpeKTAdGWkwGNWpMBqSqTAX9WpwI1uqMBOO6fACj2mwPVOpcBuF6TAL9miwKLRocAK+aDAL0igwJK4n8B6RJ/A/OaewMObnsCCX57AWS+ewOsInsBL6p3A6tGdwIa+ncAcr53ACMmkwLw+o8AX6qHAdbSgwA+xn8CswZ7A1o2dwJ9JnMDvPJvA/V+awH6rmcDcGJnASaKYwMRCmMDq9ZfAVbiXwBqHl8DQX5fAgECXwJInl8C9E5fArvCfwGQjnsBYnZzAG02bwO4omsDdIJnAXzCYwAEBl8DNtpXA96SUwKXDk8B8C5PAz3WSwLv8kcAqm5HAqkyRwL8NkcBu25DARbOQwEOTkMDGeZDAqnWbwFtRmcBSfZfAPPKVwGumlMASiJPA6oySwGabkcBRcZDAHCGPwBoKjsBiJI3AiGiMwMnPi8AvVIvAjfCKwGGgisAaYIrAsyyKwKkDisDy4onA1GCXwFzelMCospLA0teQwJ1Gj8AL943AL92MwCbri8BNA4vAIN+JwOeIiMCxbIfAjYKGwPrChcAjJ4XA+6iEwENDhMBn8YPAwK+DwD57g8BQUYPAc7eTwBPSkMC7R47AlhSMwOQyisCBm4jAeUaHwCUrhsDIPIXATGSEwMBKg8B+7oHADs2AwOm8f8BBNn7AVPh8wNz2e8A0J3vAEoB6wPr5ecC3jnnApXuQwIwxjcAJRIrAyLGHwCZ3hcCKjoPA6fCBwFuWgMCd7H7ABxF9wIJwe8DfY3nAVaR2wPJWdMDEcHLAiuJwwE2eb8Cfl27AscNtwBoZbcAvkGzAGKyNwJ7+icBfrIbAtbaDwIQcgcC2tH3AjNV5wK6NdsBlzXPAvINxwM+fb8CtDG7AKRhswAJoacBqEGfALiFlwFCLY8CyQGLAvjRhwH1cYMBmrl/ANESLwK43h8BMgoPA6ieAwC5UesDgD3XAaHxwwDKPbMCYOmnAAW9mwKgbZMBDL2LAg5hgwN24XsCNGVzA+8ZZwJ7OV8AIMVbA999UwK3OU8AL8lLAqDyJwOjXhMDyw4DAYQ16wFtIc8BhPG3AGehnwGZFY8AISl/Ak+hbwI0RWcBktFbAab9UwBgkU8B4UVHAIcNOwKVwTMB+eUrAHNRIwIZ8R8DVZUbAMYyHwMjXgsB42HzAxqF0wJMXbcBVQmbAAyZgwLTBWsCyD1bAEQZSwKKXTsANtUvA801JwENQR8BTrkXAvehDwFpnQcD7ED/Apxw9wOt0O8C7FjrAnleFwO4tgcDz5njAYQJwwAC9Z8AwI2DAvz1ZwBQRU8CynE3ATttIwFDDRMDHR0HAglk+wDToO8DT4TnAZTg4wLx9NsDnCTTA56wxwHi1L8B7Ei7AomaBwOC3fcBXoHXAdR9swIgtY8CR2VrANDBTwJs6TMCV/UXAF3lAwDyoO8DHgTfAB/kzwPH+MMBHgy7AHXQswBPDKsAeEynAZ60mwE1GJMAmSiLAA6HuwJZy7sDNTe7AsjDuwLIZ7sCIB+7ANPntwOft7cD+5O3A+t3twHLY7cAY1O3AqtDtwPfN7cDXy+3AK8rtwNrI7cDRx+3AAMftwFzG7cDbxe3A743owNpR6MAhIujAT/znwGLe58C7xufADrTnwFGl58CymefAiZDnwFGJ58Chg+fAJ3/nwKB758DZeOfAqnbnwPF058CXc+fAhnLnwK9x58AGcefA0oLiwGU14sCt9+HApcbhwMmf4cAIgeHAuGjhwIZV4cBgRuHAbjrhwAMx4cCXKeHAvyPhwCQf4cCEG+HAqhjhwGsW4cCmFOHAQhPhwCkS4cBMEeHAoIXcwBQi3MCZ0tvAPZPbwONg28D5ONvAYxnbwGoA28Cx7NrAId3awNvQ2sAux9rAj7/awI252sDStNrAGLHawCqu2sDbq9rACarawJuo2sB7p9rAVp3WwPQd1sDYt9XATWbVwEgl1cCa8dTAosjUwDSo1MCQjtTAUXrUwFVq1MC7XdTAy1PUwPdL1MDMRdTA8EDUwB091MAaOtTAuzfUwN011MBlNNTAItLQwBgw0MCLrc/A3UTPwD7xzsCOrs7AinnOwIFPzsA5Ls7A6hPOwCL/zcC77s3Ay+HNwJjXzcCPz83AOsnNwD3EzcBQwM3AOL3NwMm6zcDfuM3Ady3LwMBgysDXusnAHzXJwNvJyMAkdMjAyC/IwGv5x8BPzsfALazHwDCRx8Dee8fACmvHwMVdx8BOU8fAD0vHwJBEx8ByP8fAajvHwD44x8C/NcfA+7nFwH25xMAU6MPARz7DwGO1wsCFR8LAtO/BwKipwcDwccHAv0XBwMAiwcAUB8HAOPHAwPffwMBa0sDAn8fAwCq/wMCBuMDAQbPAwB+vwMDeq8DAJXTAwAFFv8DpPr7Ay2i9wBa7vMD9LrzAhr67wJhku8DaHLvAxOO6wHu2usCfkrrAQna6wNpfusAqTrrAN0C6wDY1usCLLLrAtiW6wFUgusAZHLrAvuO6wBL7ucAPyrjAXL63wIfjtsDnMbbAlKK1wH8vtcBx07TA/om0wIdPtMAlIbTAafyzwFrfs8BlyLPARrazwPqns8C0nLPA0pOzwNKMs8BOh7PAcUK1wHtltMAJfLPAwUmywHE4scDhWLDAUqOvwMEQr8AGm67A2DyuwKzxrcDSta3AVIatwLZgrcD0Qq3AcCutwOAYrcA7Cq3Ar/6swJX1rMBp7qzAU9avwHvCrsC64K3Ao/eswKXEq8C3rarAacmpwOUPqcASeqjArQGowFahp8BxVKfAMRenwJTmpsASwKbAmqGmwIeJpsCFdqbAhmemwLNbpsBhUqbAeqmqwMRWqcAsPajAj1anwOVtpsBDO6XAtB6kwKM1o8AmeKLAC9+hwPdjocByAaHA0LKgwCZ0oMBpQqDA/xqgwNH7n8As45/At8+fwF3An8BCtJ/Aw4alwCEUpMBj0qLAE7OhwJjHoMBk35/AF66ewOKLncAKnpzAjdybwCVAm8BdwprApV2awD8NmsAqzZnASJqZwPZxmcAOUpnA1ziZwO0kmcA3FZnA5JKgwAXhnsC6cp3A/zicwLUkm8BXNJrAA02ZwJIdmMC19ZbADgOWwIw9lcDPnZTATB2UwF22k8AuZJPAqSKTwKHuksBjxZLAv6SSwPOKksCUdpLAD/qbwCLxmcCNOJjAK8iWwFeSlcBAiZTASZ2TwDW3ksAeipHAklyQwBZlj8CIm47Ab/iNwCt1jcD+C43AAriMwAd1jMDWP4zAqRWMwEj0i8Dl2YvAksiXwF9glcAAUJPApZCRwD0akMAZ5I7Avd6NwOf/jMDhHIzAGfSKwNnAicCBxIjA3faHwGFQh8BVyobA5F6GwBYJhsChxIXAQI6FwCRjhcACQYXA4gSUwJY3kcBex47AgK+MwE/pisDQbInAWzGIwGkth8BOUobAAn+FwNpbhMDeIoPAoiGCwOBPgcD5pYDAHh2AwMNef8Byr37AjyN+wGi0fcBHXH3AGbKQwPx8jcBUp4rADi+IwKMPhsCMQoTA5L+CwAx/gcDIdoDAbTx/wDmnfcBdg3vA3wV5wIv5dsC7TXXABPNzwJ7bcsCC+3HAb0hxwIq5cMD1R3DAk8+NwF8zisDU9YbAzBeEwG+XgcDU4H7Aujh7wPYmeMBgmnXAnoBzwNDIccA9Q3DAg0BuwKbCa8BjrGnAMfhnwICWZsBZeWXAipRkwKjdY8C3S2PABFmLwM9Zh8BjtYPAa2+AwP0Re8AFAXbAraNxwIjtbcAuz2rAjTdowHAUZsCOVGTAmNZiwJ7wYMCwdV7ASFxcwJ+fWsDfNlnA5RNYwFUqV8CWb1bAAEeJwLfrhMDB5IDAR3B6wILTc8Da9W3AktRowNRnZMCEo2DAc3hdwKPVWsAJqVjA9OBWwG5mVcCZlFPAuBtRwBIHT8BzRE3Aj9RLwLCrSsBMvUnA24+HwHPhgsAk/nzAzeB0wEB3bcCsyWbAMNtgwIipW8BLLVfAs1pTwMYiUMCmdE3Abj5LwAZuScDG8EfAgy1GwIK8Q8CGpEHA8+Y/wPFvPsAZQT3A2liFwDQxgcD8+HjAKSZwwID5Z8Cxf2DAU8FZwP7BU8Dof07AFfRJwBYTRsAtzkLAmRRAwKDUPcDE+zvA+nk6wLrAOMBTWTbAFT00wLR9MsBcCTHAomaBwDu6fcAkpnXAPjBswHlPY8CYE1vAmIlTwHe6TMBHqkbAtFdBwDO8PMCwzDjAqXo1wH61MsCjazDANIouwMICLcC2VCvAxfYowH/RJsA2DyXAxU7wwJ0o8MCkCvDAH/PvwK/g78A/0u/A8sbvwBq+78Awt+/Ax7HvwI2t78BAqu/Aq6fvwKel78ATpO/A2KLvwOKh78Aioe/AjKDvwBag78C7n+/AsDTqwMoC6sCG2+nArLzpwHak6cB8kenAnoLpwPt26cDhbenAwmbpwDFh6cDXXOnAcFnpwMhW6cC0VOnAFVPpwNBR6cDTUOnADVDpwHJP6cD5TunAbB/kwH7e48Atq+PAyYLjwAxj48AkSuPAnTbjwFIn48BZG+PA+hHjwKYK48DsBOPAcQDjwPH84sA1+uLAEvjiwGf24sAZ9eLAFPTiwEjz4sCp8uLAjBTewDHA3cB3fd3AuEjdwDMf3cCR/tzA9eTcwODQ3MAlwdzA1bTcwDOr3MCpo9zAxZ3cwCqZ3MCQldzAwJLcwI2Q3MDVjtzAfo3cwHKM3MCgi9zArxrYwJCt18DxVtfAaBLXwDnc1sCPsdbAB5DWwLV11sASYdbA51DWwD5E1sBXOtbAmDLWwIks1sDNJ9bAGSTWwDUh1sDzHtbALx3WwM4b1sC6GtbAtTnSwFOt0cBePdHAduTQwBue0MB5ZtDAqTrQwDkY0MAw/c/A/efPwGHXz8Bgys/AM8DPwD24z8AEss/AJq3PwFmpz8Bgps/ADqTPwD2iz8DToM/A0nrMwG3Hy8CLN8vAu8TKwIhpysBXIcrAQejJwEi7ycDtl8nALHzJwGhmycBaVcnA/0fJwIw9ycBgNcnA/C7JwP0pycAVJsnACCPJwKUgycDIHsnAqejGwDMFxsB8TcXAEbrEwGdExMDm5sPA3ZzDwE9iw8AsNMPA5Q/DwGnzwsAS3cLAksvCwN29wsAjs8LAv6rCwDCkwsAPn8LADZvCwOuXwsB4lcLA647BwFhxwMCniL/Amsy+wKI1vsAavb3AR129wGIRvcBa1bzACqa8wNWAvMCeY7zAtEy8wL86vMCvLLzAriG8wBIZvMBXErzAFA28wPcIvMDABbzAbPq7wMAVu8DJ87nA3AW5wHZFuMDtqrfAfi+3wFjNtsCUf7bAEEK2wJERtsBs67XAd821wPi1tcCOo7XAIpW1wNmJtcAFgbXAHnq1wLh0tcCAcLXALEW2wBZ7tcC+lrTAo3CzwHZ9ssCyuLHAkxqxwDqcsMC7N7DAF+ivwBOpr8Bhd6/ASlCvwJYxr8CBGa/AoAavwNj3rsBG7K7AOeOuwCXcrsCc1q7AZr6wwGPCr8BT9K7AtxCuwH/orMAO8KvA6SarwC+FqsDmA6rACJ2pwIBLqcD6CqnAE9iowAewqMCSkKjA5HeowI1kqMBnVajAi0mowEVAqMADOajA1nWrwKI7qsAhOqnAJWiowIyEp8DrW6bANF6lwKiQpMBN66PAD2ejwM39osBZqqLAT2iiwDA0osAtC6LA9eqhwK7RocDdvaHAWK6hwDOiocCymKHASkGmwMrlpMAAtKPA/qyiwCPXocD986DAbMufwGnInsBw9p3Abk2dwDXGnMCJWpzAJQWcwJPBm8A5jJvAPGKbwD9Bm8BcJ5vAERObwCwDm8C79prAKDShwKicn8B6RJ7A6x+dwIYbnMCDQZvAjF+awHs3mcAmL5jAuViXwAmslsDOIZbAs7OVwFpclcA5F5XAouCUwKi1lMDjk5TAYnmUwJxklMBWVJTAUX6cwAyQmsDm8ZjA1pqXwP55lsBMhJXAkaeUwG3Hk8CFoJLA2JKRwO+3kMCJB5DARXqPwLQJj8BgsI7ArGmOwNIxjsDaBY7AS+ONwCvIjcDnso3ApjCYwEzilcCP7JPAsUeSwNDqkMAhzI/AK9qOwDoKjsBsK43A7waMwOLzisB1FIrAUWCJwPzPiMDuXIjAmQGIwE25h8AsgIfAMlOHwNYvh8AUFIfA01KUwHSdkcD4Ro/AtEmNwAyei8AwO4rA1BeJwPQoiMDlXofAwIyGwBNrhcCdUoTAo26DwLi2gsBJI4LAt62BwFtQgcByBoHABsyAwASegMDZeYDACOmQwO7IjcD/CovAVqyIwHunhsD39ITAD4yDwHljgsBkcYHAs6qAwAHOf8CEmn3Atl57wJKNecAbFnjA+eh2wLz4dcDpOXXA0qJ0wFcrdMA+zXPAavONwJtoisDNP4fASHmEwGcSgsDnBYDA7Jh8wNy6ecAWX3fAD3J1wPHic8BWanLARVhwwMYUbsBeOmzAMLtqwLeHacBSkmjAVM9nwOw0Z8DGumbACm6LwEl8h8Dy6IPAcbeAwKHQe8Ba8nbA8clywBJJb8CdXmzAGvhpwBICaMBHa2bAWP1kwBgFY8A8x2DAKuRewDFdXcBMI1zArChbwHVhWsCuw1nAcVGJwLr/hMDlBYHAGdR6wLJfdMAxsG7AUMFpwGKJZcBk+mHAZgNfwP+RXMDUklrAPfRYwKOJV8Crq1XAhmpTwGqLUcCN/E/AKLxOwDu8TcC68EzAjZOHwDXrgsAyJH3AeiB1wNTXbcALUmfAQpFhwLSRXMAkSljA5axUwDipUcDJLE/AWSRNwNR9S8A3FkrA00xIwKoHRsBPKETAqplCwK9SQcBhTUDAFlqFwIE0gcAvC3nATUpwwJ82aMAU3WDA7kVawNVzVMCHY0/AOgxLwJhgR8AYUETAe8hBwKO2P8AQCD7AeKM8wOvqOsBaoDjAeL02wFMxNcA65zPAomaBwJa8fcD9q3XALUFswMFxY8A3TlvA2ONTwFs7TcDrV0fAyzZCwKbPPcCAFTrACfg2wBllNMC0STLA85IwwEEtL8AnhC3AOjgrwBFPKcAnwCfA/uTxwKvF8cBErfHARprxwIKL8cAJgPHAIHfxwDVw8cDXavHArWbxwHJj8cDwYPHA/17xwH1d8cBSXPHAalvxwLda8cArWvHAv1nxwGtZ8cAqWfHAwMXrwGKc68AcfOvA9mLrwGRP68AsQOvAWTTrwCor68AJJOvAgR7rwDYa68DhFuvATBTrwEsS68C+EOvAig/rwJsO68DhDevAUg3rwOIM68CMDOvAgKjlwBpy5cCDR+XARiblwGAM5cA4+OTAjOjkwF3c5MDo0uTAkMvkwN3F5MBwweTAAr7kwFm75MBJueTAr7fkwHK25MB7teTAvbTkwCi05MC2s+TAXpLfwAFL38AJE9/ANefewAHF3sBZqt7AmZXewHeF3sDteN7AMG/ewKBn3sDCYd7ANF3ewKxZ3sDvVt7Az1TewClT3sDiUd7A5VDewCBQ3sCIT97AnYnZwFEs2cDy4tjAZ6nYwFR82MAmWdjAuj3YwGIo2MDIF9jA4QrYwNwA2MAU+dfAC/PXwFvu18C56tfA5+fXwLjl18AG5NfAteLXwLDh18Dm4NfAwZXTwGUc08CQvNLALnHSwAw20sC4B9LAjePRwFzH0cBqsdHAWKDRwBST0cDGiNHAxYDRwJB60cC+ddHAAXLRwBtv0cDcbNHAHWvRwMNp0cC3aNHAr7/NwNgizcBSpszA8EPMwIf2y8DMucvANIrLwAtly8ATSMvAhTHLwPofy8BXEsvAwAfLwIf/ysAl+crAMfTKwFnwysBe7crAD+vKwETpysDg58rA5BHIwLBIx8Dlp8bALyjGwD7DxcDLc8XAdDXFwJUExcBs3sTArMDEwIGpxMB8l8TAeonEwJh+xMAmdsTAl2/EwIBqxMCOZsTAfmPEwB5hxMBHX8TAOZjCwH+YwcBxysDArCXAwMCiv8A/O7/Avum+wMipvsCgd77AdFC+wOoxvsAhGr7AoAe+wD/5vcAS7r3AZeW9wKrevcBw2b3AYtW9wD3SvcDNz73AwQS9wC0evMCWGLvAqkW6wOmcucDBFrnAqay4wBlZuMCBF7jADeS3wN27t8CGnLfAHoS3wCFxt8BeYrfA5la3wP9Nt8AVR7fAuEG3wI89t8BUOrfAQEK3wFaDtsBOnrXA2pK0wAy7s8BJDrPA4YSywCwYssCKwrHAS3+xwIpKscBTIbHALgGxwCXosMCq1LDAhcWwwMG5sMCesLDAhqmwwAWksMDAn7DAs6KxwNe8sMDv+6/AQxmvwO4HrsA6K63AcXqswMPtq8BsfqvAsCarwMnhqsC4q6rAd4GqwIJgqsDVRqrA3DKqwFQjqsBCF6rA5A2qwJ0GqsD4AKrAxT6swO0cq8DXMarAMm+pwG6PqMBqeKfAy5amwPXhpcD8UaXA/t+kwCKGpMCNP6TAKwikwN3co8AVu6PAxKCjwEqMo8BefKPA/2+jwGNmo8DuXqPA0fmmwHSzpcAykqTA36GjwLrdosBE/6HA2uSgwEr+n8BgRZ/AFbKewGk9nsBp4Z3AIZmdwGpgncANNJ3AcBGdwHj2nMB84ZzAKtGcwHzEnMCjupzARtShwIxVoMD7Ep/AjwGewIENncAtRpzAimqbwL1NmsA1YpnAMKWYwIwOmMAsl5fAAjmXwAHvlsDwtJbAgYeWwA1klsBsSJbA7DKWwDMilsA1FZbASAKdwOQtm8AeqZnAdmmYwClcl8BDdZbAU6qVwK3PlMCHs5PA/8KSwNcBksDSZ5HAtu2QwFyNkMCdQZDALQaQwKrXj8Bbs4/AD5ePwAmBj8Dob4/A8piYwPxjlsAhiJTAt/ySwBS4kcBirpDAPc6PwBsLj8DGMY7AoRaNwBAhjMC8W4vATb6KwG5BisDd3onAW5GJwIdUicDqJInAv/+IwMXiiMA4zIjANqGUwJEDksBhxo/A/uKNwNxQjMBiBovAqvmJwNccicChY4jAO5GHwGp3hsDGfIXAPLOEwFkShMCwkoPA4C2DwJXegsBZoILAnW+CwJFJgsDpK4LAbSCRwFUVjsDxbovAeimJwH0+h8CRpYXAKlWEwGRDg8DxZYLAva+BwB3tgMBqrH/A6ax9wFMRfMCUyHrAmMN5wG71eMA3U3jA5NN3wCZwd8BHInfAmheOwEueisA8iofAEtuEwEiNgsCgmoDArPV9wN5Ie8APG3nArFd3wGTtdcCUenTAoGZywM5ccMCfuG7A0WhtwBpebMBTi2vAb+VqwDZjasAq/WnARYOLwBqfh8DzHITA7f+AwOuPfMCX43fA0e5zwFuhcMBl6G3ALbBrwCnkacAyc2jAChJnwP4RZcC/CWPA4FxhwO0FYMBm9V7A8x1ewFN0XcAo71zA+luJwO8ThcBdJ4HAyzh7wNHsdMA4a2/ADK5qwLCpZsAxTmPA7YhgwCRGXsBdcVzAAflawM6eWcCdtFfAh61VwI3+U8BcoFLA8olRwL+tUMBVAFDAR5eHwA71gsCgSn3AyGB1wEQ5bsBc22fADkhiwPN5XcDfZVnANPxVwHgqU8D43FDASf9OwGh/TcAGKEzAl1JKwFZHSMDNm0bAhjhFwCIcRMAfO0PAU1uFwNQ3gcCMHXnAzG5wwFl0aMBPO2HAe8tawG4mVcBMR1DAYiNMwGWrSMALzUXArHRDwPKNQcBrBkDAnLE+wGruPMAU3TrAYC45wMfON8BTrDbAomaBwPK+fcDhsXXAQ1JswF+UY8BtiVvA7D5UwC+9TcBaBkjAHBZDwDziPsDIWzvAqHA4wEQNNsBaHTTADI4ywNo7McAwiy/A9m8twAq9K8DtWyrA0mTzwCBL88BFN/PA8ifzwCAc88ADE/PA/gvzwJUG88BrAvPANv/ywL788sDX+vLAYfnywEH48sBj9/LAuPbywDX28sDQ9fLAgvXywEb18sAY9fLAAELtwL0f7cA8Be3AwPDswPHg7MC/1OzAWMvswBnE7MCEvuzAOLrswOm27MBdtOzAZ7LswOSw7MC7r+zA1q7swCau7MCerezANq3swOas7MCorOzAmB7nwBLx5sDCzebAbrLmwFCd5sADjebAcIDmwL525sBFb+bAhGnmwBVl5sCrYebAC1/mwAVd5sB3W+bARFrmwFhZ5sCiWObAF1jmwKtX5sBYV+bAUP/gwAXD4MAilODAwW/gwJpT4MDYPeDACy3gwBYg4MAYFuDAZQ7gwHYI4MDlA+DAYADgwKv938CW+9/A+/nfwL/438DM99/AEfffwIH238AS9t/ACurawGWa2sBYXNrAFizawKEG2sCk6dnAPdPZwPDB2cCXtNnATarZwF+i2cBDnNnAjpfZwO+T2cAlkdnA/47ZwFiN2cASjNnAGIvZwFeK2cDDidnA5uXUwDB91MBKK9TAd+vTwNK508BJk9PAdHXTwGVe08CXTNPA2j7TwEM008AZLNPAzyXTwPcg08A8HdPAXRrTwCcY08B0FtPAJRXTwCMU08BcE9PAcfvOwJxyzsAKB87A37LNwERxzcA6Ps3AmRbNwOv3zMAz4MzA483MwMG/zMDbtMzAdazMwP2lzMABoczAK53MwDeazMDxl8zAMZbMwNiUzMDOk8zA4zTJwFODyMDi9sfAc4jHwAEyx8CZ7sbAKLrGwG2RxsDjccbAglnGwK1GxsAmOMbA8izGwE8kxsCoHcbAiBjGwJYUxsCMEcbANg/GwGkNxsAGDMbAC57DwKq5wsCeA8LAj3PBwDsCwcB/qcDASGTAwGwuwMCVBMDAL+S/wCLLv8DIt7/A2qi/wFadv8B2lL/AoI2/wFyIv8BNhL/ALoG/wMd+v8DtfL/AzAi+wIUhvcCmN7zAG327wGfpusAqdbrAIRq6wBbTucDOm7nA2HC5wJJPucDYNbnA+CG5wKISucDOBrnAsP24wKr2uMBB8bjAF+24wOLpuMBp57jAbTm4wD6Ft8DxnrbAk6+1wIPwtMAnWbTA+uGzwJyEs8C+O7PABQOzwO7WssDHtLLAXpqywPaFssA3drLAEmqywLZgssB/WbLA8VOywKpPssBfTLLA6oKywJaxscBw+7DAARewwB4ir8CEXq7AesOtwFlJrcCh6azA6Z6swL5krMCCN6zAdxSswF35q8Bt5KvARNSrwM3Hq8AxvqvAyrarwBaxq8CxrKvARgWtwFH6q8AIJKvAJmyqwFSKqcDoj6jAv8enwAApp8Dkq6bAzUmmwDX9pcCVwaXAMpOlwEFvpcB0U6XA+T2lwGQtpcCaIKXAvhalwCYPpcBMCaXA9K+nwHZ8psCubKXAa5GkwAjYo8CA+aLAhvmhwMYsocBLiqDALgqgwLKln8A1V5/AGhqfwI3qnsCzxZ7AMamewCmTnsAogp7ACnWewO1qnsAiY57ACXOiwKcLocDK3J/Am9qewFn6ncCpP53AC2WcwHxfm8AfjprA3+eZwLpkmcDS/ZjAaq2YwM5umMAWPpjAUBiYwBb7l8CA5JfAEdOXwJ7Fl8A/u5fAyoWdwHjKm8D9XZrAHzOZwKc4mMBdX5fAkKOWwBHNlcBGwpTAQeyTwDVCk8D/u5LApFKSwE0AksAqwJHAQY6RwI5nkcCZSZHAczKRwJQgkcDKEpHAXAGZwEbllsCDIpXAfq+TwNOBksClipHAzLuQwOYDkMD3L4/AUCKOwJtHjcC4mYzAaRCMwJSki8BGUIvAlw6LwHnbisDUs4rAI5WKwGt9isAaa4rA+++UwNVpksB0RZDALnuOwIoBjcAtzovAjtaKwL8KisCTXonAW46IwP1/h8CMoIbAyu6FwFhihcAB9ITAtJ2EwHRahMAdJoTAgf2DwBLeg8DFxYPAPliRwCBijsAQ04vAVqaJwHnUh8AhVIbA/RqFwJEehMDzU4PAIayCwKrogcCl24DA2+5/wH+DfsBCZH3AfoJ8wNvRe8AqSHvAAN16wNSJesBxSXrAIDyOwGbUisAS1YfAED2FwO0Hg8BnLoHAi05/wIzQfMDlzXrAKzF5wCDnd8DCdnbALGt0wBiZcsDNJXHAIgBwwDYZb8B5ZG7AjNdtwNxpbcCzFG3AtpiLwD7Ch8BfUYTA00iBwKtPfcB21HjA8hF1wPX1ccAUbG/AXl9twGi6a8AqbGrAOg5pwO8WZ8BYQGXABsVjwNeYYsCvrGHAyfNgwJJjYMBR81/Am2aJwFgohcAnSYHAUJ57wMZ6dcDDJnDAg5prwGPIZ8CCnmTAlghiwKnxX8BSRF7AGe9cwKOdW8BitlnA9eNXwKRhVsDYLlXAYD1UwD+AU8Cx7FLAB5uHwP3+gsBucX3As6F1wIObbsCEZWjAav9iwANiXsAjgFrANkhXwBSmVMDIhFLA7M5QwJdyT8D7KE7AAVFMwPF6SsAQ/EjAkMJHwLLLRsBFCkbAkFyFwC07gcATMHnApZNwwKuyaMBWmmHA4lFbwKLZVcD6KlHANjlNwBTzScCTREfAvxhFwDlaQ8Cn9kHA4rFAwPnnPsCKDT3AnI07wFtUOsADWDnAomaBwE/BfcDQt3XAf2NswFO3Y8A0xVvAyZpUwOA/TsBstUjAavVDwKDzP8AgnzzAFuQ5wJGtN8A85jXAS3s0wAQ5M8CHfzHAc5wvwGUZLsDN4SzAbc/0wF269MA4qvTA3J30wGeU9MAqjfTAoof0wGiD9MAsgPTAtH30wNF79MBhevTAR3n0wHB49MDLd/TATnf0wO529MCldvTAbXb0wEJ29MAhdvTAXKruwAKO7sBBeO7AlWfuwNFa7sALUe7AkknuwNtD7sB9P+7AJzzuwJo57sCnN+7AKjbuwAc17sAoNO7AfjPuwP0y7sCaMu7ATjLuwBQy7sDoMe7AWoLowExc6MALP+jAlyjowGIX6MA0CujAHwDowGj458CB8ufA/+3nwI3q58Dr5+fA6OXnwF7k58Ay4+fATOLnwJ3h58AX4efAseDnwGPg58An4OfAvlviwN0o4sChAeLAdePhwE3M4cCNuuHA9azhwI2i4cCYmuHAgpThwNuP4cBNjOHAlYnhwIKH4cDsheHAtoThwMmD4cAUg+HAioLhwCGC4cDQgeHACTzcwCX428C6w9vATJvbwDN828BVZNvACVLbwAVE28BMOdvAFzHbwNEq28AFJtvAWiLbwI0f28BqHdvAxxvbwIca28CTGdvA2RjbwEoY28DdF9vA8ynWwL/P1cDcidXA41PVwEAq1cA5CtXAo/HUwMre1MBa0NTATcXUwNm81MBittTAcLHUwKmt1MDHqtTAkqjUwOOm1MCZpdTAnqTUwN2j1MBLo9TApy3QwH22z8C4Wc/A0hHPwEjazsBvr87Ad47OwCh1zsDAYc7A4lLOwIFHzsDNPs7AJTjOwA4zzsAqL87AMSzOwOwpzsAwKM7A3CbOwNklzsATJc7ABFHKwKO0ycA1OsnA3trIwPGQyMDSV8jAwSvIwNYJyMDM78fA1NvHwIjMx8DSwMfA3bfHwAOxx8DGq8fAxafHwLakx8BgosfAlqDHwDmfx8AvnsfAsp/EwDTUw8C0M8PA/LXCwA5UwsAXCMLAYc3BwBWgwcA1fcHAbmLBwOVNwcApPsHAHjLBwOcowcDbIcHAdxzBwFkYwcA0FcHAzBLBwPYQwcCPD8HA8AK/wO0gvsBRUL3Arau8wKYqvMAZxrvAGHi7wMc7u8A9DbvAZum6wODNusDEuLrAmKi6wDacusC9krrAfou6wPSFusC4gbrAfH66wAN8usAferrAgSq5wIN+uMDfm7fAIca2wFQdtsD5mLXAyjG1wLfhtMDJo7TA/nO0wC1PtMDnMrTANx20wJkMtMDg/7PAI/azwLHus8AA6bPApuSzwFPhs8DI3rPAx16zwGmgssD087HAQxGxwF42sMBjia/ArQGvwNWXrsCrRa7AHgauwA/VrcBCr63AOJKtwPN7rcDhaq3A0F2twNBTrcAqTK3AUUatwNhBrcBuPq3ADMmtwInTrMB8EKzAEGOrwMSBqsCyoanAgfCowGtlqMDl+KfAnqSnwGpjp8AVMafASQqnwHvspsCd1abAF8SmwKy2psBorKbAjaSmwIyepsD1mabAyWGowGE+p8AsQ6bAanulwKTMpMD+7aPAuQijwEtTosDNxKHAkVWhwCj/oMBJvKDAqoigwNxgoMBGQqDAzyqgwNMYoMANC6DAgwCgwHP4n8BJ8p/AQxCjwES9ocCCoqDAUK6fwNPhnsDDMZ7AgFadwP9rnMBMspvAXiCbwGWumsDTVZrAQxGawFbcmcCEs5nAJJSZwBF8mcCdaZnAe1uZwKpQmcBkSJnAsgiewJhlnMBSEJvAlfiZwMEPmcBIRJjAF5OXwMq7lsAFzJXAAw6VwJt4lMDeA5TAHamTwNdik8CWLJPAuwKTwI/iksDdyZLA8LaSwHGoksBYnZLAyWmZwAVml8CIu5XA1l+UwN1Hk8AkYpLAhKKRwCXxkMBQHpDAPCmPwOFmjsD3zY3AbVaNwHX5jMBysYzA2HmMwPBOjMD1LYzAoxSMwDoBjMBc8ovAEz+VwCTQksALxJDAFRKPwOGvjcBgkozAEq6LwOHxisBcTIrAeH6JwAuEiMBMvYfA1CCHwHSmhsA9R4bAeP2FwIDEhcCHmIXAuHaFwMRchcDeSIXAdJCRwEGvjsBEN4zAxCKKwEFpiMB1AIfAV92FwNL0hMD5OoTA7p6DwMHagsDN3IHAnhGBwI5xgMCa6H/AoCV/wIGOfsDGGX7Arb99wGF6fcAvRX3A+mCOwOYKi8BBIIjAK5+FwDOCg8AOwYHAk1GAwIRRfsAWd3zAWf56wJjNecAfY3jAp2d2wE3IdMDkgHPAjoBywPS4ccA0HnHAoqZwwFdKcMBWA3DAW66LwLPlh8AvhoTAFZKBwLUPfsCzxHnA/DJ2wH5Gc8BI6XDATgVvwJiEbcAuVWzAyvlqwCQSacBaamfAkBtmwE4VZcACSWTAkapjwBwwY8CX0WLAVXGJwPE8hcA+a4HAnAR8wHcJdsCl4nDAcYZswCblaMDy6mXA/YFjwDqUYcB7C2DAetZewP6JXcDmrlvA4AlawJmzWMBVp1fARNZWwBE0VsCstlXAz56HwAIJg8CZmH3ANuN1wIf+bsBt8GjAKrdjwKVJX8CcmFvAiJBYwKgbVsDjI1TABJNSwFBXUcBaFFDAL0ZOwIOgTMBuSUvAEDdKwCRhScAeu0jAzV2FwI0+gcDCQnnA17hwwJDxaMAg+mHADNlbwEaNVsBQDlLAZE1OwEM3S8BLtkjAXLRGwDcbRcCu2EPA0pxCwH/ZQMAFMD/A89o9wNzEPMAB6jvAomaBwKvDfcDKvXXA4HRswJvaY8CJAVzAZPdUwFbDTsD7ZEnAd9REwIADQcAo3z3A7FE7wKdFOcAXpDfAmFo2wPglNcBCbDPAbrwxwGtkMMAHUS/A/yX2wL0U9sCfB/bAqP31wBb29cBY8PXA/ev1wK/o9cAt5vXARuT1wNbi9cC+4fXA6uD1wEng9cDP3/XAc9/1wC3f9cD43vXAz971wLHe9cCa3vXAyv/vwFno78CB1u/A8cjvwKO+78DQtu/A4LDvwF6s78DzqO/AW6bvwGSk78Dnou/AxaHvwOqg78BEoO/Axp/vwGaf78Aen+/A557vwL2e78Cenu/AgtTpwLm06cCBnOnAEorpwA586cBocenAUmnpwC9j6cCHXunA/lrpwFFY6cBIVunAvlTpwJNT6cCwUunABVLpwIJR6cAgUenA1VDpwJxQ6cBxUOnAI6jjwD9948BwXOPAb0PjwGYw48DtIePA7hbjwJUO48A+COPAbwPjwMn/4sAF/eLA7PriwFX54sAg+OLANvfiwIT24sD+9eLAmPXiwEr14sAQ9eLA0X/dwANG3cDHGd3A7/fcwCLe3MB/ytzAkLvcwDew3MCZp9zADqHcwBic3MBUmNzAeZXcwE+T3MCqkdzAbJDcwHqP3MDDjtzAOI7cwM+N3MB/jdzA3GHXwEQU18Cy2NbAGqvWwDeI1sCdbdbAXVnWwPdJ1sBDPtbAYDXWwKEu1sCDKdbAoSXWwK8i1sBzINbAwR7WwHkd1sB/HNbAwxvWwDMb1sDHGtbABlbRwGru0MCHntDALmHQwDcy0MBGDtDA3vLPwADez8Ahzs/AEsLPwOm4z8D1sc/Ar6zPwK6oz8Clpc/AV6PPwJmhz8BGoM/ARZ/PwIKez8Dvnc/AymXLwFLcysDEccrAkh/KwG7gycAVsMnAFYvJwNxuycBfWcnAB0nJwJs8ycArM8nAAizJwJMmycBzIsnAUx/JwPQcycAnG8nAyhnJwMIYycD5F8nAjJzFwJrnxMBcWsTA1OzDwFKYw8BgV8PAoiXDwJD/wsCF4sLAZ8zCwJS7wsDKrsLAFKXCwLSdwsAcmMLA3ZPCwKWQwsA0jsLAWozCwPOKwsDiicLAKvW/wL8bv8AOYr7ABdG9wH5gvcCmCb3A48a8wL2TvMCYbLzAt068wPc3vMCoJrzAgBm8wIIPvMDrB7zAKgK8wMv9u8B7+rvA+Pe7wBD2u8Cf9LvAWhW6wE5vucBvlLjA+dW3wCBBt8CVzbbAYHS2wMovtsA4+7XA/NK1wEW0tcDgnLXAE4u1wIx9tcBFc7XAeGu1wIxltcAOYbXApl21wBBbtcAaWbXAETa0wCyJs8DB4rLAYAeywCBEscBwq7DA2zSwwEPZr8DTkq/A1FyvwH4zr8DuE6/A4vuuwJfprsCv267AH9GuwBnJrsADw67AZb6uwOS6rsA8uK7A1YmuwFqorcAM96zAalCswEd1q8A2rarAqBCqwAGXqcACOanAsfCowEG5qMDPjqjAYm6owK9VqMDjQqjAmTSowL8pqMCBIajAPxuowIEWqMDnEqjABxGpwFn8p8BvFafAsF+mwDO5pcDH3qTA3hGkwGpxo8Cr9KLAPZSiwAhKosAfEaLAj+WhwETEocDmqqHAmJehwOuIocDEfaHATXWhwOBuocAAaqHAx6ujwFlsosDRY6HA932gwMDDn8C8HZ/AeESewK1yncBKzpzAa06cwIfrm8Bmn5vAAWWbwE04m8AiFpvAF/yawEXomsAz2ZrAwM2awA/FmsB2vprA2oqewBn/nMDdv5vAWLqawHDhmcDTI5nA+HyYwN6ml8Ao0JbAzCeWwMSklcBjP5XAUPGUwGq1lMCNh5TAfmSUwMRJlMBsNZTA9CWUwDMalMBGEZTAHdKZwBXml8AEU5bAkA2VwI4JlMAXNJPAcoCSwLHYkcBzBpHAxiqQwGh+j8As+I7ARZCOwDpAjsDMAo7Aw9ONwMuvjcBglI3Af3+NwKBvjcCQY43AbI6VwGU2k8ADQpHAiaePwLVbjsDVUo3A4H+MwErSi8B6MYvAoWOKwPKCicCF0ojADEmIwJbeh8CLjIfAj02HwFUdh8Bw+IbAUNyGwObGhsCdtobAB8mRwKj8jsB0m4zAo56KwKv8iMBgqofADpyGwB/GhcAPG4XAeYWEwMm+g8AJ2YLAgSSCwL+XgcCxKoHAntaAwA6WgMCdZIDAyD6AwPAhgMD6C4DAJIaOwMNBi8C6a4jASwGGwPn7g8BsUoLAkvmAwHDLf8CRFn7AHL98wHOfe8BXMHrAv1p4wF3pdsAxyXXAz+l0wIg9dMAyuXPA2lNzwEYGc8Aey3LAMsSLwHYJiMBbu4TAo9uBwNjPfsAMtHrAnVF3wJuSdMCqX3LAoKFwwJtCb8A3LG7AC9FswH0Aa8CthmnAvl9owAN7Z8CJymbA70JmwBHbZcCNi2XAJ3yJwLtRhcCijYHAoGt8wMmYdsCxnnHAl3FtwKf/acApM2fAzfRkwG8tY8C1xmHArKxgwBlmX8AGnV3AcSFcwKXzWsB5CVrAulRZwM3JWMBcX1jAnqKHwB4Tg8AhwH3ATCV2wENib8D8e2nAI29kwJkwYMD6rlzA0tRZwN2KV8ABulXAbEtUwAItU8BE71HAJDFQwL63TsBVhU3AoJVMwIncS8A4TkvADF+FwPNBgcCbVXnAYt5wwAMxacCfWmLA4WBcwDJBV8AT8VLAnF9PwJp3TMDdIUrAOkdIwMPQRsCCrEXA4XZEwMjBQsDgREHALxVAwNgfP8BUYj7AomaBwAjGfcDQw3XAaIZswDX+Y8BoPlzAtFRVwHtHT8DfFErACrNFwI8RQsCFGz/A07k8wDrVOsC+VjnA7ys4wFz+NsApUDXAoM4zwAOdMsB1qDHAsWn3wJBb98DoUPfA4Ej3wNNC98BEPvfA1jr3wEE498BPNvfA2DT3wL4z98DqMvfASzL3wNMx98B4MffANDH3wAEx98DbMPfAvjD3wKgw98CYMPfASUPxwOkv8cBJIfHAQRbxwPAN8cCsB/HA9ALxwGf/8MC6/PDAt/rwwDP58MAP+PDANPfwwI/28MAS9vDAtfXwwG718MA69fDAEvXwwPT08MDd9PDA1BXrwFH76sBG5+rAJtjqwLzM6sAixOrAp73qwMa46sAZterAVbLqwD+w6sCururAgK3qwJ2s6sDyq+rAcqvqwBGr6sDIqurAkarqwGiq6sBJqurADOXkwOrA5MCDpeTAzZDkwCqB5MBedeTAemzkwMdl5MC7YOTA7lzkwBJa5MDrV+TATFbkwBRV5MApVOTAeFPkwPNS5MCPUuTARFLkwAtS5MDhUeTAs7XewIiE3sA5X97A7ULewIkt3sBiHd7AMxHewAMI3sAYAd7A4fvdwPT33cAA9d3AxvLdwBrx3cDX793A5e7dwC7u3cCl7d3APe3dwPDs3cC17N3As43YwAhL2MBQGNjA0vHXwJ7U18CKvtfA3q3XwEqh18DPl9fAqpDXwEiL18A7h9fALoTXwOKB18AogNfA237XwOB918AkfdfAlnzXwCt818Dbe9fAZnTSwHAa0sC71dHAcaHRwMB50cCjW9HA3kTRwKwz0cCzJtHA6xzRwIwV0cD+D9HA0AvRwKoI0cBMBtHAhATRwCwD0cAqAtHAZwHRwNUA0cBnANHA1nLMwDD6y8CUncvA0FbLwPEgy8AM+MrAA9nKwIvBysDRr8rAcqLKwFyYysDDkMrACovKwLqGysB7g8rACoHKwDR/ysDRfcrAx3zKwP57ysBne8rAEpTGwHnzxcBjd8XAGRjFwEPPxMDNl8TAsW3EwLpNxMCNNcTASiPEwIMVxMAfC8TASwPEwGX9w8D0+MPAnPXDwBjzw8Az8cPAxu/DwLPuw8Dl7cPAcuDAwHQRwMB4bL/A6+y+wO2KvsADQL7A8Qa+wJrbvcC0ur3A0KG9wAOPvcDTgL3AIXa9wBFuvcD+Z73Aa2O9wPpfvcBiXb3Ab1u9wPdZvcDcWL3ATvm6wKRYusAWiLnAsd64wKlbuMDy9rfA66m3wDxvt8CnQrfAzyC3wDMHt8Da87bAQeW2wD7atsDy0bbAscu2wPzGtsBxw7bAxsC2wMS+tsBBvbbAnAi1wLNrtMBvyrPAyfiywPVKssBqxLHA81yxwMwNscB60bDApaOwwNiAsMCBZrDAm1KwwJZDsMBCOLDAuS+wwEspsMBzJLDAzSCwwA8esMD+G7DAZ0evwJZ4rsCa163AnTatwEpkrMD/savA6ierwK69qsBfbKrAZS6qwEz/qcCI26nAdcCpwP+rqcCOnKnA6JCpwCGIqcCEganAiXypwMl4qcD2danA9LypwES3qMBG46fAHj6nwOSdpsBHy6XAfRSlwNaGpMDNGaTAUcajwKmGo8BHVqPAijGjwLcVo8CwAKPA0PCiwNjkosDR26LABdWiwObPosALzKLAKUWkwLIYo8APIaLAXEmhwP+foMAeAKDAXC6fwApznsDH4Z3A6XGdwDkcncDd2pzALqmcwHSDnMDfZpzARFGcwPVAnMCoNJzAYiucwGYknMAjH5zAHwyfwNOWncARbJzArHebwHarmsDb/ZnAkl6ZwBaOmMAwzpfASTmXwIzGlsCgbpbAjCuWwIn4lcDO0ZXAdLSVwESelcCEjZXA4YCVwFp3lcAtcJXAPzqawFRlmMDP6JbAhriVwLTGlMBpAJTAPViTwM65ksDx6pHAbCaRwNSNkMAwGJDAAb6PwCx5j8DSRI/AER2PwO/+jsAo6I7A9NaOwPnJjsAxwI7A992VwH+ck8A6v5HAYzuQwN8Ej8BoD47A2EuNwCGsjMAPEYzAXEWLwCx8isDY34nAQmeJwMcKicArxIjAc46IwKhliMC7RojAWS+IwK8diMBcEIjA7wGSwEZKj8CG/4zA0RmLwJGOicC7UYjAAVeHwGKShsAN9YXAJWWFwLudhMDRz4PAtC+DwCG0gsBQVYLA5gyCwMrVgcDxq4HANIyBwDR0gcAUYoHAmquOwPV4i8But4jAV2OGwB51hMBb4oLAGZ+BwAafgMAzrH/A1HJ+wMJefcDE6HvAYEN6wHv7eMBD/nfA4zt3wGKndsBWNnbAfeB1wFufdcAabnXAPNqLwIQtiMDd8ITAcSWCwOiPf8BBonvAh214wPzZdcD0znPAVDRywGL0cMBJ6m/AWoxuwCnkbMB7lGvAGpFqwObJacCnMWnAur1owLBlaMDeImjAEYeJwLVmhcBOsIHAT9N8wKEod8C7WnLAuFtuwJoXa8DVdmjAvGBmwCy9ZMDudWPAp29iwBEmYcAkgF/A7CpewEYhXcAqVVzAHLlbwD9CW8D451rAdKaHwFAdg8AE6H3A72d2wKnGb8AYCGrALCdlwKMWYcDywl3AwhRbwGjzWMC9RlfADfhVwNvxVMAyuFPAthFSwEC/UMA6r0/AH95OwC4+TsBUxE3ASmCFwF9FgcCdaHnAQgRxwABxacDIu2LASelcwDz1V8AH01PAlW9QwMezTcD9hkvADNFJwMR6SMBScEfAIUJGwHefRMCpSkPAVztCwCRlQcA/wUDAomaBwGXIfcDgyXXAFZhswCIiZMDMe1zArLJVwDjMT8DwxErA6ZBGwIUdQ8DqU0DAfxs+wBJcPMAW/jrATO85wDDHOMAzKjfA39E1wAbDNMCP6jPAqZv4wBiQ+MBxh/jA+ID4wCJ8+MCEePjA0HX4wMtz+MBJcvjAKXH4wFJw+MCxb/jAOW/4wN9u+MCcbvjAam74wEVu+MApbvjAFG74wAVu+MD5bfjA0nXywNFl8sDVWfLA3VDywChK8sAkRfLAZUHywJg+8sCAPPLA8DrywMU58sDmOPLAPzjywMM38sBmN/LAITfywO028sDGNvLAqTbywJM28sCDNvLAJEfswAkx7MB2IOzADRTswMQK7MDRA+zAoP7rwL7668DY9+vArfXrwA/068DZ8uvA8vHrwEXx68DF8OvAZPDrwBzw68Dn7+vAv+/rwKHv68CK7+vAFxPmwKv05cDM3eXApszlwM+/5cAytuXAAq/lwKKp5cCepeXAnqLlwGCg5cCznuXAc53lwIOc5cDRm+XAS5vlwOia5cCdmuXAZprlwDya5cAdmuXAE97fwEu038DZlN/ANH3fwHpr38AzXt/AQ1TfwNRM38BFR9/AHkPfwANA38CxPd/A9jvfwKs638CzOd/A+jjfwHA438AJON/AvDffwIM338BYN9/ApK3ZwG102cBHSdnAzCjZwGAQ2cAP/tjAV/DYwBPm2MBk3tjAptjYwFvU2MAm0djAwc7YwPbM2MCgy9jAoMrYwOHJ2MBTydjA6MjYwJnI2MBdyNjAuIjTwLY608Cu/9LAJ9PSwKKx0sBrmNLAg4XSwFl30sC/bNLA0WTSwOJe0sB0WtLAJFfSwKpU0sDRUtLAcFHSwGhQ0sCiT9LAD0/SwKFO0sBPTtLA53fNwC0OzcDJvczA7IDMwAFTzMBvMMzAbRbMwOsCzMBO9MvAXenLwC7hy8AQ28vAfdbLwBLTy8CE0MvAnM7LwC/Ny8AfzMvAU8vLwLvKy8BKysvA2YXHwIz3xsCyisbA5zfGwDL5xcDgycXAPqbFwG6LxcBSd8XAQGjFwPlcxcCIVMXAOU7FwIFJxcD7RcXAWUPFwGFBxcDpP8XA0D7FwP49xcBhPcXAYr/BwJsBwcBEb8DAQ/+/wAqqv8B8ab/Avzi/wAsUv8Br+L7AsuO+wCvUvsCLyL7A2b++wFi5vsB8tL7A2rC+wCOuvsAcrL7AmKq+wHapvsCeqL7A9NW7wL44u8BhdrrA+t+5wM5sucAhFbnAstK4wIiguMDAerjATl64wPdIuMD5OLjAAC24wAskuMBYHbjAVhi4wJgUuMDMEbjAtQ+4wCYOuMD7DLjARta1wMhGtcDMqrTAB+WzwIpKs8Aq1LLABHqywLA1ssAVArLANduxwO69scD3p7HAgZexwC2LscD0gbHAD3uxwOd1scANcrHAK2+xwAVtscBqa7HAgwGwwBhEr8A4sa7ARxauwFVOrcC5r6zAHzaswHnZq8A6k6vAKF6rwC42q8ARGKvAdwGrwIfwqsDY46rAW9qqwELTqsDzzarA/MmqwAbHqsDPxKrA+GWqwOluqcCMrKjAUBaowF97p8ACs6bAPRCmwGGTpcA0NKXAA+ykwHa1pMBdjKTAZ22kwClWpMC9RKTAsTekwO4tpMChJqTALCGkwBcdpMALGqTAQtykwJfBo8Cr16LAWBCiwHt2ocAi3KDArxOgwLlsn8CR7J7A1YqewKxAnsCfCJ7AYd6dwJG+ncCspp3AwpSdwFiHncBOfZ3AzHWdwC9wncD9a53AYYyfwKIsnsC4FJ3AVTCcwCBwm8BG0prAKzmawO9wmcC9xZjAP0KYwOzdl8DEkZfAMFiXwMosl8AaDJfAjPOWwCPhlsBZ05bAB8mWwE/BlsCKu5bAFqKawKHjmMDGfJfAlWCWwP9+lcBcx5TAlCqUwGSSk8BFy5LAyhuSwOyUkcD3LZHAyd+QwKikkMAVeJDAglaQwEg9kMBdKpDAMRyQwJYRkMCnCZDAoy2WwFkClMCQO5LAfs2QwDyrj8D/x47A3hKOwFl/jcCd6IzAIyOMwFFvi8AH5YrAZ3uKwCorisB37onAsMCJwDaeicBMhInA3nCJwE9iicBqV4nAIzuSwAuYj8BkY43AMJSLwM0eisBh9ojAFA6IwFFZh8ByyIbAfjyGwO54hcC4wITA9DKEwJ/Gg8BKdIPA/DWDwP0Gg8CY44LA/MiCwAe1gsATpoLAWdGOwHSwi8BPA4nAOsWGwIPthMC2cIPABkKCwJBUgcDum4DAmgyAwGwRf8D8mX3AqSB8wBX+esDpH3rA/XZ5wB73eMCklnjA+U14wFMXeMBX7nfAd/CLwNlRiMCtJoXAcW+CwNwngMAXj3zAdYZ5wFkcd8DrNnXASb1zwPGZcsDrm3HAzDxwwOm8bsArk23AZa9swCQCbMDxfmvA7htrwFvRasBAmWrAEpKJwN57hcBB04HAnDt9wOS4d8CYFnPAlkRvwLosbMCvtWnAj8VnwGJDZsAmGWXAqiBkwMHTYsC1VmHAsCVgwDY8X8CKil7A9ANewFueXcDVUV3AUqqHwJgng8BAEH7AHKt2wK0rcMCnlGrAGd9lwIr7YcA/1F7AEFBcwA1VWsAryljA5ZhXwJqhVsBkZlXAXeZTwBW2UsDNxlHAohBRwJaGUMBaHlDAiWGFwNJIgcDIe3nAeCpxwIKxacCPHWPALHJdwD6pWMD1s1TACX1RwIPrTsBs5UzAqVFLwDQZSsAWI0nAj/VHwGZxRsBDQUXAjk9EwMyUQ8A5B0PAomaBwMLKfcD8z3XA6KlswF9GZMCyuVzAQhFWwHdRUMAJdUvA221HwB0nRMALiEHArnY/wN7ZPcATmjzAJKI7wFqAOsCO+TjAOsY3wF3WNsBeFzbA/rz5wIez+cCArPnASqf5wGyj+cCNoPnAbZ75wNmc+cCum/nA0Jr5wCua+cCxmfnAV5n5wBSZ+cDimPnAvZj5wKKY+cCOmPnAf5j5wHSY+cBsmPnAXZjzwCaL88BUgfPACnrzwKF088CecPPApG3zwG9r88DMafPAlmjzwK9n88AFZ/PAhmbzwChm88DjZfPAr2XzwIll88BtZfPAWGXzwEhl88A9ZfPAQWntwNVW7cAiSe3A9T7twGY37cDKMe3AoS3twIsq7cBBKO3AjybtwE0l7cBeJO3ArSPtwCoj7cDJIu3AgSLtwEsi7cAkIu3ABiLtwPEh7cDhIe3A6DLnwE4Z58A6BufACfjmwH7t5sCq5ebA29/mwIvb5sBZ2ObA+tXmwDjU5sDq0ubA89HmwDzR5sC00ObAT9DmwATQ5sDNz+bApM/mwIbP5sBvz+bAZ/ngwOzV4MBvu+DAsKfgwAGZ4MAXjuDA/YXgwPl/4MCDe+DANHjgwL914MDuc+DAlHLgwJRx4MDWcODASnDgwOFv4MCUb+DAW2/gwDBv4MARb+DA8cHawOGQ2sAzbNrA0FDawGU82sA1LdrA7CHawIsZ2sBSE9rAtQ7awEgL2sC+CNrA3AbawHcF2sBuBNrAqgPawBkD2sCtAtrAXQLawCIC2sD2AdrACJPUwHhP1MDMHNTA6fbTwJ3a08CExdPA07XTwCmq08CAodPAEpvTwE2W08DDktPAI5DTwDGO08DAjNPArovTwOOK08BNitPA3YnTwIuJ08BNidPA1nTOwE4YzsCZ0s3ATp7NwDJ3zcD8Wc3ANETNwP8zzcDzJ83AAh/NwF4YzcBwE83AyQ/NwBMNzcARC83AkwnNwHkIzcCnB83ADAfNwJgGzcBDBs3AjXHIwKjzx8BKlMfAb0zHwIAWx8Ao7sbAB9DGwIy5xsDTqMbAZZzGwCqTxsBPjMbAOofGwHSDxsCogMbAlX7GwAt9xsDoe8bAD3vGwG96xsD4ecbArJXCwN3rwcBDasHACgjBwAG+wMBthsDA11zAwMY9wMCZJsDAWhXAwIgIwMAC/7/A8fe/wLLyv8DO7r/A6+u/wMjpv8Ay6L/ABee/wCXmv8CA5b/AH6m8wIsNvMD1XrvAoNm6wId0usBLKLrADe+5wDXEucAzpLnAUIy5wIp6ucBTbbnAgmO5wDlcucDRVrnAzlK5wNRPucCgTbnA/Uu5wMdKucDgSbnA9562wFQZtsAgf7XAvsu0wKZCtMCl2rPAMIyzwENRs8AmJbPAMQSzwJbrssBG2bLAqcuywIzBssALurLAeLSywFawssBGrbLAAKuywFCpssARqLLACriwwMYKsMB5g6/AP+uuwAgzrsAmpq3ANjutwILqrMDgrazAeoCswI5erMA5RazAXjKswFokrMDwGazANRKswHgMrMA2CKzADgWswLcCrMD6AKzAWQmrwBUjqsAjcanAtOeowDZRqMCTlafA3QSnwPaWpsD8Q6bAnwWmwOvWpcAGtKXA9JmlwIyGpcAeeKXAZm2lwHFlpcCJX6XAJ1ulwOdXpcB+VaXAe3ClwLtmpMB1iaPAy9KiwDZGosAvsqHACPSgwHZfoMCO7p/ARpmfwChZn8AgKZ/APgWfwG3qnsB21p7AnseewJa8nsBltJ7AUa6ewM+pnsB3pp7AgAugwGXAnsB4uZ3AvuScwGgwnMCtoJvAFA2bwAFPmsCFtpnAk0KZwPXqmMAQqZjAsHeYwMpSmMA5N5jAsCKYwGsTmMASCJjApf+XwGT5l8DB9JfAiQmbwN1gmcDHDpjAoAWXwF4zlsBUiZXAZ/eUwMJklMAEp5PAkgqTwIuTksCOOZLA2vWRwBzDkcAunZHA2ICRwLxrkcAIXJHAXVCRwLJHkcBEQZHAYX2WwNtnlMDntpLAul2RwK9OkMBcfI/Ap9SOwMpKjsC1uY3AhvyMwBJcjMDq4YvAhIWLwPo/i8DWC4vA3OSKwL3HisALsorA56GKwOiVisD/jIrAmnSSwOjlj8D2xo3AoQ2MwEGtisA3mInAMcGIwOoaiMBwlYfAsguHwPBPhsBqq4XAFS6FwD3PhMDTh4TARVKEwDkqhMBODITAAfaDwGvlg8AW2YPAXveOwDnoi8BNT4nA2yaHwAtlhcBd/YPAOuKCwD4GgsC/XIHAOdmAwMFZgMA5Q3/A7fF9wM7wfMAgLnzAfpt7wH0te8A423rAwZ16wO1vesDWTXrA4gaMwHN2iMDEXIXAk7mCwI6HgMBTen3AJZx6wHZZeMBhl3bAajx1wFozdMAUQXPAo+NxwAeKcMBXgm/AlrpuwBIkbsAfs23AoF5twH8fbcBr8GzAK52JwDWRhcB29oHAd6R9wHhJeMAf0nPA/CtwwMU+bcB472rAFCNpwPm/Z8BrsGbAJMVlwHl4ZMCsH2PAThFiwGBEYcDnqWDA8TVgwC3fX8Banl/ANq6HwPYxg8DUOH7AzO52wEKRcMCQIWvAxJZmwBXfYsCg4l/AfoZdwJqvW8AwRFrA/y1ZwClEWMAwCFfABK9VwCWeVMDyy1PAbi1TwGe2UsBRXVLAyWKFwEtMgcAbj3nAAVFxwIXyacDof2PAcvtdwA5dWcCkk1XAuodSwI4eUMD2PE7AEclMwBisS8Azw0rApJRJwJw3SMCSKEfAr1FGwAuvRcDhNEXAomaBwB/NfcAi1nXA4LtswOxqZMAV+FzAanBWwCDXUMACJUzArklIwBguRcCrt0LALctAwKFOP8C6Kj7AyUI9wF4gPMCJvTrAiqs5wO3VOMATLzjAu876wP3G+sBJwfrAFr36wP65+sC4t/rAC7b6wNC0+sDos/rAPbP6wL+y+sBjsvrAH7L6wO2x+sDIsfrArbH6wJmx+sCKsfrAgLH6wHix+sBysfrA2av0wPCg9MDmmPTA+pL0wJ2O9MBni/TACon0wEyH9MAFhvTAE4X0wGKE9MDgg/TAgIP0wDmD9MAFg/TA34L0wMOC9MCugvTAn4L0wJSC9MCLgvTA+nzuwKJt7sBQYu7A+FnuwNJT7sBLT+7A9kvuwIJJ7sCzR+7AX0buwGVF7sCtRO7AJUTuwMJD7sB4Q+7AQkPuwBtD7sD+Qu7A6ELuwNhC7sDNQu7AJ0XowJ8v6MC2H+jA+RPowFIL6MDyBOjAQADowMv858BA+ufAYPjnwAD358D89efAPfXnwLH058BJ9OfA/fPnwMXz58Cc8+fAfvPnwGjz58BX8+fALAjiwBDq4cDD0+HASMPhwB+34cAnruHAjKfhwK+i4cAan+HAd5zhwIaa4cAZmeHADJjhwEaX4cC0luHASZbhwPqV4cDAleHAlpXhwHaV4cBfleHA6MrbwN6g28C2gdvAoWrbwJFZ28D6TNvAskPbwNw828DSN9vAHTTbwGIx28BfL9vA5S3bwM8s28ACLNvAayvbwPwq28CqKtvAbirbwEIq28AiKtvAd5PVwABZ1cCKLdXAUg3VwHT11MDP49TAydbUwC/N1MAcxtTA5sDUwBC91MA9utTAKbjUwKG21MCBtdTArbTUwBG01MCes9TASrPUwAyz1MDestTAkmnPwK0Yz8BM3M7AZq/OwByOzsBydc7ANmPOwMBVzsDTS87Ag0TOwCA/zsApO87APjjOwBg2zsCDNM7AWTPOwH4yzsDcMc7AZjHOwA8xzsDOMM7A8lbJwLbnyMBClMjA9FXIwJsnyMA8BcjAxevHwO/Yx8AJy8fAyMDHwDu5x8Cqs8fAka/HwI2sx8BVqsfAs6jHwH+nx8CdpsfA9qXHwHylx8AhpcfAr2fDwPrPwsBaXcLAUQfCwBHHwcBDl8HAzHPBwIVZwcAVRsHAuzfBwCctwcBaJcHAnB/BwGEbwcBEGMHA+hXBwEoUwcAME8HAIxLBwHcRwcD4EMHA1na9wLDdvMCPQbzAhcu7wOFyu8CpMLvAYv+6wNDausC3v7rAq6u6wN6cusDzkbrA6Im6wPuDusCef7rAZ3y6wAp6usBNeLrABXe6wBR2usBidbrAn2K3wFLltsA5TbbApKy1wCkztcDk17TArpO0wOhgtMA5O7TATB+0wKEKtMBe+7PAHfCzwNLns8C24bPANt2zwObZs8B217PAqtWzwFjUs8Bg07PA4mqxwI3MsMChTbDAJ7evwBYSr8Ahla7AMzeuwPnwrcCwvK3A4JWtwBx5rcDQY63AF1StwH5IrcDyP63ApjmtwAI1rcCZMa3AFS+twDwtrcDfK63AcairwLbTqsD2MKrAlLCpwEMcqcCscqjANPKnwJWRp8BRSafAfhOnwInrpsDszabA/bemwMunpsDZm6bACpOmwI6MpsDGh6bAQoSmwKuBpsDEf6bAzgGmwLQIpcDTN6TAnpCjwOwOo8BAfaLAF8+hwBJLocC656DAZJ2gwANmoMDiPKDAaB6gwNQHoMAn95/A2uqfwMnhn8Ab25/AL9afwJDSn8Dmz5/AYImgwABSn8A8W57A+5SdwDTsnMCvaJzAetmbwPYnm8BYoJrAPTqawM3tmcDXtJnAh4qZwCxrmcDwU5nAxkKZwB02mcDHLJnA5yWZwNYgmcAcHZnAgXCbwO3cmcC3npjAd6eXwKTjlsBTRJbA172VwHoxlcDUfZTAkfKTwKeJk8AWO5PAgwCTwP/UksC+tJLA15ySwC+LksAnfpLAjHSSwHltksBCaJLAIc2WwO/MlMAkMZPA+uuRwB7vkMBtLJDAupCPwAwQj8BnhI7AKtGNwDRCjcBy1ozAtYWMwH9JjMDAHIzAlfuLwADji8DX0IvAb8OLwI25i8BFsovATK6SwM0zkMAlKo7ACIaMwM45i8AhN4rASnCJwJvWiMAzXIjAB9WHwGQih8Ctj4bABCGGwBLOhcAxkIXAMmKFwBhAhcDRJoXAJBSFwFsGhcAx/ITApR2PwDogjMBam4nAJ4iHwJvbhcAziITAm3+DwAK0gsCKGILA7p+BwIkjgcDdcYDAq7Z/wHbTfsASKX7A6al9wFxLfcBABX3ASdF8wOCqfMCHjnzAfB2MwE6biMAZk4XAywODwPXmgMDAY37AXa57wB2RecAz8HfAsrF2wGvAdcDU03TAzn9zwP1KcsDHYXHAzrJwwCwwcMAEz2/A9YZvwI1Rb8AQKm/AXKiJwLmmhcDsGYLA0w1+wELaeMAljXTAshFxwIFNbsD7I2zAKHlqwOoyacDaO2jAMlpnwC8UZsDY3GTAhu1jwN85Y8Cys2LA4E9iwNMFYsDyzmHAIrKHwGo8g8C/YX7A+jJ3wFn3cMC6rmvAA05nwBHBY8Da7WDA1bdewOYCXcDAtFvAcrdawJ/aWcA3oVjAWmtXwCZ3VsC5vlXA7zRVwGTOVMBOglTACWSFwMpPgcCWonnA3HdxwAI0asDG4mPAAoVewIgQWsDkcVbAbI9TwLBMUcByjU/ANzdOwIczTcCxV0zASytLwNrxScAN/0jAwkFIwEW0R8DxSkfAomaBwH3PfcBU3HXA/s1swMePZMDwNl3AGdBWwBtdUcC31EzALSRJwDwyRsCQ4kPAzxhCwFS6QMAbsD/AAtU+wH6zPcCAdTzALIE7wE3DOsAJMjrA3tH7wInL+8DoxvvAhsP7wA7B+8BAv/vA7r37wPi8+8BEvPvAwLv7wGC7+8Aau/vA57r7wMK6+8CnuvvAk7r7wIS6+8B6uvvAcrr7wGy6+8BouvvAK7H1wCuo9cCWofXAxpz1wEKZ9cCwlvXAz5T1wHCT9cBwkvXAtZH1wCyR9cDJkPXAgJD1wEqQ9cAkkPXAB5D1wPOP9cDjj/XA2I/1wNCP9cDKj/XAGYPvwFJ278D4bO/AIWbvwCFh78B6Xe/AzlrvwNtY78BuV+/AZFbvwKJV78AUVe/ArFTvwGBU78ApVO/AAFTvwONT78DNU+/AvlPvwLJT78CqU+/Af0rpwGU46cAiK+nAbSHpwFMa6cAiFenAVxHpwJIO6cCLDOnAEQvpwPwJ6cAyCenAnwjpwDMI6cDlB+nAqwfpwIEH6cBjB+nATAfpwDwH6cAwB+nA6ArjwF7x4sCa3uLA2dDiwMjG4sBqv+LACLriwBi24sA4s+LAH7HiwJav4sB3ruLApq3iwA2t4sCdrOLATKziwBCs4sDlq+LAxaviwK6r4sCdq+LA5MjcwOak3MByitzAAXfcwMBo3MBRXtzAsFbcwBtR3MAHTdzADErcwN9H3MBIRtzAH0XcwEZE3MCnQ9zAM0PcwN9C3MChQtzAdELcwFNC3MA7QtzAM4rWwKdX1sBnMtbABRfWwOUC1sAk9NXAVunVwHDh1cCo29XAb9fVwFrU1cAY0tXAc9DVwD/P1cBeztXAus3VwELN1cDrzNXAq8zVwHzM1cBazNXAHFbQwHYP0MA028/AsLTPwF6Yz8CNg8/ASnTPwB1pz8DwYM/A9lrPwJdWz8BmU8/AEVHPwF1Pz8AeTs/ANk3PwIxMz8AQTM/AtUvPwHNLz8BDS8/A3zXKwLXTycDBisnAxlTJwPosycC2D8nAMvrIwGvqyMDe3sjAa9bIwDzQyMC4y8jAa8jIwALGyMA/xMjA9sLIwAXCyMBVwcjA1cDIwHjAyMAzwMjAHTXEwMWtw8CESMPAPP3CwIbFwsBunMLANH7CwP1nwsCxV8LAwkvCwAdDwsCkPMLA+jfCwJE0wsATMsLAQTDCwO0uwsD0LcLAPy3CwLoswsBaLMLA5j6+wGupvcD+Hb3An7W8wPxnvMCELrzAHwS8wO7ku8AAzrvALb27wNuwu8DYp7vAQKG7wG+cu8DpmLvAV5a7wHaUu8AWk7vAFpK7wFqRu8DSkLvAOCG4wOWrt8ASF7fAh4e2wAMctsABzLXAwZC1wApltcDeRLXAOC21wNwbtcAmD7XA2QW1wAz/tMAT+rTAcfa0wMnztMDZ8bTAbvC0wGXvtMCk7rTA8RmywGWJscCKErHA+n6wwEnrr8CYfK/ALiqvwCDtrsASwK7A6Z6uwIiGrsCidK7AhmeuwO9drsDrVq7AylGuwApOrsBNS67ATUmuwNdHrsDGRq7ABEWswLCAq8D766rAtHOqwPXhqcATSqnAK9iowFKDqMBxRKjABhaowNvzp8C92qfAS8inwMi6p8DksKfAqamnwF+kp8CCoKfAsJ2nwKCbp8AemqfA/JCmwFCnpcCt4qTAxEmkwDXQo8C8QKPAnqSiwHUvosAk2KHAaZehwJxnocBrRKHAjSqhwIwXocCgCaHAb/+gwPv3oMCJ8qDAje6gwKXroMCF6aDA5gWhwFHhn8Dn+Z7AKECewHWjncC8KJ3A9ZucwI77m8AZg5vARymbwKnmmsB1tZrAOZGawJd2msAFY5rArlSawC9KmsCCQprA5TyawMs4msDMNZrA5tabwLVXmsB6LJnA2EWYwBiPl8Ct+ZbA5H2WwDH0lcByT5XApNOUwEd3lMDAMpTAHQCUwNLak8Bnv5PAQquTwH6ck8CvkZPAyImTwACEk8DGf5PA0hyXwH4xlcArqpPAJHiSwHWMkcCP15DAwEeQwCPPj8BeSI/AyaCOwJUhjsChwo3AJ3yNwBBIjcCwIY3AeQWNwLzwjMCK4YzAataMwEbOjMBTyIzAMeiSwKyBkMDejI7ATP2MwFrEi8AL04rAVBuKwGKNicBuHInA15iIwP7vh8BXbYfAwQuHwErDhsC3jYbAPGaGwDZJhsDfM4bAOySGwMgYhsBnEIbAKkSPwHBYjMBp54nAB+mHwBlRhsAeEYXAExqEwM9dg8BIz4LAmWCCwK3lgcByPYHAR7eAwAJTgMCFCIDA3KJ/wKZRf8DwFX/AB+p+wNjJfsBIsn7ARDSMwGfAiMClyYXAC06DwP1FgcAqS3/A57x8wCHDesBIQXnAJB14wFVBd8CXWnbA6xJ1wGz/c8BrMXPAT5hywAkncsCF03HAG5ZxwPJoccDWR3HApLOJwGm8hcCePYLAond+wCdrecCER3XAh/VxwLlYb8AJU23Ar8drwDScasCZu2nAaOBowFmmZ8DVjWbAQLplwOwcZcB9qGTAnlJkwHYTZMAG5WPAFbaHwPNGg8D9in7An3d3wOddccALPGzAsQRowE2hZMC59WHA5eNfwNZOXsDZG13AYTVcwEBhW8AfMVrAPxpZwPlAWMBWn1fAqydXwGTPVsBzjlbASmWFwFBTgcA6tnnACJ9xwPV1asAbRmTAww5fwITDWsCBTlfA6pNUwLl1UsDB1lDAFpxPwJ6vTsDN303AubhMwEafS8D7xUrA8R9KwPekScA6SknAomaBwNvRfcCR4nXAQOBswO60ZMA+dl3AQTBXwFPjUcAEhE3AKf1JwFMzR8CKCEXAdV9DwPAcQsBTKkHAwltAwPI9P8DNID7Agkc9wBKfPMC3IDzAVsf8wCnC/MBnvvzArrv8wLW5/MBGuPzAPLf8wHy2/MDwtfzAi7X8wEK1/MANtfzA5rT8wMq0/MC2tPzAqLT8wJ20/MCVtPzAkLT8wIy0/MCJtPzAMan2wMSh9sBhnPbAeJj2wKKV9sCUk/bAFpL2wAKR9sA5kPbAqI/2wD+P9sDyjvbAu472wJOO9sB2jvbAYY72wFKO9sBGjvbAPo72wDmO9sA0jvbAY3zwwMBx8MAHavDAbGTwwFtg8MBoXfDARFvwwLdZ8MCYWPDAx1fwwDBX8MDDVvDAc1bwwDpW8MAQVvDA8lXwwNxV8MDMVfDAwFXwwLhV8MCyVfDAl0PqwGI06sBVKerATiHqwHsb6sBBF+rAMBTqwPcR6sBbEOrAMA/qwFcO6sC6DerASA3qwPYM6sC6DOrAjgzqwG8M6sBYDOrASAzqwDwM6sAzDOrAIgLkwHvs48Cy3OPAOdHjwOTI48DXwuPAdL7jwEW748D2uOPASrfjwBS248AztePAkLTjwBm048DEs+PAhrPjwFmz48A4s+PAILPjwA+z48ADs+PAS7zdwH6d3cALh93Aq3bdwMVq3cAgYt3A2lvdwE1X3cD/U93Am1HdwN5P3cCcTt3As03dwApN3cCPTN3ANkzdwPZL3cDHS93ApUvdwI1L3cB7S93AeHfXwMxL18DjK9fAoRTXwKoD18BV99bAX+7WwN/n1sAn49bAu9/WwEDd1sBz29bAJtrWwDTZ1sCE2NbABdjWwKnX1sBm19bANtfWwBPX1sD51tbAhjrRwOH80MCvz9DAqK7QwJSW0MAEhdDAP3jQwPhu0MA9aNDAWmPQwM9f0MA9XdDAYFvQwAZa0MAMWdDAVljQwNNX0MBzV9DALlfQwPxW0MDYVtDAOg7LwLG3ysD5d8rAP0nKwBcnysAvDsrABPzJwM7uycA15cnAPt7JwC/ZycCF1cnA3NLJwO/QycCJz8nAhs7JwMrNycBBzcnA38zJwJfMycBjzMnAu/3EwCOFxMDKK8TA+enDwLS5w8BnlsPAqXzDwOJpw8A5XMPATVLDwBlLw8DfRcPAFELDwFQ/w8BWPcPA5DvDwNg6w8AWOsPAiTnDwCM5w8DZOMPAa/++wH1wvsAi9L3A85e9wAVUvcAuIr3Au/28wCPjvMC+z7zAosG8wGG3vMDwr7zAiaq8wJ6mvMDHo7zAuKG8wDmgvMAkn7zAW568wMqdvMBgnbzAv9q4wNxruMBq3LfARFy3wDj9tsAlt7bAuIO2wBpetsCnQrbAoi62wBAgtsB6FbbAyw22wDcItsArBLbAPAG2wBv/tcCR/bXAcvy1wKP7tcAN+7XAIsWywEpBssAD0rHAdEKxwHq+sMCIXLDASxSwwELfr8B1uK/AJJyvwHyHr8BzeK/Ah22vwJhlr8DWX6/AqVuvwKJYr8BwVq/A2FSvwLFTr8DbUq/A8d6swO0prMAroqvAnzGrwHajqsCeG6rAvbapwE1sqcCjNanAog2pwG/wqMAj26jAocuowFzAqMAtuKjAPbKowO6tqMDOqqjAiqiowOWmqMC1pajA7h2nwKNCpsDriaXANf6kwHaMpMAyAKTAb3SjwJYMo8Drv6LAmIeiwF5eosBGQKLAUiqiwFUaosC2DqLARgaiwCYAosC1+6HAfPihwCb2ocB19KHA+oChwO1toMAClZ/A1+WewCFWnsA+453AUlmdwJjJnMC6XpzAzA+cwMrVm8BRq5vAToybwLF1m8A2ZZvAPFmbwIpQm8A5SpvApUWbwFNCm8DqP5vApTycwB7RmsD8t5nApOCYwGg2mMCSqpfApDaXwGuvlsCrG5bAvq2VwIJclcDJIJXADPWUwBrVlMDPvZTA1ayUwH6glMCHl5TABpGUwE6MlMDhiJTAZmyXwHSVlcDmIZTAIQKTwKYmksBvfpHAufmQwDOHkMABA5DALGuPwCH6jsCMpo7AFGmOwAw8jsAoG47AKwOOwK7xjcD55I3AvduNwAnVjcAs0I3APiKTwHXPkMAJ747AVXONwM5MjMDla4vAO8KKwD4/isBj1YnAXVSJwIi4iMBRRIjAWu6HwBqvh8DAgIfA416HwDBGh8AvNIfAGCeHwJYdh8CvFofA6WqPwNOQjMBpM4rAaEmIwG3FhsAGmIXAkrGEwJoDhMDcgIPANxqDwB2igsAgBILAsIyBwEk0gcA384DAhMOAwKmggMA+h4DAtHSAwDlngMBvXYDAOEuMwLnliMBhAIbARJiDwJKkgcAyGIDAlcd9wF/ve8CSinrA0H55wCS1eMD71HfAj5x2wBqndcBU8XTAeWt0wFMJdMCWwXPARI1zwBlnc8BYS3PAAr+JwETShcCKYYLA0+F+wA78ecAVAXbATNdywD5gcMB/fG7AmQ5twOT7a8DXL2vAPlpqwDguacBgMmjAh3dnwODtZsDpiGbAGD9mwEEJZsD54WXAELqHwJFRg8COtH7Atrx3wNvEccBpyWzAp7powJl/ZcAM+mLAiQphwFaTX8CFeV7A+qddwHbbXMASt1vAqbtawKD7WcAYblnAPwZZwE66WMDogljAi2aFwNxWgcAEynnAgsZxwFi4asDcqWTAnphfwOB1W8BQKVjABZVVwIKZU8DPGFLAtfdQwIkgUMAmWE/AZDxOwCdATcAHfkzAhuxLwLqBS8CbM0vAomaBwDnUfcDZ6HXApvJswGHaZMD6tV3A2JBXwLBpUsDEMk7AdtRKwC4xSMBvKUbABp9EwHl2Q8CHmULACdVBwES/QMDDvz/Apf4+wH9pPsCt+z3ABLD9wMir/cC8qP3Ai6b9wPek/cDUo/3AA6P9wG2i/cABov3As6H9wHuh/cBTof3ANqH9wCGh/cASof3AB6H9wP+g/cD6oP3A9qD9wPOg/cDxoP3AupT3wJqO98AxivfABIf3wLuE98AWg/fA54H3wA2B98BwgPfA/3/3wK5/98B0f/fASn/3wCx/98AWf/fABn/3wPt+98DzfvfA7X73wOl+98DmfvfAk2nxwLlg8cBYWvHAwVXxwHJS8cARUPHAWk7xwB9N8cA8TPHAmUvxwCNL8cDPSvHAkkrxwGZK8cBHSvHAMErxwCBK8cAUSvHADErxwAZK8cABSvHAFDHrwE8k68AaG+vAeBTrwLAP68BADOvAxgnrwP4H68C2BuvAyQXrwCAF68ClBOvATQTrwA4E68DhA+vAwAPrwKkD68CYA+vAiwPrwIMD68B8A+vAY+7kwAnc5MDEzuTAMsXkwE2+5MBWueTAwrXkwDCz5MBVseTAALDkwAuv5MBaruTA263kwICt5MA+reTAD63kwO2s5MDVrOTAw6zkwLas5MCtrOTAhKXewCyL3sAfeN7AWGrewGlg3sBAWd7AF1TewGFQ3sC1Td7AyUvewGZK3sBnSd7AsEjewCxI3sDNR97AiUfewFhH3sA1R97AG0fewAlH3sD8Rt7AilvYwNU12MCDGtjAwgbYwHf418Ap7tfAvObXwGLh18CI3dfAwtrXwMTY18BU19fATNbXwI3V18AF1dfAotTXwFvU18Ao1NfABNTXwOnT18DW09fA7xbSwC7h0cAfutHA0Z3RwFmJ0cCKetHA3G/RwClo0cCeYtHAoF7RwMBb0cCuWdHAMVjRwB9X0cBaVtHAzFXRwGZV0cAdVdHA6FTRwMJU0cCnVNHA/d/LwMaTy8AqXMvAvTPLwHEWy8BAAcvA6/HKwNzmysDj3srAJdnKwALVysAI0srA5M/KwFrOysA+zcrAcszKwN/LysB1y8rAKcvKwPLKysDLysrAW8HFwAZWxcBDB8XAxc3EwPijxMCqhcTAv2/EwOJfxMBwVMTAMEzEwD9GxMD4QcTA5D7EwKw8xMAUO8TA7jnEwBs5xMCDOMTAFTjEwMc3xMCON8TAdrq/wLYyv8Dtw77AlnK+wDE3vsAADL7Aruy9wAXWvcCexb3Aybm9wEKxvcAdq73AsKa9wIGjvcA2ob3AkJ+9wGCevcCFnb3A6Jy9wHecvcAmnL3AO4+5wKQlucANnbjAyCq4wNbWt8CFmbfA6my3wJBMt8AnNbfANiS3wPwXt8AsD7fA0gi3wD8Et8D1ALfAlv62wOL8tsCo+7bAxvq2wCT6tsCv+bbAaWyzwD/0ssA0irLAXwGywJWLscAANbHAu/WwwLHHsMBNprDAIY6wwKN8sMADcLDA6GawwFlgsMCgW7DAOliwwMdVsMAFVLDAwFKwwNdRsMAvUbDAHnatwF7PrMCJU6zAS+mrwI9gq8A056rA9Y2qwLVMqsA3HarAwvqpwNLhqcDEz6nAvMKpwFa5qcCRsqnAsK2pwC6qqcCnp6nA1qWpwIekqcCWo6nAdainwBDZpsB8LabA8K2lwIdDpcBmu6TAbz6kwHrio8A4n6PAQG6jwLZKo8D8MKPAXh6jwOsQo8A5B6PAPQCjwDT7osCV96LA+vSiwBrzosDA8aLAh/qhwCv4oMBlLKDAg4efwDQEn8DNmJ7AlRKewPWRncBAM53A8+2cwHm7nMDVlpzATnycwB1pnMA+W5zAPVGcwAlKnMDYRJzAG0GcwGs+nMB7PJzAqKGcwBJJm8ApQZrAlXeZwGnZmMD9VpjAluqXwLVml8Bd4pbA3ICWwHs5lsB5BZbAtt+VwF7ElcCVsJXASKKVwPiXlcCKkJXAMIuVwFWHlcCPhJXAzbuXwLz4lcA9mJTA3omTwKS9ksBSIZLAY6aRwIM5kcBLuJDALTCQwNPLj8BTgo/AwUyPwNolj8CsCY/ASPWOwIvmjsDq247AQdSOwLzOjsDDyo7AbVyTwBsdkcCWUI/ADOiNwBfTjMCiAYzA6WSLwOLrisAThorAzAeKwNZ7icCWFInA7ciIwMORiMCvaYjAp0yIwKY3iMB2KIjAgh2IwJ0ViMDtD4jA35GPwFrJjMBOf4rANqmIwIE4h8DXHIbACkaFwF2lhMA5LYTAas2DwJlVg8C7xYLAhluCwKgNgsDc1IHAl6uBwLCNgcANeIHAZ2iBwB5dgcD8VIHAWGKMwEILicBEN4bAaeKDwKECgsCgiYDAPs5+wLoVfcD7y3vAztZ6wJwcesAkQXnAXRx4wOtBd8CuoXbAwSx2wMTXdcAsmnXAnG11wF9NdcAfNnXAeMqJwEjohcCshYLAWUx/wNuMesCyuXbA1rZzwOVjccA8oG/A3U1uwBBSbcDal2zA/chrwPOqasBYymnAfyVpwCmtaMCsVWjAQBZowF3oZ8Apx2fAEb6HwEVcg8Bv3n7AOAJ4wCkscsC9Vm3Awm9pwMtbZsCq+mPAoCtiwFzQYMDVzV/Abw9fwNZIXsAAM13AylBcwDunW8BoK1vAWtFawA6QWsDQYFrAzGeFwG9agcD23XnASe5xwCX7asD7DWXAfCJgwHcnXMAkAlnAkpJWwOm3VMCOU1PAIkpSwHeGUcBYxVDAH7ZPwGrUTsBIJ07A4qdNwDNLTcD7B03AomaBwJfWfcAs73XAMQVtwB0AZcAf9l3A0PFXwBvwUsDX4E7A56lLwKIrScAdRUfAdddFwPrGRMDm/UPA8EBDwBw3QsBjUkHA+6VAwOwiQMCLwz/Auoz+wESJ/sDLhv7AB4X+wMWD/sDegv7AOoL+wMSB/sBwgf7ANIH+wAqB/sDrgP7A1YD+wMaA/sC7gP7As4D+wK2A/sCpgP7ApoD+wKSA/sCjgP7AinT4wH1v+MDha/jATGn4wHVn+MAkZvjAM2X4wIhk+MANZPjAtmP4wHdj+MBKY/jAK2P4wBRj+MAEY/jA+GL4wPBi+MDqYvjA5mL4wONi+MDhYvjAXkvywAFE8sC9PvLA+TrywEk48sBdNvLA/jTywAQ08sBRM/LA0TLywHYy8sA0MvLABjLywOUx8sDNMfLAvDHywLAx8sCnMfLAoTHywJ0x8sCaMfLAmRPswOAI7MA1AezAufvrwM3368AB9evAAfPrwJPx68CO8OvA0+/rwE7v68Dv7uvAq+7rwHvu68BY7uvAQO7rwC7u68Ah7uvAGO7rwBLu68AN7uvANdDlwKjA5cCBteXAhq3lwNKn5cC+o+XA1KDlwL+e5cBDneXAM5zlwHGb5cDmmuXAg5rlwD2a5cAKmuXA5pnlwM2Z5cC6meXArZnlwKSZ5cCdmeXA+4TfwHVu38BNXt/AtVLfwGpK38B8RN/AP0DfwDg938AOO9/AgznfwGg438CfN9/ADzffwKg238BfNt/AKjbfwAU238DqNd/A1zXfwMk138DANd/AtTbZwCsW2cDK/tjAA+7YwPvh2MBf2djANtPYwNDO2MCry9jAbMnYwNHH2MCsxtjA2sXYwEXF2MDaxNjAjsTYwFfE2MAwxNjAFcTYwAHE2MDzw9jAfuvSwKe80sDqmtLAq4LSwEZx0sDLZNLA3FvSwHlV0sDoUNLApU3SwFBL0sCmSdLAdkjSwJ1H0sACR9LAk0bSwERG0sALRtLA40XSwMZF0sCyRdLAKqvMwBlozMCZN8zApRTMwIf7y8CA6cvAkdzLwE/Ty8CwzMvA9cfLwJPEy8ApwsvAb8DLwDS/y8BSvsvAsr3LwD+9y8DtvMvAsrzLwIm8y8BrvMvA33/GwHEgxsAR28XA4qjFwLWExcC0asXACljFwKVKxcAPQcXANDrFwE01xcDNMcXATC/FwIMtxcA8LMXAUyvFwK0qxcA2KsXA4SnFwKQpxcB5KcXAvG/AwPPvv8Bbjb/ApkW/wMERv8BZ7L7ActG+wCO+vsBHsL7AXKa+wEOfvsAxmr7AkZa+wPqTvsAhkr7Az5C+wN2PvsAxj77Ato6+wF6OvsAfjr7Atj66wMPZucDXWLnADfO4wPuouMBcc7jAsky4wOMwuMDuHLjAmQ64wFcEuMAA/bfAwfe3wAL0t8BU8bfAa++3wA3ut8AT7bfAYey3wOLrt8CH67fAvg+0wE6is8BVPbPAlLuywI9SssAYBrLAuc6xwMimscAOirHAb3WxwKBmscAFXLHAcFSxwARPscAkS7HAX0ixwGVGscD8RLHA+kOxwEFDscC+QrHAdAquwPlwrcAaAK3AEpuswBUZrMDKrKvA512rwMAkq8CE+6rA2t2qwI/IqsBDuarAUK6qwHqmqsDgoKrA35yqwAOaqsD4l6rAg5aqwHiVqsC6lKrAsi+owGNrp8BUzabA+limwOTzpcAscqXAjwKlwDaxpMBAdqTAs0ukwBUtpMAaF6TAUAekwAL8o8Dr86PAIu6jwADqo8AM56PA8OSjwG7jo8Bb4qPAeXKiwO5+ocCSwKDAkyWgwLKtn8DASJ/AjseewJNUnsC5AJ7A7MOdwAiYncBxeJ3AwmGdwHlRncDNRZ3Acz2dwHs3ncA2M53AKjCdwP0tncBvLJ3A3AWdwH2/m8Dxx5rAXwuawHR4mcDv/pjAopmYwNoZmMBzo5fADE2XwGAOl8Ad4ZbAicCWwCKplsBWmJbAS4yWwK6DlsCFfZbAHXmWwPh1lsC5c5bA+gqYwEVblsAeDZXASw+UwGhRk8AtwJLAQ02SwCDnkcCZaZHAte+QwLaWkMAhVpDAeSeQwOEFkMC/7Y/AbdyPwALQj8Afx4/AxMCPwDm8j8D6uI/As5aTwI9qkcBvsY/AX1uOwCRXjcA6lIzAdwOMwIuTi8AtMovAP7eKwNA5isAr3onAopuJwI1ricDsSInACzCJwC8eicBhEYnANwiJwKkBicD5/IjAB7mPwP0BjcAKy4rAYAiJwEKqh8B/n4bAcdeFwCdDhcB/1ITAy3mEwDIDhMAlgoPAzSODwEXfgsC7rYLAC4qCwGZwgsD9XYLAyVCCwFZHgsCUQILAonmMwP4wicBHbobAbSyEwBlggsDM+YDAvtB/wB02fsCJBX3APCV8wJh2e8CPm3rAFJJ5wN7PeMC8QnjAq9x3wB+Td8BEXnfAUzh3wBodd8CfCXfAA9aJwHX+hcABqoLAJbd/wHcde8A6cXfA/ZN0wItjcsAsvnDAZoVvwNKebsAF9G3AcSdtwI4dbMC0VWvAZcRqwEZbasCBD2rACtlpwPKxacDklWnAGsKHwA1ng8CeCH/AIEh4wMOTcsDu423A4CNqwLs1Z8Bu92TAEkdjwOUFYsDkGGHAyWpgwP+qX8C1pF7Ak9ldwP9DXcC+11zAsolcwJVRXMBNKVzADmmFwAhegcAP8nnAXBZywFc+a8BrcmXARKxgwCnYXMDX2FnAaoxXwNXQVcD5hlTAdJNTwJ7hUsD6JlLABiZRwMFbUMDuwU/Ad1JPwBUCT8BGyE7AomaBwPXYfcCK9XXA4BdtwCEmZcCoNl7AHlNYwH52U8Abjk/AV31MwIciSsB6W0jAughHwIcORsClV0XAdKFEwCSlQ8Bk2ELAiD5CwMfLQcD+eEHAPF7/wGhb/8BnWf/A+1f/wPlW/8BCVv/AwVX/wGVV/8AkVf/A9lT/wNVU/8C+VP/ArlT/wKJU/8CaVP/AlFT/wJBU/8CNVP/Ai1T/wIlU/8CIVP/AWkn5wDBF+cA8QvnAJED5wKg++cCaPfnA2zz5wFQ8+cD0O/nAsDv5wIA7+cBeO/nARjv5wDU7+cAoO/nAIDv5wBo7+cAVO/nAEjv5wBA7+cAPO/nAbyLzwE8c88D2F/PA4RTzwLES88AkEfPACxDzwEQP88C3DvPAUw7zwAwO88DZDfPAtg3zwJ0N88CLDfPAfg3zwHUN88BvDfPAag3zwGcN88BlDfPAvevswL7i7MBa3OzA0tfswJvU7MBU0uzAttDswJHP7MDBzuzALs7swMbN7MB8zezAR83swCLN7MAIzezA9czswOjM7MDfzOzA2MzswNTM7MDQzOzAG6jmwO+a5sCQkebA6YrmwDGG5sDYgubAeIDmwMl+5sCYfebAwHzmwCZ85sC6e+bAbHvmwDZ75sAPe+bA9HrmwOB65sDTeubAyXrmwMJ65sC9eubAHVvgwN5H4MAqOuDAajDgwH4p4MCVJODAGiHgwKEe4MDhHODAoxvgwMIa4MAjGuDAshngwGIZ4MApGeDAARngwOQY4MDQGODAwRjgwLcY4MCwGODASgnawDjt2cA42dnA+8rZwNrA2cCoudnAjrTZwO+w2cBertnAjKzZwEKr2cBYqtnAsqnZwDyp2cDpqNnArqjZwISo2cBnqNnAUqjZwEOo2cA4qNnAY7jTwJqP08B5ctPAtl3TwO5O08BqRNPA8jzTwKU308DjM9PAOTHTwFUv08D+LdPACy3TwF8s08DlK9PAjivTwFEr08AlK9PAByvTwPEq08DhKtPA0G/NwNc0zcCRCs3AXezMwNXWzMCBx8zAmLzMwNm0zMBar8zAc6vMwLCozMC6pszAVqXMwFqkzMCno8zAKaPMwM+izMCPoszAYqLMwEKizMAsoszAMznHwG/kxsBfp8bAmHvGwE1cxsD/RcbAHDbGwM4qxsDHIsbAFB3GwAkZxsArFsbAIxTGwLMSxsCtEcbA9BDGwHEQxsAUEMbA0g/GwKMPxsCCD8bAbh/BwCCowMB3UMDASxHAwPzjv8CZw7/AgKy/wA6cv8BZkL/ACIi/wCKCv8Dyfb/A+nq/wN94v8Bhd7/AU3a/wJN1v8ALdb/AqnS/wGZ0v8A2dL/A9ui6wNaIusCvD7rAGrW5wMtzucDvRLnAbyO5wIsLucCH+rjAae64wM7luMCy37jAXdu4wEvYuMAd1rjAktS4wHrTuMCz0rjAJtK4wMPRuMB80bjAHK+0wINLtMD66rPA93CzwGsTs8Dyz7LAhJ+ywOJ8ssAuZLLAl1KywA9GssAoPbLA1zaywFwyssAuL7LA7SyywFQrssAzKrLAZSmywNQossBsKLLA4puuwLkOrsDqp63AiketwOrMrMBfbKzAsyaswK30q8Dk0KvAXberwDClq8A8mKvACI+rwIGIq8Deg6vAlYCrwEF+q8CafKvAb3urwJp6q8AEeqvAi7SowOn6p8BtaafAXP+mwGOfpsBjJKbAzMClwOR4pcA+RaXASiClwOwFpcAl86TAxOWkwELcpMCC1aTAudCkwFTNpMDryqTANsmkwAHIpMAlx6TAvuiiwEcDosBKUaHAAcCgwKJSoMDA8p/AG3ifwG0Rn8A/x57A8pGewMxrnsCSUJ7ALz2ewF4vnsCNJZ7AlB6ewKIZnsAgFp7ApBOewOARnsCgEJ7AMWmdwE00nMBITJvA/JuawMsSmsBtopnAwUKZwLfImMDjXpjAZBKYwGfbl8AKtJfA8JeXwOyDl8CqdZfAh2uXwFRkl8A5X5fAmluXwAlZl8A2V5fA3lmYwPu8lsB2gJXAWpKUwK3hk8CSWpPAUu+SwOmPksDCFpLAuamRwN1akcAoIpHAjPmQwI3ckMDlx5DAL7mQwLiukMBLp5DABaKQwEiekMChm5DACNGTwMS3kcCFEZDAOs2OwOfYjcCmI43Ahp2MwGY2jMCu2YvAs2KLwGXyisAgoYrAqWaKwMc8isDeHorAjgmKwGD6icCV74nA6ueJwHniicCe3onAXeCPwLM6jcCQFovA02aJwJ0aiMDxH4fAwGWGwPzchcAdd4XAHiGFwPCshMBNOYTAkeWDwE2pg8AefoPARV+DwElJg8ChOYPAfi6DwJUmg8D4IIPAFZGMwOhWicBhpYbARHaEwOe8gsCjaIHAe2eAwHpQf8BWN37AKWp9wI7EfMCi63vAiv16wAlResDT1HnAyXt5wCw8ecDUDnnAie54wI7XeMA9x3jApeGJwMoUhsCFzoLAFBGAwMite8CKJ3jAnW51wBFfc8A91nHATLVwwE/ib8DRQW/AG3duwC6GbcCF1GzAiVRswMP4a8Aut2vAbIhrwCBna8BtT2vAKsaHwOtxg8AaM3/AZ454wJv7csDjcG7A4NZqwEUNaMA38GXAzlxkwN8zY8DRWmLAPLthwJH8YMBQDGDAD1ZfwDXSXsChc17ABjBewNL/XcB93V3AUWqFwKdhgcBPBnrAuD5ywOiBa8Ae12XA3zVhwNWHXcBErVrAboJYwDLkVsASs1XAydNUwNwwVMCufFPA5YtSwA3WUcA9TlHAyOxQwBmnUMBodVDAomaBwFTbfcDz+3XAsyptwGxMZcCPd17AtbRYwML8U8BwOlDAoU5NwL4VS8BwbEnA1DJIwD1NR8CzpkbAW/dFwEIJRcAPUkTA88hDwIpkQ8C6HEPAoRIAwXkRAMGpEADBFhAAwa8PAMFnDwDBNA8AwRAPAMH3DgDB5Q4AwdkOAMHQDgDByg4AwcUOAMHCDgDBwA4Awb8OAMG9DgDBvQ4AwbwOAMG8DgDB2RP6wGoQ+sD/DfrASwz6wBkL+sBCCvrAqgn6wD8J+sD0CPrAwAj6wJsI+sCBCPrAbgj6wGEI+sBYCPrAUgj6wE0I+sBKCPrASAj6wEYI+sBFCPrAaO/zwE/q88C45vPAMuTzwGvi88Ar4fPASuDzwKvf88A83/PA7t7zwLfe88CQ3vPAdd7zwGHe88BU3vPAS97zwETe88A/3vPAPN7zwDre88A43vPAFbrtwIiy7cA3re3AeKntwNWm7cD6pO3ArKPtwMGi7cAcou3AqKHtwFah7cAdoe3A9KDtwNig7cDEoO3AtqDtwKyg7cCloO3AoKDtwJyg7cCaoO3AmXbnwHFr58CRY+fABl7nwB5a58BfV+fAcFXnwBNU58AeU+fAclLnwPlR58CkUefAaFHnwD1R58AgUefAC1HnwPxQ58DyUOfA61DnwOVQ58DiUOfAVyjhwOUX4cBHDOHAFQThwE7+4MA9+uDAYffgwF314MDy8+DA8/LgwEDy4MDB8eDAafHgwCrx4MD+8ODA3/DgwMrw4MC68ODAsPDgwKjw4MCj8ODAnNPawGi72sBOqtrAOJ7awLGV2sCvj9rAdIvawHqI2sBhhtrA6ITawN+D2sAkg9rAoILawESC2sADgtrA1YHawLWB2sCfgdrAj4HawISB2sB8gdrA133UwFha1MA0QdTAbi/UwOAi1MAEGtTAxRPUwGAP1MBIDNTAGgrUwJII1MB+B9TAvAbUwDMG1MDTBdTAkAXUwGAF1MA/BdTAJwXUwBcF1MALBdTABy7OwDX6zcBh1c3ASrvNwNiozcDQm83AnJLNwCGMzcCRh83AWoTNwBeCzcCAgM3AYn/NwJh+zcAKfs3Ap33NwGB9zcAvfc3ADH3NwPR8zcDjfM3AUe3HwBSix8BfbMfAM0bHwCUrx8AEGMfAgArHwPYAx8A8+sbAgPXGwCvyxsDT78bALO7GwAPtxsAy7MbAn+vGwDfrxsDu6sbAu+rGwJfqxsB+6sbAlsfBwDFbwcBRDcHAtNXAwCquwMAjksDAUX7AwFBwwMBsZsDAdF/AwIxawMAYV8DAqVTAwPNSwMC/UcDA5lDAwE5QwMDjT8DAl0/AwGJPwMA9T8DAEI67wCcxu8CJwbrA/XC6wHI3usCFDrrAgvG5wPzcucB8zrnAPsS5wAe9ucDxt7nAXbS5wNmxucATsLnA1K65wPOtucBVrbnA5qy5wJisucBhrLnAh0q1wGnvtMCGk7TAdyG0wDfOs8C3krPAYmizwF5Ks8AiNbPAISazwIcbs8APFLPAzA6zwBgLs8B9CLPApwazwF0Fs8B0BLPA0QOzwF4Ds8ANA7PAWiqvwJ+orsDhSq7AGu+twPx7rcD9Ja3AgOiswL28rMCznazAvoeswDp4rMBDbazAiWWswBdgrMBCXKzAkFmswKpXrMBUVqzAZFWswLtUrMBEVKzAxzapwJaHqMDEAajAI6GnwIBFp8D10abALXmmwKk5psByDKbAXuylwKvVpcCixaXATLqlwE6ypcCtrKXAt6ilwO2lpcD3o6XAlaKlwJ2hpcDuoKXAR12jwDaFosDl3qHAyFahwBDzoMDtl6DAJCSgwIfIn8D0hp/AQFifwB03n8CpH5/AFw+fwGADn8Ae+57ATfWewDTxnsBS7p7AS+yewN3qnsDc6Z7AlMudwHSnnMAQzpvAWCmbwF2omsCBQZrAzOaZwDBzmcCwFJnAA9GYwMygmMCTfpjAWmaYwDxVmMAjSZjAmkCYwJc6mMBcNpjAYTOYwEkxmMDPL5jAa6iYwM8dl8A18pXAABOVwLdulMD98JPAD42TwJ0yk8Cov5LANl6SwGQYksCh5pHATcORwEqqkcCdmJHAHoyRwE6DkcAZfZHAuXiRwKZ1kcB7c5HAZAuUwKwEksDHcJDAjj2PwFRYjsDlr43AhjONwKDUjMAtfIzABgqMwJOli8CQXYvAOCqLwMEFi8Dv64rAr9mKwMnMisCvw4rARr2KwMK4isCVtYrA3geQwHVzjcDSYYvAgMSJwIOJiMAgnofA9fCGwOVyhsAjFYbAEcOFwLFShcAs64TA66CEwPRrhMBURoTArSuEwNcYhMCHC4TAIgKEwIT7g8Da9oPAr6iMwP58icCL3IbA4b+EwP0Yg8AV1oHAaOSAwGQygMBvYX/ApKV+wNIIfsD/M33Arl58wJXFe8BVWHvAtAp7wLTTesDSrHrAV5F6wPN9esBJcHrAXu2JwEUrhsA184LAqUaAwLU9fMCE3HjAlEZ2wFtWdMBk6HLApN1xwK4cccALhXDAYL5vwLvkbsDvRm7ASNZtwDSGbcB2TW3AVyVtwP0IbcD59GzAQcqHwNx8g8DfXX/ABtV4wKFjc8CG/W7AoohrwEbiaMDq5GbAx2xlwGxaZMDCk2PA1/1iwPlBYsD6aGHAW8ZgwDZSYMCh/1/AGMVfwLObX8Bzfl/AlGuFwExlgcC1GnrAW2dywNLFa8AIPGbAOL9hwFw2XsBJf1vAgnRZwPPxV8DM11bARQtWwEF1VcAUw1TAXudTwEBEU8CGzFLAXXdSwP06UsBJEFLAomaBwLLdfcBoAnbAqT1twPtyZcDOuF7AiBZZwNKCVMC55VDAox1OwCgFTMDvd0rAx1VJwDuDSMCn6kfAkUBHwBBjRsCBv0XAi0VFwLztRMB4r0TAOnEAwUhwAMGfbwDBKW8AwdduAMGebgDBdm4AwVpuAMFGbgDBOG4AwS9uAMEobgDBJG4AwSBuAMEebgDBHG4AwRtuAMEbbgDBGm4AwRpuAMEZbgDBp9T6wNPR+sDYz/rAd876wIDN+sDUzPrAW8z6wAfM+sDNy/rApMv6wIfL+sBzy/rAZcv6wFvL+sBVy/rAUMv6wE3L+sBKy/rAScv6wEjL+sBHy/rA4LL0wKOu9MCtq/TAnKn0wCqo9MAop/TAc6b0wPal9MCepfTAYKX0wDal9MAYpfTAA6X0wPSk9MDqpPTA46T0wN6k9MDbpPTA2KT0wNak9MDVpPTALn/uwNh47sBqdO7AUnHuwClv7sCnbe7AmWzuwNxr7sBZa+7A/WruwL1q7sCQau7AcWruwFtq7sBMau7AQWruwDpq7sA1au7AMWruwC9q7sAtau7AKzzowLgy6MAbLOjAfCfowEIk6MAAIujAbSDowFMf6MCPHujABR7owKUd6MBjHejANB3owBMd6MD8HOjA7RzowOEc6MDaHOjA1BzowNEc6MDOHOjAFO3hwAjf4cAv1eHAS87hwHnJ4cAbxuHAwcPhwB3C4cD3wOHAKsDhwJu/4cA3v+HA8r7hwMG+4cCfvuHAh77hwHe+4cBrvuHAY77hwF2+4cBZvuHA/5XbwCOB28CEctvAQ2jbwBZh28ARXNvAkFjbwB1W28BnVNvANVPbwGBS28DLUdvAY1HbwBpR28DoUNvAxFDbwKtQ28CaUNvAjlDbwIZQ28CAUNvAFDzVwDMd1cCCB9XATfjUwKPt1MAs5tTA9ODUwE/d1MDD2tTA+9jUwL3X1MDf1tTARNbUwNjV1MCM1dTAV9XUwDPV1MAZ1dTAB9XUwPrU1MDy1NTA7+XOwGy4zsBamM7A0oHOwAZyzsDyZs7AMV/OwMRZzsD6Vc7AVVPOwHtRzsAxUM7ASk/OwKlOzsA4Ts7A6k3OwLNNzsCNTc7Ack3OwF9NzsBSTc7AOJzIwH1ZyMBIKsjAAwnIwKHxx8A74cfAu9XHwK7Nx8ANyMfAHsTHwF7Bx8Bzv8fAHL7HwCy9x8CFvMfAELzHwL+7x8CGu8fAXrvHwEK7x8Avu8fAR2rCwCUJwsADxMHAFZPBwJlwwcBaWMHAWUfBwG07wcASM8HAPC3BwCcpwcBNJsHATyTBwOsiwcDzIcHARSHBwMwgwcB4IMHAPSDBwBMgwcD3H8HAai28wN3Su8BebrvAzia7wCL0usBo0LrAS7e6wKulusBRmbrAqZC6wJuKusBhhrrAbIO6wFyBusDrf7rA6X66wDV+usC4fbrAYH26wCN9usD4fLrAAuK1wJOOtcD2NLXAD820wAeDtMCXTrTAnCm0wJsPtMBb/bPAkPCzwJnns8BU4bPA8tyzwOPZs8C/17PAQdazwDbVs8B81LPA+tOzwJ/Ts8Bg07PA0LWvwK0+r8DX6K7Aw5CuwEAmrsC32a3Ae6OtwDh9rcBPYq3AbU+twC9CrcDnOK3AajKtwOEtrcC1Kq3AfyitwPMmrcDfJa3AHiWtwJckrcA5JK3AaLapwF4RqcBclqjADz6owCfnp8DWeqfAwSunwLHzpsAgzKbAS7CmwMOcpsARj6bAd4WmwMB+psAOeqbAx3amwHx0psDjcqbAxXGmwP1wpsBycKbAB9CjwK8Eo8BuaKLA5+mhwAqPocA0OKHAmsugwO15oMD/P6DAGhegwFT6n8Ai5p/A+defwAvOn8AZx5/APsKfwNq+n8B7vJ/A1LqfwKy5n8DduJ/A9yyewOIYncAmTZzA9LKbwAU6m8A43JrA8oWawDUZmsDkxJnAD4mZwM5emcASQZnAMSyZwI8dmcBLE5nAHQyZwBgHmcCWA5nAIwGZwG3/mMA7/pjAlPaYwLF9l8BOYpbANpGVwPH3lMBrg5TAiCaUwOrQk8A6ZJPANg2TwG/PksDLo5LAE4WSwIBvksBhYJLAxVWSwFlOksApSZLAiUWSwAFDksA8QZLAvkWUwDpRksAmz5DATayPwGLVjsD2OI7AssWNwBpujcAqGY3AJK2MwF5TjMCbE4zAi+aLwNDGi8CHsIvA56CLwPKVi8BHjovA6oiLwCuFi8CNgovAhS+QwDqsjcDFrIvAWCGKwOP2iMADGojAD3mHwOIEh8B2robAll+GwFz0hcDFl4XA+FWFwHMnhcCvBoXAqu+EwIffhMA21ITASsyEwMDGhMDhwoTAb8CMwDujicC9E4fANwmFwEx0g8AUQoLAGl+BwIG5gMD1QYDAyNd/wJhDf8BydH7Af7V9wLgtfcCxzXzACop8wIFafMAsOXzAzCF8wG4RfMD9BXzAK/mJwOVBhsANGIPAS3yAwCnNfMAJkHnAxBt3wFZJdcCf9HPAfv5ywB1OcsAcv3HAg/1wwDA5cMAirW/ACUpvwDQEb8Ag027AtbBuwJKYbsCsh27AX86HwOOHg8DtiH/A9xt5wMrLc8C/iW/ACjlswKK0acBy1WfA9nZmwJ95ZcDiw2TAPTdkwFh/Y8AWu2LApCpiwGbEYcBSfGHAqUlhwCAmYcA1DWHA12yFwPhogcBAL3rARJBywA4KbMAaoWbAOEhiwKLjXsDJTlzAjWJawA/6WMBO9VfADzpXwEOtVsCm/lXA2DhVwKSmVMAqPVTAyfJTwH6+U8DPmVPAomaBwBHgfcDnCHbAw1BtwM2ZZcBh+l7Ai3hZwJkIVcDZj1HAQOpOwK7wTMDufUvAkHFKwKewScCqI0nAAHxIwAKzR8AYIUfAqbRGwOpnRsDyMUbAOcsAwXPKAMHqyQDBi8kAwUrJAMEcyQDB/MgAwefIAMHXyADBzcgAwcbIAMHByADBvcgAwbvIAMG5yADBuMgAwbfIAMG2yADBtsgAwbbIAMG2yADBXoz7wAiK+8BqiPvAS4f7wISG+8D6hfvAm4X7wFmF+8ArhfvAC4X7wPWE+8DmhPvA24T7wNSE+8DPhPvAy4T7wMmE+8DHhPvAxoT7wMWE+8DFhPvAaW31wONp9cBxZ/XAv2X1wJNk9cDCY/XAMmP1wM5i9cCJYvXAWWL1wDdi9cAgYvXAEGL1wAVi9cD+YfXA+GH1wPVh9cDyYfXA8GH1wO9h9cDuYfXAjDvvwDs278CMMu/A/S/vwDcu78D9LO/AIyzvwIwr78AkK+/A2yrvwKkq78CGKu/AbirvwF0q78BSKu/ASirvwEQq78BAKu/APSrvwDwq78A6Ku/ASfnowErx6MC86+jA4ufowDbl6MBc4+jAFOLowDDh6MCS4OjAJeDowNnf6MCl3+jAgN/owGff6MBW3+jASt/owEHf6MA73+jAN9/owDXf6MAz3+jAvKniwL2d4sBlleLAmo/iwJSL4sDLiOLA3IbiwIWF4sCYhOLA84PiwIGD4sAyg+LA+4LiwNWC4sC7guLAqYLiwJyC4sCTguLAjYLiwImC4sCGguLAylDcwNE+3MBRMtzAnincwJQj3MBkH9zAfBzcwHka3MATGdzAGxjcwHAX3MD5FtzApxbcwG0W3MBGFtzAKxbcwBgW3MAKFtzAARbcwPsV3MD3FdzAWPPVwH7Y1cDJxdXAxrjVwLmv1cBvqdXAE6XVwAyi1cDzn9XAf57VwH6d1cDLnNXAT5zVwPmb1cC+m9XAlZvVwHib1cBkm9XAV5vVwE2b1cBHm9XAq5fPwLhvz8DOU8/AW0DPwNMyz8BpKc/A3yLPwFYez8AxG8/AAhnPwH8Xz8BzFs/AuRXPwDkVz8DfFM/AohTPwHcUz8BZFM/ARBTPwDYUz8AsFM/A8UXJwMwKycBS4cjAVsTIwCOwyMAVosjATZjIwIKRyMDMjMjAh4nIwEOHyMCxhcjAmoTIwNmDyMBTg8jA9oLIwLaCyMCKgsjAa4LIwFWCyMBHgsjA+gjDwAKywsCtdMLAp0nCwJYrwsCfFsLACAjCwOL9wcDV9sHA8fHBwIzuwcAy7MHAkOrBwG/pwcCm6MHAHOjBwLvnwcB558HASufBwCrnwcAU58HA1ce8wEVwvMA1FrzAqta7wBKqu8DlirvAKXW7wAhmu8CCW7vAMlS7wB5Pu8CZS7vAKUm7wHhHu8BMRrvAfEW7wOtEu8CIRLvAQkS7wBJEu8DxQ7vAl3W2wMQntsDy0LXAwXO1wPYxtcDHA7XAe+O0wPXMtMBIvbTAYLK0wMuqtMCJpbTA46G0wFuftMCanbTAY5y0wIubtMD2mrTAjpq0wEeatMAVmrTAOz6wwOrQr8DOga/AFiyvwLbLrsCkh67A1leuwGU2rsATH67A1w6uwIsDrsCw+63APfatwHbyrcDX763ABu6twMPsrcDk663ASeutwN7qrcCU6q3AoDOqwDSYqcA6J6nAYNaowGSCqMAEH6jAoNinwCqnp8CQhKfAbGynwJ5bp8DtT6fAy0enwCZCp8A8PqfAhjunwKQ5p8BWOKfAbzenwM82p8BgNqfAyUCkwKCBo8AT7qLAZHmiwDUmosDP06HAd26hwLQlocCQ8qDAxM6gwMu1oMBnpKDAT5igwOWPoMANiqDAAIagwDGDoMA/gaDA5X+gwPZ+oMBQfqDATI2ewI6IncC8yZzAajmcwCLIm8CZcpvAliCbwL26msCQb5rAszqawLEVmsDc+5nA4OmZwF3dmcCp1JnAns6ZwG3KmcCFx5nAgcWZwBvEmcAkw5nATkSZwJTcl8C10JbA9QyWwPV9lcACEpXAyruUwFVqlMBrBJTAx7aTwCeAk8DmWZPAMj+TwJgsk8CpH5PAqBaTwGgQk8ATDJPAEQmTwPwGk8CKBZPADoCUwGOdksCULJHAaxmQwAxQj8Ddvo7AEVSOwJsCjsDfsY3A/0uNwNX7jMBow4zA4JuMwEaAjMAMbYzArV+MwF5WjMDoT4zAbEuMwFBIjMApRozATleQwPrkjcBc94vATX2KwLNiicCSk4jAEP6HwPGSh8BAQ4fALfeGwOKRhsAiP4bA3ASGwAbchcCAv4XAoauFwM+dhcAwlIXAgo2FwOCIhcCphYXAVNiMwJvJicDwSofAPFKFwMXOg8CSrILAiteBwJc9gcBvz4DAWICAwM05gMDZrH/ADgJ/wLiJfsBbNX7AbPp9wFrRfcDJtH3A56B9wBiTfcCEiX3ADgWKwKlYhsAKPYPA8rGAwAtcfcD9QXrAFO53wPA3dsDs+nTA8xd0wM12c8D773LA0DNywJiDccBeB3HAP7BwwF5zcMDwSHDAaytwwOAWcMCcCHDAhNKHwP2Sg8BAtH/AM2N5wAY0dMB6FXDA++dswD6EasC7wWjAXHtnwIyRZsBf62XAeWdlwHy0ZMBcA2TAJINjwC8pY8BO6mLAer5iwPqfYsDBimLAG26FwKpsgcDxQ3rAcLlywJdObMBJBmfAytBiwIyPX8CoG13AfUxbwIT8WcCrC1nAU2BYwF/cV8ALMlfARoBWwG79VcCOoFXAn19VwFkyVcDYElXAomaBwHDifcBxD3bA/mNtwODAZcBCPF/AsdpZwAKOVcC1OFLAW7RPwDvYTcBofkzAVoZLwKvVSsB1UUrA3a1JwCj5SMCPdkjArxZIwKLTR8DgpEfA5iABwUUgAcHWHwHBih8BwVUfAcExHwHBGB8BwQcfAcH7HgHB8x4Bwe4eAcHqHgHB5x4BweUeAcHkHgHB4x4BweMeAcHiHgHB4h4BweIeAcHiHgHBijv8wJ05/MBKOPzAYTf8wME2/MBSNvzABzb8wNI1/MCvNfzAljX8wIU1/MB5NfzAcTX8wGw1/MBoNfzAZTX8wGQ1/MBiNfzAYjX8wGE1/MBhNfzAiB/2wJoc9sCVGvbAMhn2wD4Y9sCWF/bAIhf2wNIW9sCcFvbAdhb2wFwW9sBLFvbAPhb2wDYW9sAwFvbALBb2wCkW9sAoFvbAJhb2wCUW9sAlFvbAru/vwDjr78An6O/ACubvwJbk78CW4+/A5uLvwG3i78Aa4u/A4eHvwLnh78Ce4e/AjOHvwH/h78B24e/AcOHvwGzh78Bp4e/AZ+HvwGbh78Bl4e/AaK7pwKOn6cD5ounAw5/pwI6d6cAJnOnA/ZrpwEWa6cDGmenAb5npwDOZ6cAKmenA7pjpwNqY6cDNmOnAxJjpwL2Y6cC5mOnAtpjpwLSY6cCzmOnAtV7jwHdU48BlTePAhkjjwCtF48DdQuPARkHjwC9A48BuP+PA6j7jwI8+48BRPuPAJj7jwAg+48D0PePA5j3jwNw948DVPePA0T3jwM4948DMPePAUQTdwNX03MAm6tzAxuLcwLHd3MAx2tzAydfcwCHW3MD91NzANdTcwKvT3MBM09zAC9PcwN7S3MC/0tzAqtLcwJvS3MCR0tzAitLcwIXS3MCC0tzA5qPWwI6M1sBtfNbAS3HWwJxp1sBQZNbAq2DWwCle1sBvXNbAP1vWwG5a1sDeWdbAe1nWwDdZ1sAIWdbA6FjWwNJY1sDDWNbAuVjWwLFY1sCsWNbAZEPQwFcg0MANCNDARPfPwK/rz8Cv48/ALN7PwGHaz8DE18/A+NXPwLzUz8Di08/ATNPPwObSz8Cf0s/AbtLPwE3Sz8A20s/AJtLPwBvSz8AT0s/AjerJwCi2ycC8kcnAfnjJwAtnycAAW8nAr1LJwPRMycACScnAS0bJwGxEycAjQ8nAQULJwKVBycA6QcnA8UDJwL5AycCbQMnAg0DJwHNAycBoQMnApqPDwNVVw8B1H8PApPnCwG/fwsBQzcLAzcDCwCq4wsA2ssLAHa7CwEqrwsBZqcLABKjCwBinwsB3psLACKbCwLulwsCGpcLAYqXCwEmlwsA4pcLABV69wL0JvcAXubzAs4C8wHpZvMBIPrzAeiu8wH8evMCIFbzAWg+8wBkLvMArCLzAJwa8wMQEvMDQA7zAKAO8wLUCvMBlArzALwK8wAkCvMDvAbzAUQW3wM28tsAaabbAkxW2wCXbtcB8srXAS5a1wMuCtcBUdbXACGy1wJ9ltcA1YbXALF61wBVctcCkWrXAp1m1wPlYtcCBWLXAL1i1wPZXtcDPV7XAoMOwwGBfsMCiFbDA2cKvwGVsr8DkL6/AxQWvwI/orsBa1K7AZsauwMO8rsAetq7Ai7GuwGSursA5rK7AvKquwLWprsABqa7AhKiuwC+orsD0p67AfK2qwBccqsBntKnAgmmpwO8XqcCDvqjA5H+owEhUqMAINqjAGSGowKUSqMCqCKjAyAGowAr9p8DG+afAh/enwPz1p8Ds9KfAMfSnwLDzp8BY86fAlK+kwHr7o8B0cKPARQWjwBm5osAxaaLAvQyiwPfLocDWnqHAhX+hwNlpocDhWqHAjVChwGtJocCCRKHAIUGhwM0+ocA0PaHAGjyhwFg7ocDTOqHAhuyewGz2ncApQ53ApLycwLlSnMBZBJzAPbabwMhXm8DOFJvAH+aawLfFmsBKr5rAzJ+awBqVmsC5jZrAo4iawCOFmsC7gprAE4GawO9/msAmf5rAi5GZwGs6mMBfPZfAOoaWwN4AlsDJnJXAyUyVwJD/lMA6oJTA/1qUwLkqlMA0CZTAAPKTwPjhk8Dn1pPARM+TwAHKk8BixpPA5MOTwC3Ck8D/wJPASrqUwBvpksADiZHA3ISQwEzIj8CaQY/Akt6OwKmSjsDtRY7AkuaNwAmfjcAhbY3AeEqNwHgyjcDiIY3AcBaNwIkOjcAYCY3AWAWNwMQCjcD+AI3ANH+QwK4djsCMQYzAUtiKwOfMicDJConA/H+IwC8diMC/04fAhoqHwDwrh8BV4YbAwa2GwOyJhsAacYbA81+GwB1UhsDwS4bAT0aGwG5ChsDDP4bAXPCMwBvwicAcgofA45qFwFwohMCEFYPAs02CwKm+gcA0WYHAjhCBwA/NgMCPboDAPCKAwODZf8DMj3/Aelx/wAE5f8CHIH/Ang9/wPkDf8D0+37ABxGKwI9vhsAnYoPAmOeAwEfqfcBI8nrAbL14wBwid8BQ+3XAHSp1wPGWdMAqFnTArWFzwAvEcsDtVXLAXglywFHUccCkr3HAVZZxwNqEccDOeHHAsNaHwCueg8DW33/As6p5wEicdMCgoHDAXZVtwAFRa8C5qWnA+XlowEyiZ8BsCmfAo45mwJvhZcDfQWXAINBkwASBZMAvSmTARiRkwBsKZMAJ+GPAX2+FwGJwgcDHWHrA3eJywGaTbMCGa2fA2VhjwP85YMDP5V3AQzJcwFL5WsD6GlrAQX5ZwMMCWcCSXVjA6b1XwN5IV8Ah91bAd75WwEiXVsA6fFbAo2aBwM/kfcAGFnbAXXdtwDLoZcBqfl/A7zxawPkSVsA14FLA23tQwMC7TsBeeU3ALJRMwHTyS8CldkvA99dKwI81SsB3wEnAB2xJwHkxScD6CEnAh3IBwQNyAcGpcQHBbHEBwUJxAcElcQHBEnEBwQRxAcH7cAHB9XABwfFwAcHucAHB7HABwepwAcHqcAHB6XABwehwAcHocAHB6HABwehwAcHocAHBruL8wBjh/MAD4PzARt/8wMXe/MBs3vzAMN78wAfe/MDr3fzA2N38wMvd/MDC3fzAvN38wLjd/MC13fzAs938wLLd/MCx3fzAsN38wLDd/MCv3fzAu8n2wEvH9sChxfbAfsT2wLjD9sAww/bA1ML2wJTC9sBpwvbATML2wDjC9sAqwvbAIcL2wBrC9sAWwvbAE8L2wBHC9sAQwvbAD8L2wA7C9sAOwvbACpzwwE2Y8MC+lfDAAJTwwM+S8MD/kfDAcJHwwA+R8MDNkPDAoJDwwIGQ8MBskPDAXpDwwFSQ8MBNkPDASZDwwEaQ8MBDkPDAQpDwwEGQ8MBAkPDA9FvqwDlW6sBPUurAok/qwM5N6sCPTOrAtUvqwCBL6sC7SurAdUrqwEZK6sAmSurAEErqwAFK6sD2SerA70nqwOpJ6sDnSerA5UnqwONJ6sDiSerAYAzkwKID5MCk/ePAjPnjwMD248DX9OPAifPjwKXy48AK8uPAn/HjwFfx48Al8ePABPHjwOzw48Dd8OPA0vDjwMvw48DG8OPAwvDjwMDw48C+8OPA5rDdwJGj3cBwmt3ALpTdwOiP3cD8jN3A/ordwKGJ3cCziN3AEIjdwKGH3cBWh93AIofdwP+G3cDnht3A1obdwMuG3cDDht3AvobdwLqG3cC4ht3A/E3XwLM518DMK9fARyLXwMEb18BLF9fAPxTXwCsS18C/ENfAxw/XwB0P18CpDtfAWg7XwCQO18AADtfA5w3XwNUN18DKDdfAwg3XwLwN18C5DdfAR+nQwInK0MBptdDA7abQwAOd0MA3ltDAkpHQwGWO0MA7jNDAwIrQwL2J0MAMidDAlIjQwEGI0MAJiNDA44fQwMmH0MC3h9DAq4fQwKKH0MCdh9DAH4rKwLxbysDDO8rAySXKwLcWysBmDMrAVAXKwH4AysAx/cnA7/rJwGX5ycBY+MnAoPfJwCP3ycDN9snAkvbJwGv2ycBP9snAPfbJwDD2ycAn9snARTrEwLL0w8CCxMPASaPDwHOMw8DKfMPAEHLDwLZqw8CwZcPAQGLDwOhfw8BOXsPANl3DwHdcw8D0W8PAm1vDwF9bw8A1W8PAGVvDwAZbw8D4WsPAAfC9wEKfvcAUV73AEiW9wJQCvcDe6rzAmtq8wHbPvMDUx7zAnMK8wAq/vMCbvLzA8bq8wM65vMAHubzAgLi8wCO4vMDkt7zAube8wJy3vMCIt7zAPZG3wL5Nt8Bm/bbAlbK2wLl+tsDxWrbAV0K2wHYxtsDmJbbA+h22wI4YtsDaFLbAUxK2wJkQtsBrD7bAnQ62wBAOtsCwDbbAbg22wEINtsAjDbbAAEaxwB3qsMBxpbDA2VWwwFkIsMCa0q/Aga2vwP6Tr8B9gq/AgHavwEhur8CpaK/A0WSvwDJir8BnYK/ALl+vwFher8DGXa/AYl2vwB5dr8DwXK/ANySrwAqdqsDtParAKPipwJapqcBcWanAsCGpwEH7qMDQ4KjAq86owD3CqMC5uajA5bOowOmvqMAxrajAVauowBCqqMAyqajAm6iowDSoqMDtp6jAghylwOFypMD576PAlI2jwMNGo8B4+aLAdaaiwNNsosAFRaLAoimiwNUWosD0CaLAIQGiwBf7ocD29qHAJPShwDfyocDm8KHAAfChwGTvocD57qHAmUqfwHZinsAUup3AqjydwNLZnMACkpzAN0acwFzwm8C4tJvAhIubwCdvm8CvW5vAWE6bwDVFm8DzPpvArDqbwMA3m8DBNZvAZDSbwHYzm8DTMpvAQd6ZwCmXmMBEqJfABP2WwLOAlsBNI5bAb9mVwKqPlcCqN5XA+PmUwFTPlMD5sZTA0J2UwACQlMCKhpTAD4CUwKF7lMCbeJTAiXaUwCB1lMAqdJTAbfSUwFY0k8Bo5JHAmO6QwCE+kMAWwY/ALmWPwI8ej8D41Y7A4HyOwBQ9jsD2EI7AlfKNwLjdjcBrz43AoMWNwOq+jcBUuo3AMreNwA61jcCYs43ANKeQwE1WjsBLi4zAWjKLwHY1isCkf4nA2v6IwHCjiMACYIjAfxmIwGrAh8B0fofA01CHwGUxh8DOG4fAAQ2HwN4Ch8Dt+4bALveGwO/zhsC48YbAhQiNwLcWisA5uYfAI+OFwASBhMDhfIPAkcGCwLs8gsBW34HAnpyBwKJbgcCgAoHAcr6AwESPgMDAboDAaliAwBpJgMCdPoDAbTeAwIMygMAoL4DAFB2KwJaGhsBih4PANB2BwMZ3fsDQoHvAuYl5wNIHeMDW9XbAGjV2wJiudcBGM3XAmId0wK/6c8AfmXPA31VzwKgnc8D4B3PARfJywGXjcsA62XLA5NqHwGypg8DWBYDAcfJ5wIIEdcAcK3HAGEFuwNgabMBhjWrA13JpwPyraMA8IWjAH6tnwJkGZ8C/dmbA5RFmwFrMZcCOnGXAxntlwFNlZcDwVWXAo3CFwCF0gcDBbXrAiQxzwHXYbMDF0GfAUeBjwOXiYMAnrV7A0xNdwH/wW8BWI1vADJRawG0gWsA1gVnAdvFYwDyJWMBVQVjA5w9YwP7tV8DF1lfAo2aBwC7nfcCnHHbA3YptwMIPZsDUwF/AN59awGqXVsBAhlPArEBRwC+bT8DSbk7AK5tNwDIHTcBnk0zAMvpLwDFoS8B1/0rAILVKwAKCSsDwXkrAWsABwe+/AcGlvwHBdL8BwVK/AcE8vwHBLL8BwSK/AcEbvwHBFr8BwRO/AcERvwHBD78BwQ6/AcENvwHBDb8BwQ2/AcEMvwHBDL8BwQy/AcEMvwHBRoL9wPiA/cAVgP3Ae3/9wBN//cDNfv3AnX79wH1+/cBnfv3AWH79wE5+/cBHfv3AQn79wD9+/cA9fv3APH79wDt+/cA6fv3AOn79wDl+/cA5fv3AeWz3wHJq98ATaffAJGj3wINn98AWZ/fAzGb3wJlm98B3ZvfAYGb3wFFm98BGZvfAP2b3wDpm98A3ZvfANWb3wDNm98AyZvfAMWb3wDFm98AxZvfAEEHxwO098cDNO/HAXDrxwGI58cC4OPHARjjxwPg38cDDN/HAoDfxwIc38cB3N/HAbDfxwGQ38cBfN/HAXDfxwFk38cBYN/HAVzfxwFY38cBWN/HAVgLrwHz96sAz+urA+PfqwHb26sBv9erAvvTqwEb06sD08+rAvfPqwJfz6sB+8+rAbfPqwGHz6sBZ8+rAVPPqwFDz6sBO8+rATPPqwEvz6sBK8+rAHLPkwKWr5MCSpuTAIaPkwMyg5MA3n+TAJZ7kwGud5MDtnOTAmJzkwF6c5MA3nOTAHJzkwAqc5MD+m+TA9pvkwPCb5MDtm+TA6pvkwOib5MDnm+TA3FbewGFL3sCUQ97ARj7ewK063sA9ON7AljbewHc13sC1NN7AMTTewNgz3sCcM97AczPewFcz3sBEM97AODPewC8z3sApM97AJTPewCIz3sAhM97A3vHXwD/g18BD1NfAHszXwJXG18DUwtfASMDXwI6+18BjvdfAmLzXwA+818Cyu9fAc7vXwEi718Aru9fAF7vXwAq718ABu9fA+7rXwPe618D0utfAg4nRwI5u0cAwXNHAsU/RwDVH0cBvQdHAhT3RwN060cAROdHA2DfRwAU30cB2NtHAFDbRwNM10cCmNdHAiDXRwHM10cBmNdHAXDXRwFY10cBSNdHAwSTLwLT7ysCl38rAhczKwIK/ysCstsrAqbDKwJWsysDRqcrA8afKwKymysDQpcrAO6XKwNakysCRpMrAY6TKwEOkysAupMrAH6TKwBakysAPpMrA28zEwK6OxMAAZMTA00bEwO8yxMBmJcTANBzEwPMVxMC1EcTA1A7EwOEMxMCPC8TAqgrEwA4KxMClCcTAXgnEwC4JxMANCcTA9wjEwOgIxMDdCMTAjn2+wNEwvsBE8L3A7sO9wJ2lvcDykL3A4YK9wFJ5vcDTcr3AaW69wGxrvcBlab3ABWi9wBdnvcB1Zr3ACGa9wL5lvcCMZb3AamW9wFNlvcBDZb3AbRm4wJrat8DTjbfA20q3wNgct8Bf/bbA6Oe2wE3ZtsBgz7bAn8i2wAvEtsDvwLbA1L62wGe9tsBvvLbAx7u2wFa7tsAJu7bA1bq2wLG6tsCZurbAXMWxwC5xscBLMbHAEeWwwKOfsMDqb7DAQk+wwP04sMDUKbDAhh+wwIUYsMDDE7DAihCwwFoOsMDfDLDA3QuwwC8LsMC5CrDAaQqwwDMKsMAOCrDAKpirwA8bq8Daw6rA6oKqwI43qsCf76nAJ76pwEucqcAxhanAeHWpwMhqqcCEY6nAlF6pwDxbqcD3WKnAbVepwGNWqcCuVanAM1WpwOFUqcCoVKnA44alwMfnpMClbKTAXBKkwGzQo8AphqPArDujwGwIo8BU5aLAYs2iwBS9osD/saLAdqqiwFilosDgoaLAhp+iwO2dosDZnKLAHZyiwJ6bosBIm6LAfKefwKXMnsCPLp7ArrmdwHhdncCUGp3An9GcwISEnMBxT5zAFiucwEYSnMBgAZzA4/WbwBXum8DH6JvALuWbwL3im8AW4ZvA99+bwDXfm8Cx3pvAZSqawMXymMBeEZjAUnGXwGv9lsDWpZbABGKWwIwalsDFypXA0pOVwCxulcB4VJXA9kKVwA83lcD4LpXAeSmVwL8llcA4I5XAgSGVwFgglcCOH5XAbC6VwAp/k8C4PpLAmFaRwIqxkMCEPZDAP+iPwFimj8DkYI/A7w6PwBLWjsAXr47AeJSOwFeCjsACdo7AoW2OwPBnjsATZI7AdGGOwK5fjsB6Xo7ASs+QwNCOjsCN1IzAXIuLwFicisAk8onAsXqJwCUmicAS6IjAlqSIwHBRiMCaFojAQe6HwLLSh8Drv4fAJrOHwHmqh8CTpIfAk6CHwNydh8AGnIfAzyCNwGo9isBB8IfA8SqGwLPYhMCg4oPAIjODwNa3gsDlYYLAnySCwMHlgcCgkoHAxFWBwAMsgcB8D4HADPyAwNPugMDX5YDAu9+AwJbbgMDH2IDANSmKwL2dhsC3rIPAwVKBwHYEf8CBTXzA6FJ6wA7peMCJ6nfADTl3wCO+dsD1R3bAk6V1wLAndcBK0XTAPZZ0wP5tdMCeUnTABEB0wF0zdMDIKnTAHt+HwMG0g8DgG4DAZjp6wKdsdcDdtHHAFOtuwLDhbMCtbGvAAGZqwLyuacAFMGnAT79owKIjaMAlomfAxUhnwKoLZ8AC4mbAq8VmwGmyZsBQpWbA6HGFwOV3gcDfgnrAcjZzwL4dbcD6NWjAH2dkwCaKYcCecV/AJ/FdwBXiXMDcJFzA5qFbwCQ0W8D1nFrASxtawNi+WcCef1nAglRZwCw3WcA+I1nAo2aBwI7pfcBSI3bAf55twIw3ZsB5A2DAfgFbwEQbV8DAKlTAugJSwIF2UMDMXk/Ab5tOwBgUTsC/p03ApBRNwHmRTMDTM0zAavJLwM3FS8Bxp0vAmgoCwUIKAsEHCgLB3wkCwcQJAsGyCQLBpgkCwZ4JAsGYCQLBlQkCwZIJAsGRCQLBkAkCwY8JAsGOCQLBjgkCwY4JAsGOCQLBjQkCwY0JAsGNCQLBxBr+wLEZ/sD3GP7Aehj+wCcY/sDuF/7AyBf+wK8X/sCeF/7Akhf+wIoX/sCFF/7Aghf+wH8X/sB+F/7AfRf+wHwX/sB7F/7Aexf+wHsX/sB7F/7AMAj4wIAG+MBeBfjAmwT4wBgE+MDAA/jAhAP4wFwD+MBCA/jAMAP4wCMD+MAbA/jAFgP4wBID+MAQA/jADgP4wA0D+MAMA/jADAP4wAsD+MALA/jAKt/xwInc8cDE2vHAk9nxwMbY8cA82PHA39fxwKHX8cB31/HAW9fxwEjX8cA71/HAM9fxwC3X8cAp1/HAJtfxwCXX8cAj1/HAI9fxwCLX8cAi1/HA76HrwNWd68ATm+vAN5nrwPiX68Ahl+vAkJbrwC+W68DtlevAwZXrwKSV68CQlevAgpXrwHmV68BzlevAb5XrwG2V68BrlevAapXrwGmV68BolevAQlPlwONM5cCXSOXAs0XlwMFD5cByQuXAkEHlwPlA5cCTQOXATkDlwCBA5cABQOXA7D/lwN4/5cDVP+XAzz/lwMo/5cDHP+XAxT/lwMQ/5cDDP+XAgfbewJ7s3sD05d7AdeHewG/e3sBm3N7AB9vewBva3sB92d7AEtnewMrY3sCa2N7AetjewGTY3sBV2N7AS9jewEXY3sBA2N7APdjewDvY3sA62N7AzI/YwH6A2MAqdtjAM2/YwIFq2MBXZ9jAN2XYwMhj2MDSYtjALGLYwL1h2MByYdjAQGHYwB5h2MAHYdjA+GDYwO1g2MDmYNjA4mDYwN9g2MDdYNjASCTSwKcM0sCv/NHA6PHRwKTq0cC95dHAceLRwDng0cC63tHAud3RwAzd0cCY3NHAStzRwBXc0cDy29HA2tvRwMrb0cC/29HAuNvRwLPb0cCw29HAkLrLwD+Wy8CifcvA/WzLwMJhy8AwWsvAFFXLwKRRy8BTT8vAxU3LwLlMy8AFTMvAi0vLwDpLy8ADS8vA3krLwMVKy8C1SsvAqkrLwKJKy8CdSsvAbVvFwOYjxcAc/sTAfuTEwCzTxMB6x8TAmL/EwEe6xMCytsTASbTEwKqyxMCTscTA17DEwFmwxMAEsMTAy6/EwKWvxMCLr8TAea/EwG6vxMBmr8TAoQa/wHG+vsC9hL7AdF2+wNFCvsDOML7ApCS+wHEcvsDpFr7ALxO+wK0QvsD9Dr7A2w2+wBgNvsCUDL7APAy+wAEMvsDZC77Avgu+wKwLvsCgC77A8p24wAFjuMBlGrjAe963wK21t8AAmrfASIe3wKV6t8AfcrfAX2y3wH9ot8DkZbfAI2S3wPVit8AqYrfAomG3wEZht8AIYbfA32C3wMNgt8CwYLfAu0GywKT0scAvubHAg3CxwFkyscD+B7HAQuuwwNHXsMCxyrDA18GwwN67sMDYt7DAI7WwwFCzsMAXsrDARLGwwLawsMBXsLDAFrCwwOuvsMDOr7DA4gmswCmWq8A9RqvA2QmrwNXBqsBggarAcFWqwJ83qsBxI6rA0RWqwKIMqsBuBqrAQQKqwHH/qcCN/anAR/ypwGz7qcDZ+qnAdvqpwDP6qcAH+qnAWe+lwAxapcB65qTArJOkwFVWpMBBD6TAdMyjwOWeo8D4f6PACmujwOdco8BeU6PA8EyjwJpIo8CvRaPAuUOjwGdCo8CDQaPA60CjwIRAo8A/QKPAJQOgwPM0n8CZoJ7AJjOewLjdncB3n53AhVmdwFIUncAb5ZzAC8WcwFavnMCtoJzAypacwB6QnMCfi5zAmIicwI+GnMAwhZzARYScwKaDnMA7g5zA7XWawDRNmcCmeJjAA+OXwMt2l8AKJZfA5uWWwEGhlsCYWZbAriiWwHQHlsD08JXAweGVwIDXlcCW0JXA7MuVwMnIlcCsxpXAQMWVwEzElcCnw5XAQmiVwC3Jk8Drl5LA1ryRwIkikcCStpDAtGeQwCsqkMD65o/AzJyPwCNqj8C1R4/AZDCPwKMgj8ADFo/A2A6PwAIKj8DBBo/AkQSPwBgDj8AaAo/AcPeQwDDHjsBJHY3ATeOLwIYBi8BHYorAjPOJwGClicC9a4nAqiqJwFneiMDlqYjAO4aIwBNuiMDAXYjAvFKIwE9LiMBMRojA7UKIwKhAiMAhP4jANzmNwDBkisArJ4jAQ3KGwF4vhcC7RoTAZaKDwAEwg8Ds4ILAW6iCwB5sgsCZHoLATOiBwF7DgcBYqoHAbpmBwASOgcBShoHAIYGBwKJ9gcBIe4HAazWKwAK1hsAh0oPANoiBwEOQf8BG+HzA7Rh7wMzFecB62XjAGTZ4wHvFd8BLVHfArLt2wERLdsDK/nXA9Mp1wOqndcBEkHXAUoB1wJB1dcBSbnXAX+OHwCjAg8AJMoDAioJ6wKrUdcDOPXLAP5NvwHqlbcCaR2zAglNrwK6qasD/NmrATMtpwHM4acBExGjAF3VowGo/aMAfG2jAoAJowBzyZ8D35mfALnOFwLB7gcAhmHrAlmBzwDpjbcAXm2jAMe1kwLAvYsAlM2DAOcpewB/OXcCsH13ABqhcwNE/XMC4sFvA+jtbwAXqWsBxslrA24xawHxzWsBhYlrAo2aBwO3rfcAIKnbAQrJtwJBfZsBVRmDAuGNbwHOeV8ChzVTA9cFSwK9NUcBXSVDAF5VPwFgZT8CVsk7ANidOwIKxTcDiXU3AVyRNwGv9TMAk40zAfVECwTVRAsEFUQLB5VACwdBQAsHCUALBuFACwbJQAsGtUALBq1ACwalQAsGnUALBp1ACwaZQAsGmUALBpVACwaVQAsGlUALBpVACwaVQAsGlUALBk6z+wK+r/sAYq/7Asqr+wG+q/sBCqv7AI6r+wA+q/sACqv7A+an+wPOp/sDvqf7A7Kn+wOup/sDpqf7A6an+wOip/sDoqf7A6Kn+wOep/sDnqf7ARp34wN+b+MDwmvjAUJr4wOWZ+MCemfjAb5n4wE+Z+MA6mfjALJn4wCKZ+MAcmfjAGJn4wBWZ+MATmfjAEpn4wBGZ+MARmfjAEJn4wBCZ+MAQmfjAunbywIV08sAMc/LAEXLywGhx8sD4cPLArXDywHtw8sBacPLARHDywDVw8sArcPLAJHDywCBw8sAdcPLAG3DywBpw8sAZcPLAGHDywBhw8sAYcPLAHzvswKY37MBVNezAyTPswMEy7MAQMuzAmjHswEwx7MAXMezA9DDswN0w7MDNMOzAwzDswLww7MC3MOzAtDDswLIw7MCxMOzAsDDswK8w7MCvMOzAKO3lwLjn5cAV5OXAp+HlwAfg5cDy3uXAOd7lwL3d5cBr3eXANN3lwA/d5cD33OXA5tzlwNvc5cDU3OXAz9zlwMzc5cDK3OXAyNzlwMfc5cDH3OXAIZDfwJ+H38Dtgd/AHn7fwJJ738Dfed/AvXjfwPt338B5d9/AI3ffwOl238DDdt/AqXbfwJh238CNdt/AhXbfwIB238B8dt/AenbfwHl238B4dt/AByjZwLsa2cDVEdnA4QvZwOUH2cA8BdnAdQPZwEUC2cB6AdnA8wDZwJgA2cBcANnANADZwBkA2cAHANnA+//YwPP/2MDu/9jA6v/YwOj/2MDm/9jAxrnSwBKl0sAwl9LA5Y3SwK2H0sCEg9LAvIDSwOF+0sCkfdLA0HzSwEJ80sDke9LApXvSwHt70sBfe9LATHvSwEB70sA3e9LAMnvSwC570sAse9LAqkvMwI0rzMD3FczAfAfMwMv9y8BP98vA9/LLwBHwy8Ah7svA1uzLwPnry8Bl68vAA+vLwMHqy8CV6svAeOrLwGTqy8BX6svAT+rLwEnqy8BF6svACebFwHa0xcAEk8XAiHzFwHNtxcBaY8XAmFzFwBJYxcAMVcXAB1PFwK5RxcDIUMXALlDFwMhPxcCDT8XAVU/FwDdPxcAjT8XAFU/FwAxPxcAGT8XA8Yu/wCtIv8CdFL/A0fG+wGvavsC5yr7ANcC+wC25vsB3tL7AUbG+wDevvsDQrb7A4Ky+wECsvsDWq77Ajqu+wF+rvsA/q77AKqu+wByrvsASq77A3h65wFznuMAko7jAkW24wGVJuMAQMbjAvSC4wM8VuMB+DrjAmAm4wFIGuMAiBLjArAK4wLMBuMAMAbjAnQC4wFMAuMAiALjAAQC4wOr/t8Dc/7fAIruywJJ0ssCvPLLANPixwJPAscAAm7HAuIGxwMFwscBlZbHAyl2xwLNYscBLVbHABlOxwIFRscB+ULHA0U+xwF1PscAQT7HA3U6xwLpOscCjTrHAXHmswF0OrMAoxavA+IyrwHFIq8C2DqvAtOeqwHPNqsDVu6rAB7CqwCKoqsDYoqrATp+qwPKcqsBem6rAUZqqwJ2ZqsAlmarA1ZiqwJ+YqsB8mKrA9lWmwO3JpcB9XaXAkxGlwIzYpMDClKTA4likwGgwpMAoFaTA3gKkwJ32o8Bq7qPA7OijwEDlo8DM4qPAKeGjwBHgo8BW36PA2t6jwIbeo8BP3qPAi12gwF+bn8AuEJ/ATqmewJ9ansC8IJ7A6t2dwNefncDcdZ3Al1mdwJxGncDkOZ3AYTGdwK8rncDfJ53AUyWdwKAjncB+Ip3AvCGdwDohncDkIJ3Az8CawG+mmcAa3pjAPVKYwDjtl8D3oJfAO2aXwIskl8A35JbAsLiWwF+blsCvh5bAfXqWwKhxlsC/a5bAy2eWwCZllsBjY5bANWKWwGxhlsDmYJbA5aGVwLYSlMD275LATiGSwB+RkcCdLJHAwOOQwJWpkMAsaZDAhyaQwGr5j8AE24/AmcaPwOq4j8DBr4/An6mPwIWlj8DIoo/A86CPwLqfj8Dqno/Aox+RwGX/jsB1ZY3AJTqMwP1ki8AQ0IrAcWmKwDIhisA+64nAOqyJwDRnicB1OInA8xiJwMcDicCW9YjAF+yIwLvliMB64YjAot6IwL3ciMB424jAvFGNwAeLisDyXYjAEbmGwP6EhcAsqYTAXQ+EwEilg8B6XIPAIiiDwKntgsCYpoLAKnaCwINVgsCRP4LA2zCCwAEngsBqIILAAByCwA4ZgsAWF4LAtEGKwGTMhsCe94PAjr2BwI0NgMANoX3Au9t7wA+eesC7wnnAZCx5wNfEeMAnWXjA+Ml3wKVld8D5IXfAffR2wPzVdsCQwXbA5rN2wMCqdsCjpHbAqOeHwKPLg8BNSIDA18p6wH48dsDexXLAhjlwwCtmbsAoHm3AbjtswPafa8BhNmvAWc9qwDhFasBS3WnANpdpwBNoacB1SGnASjNpwCAlacCkG2nAc3SFwIF/gcCGrXrA8YpzwOKobcAQAGnAdXJlwG/TYsCv8WDACZ9fwK+0XsDqE17AoqZdwIBDXcDDvFzAulNcwBoLXMBD2lvAf7lbwI6jW8DglFvAo2aBwEzufcDJMHbAJsZtwMuHZsBhiWDA2MVbwOggWMDQblXAT35TwLggUsCCLlHARIhQwCgXUMC9tU/AHjJPwJrITsD0fU7AWktOwGYpTsCpEk7ANpUCwfuUAsHUlALBu5QCwamUAsGelALBl5QCwZKUAsGOlALBjJQCwYuUAsGKlALBiZQCwYmUAsGIlALBiJQCwYiUAsGIlALBiJQCwYiUAsGIlALBFDj/wFg3/8DcNv/Aijb/wFM2/8AvNv/AFzb/wAg2/8D9Nf/A9jX/wPI1/8DvNf/A7TX/wOs1/8DqNf/A6jX/wOk1/8DpNf/A6TX/wOk1/8DpNf/AHCz5wPIq+cAsKvnAqSn5wFMp+cAZKfnA8yj5wNoo+cDJKPnAvij5wLco+cCyKPnAryj5wK0o+cCrKPnAqij5wKoo+cCpKPnAqSj5wKko+cCpKPnAHQjzwEMG88AKBfPAOgTzwLAD88BVA/PAGAPzwPAC88DVAvPAxALzwLgC88CxAvPAqwLzwKgC88CmAvPApALzwKMC88CjAvPAogLzwKIC88CiAvPAO87swEzL7MBayezAEMjswDXH7MCkxuzARMbswAXG7MDbxezAv8XswKzF7MCgxezAmMXswJPF7MCPxezAjcXswIvF7MCKxezAicXswInF7MCJxezAIYHmwH185sBoeebAXXfmwAN25sAddebAhXTmwCB05sDdc+bAsXPmwJRz5sCBc+bAdHPmwGtz5sBmc+bAYnPmwF9z5sBec+bAXXPmwFxz5sBbc+bABiTgwLMc4MDWF+DAmxTgwHcS4MAMEeDAGxDgwHwP4MASD+DAzA7gwJ4O4MB/DuDAaw7gwF0O4MBUDuDATg7gwEoO4MBIDuDARg7gwEUO4MBEDuDAzLrZwEGv2cCWp9nAf6LZwB2f2cDgnNnAZJvZwGia2cDBmdnAUpnZwAmZ2cDYmNnAuJjZwKOY2cCVmNnAjJjZwIWY2cCBmNnAfpjZwH2Y2cB8mNnAMErTwAw408D8K9PA+SPTwKYe08AeG9PAxhjTwDkX08AxFtPAgxXTwA8V08DDFNPAkBTTwG4U08BYFNPASRTTwD8U08A5FNPANRTTwDIU08AwFNPAMtjMwM67zMDgqMzASJzMwOuTzMBdjszArIrMwDqIzMCbhszAiIXMwNKEzMBZhMzACYTMwNWDzMCxg8zAmoPMwIuDzMCBg8zAeoPMwHWDzMByg8zAu2zGwH9AxsDoIsbALQ/GwAsCxsBS+cXAiPPFwK/vxcAi7cXAcevFwFLqxcCU6cXAFunFwMPoxcCM6MXAZ+jFwE/oxcA/6MXANOjFwC3oxcAo6MXAPg3AwAzOv8ABoL/AMYG/wKVsv8D5Xr/A4lW/wNpPv8DYS7/AL0m/wGxHv8BCRr/AfEW/wPhEv8CiRL/AaES/wEJEv8ApRL/AGES/wA1Ev8AFRL/AR5y5wAhoucAaKLnAOPi4wCrYuMDIwrjAjbS4wBiruMDRpLjApKC4wOCduMALnLjA05q4wAWauMB9mbjAIpm4wOaYuMC/mLjApJi4wJOYuMCImLjAmzGzwArxssB0vLLAMHyywG1KssAbKbLA3xKywBIEssA8+rHAtPOxwF3vscB87LHAlOqxwFDpscB66LHA7OexwI7nscBP57HAJuexwAvnscD55rHAluaswLWDrMCrQKzAzwuswGnLq8C7l6vAHHWrwAFeq8CfTqvAZkSrwJ09q8AZOavAGzarwCA0q8DPMqvA8DGrwF0xq8D7MKvAujCrwI8wq8BzMKvAtbqmwFo3psC00aXAIoylwBhXpcCyFqXADuGkwBu9pMAbpaTAIJWkwIGKpMB0g6TAxH6kwKh7pMCYeaTAOnikwFN3pMC5dqTAVHakwBB2pMDkdaTAqbagwNP/n8A3fZ/AZxyfwD/UnsBynp7A0l6ewCsnnsDbAZ7A8OidwFjYncBQzZ3A/cWdwB/BncDkvZ3AwLudwFW6ncBkuZ3AxbidwFu4ncAVuJ3ABAubwG/+mcC3QZnA9r6YwL9gmMCsGZjAFOOXwG6kl8C1apfA/kOXwCIql8DpGJfAdQ2XwNoFl8DMAJfAcv2WwDn7lsDA+ZbAxviWwCD4lsCz95bAUNuVwJxblMDURpPA/IOSwFL9kcDJn5HAflyRwJQlkcAL6JDAM6yQwAuEkMA2aZDAVleQwHNLkMCPQ5DAUD6QwNU6kMCGOJDA/zaQwPs1kMBPNZDA30eRwGk3j8AKrY3A24+MwLnGi8CDO4vAb9yKwKaZisBnZorAGSqKwBLsicBuwonAmaaJwA2UicC4h4nAh3+JwBZ6icB5donAFHSJwH5yicBwcYnAXWqNwOmxisCNlIjAUf+GwIrZhcDvCYXADHqEwLIXhMC11IPAI6SDwPNqg8CsKoPAgP+CwKPigsBmz4LAmsKCwBq6gsB1tILAtrCCwDqugsCUrILAEU6KwOHjhsApHYTAwvKBwHZSgMDGR37ASZt8wNtxe8BhpnrAFhx6wJK8ecCRVHnAlNB4wBR3eMA4O3jAUBN4wMT4d8Ah53fAa9t3wKTTd8B8znfA9+uHwC/Xg8CtXoDARhN7wBekdsD8THPA2d1wwLcjb8Ba8G3A2B1twLmObMAyLmzABcxrwE5Ka8CL7WrAfK9qwBmGasCRamrARlhqwCBMasAPRGrAunWFwFiDgcAOw3rAg7VzwLDubcDZZGnA2vZlwFN1Y8AwrWHAl29gwNWVX8C4AV/A8J1ewHA/XsAzwV3AxWJdwG8iXcCG91zA+dpcwADIXMBnu1zAo2aBwIDwfcCUN3bAKtptwDuwZsCXzGDA0ydcwJCiWMA9DlbAvDdUwJrvUsBcDlLAF3VRwLwNUcBKsVDAjDVQwOfWT8BglE/A4mdPwEZKT8CZNk/A89UCwcPVAsGk1QLBj9UCwYHVAsF41QLBc9UCwW/VAsFs1QLBatUCwWnVAsFp1QLBaNUCwWjVAsFo1QLBZ9UCwWfVAsFn1QLBZ9UCwWfVAsFn1QLBo73/wAm9/8CkvP/AYbz/wDW8/8AYvP/ABbz/wPm7/8Dwu//A67v/wOe7/8Dlu//A5Lv/wOO7/8Diu//A4bv/wOG7/8Dhu//A4bv/wOG7/8Dhu//AC7X5wBS0+cBxs/nABbP5wL+y+cCRsvnAcrL5wF6y+cBRsvnASLL5wEOy+cA/svnAPbL5wDuy+cA6svnAObL5wDmy+cA4svnAOLL5wDiy+cA4svnAqZPzwByS88AXkfPAa5DzwPqP88Cwj/PAf4/zwF+P88BKj/PAPI/zwDOP88Atj/PAKY/zwCaP88Alj/PAJI/zwCOP88Aij/PAIo/zwCKP88Aij/PAl1vtwBxZ7cB6V+3AZ1btwLJV7cA7Ve3A7VTtwLpU7cCYVO3AglTtwHNU7cBpVO3AY1TtwF9U7cBcVO3AWlTtwFlU7cBZVO3AWFTtwFhU7cBXVO3AeA/nwIIL58DmCOfALwfnwA4G58BQBefA0wTnwIEE58BLBOfAJwTnwBAE58ABBOfA9wPnwPAD58DsA+fA6QPnwOcD58DmA+fA5QPnwOQD58DkA+fAdbLgwCis4MAAqODAQ6XgwHaj4MBHouDAgKHgwP2g4MCmoODAbqDgwEig4MAwoODAIKDgwBWg4MAOoODACqDgwAeg4MAFoODAA6DgwAOg4MACoODAWUjawFM+2sC5N9rAXjPawIAw2sCdLtrAYC3awI8s2sAFLNrAqyvawG8r2sBIK9rALyvawB4r2sATK9rADCvawAcr2sAEK9rAASvawAAr2sD/KtrAttXTwNPF08BXu9PAbrTTwOGv08DhrNPA56rTwJup08DAqNPAMajTwNKn08CUp9PAa6fTwFCn08A/p9PAM6fTwCun08Amp9PAI6fTwCGn08Afp9PASWDNwDJHzcCaNs3ApivNwG4kzcCsH83AihzNwHoazcAfGc3AOhjNwKQXzcBBF83AABfNwNYWzcC6Fs3ApxbNwJsWzcCTFs3AjhbNwIoWzcCIFs3Al+/GwCLIxsD1rcbAppzGwDiRxsCwicbAuYTGwHSBxsBNf8bA4n3GwPR8xsBXfMbA8HvGwKx7xsB/e8bAYnvGwE97xsBCe8bAOnvGwDR7xsAxe8bA+orAwCVQwMALJ8DAxAvAwLr5v8DR7b/A9uW/wMrgv8Bg3b/AItu/wKjZv8Cv2L/ADNi/wKDXv8Ba17/AK9e/wA3Xv8D41r/A69a/wOPWv8Dd1r/AQha6wOPkucBYqbnAkH65wCpiucBgT7nA+UK5wMs6ucBnNbnA2jG5wIMvucD5LbnA9iy5wEwsucDcK7nAkiu5wGIrucBCK7nALSu5wCArucAWK7nAMKWzwCFqs8CjOLPAg/yywAXQssB6srLA7Z6ywASSssCBibLA5YOywDKAssDDfbLAKXyywBt7ssBqerLA9nmywKl5ssB3ebLAVXmywEB5ssAxebLAkFGtwDn2rMDbuKzAKYeswMlKrMCLHKzA1P2rwH/pq8AR3KvAN9OrwGHNq8CIyavAAMerwFXFq8A9xKvAhcOrwAvDq8C8wqvAh8KrwGXCq8BOwqvAlh2nwLShpsAnQ6bAbAOmwIfRpcAdlaXAFGWlwClFpcAGMKXAESKlwN0YpcDMEqXAzA6lwCoMpcBuCqXASwmlwIsIpcANCKXAugelwIMHpcBfB6XAdw6hwEpioMCe55/AzoyfwKdKn8CiGJ/ASNyewGeqnsBAiZ7AS3OewMpknsA5W57A7FSewMNQnsAHTp7AOkyewApLnsBDSp7AwEmewGpJnsAxSZ7AglSbwC1VmsB8o5nA9SiZwFLRmMA4j5jAgVyYwPAgmMAr7ZfAv8qXwPGzl8DgpJfA8JqXwGOUl8ASkJfAOo2XwFuLl8AgipfAUYmXwMmIl8BviJfAehSWwNejlMB8nJPA4OSSwCdnksAiEJLAk9GRwDeekcCdY5HA5y2RwCwKkcB/8pDA2eKQwIfYkMC50ZDAPc2QwEnKkMBYyJDAEMeQwDnGkMCsxZDAIHCRwDRvj8D+843AauSMwLYmjMClpIvAh0yLwK8Oi8BF3orAv6SKwAhtisD0R4rAYC+KwCIfisBqFIrAWg2KwLEIisCgBYrAnAOKwEgCisBoAYrAF4ONwNPYisD4yojA+0SHwPoshsADaYXAdeKEwE2HhMB5SYTA5huEwLHkg8DpqoPAcISDwO9qg8ASWoPA8U6DwJxHg8DGQoPAlz+DwH89g8AePIPAgVqKwHj7hsC/QoTAzCeCwNSWgMBj7H7Akld9wDdBfMB/hHvAWAV7wD2tesBzR3rAo895wNJ/ecDjSnnA4id5wMgQecCPAXnAhvd4wOnweMCP7HjATfCHwM7ig8AndYDA0Ft7wGcLd8AY03PAJ4BxwBneb8A0vm7A1fptwCB3bcB5Hm3Ayb9swPhHbMAw9WvARL5rwPGZa8D4gWvAKnJrwL9na8DiYGvAAHeFwDaHgcC32HrASOBzwJ80bsBmyWnAUXpmwEsVZMChZWLA6TthwKVxYMA+6V/ADI5fwBw0X8Arvl7AV2lewF4wXsCtCl7AzPFdwGXhXcCW1l3Ao2aBwILyfcBrPnbATu5twN3YZsDwD2HAnolcwF0jWcDYq1bAM+5UwFq6U8D46FLAtVtSwEr9UcBepVHAoTFRwJTcUMB7oVDAYXpQwI9gUMCJT1DA4RMDwboTA8GgEwPBjxMDwYQTA8F9EwPBeRMDwXYTA8F0EwPBchMDwXITA8FxEwPBcRMDwXATA8FwEwPBcBMDwXATA8FwEwPBcBMDwXATA8FwEwPBzB4AwYweAMFjHgDBSB4AwTYeAMEqHgDBIx4AwR4eAMEbHgDBGR4AwRceAMEWHgDBFh4AwRUeAMEVHgDBFR4AwRUeAMEVHgDBFR4AwRUeAMEVHgDBaDj6wJo3+sAUN/rAvDb6wIM2+sBdNvrARTb6wDU2+sArNvrAJDb6wB82+sAdNvrAGzb6wBk2+sAZNvrAGDb6wBg2+sAYNvrAFzb6wBc2+sAXNvrAsBn0wGMY9MCKF/TA/Bb0wJ8W9MBjFvTAOxb0wCIW9MARFvTABhb0wP8V9MD6FfTA9xX0wPUV9MD0FfTA8xX0wPIV9MDyFfTA8hX0wPIV9MDyFfTAgePtwGjh7cAJ4O3AJN/twI/e7cAt3u3A7d3twMTd7cCp3e3Al93twIvd7cCE3e3Af93twHzd7cB63e3AeN3twHfd7cB33e3Adt3twHbd7cB23e3Ad5jnwBaV58DhkufAcJHnwH+Q58Dhj+fAe4/nwDiP58AMj+fA8I7nwN2O58DRjufAyY7nwMSO58DAjufAvo7nwL2O58C8jufAu47nwLuO58C7jufAszvhwEY24cC5MuHAaDDhwOQu4cDnLeHAQS3hwNYs4cCPLOHAYSzhwEMs4cAwLOHAIyzhwBss4cAVLOHAEizhwA8s4cAOLOHADSzhwAws4cAMLOHA6dDawDXI2sCFwtrAzb7awF682sDHutrAvrnawBC52sCfuNrAVrjawCW42sAGuNrA8rfawOS32sDbt9rA1rfawNK32sDQt9rAzrfawM232sDMt9rAiVzUwJ9O1MCERdTAjz/UwKk71MAdOdTAczfUwF421MCoNdTAMjXUwOQ01MCyNNTAkTTUwHw01MBuNNTAZDTUwF801MBbNNTAWDTUwFY01MBVNNTAFOTNwOjNzcBdv83A17XNwJ2vzcCKq83A4KjNwCOnzcAAps3AQqXNwMakzcB2pM3AQaTNwB+kzcAIpM3A+aPNwPCjzcDqo83A5qPNwOOjzcDho83AsG7HwIFLx8BcNMfALSXHwDsbx8C6FMfAeRDHwLANx8DfC8fAsArHwOoJx8BoCcfAFAnHwN0Ix8C5CMfAoQjHwJIIx8CICMfAggjHwH0Ix8B6CMfAIQXBwInOwMDaqcDAt5HAwOGBwMCBd8DAuHDAwEhswMBhacDAe2fAwD9mwMBwZcDA6WTAwJFkwMBXZMDAMmTAwBlkwMAJZMDA/2PAwPhjwMD0Y8DA5Yy6wFNeusDuJrrAuAC6wJLnucAR17nAQcy5wC7FucCOwLnAiL25wI67ucBDurnAbLm5wN+4ucCDuLnAR7i5wCC4ucAHuLnA9re5wOu3ucDkt7nA7BW0wOzfs8AzsbPAPXmzwHlRs8BJN7PAGSazwNcas8B6E7PAqA6zwIELs8ByCbPAGgizwDoHs8CnBrPARwazwAkGs8DgBbPAxgWzwLQFs8CpBbPASrqtwPNlrcDLLa3AC/+swKHGrMBDnazABYKswCJwrMBqZKzAv1yswLxXrMBzVKzAT1KswOlQrMD/T6zAZk+swANPrMDCTqzAl06swHxOrMBqTqzAjn6nwHMJp8DgsabAhHemwKVIpsAPEKbAD+WlwLrIpcAftqXA7qmlwPShpcC9nKXAU5mlwBiXpcCjlaXAsJSlwBGUpcCqk6XAZpOlwDqTpcAdk6XA82ShwOHCoMCzT6DAivqfwOq9n8Dmjp/AVVafwKcpn8A0DJ/A3PiewC/snsDj457Ad96ewOransCY2J7AFdeewBjWnsBy1Z7AB9WewMDUnsCS1J7AQp2bwKSqmsBoA5rAoZCZwCQ/mcCtAZnAjNKYwBuamMCza5jAGk2YwP84mMDSK5jAMiOYwI8dmMDeGZjAdBeYwOEVmMDaFJjALxSYwL4TmMB1E5jAXk2WwF/rlMDr8JPA90OTwKXOksCyfZLAXEOSwJETksDr25HAu6uRwPKLkcAPd5HAXWmRwGdgkcCLWpHAtVaRwDNUkcCQUpHAf1GRwMxQkcBYUJHAYZiRwL+mj8BLOo7AzDeNwPWEjMB6C4zAz7mLwJeAi8DpUovAMxyLwC3qisAryYrAebOKwD+lisDvm4rA2JWKwNyRisBBj4rAjo2KwHGMisC4i4rA6ZuNwMH/isArAYnACYqHwEp/hsBkxoXAn0iFwCn0hMAbu4TAZZCEwE5bhMBkJ4TAHgWEwJbug8DO34PAItaDwM7Pg8Cqy4PA9siDwDHHg8AKxoPAA2eKwCcTh8BcaITApFyCwJ/agMDWjn/AkBB+wCsMfcAtXXzAU+h7wKOVe8AKM3vATMd6wCWAesBYUXrApjJ6wI0eesBoEXrAzwh6wC8DesCE/3nAqvSHwH7ug8C5i4DAbqR7wGNyd8AiWHTAZiBywEqVcMDAh2/Ae9JuwFFZbsDoB27ArKttwFw+bcCC9GzA68NswAukbMArj2zAhIFswJZ4bMC/cmzAR3iFwBmLgcCC7nrAPgt0wKZ6bsCsLWrAy/xmwEyzZMD7GmPABARiwDZIYcCgymDA7HZgwKkgYMDes1/AsGdfwD81X8AmFF/Aef5ewEvwXsAF517Ao2aBwIT0fcBMRXbAkgJuwLEBZ8BoU2HALutcwEGjWcCSR1fAraFVwPuAVMBqvlPAQzxTwATmUsCcklLAfyZSwPrZUcCepVHAQINRwL5sUcAEXlHAJ08DwQdPA8HyTgPB5U4DwdxOA8HWTgPB004DwdBOA8HPTgPBzk4Dwc1OA8HNTgPBzE4DwcxOA8HMTgPBzE4DwcxOA8HMTgPBzE4DwcxOA8HMTgPBIFwAwexbAMHKWwDBtFsAwaVbAMGcWwDBllsAwZJbAMGQWwDBjlsAwY1bAMGMWwDBjFsAwYxbAMGMWwDBi1sAwYtbAMGLWwDBi1sAwYtbAMGLWwDBgLb6wNW1+sBmtfrAHrX6wPC0+sDStPrAvrT6wLG0+sCptPrApLT6wKC0+sCetPrAnbT6wJy0+sCbtPrAm7T6wJu0+sCatPrAmrT6wJq0+sCatPrAfpr0wGeZ9MCymPTAPJj0wPGX9MC/l/TAoJf0wIuX9MB+l/TAdZf0wG+X9MBsl/TAaZf0wGiX9MBnl/TAZpf0wGaX9MBml/TAZZf0wGWX9MBll/TAQmbuwHxk7sBVY+7AlmLuwBti7sDLYe7Al2HuwHVh7sBgYe7AUWHuwEhh7sBCYe7AP2HuwDxh7sA7Ye7AOWHuwDlh7sA4Ye7AOGHuwDhh7sA4Ye7AZRzowIIZ6MCkF+jAbRbowKUV6MAiFejAzhTowJcU6MB0FOjAXRTowE4U6MBFFOjAPhTowDoU6MA4FOjANhTowDUU6MA0FOjANBTowDQU6MAzFOjA/r/hwFO74cBLuOHAU7bhwA214cA6tOHAsbPhwFiz4cAfs+HA+rLhwOKy4cDSsuHAyLLhwMKy4cC9suHAu7LhwLmy4cC4suHAt7LhwLay4cC2suHAtFTbwCdN28BBSNvAEkXbwAJD28CsQdvAzkDbwD5A28DhP9vApT/bwH4/28BlP9vAVD/bwEo/28BDP9vAPj/bwDs/28A5P9vAOD/bwDg/28A3P9vA2d7UwKrS1MDBytTAnsXUwEnC1MAfwNTAuL7UwNC91MA5vdTA2LzUwJm81MBwvNTAVbzUwES81MA5vNTAMrzUwC281MAqvNTAKLzUwCe81MAmvNTAtmPOwCBQzsBiQ87AGjvOwLo1zsA9Ms7A+i/OwIMuzsCPLc7A8izOwIwszsBKLM7AHyzOwAMszsDxK87A5SvOwN4rzsDZK87A1ivOwNQrzsDSK87AHerHwMDKx8BJtsfA+KjHwFGgx8CzmsfADpfHwLCUx8Aok8fAKpLHwIWRx8AakcfA1ZDHwKiQx8CLkMfAeZDHwGyQx8BkkMfAX5DHwFyQx8BakMfAHXvBwExJwcCSKMHANxPBwFAFwcBI/MDAa/bAwJ3ywMAk8MDAiu7AwIHtwMDV7MDAZuzAwB3swMDv68DA0OvAwL3rwMCw68DAqOvAwKLrwMCf68DAGAC7wDXUusDwoLrA0366wI5ousAPWrrAo1C6wIVKusCNRrrA+UO6wE5CusA5QbrAhUC6wBFAusDGP7rAlT+6wHU/usBhP7rAVD+6wEs/usBGP7rA3YO0wIBStMB5JrTAcfKzwOnOs8C1t7PAmaizwMies8BomLPARZSzwJWRs8DYj7PAt46zwPyNs8CDjbPANI2zwAGNs8DhjLPAy4yzwL2Ms8C0jLPAySCuwPDSrcCRn63AenOtwP8+rcADGq3A2gGtwB/yrMDl56zAQeGswPLcrMAm2qzAVdiswCnXrMBm1qzA6NWswJbVrMBh1azAP9WswCjVrMAa1azAd92nwM9up8DqHafAfOimwG+8psCXh6bAHWGmwPlHpsCZN6bA8yymwAompsCOIabApB6mwMEcpsCHG6bAvRqmwDkapsDkGabArRmmwIkZpsByGabAFrqhwG4hocBztaDApmWgwBsuoMD5AaDACc2fwAaln8Dfip/A1nmfwMJun8CRZ5/A5mKfwN5fn8DnXZ/AoVyfwM1bn8BFW5/A7FqfwLNan8CNWp/APuWbwND+msB8YZrAAvaZwEGqmcAdcZnA3kSZwP4PmcBm5pjANcuYwH25mMD3rZjAfKaYwKGhmMB6npjAbpyYwBubmMBAmpjAsZmYwFWZmMAZmZjA9YWWwC4ylcAbRJTARKGTwNIzk8CC6JLAEbKSwKuFksAAUZLAyCWSwIQJksAY95HAHOuRwFTjkcBI3pHAANuRwODYkcB/15HAmtaRwAbWkcCn1ZHAnsCRwAbej8Dpf47A+4mNwHXhjMALcIzAYCSMwGrvi8BlxIvAf5CLwJlji8A6RovAEzOLwJ4mi8CHHovARxmLwN4Vi8CoE4vAORKLwEsRi8CxEIvA0rSNwK8mi8AfN4nAcs6HwHTQhsATIobAj6yFwFRehcCvKYXAoQGFwNTOhMAzoITAroGEwMdthMDUYITAa1iEwPZShMBqT4TAHk2EwKBLhMCpSoTAmHOKwO4qh8D9jYTARpGCwNAdgcCLF4DAQsZ+wMLSfcCNMH3AMsV8wJN3fMCTGHzAu7d7wFJ4e8D0TnvACjR7wI4ie8A2F3vA1w97wBALe8D3B3vADvmHwED6g8BjooDAGe17wP/Yd8AO3HTAiL5ywEdJccAGTXDA3qRvwHc1b8CN6W7AfpBuwKItbsDF623Ay8BtwNOkbcCnkm3A3IZtwDR/bcA8em3AjnmFwAOPgcBtBHvAYjZ0wMHAbsCgkWrAOn5nwElPZcA7zWPA8cdiwKAZYsAIpmHAOllhwJsFYcBWomDAEV5gwGsxYMBcFGDAegFgwDj1X8BD7V/Ao2aBwIf2fcA4THbA9BZuwLIqZ8D3lmHAeExdwCwiWsBh4VfAJlJWwIZDVcDKjlTA5xZUwLjHU8BbeFPAQBRTwH7PUsAdoVLA7IJSwE1vUsCQYlLA64cDwdGHA8HAhwPBtYcDwa6HA8GqhwPBp4cDwaWHA8GkhwPBo4cDwaOHA8GjhwPBoocDwaKHA8GihwPBoocDwaKHA8GihwPBoocDwaKHA8GihwPB85YAwciWAMGslgDBm5YAwY+WAMGIlgDBg5YAwYCWAMF+lgDBfZYAwXyWAMF7lgDBe5YAwXuWAMF7lgDBe5YAwXqWAMF6lgDBepYAwXqWAMF6lgDBnS/7wA4v+8CzLvvAeC77wFIu+8A6LvvAKi77wCAu+8AaLvvAFS77wBMu+8ARLvvAEC77wA8u+8APLvvADi77wA4u+8AOLvvADi77wA4u+8AOLvvAWRb1wG8V9cDZFPXAeBT1wDoU9cASFPXA+BP1wOcT9cDdE/XA1hP1wNET9cDPE/XAzRP1wMwT9cDLE/XAyhP1wMoT9cDKE/XAyhP1wMoT9cDKE/XAH+TuwJ/i7sCn4e7ACOHuwKLg7sBg4O7ANuDuwBvg7sAK4O7A/t/uwPff7sDy3+7A8N/uwO7f7sDs3+7A7N/uwOvf7sDr3+7A69/uwOrf7sDq3+7AgZvowAuZ6MB2l+jAcZbowMmV6MBelejAGJXowOyU6MDPlOjAvZTowLGU6MCplOjApJTowKGU6MCflOjAnpTowJ2U6MCdlOjAnJTowJyU6MCclOjAkz/iwI874sD4OOLATjfiwDw24sCLNeLAGjXiwNE04sCiNOLAhDTiwHE04sBkNOLAXDTiwFc04sBUNOLAUjTiwFA04sBPNOLATzTiwE404sBONOLA8tPbwGTN28AsydvAdMbbwLTE28CTw9vA2sLbwGPC28AWwtvA5cHbwMbB28CxwdvApMHbwJzB28CWwdvAk8HbwJHB28CPwdvAjsHbwI7B28CNwdvA1FzVwCpS1cBKS9XA3UbVwANE1cAtQtXA/0DVwDxA1cC/P9XAbz/VwDs/1cAaP9XABT/VwPc+1cDuPtXA6T7VwOU+1cDjPtXA4T7VwOA+1cDgPtXAVN/OwAjOzsDdws7Aq7vOwAi3zsALtM7AH7LOwOKwzsAXsM7AlK/OwECvzsAKr87A567OwNCuzsDCrs7Aua7OwLOuzsCvrs7Ara7OwKuuzsCqrs7A9WHIwAFGyMDrM8jAPijIwLYgyMDdG8jAvRjIwLoWyMBvFcjAmhTIwBEUyMC5E8jAgRPIwFwTyMBFE8jANhPIwCwTyMAmE8jAIhPIwB8TyMAeE8jAc+3BwIXAwcBVo8HAcJDBwD6EwcBgfMHAT3fBwAx0wcDyccHAmHDBwLlvwcAqb8HAzm7BwJNuwcBtbsHAVG7BwEVuwcA7bsHANG7BwDBuwcAtbsHAIHC7wDxGu8BzF7vAAPm6wEnlusCO2LrAWdC6wA/LusCnx7rAdcW6wAzEusAkw7rAjsK6wC7CusDwwbrAycG6wK/BusCfwbrAlMG6wI7BusCJwbrAEO+0wMjBtMBNmLTAMmi0wHVItMDnM7TAoCa0wBAetMCNGLTA/xS0wLUStMA8EbTAShC0wK4PtMBKD7TACg+0wOAOtMDFDrTAtA60wKkOtMCiDrTAEYWuwDs9rsBADq7AvOStwPmzrcDpkq3Afn2twKhvrcC8Zq3A/GCtwEhdrcDlWq3AXVmtwGBYrcC+V63AVVetwBJXrcDnVq3Ay1atwLlWrcCuVq3AWDqowAPSp8BQh6fAalanwOcsp8DI+6bAXNmmwA7DpsCltKbAWqumwF2lpsCBoabABZ+mwGydpsBknKbAu5umwE6bpsAIm6bA25qmwL6apsCsmqbA4A2iwN59ocDPGKHAK86gwEyboMDfcaDAc0CgwKEcoMBqBaDAafafwLvsn8B/5p/Ae+KfwOTfn8A63p/AKN2fwHfcn8AG3J/AvdufwI7bn8Bw25/AcCycwK5Rm8C8vZrAHVmawFESmsCY3ZnAF7SZwKWCmcBiXZnAOkWZwJw1mcCJK5nADCWZwN4gmcAsHpnAcByZwFMbmcCbGpnAJRqZwNkZmcCpGZnAOL6WwD14lcAIlpTAx/yTwKiWk8B7UJPA3h2TwEf0ksDpwpLAKpySwAmDksDJcpLATmiSwIxhksAzXZLAZVqSwJdYksBuV5LAr1aSwDRWksDlVZLA1OiRwAEVkMDRxI7A89qNwDc8jcBe0ozAE4yMwDZbjMDBMozArgGMwGbZi8BEv4vAXa6LwHaji8BunIvA6JeLwP2Ui8Ack4vA55GLwCCRi8ChkIvAz82NwJlNi8DRbInAMRKIwHMgh8APfIbATQ6GwN3FhcBMlYXAnm+FwE4/hcBwFYXARPqEwLHohMBZ3YTACdaEwFTRhMBLzoTAV8yEwBXLhMBGyoTAP4CKwMlCh8Cds4TArMWCwGFggcCMZoDAp3h/wAqVfsC6/n3ADZx9wDRTfcAj+HzAHqF8wJ9ofMASRHzAeSx8wEQdfMB5E3zAKQ18wBkJfMB8BnzAef2HwBMGhMAiuYDAyjV8wDE/eMDOXnXAhVpzwA/6ccATDnHAIXJwwLoLcMChxG/AUW9vwPcVb8A9227APLVuwLOcbsDijG7AsoJuwCJ8bsDod27A1nqFwPKSgcB5GnvAsmF0wOcGb8A29WrAkP5nwDfpZcBdfGTAuYdjwPLlYsCce2LAajRiwIjjYcDEiWHAvExhwDklYcC2C2HARPtgwKzwYMDZ6WDAo2aBwIr4fcAvU3bAdStuwOBTZ8CY2mHAca1dwBOgWsA3eVjAmf9WwAQCVsAuWlXAx+tUwBqjVMCvVlTAHftTwGG9U8BPlFPAyXlTwK9oU8CrXVPAUb4DwTu+A8EuvgPBJb4DwSC+A8EcvgPBGr4DwRi+A8EXvgPBF74DwRa+A8EWvgPBFr4DwRa+A8EWvgPBFr4DwRa+A8EWvgPBFr4DwRa+A8EWvgPBaM8AwUXPAMEuzwDBIM8AwRbPAMEQzwDBDc8AwQrPAMEJzwDBCM8AwQfPAMEHzwDBBs8AwQbPAMEGzwDBBs8AwQbPAMEGzwDBBs8AwQbPAMEGzwDBAaT7wIuj+8A/o/vAD6P7wPCi+8DdovvA0KL7wMii+8DDovvAwKL7wL6i+8C9ovvAvKL7wLui+8C7ovvAu6L7wLqi+8C6ovvAuqL7wLqi+8C6ovvAhY31wMGM9cBEjPXA9Iv1wMGL9cCgi/XAi4v1wH6L9cB2i/XAcIv1wG2L9cBri/XAaYv1wGiL9cBoi/XAZ4v1wGeL9cBni/XAZ4v1wGeL9cBni/XAWF3vwBNc78BDW+/Av1rvwGpa78A0Wu/AElrvwPxZ78DuWe/A5VnvwN9Z78DcWe/A2VnvwNhZ78DXWe/A1lnvwNZZ78DWWe/A1lnvwNVZ78DVWe/AChbpwPAT6cCZEunAvhHpwDMR6cDZEOnAoBDpwHwQ6cBlEOnAVhDpwE0Q6cBHEOnAQxDpwEAQ6cA/EOnAPhDpwD0Q6cA9EOnAPRDpwDwQ6cA8EOnArrriwDm34sADteLAmrPiwLOy4sAgsuLAwrHiwIax4sBgseLAR7HiwDix4sAuseLAJ7HiwCOx4sAhseLAH7HiwB6x4sAdseLAHbHiwB2x4sAcseLA107cwCdJ3MCERdzAMUPcwLVB3MDDQNzAKEDcwMU/3MCGP9zAXj/cwEQ/3MA0P9zAKT/cwCM/3MAeP9zAHD/cwBo/3MAZP9zAGD/cwBg/3MAXP9zAqNbVwFLN1cBax9XAicPVwBnB1cCKv9XAi77VwOi91cCBvdXAPr3VwBS91cD5vNXA6LzVwN281cDWvNXA0rzVwM+81cDNvNXAzLzVwMu81cDLvNXAE1fPwMxHz8AEPs/AwjfPwMIzz8AzMc/AkS/PwIYuz8DcLc/Aby3PwCotz8D9LM/A4SzPwM8sz8DELM/AvCzPwLgsz8C1LM/AsyzPwLIsz8CxLM/AUdbIwGm9yMBtrcjAMKPIwKOcyMB0mMjAx5XIwBGUyMD5ksjAR5LIwNWRyMCMkcjAXpHIwECRyMAukcjAIpHIwBqRyMAVkcjAEpHIwBCRyMAPkcjAslzCwEs0wsBEGsLAjwnCwNv+wcAC+MHAofPBwNXwwcAL78HA5+3BwCztwcC17MHAaezBwDnswcAa7MHABuzBwPrrwcDy68HA7OvBwOnrwcDn68HAAt27wLi0u8COirvAYm+7wO9du8DCUrvAm0u7wAhHu8AcRLvAPkK7wAxBu8BKQLvAzT+7wH4/u8BLP7vAKz+7wBY/u8AJP7vAAT+7wPs+u8D4PrvAk1e1wAcutcB8BrXAltq0wD6+tMAJrLTAX6C0wOiYtMAjlLTAFpG0wCOPtMDkjbTAGI20wJeMtMBEjLTAD4y0wO2LtMDYi7TAyou0wMGLtMC8i7TAJueuwOOkrsDJea7AvFKuwKElrsAVCK7AGfWtwO/orcAm4a3ALNytwP3YrcD11q3AqNWtwNTUrcBN1K3A9tOtwL/TrcCc063AhdOtwHfTrcBu063Aa5WowBQzqMAg7qfAYcGnwFOap8C0bKfA7E2nwCM6p8B1LafAVyWnwCcgp8DXHKfAuBqnwF0Zp8CAGKfA8xenwJgXp8BfF6fAOhenwCMXp8AUF6fATGCiwIHYocDyeaHAJzShwJIFocCQ3qDAprCgwJeQoMD8e6DAxW6gwFFmoMDpYKDAdV2gwD9boMDWWaDA71igwFxYoMD+V6DAwlegwJxXoMCEV6DA0XKcwDujm8AoGJvA/LmawK13msA0R5rATiCawCLymcDE0JnATruZwIytmcC9pJnAHJ+ZwIObmcA2mZnAvZeZwM2WmcA0lpnA0pWZwJSVmcBslZnAI/aWwIe9lcCw5pTAglaUwDj3k8DhtZPA1oaTwNhfk8C2MZPA/A6TwKb4ksBS6pLAJ+GSwErbksCK15LAJdWSwJ3TksCj0pLAA9KSwJ3RksBc0ZLA/RCSwKtLkMD/CI/AsiqOwDyVjcB9Mo3ALvGMwCDEjMDbnYzAz2+MwK9LjMBwNIzAhiWMwPobjMDgFYzA+RGMwHoPjMDiDYzA3gyMwDcMjMDNC4zA3+aNwHt0i8A4oonAP1WIwENvh8Bb1IbA322GwNEqhsAF/oXActqFwMmshcA0h4XABW+FwIBfhcCQVYXANU+FwCZLhcCNSIXA5EaFwNVFhcAoRYXA94yKwLhah8A62YTA0PmCwEyigcBqtIDA4ROAwBBTf8DQx37AG21+wNUofsDR0X3Ap4N9wFVRfcAJMX3AWhx9wCAPfcCsBn3AQwF9wM/9fMCb+3zA6gGIwPYRhMD1z4DAfH58wO2keMBV4HXAU/RzwKOncsDyynHAXjpxwELccMC7mXDARUhwwIj3b8Aww2/AlqFvwBCMb8BMfm/AgHVvwN9vb8BHbG/AHnyFwOiWgcClMHvAK410wBRNb8BkWGvAwn1owA6BZsBiKGXAakNkwFCtY8CFS2PAIwljwKS7YsBlamLA8zNiwP4QYsCa+mHARuxhwB/jYcBE3WHAo2aBwI/6fcAwWnbAFEBuwDd9Z8BGHmLADg5ewOgcW8AOD1nABqpXwH68VsCrIFbAC7tVwPx3VcD0LVXAT9tUwOSjVMCHf1TAO2hUwFNZVMDMT1TA";
@@ -0,0 +1,559 @@
+"""
+Vectorized Monte Carlo kernels for particle mass statistics
+- Integer-coded shape/polymer sampling (no string arrays)
+- Batched sampling over many prior compositions at once
+- Nested prior-uncertainty propagation (Dirichlet compositions); the same batched
+  kernel evaluates region-stratified priors
+- Streaming sample -> volume -> mass -> reduce over fixed-size chunks (constant
+  memory), fused into one compiled loop when numba is installed
+- Pathwise derivatives of the mean and quantile masses with respect to alpha and
+  the size bounds, from the same draws; gradient-enhanced (Hermite) surfaces
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+DENSITIES = {
+    'Poly_PE': 0.95, 'Poly_PP': 0.91, 'Poly_PS': 1.05,
+    'Poly_PET': 1.38, 'Poly_PVC': 1.38, 'Poly_PA': 1.15,
+    'Poly_PC': 1.20, 'Poly_PU': 1.20, 'Poly_PMMA': 1.18,
+    'Poly_EPS': 0.05, 'Poly_Rayon': 1.50, 'Poly_CA': 1.30, 'Poly_XPS': 0.05
+}
+
+# Geometry parameters (uncertain; flux_sweep.py sweeps them over ranges)
+FIBER_ASPECT = 10.0          # fibre length / diameter
+FILM_THICKNESS_UM = 20.0
+
+# volume_um3 = coef * size_um ** power (same geometry as calculate_volumes)
+#   Fiber: cylinder with D = L/10   -> pi * (L/20)^2 * L = pi/400 * L^3
+#   Fragment/Pellet: sphere         -> 4/3 * pi * (D/2)^3 = pi/6 * D^3
+#   Film: square sheet, 20 um thick -> 20 * D^2
+SHAPE_GEOMETRY = {
+    'Shape_Fiber': (np.pi / (4.0 * FIBER_ASPECT ** 2), 3.0),
+    'Shape_Fragment': (np.pi / 6.0, 3.0),
+    'Shape_Pellet': (np.pi / 6.0, 3.0),
+    'Shape_Film': (FILM_THICKNESS_UM, 2.0),
+}
+
+UM3_TO_CM3 = 1e-12
+
+BOOTSTRAP_REPLICATES = 200
+# Replicates are processed in blocks of at most this many weights
+BOOTSTRAP_BLOCK_ELEMENTS = 4_000_000
+
+STREAM_CHUNK = 1 << 20
+# log10(mass_g) histogram for streamed quantiles: 0.01 decade bins
+STREAM_HIST_RANGE = (-16.0, 2.0)
+STREAM_HIST_BINS = 1800
+
+# Bins of the cached per-cell mass histogram in ReweightableDraws
+REWEIGHT_HIST_BINS = 70
+
+# Parameters of the pathwise derivatives, in row order of d_log_mass
+GRADIENT_PARAMS = ('alpha', 'min_size', 'max_size')
+# Quantile derivatives average over the ~sqrt(n) draws ranked nearest the quantile
+GRADIENT_MIN_NEIGHBOURS = 10
+
+
+def shape_geometry(shape_names, fiber_aspect=FIBER_ASPECT, film_thickness_um=FILM_THICKNESS_UM):
+    """
+    Return (coef, power) arrays aligned with shape_names; unknown shapes have zero volume.
+    Array-valued fiber_aspect / film_thickness_um give coef of shape (..., n_shapes).
+    """
+    power = np.array([SHAPE_GEOMETRY.get(s, (0.0, 0.0))[1] for s in shape_names])
+    fiber_aspect, film = np.broadcast_arrays(np.asarray(fiber_aspect, dtype=float),
+                                             np.asarray(film_thickness_um, dtype=float))
+    laws = {'Shape_Fiber': np.pi / (4.0 * fiber_aspect ** 2), 'Shape_Film': film}
+    coef = [laws.get(s, np.full(film.shape, SHAPE_GEOMETRY.get(s, (0.0, 0.0))[0])) for s in shape_names]
+    return np.stack(coef, axis=-1), power
+
+
+def density_array(poly_names, densities=None):
+    densities = DENSITIES if densities is None else densities
+    return np.array([densities.get(p, 1.0) for p in poly_names])
+
+
+def sizes_from_uniform(u, alpha, min_um, max_um):
+    """Inverse CDF of the truncated power law; alpha/min/max broadcast against u"""
+    alpha = np.asarray(alpha, dtype=float)
+    one_minus = 1.0 - alpha
+    safe = np.where(np.abs(one_minus) < 0.01, 1.0, one_minus)
+    term1 = np.power(max_um, safe)
+    term2 = np.power(min_um, safe)
+    power_law = ((term1 - term2) * u + term2) ** (1.0 / safe)
+    log_uniform = min_um * (np.asarray(max_um, dtype=float) / min_um) ** u
+    return np.where(np.abs(one_minus) < 0.01, log_uniform, power_law)
+
+
+def log_size_derivatives(u, alpha, min_um, max_um):
+    """
+    d log(size) / d(alpha, min, max) of sizes_from_uniform at fixed u; shape (3,) + u.shape.
+    Inside the log-uniform band the alpha row is the alpha -> 1 limit of the power law.
+    """
+    u = np.asarray(u, dtype=float)
+    alpha = np.asarray(alpha, dtype=float)
+    one_minus = 1.0 - alpha
+    near_one = np.abs(one_minus) < 0.01
+    c = np.where(near_one, 1.0, one_minus)
+    log_lo, log_hi = np.log(min_um), np.log(max_um)
+    lo_p, hi_p = np.power(min_um, c), np.power(max_um, c)
+    t = (1.0 - u) * lo_p + u * hi_p
+    power_law = np.stack([np.log(t) / c ** 2 - ((1.0 - u) * lo_p * log_lo + u * hi_p * log_hi) / (c * t),
+                          (1.0 - u) * lo_p / (min_um * t),
+                          u * hi_p / (max_um * t)])
+    log_uniform = np.stack(np.broadcast_arrays(-0.5 * u * (1.0 - u) * (log_hi - log_lo) ** 2,
+                                               (1.0 - u) / min_um, u / max_um))
+    return np.where(near_one, log_uniform, power_law)
+
+
+def draw_codes(u, cum_probs):
+    """
+    Map uniforms to category codes.
+    u: (..., n), cum_probs: (C,) or (..., C) cumulative probabilities per row.
+    """
+    cum_probs = np.asarray(cum_probs)
+    if cum_probs.ndim == 1:
+        codes = np.searchsorted(cum_probs, u, side='right')
+    else:
+        codes = (u[..., :, None] >= cum_probs[..., None, :]).sum(axis=-1)
+    return np.minimum(codes, cum_probs.shape[-1] - 1)
+
+
+def masses_from_codes(sizes_um, shape_codes, poly_codes, coef, power, rho):
+    """Particle masses (g) for coded draws"""
+    volumes_um3 = coef[shape_codes] * sizes_um ** power[shape_codes]
+    return volumes_um3 * UM3_TO_CM3 * rho[poly_codes]
+
+
+def sample_masses(n, alpha, min_size, max_size, shape_probs, poly_probs,
+                  densities=None, rng=None, derivatives=False):
+    """
+    Coded equivalent of run_monte_carlo: returns masses_g plus the shape and
+    polymer codes (indices into the dict key order) for each draw.
+    derivatives=True appends d_log_mass, the (3, n) pathwise derivatives of
+    log(mass) with respect to GRADIENT_PARAMS, from the same uniforms.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    coef, power = shape_geometry(list(shape_probs.keys()))
+    rho = density_array(list(poly_probs.keys()), densities)
+
+    shape_codes = draw_codes(rng.random(n), np.cumsum(list(shape_probs.values())))
+    poly_codes = draw_codes(rng.random(n), np.cumsum(list(poly_probs.values())))
+    u_size = rng.random(n)
+    sizes = sizes_from_uniform(u_size, alpha, min_size, max_size)
+
+    masses_g = masses_from_codes(sizes, shape_codes, poly_codes, coef, power, rho)
+    if not derivatives:
+        return masses_g, shape_codes, poly_codes
+    # mass = coef * size**power, so d log(mass) = power * d log(size)
+    d_log_mass = power[shape_codes] * log_size_derivatives(u_size, alpha, min_size, max_size)
+    return masses_g, shape_codes, poly_codes, d_log_mass
+
+
+def pathwise_gradients(masses_g, d_log_mass, weights=None, quantiles=(5, 50, 95)):
+    """
+    Gradients of the mean and quantile masses, {stat: (3,) d mass / d GRADIENT_PARAMS}.
+
+    The mean gradient is the (weighted) mean of the per-draw derivatives. Mass is
+    monotone in the size uniform within every shape x polymer cell, so
+    dQ/dtheta = E[d mass / d theta | mass = Q]; the conditional mean is taken over
+    the draws ranked nearest the quantile. Optional per-draw weights as in
+    bootstrap_statistics (e.g. prior reweighting).
+    """
+    masses_g = np.asarray(masses_g, dtype=float)
+    d_mass = masses_g * np.asarray(d_log_mass, dtype=float)
+    w = np.ones_like(masses_g) if weights is None else np.asarray(weights, dtype=float)
+    grads = {'mean': (d_mass @ w) / w.sum()}
+
+    order = np.argsort(masses_g, kind='stable')
+    w_sorted, d_sorted = w[order], d_mass[:, order]
+    cum = np.cumsum(w_sorted)
+    n = len(masses_g)
+    half = max(GRADIENT_MIN_NEIGHBOURS, int(np.sqrt(n))) // 2
+    for q in quantiles:
+        pos = min(int(np.searchsorted(cum, q / 100.0 * cum[-1])), n - 1)
+        window = slice(max(pos - half, 0), min(pos + half + 1, n))
+        grads[f'P{q:g}'] = (d_sorted[:, window] @ w_sorted[window]) / max(w_sorted[window].sum(), 1e-300)
+    return grads
+
+
+def elasticities(values, gradients, alpha, min_size, max_size):
+    """
+    {stat: (3,) theta / value * d value / d theta}; flux is linear in mass, so these
+    are also the flux elasticities.
+    """
+    theta = np.array([alpha, min_size, max_size], dtype=float)
+    return {stat: theta * gradients[stat] / values[stat] for stat in gradients}
+
+
+def mass_statistics_with_gradients(n, alpha, min_size, max_size, shape_probs, poly_probs,
+                                   densities=None, rng=None, quantiles=(5, 50, 95)):
+    """
+    Mean and quantile masses of one MC run with their pathwise gradients.
+    Returns ({stat: mass_g}, {stat: (3,) gradient}).
+    """
+    masses_g, _, _, d_log_mass = sample_masses(n, alpha, min_size, max_size, shape_probs, poly_probs,
+                                               densities, rng, derivatives=True)
+    stats = {'mean': masses_g.mean()}
+    for q, v in zip(quantiles, np.percentile(masses_g, quantiles)):
+        stats[f'P{q:g}'] = v
+    return stats, pathwise_gradients(masses_g, d_log_mass, quantiles=quantiles)
+
+
+def _hermite_last_axis(values, slopes, knots, x_new):
+    """Cubic Hermite interpolation along the last axis from values and slopes at the knots"""
+    i = np.clip(np.searchsorted(knots, x_new, side='right') - 1, 0, len(knots) - 2)
+    h = knots[i + 1] - knots[i]
+    t = (np.asarray(x_new, dtype=float) - knots[i]) / h
+    t2, t3 = t * t, t * t * t
+    return ((2 * t3 - 3 * t2 + 1) * values[..., i] + (t3 - 2 * t2 + t) * h * slopes[..., i]
+            + (3 * t2 - 2 * t3) * values[..., i + 1] + (t3 - t2) * h * slopes[..., i + 1])
+
+
+def hermite_surface(x, y, z, dz_dx, dz_dy, x_new, y_new):
+    """
+    Bicubic Hermite interpolation of z (len(y), len(x)) (np.meshgrid layout) from
+    values and first derivatives at the knots; the cross derivative is estimated
+    from the derivative grids. Returns (len(y_new), len(x_new)).
+    """
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    cross = 0.5 * (np.gradient(dz_dx, y, axis=0) + np.gradient(dz_dy, x, axis=1))
+    along_x = _hermite_last_axis(z, dz_dx, x, x_new)
+    dy_along_x = _hermite_last_axis(dz_dy, cross, x, x_new)
+    return _hermite_last_axis(along_x.T, dy_along_x.T, y, y_new).T
+
+
+def gradient_surfaces(alpha_knots, min_knots, alpha_grid, min_grid, n, max_size,
+                      shape_probs, poly_probs, densities=None, rng=None, quantiles=(5, 50, 95)):
+    """
+    {stat: mass_g on np.meshgrid(alpha_grid, min_grid)} from one MC run per
+    (alpha_knots x min_knots) point. log(mass) is interpolated with its pathwise
+    gradients, so a coarse knot grid stands in for a dense grid of runs.
+    """
+    knots_a, knots_m = np.meshgrid(alpha_knots, min_knots)
+    log_mass, d_alpha, d_min = {}, {}, {}
+    for i, j in np.ndindex(knots_a.shape):
+        stats, grads = mass_statistics_with_gradients(n, knots_a[i, j], knots_m[i, j], max_size,
+                                                      shape_probs, poly_probs, densities, rng, quantiles)
+        for stat, value in stats.items():
+            for out in (log_mass, d_alpha, d_min):
+                out.setdefault(stat, np.zeros(knots_a.shape))
+            log_mass[stat][i, j] = np.log(value)
+            d_alpha[stat][i, j], d_min[stat][i, j] = grads[stat][:2] / value
+    return {stat: np.exp(hermite_surface(alpha_knots, min_knots, log_mass[stat], d_alpha[stat],
+                                         d_min[stat], alpha_grid, min_grid))
+            for stat in log_mass}
+
+
+def _fused_chunk(u_shape, u_poly, u_size, cum_shape, cum_poly, coef, power, rho,
+                 alpha, min_um, max_um, hist_lo, hist_scale, hist, acc):
+    """
+    One pass over a chunk of uniforms: codes, size, mass and the reductions.
+    acc = [sum, sum of squares, min, max], updated in place.
+    """
+    one_minus = 1.0 - alpha
+    log_uniform = abs(one_minus) < 0.01
+    lo_p = min_um ** one_minus
+    span_p = max_um ** one_minus - lo_p
+    log_ratio = np.log(max_um / min_um)
+    n_shape, n_poly, n_bins = cum_shape.shape[0], cum_poly.shape[0], hist.shape[0]
+    for i in range(u_size.shape[0]):
+        s = 0
+        while s < n_shape - 1 and u_shape[i] >= cum_shape[s]:
+            s += 1
+        p = 0
+        while p < n_poly - 1 and u_poly[i] >= cum_poly[p]:
+            p += 1
+        if log_uniform:
+            size = min_um * np.exp(u_size[i] * log_ratio)
+        else:
+            size = (span_p * u_size[i] + lo_p) ** (1.0 / one_minus)
+        m = coef[s] * size ** power[s] * UM3_TO_CM3 * rho[p]
+        acc[0] += m
+        acc[1] += m * m
+        if m < acc[2]:
+            acc[2] = m
+        if m > acc[3]:
+            acc[3] = m
+        if m > 0.0:
+            b = int((np.log10(m) - hist_lo) * hist_scale)
+            hist[min(max(b, 0), n_bins - 1)] += 1
+
+
+if numba is not None:
+    _fused_chunk_jit = numba.njit(cache=True, nogil=True)(_fused_chunk)
+else:
+    _fused_chunk_jit = None
+
+
+def _numpy_chunk(u_shape, u_poly, u_size, cum_shape, cum_poly, coef, power, rho,
+                 alpha, min_um, max_um, hist_lo, hist_scale, hist, acc):
+    """NumPy equivalent of _fused_chunk; temporaries are bounded by the chunk length"""
+    masses = masses_from_codes(sizes_from_uniform(u_size, alpha, min_um, max_um),
+                               draw_codes(u_shape, cum_shape), draw_codes(u_poly, cum_poly), coef, power, rho)
+    acc[0] += masses.sum()
+    acc[1] += masses @ masses
+    acc[2] = min(acc[2], masses.min())
+    acc[3] = max(acc[3], masses.max())
+    positive = masses[masses > 0]
+    bins = np.clip(((np.log10(positive) - hist_lo) * hist_scale).astype(np.int64), 0, len(hist) - 1)
+    hist += np.bincount(bins, minlength=len(hist))
+
+
+def histogram_quantiles(hist, edges, quantiles=(5, 50, 95)):
+    """Quantiles from binned counts, linear within a bin (edges in log10 units -> values)"""
+    cum = np.concatenate([[0.0], np.cumsum(hist, dtype=float)])
+    targets = np.asarray(quantiles, dtype=float) / 100.0 * cum[-1]
+    return 10.0 ** np.interp(targets, cum, edges)
+
+
+def stream_mass_statistics(n, alpha, min_size, max_size, shape_probs, poly_probs, densities=None,
+                           rng=None, chunk=STREAM_CHUNK, quantiles=(5, 50, 95), use_jit=None):
+    """
+    Mean, std, min/max and histogram quantiles of n particle masses without holding them.
+    Uniforms are drawn into reused chunk buffers; the compiled and NumPy paths consume the
+    same random stream. use_jit=None picks numba when available.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    use_jit = (_fused_chunk_jit is not None) if use_jit is None else use_jit
+    if use_jit and _fused_chunk_jit is None:
+        raise ImportError("numba is not installed")
+    kernel = _fused_chunk_jit if use_jit else _numpy_chunk
+
+    coef, power = shape_geometry(list(shape_probs.keys()))
+    rho = density_array(list(poly_probs.keys()), densities)
+    cum_shape = np.cumsum(list(shape_probs.values()), dtype=float)
+    cum_poly = np.cumsum(list(poly_probs.values()), dtype=float)
+    hist_lo, hist_hi = STREAM_HIST_RANGE
+    hist_scale = STREAM_HIST_BINS / (hist_hi - hist_lo)
+    hist = np.zeros(STREAM_HIST_BINS, dtype=np.int64)
+    acc = np.array([0.0, 0.0, np.inf, -np.inf])
+
+    buffers = np.empty((3, min(chunk, n)))
+    for start in range(0, n, chunk):
+        k = min(chunk, n - start)
+        u = buffers[:, :k]
+        for row in u:
+            rng.random(out=row)
+        kernel(u[0], u[1], u[2], cum_shape, cum_poly, coef, power, rho,
+               float(alpha), float(min_size), float(max_size), hist_lo, hist_scale, hist, acc)
+
+    mean = acc[0] / n
+    edges = np.linspace(hist_lo, hist_hi, STREAM_HIST_BINS + 1)
+    stats = {'n': n, 'mean': mean, 'std': np.sqrt(max(acc[1] / n - mean ** 2, 0.0)),
+             'min': acc[2], 'max': acc[3], 'hist': hist, 'log10_edges': edges}
+    for q, v in zip(quantiles, histogram_quantiles(hist, edges, quantiles)):
+        stats[f'P{q:g}'] = v
+    return stats
+
+
+def bootstrap_statistics(masses_g, weights=None, n_boot=BOOTSTRAP_REPLICATES, quantiles=(5, 50, 95),
+                         ci=95, rng=None, presorted=False):
+    """
+    Monte Carlo error of the mean and quantiles of one set of draws (nonparametric bootstrap).
+
+    All replicates are drawn as one index matrix and turned into per-draw counts, so
+    every replicate reuses a single sort of the masses: replicate means are count-weighted
+    sums and replicate quantiles come from cumulative counts over the sorted masses.
+    Optional per-draw weights (e.g. prior reweighting) multiply the counts.
+    Returns {stat: {'lo': .., 'hi': .., 'se': ..}} for 'mean' and each 'P<q>'.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    masses_g = np.asarray(masses_g, dtype=float)
+    base = None if weights is None else np.asarray(weights, dtype=float)
+    if not presorted:
+        order = np.argsort(masses_g, kind='stable')
+        masses_g = masses_g[order]
+        base = None if base is None else base[order]
+
+    n = len(masses_g)
+    names = ['mean'] + [f'P{q:g}' for q in quantiles]
+    fractions = np.asarray(quantiles, dtype=float) / 100.0
+    replicates = np.empty((len(names), n_boot))
+    block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // max(n, 1))
+    for start in range(0, n_boot, block):
+        k = min(block, n_boot - start)
+        # Row r of the index matrix is shifted by r * n so one bincount gives all count vectors
+        idx = rng.integers(0, n, size=(k, n)) + (np.arange(k) * n)[:, None]
+        w = np.bincount(idx.ravel(), minlength=k * n).reshape(k, n).astype(float)
+        if base is not None:
+            w *= base
+        cum = np.cumsum(w, axis=1)
+        total = cum[:, -1]
+        replicates[0, start:start + k] = (w @ masses_g) / total
+        # Rows of cum are increasing; offsetting row r by r * (total.max() + 1) makes the
+        # flattened array sorted, so one searchsorted answers every replicate
+        offset = np.arange(k) * (total.max() + 1.0)
+        flat = (cum + offset[:, None]).ravel()
+        for j, frac in enumerate(fractions):
+            pos = np.searchsorted(flat, frac * total + offset, side='left') - np.arange(k) * n
+            replicates[j + 1, start:start + k] = masses_g[np.clip(pos, 0, n - 1)]
+
+    tail = (100.0 - ci) / 2.0
+    lo, hi = np.percentile(replicates, [tail, 100.0 - tail], axis=1)
+    se = replicates.std(axis=1, ddof=1) if n_boot > 1 else np.zeros(len(names))
+    return {name: {'lo': float(lo[j]), 'hi': float(hi[j]), 'se': float(se[j])} for j, name in enumerate(names)}
+
+
+def sample_dirichlet_compositions(probs, n_outer, concentration, rng):
+    """Draw n_outer composition vectors around probs; concentration ~ effective sample count"""
+    probs = np.asarray(probs, dtype=float)
+    probs = probs / probs.sum()
+    if concentration is None or np.isinf(concentration):
+        return np.tile(probs, (n_outer, 1))
+    return rng.dirichlet(np.maximum(probs * concentration, 1e-6), size=n_outer)
+
+
+def nested_mass_statistics(alpha, min_size, max_size, shape_probs, poly_probs,
+                           n_outer=200, n_inner=2000, shape_concentration=100.0,
+                           poly_concentration=100.0, quantiles=(5, 50, 95),
+                           densities=None, rng=None):
+    """
+    Two-level uncertainty in one batched pass.
+
+    Outer level: n_outer shape and polymer composition vectors drawn from
+    Dirichlet(concentration * prior). Inner level: n_inner particles per
+    composition. All n_outer x n_inner draws are evaluated as one array.
+
+    Returns a dict of per-composition statistics, each of shape (n_outer,):
+    'mean' and one 'P<q>' entry per requested particle-mass quantile.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    shape_comp = sample_dirichlet_compositions(
+        list(shape_probs.values()), n_outer, shape_concentration, rng)
+    poly_comp = sample_dirichlet_compositions(
+        list(poly_probs.values()), n_outer, poly_concentration, rng)
+    return composition_mass_statistics(alpha, min_size, max_size, list(shape_probs.keys()), shape_comp,
+                                       list(poly_probs.keys()), poly_comp, n_inner, quantiles, densities, rng)
+
+
+def composition_mass_statistics(alpha, min_size, max_size, shape_keys, shape_comp, poly_keys, poly_comp,
+                                n=2000, quantiles=(5, 50, 95), densities=None, rng=None, common_codes=False):
+    """
+    Mass statistics of R shape/polymer compositions in one batched pass.
+    shape_comp: (R, len(shape_keys)), poly_comp: (R, len(poly_keys)) probabilities per row.
+    All rows share the n size uniforms, so differences between rows reflect
+    composition only. common_codes=True also shares the shape/polymer uniforms
+    (rows with equal compositions then give identical draws); otherwise each
+    row draws its codes independently.
+    Returns {stat: (R,)} for 'mean' and each 'P<q>'.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    coef, power = shape_geometry(list(shape_keys))
+    rho = density_array(list(poly_keys), densities)
+    n_rows = len(shape_comp)
+
+    code_shape = (1, n) if common_codes else (n_rows, n)
+    shape_codes = draw_codes(rng.random(code_shape), np.cumsum(shape_comp, axis=1))
+    poly_codes = draw_codes(rng.random(code_shape), np.cumsum(poly_comp, axis=1))
+    # Common size draws across compositions isolate the composition effect
+    sizes = sizes_from_uniform(rng.random(n), alpha, min_size, max_size)
+
+    masses_g = masses_from_codes(sizes[None, :], shape_codes, poly_codes, coef, power, rho)
+
+    stats = {'mean': masses_g.mean(axis=1)}
+    q_vals = np.percentile(masses_g, quantiles, axis=1)
+    for q, row in zip(quantiles, q_vals):
+        stats[f'P{q:g}'] = row
+    return stats
+
+
+def nested_flux_quantiles(total_item_flux_yr, alpha, min_size, max_size,
+                          shape_probs, poly_probs, band=(5, 50, 95), **kwargs):
+    """
+    Flux (kt/yr) for each mass statistic, summarised across compositions.
+
+    Returns {stat: {'P5': .., 'P50': .., 'P95': ..}} where stat is 'mean', 'P5',
+    'P50', 'P95' of the particle mass distribution and the inner keys are the
+    composition-uncertainty band for that flux.
+    """
+    stats = nested_mass_statistics(alpha, min_size, max_size, shape_probs,
+                                   poly_probs, **kwargs)
+    result = {}
+    for name, masses in stats.items():
+        flux_kt = total_item_flux_yr * masses / 1e9
+        band_vals = np.percentile(flux_kt, band)
+        result[name] = {f'P{b:g}': float(v) for b, v in zip(band, band_vals)}
+    return result
+
+
+class ReweightableDraws:
+    """
+    A fixed set of coded MC draws that can be re-targeted to new shape/polymer
+    priors without sampling again.
+
+    Shape and polymer are drawn independently of size, so changing a prior only
+    changes the importance weight new_prob / old_prob of each (shape, polymer)
+    cell. Per-cell sums, counts and histograms are cached once, so the weighted
+    mean and histogram cost O(cells) and the weighted quantiles cost O(n).
+    """
+
+    def __init__(self, masses_g, shape_codes, poly_codes, shape_probs, poly_probs, hist_bins=REWEIGHT_HIST_BINS):
+        self.masses_g = masses_g
+        self.shape_keys = list(shape_probs.keys())
+        self.poly_keys = list(poly_probs.keys())
+        self.draw_shape = np.array(list(shape_probs.values()), dtype=float)
+        self.draw_poly = np.array(list(poly_probs.values()), dtype=float)
+
+        n_cells = len(self.shape_keys) * len(self.poly_keys)
+        self.cell = shape_codes * len(self.poly_keys) + poly_codes
+        self.cell_count = np.bincount(self.cell, minlength=n_cells).astype(float)
+        self.cell_sum = np.bincount(self.cell, weights=masses_g, minlength=n_cells)
+
+        order = np.argsort(masses_g)
+        self.sorted_masses = masses_g[order]
+        self.sorted_cell = self.cell[order]
+
+        log_mg = np.log10(masses_g * 1000 + 1e-12)
+        self.hist_edges = np.histogram_bin_edges(log_mg, bins=hist_bins)
+        bin_idx = np.clip(np.searchsorted(self.hist_edges, log_mg, side='right') - 1, 0, hist_bins - 1)
+        self.cell_hist = np.bincount(self.cell * hist_bins + bin_idx,
+                                     minlength=n_cells * hist_bins).reshape(n_cells, hist_bins).astype(float)
+
+    def can_reweight(self, shape_probs, poly_probs):
+        """False if a category gains probability it was never drawn with"""
+        for keys, drawn, probs in [(self.shape_keys, self.draw_shape, shape_probs),
+                                   (self.poly_keys, self.draw_poly, poly_probs)]:
+            if set(probs) - set(keys):
+                return False
+            new = np.array([probs.get(k, 0.0) for k in keys])
+            if np.any((drawn <= 0) & (new > 0)):
+                return False
+        return True
+
+    def cell_weights(self, shape_probs, poly_probs):
+        new_shape = np.array([shape_probs.get(k, 0.0) for k in self.shape_keys])
+        new_poly = np.array([poly_probs.get(k, 0.0) for k in self.poly_keys])
+        ratio_shape = np.divide(new_shape, self.draw_shape,
+                                out=np.zeros_like(new_shape), where=self.draw_shape > 0)
+        ratio_poly = np.divide(new_poly, self.draw_poly,
+                               out=np.zeros_like(new_poly), where=self.draw_poly > 0)
+        return np.outer(ratio_shape, ratio_poly).ravel()
+
+    def effective_sample_size(self, w_cell):
+        total = w_cell @ self.cell_count
+        return total ** 2 / ((w_cell ** 2) @ self.cell_count)
+
+    def mean(self, w_cell):
+        return (w_cell @ self.cell_sum) / (w_cell @ self.cell_count)
+
+    def quantiles(self, w_cell, quantiles=(5, 50, 95)):
+        cum_w = np.cumsum(w_cell[self.sorted_cell])
+        idx = np.searchsorted(cum_w, np.asarray(quantiles) / 100.0 * cum_w[-1])
+        return self.sorted_masses[np.minimum(idx, len(cum_w) - 1)]
+
+    def bootstrap(self, w_cell, **kwargs):
+        """bootstrap_statistics of the reweighted draws (uses the cached sort)"""
+        return bootstrap_statistics(self.sorted_masses, w_cell[self.sorted_cell], presorted=True, **kwargs)
+
+    def histogram(self, w_cell):
+        """Weighted counts over the cached log10(mg) bin edges"""
+        return w_cell @ self.cell_hist, self.hist_edges
+
+    def running_mean(self, w_cell):
+        w = w_cell[self.cell]
+        return np.cumsum(w * self.masses_g) / np.maximum(np.cumsum(w), 1e-300)
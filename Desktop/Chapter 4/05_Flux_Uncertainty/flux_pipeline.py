@@ -0,0 +1,383 @@
+"""
+Stage-level pipeline for the Level 12 and DDM30 exports
+- Stages are DAG nodes: load atlas, load flux, merge, centroids, mean mass,
+  DDM30 polygons/metadata, assign, export
+- Each stage key hashes its code, parameters, the content of its input files
+  and the keys of its upstream stages; results are pickled under cache/pipeline/
+- A stage's code is its own function plus the source files of the modules it
+  delegates to (Stage code=), so editing e.g. export_basin_data reruns its stages
+- Shared stages (atlas, flux, merge, centroids) run once for both exports, and
+  a rerun only executes stages downstream of a changed input
+- File content hashes are memoised by (size, mtime), so unchanged multi-GB
+  inputs are not re-read to be hashed
+
+    python flux_pipeline.py --atlas lev12.shp --flux Flux_Data_Modeling.csv \
+        --ddm30-shp basins_joined.shp --ddm30-csv ddm30_meta.csv --out-dir .
+    python flux_pipeline.py --targets coastal_js          # Level 12 export only
+"""
+
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+
+from flux_ranking import ranking_path_for
+from pipeline_profiler import NULL_PROFILER, add_profiler_arguments, profiler_from_args
+
+UNC_DIR = os.path.dirname(os.path.abspath(__file__))
+PIPELINE_CACHE_DIR = os.path.join(UNC_DIR, "cache", "pipeline")
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+
+SHAPEFILE_PARTS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+# Modules whose code the stage wrappers call into (transitively, within this package)
+MASS_CODE = ('export_basin_data', 'priors', 'regional_priors', 'flux_mc')
+COASTAL_EXPORT_CODE = ('export_basin_data', 'flux_ranking', 'regional_priors', 'flux_mc')
+DDM30_CODE = ('06_Aggregate_DDM30',)
+DDM30_EXPORT_CODE = ('06_Aggregate_DDM30', 'flux_ranking', 'regional_priors')
+FLUX_COLUMNS = ['HYBAS_ID', 'Flux_Linear', 'Natural_Discharge_Upstream']
+HASH_BLOCK = 1 << 20
+
+
+def expand_inputs(path):
+    """A shapefile is its .shp plus the sidecar files that exist"""
+    stem, ext = os.path.splitext(path)
+    if ext.lower() != '.shp':
+        return [path]
+    return [stem + part for part in SHAPEFILE_PARTS if os.path.exists(stem + part)]
+
+
+class FileHasher:
+    """sha1 of file contents, memoised on disk by (path, size, mtime_ns)"""
+
+    def __init__(self, memo_path=None):
+        self.memo_path = memo_path
+        self.memo = {}
+        if memo_path and os.path.exists(memo_path):
+            with open(memo_path) as f:
+                self.memo = json.load(f)
+
+    def __call__(self, path):
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        entry = self.memo.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha1']
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK), b''):
+                digest.update(block)
+        self.memo[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': digest.hexdigest()}
+        return digest.hexdigest()
+
+    def save(self):
+        if self.memo_path:
+            os.makedirs(os.path.dirname(self.memo_path), exist_ok=True)
+            with open(self.memo_path, 'w') as f:
+                json.dump(self.memo, f, indent=1)
+
+
+def code_fingerprint(func):
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__code__.co_code.hex()
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+
+def module_source(name):
+    """Path of a module's source file, found without importing it"""
+    spec = importlib.util.find_spec(name)
+    if spec is None or not spec.origin or not os.path.exists(spec.origin):
+        raise ValueError(f"No source file for code dependency {name!r}")
+    return spec.origin
+
+
+class Stage:
+    """
+    func(*upstream_results, **params) -> result
+    files   : input files whose content is part of the key
+    outputs : files the stage writes; a cached result is only reused while they are unchanged
+    code    : names of the modules func delegates to; their source files are part of the key
+    """
+
+    def __init__(self, name, func, deps=(), files=(), params=None, outputs=(), code=()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.files = tuple(files)
+        self.params = dict(params or {})
+        self.outputs = tuple(outputs)
+        self.code = tuple(code)
+
+
+class Pipeline:
+    def __init__(self, cache_dir=PIPELINE_CACHE_DIR, profiler=NULL_PROFILER, verbose=True):
+        self.cache_dir = cache_dir
+        self.profiler = profiler
+        self.verbose = verbose
+        self.stages = {}
+        self.hasher = FileHasher(os.path.join(cache_dir, "file_hashes.json") if cache_dir else None)
+        self._keys = {}
+        self.executed, self.cached = [], []
+
+    def add(self, name, func, deps=(), files=(), params=None, outputs=(), code=()):
+        missing = [d for d in deps if d not in self.stages]
+        if missing:
+            raise ValueError(f"Stage {name!r} depends on undeclared stages {missing}")
+        self.stages[name] = Stage(name, func, deps, files, params, outputs, code)
+        return self
+
+    def key(self, name):
+        """Content hash of a stage: code (function and module deps), params, input file contents and upstream keys"""
+        if name not in self._keys:
+            stage = self.stages[name]
+            files = {p: self.hasher(p) for path in stage.files for p in expand_inputs(path)}
+            modules = {module: self.hasher(module_source(module)) for module in stage.code}
+            raw = json.dumps({'stage': name, 'code': code_fingerprint(stage.func), 'modules': modules,
+                              'params': stage.params, 'files': files, 'outputs': stage.outputs,
+                              'deps': [self.key(d) for d in stage.deps]}, sort_keys=True, default=str)
+            self._keys[name] = hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+        return self._keys[name]
+
+    def order(self, targets):
+        """Upstream closure of the targets, dependencies first"""
+        seen, order = set(), []
+
+        def visit(name):
+            if name in seen:
+                return
+            seen.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            order.append(name)
+
+        for target in targets:
+            visit(target)
+        return order
+
+    def _cache_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}_{self.key(name)}.pkl")
+
+    def _is_cached(self, name):
+        """A result exists for the current key and the stage's outputs are unchanged since it was stored"""
+        if not self.cache_dir or not os.path.exists(self._cache_path(name)):
+            return False
+        manifest = self._cache_path(name)[:-4] + '.json'
+        outputs = {}
+        if os.path.exists(manifest):
+            with open(manifest) as f:
+                outputs = json.load(f)
+        # Outputs deleted or edited since the run -> execute again
+        return all(os.path.exists(out) and self.hasher(out) == digest for out, digest in outputs.items())
+
+    def _load(self, name):
+        with open(self._cache_path(name), 'rb') as f:
+            return pickle.load(f)
+
+    def _store(self, name, result):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._cache_path(name)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+        with open(path[:-4] + '.json', 'w') as f:
+            json.dump({out: self.hasher(out) for out in self.stages[name].outputs}, f, indent=1)
+
+    def run(self, targets=None, force=()):
+        """
+        Execute the targets (default: every stage without dependents) and their upstream stages.
+        A stage runs at most once per call; cached stages are loaded lazily, only if a
+        downstream stage has to run. Returns {target: result}.
+        """
+        targets = list(targets or self.sinks())
+        self._keys = {}
+        self.executed, self.cached = [], []
+        results = {}
+        order = self.order(targets)
+        cached = {name for name in order if name not in force and self._is_cached(name)}
+
+        def result_of(name):
+            if name not in results:
+                if name in cached:
+                    results[name] = self._load(name)
+                else:
+                    execute(name)
+            return results[name]
+
+        def execute(name):
+            stage = self.stages[name]
+            args = [result_of(d) for d in stage.deps]
+            t0 = time.perf_counter()
+            with self.profiler.stage(name) as st:
+                results[name] = stage.func(*args, **stage.params)
+                st.rows = len(results[name]) if hasattr(results[name], '__len__') else None
+            self._store(name, results[name])
+            self.executed.append(name)
+            if self.verbose:
+                print(f"  [run]    {name} ({time.perf_counter() - t0:.2f} s)")
+
+        for name in order:
+            # Upstream changes alter the key, so a cached key means nothing it depends on changed
+            if name in cached:
+                self.cached.append(name)
+                if self.verbose:
+                    print(f"  [cached] {name}")
+            else:
+                result_of(name)
+        self.hasher.save()
+        return {t: result_of(t) for t in targets}
+
+    def sinks(self):
+        used = {d for stage in self.stages.values() for d in stage.deps}
+        return [name for name in self.stages if name not in used]
+
+
+# --- Stage functions ---
+def load_atlas(atlas_path):
+    import geopandas as gpd
+    gdf = gpd.read_file(atlas_path, columns=['HYBAS_ID', 'COAST'])
+    gdf['HYBAS_ID'] = gdf['HYBAS_ID'].astype('int64')
+    return gdf
+
+
+def load_flux(flux_path):
+    df = pd.read_csv(flux_path, usecols=FLUX_COLUMNS)
+    df['HYBAS_ID'] = df['HYBAS_ID'].astype('int64')
+    return df
+
+
+def merge_flux(atlas, flux):
+    return atlas.merge(flux, on='HYBAS_ID', how='inner')
+
+
+def centroids(merged):
+    """Polygons replaced by their centroids; everything downstream works on points"""
+    points = merged.copy()
+    points['geometry'] = merged.geometry.centroid
+    return points
+
+
+def mean_mass(prior_shape, prior_poly, n=5000, alpha=2.64, min_size=100, max_size=5000, seed=0,
+              regional_priors=None, region_digits=1):
+    """Global mean particle mass (g), or a RegionalMass keyed by HYBAS_ID prefix"""
+    from export_basin_data import DENSITIES, estimate_mean_mass, load_priors
+    from regional_priors import RegionalPriors
+    shape_probs, poly_probs = load_priors(prior_shape, prior_poly)
+    if regional_priors:
+        regional = RegionalPriors.from_csv(regional_priors, shape_probs, poly_probs, 'hybas', region_digits)
+        return regional.mean_mass(n, alpha, min_size, max_size, DENSITIES, np.random.default_rng(seed))
+    np.random.seed(seed)
+    return estimate_mean_mass(shape_probs, poly_probs, n, alpha, min_size, max_size)
+
+
+def coastal_export(points, mass_g, output_file):
+    from export_basin_data import export_merged_basins
+    coastal = points[points['COAST'] == 1].drop(columns=['COAST']).reset_index(drop=True)
+    export_merged_basins(coastal, mass_g, output_file)
+    return output_file
+
+
+def _aggregate_module():
+    return importlib.import_module('06_Aggregate_DDM30')
+
+
+def load_ddm30(ddm30_shp_path):
+    return _aggregate_module().read_ddm30_polygons(ddm30_shp_path)
+
+
+def assign_outlets(points, ddm30):
+    """Centroid-in-polygon assignment and max-discharge outlet per DDM30 basin"""
+    import geopandas as gpd
+    points = points.drop(columns=['COAST'])
+    if points.crs and points.crs.to_epsg() != 4326:
+        points = points.to_crs(epsg=4326)
+    joined = gpd.sjoin(points, ddm30[['Basin_ID', 'Basin_name', 'geometry']], how="inner", predicate="within")
+    joined = joined.sort_values(by='Natural_Discharge_Upstream', ascending=False)
+    return pd.DataFrame(joined.drop_duplicates(subset=['Basin_ID'], keep='first').drop(columns='geometry'))
+
+
+def ddm30_export(outlets, ddm30_csv_path, output_path):
+    _aggregate_module().write_ddm30_export(outlets, ddm30_csv_path, output_path)
+    return output_path
+
+
+def ddm30_export_regional(outlets, regional_mass, ddm30_csv_path, output_path):
+    """DDM30 export with per-basin mass scaled by the outlet's prior region"""
+    _aggregate_module().write_ddm30_export(outlets, ddm30_csv_path, output_path, regional_mass=regional_mass)
+    return output_path
+
+
+def build_export_pipeline(atlas, flux, ddm30_shp=None, ddm30_csv=None, out_dir=UNC_DIR,
+                          prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY,
+                          cache_dir=PIPELINE_CACHE_DIR, profiler=NULL_PROFILER,
+                          regional_priors=None, region_digits=1):
+    """
+    Both exports as one DAG; the DDM30 branch is added when its inputs are given.
+    regional_priors: optional region,category,prob CSV matched by HYBAS_ID prefix (outlet HYBAS_ID for DDM30).
+    """
+    coastal_js = os.path.join(out_dir, 'coastal_data.js')
+    pipe = Pipeline(cache_dir, profiler)
+    pipe.add('load_atlas', load_atlas, files=[atlas], params={'atlas_path': atlas})
+    pipe.add('load_flux', load_flux, files=[flux], params={'flux_path': flux})
+    pipe.add('merge', merge_flux, deps=['load_atlas', 'load_flux'])
+    pipe.add('centroids', centroids, deps=['merge'])
+    mass_params = {'prior_shape': prior_shape, 'prior_poly': prior_poly}
+    if regional_priors:
+        mass_params.update(regional_priors=regional_priors, region_digits=region_digits)
+    pipe.add('mean_mass', mean_mass, files=[prior_shape, prior_poly] + ([regional_priors] if regional_priors else []),
+             params=mass_params, code=MASS_CODE)
+    pipe.add('coastal_js', coastal_export, deps=['centroids', 'mean_mass'],
+             params={'output_file': coastal_js}, outputs=[coastal_js, ranking_path_for(coastal_js)],
+             code=COASTAL_EXPORT_CODE)
+    if ddm30_shp and ddm30_csv:
+        ddm30_js = os.path.join(out_dir, 'coastal_data_ddm30.js')
+        pipe.add('load_ddm30', load_ddm30, files=[ddm30_shp], params={'ddm30_shp_path': ddm30_shp}, code=DDM30_CODE)
+        pipe.add('assign', assign_outlets, deps=['centroids', 'load_ddm30'])
+        # Without regional priors the DDM30 export does not depend on the mean-mass stage
+        export, deps = (ddm30_export_regional, ['assign', 'mean_mass']) if regional_priors else (ddm30_export, ['assign'])
+        pipe.add('ddm30_js', export, deps=deps, files=[ddm30_csv],
+                 params={'ddm30_csv_path': ddm30_csv, 'output_path': ddm30_js},
+                 outputs=[ddm30_js, ranking_path_for(ddm30_js)], code=DDM30_EXPORT_CODE)
+    return pipe
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from pfaf_rollup import FLUX_FILE, LEV12_SHP
+
+    parser = add_profiler_arguments(argparse.ArgumentParser(description="Run the export pipeline with stage caching"))
+    parser.add_argument('--atlas', default=LEV12_SHP)
+    parser.add_argument('--flux', default=FLUX_FILE)
+    parser.add_argument('--ddm30-shp', default=None)
+    parser.add_argument('--ddm30-csv', default=None)
+    parser.add_argument('--out-dir', default=UNC_DIR)
+    parser.add_argument('--cache-dir', default=PIPELINE_CACHE_DIR)
+    parser.add_argument('--targets', nargs='+', default=None, help="Stages to build (default: all exports)")
+    parser.add_argument('--force', nargs='*', default=(), help="Stages to execute even if cached")
+    parser.add_argument('--regional-priors', default=None, help="CSV of region,category,prob (HYBAS_ID prefix regions)")
+    parser.add_argument('--region-digits', type=int, default=1, help="HYBAS_ID prefix length of the regions")
+    args = parser.parse_args()
+
+    profiler = profiler_from_args('flux_pipeline', args)
+    pipe = build_export_pipeline(args.atlas, args.flux, args.ddm30_shp, args.ddm30_csv, args.out_dir,
+                                 cache_dir=args.cache_dir, profiler=profiler,
+                                 regional_priors=args.regional_priors, region_digits=args.region_digits)
+    t0 = time.perf_counter()
+    try:
+        outputs = pipe.run(args.targets, force=args.force)
+    finally:
+        profiler.write_report(args.profile_report or os.path.join(args.out_dir, "flux_pipeline_run_report.json"))
+    print(f"Executed {len(pipe.executed)}, cached {len(pipe.cached)} stages in {time.perf_counter() - t0:.2f} s")
+    for name, path in outputs.items():
+        print(f"  {name}: {path}")
@@ -0,0 +1,150 @@
+"""
+Ranking and cumulative-share index of basin flux
+- Mass flux of a basin is its item flux times one mean particle mass, so the order
+  of the basins and their cumulative flux shares do not depend on alpha or the size
+  bounds: the index is built once (argsort of item flux) and only scaled per query
+- Top-N is a slice (O(1)), the number of basins carrying X% of the flux is a
+  searchsorted on the cumulative share (O(log n)), the rank of a basin is O(1)
+- Persisted as <export>_ranking.npz next to coastal_data*.js and embedded in the
+  export ('ranking': order of basin positions) for the dashboards
+- Regional-prior exports give each region its own mass, so the order holds only at
+  the export parameters; those are ranked by flux_baseline with invariant=False
+
+    ranking = FluxRanking.for_export('coastal_data.js')
+    ranking.top(10)                           # positions of the 10 largest basins
+    ranking.count_for_share(0.9)              # basins making up 90% of the flux
+    ranking.summary(mean_mass_g=4.76e-5)      # totals (kt/yr), top basins, shares
+"""
+
+import json
+import os
+
+import numpy as np
+
+SUMMARY_SHARES = (0.5, 0.9, 0.99)
+PARETO_POINTS = 100
+
+
+def ranking_path_for(js_path):
+    return os.path.splitext(js_path)[0] + "_ranking.npz"
+
+
+class FluxRanking:
+    """
+    order      : (B,) basin positions by decreasing weight (stable, ties keep export order)
+    cum_share  : (B,) share of the total carried by the first k + 1 basins of order
+    rank       : (B,) 0-based rank of each basin position
+    invariant  : True when the weights are item flux (the order holds for any parameters)
+    """
+
+    def __init__(self, ids, weights, invariant=True):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=float)
+        self.invariant = bool(invariant)
+        self.order = np.argsort(-self.weights, kind='stable')
+        cumulative = np.cumsum(self.weights[self.order])
+        self.total = float(cumulative[-1]) if len(cumulative) else 0.0
+        self.cum_share = cumulative / self.total if self.total > 0 else np.zeros(len(cumulative))
+        self.rank = np.empty(len(self.order), dtype=np.int64)
+        self.rank[self.order] = np.arange(len(self.order))
+
+    def __len__(self):
+        return len(self.order)
+
+    @classmethod
+    def from_basins(cls, basins, regional=False):
+        """From the exported basin records; regional exports rank by flux_baseline"""
+        column = 'flux_baseline' if regional else 'flux_items'
+        return cls([b['id'] for b in basins], [b[column] for b in basins], invariant=not regional)
+
+    # --- Persistence ---
+    def save(self, path):
+        np.savez_compressed(path, ids=self.ids, weights=self.weights, invariant=self.invariant)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['ids'], data['weights'], bool(data['invariant']))
+
+    @classmethod
+    def for_export(cls, js_path, rebuild=False):
+        """Load the persisted ranking next to an export; rebuild it if the export is newer"""
+        path = ranking_path_for(js_path)
+        if not rebuild and os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(js_path):
+            return cls.load(path)
+        with open(js_path, encoding='utf-8') as f:
+            data = json.loads(f.read().split('=', 1)[1].strip().rstrip(';'))
+        ranking = cls.from_basins(data['basins'], regional='prior_regions' in data)
+        ranking.save(path)
+        return ranking
+
+    def to_export(self):
+        """Compact form embedded in the exported JS"""
+        return {'order': self.order.tolist(), 'by': 'flux_items' if self.invariant else 'flux_baseline',
+                'invariant': self.invariant}
+
+    # --- Queries ---
+    def scale(self, mean_mass_g=None):
+        """Factor from the ranked weights to kt/yr (regional weights already are kt/yr)"""
+        if not self.invariant or mean_mass_g is None:
+            return 1.0
+        return mean_mass_g / 1e9
+
+    def top(self, n=10):
+        return self.order[:n]
+
+    def share_of_top(self, n):
+        """Share of the total carried by the n largest basins"""
+        n = min(int(n), len(self))
+        return float(self.cum_share[n - 1]) if n > 0 else 0.0
+
+    def count_for_share(self, share):
+        """Fewest basins whose flux adds up to at least `share` of the total"""
+        share = np.asarray(share, dtype=float)
+        # Tolerance so that share=1.0 is reached despite rounding in the cumulative sum
+        count = np.searchsorted(self.cum_share, share - 1e-12, side='left') + 1
+        return np.minimum(count, len(self))
+
+    def rank_of(self, positions):
+        """1-based rank of basin positions"""
+        return self.rank[positions] + 1
+
+    def pareto(self, n_points=PARETO_POINTS):
+        """(basin count, cumulative share) at log-spaced counts, for Lorenz/Pareto plots"""
+        if not len(self):
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        counts = np.unique(np.geomspace(1, len(self), n_points).round().astype(np.int64))
+        return counts, self.cum_share[counts - 1]
+
+    def summary(self, mean_mass_g=None, n_top=5, shares=SUMMARY_SHARES):
+        """Totals, the n_top basins and the basin counts behind each share"""
+        factor = self.scale(mean_mass_g)
+        top = self.top(n_top)
+        counts = self.count_for_share(shares)
+        return {
+            'n_basins': len(self),
+            'invariant': self.invariant,
+            'total': self.total * factor,
+            'top': [{'id': int(self.ids[p]), 'position': int(p), 'value': float(self.weights[p] * factor),
+                     'share': float(self.weights[p] / self.total) if self.total > 0 else 0.0} for p in top],
+            'count_for_share': {f'{s:g}': int(c) for s, c in zip(shares, counts)},
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build / query the flux ranking index of an export")
+    parser.add_argument('export', help="coastal_data.js or coastal_data_ddm30.js")
+    parser.add_argument('--rebuild', action='store_true')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--shares', type=float, nargs='+', default=list(SUMMARY_SHARES))
+    args = parser.parse_args()
+
+    ranking = FluxRanking.for_export(args.export, rebuild=args.rebuild)
+    print(f"Ranking: {len(ranking)} basins by {'item flux' if ranking.invariant else 'flux_baseline'} "
+          f"-> {ranking_path_for(args.export)}")
+    for share, count in zip(args.shares, ranking.count_for_share(args.shares)):
+        print(f"  {share:.0%} of the flux: {count} basins ({count / max(len(ranking), 1):.2%})")
+    for r, p in enumerate(ranking.top(args.top), 1):
+        print(f"  #{r} {int(ranking.ids[p])}: {ranking.weights[p]:.4g} ({ranking.weights[p] / ranking.total:.2%})")
@@ -0,0 +1,235 @@
+"""
+Rasterize coastal mouth fluxes onto regular lat/lon grids for ocean models
+- Layers: mouth count, items/yr and mass flux (kt/yr) at the mean and P5/P50/P95 particle mass;
+  exports built with regional priors carry a per-basin mass_factor that scales the mass layers
+- Vectorized binning: one np.bincount per layer
+- Optional land mask: mouths that fall in a land cell are moved to the nearest
+  coastal ocean cell (great-circle nearest, KD-tree on cell centres)
+- Output per resolution: float32 .npy files opened with mmap_mode='r', CF-style
+  metadata.json, and a NetCDF3 file when scipy is available
+
+    rasterize_export('coastal_data.js', 'flux_grids', resolutions=(1.0, 0.5, 0.1), land_shp='ne_10m_land.shp')
+    grid = np.load('flux_grids/res_0.5/flux_kt_mean.npy', mmap_mode='r')   # (lat, lon), south first
+"""
+
+import json
+import os
+
+import numpy as np
+
+from basin_index import cKDTree, load_basin_table, lonlat_to_xyz
+from pfaf_rollup import CACHE_DIR, PRIOR_POLY, PRIOR_SHAPE, file_cache_key
+
+try:
+    from scipy.io import netcdf_file
+except ImportError:
+    netcdf_file = None
+
+RESOLUTIONS = (1.0, 0.5, 0.1)
+MASK_ROW_CHUNK = 50
+
+
+def grid_shape(res):
+    return int(round(180.0 / res)), int(round(360.0 / res))
+
+
+def cell_centers(res):
+    n_lat, n_lon = grid_shape(res)
+    lat = -90.0 + (np.arange(n_lat) + 0.5) * res
+    lon = -180.0 + (np.arange(n_lon) + 0.5) * res
+    return lat, lon
+
+
+def cell_index(lon, lat, res):
+    """(row, col) of the cell containing each point; rows run south to north"""
+    n_lat, n_lon = grid_shape(res)
+    row = np.clip(np.floor((np.asarray(lat) + 90.0) / res).astype(np.int64), 0, n_lat - 1)
+    col = np.floor((np.asarray(lon) + 180.0) / res).astype(np.int64) % n_lon
+    return row, col
+
+
+def land_mask_from_shp(land_shp, res, cache_dir=CACHE_DIR):
+    """Boolean (lat, lon) grid, True where the cell centre lies on land; cached per file and resolution"""
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"land_mask_{file_cache_key(land_shp)}_{res:g}.npy")
+        if os.path.exists(cache_path):
+            return np.load(cache_path)
+
+    import geopandas as gpd
+    import shapely
+
+    land = gpd.read_file(land_shp)
+    if land.crs and land.crs.to_epsg() != 4326:
+        land = land.to_crs(epsg=4326)
+    tree = land.sindex
+    lat, lon = cell_centers(res)
+    mask = np.zeros(grid_shape(res), dtype=bool)
+    # Row chunks keep the number of temporary point geometries bounded
+    for start in range(0, len(lat), MASK_ROW_CHUNK):
+        rows = lat[start:start + MASK_ROW_CHUNK]
+        lon_g, lat_g = np.meshgrid(lon, rows)
+        points = shapely.points(lon_g.ravel(), lat_g.ravel())
+        hit, _ = tree.query(points, predicate='within')
+        chunk = np.zeros(points.shape, dtype=bool)
+        chunk[hit] = True
+        mask[start:start + len(rows)] = chunk.reshape(lon_g.shape)
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(cache_path, mask)
+    return mask
+
+
+def coastal_ocean_cells(land_mask):
+    """Ocean cells with at least one land neighbour (longitude wraps)"""
+    ocean = ~land_mask
+    near_land = np.zeros_like(land_mask)
+    near_land |= np.roll(land_mask, 1, axis=1) | np.roll(land_mask, -1, axis=1)
+    near_land[1:] |= land_mask[:-1]
+    near_land[:-1] |= land_mask[1:]
+    return np.flatnonzero(ocean & near_land)
+
+
+def snap_to_ocean(lon, lat, res, land_mask):
+    """
+    Flat cell index for each mouth; mouths on land cells move to the nearest coastal ocean cell.
+    Returns (flat_index, snapped_mask).
+    """
+    n_lat, n_lon = grid_shape(res)
+    row, col = cell_index(lon, lat, res)
+    flat = row * n_lon + col
+    if land_mask is None:
+        return flat, np.zeros(len(flat), dtype=bool)
+    if land_mask.shape != (n_lat, n_lon):
+        raise ValueError(f"Land mask shape {land_mask.shape} does not match the {res} deg grid")
+
+    on_land = land_mask.ravel()[flat]
+    targets = coastal_ocean_cells(land_mask)
+    if on_land.any() and len(targets):
+        c_lat, c_lon = cell_centers(res)
+        target_xyz = lonlat_to_xyz(c_lon[targets % n_lon], c_lat[targets // n_lon])
+        query_xyz = lonlat_to_xyz(np.asarray(lon)[on_land], np.asarray(lat)[on_land])
+        if cKDTree is not None:
+            _, nearest = cKDTree(target_xyz).query(query_xyz)
+        else:
+            nearest = np.array([np.argmin(((target_xyz - q) ** 2).sum(axis=1)) for q in query_xyz])
+        flat = flat.copy()
+        flat[on_land] = targets[nearest]
+    return flat, on_land
+
+
+def rasterize(flat_index, layers, res):
+    """Sum each (n,) layer into a (lat, lon) grid with one bincount"""
+    n_cells = np.prod(grid_shape(res))
+    return {name: np.bincount(flat_index, weights=values, minlength=n_cells).reshape(grid_shape(res))
+            for name, values in layers.items()}
+
+
+def mouth_layers(table, alpha=2.64, min_size=100, max_size=5000,
+                 prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY):
+    """
+    Per-mouth layers: count, items/yr and kt/yr at the mean and P5/P50/P95 particle mass.
+    Global-prior masses are scaled by the export's per-basin mass_factor when present
+    (regional priors), so the layers agree with the export's flux_baseline.
+    """
+    from priors import load_priors
+    from flux_lookup import mass_statistics_exact
+
+    shape_probs, poly_probs = load_priors(prior_shape, prior_poly)
+    mass = mass_statistics_exact(alpha, min_size, max_size, shape_probs, poly_probs)
+    mass_items = table['flux_items'] * table.get('mass_factor', 1.0)
+    layers = {'n_mouths': np.ones(len(table['id'])), 'flux_items': table['flux_items']}
+    for stat, m in mass.items():
+        layers[f'flux_kt_{stat}'] = mass_items * float(m) / 1e9
+    return layers
+
+
+LAYER_UNITS = {'n_mouths': '1', 'flux_items': 'items yr-1'}
+
+
+def write_grids(out_dir, grids, res, attrs):
+    """float32 .npy per layer (memory-mappable), lat/lon axes, metadata.json and optional NetCDF3"""
+    os.makedirs(out_dir, exist_ok=True)
+    lat, lon = cell_centers(res)
+    np.save(os.path.join(out_dir, 'lat.npy'), lat)
+    np.save(os.path.join(out_dir, 'lon.npy'), lon)
+    for name, grid in grids.items():
+        out = np.lib.format.open_memmap(os.path.join(out_dir, f'{name}.npy'), mode='w+',
+                                        dtype=np.float32, shape=grid.shape)
+        out[:] = grid
+        out.flush()
+        del out
+
+    meta = dict(attrs, resolution_deg=res, dims=['lat', 'lon'], shape=list(grid_shape(res)),
+                lat_order='south_to_north', cell_reference='center',
+                variables={name: {'file': f'{name}.npy', 'units': LAYER_UNITS.get(name, 'kt yr-1'),
+                                  'total': float(grid.sum())} for name, grid in grids.items()})
+    with open(os.path.join(out_dir, 'metadata.json'), 'w') as f:
+        json.dump(meta, f, indent=2)
+
+    if netcdf_file is not None:
+        path = os.path.join(out_dir, f'coastal_flux_{res:g}deg.nc')
+        with netcdf_file(path, 'w') as nc:
+            nc.title = 'Coastal microplastic flux'
+            nc.Conventions = 'CF-1.8'
+            nc.createDimension('lat', len(lat))
+            nc.createDimension('lon', len(lon))
+            for axis, values, units in [('lat', lat, 'degrees_north'), ('lon', lon, 'degrees_east')]:
+                var = nc.createVariable(axis, 'f8', (axis,))
+                var[:] = values
+                var.units = units
+            for name, grid in grids.items():
+                var = nc.createVariable(name, 'f4', ('lat', 'lon'))
+                var[:] = grid
+                var.units = LAYER_UNITS.get(name, 'kt yr-1')
+    return meta
+
+
+def rasterize_export(js_path, out_dir, resolutions=RESOLUTIONS, land_shp=None, land_masks=None,
+                     alpha=2.64, min_size=100, max_size=5000,
+                     prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY, cache_dir=CACHE_DIR):
+    """
+    Grid an exported coastal_data*.js at each resolution into out_dir/res_<res>/.
+    land_masks: optional {res: bool array} overriding land_shp.
+    """
+    table = load_basin_table(js_path)
+    layers = mouth_layers(table, alpha, min_size, max_size, prior_shape, prior_poly)
+    results = {}
+    for res in resolutions:
+        mask = (land_masks or {}).get(res)
+        if mask is None and land_shp:
+            mask = land_mask_from_shp(land_shp, res, cache_dir)
+        flat, snapped = snap_to_ocean(table['lon'], table['lat'], res, mask)
+        grids = rasterize(flat, layers, res)
+        attrs = {'source': os.path.basename(js_path), 'n_mouths': int(len(flat)),
+                 'n_snapped_to_ocean': int(snapped.sum()), 'land_mask': land_shp or ('array' if mask is not None else None),
+                 'regional_priors': 'mass_factor' in table,
+                 'params': {'alpha': alpha, 'min_size_um': min_size, 'max_size_um': max_size}}
+        res_dir = os.path.join(out_dir, f'res_{res:g}')
+        results[res] = write_grids(res_dir, grids, res, attrs)
+        print(f"  {res:g} deg: {grid_shape(res)[0]}x{grid_shape(res)[1]} cells, "
+              f"{int((grids['n_mouths'] > 0).sum())} non-empty, {int(snapped.sum())} mouths snapped -> {res_dir}")
+    return results
+
+
+def add_raster_arguments(parser):
+    """Shared --raster-* flags for the export scripts"""
+    group = parser.add_argument_group('rasterization')
+    group.add_argument('--raster-dir', default=None, help="Also grid the export into this directory")
+    group.add_argument('--raster-res', type=float, nargs='+', default=list(RESOLUTIONS))
+    group.add_argument('--land-shp', default=None, help="Land polygons for snapping mouths to ocean cells")
+    return parser
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = add_raster_arguments(argparse.ArgumentParser(description="Rasterize an exported coastal flux file"))
+    parser.add_argument('export', help="coastal_data.js or coastal_data_ddm30.js")
+    parser.add_argument('--alpha', type=float, default=2.64)
+    parser.add_argument('--min-size', type=float, default=100)
+    parser.add_argument('--max-size', type=float, default=5000)
+    args = parser.parse_args()
+    rasterize_export(args.export, args.raster_dir or 'flux_grids', args.raster_res, args.land_shp,
+                     alpha=args.alpha, min_size=args.min_size, max_size=args.max_size)
@@ -0,0 +1,206 @@
+"""
+Scenario matrix: S parameter scenarios evaluated against B basins in one pass
+- A scenario is alpha, min/max size and optionally its own shape/polymer priors, densities,
+  fiber_aspect and film_thickness_um
+- Mean and quantile particle mass of all S scenarios in one batched computation
+  (mixture laws padded to a common width, exact moments, vectorized bisection)
+- S x B flux matrix (kt/yr) as one broadcast per chunk of scenarios; chunks are sized
+  from a memory budget and can be streamed into a memory-mapped .npy
+- Per-scenario totals and rankings without materializing the matrix
+
+    scenarios = scenario_grid(alpha=np.linspace(2, 3.5, 40), min_size=[20, 50, 100], max_size=[5000])
+    matrix = ScenarioMatrix(scenarios, basin_ids, items_yr, shape_probs, poly_probs)
+    matrix.totals('P50')                       # (S,) kt/yr
+    matrix.write_matrix('flux_matrix.npy')     # (S, B) float32, chunked
+"""
+
+import itertools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from flux_lookup import STATS, mixture_components, mixture_statistics
+from flux_mc import FIBER_ASPECT, FILM_THICKNESS_UM
+
+MEMORY_BUDGET_MB = 256
+SCENARIO_KEYS = ('alpha', 'min_size', 'max_size')
+
+
+def normalize_scenario(scenario, index=0):
+    """Accept the explorer/preset spellings (min_size_um, ...) and fill a name"""
+    s = dict(scenario.get('parameters', {}), **{k: v for k, v in scenario.items() if k != 'parameters'})
+    for key in ('min_size', 'max_size'):
+        if f'{key}_um' in s:
+            s.setdefault(key, s.pop(f'{key}_um'))
+    missing = [k for k in SCENARIO_KEYS if k not in s]
+    if missing:
+        raise ValueError(f"Scenario {s.get('name', index)} is missing {missing}")
+    s.setdefault('name', f"scenario_{index}")
+    return s
+
+
+def scenario_grid(alpha, min_size, max_size, **shared):
+    """Cartesian product of parameter values; extra keywords (priors, densities) apply to all"""
+    return [dict(shared, name=f"a{a:g}_min{lo:g}_max{hi:g}", alpha=a, min_size=lo, max_size=hi)
+            for a, lo, hi in itertools.product(alpha, min_size, max_size)]
+
+
+def load_scenarios(path):
+    """Scenarios from config_presets.json ('scenarios' mapping), a JSON list, or a CSV with one row per scenario"""
+    if path.lower().endswith('.csv'):
+        return [normalize_scenario(row, i) for i, row in enumerate(pd.read_csv(path).to_dict('records'))]
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [dict(v, name=k) for k, v in data['scenarios'].items()]
+    return [normalize_scenario(s, i) for i, s in enumerate(data)]
+
+
+def scenario_components(scenarios, shape_probs, poly_probs, densities=None):
+    """(S, K) weight/coef/power of each scenario's mixture, zero-weight padded to a common K"""
+    comps = [mixture_components(s.get('shape_probs', shape_probs), s.get('poly_probs', poly_probs),
+                                s.get('densities', densities), s.get('fiber_aspect', FIBER_ASPECT),
+                                s.get('film_thickness_um', FILM_THICKNESS_UM)) for s in scenarios]
+    width = max(len(w) for w, _, _ in comps)
+    weight, coef, power = np.zeros((len(comps), width)), np.ones((len(comps), width)), np.ones((len(comps), width))
+    # Scenarios sharing priors share the component arrays; only the padding differs
+    for j, (w, c, p) in enumerate(comps):
+        weight[j, :len(w)], coef[j, :len(w)], power[j, :len(w)] = w, c, p
+    return weight, coef, power
+
+
+def scenario_mass_statistics(scenarios, shape_probs, poly_probs, densities=None, quantiles=(5, 50, 95)):
+    """{stat: (S,) particle mass in g} for all scenarios in one batch"""
+    params = np.array([[s[k] for k in SCENARIO_KEYS] for s in scenarios], dtype=float)
+    weight, coef, power = scenario_components(scenarios, shape_probs, poly_probs, densities)
+    return mixture_statistics(params[:, 0], params[:, 1], params[:, 2], weight, coef, power, quantiles)
+
+
+def chunk_size_for_budget(n_basins, memory_budget_mb=MEMORY_BUDGET_MB, itemsize=8):
+    return max(1, int(memory_budget_mb * 1024 ** 2 // max(1, n_basins * itemsize)))
+
+
+class ScenarioMatrix:
+    """
+    mass[stat]  : (S,) particle mass (g) per scenario
+    items       : (B,) item flux per basin (items/yr)
+    Flux of basin b under scenario s = items[b] * mass[stat][s] / 1e9 (kt/yr).
+    """
+
+    def __init__(self, scenarios, basin_ids, items_yr, shape_probs, poly_probs, densities=None,
+                 memory_budget_mb=MEMORY_BUDGET_MB):
+        self.scenarios = [normalize_scenario(s, i) for i, s in enumerate(scenarios)]
+        self.basin_ids = np.asarray(basin_ids, dtype=np.int64)
+        self.items = np.asarray(items_yr, dtype=float)
+        self.mass = scenario_mass_statistics(self.scenarios, shape_probs, poly_probs, densities)
+        self.chunk = chunk_size_for_budget(len(self.items), memory_budget_mb)
+
+    @property
+    def shape(self):
+        return len(self.scenarios), len(self.items)
+
+    # --- Matrix ---
+    def iter_blocks(self, stat='mean', dtype=np.float64):
+        """Yield (scenario slice, (s, B) flux block in kt/yr), one broadcast per block"""
+        mass_kt = self.mass[stat] / 1e9
+        for start in range(0, len(mass_kt), self.chunk):
+            rows = slice(start, min(start + self.chunk, len(mass_kt)))
+            yield rows, np.multiply.outer(mass_kt[rows], self.items).astype(dtype, copy=False)
+
+    def matrix(self, stat='mean'):
+        """Full (S, B) matrix in memory; use write_matrix for large S x B"""
+        out = np.empty(self.shape)
+        for rows, block in self.iter_blocks(stat):
+            out[rows] = block
+        return out
+
+    def write_matrix(self, path, stat='mean', dtype=np.float32):
+        """Stream the matrix into a memory-mapped .npy (open with np.load(path, mmap_mode='r'))"""
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=self.shape)
+        for rows, block in self.iter_blocks(stat, dtype):
+            out[rows] = block
+        out.flush()
+        del out
+        return path
+
+    # --- Reductions ---
+    def totals(self, stat='mean'):
+        """(S,) total flux (kt/yr); the sum over basins factors out of the product"""
+        return self.mass[stat] * self.items.sum() / 1e9
+
+    def scenario_ranking(self, stat='mean'):
+        """Scenario positions ordered by total flux, largest first"""
+        return np.argsort(-self.totals(stat), kind='stable')
+
+    def top_basins(self, n=10, stat='mean'):
+        """
+        (S, n) basin positions with the largest flux per scenario.
+        Each scenario scales all basins by the same mass, so the order is shared; computed once.
+        """
+        n = min(n, len(self.items))
+        part = np.argpartition(-self.items, n - 1)[:n] if n else np.arange(0)
+        order = part[np.argsort(-self.items[part], kind='stable')]
+        return np.broadcast_to(order, (len(self.scenarios), n))
+
+    def summary(self, n_top=1):
+        """One row per scenario: parameters, mass statistics, totals, rank and top basin(s)"""
+        df = pd.DataFrame([{k: s.get(k) for k in ('name',) + SCENARIO_KEYS} for s in self.scenarios])
+        for stat in STATS:
+            df[f'mass_g_{stat}'] = self.mass[stat]
+            df[f'flux_kt_{stat}'] = self.totals(stat)
+        rank = np.empty(len(df), dtype=np.int64)
+        rank[self.scenario_ranking()] = np.arange(1, len(df) + 1)
+        df['rank'] = rank
+        if n_top:
+            top = self.top_basins(n_top)
+            df['top_basins'] = [' '.join(str(i) for i in self.basin_ids[row]) for row in top]
+        return df
+
+
+def basin_items_from_export(js_path):
+    from basin_index import load_basin_table
+    table = load_basin_table(js_path)
+    return table['id'], table['flux_items']
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from priors import load_priors
+    from flux_lookup import PRIOR_POLY, PRIOR_SHAPE
+
+    parser = argparse.ArgumentParser(description="Evaluate many parameter scenarios against all basins")
+    parser.add_argument('--export', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'coastal_data.js'),
+                        help="coastal_data*.js providing basin ids and item flux")
+    parser.add_argument('--scenarios', default=None, help="config_presets.json, JSON list or CSV of scenarios")
+    parser.add_argument('--alpha', type=float, nargs='+', default=[2.64])
+    parser.add_argument('--min-size', type=float, nargs='+', default=[100])
+    parser.add_argument('--max-size', type=float, nargs='+', default=[5000])
+    parser.add_argument('--memory-budget-mb', type=float, default=MEMORY_BUDGET_MB)
+    parser.add_argument('--summary-out', default=None, help="CSV with one row per scenario")
+    parser.add_argument('--matrix-out', default=None, help="Memory-mapped (S, B) .npy of kt/yr")
+    parser.add_argument('--stat', default='mean', choices=STATS)
+    args = parser.parse_args()
+
+    shape_probs, poly_probs = load_priors(PRIOR_SHAPE, PRIOR_POLY)
+    scenarios = (load_scenarios(args.scenarios) if args.scenarios
+                 else scenario_grid(args.alpha, args.min_size, args.max_size))
+    basin_ids, items = basin_items_from_export(args.export)
+
+    t0 = time.perf_counter()
+    matrix = ScenarioMatrix(scenarios, basin_ids, items, shape_probs, poly_probs,
+                            memory_budget_mb=args.memory_budget_mb)
+    summary = matrix.summary()
+    print(f"{matrix.shape[0]} scenarios x {matrix.shape[1]} basins in {time.perf_counter() - t0:.3f} s "
+          f"({matrix.chunk} scenarios per block)")
+    print(summary.sort_values('rank').head(10).to_string(index=False))
+    if args.summary_out:
+        summary.to_csv(args.summary_out, index=False)
+        print(f"Wrote {args.summary_out}")
+    if args.matrix_out:
+        t0 = time.perf_counter()
+        matrix.write_matrix(args.matrix_out, args.stat)
+        print(f"Wrote {args.matrix_out} ({time.perf_counter() - t0:.2f} s)")
@@ -0,0 +1,347 @@
+"""
+Local HTTP query service for flux estimates and per-basin lookups
+- Priors, MC kernels and the exported basin tables stay resident in memory
+- Mass statistics per (alpha, min, max) are memoised in an LRU cache
+- Standard library server (ThreadingHTTPServer), one thread per request
+
+    python flux_service.py --port 8765
+    curl "http://127.0.0.1:8765/mass?alpha=2.64&min=100&max=5000"
+    curl "http://127.0.0.1:8765/basin/1120002750?alpha=2.8"
+    curl "http://127.0.0.1:8765/top?n=10&bbox=-20,30,40,60&dataset=ddm30"
+
+Endpoints (all GET, JSON responses):
+    /health                     loaded datasets and cache statistics
+    /mass                       mean/P5/P50/P95 particle mass (g) for alpha, min, max
+                                (ci=1 adds 95% bootstrap intervals of each statistic)
+    /basin/<id>                 basin record plus mass flux (kt/yr) at alpha, min, max
+    /top                        top-n basins by item flux, optionally inside bbox
+    /ranking                    total flux, top basins, basins behind each share (shares=0.5,0.9)
+                                and the Pareto curve, from the persisted ranking index
+    /near                       basins within radius_km of lon, lat (plus the k nearest)
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from basin_index import BasinIndex
+from flux_ranking import PARETO_POINTS, SUMMARY_SHARES, FluxRanking
+from flux_mc import bootstrap_statistics, sample_masses
+from priors import load_priors
+
+UNC_DIR = os.path.dirname(os.path.abspath(__file__))
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+DATASETS = {
+    'lev12': os.path.join(UNC_DIR, "coastal_data.js"),
+    'ddm30': os.path.join(UNC_DIR, "coastal_data_ddm30.js"),
+}
+
+DEFAULT_PARAMS = {'alpha': 2.64, 'min': 100.0, 'max': 5000.0}
+# Size-distribution exponents accepted by /mass and friends (the dashboards' slider spans 1.5-4.0)
+ALPHA_RANGE = (1.0, 5.0)
+DEFAULT_DRAWS = 200000
+MAX_DRAWS = 5000000
+CACHE_SIZE = 4096
+MAX_TOP_N = 1000
+CI_REPLICATES = 100
+
+
+class QueryError(ValueError):
+    """Bad request parameters (reported as HTTP 400)"""
+
+
+def load_basin_table(js_path):
+    """Column arrays plus the persisted spatial and ranking indexes of an exported window.COASTAL_DATA* file"""
+    index = BasinIndex.for_export(js_path)
+    table = {'id': index.ids, 'lat': index.lat, 'lon': index.lon, 'index': index,
+             'ranking': FluxRanking.for_export(js_path), **index.columns}
+    # Items weighted by the regional composition factor (= flux_items for global-prior exports)
+    table['mass_items'] = table['flux_items'] * table.get('mass_factor', 1.0)
+    if index.names is not None:
+        table['name'] = index.names
+    # Sorted ids for O(log n) lookups
+    table['order'] = np.argsort(table['id'], kind='stable')
+    table['sorted_id'] = table['id'][table['order']]
+    return table
+
+
+class FluxQueryService:
+    def __init__(self, datasets=None, prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY,
+                 n_draws=DEFAULT_DRAWS, cache_size=CACHE_SIZE, seed=0):
+        self.shape_probs, self.poly_probs = load_priors(prior_shape, prior_poly)
+        self.n_draws = n_draws
+        self.seed = seed
+        self.tables = {}
+        for name, path in (DATASETS if datasets is None else datasets).items():
+            if os.path.exists(path):
+                self.tables[name] = load_basin_table(path)
+                print(f"Loaded {name}: {len(self.tables[name]['id'])} basins from {path}")
+            else:
+                print(f"Skipping {name}: {path} not found")
+        self._mass_stats = lru_cache(maxsize=cache_size)(self._compute_mass_stats)
+        self._mass_ci = lru_cache(maxsize=cache_size)(self._compute_mass_ci)
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.n_requests = 0
+
+    # --- Parameter handling ---
+    @staticmethod
+    def _float(query, key, default):
+        raw = query.get(key, [None])[0]
+        if raw is None:
+            return float(default)
+        try:
+            value = float(raw)
+        except ValueError:
+            raise QueryError(f"'{key}' must be a number, got {raw!r}")
+        # nan/inf would overflow int() (HTTP 500) or be written as bare NaN tokens (invalid JSON)
+        if not math.isfinite(value):
+            raise QueryError(f"'{key}' must be finite, got {raw!r}")
+        return value
+
+    def parse_params(self, query):
+        """(alpha, min, max, n) rounded so that nearby slider values share a cache entry"""
+        alpha = round(self._float(query, 'alpha', DEFAULT_PARAMS['alpha']), 3)
+        min_size = round(self._float(query, 'min', DEFAULT_PARAMS['min']), 1)
+        max_size = round(self._float(query, 'max', DEFAULT_PARAMS['max']), 1)
+        n = int(self._float(query, 'n', self.n_draws))
+        if not ALPHA_RANGE[0] <= alpha <= ALPHA_RANGE[1]:
+            raise QueryError(f"Require {ALPHA_RANGE[0]} <= alpha <= {ALPHA_RANGE[1]}")
+        if not 0 < min_size < max_size:
+            raise QueryError("Require 0 < min < max")
+        if not 0 < n <= MAX_DRAWS:
+            raise QueryError(f"Require 0 < n <= {MAX_DRAWS}")
+        return alpha, min_size, max_size, n
+
+    def table(self, query):
+        name = query.get('dataset', ['lev12'])[0]
+        if name not in self.tables:
+            raise QueryError(f"Unknown dataset {name!r}; loaded: {sorted(self.tables)}")
+        return name, self.tables[name]
+
+    # --- Queries ---
+    def _compute_mass_stats(self, alpha, min_size, max_size, n):
+        # Fixed seed per parameter set: repeated queries are reproducible
+        rng = np.random.default_rng(self.seed)
+        masses_g, _, _ = sample_masses(n, alpha, min_size, max_size,
+                                       self.shape_probs, self.poly_probs, rng=rng)
+        p5, p50, p95 = np.percentile(masses_g, [5, 50, 95])
+        return {'mean': float(masses_g.mean()), 'P5': float(p5), 'P50': float(p50), 'P95': float(p95)}
+
+    def _compute_mass_ci(self, alpha, min_size, max_size, n):
+        # Same seed as _compute_mass_stats: the intervals describe exactly the reported draws
+        rng = np.random.default_rng(self.seed)
+        masses_g, _, _ = sample_masses(n, alpha, min_size, max_size,
+                                       self.shape_probs, self.poly_probs, rng=rng)
+        return bootstrap_statistics(masses_g, n_boot=CI_REPLICATES, rng=np.random.default_rng(self.seed + 1))
+
+    def mass_statistics(self, query):
+        alpha, min_size, max_size, n = self.parse_params(query)
+        stats = self._mass_stats(alpha, min_size, max_size, n)
+        result = {'alpha': alpha, 'min_size_um': min_size, 'max_size_um': max_size, 'n_draws': n,
+                  'mass_g': stats, 'mass_mg': {k: v * 1000 for k, v in stats.items()}}
+        if query.get('ci', ['0'])[0] in ('1', 'true'):
+            result['ci95_mass_g'] = self._mass_ci(alpha, min_size, max_size, n)
+        return result
+
+    def _record(self, table, i, mean_mass_g):
+        record = {
+            'id': int(table['id'][i]),
+            'lat': float(table['lat'][i]),
+            'lon': float(table['lon'][i]),
+            'discharge': float(table['discharge'][i]),
+            'flux_items': float(table['flux_items'][i]),
+            'flux_baseline': float(table['flux_baseline'][i]),
+            'flux_kt': float(table['mass_items'][i] * mean_mass_g / 1e9),
+        }
+        if 'name' in table:
+            record['name'] = str(table['name'][i])
+        return record
+
+    def basin(self, basin_id, query):
+        name, table = self.table(query)
+        try:
+            basin_id = int(basin_id)
+        except ValueError:
+            raise QueryError(f"Basin id must be an integer, got {basin_id!r}")
+        pos = np.searchsorted(table['sorted_id'], basin_id)
+        if pos >= len(table['sorted_id']) or table['sorted_id'][pos] != basin_id:
+            return None
+        mass = self.mass_statistics(query)
+        result = self._record(table, table['order'][pos], mass['mass_g']['mean'])
+        result.update(dataset=name, params={k: mass[k] for k in ['alpha', 'min_size_um', 'max_size_um']})
+        return result
+
+    def top_basins(self, query):
+        name, table = self.table(query)
+        n_top = int(self._float(query, 'n', 10))
+        if not 0 < n_top <= MAX_TOP_N:
+            raise QueryError(f"Require 0 < n <= {MAX_TOP_N}")
+        # 'n' is the list length here; the MC draw count comes from 'draws'
+        mc_query = dict(query, n=query.get('draws', [str(self.n_draws)]))
+        mass = self.mass_statistics(mc_query)
+
+        candidates = np.arange(len(table['id']))
+        if 'bbox' in query:
+            try:
+                lon0, lat0, lon1, lat1 = (float(v) for v in query['bbox'][0].split(','))
+            except ValueError:
+                raise QueryError("bbox must be min_lon,min_lat,max_lon,max_lat")
+            if not all(math.isfinite(v) for v in (lon0, lat0, lon1, lat1)):
+                raise QueryError("bbox must be finite")
+            candidates = table['index'].bbox(lon0, lat0, lon1, lat1)
+
+        if 'bbox' not in query and table['ranking'].invariant:
+            # Whole dataset: the item-flux order is precomputed
+            top = table['ranking'].top(n_top)
+        else:
+            flux = table['mass_items'][candidates]
+            k = min(n_top, len(candidates))
+            if k < len(candidates):
+                part = np.argpartition(-flux, k - 1)[:k]
+            else:
+                part = np.arange(len(candidates))
+            top = candidates[part[np.argsort(-flux[part], kind='stable')]]
+
+        mean_mass_g = mass['mass_g']['mean']
+        return {'dataset': name, 'n_candidates': int(len(candidates)),
+                'params': {k: mass[k] for k in ['alpha', 'min_size_um', 'max_size_um']},
+                'basins': [self._record(table, i, mean_mass_g) for i in top]}
+
+    def ranking(self, query):
+        """Concentration of the flux: the order is parameter-independent, only the kt/yr scale changes"""
+        name, table = self.table(query)
+        n_top = int(self._float(query, 'n', 10))
+        if not 0 < n_top <= MAX_TOP_N:
+            raise QueryError(f"Require 0 < n <= {MAX_TOP_N}")
+        try:
+            shares = [float(v) for v in query.get('shares', [','.join(map(str, SUMMARY_SHARES))])[0].split(',')]
+        except ValueError:
+            raise QueryError("shares must be comma-separated fractions")
+        if not all(0 < s <= 1 for s in shares):
+            raise QueryError("Require 0 < share <= 1")
+        mass = self.mass_statistics(dict(query, n=query.get('draws', [str(self.n_draws)])))
+        ranking = table['ranking']
+        summary = ranking.summary(mass['mass_g']['mean'], n_top, shares)
+        counts, cum_share = ranking.pareto(int(self._float(query, 'points', PARETO_POINTS)))
+        summary.update(dataset=name, params={k: mass[k] for k in ['alpha', 'min_size_um', 'max_size_um']},
+                       pareto={'count': counts.tolist(), 'share': cum_share.tolist()})
+        return summary
+
+    def near(self, query):
+        """Regional summary around a point: basins within radius_km plus the k nearest"""
+        name, table = self.table(query)
+        if 'lon' not in query or 'lat' not in query:
+            raise QueryError("near requires lon and lat")
+        lon, lat = self._float(query, 'lon', 0), self._float(query, 'lat', 0)
+        radius_km = self._float(query, 'radius_km', 200)
+        k = int(self._float(query, 'k', 5))
+        if not 0 < k <= MAX_TOP_N:
+            raise QueryError(f"Require 0 < k <= {MAX_TOP_N}")
+        mass = self.mass_statistics(dict(query, n=query.get('draws', [str(self.n_draws)])))
+        mean_mass_g = mass['mass_g']['mean']
+
+        index = table['index']
+        within = index.radius(lon, lat, radius_km)
+        dist_km, nearest = index.nearest(lon, lat, k=k)
+        summary = index.summarize(within, 'flux_items')
+        summary['flux_kt'] = float(table['mass_items'][within].sum()) * mean_mass_g / 1e9
+        nearest_records = []
+        for d, i in zip(dist_km, nearest):
+            record = self._record(table, i, mean_mass_g)
+            record['distance_km'] = float(d)
+            nearest_records.append(record)
+        return {'dataset': name, 'lon': lon, 'lat': lat, 'radius_km': radius_km,
+                'params': {key: mass[key] for key in ['alpha', 'min_size_um', 'max_size_um']},
+                'within': summary, 'nearest': nearest_records}
+
+    def health(self):
+        info = self._mass_stats.cache_info()
+        return {'status': 'ok', 'uptime_s': round(time.time() - self.started, 1),
+                'requests': self.n_requests,
+                'datasets': {k: int(len(t['id'])) for k, t in self.tables.items()},
+                'cache': {'hits': info.hits, 'misses': info.misses,
+                          'size': info.currsize, 'maxsize': info.maxsize}}
+
+    def dispatch(self, path, query):
+        """Route a request; returns (status, payload)"""
+        with self._lock:
+            self.n_requests += 1
+        parts = [p for p in path.split('/') if p]
+        if parts == ['health']:
+            return 200, self.health()
+        if parts == ['mass']:
+            return 200, self.mass_statistics(query)
+        if parts == ['top']:
+            return 200, self.top_basins(query)
+        if parts == ['near']:
+            return 200, self.near(query)
+        if parts == ['ranking']:
+            return 200, self.ranking(query)
+        if len(parts) == 2 and parts[0] == 'basin':
+            record = self.basin(parts[1], query)
+            if record is None:
+                return 404, {'error': f"Basin {parts[1]} not found"}
+            return 200, record
+        return 404, {'error': f"Unknown endpoint {path!r}",
+                     'endpoints': ['/health', '/mass', '/basin/<id>', '/top', '/near', '/ranking']}
+
+
+def make_handler(service, quiet=False):
+    class FluxRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            try:
+                status, payload = service.dispatch(url.path, parse_qs(url.query))
+            except QueryError as e:
+                status, payload = 400, {'error': str(e)}
+            except Exception as e:
+                status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            # Dashboards opened from file:// can query the service directly
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+    return FluxRequestHandler
+
+
+def serve(host='127.0.0.1', port=8765, quiet=False, **service_kwargs):
+    service = FluxQueryService(**service_kwargs)
+    server = ThreadingHTTPServer((host, port), make_handler(service, quiet))
+    server.daemon_threads = True
+    print(f"Flux query service on http://{host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local HTTP query service for flux estimates")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--draws', type=int, default=DEFAULT_DRAWS, help="Default MC draws per parameter set")
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help="LRU entries for mass statistics")
+    parser.add_argument('--quiet', action='store_true', help="No per-request log lines")
+    args = parser.parse_args()
+    serve(args.host, args.port, quiet=args.quiet, n_draws=args.draws, cache_size=args.cache_size)
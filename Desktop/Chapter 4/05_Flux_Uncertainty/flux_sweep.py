@@ -0,0 +1,344 @@
+"""
+Sparse-grid (Smolyak) sweeps over the physical parameter space
+- Uncertain parameters with ranges: alpha, min/max size, fibre aspect ratio (L/D),
+  film thickness and the densities of the most common polymers; sizes and
+  geometry are swept in log space
+- Nested Clenshaw-Curtis nodes combined by the Smolyak formula: level 4 over the
+  8 default parameters is 3,937 points, where a full factorial at the same
+  1-D resolution (17 nodes) would be 17^8
+- All points are evaluated in one batched exact computation (per-point mixture
+  laws through flux_lookup.mixture_statistics), in chunks of SWEEP_CHUNK points
+- The surrogate interpolates log mass with the same Smolyak combination of tensor
+  Lagrange interpolants; parameters left out of a query take their nominal value
+- query() serves only the mean from the surrogate (within 0.1% at level 4); the
+  quantiles have kinks where the dominant shape changes (surrogate errors of tens of
+  percent), so query() computes them exactly at the requested points;
+  interpolate() returns the raw surrogate for every statistic
+
+    sweep = SparseGridSweep(shape_probs, poly_probs, level=4).build()
+    sweep.query(alpha=2.64, min_size=100, fiber_aspect=20)   # {'mean': (1,), 'P5': .., ...} in g
+    sweep.query(stats=('mean',), alpha=np.linspace(2, 3.5, 10000))   # surrogate only
+    python flux_sweep.py --level 3 --check 500
+"""
+
+import time
+from math import comb
+
+import numpy as np
+
+from flux_lookup import mixture_statistics
+from flux_mc import FIBER_ASPECT, FILM_THICKNESS_UM, UM3_TO_CM3, density_array, shape_geometry
+
+# 'polymer' marks a density parameter; its nominal value comes from the densities table
+DEFAULT_PARAMETERS = (
+    {'name': 'alpha', 'scale': 'linear', 'start': 2.0, 'stop': 3.5},
+    {'name': 'min_size', 'scale': 'log', 'start': 20.0, 'stop': 300.0},
+    {'name': 'max_size', 'scale': 'log', 'start': 1000.0, 'stop': 10000.0},
+    {'name': 'fiber_aspect', 'scale': 'log', 'start': 5.0, 'stop': 50.0},
+    {'name': 'film_thickness_um', 'scale': 'log', 'start': 5.0, 'stop': 100.0},
+    {'name': 'density_PE', 'scale': 'linear', 'start': 0.91, 'stop': 0.97, 'polymer': 'Poly_PE'},
+    {'name': 'density_PP', 'scale': 'linear', 'start': 0.85, 'stop': 0.94, 'polymer': 'Poly_PP'},
+    {'name': 'density_PET', 'scale': 'linear', 'start': 1.33, 'stop': 1.45, 'polymer': 'Poly_PET'},
+)
+
+# Values of the non-density parameters when they are not swept or not queried
+NOMINAL = {'alpha': 2.64, 'min_size': 100.0, 'max_size': 5000.0,
+           'fiber_aspect': FIBER_ASPECT, 'film_thickness_um': FILM_THICKNESS_UM}
+
+SPARSE_LEVEL = 4
+SWEEP_CHUNK = 4096
+# Statistics query() answers from the surrogate; the others are evaluated exactly
+SURROGATE_STATS = ('mean',)
+
+
+# --- Nested Clenshaw-Curtis rule ---
+def cc_size(level):
+    return 1 if level == 1 else 2 ** (level - 1) + 1
+
+
+def cc_nodes(level):
+    """Nodes on [-1, 1], ascending; written with sin so the centre and ends are exact"""
+    m = cc_size(level)
+    if m == 1:
+        return np.zeros(1)
+    return np.sin(np.pi * (2 * np.arange(m) - (m - 1)) / (2 * (m - 1)))
+
+
+def lagrange_basis(x, level):
+    """(Q, m) Lagrange polynomials of the level's nodes at x (barycentric form)"""
+    nodes = cc_nodes(level)
+    if len(nodes) == 1:
+        return np.ones((len(x), 1))
+    weights = (-1.0) ** np.arange(len(nodes))
+    weights[[0, -1]] *= 0.5
+    diff = x[:, None] - nodes
+    exact = diff == 0
+    terms = weights / np.where(exact, 1.0, diff)
+    basis = terms / terms.sum(axis=1, keepdims=True)
+    hit = exact.any(axis=1)
+    basis[hit] = exact[hit]
+    return basis
+
+
+def _compositions(total, parts):
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in _compositions(total - first, parts - 1):
+            yield (first,) + rest
+
+
+def smolyak_terms(dim, level):
+    """[(multi-index, coefficient)] of the combination technique, levels starting at 1"""
+    terms = []
+    for s in range(max(0, level - dim + 1), level + 1):
+        coefficient = (-1) ** (level - s) * comb(dim - 1, level - s)
+        terms += [(tuple(k + 1 for k in c), coefficient) for c in _compositions(s, dim)]
+    return terms
+
+
+class SparseGrid:
+    """
+    Smolyak sparse grid on [-1, 1]^dim.
+
+    terms  : [(multi-index, coefficient)] tensor grids of the combination technique
+    keys   : (N, dim) node positions on the finest 1-D lattice (2^level + 1 nodes)
+    points : (N, dim) unique nodes
+    """
+
+    def __init__(self, dim, level):
+        if level < 1:
+            raise ValueError("Sparse-grid level must be >= 1")
+        self.dim, self.level = dim, level
+        self.terms = smolyak_terms(dim, level)
+        self._base = 2 ** level + 1
+        keys = [self._term_keys(index) for index, _ in self.terms]
+        self.codes, first = np.unique(np.concatenate([self._encode(k) for k in keys]), return_index=True)
+        self.keys = np.concatenate(keys)[first]
+        self.points = np.sin(np.pi * (2 * self.keys - 2 ** self.level) / 2 ** (self.level + 1))
+        # Rows of each tensor grid in C order of its (m_1, ..., m_dim) layout
+        self._rows = [np.searchsorted(self.codes, self._encode(k)) for k in keys]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _term_keys(self, index):
+        axes = []
+        for level in index:
+            m = cc_size(level)
+            axes.append(np.array([2 ** (self.level - 1)]) if m == 1
+                        else np.arange(m) * 2 ** (self.level - level + 1))
+        return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, self.dim)
+
+    def _encode(self, keys):
+        return keys @ (self._base ** np.arange(self.dim, dtype=np.int64))
+
+    def interpolate(self, values, x):
+        """values: (N, ...) at the points; x: (Q, dim) in [-1, 1] -> (Q, ...)"""
+        values = np.asarray(values, dtype=float)
+        x = np.atleast_2d(np.asarray(x, dtype=float))
+        tail = values.shape[1:]
+        bases = {}
+        out = np.zeros((len(x),) + tail)
+        for (index, coefficient), rows in zip(self.terms, self._rows):
+            B = [bases.setdefault((k, level), lagrange_basis(x[:, k], level)) for k, level in enumerate(index)]
+            R = B[0] @ values[rows].reshape(B[0].shape[1], -1)
+            for Bk in B[1:]:
+                R = np.einsum('qm,qmr->qr', Bk, R.reshape(len(x), Bk.shape[1], -1))
+            out += coefficient * R.reshape(out.shape)
+        return out
+
+
+# --- Batched exact evaluation ---
+def sweep_mass_statistics(alpha, min_size, max_size, shape_probs, poly_probs, densities=None,
+                          fiber_aspect=FIBER_ASPECT, film_thickness_um=FILM_THICKNESS_UM,
+                          polymer_densities=None, quantiles=(5, 50, 95)):
+    """
+    {stat: (N,) particle mass in g} with every parameter varying per point.
+    polymer_densities: {polymer: (N,) density} overriding the densities table.
+    """
+    alpha, min_size, max_size, fiber_aspect, film_thickness_um = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (alpha, min_size, max_size, fiber_aspect, film_thickness_um)))
+    n = alpha.size
+    shape_keys, poly_keys = list(shape_probs), list(poly_probs)
+    s_coef, s_power = shape_geometry(shape_keys, fiber_aspect.ravel(), film_thickness_um.ravel())
+    rho = np.tile(density_array(poly_keys, densities), (n, 1))
+    for polymer, values in (polymer_densities or {}).items():
+        if polymer in poly_keys:
+            rho[:, poly_keys.index(polymer)] = np.broadcast_to(values, alpha.shape).ravel()
+
+    weight = np.outer(list(shape_probs.values()), list(poly_probs.values())).ravel()
+    coef = (s_coef[:, :, None] * rho[:, None, :]).reshape(n, -1) * UM3_TO_CM3
+    power = np.repeat(s_power, len(poly_keys))
+    keep = (weight > 0) & (power > 0)
+
+    stats = {}
+    for start in range(0, n, SWEEP_CHUNK):
+        rows = slice(start, start + SWEEP_CHUNK)
+        chunk = mixture_statistics(alpha.ravel()[rows], min_size.ravel()[rows], max_size.ravel()[rows],
+                                   weight[keep], coef[rows][:, keep], power[keep], quantiles)
+        for k, v in chunk.items():
+            stats.setdefault(k, []).append(v)
+    return {k: np.concatenate(v).reshape(alpha.shape) for k, v in stats.items()}
+
+
+class SparseGridSweep:
+    """
+    Exact mass statistics on a Smolyak grid over the parameter box, with a
+    log-mass surrogate for queries.
+
+    parameters : axis dicts (name, scale, start, stop[, polymer]) as DEFAULT_PARAMETERS
+    log_values : (N, n_stats) log mass (g) at the grid points, after build()
+    """
+
+    def __init__(self, shape_probs, poly_probs, parameters=DEFAULT_PARAMETERS, level=SPARSE_LEVEL,
+                 densities=None, quantiles=(5, 50, 95)):
+        self.shape_probs, self.poly_probs, self.densities = shape_probs, poly_probs, densities
+        self.parameters = [dict(p) for p in parameters]
+        self.names = [p['name'] for p in self.parameters]
+        self.quantiles = quantiles
+        self.stats = ('mean',) + tuple(f'P{q:g}' for q in quantiles)
+        self.grid = SparseGrid(len(self.parameters), level)
+        self.log_values = None
+        self.seconds = None
+
+    def __len__(self):
+        return len(self.grid)
+
+    # --- Coordinates ---
+    def nominal(self, name):
+        p = self.parameters[self.names.index(name)] if name in self.names else {}
+        if 'polymer' in p:
+            return float(density_array([p['polymer']], self.densities)[0])
+        return NOMINAL[name]
+
+    def from_unit(self, x):
+        """(Q, d) in [-1, 1] -> {name: (Q,) physical value}"""
+        values = {}
+        for k, p in enumerate(self.parameters):
+            t = 0.5 * (x[:, k] + 1.0)
+            if p['scale'] == 'log':
+                values[p['name']] = np.exp(np.log(p['start']) + t * np.log(p['stop'] / p['start']))
+            else:
+                values[p['name']] = p['start'] + t * (p['stop'] - p['start'])
+        return values
+
+    def to_unit(self, values):
+        """{name: (Q,)} -> (Q, d) in [-1, 1]; raises outside the box (no extrapolation)"""
+        columns = []
+        for p in self.parameters:
+            v = np.asarray(values[p['name']], dtype=float)
+            if p['scale'] == 'log':
+                t = np.log(v / p['start']) / np.log(p['stop'] / p['start'])
+            else:
+                t = (v - p['start']) / (p['stop'] - p['start'])
+            if np.any((t < -1e-9) | (t > 1 + 1e-9)):
+                raise ValueError(f"{p['name']} outside the swept range [{p['start']}, {p['stop']}]")
+            columns.append(2.0 * np.clip(t, 0.0, 1.0) - 1.0)
+        return np.column_stack(columns)
+
+    def points(self):
+        """{name: (N,)} parameter values of the grid points"""
+        return self.from_unit(self.grid.points)
+
+    # --- Evaluation ---
+    def evaluate(self, values):
+        """Exact {stat: (Q,)} at {name: (Q,)} points; unswept parameters at their nominal value"""
+        n = len(next(iter(values.values())))
+        full = {name: np.asarray(values.get(name, np.full(n, self.nominal(name))), dtype=float)
+                for name in NOMINAL}
+        polymers = {p['polymer']: np.asarray(values[p['name']], dtype=float)
+                    for p in self.parameters if 'polymer' in p and p['name'] in values}
+        return sweep_mass_statistics(full['alpha'], full['min_size'], full['max_size'], self.shape_probs,
+                                     self.poly_probs, self.densities, full['fiber_aspect'],
+                                     full['film_thickness_um'], polymers, self.quantiles)
+
+    def build(self):
+        t0 = time.perf_counter()
+        stats = self.evaluate(self.points())
+        self.log_values = np.column_stack([np.log(stats[s]) for s in self.stats])
+        self.seconds = time.perf_counter() - t0
+        return self
+
+    def _query_points(self, values):
+        """{name: (Q,)} over all swept parameters (nominal where not given)"""
+        unknown = set(values) - set(self.names)
+        if unknown:
+            raise ValueError(f"Unknown or unswept parameters {sorted(unknown)}")
+        arrays = [np.atleast_1d(np.asarray(v, dtype=float)) for v in values.values()]
+        n = max((len(a) for a in arrays), default=1)
+        return {name: np.broadcast_to(np.atleast_1d(values.get(name, self.nominal(name))), (n,))
+                for name in self.names}
+
+    def interpolate(self, **values):
+        """
+        Raw surrogate {stat: (Q,) mass in g} for every statistic.
+        Only the mean is accurate; quantile errors reach tens of percent (see check()).
+        """
+        logs = self.grid.interpolate(self.log_values, self.to_unit(self._query_points(values)))
+        return {stat: np.exp(logs[:, k]) for k, stat in enumerate(self.stats)}
+
+    def query(self, stats=None, **values):
+        """
+        {stat: (Q,) mass in g}; parameters not given take their nominal value.
+        The mean comes from the surrogate, quantiles are evaluated exactly at the
+        query points (stats= restricts the output, e.g. ('mean',) skips the exact pass).
+        """
+        stats = self.stats if stats is None else tuple(stats)
+        unknown = set(stats) - set(self.stats)
+        if unknown:
+            raise ValueError(f"Unknown statistics {sorted(unknown)}; available {list(self.stats)}")
+        full = self._query_points(values)
+        unit = self.to_unit(full)
+        result = {}
+        surrogate = [stat for stat in stats if stat in SURROGATE_STATS]
+        if surrogate:
+            logs = self.grid.interpolate(self.log_values, unit)
+            result.update({stat: np.exp(logs[:, self.stats.index(stat)]) for stat in surrogate})
+        if any(stat not in SURROGATE_STATS for stat in stats):
+            exact = self.evaluate(full)
+            result.update({stat: exact[stat] for stat in stats if stat not in SURROGATE_STATS})
+        return {stat: result[stat] for stat in stats}
+
+    def flux_kt(self, total_item_flux_yr, stats=None, **values):
+        return {k: total_item_flux_yr * v / 1e9 for k, v in self.query(stats, **values).items()}
+
+    def check(self, n=500, rng=None):
+        """Max and median |relative error| of the surrogate (interpolate()) at n random points in the box"""
+        rng = np.random.default_rng(0) if rng is None else rng
+        values = self.from_unit(rng.uniform(-1.0, 1.0, (n, len(self.names))))
+        exact, approx = self.evaluate(values), self.interpolate(**values)
+        return {s: {'max': float(np.max(np.abs(approx[s] / exact[s] - 1.0))),
+                    'median': float(np.median(np.abs(approx[s] / exact[s] - 1.0)))} for s in self.stats}
+
+    def to_frame(self):
+        import pandas as pd
+        frame = pd.DataFrame(self.points())
+        for k, stat in enumerate(self.stats):
+            frame[f'{stat}_mass_g'] = np.exp(self.log_values[:, k])
+        return frame
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from priors import load_priors
+    from flux_lookup import PRIOR_POLY, PRIOR_SHAPE
+
+    parser = argparse.ArgumentParser(description="Smolyak sparse-grid sweep of particle mass statistics")
+    parser.add_argument('--level', type=int, default=SPARSE_LEVEL)
+    parser.add_argument('--check', type=int, default=0, help="Compare the surrogate to exact values at N random points")
+    parser.add_argument('--out', default=None, help="CSV of the grid points and their statistics")
+    args = parser.parse_args()
+
+    sweep = SparseGridSweep(*load_priors(PRIOR_SHAPE, PRIOR_POLY), level=args.level).build()
+    full = np.prod([cc_size(args.level + 1)] * len(sweep.names), dtype=float)
+    print(f"{len(sweep)} points over {len(sweep.names)} parameters in {sweep.seconds:.2f} s "
+          f"(full factorial at the same resolution: {full:.3g})")
+    if args.check:
+        for stat, err in sweep.check(args.check).items():
+            print(f"  {stat:>4}: max |rel err| {err['max']:.2%}, median {err['median']:.3%}")
+    if args.out:
+        sweep.to_frame().to_csv(args.out, index=False)
+        print(f"-> {args.out}")
@@ -0,0 +1,257 @@
+"""
+Hierarchical Pfafstetter rollups of Level 12 flux to BasinATLAS levels 1-11
+- Level k basin of a Level 12 basin = first k digits of its 12-digit PFAF_ID
+- Parent index for every level built once (one sort) and cached as .npz
+- Additive columns (items, mass, discharge, MC draws) aggregated to all levels
+  in one sweep: each level is reduced from the level below it
+- Flux_Linear and Natural_Discharge_Upstream are accumulated along NEXT_DOWN, so
+  build_rollups de-accumulates them (river_routing.RiverNetwork.local_loads) before
+  summing: a level-k value is the load generated inside that unit, not its outflow
+- No geometry is read or processed
+
+    hierarchy = PfafHierarchy.from_atlas(LEV12_SHP)
+    sums = hierarchy.aggregate(flux_items)            # {level: array per level-k basin}
+    bands = hierarchy.quantiles(flux_draws, (5, 50, 95))
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = r"c:\Users\syyda\Desktop\Chapter 4"
+# Caches and outputs live next to this module, independent of the working directory
+UNC_DIR = os.path.dirname(os.path.abspath(__file__))
+LEV12_SHP = os.path.join(BASE_DIR, "BasinATLAS_v10_shp", "BasinATLAS_v10_lev12.shp")
+FLUX_FILE = os.path.join(BASE_DIR, "04_Flux_Analysis", "Flux_Data_Modeling.csv")
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+CACHE_DIR = os.path.join(UNC_DIR, "cache")
+OUTPUT_FILE = os.path.join(UNC_DIR, "basin_rollups.js")
+
+PFAF_DIGITS = 12
+LEVELS = tuple(range(1, PFAF_DIGITS + 1))
+SECONDS_PER_YEAR = 31536000.0
+ID_COLUMNS = ('HYBAS_ID', 'PFAF_ID', 'NEXT_DOWN', 'NEXT_SINK', 'MAIN_BAS', 'COAST', 'ENDO')
+# build_rollups sums loads generated inside each unit (accumulated columns de-accumulated first)
+LOAD_BASIS = 'local'
+
+
+def read_atlas_attributes(atlas_path, columns=('HYBAS_ID', 'PFAF_ID')):
+    """Attribute table only (the .dbf); geometry is skipped"""
+    import geopandas as gpd
+    df = pd.DataFrame(gpd.read_file(atlas_path, columns=list(columns), ignore_geometry=True))
+    return df.astype({c: 'int64' for c in columns if c in ID_COLUMNS})
+
+
+def file_cache_key(path):
+    stat = os.stat(path)
+    raw = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+class PfafHierarchy:
+    """
+    Nesting of Level 12 basins into levels 1-11 as integer group codes.
+
+    order      : permutation that sorts the Level 12 basins by PFAF_ID
+    keys[k]    : PFAF code (k digits) of each level-k basin, ascending
+    codes[k]   : level-k group code of every Level 12 basin (input order)
+    starts[k]  : first level-(k+1) group of each level-k group, for the sweep
+    parent[k]  : level-k group code of each level-(k+1) group
+    """
+
+    def __init__(self, pfaf_ids, hybas_ids=None):
+        pfaf_ids = np.asarray(pfaf_ids, dtype=np.int64)
+        if len(pfaf_ids) and pfaf_ids.min() < 10 ** (PFAF_DIGITS - 1):
+            raise ValueError(f"Expected {PFAF_DIGITS}-digit Level 12 PFAF_IDs")
+        self.pfaf_ids = pfaf_ids
+        self.hybas_ids = None if hybas_ids is None else np.asarray(hybas_ids, dtype=np.int64)
+        self.order = np.argsort(pfaf_ids, kind='stable')
+        sorted_pfaf = pfaf_ids[self.order]
+
+        self.keys, self.codes, self.starts, self.parent = {}, {}, {}, {}
+        sorted_codes = {}
+        for level in LEVELS:
+            prefix = sorted_pfaf // 10 ** (PFAF_DIGITS - level)
+            new_group = np.empty(len(prefix), dtype=bool)
+            new_group[:1] = True
+            new_group[1:] = prefix[1:] != prefix[:-1]
+            sorted_codes[level] = np.cumsum(new_group) - 1
+            self.keys[level] = prefix[new_group]
+            codes = np.empty(len(prefix), dtype=np.int64)
+            codes[self.order] = sorted_codes[level]
+            self.codes[level] = codes
+        for level in LEVELS[:-1]:
+            # Groups of level k+1 are contiguous and nested inside level k groups
+            child_parent = self.keys[level + 1] // 10
+            self.parent[level] = np.searchsorted(self.keys[level], child_parent)
+            self.starts[level] = np.flatnonzero(np.r_[True, child_parent[1:] != child_parent[:-1]])
+
+    def n_basins(self, level):
+        return len(self.keys[level])
+
+    # --- Caching ---
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        arrays = {'pfaf_ids': self.pfaf_ids}
+        if self.hybas_ids is not None:
+            arrays['hybas_ids'] = self.hybas_ids
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['pfaf_ids'], data['hybas_ids'] if 'hybas_ids' in data else None)
+
+    @classmethod
+    def from_atlas(cls, atlas_path, cache_dir=CACHE_DIR):
+        """
+        Build from the Level 12 attribute table; cached per atlas file.
+        Only the ID columns are cached: rebuilding the index is one sort, reading the .dbf is the slow part.
+        """
+        cache_path = os.path.join(cache_dir, f"pfaf_hierarchy_{file_cache_key(atlas_path)}.npz") if cache_dir else None
+        if cache_path and os.path.exists(cache_path):
+            return cls.load(cache_path)
+        attrs = read_atlas_attributes(atlas_path)
+        hierarchy = cls(attrs['PFAF_ID'].values, attrs['HYBAS_ID'].values)
+        if cache_path:
+            hierarchy.save(cache_path)
+        return hierarchy
+
+    # --- Aggregation ---
+    def align(self, hybas_ids, values, fill=0.0):
+        """Scatter values keyed by HYBAS_ID onto the hierarchy's basin order (missing -> fill)"""
+        if self.hybas_ids is None:
+            raise ValueError("Hierarchy was built without HYBAS_IDs")
+        values = np.asarray(values, dtype=float)
+        lookup = pd.Index(self.hybas_ids).get_indexer(np.asarray(hybas_ids, dtype=np.int64))
+        found = lookup >= 0
+        out = np.full((len(self.hybas_ids),) + values.shape[1:], fill, dtype=float)
+        out[lookup[found]] = values[found]
+        return out
+
+    def aggregate(self, values, levels=LEVELS):
+        """
+        Sum Level 12 values (n,) or (n, m) to every requested level.
+        Level 12 is reduced once; each coarser level is reduced from the one below.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.shape[0] != len(self.pfaf_ids):
+            raise ValueError(f"Expected {len(self.pfaf_ids)} rows, got {values.shape[0]}")
+        finest = PFAF_DIGITS
+        sorted_vals = values[self.order]
+        group_starts = np.flatnonzero(np.r_[True, np.diff(self.codes[finest][self.order]) != 0])
+        sums = {finest: np.add.reduceat(sorted_vals, group_starts, axis=0)}
+        for level in range(finest - 1, min(levels) - 1, -1):
+            sums[level] = np.add.reduceat(sums[level + 1], self.starts[level], axis=0)
+        return {level: sums[level] for level in levels}
+
+    def quantiles(self, draws, quantiles=(5, 50, 95), levels=LEVELS):
+        """
+        Quantiles of level sums from per-basin MC draws (n, n_draws).
+        Draws are summed per draw first, so the bands keep the cross-basin correlation.
+        """
+        sums = self.aggregate(draws, levels)
+        return {level: {f'P{q:g}': row for q, row in zip(quantiles, np.percentile(s, quantiles, axis=1))}
+                for level, s in sums.items()}
+
+    def to_frame(self, level, **columns):
+        """Per level-k basin table: PFAF code, number of Level 12 basins, aggregated columns"""
+        counts = np.bincount(self.codes[level], minlength=self.n_basins(level))
+        return pd.DataFrame({'PFAF_ID': self.keys[level], 'n_lev12': counts, **columns})
+
+
+def build_rollups(atlas_path=LEV12_SHP, flux_file=FLUX_FILE, alpha=2.64, min_size=100, max_size=5000,
+                  prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY, levels=LEVELS[:-1], cache_dir=CACHE_DIR):
+    """
+    Items, discharge and mass flux (mean and P5/P50/P95 particle mass) for every level.
+    The columns are local loads: Flux_Linear and Natural_Discharge_Upstream are
+    de-accumulated along NEXT_DOWN first, so each level-k value is what the unit's own
+    Level 12 basins contribute (a unit containing a river mouth holds that river's total
+    only when the whole catchment lies inside it). Atlas basins without a flux row count
+    as 0 and negative residuals are clipped, as in 06_Aggregate_DDM30.aggregate_by_overlay;
+    both counts are printed and kept in each table's attrs['rollup_audit'].
+    """
+    from priors import load_priors
+    from flux_lookup import mass_statistics_exact
+    from river_routing import RiverNetwork
+
+    hierarchy = PfafHierarchy.from_atlas(atlas_path, cache_dir)
+    network = RiverNetwork.from_atlas(atlas_path, cache_dir)
+    flux = pd.read_csv(flux_file, usecols=['HYBAS_ID', 'Flux_Linear', 'Natural_Discharge_Upstream'])
+    lookup = network.index.get_indexer(flux['HYBAS_ID'].values.astype(np.int64))
+    matched = np.zeros(len(network.hybas_ids), dtype=bool)
+    matched[lookup[lookup >= 0]] = True
+    audit = {'n_atlas_basins': int(len(matched)), 'n_unmatched': int((~matched).sum()), 'clipped': {}}
+    local = {}
+    for col in ['Flux_Linear', 'Natural_Discharge_Upstream']:
+        residual = network.local_loads(network.align(flux['HYBAS_ID'].values, flux[col].values), clip=False)
+        negative = residual < 0
+        audit['clipped'][col] = {'n_basins': int(negative.sum()), 'amount': float(-residual[negative].sum())}
+        local[col] = hierarchy.align(network.hybas_ids, np.maximum(residual, 0.0))
+    if audit['n_unmatched']:
+        print(f"  Warning: {audit['n_unmatched']} of {audit['n_atlas_basins']} Level 12 basins have no flux row; "
+              f"their upstream load is attributed to the next matched basin downstream")
+    for col, clipped in audit['clipped'].items():
+        if clipped['n_basins']:
+            print(f"  Warning: {clipped['n_basins']} negative local {col} residuals clipped to 0 "
+                  f"(total {clipped['amount']:.4g})")
+    items_yr = local['Flux_Linear'] * SECONDS_PER_YEAR
+    discharge = local['Natural_Discharge_Upstream']
+
+    shape_probs, poly_probs = load_priors(prior_shape, prior_poly)
+    mass = mass_statistics_exact(alpha, min_size, max_size, shape_probs, poly_probs)
+
+    sums = hierarchy.aggregate(np.column_stack([items_yr, discharge]), levels)
+    tables = {}
+    for level, s in sums.items():
+        columns = {'flux_items': s[:, 0], 'discharge': s[:, 1]}
+        for stat, m in mass.items():
+            columns[f'flux_kt_{stat}'] = s[:, 0] * float(m) / 1e9
+        tables[level] = hierarchy.to_frame(level, **columns)
+        tables[level].attrs['rollup_audit'] = audit
+    return tables
+
+
+def export_rollups_js(tables, output_file=OUTPUT_FILE, params=None):
+    """
+    Column-oriented window.BASIN_ROLLUPS for the dashboards.
+    params['loads'] records that the columns are local (de-accumulated) loads per unit;
+    the build_rollups audit is written as 'audit'.
+    """
+    data = {'params': {'loads': LOAD_BASIS, **(params or {})}, 'levels': {}}
+    audit = next((df.attrs['rollup_audit'] for df in tables.values() if 'rollup_audit' in df.attrs), None)
+    if audit is not None:
+        data['audit'] = audit
+    for level, df in tables.items():
+        data['levels'][str(level)] = {col: df[col].tolist() for col in df.columns}
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(f"window.BASIN_ROLLUPS = {json.dumps(data)};")
+    print(f"Wrote {output_file}")
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Roll Level 12 flux up to Pfafstetter levels 1-11")
+    parser.add_argument('--atlas', default=LEV12_SHP)
+    parser.add_argument('--flux', default=FLUX_FILE)
+    parser.add_argument('--out', default=OUTPUT_FILE)
+    parser.add_argument('--max-level', type=int, default=6, help="Finest level written to the JS export")
+    parser.add_argument('--alpha', type=float, default=2.64)
+    parser.add_argument('--min-size', type=float, default=100)
+    parser.add_argument('--max-size', type=float, default=5000)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    tables = build_rollups(args.atlas, args.flux, args.alpha, args.min_size, args.max_size,
+                           levels=tuple(range(1, args.max_level + 1)))
+    for level, df in tables.items():
+        print(f"Level {level:2d}: {len(df):7d} basins, {df['flux_kt_mean'].sum():.2f} kt/yr")
+    print(f"Rollups built in {time.perf_counter() - t0:.2f} s")
+    export_rollups_js(tables, args.out, params={'alpha': args.alpha, 'min_size_um': args.min_size,
+                                                'max_size_um': args.max_size})
@@ -0,0 +1,242 @@
+"""
+Lightweight per-stage instrumentation for the export pipelines
+- Wall time, CPU time, RSS at start/end, RSS delta and row counts per stage
+- Per-stage peak RSS where the OS lets the high-water mark be reset (Linux:
+  /proc/self/clear_refs); the process-lifetime peak is reported separately
+- Optional tracemalloc delta/peak and a cProfile dump per stage
+- Structured JSON run report
+
+Disabled profilers hand out one shared no-op stage, so instrumented code
+costs nothing measurable when the flag is off:
+
+    prof = RunProfiler('load_and_process', enabled=args.profile)
+    with prof.stage('read_flux_csv') as st:
+        df = pd.read_csv(path)
+        st.rows = len(df)
+    prof.write_report('run_report.json')
+"""
+
+import cProfile
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MB = 1024.0 ** 2
+
+
+def current_rss_mb():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / MB
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / MB
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def reset_peak_rss():
+    """
+    Reset the RSS high-water mark (Linux >= 4.0); False where unsupported.
+    This also resets ru_maxrss, so RunProfiler keeps the lifetime peak itself.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def stage_peak_rss_mb():
+    """RSS high-water mark since the last reset_peak_rss() (VmHWM)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024.0
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def peak_rss_mb():
+    """Process-lifetime peak RSS (not reset between stages)"""
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        if hasattr(info, 'peak_wset'):  # Windows
+            return info.peak_wset / MB
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / MB if sys.platform == 'darwin' else peak / 1024.0
+    return None
+
+
+def _round(value, ndigits=4):
+    return None if value is None else round(value, ndigits)
+
+
+class _NullStage:
+    """Shared no-op stage used when profiling is off"""
+    rows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    def __init__(self, profiler, name, rows):
+        self.profiler = profiler
+        self.name = name
+        self.rows = rows
+
+    def __enter__(self):
+        prof = self.profiler
+        if prof.trace_memory:
+            tracemalloc.reset_peak()
+            self._traced_start = tracemalloc.get_traced_memory()[0]
+        prof.note_peak(peak_rss_mb())
+        self._peak_reset = reset_peak_rss()
+        self._rss_start = current_rss_mb()
+        if prof.profile_dir:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self._wall_start
+        cpu = time.process_time() - self._cpu_start
+        prof = self.profiler
+        rss_end = current_rss_mb()
+        stage_peak = stage_peak_rss_mb() if self._peak_reset else None
+        prof.note_peak(stage_peak)
+        prof.note_peak(peak_rss_mb())
+        record = {
+            'name': self.name,
+            'wall_s': _round(wall),
+            'cpu_s': _round(cpu),
+            'rss_start_mb': _round(self._rss_start, 1),
+            'rss_end_mb': _round(rss_end, 1),
+            'rss_delta_mb': None if rss_end is None or self._rss_start is None else _round(rss_end - self._rss_start, 1),
+            # Peak within this stage; None where the high-water mark cannot be reset
+            'stage_peak_rss_mb': _round(stage_peak, 1),
+            'process_peak_rss_mb': _round(prof.process_peak_mb, 1),
+            'rows': None if self.rows is None else int(self.rows),
+            'failed': exc_type is not None,
+        }
+        if prof.trace_memory:
+            traced_now, traced_peak = tracemalloc.get_traced_memory()
+            record['tracemalloc_delta_mb'] = _round((traced_now - self._traced_start) / MB, 2)
+            record['tracemalloc_peak_mb'] = _round((traced_peak - self._traced_start) / MB, 2)
+        if prof.profile_dir:
+            self._cprofile.disable()
+            os.makedirs(prof.profile_dir, exist_ok=True)
+            dump = os.path.join(prof.profile_dir,
+                                f"{prof.name}_{len(prof.stages):02d}_{self.name}.prof")
+            self._cprofile.dump_stats(dump)
+            record['cprofile'] = dump
+        prof.stages.append(record)
+        if prof.verbose:
+            rows = '' if self.rows is None else f", {int(self.rows)} rows"
+            print(f"  [profile] {self.name}: {wall:.2f} s wall, {cpu:.2f} s cpu{rows}")
+        return False
+
+
+class RunProfiler:
+    def __init__(self, name, enabled=False, trace_memory=False, profile_dir=None, verbose=True):
+        self.name = name
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.profile_dir = profile_dir if enabled else None
+        self.verbose = verbose
+        self.stages = []
+        self.process_peak_mb = None
+        self._started = datetime.datetime.now()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def note_peak(self, mb):
+        """Fold a peak reading into the process-lifetime peak"""
+        if mb is not None and (self.process_peak_mb is None or mb > self.process_peak_mb):
+            self.process_peak_mb = mb
+
+    def stage(self, name, rows=None):
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, rows)
+
+    def report(self):
+        return {
+            'run': self.name,
+            'started': self._started.isoformat(timespec='seconds'),
+            'total_wall_s': _round(time.perf_counter() - self._wall_start),
+            'total_cpu_s': _round(time.process_time() - self._cpu_start),
+            'process_peak_rss_mb': _round(max(filter(None, (self.process_peak_mb, peak_rss_mb())), default=None), 1),
+            'stages': self.stages,
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'argv': sys.argv,
+                'tracemalloc': self.trace_memory,
+                'cprofile_dir': self.profile_dir,
+            },
+        }
+
+    def write_report(self, path):
+        """Write the JSON run report; no-op when disabled"""
+        if not self.enabled or not path:
+            return None
+        report = self.report()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Run report written: {path}")
+        return report
+
+
+NULL_PROFILER = RunProfiler('disabled', enabled=False)
+
+
+def add_profiler_arguments(parser):
+    """Shared --profile flags for the pipeline scripts"""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', action='store_true',
+                       help="Record per-stage timing/memory and write a JSON run report")
+    group.add_argument('--profile-report', default=None,
+                       help="Run report path (default: <script>_run_report.json)")
+    group.add_argument('--trace-malloc', action='store_true',
+                       help="Also record tracemalloc deltas (slower)")
+    group.add_argument('--cprofile-dir', default=None,
+                       help="Dump a cProfile .prof file per stage into this directory")
+    return parser
+
+
+def profiler_from_args(name, args):
+    return RunProfiler(name, enabled=args.profile or bool(args.cprofile_dir),
+                       trace_memory=args.trace_malloc, profile_dir=args.cprofile_dir)
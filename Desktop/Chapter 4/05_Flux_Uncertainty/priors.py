@@ -0,0 +1,37 @@
+"""
+Shape/polymer prior probabilities
+- Reads prior_shape_probs.csv / prior_poly_probs.csv (name,prob rows, no header)
+- Cleaning shared by every consumer: drop 'Other' and non-positive entries, renormalize
+- No geospatial imports, so the service and the MC tools load it cheaply
+"""
+
+import os
+
+import pandas as pd
+
+UNC_DIR = os.path.dirname(os.path.abspath(__file__))
+PRIOR_SHAPE = os.path.join(UNC_DIR, "prior_shape_probs.csv")
+PRIOR_POLY = os.path.join(UNC_DIR, "prior_poly_probs.csv")
+
+
+def normalized(probs):
+    """{name: prob} without 'Other' and non-positive entries, renormalized to sum to 1 ({} if nothing is left)"""
+    probs = {k: float(v) for k, v in probs.items() if 'other' not in k.lower() and v > 0}
+    total = sum(probs.values())
+    return {k: v / total for k, v in probs.items()} if total > 0 else {}
+
+
+def load_priors(prior_shape=PRIOR_SHAPE, prior_poly=PRIOR_POLY):
+    """(shape_probs, poly_probs) dicts from the two prior CSVs"""
+    shape_df = pd.read_csv(prior_shape, index_col=0, header=None, names=['Prob'])
+    shape_df = shape_df[~shape_df.index.str.contains('Other', case=False, na=False)]
+    shape_df = shape_df[shape_df['Prob'] > 0]
+    shape_df['Prob'] = shape_df['Prob'] / shape_df['Prob'].sum()
+
+    poly_df = pd.read_csv(prior_poly, index_col=0, header=None, names=['Prob'])
+    poly_df = poly_df[~poly_df.index.str.contains('Other', case=False, na=False)]
+    poly_df = poly_df.dropna()
+    poly_df = poly_df[poly_df['Prob'] > 0]
+    poly_df['Prob'] = poly_df['Prob'] / poly_df['Prob'].sum()
+
+    return shape_df['Prob'].to_dict(), poly_df['Prob'].to_dict()
@@ -0,0 +1,128 @@
+"""
+Concurrent startup for the explorers and export scripts
+- Independent inputs (shapefile, flux CSV, priors) are read on a thread pool;
+  pyogrio and the pandas C parser release the GIL, so the reads overlap
+- CPU-bound precomputation (MC surfaces) runs in a worker process, submitted
+  before the loader threads start
+- FutureWatcher polls futures from a figure timer and runs each panel's fill-in
+  on the GUI thread once its inputs are ready (matplotlib is not thread-safe)
+- Per-loader timings are printed only after log_load_timings() (the explorers
+  turn it on; library callers stay quiet)
+
+    surfaces = submit_process(precompute_surfaces, alpha_grid, min_grid)
+    loads = load_concurrently(priors=load_priors, flux=load_flux)
+    watcher = FutureWatcher(fig)
+    watcher.when_done(loads['flux'], draw_flux_panel)
+    watcher.when_done([loads['priors'], surfaces], draw_surfaces)
+    watcher.start()
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+LOAD_WORKERS = 4
+POLL_INTERVAL_MS = 100
+
+_thread_pool = None
+_process_pool = None
+_log_timings = False
+
+
+def log_load_timings(enabled=True):
+    """Print '[load] name: t s' as each loader finishes (off by default)"""
+    global _log_timings
+    _log_timings = enabled
+
+
+def thread_pool():
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix='startup-load')
+    return _thread_pool
+
+
+def process_pool():
+    """
+    One worker process. Submit process work before load_concurrently(): with the
+    fork start method the worker is created on the first submit, and forking
+    once loader threads are running is unsafe.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=1)
+    return _process_pool
+
+
+def _timed(name, func, args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    if _log_timings:
+        print(f"  [load] {name}: {time.perf_counter() - t0:.2f} s")
+    return result
+
+
+def load_concurrently(**loaders):
+    """
+    Start every loader on the thread pool; returns {name: Future}.
+    A loader is a callable or a (callable, *args) tuple.
+    """
+    futures = {}
+    for name, loader in loaders.items():
+        func, *args = loader if isinstance(loader, tuple) else (loader,)
+        futures[name] = thread_pool().submit(_timed, name, func, args)
+    return futures
+
+
+def submit_process(func, *args):
+    """Run a module-level function in the worker process; returns a Future"""
+    return process_pool().submit(func, *args)
+
+
+def gather(futures):
+    """{name: result}, blocking; the first failing loader raises"""
+    return {name: future.result() for name, future in futures.items()}
+
+
+class FutureWatcher:
+    """
+    Runs callback(*results) on the GUI thread when all of its futures are done.
+    Polled from a canvas timer, so callbacks never run on loader threads.
+    """
+
+    def __init__(self, fig, interval_ms=POLL_INTERVAL_MS):
+        self.fig = fig
+        self.pending = []
+        self.timer = fig.canvas.new_timer(interval=interval_ms)
+        self.timer.add_callback(self.poll)
+
+    def when_done(self, futures, callback):
+        futures = list(futures) if isinstance(futures, (list, tuple)) else [futures]
+        self.pending.append((futures, callback))
+        return self
+
+    def start(self):
+        self.poll()
+        if self.pending:
+            self.timer.start()
+        return self
+
+    def poll(self):
+        """Run every callback whose futures have finished; True while work remains"""
+        ready = [item for item in self.pending if all(f.done() for f in item[0])]
+        for item in ready:
+            self.pending.remove(item)
+            futures, callback = item
+            callback(*[f.result() for f in futures])
+        if ready:
+            self.fig.canvas.draw_idle()
+        if not self.pending:
+            self.timer.stop()
+        return bool(self.pending)
+
+    def wait(self, timeout=None):
+        """Block until every callback has run (scripts without an event loop)"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.poll():
+            if deadline is not None and time.perf_counter() > deadline:
+                raise TimeoutError(f"{len(self.pending)} startup tasks still pending")
+            time.sleep(POLL_INTERVAL_MS / 1000.0)